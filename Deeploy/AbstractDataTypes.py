@@ -117,6 +117,49 @@ class BaseType(Generic[_PythonType, _DeeployType], _SlotPickleMixin):
         """
         return False
 
+    @classmethod
+    def sizeInBytes(cls, numElements: int) -> int:
+        """Returns the number of bytes occupied by `numElements` elements of this type
+
+        Sub-byte types are stored packed, i.e. the size is rounded up to
+        full bytes.
+
+        Parameters
+        ----------
+        numElements : int
+            Number of elements
+
+        Returns
+        -------
+        int
+            Size in bytes
+
+        """
+        return (int(numElements) * cls.typeWidth + 7) // 8
+
+    @_classproperty
+    def isPacked(cls) -> bool:
+        """Whether multiple elements of this type share a byte"""
+        return cls.typeWidth < 8
+
+    @classmethod
+    def binaryImage(cls, values: Union[Iterable, np.ndarray]) -> Optional[np.ndarray]:
+        """Returns the in-memory representation of values of this type
+
+        Parameters
+        ----------
+        values : Union[Iterable, np.ndarray]
+            Values representable by cls
+
+        Returns
+        -------
+        Optional[np.ndarray]
+            uint8 array of the little-endian bytes of the values, or
+            None if the binary representation of this type is not known
+
+        """
+        return None
+
 
 class VoidType(BaseType):
     """Helper type to represent the C void type for pointers
@@ -223,6 +266,38 @@ class IntegerImmediate(Immediate[Union[int, Iterable[int]], _ImmediateType]):
     def fitsNumLevels(cls, nLevels: int) -> bool:
         return nLevels <= cls.nLevels
 
+    @classmethod
+    def packValues(cls, values: Union[Iterable[int], np.ndarray]) -> np.ndarray:
+        """Packs sub-byte values into bytes, least significant element first
+
+        Parameters
+        ----------
+        values : Union[Iterable[int], np.ndarray]
+            Values representable by cls
+
+        Returns
+        -------
+        np.ndarray
+            uint8 array of `cls.sizeInBytes(len(values))` bytes
+
+        """
+        assert cls.isPacked, f"Only sub-byte types are packed, {cls.typeName} is {cls.typeWidth} bits wide"
+        elementsPerByte = 8 // cls.typeWidth
+        fields = np.asarray(values).astype(np.int64).reshape(-1) & ((1 << cls.typeWidth) - 1)
+        fields = np.pad(fields, (0, (-fields.size) % elementsPerByte)).reshape(-1, elementsPerByte)
+        shifts = np.arange(elementsPerByte) * cls.typeWidth
+        return np.bitwise_or.reduce(fields << shifts, axis = 1).astype(np.uint8)
+
+    @classmethod
+    def binaryImage(cls, values: Union[Iterable[int], np.ndarray]) -> Optional[np.ndarray]:
+        if cls.isPacked:
+            return cls.packValues(values)
+        if cls.typeWidth not in (8, 16, 32, 64):
+            return None
+        # Wrap out-of-range values like the C conversion of integer literals
+        dtype = np.dtype(f"<{'i' if cls.signed else 'u'}{cls.typeWidth // 8}")
+        return np.asarray(values).astype(np.int64).reshape(-1).astype(dtype).view(np.uint8)
+
 
 class FloatImmediate(Immediate[Union[float, Iterable[float]], _ImmediateType]):
     typeMantissa: int  #: int: Represents the number of bits reserved for the mantissa part
@@ -253,6 +328,14 @@ class FloatImmediate(Immediate[Union[float, Iterable[float]], _ImmediateType]):
         else:
             return False
 
+    @classmethod
+    def binaryImage(cls, values: Union[Iterable[float], np.ndarray]) -> Optional[np.ndarray]:
+        # Only IEEE754 formats have a native NumPy representation
+        dtype = {(10, 5): "<f2", (23, 8): "<f4", (52, 11): "<f8"}.get((cls.typeMantissa, cls.typeExponent))
+        if dtype is None:
+            return None
+        return np.asarray(values).reshape(-1).astype(dtype).view(np.uint8)
+
     @classmethod
     def checkValue(cls, value: Union[float, Iterable[float], np.ndarray], ctxt: Optional[_NetworkContext] = None):
         """
@@ -260,42 +343,38 @@ class FloatImmediate(Immediate[Union[float, Iterable[float]], _ImmediateType]):
         (64 bits) to an arbitrary FP representation and check if the new representation is close enough
         to the original value.
         """
-        _val_list = []
-
         if isinstance(value, float):
-            _val_list.append(value)
+            _val_array = np.array([value], dtype = np.float64)
         elif isinstance(value, np.ndarray):
-            _val_list = value.flatten().tolist()
+            _val_array = np.asarray(value, dtype = np.float64).reshape(-1)
         elif isinstance(value, Iterable):
-            for i in value:
-                _val_list.append(i)
+            _val_array = np.array(list(value), dtype = np.float64).reshape(-1)
         else:
             raise Exception("Immediate type not recognized.")
 
-        # The exponent bias for FP64 is 2**(11-1)-1 as the exponent has 11 bits.
-        DOUBLE_MIN_EXP = -1023
-
-        for val in _val_list:
+        # Decompose the FP64 values into their IEEE754 fields. For normal numbers, this matches
+        # math.frexp with the mantissa brought to [1, 2) and the exponent decremented accordingly.
+        DOUBLE_MANTISSA = 52
+        DOUBLE_EXPONENT_MASK = 0x7FF
+        DOUBLE_EXPONENT_BIAS = 1023
 
-            # Extract mantissa, exponent, and sign.
-            # Also bring mantissa and exponent to IEEE754 compliant form for non-denormals.
-            mantissa, exponent = math.frexp(val)
-            sign = True if mantissa < 0 else False
-            mantissa = -mantissa * 2 if sign else mantissa * 2
-            exponent -= 1
+        bits = _val_array.view(np.uint64)
+        biasedExponent = ((bits >> np.uint64(DOUBLE_MANTISSA)) & np.uint64(DOUBLE_EXPONENT_MASK)).astype(np.int64)
 
-            # Check if the number is finite, nonzero and not denormal, otherwise skip the check.
-            if not (math.isfinite(val) and val != 0 and exponent > DOUBLE_MIN_EXP):
-                continue
+        # Only check finite, nonzero and non-denormal numbers, i.e. skip all-zero and all-one exponents.
+        normal = (biasedExponent > 0) & (biasedExponent < DOUBLE_EXPONENT_MASK)
+        if not np.any(normal):
+            return True
 
-            # Check if exponent is representable.
-            if (cls.typeExponentOffset + exponent) > cls.typeExponentMax or (cls.typeExponentOffset + exponent) < 0:
-                return False
+        # Check if exponents are representable.
+        exponent = cls.typeExponentOffset + biasedExponent[normal] - DOUBLE_EXPONENT_BIAS
+        if np.any((exponent > cls.typeExponentMax) | (exponent < 0)):
+            return False
 
-            # Check if mantissa is representable. Implicit assumption is that cls.typeMantissa < 52 (like in FP64)
-            truncated_mantissa = 1 + math.floor((2**cls.typeMantissa) * (mantissa - 1)) / (2**cls.typeMantissa)
-            if math.fabs(truncated_mantissa - mantissa) > 0.0:
-                return False
+        # Check if mantissas are representable, i.e. all mantissa bits beyond typeMantissa are zero.
+        truncatedBits = DOUBLE_MANTISSA - cls.typeMantissa
+        if truncatedBits > 0 and np.any(bits[normal] & np.uint64((1 << truncatedBits) - 1)):
+            return False
 
         return True
 
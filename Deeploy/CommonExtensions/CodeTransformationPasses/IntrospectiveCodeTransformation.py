@@ -2,8 +2,9 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import copy
 import types
-from typing import Dict, List
+from typing import Callable, Dict, List, Tuple
 
 import mako.codegen as codegen
 from mako.lexer import Lexer
@@ -16,6 +17,86 @@ from Deeploy.DeeployTypes import ExecutionBlock, NetworkContext, OperatorReprese
 _NULL: str = "NULL"
 
 
+class TemplateAnalysis():
+    """Analysis of a template source, shared by all templates with the same source
+
+    Attributes
+    ----------
+    parseTree : TemplateNode
+        The parse tree of the source. Must not be modified, transformations work on a fresh parse tree.
+    encoding : str
+        Source encoding detected by the lexer
+    expressions : List[str]
+        Text of all expressions of the template
+    pageargsKeys : List[str]
+        Keys of the operator representation accessed through `pageargs`
+    reconstructions : Dict[Tuple, Tuple[types.CodeType, types.ModuleType]]
+        Compiled code and module of the transformed template, keyed by the transformation and the compile options
+    """
+
+    def __init__(self, source: str):
+        lexer = Lexer(source)
+        self.parseTree: TemplateNode = lexer.parse()
+        self.encoding = lexer.encoding
+        self.expressions: List[str] = [node.text for node in self.parseTree.nodes if isinstance(node, Expression)]
+        self.pageargsKeys: List[str] = [
+            self._pageargsKey(expr) for expr in self.expressions if expr.startswith("pageargs[")
+        ]
+        self.reconstructions: Dict[Tuple, Tuple[types.CodeType, types.ModuleType]] = {}
+
+    @staticmethod
+    def _pageargsKey(expr: str) -> str:
+        # Extract key inside pageargs[]
+        key = expr[len("pageargs["):-1]
+        assert key.startswith("'") or key.startswith("\""), f"pageargs key must begin with a string literal, got: {key}"
+
+        # Extract initial string literal (between first 2 " or ' characters)
+        quoteChar = key[0]
+        endIdx = key.find(quoteChar, 1)
+        assert endIdx != -1, f"pageargs key missing closing quote: {expr}"
+        return key[1:endIdx]
+
+
+# Template analyses keyed by the template source. Python caches the hash of a string, so looking up the source of a
+# template only hashes it once.
+_templateAnalyses: Dict[str, TemplateAnalysis] = {}
+
+
+def templateAnalysis(template: Template) -> TemplateAnalysis:
+    """Return the analysis of a template, analysing its source only the first time it is seen
+
+    Parameters
+    ----------
+    template : Template
+        The template to analyse.
+
+    Returns
+    -------
+    TemplateAnalysis
+        The cached analysis of the template source.
+    """
+    analysis = _templateAnalyses.get(template._source)
+    if analysis is None:
+        analysis = TemplateAnalysis(template._source)
+        _templateAnalyses[template._source] = analysis
+    return analysis
+
+
+def clearTemplateAnalyses() -> None:
+    """Drop all cached template analyses"""
+    _templateAnalyses.clear()
+
+
+def _compileOptions(template: Template) -> Tuple:
+    # Options of mako's code generator which change the compiled module. The URI only names the module, modules are
+    # shared between templates with different URIs.
+    options = [
+        template.default_filters, template.buffer_filters, template.imports, template.future_imports,
+        sorted(template.reserved_names or ())
+    ]
+    return (*[tuple(option or ()) for option in options], template.strict_undefined, template.enable_loop)
+
+
 class IntrospectiveCodeTransformationMixIn():
     """A mix-in class providing introspective code transformation capabilities for template-based code generation.
 
@@ -30,7 +111,7 @@ class IntrospectiveCodeTransformationMixIn():
     - Programmatically index or dereference variables within templates.
     - Extract dynamic references (e.g., buffers, tensors) used in code blocks.
     - Support for unrolling struct references and distinguishing between local/global context.
-    - Efficient caching of parse trees for repeated template analysis.
+    - Caching of the analysis and the transformed code of templates, shared by all templates with the same source.
 
     Intended Usage
     --------------
@@ -39,8 +120,6 @@ class IntrospectiveCodeTransformationMixIn():
     context or user input, such as in neural network frameworks or domain-specific languages.
     """
 
-    parseTreeDict: Dict[int, TemplateNode] = {}
-
     @staticmethod
     def _generateParseTree(template: Template) -> TemplateNode:
         """Generate the parse tree for the given template.
@@ -73,7 +152,6 @@ class IntrospectiveCodeTransformationMixIn():
         Template
             The modified template.
         """
-        lexer = Lexer(template._source)
         source = codegen.compile(
             node,
             template.uri,
@@ -82,7 +160,7 @@ class IntrospectiveCodeTransformationMixIn():
             buffer_filters = template.buffer_filters,
             imports = template.imports,
             future_imports = template.future_imports,
-            source_encoding = lexer.encoding,
+            source_encoding = templateAnalysis(template).encoding,
             generate_magic_comment = True,
             strict_undefined = template.strict_undefined,
             enable_loop = template.enable_loop,
@@ -99,6 +177,31 @@ class IntrospectiveCodeTransformationMixIn():
         template.callable_ = template.module.render_body
         return template
 
+    @staticmethod
+    def _transformTemplate(template: Template, transformation: Tuple, transform: Callable[[TemplateNode],
+                                                                                          TemplateNode]) -> None:
+        """Apply a parse tree transformation to the template, reusing the code of a previous identical transformation.
+
+        Parameters
+        ----------
+        template : Template
+            The template to modify in place.
+        transformation : Tuple
+            Hashable description of the transformation, e.g. its kind and arguments.
+        transform : Callable[[TemplateNode], TemplateNode]
+            Transformation of a fresh parse tree of the template.
+        """
+        analysis = templateAnalysis(template)
+        key = (transformation, _compileOptions(template))
+        if key in analysis.reconstructions:
+            template._code, template.module = analysis.reconstructions[key]
+            template.callable_ = template.module.render_body
+            return
+
+        parseTree = transform(IntrospectiveCodeTransformationMixIn._generateParseTree(template))
+        IntrospectiveCodeTransformationMixIn._reconstructCode(template, parseTree)
+        analysis.reconstructions[key] = (template._code, template.module)
+
     @staticmethod
     def _indexPointer(parseTree: TemplateNode, ptrName: str, index: str) -> TemplateNode:
         """Index a pointer in the parse tree.
@@ -146,10 +249,13 @@ class IntrospectiveCodeTransformationMixIn():
         """
         if len(varNames) == 0:
             return
-        parseTree = IntrospectiveCodeTransformationMixIn._generateParseTree(template)
-        for name in varNames:
-            parseTree = IntrospectiveCodeTransformationMixIn._indexPointer(parseTree, name, index)
-        IntrospectiveCodeTransformationMixIn._reconstructCode(template, parseTree)
+
+        def _transform(parseTree: TemplateNode) -> TemplateNode:
+            for name in varNames:
+                parseTree = IntrospectiveCodeTransformationMixIn._indexPointer(parseTree, name, index)
+            return parseTree
+
+        IntrospectiveCodeTransformationMixIn._transformTemplate(template, ("index", tuple(varNames), index), _transform)
 
     @staticmethod
     def _dereferencePointer(parseTree: TemplateNode, ptrName: str) -> TemplateNode:
@@ -191,10 +297,95 @@ class IntrospectiveCodeTransformationMixIn():
         """
         if len(varNames) == 0:
             return
-        parseTree = IntrospectiveCodeTransformationMixIn._generateParseTree(template)
-        for name in varNames:
+
+        def _transform(parseTree: TemplateNode) -> TemplateNode:
+            for name in varNames:
+                parseTree = IntrospectiveCodeTransformationMixIn._dereferencePointer(parseTree, name)
+            return parseTree
+
+        IntrospectiveCodeTransformationMixIn._transformTemplate(template, ("dereference", tuple(varNames)), _transform)
+
+    @staticmethod
+    def _versionPointers(parseTree: TemplateNode, ptrNames: List[str], variants: List[Dict[str, int]]) -> TemplateNode:
+        """Version the template on the values pointed to by the pointers in the parse tree.
+
+        Parameters
+        ----------
+        parseTree : TemplateNode
+            The parse tree to modify.
+        ptrNames : List[str]
+            The names of the pointers to specialize.
+        variants : List[Dict[str, int]]
+            The pointed-to values of every specialized version.
+
+        Returns
+        -------
+        TemplateNode
+            The modified parse tree, which selects the version with the matching values at runtime and falls back to
+            the dereferenced pointers otherwise.
+        """
+
+        def _text(text: str) -> Text:
+            return Text(text, source = text, lineno = 0, pos = 0, filename = None)
+
+        def _expression(name: str) -> Expression:
+            return Expression(name, '', source = name, lineno = 0, pos = 0, filename = None)
+
+        body = parseTree.nodes
+        nodes = []
+        for idx, variant in enumerate(variants):
+            nodes.append(_text("if (" if idx == 0 else "} else if ("))
+            for nameIdx, name in enumerate(ptrNames):
+                nodes.extend(
+                    [_text("(*" if nameIdx == 0 else " && (*"),
+                     _expression(name),
+                     _text(f" == {variant[name]})")])
+            nodes.append(_text(") {"))
+
+            # Literal values, such that the compiler can propagate them into the kernel
+            for node in body:
+                if isinstance(node, Expression) and node.text in ptrNames:
+                    nodes.append(_text(str(variant[node.text])))
+                else:
+                    nodes.append(copy.deepcopy(node))
+            nodes.append(_text("\n"))
+
+        nodes.append(_text("} else {"))
+        for name in ptrNames:
             parseTree = IntrospectiveCodeTransformationMixIn._dereferencePointer(parseTree, name)
-        IntrospectiveCodeTransformationMixIn._reconstructCode(template, parseTree)
+        nodes.extend(parseTree.nodes)
+        nodes.append(_text("\n}\n"))
+
+        parseTree.nodes = nodes
+        return parseTree
+
+    @staticmethod
+    def specializeVars(template: Template, varNames: List[str], variants: List[Dict[str, int]]) -> None:
+        """Dereference the specified variables in the given template and specialize it for the given values.
+
+        The template is generated once per variant with the values as literals, guarded by a comparison of the
+        dereferenced variables with these values, and once with the dereferenced variables for all other values. The
+        template is modified in place.
+
+        Parameters
+        ----------
+        template : Template
+            The template object to be modified.
+        varNames : List[str]
+            List of variable names to dereference and specialize within the template.
+        variants : List[Dict[str, int]]
+            Values of the variables of every specialized version.
+        """
+        if len(variants) == 0:
+            IntrospectiveCodeTransformationMixIn.dereferenceVars(template, varNames)
+            return
+
+        def _transform(parseTree: TemplateNode) -> TemplateNode:
+            return IntrospectiveCodeTransformationMixIn._versionPointers(parseTree, varNames, variants)
+
+        transformation = ("specialize", tuple(varNames),
+                          tuple(tuple(variant[name] for name in varNames) for variant in variants))
+        IntrospectiveCodeTransformationMixIn._transformTemplate(template, transformation, _transform)
 
     def extractDynamicReferences(self,
                                  ctxt: NetworkContext,
@@ -280,43 +471,20 @@ class IntrospectiveCodeTransformationMixIn():
         List[str]
             A list of dynamic expressions, including local (and optionally global) references.
         """
-        codeHash = hash(template._source)
-
-        if codeHash in self.parseTreeDict.keys():
-            makoParseTree = self.parseTreeDict[codeHash]
-        else:
-            # Parse the user-provided template
-            makoParseTree = IntrospectiveCodeTransformationMixIn._generateParseTree(template)
-            self.parseTreeDict[codeHash] = makoParseTree
-
-        # Filter parsing tree for expressions
-        makoExpressions = [node.text for node in makoParseTree.nodes if isinstance(node, Expression)]
+        analysis = templateAnalysis(template)
 
         # Filter represented expressions
         representedExpressions = [
-            operatorRepresentation[expr] for expr in makoExpressions if expr in operatorRepresentation
+            operatorRepresentation[expr] for expr in analysis.expressions if expr in operatorRepresentation
         ]
 
         # Add in mako expressions that are accessed through pageargs
         # Required for unknown number of data dimensions
-        for expr in makoExpressions:
-            if expr.startswith("pageargs["):
-                # Extract key inside pageargs[]
-                key = expr[len("pageargs["):-1]
-                assert key.startswith("'") or key.startswith(
-                    "\""), f"pageargs key must begin with a string literal, got: {key}"
-
-                # Extract initial string literal (between first 2 " or ' characters)
-                quoteChar = key[0]
-                endIdx = key.find(quoteChar, 1)
-                key = key[1:endIdx]
-
-                assert endIdx != -1, f"pageargs key missing closing quote: {expr}"
-
-                # Search for all expressions that begin with the given key
-                for exprKey in operatorRepresentation.keys():
-                    if exprKey.startswith(key):
-                        representedExpressions.append(operatorRepresentation[exprKey])
+        for key in analysis.pageargsKeys:
+            # Search for all expressions that begin with the given key
+            for exprKey in operatorRepresentation.keys():
+                if exprKey.startswith(key):
+                    representedExpressions.append(operatorRepresentation[exprKey])
 
         # Filter buffers from expressions
         references = [expr for expr in representedExpressions if ctxt.is_buffer(expr)]
@@ -9,6 +9,20 @@ import numpy.typing as npt
 from Deeploy.AbstractDataTypes import FloatImmediate, IntegerImmediate
 
 
+class int2_t(IntegerImmediate):
+    """2-bit signed integer type, stored packed with four elements per byte."""
+    typeName = "int2_t"
+    typeWidth = 2
+    signed = True
+
+
+class int4_t(IntegerImmediate):
+    """4-bit signed integer type, stored packed with two elements per byte."""
+    typeName = "int4_t"
+    typeWidth = 4
+    signed = True
+
+
 class int8_t(IntegerImmediate):
     """8-bit signed integer type."""
     typeName = "int8_t"
@@ -37,6 +51,20 @@ class int64_t(IntegerImmediate):
     signed = True
 
 
+class uint2_t(IntegerImmediate):
+    """2-bit unsigned integer type, stored packed with four elements per byte."""
+    typeName = "uint2_t"
+    typeWidth = 2
+    signed = False
+
+
+class uint4_t(IntegerImmediate):
+    """4-bit unsigned integer type, stored packed with two elements per byte."""
+    typeName = "uint4_t"
+    typeWidth = 4
+    signed = False
+
+
 class uint8_t(IntegerImmediate):
     """8-bit unsigned integer type."""
     typeName = "uint8_t"
@@ -104,6 +132,8 @@ IntegerDataTypes: Tuple[Type[IntegerImmediate], ...] = tuple(
         *SignedIntegerDataTypes,
         *UnsignedIntegerDataTypes,
     ), key = lambda _type: _type.typeWidth))
+# Packed sub-byte types are opt-in and hence not part of IntegerDataTypes, which drives type inference
+SubByteIntegerDataTypes: Tuple[Type[IntegerImmediate], ...] = (int2_t, uint2_t, int4_t, uint4_t)
 FloatDataTypes: Tuple[Type[FloatImmediate], ...] = (bfloat16_t, float16_t, float32_t, float64_t)
 
 
@@ -65,6 +65,10 @@ class NetworkDeployerWrapper(NetworkDeployer):
     def generateBufferAllocationCode(self) -> str:
         return self._innerObject.generateBufferAllocationCode()
 
+    # PULPDeployer augment
+    def generateIncludeString(self) -> str:
+        return self._innerObject.generateIncludeString()
+
     # MultiEngineDeployer augment
     def _selectEngine(self, node: gs.Node) -> DeploymentEngine:
         return self._innerObject._selectEngine(node)
@@ -3,7 +3,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import re
-from typing import Dict, Literal, NamedTuple, Optional
+from typing import Dict, List, Literal, NamedTuple, Optional
 
 import onnx_graphsurgeon as gs
 
@@ -39,6 +39,70 @@ class Match(NamedTuple):
     nodes_map: Dict[str, gs.Node]
 
 
+class OpTypeIndex:
+    """
+    Index of the nodes of a graph by operation type.
+
+    The index is built with a single sweep over the graph and records the
+    position of every node, so that candidate anchors can be visited in
+    graph order. Passes rewrite node operations in place, hence the index
+    is a snapshot of the graph at construction time.
+
+    Parameters
+    ----------
+    graph : gs.Graph
+        The graph to index.
+    """
+
+    def __init__(self, graph: gs.Graph):
+        self.nodes: Dict[str, List[gs.Node]] = {}
+        # Nodes are not hashable so we are using their ids
+        self.position: Dict[int, int] = {}
+
+        for idx, node in enumerate(graph.nodes):
+            self.nodes.setdefault(node.op, []).append(node)
+            self.position[id(node)] = idx
+
+    def lookup(self, op: str, regex_op: bool = False) -> List[gs.Node]:
+        """
+        Return all nodes whose operation matches `op`, in graph order.
+
+        Parameters
+        ----------
+        op : str
+            Operation type, or a regular expression if `regex_op` is set.
+        regex_op : bool, optional
+            Whether `op` is matched with `re.fullmatch`. Default is False.
+
+        Returns
+        -------
+        List[gs.Node]
+            The matching nodes.
+        """
+        if not regex_op:
+            return self.nodes.get(op, [])
+
+        nodes = [node for nodeOp, opNodes in self.nodes.items() if re.fullmatch(op, nodeOp) for node in opNodes]
+        return self.sorted(nodes)
+
+    def sorted(self, nodes: List[gs.Node]) -> List[gs.Node]:
+        """
+        Deduplicate nodes and sort them by their position in the graph.
+
+        Parameters
+        ----------
+        nodes : List[gs.Node]
+            Nodes of the indexed graph.
+
+        Returns
+        -------
+        List[gs.Node]
+            The unique nodes in graph order.
+        """
+        unique = {id(node): node for node in nodes}
+        return [unique[key] for key in sorted(unique.keys(), key = lambda key: self.position[key])]
+
+
 class SubgraphMatcher:
     """
     Base class for pattern matching in computational graphs.
@@ -163,6 +227,31 @@ class SubgraphMatcher:
         """
         _, _ = anchor, pattern
 
+    # Override this
+    def _anchor_candidates(self, index: OpTypeIndex, pattern: gs.Graph) -> List[gs.Node]:
+        """
+        Select the graph nodes from which a match of the pattern may start.
+
+        Parameters
+        ----------
+        index : OpTypeIndex
+            Operation type index of the target graph.
+        pattern : gs.Graph
+            The pattern graph to match.
+
+        Returns
+        -------
+        List[gs.Node]
+            Superset of the anchors of all matches, in any order.
+
+        Notes
+        -----
+        The default implementation returns all nodes matching the
+        operation of the pattern anchor, which every match has to start
+        from.
+        """
+        return index.lookup(next(iter(pattern.nodes)).op, self.regex_op)
+
     def _match_from_anchor(self, anchor: gs.Node, pattern: gs.Graph) -> Optional[Match]:
         """
         Attempt to create a complete match starting from an anchor node.
@@ -220,9 +309,11 @@ class SubgraphMatcher:
         -----
         The algorithm:
         1. Validates the pattern using the subclass-specific validation
-        2. Iterates through all nodes in the target graph as potential anchors
-        3. Attempts to match the pattern from each anchor
-        4. Collects only non-overlapping matches to avoid conflicts
+        2. Indexes the target graph by operation type and returns early if
+           any pattern operation does not occur in the graph
+        3. Iterates through the candidate anchors in graph order
+        4. Attempts to match the pattern from each anchor
+        5. Collects only non-overlapping matches to avoid conflicts
 
         Non-overlapping means that if a node is part of one match, it cannot
         be part of any other match in the returned list.
@@ -241,7 +332,13 @@ class SubgraphMatcher:
         def is_overlap(match: Match):
             return not matched_node_names.isdisjoint(node_names(match))
 
-        for node in graph.nodes:
+        index = OpTypeIndex(graph)
+
+        # Every pattern node has to be matched, so a single missing operation rules out any match
+        if any(len(index.lookup(patternNode.op, self.regex_op)) == 0 for patternNode in pattern.nodes):
+            return matches
+
+        for node in index.sorted(self._anchor_candidates(index, pattern)):
             match = self._match_from_anchor(node, pattern)
             if match is not None and not is_overlap(match):
                 matches.append(match)
@@ -391,6 +488,47 @@ class NonBranchingMatcher(SubgraphMatcher):
 
         return self._match_nodes_recursive(pn.o(), gn.o(), pattern_length - 1, nodes_map)
 
+    def _anchor_candidates(self, index: OpTypeIndex, pattern: gs.Graph) -> List[gs.Node]:
+        """
+        Select anchors by walking back from the pattern's rarest operation.
+
+        Parameters
+        ----------
+        index : OpTypeIndex
+            Operation type index of the target graph.
+        pattern : gs.Graph
+            The pattern graph to match.
+
+        Returns
+        -------
+        List[gs.Node]
+            All nodes matching the pattern anchor's operation that lie the
+            right number of producer steps upstream of a node matching the
+            rarest operation of the pattern.
+
+        Notes
+        -----
+        A match maps the i-th node of the chain to a direct producer of the
+        graph node matched by the (i+1)-th node, so walking back over all
+        producers yields a superset of the anchors of all matches.
+        """
+        chain = [next(iter(pattern.nodes))]
+        while len(chain) < len(pattern.nodes) and len(chain[-1].outputs[0].outputs) > 0:
+            chain.append(chain[-1].o())
+
+        # Patterns that are not a single chain can't match, leave them to the default selection
+        if len(chain) < len(pattern.nodes):
+            return super()._anchor_candidates(index, pattern)
+
+        candidates = [index.lookup(patternNode.op, self.regex_op) for patternNode in chain]
+        rarest = min(range(len(chain)), key = lambda idx: len(candidates[idx]))
+
+        nodes = candidates[rarest]
+        for _ in range(rarest):
+            nodes = index.sorted([producer for node in nodes for tensor in node.inputs for producer in tensor.inputs])
+
+        return [node for node in nodes if self.is_op_match(chain[0], node)]
+
     def _nodes_map_from_anchor(self, anchor: gs.Node, pattern: gs.Graph) -> Optional[Dict[str, gs.Node]]:
         """
         Create a complete node mapping starting from an anchor node.
@@ -7,6 +7,7 @@ from typing import List, Optional
 import onnx_graphsurgeon as gs
 
 from Deeploy.DeeployTypes import NetworkContext
+from Deeploy.GraphMaintenance import cleanupGraph, insertNode, removeDeadNodes, toposortGraph
 from Deeploy.Logging import DEFAULT_LOGGER as log
 
 from .Matchers import Match, NonBranchingMatcher, SubgraphMatcher
@@ -83,13 +84,19 @@ def deleteNode(self, node: gs.Node):
         node.inputs.clear()
         node.outputs.clear()
 
-    self.cleanup()
+    # Only the deleted node and its producers can have become dead
+    removeDeadNodes(self, [node])
 
 
 def _reachableNodes(graph: gs.Graph, inputTensors: List[gs.Tensor], outputTensors: List[gs.Tensor]) -> List[gs.Node]:
 
-    _inputTensors = [tensor for tensor in inputTensors.copy() if tensor.name in graph.tensors().keys()]
-    _outputTensors = [tensor for tensor in outputTensors.copy() if tensor.name in graph.tensors().keys()]
+    tensorNames = {tensor.name for tensor in graph.inputs + graph.outputs}
+    for node in graph.nodes:
+        tensorNames.update(tensor.name for tensor in node.inputs)
+        tensorNames.update(tensor.name for tensor in node.outputs)
+
+    _inputTensors = [tensor for tensor in inputTensors.copy() if tensor.name in tensorNames]
+    _outputTensors = [tensor for tensor in outputTensors.copy() if tensor.name in tensorNames]
 
     retList = _MemoReach(graph, _inputTensors, _outputTensors).reachingSet()
 
@@ -100,12 +107,17 @@ def _reachableNodes(graph: gs.Graph, inputTensors: List[gs.Tensor], outputTensor
 def replaceInsertNode(self, inputs, outputs, newNode):
     reachableSet = _reachableNodes(self, inputs, outputs)
 
-    ret = self.layer(op = newNode.op, name = newNode.name, attrs = newNode.attrs, inputs = inputs, outputs = outputs)
+    self.layer(op = newNode.op, name = newNode.name, attrs = newNode.attrs, inputs = inputs, outputs = outputs)
+    insertedNode = self.nodes.pop()
 
     for node in reachableSet:
         node.outputs = []
 
-    self.toposort().cleanup()
+    # Insert the new node in front of its first consumer, so the topological order only needs repairing for the
+    # depths downstream of the replaced nodes, and remove the disconnected nodes and their dead producers
+    insertNode(self, insertedNode)
+    toposortGraph(self)
+    removeDeadNodes(self, reachableSet)
 
 
 class Pass():
@@ -245,7 +257,7 @@ class ContextAwareReplaceSequentialPatternPassMixIn(ContextAwareSequentialPassMi
         self.matches = self.matcher.match(graph, self.pattern)
         for i, m in enumerate(self.matches):
             ctxt, graph = self.replacement_fn(ctxt, graph, m, f"{self.name}_{i}", **self.kwargs)
-        graph.cleanup().toposort()
+        toposortGraph(cleanupGraph(graph))
         return ctxt, graph
 
 
@@ -258,7 +270,7 @@ class ContextAgnosticReplaceSequentialPatternPassMixIn(ContextAgnosticSequential
         self.matches = self.matcher.match(graph, self.pattern)
         for i, m in enumerate(self.matches):
             graph = self.replacement_fn(graph, m, f"{self.name}_{i}", **self.kwargs)
-        graph.cleanup().toposort()
+        toposortGraph(cleanupGraph(graph))
         return graph
 
 
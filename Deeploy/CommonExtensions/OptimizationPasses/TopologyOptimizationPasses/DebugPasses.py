@@ -11,6 +11,7 @@ import onnx_graphsurgeon as gs
 
 from Deeploy.CommonExtensions.OptimizationPasses.Matchers import Match, NonBranchingMatcher
 from Deeploy.CommonExtensions.OptimizationPasses.PassClasses import ReplaceSequentialPatternPass, contextagnostic
+from Deeploy.GraphMaintenance import cleanupGraph, toposortGraph
 
 
 @contextagnostic
@@ -62,7 +63,7 @@ def _print_fun(graph: gs.Graph, match: Match, name: str, position: Literal["befo
         node.inputs[0] = newNodeInput
 
         graph.nodes.append(newPrintNode)
-        graph.cleanup().toposort()
+        toposortGraph(cleanupGraph(graph))
 
     if position == 'after' and "PRINT" not in node.outputs[0].name:
         newNodeOutput = gs.Variable(name + '_output', dtype = np.float32, shape = node.outputs[0].shape)
@@ -74,7 +75,7 @@ def _print_fun(graph: gs.Graph, match: Match, name: str, position: Literal["befo
         node.outputs[0] = newNodeOutput
 
         graph.nodes.append(newPrintNode)
-        graph.cleanup().toposort()
+        toposortGraph(cleanupGraph(graph))
 
     return graph
 
@@ -110,7 +111,7 @@ def _merge_print_fun(graph: gs.Graph, match: Match, name: str):
     newPrintNode = gs.Node(op = 'DebugPrint', name = name)
     graph.replaceInsertNode(_inputs, _outputs, newPrintNode)
 
-    graph.cleanup().toposort()
+    toposortGraph(cleanupGraph(graph))
     return graph
 
 
@@ -0,0 +1,233 @@
+# SPDX-FileCopyrightText: 2025 ETH Zurich and University of Bologna
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# Wall time and peak memory of the compiler stages.
+#
+# Stages are recorded by wrapping them in `profileStage`. This is a no-op unless a `CompilerProfiler` was activated,
+# which `NetworkDeployer.prepare` does for its `compilerProfiler`. The recorded stages are exported as a JSON report
+# and as a Chrome trace, which can be opened in chrome://tracing or https://ui.perfetto.dev.
+
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+_activeProfiler: Optional['CompilerProfiler'] = None
+
+
+@dataclass
+class ProfiledStage():
+    """Wall time and memory of one execution of a compiler stage
+    """
+    name: str
+    category: str
+    depth: int
+    start: float  # Seconds since the profiler was created
+    duration: float = 0.  # Seconds
+    peakMemory: Optional[int] = None  # Peak of traced memory above the memory at the start of the stage in bytes
+    args: Dict[str, Any] = field(default_factory = dict)
+
+
+class CompilerProfiler():
+    """Records the wall time and peak memory of compiler stages
+
+    Parameters
+    ----------
+    traceMemory : bool
+        Measure the peak memory of every stage with `tracemalloc`. Tracing memory slows down the
+        compilation noticeably, the wall times of a run with memory tracing are only comparable with
+        other runs with memory tracing.
+
+    """
+
+    def __init__(self, traceMemory: bool = True):
+        self.traceMemory = traceMemory
+        self.stages: List[ProfiledStage] = []
+        self._origin = time.perf_counter()
+        self._stack: List[ProfiledStage] = []
+        self._peaks: List[int] = []
+        self._startedTracing = False
+
+    def _foldPeak(self):
+        # tracemalloc has a single peak, so every open stage takes the peak before it is reset
+        _, peak = tracemalloc.get_traced_memory()
+        self._peaks = [max(openPeak, peak) for openPeak in self._peaks]
+        tracemalloc.reset_peak()
+
+    @contextmanager
+    def stage(self, name: str, category: str = "deeploy", **args) -> Iterator[ProfiledStage]:
+        """Record the enclosed code as a stage
+
+        Parameters
+        ----------
+        name : str
+            Name of the stage, e.g. the name of a pass
+        category : str
+            Category to group stages in the report
+        **args
+            Additional information stored with the stage. The
+            yielded `ProfiledStage` can be used to add information
+            gathered while the stage runs.
+
+        """
+        stage = ProfiledStage(name, category, len(self._stack), time.perf_counter() - self._origin, args = args)
+        self.stages.append(stage)
+        self._stack.append(stage)
+
+        memoryAtStart = 0
+        if self.traceMemory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._startedTracing = True
+            self._foldPeak()
+            memoryAtStart, _ = tracemalloc.get_traced_memory()
+            self._peaks.append(memoryAtStart)
+
+        try:
+            yield stage
+        finally:
+            stage.duration = time.perf_counter() - self._origin - stage.start
+            if self.traceMemory and tracemalloc.is_tracing():
+                self._foldPeak()
+                stage.peakMemory = self._peaks.pop() - memoryAtStart
+            self._stack.pop()
+
+            if len(self._stack) == 0 and self._startedTracing:
+                tracemalloc.stop()
+                self._startedTracing = False
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Aggregate the stages by category and name
+
+        Returns
+        -------
+        Dict[str, Dict[str, Any]]
+            Number of executions, total and maximum wall time in
+            milliseconds and maximum peak memory in bytes of each stage,
+            keyed by `<category>/<name>`
+
+        """
+        summary: Dict[str, Dict[str, Any]] = {}
+        for stage in self.stages:
+            entry = summary.setdefault(f"{stage.category}/{stage.name}", {
+                "count": 0,
+                "totalMs": 0.,
+                "maxMs": 0.,
+                "peakMemory": None
+            })
+            entry["count"] += 1
+            entry["totalMs"] += stage.duration * 1E3
+            entry["maxMs"] = max(entry["maxMs"], stage.duration * 1E3)
+            if stage.peakMemory is not None:
+                entry["peakMemory"] = max(entry["peakMemory"] or 0, stage.peakMemory)
+        return summary
+
+    def report(self) -> Dict[str, Any]:
+        """Return the structured profiling report
+
+        Returns
+        -------
+        Dict[str, Any]
+            JSON-serializable report with all recorded stages in the
+            order they started and the per-stage summary
+
+        """
+        return {
+            "traceMemory": self.traceMemory,
+            "stages": [{
+                "name": stage.name,
+                "category": stage.category,
+                "depth": stage.depth,
+                "startMs": stage.start * 1E3,
+                "durationMs": stage.duration * 1E3,
+                "peakMemory": stage.peakMemory,
+                "args": stage.args
+            } for stage in self.stages],
+            "summary": self.summary()
+        }
+
+    def chromeTrace(self) -> Dict[str, Any]:
+        """Return the recorded stages in the Chrome trace event format
+
+        Returns
+        -------
+        Dict[str, Any]
+            JSON-serializable trace with one complete event per stage
+
+        """
+        pid = os.getpid()
+        tid = threading.get_ident()
+        events = []
+        for stage in self.stages:
+            args = dict(stage.args)
+            if stage.peakMemory is not None:
+                args["peakMemory"] = stage.peakMemory
+            events.append({
+                "name": stage.name,
+                "cat": stage.category,
+                "ph": "X",
+                "ts": stage.start * 1E6,
+                "dur": stage.duration * 1E6,
+                "pid": pid,
+                "tid": tid,
+                "args": args
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export(self, reportPath: Optional[str] = None, tracePath: Optional[str] = None):
+        """Write the JSON report and the Chrome trace
+
+        Parameters
+        ----------
+        reportPath : Optional[str]
+            Path of the JSON report, not written if None
+        tracePath : Optional[str]
+            Path of the Chrome trace, not written if None
+
+        """
+        for path, content in ((reportPath, self.report), (tracePath, self.chromeTrace)):
+            if path is None:
+                continue
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok = True)
+            with open(path, "w") as f:
+                json.dump(content(), f, indent = 1, default = str)
+
+
+@contextmanager
+def activateProfiler(profiler: Optional[CompilerProfiler]) -> Iterator[Optional[CompilerProfiler]]:
+    """Record all stages run in the enclosed code with the given profiler
+
+    Parameters
+    ----------
+    profiler : Optional[CompilerProfiler]
+        Profiler to activate. If None, the currently active profiler
+        stays active.
+
+    """
+    global _activeProfiler
+    if profiler is None:
+        yield _activeProfiler
+        return
+
+    previous = _activeProfiler
+    _activeProfiler = profiler
+    try:
+        yield profiler
+    finally:
+        _activeProfiler = previous
+
+
+def profileStage(name: str, category: str = "deeploy", **args):
+    """Record the enclosed code as a stage of the active profiler
+
+    Returns a context manager yielding the `ProfiledStage`, or None if no profiler is active.
+
+    """
+    if _activeProfiler is None:
+        return nullcontext()
+    return _activeProfiler.stage(name, category, **args)
@@ -5,13 +5,17 @@
 from __future__ import annotations
 
 import copy
-import math
+import hashlib
+import io
+import json
 import os
 import pickle
 import re
+import threading
 import time
 from abc import abstractmethod
 from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from functools import reduce
 from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Set, Tuple, Type, TypeVar, Union
@@ -21,13 +25,16 @@ import numpy as np
 import onnx
 import onnx_graphsurgeon as gs
 from mako.template import Template
-from onnx.external_data_helper import convert_model_to_external_data
+from onnx.external_data_helper import convert_model_to_external_data, set_external_data
 from ortools.constraint_solver.pywrapcp import IntVar
 
+from Deeploy.CompilerProfiling import CompilerProfiler, activateProfiler, profileStage
+from Deeploy.GraphMaintenance import cleanupGraph, toposortGraph
 from Deeploy.Logging import DEFAULT_LOGGER as log
 from Deeploy.Logging import FAILURE_MARK, SUCCESS_MARK
 
-from .AbstractDataTypes import BaseType, FloatImmediate, IntegerImmediate, Pointer, PointerClass, Struct, VoidType
+from .AbstractDataTypes import BaseType, FloatImmediate, IntegerImmediate, Pointer, PointerClass, Struct, StructClass, \
+    VoidType
 
 Shape = TypeVar("Shape", bound = Any)
 SubGraph = List[gs.Node]
@@ -54,6 +61,8 @@ class CodeGenVerbosity:
     tilingProfiling: Optional[bool] = False  # Specifies if we should profile the tiling code
     untiledProfiling: Optional[bool] = None  #  Specifies if we should profile the untilied code
     microbenchmarkProfiling: Optional[bool] = False  # Wrap each layer with PULP perf-counter microbenchmark
+    tileSpecializations: Optional[int] = 0  # Maximum number of tile variants whose kernel call gets literal arguments
+    hoistArgumentStructs: Optional[bool] = False  # Build the argument structs of a tiling loop once before the loop
 
 
 _NoVerbosity = CodeGenVerbosity(None)
@@ -62,10 +71,22 @@ _middlewarePreLoweringFilename = 'middleware_pre_lowering'
 _middlewarePostLoweringFilename = 'middleware_post_lowering'
 _backendPostParsingFilename = 'backend_post_parsing'
 _backendPostBindingFilename = 'backend_post_binding'
+_compilationCacheFilename = 'compilation_cache'
 
 _ctxtExtension = '.pkl'
+_metadataExtension = '.json'
 _graphExtension = '.onnx'
 _dataExtension = '.data'
+_blobDirectory = 'blobs'
+
+_blobSizeThreshold = 1024  #: int: Arrays of at least this many bytes are moved into the blob store of compact DeeployStates
+
+_deeployStateWriter: Optional[ThreadPoolExecutor] = None
+_pendingDeeployStateWrites: List[Future] = []
+
+# Compiled template modules can be cached on disk, keyed by the hash of the template source. The cache is opt-in, set
+# the environment variable to the cache directory to enable it.
+_templateCacheDir: Optional[str] = os.environ.get("DEEPLOY_TEMPLATE_CACHE") or None
 
 
 # SCHEREMO: mako.Templates are not copiable, since they can use shared context.
@@ -84,6 +105,55 @@ class _Template(Template):
         memo[id(self)] = _copy
         return _copy
 
+    @classmethod
+    def cached(cls, text: str, strict_undefined: bool = False) -> _Template:
+        """Compile a template, reusing the generated module from the template cache if possible
+
+        The template source is stored in the cache directory and compiled
+        through mako's `module_directory` mechanism, i.e., the generated
+        Python module and its bytecode are only rebuilt if the source
+        changed. Falls back to in-memory compilation if the cache
+        directory is unavailable.
+
+        Parameters
+        ----------
+        text : str
+            Mako template string
+        strict_undefined : bool
+            Raise on undefined template variables
+
+        Returns
+        -------
+        _Template
+            The compiled template
+
+        """
+        if _templateCacheDir is None:
+            return cls(text, strict_undefined = strict_undefined)
+
+        key = hashlib.sha1(f"{mako.__version__}:{strict_undefined}:{text}".encode()).hexdigest()
+        sourcePath = os.path.join(_templateCacheDir, key + ".mako")
+
+        try:
+            if not os.path.exists(sourcePath):
+                os.makedirs(_templateCacheDir, exist_ok = True)
+                tmpPath = f"{sourcePath}.{os.getpid()}.tmp"
+                with open(tmpPath, "w", encoding = "utf-8") as f:
+                    f.write(text)
+                os.replace(tmpPath, sourcePath)
+
+            template = cls(filename = sourcePath,
+                           module_filename = os.path.join(_templateCacheDir, key + ".py"),
+                           input_encoding = "utf-8",
+                           strict_undefined = strict_undefined)
+        except OSError:
+            return cls(text, strict_undefined = strict_undefined)
+
+        # File-based templates don't keep their source, but code transformations re-parse it
+        template._source = text
+        template._code = None
+        return template
+
 
 class NodeTemplate():
     """This class wraps a `Mako.Template` with additional functionality for hoisting transient buffers and adding expressions to the parsers' node representation"""
@@ -100,11 +170,23 @@ class NodeTemplate():
             or the `alignToContext` method.
 
         """
-        self.template = _Template(templateStr, strict_undefined = True)
+        self.templateStr = templateStr
+        self._template: Optional[_Template] = None
         self.subTemplates: Dict[str, Tuple[NodeTemplate, Callable[[NetworkContext, OperatorRepresentation],
                                                                   Tuple[NetworkContext, OperatorRepresentation]]]] = {}
         self.subTemplateGenerators = {}
 
+    @property
+    def template(self) -> _Template:
+        """The compiled mako template, compiled on first use"""
+        if self._template is None:
+            self._template = _Template.cached(self.templateStr, strict_undefined = True)
+        return self._template
+
+    @template.setter
+    def template(self, template: _Template):
+        self._template = template
+
     def internalSize(self) -> int:
         """Return the byte size of internal memory buffers used by this template
 
@@ -260,8 +342,16 @@ class VariableBuffer():
 
         self.aliases: Set[str] = set(aliases) if aliases is not None else set()
 
+    def _bufferSize(self) -> int:
+        numElements = int(np.prod(self.shape))
+        referencedType = self._type.referencedType
+        # Packed sub-byte buffers are declared as arrays of their byte containers
+        if referencedType.isPacked:
+            return referencedType.sizeInBytes(numElements)
+        return numElements
+
     def _bufferRepresentation(self) -> Dict:
-        return {"type": self._instance, "name": self.name, "size": int(np.prod(self.shape))}
+        return {"type": self._instance, "name": self.name, "size": self._bufferSize()}
 
     def init(self) -> str:
         """Return a string representation of the C code to declare this memory buffer
@@ -359,7 +449,7 @@ class VariableBuffer():
             Size of this VariableBuffer in bytes
 
         """
-        return (math.prod(self.shape) * (self._type.referencedType.typeWidth)) // 8
+        return self._type.referencedType.sizeInBytes(int(np.prod(self.shape)))
 
 
 class TransientBuffer(VariableBuffer):
@@ -398,6 +488,8 @@ class ConstantBuffer(VariableBuffer):
 
     """
 
+    binaryInitTemplate: Optional[NodeTemplate] = None  #: NodeTemplate: Holds the buffer's binary blob declaration
+
     def __init__(self, name: str = '', shape = [1], values = [0]):
         super().__init__(name, shape)
         values = np.asarray(values)
@@ -414,7 +506,10 @@ class ConstantBuffer(VariableBuffer):
 
     def _valueString(self) -> str:
         values = list(self.values.reshape(-1))
-        if self._type.typeName == 'float32_t*':
+        if self._type.referencedType.isPacked:
+            values = list(self._type.referencedType.packValues(self.values))
+            strValues = [f'{int(value)}' for value in values]
+        elif self._type.typeName == 'float32_t*':
             strValues = [f'{value}f' for value in values]
         elif self._type.typeName == 'int8_t*':
             strValues = [f'{int(value)}' for value in values]
@@ -430,7 +525,41 @@ class ConstantBuffer(VariableBuffer):
         return f'ConstantBuffer: name: {self.name}, type: {self._type}'
 
     def _bufferRepresentation(self) -> Dict:
-        return {"type": self._type, "name": self.name, "size": int(np.prod(self.shape)), "values": self._valueString()}
+        operatorRepresentation = {"type": self._type, "name": self.name, "size": self._bufferSize()}
+        if hasattr(self, "_blobPath"):
+            operatorRepresentation["blobPath"] = self._blobPath
+        else:
+            operatorRepresentation["values"] = self._valueString()
+        return operatorRepresentation
+
+    def init(self) -> str:
+        if hasattr(self, "_blobPath"):
+            return self.binaryInitTemplate.generate(self._bufferRepresentation())
+        return super().init()
+
+    def _binaryInitTemplate(self) -> Optional[NodeTemplate]:
+        """Return the template declaring this buffer with values linked from a binary blob
+
+        Returns
+        -------
+        Optional[NodeTemplate]
+            The binary init template, or None if this buffer has to be
+            declared as literal array
+
+        """
+        return self.binaryInitTemplate
+
+    def binaryImage(self) -> Optional[np.ndarray]:
+        """Return the in-memory representation of this buffer's values
+
+        Returns
+        -------
+        Optional[np.ndarray]
+            uint8 array of the buffer's bytes, or None if the binary
+            representation of the buffer's type is not known
+
+        """
+        return self._type.referencedType.binaryImage(self.values)
 
 
 class StructBuffer(VariableBuffer):
@@ -517,6 +646,125 @@ class _ReferenceBuffer(VariableBuffer):
         return self.__str__()
 
 
+def _valueDigest(values: Any) -> str:
+    # Independent of shape and data type, such that reshaped or cast copies of the same values match
+    return hashlib.sha1(np.ascontiguousarray(np.asarray(values, dtype = np.float64).reshape(-1)).tobytes()).hexdigest()
+
+
+def _structureDigest(graph: gs.Graph, extra: Sequence[Any] = ()) -> str:
+    # Digest of everything but the values of the constants: nodes, attributes, tensor names, shapes and types
+
+    def _attrRepresentation(value: Any) -> Any:
+        if isinstance(value, np.ndarray):
+            return ("ndarray", value.dtype.str, value.shape,
+                    hashlib.sha1(np.ascontiguousarray(value).tobytes()).hexdigest())
+        if isinstance(value, gs.Tensor):
+            return ("tensor", value.name, value.shape, str(value.dtype))
+        if isinstance(value, gs.Graph):
+            return ("graph", _structureDigest(value))
+        if isinstance(value, (list, tuple)):
+            return [_attrRepresentation(item) for item in value]
+        return repr(value)
+
+    tensors = [(name, type(tensor).__name__, repr(tensor.shape), str(tensor.dtype))
+               for name, tensor in sorted(graph.tensors().items())]
+    nodes = [(node.op, node.name, [tensor.name for tensor in node.inputs], [tensor.name for tensor in node.outputs],
+              [(key, _attrRepresentation(value)) for key, value in sorted(node.attrs.items())]) for node in graph.nodes]
+    structure = (tensors, nodes, [tensor.name for tensor in graph.inputs], [tensor.name for tensor in graph.outputs],
+                 list(extra))
+    return hashlib.sha1(repr(structure).encode()).hexdigest()
+
+
+# Attributes of deployers and tilers that do not change the generated code of the network
+_cacheIrrelevantOptions = {
+    "deeployStateDir", "deeployStateSnapshots", "compactDeeployState", "asyncDeeployState", "compilationCacheDir",
+    "reusedCompilation", "binaryConstantDir", "parsed", "bound", "transformed", "prepared", "visualizeMemoryAlloc",
+    "testName", "workDir"
+}
+
+
+def _optionsDigest(objects: Sequence[Any]) -> str:
+    # Digest of the classes and the public scalar attributes, i.e. the options, of deployers, tilers, engines and the
+    # code generation verbosity
+    options = []
+    for obj in objects:
+        attributes: Dict[str, Any] = {}
+        for cls in reversed(type(obj).__mro__):
+            attributes.update(vars(cls))
+        attributes.update(vars(obj))
+
+        options.append(type(obj).__name__)
+        options += [(name, value)
+                    for name, value in sorted(attributes.items())
+                    if not name.startswith("_") and name not in _cacheIrrelevantOptions and (
+                        value is None or isinstance(value, (bool, int, float, str)))]
+    return hashlib.sha1(repr(options).encode()).hexdigest()
+
+
+class _BlobStore():
+    """Content-addressed store of raw array data, shared by all compact DeeployState snapshots in a directory"""
+
+    def __init__(self, folderPath: str):
+        self.path = os.path.join(os.path.abspath(folderPath), _blobDirectory)
+        self._pending: Dict[str, bytes] = {}
+
+    def put(self, data: bytes) -> str:
+        key = hashlib.sha1(data).hexdigest()
+        if not os.path.exists(os.path.join(self.path, key)):
+            self._pending[key] = data
+        return key
+
+    def get(self, key: str) -> bytes:
+        with open(os.path.join(self.path, key), 'rb') as f:
+            return f.read()
+
+    def flush(self):
+        """Write all blobs added since the last flush"""
+        os.makedirs(self.path, exist_ok = True)
+        for key, data in self._pending.items():
+            path = os.path.join(self.path, key)
+            if os.path.exists(path):
+                continue
+            tmpPath = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmpPath, 'wb') as f:
+                f.write(data)
+            os.replace(tmpPath, path)
+        self._pending = {}
+
+
+class _BlobPickler(pickle.Pickler):
+
+    def __init__(self, file, blobStore: Optional[_BlobStore] = None):
+        super().__init__(file)
+        self.blobStore = blobStore
+
+    def persistent_id(self, obj):
+        if self.blobStore is None or type(obj) is not np.ndarray or obj.nbytes < _blobSizeThreshold or \
+                obj.dtype.hasobject or obj.dtype.fields:
+            return None
+        return ("ndarray", self.blobStore.put(np.ascontiguousarray(obj).tobytes()), obj.dtype.str, obj.shape)
+
+    def reducer_override(self, obj):
+        # Struct and pointer classes are created at runtime, so they have to be recreated instead of looked up
+        if isinstance(obj, type) and issubclass(obj, Struct) and "structTypeDict" in obj.__dict__:
+            return StructClass, (obj.typeName, obj.structTypeDict)
+        if isinstance(obj, type) and issubclass(obj, Pointer) and "referencedType" in obj.__dict__ and \
+                obj.__name__ == obj.referencedType.typeName + "Ptr":
+            return PointerClass, (obj.referencedType,)
+        return NotImplemented
+
+
+class _BlobUnpickler(pickle.Unpickler):
+
+    def __init__(self, file, blobStore: _BlobStore):
+        super().__init__(file)
+        self.blobStore = blobStore
+
+    def persistent_load(self, pid):
+        _, key, dtype, shape = pid
+        return np.frombuffer(bytearray(self.blobStore.get(key)), dtype = dtype).reshape(shape)
+
+
 class NetworkContext():
     """The global context of the compiler. This object holds all the typing inferred in the type-checking passes within
     the respective buffers. It holds all hoisted transient buffers, struct buffers, and global definitions.
@@ -595,7 +843,7 @@ class NetworkContext():
             assert ref.name not in seenRefs, "Circular reference found"
         return ref
 
-    def exportNetworkContext(self, folderPath: str, fileName: str):
+    def exportNetworkContext(self, folderPath: str, fileName: str, blobStore: Optional[_BlobStore] = None):
         """Exports the NetworkContext as a pickled dictionary
 
         Parameters
@@ -605,6 +853,9 @@ class NetworkContext():
             saved
         fileName : str
             Name of the pickled context file
+        blobStore : Optional[_BlobStore]
+            If set, large arrays are stored in the blob store and only
+            referenced from the pickled context
 
         Raises
         ------
@@ -618,8 +869,17 @@ class NetworkContext():
         if not os.path.isabs(absolutePath):
             raise OSError(f"Error exporting the context to: {absolutePath}")
 
+        data = self._serialize(blobStore)
+        if blobStore is not None:
+            blobStore.flush()
+
         with open(absolutePath, 'wb') as f:
-            pickle.dump(self, f)
+            f.write(data)
+
+    def _serialize(self, blobStore: Optional[_BlobStore] = None) -> bytes:
+        buffer = io.BytesIO()
+        _BlobPickler(buffer, blobStore).dump(self)
+        return buffer.getvalue()
 
     @staticmethod
     def importNetworkContext(folderPath, fileName):
@@ -646,8 +906,9 @@ class NetworkContext():
         if not os.path.isabs(absolutePath) or not os.path.exists(absolutePath):
             raise OSError(f"File or path does not exist: {absolutePath}")
 
+        # Contexts without blob references never touch the blob store
         with open(absolutePath, 'rb') as f:
-            return pickle.load(f)
+            return _BlobUnpickler(f, _BlobStore(folderPath)).load()
 
     def __repr__(self):
         globalObjects = []
@@ -1415,6 +1676,10 @@ class ExecutionBlock():
             )  #: Sequence[CodeSnippet]: ordered list of code snippets that need to be generated to implemented the associated operator
 
         self.patternMemoryConstraint: Optional = None  #: Optional[PatternMemoryConstraint]: Tiling information of the operator which is annotated in the midend
+        self.issuedPrefetches: Dict = {
+        }  #: Dict[str, CrossLayerPrefetch]: First tiles of the next operator this block transfers, per memory level
+        self.receivedPrefetches: Dict = {
+        }  #: Dict[str, CrossLayerPrefetch]: First tiles of this block transferred by the previous operator, per memory level
 
     def addLeft(self, template: NodeTemplate, operatorRepresentation: OperatorRepresentation):
         """Adds a code snippet that is generated BEFORE any of the other code snippets in this ExecutionBlock
@@ -2165,6 +2430,9 @@ class TopologyOptimizationPass():
 
     """
 
+    # Passes which only annotate nodes don't require cleaning up and sorting the graph after they are applied
+    modifiesTopology: bool = True
+
     def __init__(self):
         pass
 
@@ -2209,11 +2477,121 @@ class TopologyOptimizer():
 
         """
         for _pass in self.passes:
-            start_time = time.perf_counter()
+            graph = self._applyPass(_pass, graph)
+        return graph
+
+    def _applyPass(self, _pass: TopologyOptimizationPass, graph: gs.Graph) -> gs.Graph:
+        start_time = time.perf_counter()
+        with profileStage(_pass.__class__.__name__, "topologyOptimizationPass", optimizer = self.name):
             graph = _pass.apply(graph)
-            graph.cleanup().toposort()
-            end_time = time.perf_counter()
-            log.debug(f" - Applied {_pass.__class__.__name__} ({(end_time - start_time)*1E3:.3f} ms)")
+            if getattr(_pass, "modifiesTopology", True):
+                toposortGraph(cleanupGraph(graph))
+        end_time = time.perf_counter()
+        log.debug(f" - Applied {_pass.__class__.__name__} ({(end_time - start_time)*1E3:.3f} ms)")
+        return graph
+
+
+class FixpointTopologyOptimizer(TopologyOptimizer):
+    """Wrapper object to apply TopologyOptimizationPasses until none of them changes the graph anymore
+
+    After the first sweep over all passes, a pass is only re-run if nodes it matches on were added,
+    removed or rewired since its last application. Passes matching a `pattern` care about the
+    operations of the pattern, all other passes are re-run after any change of the graph.
+
+    """
+
+    def __init__(self,
+                 passes: List[TopologyOptimizationPass],
+                 name: str = "FixpointTopologyOptimizer",
+                 maxIterations: int = 16):
+        super().__init__(passes, name)
+        self.maxIterations = maxIterations
+
+    @staticmethod
+    def _patternOps(_pass: TopologyOptimizationPass) -> Optional[Set[str]]:
+        # Returns None if the pass may react to any operation
+        pattern = getattr(_pass, "pattern", None)
+        if isinstance(pattern, gs.Graph):
+            if getattr(getattr(_pass, "matcher", None), "regex_op", False):
+                return None
+            return {node.op for node in pattern.nodes}
+
+        if hasattr(_pass, "named_subpasses") and len(_pass.named_subpasses()) > 0:
+            ops = set()
+            for subpass in _pass.named_subpasses().values():
+                subpassOps = FixpointTopologyOptimizer._patternOps(subpass)
+                if subpassOps is None:
+                    return None
+                ops |= subpassOps
+            return ops
+
+        return None
+
+    @staticmethod
+    def _nodeStates(graph: gs.Graph) -> Dict[int, Tuple]:
+        # Keep references to the nodes and tensors so their ids stay unique while states are compared
+        return {
+            id(node): (node, node.op, tuple(node.inputs), tuple(node.outputs),
+                       tuple(consumer for tensor in node.outputs for consumer in tensor.outputs)) for node in graph.nodes
+        }
+
+    @staticmethod
+    def _changedOps(before: Dict[int, Tuple], after: Dict[int, Tuple]) -> Set[str]:
+
+        def _sameState(a: Tuple, b: Tuple) -> bool:
+            return a[1] == b[1] and all(
+                len(x) == len(y) and all(u is v for u, v in zip(x, y)) for x, y in zip(a[2:], b[2:]))
+
+        changedOps = set()
+        for key, state in before.items():
+            if key not in after or not _sameState(state, after[key]):
+                changedOps.add(state[1])
+        for key, state in after.items():
+            if key not in before or not _sameState(state, before[key]):
+                changedOps.add(state[1])
+        return changedOps
+
+    def optimize(self, graph: gs.Graph) -> Tuple[gs.Graph]:
+        """Applies passes until the graph reaches a fixpoint
+
+        Parameters
+        ----------
+        graph : gs.Graph
+            Current neural network graph
+
+        Returns
+        -------
+        Tuple[gs.Graph]
+            Modified neural network graph
+
+        """
+        patternOps = [self._patternOps(_pass) for _pass in self.passes]
+        # Operations changed since the last application of each pass, None if the pass has not been applied yet
+        dirtyOps: List[Optional[Set[str]]] = [None] * len(self.passes)
+
+        for iteration in range(self.maxIterations):
+            changed = False
+            for idx, _pass in enumerate(self.passes):
+                if dirtyOps[idx] is not None and (len(dirtyOps[idx]) == 0 or
+                                                  (patternOps[idx] is not None
+                                                   and patternOps[idx].isdisjoint(dirtyOps[idx]))):
+                    continue
+
+                before = self._nodeStates(graph)
+                graph = self._applyPass(_pass, graph)
+                changedOps = self._changedOps(before, self._nodeStates(graph))
+                changed |= len(changedOps) > 0
+
+                dirtyOps[idx] = set()
+                for ops in dirtyOps:
+                    if ops is not None:
+                        ops |= changedOps
+
+            if not changed:
+                log.debug(f" - {self.name} converged after {iteration + 1} iterations")
+                return graph
+
+        log.warning(f"{self.name} did not converge after {self.maxIterations} iterations!")
         return graph
 
 
@@ -2261,8 +2639,9 @@ class NetworkOptimizer(TopologyOptimizer):
 
         """
         for _pass in self.passes:
-            ctxt, graph = _pass.apply(ctxt, graph)  # type: ignore
-            graph.cleanup().toposort()
+            with profileStage(_pass.__class__.__name__, "networkOptimizationPass", optimizer = self.name):
+                ctxt, graph = _pass.apply(ctxt, graph)  # type: ignore
+                toposortGraph(cleanupGraph(graph))
         return ctxt, graph
 
 
@@ -2333,7 +2712,8 @@ class CodeTransformation():
 
         """
         for _pass in self.passes:
-            ctxt, executionBlock = _pass.apply(ctxt, executionBlock, name, verbose)
+            with profileStage(_pass.__class__.__name__, "codeTransformationPass", node = name):
+                ctxt, executionBlock = _pass.apply(ctxt, executionBlock, name, verbose)
         return ctxt, executionBlock
 
 
@@ -2484,6 +2864,33 @@ class NetworkContainer():
 
         self.deeployStateDir = deeployStateDir
 
+        # If set, constants are written as binary blobs into this subdirectory of the generated sources and linked with
+        # .incbin, which requires an ELF toolchain (.pushsection)
+        self.binaryConstantDir: Optional[str] = None
+
+        # DeeployState snapshots to export: "off", "final" (final state and error dumps only) or "all"
+        self.deeployStateSnapshots: Literal["off", "final", "all"] = "all"
+        # If set, snapshots store constants once in a content-addressed blob store
+        self.compactDeeployState = False
+        # If set, snapshots are written to disk by a background thread
+        self.asyncDeeployState = False
+
+        # If set, wall time and peak memory of the compiler stages are recorded while preparing the deployment
+        self.compilerProfiler: Optional[CompilerProfiler] = None
+        # Number of times parsing backtracked because a layer could not be parsed, by node name
+        self.parseBacktracks: Dict[str, int] = {}
+
+        # If set, the compilation is cached in this directory and reused when only the values of constants change
+        self.compilationCacheDir: Optional[str] = None
+        # Set if the cached compilation was reused, only constants and L3 files have to be regenerated then
+        self.reusedCompilation = False
+        # Constants merged into another buffer by the constant deduplication
+        self.constantRenames: Dict[str, str] = {}
+        self._loweredStructure: Optional[str] = None
+        # Verbosity of the code generation in progress, part of the options a cached compilation has to match
+        self._codeGenVerbosity: CodeGenVerbosity = _NoVerbosity
+        self._loweredConstants: Dict[str, str] = {}
+
         self.bound = False
         self.transformed = False
 
@@ -2673,6 +3080,7 @@ class NetworkContainer():
         iteration_main = 0
         iteration_sub = 0
         iteration_tot = 0
+        backtracks: Dict[str, int] = {}
         while (idx < len(scheduledLayerList)):
             currentLayer = scheduledLayerList[idx]
 
@@ -2719,6 +3127,7 @@ class NetworkContainer():
                         f'Did not find adequate mapping for graph! Explored until layer {deepestLayer.__class__.__name__} of node {deepestNodeName}'
                         f'Candidates: {[type(x.parser).__name__ for x in deepestLayer.maps]}. Exhausted backtracking.')
 
+                backtracks[currentLayer.node.name] = backtracks.get(currentLayer.node.name, 0) + 1
                 previousLayer = scheduledLayerList[idx - 1]
                 ctxt = ctxtStack.pop()
 
@@ -2743,6 +3152,7 @@ class NetworkContainer():
             f" {SUCCESS_MARK} Parsed network with {len(self.layerBinding)} layers after {iteration_tot} iterations in {(end_time-start_time)*1E3:.3f} ms"
         )
         self.ctxt = ctxt
+        self.parseBacktracks = backtracks
         self.parsed = True
         return True
 
@@ -2913,7 +3323,7 @@ class NetworkContainer():
 
         numBytes = []
         for node in inputs:
-            numBytes.append(str(np.prod(node.shape) * node._type.referencedType.typeWidth // 8))
+            numBytes.append(str(node.sizeInBytes))
         callStack += ", ".join(numBytes)
 
         callStack += "};"
@@ -2922,7 +3332,7 @@ class NetworkContainer():
 
         numBytes = []
         for node in outputs:
-            numBytes.append(str(np.prod(node.shape) * node._type.referencedType.typeWidth // 8))
+            numBytes.append(str(node.sizeInBytes))
         callStack += ", ".join(numBytes)
 
         callStack += "};"
@@ -2936,9 +3346,15 @@ class NetworkContainer():
         return self.ctxt._maxDynamicSize
 
     # Don't override this
-    def generateBufferInitializationCode(self) -> str:
+    def generateBufferInitializationCode(self, constants: bool = True) -> str:
         """Generates code for all forward-declaration of buffers used during inference
 
+        Parameters
+        ----------
+        constants : bool
+            Whether to include the declarations of constant buffers,
+            see `generateConstantInitializationCode`
+
         Returns
         -------
         str
@@ -2962,10 +3378,13 @@ class NetworkContainer():
         for node in ctxt.globalObjects.values():
             if isinstance(node, VariableBuffer) and not isinstance(node, StructBuffer):
                 assert issubclass(node._type, Pointer), f"Global VariableBuffer {node.name} is not a Pointer!"
-                if node._deploy:
+                if node._deploy and (constants or not isinstance(node, ConstantBuffer)):
                     name = node.name
                     node.name = ctxt._mangle(node.name)
-                    callStack += node.init()
+                    if isinstance(node, ConstantBuffer) and self.binaryConstantDir is not None:
+                        callStack += self._binaryConstantInit(node)
+                    else:
+                        callStack += node.init()
                     node.name = name
 
         for node in ctxt.globalObjects.values():
@@ -2980,6 +3399,80 @@ class NetworkContainer():
 
         return callStack
 
+    # Don't override this
+    def generateConstantInitializationCode(self) -> str:
+        """Generates the declarations of all deployed constant buffers
+
+        Together with `generateBufferInitializationCode(constants = False)`,
+        this declares the same buffers as `generateBufferInitializationCode()`,
+        but keeps the values of the constants separate from the rest of the
+        network code.
+
+        Returns
+        -------
+        str
+            Constant declaration code
+
+        Raises
+        ------
+        RuntimeError
+            Raises a RuntimeError if network is not parsed and bound
+
+        """
+        if not self.parsed or not self.bound:
+            raise RuntimeError('You need to parse and bind the network before generating code!')
+
+        ctxt = self.ctxt.copy()
+
+        callStack = ''
+        for node in ctxt.globalObjects.values():
+            if isinstance(node, ConstantBuffer) and node._deploy:
+                assert issubclass(node._type, Pointer), f"Global ConstantBuffer {node.name} is not a Pointer!"
+                name = node.name
+                node.name = ctxt._mangle(node.name)
+                if self.binaryConstantDir is not None:
+                    callStack += self._binaryConstantInit(node)
+                else:
+                    callStack += node.init()
+                node.name = name
+
+        return callStack
+
+    def _binaryConstantInit(self, buffer: ConstantBuffer) -> str:
+        """Write the values of a constant buffer into `binaryConstantDir` and return its declaration
+
+        Buffers whose platform or type does not support binary emission
+        fall back to literal arrays.
+
+        Parameters
+        ----------
+        buffer : ConstantBuffer
+            Constant buffer with its mangled name
+
+        Returns
+        -------
+        str
+            C code declaring the buffer
+
+        """
+        template = buffer._binaryInitTemplate()
+        image = buffer.binaryImage() if template is not None else None
+        if image is None:
+            return buffer.init()
+
+        # Blobs are padded to full words, like the literal arrays of platforms with word-sized transfers
+        image = np.pad(image, (0, (-image.size) % 4))
+
+        os.makedirs(self.binaryConstantDir, exist_ok = True)
+        image.tofile(os.path.join(self.binaryConstantDir, f"{buffer.name}.bin"))
+
+        # The assembler looks the blob up relative to the generated sources, which are on the include path of the build
+        buffer._blobPath = f"{os.path.basename(os.path.normpath(self.binaryConstantDir))}/{buffer.name}.bin"
+        code = buffer.init()
+        del buffer._blobPath
+
+        return code
+
     def generateBufferAllocationCode(self) -> str:
         """Generates code to allocate space for the global input and output buffer of the network
 
@@ -3116,7 +3609,7 @@ class NetworkContainer():
         return totalSum
 
         # Don't override this
-    def _exportGraph(self, folderPath, fileName):
+    def _exportGraph(self, folderPath, fileName, blobStore: Optional[_BlobStore] = None) -> Callable[[], None]:
         relativeDataPath = os.path.join(folderPath, fileName + _dataExtension)
         absoluteDataPath = os.path.abspath(relativeDataPath)
         relativeOnnxPath = os.path.join(folderPath, fileName + _graphExtension)
@@ -3155,12 +3648,32 @@ class NetworkContainer():
                     if hasattr(gObject._type, "referencedType"):
                         tensor.doc_string += f"Reference Type: {gObject._type.referencedType.typeName}"
 
-        convert_model_to_external_data(model, location = fileName + _dataExtension)
-        onnx.save(model, absoluteOnnxPath)
+        if blobStore is None:
+
+            def save():
+                convert_model_to_external_data(model, location = fileName + _dataExtension)
+                onnx.save(model, absoluteOnnxPath)
+
+            return save
+
+        # Reference large initializers from the blob store instead of a per-snapshot data file
+        for tensor in model.graph.initializer:
+            if tensor.HasField("raw_data") and len(tensor.raw_data) >= _blobSizeThreshold:
+                key = blobStore.put(tensor.raw_data)
+                set_external_data(tensor, location = f"{_blobDirectory}/{key}")
+                tensor.ClearField("raw_data")
+
+        return lambda: onnx.save(model, absoluteOnnxPath)
 
     def exportDeeployState(self, folderPath: str, fileName: str):
         """Export compressed network context and neural network graph
 
+        If `compactDeeployState` is set, constants are stored once in
+        a content-addressed blob store shared by all snapshots in
+        `folderPath`. If `asyncDeeployState` is set, the snapshot is
+        taken immediately but written to disk by a background thread;
+        use `waitDeeployState` to wait for pending writes.
+
         Parameters
         ----------
         folderPath : str
@@ -3171,8 +3684,49 @@ class NetworkContainer():
         """
 
         os.makedirs(os.path.abspath(folderPath), exist_ok = True)
-        self._exportGraph(folderPath, fileName)
-        self.ctxt.exportNetworkContext(folderPath, fileName)
+        blobStore = _BlobStore(folderPath) if self.compactDeeployState else None
+        saveGraph = self._exportGraph(folderPath, fileName, blobStore)
+        ctxtData = self.ctxt._serialize(blobStore)
+        ctxtPath = os.path.abspath(os.path.join(folderPath, fileName + _ctxtExtension))
+
+        def write():
+            # Blobs go first, so that no snapshot ever references a missing blob
+            if blobStore is not None:
+                blobStore.flush()
+            saveGraph()
+            with open(ctxtPath, 'wb') as f:
+                f.write(ctxtData)
+
+        if not self.asyncDeeployState:
+            write()
+            return
+
+        global _deeployStateWriter
+        if _deeployStateWriter is None:
+            _deeployStateWriter = ThreadPoolExecutor(max_workers = 1, thread_name_prefix = "DeeployState")
+        _pendingDeeployStateWrites.append(_deeployStateWriter.submit(write))
+
+    def waitDeeployState(self):
+        """Wait until all DeeployState snapshots are written to disk
+
+        Raises
+        ------
+        Exception
+            Re-raises the first error of a failed background write
+
+        """
+        while len(_pendingDeeployStateWrites) > 0:
+            _pendingDeeployStateWrites.pop(0).result()
+
+    def _snapshotDeeployState(self, fileName: str, final: bool = False):
+        assert self.deeployStateSnapshots in ("off", "final", "all"), \
+            f"Unknown DeeployState snapshot policy {self.deeployStateSnapshots}!"
+
+        if self.deeployStateSnapshots == "off" or (self.deeployStateSnapshots == "final" and not final):
+            return
+
+        log.info(f"> Export State {fileName}[.onnx|.pkl]")
+        self.exportDeeployState(self.deeployStateDir, fileName)
 
     @staticmethod
     def _importONNXGraph(folderPath: str, fileName: str) -> gs.Graph:
@@ -3196,6 +3750,7 @@ class NetworkContainer():
             prefix of the saved artifacts
 
         """
+        self.waitDeeployState()
         self.graph = NetworkDeployer._importONNXGraph(folderPath, f"{fileName}")
         self.ctxt = NetworkContext.importNetworkContext(folderPath, f"{fileName}")
 
@@ -3295,7 +3850,8 @@ class NetworkDeployer(NetworkContainer):
         )
 
     # Don't override this
-    # Duplicate constants with multiple users
+    # Duplicate constants with multiple users such that every user may transform its own copy;
+    # copies that remain identical are merged again after binding, see _deduplicateConstants
     def _duplicateConstants(self, graph: gs.Graph) -> None:
         # Duplicate constant tensors
         for tensor in filter(lambda t: isinstance(t, gs.Constant) and len(t.outputs) > 1, graph.tensors().values()):
@@ -3344,6 +3900,113 @@ class NetworkDeployer(NetworkContainer):
 
         graph.cleanup().toposort()
 
+    @staticmethod
+    def _renameBufferReferences(value: Any, renames: Dict[str, str]) -> Any:
+        if isinstance(value, str):
+            return renames.get(value, value)
+        if isinstance(value, list):
+            return [NetworkDeployer._renameBufferReferences(val, renames) for val in value]
+        if isinstance(value, tuple):
+            return tuple(NetworkDeployer._renameBufferReferences(val, renames) for val in value)
+        if isinstance(value, dict):
+            return {key: NetworkDeployer._renameBufferReferences(val, renames) for key, val in value.items()}
+        return value
+
+    @staticmethod
+    def _referencesBuffer(value: Any, names: Set[str]) -> bool:
+        if isinstance(value, str):
+            return value in names
+        if isinstance(value, (list, tuple)):
+            return any(NetworkDeployer._referencesBuffer(val, names) for val in value)
+        if isinstance(value, dict):
+            return any(NetworkDeployer._referencesBuffer(val, names) for val in value.values())
+        return False
+
+    # Don't override this
+    # Merge byte-identical constants into a single buffer shared by all of their consumers
+    def _deduplicateConstants(self) -> int:
+        """Merge deployed constants whose values are byte-identical
+
+        Constants are duplicated per consumer in the frontEnd, such that
+        lowering, parsing and template alignment may transform them in place
+        (copy-on-transform). Once every layer is bound, all constants hold
+        their final values; buffers with identical type, memory level, shape
+        and content are merged into the first one encountered.
+
+        Only constants of the graph are merged. Their consumers are rewired
+        through the operator representation keys their parsers bound to the
+        input tensors of the node, other fields are left untouched.
+
+        Returns
+        -------
+        int
+            The number of removed constant buffers
+
+        """
+        candidates: Dict[Tuple, List[ConstantBuffer]] = {}
+        renames: Dict[str, str] = {}
+        tensors = self.graph.tensors()
+
+        for buffer in list(self.ctxt.globalObjects.values()):
+            if not isinstance(buffer, ConstantBuffer) or not buffer._deploy or not hasattr(buffer, "_type"):
+                continue
+
+            # Constants hoisted by templates are referenced by keys which are not known here
+            if not isinstance(tensors.get(buffer.name), gs.Constant):
+                continue
+
+            values = np.ascontiguousarray(buffer.values)
+            key = (type(buffer), buffer._type.referencedType.typeName, getattr(buffer, "_memoryLevel", None),
+                   tuple(values.shape), values.dtype.str, hashlib.sha1(values.tobytes()).hexdigest())
+
+            bucket = candidates.setdefault(key, [])
+            canonical = next((other for other in bucket if np.array_equal(other.values, values)), None)
+            if canonical is None:
+                bucket.append(buffer)
+                continue
+
+            renames[buffer.name] = canonical.name
+            canonical._users += [user for user in buffer._users if user not in canonical._users]
+            del self.ctxt.globalObjects[buffer.name]
+
+        if len(renames) == 0:
+            return 0
+
+        self.constantRenames.update(renames)
+
+        for layer in self.layerBinding.values():
+            layerRenames = {tensor.name: renames[tensor.name] for tensor in layer.node.inputs if tensor.name in renames}
+            if len(layerRenames) == 0:
+                continue
+
+            parserRepresentation = layer.mapper.parser.operatorRepresentation
+            referenceKeys = [
+                key for key, value in parserRepresentation.items()
+                if self._referencesBuffer(value, set(layerRenames.keys()))
+            ]
+
+            operatorRepresentations = [parserRepresentation]
+            operatorRepresentations += [
+                snippet.operatorRepresentation for snippet in layer.mapper.binder.executionBlock.codeSnippets
+            ]
+            for operatorRepresentation in operatorRepresentations:
+                for key in referenceKeys:
+                    if key in operatorRepresentation:
+                        operatorRepresentation[key] = self._renameBufferReferences(operatorRepresentation[key],
+                                                                                   layerRenames)
+
+        for buffer in list(self.ctxt.globalObjects.values()) + list(self.ctxt.localObjects.values()):
+            if isinstance(buffer, _ReferenceBuffer):
+                buffer._referenceName = renames.get(buffer._referenceName, buffer._referenceName)
+
+        for node in self.graph.nodes:
+            for idx, tensor in enumerate(node.inputs):
+                if tensor.name in renames and renames[tensor.name] in tensors:
+                    node.inputs[idx] = tensors[renames[tensor.name]]
+        self.graph.cleanup()
+
+        return len(renames)
+
     def _foldConstants(self, graph: gs.Graph):
         graph.fold_constants()
         graph.cleanup().toposort()
@@ -3405,6 +4068,140 @@ class NetworkDeployer(NetworkContainer):
         assert len(missingShapes) == 0, \
             f"Shape inference is not supported.\nFound tensors with missing shape annotation: {missingShapes}"
 
+    def _compilationKey(self) -> List[str]:
+        # Settings besides the graph that have to match to reuse a compilation
+        key = [
+            self.name, self.Platform.__class__.__name__,
+            str(self.default_channels_first), *[engine.name for engine in self.Platform.engines],
+            *[f"{name}: {_type.typeName}" for name, _type in sorted(self.inputTypes.items())]
+        ]
+        memoryHierarchy = getattr(self.Platform, "memoryHierarchy", None)
+        if memoryHierarchy is not None:
+            key += [f"{level.name}: {level.size}" for level in memoryHierarchy.memoryLevels.values()]
+
+        # Options of all deployer wrappers, the tiler, the engines and the code generation verbosity
+        deployers = [self]
+        while "_innerObject" in vars(deployers[-1]):
+            deployers.append(vars(deployers[-1])["_innerObject"])
+        options = [*deployers, *self.Platform.engines, self._codeGenVerbosity]
+        if hasattr(self, "tiler"):
+            options.append(self.tiler)
+        key.append(_optionsDigest(options))
+        return key
+
+    def _recordLoweredGraph(self):
+        self._loweredStructure = _structureDigest(self.graph, self._compilationKey())
+        self._loweredConstants = {
+            name: _valueDigest(tensor.values)
+            for name, tensor in self.graph.tensors().items()
+            if isinstance(tensor, gs.Constant)
+        }
+
+    def exportCompilationCache(self, folderPath: str):
+        """Export the final state of the compilation to reuse it if only the values of constants change
+
+        Besides a DeeployState of the final context, the cache records
+        the structure of the lowered graph and a digest of the values of
+        its constants. Constants whose values were not transformed by
+        parsing, binding or code generation are marked as replaceable.
+
+        Parameters
+        ----------
+        folderPath : str
+            Directory of the cache
+
+        """
+        replaceable = []
+        for name, digest in self._loweredConstants.items():
+            buffer = self.ctxt.globalObjects.get(self.constantRenames.get(name, name))
+            # Constants stored as an encoded image (extData), e.g. compressed in L3, are encoded by code generation
+            if isinstance(buffer, ConstantBuffer) and not hasattr(buffer, "extData") and _valueDigest(
+                    buffer.values) == digest:
+                replaceable.append(name)
+
+        metadata = {
+            "structure": self._loweredStructure,
+            "constants": self._loweredConstants,
+            "replaceable": replaceable,
+            "constantRenames": self.constantRenames
+        }
+
+        self.exportDeeployState(folderPath, _compilationCacheFilename)
+        self.waitDeeployState()
+        with open(os.path.join(folderPath, _compilationCacheFilename + _metadataExtension), 'w') as f:
+            json.dump(metadata, f)
+
+    def _reuseCompilationCache(self, folderPath: str) -> bool:
+        # Returns True if the cached compilation was loaded with the values of the constants of the lowered graph
+        metadataPath = os.path.join(folderPath, _compilationCacheFilename + _metadataExtension)
+        if not os.path.exists(metadataPath):
+            log.info(" - No cached compilation found")
+            return False
+
+        with open(metadataPath, 'r') as f:
+            metadata = json.load(f)
+
+        if metadata["structure"] != self._loweredStructure:
+            log.info(" - Cached compilation not reusable: The structure of the graph or the deployment options changed")
+            return False
+
+        renames: Dict[str, str] = metadata["constantRenames"]
+        replaceable = set(metadata["replaceable"])
+        changed = [name for name, digest in self._loweredConstants.items() if metadata["constants"].get(name) != digest]
+
+        ctxt = NetworkContext.importNetworkContext(folderPath, _compilationCacheFilename)
+        tensors = self.graph.tensors()
+
+        # Deduplicated constants share a buffer, so all of them have to hold the same new values
+        bufferUsers: Dict[str, List[str]] = {}
+        for name in self._loweredConstants.keys():
+            bufferUsers.setdefault(renames.get(name, name), []).append(name)
+
+        newValues: Dict[str, np.ndarray] = {}
+        for name in changed:
+            bufferName = renames.get(name, name)
+            buffer = ctxt.globalObjects.get(bufferName)
+            values = np.asarray(tensors[name].values)
+
+            if name not in replaceable or not isinstance(buffer, ConstantBuffer) or not buffer._deploy:
+                log.info(f" - Cached compilation not reusable: The values of {name} were used to compile the network")
+                return False
+
+            if any(not np.array_equal(np.asarray(tensors[user].values).reshape(-1), values.reshape(-1))
+                   for user in bufferUsers[bufferName]):
+                log.info(f" - Cached compilation not reusable: {bufferName} is no longer shared")
+                return False
+
+            if values.size != buffer.values.size or not buffer._type.referencedType.checkPromotion(values):
+                log.info(
+                    f" - Cached compilation not reusable: {name} does not fit {buffer._type.referencedType.typeName}")
+                return False
+
+            newValues[bufferName] = values
+
+        for bufferName, values in newValues.items():
+            buffer = ctxt.globalObjects[bufferName]
+            buffer.values = values.astype(buffer.values.dtype).reshape(buffer.values.shape)
+
+        self.ctxt = ctxt
+        self.parsed = True
+        self.bound = True
+
+        log.info(f" {SUCCESS_MARK} Reuse cached compilation, updated {len(newValues)} constants")
+        self.constantRenames = dict(renames)
+        self.transformed = True
+        self.reusedCompilation = True
+        return True
+
+    def bind(self) -> bool:
+        if not super().bind():
+            return False
+
+        log.debug(" - Deduplicate Constants")
+        numMerged = self._deduplicateConstants()
+        log.debug(f" {SUCCESS_MARK} Merged {numMerged} duplicated constants")
+        return True
+
     def frontEnd(self):
         """API hook to prepare the graph to be deployed and build the initial NetworkContext
 
@@ -3441,26 +4238,35 @@ class NetworkDeployer(NetworkContainer):
         self._duplicateConstants(self.graph)
 
         log.debug(" - Constant Folding")
-        self._foldConstants(self.graph)
+        with profileStage("foldConstants", "frontEnd"):
+            self._foldConstants(self.graph)
 
-        log.info(f"> Export State to {_middlewarePreLoweringFilename}[.onnx|.pkl]")
-        self.exportDeeployState(self.deeployStateDir, _middlewarePreLoweringFilename)
+        self._snapshotDeeployState(_middlewarePreLoweringFilename)
 
         log.info("- Perform Graph Lowering")
-        self.graph = self.lower(self.graph)  # This lowers the graph to a deployable format
+        with profileStage("lower", "frontEnd"):
+            self.graph = self.lower(self.graph)  # This lowers the graph to a deployable format
+
+        self._snapshotDeeployState(_middlewarePostLoweringFilename)
 
-        log.info(f"> Export State {_middlewarePostLoweringFilename}[.onnx|.pkl]")
-        self.exportDeeployState(self.deeployStateDir, _middlewarePostLoweringFilename)
+        if self.compilationCacheDir is not None:
+            self._recordLoweredGraph()
+            if self._reuseCompilationCache(self.compilationCacheDir):
+                return
 
         log.info(" - Assert all tensors have a shape annotation")
         self._assertTensorsHaveShape()
 
         log.info("- Perform Graph Parsing")
         try:
-            self.parse(self.default_channels_first)  # This reparses the lowered graph
+            with profileStage("parse", "frontEnd") as stage:
+                self.parse(self.default_channels_first)  # This reparses the lowered graph
+                if stage is not None:
+                    stage.args["layers"] = len(self.layerBinding)
+                    stage.args["backtracks"] = dict(self.parseBacktracks)
         except Exception as e:
             log.error(f"Error during parsing! Exporting deeploy state {_backendPostBindingFilename}[.onnx|.pkl]!")
-            self.exportDeeployState(self.deeployStateDir, _backendPostBindingFilename)
+            self._snapshotDeeployState(_backendPostBindingFilename, final = True)
             raise e
 
     # Don't Override this
@@ -3471,14 +4277,14 @@ class NetworkDeployer(NetworkContainer):
         log.info("Deeploy MidEnd")
         log.info(80 * "=")
         try:
-            self.bind()
+            with profileStage("bind", "midEnd"):
+                self.bind()
         except Exception as e:
             log.error("Error during binding! Exporting deeploy state!")
-            self.exportDeeployState(self.deeployStateDir, _backendPostBindingFilename)
+            self._snapshotDeeployState(_backendPostBindingFilename, final = True)
             raise e
 
-        log.info(f"> Export State {_backendPostParsingFilename}[.onnx|.pkl]")
-        self.exportDeeployState(self.deeployStateDir, _backendPostParsingFilename)
+        self._snapshotDeeployState(_backendPostParsingFilename)
 
     # Don't override this unless you know what you are doin
     def backEnd(self, verbose: CodeGenVerbosity = _NoVerbosity):
@@ -3495,26 +4301,46 @@ class NetworkDeployer(NetworkContainer):
         log.info(80 * "=")
 
         log.info("- Performing code transformations and optimization...")
-        self.codeTransform(verbose)
+        with profileStage("codeTransform", "backEnd"):
+            self.codeTransform(verbose)
 
-        log.info(f"> Export State {_backendPostBindingFilename}[.onnx|.pkl]")
-        self.exportDeeployState(self.deeployStateDir, _backendPostBindingFilename)
+        if self.compilationCacheDir is not None:
+            log.info(f"> Export Compilation Cache to {self.compilationCacheDir}")
+            self.exportCompilationCache(self.compilationCacheDir)
+
+        self._snapshotDeeployState(_backendPostBindingFilename, final = True)
 
     # Don't override this
     def prepare(self, verbose: CodeGenVerbosity = _NoVerbosity):
         """API hook to perform the entire deployment process to the point where generated code may be extracted
 
+        If `compilationCacheDir` holds a compilation of the same network
+        that differs only in the values of constants, the cached
+        compilation is reused after lowering and `reusedCompilation` is
+        set. Only the constants (`generateConstantInitializationCode`) and
+        L3 files have to be regenerated then.
+
         Parameters
         ----------
         verbose : CodeGenVerbosity
             Control verbosity of generated code
 
         """
-        self.frontEnd()
+        self._codeGenVerbosity = verbose
+        with activateProfiler(self.compilerProfiler), profileStage("prepare"):
+            with profileStage("frontEnd"):
+                self.frontEnd()
+
+            # A reused compilation only has to regenerate the constants
+            if not self.reusedCompilation:
+                with profileStage("midEnd"):
+                    self.midEnd()
 
-        self.midEnd()
+                with profileStage("backEnd"):
+                    self.backEnd(verbose = verbose)
 
-        self.backEnd(verbose = verbose)
+            with profileStage("waitDeeployState"):
+                self.waitDeeployState()
         self.prepared = True
 
     def _printInputOutputSummary(self):
@@ -3543,7 +4369,7 @@ class NetworkDeployer(NetworkContainer):
                 if isinstance(_buffer, ConstantBuffer) or (isinstance(_buffer, VariableBuffer) and _buffer._deploy):
                     # SCHEREMO: We only
                     if (hasattr(_buffer, "_memoryLevel") and _buffer._memoryLevel == level) or level == "None":
-                        staticSize += int((np.prod(_buffer.shape) * _buffer._type.referencedType.typeWidth // 8))
+                        staticSize += int(_buffer.sizeInBytes)
                     else:
                         log.warning(f"Buffer {_buffer.name} does not have a valid memory level")
 
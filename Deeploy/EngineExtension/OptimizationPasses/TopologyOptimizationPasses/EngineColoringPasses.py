@@ -27,6 +27,9 @@ class EngineMapper:
 
 class EngineColoringPass(TopologyOptimizationPass):
 
+    # Coloring only annotates nodes, so re-running it after every lowering pass doesn't need another cleanup and sort
+    modifiesTopology = False
+
     def __init__(self, engineMapper: EngineMapper):
         super().__init__()
         self.engineMapper = engineMapper
@@ -0,0 +1,286 @@
+# SPDX-FileCopyrightText: 2025 ETH Zurich and University of Bologna
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# Incremental maintenance of onnx_graphsurgeon graphs during lowering.
+#
+# `cleanupGraph` and `toposortGraph` produce exactly the same graph as `gs.Graph.cleanup()` and
+# `gs.Graph.toposort()`, but in linear time with plain loops instead of onnx_graphsurgeon's tensor map
+# and recursion. Graphs with subgraphs or functions are forwarded to onnx_graphsurgeon. `removeDeadNodes` and
+# `insertNode` are the local counterparts used while a pass rewrites the graph.
+
+from typing import Dict, Iterable, List, Optional, Set
+
+import onnx_graphsurgeon as gs
+
+
+def _hasSubgraphs(graph: gs.Graph) -> bool:
+    if len(graph.functions) > 0:
+        return True
+    for node in graph.nodes:
+        for attr in node.attrs.values():
+            if isinstance(attr, gs.Graph):
+                return True
+    return False
+
+
+def _localTensorNames(graph: gs.Graph) -> Set[str]:
+    # Tensors produced in this graph, graph inputs and constants, see gs.Graph._local_tensors
+    localNames = set()
+    tensorIsConstant = {}
+    for tensor in graph.inputs:
+        localNames.add(tensor.name)
+        tensorIsConstant[tensor.name] = isinstance(tensor, gs.Constant)
+    for node in graph.nodes:
+        for tensor in node.inputs:
+            tensorIsConstant[tensor.name] = isinstance(tensor, gs.Constant)
+        for tensor in node.outputs:
+            tensorIsConstant[tensor.name] = isinstance(tensor, gs.Constant)
+            localNames.add(tensor.name)
+    for tensor in graph.outputs:
+        tensorIsConstant[tensor.name] = isinstance(tensor, gs.Constant)
+
+    localNames.update(name for name, isConstant in tensorIsConstant.items() if isConstant)
+    localNames.discard("")
+    return localNames
+
+
+class _ProducerResolver():
+    # Resolves producers like onnx_graphsurgeon: Producers of tensors which are not local to the graph are ignored,
+    # producers outside of the graph of local tensors are an error onnx_graphsurgeon reports
+
+    def __init__(self, graph: gs.Graph):
+        self.graph = graph
+        self.nodeIds = {id(node) for node in graph.nodes}
+        self._localNames: Optional[Set[str]] = None
+
+    def isLocal(self, tensor: gs.Tensor) -> bool:
+        if self._localNames is None:
+            self._localNames = _localTensorNames(self.graph)
+        return tensor.name in self._localNames
+
+    def producers(self, node: gs.Node) -> Optional[List[gs.Node]]:
+        # Returns None if a local input tensor is produced outside of the graph
+        producers = {}
+        for tensor in node.inputs:
+            if tensor.name == "":
+                continue
+            if any(id(producer) not in self.nodeIds for producer in tensor.inputs):
+                if self.isLocal(tensor):
+                    return None
+                continue
+            for producer in tensor.inputs:
+                producers.setdefault(id(producer), producer)
+        return list(producers.values())
+
+
+def cleanupGraph(graph: gs.Graph) -> gs.Graph:
+    """Remove all nodes which do not contribute to the graph outputs
+
+    Equivalent to `graph.cleanup()` with its default arguments.
+
+    Parameters
+    ----------
+    graph : gs.Graph
+        Graph to clean up in place
+
+    Returns
+    -------
+    gs.Graph
+        The cleaned up graph
+
+    """
+    if _hasSubgraphs(graph):
+        return graph.cleanup()
+
+    for tensor in graph.inputs:
+        tensor.inputs.clear()
+
+    resolver = _ProducerResolver(graph)
+    seenNames = set()
+    usedNodeIds = set()
+    usedTensors = []
+
+    def _useTensors(tensors: Iterable[gs.Tensor]):
+        for tensor in tensors:
+            if tensor.name == "":
+                usedTensors.append(tensor)
+            elif tensor.name not in seenNames and resolver.isLocal(tensor):
+                seenNames.add(tensor.name)
+                usedTensors.append(tensor)
+
+    _useTensors(graph.outputs)
+    idx = 0
+    while idx < len(usedTensors):
+        for producer in usedTensors[idx].inputs:
+            if id(producer) not in resolver.nodeIds:
+                return graph.cleanup()
+            usedNodeIds.add(id(producer))
+            _useTensors(producer.inputs)
+        idx += 1
+
+    if len(usedNodeIds) == len(resolver.nodeIds):
+        return graph
+
+    nodes = []
+    for node in graph.nodes:
+        if id(node) in usedNodeIds:
+            nodes.append(node)
+        else:
+            node.inputs.clear()
+            node.outputs.clear()
+    graph.nodes = nodes
+    return graph
+
+
+def toposortGraph(graph: gs.Graph) -> gs.Graph:
+    """Topologically sort the nodes of the graph
+
+    Equivalent to `graph.toposort()`: Nodes are ordered by their depth in the graph, nodes of equal
+    depth keep their relative order. Nodes whose producers precede them are handled in a single
+    forward sweep, only out-of-order nodes require a depth-first traversal of their producers.
+
+    Parameters
+    ----------
+    graph : gs.Graph
+        Graph to sort in place
+
+    Returns
+    -------
+    gs.Graph
+        The sorted graph
+
+    """
+    if _hasSubgraphs(graph):
+        return graph.toposort()
+
+    resolver = _ProducerResolver(graph)
+    levels: Dict[int, int] = {}
+    order = []
+
+    for root in graph.nodes:
+        if id(root) in levels:
+            continue
+
+        rootProducers = resolver.producers(root)
+        if rootProducers is not None and all(id(producer) in levels for producer in rootProducers):
+            levels[id(root)] = max((levels[id(producer)] for producer in rootProducers), default = -1) + 1
+            order.append(root)
+            continue
+
+        # Depth-first post-order traversal of the producers, as onnx_graphsurgeon does recursively
+        visiting = {id(root)}
+        stack = [(root, rootProducers, 0)]
+        while len(stack) > 0:
+            node, producers, idx = stack[-1]
+            if producers is None:
+                # Let onnx_graphsurgeon report the dangling node
+                return graph.toposort()
+
+            while idx < len(producers) and id(producers[idx]) in levels:
+                idx += 1
+
+            if idx < len(producers):
+                producer = producers[idx]
+                if id(producer) in visiting:
+                    # Let onnx_graphsurgeon report the cycle
+                    return graph.toposort()
+                stack[-1] = (node, producers, idx + 1)
+                visiting.add(id(producer))
+                stack.append((producer, resolver.producers(producer), 0))
+                continue
+
+            stack.pop()
+            visiting.discard(id(node))
+            levels[id(node)] = max((levels[id(producer)] for producer in producers), default = -1) + 1
+            order.append(node)
+
+    if any(levels[id(order[idx])] > levels[id(order[idx + 1])] for idx in range(len(order) - 1)):
+        order.sort(key = lambda node: levels[id(node)])
+
+    if len(order) != len(graph.nodes) or any(a is not b for a, b in zip(order, graph.nodes)):
+        graph.nodes = order
+    return graph
+
+
+def removeDeadNodes(graph: gs.Graph, dirtyNodes: Iterable[gs.Node]) -> gs.Graph:
+    """Remove dead nodes starting from a set of nodes whose outputs may have lost their consumers
+
+    Only the dirty nodes and, transitively, the producers of removed nodes are checked. On a graph
+    that was clean before the dirty nodes were modified, this removes the same nodes as
+    `cleanupGraph`.
+
+    Parameters
+    ----------
+    graph : gs.Graph
+        Graph to clean up in place
+    dirtyNodes : Iterable[gs.Node]
+        Nodes whose outputs may have lost consumers
+
+    Returns
+    -------
+    gs.Graph
+        The cleaned up graph
+
+    """
+    nodeIds = {id(node) for node in graph.nodes}
+    outputNames = {tensor.name for tensor in graph.outputs}
+
+    def _isDead(node: gs.Node) -> bool:
+        for tensor in node.outputs:
+            if tensor.name in outputNames:
+                return False
+            if any(id(consumer) in nodeIds for consumer in tensor.outputs):
+                return False
+        return True
+
+    worklist = [node for node in dirtyNodes if id(node) in nodeIds]
+    deadIds = set()
+    while len(worklist) > 0:
+        node = worklist.pop()
+        if id(node) not in nodeIds or not _isDead(node):
+            continue
+
+        producers = [producer for tensor in node.inputs for producer in tensor.inputs]
+        node.inputs.clear()
+        node.outputs.clear()
+        nodeIds.discard(id(node))
+        deadIds.add(id(node))
+        worklist.extend(producers)
+
+    if len(deadIds) > 0:
+        graph.nodes = [node for node in graph.nodes if id(node) not in deadIds]
+    return graph
+
+
+def insertNode(graph: gs.Graph, node: gs.Node, position: Optional[int] = None) -> gs.Graph:
+    """Insert a node into a topologically sorted graph without breaking the topological order
+
+    The node is placed before its first consumer, after all its producers. If that is not
+    possible, it is appended and the order has to be repaired by `toposortGraph`.
+
+    Parameters
+    ----------
+    graph : gs.Graph
+        Topologically sorted graph
+    node : gs.Node
+        Node to insert
+    position : Optional[int]
+        Position of the first consumer of the node, computed from the graph if not given
+
+    Returns
+    -------
+    gs.Graph
+        The graph including the node
+
+    """
+    if position is None:
+        consumerIds = {id(consumer) for tensor in node.outputs for consumer in tensor.outputs}
+        position = next((idx for idx, other in enumerate(graph.nodes) if id(other) in consumerIds), len(graph.nodes))
+
+    producerIds = {id(producer) for tensor in node.inputs for producer in tensor.inputs}
+    if any(id(other) in producerIds for other in graph.nodes[position:]):
+        position = len(graph.nodes)
+
+    graph.nodes.insert(position, node)
+    return graph
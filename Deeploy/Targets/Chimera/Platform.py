@@ -36,6 +36,7 @@ class ChimeraTransientBuffer(TransientBuffer):
 class ChimeraConstantBuffer(ConstantBuffer):
 
     initTemplate = BasicAllocateTemplate.referenceGlobalInitTemplate
+    binaryInitTemplate = BasicAllocateTemplate.referenceGlobalBinaryInitTemplate
     allocTemplate = BasicAllocateTemplate.referenceGlobalInitTemplate
     deallocTemplate = NodeTemplate("")
 
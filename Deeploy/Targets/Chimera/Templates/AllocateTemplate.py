@@ -5,6 +5,6 @@
 from Deeploy.DeeployTypes import NodeTemplate
 
 memoryIslandAllocateTemplate = NodeTemplate(
-    "${name} = (${type.typeName}) memory_island_malloc(${type.referencedType.typeWidth//8} * ${size});\n")
+    "${name} = (${type.typeName}) memory_island_malloc(${max(1, type.referencedType.typeWidth//8)} * ${size});\n")
 
 memoryIslandFreeTemplate = NodeTemplate("memory_island_free(${name})")
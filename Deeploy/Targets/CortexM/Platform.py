@@ -111,6 +111,7 @@ class CMSISTransientBuffer(TransientBuffer):
 class CMSISConstantBuffer(ConstantBuffer):
 
     initTemplate = AllocateTemplate.referenceGlobalInitTemplate
+    binaryInitTemplate = AllocateTemplate.referenceGlobalBinaryInitTemplate
     allocTemplate = AllocateTemplate.referenceGlobalAllocateTemplate
     deallocTemplate = FreeTemplate.referenceGlobalTemplate
 
@@ -62,3 +62,61 @@ class GAP9L3Dma(AsyncDma):
 
 # Blocking adapter for L3 DMA (used in GAP9 L3 tiling)
 gap9L3DmaHack = BlockingDmaFromAsyncDmaAdapter(GAP9L3Dma())
+
+
+class GAP9L3DmaPoolFuture(Future):
+    """Pool of cluster RAM requests
+
+    Every transfer of the future takes the next request of the pool, so that
+    the rows of a multi-dimensional transfer are in flight at the same time.
+    A request is only reused after it completed, waiting the future waits
+    for all outstanding requests.
+    """
+
+    poolSize = 4
+
+    _initTemplate = NodeTemplate("""
+    pi_cl_ram_req_t ${name}[${poolSize}] = {0};
+    uint32_t ${name}_issued = 0;""")
+
+    _deinitTemplate = NodeTemplate("")
+
+    _allocTemplate = NodeTemplate("")
+
+    _waitTemplate = NodeTemplate("""
+    for (uint32_t ${name}_req = 0; ${name}_req < ${name}_issued && ${name}_req < ${poolSize}; ${name}_req++) {
+        pi_cl_ram_copy_wait(&${name}[${name}_req]);
+    }
+    ${name}_issued = 0;""")
+
+    def _operatorRepresentation(self) -> OperatorRepresentation:
+        return {"name": self.name, "poolSize": self.poolSize}
+
+
+class GAP9L3AsyncDma(GAP9L3Dma):
+    """Asynchronous L3 DMA, which keeps the transfers of a future in flight until it is waited for"""
+
+    _transferTemplates = {
+        2:
+            NodeTemplate("""
+    {
+        pi_cl_ram_req_t *request = &${future}[${future}_issued % ${pool_size}];
+        if (${future}_issued >= ${pool_size}) {
+            pi_cl_ram_copy_wait(request);
+        }
+        ${future}_issued++;
+        pi_cl_ram_copy_2d(get_ram_ptr(), ${ext}, ${loc}, ${transfer_size}, ${stride}, ${length}, ${ext2loc}, request);
+    }""")
+    }
+    _waitingStrategy = PerTensorWaitingStrategy(GAP9L3DmaPoolFuture)
+
+    def __init__(self, transferTemplates: Dict[int, NodeTemplate] = _transferTemplates) -> None:
+        super().__init__(transferTemplates)
+
+    def transferOpRepr(self, externalBuffer: VariableBuffer, localBuffer: VariableBuffer, shape: Tuple[int, ...],
+                       strideExt: Tuple[int, ...], strideLoc: Tuple[int, ...], direction: DmaDirection,
+                       future: Future) -> OperatorRepresentation:
+        operatorRepresentation = super().transferOpRepr(externalBuffer, localBuffer, shape, strideExt, strideLoc,
+                                                        direction, future)
+        operatorRepresentation["pool_size"] = future.poolSize
+        return operatorRepresentation
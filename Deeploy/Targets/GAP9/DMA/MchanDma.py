@@ -38,6 +38,9 @@ class GAP9MchanDma(AsyncDma):
     }
     _waitingStrategy = DirectionWaitingStrategy(MchanTransferFuture, "transfer")
 
+    # Width of the transfer size of a command
+    _maxTransferSize = (1 << 17) - 1
+
     def __init__(self, transferTemplates: Dict[int, NodeTemplate] = _transferTemplates) -> None:
         super().__init__(transferTemplates)
 
@@ -75,10 +78,8 @@ class GAP9MchanDma(AsyncDma):
         mchanFlags += (1 << 3)  # event enable
 
         mchanTransferSize = math.prod(shape)
-        mchanTransferSizeBits = math.ceil(math.log2(mchanTransferSize)) if mchanTransferSize > 0 else 0
-        assert mchanTransferSizeBits <= 17, (
-            "The transfer size is not representable with 17 bits. "
-            f"Received transfer size {mchanTransferSize} that requires {mchanTransferSizeBits} bits")
+        assert mchanTransferSize <= self._maxTransferSize, ("The transfer size is not representable with 17 bits. "
+                                                            f"Received transfer size {mchanTransferSize}")
 
         # cmd = (flags << 17) + size, matching PULPOpen MchanDma pattern
         operatorRepresentation["cmd"] = (mchanFlags << 17) + mchanTransferSize
@@ -10,7 +10,6 @@ the GAP9Bindings transformers.
 
 from typing import Callable, Dict, Type
 
-import numpy as np
 import onnx_graphsurgeon as gs
 
 from Deeploy.AbstractDataTypes import Pointer
@@ -88,7 +87,8 @@ class GAP9Deployer(PULPDeployer):
             locPtr = str(buf._instance)
             extName = str(idx)
             buf.extName = extName  # This enables hex dump generation
-            size = np.prod(buf.shape) * (buf._type.referencedType.typeWidth // 8)
+            # Compressed constants are stored as their L3 image
+            size = len(buf.extData) if hasattr(buf, "extData") else buf.sizeInBytes
 
             # Allocate L3 RAM space (for constant buffers only)
             if isinstance(buf, ConstantBuffer):
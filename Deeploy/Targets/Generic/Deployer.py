@@ -12,7 +12,8 @@ from Deeploy.CommonExtensions.OptimizationPasses.TopologyOptimizationPasses.Debu
 from Deeploy.CommonExtensions.OptimizationPasses.TopologyOptimizationPasses.LoweringOptimizationPasses import \
     NCHWtoNHWCPass, TransposeMatmulInputsPass
 from Deeploy.DeeployTypes import DeploymentPlatform, TopologyOptimizer
-from Deeploy.Targets.Generic.TopologyOptimizationPasses.Passes import TransposeConstOptPass, TransposeMergePass
+from Deeploy.Targets.Generic.TopologyOptimizationPasses.Passes import FuseElementwiseChainPass, TransposeConstOptPass, \
+    TransposeMergePass
 
 
 class GenericDeployer(SignPropDeployer):
@@ -44,5 +45,6 @@ class GenericDeployer(SignPropDeployer):
             NCHWtoNHWCPass(self.default_channels_first),
             TransposeMergePass(),
             TransposeConstOptPass(),
-            DebugPrintMergePass()
+            DebugPrintMergePass(),
+            FuseElementwiseChainPass(self.default_channels_first)
         ]
@@ -3159,3 +3159,95 @@ class GlobalMaxPoolParser(GlobalPoolParser):
 
     def parseNode(self, node: gs.Node) -> bool:
         return super().parseNode(node) and node.op == 'GlobalMaxPool'
+
+
+class FusedElementwiseParser(NodeParser):
+
+    _stageArity = {
+        'Add': 2,
+        'Mul': 2,
+        'Div': 2,
+        'RequantShift': 3,
+        'Relu': 1,
+        'Clip': 1,
+        'iGELU': 1,
+        'iHardswish': 1,
+        'HardSwish': 1
+    }
+
+    def __init__(self):
+        super().__init__()
+
+    def parseNode(self, node: gs.Node) -> bool:
+
+        ret = all([
+            'ops' in node.attrs, 'arity' in node.attrs, 'args' in node.attrs,
+            len(node.inputs) >= 1,
+            len(node.outputs) == 1
+        ])
+
+        if not ret:
+            return False
+
+        ops = list(node.attrs['ops'])
+        arity = [int(a) for a in node.attrs['arity']]
+        args = [int(a) for a in node.attrs['args']]
+
+        if len(ops) != len(arity) or sum(arity) != len(args):
+            return False
+
+        stages = []
+        argOffset = 0
+        for idx, (op, nArgs) in enumerate(zip(ops, arity)):
+            if self._stageArity.get(op, None) != nArgs:
+                return False
+
+            stageArgs = args[argOffset:argOffset + nArgs]
+            argOffset += nArgs
+
+            # Stages may only refer to node inputs or to previously computed stages
+            if not all(-idx <= arg < len(node.inputs) for arg in stageArgs):
+                return False
+
+            prefix = f"stage{idx}_"
+            stageAttrs = {key[len(prefix):]: value for key, value in node.attrs.items() if key.startswith(prefix)}
+            stages.append({'op': op, 'args': stageArgs, 'attrs': stageAttrs})
+
+        self.operatorRepresentation['stages'] = stages
+
+        return True
+
+    def parseNodeCtxt(self,
+                      ctxt: NetworkContext,
+                      node: gs.Node,
+                      channels_first: bool = True) -> Tuple[NetworkContext, bool]:
+
+        data_out = ctxt.lookup(node.outputs[0].name)
+        outShape = list(data_out.shape)
+
+        inputShapes = []
+        for idx, inputNode in enumerate(node.inputs):
+            data_in = ctxt.lookup(inputNode.name)
+            shape = list(data_in.shape)
+
+            if len(shape) > len(outShape):
+                return ctxt, False
+
+            # Right-align the operand to the output, as in numpy broadcasting
+            alignedShape = [1] * (len(outShape) - len(shape)) + shape
+            if not all(dim == 1 or dim == outDim for dim, outDim in zip(alignedShape, outShape)):
+                return ctxt, False
+
+            self.operatorRepresentation[f'data_in_{idx}'] = data_in.name
+            inputShapes.append(alignedShape)
+
+        self.operatorRepresentation['n_inputs'] = len(node.inputs)
+        self.operatorRepresentation['input_shapes'] = inputShapes
+        self.operatorRepresentation['data_out'] = data_out.name
+        self.operatorRepresentation['data_out_shape'] = outShape
+        self.operatorRepresentation['size'] = int(np.prod(outShape))
+
+        for dim, dimSize in enumerate(outShape):
+            self.operatorRepresentation[f'dim_{dim}'] = dimSize
+
+        return ctxt, True
@@ -6,10 +6,16 @@ from Deeploy.DeeployTypes import NodeTemplate
 
 referenceInitTemplate = NodeTemplate("${type.typeName} ${name};\n")
 referenceAllocateTemplate = NodeTemplate(
-    "${name} = (${type.typeName}) deeploy_malloc(${type.referencedType.typeWidth//8} * ${size});\n")
+    "${name} = (${type.typeName}) deeploy_malloc(${max(1, type.referencedType.typeWidth//8)} * ${size});\n")
 
 referenceGlobalInitTemplate = NodeTemplate("static ${type.referencedType.typeName} ${name}[${size}] = {${values}};\n")
 
+# Values are linked from the binary blob at ${blobPath} by the assembler, its label is local like the static array
+referenceGlobalBinaryInitTemplate = NodeTemplate("""
+__asm__(".pushsection .data, \\"aw\\"\\n.balign 16\\n${name}:\\n.incbin \\"${blobPath}\\"\\n.popsection");
+extern ${type.referencedType.typeName} ${name}[${size}] __attribute__((aligned(16)));
+""")
+
 referenceGlobalAllocateTemplate = NodeTemplate("")
 
 referenceStructInitTemplate = NodeTemplate("""
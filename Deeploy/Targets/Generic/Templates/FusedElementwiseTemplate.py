@@ -0,0 +1,175 @@
+# SPDX-FileCopyrightText: 2025 ETH Zurich and University of Bologna
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import math
+from typing import Dict, List, Tuple
+
+from Deeploy.AbstractDataTypes import FloatImmediate
+from Deeploy.DeeployTypes import NetworkContext, NodeTemplate, OperatorRepresentation
+
+
+class FusedElementwiseTemplate(NodeTemplate):
+    """Template for chains of elementwise operators fused into one loop
+
+    `alignToContext` lowers every stage of the chain into C statements
+    operating on the per-element locals `x<input>` and `t<stage>`, which
+    are emitted in the loop body by `loopBodyTemplate`. Integer stages
+    compute in the signed domain, i.e. input and output offsets are
+    applied once when loading and storing elements.
+    """
+
+    def __init__(self, templateStr: str, applyOffsets: bool = True):
+        super().__init__(templateStr)
+        self.applyOffsets = applyOffsets
+
+    @staticmethod
+    def _floatLiteral(value: float) -> str:
+        if math.isinf(value):
+            return "inf" if value > 0 else "-inf"
+        return f"{float(value)!r}f"
+
+    @staticmethod
+    def _stageStatements(stage: Dict, operands: List[str], result: str, accType: str, isFloat: bool) -> List[str]:
+        op = stage['op']
+        attrs = stage['attrs']
+
+        if op == 'Add':
+            return [f"{accType} {result} = {operands[0]} + {operands[1]};"]
+
+        if op == 'Mul':
+            return [f"{accType} {result} = {operands[0]} * {operands[1]};"]
+
+        if op == 'Div':
+            return [f"{accType} {result} = {operands[0]} / {operands[1]};"]
+
+        if op == 'Relu':
+            zero = "0.0f" if isFloat else "0"
+            return [f"{accType} {result} = MAX({operands[0]}, {zero});"]
+
+        if op == 'Clip':
+            if isFloat:
+                low = FusedElementwiseTemplate._floatLiteral(attrs['min']) if 'min' in attrs else None
+                high = FusedElementwiseTemplate._floatLiteral(attrs['max']) if 'max' in attrs else None
+            else:
+                low = math.ceil(attrs['min']) if 'min' in attrs else None
+                high = math.floor(attrs['max']) if 'max' in attrs else None
+
+            if low is not None and high is not None:
+                return [f"{accType} {result} = CLAMP({operands[0]}, {low}, {high});"]
+            if low is not None:
+                return [f"{accType} {result} = MAX({operands[0]}, {low});"]
+            if high is not None:
+                return [f"{accType} {result} = MIN({operands[0]}, {high});"]
+            return [f"{accType} {result} = {operands[0]};"]
+
+        if op == 'RequantShift':
+            log2D = attrs['log2D']
+            nLevels = attrs['n_levels']
+            rounding = (1 << (log2D - 1)) if log2D > 0 else 0
+            if attrs['signed']:
+                low, high = -(nLevels // 2), (nLevels // 2) - 1
+            else:
+                low, high = 0, nLevels - 1
+            return [
+                f"{accType} {result} = ({operands[0]} * {operands[1]} + {operands[2]} + {rounding}) >> {log2D};",
+                f"{result} = CLAMP({result}, {low}, {high});"
+            ]
+
+        if op == 'iGELU':
+            b, one = attrs['b'], attrs['one']
+            return [
+                f"{accType} {result}_sign = ({operands[0]} > 0) - ({operands[0]} < 0);",
+                f"{accType} {result}_d = MIN({result}_sign * {operands[0]}, {-b}) + {b};",
+                f"{accType} {result}_L = {result}_sign * (-({result}_d * {result}_d) + {one});",
+                f"{accType} {result} = {operands[0]} * (({one} + {result}_L) >> 1);"
+            ]
+
+        if op == 'iHardswish':
+            return [
+                f"{accType} {result} = CLAMP({operands[0]} + {attrs['three']}, 0, {attrs['six']}) * {attrs['one_over_six']};",
+                f"{result} = {operands[0]} * {result};"
+            ]
+
+        if op == 'HardSwish':
+            return [f"{accType} {result} = {operands[0]} * CLAMP({operands[0]} / 6.0f + 0.5f, 0.0f, 1.0f);"]
+
+        raise ValueError(f"Unsupported fused elementwise stage {op}!")
+
+    def alignToContext(self, ctxt: NetworkContext,
+                       operatorRepresentation: OperatorRepresentation) -> Tuple[NetworkContext, Dict, List[str]]:
+
+        data_out = ctxt.lookup(operatorRepresentation['data_out'])
+        isFloat = issubclass(data_out._type.referencedType, FloatImmediate)
+        accType = "float32_t" if isFloat else "int32_t"
+
+        inputOffsets = []
+        for idx in range(operatorRepresentation['n_inputs']):
+            data_in = ctxt.lookup(operatorRepresentation[f'data_in_{idx}'])
+            offset = 0
+            if self.applyOffsets and hasattr(data_in, "_signed") and hasattr(data_in, "nLevels") and not isFloat:
+                offset = (data_in._signed == 0) * int(data_in.nLevels / 2)
+            inputOffsets.append(offset)
+
+        output_offset = 0
+        if self.applyOffsets and hasattr(data_out, "_signed") and hasattr(data_out, "nLevels") and not isFloat:
+            output_offset = -(data_out._signed == 0) * int(data_out.nLevels // 2)
+
+        stageStatements = []
+        for idx, stage in enumerate(operatorRepresentation['stages']):
+            operands = [f"x{arg}" if arg >= 0 else f"t{-arg - 1}" for arg in stage['args']]
+            stageStatements += self._stageStatements(stage, operands, f"t{idx}", accType, isFloat)
+
+        operatorRepresentation['input_offsets'] = inputOffsets
+        operatorRepresentation['output_offset'] = output_offset
+        operatorRepresentation['acc_type'] = accType
+        operatorRepresentation['stage_statements'] = stageStatements
+        operatorRepresentation['result'] = f"t{len(operatorRepresentation['stages']) - 1}"
+
+        return ctxt, operatorRepresentation, []
+
+
+# Loop body evaluating the whole chain for element i. Inputs that are broadcast along
+# some dimensions are indexed by decomposing i into the (possibly tiled) output dimensions.
+loopBodyTemplate = """
+<%
+def _dim(d):
+    dim = pageargs['dim_' + str(d)]
+    return f"(*{dim})" if isinstance(dim, str) else str(dim)
+
+input_indices = []
+for shape in input_shapes:
+    if all(s == o for s, o in zip(shape, data_out_shape)):
+        input_indices.append("i")
+        continue
+    terms = []
+    for d, s in enumerate(shape):
+        if s == 1:
+            continue
+        inner = [_dim(e) for e in range(d + 1, len(shape))]
+        stride = [_dim(e) for e in range(d + 1, len(shape)) if shape[e] != 1]
+        term = "(i / (" + " * ".join(inner) + "))" if inner else "i"
+        if d > 0:
+            term = "(" + term + " % " + _dim(d) + ")"
+        if stride:
+            term = term + " * " + " * ".join(stride)
+        terms.append(term)
+    input_indices.append(" + ".join(terms) if terms else "0")
+%>
+% for j in range(n_inputs):
+        ${acc_type} x${j} = (${acc_type}) ${pageargs['data_in_' + str(j)]}[${input_indices[j]}]${f" + {input_offsets[j]}" if input_offsets[j] != 0 else ""};
+% endfor
+% for statement in stage_statements:
+        ${statement}
+% endfor
+        ${data_out}[i] = (${data_out_type.referencedType.typeName}) (${result}${f" + {output_offset}" if output_offset != 0 else ""});
+"""
+
+referenceTemplate = FusedElementwiseTemplate("""
+// Fused Elementwise (Name: ${nodeName}, Op: ${nodeOp})
+BEGIN_SINGLE_CORE
+    for (uint32_t i = 0; i < ${size}; i++) {
+""" + loopBodyTemplate + """
+    }
+END_SINGLE_CORE
+""")
@@ -0,0 +1,113 @@
+# SPDX-FileCopyrightText: 2025 ETH Zurich and University of Bologna
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from Deeploy.AbstractDataTypes import PointerClass
+from Deeploy.CommonExtensions.DataTypes import uint32_t
+from Deeploy.DeeployTypes import NetworkContext, OperatorRepresentation
+from Deeploy.TilingExtension.MemoryConstraints import NodeMemoryConstraint
+from Deeploy.TilingExtension.TileConstraint import TileConstraint
+from Deeploy.TilingExtension.TilerModel import TilerModel
+from Deeploy.TilingExtension.TilingCodegen import AbsoluteHyperRectangle, HyperRectangle, TilingSchedule, \
+    VariableReplacementScheme
+
+
+class FusedElementwiseTileConstraint(TileConstraint):
+    """Tile constraint for fused elementwise chains with an arbitrary number of inputs.
+
+    Every input is right-aligned to the output shape. Dimensions an input
+    shares with the output are tiled together with the output, broadcast
+    (unit) dimensions stay untiled.
+    """
+
+    dataOutName = 'data_out'  #: str: Name of the output tensor as defined by the operator's parser
+
+    @staticmethod
+    def _inputNames(parseDict: Dict) -> List[str]:
+        return [f'data_in_{idx}' for idx in range(parseDict['n_inputs'])]
+
+    @classmethod
+    def addGeometricalConstraint(cls, tilerModel: TilerModel, parseDict: Dict, ctxt: NetworkContext) -> TilerModel:
+
+        outputBufferName = parseDict[cls.dataOutName]
+        tilerModel.addTensorDimToModel(ctxt, outputBufferName)
+        outputRank = len(ctxt.lookup(outputBufferName).shape)
+
+        for inputName in cls._inputNames(parseDict):
+            inputBufferName = parseDict[inputName]
+            tilerModel.addTensorDimToModel(ctxt, inputBufferName)
+
+            inputShape = ctxt.lookup(inputBufferName).shape
+            rankOffset = outputRank - len(inputShape)
+
+            for dim, dimSize in enumerate(inputShape):
+                inputDimVar = tilerModel.getTensorDimVar(tensorName = inputBufferName, dimIdx = dim)
+                if dimSize == 1:
+                    tilerModel.addConstraint(inputDimVar == 1)
+                    continue
+
+                outputDimVar = tilerModel.getTensorDimVar(tensorName = outputBufferName, dimIdx = dim + rankOffset)
+                tilerModel.addConstraint(inputDimVar == outputDimVar)
+
+        return tilerModel
+
+    @classmethod
+    def serializeTilingSolution(
+            cls, tilingSolution: NodeMemoryConstraint, absoluteOutputCubes: List[AbsoluteHyperRectangle],
+            targetMemLevel: str, ctxt: NetworkContext,
+            operatorRepresentation: OperatorRepresentation) -> Tuple[VariableReplacementScheme, TilingSchedule]:
+        outputCubes = [cube.rectangle for cube in absoluteOutputCubes]
+
+        inputNames = cls._inputNames(operatorRepresentation)
+        addrNames = inputNames + [cls.dataOutName]
+        inputBaseOffsets, outputBaseOffsets = cls.extractBaseAddr(tilingSolution, targetMemLevel,
+                                                                  operatorRepresentation, addrNames)
+
+        outputRank = len(operatorRepresentation['data_out_shape'])
+        dimNames = [f"dim_{dim}" for dim in range(outputRank)]
+
+        replacements = {"size": []}
+        replacementTypes = {"size": PointerClass(uint32_t)}
+        for dimName in dimNames:
+            replacements[dimName] = []
+            replacementTypes[dimName] = PointerClass(uint32_t)
+
+        for cube in outputCubes:
+            replacements["size"].append(int(np.prod(cube.dims)))
+            for dimName, dimSize in zip(dimNames, cube.dims):
+                replacements[dimName].append(dimSize)
+
+        inputLoadSchedule = []
+        outputLoadSchedule = []
+
+        for cube in outputCubes:
+            inputCubes = {}
+            for inputName in inputNames:
+                inputShape = ctxt.lookup(operatorRepresentation[inputName]).shape
+                rankOffset = outputRank - len(inputShape)
+
+                offset = []
+                dims = []
+                for dim, dimSize in enumerate(inputShape):
+                    if dimSize == 1:
+                        offset.append(0)
+                        dims.append(1)
+                    else:
+                        offset.append(cube.offset[dim + rankOffset])
+                        dims.append(cube.dims[dim + rankOffset])
+
+                inputCubes[inputName] = HyperRectangle(tuple(offset), tuple(dims))
+
+            inputLoadSchedule.append(inputCubes)
+
+        for out in outputCubes:
+            outputLoadSchedule.append({cls.dataOutName: out})
+
+        tilingSchedule = TilingSchedule(inputBaseOffsets, outputBaseOffsets, inputLoadSchedule, outputLoadSchedule)
+        variableReplacementSchedule = VariableReplacementScheme(replacements, replacementTypes)
+
+        return variableReplacementSchedule, tilingSchedule
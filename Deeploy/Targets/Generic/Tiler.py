@@ -2,10 +2,11 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-from Deeploy.Targets.Generic.Bindings import BasicAddBindings, BasicConcatBindings, BasicReshapeBindings, \
-    BasicTransposeBindings
+from Deeploy.Targets.Generic.Bindings import BasicAddBindings, BasicConcatBindings, BasicFusedElementwiseBindings, \
+    BasicReshapeBindings, BasicTransposeBindings
 from Deeploy.Targets.Generic.TileConstraints.AddTileConstraint import AddTileConstraint
 from Deeploy.Targets.Generic.TileConstraints.ConcatTileConstraint import ConcatTileConstraint
+from Deeploy.Targets.Generic.TileConstraints.FusedElementwiseTileConstraint import FusedElementwiseTileConstraint
 from Deeploy.Targets.Generic.TileConstraints.NOPTileConstraint import NOPTileConstraint
 from Deeploy.Targets.Generic.TileConstraints.TransposeTileConstraint import TransposeTileConstraint
 from Deeploy.TilingExtension.TilerExtension import TilingReadyNodeBindings
@@ -21,3 +22,6 @@ BasicAddTilingReadyBindings = TilingReadyNodeBindings(nodeBindings = BasicAddBin
 
 BasicConcatTilingReadyBinding = TilingReadyNodeBindings(nodeBindings = BasicConcatBindings,
                                                         tileConstraint = ConcatTileConstraint())
+
+BasicFusedElementwiseTilingReadyBindings = TilingReadyNodeBindings(nodeBindings = BasicFusedElementwiseBindings,
+                                                                   tileConstraint = FusedElementwiseTileConstraint())
@@ -3,15 +3,17 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import copy
+import math
 from collections import OrderedDict
 from functools import partial
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import onnx_graphsurgeon as gs
 
 from Deeploy.CommonExtensions.OptimizationPasses.Matchers import BranchingMatcher, Match, NonBranchingMatcher
-from Deeploy.CommonExtensions.OptimizationPasses.PassClasses import ReplaceSequentialPatternPass, contextagnostic
+from Deeploy.CommonExtensions.OptimizationPasses.PassClasses import Pass, ReplaceSequentialPatternPass, contextagnostic
+from Deeploy.GraphMaintenance import cleanupGraph, toposortGraph
 
 
 def _merge_trueintegerdiv_rq_fun(graph: gs.Graph, match: Match, name: str):
@@ -296,7 +298,7 @@ def _skip_emptyconcat_fun(graph: gs.Graph, match: Match, name: str):
                 # Check if inputs are global inputs and remove them
                 graph.inputs = [inp for inp in graph.inputs if inp not in empty_inputs]
 
-                graph.cleanup().toposort()
+                toposortGraph(cleanupGraph(graph))
                 return graph
 
     return graph
@@ -334,7 +336,7 @@ def _split_add_fun(graph: gs.Graph, match: Match, name: str):
 
         add.inputs.clear()
         add.outputs.clear()
-        graph.cleanup().toposort()
+        toposortGraph(cleanupGraph(graph))
 
     return graph
 
@@ -389,7 +391,7 @@ def _extract_padding_fun_conv(graph: gs.Graph, match: Match, name: str, value =
 
         conv.inputs[0] = newConvInput
         graph.nodes.append(newPad)
-        graph.cleanup().toposort()
+        toposortGraph(cleanupGraph(graph))
 
     return graph
 
@@ -439,7 +441,7 @@ def _extract_padding_fun_maxpool(graph: gs.Graph, match: Match, name: str, value
 
         pool.inputs[0] = newPoolInput
         graph.nodes.append(newPad)
-        graph.cleanup().toposort()
+        toposortGraph(cleanupGraph(graph))
 
     return graph
 
@@ -621,7 +623,7 @@ def _merge_transposes_fun(graph: gs.Graph, match: Match, name: str):
         # Find Nodes-to-be-replaced
         graph.deleteNode(t2)
         graph.deleteNode(t1)
-        graph.cleanup().toposort()
+        toposortGraph(cleanupGraph(graph))
         return graph
     # Net the transpose
     else:
@@ -640,7 +642,7 @@ def _merge_transposes_fun(graph: gs.Graph, match: Match, name: str):
     newTrans = gs.Node(op = 'Transpose', name = name, attrs = {"perm": newPerm})
     graph.replaceInsertNode(_inputs, _outputs, newTrans)
 
-    graph.cleanup().toposort()
+    toposortGraph(cleanupGraph(graph))
     return graph
 
 
@@ -700,7 +702,7 @@ def _split_transposes_fun(graph: gs.Graph, match: Match, name: str):
     t1.outputs = []
     t1.inputs = []
 
-    graph.cleanup().toposort()
+    toposortGraph(cleanupGraph(graph))
     return graph
 
 
@@ -800,7 +802,7 @@ def _merge_reshape_fun(graph: gs.Graph, match: Match, name: str):
 
     graph.deleteNode(reshape1)
 
-    graph.cleanup()
+    cleanupGraph(graph)
 
     return graph
 
@@ -873,7 +875,7 @@ def _split_rqs_fun(graph: gs.Graph, match: Match, name: str, splitSet: List[str]
     t1.outputs = []
     t1.inputs = []
 
-    graph.cleanup().toposort()
+    toposortGraph(cleanupGraph(graph))
 
     return graph
 
@@ -1177,3 +1179,300 @@ class DequantPatternPass(ReplaceSequentialPatternPass):
 
         name = "_RECOGNIZE_DEQUANT_PASS"
         super().__init__(graph, _recognize_dequant_fun, name)
+
+
+def _unpack_scalar(value):
+    if isinstance(value, gs.Constant):
+        value = value.values
+    return np.asarray(value).item()
+
+
+def _elementwise_stage(node: gs.Node) -> Optional[Tuple[str, List[gs.Tensor], List[bool], Dict]]:
+    """Describe a node as a stage of a fused elementwise chain
+
+    Returns the stage operator, its operand tensors, a mask marking the
+    per-channel parameter operands and the stage attributes, or None if
+    the node cannot be fused.
+    """
+
+    if len(node.outputs) != 1 or node.outputs[0].shape is None:
+        return None
+
+    if node.op in ['Add', 'Mul', 'Div'] and len(node.inputs) == 2:
+        return node.op, list(node.inputs), [False, False], {}
+
+    if node.op == 'Relu' and len(node.inputs) == 1:
+        return 'Relu', list(node.inputs), [False], {}
+
+    if node.op == 'HardSwish' and len(node.inputs) == 1:
+        return 'HardSwish', list(node.inputs), [False], {}
+
+    if node.op in ['iGELU', 'Gelu'] and all(key in node.attrs for key in ['b', 'one']):
+        attrs = {'b': int(_unpack_scalar(node.attrs['b'])), 'one': int(_unpack_scalar(node.attrs['one']))}
+        return 'iGELU', [node.inputs[0]], [False], attrs
+
+    if node.op == 'iHardswish' and all(key in node.attrs for key in ['one_over_six', 'six', 'three']):
+        attrs = {key: int(_unpack_scalar(node.attrs[key])) for key in ['one_over_six', 'six', 'three']}
+        return 'iHardswish', [node.inputs[0]], [False], attrs
+
+    if node.op == 'Clip' and 1 <= len(node.inputs) <= 3:
+        attrs = {key: float(_unpack_scalar(node.attrs[key])) for key in ['min', 'max'] if key in node.attrs}
+        for key, tensor in zip(['min', 'max'], node.inputs[1:]):
+            if tensor.name == "":
+                continue
+            if not isinstance(tensor, gs.Constant) or tensor.values.size != 1:
+                return None
+            attrs[key] = float(tensor.values.item())
+        return 'Clip', [node.inputs[0]], [False], attrs
+
+    if node.op == 'RequantShift' and len(node.inputs) == 3:
+        if not all(key in node.attrs for key in ['div', 'signed']):
+            return None
+        if not any(key in node.attrs for key in ['n_levels', 'n_levels_out']):
+            return None
+        if not all(isinstance(tensor, gs.Constant) for tensor in node.inputs[1:]):
+            return None
+
+        div = int(_unpack_scalar(node.attrs['div']))
+        if div <= 0 or (div & (div - 1)) != 0:
+            return None
+
+        nLevels = node.attrs['n_levels'] if 'n_levels' in node.attrs else node.attrs['n_levels_out']
+        attrs = {
+            'log2D': int(math.log2(div)),
+            'n_levels': int(_unpack_scalar(nLevels)),
+            'signed': int(_unpack_scalar(node.attrs['signed'])),
+        }
+        return 'RequantShift', list(node.inputs), [False, True, True], attrs
+
+    return None
+
+
+def _broadcasts_to(shape: List[int], outShape: List[int]) -> bool:
+    if len(shape) > len(outShape):
+        return False
+    alignedShape = [1] * (len(outShape) - len(shape)) + list(shape)
+    return all(dim == 1 or dim == outDim for dim, outDim in zip(alignedShape, outShape))
+
+
+def _channel_aligned_shape(tensor: gs.Constant, outShape: List[int], channels_first: bool) -> Optional[List[int]]:
+    # Per-channel RequantShift parameters index the channel axis directly; align them to the
+    # output for plain ONNX-style broadcasting inside the fused node.
+    channelAxis = 1 if channels_first else len(outShape) - 1
+    channels = outShape[channelAxis]
+
+    if tensor.values.size == 1:
+        return [1]
+
+    if tensor.values.size == channels:
+        targetShape = [1] * len(outShape)
+        targetShape[channelAxis] = channels
+        return targetShape
+
+    return None
+
+
+def _channel_aligned_constant(tensor: gs.Constant, targetShape: List[int]) -> gs.Constant:
+    if list(tensor.values.shape) == targetShape:
+        return tensor
+
+    if len(tensor.outputs) > 1:
+        return gs.Constant(tensor.name + "_aligned", tensor.values.reshape(targetShape))
+
+    tensor.values = tensor.values.reshape(targetShape)
+    return tensor
+
+
+def _fuse_elementwise_group(graph: gs.Graph, group: List[gs.Node], stages: Dict[str, Tuple], name: str,
+                            default_channels_first: bool) -> bool:
+    groupNames = {node.name for node in group}
+
+    def producer(tensor: gs.Tensor) -> Optional[gs.Node]:
+        if len(tensor.inputs) == 1 and tensor.inputs[0].name in groupNames:
+            return tensor.inputs[0]
+        return None
+
+    roots = [node for node in group if not any(user.name in groupNames for user in node.outputs[0].outputs)]
+    assert len(roots) == 1, f"Elementwise group {[node.name for node in group]} has more than one root!"
+    root = roots[0]
+    outShape = list(root.outputs[0].shape)
+
+    # Post-order traversal from the root yields a valid evaluation order of the stages
+    order = []
+
+    def visit(node: gs.Node):
+        _, operands, paramMask, _ = stages[node.name]
+        for tensor, isParam in zip(operands, paramMask):
+            _producer = producer(tensor)
+            if not isParam and _producer is not None and _producer not in order:
+                visit(_producer)
+        order.append(node)
+
+    visit(root)
+
+    # Check all external operands before touching the graph
+    alignedShapes = {}
+    for node in order:
+        _, operands, paramMask, _ = stages[node.name]
+        for tensor, isParam in zip(operands, paramMask):
+            if isParam:
+                channels_first = node.attrs.get('channels_first', default_channels_first)
+                alignedShapes[tensor.name] = _channel_aligned_shape(tensor, outShape, channels_first)
+                if alignedShapes[tensor.name] is None:
+                    return False
+            elif producer(tensor) is None and (tensor.shape is None or not _broadcasts_to(tensor.shape, outShape)):
+                return False
+
+    # The first input of the fused node has to be a variable tensor, it determines the selected binding
+    if not any(
+            producer(tensor) is None and not isinstance(tensor, gs.Constant)
+            for node in order
+            for tensor in stages[node.name][1]):
+        return False
+
+    alignedConstants = {}
+    externalTensors = []
+    stageArgs = []
+    for node in order:
+        _, operands, paramMask, _ = stages[node.name]
+        args = []
+        for tensor, isParam in zip(operands, paramMask):
+            _producer = producer(tensor)
+            if not isParam and _producer is not None:
+                args.append(("stage", order.index(_producer)))
+                continue
+
+            if isParam:
+                if tensor.name not in alignedConstants:
+                    alignedConstants[tensor.name] = _channel_aligned_constant(tensor, alignedShapes[tensor.name])
+                tensor = alignedConstants[tensor.name]
+
+            if tensor not in externalTensors:
+                externalTensors.append(tensor)
+            args.append(("input", tensor))
+        stageArgs.append(args)
+
+    inputs = [tensor for tensor in externalTensors if not isinstance(tensor, gs.Constant)] + \
+        [tensor for tensor in externalTensors if isinstance(tensor, gs.Constant)]
+
+    attrs = {'ops': [], 'arity': [], 'args': []}
+    for idx, (node, args) in enumerate(zip(order, stageArgs)):
+        op, _, _, stageAttrs = stages[node.name]
+        attrs['ops'].append(op)
+        attrs['arity'].append(len(args))
+        # Non-negative arguments index the fused node's inputs, negative ones refer to earlier stages
+        attrs['args'] += [inputs.index(arg) if kind == "input" else -(arg + 1) for kind, arg in args]
+        for key, value in stageAttrs.items():
+            attrs[f"stage{idx}_{key}"] = value
+
+    if "engine" in root.attrs:
+        attrs["engine"] = root.attrs["engine"]
+
+    output = root.outputs[0]
+    for node in group:
+        node.inputs.clear()
+        node.outputs.clear()
+        graph.nodes.remove(node)
+
+    fusedNode = gs.Node(op = 'FusedElementwise', name = name, inputs = inputs, outputs = [output], attrs = attrs)
+    graph.nodes.append(fusedNode)
+
+    return True
+
+
+@contextagnostic
+class FuseElementwiseChainPass(Pass):
+    """Fuses trees of elementwise operators into a single FusedElementwise node
+
+    Every single-consumer edge between two fusable elementwise operators
+    (Add, Mul, Div, RequantShift, Relu, Clip, iGELU, iHardswish,
+    HardSwish) whose outputs have the same shape is collapsed. Each
+    maximal group is replaced by one node that evaluates the whole tree
+    per element, so intermediate results never leave the registers.
+    Groups read at most two full-size tensors, so fusing never increases
+    the number of simultaneously live activation buffers.
+    The evaluation order is encoded in the `ops`, `arity` and `args`
+    attributes, per-stage attributes are prefixed with `stage<idx>_`.
+    """
+
+    def __init__(self, default_channels_first: bool = True):
+        super().__init__()
+        self.default_channels_first = default_channels_first
+        self.name = "_FUSE_ELEMENTWISE_PASS"
+
+    def run_pass(self, graph: gs.Graph) -> gs.Graph:
+        stages = {}
+        for node in graph.nodes:
+            stage = _elementwise_stage(node)
+            if stage is not None:
+                stages[node.name] = stage
+
+        groupOf = {name: name for name in stages.keys()}
+
+        # Tensors produced and full-size tensors read by each group. A fused node keeps all of
+        # its full-size inputs live at once, hence groups are bounded to the two inputs of a
+        # regular binary elementwise layer.
+        groupOutputs = {}
+        groupFullInputs = {}
+        for node in graph.nodes:
+            if node.name not in stages:
+                continue
+            _, operands, paramMask, _ = stages[node.name]
+            groupOutputs[node.name] = {node.outputs[0].name}
+            groupFullInputs[node.name] = {
+                tensor.name
+                for tensor, isParam in zip(operands, paramMask)
+                if not isParam and tensor.shape is not None and list(tensor.shape) == list(node.outputs[0].shape)
+            }
+
+        def find(name: str) -> str:
+            while groupOf[name] != name:
+                groupOf[name] = groupOf[groupOf[name]]
+                name = groupOf[name]
+            return name
+
+        graphOutputs = {tensor.name for tensor in graph.outputs}
+
+        for node in graph.nodes:
+            if node.name not in stages:
+                continue
+
+            output = node.outputs[0]
+            if output.name in graphOutputs or len(output.outputs) != 1:
+                continue
+
+            consumer = output.outputs[0]
+            if consumer.name not in stages or list(consumer.outputs[0].shape) != list(output.shape):
+                continue
+
+            if node.attrs.get("engine", None) != consumer.attrs.get("engine", None):
+                continue
+
+            _, operands, paramMask, _ = stages[consumer.name]
+            if not any(tensor is output and not isParam for tensor, isParam in zip(operands, paramMask)):
+                continue
+
+            producerGroup, consumerGroup = find(node.name), find(consumer.name)
+            outputs = groupOutputs[producerGroup] | groupOutputs[consumerGroup]
+            fullInputs = (groupFullInputs[producerGroup] | groupFullInputs[consumerGroup]) - outputs
+            if len(fullInputs) > 2:
+                continue
+
+            groupOf[producerGroup] = consumerGroup
+            groupOutputs[consumerGroup] = outputs
+            groupFullInputs[consumerGroup] = fullInputs
+
+        groups = OrderedDict()
+        for node in graph.nodes:
+            if node.name in stages:
+                groups.setdefault(find(node.name), []).append(node)
+
+        fusedIdx = 0
+        for group in groups.values():
+            if len(group) < 2:
+                continue
+            if _fuse_elementwise_group(graph, group, stages, f"{self.name}_{fusedIdx}", self.default_channels_first):
+                fusedIdx += 1
+
+        toposortGraph(cleanupGraph(graph))
+        return graph
@@ -5,10 +5,11 @@
 from typing import List, Optional, Sequence, Type
 
 import numpy as np
+import onnx_graphsurgeon as gs
 
-from Deeploy.AbstractDataTypes import FloatImmediate, Pointer
+from Deeploy.AbstractDataTypes import FloatImmediate, IntegerImmediate, Pointer
 from Deeploy.CommonExtensions.TypeCheckers.SignPropTypeChecker import SignPropTypeChecker
-from Deeploy.DeeployTypes import ConstantBuffer, OperatorRepresentation, VariableBuffer
+from Deeploy.DeeployTypes import ConstantBuffer, NetworkContext, OperatorRepresentation, VariableBuffer
 
 
 class ConcatChecker(SignPropTypeChecker):
@@ -629,3 +630,69 @@ class RMSNormChecker(SignPropTypeChecker):
             return [True]
         else:
             return [False]
+
+
+class FusedElementwiseChecker(SignPropTypeChecker):
+    """Type checker for fused elementwise chains
+
+    The binding only fixes the type of the first (variable) input and the
+    output. Further variable inputs keep the type assigned by their
+    producers, constant inputs are assigned the `parameter_type`.
+    """
+
+    _integerOnlyOps = ['RequantShift', 'iGELU', 'iHardswish']
+    _floatOnlyOps = ['HardSwish']
+
+    def __init__(self, input_types: Sequence[Type[Pointer]], output_types: Sequence[Type[Pointer]],
+                 parameter_type: Type[Pointer]):
+        super().__init__(input_types, output_types)
+        self.head_types = list(input_types)
+        self.parameter_type = parameter_type
+
+    def _isFloat(self) -> bool:
+        return issubclass(self.head_types[0].referencedType, FloatImmediate)
+
+    def typeCheckNodeInputs(self, ctxt: NetworkContext, node: gs.Node) -> bool:
+        inputTypes = list(self.head_types)
+        for inputNode in node.inputs[len(self.head_types):]:
+            reference = ctxt.lookup(inputNode.name)
+            if isinstance(reference, ConstantBuffer):
+                inputTypes.append(self.parameter_type)
+                continue
+
+            if not hasattr(reference, "_type") or self._isFloat() != issubclass(reference._type.referencedType,
+                                                                                FloatImmediate):
+                return False
+            inputTypes.append(reference._type)
+
+        self.input_types = inputTypes
+        return super().typeCheckNodeInputs(ctxt, node)
+
+    def checkOutputType(self, inputs: List[VariableBuffer], operatorRepresentation: OperatorRepresentation) -> bool:
+        stages = operatorRepresentation['stages']
+        outputType = self.output_types[0].referencedType
+
+        if self._isFloat():
+            return not any(stage['op'] in self._integerOnlyOps for stage in stages)
+
+        if any(stage['op'] in self._floatOnlyOps for stage in stages):
+            return False
+
+        # Requantized chains store their result in 8 bit, all others keep the 32 bit accumulator
+        if stages[-1]['op'] == 'RequantShift':
+            return issubclass(outputType, IntegerImmediate) and outputType.typeWidth == 8
+        return outputType.typeWidth == 32
+
+    def _inferNumLevels(self, inputs: List[VariableBuffer],
+                        operatorRepresentation: OperatorRepresentation) -> List[int]:
+        lastStage = operatorRepresentation['stages'][-1]
+        if lastStage['op'] == 'RequantShift':
+            return [lastStage['attrs']['n_levels']]
+        return [2**(self.output_types[0].referencedType.typeWidth)]
+
+    def _inferSignedness(self, inputs: List[VariableBuffer],
+                         operatorRepresentation: OperatorRepresentation) -> List[bool]:
+        lastStage = operatorRepresentation['stages'][-1]
+        if lastStage['op'] == 'RequantShift':
+            return [bool(lastStage['attrs']['signed'])]
+        return [True]
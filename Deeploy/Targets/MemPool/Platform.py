@@ -141,6 +141,7 @@ class MemPoolTransientBuffer(TransientBuffer):
 class MemPoolConstantBuffer(ConstantBuffer):
 
     initTemplate = AllocateTemplate.MemPoolGlobalInitTemplate
+    binaryInitTemplate = AllocateTemplate.MemPoolGlobalBinaryInitTemplate
     allocTemplate = AllocateTemplate.MemPoolGlobalAllocateTemplate
     deallocTemplate = FreeTemplate.MemPoolGlobalTemplate
 
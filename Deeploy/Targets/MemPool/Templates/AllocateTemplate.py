@@ -23,6 +23,13 @@ if (core_id ==0) {
 
 MemPoolGlobalInitTemplate = NodeTemplate(
     "static ${type.referencedType.typeName} ${name}[${size}] __attribute__((section(\".l2\"))) = {${values}};\n")
+
+# Values are linked from the binary blob at ${blobPath} by the assembler, its label is local like the static array
+MemPoolGlobalBinaryInitTemplate = NodeTemplate("""
+__asm__(".pushsection .l2, \\"aw\\"\\n.balign 4\\n${name}:\\n.incbin \\"${blobPath}\\"\\n.popsection");
+extern ${type.referencedType.typeName} ${name}[${size}] __attribute__((aligned(4)));
+""")
+
 MemPoolGlobalAllocateTemplate = NodeTemplate("")
 
 MemPoolStructInitTemplate = NodeTemplate("""
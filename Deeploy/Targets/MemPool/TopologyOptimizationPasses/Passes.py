@@ -10,6 +10,7 @@ import onnx_graphsurgeon as gs
 
 from Deeploy.CommonExtensions.OptimizationPasses.Matchers import BranchingMatcher, Match, NonBranchingMatcher
 from Deeploy.CommonExtensions.OptimizationPasses.PassClasses import ReplaceSequentialPatternPass, contextagnostic
+from Deeploy.GraphMaintenance import cleanupGraph, toposortGraph
 
 
 def merge_matmul_rq_fun(graph: gs.Graph, match: Match, name: str):
@@ -297,7 +298,7 @@ def _fuse_mhsa_fun(graph: gs.Graph, match: Match, name: str, batchedMatMul = Fal
         # Disconnect input nodes of all output tensors
         _output.inputs = _output.inputs[-1:]
 
-        graph.cleanup().toposort()
+        toposortGraph(cleanupGraph(graph))
 
     return graph
 
@@ -485,7 +486,7 @@ def _split_mhsa_fun(graph: gs.Graph, match: Match, name: str):
     # graph.deleteNode(ReduceSum)
     # graph.deleteNode(RequantShift)
 
-    graph.cleanup().toposort()
+    toposortGraph(cleanupGraph(graph))
 
     return graph
 
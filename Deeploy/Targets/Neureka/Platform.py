@@ -11,7 +11,8 @@ from Deeploy.CommonExtensions.OptimizationPasses.TopologyOptimizationPasses.Lowe
 from Deeploy.DeeployTypes import ConstantBuffer, NetworkContext, NodeTemplate, TopologyOptimizer
 from Deeploy.MemoryLevelExtension.MemoryLevels import MemoryHierarchy, MemoryLevel
 from Deeploy.Targets.Neureka.Engine import NeurekaEngine
-from Deeploy.Targets.Neureka.Templates.AllocateTemplate import neurekaGenericGlobalInitTemplate
+from Deeploy.Targets.Neureka.Templates.AllocateTemplate import neurekaGenericGlobalBinaryInitTemplate, \
+    neurekaGenericGlobalInitTemplate
 from Deeploy.Targets.PULPOpen.Platform import MemoryPULPPlatform, MemoryPULPPlatformWrapper, PULPClusterEngine, \
     PULPOptimizer, PULPPlatform, PULPStructBuffer, PULPTransientBuffer, PULPVariableBuffer
 
@@ -24,6 +25,7 @@ NeurekaOptimizer = TopologyOptimizer([
 class NeurekaConstantBuffer(ConstantBuffer):
 
     initTemplate = neurekaGenericGlobalInitTemplate
+    binaryInitTemplate = neurekaGenericGlobalBinaryInitTemplate
     allocTemplate = NodeTemplate("")
     deallocTemplate = NodeTemplate("")
 
@@ -32,6 +34,12 @@ class NeurekaConstantBuffer(ConstantBuffer):
         operatorRepresentation["_memoryLevel"] = getattr(self, "_memoryLevel", None)
         return operatorRepresentation
 
+    def _binaryInitTemplate(self):
+        # L1 and L3 constants keep their literal declaration
+        if getattr(self, "_memoryLevel", None) not in ("L2", "WeightMemory_SRAM", None):
+            return None
+        return super()._binaryInitTemplate()
+
 
 class NeurekaPlatform(PULPPlatform):
 
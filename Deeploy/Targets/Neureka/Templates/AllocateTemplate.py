@@ -16,3 +16,15 @@ static PI_L2 ${type.referencedType.typeName}* ${name};
 static __attribute__((section(".weightmem_sram"))) ${type.referencedType.typeName} ${name}[${size}] = {${values}};\n
 % endif
 """)
+
+# Only used for L2 and weight memory constants, the values are linked from the binary blob at ${blobPath} by the
+# assembler, its label is local like the static array
+neurekaGenericGlobalBinaryInitTemplate = NodeTemplate("""
+% if _memoryLevel == "WeightMemory_SRAM":
+__asm__(".pushsection .weightmem_sram, \\"aw\\"\\n.balign 4\\n${name}:\\n.incbin \\"${blobPath}\\"\\n.popsection");
+extern ${type.referencedType.typeName} ${name}[${size}] __attribute__((aligned(4)));
+% else:
+__asm__(".pushsection .l2_data, \\"aw\\"\\n.balign 4\\n${name}:\\n.incbin \\"${blobPath}\\"\\n.popsection");
+extern ${type.referencedType.typeName} ${name}[${size}] __attribute__((aligned(4)));
+% endif
+""")
@@ -21,22 +21,23 @@ from Deeploy.Targets.Generic.TypeCheckers import AddChecker, ConcatChecker, Conv
     GatherChecker, GELUChecker, GEMMChecker, HardswishChecker, LayerNormChecker, MatMulChecker, MulChecker, \
     QuantChecker, ReduceMeanChecker, ReluChecker, ReshapeChecker, RQAddChecker, RQHardswishChecker, SGDChecker, \
     SliceChecker, SoftmaxChecker, SoftmaxCrossEntropyLossChecker, TransposeChecker
+from Deeploy.Targets.PULPOpen.CodeTransformationPasses.PULPClusterFork import PULPClusterForkGeneration
 from Deeploy.Targets.PULPOpen.CodeTransformationPasses.PULPClusterSynch import PULPSynchCoresPass
 from Deeploy.Targets.PULPOpen.CodeTransformationPasses.PULPClusterTiling import PULPClusterTiling
 from Deeploy.Targets.PULPOpen.CodeTransformationPasses.PULPL3Tiling import PULPL3Tiling
 from Deeploy.Targets.PULPOpen.CodeTransformationPasses.PULPMicrobenchmark import PULPMicrobenchmark
 from Deeploy.Targets.PULPOpen.CodeTransformationPasses.PULPProfileUntiled import PULPProfileUntiled
 from Deeploy.Targets.PULPOpen.DataTypes import PULPDMAFuture
-from Deeploy.Targets.PULPOpen.DMA.L3Dma import l3DmaHack
+from Deeploy.Targets.PULPOpen.DMA.L3Dma import L3AsyncDma, l3DmaHack
 from Deeploy.Targets.PULPOpen.DMA.MchanDma import MchanDma
 from Deeploy.Targets.PULPOpen.Templates import ConvTemplate, DMASliceTemplate, FloatAddTemplate, FloatConvTemplate, \
     FloatGELUTemplate, FloatGemmTemplate, FloatLayernormTemplate, FloatMatMulTemplate, FloatMaxPoolTemplate, \
-    FloatMulTemplate, FloatReduceMeanTemplate, FloatReluTemplate, FloatSoftmaxTemplate, GEMMTemplate, \
-    MatrixVectorTemplate, MaxPoolTemplate, MulTemplate, ReduceMeanTemplate, RequantShiftTemplate, ReshapeTemplate, \
-    RQAddTemplate, RQSiHardswishTemplate, SGDTemplate, SoftmaxCrossEntropyLossTemplate, TallGEMMTemplate, \
-    TransposeTemplate, UniformRequantShiftTemplate, iRMSNormTemplate, iSoftmaxTemplate
-from Deeploy.Targets.PULPOpen.TypeCheckers import PULPConvChecker, PULPLinearChecker, PULPMaxPoolChecker, \
-    PULPRequantShiftChecker
+    FloatMulTemplate, FloatReduceMeanTemplate, FloatReluTemplate, FloatSoftmaxTemplate, FusedElementwiseTemplate, \
+    GEMMTemplate, MatrixVectorTemplate, MaxPoolTemplate, MulTemplate, ReduceMeanTemplate, RequantShiftTemplate, \
+    ReshapeTemplate, RQAddTemplate, RQSiHardswishTemplate, SGDTemplate, SoftmaxCrossEntropyLossTemplate, \
+    TallGEMMTemplate, TransposeTemplate, UniformRequantShiftTemplate, iRMSNormTemplate, iSoftmaxTemplate
+from Deeploy.Targets.PULPOpen.TypeCheckers import PULPConvChecker, PULPFusedElementwiseChecker, PULPLinearChecker, \
+    PULPMaxPoolChecker, PULPRequantShiftChecker
 from Deeploy.TilingExtension.CodeTransformationPasses.TilingVariableReplacement import TilingVariableReplacement, \
     TilingVariableReplacementUpdate
 
@@ -51,10 +52,6 @@ pi_cluster_send_task_to_cl(&cluster_dev, &cluster_task);
 //pi_cluster_close(&cluster_dev);
 """)
 
-_clusterForkClosureCallTemplate = NodeTemplate("""
-pi_cl_team_fork(NUM_CORES, (void*)${closureName}, &${closureStructArgName});
-""")
-
 SkipTransformer = CodeTransformation(
     [ArgumentStructGeneration(),
      MemoryPassthroughGeneration("L.*"),
@@ -65,15 +62,11 @@ FunctionCallClosure = partial(ClosureGeneration, closureSuffix = "_closure")
 ClusterClosure = partial(ClosureGeneration,
                          closureSuffix = "_cluster_entry",
                          closureCallTemplate = _clusterEntryClosureCallTemplate)
-ForkClosure = partial(ClosureGeneration,
-                      closureSuffix = "_cluster_fork",
-                      closureCallTemplate = _clusterForkClosureCallTemplate)
+ForkClosure = partial(PULPClusterForkGeneration, closureSuffix = "_cluster_fork")
 
 TilingCallClosure = partial(ClosureGeneration, closureSuffix = "_tiling_closure")
 FunctionCallClosure = partial(ClosureGeneration, closureSuffix = "_closure")
-ForkClosure = partial(ClosureGeneration,
-                      closureSuffix = "_cluster_fork",
-                      closureCallTemplate = _clusterForkClosureCallTemplate)
+ForkClosure = partial(PULPClusterForkGeneration, closureSuffix = "_cluster_fork")
 
 MemoryAwareClusterClosure = partial(MemoryAwareClosureGeneration,
                                     closureSuffix = "_cluster_entry",
@@ -109,7 +102,29 @@ ForkTransformer = CodeTransformation([
     MemoryManagementGeneration("L1"),
     TilingVariableReplacement("L2"),
     MemoryAwareFunctionCallClosure(writeback = False, generateStruct = True),
-    PULPL3Tiling("L3", "L2", l3DmaHack),
+    PULPL3Tiling("L3", "L2", l3DmaHack, asyncDma = L3AsyncDma()),
+    PULPProfileUntiled(),
+    ArgumentStructGeneration(),
+    L3MemoryAwareFunctionCallClosure(writeback = False),
+    MemoryManagementGeneration("L2"),
+    MemoryManagementGeneration("L3.*"),
+    MemoryManagementGeneration(),
+    PULPMicrobenchmark(),
+])
+
+# Kernels which accept a core count run on the compute cores alone if a core is dedicated to the DMA
+ComputeCoresForkTransformer = CodeTransformation([
+    TilingVariableReplacement("L1"),
+    PULPSynchCoresPass(computeCores = True),
+    TilingCallClosure(writeback = False),
+    ForkClosure(writeback = False, generateStruct = True, computeCores = True),
+    TilingVariableReplacementUpdate("L1"),
+    PULPClusterTiling("L2", "L1", MchanDma()),
+    ArgumentStructGeneration(),
+    MemoryManagementGeneration("L1"),
+    TilingVariableReplacement("L2"),
+    MemoryAwareFunctionCallClosure(writeback = False, generateStruct = True),
+    PULPL3Tiling("L3", "L2", l3DmaHack, asyncDma = L3AsyncDma()),
     PULPProfileUntiled(),
     ArgumentStructGeneration(),
     L3MemoryAwareFunctionCallClosure(writeback = False),
@@ -128,7 +143,7 @@ ClusterTransformer = CodeTransformation([
     MemoryManagementGeneration("L1"),
     TilingVariableReplacement("L2"),
     MemoryAwareFunctionCallClosure(writeback = False, generateStruct = True),
-    PULPL3Tiling("L3", "L2", l3DmaHack),
+    PULPL3Tiling("L3", "L2", l3DmaHack, asyncDma = L3AsyncDma()),
     PULPProfileUntiled(),
     ArgumentStructGeneration(),
     L3MemoryAwareFunctionCallClosure(writeback = False),
@@ -191,7 +206,7 @@ PULPAddBindings = [
     for type2 in IntegerDataTypes
 ] + [
     NodeBinding(AddChecker([PointerClass(float32_t), PointerClass(float32_t)], [PointerClass(float32_t)]),
-                FloatAddTemplate.referenceTemplate, ForkTransformer)
+                FloatAddTemplate.referenceTemplate, ComputeCoresForkTransformer)
 ]
 
 PULPRQSConv2DBindings = [
@@ -206,6 +221,31 @@ PULPRQSConv2DBindings = [
     for type1, type2 in zip([int8_t, int8_t, uint8_t, uint8_t], [int8_t, uint8_t, int8_t, uint8_t])
 ]
 
+PULPRQSConv2DMaxPoolBindings = [
+    NodeBinding(
+        PULPConvChecker([
+            PointerClass(type1),
+            PointerClass(int8_t),
+            PointerClass(int32_t),
+            PointerClass(int32_t),
+        ], [PointerClass(type2)]), ConvTemplate.PULPConv2DMaxPool_8_Template, ForkTransformer)
+    for type1, type2 in zip([int8_t, int8_t, uint8_t, uint8_t], [int8_t, uint8_t, int8_t, uint8_t])
+]
+
+PULPRQSConv2DAddBindings = [
+    NodeBinding(
+        RQAddChecker([
+            PointerClass(type1),
+            PointerClass(int8_t),
+            PointerClass(int32_t),
+            PointerClass(int32_t),
+            PointerClass(type2),
+        ], [PointerClass(type3)]), ConvTemplate.PULPConv2DAdd_8_Template, ForkTransformer)
+    for type1 in [int8_t, uint8_t]
+    for type2 in [int8_t, uint8_t]
+    for type3 in [int8_t, uint8_t]
+]
+
 PULPRQSDWConv2DBindings = [
     NodeBinding(
         PULPConvChecker([
@@ -413,11 +453,11 @@ PULPiRQSGELUBindings = [
 
 PULPMulBindings = [
     NodeBinding(MulChecker([PointerClass(typeA), PointerClass(typeB)], [PointerClass(int32_t)]),
-                MulTemplate.referenceTemplate, ForkTransformer)
+                MulTemplate.referenceTemplate, ComputeCoresForkTransformer)
     for typeA, typeB in itertools.product(SignedIntegerDataTypes, SignedIntegerDataTypes)
 ] + [
     NodeBinding(MulChecker([PointerClass(float32_t), PointerClass(float32_t)], [PointerClass(float32_t)]),
-                FloatMulTemplate.referenceTemplate, ForkTransformer)
+                FloatMulTemplate.referenceTemplate, ComputeCoresForkTransformer)
 ]
 
 PULPReluBinding = NodeBinding(ReluChecker([PointerClass(float32_t)], [PointerClass(float32_t)]),
@@ -462,3 +502,14 @@ BasicDequantBindings = [
     NodeBinding(DequantChecker([PointerClass(int32_t)], [PointerClass(float32_t)]), DequantTemplate.referenceTemplate,
                 ForkTransformer),
 ]
+
+PULPFusedElementwiseBindings = [
+    NodeBinding(PULPFusedElementwiseChecker([PointerClass(type)], [PointerClass(outType)], PointerClass(int32_t)),
+                FusedElementwiseTemplate.referenceTemplate, ComputeCoresForkTransformer)
+    for type in IntegerDataTypes
+    for outType in (int8_t, uint8_t, int32_t)
+] + [
+    NodeBinding(
+        PULPFusedElementwiseChecker([PointerClass(float32_t)], [PointerClass(float32_t)], PointerClass(float32_t)),
+        FusedElementwiseTemplate.referenceTemplate, ComputeCoresForkTransformer)
+]
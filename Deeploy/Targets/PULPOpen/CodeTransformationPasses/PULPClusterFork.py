@@ -0,0 +1,83 @@
+# SPDX-FileCopyrightText: 2025 ETH Zurich and University of Bologna
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import Tuple
+
+from Deeploy.CommonExtensions.CodeTransformationPasses.Closure import ClosureGeneration
+from Deeploy.DeeployTypes import CodeGenVerbosity, ExecutionBlock, NetworkContext, NodeTemplate, _NoVerbosity
+from Deeploy.Targets.PULPOpen.CodeTransformationPasses.PULPDeploymentOptions import deploymentOption
+
+# Name of the global definition of the persistent cluster team
+persistentClusterTeamName = "cluster_team"
+
+_clusterForkClosureCallTemplate = NodeTemplate("""
+pi_cl_team_fork(NUM_CORES, (void*)${closureName}, &${closureStructArgName});
+""")
+
+# The team name is substituted before the closure arguments
+_clusterDispatchClosureCall = """
+deeploy_cluster_dispatch(&${teamName}, (void*)${closureName}, &${closureStructArgName});
+"""
+
+_computeCoresPostClosureCall = """
+deeploy_cluster_post(&${teamName}, (void*)${closureName}, &${closureStructArgName});
+"""
+
+# Separate from the post, such that the tiling loop can wait for the compute cores only before reusing their buffers
+computeCoresWaitTemplate = NodeTemplate("""
+deeploy_cluster_wait(&${teamName});
+""")
+
+_clusterTeamDefinitionTemplate = NodeTemplate("""
+PI_L1 deeploy_cluster_team_t ${teamName};
+""")
+
+
+def hoistPersistentClusterTeam(ctxt: NetworkContext) -> str:
+    """Declare the persistent cluster team, which runs the network and the closures dispatched to it
+
+    Returns the name of the team
+    """
+    teamName = ctxt._mangle(persistentClusterTeamName)
+    if not ctxt.is_global(persistentClusterTeamName):
+        ctxt.hoistGlobalDefinition(persistentClusterTeamName,
+                                   _clusterTeamDefinitionTemplate.generate({"teamName": teamName}))
+    return teamName
+
+
+class PULPClusterForkGeneration(ClosureGeneration):
+    """Closure generation for code executed by all cluster cores.
+
+    By default, every closure call forks the cluster team. If the layer is deployed with the `persistentCluster`
+    option, the closure is dispatched to the already running team instead. With `computeCores`, the closure only
+    runs on the compute cores if the layer is deployed with the `dmaCore` option, i.e., a core is dedicated to the
+    DMA: It is posted to the other cores and waited for afterwards.
+    """
+
+    def __init__(self,
+                 closureSuffix = "_cluster_fork",
+                 writeback: bool = True,
+                 generateStruct: bool = True,
+                 computeCores: bool = False):
+        super().__init__(_clusterForkClosureCallTemplate, closureSuffix, writeback, generateStruct)
+        self.computeCores = computeCores
+
+    def apply(self,
+              ctxt: NetworkContext,
+              executionBlock: ExecutionBlock,
+              name: str,
+              verbose: CodeGenVerbosity = _NoVerbosity) -> Tuple[NetworkContext, ExecutionBlock]:
+        teamName = ctxt._mangle(persistentClusterTeamName)
+        posted = self.computeCores and deploymentOption(executionBlock, "dmaCore")
+        if posted:
+            self.closureCallTemplate = NodeTemplate(_computeCoresPostClosureCall.replace("${teamName}", teamName))
+        elif deploymentOption(executionBlock, "persistentCluster"):
+            self.closureCallTemplate = NodeTemplate(_clusterDispatchClosureCall.replace("${teamName}", teamName))
+        else:
+            self.closureCallTemplate = _clusterForkClosureCallTemplate
+
+        ctxt, executionBlock = super().apply(ctxt, executionBlock, name, verbose)
+        if posted:
+            executionBlock.addRight(computeCoresWaitTemplate, {"teamName": teamName})
+        return ctxt, executionBlock
@@ -6,18 +6,42 @@ from typing import Tuple
 
 from Deeploy.DeeployTypes import CodeGenVerbosity, CodeTransformationPass, ExecutionBlock, NetworkContext, \
     NodeTemplate, _NoVerbosity
+from Deeploy.Targets.PULPOpen.CodeTransformationPasses.PULPClusterFork import persistentClusterTeamName
+from Deeploy.Targets.PULPOpen.CodeTransformationPasses.PULPDeploymentOptions import deploymentOption
 
 _synchTemplate = NodeTemplate("""
         pi_cl_team_barrier();
         """)
 
+_taskDoneTemplate = NodeTemplate("""
+        deeploy_cluster_task_done(&${teamName});
+        """)
+
 
 class PULPSynchCoresPass(CodeTransformationPass):
+    """Join the cluster cores after a kernel.
+
+    With `computeCores`, the kernel accepts a core count in `compute_cores`. If the layer is deployed with the `dmaCore`
+    option, i.e., a core is dedicated to the DMA, the kernel is computed by the remaining cores, which signal their
+    completion instead of joining the team in a barrier.
+    """
+
+    def __init__(self, computeCores: bool = False):
+        super().__init__()
+        self.computeCores = computeCores
 
     def apply(self,
               ctxt: NetworkContext,
               executionBlock: ExecutionBlock,
               name: str,
               verbose: CodeGenVerbosity = _NoVerbosity) -> Tuple[NetworkContext, ExecutionBlock]:
-        executionBlock.addRight(_synchTemplate, {})
+        if not (self.computeCores and deploymentOption(executionBlock, "dmaCore")):
+            executionBlock.addRight(_synchTemplate, {})
+            return ctxt, executionBlock
+
+        for snippet in executionBlock.codeSnippets:
+            snippet.operatorRepresentation = {
+                **snippet.operatorRepresentation, "compute_cores": "DEEPLOY_COMPUTE_CORES"
+            }
+        executionBlock.addRight(_taskDoneTemplate, {"teamName": ctxt._mangle(persistentClusterTeamName)})
         return ctxt, executionBlock
@@ -2,9 +2,12 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import Tuple
+from collections import deque
+from typing import List, Tuple
 
-from Deeploy.DeeployTypes import CodeGenVerbosity, CodeTransformationPass, ExecutionBlock, NetworkContext, _NoVerbosity
+from Deeploy.DeeployTypes import CodeGenVerbosity, CodeSnippet, CodeTransformationPass, ExecutionBlock, \
+    NetworkContext, _NoVerbosity
+from Deeploy.Targets.PULPOpen.CodeTransformationPasses.PULPClusterFork import computeCoresWaitTemplate
 from Deeploy.TilingExtension.AsyncDma import AsyncDma
 from Deeploy.TilingExtension.CodeTransformationPasses.DoubleBufferingTilingCodeGeneration import \
     DoubleBufferingTilingCodeGeneration, ProfilingDoubleBufferingTilingMixIn
@@ -21,7 +24,13 @@ class ProfilingPULPClusterTilingGenerationSB(SingleBufferingTilingCodeGeneration
 
 
 class PULPClusterTilingGenerationDB(DoubleBufferingTilingCodeGeneration):
-    pass
+
+    def _asyncKernelWait(self, executionBlock: ExecutionBlock) -> List[CodeSnippet]:
+        # Closures posted to the compute cores run while the dedicated DMA core continues the tiling loop
+        waits = [snippet for snippet in executionBlock.codeSnippets if snippet.template is computeCoresWaitTemplate]
+        executionBlock.codeSnippets = deque(
+            snippet for snippet in executionBlock.codeSnippets if snippet.template is not computeCoresWaitTemplate)
+        return waits
 
 
 class ProfilingPULPClusterTilingGenerationDB(DoubleBufferingTilingCodeGeneration, ProfilingDoubleBufferingTilingMixIn):
@@ -43,10 +52,10 @@ class PULPClusterTiling(CodeTransformationPass):
               verbose: CodeGenVerbosity = _NoVerbosity) -> Tuple[NetworkContext, ExecutionBlock]:
 
         if verbose.tilingProfiling:
-            ctxt, executionBlock = self.profilingSB.apply(ctxt, executionBlock, name)
-            ctxt, executionBlock = self.profilingDB.apply(ctxt, executionBlock, name)
+            ctxt, executionBlock = self.profilingSB.apply(ctxt, executionBlock, name, verbose)
+            ctxt, executionBlock = self.profilingDB.apply(ctxt, executionBlock, name, verbose)
         else:
-            ctxt, executionBlock = self.SB.apply(ctxt, executionBlock, name)
-            ctxt, executionBlock = self.DB.apply(ctxt, executionBlock, name)
+            ctxt, executionBlock = self.SB.apply(ctxt, executionBlock, name, verbose)
+            ctxt, executionBlock = self.DB.apply(ctxt, executionBlock, name, verbose)
 
         return ctxt, executionBlock
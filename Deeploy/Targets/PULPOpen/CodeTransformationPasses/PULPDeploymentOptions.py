@@ -0,0 +1,18 @@
+# SPDX-FileCopyrightText: 2025 ETH Zurich and University of Bologna
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from Deeploy.CommonExtensions.CodeTransformationPasses.Closure import ClosureExecutionBlock
+from Deeploy.DeeployTypes import ExecutionBlock
+
+
+def deploymentOption(executionBlock: ExecutionBlock, option: str) -> bool:
+    """Return whether the deployer enabled `option` for the layer of `executionBlock`
+
+    `PULPDeployer.annotateDeploymentOptions` annotates its options in the
+    operator representation of every layer, from where the code
+    transformation passes of the layer read them.
+    """
+    if isinstance(executionBlock, ClosureExecutionBlock):
+        executionBlock = executionBlock.baseBlock
+    return any(snippet.operatorRepresentation.get(option, False) for snippet in executionBlock.codeSnippets)
@@ -2,51 +2,125 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import Tuple
+import math
+from typing import Dict, List, Optional, Tuple
 
-from Deeploy.DeeployTypes import CodeGenVerbosity, CodeTransformationPass, ExecutionBlock, NetworkContext, _NoVerbosity
+import numpy as np
+
+from Deeploy.DeeployTypes import CodeGenVerbosity, CodeTransformationPass, ConstantBuffer, ExecutionBlock, \
+    NetworkContext, NodeTemplate, OperatorRepresentation, VariableBuffer, _NoVerbosity
+from Deeploy.Logging import DEFAULT_LOGGER as log
+from Deeploy.Targets.PULPOpen.CodeTransformationPasses.PULPDeploymentOptions import deploymentOption
+from Deeploy.Targets.PULPOpen.L3Compression import compressL3Tiles, l3Image
 from Deeploy.TilingExtension.AsyncDma import AsyncDma
 from Deeploy.TilingExtension.CodeTransformationPasses.DoubleBufferingTilingCodeGeneration import \
     DoubleBufferingTilingCodeGeneration, ProfilingDoubleBufferingTilingMixIn
 from Deeploy.TilingExtension.CodeTransformationPasses.SingleBufferingTilingCodeGeneration import \
     ProfilingSingleBufferingTilingMixIn, SingleBufferingTilingCodeGeneration
-
-
-class PULPL3TilingGenerationSB(SingleBufferingTilingCodeGeneration):
+from Deeploy.TilingExtension.TilingCodegen import HyperRectangle, padOffset, padShape
+
+
+class PULPL3CompressionMixIn:
+    """Keep the L3 constants compressed if the layer is deployed with the `compressL3Constants` option
+
+    Each distinct tile of a constant that is only used by the layer is
+    compressed into a chunk of the constant's L3 image (`extData`), which is
+    transferred into the end of the tile's L2 buffer and decompressed in place
+    by `l3_decompress`, see `L3Compression`.
+    """
+
+    _decompressTileTemplate = NodeTemplate("l3_decompress(${localBuffer}, (char *)(${localBuffer}) + ${stageOffset});")
+
+    def _compressTransfers(
+            self, ctxt: NetworkContext, operatorRepresentation: OperatorRepresentation, externalBuffer: VariableBuffer,
+            transfers: List[HyperRectangle], outerShape: Tuple[int, ...],
+            isFinalMemoryLevel: bool) -> Optional[Tuple[List[HyperRectangle], Tuple[int, ...], List[int]]]:
+        if not operatorRepresentation.get("compressL3Constants", False) or not isFinalMemoryLevel:
+            return None
+        if not isinstance(externalBuffer, ConstantBuffer) or len(externalBuffer._users) != 1:
+            return None
+
+        referencedType = externalBuffer._type.referencedType
+        values = np.asarray(externalBuffer.values).reshape(outerShape)
+
+        tileIdxs: Dict[Tuple[Tuple[int, ...], Tuple[int, ...]], int] = {}
+        images = []
+        for rect in transfers:
+            offset, dims = padOffset(rect.offset, len(outerShape)), padShape(rect.dims, len(outerShape))
+            if (offset, dims) in tileIdxs:
+                continue
+            tileIdxs[(offset, dims)] = len(images)
+            image = l3Image(values[tuple(slice(o, o + d) for o, d in zip(offset, dims))], referencedType)
+            tileSize = math.ceil(math.prod(dims) * referencedType.typeWidth / 8)
+            images.append(image[:tileSize // image.itemsize])
+
+        compressed = compressL3Tiles(images, l3Image(values, referencedType).nbytes)
+        if compressed is None:
+            return None
+
+        encoding, chunks, stageOffsets = compressed
+        chunkOffsets = np.cumsum([0] + [len(chunk) for chunk in chunks])
+        externalBuffer.extData = b"".join(chunks)
+        log.debug(f" - Compressed {externalBuffer.name} from {externalBuffer.sizeInBytes} to "
+                  f"{len(externalBuffer.extData)} bytes in L3 (encoding {encoding})")
+
+        idxs = [
+            tileIdxs[(padOffset(rect.offset, len(outerShape)), padShape(rect.dims, len(outerShape)))]
+            for rect in transfers
+        ]
+        compressedTransfers = [HyperRectangle((int(chunkOffsets[idx]),), (len(chunks[idx]),)) for idx in idxs]
+        return compressedTransfers, (len(externalBuffer.extData),), [stageOffsets[idx] for idx in idxs]
+
+
+class PULPL3TilingGenerationSB(PULPL3CompressionMixIn, SingleBufferingTilingCodeGeneration):
     pass
 
 
-class ProfilingPULPL3TilingGenerationSB(SingleBufferingTilingCodeGeneration, ProfilingSingleBufferingTilingMixIn):
+class ProfilingPULPL3TilingGenerationSB(PULPL3CompressionMixIn, SingleBufferingTilingCodeGeneration,
+                                        ProfilingSingleBufferingTilingMixIn):
     pass
 
 
-class PULPL3TilingGenerationDB(DoubleBufferingTilingCodeGeneration):
+class PULPL3TilingGenerationDB(PULPL3CompressionMixIn, DoubleBufferingTilingCodeGeneration):
     pass
 
 
-class ProfilingPULPL3TilingGenerationDB(DoubleBufferingTilingCodeGeneration, ProfilingDoubleBufferingTilingMixIn):
+class ProfilingPULPL3TilingGenerationDB(PULPL3CompressionMixIn, DoubleBufferingTilingCodeGeneration,
+                                        ProfilingDoubleBufferingTilingMixIn):
     pass
 
 
 class PULPL3Tiling(CodeTransformationPass):
+    """L3 tiling code generation
 
-    def __init__(self, externalMemory: str, localMemory: str, dma: AsyncDma):
+    Tiles are transferred with `dma`. If `asyncDma` is given and the layer is deployed with the `asyncL3Dma` option,
+    `asyncDma` is used instead.
+    """
+
+    def __init__(self, externalMemory: str, localMemory: str, dma: AsyncDma, asyncDma: Optional[AsyncDma] = None):
         self.SB = PULPL3TilingGenerationSB(externalMemory, localMemory, dma)
         self.DB = PULPL3TilingGenerationDB(externalMemory, localMemory, dma)
         self.profilingSB = ProfilingPULPL3TilingGenerationSB(externalMemory, localMemory, dma)
         self.profilingDB = ProfilingPULPL3TilingGenerationDB(externalMemory, localMemory, dma)
 
+        self.asyncTiling = None
+        if asyncDma is not None:
+            self.asyncTiling = PULPL3Tiling(externalMemory, localMemory, asyncDma)
+
     def apply(self,
               ctxt: NetworkContext,
               executionBlock: ExecutionBlock,
               name: str,
               verbose: CodeGenVerbosity = _NoVerbosity) -> Tuple[NetworkContext, ExecutionBlock]:
 
+        if self.asyncTiling is not None and deploymentOption(executionBlock, "asyncL3Dma"):
+            return self.asyncTiling.apply(ctxt, executionBlock, name, verbose)
+
         if verbose.tilingProfiling:
-            ctxt, executionBlock = self.profilingSB.apply(ctxt, executionBlock, name)
-            ctxt, executionBlock = self.profilingDB.apply(ctxt, executionBlock, name)
+            ctxt, executionBlock = self.profilingSB.apply(ctxt, executionBlock, name, verbose)
+            ctxt, executionBlock = self.profilingDB.apply(ctxt, executionBlock, name, verbose)
         else:
-            ctxt, executionBlock = self.SB.apply(ctxt, executionBlock, name)
-            ctxt, executionBlock = self.DB.apply(ctxt, executionBlock, name)
+            ctxt, executionBlock = self.SB.apply(ctxt, executionBlock, name, verbose)
+            ctxt, executionBlock = self.DB.apply(ctxt, executionBlock, name, verbose)
 
         return ctxt, executionBlock
@@ -6,7 +6,7 @@ import math
 from typing import Dict, Tuple
 
 from Deeploy.DeeployTypes import NetworkContext, NodeTemplate, OperatorRepresentation, VariableBuffer
-from Deeploy.TilingExtension.AsyncDma import AsyncDma, DirectionWaitingStrategy, DmaDirection, Future
+from Deeploy.TilingExtension.AsyncDma import AsyncDma, DirectionWaitingStrategy, DmaDirection, Future, descriptorArray
 
 
 class MchanChannelFuture(Future):
@@ -25,16 +25,43 @@ if (${name} <= MCHAN_CHANNEL_ID_MAX) {
 """)
 
 
+def _descriptorTransferTemplate(numDims: int) -> NodeTemplate:
+    # The outer dimensions are walked by the runtime, which issues a 2D transfer per iteration
+    dims = descriptorArray("mchan_dim_t", ["count", "loc_stride", "ext_stride"], numDims)
+    return NodeTemplate(
+        f"mchan_transfer_nd_ext_strided(${{cmd}}, ${{loc}}, ${{ext}}, ${{size_1d}}, ${{stride_2d}}, {dims}, {numDims});"
+    )
+
+
 class MchanDma(AsyncDma):
 
     _transferTemplates = {
         1: NodeTemplate("mchan_transfer_1d(${cmd}, ${loc}, ${ext});"),
         2: NodeTemplate("mchan_transfer_2d_ext_strided(${cmd}, ${loc}, ${ext}, ${size_1d}, ${stride_2d});"),
+        3: _descriptorTransferTemplate(1),
+        4: _descriptorTransferTemplate(2),
     }
     _waitingStrategy = DirectionWaitingStrategy(MchanChannelFuture, "channel")
 
-    def __init__(self, transferTemplates: Dict[int, NodeTemplate] = _transferTemplates) -> None:
+    # Width of the transfer size of a command
+    _maxTransferSize = (1 << 17) - 1
+    # Transfer IDs in flight at the same time, MCHAN_CHANNEL_ID_MAX + 1
+    _maxChannelIds = 16
+
+    # Register writes of a command
+    _transferIssueCost = {1: 3, 2: 5}
+    # Call of the descriptor transfer and the initialization of a descriptor entry
+    _descriptorCallCost = 10
+    _descriptorDimCost = 3
+    # Address update of the descriptor walk per issued 2D transfer
+    _descriptorIterationCost = 4
+
+    def __init__(self, transferTemplates: Dict[int, NodeTemplate] = _transferTemplates, numChannels: int = 2) -> None:
         super().__init__(transferTemplates)
+        # Every channel of a direction allocates its own transfer ID
+        assert 2 * numChannels <= self._maxChannelIds, \
+            f"Mchan supports at most {self._maxChannelIds // 2} channels per direction, received {numChannels}"
+        self._numChannels = numChannels
 
     def checkTransfer(self, ctxt: NetworkContext, externalBuffer: VariableBuffer, localBuffer: VariableBuffer,
                       shape: Tuple[int, ...], strideExt: Tuple[int, ...], strideLoc: Tuple[int, ...],
@@ -47,8 +74,19 @@ class MchanDma(AsyncDma):
         if transferRank == 1:
             assert strideLoc[0] == 1, "Mchan supports only contigous transfers for local memory"
         else:
-            assert strideLoc[0] == shape[1] and strideLoc[
-                1] == 1, "Mchan supports only contigous transfers for local memory"
+            assert strideLoc[-2] == shape[-1] and strideLoc[
+                -1] == 1, "Mchan supports only contigous transfers for local memory"
+
+    def splitAxis(self, shape: Tuple[int, ...]) -> int:
+        # Higher ranks are issued as 2D transfers
+        return max(0, len(shape) - 2)
+
+    def transferIssueCost(self, shape: Tuple[int, ...]) -> int:
+        if len(shape) <= 2:
+            return super().transferIssueCost(shape)
+        numDims = len(shape) - 2
+        setupCost = self._descriptorCallCost + numDims * self._descriptorDimCost
+        return setupCost + math.prod(shape[:numDims]) * (self._transferIssueCost[2] + self._descriptorIterationCost)
 
     def transferOpRepr(self, externalBuffer: VariableBuffer, localBuffer: VariableBuffer, shape: Tuple[int, ...],
                        strideExt: Tuple[int, ...], strideLoc: Tuple[int, ...], direction: DmaDirection,
@@ -61,19 +99,23 @@ class MchanDma(AsyncDma):
         mchanFlags = 0
         mchanFlags += (1 << 0) if direction == "ExternalToLocal" else 0  # direction
         mchanFlags += (1 << 1)  # increment addresses
-        mchanFlags += (1 << 2) if transferRank == 2 else 0  # 2d transfer
+        mchanFlags += (1 << 2) if transferRank >= 2 else 0  # 2d transfer
         mchanFlags += (1 << 3)  # event enable
 
-        mchanTransferSize = math.prod(shape)
-        mchanTransferSizeBits = math.ceil(math.log2(mchanTransferSize))
-        assert mchanTransferSizeBits <= 17, (
-            "The transfer size is not representable with 17 bits. "
-            f"Received transfer size {mchanTransferSize} that requires {mchanTransferSizeBits}")
+        # Higher ranks are issued as 2D transfers
+        mchanTransferSize = math.prod(shape[-2:])
+        assert mchanTransferSize <= self._maxTransferSize, ("The transfer size is not representable with 17 bits. "
+                                                            f"Received transfer size {mchanTransferSize}")
 
         operatorRepresentation["cmd"] = (mchanFlags << 17) + mchanTransferSize
 
-        if transferRank == 2:
-            operatorRepresentation["size_1d"] = shape[1]
-            operatorRepresentation["stride_2d"] = strideExt[0]
+        if transferRank >= 2:
+            operatorRepresentation["size_1d"] = shape[-1]
+            operatorRepresentation["stride_2d"] = strideExt[-2]
+
+        for dim in range(transferRank - 2):
+            operatorRepresentation[f"count_{dim}"] = shape[dim]
+            operatorRepresentation[f"loc_stride_{dim}"] = strideLoc[dim]
+            operatorRepresentation[f"ext_stride_{dim}"] = strideExt[dim]
 
         return operatorRepresentation
@@ -4,7 +4,6 @@
 
 from typing import Callable, Dict, List, Type
 
-import numpy as np
 import onnx_graphsurgeon as gs
 
 from Deeploy.AbstractDataTypes import Pointer
@@ -14,10 +13,12 @@ from Deeploy.CommonExtensions.OptimizationPasses.TopologyOptimizationPasses.Lowe
     PULPNCHWtoNHWCPass, RemoveGlobalOutputReshapePass, TransposeMatmulInputsPass
 from Deeploy.DeeployTypes import ConstantBuffer, DeploymentPlatform, NodeTemplate, TopologyOptimizer, VariableBuffer
 from Deeploy.Targets.GAP9.Platform import GAP9ClusterEngine
-from Deeploy.Targets.Generic.TopologyOptimizationPasses.Passes import ReshapeConstOptPass, TransposeConstOptPass, \
-    TransposeMergePass, TransposeNoPermOptPass, TransposeSplitPass
+from Deeploy.Targets.Generic.TopologyOptimizationPasses.Passes import FuseElementwiseChainPass, ReshapeConstOptPass, \
+    TransposeConstOptPass, TransposeMergePass, TransposeNoPermOptPass, TransposeSplitPass
+from Deeploy.Targets.PULPOpen.CodeTransformationPasses.PULPClusterFork import hoistPersistentClusterTeam
 from Deeploy.Targets.PULPOpen.Platform import PULPClusterEngine
-from Deeploy.Targets.PULPOpen.TopologyOptimizationPasses.Passes import RQAddTransposeSquashPass
+from Deeploy.Targets.PULPOpen.TopologyOptimizationPasses.Passes import PULPConvAddFusionPass, \
+    PULPConvMaxPoolFusionPass, RQAddTransposeSquashPass
 
 _L3AllocTemplate = NodeTemplate("""
 ${locPtr} = cl_ram_malloc(${size});
@@ -61,9 +62,20 @@ class PULPDeployer(SignPropDeployer):
             ReshapeConstOptPass(),
             TransposeNoPermOptPass(),
             RemoveGlobalOutputReshapePass(),
+            PULPConvMaxPoolFusionPass(),
+            PULPConvAddFusionPass(),
+            FuseElementwiseChainPass(self.default_channels_first),
         ]
 
         self.extNameCount = 0
+        # Keep the L3 constants compressed and decompress their tiles after transferring them to L2
+        self.compressL3Constants = False
+        # Fork the cluster once per inference and dispatch the parallel layers to the running team
+        self.persistentCluster = False
+        # Run the network on a core dedicated to the DMA, the other cores of the persistent team compute
+        self.dmaCore = False
+        # Transfer L3 tiles with the asynchronous L3 DMA instead of the blocking one
+        self.asyncL3Dma = False
 
     def annotateNCores(self) -> None:
         for layer in self.layerBinding.values():
@@ -72,6 +84,20 @@ class PULPDeployer(SignPropDeployer):
             opRepr = layer.mapper.parser.operatorRepresentation
             if isinstance(engine, (PULPClusterEngine, GAP9ClusterEngine)):
                 opRepr["n_cores"] = engine.n_cores
+                # Kernels which accept a core count may be computed by fewer cores than the whole team
+                opRepr["compute_cores"] = "NUM_CORES"
+
+    def annotateDeploymentOptions(self) -> None:
+        # The code transformation passes of the layers read the options from the operator representation, see
+        # `deploymentOption`
+        options = {
+            "compressL3Constants": self.compressL3Constants,
+            "persistentCluster": self.persistentCluster or self.dmaCore,
+            "dmaCore": self.dmaCore,
+            "asyncL3Dma": self.asyncL3Dma,
+        }
+        for layer in self.layerBinding.values():
+            layer.mapper.parser.operatorRepresentation.update(options)
 
     def bind(self) -> bool:
         # SCHEREMO: THIS IS A STOP GAP SOLUTION. DONT REUSE. I MEAN IT. I WILL FIND YOU.
@@ -84,14 +110,25 @@ class PULPDeployer(SignPropDeployer):
 
         # LMACAN: THIS IS A STOP GAP SOLUTION. DONT REUSE. I MEAN IT. I WILL FIND YOU.
         self.annotateNCores()
+        self.annotateDeploymentOptions()
 
         # SCHEREMO: THIS IS A STOP GAP SOLUTION. DONT REUSE. I MEAN IT. I WILL FIND YOU.
         if not super().bind():
             return False
 
         self.ctxt.hoistGlobalDefinition("cluster_dev", "extern struct pi_device cluster_dev;")
+        if self.persistentCluster or self.dmaCore:
+            hoistPersistentClusterTeam(self.ctxt)
         return True
 
+    def generateIncludeString(self) -> str:
+        includeStr = super().generateIncludeString()
+        if self.persistentCluster or self.dmaCore:
+            includeStr += "\n#include \"persistent_cluster.h\""
+        if self.compressL3Constants:
+            includeStr += "\n#include \"l3_decompress.h\""
+        return includeStr
+
     def _l3ConstBuffer(self) -> List[VariableBuffer]:
         return [
             buf for buf in self.ctxt.globalObjects.values() if all([
@@ -126,7 +163,8 @@ class PULPDeployer(SignPropDeployer):
             locPtr = str(buf._instance)
             extName = str(idx)
             buf.extName = extName
-            size = np.prod(buf.shape) * (buf._type.referencedType.typeWidth // 8)
+            # Compressed constants are stored as their L3 image
+            size = len(buf.extData) if hasattr(buf, "extData") else buf.sizeInBytes
 
             if isinstance(buf, ConstantBuffer):
                 L3FileStr += _L3AllocTemplate.generate({"locPtr": locPtr, "extName": extName, "size": size})
@@ -0,0 +1,418 @@
+# SPDX-FileCopyrightText: 2025 ETH Zurich and University of Bologna
+#
+# SPDX-License-Identifier: Apache-2.0
+"""Compression of L3-resident constants.
+
+The constants stay compressed in L3. Each tile of a constant that is
+transferred from L3 to L2 is compressed into a self-contained chunk, which
+the L3 tiling loop transfers into the end of the tile's L2 buffer and
+decompresses in place with `l3_decompress` (see `PULPL3Tiling`).
+
+A chunk starts with a 12 byte little-endian header. The header matches
+`l3_compression_header_t` in `l3_decompress.h`:
+
+- `uint8_t encoding`: bitmask of `L3_COMPRESSION_BITPACK`, `L3_COMPRESSION_ZRLE` and `L3_COMPRESSION_HUFFMAN`
+- `uint8_t bits`: element width in bits of bit-packed payloads
+- `uint8_t is_signed`: whether bit-packed elements are sign-extended
+- `uint8_t tail_size`: number of payload bytes stored in front of the payload
+- `uint32_t size`: size in bytes of the decompressed tile
+- `uint32_t body_size`: number of payload bytes read in place
+
+The stages are applied in the order bit-packing, zero-run-length encoding and
+canonical Huffman coding, so decompression runs them in reverse. Huffman coded
+chunks continue with their code table: 16 bytes counting the codes of each
+length from 1 to 16 bits, followed by the coded symbols ordered by code length
+and value. The codes are stored most significant bit first.
+
+Decompressing in place is only safe if the decoder never overwrites input it
+has not read yet. The decoder reads the header, the code table and the last
+`tail_size` bytes of the payload, which precede the other `body_size` bytes in
+the chunk, before writing any output. `compressL3Tiles` chooses the tail such
+that every output byte is written behind the input read so far and rejects
+encodings which would need a longer tail than the decoder holds.
+"""
+
+import heapq
+from typing import List, Optional, Sequence, Tuple, Type
+
+import numpy as np
+
+from Deeploy.AbstractDataTypes import BaseType
+
+L3_COMPRESSION_RAW = 0
+L3_COMPRESSION_BITPACK = 1
+L3_COMPRESSION_ZRLE = 2
+L3_COMPRESSION_HUFFMAN = 4
+
+_headerDtype = np.dtype([('encoding', 'u1'), ('bits', 'u1'), ('is_signed', 'u1'), ('tail_size', 'u1'), ('size', '<u4'),
+                         ('body_size', '<u4')])
+
+_maxTokenLength = 128  #: int: Maximum number of bytes covered by one ZRLE token
+_minZeroRun = 3  #: int: Shortest zero run worth a token of its own
+_maxCodeLength = 16  #: int: Longest Huffman code
+_chunkAlignment = 4  #: int: Alignment in bytes of chunks in L3 and of their staging offset in L2
+_maxTailSize = 64  #: int: Maximum number of payload bytes read up front, `L3_DECOMPRESS_MAX_TAIL_SIZE`
+
+
+def l3Image(values: np.ndarray, referencedType: Type[BaseType]) -> np.ndarray:
+    """Return the padded, typed array that is stored in L3 for a buffer
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Values of the buffer
+    referencedType : Type[BaseType]
+        Type of the buffer's elements
+
+    Returns
+    -------
+    np.ndarray
+        The flattened values padded to a multiple of 32 bits; sub-byte
+        types are packed into a uint8 array
+
+    """
+    if referencedType.isPacked:
+        packed = referencedType.packValues(values)
+        return np.pad(packed, (0, (-packed.size) % 4), 'constant')
+
+    if referencedType.typeName == "float32_t":
+        typeStr = "float32"
+    else:
+        typeStr = ("int" if referencedType.typeMin < 0 else "uint") + str(referencedType.typeWidth)
+
+    mod = (32 // referencedType.typeWidth)
+    paddingLength = (mod - (values.size % mod)) % mod
+    return np.pad(values.flatten(), (0, paddingLength), 'constant').astype(typeStr)
+
+
+def bitPack(image: np.ndarray, bits: int) -> np.ndarray:
+    """Pack 8 bit elements into `bits` bits each, least significant element first"""
+    elementsPerByte = 8 // bits
+    paddingLength = (elementsPerByte - (image.size % elementsPerByte)) % elementsPerByte
+    fields = np.pad(image.view(np.uint8) & ((1 << bits) - 1), (0, paddingLength)).astype(np.uint8)
+    fields = fields.reshape(-1, elementsPerByte)
+    shifts = np.arange(elementsPerByte, dtype = np.uint8) * bits
+    return np.bitwise_or.reduce(fields << shifts, axis = 1).astype(np.uint8)
+
+
+def bitUnpack(packed: np.ndarray, bits: int, signed: bool, size: int) -> np.ndarray:
+    """Inverse of `bitPack`, returns `size` bytes"""
+    elementsPerByte = 8 // bits
+    shifts = np.arange(elementsPerByte, dtype = np.uint8) * bits
+    fields = ((packed[:, None] >> shifts) & ((1 << bits) - 1)).astype(np.uint8).flatten()[:size]
+    if signed:
+        signBit = np.uint8(1 << (bits - 1))
+        fields = np.where(fields & signBit, fields | np.uint8((0xFF << bits) & 0xFF), fields).astype(np.uint8)
+    return fields
+
+
+def _zrleEncode(data: np.ndarray) -> Tuple[bytes, np.ndarray]:
+    # Returns the tokens and, for each input byte, the index of the token byte it is decoded from
+    data = data.view(np.uint8)
+    isZero = np.concatenate(([False], data == 0, [False]))
+    edges = np.flatnonzero(np.diff(isZero.astype(np.int8)))
+    runs = [(start, stop) for start, stop in zip(edges[::2], edges[1::2]) if stop - start >= _minZeroRun]
+
+    encoded = bytearray()
+    source = np.zeros(data.size, dtype = np.int64)
+
+    def emitLiteral(start: int, stop: int):
+        for offset in range(start, stop, _maxTokenLength):
+            chunk = data[offset:min(offset + _maxTokenLength, stop)]
+            source[offset:offset + chunk.size] = len(encoded) + 1 + np.arange(chunk.size)
+            encoded.append(len(chunk) - 1)
+            encoded.extend(chunk.tobytes())
+
+    position = 0
+    for start, stop in runs:
+        emitLiteral(position, start)
+        for offset in range(start, stop, _maxTokenLength):
+            length = min(_maxTokenLength, stop - offset)
+            source[offset:offset + length] = len(encoded)
+            encoded.append(0x80 | (length - 1))
+        position = stop
+    emitLiteral(position, data.size)
+
+    return bytes(encoded), source
+
+
+def zrleEncode(data: np.ndarray) -> bytes:
+    """Encode a byte array into zero-run and literal tokens
+
+    A control byte `c < 0x80` is followed by `c + 1` literal bytes, a control
+    byte `c >= 0x80` expands to `(c & 0x7F) + 1` zero bytes.
+    """
+    encoded, _ = _zrleEncode(data)
+    return encoded
+
+
+def zrleDecode(encoded: bytes) -> np.ndarray:
+    """Inverse of `zrleEncode`"""
+    decoded = bytearray()
+    idx = 0
+    while idx < len(encoded):
+        control = encoded[idx]
+        idx += 1
+        if control & 0x80:
+            decoded.extend(bytes((control & 0x7F) + 1))
+        else:
+            decoded.extend(encoded[idx:idx + control + 1])
+            idx += control + 1
+    return np.frombuffer(bytes(decoded), dtype = np.uint8)
+
+
+def huffmanCodeLengths(counts: np.ndarray) -> np.ndarray:
+    """Return the Huffman code length of each byte value, limited to 16 bits
+
+    Parameters
+    ----------
+    counts : np.ndarray
+        Number of occurrences of each of the 256 byte values
+
+    Returns
+    -------
+    np.ndarray
+        The code length of each byte value, 0 for values that do not occur
+
+    """
+    weights = counts.astype(np.int64)
+    symbols = np.flatnonzero(weights)
+    lengths = np.zeros(256, dtype = np.int64)
+    if symbols.size == 1:
+        lengths[symbols] = 1
+        return lengths
+
+    while True:
+        lengths[:] = 0
+        heap = [(int(weights[symbol]), idx, [symbol]) for idx, symbol in enumerate(symbols)]
+        heapq.heapify(heap)
+        tieBreaker = len(heap)
+        while len(heap) > 1:
+            weight0, _, symbols0 = heapq.heappop(heap)
+            weight1, _, symbols1 = heapq.heappop(heap)
+            lengths[symbols0 + symbols1] += 1
+            heapq.heappush(heap, (weight0 + weight1, tieBreaker, symbols0 + symbols1))
+            tieBreaker += 1
+
+        if lengths.max() <= _maxCodeLength:
+            return lengths
+
+        # Flatten the distribution until the deepest code fits, all weights equal yields codes of at most 8 bits
+        weights = np.where(weights > 0, (weights + 1) // 2, 0)
+
+
+def _huffmanEncode(data: np.ndarray) -> Optional[Tuple[bytes, bytes, np.ndarray]]:
+    # Returns the code table, the bitstream and the end of the code of each byte in bits, None if the table of the
+    # canonical code does not fit into its byte counts
+    data = data.view(np.uint8)
+    lengths = huffmanCodeLengths(np.bincount(data, minlength = 256))
+    lengthCounts = np.bincount(lengths, minlength = _maxCodeLength + 1)[1:]
+    if lengthCounts.max() > 255:
+        return None
+
+    # Canonical code: codes of the same length are consecutive and ordered by symbol
+    symbols = np.lexsort((np.arange(256), lengths))
+    symbols = symbols[lengths[symbols] > 0]
+    codes = np.zeros(256, dtype = np.int64)
+    code = 0
+    for symbol, previousLength, length in zip(symbols, np.concatenate(([1], lengths[symbols][:-1])), lengths[symbols]):
+        code <<= length - previousLength
+        codes[symbol] = code
+        code += 1
+
+    table = lengthCounts.astype(np.uint8).tobytes() + symbols.astype(np.uint8).tobytes()
+
+    codeLengths = lengths[data].astype(np.int16)
+    shifts = codeLengths[:, None] - 1 - np.arange(_maxCodeLength, dtype = np.int16)[None, :]
+    bits = (codes[data].astype(np.uint16)[:, None] >> np.maximum(shifts, 0).astype(np.uint16)) & 1
+    bitstream = np.packbits(bits[shifts >= 0].astype(np.uint8))
+
+    return table, bitstream.tobytes(), np.cumsum(codeLengths, dtype = np.int64)
+
+
+def _packedWidth(image: np.ndarray, signed: bool) -> Optional[int]:
+    # Only byte-sized elements are packed; wider types are left to the other stages
+    if image.dtype.itemsize != 1 or image.size == 0:
+        return None
+
+    values = image.astype(np.int32)
+    for bits in (1, 2, 4):
+        if signed:
+            low, high = -(1 << (bits - 1)), (1 << (bits - 1)) - 1
+        else:
+            low, high = 0, (1 << bits) - 1
+        if values.min() >= low and values.max() <= high:
+            return bits
+    return None
+
+
+def _compressPayload(image: np.ndarray, encoding: int, bits: int) -> Optional[Tuple[bytes, bytes, np.ndarray]]:
+    # Returns the Huffman code table, the payload and, for each output byte, the number of payload bytes read before
+    # writing it
+    stream = image.view(np.uint8)
+    source = np.arange(stream.size, dtype = np.int64)
+    if encoding & L3_COMPRESSION_BITPACK:
+        stream = bitPack(image, bits)
+        source = source // (8 // bits)
+    if encoding & L3_COMPRESSION_ZRLE:
+        tokens, tokenSource = _zrleEncode(stream)
+        stream = np.frombuffer(tokens, dtype = np.uint8)
+        source = tokenSource[source]
+
+    if not encoding & L3_COMPRESSION_HUFFMAN:
+        return b"", stream.tobytes(), source + 1
+
+    encoded = _huffmanEncode(stream)
+    if encoded is None:
+        return None
+    table, payload, codeEnds = encoded
+    # The bitstream is read byte by byte as the codes are decoded
+    return table, payload, (codeEnds[source] + 7) // 8
+
+
+def _compressChunk(image: np.ndarray, encoding: int, bits: int) -> Optional[Tuple[bytes, int]]:
+    # Returns the chunk and its offset in bytes into the tile to be decompressed in place
+    compressed = _compressPayload(image, encoding, bits)
+    if compressed is None:
+        return None
+    table, payload, payloadRead = compressed
+
+    size = image.nbytes
+    front = _headerDtype.itemsize + len(table)
+    chunkSize = front + len(payload)
+    # Stage the chunk at the end of the tile
+    stageOffset = (size - chunkSize - (-chunkSize) % _chunkAlignment) // _chunkAlignment * _chunkAlignment
+    if stageOffset < 0:
+        return None
+
+    # Writing output byte p overwrites chunk byte p - stageOffset, which has to be read already. The decoder reads the
+    # header, the table and the tail of the payload up front, the tail covers the input read after it is overwritten.
+    overwritten = np.arange(size) - stageOffset
+    inChunk = overwritten < chunkSize
+    tailSize = int(max(0, np.max(overwritten[inChunk] - front - payloadRead[inChunk] + 1, initial = 0)))
+    if tailSize > _maxTailSize:
+        return None
+
+    signed = np.issubdtype(image.dtype, np.signedinteger) and bits != 0
+    bodySize = len(payload) - tailSize
+    header = np.array([(encoding, bits, int(signed), tailSize, size, bodySize)], dtype = _headerDtype).tobytes()
+    chunk = header + table + payload[bodySize:] + payload[:bodySize]
+    return chunk + bytes((-len(chunk)) % _chunkAlignment), stageOffset
+
+
+def compressL3Tiles(images: Sequence[np.ndarray], imageSize: int) -> Optional[Tuple[int, List[bytes], List[int]]]:
+    """Compress the tiles of an L3 constant with the encoding resulting in the smallest L3 image
+
+    Parameters
+    ----------
+    images : Sequence[np.ndarray]
+        The typed image of each distinct tile as transferred into L2
+    imageSize : int
+        Size in bytes of the uncompressed L3 image of the constant
+
+    Returns
+    -------
+    Optional[Tuple[int, List[bytes], List[int]]]
+        The selected encoding, the chunk of each tile padded to 32 bits and
+        the offset in bytes into the tile's L2 buffer to transfer the chunk to
+        before decompressing it in place. None if no encoding shrinks the
+        image with chunks that can be decompressed in place.
+
+    """
+    signed = np.issubdtype(images[0].dtype, np.signedinteger)
+    bits = _packedWidth(np.concatenate([image.flatten() for image in images]), signed)
+
+    encodings = [L3_COMPRESSION_ZRLE, L3_COMPRESSION_HUFFMAN, L3_COMPRESSION_ZRLE | L3_COMPRESSION_HUFFMAN]
+    if bits is not None:
+        encodings += [L3_COMPRESSION_BITPACK | encoding for encoding in [L3_COMPRESSION_RAW] + encodings]
+
+    best = None
+    for encoding in encodings:
+        compressed = [_compressChunk(image, encoding, bits or 0) for image in images]
+        if any(chunk is None for chunk in compressed):
+            continue
+
+        chunks, stageOffsets = zip(*compressed)
+        size = sum(len(chunk) for chunk in chunks)
+        if size < imageSize and (best is None or size < sum(len(chunk) for chunk in best[1])):
+            best = (encoding, list(chunks), list(stageOffsets))
+
+    return best
+
+
+def decompressL3Chunk(chunk: bytes) -> Tuple[np.ndarray, np.ndarray]:
+    """Reference decoder of chunks, mirrors `l3_decompress`
+
+    Returns the decompressed tile and, for each of its bytes, the number of
+    chunk bytes read before writing it.
+    """
+    header = np.frombuffer(chunk[:_headerDtype.itemsize], dtype = _headerDtype)[0]
+    encoding, bits, signed = int(header['encoding']), int(header['bits']), bool(header['is_signed'])
+    size, tailSize, bodySize = int(header['size']), int(header['tail_size']), int(header['body_size'])
+    position = _headerDtype.itemsize
+
+    if encoding & L3_COMPRESSION_HUFFMAN:
+        lengthCounts = chunk[position:position + _maxCodeLength]
+        position += _maxCodeLength
+        symbols = chunk[position:position + sum(lengthCounts)]
+        position += sum(lengthCounts)
+
+    # The header, the table and the tail of the payload are read up front
+    front = position + tailSize
+    payload = chunk[front:front + bodySize] + chunk[position:front]
+    payloadRead = 0
+    bitBuffer, bitCount = 0, 0
+
+    def nextPayloadByte() -> int:
+        nonlocal payloadRead
+        payloadRead += 1
+        return payload[payloadRead - 1]
+
+    def nextByte() -> int:
+        nonlocal bitBuffer, bitCount
+        if not encoding & L3_COMPRESSION_HUFFMAN:
+            return nextPayloadByte()
+
+        code, first, index = 0, 0, 0
+        for count in lengthCounts:
+            if bitCount == 0:
+                bitBuffer, bitCount = nextPayloadByte(), 8
+            bitCount -= 1
+            code |= (bitBuffer >> bitCount) & 1
+            if code - count < first:
+                return symbols[index + code - first]
+            index += count
+            first = (first + count) << 1
+            code <<= 1
+        raise ValueError("Invalid Huffman code")
+
+    decoded = bytearray()
+    consumed = []
+    zeros, literals = 0, 0
+    while len(decoded) < size:
+        if encoding & L3_COMPRESSION_ZRLE:
+            if zeros > 0:
+                zeros -= 1
+                value = 0
+            elif literals > 0:
+                literals -= 1
+                value = nextByte()
+            else:
+                control = nextByte()
+                if control & 0x80:
+                    zeros = (control & 0x7F) + 1
+                else:
+                    literals = control + 1
+                continue
+        else:
+            value = nextByte()
+
+        if encoding & L3_COMPRESSION_BITPACK:
+            elements = bitUnpack(np.array([value], dtype = np.uint8), bits, signed, 8 // bits)
+        else:
+            elements = [value]
+        for element in elements[:size - len(decoded)]:
+            decoded.append(int(element))
+            consumed.append(front + min(payloadRead, bodySize))
+
+    return np.frombuffer(bytes(decoded), dtype = np.uint8), np.array(consumed, dtype = np.int64)
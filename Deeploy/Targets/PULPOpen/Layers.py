@@ -41,3 +41,29 @@ class PULPRQSGEMMLayer(RQGEMMLayer):
         inputShapes[3] = [inputShapes[1][channelDim]]  # Channels out dimension of Kernel
 
         return (inputShapes, outputShapes)
+
+
+class PULPRQSConvMaxPoolLayer(PULPRQSConvLayer):
+
+    def __init__(self, maps: List[NodeMapper]):
+        super().__init__(maps)
+
+    def computeOps(self):
+        conv = super().computeOps()
+
+        operatorRepresentation = self.mapper.parser.operatorRepresentation
+        comparisonsPerWindow = operatorRepresentation['pool_dim_kernel_x'] * operatorRepresentation[
+            'pool_dim_kernel_y'] - 1
+        pool = operatorRepresentation['pool_dim_im_out_x'] * operatorRepresentation[
+            'pool_dim_im_out_y'] * operatorRepresentation['ch_im_out'] * comparisonsPerWindow
+
+        return conv + pool
+
+
+class PULPRQSConvAddLayer(PULPRQSConvLayer):
+
+    def __init__(self, maps: List[NodeMapper]):
+        super().__init__(maps)
+
+    def computeOps(self):
+        return super().computeOps() + self.mapper.parser.operatorRepresentation['size']
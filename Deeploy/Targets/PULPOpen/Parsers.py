@@ -5,15 +5,19 @@
 import math
 from typing import Tuple
 
+import numpy as np
 import onnx_graphsurgeon as gs
 
-from Deeploy.DeeployTypes import NetworkContext
+from Deeploy.DeeployTypes import NetworkContext, NodeParser
 from Deeploy.Targets.Generic.Parsers import Conv2DParser, GEMMParser, ReduceMeanParser, RQSConv1DParser, \
     RQSConv2DParser, RQSParserInterface
 
 
 class PULPConv2DParser(RQSConv2DParser):
 
+    # Operator representation keys of the node inputs, in order
+    inputNames = ['data_in', 'weight', 'mul', 'add']
+
     def __init__(self, noBiasHoisting = True):
         super().__init__(noBiasHoisting)
 
@@ -27,7 +31,7 @@ class PULPConv2DParser(RQSConv2DParser):
                 self.operatorRepresentation['pads'][0] == self.operatorRepresentation['pads'][2],
                 self.operatorRepresentation['pads'][1] == self.operatorRepresentation['pads'][3],
                 self.operatorRepresentation['pads'][0] == self.operatorRepresentation['pads'][1],
-                len(node.inputs) == 4,
+                len(node.inputs) == len(self.inputNames),
                 'shift' in node.attrs,
             ])
 
@@ -53,10 +57,102 @@ class PULPConv2DParser(RQSConv2DParser):
         newCtxt, ret = super().parseNodeCtxt(ctxt, node, channels_first)
 
         if ret:
-            inputs = ['data_in', 'weight', 'mul', 'add']
             for idx, inputNode in enumerate(node.inputs):
-                self.operatorRepresentation[inputs[idx]] = ctxt.lookup(inputNode.name).name
+                self.operatorRepresentation[self.inputNames[idx]] = ctxt.lookup(inputNode.name).name
+
+            return newCtxt, True
+
+        return ctxt, False
+
+
+class PULPConv2DMaxPoolParser(PULPConv2DParser):
+
+    def __init__(self, noBiasHoisting = True):
+        super().__init__(noBiasHoisting)
+
+    def parseNode(self, node: gs.Node) -> (bool):
+
+        if not all(['pool_kernel_shape' in node.attrs, 'pool_strides' in node.attrs]):
+            return False
+
+        wellFormed = super().parseNode(node)
+        if wellFormed:
+            self.operatorRepresentation['pool_dim_kernel_x'] = int(node.attrs['pool_kernel_shape'][0])
+            self.operatorRepresentation['pool_dim_kernel_y'] = int(node.attrs['pool_kernel_shape'][1])
+            self.operatorRepresentation['pool_stride_x'] = int(node.attrs['pool_strides'][0])
+            self.operatorRepresentation['pool_stride_y'] = int(node.attrs['pool_strides'][1])
+
+        return wellFormed
+
+    def parseNodeCtxt(self,
+                      ctxt: NetworkContext,
+                      node: gs.Node,
+                      channels_first: bool = True) -> Tuple[NetworkContext, bool]:
+
+        newCtxt, ret = super().parseNodeCtxt(ctxt, node, channels_first)
+
+        if ret:
+            # The node output is the pooled tensor; pooling windows evenly tile the convolution output
+            self.operatorRepresentation['pool_dim_im_out_x'] = self.operatorRepresentation['dim_im_out_x']
+            self.operatorRepresentation['pool_dim_im_out_y'] = self.operatorRepresentation['dim_im_out_y']
+            self.operatorRepresentation['dim_im_out_x'] *= self.operatorRepresentation['pool_stride_x']
+            self.operatorRepresentation['dim_im_out_y'] *= self.operatorRepresentation['pool_stride_y']
+
+            return newCtxt, True
+
+        return ctxt, False
+
+
+class PULPConv2DAddParser(PULPConv2DParser):
+
+    inputNames = ['data_in', 'weight', 'mul', 'add', 'skip']
+
+    def __init__(self, noBiasHoisting = True):
+        super().__init__(noBiasHoisting)
+
+    @staticmethod
+    def _unpack_int(attr) -> int:
+        if isinstance(attr, (gs.Constant, np.ndarray)):
+            return int(NodeParser._unpack_const(attr))
+        return int(attr)
+
+    def parseNode(self, node: gs.Node) -> (bool):
+
+        rqKeys = ['rqs1', 'rqs2', 'rqsOut']
+        if not all(
+                all([
+                    f'{rqKey}_mul' in node.attrs,
+                    f'{rqKey}_add' in node.attrs,
+                    f'{rqKey}_div' in node.attrs,
+                    f'{rqKey}_signed' in node.attrs,
+                    any([f'{rqKey}_n_levels' in node.attrs, f'{rqKey}_n_levels_out' in node.attrs]),
+                ]) for rqKey in rqKeys):
+            return False
+
+        wellFormed = super().parseNode(node)
+        if wellFormed:
+            for rqKey in rqKeys:
+                nLevels = node.attrs.get(f'{rqKey}_n_levels', node.attrs.get(f'{rqKey}_n_levels_out'))
+                self.operatorRepresentation[f'{rqKey}_n_levels'] = self._unpack_int(nLevels)
+                self.operatorRepresentation[f'{rqKey}_mul'] = self._unpack_int(node.attrs[f'{rqKey}_mul'])
+                self.operatorRepresentation[f'{rqKey}_add'] = self._unpack_int(node.attrs[f'{rqKey}_add'])
+                self.operatorRepresentation[f'{rqKey}_signed'] = self._unpack_int(node.attrs[f'{rqKey}_signed'])
+                self.operatorRepresentation[f'{rqKey}_log2D'] = int(
+                    math.log2(self._unpack_int(node.attrs[f'{rqKey}_div'])))
+
+        return wellFormed
+
+    def parseNodeCtxt(self,
+                      ctxt: NetworkContext,
+                      node: gs.Node,
+                      channels_first: bool = True) -> Tuple[NetworkContext, bool]:
+
+        newCtxt, ret = super().parseNodeCtxt(ctxt, node, channels_first)
 
+        if ret and ctxt.lookup(self.operatorRepresentation['skip']).shape == ctxt.lookup(
+                self.operatorRepresentation['data_out']).shape:
+            self.operatorRepresentation['size'] = int(
+                np.prod(ctxt.lookup(self.operatorRepresentation['data_out']).shape))
             return newCtxt, True
 
         return ctxt, False
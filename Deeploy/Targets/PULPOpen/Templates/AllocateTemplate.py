@@ -54,6 +54,13 @@ static PI_L2 ${type.referencedType.typeName}* ${name};
 % endif
 """)
 
+# Only used for L2 constants, the values are linked from the binary blob at ${blobPath} by the assembler, its label
+# is local like the static array
+pulpGenericGlobalBinaryInitTemplate = NodeTemplate("""
+__asm__(".pushsection .l2_data, \\"aw\\"\\n.balign 4\\n${name}:\\n.incbin \\"${blobPath}\\"\\n.popsection");
+extern ${type.referencedType.typeName} ${name}[${size}] __attribute__((aligned(4)));
+""")
+
 pulpGenericAllocate = NodeTemplate("""
 % if _memoryLevel == "L1":
 ${name} = (${type.typeName}) pmsis_l1_malloc(sizeof(${type.referencedType.typeName}) * ${size});\n
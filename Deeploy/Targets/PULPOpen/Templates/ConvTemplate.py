@@ -45,6 +45,53 @@ class PULP2DConvTemplate(NodeTemplate):
         return ctxt, operatorRepresentation, [im2col_name]
 
 
+class PULP2DConvFusionTemplate(PULP2DConvTemplate):
+    """2D im2col convolution followed by an epilogue (pooling or residual add)
+
+    The convolution writes its requantized output tile into a transient
+    buffer, from which the epilogue produces the node output without
+    the intermediate tensor ever leaving L1.
+    """
+
+    def __init__(self, templateStr):
+        super().__init__(templateStr)
+
+    def alignToContext(self, ctxt: NetworkContext,
+                       operatorRepresentation: OperatorRepresentation) -> Tuple[NetworkContext, Dict, List[str]]:
+        ctxt, operatorRepresentation, nameList = super().alignToContext(ctxt, operatorRepresentation)
+
+        # The intermediate convolution output is typed by the requantization's signedness
+        operatorRepresentation['conv_output_signed'] = bool(operatorRepresentation['signed'])
+        if 'skip' in operatorRepresentation:
+            signedS = ctxt.lookup(operatorRepresentation['skip'])._type.referencedType.typeMin < 0
+            operatorRepresentation['skip_signed'] = signedS
+
+        return ctxt, operatorRepresentation, nameList
+
+    @staticmethod
+    def computeTransientBuffersSize(
+            ctxt: NetworkContext,
+            operatorRepresentation: OperatorRepresentation) -> List[Tuple[str, Union[int, IntVar]]]:
+        convOut_dim = operatorRepresentation['dim_im_out_x'] * operatorRepresentation[
+            'dim_im_out_y'] * operatorRepresentation['ch_im_out']
+        convOut_name = operatorRepresentation['nodeName'] + "_conv_out"
+        return PULP2DConvTemplate.computeTransientBuffersSize(ctxt,
+                                                              operatorRepresentation) + [(convOut_name, convOut_dim)]
+
+    def hoistTransientBuffers(self, ctxt: NetworkContext,
+                              operatorRepresentation: OperatorRepresentation) -> Tuple[NetworkContext, Dict, List[str]]:
+        (im2col_name, im2col_dim), (convOut_name, convOut_dim) = PULP2DConvFusionTemplate.computeTransientBuffersSize(
+            ctxt, operatorRepresentation)
+        ctxt.hoistTransientBuffer(im2col_name, im2col_dim)
+        ctxt.hoistTransientBuffer(convOut_name, convOut_dim)
+
+        operatorRepresentation['ctxtBuffer'] = im2col_name
+        operatorRepresentation['ctxtBufferSize'] = im2col_dim
+        operatorRepresentation['convOutBuffer'] = convOut_name
+        operatorRepresentation['convOutBufferSize'] = convOut_dim
+        return ctxt, operatorRepresentation, [im2col_name, convOut_name]
+
+
 class PULP2DDWConvTemplate(PULP2DConvTemplate):
 
     def __init__(self, templateStr):
@@ -137,6 +184,26 @@ operatorString = 'conv'
 pulp_nn_${operatorString}${signatureString}(${data_in}, ${ctxtBuffer}, NULL, ${data_out}, ${weight}, ${mul}, ${add}, 1, ${log2D}, ${dim_im_in_y}, ${dim_im_in_x}, ${ch_im_in}, ${dim_im_out_y}, ${dim_im_out_x}, ${ch_im_out}, ${dim_kernel_y}, ${dim_kernel_x}, ${padding_y_top}, ${padding_y_bottom}, ${padding_x_left}, ${padding_x_right}, ${stride_y}, ${stride_x}, 1, 1);
 """)
 
+_convSignatureString = """
+<%
+def _sign(signed):
+    return '_i8' if signed else '_u8'
+%>"""
+
+PULPConv2DMaxPool_8_Template = PULP2DConvFusionTemplate(_convSignatureString + """
+// PULP NN CONV + MAXPOOL (Name: ${nodeName}, Op: ${nodeOp})
+pulp_nn_conv${_sign(input_signed)}${_sign(conv_output_signed)}${_sign(weight_signed)}(${data_in}, ${ctxtBuffer}, NULL, ${convOutBuffer}, ${weight}, ${mul}, ${add}, 1, ${log2D}, ${dim_im_in_y}, ${dim_im_in_x}, ${ch_im_in}, ${dim_im_out_y}, ${dim_im_out_x}, ${ch_im_out}, ${dim_kernel_y}, ${dim_kernel_x}, ${padding_y_top}, ${padding_y_bottom}, ${padding_x_left}, ${padding_x_right}, ${stride_y}, ${stride_x}, 1, 1);
+pi_cl_team_barrier();
+pulp_nn_maxpool${_sign(conv_output_signed)}(${convOutBuffer}, ${data_out}, ${dim_im_out_y}, ${dim_im_out_x}, ${ch_im_out}, ${pool_dim_im_out_y}, ${pool_dim_im_out_x}, ${pool_dim_kernel_y}, ${pool_dim_kernel_x}, 0, 0, 0, 0, ${pool_stride_y}, ${pool_stride_x});
+""")
+
+PULPConv2DAdd_8_Template = PULP2DConvFusionTemplate(_convSignatureString + """
+// PULP NN CONV + RQADD (Name: ${nodeName}, Op: ${nodeOp})
+pulp_nn_conv${_sign(input_signed)}${_sign(conv_output_signed)}${_sign(weight_signed)}(${data_in}, ${ctxtBuffer}, NULL, ${convOutBuffer}, ${weight}, ${mul}, ${add}, 1, ${log2D}, ${dim_im_in_y}, ${dim_im_in_x}, ${ch_im_in}, ${dim_im_out_y}, ${dim_im_out_x}, ${ch_im_out}, ${dim_kernel_y}, ${dim_kernel_x}, ${padding_y_top}, ${padding_y_bottom}, ${padding_x_left}, ${padding_x_right}, ${stride_y}, ${stride_x}, 1, 1);
+pi_cl_team_barrier();
+pulp_nn_add${_sign(conv_output_signed)}${_sign(skip_signed)}${_sign(output_signed)}(${convOutBuffer}, ${skip}, ${data_out}, ${rqs1_mul}, ${rqs1_add}, ${rqs1_log2D}, ${rqs2_mul}, ${rqs2_add}, ${rqs2_log2D}, ${rqsOut_mul}, ${rqsOut_add}, ${rqsOut_log2D}, 1, (${dim_im_out_x} * ${dim_im_out_y} * ${ch_im_out}), 1, 1);
+""")
+
 PULPDWConv2D_8_Template = PULP2DDWConvTemplate("""
 // PULP NN CONV
 <%
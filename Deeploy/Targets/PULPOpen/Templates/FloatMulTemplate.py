@@ -8,8 +8,7 @@ referenceTemplate = NodeTemplate("""
 // Float Mul with parallelism and 6x unrolling (Name: ${nodeName}, Op: ${nodeOp})
 
 uint32_t ${nodeName}_core_id = pi_core_id();
-uint32_t ${nodeName}_log2Core = (uint32_t) log2(NUM_CORES);
-uint32_t ${nodeName}_chunk = (${size} >> ${nodeName}_log2Core) + ((${size} & (NUM_CORES-1)) != 0);
+uint32_t ${nodeName}_chunk = ((uint32_t) ${size} + ${compute_cores} - 1) / ${compute_cores};
 uint32_t ${nodeName}_start = MIN(${nodeName}_chunk * ${nodeName}_core_id, (uint32_t) ${size});
 uint32_t ${nodeName}_end = MIN(${nodeName}_start + ${nodeName}_chunk, (uint32_t) ${size});
 
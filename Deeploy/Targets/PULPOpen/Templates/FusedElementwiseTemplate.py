@@ -0,0 +1,19 @@
+# SPDX-FileCopyrightText: 2025 ETH Zurich and University of Bologna
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from Deeploy.Targets.Generic.Templates.FusedElementwiseTemplate import FusedElementwiseTemplate, loopBodyTemplate
+
+# PULP types are stored with their actual signedness, hence no input and output offsets
+referenceTemplate = FusedElementwiseTemplate("""
+// Fused Elementwise Parallel (Name: ${nodeName}, Op: ${nodeOp})
+uint8_t ${nodeName}_core_id = (uint8_t) pi_core_id();
+uint32_t ${nodeName}_chunk = ((uint32_t) ${size} + ${compute_cores} - 1) / ${compute_cores};
+uint32_t ${nodeName}_chunk_start = (uint32_t) MIN(${nodeName}_chunk*${nodeName}_core_id, (uint32_t) ${size});
+uint32_t ${nodeName}_chunk_stop = (uint32_t) MIN(${nodeName}_chunk_start + ${nodeName}_chunk, (uint32_t) ${size});
+
+for (uint32_t i = ${nodeName}_chunk_start; i < ${nodeName}_chunk_stop; i++) {
+""" + loopBodyTemplate + """
+}
+""",
+                                             applyOffsets = False)
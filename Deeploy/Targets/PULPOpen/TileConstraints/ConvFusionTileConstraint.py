@@ -0,0 +1,263 @@
+# SPDX-FileCopyrightText: 2025 ETH Zurich and University of Bologna
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import Dict, List, Tuple, Union
+
+from ortools.constraint_solver.pywrapcp import IntVar
+
+from Deeploy.AbstractDataTypes import PointerClass
+from Deeploy.CommonExtensions.DataTypes import uint8_t, uint16_t
+from Deeploy.DeeployTypes import NetworkContext, OperatorRepresentation
+from Deeploy.Targets.PULPOpen.TileConstraints.ConvTileConstraint import Conv2DTileConstraint, RQConv2DTileConstraint
+from Deeploy.TilingExtension.MemoryConstraints import NodeMemoryConstraint
+from Deeploy.TilingExtension.TilerModel import TilerModel
+from Deeploy.TilingExtension.TilingCodegen import AbsoluteHyperRectangle, HyperRectangle, TilingSchedule, \
+    VariableReplacementScheme
+
+
+class RQConv2DMaxPoolTileConstraint(RQConv2DTileConstraint):
+    """Tile constraint for an im2col convolution fused with a non-overlapping max pooling.
+
+    Output tiles are pooled tiles; the matching convolution output tile
+    is obtained by scaling the spatial dimensions with the pooling stride.
+    """
+
+    @staticmethod
+    def addGeometricalConstraint(tilerModel: TilerModel, parseDict: Dict, ctxt: NetworkContext) -> TilerModel:
+
+        # Get to-be-tiled tensor's buffers
+        inputBufferName = parseDict['data_in']
+        weightBufferName = parseDict['weight']
+        mulBufferName = parseDict['mul']
+        addBufferName = parseDict['add']
+        outputBufferName = parseDict['data_out']
+
+        strides = parseDict["strides"]
+        padding = parseDict["pads"]
+        poolStrides = (parseDict['pool_stride_x'], parseDict['pool_stride_y'])
+
+        # Add I/O dimensions to the model as variables
+        for bufferName in [inputBufferName, weightBufferName, mulBufferName, addBufferName, outputBufferName]:
+            tilerModel.addTensorDimToModel(ctxt, bufferName)
+
+        inputBatchVar = tilerModel.getTensorDimVar(tensorName = inputBufferName, dimIdx = 0)
+        inputHeightVar = tilerModel.getTensorDimVar(tensorName = inputBufferName, dimIdx = 1)
+        inputWidthVar = tilerModel.getTensorDimVar(tensorName = inputBufferName, dimIdx = 2)
+
+        weightOutChannelVar = tilerModel.getTensorDimVar(tensorName = weightBufferName, dimIdx = 0)
+        weightHeightVar = tilerModel.getTensorDimVar(tensorName = weightBufferName, dimIdx = 1)
+        weightWidthVar = tilerModel.getTensorDimVar(tensorName = weightBufferName, dimIdx = 2)
+
+        outputBatchVar = tilerModel.getTensorDimVar(tensorName = outputBufferName, dimIdx = 0)
+        outputHeightVar = tilerModel.getTensorDimVar(tensorName = outputBufferName, dimIdx = 1)
+        outputWidthVar = tilerModel.getTensorDimVar(tensorName = outputBufferName, dimIdx = 2)
+        outputChannelVar = tilerModel.getTensorDimVar(tensorName = outputBufferName, dimIdx = 3)
+
+        addChannelVar = tilerModel.getTensorDimVar(tensorName = addBufferName, dimIdx = 0)
+        mulChannelVar = tilerModel.getTensorDimVar(tensorName = mulBufferName, dimIdx = 0)
+
+        # Map output dims to inputs dims
+        tilerModel.addConstraint(outputBatchVar == inputBatchVar)  # Batch
+        tilerModel.addConstraint(outputChannelVar == weightOutChannelVar)  # Output Channel
+
+        tilerModel.addConstraint(outputChannelVar == addChannelVar)
+        tilerModel.addConstraint(outputChannelVar == mulChannelVar)
+
+        inputBuffer = ctxt.lookup(inputBufferName)
+
+        effectiveHeight = inputHeightVar + ((padding[0] + padding[2]) * (inputHeightVar == inputBuffer.shape[1]))
+        effectiveWidth = inputWidthVar + ((padding[1] + padding[3]) * (inputWidthVar == inputBuffer.shape[2]))
+
+        # Every pooled pixel consumes exactly one pooling window of convolution outputs
+        tilerModel.addConstraint(
+            (outputHeightVar * poolStrides[0] == (effectiveHeight - (weightHeightVar - 1) - 1) // strides[0] + 1))
+        tilerModel.addConstraint(
+            (outputWidthVar * poolStrides[1] == (effectiveWidth - (weightWidthVar - 1) - 1) // strides[1] + 1))
+
+        return tilerModel
+
+    @staticmethod
+    def constructSymbolicNodeRep(tilerModel: TilerModel, parseDict: Dict,
+                                 ctxt: NetworkContext) -> Dict[str, Union[int, IntVar]]:
+
+        outputBuffer = ctxt.lookup(name = parseDict['data_out'])
+
+        symbolicParseDict = RQConv2DTileConstraint.constructSymbolicNodeRep(tilerModel, parseDict, ctxt)
+        symbolicParseDict['dim_im_out_x'] = tilerModel.getTensorDimVar(outputBuffer.name,
+                                                                       1) * parseDict['pool_stride_x']
+        symbolicParseDict['dim_im_out_y'] = tilerModel.getTensorDimVar(outputBuffer.name,
+                                                                       2) * parseDict['pool_stride_y']
+        symbolicParseDict['ch_im_out'] = tilerModel.getTensorDimVar(outputBuffer.name, 3)
+
+        return symbolicParseDict
+
+    @classmethod
+    def serializeTilingSolution(
+            cls, tilingSolution: NodeMemoryConstraint, absoluteOutputCubes: List[AbsoluteHyperRectangle],
+            targetMemLevel: str, ctxt: NetworkContext,
+            operatorRepresentation: OperatorRepresentation) -> Tuple[VariableReplacementScheme, TilingSchedule]:
+        outputCubes = [cube.rectangle for cube in absoluteOutputCubes]
+
+        addrNames = ['data_in', 'weight', 'mul', 'add', 'data_out']
+        inputBaseOffsets, outputBaseOffsets = cls.extractBaseAddr(tilingSolution, targetMemLevel,
+                                                                  operatorRepresentation, addrNames)
+
+        varWeight = operatorRepresentation['weight']
+        varIn = operatorRepresentation["data_in"]
+        varOut = operatorRepresentation['data_out']
+
+        inputInCubes = []
+        inputAddCubes = []
+        inputMulCubes = []
+        inputWeightCubes = []
+        replacements: Dict[str, List[int]] = {
+            "dim_im_in_x": [],
+            "dim_im_in_y": [],
+            "dim_im_out_x": [],
+            "dim_im_out_y": [],
+            "pool_dim_im_out_x": [],
+            "pool_dim_im_out_y": [],
+            "ch_im_out": [],
+            "padding_y_top": [],
+            "padding_y_bottom": [],
+            "padding_x_left": [],
+            "padding_x_right": []
+        }
+
+        replacementTypes = {
+            "dim_im_in_x": PointerClass(uint16_t),
+            "dim_im_in_y": PointerClass(uint16_t),
+            "dim_im_out_x": PointerClass(uint16_t),
+            "dim_im_out_y": PointerClass(uint16_t),
+            "pool_dim_im_out_x": PointerClass(uint16_t),
+            "pool_dim_im_out_y": PointerClass(uint16_t),
+            "ch_im_out": PointerClass(uint16_t),
+            "padding_y_top": PointerClass(uint8_t),
+            "padding_y_bottom": PointerClass(uint8_t),
+            "padding_x_left": PointerClass(uint8_t),
+            "padding_x_right": PointerClass(uint8_t)
+        }
+
+        weightH = ctxt.lookup(varWeight).shape[1]
+        weightW = ctxt.lookup(varWeight).shape[2]
+        weightC = ctxt.lookup(varWeight).shape[3]
+
+        pads = operatorRepresentation['pads']
+        strides = operatorRepresentation['strides']
+        poolStrideH = operatorRepresentation['pool_stride_x']
+        poolStrideW = operatorRepresentation['pool_stride_y']
+
+        outputBatch, outputH, outputW, outputC = ctxt.lookup(varOut).shape
+        convOutputDims = (outputBatch, outputH * poolStrideH, outputW * poolStrideW, outputC)
+
+        for cube in outputCubes:
+            (BatchOffset, HOffset, WOffset, COffset) = cube.offset
+            (BatchSize, HSize, WSize, CSize) = cube.dims
+
+            # Convolution output tile covered by the pooled output tile
+            convCube = HyperRectangle((BatchOffset, HOffset * poolStrideH, WOffset * poolStrideW, COffset),
+                                      (BatchSize, HSize * poolStrideH, WSize * poolStrideW, CSize))
+
+            InCube, padding_tuple = Conv2DTileConstraint.computeInputCube(
+                kernelShape = (weightH, weightW),
+                pads = pads,
+                strides = strides,
+                inputCSize = weightC,
+                outputCube = convCube,
+                inputDims = ctxt.lookup(varIn).shape,
+                outputDims = convOutputDims,
+            )
+
+            padding_left, padding_right, padding_top, padding_bottom = padding_tuple
+
+            replacements['dim_im_in_x'].append(InCube.dims[1])
+            replacements['dim_im_in_y'].append(InCube.dims[2])
+            replacements['dim_im_out_x'].append(convCube.dims[1])
+            replacements['dim_im_out_y'].append(convCube.dims[2])
+            replacements['pool_dim_im_out_x'].append(HSize)
+            replacements['pool_dim_im_out_y'].append(WSize)
+            replacements['ch_im_out'].append(CSize)
+
+            replacements['padding_y_top'].append(padding_top)
+            replacements['padding_y_bottom'].append(padding_bottom)
+            replacements['padding_x_left'].append(padding_left)
+            replacements['padding_x_right'].append(padding_right)
+
+            inputInCubes.append(InCube)
+
+            RequantCube = HyperRectangle((COffset,), (CSize,))
+            WeightCube = HyperRectangle((COffset, 0, 0, 0), (CSize, weightH, weightW, weightC))
+
+            inputWeightCubes.append(WeightCube)
+            inputAddCubes.append(RequantCube)
+            inputMulCubes.append(RequantCube)
+
+        inputLoadSchedule = []
+        outputLoadSchedule = []
+
+        for a, b, add, mul in zip(inputInCubes, inputWeightCubes, inputAddCubes, inputMulCubes):
+            inputLoadSchedule.append({"data_in": a, "weight": b, "add": add, "mul": mul})
+
+        for out in outputCubes:
+            outputLoadSchedule.append({"data_out": out})
+
+        tilingSchedule = TilingSchedule(inputBaseOffsets, outputBaseOffsets, inputLoadSchedule, outputLoadSchedule)
+        variableReplacementSchedule = VariableReplacementScheme(replacements, replacementTypes)
+
+        return variableReplacementSchedule, tilingSchedule
+
+
+class RQConv2DAddTileConstraint(RQConv2DTileConstraint):
+    """Tile constraint for an im2col convolution fused with a requantized residual add.
+
+    The skip tensor is tiled exactly like the output and transferred
+    alongside the convolution input.
+    """
+
+    @staticmethod
+    def addGeometricalConstraint(tilerModel: TilerModel, parseDict: Dict, ctxt: NetworkContext) -> TilerModel:
+
+        tilerModel = RQConv2DTileConstraint.addGeometricalConstraint(tilerModel, parseDict, ctxt)
+
+        skipBufferName = parseDict['skip']
+        outputBufferName = parseDict['data_out']
+
+        tilerModel.addTensorDimToModel(ctxt, skipBufferName)
+
+        for dimIdx in range(len(ctxt.lookup(outputBufferName).shape)):
+            skipDimVar = tilerModel.getTensorDimVar(tensorName = skipBufferName, dimIdx = dimIdx)
+            outputDimVar = tilerModel.getTensorDimVar(tensorName = outputBufferName, dimIdx = dimIdx)
+            tilerModel.addConstraint(skipDimVar == outputDimVar)
+
+        return tilerModel
+
+    @staticmethod
+    def constructSymbolicNodeRep(tilerModel: TilerModel, parseDict: Dict,
+                                 ctxt: NetworkContext) -> Dict[str, Union[int, IntVar]]:
+
+        outputBuffer = ctxt.lookup(name = parseDict['data_out'])
+
+        symbolicParseDict = RQConv2DTileConstraint.constructSymbolicNodeRep(tilerModel, parseDict, ctxt)
+        symbolicParseDict['dim_im_out_x'] = tilerModel.getTensorDimVar(outputBuffer.name, 1)
+        symbolicParseDict['dim_im_out_y'] = tilerModel.getTensorDimVar(outputBuffer.name, 2)
+        symbolicParseDict['ch_im_out'] = tilerModel.getTensorDimVar(outputBuffer.name, 3)
+
+        return symbolicParseDict
+
+    @classmethod
+    def serializeTilingSolution(
+            cls, tilingSolution: NodeMemoryConstraint, absoluteOutputCubes: List[AbsoluteHyperRectangle],
+            targetMemLevel: str, ctxt: NetworkContext,
+            operatorRepresentation: OperatorRepresentation) -> Tuple[VariableReplacementScheme, TilingSchedule]:
+
+        variableReplacementSchedule, tilingSchedule = super().serializeTilingSolution(
+            tilingSolution, absoluteOutputCubes, targetMemLevel, ctxt, operatorRepresentation)
+
+        skipBaseOffsets, _ = cls.extractBaseAddr(tilingSolution, targetMemLevel, operatorRepresentation, ['skip'])
+        tilingSchedule.inputBaseOffsets.update(skipBaseOffsets)
+
+        for step, cube in zip(tilingSchedule.inputLoadSchedule, absoluteOutputCubes):
+            step['skip'] = cube.rectangle
+
+        return variableReplacementSchedule, tilingSchedule
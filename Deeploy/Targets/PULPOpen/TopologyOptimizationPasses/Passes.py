@@ -265,3 +265,120 @@ class PULPMatMulRequantMergePass(ReplaceSequentialPatternPass):
 
         name = "_MERGE_GEMM_MATMUL_RQ_PASS"
         super().__init__(graph, _merge_gemm_rq_fun, name)
+
+
+def _is_fusable_pulp_conv(conv: gs.Node) -> bool:
+    # Only regular 2D HWC convolutions map to the pulp-nn im2col kernel the fused templates are built on
+    pads = list(conv.attrs.get('pads', []))
+    return all([
+        len(pads) == 4,
+        len(set(pads)) <= 1,
+        conv.attrs.get('group', 1) == 1,
+        'shift' in conv.attrs,
+        not conv.attrs.get('channels_first', True),
+        len(conv.inputs) == 4,
+        len(conv.outputs[0].shape) == 4,
+    ])
+
+
+def _fuse_conv_maxpool_fun(graph: gs.Graph, match: Match, name: str):
+    matched_nodes = [m for k, m in match.nodes_map.items()]
+    conv = matched_nodes[0]
+    pool = matched_nodes[1]
+
+    if not _is_fusable_pulp_conv(conv) or conv.attrs.get('engine') != pool.attrs.get('engine'):
+        return graph
+
+    kernelShape = list(pool.attrs['kernel_shape'])
+    strides = list(pool.attrs.get('strides', kernelShape))
+    pads = list(pool.attrs.get('pads', [0] * 4))
+    convOutShape = conv.outputs[0].shape
+
+    # Only non-overlapping, unpadded pooling windows that evenly divide the convolution output, such
+    # that every pooling output tile maps to a self-contained convolution output tile.
+    if not all([
+            pool.attrs.get('channels_first', True) == conv.attrs.get('channels_first', True),
+            len(kernelShape) == 2,
+            kernelShape == strides,
+            all(pad == 0 for pad in pads),
+            pool.attrs.get('ceil_mode', 0) == 0,
+            convOutShape[1] % strides[0] == 0,
+            convOutShape[2] % strides[1] == 0,
+    ]):
+        return graph
+
+    attrs = {**conv.attrs, "pool_kernel_shape": kernelShape, "pool_strides": strides}
+    convPool = gs.Node(op = 'RequantizedConvMaxPool', name = name, attrs = attrs)
+    graph.replaceInsertNode(list(conv.inputs), list(pool.outputs), convPool)
+
+    return graph
+
+
+@contextagnostic
+class PULPConvMaxPoolFusionPass(ReplaceSequentialPatternPass):
+    """Fuses a RequantizedConv and the MaxPool consuming its output into a RequantizedConvMaxPool node
+
+    The pooling is applied on the L1 output tile of the convolution, so the
+    unpooled activation is never written back to L2.
+    """
+
+    def __init__(self):
+        graph = gs.Graph()
+        _input = gs.Variable(name = 'input_1')
+        output = graph.layer(inputs = [_input], outputs = ['conv_out'], op = 'RequantizedConv', name = 'conv1')
+        output = graph.layer(inputs = output, outputs = ['pool_out'], op = 'MaxPool', name = 'pool1')
+        graph.outputs.append(output)
+        graph.inputs.append(_input)
+
+        name = "_FUSE_CONV_MAXPOOL_PASS"
+        super().__init__(graph, _fuse_conv_maxpool_fun, name)
+
+
+def _fuse_conv_add_fun(graph: gs.Graph, match: Match, name: str):
+    matched_nodes = [m for k, m in match.nodes_map.items()]
+    conv = matched_nodes[0]
+    addNode = matched_nodes[1]
+
+    if not _is_fusable_pulp_conv(conv) or conv.attrs.get('engine') != addNode.attrs.get('engine'):
+        return graph
+
+    convIdx = addNode.inputs.index(conv.outputs[0])
+    skip = addNode.inputs[1 - convIdx]
+
+    # The skip tensor is tiled like the output, hence broadcasting is not supported
+    if isinstance(skip, gs.Constant) or skip.shape is None or list(skip.shape) != list(addNode.outputs[0].shape):
+        return graph
+
+    # The convolution always feeds the first input of the fused requantized addition
+    prefixes = {'rqs1': 'rqs2', 'rqs2': 'rqs1'} if convIdx == 1 else {}
+    attrs = copy.copy(conv.attrs)
+    for key, value in addNode.attrs.items():
+        prefix, _, suffix = key.partition('_')
+        if prefix in ('rqs1', 'rqs2', 'rqsOut'):
+            attrs[f"{prefixes.get(prefix, prefix)}_{suffix}"] = value
+
+    convAdd = gs.Node(op = 'RequantizedConvAdd', name = name, attrs = attrs)
+    graph.replaceInsertNode(list(conv.inputs) + [skip], list(addNode.outputs), convAdd)
+
+    return graph
+
+
+@contextagnostic
+class PULPConvAddFusionPass(ReplaceSequentialPatternPass):
+    """Fuses a RequantizedConv and the residual RequantizedAdd consuming its output into a RequantizedConvAdd node
+
+    The skip tensor becomes an additional input of the fused node, which is
+    loaded tile by tile alongside the convolution input and added on the L1
+    output tile of the convolution.
+    """
+
+    def __init__(self):
+        graph = gs.Graph()
+        _input = gs.Variable(name = 'input_1')
+        output = graph.layer(inputs = [_input], outputs = ['conv_out'], op = 'RequantizedConv', name = 'conv1')
+        output = graph.layer(inputs = output, outputs = ['add_out'], op = 'RequantizedAdd', name = 'add1')
+        graph.outputs.append(output)
+        graph.inputs.append(_input)
+
+        name = "_FUSE_CONV_ADD_PASS"
+        super().__init__(graph, _fuse_conv_add_fun, name)
@@ -7,6 +7,7 @@ from typing import List, Sequence, Type
 from Deeploy.AbstractDataTypes import Pointer
 from Deeploy.CommonExtensions.TypeCheckers.SignPropTypeChecker import SignPropTypeChecker
 from Deeploy.DeeployTypes import OperatorRepresentation, VariableBuffer
+from Deeploy.Targets.Generic.TypeCheckers import FusedElementwiseChecker
 
 
 class PULPDMASliceChecker(SignPropTypeChecker):
@@ -71,6 +72,21 @@ class PULPRequantShiftChecker(SignPropTypeChecker):
         return False
 
 
+class PULPFusedElementwiseChecker(FusedElementwiseChecker):
+
+    def checkOutputType(self, inputs: List[VariableBuffer], operatorRepresentation: OperatorRepresentation) -> bool:
+        if not super().checkOutputType(inputs, operatorRepresentation):
+            return False
+
+        # Requantized chains store their result with the requested signedness, as no offsets are applied
+        lastStage = operatorRepresentation['stages'][-1]
+        if lastStage['op'] == 'RequantShift':
+            outputTypeSigned = self.output_types[0].referencedType.typeMin < 0
+            return bool(lastStage['attrs']['signed']) == outputTypeSigned
+
+        return True
+
+
 class PULPConvChecker(SignPropTypeChecker):
 
     def __init__(self, input_types: Sequence[Type[Pointer]], output_types: Sequence[Type[Pointer]]):
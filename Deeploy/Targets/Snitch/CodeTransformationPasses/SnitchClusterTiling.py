@@ -2,33 +2,58 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import Tuple
+from typing import List, Tuple
 
-from Deeploy.DeeployTypes import CodeGenVerbosity, CodeTransformationPass, ExecutionBlock, NetworkContext, \
-    NodeTemplate, _NoVerbosity
+from Deeploy.DeeployTypes import CodeGenVerbosity, CodeSnippet, CodeTransformationPass, ExecutionBlock, \
+    NetworkContext, NodeTemplate, _NoVerbosity
+from Deeploy.Targets.Snitch.DMA.SnitchDma import batchDmaStatements
 from Deeploy.TilingExtension.AsyncDma import AsyncDma
 from Deeploy.TilingExtension.CodeTransformationPasses.DoubleBufferingTilingCodeGeneration import \
     DoubleBufferingTilingCodeGeneration, ProfilingDoubleBufferingTilingMixIn
 from Deeploy.TilingExtension.CodeTransformationPasses.SingleBufferingTilingCodeGeneration import \
     ProfilingSingleBufferingTilingMixIn, SingleBufferingTilingCodeGeneration
+from Deeploy.TilingExtension.CodeTransformationPasses.TilingPrototypes import PrototypeTilingMixIn, TilingMetaInfo
 
 
-class SnitchClusterTilingSB(SingleBufferingTilingCodeGeneration):
+class SnitchDmaBatchingMixIn(PrototypeTilingMixIn):
+    """Issue all transfers of a tile from the DM core at once and wait only for the highest transaction ID."""
+
+    @classmethod
+    def generateSetupAndTeardownCode(cls, executionBlock: ExecutionBlock, metaInfo: TilingMetaInfo,
+                                     setupStatements: List[CodeSnippet],
+                                     teardownStatements: List[CodeSnippet]) -> ExecutionBlock:
+        return super().generateSetupAndTeardownCode(executionBlock, metaInfo, batchDmaStatements(setupStatements),
+                                                    batchDmaStatements(teardownStatements))
+
+    @classmethod
+    def generateLoopCode(cls, executionBlock: ExecutionBlock, metaInfo: TilingMetaInfo,
+                         openLoopStatements: List[CodeSnippet], ingressDMAStatements: List[CodeSnippet],
+                         egressDMAStatements: List[CodeSnippet],
+                         closeLoopStatements: List[CodeSnippet]) -> ExecutionBlock:
+        # The ingress and egress statements of the tiling loop only concern the DM core
+        return super().generateLoopCode(executionBlock, metaInfo, openLoopStatements,
+                                        batchDmaStatements(ingressDMAStatements, dmCoreOnly = True),
+                                        batchDmaStatements(egressDMAStatements, dmCoreOnly = True), closeLoopStatements)
+
+
+class SnitchClusterTilingSB(SnitchDmaBatchingMixIn, SingleBufferingTilingCodeGeneration):
     pass
 
 
-class SnitchClusterTilingDB(DoubleBufferingTilingCodeGeneration):
+class SnitchClusterTilingDB(SnitchDmaBatchingMixIn, DoubleBufferingTilingCodeGeneration):
     pass
 
 
-class ProfilingSnitchClusterTilingSB(SingleBufferingTilingCodeGeneration, ProfilingSingleBufferingTilingMixIn):
+class ProfilingSnitchClusterTilingSB(SnitchDmaBatchingMixIn, SingleBufferingTilingCodeGeneration,
+                                     ProfilingSingleBufferingTilingMixIn):
     _printCycleDifference = NodeTemplate(r"""
     printf("%s%u][Core %d] %s%u%s", ${prefixStr}, ${profileIdxVar}, snrt_global_core_idx(), "${flavorStr}", \
     ${measurementsEnd}[${profileIdxVar}] - ${measurementsStart}[${profileIdxVar}], ${suffixStr});
     """)
 
 
-class ProfilingSnitchClusterTilingDB(DoubleBufferingTilingCodeGeneration, ProfilingDoubleBufferingTilingMixIn):
+class ProfilingSnitchClusterTilingDB(SnitchDmaBatchingMixIn, DoubleBufferingTilingCodeGeneration,
+                                     ProfilingDoubleBufferingTilingMixIn):
     _printCycleDifference = NodeTemplate(r"""
     printf("%s%u][Core %d] %s%u%s", ${prefixStr}, ${profileIdxVar}, snrt_global_core_idx(), "${flavorStr}", \
     ${measurementsEnd}[${profileIdxVar}] - ${measurementsStart}[${profileIdxVar}], ${suffixStr});
@@ -50,9 +75,9 @@ class SnitchClusterTiling(CodeTransformationPass):
               name: str,
               verbose: CodeGenVerbosity = _NoVerbosity) -> Tuple[NetworkContext, ExecutionBlock]:
         if verbose.tilingProfiling:
-            ctxt, executionBlock = self.profilingSB.apply(ctxt, executionBlock, name)
-            ctxt, executionBlock = self.profilingDB.apply(ctxt, executionBlock, name)
+            ctxt, executionBlock = self.profilingSB.apply(ctxt, executionBlock, name, verbose)
+            ctxt, executionBlock = self.profilingDB.apply(ctxt, executionBlock, name, verbose)
         else:
-            ctxt, executionBlock = self.SB.apply(ctxt, executionBlock, name)
-            ctxt, executionBlock = self.DB.apply(ctxt, executionBlock, name)
+            ctxt, executionBlock = self.SB.apply(ctxt, executionBlock, name, verbose)
+            ctxt, executionBlock = self.DB.apply(ctxt, executionBlock, name, verbose)
         return ctxt, executionBlock
@@ -2,10 +2,18 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import Dict, Tuple
+import math
+from typing import Dict, List, Optional, Tuple
 
-from Deeploy.DeeployTypes import NetworkContext, NodeTemplate, OperatorRepresentation, VariableBuffer
-from Deeploy.TilingExtension.AsyncDma import AsyncDma, DmaDirection, Future, PerTensorWaitingStrategy
+from Deeploy.DeeployTypes import CodeSnippet, NetworkContext, NodeTemplate, OperatorRepresentation, VariableBuffer
+from Deeploy.TilingExtension.AsyncDma import AsyncDma, AsyncDmaWaitingStrategy, DmaDirection, Future, \
+    PerTensorWaitingStrategy, descriptorArray
+
+_dmCoreGuardOpen = NodeTemplate("if (snrt_is_dm_core()) {")
+_dmCoreGuardClose = NodeTemplate("}")
+
+# Wait for the highest transaction ID of a group of futures, which resolves all of them
+_waitTxidTemplate = NodeTemplate("deeploy_dma_wait(${txid});")
 
 
 class SnitchBarrierFuture(Future):
@@ -15,51 +23,163 @@ class SnitchBarrierFuture(Future):
     _waitTemplate = NodeTemplate("if (snrt_is_dm_core()) snrt_dma_wait_all();")
 
 
-# LMACAN: TODO: Add single transfer waiting
 class SnitchFuture(Future):
-    _initTemplate = NodeTemplate("snrt_dma_txid_t ${name} = (snrt_dma_txid_t) -1;")
+    """Transaction ID of the latest transfer of a future.
+
+    Transaction IDs are monotonic, so a future that is shared by several transfers holds the highest ID and waiting for
+    it resolves all of them.
+    """
+
+    _initTemplate = NodeTemplate("snrt_dma_txid_t ${name} = DEEPLOY_DMA_TXID_NONE;")
 
     _deinitTemplate = NodeTemplate("")
 
     _allocTemplate = NodeTemplate("")
 
-    _waitTemplate = NodeTemplate(
-        "if ( (${name} != ( (snrt_dma_txid_t) -1) ) && snrt_is_dm_core() ) snrt_dma_wait(${name});")
+    _waitTemplate = NodeTemplate("if (snrt_is_dm_core()) deeploy_dma_wait(${name});")
+
+
+def _descriptorTransferTemplate(numDims: int) -> NodeTemplate:
+    # The outer dimensions are walked by the runtime, which issues a 2D transfer per iteration
+    dims = descriptorArray("deeploy_dma_dim_t", ["count", "stride_dest", "stride_src"], numDims)
+    return NodeTemplate(
+        "${future} = deeploy_dma_start_nd(${dest}, ${src}, ${size}, ${stride_dest}, ${stride_src}, ${repeat}, "
+        f"{dims}, {numDims});")
 
 
 class SnitchDma(AsyncDma):
 
     _transferTemplates = {
         2:
-            NodeTemplate("""
-            if (snrt_is_dm_core()) {
-                ${future} = snrt_dma_start_2d(${dest}, ${src}, ${size}, ${stride_dest}, ${stride_src}, ${repeat});
-                // WIESEP: Hack as otherwise the last commited DMA transaction ID can never be resolved.
-                snrt_dma_start_2d(${dest}, ${dest}, 1, 0, 0, 0);
-            }
-            """),
+            NodeTemplate(
+                "${future} = deeploy_dma_start_2d(${dest}, ${src}, ${size}, ${stride_dest}, ${stride_src}, ${repeat});"
+            ),
+        3:
+            _descriptorTransferTemplate(1),
+        4:
+            _descriptorTransferTemplate(2),
     }
     _waitingStrategy = PerTensorWaitingStrategy(SnitchFuture)
 
-    def __init__(self, transferTemplates: Dict[int, NodeTemplate] = _transferTemplates) -> None:
+    # Writes of the DMA registers and the transaction ID bookkeeping of a 2D transfer
+    _transferIssueCost = {2: 10}
+    # Call of the descriptor transfer and the initialization of a descriptor entry
+    _descriptorCallCost = 10
+    _descriptorDimCost = 3
+    # Address update of the descriptor walk per issued 2D transfer
+    _descriptorIterationCost = 4
+
+    def __init__(self,
+                 transferTemplates: Dict[int, NodeTemplate] = _transferTemplates,
+                 waitingStrategy: Optional[AsyncDmaWaitingStrategy] = None) -> None:
         super().__init__(transferTemplates)
+        if waitingStrategy is not None:
+            self._waitingStrategy = waitingStrategy
 
     def checkTransfer(self, ctxt: NetworkContext, externalBuffer: VariableBuffer, localBuffer: VariableBuffer,
                       shape: Tuple[int, ...], strideExt: Tuple[int, ...], strideLoc: Tuple[int, ...],
                       direction: DmaDirection) -> None:
         super().checkTransfer(ctxt, externalBuffer, localBuffer, shape, strideExt, strideLoc, direction)
-        assert strideLoc[1] == 1 and strideExt[1] == 1, f"Supports only contigous transfers in the innermost dimension"
+        assert strideLoc[-1] == 1 and strideExt[-1] == 1, f"Supports only contigous transfers in the innermost dimension"
+
+    def transferIssueCost(self, shape: Tuple[int, ...]) -> int:
+        if len(shape) <= 2:
+            return super().transferIssueCost(shape)
+        numDims = len(shape) - 2
+        setupCost = self._descriptorCallCost + numDims * self._descriptorDimCost
+        return setupCost + math.prod(shape[:numDims]) * (self._transferIssueCost[2] + self._descriptorIterationCost)
 
     def transferOpRepr(self, externalBuffer: VariableBuffer, localBuffer: VariableBuffer, shape: Tuple[int, ...],
                        strideExt: Tuple[int, ...], strideLoc: Tuple[int, ...], direction: DmaDirection,
                        future: Future) -> OperatorRepresentation:
+        strideDest, strideSrc = (strideLoc, strideExt) if direction == "ExternalToLocal" else (strideExt, strideLoc)
         operatorRepresentation: OperatorRepresentation = {
             "dest": localBuffer.name if direction == "ExternalToLocal" else externalBuffer.name,
             "src": externalBuffer.name if direction == "ExternalToLocal" else localBuffer.name,
-            "repeat": shape[0],
-            "size": shape[1],
-            "stride_dest": strideLoc[0] if direction == "ExternalToLocal" else strideExt[0],
-            "stride_src": strideExt[0] if direction == "ExternalToLocal" else strideLoc[0],
+            "repeat": shape[-2],
+            "size": shape[-1],
+            "stride_dest": strideDest[-2],
+            "stride_src": strideSrc[-2],
             "future": future.name
         }
+        for dim in range(len(shape) - 2):
+            operatorRepresentation[f"count_{dim}"] = shape[dim]
+            operatorRepresentation[f"stride_dest_{dim}"] = strideDest[dim]
+            operatorRepresentation[f"stride_src_{dim}"] = strideSrc[dim]
         return operatorRepresentation
+
+    def transfer(self,
+                 ctxt: NetworkContext,
+                 externalBuffer: VariableBuffer,
+                 localBuffer: VariableBuffer,
+                 shape: Tuple[int, ...],
+                 strideExt: Tuple[int, ...],
+                 strideLoc: Tuple[int, ...],
+                 direction: DmaDirection,
+                 future: Future,
+                 split: Optional[bool] = None) -> List[CodeSnippet]:
+        # Only the DM core issues transfers. The guards of consecutive transfers are merged by batchDmaStatements.
+        callStack = [CodeSnippet(_dmCoreGuardOpen, {})]
+        callStack.extend(super().transfer(ctxt, externalBuffer, localBuffer, shape, strideExt, strideLoc, direction,
+                                          future, split))
+        callStack.append(CodeSnippet(_dmCoreGuardClose, {}))
+        return callStack
+
+
+def _isGuard(snippet: CodeSnippet) -> bool:
+    return snippet.template is _dmCoreGuardOpen or snippet.template is _dmCoreGuardClose
+
+
+def _isFutureWait(snippet: CodeSnippet) -> bool:
+    return snippet.template is SnitchFuture._waitTemplate
+
+
+def _mergeFutureWaits(statements: List[CodeSnippet], guarded: bool) -> List[CodeSnippet]:
+    # Consecutive waits only have to wait for the highest transaction ID
+    merged: List[CodeSnippet] = []
+    names: List[str] = []
+
+    def flush():
+        if len(names) == 0:
+            return
+        txid = names[-1]
+        for name in reversed(names[:-1]):
+            txid = f"deeploy_dma_txid_max({name}, {txid})"
+        wait = CodeSnippet(_waitTxidTemplate, {"txid": txid})
+        merged.extend([CodeSnippet(_dmCoreGuardOpen, {}
+                                  ), wait, CodeSnippet(_dmCoreGuardClose, {})] if guarded else [wait])
+        names.clear()
+
+    for snippet in statements:
+        if _isFutureWait(snippet):
+            if snippet.operatorRepresentation["name"] not in names:
+                names.append(snippet.operatorRepresentation["name"])
+            continue
+        flush()
+        merged.append(snippet)
+    flush()
+
+    return merged
+
+
+def batchDmaStatements(statements: List[CodeSnippet], dmCoreOnly: bool = False) -> List[CodeSnippet]:
+    """Issue the transfers of a group of statements from the DM core at once.
+
+    With `dmCoreOnly`, all statements only concern the DM core, e.g. the ingress and egress statements of a tiling
+    loop, and are wrapped into a single DM core guard. Otherwise, only the guards of directly consecutive transfers and
+    waits are merged. In both cases, consecutive waits are merged into a single wait for the highest transaction ID.
+    """
+    if not any(_isGuard(snippet) or _isFutureWait(snippet) for snippet in statements):
+        return statements
+
+    if dmCoreOnly:
+        body = _mergeFutureWaits([snippet for snippet in statements if not _isGuard(snippet)], guarded = False)
+        return [CodeSnippet(_dmCoreGuardOpen, {})] + body + [CodeSnippet(_dmCoreGuardClose, {})]
+
+    batched: List[CodeSnippet] = []
+    for snippet in _mergeFutureWaits(statements, guarded = True):
+        if snippet.template is _dmCoreGuardOpen and len(batched) > 0 and batched[-1].template is _dmCoreGuardClose:
+            batched.pop()
+            continue
+        batched.append(snippet)
+    return batched
@@ -123,6 +123,7 @@ class SnitchTransientBuffer(TransientBuffer):
 class SnitchConstantBuffer(ConstantBuffer):
 
     initTemplate = AllocateTemplate.snitchGenericGlobalInitTemplate
+    binaryInitTemplate = AllocateTemplate.snitchGenericGlobalBinaryInitTemplate
     allocTemplate = AllocateTemplate.snitchL2GlobalAllocateTemplate
     deallocTemplate = FreeTemplate.snitchL2GlobalTemplate
 
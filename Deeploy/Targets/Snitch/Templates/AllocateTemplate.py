@@ -45,6 +45,12 @@ static ${type.referencedType.typeName} ${name}[${size}] = {${values}};\n
 % endif
 """)
 
+# Values are linked from the binary blob at ${blobPath} by the assembler, its label is local like the static array
+snitchGenericGlobalBinaryInitTemplate = NodeTemplate("""
+__asm__(".pushsection .data, \\"aw\\"\\n.balign 8\\n${name}:\\n.incbin \\"${blobPath}\\"\\n.popsection");
+extern ${type.referencedType.typeName} ${name}[${size}] __attribute__((aligned(8)));
+""")
+
 snitchGenericGuardedAllocate = NodeTemplate("""
 % if _memoryLevel == "L1":
 if (snrt_is_dm_core()) { ${name} = (${type.typeName}) snrt_l1alloc(sizeof(${type.referencedType.typeName}) * ${size}); }
@@ -34,7 +34,7 @@ for(uint32_t i_${i} = 0; i_${i} < dimLen_${i}; i_${i}++) {
 class SnitchTransposeTemplate(NodeTemplate):
 
     def __init__(self, templateStr: str):
-        self._indirectTemplate = _Template(templateStr)
+        self._indirectTemplate = _Template.cached(templateStr)
         self.subTemplates = {}
         self.subTemplateGenerators = {}
 
@@ -4,7 +4,7 @@
 
 import math
 from abc import ABC, abstractmethod
-from typing import Dict, List, Literal, Set, Tuple, Type
+from typing import Callable, Dict, List, Literal, Mapping, Optional, Sequence, Set, Tuple, Type
 
 from Deeploy.DeeployTypes import CodeSnippet, NetworkContext, NodeTemplate, OperatorRepresentation, VariableBuffer, \
     _ReferenceBuffer
@@ -45,7 +45,7 @@ class AsyncDmaWaitingStrategy(ABC):
         self.FutureCls = FutureCls
 
     @abstractmethod
-    def getFuture(self, tensorName: str, direction: DmaDirection) -> Future:
+    def getFuture(self, tensorName: str, direction: DmaDirection, channel: int = 0) -> Future:
         pass
 
 
@@ -57,7 +57,9 @@ class PerTensorWaitingStrategy(AsyncDmaWaitingStrategy):
         # object is returned for repeated requests for the same tensor/direction
         self._futures: Dict[Tuple[str, DmaDirection], Future] = {}
 
-    def getFuture(self, tensorName: str, direction: DmaDirection) -> Future:
+    def getFuture(self, tensorName: str, direction: DmaDirection, channel: int = 0) -> Future:
+        # Every tensor is waited for on its own, independent of the channel
+        _ = channel
         key = (tensorName, direction)
         if key not in self._futures:
             # include direction in the future name to avoid accidental name
@@ -76,10 +78,17 @@ class DirectionWaitingStrategy(AsyncDmaWaitingStrategy):
             "ExternalToLocal": FutureCls(asyncGroupName + "_input"),
             "LocalToExternal": FutureCls(asyncGroupName + "_output")
         }
+        # Futures of the additional channels of a direction
+        self._channelFutures: Dict[Tuple[DmaDirection, int], Future] = {}
 
-    def getFuture(self, tensorName: str, direction: DmaDirection) -> Future:
+    def getFuture(self, tensorName: str, direction: DmaDirection, channel: int = 0) -> Future:
         _ = tensorName
-        return self.asyncGroupFutures[direction]
+        if channel == 0:
+            return self.asyncGroupFutures[direction]
+        key = (direction, channel)
+        if key not in self._channelFutures:
+            self._channelFutures[key] = self.FutureCls(f"{self.asyncGroupFutures[direction].name}_{channel}")
+        return self._channelFutures[key]
 
 
 class BarrierWaitingStrategy(AsyncDmaWaitingStrategy):
@@ -88,24 +97,70 @@ class BarrierWaitingStrategy(AsyncDmaWaitingStrategy):
         super().__init__(FutureCls)
         self.barrier = FutureCls(barrierName)
 
-    def getFuture(self, tensorName: str, direction: DmaDirection) -> Future:
-        _ = tensorName, direction
+    def getFuture(self, tensorName: str, direction: DmaDirection, channel: int = 0) -> Future:
+        _ = tensorName, direction, channel
         return self.barrier
 
 
+def descriptorArray(typeName: str, fields: Sequence[str], numDims: int) -> str:
+    """Template of a descriptor array of `numDims` outer transfer dimensions
+
+    The value of every field of dimension `i` is taken from the operator representation key `<field>_<i>`.
+    """
+    entries = ", ".join("{" + ", ".join(f"${{{field}_{dim}}}" for field in fields) + "}" for dim in range(numDims))
+    return f"(const {typeName}[{numDims}]){{{entries}}}"
+
+
 class AsyncDma(ABC):
 
     _waitingStrategy: AsyncDmaWaitingStrategy
 
+    # Estimated cycles to issue a single transfer of a given rank
+    _transferIssueCost: Dict[int, int] = {}
+
+    # Maximum number of bytes moved by a single transfer command. Longer transfers are split. None if unlimited.
+    _maxTransferSize: Optional[int] = None
+
+    # Number of channels that process transfers independently of each other
+    _numChannels: int = 1
+
+    _chunkLoopOpenTemplate = NodeTemplate("for (uint32_t chunk = 0; chunk < ${numChunks}; chunk++) {")
+    _chunkPtrTemplate = NodeTemplate(
+        "void * const ${resultPtr} = (void *)((char *)${basePtr} + chunk * ${chunkStride});")
+    _remainderOpenTemplate = NodeTemplate("if (${remainder} > 0) {")
+    _remainderPtrTemplate = NodeTemplate("void * const ${resultPtr} = (void *)((char *)${basePtr} + ${offset});")
+    _blockCloseTemplate = NodeTemplate("}")
+
     def __init__(self, transferTemplates: Dict[int, NodeTemplate]) -> None:
         self._transferTemplates = transferTemplates
 
-    def getFuture(self, tensorName: str, direction: DmaDirection) -> Future:
-        return self._waitingStrategy.getFuture(tensorName, direction)
+    def getFuture(self, tensorName: str, direction: DmaDirection, channel: int = 0) -> Future:
+        assert 0 <= channel < self.numChannels(), f"Channel {channel} does not exist, the DMA has {self.numChannels()}"
+        return self._waitingStrategy.getFuture(tensorName, direction, channel)
+
+    def newFuture(self, name: str) -> Future:
+        # Future that is not shared with the transfers of the tiling loops
+        return self._waitingStrategy.FutureCls(name)
+
+    def numChannels(self) -> int:
+        return self._numChannels
 
     def supportedTransferRanks(self) -> Set[int]:
         return set(self._transferTemplates.keys())
 
+    def transferIssueCost(self, shape: Tuple[int, ...]) -> int:
+        """Estimated cycles to issue a transfer of the given shape with a single transfer template"""
+        return self._transferIssueCost.get(len(shape), 1)
+
+    def splitAxis(self, shape: Tuple[int, ...]) -> int:
+        """Outermost dimension of a transfer that is moved by a single transfer command"""
+        return 0
+
+    def requiresSplit(self, shape: Tuple[int, ...]) -> bool:
+        if self._maxTransferSize is None:
+            return False
+        return math.prod(shape[self.splitAxis(shape):]) > self._maxTransferSize
+
     def checkTransfer(self, ctxt: NetworkContext, externalBuffer: VariableBuffer, localBuffer: VariableBuffer,
                       shape: Tuple[int, ...], strideExt: Tuple[int, ...], strideLoc: Tuple[int, ...],
                       direction: DmaDirection) -> None:
@@ -121,14 +176,87 @@ class AsyncDma(ABC):
                        future: Future) -> OperatorRepresentation:
         return {"loc": localBuffer.name, "ext": externalBuffer.name, "future": future.name}
 
-    def transfer(self, ctxt: NetworkContext, externalBuffer: VariableBuffer, localBuffer: VariableBuffer,
-                 shape: Tuple[int, ...], strideExt: Tuple[int, ...], strideLoc: Tuple[int, ...],
-                 direction: DmaDirection, future: Future) -> List[CodeSnippet]:
+    def transfer(self,
+                 ctxt: NetworkContext,
+                 externalBuffer: VariableBuffer,
+                 localBuffer: VariableBuffer,
+                 shape: Tuple[int, ...],
+                 strideExt: Tuple[int, ...],
+                 strideLoc: Tuple[int, ...],
+                 direction: DmaDirection,
+                 future: Future,
+                 split: Optional[bool] = None) -> List[CodeSnippet]:
+        """Transfer a tile, split into several transfers of the same future if it exceeds the maximum transfer size
+
+        `split` forces the split code, which has the same structure for every shape. This allows sharing the code
+        between tiles of which only some exceed the maximum transfer size. By default, only transfers that exceed the
+        maximum transfer size are split.
+        """
+        if split is None:
+            split = self.requiresSplit(shape)
+        if split and self._maxTransferSize is not None:
+            return self._splitTransfer(ctxt, externalBuffer, localBuffer, shape, strideExt, strideLoc, direction,
+                                       future)
         self.checkTransfer(ctxt, externalBuffer, localBuffer, shape, strideExt, strideLoc, direction)
         opRepr = self.transferOpRepr(externalBuffer, localBuffer, shape, strideExt, strideLoc, direction, future)
         template = self._transferTemplates[len(shape)]
         return [CodeSnippet(template, opRepr)]
 
+    def _splitTransfer(self, ctxt: NetworkContext, externalBuffer: VariableBuffer, localBuffer: VariableBuffer,
+                       shape: Tuple[int, ...], strideExt: Tuple[int, ...], strideLoc: Tuple[int, ...],
+                       direction: DmaDirection, future: Future) -> List[CodeSnippet]:
+        # Split the split axis into chunks of rows that fit the maximum transfer size and a remainder
+        assert self._maxTransferSize is not None
+        axis = self.splitAxis(shape)
+        rowSize = math.prod(shape[axis + 1:])
+        assert rowSize <= self._maxTransferSize, \
+            f"Rows of {rowSize} bytes exceed the maximum transfer size of {self._maxTransferSize} bytes"
+
+        rowsPerChunk = self._maxTransferSize // rowSize
+        # Keep the chunks aligned to 8 bytes
+        if rowSize % 8 != 0 and rowsPerChunk >= 8:
+            rowsPerChunk -= rowsPerChunk % 8
+        numChunks, remainder = divmod(shape[axis], rowsPerChunk)
+
+        chunkShape = shape[:axis] + (rowsPerChunk,) + shape[axis + 1:]
+        # The remainder transfer is skipped if it is empty, but it requires a valid shape
+        remainderShape = shape[:axis] + (remainder,) + shape[axis + 1:] if remainder > 0 else chunkShape
+
+        externalChunk = _ReferenceBuffer("ext_chunk", externalBuffer)
+        externalChunk._memoryLevel = externalBuffer._memoryLevel
+        localChunk = _ReferenceBuffer("loc_chunk", localBuffer)
+        localChunk._memoryLevel = localBuffer._memoryLevel
+
+        def chunkTransfer(ptrTemplate: NodeTemplate, offsetRepr: Callable[[int], OperatorRepresentation],
+                          chunkShape: Tuple[int, ...]) -> List[CodeSnippet]:
+            self.checkTransfer(ctxt, externalChunk, localChunk, chunkShape, strideExt, strideLoc, direction)
+            return [
+                CodeSnippet(ptrTemplate, {
+                    "resultPtr": externalChunk.name,
+                    "basePtr": externalBuffer.name,
+                    **offsetRepr(strideExt[axis])
+                }),
+                CodeSnippet(ptrTemplate, {
+                    "resultPtr": localChunk.name,
+                    "basePtr": localBuffer.name,
+                    **offsetRepr(strideLoc[axis])
+                }),
+                CodeSnippet(
+                    self._transferTemplates[len(shape)],
+                    self.transferOpRepr(externalChunk, localChunk, chunkShape, strideExt, strideLoc, direction,
+                                        future)),
+            ]
+
+        callStack = [CodeSnippet(self._chunkLoopOpenTemplate, {"numChunks": numChunks})]
+        callStack += chunkTransfer(self._chunkPtrTemplate, lambda stride: {"chunkStride": rowsPerChunk * stride},
+                                   chunkShape)
+        callStack.append(CodeSnippet(self._blockCloseTemplate, {}))
+        callStack.append(CodeSnippet(self._remainderOpenTemplate, {"remainder": remainder}))
+        callStack += chunkTransfer(self._remainderPtrTemplate,
+                                   lambda stride: {"offset": numChunks * rowsPerChunk * stride}, remainderShape)
+        callStack.append(CodeSnippet(self._blockCloseTemplate, {}))
+        return callStack
+
 
 class EmptyFuture(Future):
 
@@ -149,25 +277,73 @@ class BlockingDmaFromAsyncDmaAdapter(AsyncDma):
     def _transferTemplates(self) -> Dict[int, NodeTemplate]:
         return self.dma._transferTemplates
 
-    def getFuture(self, tensorName: str, direction: DmaDirection) -> Future:
-        return self.dma.getFuture(tensorName, direction)
+    def getFuture(self, tensorName: str, direction: DmaDirection, channel: int = 0) -> Future:
+        return self.dma.getFuture(tensorName, direction, channel)
+
+    def newFuture(self, name: str) -> Future:
+        return self.dma.newFuture(name)
+
+    def numChannels(self) -> int:
+        return self.dma.numChannels()
+
+    def transferIssueCost(self, shape: Tuple[int, ...]) -> int:
+        return self.dma.transferIssueCost(shape)
+
+    def splitAxis(self, shape: Tuple[int, ...]) -> int:
+        return self.dma.splitAxis(shape)
+
+    def requiresSplit(self, shape: Tuple[int, ...]) -> bool:
+        return self.dma.requiresSplit(shape)
 
     def transferOpRepr(self, externalBuffer: VariableBuffer, localBuffer: VariableBuffer, shape: Tuple[int, ...],
                        strideExt: Tuple[int, ...], strideLoc: Tuple[int, ...], direction: DmaDirection,
                        future: Future) -> OperatorRepresentation:
         return self.dma.transferOpRepr(externalBuffer, localBuffer, shape, strideExt, strideLoc, direction, future)
 
-    def transfer(self, ctxt: NetworkContext, externalBuffer: VariableBuffer, localBuffer: VariableBuffer,
-                 shape: Tuple[int, ...], strideExt: Tuple[int, ...], strideLoc: Tuple[int, ...],
-                 direction: DmaDirection, future: Future) -> List[CodeSnippet]:
+    def transfer(self,
+                 ctxt: NetworkContext,
+                 externalBuffer: VariableBuffer,
+                 localBuffer: VariableBuffer,
+                 shape: Tuple[int, ...],
+                 strideExt: Tuple[int, ...],
+                 strideLoc: Tuple[int, ...],
+                 direction: DmaDirection,
+                 future: Future,
+                 split: Optional[bool] = None) -> List[CodeSnippet]:
         callStack = []
-        dma_code = self.dma.transfer(ctxt, externalBuffer, localBuffer, shape, strideExt, strideLoc, direction, future)
+        dma_code = self.dma.transfer(ctxt, externalBuffer, localBuffer, shape, strideExt, strideLoc, direction, future,
+                                     split)
         callStack.append(future.alloc())
         callStack.extend(dma_code)
         callStack.append(future.wait())
         return callStack
 
 
+class DmaTransferScheduler:
+    """Issue order and channel assignment of the transfers of a tile
+
+    Transfers are issued largest first, since the largest transfer finishes last otherwise. Every transfer is assigned
+    to the channel with the fewest bytes scheduled so far, such that all channels finish at about the same time.
+    """
+
+    def __init__(self, numChannels: int = 1) -> None:
+        assert numChannels >= 1, "Expecting at least one channel"
+        self.numChannels = numChannels
+
+    def schedule(self, transferSizes: Mapping[str, int]) -> List[Tuple[str, int]]:
+        """Returns the names of the transfers in issue order together with their channel
+
+        Transfers of equal size keep their original order.
+        """
+        channelLoads = [0] * self.numChannels
+        schedule: List[Tuple[str, int]] = []
+        for name in sorted(transferSizes.keys(), key = lambda name: transferSizes[name], reverse = True):
+            channel = min(range(self.numChannels), key = lambda channel: channelLoads[channel])
+            channelLoads[channel] += transferSizes[name]
+            schedule.append((name, channel))
+        return schedule
+
+
 class AnydimAsyncDmaTransferAdapter:
 
     class NestedForLoopOpenTemplate(NodeTemplate):
@@ -200,11 +376,14 @@ class AnydimAsyncDmaTransferAdapter:
 
     offsetPtrTemplate = NodeTemplate("void * const ${resultPtr} = (void *)((char *)${basePtr} + ${offset});")
 
+    # Estimated cycles of an iteration of the nested loops, including the offset calculation
+    loopIterationCost = 8
+
     def __init__(self, dma: AsyncDma) -> None:
         self.dma = dma
 
-    def getFuture(self, tensorName: str, direction: DmaDirection) -> Future:
-        return self.dma.getFuture(tensorName, direction)
+    def getFuture(self, tensorName: str, direction: DmaDirection, channel: int = 0) -> Future:
+        return self.dma.getFuture(tensorName, direction, channel)
 
     def nearestSupportedTransferRank(self, transfer_rank: int) -> int:
         sortedRanks = sorted(self.dma.supportedTransferRanks())
@@ -217,6 +396,40 @@ class AnydimAsyncDmaTransferAdapter:
         # All supported ranks are bigger so return the smallest one
         return sortedRanks[0]
 
+    @staticmethod
+    def kernelShape(shape: Tuple[int, ...], kernelRank: int) -> Tuple[int, ...]:
+        """Shape of the transfers of rank `kernelRank` that a transfer of the given shape is lowered to"""
+        if kernelRank >= len(shape):
+            return padShape(shape, kernelRank)
+        return shape[-kernelRank:]
+
+    def transferCost(self, shape: Tuple[int, ...], kernelRank: int) -> int:
+        """Estimated cycles to issue a transfer of the given shape with transfers of rank `kernelRank`"""
+        transferRank = len(shape)
+        if kernelRank >= transferRank:
+            return self.dma.transferIssueCost(self.kernelShape(shape, kernelRank))
+        iterations = math.prod(shape[:transferRank - kernelRank])
+        return iterations * (self.loopIterationCost + self.dma.transferIssueCost(self.kernelShape(shape, kernelRank)))
+
+    def requiresSplit(self, shapes: Sequence[Tuple[int, ...]], kernelRank: int) -> bool:
+        """Whether any of the transfers of rank `kernelRank` of the given shapes exceeds the maximum transfer size"""
+        return any(self.dma.requiresSplit(self.kernelShape(shape, kernelRank)) for shape in shapes)
+
+    def cheapestTransferRank(self, shapes: Sequence[Tuple[int, ...]]) -> int:
+        """Rank of the transfers with the lowest total issue cost for transfers of the given shapes
+
+        The shapes have to be of the same rank. On equal cost, the highest rank is preferred.
+        """
+        transferRank = len(shapes[0])
+        assert all(len(shape) == transferRank for shape in shapes), "Expecting shapes of the same rank"
+
+        candidateRanks = sorted((rank for rank in self.dma.supportedTransferRanks() if rank <= transferRank),
+                                reverse = True)
+        if len(candidateRanks) == 0:
+            return self.nearestSupportedTransferRank(transferRank)
+
+        return min(candidateRanks, key = lambda rank: sum(self.transferCost(shape, rank) for shape in shapes))
+
     def transfer(self,
                  ctxt: NetworkContext,
                  externalBuffer: VariableBuffer,
@@ -226,9 +439,12 @@ class AnydimAsyncDmaTransferAdapter:
                  strideLoc: Tuple[int, ...],
                  direction: DmaDirection,
                  future: Future,
-                 strideExtPad: int = 0) -> List[CodeSnippet]:
+                 strideExtPad: int = 0,
+                 kernelRank: Optional[int] = None,
+                 split: Optional[bool] = None) -> List[CodeSnippet]:
         transferRank = len(shape)
-        kernelRank = self.nearestSupportedTransferRank(transferRank)
+        if kernelRank is None:
+            kernelRank = self.cheapestTransferRank([shape])
 
         if kernelRank < transferRank:
             nestedLoopDepth = transferRank - kernelRank
@@ -263,14 +479,15 @@ class AnydimAsyncDmaTransferAdapter:
                 }))
 
             dma_code = self.dma.transfer(ctxt, externalBufferOffseted, localBufferOffseted, shape[-kernelRank:],
-                                         strideExt[-kernelRank:], strideLoc[-kernelRank:], direction, future)
+                                         strideExt[-kernelRank:], strideLoc[-kernelRank:], direction, future, split)
 
             callStack.extend(dma_code)
             callStack.append(CodeSnippet(self.NestedForLoopCloseTemplate(nestedLoopDepth), {}))
             return callStack
         elif kernelRank == transferRank:
-            return self.dma.transfer(ctxt, externalBuffer, localBuffer, shape, strideExt, strideLoc, direction, future)
+            return self.dma.transfer(ctxt, externalBuffer, localBuffer, shape, strideExt, strideLoc, direction, future,
+                                     split)
         else:
             return self.dma.transfer(ctxt, externalBuffer, localBuffer, padShape(shape, kernelRank),
                                      padStride(strideExt, kernelRank, strideExtPad),
-                                     padStride(strideLoc, kernelRank, math.prod(shape)), direction, future)
+                                     padStride(strideLoc, kernelRank, math.prod(shape)), direction, future, split)
@@ -6,11 +6,11 @@ import math
 from typing import List, Set, Tuple
 
 from Deeploy.AbstractDataTypes import VoidType
+from Deeploy.CommonExtensions.CodeTransformationPasses.Closure import ClosureExecutionBlock
 from Deeploy.DeeployTypes import CodeSnippet, ExecutionBlock, NetworkContext, NodeTemplate, OperatorRepresentation, \
     VariableBuffer, _ReferenceBuffer
 from Deeploy.TilingExtension.AsyncDma import AnydimAsyncDmaTransferAdapter, AsyncDma, Future
 from Deeploy.TilingExtension.CodeTransformationPasses.TilingCodeGeneration import TilingCodeGeneration
-from Deeploy.TilingExtension.CodeTransformationPasses.TilingHoistingMixIn import dictOfArrays
 from Deeploy.TilingExtension.CodeTransformationPasses.TilingPrototypes import ProfilingPrototypeMixIn, \
     PrototypeTilingMixIn, TilingMetaInfo
 from Deeploy.TilingExtension.MemoryConstraints import NodeMemoryConstraint
@@ -28,6 +28,16 @@ class DoubleBufferingTilingCodeGeneration(TilingCodeGeneration):
     }
     """)
 
+    _moveTileOutCheckOpenStatement = NodeTemplate("""
+    // ASYNCHRONOUS KERNEL CHECK PREVIOUS TILE
+    if ((${tileIdxVar}) > ${numTiles}[*${tileIdxPtr}]) {
+    """)
+
+    _prefetchCheckOpenStatement = NodeTemplate("""
+    // CROSS-LAYER PREFETCH CHECK LAST TILE
+    if ((${tileIdxVar}) == ${numTiles}[*${tileIdxPtr}+1]) {
+    """)
+
     # LMACAN: The brackets around ${tileIdxVar} are important to ensure correct order
     #         of the modulo operation. Breaking case without the brackets is when we
     #         put "TILING_I + 1" for tileIdxVar.
@@ -41,6 +51,8 @@ class DoubleBufferingTilingCodeGeneration(TilingCodeGeneration):
 
     _referenceUpdate = NodeTemplate("${reference} = (${type})${update};")
 
+    _referenceUpdateTemplates = TilingCodeGeneration._referenceUpdateTemplates + (_referenceUpdate,)
+
     def __init__(self, externalMemory: str, localMemory: str, dma: AsyncDma):
         super().__init__(externalMemory, localMemory, dma, 2)
 
@@ -64,6 +76,14 @@ class DoubleBufferingTilingCodeGeneration(TilingCodeGeneration):
             })
         ] for buff in buffers]
 
+    def _asyncKernelWait(self, executionBlock: ExecutionBlock) -> List[CodeSnippet]:
+        """Detach the statements which wait for the kernel from the execution block
+
+        Returns no statements if the kernel of a tile completes before the tiling loop continues. Otherwise, the tiling
+        loop only waits for the kernel before reusing the buffers of its tile.
+        """
+        return []
+
     def _tilingLoop(self, ctxt: NetworkContext, executionBlock: ExecutionBlock,
                     nodeMemoryConstraint: NodeMemoryConstraint, tilingSchedule: TilingSchedule,
                     variableReplacement: VariableReplacementScheme,
@@ -82,6 +102,11 @@ class DoubleBufferingTilingCodeGeneration(TilingCodeGeneration):
         # - 5) Wait for final output tile to be ready
         # - 6) Deinitialize all futures
 
+        # Cross-Layer Prefetching
+        # -----------------------------------
+        # - The first input tiles of the next layer are transferred during the last tile (4.2)
+        # - The first input tiles transferred by the previous layer replace their transfer (2) with a wait
+
         # 4.2) Input Data Transfers
         # -----------------------------------
         # - for each input tensor:
@@ -90,6 +115,7 @@ class DoubleBufferingTilingCodeGeneration(TilingCodeGeneration):
         #     - 4.2.3) Choose buffers for next tile
         #     - 4.2.4) Start transfer for next input tile
         #     - 4.2.5) Update input reference for next tile
+        #   - 4.2.6) Decompress current input tile if it is compressed, overlapping with the transfer of the next one
 
         # 4.4) Output Data Transfers
         # -----------------------------------
@@ -98,6 +124,36 @@ class DoubleBufferingTilingCodeGeneration(TilingCodeGeneration):
         #   - 4.4.2) Start transfer for current output tile
         #   - 4.4.3) Update outut reference for next tile
 
+        # Transfer Scheduling
+        # -----------------------------------
+        # - The tensors of both directions are transferred largest first and spread over the channels of the DMA
+        # - The future of a channel is waited for once per tile, so transfers do not wait for the other channels
+
+        # Asynchronous Kernels
+        # -----------------------------------
+        # - The kernel of the current tile runs while the loop transfers the tiles around it
+        # - 4.2) first waits for the kernel of the previous tile and the output tile before it, which frees their buffers
+        # - 4.4) transfers the output tile of the previous tile instead of the current one
+        # - 5) waits for the kernel of the final tile and transfers its output tile
+
+        if isinstance(executionBlock, ClosureExecutionBlock):
+            baseExecutionBlock = executionBlock.baseBlock
+        else:
+            baseExecutionBlock = executionBlock
+
+        kernelWaitStatements = self._asyncKernelWait(executionBlock)
+        asyncKernel = len(kernelWaitStatements) > 0
+        previousTileIdxVar = "TILING_I-1"
+        # The tile index is already advanced past the loop. Names embedded in the index are not mangled by the templates
+        finalTileIdxVar = (f"{ctxt._mangle(operatorRepresentation['numTiles'])}"
+                           f"[*{ctxt._mangle(operatorRepresentation['tileIdxPtr'])}]-1")
+        outputWaitStatements: List[CodeSnippet] = []
+        finalEgressDMAStatements: List[CodeSnippet] = []
+
+        receivedPrefetch = baseExecutionBlock.receivedPrefetches.get(self.localMemory)
+        prefetchFutures = receivedPrefetch.futures if receivedPrefetch is not None else {}
+        prefetchWaits: List[CodeSnippet] = []
+
         setupStatements: List[CodeSnippet] = []
         openLoopStatements: List[CodeSnippet] = [CodeSnippet(self._openTileLoopTemplate, {**operatorRepresentation})]
 
@@ -114,7 +170,8 @@ class DoubleBufferingTilingCodeGeneration(TilingCodeGeneration):
         # -----------------------------------
 
         buffer_choices: List[List[CodeSnippet]] = [[], []]
-        for tensorName, rectangles in dictOfArrays(tilingSchedule.inputLoadSchedule).items():
+        for tensorName, rectangles, channel in self._scheduleTransfers(ctxt, operatorRepresentation,
+                                                                       tilingSchedule.inputLoadSchedule):
             localBuffer = ctxt.lookup(operatorRepresentation[tensorName])
             assert localBuffer._memoryLevel == self.localMemory
             assert isinstance(localBuffer, _ReferenceBuffer)
@@ -124,9 +181,19 @@ class DoubleBufferingTilingCodeGeneration(TilingCodeGeneration):
             externalBufferShape = tensorMemoryConstraint.memoryConstraints[self.externalMemory].shape
             assert externalBufferShape is not None
 
-            rectangles, externalBufferShape = self._legalizeTransfers(rectangles, tuple(externalBufferShape),
-                                                                      localBuffer._type.referencedType.typeWidth,
-                                                                      self.isFinalMemoryLevel(tensorMemoryConstraint))
+            # Tiles prefetched by the previous layer are transferred uncompressed
+            compressedTransfers = None
+            if externalBuffer.name not in prefetchFutures:
+                compressedTransfers = self._compressTransfers(ctxt, operatorRepresentation, externalBuffer, rectangles,
+                                                              tuple(externalBufferShape),
+                                                              self.isFinalMemoryLevel(tensorMemoryConstraint))
+
+            if compressedTransfers is None:
+                rectangles, externalBufferShape = self._legalizeTransfers(
+                    rectangles, tuple(externalBufferShape), localBuffer._type.referencedType.typeWidth,
+                    self.isFinalMemoryLevel(tensorMemoryConstraint))
+            else:
+                rectangles, externalBufferShape, stageOffsets = compressedTransfers
 
             externalBufferRef = self._hoistReference(ctxt,
                                                      externalBuffer.name + "_ref",
@@ -139,17 +206,35 @@ class DoubleBufferingTilingCodeGeneration(TilingCodeGeneration):
 
             nextLocalBufferReference = self._hoistReference(ctxt, f"{tensorName}_next", l1BuffersReferences[1])
 
-            future = self.dma.getFuture(tensorName, "ExternalToLocal")
+            # Compressed tiles are transferred into the end of their buffer and decompressed in place
+            initialTransferBuffer = localBuffer
+            nextTransferBuffer = nextLocalBufferReference
+            if compressedTransfers is not None:
+                stageReference = self._hoistReference(ctxt,
+                                                      f"{tensorName}_stage",
+                                                      localBuffer,
+                                                      override_type = VoidType)
+                stageOpRepr, hoistedNames = self._hoistStageOffsets(ctxt, tensorName, stageOffsets)
+                initialTransferBuffer = stageReference
+                nextTransferBuffer = stageReference
+
+            future = self.dma.getFuture(tensorName, "ExternalToLocal", channel)
 
             # 2) Load initial input tiles
             anydimAdapter = AnydimAsyncDmaTransferAdapter(self.dma)
-            initialDmaTransferCalls = anydimAdapter.transfer(ctxt, externalBufferRef, localBuffer, rectangles[0].dims,
-                                                             stridesFromShape(externalBufferShape),
+            initialDmaTransferCalls = anydimAdapter.transfer(ctxt, externalBufferRef, initialTransferBuffer,
+                                                             rectangles[0].dims, stridesFromShape(externalBufferShape),
                                                              stridesFromShape(rectangles[0].dims), "ExternalToLocal",
                                                              future, math.prod(externalBufferShape))
             if future not in ingressFutures:
                 setupStatements.append(future.alloc())
-            setupStatements.extend(initialDmaTransferCalls)
+            if externalBuffer.name in prefetchFutures:
+                prefetchWaits.append(prefetchFutures[externalBuffer.name].wait())
+            else:
+                if compressedTransfers is not None:
+                    setupStatements.append(
+                        self._generateStageReferenceUpdate(stageReference, localBuffer, stageOpRepr, hoistedNames, 0))
+                setupStatements.extend(initialDmaTransferCalls)
 
             # 4.1) Choose buffers for current tile (inputs and outputs)
             _buffer_choice = self._generateBufferChoice(localBuffer, l1BuffersReferences)
@@ -179,8 +264,13 @@ class DoubleBufferingTilingCodeGeneration(TilingCodeGeneration):
             if future not in ingressFutures:
                 ingressDMAStatements.append(future.alloc())
 
+            if compressedTransfers is not None:
+                ingressDMAStatements.append(
+                    self._generateStageReferenceUpdate(stageReference, nextLocalBufferReference, stageOpRepr,
+                                                       hoistedNames, "TILING_I+1"))
+
             ingressDMAStatements.extend(
-                self._generateDmaTransferCalls(ctxt, tensorName, rectangles, "TILING_I+1", nextLocalBufferReference,
+                self._generateDmaTransferCalls(ctxt, tensorName, rectangles, "TILING_I+1", nextTransferBuffer,
                                                externalBufferRef, "ExternalToLocal", future))
             # 4.2.5) Update external reference for next til
             referenceUpdate = self._generateExternalReferenceUpdate(ctxt, tensorName, rectangles, "TILING_I+1",
@@ -199,12 +289,39 @@ class DoubleBufferingTilingCodeGeneration(TilingCodeGeneration):
             # Close the "if there is a next tile" block
             ingressDMAStatements.append(CodeSnippet(self._moveTileInCheckCloseStatement, {}))
 
+            # 4.2.6) Decompress current input tile
+            if compressedTransfers is not None:
+                ingressDMAStatements.append(CodeSnippet(self._lineComment,
+                                                        {"comment": "Decompress current input tile"}))
+                ingressDMAStatements.append(
+                    self._generateTileDecompression(localBuffer, stageOpRepr, hoistedNames, "TILING_I"))
+
             # Add future to the set to prevent double wait/allocation
             ingressFutures.add(future)
 
+        # Transfer the first input tiles of the next layer during the last tile
+        issuedPrefetch = baseExecutionBlock.issuedPrefetches.get(self.localMemory)
+        if issuedPrefetch is not None:
+            ingressDMAStatements.append(
+                CodeSnippet(self._lineComment, {"comment": "Prefetch first input tiles of the next layer"}))
+            ingressDMAStatements.append(
+                CodeSnippet(self._prefetchCheckOpenStatement, {
+                    **operatorRepresentation, "tileIdxVar": "TILING_I+1"
+                }))
+            ingressDMAStatements.extend(self._generatePrefetchCalls(ctxt, issuedPrefetch))
+            ingressDMAStatements.append(CodeSnippet(self._moveTileInCheckCloseStatement, {}))
+
+        # Wait for the first input tiles transferred by the previous layer
+        if len(prefetchWaits) > 0:
+            setupStatements.append(
+                CodeSnippet(self._lineComment,
+                            {"comment": "Wait for first input tiles prefetched by the previous layer"}))
+            setupStatements.extend(prefetchWaits)
+
         # 4.4) Output Data Transfers
         # -----------------------------------
-        for tensorName, rectangles in dictOfArrays(tilingSchedule.outputLoadSchedule).items():
+        for tensorName, rectangles, channel in self._scheduleTransfers(ctxt, operatorRepresentation,
+                                                                       tilingSchedule.outputLoadSchedule):
             localBuffer = ctxt.lookup(operatorRepresentation[tensorName])
             assert localBuffer._memoryLevel == self.localMemory
             assert isinstance(localBuffer, _ReferenceBuffer)
@@ -233,29 +350,57 @@ class DoubleBufferingTilingCodeGeneration(TilingCodeGeneration):
                 buffer_choices[i].extend(_buffer_choice[i])
 
             # 4.4.1) Wait for previous output tile
-            future = self.dma.getFuture(tensorName, "LocalToExternal")
-
-            egressDMAStatements.append(CodeSnippet(self._lineComment, {"comment": "Wait for previous output tile"}))
-
-            if future not in egressFutures:
-                egressDMAStatements.append(future.wait())
+            future = self.dma.getFuture(tensorName, "LocalToExternal", channel)
+
+            if asyncKernel:
+                # The output tile before the previous one still occupies the buffer of the current tile
+                if future not in egressFutures:
+                    outputWaitStatements.append(future.wait())
+                transferBuffer = self._hoistReference(ctxt, f"{tensorName}_prev", l1BuffersReferences[1])
+                egressDMAStatements += self._switch(self._generateBufferChoice(transferBuffer, l1BuffersReferences),
+                                                    previousTileIdxVar)
+                transferTileIdxVar = previousTileIdxVar
+            else:
+                egressDMAStatements.append(CodeSnippet(self._lineComment, {"comment": "Wait for previous output tile"}))
+                if future not in egressFutures:
+                    egressDMAStatements.append(future.wait())
+                transferBuffer = localBuffer
+                transferTileIdxVar = "TILING_I"
 
             # 4.4.2) Start transfer for current output tile
-            dmaTransferCalls = self._generateDmaTransferCalls(ctxt, tensorName, rectangles, "TILING_I", localBuffer,
-                                                              externalBufferRef, "LocalToExternal", future)
+            dmaTransferCalls = self._generateDmaTransferCalls(ctxt, tensorName, rectangles, transferTileIdxVar,
+                                                              transferBuffer, externalBufferRef, "LocalToExternal",
+                                                              future)
 
-            egressDMAStatements.append(CodeSnippet(self._lineComment, {"comment": "Transfer current output tile"}))
+            transferStatements: List[CodeSnippet] = []
             # Allocate the future for the next transfer
             if future not in egressFutures:
-                egressDMAStatements.append(future.alloc())
+                transferStatements.append(future.alloc())
 
-            egressDMAStatements.extend(dmaTransferCalls)
+            transferStatements.extend(dmaTransferCalls)
 
             # 4.4.3) Update outut reference for next tile
-            referenceUpdate = self._generateExternalReferenceUpdate(ctxt, tensorName, rectangles, "TILING_I",
+            referenceUpdate = self._generateExternalReferenceUpdate(ctxt, tensorName, rectangles, transferTileIdxVar,
                                                                     externalBufferRef)
             if referenceUpdate is not None:
-                egressDMAStatements.append(referenceUpdate)
+                transferStatements.append(referenceUpdate)
+
+            transferComment = "Transfer previous output tile" if asyncKernel else "Transfer current output tile"
+            egressDMAStatements.append(CodeSnippet(self._lineComment, {"comment": transferComment}))
+            egressDMAStatements.extend(transferStatements)
+
+            if asyncKernel:
+                # 5) The final output tile is still in the buffer of the current tile
+                finalEgressDMAStatements.append(
+                    CodeSnippet(self._referenceUpdate, {
+                        "reference": transferBuffer.name,
+                        "type": transferBuffer._type.typeName,
+                        "update": localBuffer.name
+                    }))
+                finalEgressDMAStatements.extend(
+                    CodeSnippet(snippet.template, {
+                        **snippet.operatorRepresentation, "tileIdxVar": finalTileIdxVar
+                    }) if "tileIdxVar" in snippet.operatorRepresentation else snippet for snippet in transferStatements)
 
             # Add future to the set to prevent double wait/allocation
             egressFutures.add(future)
@@ -263,6 +408,25 @@ class DoubleBufferingTilingCodeGeneration(TilingCodeGeneration):
         # 4.2.
         openLoopStatements += self._switch(buffer_choices, "TILING_I")
 
+        if asyncKernel:
+            previousTileStatements = [CodeSnippet(self._lineComment, {"comment": "Wait for kernel of previous tile"})]
+            previousTileStatements += kernelWaitStatements
+            previousTileStatements.append(
+                CodeSnippet(self._lineComment, {"comment": "Wait for output tile before previous tile"}))
+            previousTileStatements += outputWaitStatements
+            ingressDMAStatements = previousTileStatements + ingressDMAStatements
+            egressDMAStatements = [
+                CodeSnippet(self._moveTileOutCheckOpenStatement, {
+                    **operatorRepresentation, "tileIdxVar": "TILING_I"
+                })
+            ] + egressDMAStatements + [CodeSnippet(self._moveTileInCheckCloseStatement, {})]
+
+            teardownStatements.append(CodeSnippet(self._lineComment, {"comment": "Wait for kernel of final tile"}))
+            teardownStatements.extend(kernelWaitStatements)
+            teardownStatements.extend(outputWaitStatements)
+            teardownStatements.append(CodeSnippet(self._lineComment, {"comment": "Transfer final output tile"}))
+            teardownStatements.extend(finalEgressDMAStatements)
+
         # 1. Initialize all futures
         setupStatements = [f.init() for f in ingressFutures | egressFutures] + setupStatements
         setupStatements = [CodeSnippet(self._lineComment, {"comment": "Initialize DMA future"})] + setupStatements
@@ -9,7 +9,6 @@ from Deeploy.DeeployTypes import CodeSnippet, ExecutionBlock, NetworkContext, Op
     _ReferenceBuffer
 from Deeploy.TilingExtension.AsyncDma import AsyncDma, DmaDirection, Future
 from Deeploy.TilingExtension.CodeTransformationPasses.TilingCodeGeneration import TilingCodeGeneration
-from Deeploy.TilingExtension.CodeTransformationPasses.TilingHoistingMixIn import dictOfArrays
 from Deeploy.TilingExtension.CodeTransformationPasses.TilingPrototypes import ProfilingPrototypeMixIn, \
     PrototypeTilingMixIn, TilingMetaInfo
 from Deeploy.TilingExtension.MemoryConstraints import NodeMemoryConstraint, TensorMemoryConstraint
@@ -23,13 +22,15 @@ class SingleBufferingTilingCodeGeneration(TilingCodeGeneration):
 
     def _generateTransferScheduleCalls(
             self, ctxt: NetworkContext, operatorRepresentation: OperatorRepresentation,
-            transferSchedule: List[Dict[str, HyperRectangle]], tensorMemoryConstraintDict: Dict[str,
-                                                                                                TensorMemoryConstraint],
-            tileIdxVar: str, direction: DmaDirection) -> Tuple[NetworkContext, List[CodeSnippet], Set[Future]]:
+            transferSchedule: List[Dict[str, HyperRectangle]],
+            tensorMemoryConstraintDict: Dict[str, TensorMemoryConstraint], tileIdxVar: str,
+            direction: DmaDirection) -> Tuple[NetworkContext, List[CodeSnippet], Set[Future], List[CodeSnippet]]:
+        # Also returns the statements which decompress the transferred tiles once the futures completed
         callStack: List[CodeSnippet] = []
         futures: Set[Future] = set()
+        decompressionStatements: List[CodeSnippet] = []
 
-        for tensorName, rectangles in dictOfArrays(transferSchedule).items():
+        for tensorName, rectangles, channel in self._scheduleTransfers(ctxt, operatorRepresentation, transferSchedule):
             localBuffer = ctxt.lookup(operatorRepresentation[tensorName])
             assert localBuffer._memoryLevel == self.localMemory
             assert isinstance(localBuffer, _ReferenceBuffer)
@@ -39,9 +40,18 @@ class SingleBufferingTilingCodeGeneration(TilingCodeGeneration):
             externalBufferShape = tensorMemoryConstraint.memoryConstraints[self.externalMemory].shape
             assert externalBufferShape is not None
 
-            rectangles, externalBufferShape = self._legalizeTransfers(rectangles, tuple(externalBufferShape),
-                                                                      localBuffer._type.referencedType.typeWidth,
-                                                                      self.isFinalMemoryLevel(tensorMemoryConstraint))
+            compressedTransfers = None
+            if direction == "ExternalToLocal":
+                compressedTransfers = self._compressTransfers(ctxt, operatorRepresentation, externalBuffer, rectangles,
+                                                              tuple(externalBufferShape),
+                                                              self.isFinalMemoryLevel(tensorMemoryConstraint))
+
+            if compressedTransfers is None:
+                rectangles, externalBufferShape = self._legalizeTransfers(
+                    rectangles, tuple(externalBufferShape), localBuffer._type.referencedType.typeWidth,
+                    self.isFinalMemoryLevel(tensorMemoryConstraint))
+            else:
+                rectangles, externalBufferShape, stageOffsets = compressedTransfers
 
             externalBufferRef = self._hoistReference(ctxt,
                                                      externalBuffer.name + "_ref",
@@ -49,15 +59,29 @@ class SingleBufferingTilingCodeGeneration(TilingCodeGeneration):
                                                      shape = externalBufferShape,
                                                      override_type = VoidType)
 
-            future = self.dma.getFuture(tensorName, direction)
+            future = self.dma.getFuture(tensorName, direction, channel)
 
             # Allocate a future for this transfer
             if future not in futures:
                 callStack.append(future.alloc())
 
+            # Compressed tiles are transferred into the end of the local buffer and decompressed in place
+            transferBuffer = localBuffer
+            if compressedTransfers is not None:
+                transferBuffer = self._hoistReference(ctxt,
+                                                      f"{tensorName}_stage",
+                                                      localBuffer,
+                                                      override_type = VoidType)
+                stageOpRepr, hoistedNames = self._hoistStageOffsets(ctxt, tensorName, stageOffsets)
+                callStack.append(
+                    self._generateStageReferenceUpdate(transferBuffer, localBuffer, stageOpRepr, hoistedNames,
+                                                       tileIdxVar))
+                decompressionStatements.append(
+                    self._generateTileDecompression(localBuffer, stageOpRepr, hoistedNames, tileIdxVar))
+
             try:
                 callStack.extend(
-                    self._generateDmaTransferCalls(ctxt, tensorName, rectangles, tileIdxVar, localBuffer,
+                    self._generateDmaTransferCalls(ctxt, tensorName, rectangles, tileIdxVar, transferBuffer,
                                                    externalBufferRef, direction, future))
             except AssertionError as e:
                 raise AssertionError(f"{e} while generating DMA transfer for tensor '{tensorName}'") from e
@@ -69,7 +93,24 @@ class SingleBufferingTilingCodeGeneration(TilingCodeGeneration):
 
             futures.add(future)
 
-        return ctxt, callStack, futures
+        return ctxt, callStack, futures, decompressionStatements
+
+    def _localOutputsOverlapInputs(self, nodeMemoryConstraint: NodeMemoryConstraint) -> bool:
+
+        def addrSpaces(tensorMemoryConstraints: Dict[str, TensorMemoryConstraint]) -> List[Tuple[int, int]]:
+            constraints = [
+                tensorMemoryConstraint.memoryConstraints.get(self.localMemory)
+                for tensorMemoryConstraint in tensorMemoryConstraints.values()
+            ]
+            return [
+                constraint.addrSpace
+                for constraint in constraints
+                if constraint is not None and constraint.addrSpace is not None
+            ]
+
+        return any(inputStart < outputEnd and outputStart < inputEnd
+                   for inputStart, inputEnd in addrSpaces(nodeMemoryConstraint.inputTensorMemoryConstraints)
+                   for outputStart, outputEnd in addrSpaces(nodeMemoryConstraint.outputTensorMemoryConstraints))
 
     def _tilingLoop(self, ctxt: NetworkContext, executionBlock: ExecutionBlock,
                     nodeMemoryConstraint: NodeMemoryConstraint, tilingSchedule: TilingSchedule,
@@ -80,39 +121,65 @@ class SingleBufferingTilingCodeGeneration(TilingCodeGeneration):
         # ===================================
         # - 1) Initialize all futures
         # - 2) for TILING_I in numTiles:
-        #   - 2.1) Input data transfer for current tile (see "4.2) Input Data Transfers")
-        #   - 2.2) Process current tile
-        #   - 2.3) Output data transfer for current tile (see "4.4) Output Data Transfers")
-        # - 3) Deinitialize all futures
+        #   - 2.1) Input data transfer for current tile
+        #   - 2.2) Wait for output tiles of previous tile and decompress compressed input tiles
+        #   - 2.3) Process current tile
+        #   - 2.4) Output data transfer for current tile
+        # - 3) Wait for output tiles of final tile
+        # - 4) Deinitialize all futures
+
+        # The output tiles of a tile only have to be written back before the next tile overwrites them. Their
+        # write-back hence overlaps with the input transfers of the next tile, unless the local input and output
+        # buffers overlap.
 
         # 2) for TILING_I in numTiles:
         openLoopStatements = [CodeSnippet(self._openTileLoopTemplate, {**operatorRepresentation})]
 
-        # 2.2) Input data transfer for current tile
-        ctxt, ingressDMAStatements, ingressFutures = self._generateTransferScheduleCalls(
+        # 2.1) Input data transfer for current tile
+        ctxt, ingressDMAStatements, ingressFutures, decompressionStatements = self._generateTransferScheduleCalls(
             ctxt, operatorRepresentation, tilingSchedule.inputLoadSchedule,
             nodeMemoryConstraint.inputTensorMemoryConstraints, "TILING_I", "ExternalToLocal")
 
         ingressDMAStatements = [CodeSnippet(self._lineComment, {"comment": "Transfer input tiles"})
                                ] + ingressDMAStatements
-        ingressDMAStatements += [CodeSnippet(self._lineComment, {"comment": "Wait for input tiles"})]
-        ingressDMAStatements += [future.wait() for future in ingressFutures]
 
         # 2.4) Output data transfer for current tile
-        ctxt, egressDMAStatements, egressFutures = self._generateTransferScheduleCalls(
+        ctxt, egressDMAStatements, egressFutures, _ = self._generateTransferScheduleCalls(
             ctxt, operatorRepresentation, tilingSchedule.outputLoadSchedule,
             nodeMemoryConstraint.outputTensorMemoryConstraints, "TILING_I", "LocalToExternal")
         egressDMAStatements = [CodeSnippet(self._lineComment, {"comment": "Transfer output tiles"})
                               ] + egressDMAStatements
-        egressDMAStatements += [CodeSnippet(self._lineComment, {"comment": "Wait for output tiles"})]
-        egressDMAStatements += [future.wait() for future in egressFutures]
+
+        inputWaits = [future.wait() for future in ingressFutures]
+        outputWaits = [future.wait() for future in egressFutures]
+        teardownStatements = []
+        if self._localOutputsOverlapInputs(nodeMemoryConstraint):
+            ingressDMAStatements += [CodeSnippet(self._lineComment, {"comment": "Wait for input tiles"})]
+            ingressDMAStatements += inputWaits
+            egressDMAStatements += [CodeSnippet(self._lineComment, {"comment": "Wait for output tiles"})]
+            egressDMAStatements += outputWaits
+        else:
+            # 2.2) Wait for output tiles of previous tile
+            ingressDMAStatements += [
+                CodeSnippet(self._lineComment, {"comment": "Wait for previous output tiles and input tiles"})
+            ]
+            ingressDMAStatements += outputWaits + inputWaits
+
+            # 3) Wait for output tiles of final tile
+            teardownStatements += [CodeSnippet(self._lineComment, {"comment": "Wait for final output tiles"})]
+            teardownStatements += [future.wait() for future in egressFutures]
+
+        # 2.2) Decompress compressed input tiles
+        if len(decompressionStatements) > 0:
+            ingressDMAStatements += [CodeSnippet(self._lineComment, {"comment": "Decompress input tiles"})]
+            ingressDMAStatements += decompressionStatements
 
         # 1) Initialize all futures
         setupStatements = [CodeSnippet(self._lineComment, {"comment": "Initialize DMA futures"})]
         setupStatements.extend([f.init() for f in ingressFutures | egressFutures])
 
-        # 3) Deinitialize all futures
-        teardownStatements = [CodeSnippet(self._lineComment, {"comment": "Deinitialize DMA futures"})]
+        # 4) Deinitialize all futures
+        teardownStatements += [CodeSnippet(self._lineComment, {"comment": "Deinitialize DMA futures"})]
         teardownStatements.extend([f.deinit() for f in ingressFutures | egressFutures])
 
         closeLoopStatements = [CodeSnippet(self._closeTileLoopTemplate, {**operatorRepresentation})]
@@ -5,20 +5,26 @@
 import copy
 import math
 from abc import abstractmethod
-from typing import List, Optional, Tuple, TypeVar
+from collections import deque
+from typing import Dict, List, Optional, Set, Tuple, TypeVar, Union
 
 import numpy as np
 
+from Deeploy.AbstractDataTypes import Pointer, VoidType
 from Deeploy.CommonExtensions.CodeTransformationPasses.Closure import ClosureExecutionBlock
 from Deeploy.CommonExtensions.CodeTransformationPasses.IntrospectiveCodeTransformation import \
     IntrospectiveCodeTransformationMixIn
-from Deeploy.CommonExtensions.CodeTransformationPasses.MemoryAllocation import ArgumentStructGeneration
+from Deeploy.CommonExtensions.CodeTransformationPasses.MemoryAllocation import ArgumentStructGeneration, \
+    _ArgStructAllocateTemplate
 from Deeploy.DeeployTypes import CodeGenVerbosity, CodeSnippet, CodeTransformationPass, ExecutionBlock, \
     NetworkContext, NodeTemplate, OperatorRepresentation, VariableBuffer, _NoVerbosity
-from Deeploy.TilingExtension.AsyncDma import AnydimAsyncDmaTransferAdapter, AsyncDma, DmaDirection, Future
-from Deeploy.TilingExtension.CodeTransformationPasses.TilingHoistingMixIn import TilingHoistingMixIn
+from Deeploy.TilingExtension.AsyncDma import AnydimAsyncDmaTransferAdapter, AsyncDma, DmaDirection, \
+    DmaTransferScheduler, Future
+from Deeploy.TilingExtension.CodeTransformationPasses.TilingHoistingMixIn import TilingHoistingMixIn, dictOfArrays
 from Deeploy.TilingExtension.CodeTransformationPasses.TilingPrototypes import PrototypeTilingMixIn
-from Deeploy.TilingExtension.MemoryConstraints import NodeMemoryConstraint, TensorMemoryConstraint
+from Deeploy.TilingExtension.CodeTransformationPasses.TilingVariableReplacement import TilingVariableReplacementUpdate
+from Deeploy.TilingExtension.MemoryConstraints import CrossLayerPrefetch, NodeMemoryConstraint, TensorMemoryConstraint
+from Deeploy.TilingExtension.TilerExtension import Tiler
 from Deeploy.TilingExtension.TilingCodegen import HyperRectangle, TilingSchedule, VariableReplacementScheme, \
     calculateFlatOffset, minimizeRectangle, minimizeVariableReplacement, padOffset, padShape, stridesFromShape
 
@@ -63,6 +69,32 @@ class TilingCodeGeneration(CodeTransformationPass, IntrospectiveCodeTransformati
     *${tileIdxPtr} += 1;
     """)
 
+    _argStructDeclarationTemplateStr = """
+    % if len(fields) > 0:
+    ${typeName} ${name} = (${typeName}) {${", ".join(fields)}};
+    % else:
+    ${typeName} ${name};
+    % endif
+    """
+
+    _argStructFieldUpdateTemplate = NodeTemplate("""
+    % for field, value in fields.items():
+    ${name}.${field} = ${value};
+    % endfor
+    """)
+
+    _stageReferenceUpdateTemplate = NodeTemplate("""
+    // UPDATE VARIABLE ${reference}
+    ${reference} = (${type})((char*)(${localBuffer}) + ${stageOffset});
+    """)
+
+    # Templates of the tiling loop which update ${reference} from tile to tile
+    _referenceUpdateTemplates = (_relativeOffsetReferenceUpdateTemplate, _relativeOffsetReferenceUpdateTiledTemplate,
+                                 TilingVariableReplacementUpdate._updateReferenceTemplate)
+
+    # Decompresses the tile staged at ${stageOffset} into ${localBuffer} once it is transferred, see `_compressTransfers`
+    _decompressTileTemplate: Optional[NodeTemplate] = None
+
     @abstractmethod
     def _tilingLoop(self, ctxt: NetworkContext, executionBlock: ExecutionBlock,
                     nodeMemoryConstraint: NodeMemoryConstraint, tilingSchedule: TilingSchedule,
@@ -70,10 +102,14 @@ class TilingCodeGeneration(CodeTransformationPass, IntrospectiveCodeTransformati
                     operatorRepresentation: OperatorRepresentation) -> Tuple[NetworkContext, ExecutionBlock, bool]:
         pass
 
-    def generateTilingLoop(
-            self, ctxt: NetworkContext, executionBlock: ExecutionBlock, nodeMemoryConstraint: NodeMemoryConstraint,
-            tilingSchedules: List[TilingSchedule], variableReplacement: VariableReplacementScheme,
-            operatorRepresentation: OperatorRepresentation) -> Tuple[NetworkContext, ExecutionBlock, bool]:
+    def generateTilingLoop(self,
+                           ctxt: NetworkContext,
+                           executionBlock: ExecutionBlock,
+                           nodeMemoryConstraint: NodeMemoryConstraint,
+                           tilingSchedules: List[TilingSchedule],
+                           variableReplacement: VariableReplacementScheme,
+                           operatorRepresentation: OperatorRepresentation,
+                           verbose: CodeGenVerbosity = _NoVerbosity) -> Tuple[NetworkContext, ExecutionBlock, bool]:
 
         flatTilingSchedule = copy.copy(tilingSchedules[0])
         for tilingSchedule in tilingSchedules[1:]:
@@ -92,8 +128,85 @@ class TilingCodeGeneration(CodeTransformationPass, IntrospectiveCodeTransformati
         operatorRepresentation["numTiles"] = numTiles.name
         operatorRepresentation["tileIdxPtr"] = tileIdxPtr.name
 
-        return self._tilingLoop(ctxt, executionBlock, nodeMemoryConstraint, flatTilingSchedule, variableReplacement,
-                                operatorRepresentation)
+        ctxt, executionBlock, applicable = self._tilingLoop(ctxt, executionBlock, nodeMemoryConstraint,
+                                                            flatTilingSchedule, variableReplacement,
+                                                            operatorRepresentation)
+
+        # Build the argument structs of the calls in the tiling loop once per layer and only update the fields that
+        # change from tile to tile
+        if applicable and verbose.hoistArgumentStructs:
+            executionBlock = self._hoistArgumentStructs(ctxt, executionBlock, variableReplacement,
+                                                        operatorRepresentation)
+
+        return ctxt, executionBlock, applicable
+
+    def _tileVariables(self, ctxt: NetworkContext, snippets: List[CodeSnippet],
+                       variableReplacement: VariableReplacementScheme,
+                       operatorRepresentation: OperatorRepresentation) -> Set[str]:
+        # The per-tile variable replacements and the references updated by the tiling loop, i.e. the offsets into the
+        # external buffers and the buffer choice of multi-buffering
+        names = {operatorRepresentation[key] for key in variableReplacement.perTileReplacements.keys()}
+        names |= {
+            snippet.operatorRepresentation["reference"]
+            for snippet in snippets
+            if snippet.template in self._referenceUpdateTemplates
+        }
+        return {ctxt._mangle(name) if ctxt.is_buffer(name) else name for name in names}
+
+    def _hoistArgumentStructs(self, ctxt: NetworkContext, executionBlock: ExecutionBlock,
+                              variableReplacement: VariableReplacementScheme,
+                              operatorRepresentation: OperatorRepresentation) -> ExecutionBlock:
+        snippets = list(executionBlock.codeSnippets)
+        loopTemplates = [snippet.template for snippet in snippets]
+        if self._openTileLoopTemplate not in loopTemplates or self._closeTileLoopTemplate not in loopTemplates:
+            return executionBlock
+
+        loopStart = loopTemplates.index(self._openTileLoopTemplate)
+        loopEnd = loopTemplates.index(self._closeTileLoopTemplate)
+
+        allocIdxs = [
+            idx for idx in range(loopStart + 1, loopEnd)
+            if isinstance(snippets[idx].template, _ArgStructAllocateTemplate)
+        ]
+        if len(allocIdxs) == 0:
+            return executionBlock
+
+        tileVariables = self._tileVariables(ctxt, snippets[loopStart:loopEnd], variableReplacement,
+                                            operatorRepresentation)
+
+        declarations: List[CodeSnippet] = []
+        for idx in allocIdxs:
+            structOpRepr = snippets[idx].operatorRepresentation
+            structDict = structOpRepr["structDict"]
+            # Scalar fields are immediates and get their literal in the declaration, the loop only stores the pointers
+            # that change from tile to tile
+            tileFields = {
+                field: str(value)
+                for field, value in structDict.value.items()
+                if isinstance(value, Pointer) and str(value) in tileVariables
+            }
+            constFields = [
+                f".{field} = {value}" for field, value in structDict.value.items() if field not in tileFields
+            ]
+
+            # Still an argument struct allocation, such that it is not allocated a second time
+            declarationTemplate = _ArgStructAllocateTemplate(self._argStructDeclarationTemplateStr,
+                                                             snippets[idx].template.bufferName)
+            declarations.append(
+                CodeSnippet(declarationTemplate, {
+                    "name": structOpRepr["name"],
+                    "typeName": structDict.typeName,
+                    "fields": constFields
+                }))
+            snippets[idx] = CodeSnippet(self._argStructFieldUpdateTemplate, {
+                "name": structOpRepr["name"],
+                "fields": tileFields
+            })
+
+        # The declarations only depend on variables that are not modified by the loop, so they are placed right before
+        # it, after the setup of the loop
+        executionBlock.codeSnippets = deque(snippets[:loopStart] + declarations + snippets[loopStart:])
+        return executionBlock
 
     def __init__(self, externalMemory: str, localMemory: str, dma: AsyncDma, bufferCount: int):
         self.externalMemory = externalMemory
@@ -112,6 +225,20 @@ class TilingCodeGeneration(CodeTransformationPass, IntrospectiveCodeTransformati
             return True
         return self.localMemory in memoryOrder[:2]
 
+    def _scheduleTransfers(
+            self, ctxt: NetworkContext, operatorRepresentation: OperatorRepresentation,
+            transferSchedule: List[Dict[str, HyperRectangle]]) -> List[Tuple[str, List[HyperRectangle], int]]:
+        # Issue the transfers of a tile largest first and spread them over the channels of the DMA
+        rectanglesDict = dictOfArrays(transferSchedule)
+        transferSizes = {}
+        for tensorName, rectangles in rectanglesDict.items():
+            typeWidth = ctxt.lookup(operatorRepresentation[tensorName])._type.referencedType.typeWidth
+            transferSizes[tensorName] = sum(math.prod(rect.dims) for rect in rectangles) * typeWidth // 8
+
+        scheduler = DmaTransferScheduler(self.dma.numChannels())
+        return [(tensorName, rectanglesDict[tensorName], channel)
+                for tensorName, channel in scheduler.schedule(transferSizes)]
+
     def _generateDmaTransferCalls(self, ctxt: NetworkContext, tensorName: str, transfers: List[HyperRectangle],
                                   tileIdxVar: str, localBuffer: VariableBuffer, externalBuffer: VariableBuffer,
                                   direction: DmaDirection, future: Future) -> List[CodeSnippet]:
@@ -125,26 +252,51 @@ class TilingCodeGeneration(CodeTransformationPass, IntrospectiveCodeTransformati
 
         anydimAdapter = AnydimAsyncDmaTransferAdapter(self.dma)
 
-        initSnippets = anydimAdapter.transfer(ctxt, externalBuffer, localBuffer, transfers[0].dims,
+        # All tiles share the same lowering, so it is chosen by the issue cost of all of them and they are split if any
+        # of them exceeds the maximum transfer size
+        kernelRank = anydimAdapter.cheapestTransferRank([rect.dims for rect in transfers])
+        split = anydimAdapter.requiresSplit([rect.dims for rect in transfers], kernelRank)
+
+        initSnippets = anydimAdapter.transfer(ctxt,
+                                              externalBuffer,
+                                              localBuffer,
+                                              transfers[0].dims,
                                               stridesFromShape(externalBuffer.shape),
-                                              stridesFromShape(transfers[0].dims), direction, future,
-                                              math.prod(externalBuffer.shape,))
+                                              stridesFromShape(transfers[0].dims),
+                                              direction,
+                                              future,
+                                              math.prod(externalBuffer.shape,),
+                                              kernelRank = kernelRank,
+                                              split = split)
 
         # Add allocation snippets
         templates = [snippet.template for snippet in initSnippets]
         opReprUpdates = [[] for _ in range(len(initSnippets))]
 
         for rect in transfers:
-            snippets = anydimAdapter.transfer(ctxt, externalBuffer, localBuffer, rect.dims,
-                                              stridesFromShape(externalBuffer.shape), stridesFromShape(rect.dims),
-                                              direction, future, math.prod(externalBuffer.shape))
+            snippets = anydimAdapter.transfer(ctxt,
+                                              externalBuffer,
+                                              localBuffer,
+                                              rect.dims,
+                                              stridesFromShape(externalBuffer.shape),
+                                              stridesFromShape(rect.dims),
+                                              direction,
+                                              future,
+                                              math.prod(externalBuffer.shape),
+                                              kernelRank = kernelRank,
+                                              split = split)
+            assert len(snippets) == len(templates), "Expecting the same transfer code for all tiles"
             for i, snippet in enumerate(snippets):
                 opReprUpdates[i].append(snippet.operatorRepresentation)
 
-        tiledSnippets: List[CodeSnippet] = [
-            CodeSnippet(*self._tileTemplate(ctxt, opReprUpdate, template, tileIdxVar, f"{tensorName}_"))
-            for template, opReprUpdate in zip(templates, opReprUpdates)
-        ]
+        # Snippets can share keys, which need distinct names once they are hoisted
+        tiledSnippets: List[CodeSnippet] = []
+        hoistedKeys = set()
+        for idx, (template, opReprUpdate) in enumerate(zip(templates, opReprUpdates)):
+            keys = {key for key, values in dictOfArrays(opReprUpdate).items() if any(v != values[0] for v in values)}
+            prefix = f"{tensorName}_" if hoistedKeys.isdisjoint(keys) else f"{tensorName}_{idx}_"
+            hoistedKeys |= keys
+            tiledSnippets.append(CodeSnippet(*self._tileTemplate(ctxt, opReprUpdate, template, tileIdxVar, prefix)))
 
         return tiledSnippets
 
@@ -216,37 +368,69 @@ Old minOuterShape produced by outerDims: {outerShape} and rects:
 
         inBytesTransfers = []
         for rect in transfers:
-            newOffset = rect.offset[:-1] + (sizeInBytes(rect.offset[-1], typeWidth),)
+            # Packed sub-byte tiles are aligned to byte boundaries by the tiler
+            assert (rect.offset[-1] * typeWidth) % 8 == 0, f"Transfer {rect} does not start on a byte boundary"
+            newOffset = rect.offset[:-1] + (rect.offset[-1] * typeWidth // 8,)
             newDims = rect.dims[:-1] + (sizeInBytes(rect.dims[-1], typeWidth),)
             inBytesTransfers.append(HyperRectangle(newOffset, newDims))
         transfers = inBytesTransfers
 
         return transfers, outerShape
 
-    def _tileTemplate(self, ctxt: NetworkContext, perTileOpReprs: List[OperatorRepresentation], template: NodeTemplate,
-                      tileIdxVar: str, prefix: str) -> Tuple[NodeTemplate, OperatorRepresentation]:
-        opRepr, hoistedNames = self._hoistOpReprUpdates(ctxt, perTileOpReprs, prefix)
+    def _compressTransfers(
+            self, ctxt: NetworkContext, operatorRepresentation: OperatorRepresentation, externalBuffer: VariableBuffer,
+            transfers: List[HyperRectangle], outerShape: Tuple[int, ...],
+            isFinalMemoryLevel: bool) -> Optional[Tuple[List[HyperRectangle], Tuple[int, ...], List[int]]]:
+        """Compress the tiles of an external buffer which are transferred into the local memory
+
+        Returns the byte transfers of the compressed tiles, the shape of the
+        compressed external buffer and, for each tile, the offset into its
+        local buffer to transfer the compressed tile to. The tile is then
+        decompressed in place with `_decompressTileTemplate`. Returns None if
+        the tiles are transferred uncompressed, which is the default.
+        """
+        return None
+
+    def _hoistStageOffsets(self, ctxt: NetworkContext, tensorName: str,
+                           stageOffsets: List[int]) -> Tuple[OperatorRepresentation, List[str]]:
+        return self._hoistOpReprUpdates(ctxt, [{"stageOffset": offset} for offset in stageOffsets], f"{tensorName}_")
+
+    def _generateStageReferenceUpdate(self, stageReference: VariableBuffer, localBuffer: VariableBuffer,
+                                      stageOpRepr: OperatorRepresentation, hoistedNames: List[str],
+                                      tileIdxVar: Union[int, str]) -> CodeSnippet:
+        # Point the stage reference to where the compressed tile is transferred to
+        opRepr = {
+            **stageOpRepr,
+            "reference": stageReference.name,
+            "type": stageReference._type.typeName,
+            "localBuffer": localBuffer.name,
+        }
+        return CodeSnippet(*self._indexTemplate(self._stageReferenceUpdateTemplate, opRepr, hoistedNames, tileIdxVar))
+
+    def _generateTileDecompression(self, localBuffer: VariableBuffer, stageOpRepr: OperatorRepresentation,
+                                   hoistedNames: List[str], tileIdxVar: Union[int, str]) -> CodeSnippet:
+        assert self._decompressTileTemplate is not None, f"{type(self).__name__} cannot decompress tiles"
+        opRepr = {**stageOpRepr, "localBuffer": localBuffer.name}
+        return CodeSnippet(*self._indexTemplate(self._decompressTileTemplate, opRepr, hoistedNames, tileIdxVar))
+
+    def _indexTemplate(self, template: NodeTemplate, opRepr: OperatorRepresentation, hoistedNames: List[str],
+                       tileIdxVar: Union[int, str]) -> Tuple[NodeTemplate, OperatorRepresentation]:
         if len(hoistedNames) > 0:
             template = copy.deepcopy(template)
             self.indexVars(template.template, hoistedNames, "tileIdxVar")
             opRepr["tileIdxVar"] = tileIdxVar
         return template, opRepr
 
-    def apply(self,
-              ctxt: NetworkContext,
-              executionBlock: ExecutionBlock,
-              name: str,
-              verbose: CodeGenVerbosity = _NoVerbosity) -> Tuple[NetworkContext, ExecutionBlock]:
-        if isinstance(executionBlock, ClosureExecutionBlock):
-            baseExecutionBlock = executionBlock.baseBlock
-        else:
-            baseExecutionBlock = executionBlock
+    def _tileTemplate(self, ctxt: NetworkContext, perTileOpReprs: List[OperatorRepresentation], template: NodeTemplate,
+                      tileIdxVar: str, prefix: str) -> Tuple[NodeTemplate, OperatorRepresentation]:
+        opRepr, hoistedNames = self._hoistOpReprUpdates(ctxt, perTileOpReprs, prefix)
+        return self._indexTemplate(template, opRepr, hoistedNames, tileIdxVar)
 
+    def _wrapTilingSolution(
+            self, ctxt: NetworkContext,
+            baseExecutionBlock: ExecutionBlock) -> Tuple[CodeSnippet, VariableReplacementScheme, List[TilingSchedule]]:
         patternMemoryConstraint = baseExecutionBlock.patternMemoryConstraint
-
-        if patternMemoryConstraint is None:
-            return ctxt, executionBlock
-
+        assert patternMemoryConstraint is not None
         assert len(patternMemoryConstraint.nodeConstraints) == 1, "Only layerwise supported for now!"
         #assert len(baseExecutionBlock.codeSnippets) == 1, "Only layerwise supported for now!"
 
@@ -260,28 +444,102 @@ Old minOuterShape produced by outerDims: {outerShape} and rects:
 
         templateNode = possibleTemplateNodes[0]
 
-        self._initPrefix(templateNode.operatorRepresentation['nodeName'])
-
-        operatorRepresentation = templateNode.operatorRepresentation
-        template = templateNode.template
-
-        unraveledOpRepr = operatorRepresentation.copy()
+        unraveledOpRepr = templateNode.operatorRepresentation.copy()
         for key, value in unraveledOpRepr.items():
             if ctxt.is_buffer(value):
                 buffer = ctxt.lookup(value)
                 assert isinstance(buffer, VariableBuffer)
                 unraveledOpRepr[key] = ctxt.unravelReference(buffer).name
 
-        variableReplacement, tilingSchedules = template.tileConstraint.wrapTilingSolution(
+        variableReplacement, tilingSchedules = templateNode.template.tileConstraint.wrapTilingSolution(
             nodeMemoryConstraint, self.localMemory, ctxt, unraveledOpRepr)
 
+        return templateNode, variableReplacement, tilingSchedules
+
+    def _generatePrefetchCalls(self, ctxt: NetworkContext, prefetch: CrossLayerPrefetch) -> List[CodeSnippet]:
+        # Transfer the first input tiles of the consumer block into their first buffer and hand over the futures
+        assert prefetch.consumerBlock is not None
+        templateNode, _, tilingSchedules = self._wrapTilingSolution(ctxt, prefetch.consumerBlock)
+        consumerOpRepr = templateNode.operatorRepresentation
+        nodeMemoryConstraint = prefetch.consumerBlock.patternMemoryConstraint.nodeConstraints[0]
+
+        flatTilingSchedule = copy.copy(tilingSchedules[0])
+        for tilingSchedule in tilingSchedules[1:]:
+            flatTilingSchedule += tilingSchedule
+
+        arena = ctxt.lookup(f"{Tiler.arenaName}_{self.localMemory}")
+        anydimAdapter = AnydimAsyncDmaTransferAdapter(self.dma)
+
+        callStack: List[CodeSnippet] = []
+        for name, rectangles in dictOfArrays(flatTilingSchedule.inputLoadSchedule).items():
+            externalBuffer = ctxt.unravelReference(ctxt.lookup(consumerOpRepr[name]))
+            if externalBuffer.name not in prefetch.tensorNames:
+                continue
+
+            tensorMemoryConstraint = nodeMemoryConstraint.inputTensorMemoryConstraints[externalBuffer.name]
+            externalBufferShape = tensorMemoryConstraint.memoryConstraints[self.externalMemory].shape
+            assert externalBufferShape is not None
+
+            rectangles, externalBufferShape = self._legalizeTransfers(rectangles, tuple(externalBufferShape),
+                                                                      externalBuffer._type.referencedType.typeWidth,
+                                                                      self.isFinalMemoryLevel(tensorMemoryConstraint))
+
+            externalBufferRef = self._hoistReference(ctxt,
+                                                     f"{externalBuffer.name}_prefetch_ref",
+                                                     externalBuffer,
+                                                     externalBufferShape,
+                                                     override_type = VoidType)
+            localBufferRef = self._hoistReference(ctxt,
+                                                  f"{externalBuffer.name}_prefetch_buffer",
+                                                  arena,
+                                                  rectangles[0].dims,
+                                                  offset = flatTilingSchedule.inputBaseOffsets[name][0],
+                                                  override_type = VoidType)
+
+            future = self.dma.newFuture(ctxt._mangle(self.prefix + f"{externalBuffer.name}_prefetch"))
+            initSnippet = future.init()
+            ctxt.hoistGlobalDefinition(future.name,
+                                       initSnippet.template.generate(initSnippet.operatorRepresentation) + "\n")
+
+            callStack.append(future.alloc())
+            callStack.extend(
+                anydimAdapter.transfer(ctxt, externalBufferRef, localBufferRef, rectangles[0].dims,
+                                       stridesFromShape(externalBufferShape), stridesFromShape(rectangles[0].dims),
+                                       "ExternalToLocal", future, math.prod(externalBufferShape)))
+            prefetch.futures[externalBuffer.name] = future
+
+        return callStack
+
+    def apply(self,
+              ctxt: NetworkContext,
+              executionBlock: ExecutionBlock,
+              name: str,
+              verbose: CodeGenVerbosity = _NoVerbosity) -> Tuple[NetworkContext, ExecutionBlock]:
+        if isinstance(executionBlock, ClosureExecutionBlock):
+            baseExecutionBlock = executionBlock.baseBlock
+        else:
+            baseExecutionBlock = executionBlock
+
+        patternMemoryConstraint = baseExecutionBlock.patternMemoryConstraint
+
+        if patternMemoryConstraint is None:
+            return ctxt, executionBlock
+
+        nodeMemoryConstraint = patternMemoryConstraint.nodeConstraints[0]
+
+        templateNode, variableReplacement, tilingSchedules = self._wrapTilingSolution(ctxt, baseExecutionBlock)
+
+        self._initPrefix(templateNode.operatorRepresentation['nodeName'])
+
+        operatorRepresentation = templateNode.operatorRepresentation
+
         minimalVariableReplacement, newOpRepr = minimizeVariableReplacement(variableReplacement, operatorRepresentation)
 
         operatorRepresentation.update(newOpRepr)
 
         ctxt, executionBlock, applicable = self.generateTilingLoop(ctxt, executionBlock, nodeMemoryConstraint,
                                                                    tilingSchedules, minimalVariableReplacement,
-                                                                   operatorRepresentation)
+                                                                   operatorRepresentation, verbose)
         if applicable:
             ctxt, executionBlock = self.argStructGeneration.apply(ctxt, executionBlock, name)
 
@@ -16,7 +16,8 @@ from Deeploy.DeeployTypes import CodeGenVerbosity, CodeSnippet, CodeTransformati
 from Deeploy.TilingExtension.CodeTransformationPasses.TilingHoistingMixIn import TilingHoistingMixIn
 from Deeploy.TilingExtension.MemoryConstraints import NodeMemoryConstraint
 from Deeploy.TilingExtension.TilerExtension import Tiler
-from Deeploy.TilingExtension.TilingCodegen import TilingSchedule, VariableReplacementScheme, minimizeVariableReplacement
+from Deeploy.TilingExtension.TilingCodegen import TilingSchedule, VariableReplacementScheme, \
+    minimizeVariableReplacement, specializeVariableReplacement
 
 
 class TilingVariableReplacement(CodeTransformationPass, IntrospectiveCodeTransformationMixIn, TilingHoistingMixIn):
@@ -56,8 +57,11 @@ class TilingVariableReplacement(CodeTransformationPass, IntrospectiveCodeTransfo
 
         return ctxt
 
-    def _replaceVariableReplacements(self, ctxt: NetworkContext, snippet: CodeSnippet,
-                                     variableReplacement: VariableReplacementScheme) -> NetworkContext:
+    def _replaceVariableReplacements(self,
+                                     ctxt: NetworkContext,
+                                     snippet: CodeSnippet,
+                                     variableReplacement: VariableReplacementScheme,
+                                     maxSpecializations: int = 0) -> NetworkContext:
         operatorRepresentation = snippet.operatorRepresentation
         template = snippet.template
 
@@ -76,7 +80,12 @@ class TilingVariableReplacement(CodeTransformationPass, IntrospectiveCodeTransfo
             operatorRepresentation[name] = ref.name
             replacedVars.append(name)
 
-        self.dereferenceVars(template.template, replacedVars)
+        # The most common tile variants, e.g. the uniform interior tiles, get a version of the kernel with literals
+        replacedScheme = VariableReplacementScheme(
+            {name: variableReplacement.perTileReplacements[name] for name in replacedVars},
+            {name: variableReplacement.replacementTypes[name] for name in replacedVars})
+        variants = specializeVariableReplacement(replacedScheme, maxSpecializations)
+        self.specializeVars(template.template, replacedVars, variants)
 
         return ctxt
 
@@ -143,7 +152,7 @@ class TilingVariableReplacement(CodeTransformationPass, IntrospectiveCodeTransfo
         for tilingSchedule in tilingSchedules[1:]:
             flatTilingSchedule += tilingSchedule
 
-        ctxt = self._replaceVariableReplacements(ctxt, snippet, minimalVariableReplacement)
+        ctxt = self._replaceVariableReplacements(ctxt, snippet, minimalVariableReplacement, verbose.tileSpecializations)
         ctxt = self._replaceTiledTensors(ctxt, snippet, flatTilingSchedule)
         ctxt = self._replaceTransients(ctxt, operatorRepresentation, nodeMemoryConstraint)
 
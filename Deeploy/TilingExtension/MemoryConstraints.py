@@ -6,11 +6,14 @@ from __future__ import annotations
 
 import copy
 from collections import OrderedDict
-from typing import Dict, List, Literal, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Dict, List, Literal, Optional, Tuple, Union
 
 from ortools.constraint_solver.pywrapcp import IntVar
 
-from Deeploy.DeeployTypes import NetworkContext
+from Deeploy.DeeployTypes import ExecutionBlock, NetworkContext
+
+if TYPE_CHECKING:
+    from Deeploy.TilingExtension.AsyncDma import Future
 
 
 class MemoryConstraint():
@@ -198,3 +201,19 @@ class PatternMemoryConstraints():
             retStr += retLine
         retStr += "}"
         return retStr
+
+
+class CrossLayerPrefetch():
+    __slots__ = ["memoryLevel", "tensorNames", "consumerBlock", "futures"]
+
+    def __init__(self, memoryLevel: str, tensorNames: List[str], consumerBlock: Optional[ExecutionBlock] = None):
+        # First tiles of the next pattern's inputs, transferred to memoryLevel while the last tile of the previous
+        # pattern is processed
+        self.memoryLevel: str = memoryLevel
+        self.tensorNames: List[str] = tensorNames
+        self.consumerBlock: Optional[ExecutionBlock] = consumerBlock
+        # Filled by the code generation of the issuing block and waited for by the consuming block
+        self.futures: Dict[str, Future] = {}
+
+    def __repr__(self) -> str:
+        return f"MemoryLevel: {self.memoryLevel}, Tensors: {self.tensorNames}"
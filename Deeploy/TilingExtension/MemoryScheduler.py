@@ -357,14 +357,16 @@ class MemoryScheduler():
             for c in constraints.values():
                 if c.memoryLevel == memoryLevel:
 
-                    if not isinstance(ctxt.lookup(node), TransientBuffer):
-                        typeWidth = max(1, ctxt.lookup(node)._type.referencedType.typeWidth // 8)
+                    if isinstance(ctxt.lookup(node), TransientBuffer):
+                        byteCost = c.size
+                    elif ctxt.lookup(node)._type.referencedType.isPacked:
+                        byteCost = (c.size * ctxt.lookup(node)._type.referencedType.typeWidth + 7) // 8
                     else:
-                        typeWidth = 1
+                        byteCost = c.size * (ctxt.lookup(node)._type.referencedType.typeWidth // 8)
 
                     # SCHEREMO: Make sure each tile is word-aligned for better access performance
                     # and to comply with implicit PULP L3 tiling bugs
-                    wordCost = (((c.size * typeWidth) + type(self).byteAlignment - 1) //
+                    wordCost = ((byteCost + type(self).byteAlignment - 1) //
                                 type(self).byteAlignment) * type(self).byteAlignment
                     cost = wordCost * c.multiBufferCoefficient
 
@@ -430,7 +432,7 @@ class MemoryScheduler():
         for buffer in ctxt.globalObjects.values():
             if not "MEMORYARENA" in buffer.name and isinstance(buffer,
                                                                ConstantBuffer) and buffer._memoryLevel == memoryLevel:
-                constantTensorSize += np.prod(buffer.shape) * buffer._type.referencedType.typeWidth // 8
+                constantTensorSize += buffer.sizeInBytes
 
         return int(constantTensorSize)
 
@@ -533,14 +535,19 @@ class MemoryScheduler():
                     if isinstance(memoryConstraint.size, IntVar):
 
                         _buffer = ctxt.lookup(tensorMemoryConstraints.tensorName)
+                        sizeVar = memoryConstraint.size
 
-                        if not isinstance(_buffer, TransientBuffer):
-                            _typeWidthFactor = int(_buffer._type.referencedType.typeWidth / 8)
-                        else:
+                        if isinstance(_buffer, TransientBuffer):
+                            _typeWidthFactor = 1
+                        elif _buffer._type.referencedType.isPacked:
+                            _, copyIdx = tilerModel.getNameCopyIdx(sizeVar.Name())
+                            sizeVar = tilerModel.getTensorNumberOfBytesExpr(ctxt, _buffer.name, copyIdx)
                             _typeWidthFactor = 1
+                        else:
+                            _typeWidthFactor = int(_buffer._type.referencedType.typeWidth / 8)
 
                         tileMemoryConstraint[tensorMemoryConstraints.tensorName] = {
-                            "sizeVar": memoryConstraint.size,
+                            "sizeVar": sizeVar,
                             "typeWidthFactor": _typeWidthFactor,
                             "memoryLevel": memoryConstraint.memoryLevel,
                             "multiBufferCoeff": memoryConstraint.multiBufferCoefficient,
@@ -21,6 +21,7 @@ from ortools.constraint_solver.pywrapcp import IntVar, SolutionCollector
 import Deeploy.CommonExtensions.DataTypes as BasicDataTypes
 from Deeploy.AbstractDataTypes import PointerClass
 from Deeploy.CommonExtensions.NetworkDeployers.NetworkDeployerWrapper import NetworkDeployerWrapper
+from Deeploy.CompilerProfiling import profileStage
 from Deeploy.DeeployTypes import ConstantBuffer, NetworkContext, NodeBinding, NodeTemplate, ONNXLayer, Schedule, \
     SubGraph, TransientBuffer
 from Deeploy.Logging import DEFAULT_LOGGER as log
@@ -31,7 +32,7 @@ from Deeploy.MemoryLevelExtension.NetworkDeployers.MemoryLevelDeployer import Me
 from Deeploy.TilingExtension.GenericFlow import GenericFlowState
 from Deeploy.TilingExtension.MemoryConstraintFlows import GraphMemoryConstraintFlow, TensorMemLevelTuple, \
     convertFlowState2NodeMemoryConstraint
-from Deeploy.TilingExtension.MemoryConstraints import MemoryConstraint, NodeMemoryConstraint, \
+from Deeploy.TilingExtension.MemoryConstraints import CrossLayerPrefetch, MemoryConstraint, NodeMemoryConstraint, \
     PatternMemoryConstraints, TensorMemoryConstraint
 from Deeploy.TilingExtension.MemoryScheduler import MemoryBlock, MemoryScheduler
 from Deeploy.TilingExtension.TileConstraint import TileConstraint
@@ -77,6 +78,8 @@ class Tiler():
         Strategy for memory allocation.
     searchStrategy : {"min", "max", "random-max"}
         Search strategy for constraint solving.
+    crossLayerPrefetch : bool
+        Flag to transfer the first input tiles of a layer during the last tile of the previous layer.
 
     Examples
     --------
@@ -121,6 +124,7 @@ class Tiler():
         self.visualizeMemoryAlloc: bool = False
         self.memoryAllocStrategy: Literal["TetrisRandom", "TetrisCo-Opt", "MiniMalloc"] = "TetrisRandom"
         self.searchStrategy: Literal["min", "max", "random-max"] = "random-max"
+        self.crossLayerPrefetch: bool = False
 
         if workDir is not None:
             os.makedirs(workDir, exist_ok = True)
@@ -194,7 +198,7 @@ class Tiler():
             for ioBuffer in infiniteLifetimeBuffers:
                 if not ioBuffer._memoryLevel == memoryLevel.name:
                     continue
-                _ioSize = np.prod(ioBuffer.shape) * ioBuffer._type.referencedType.typeWidth // 8
+                _ioSize = ioBuffer.sizeInBytes
                 _maxLifetime = len(memoryMap[memoryLevel.name])
                 fig.add_trace(
                     go.Scatter(x = [-0.5, -0.5, _maxLifetime + 0.5, _maxLifetime + 0.5],
@@ -405,19 +409,16 @@ class Tiler():
 
                 _buffer = ctxt.lookup(memoryBlock.name)
                 if nodeMemoryConstraint is None:
-                    _bufferSize = _buffer.size if isinstance(
-                        _buffer,
-                        TransientBuffer) else np.prod(_buffer.shape) * (_buffer._type.referencedType.typeWidth / 8)
+                    _bufferSize = _buffer.size if isinstance(_buffer, TransientBuffer) else _buffer.sizeInBytes
                 else:
                     if isinstance(_buffer, TransientBuffer):
                         _bufferSize = nodeMemoryConstraint.tensorMemoryConstraints[
                             memoryBlock.name].memoryConstraints[memoryLevel].size
                     else:
-                        _bufferSize = nodeMemoryConstraint.tensorMemoryConstraints[
-                            memoryBlock.name].memoryConstraints[memoryLevel].size * (
-                                _buffer._type.referencedType.typeWidth /
-                                8) * nodeMemoryConstraint.tensorMemoryConstraints[
-                                    memoryBlock.name].memoryConstraints[memoryLevel].multiBufferCoefficient
+                        memoryConstraint = nodeMemoryConstraint.tensorMemoryConstraints[
+                            memoryBlock.name].memoryConstraints[memoryLevel]
+                        _bufferSize = _buffer._type.referencedType.sizeInBytes(
+                            memoryConstraint.size) * memoryConstraint.multiBufferCoefficient
 
                 writer.writerow([
                     memoryBlock.name,
@@ -481,13 +482,15 @@ class Tiler():
         initialize the constraint model and symbolic memory constraints.
         """
         assert self.tilerModel is not None and self.symbolicMemoryConstraints is not None, "Set up the model before trying to compute a schedule!"
-        collector = self.tilerModel.trySolveModel()
-        tilingSolution = self._getTilingSolution(self.tilerModel, ctxt, collector, self.symbolicMemoryConstraints)
-        if not self.memoryAllocStrategy == "MiniMalloc":
-            assert self.tilerModel is not None
-            log.debug(" - Extract Memory Allocation")
-            self.innerMemoryScheduler.annotateSolution(ctxt, self.tilerModel)
-            self.outerMemoryScheduler.annotateSolution(ctxt, self.tilerModel)
+        with profileStage("solveModel", "tiling", searchStrategy = self.searchStrategy):
+            collector = self.tilerModel.trySolveModel()
+        with profileStage("extractSolution", "tiling"):
+            tilingSolution = self._getTilingSolution(self.tilerModel, ctxt, collector, self.symbolicMemoryConstraints)
+            if not self.memoryAllocStrategy == "MiniMalloc":
+                assert self.tilerModel is not None
+                log.debug(" - Extract Memory Allocation")
+                self.innerMemoryScheduler.annotateSolution(ctxt, self.tilerModel)
+                self.outerMemoryScheduler.annotateSolution(ctxt, self.tilerModel)
         return tilingSolution
 
     def computeMemoryMap(self, ctxt: NetworkContext, tilingSolution: TilingSolution) -> MemoryMap:
@@ -586,6 +589,115 @@ class Tiler():
                         memoryConstraint.addrSpace = block.addrSpace
         return ctxt
 
+    def planCrossLayerPrefetch(self, ctxt: NetworkContext, tilingSolution: TilingSolution,
+                               memoryMap: MemoryMap) -> Dict[int, Dict[str, List[str]]]:
+        """Select the first input tiles of each pattern that are transferred during the previous pattern.
+
+        While the last tile of pattern i is processed, the first tiles of the
+        inputs of pattern i+1 can already be transferred into the first buffer
+        of their double-buffered memory block. This requires the first buffer
+        to be disjoint from all memory blocks of pattern i, so blocks of
+        pattern i+1 are moved to the first free address range if necessary.
+
+        Parameters
+        ----------
+        ctxt : NetworkContext
+            Network context containing buffer information.
+        tilingSolution : TilingSolution
+            The tiling solution of every pattern.
+        memoryMap : MemoryMap
+            Memory allocation map, modified in-place for moved memory blocks.
+
+        Returns
+        -------
+        Dict[int, Dict[str, List[str]]]
+            For each pattern issuing prefetches, the prefetched tensors of the
+            next pattern per memory level.
+
+        Notes
+        -----
+        Only layer-wise patterns whose double-buffered inputs are transferred
+        from their home in the default memory level are considered. Constant
+        tensors are always eligible, activations only if they are not
+        produced by pattern i.
+        """
+        defaultMemoryLevel = self.memoryHierarchy._defaultMemoryLevel.name
+        byteAlignment = self.memorySchedulerClass.byteAlignment
+
+        def overlaps(addrSpace: Tuple[int, int], others: List[Tuple[int, int]]) -> bool:
+            return any(addrSpace[0] < other[1] and other[0] < addrSpace[1] for other in others)
+
+        prefetches: Dict[int, Dict[str, List[str]]] = {}
+        for memoryLevel, patternList in memoryMap.items():
+            if memoryLevel == defaultMemoryLevel:
+                continue
+
+            capacity = self.memoryHierarchy.memoryLevels[memoryLevel].size - \
+                self.outerMemoryScheduler.getConstantTensorOffset(ctxt, memoryLevel)
+
+            for idx in range(len(tilingSolution) - 1):
+                producer, consumer = tilingSolution[idx], tilingSolution[idx + 1]
+                if len(producer.nodeConstraints) != 1 or len(consumer.nodeConstraints) != 1:
+                    continue
+
+                producerSpaces = [block.addrSpace for block in patternList[idx] if block.addrSpace is not None]
+                if len(producerSpaces) == 0:
+                    continue
+
+                producerOutputs = {
+                    ctxt.dealiasBuffer(name) for name in producer.nodeConstraints[0].outputTensorMemoryConstraints
+                }
+
+                for tensorName, tensorConstraint in consumer.nodeConstraints[0].inputTensorMemoryConstraints.items():
+                    buffer = ctxt.lookup(tensorName)
+                    memoryOrder = list(tensorConstraint.memoryConstraints.keys())
+                    if memoryLevel not in memoryOrder[1:] or isinstance(buffer, TransientBuffer):
+                        continue
+
+                    externalMemory = memoryOrder[memoryOrder.index(memoryLevel) - 1]
+                    if externalMemory != defaultMemoryLevel or buffer._memoryLevel != externalMemory:
+                        continue
+
+                    if tensorConstraint.memoryConstraints[memoryLevel].multiBufferCoefficient != 2:
+                        continue
+
+                    if not isinstance(buffer, ConstantBuffer) and ctxt.dealiasBuffer(tensorName) in producerOutputs:
+                        continue
+
+                    _block = [block for block in patternList[idx + 1] if block.name == tensorName]
+                    if len(_block) != 1 or _block[0].addrSpace is None:
+                        continue
+                    block = _block[0]
+
+                    # Moving a block would also require moving its in-place aliases
+                    otherBlocks = [other for other in patternList[idx + 1] if other is not block]
+                    if any(ctxt.dealiasBuffer(other.name) == tensorName for other in otherBlocks):
+                        continue
+
+                    blockSize = block.addrSpace[1] - block.addrSpace[0]
+                    firstBufferSize = blockSize // 2
+                    if not overlaps((block.addrSpace[0], block.addrSpace[0] + firstBufferSize), producerSpaces):
+                        prefetches.setdefault(idx, {}).setdefault(memoryLevel, []).append(tensorName)
+                        continue
+
+                    # First fit of the block, with its first buffer outside of the blocks of the previous pattern
+                    consumerSpaces = [other.addrSpace for other in otherBlocks if other.addrSpace is not None]
+                    candidates = sorted({0, *[end for _, end in producerSpaces + consumerSpaces]})
+                    for candidate in candidates:
+                        offset = ((candidate + byteAlignment - 1) // byteAlignment) * byteAlignment
+                        if offset + blockSize > capacity:
+                            break
+                        if overlaps((offset, offset + blockSize), consumerSpaces) or overlaps(
+                            (offset, offset + firstBufferSize), producerSpaces):
+                            continue
+
+                        log.debug(f" - Move {tensorName} in {memoryLevel} to {offset} to prefetch its first tile")
+                        block.addrSpace = (offset, offset + blockSize)
+                        prefetches.setdefault(idx, {}).setdefault(memoryLevel, []).append(tensorName)
+                        break
+
+        return prefetches
+
     def setupModel(self, ctxt: NetworkContext, schedule: Schedule, layerBinding: OrderedDict[str, ONNXLayer],
                    targetMemoryLevelMapping: TargetMemoryLevelMapping) -> NetworkContext:
         """Set up the constraint optimization model for tiling.
@@ -986,8 +1098,7 @@ class Tiler():
                 if not ctxt.lookup(tensor.name)._deploy:
                     continue
 
-                patternMemSizeExpr += tilerModel.getTensorNumberOfEltVar(
-                    tensorName = tensor.name, copyIdx = idx) * (tensor._type.referencedType.typeWidth // 8)
+                patternMemSizeExpr += tilerModel.getTensorNumberOfBytesExpr(ctxt, tensor.name, copyIdx = idx)
 
             if isinstance(patternMemSizeExpr, int):
                 _max = patternMemSizeExpr
@@ -1855,19 +1966,27 @@ class TilerDeployerWrapper(NetworkDeployerWrapper):
                 ), "All tensors have to be in the default memory level when using MiniMalloc!"
 
             log.debug(" - Setup Constraint Model")
-            self.tiler.setupModel(ctxt = self.ctxt,
-                                  schedule = schedule,
-                                  layerBinding = self.layerBinding,
-                                  targetMemoryLevelMapping = self.getTargetMemoryLevelMapping())
-            tilingSolution = self.tiler.computeTilingSchedule(self.ctxt)
+            with profileStage("setupModel", "tiling"):
+                self.tiler.setupModel(ctxt = self.ctxt,
+                                      schedule = schedule,
+                                      layerBinding = self.layerBinding,
+                                      targetMemoryLevelMapping = self.getTargetMemoryLevelMapping())
+            with profileStage("computeTilingSchedule", "tiling"):
+                tilingSolution = self.tiler.computeTilingSchedule(self.ctxt)
 
-            memoryMap = self.tiler.computeMemoryMap(self.ctxt, tilingSolution)
+            with profileStage("computeMemoryMap", "tiling", memoryAllocStrategy = self.tiler.memoryAllocStrategy):
+                memoryMap = self.tiler.computeMemoryMap(self.ctxt, tilingSolution)
 
         assert tilingSolution is not None and memoryMap is not None
 
         log.debug(" - Test Tiling Solution Correctness")
         self.tiler.testTilingSolutionCorrectness(tilingSolution)
 
+        prefetches = {}
+        if self.tiler.crossLayerPrefetch:
+            log.debug(" - Plan Cross-Layer Prefetches")
+            prefetches = self.tiler.planCrossLayerPrefetch(self.ctxt, tilingSolution, memoryMap)
+
         log.debug(" - Annotate Memory Levels")
         self.tiler.annotateMemoryLevel(self.ctxt, tilingSolution, memoryMap)
 
@@ -1884,6 +2003,13 @@ class TilerDeployerWrapper(NetworkDeployerWrapper):
         for layer, pattern in zip(self.layerBinding.values(), tilingSolution):
             layer.mapper.binder.executionBlock.patternMemoryConstraint = pattern
 
+        executionBlocks = [layer.mapper.binder.executionBlock for layer in self.layerBinding.values()]
+        for idx, levelPrefetches in prefetches.items():
+            for memoryLevel, tensorNames in levelPrefetches.items():
+                prefetch = CrossLayerPrefetch(memoryLevel, tensorNames, executionBlocks[idx + 1])
+                executionBlocks[idx].issuedPrefetches[memoryLevel] = prefetch
+                executionBlocks[idx + 1].receivedPrefetches[memoryLevel] = prefetch
+
         # SCHEREMO: Code generation STUB
 
     def bind(self):
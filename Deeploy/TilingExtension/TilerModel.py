@@ -146,10 +146,9 @@ class TilerModel():
         Namespace of added variables is: f"{tensor.name}_dim_{idx}".
         '''
         tensor = ctxt.lookup(tensorName)
+        shape = (tensor.shape,) if isinstance(tensor.shape, int) else tuple(tensor.shape)
 
-        for idx, dim in enumerate([
-                tensor.shape,
-        ] if isinstance(tensor.shape, int) else tensor.shape):
+        for idx, dim in enumerate(shape):
 
             varName = f"{tensor.name}_dim_{idx}" + self._getSuffix(copyIdx)
 
@@ -158,6 +157,29 @@ class TilerModel():
 
             self._addVariable(name = varName, lowerBound = 1, upperBound = dim)
 
+            if idx == len(shape) - 1 and hasattr(tensor, "_type") and tensor._type.referencedType.isPacked:
+                self._addPackingConstraint(tensor.name, shape, tensor._type.referencedType.typeWidth, copyIdx)
+
+    def _addPackingConstraint(self,
+                              tensorName: str,
+                              shape: Tuple[int, ...],
+                              typeWidth: int,
+                              copyIdx: Optional[int] = None):
+        # Tiles of packed sub-byte tensors have to start and end on byte boundaries
+        elementsPerByte = 8 // typeWidth
+        innerDimVar = self.getTensorDimVar(tensorName, len(shape) - 1, copyIdx)
+
+        if shape[-1] % elementsPerByte == 0:
+            packsVar = self._addVariable(name = f"{tensorName}_packs" + self._getSuffix(copyIdx),
+                                         lowerBound = 1,
+                                         upperBound = shape[-1] // elementsPerByte)
+            self._model.Add(innerDimVar == packsVar * elementsPerByte)
+            return
+
+        # Rows don't end on byte boundaries, hence only the whole tensor is aligned
+        for idx, dim in enumerate(shape):
+            self._model.Add(self.getTensorDimVar(tensorName, idx, copyIdx) == dim)
+
     def addTensorNumOfEltToModel(self, ctxt: NetworkContext, tensorName: str, copyIdx: Optional[int] = None):
         '''
         For each tensor in the given list, add a variable equal to the product of dimension variables of this tensor.
@@ -185,6 +207,31 @@ class TilerModel():
 
         self._model.Add(tensorDimProductVar == tensorDimProductExpr)
 
+    def getTensorNumberOfBytesExpr(self,
+                                   ctxt: NetworkContext,
+                                   tensorName: str,
+                                   copyIdx: Optional[int] = None) -> Union[IntExpr, IntVar]:
+        '''
+        Return an expression for the number of bytes occupied by a tile of the given tensor.
+        Packed sub-byte tensors get an additional variable f"{tensor.name}_num_bytes", rounding up to full bytes.
+        '''
+        numElements = self.getTensorNumberOfEltVar(tensorName, copyIdx)
+        referencedType = ctxt.lookup(tensorName)._type.referencedType
+
+        if not referencedType.isPacked:
+            return numElements * (referencedType.typeWidth // 8)
+
+        varName = f"{tensorName}_num_bytes" + self._getSuffix(copyIdx)
+        if varName not in self._variables:
+            elementsPerByte = 8 // referencedType.typeWidth
+            numBytes = self._addVariable(name = varName,
+                                         lowerBound = 1,
+                                         upperBound = referencedType.sizeInBytes(numElements.Max()))
+            self._model.Add(numBytes * elementsPerByte >= numElements)
+            self._model.Add(numBytes * elementsPerByte < numElements + elementsPerByte)
+
+        return self._variables[varName]
+
     def addTransientBufferSizeToModel(self, tensorName: str, memorySizeExpr: Union[IntExpr, IntVar, int]) -> IntVar:
 
         transientName = tensorName
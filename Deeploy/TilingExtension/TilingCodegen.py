@@ -483,6 +483,40 @@ def minimizeVariableReplacement(
     return VariableReplacementScheme(newPerTileRep, newRepTypes), operatorRepresentation
 
 
+def specializeVariableReplacement(scheme: VariableReplacementScheme, maxSpecializations: int) -> List[Dict[str, int]]:
+    """
+    Select the tile variants which are specialized with literal replacement values.
+
+    Tiles with the same values of all replaced variables form a variant. Typically, the uniform interior tiles form
+    the most common variant, while the remainder tiles at the borders of the tiled dimensions form the others.
+
+    Parameters
+    ----------
+    scheme : VariableReplacementScheme
+        The minimized variable replacement scheme, i.e. all variables differ between tiles.
+    maxSpecializations : int
+        Maximum number of specialized variants, which limits the code growth of the specialization.
+
+    Returns
+    -------
+    List[Dict[str, int]]
+        The replacement values of the specialized variants, most common variant first. Ties are broken by the first
+        tile of a variant.
+    """
+    names = list(scheme.perTileReplacements.keys())
+    if maxSpecializations <= 0 or len(names) == 0:
+        return []
+
+    tiles = list(zip(*(scheme.perTileReplacements[name] for name in names)))
+    counts: Dict[Tuple, int] = {}
+    for tile in tiles:
+        counts[tile] = counts.get(tile, 0) + 1
+
+    # Dictionaries keep the insertion order, so sorting by the count keeps the order of the first tiles for ties
+    variants = sorted(counts.keys(), key = lambda tile: -counts[tile])[:maxSpecializations]
+    return [{name: int(value) for name, value in zip(names, variant)} for variant in variants]
+
+
 def minimizeRectangle(rect: HyperRectangle, referenceShape: Sequence[int]) -> Tuple[HyperRectangle, Tuple[int, ...]]:
     """
     Minimize a hyperrectangle by collapsing dimensions where possible.
@@ -773,9 +807,11 @@ def calculateFlatOffsetInBytes(tile: HyperRectangle, referenceBuffer: VariableBu
     The calculation combines multi-dimensional offset computation with
     data type width to produce a byte-level memory offset.
     """
-    return int(
-        calculateFlatOffset(tile.offset, stridesFromShape(referenceBuffer.shape)) *
-        (referenceBuffer._type.referencedType.typeWidth // 8))
+    referencedType = referenceBuffer._type.referencedType
+    flatOffset = calculateFlatOffset(tile.offset, stridesFromShape(referenceBuffer.shape))
+    assert (flatOffset * referencedType.typeWidth) % 8 == 0, \
+        f"Tile of packed tensor {referenceBuffer.name} does not start on a byte boundary"
+    return flatOffset * referencedType.typeWidth // 8
 
 
 def computeTileHyperRectangles(memoryTransfer: MemoryTransfer) -> List[HyperRectangle]:
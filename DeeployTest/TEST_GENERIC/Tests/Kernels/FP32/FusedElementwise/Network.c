@@ -0,0 +1,44 @@
+#include <stdio.h>
+    #include <stdlib.h>
+    #include <math.h>
+    #include "DeeployBasicMath.h"
+
+    #include "Network.h"
+    #include "NetworkConstants.h"
+
+    float32_t* DeeployNetwork_input_0;
+float32_t* DeeployNetwork_input_1;
+float32_t* DeeployNetwork_output_0;
+void* DeeployNetwork_inputs[2];void* DeeployNetwork_outputs[1];
+        void RunNetwork(__attribute__((unused)) uint32_t core_id, __attribute__((unused)) uint32_t numThreads){
+        {
+
+// Fused Elementwise (Name: _FUSE_ELEMENTWISE_PASS_0, Op: FusedElementwise)
+BEGIN_SINGLE_CORE
+    for (uint32_t i = 0; i < 1024; i++) {
+
+
+        float32_t x0 = (float32_t) DeeployNetwork_input_0[i];
+        float32_t x1 = (float32_t) DeeployNetwork_input_1[i];
+        float32_t x2 = (float32_t) DeeployNetwork_bias_tensor[((i / (8 * 8)) % 16)];
+        float32_t x3 = (float32_t) DeeployNetwork_scale_tensor[0];
+        float32_t t0 = x0 + x2;
+        float32_t t1 = MAX(t0, 0.0f);
+        float32_t t2 = t1 * x3;
+        float32_t t3 = t2 + x1;
+        DeeployNetwork_output_0[i] = (float32_t) (t3);
+
+    }
+END_SINGLE_CORE
+
+}
+
+        }
+        
+        void InitNetwork(__attribute__((unused)) uint32_t core_id, __attribute__((unused)) uint32_t numThreads){
+        DeeployNetwork_input_0 = (float32_t*) deeploy_malloc(4 * 1024);
+DeeployNetwork_input_1 = (float32_t*) deeploy_malloc(4 * 1024);
+DeeployNetwork_output_0 = (float32_t*) deeploy_malloc(4 * 1024);
+DeeployNetwork_inputs[0] = (void*) DeeployNetwork_input_0;DeeployNetwork_inputs[1] = (void*) DeeployNetwork_input_1;DeeployNetwork_outputs[0] = (void*) DeeployNetwork_output_0;
+    }
+    
\ No newline at end of file
@@ -0,0 +1,16 @@
+
+    #ifndef __DEEPLOY_HEADER__
+    #define __DEEPLOY_HEADER__
+    #include <stdio.h>
+    #include <stdint.h>
+    #include <stdlib.h>
+    #include "DeeployBasicMath.h"
+        void RunNetwork(uint32_t core_id, uint32_t numThreads);
+        void InitNetwork(uint32_t core_id, uint32_t numThread);
+
+        extern float32_t* DeeployNetwork_input_0;
+static const uint32_t DeeployNetwork_input_0_len = 1024;extern float32_t* DeeployNetwork_input_1;
+static const uint32_t DeeployNetwork_input_1_len = 1024;extern float32_t* DeeployNetwork_output_0;
+static const uint32_t DeeployNetwork_output_0_len = 1024;static const uint32_t DeeployNetwork_num_inputs = 2;static const uint32_t DeeployNetwork_num_outputs = 1;extern void* DeeployNetwork_inputs[2];extern void* DeeployNetwork_outputs[1];static const uint32_t DeeployNetwork_inputs_bytes[2] = {4096, 4096};static const uint32_t DeeployNetwork_outputs_bytes[1] = {4096};
+    #endif
+    
\ No newline at end of file
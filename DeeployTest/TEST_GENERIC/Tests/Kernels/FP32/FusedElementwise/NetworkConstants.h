@@ -0,0 +1,8 @@
+
+    #ifndef __DEEPLOY_CONSTANTS_HEADER__
+    #define __DEEPLOY_CONSTANTS_HEADER__
+    static float32_t DeeployNetwork_bias_tensor[16] = {0.1257302165031433f, -0.13210485875606537f, 0.6404226422309875f, 0.10490011423826218f, -0.5356693863868713f, 0.3615950644016266f, 1.3040000200271606f, 0.9470809698104858f, -0.7037352323532104f, -1.2654215097427368f, -0.6232744455337524f, 0.04132597893476486f, -2.32503080368042f, -0.218791663646698f, -1.2459110021591187f, -0.7322673797607422f};
+static float32_t DeeployNetwork_scale_tensor[1] = {0.5f};
+
+    #endif
+    
\ No newline at end of file
@@ -0,0 +1,3 @@
+float32_t testInputVector0[] ={-0.5442590117454529f, -0.3163001537322998f, 0.4116305410861969f, 1.042513370513916f, -0.12853465974330902f, 1.3664634227752686f, -0.6651946902275085f, 0.35151007771492004f, 0.9034701585769653f, 0.0940122976899147f, -0.7434992790222168f, -0.9217253923416138f, -0.4577258229255676f, 0.22019512951374054f, -1.0096181631088257f, -0.20917557179927826f, -0.15922501683235168f, 0.5408455729484558f, 0.21465912461280823f, 0.35537269711494446f, -0.6538286209106445f, -0.12961363792419434f, 0.7839754819869995f, 1.4934310913085938f, -1.2590655088424683f, 1.5139237642288208f, 1.3458753824234009f, 0.7813113927841187f, 0.2644556164741516f, -0.31392282247543335f, 1.4580206871032715f, 1.9602583646774292f, 1.8016349077224731f, 1.3151037693023682f, 0.3573804199695587f, -1.2083185911178589f, -0.004454133100807667f, 0.6564749479293823f, -1.2883614301681519f, 0.39512205123901367f, 0.42986369132995605f, 0.6960427165031433f, -1.1841179132461548f, -0.661702573299408f, -0.4364352524280548f, -1.169801950454712f, 1.7393678426742554f, -0.49591073393821716f, 0.3289696276187897f, -0.2585725486278534f, 1.5834728479385376f, 1.3203610181808472f, 0.6333526372909546f, -2.20350980758667f, 0.052028972655534744f, 0.6836861968040466f, 1.0039615631103516f, -0.6179070472717285f, 1.8220113515853882f, -1.3204309940338135f, -0.6615280508995056f, 0.9350500106811523f, 0.04905461519956589f, 2.002392530441284f, 0.1885191947221756f, -0.633194088935852f, -0.3775635063648224f, -1.0911461114883423f, -1.2776801586151123f, 0.6304115056991577f, 0.5811657905578613f, 1.2945587635040283f, -0.754605770111084f, 1.6891074180603027f, -0.2873876988887787f, 1.5744082927703857f, -0.43278583884239197f, -0.7354832887649536f, 0.249785378575325f, 1.0314531326293945f, 0.16100957989692688f, -0.5855288505554199f, -1.3412196636199951f, -1.4015202522277832f, 0.5026828646659851f, 0.9897130131721497f, -0.16429458558559418f, -1.0743649005889893f, 0.8730421662330627f, -1.2803939580917358f, -0.7130680680274963f, 0.6210178732872009f, -2.250141143798828f, 0.38636958599090576f, -0.5816408395767212f, 0.10927969962358475f, -0.0757015272974968f, 0.20211438834667206f, 0.6941719651222229f, -0.7583697438240051f, 1.420982003211975f, 0.7260937690734863f, 0.8437326550483704f, 1.16486394405365f, 0.7875882387161255f, 0.8440786600112915f, 0.07559361308813095f, -1.4267739057540894f, -0.1350450962781906f, -0.7695146203041077f, -1.4227417707443237f, 0.25845280289649963f, -0.5685494542121887f, -1.0298044681549072f, -1.0430010557174683f, 0.268417090177536f, 0.35867196321487427f, 1.3224574327468872f, -0.013914668932557106f, 1.0418397188186646f, 1.4022648334503174f, 1.1501656770706177f, -2.3653039932250977f, 1.2286837100982666f, 0.3396199941635132f, 0.42377135157585144f, 0.3712274134159088f, 0.38275715708732605f, 0.3194142282009125f, -0.3589133024215698f, -1.9016352891921997f, -0.10891472548246384f, -0.8037318587303162f, 1.0801633596420288f, -0.2887665033340454f, 0.08347535878419876f, -0.8496059775352478f, -0.5106224417686462f, -0.011533061973750591f, -1.485375165939331f, 0.3006851077079773f, -0.10607225447893143f, -1.1857198476791382f, -2.398232936859131f, 0.5130521059036255f, -0.29758402705192566f, -0.5300084352493286f, -0.23615463078022003f, 1.8164759874343872f, -0.049800969660282135f, 0.08661926537752151f, -1.4870728254318237f, 1.647339105606079f, 0.9174879789352417f, 1.0669348239898682f, 0.047672729939222336f, 0.9166547656059265f, 0.37094682455062866f, 0.6131891012191772f, -0.15219296514987946f, -1.4738879203796387f, 1.0288543701171875f, -1.9349596500396729f, -0.23993666470050812f, -0.2045224905014038f, -1.0428601503372192f, 0.6131231188774109f, -0.2003297060728073f, -0.4368683397769928f, 0.519841730594635f, -0.47657904028892517f, 1.3889800310134888f, 0.35145506262779236f, -0.4743329882621765f, -1.9442650079727173f, -1.3077532052993774f, 1.086830735206604f, -0.050604064017534256f, -0.2831250727176666f, 1.643251657485962f, -1.282649278640747f, -0.5856577754020691f, -0.4725876748561859f, 0.5863372683525085f, -0.6635351777076721f, -0.6134178638458252f, -1.6051493883132935f, 0.7293493747711182f, 0.806139349937439f, -0.4763767421245575f, 0.16333994269371033f, -1.2926461696624756f, -0.4718131422996521f, 1.37795090675354f, 0.13573072850704193f, 2.310363531112671f, -0.7871927618980408f, 0.5802844166755676f, -0.19550582766532898f, 0.5658178329467773f, -0.007211359683424234f, -0.5611981153488159f, -0.8676167726516724f, 3.0660367012023926f, -0.07734505832195282f, -2.016660690307617f, -0.6486005783081055f, 0.6780397295951843f, -0.5000084042549133f, 1.3604462146759033f, 1.0023982524871826f, -0.1523386389017105f, -0.4722159504890442f, -1.0048010349273682f, -0.699966549873352f, -1.4731431007385254f, 1.2043962478637695f, 1.5907007455825806f, -1.2561380863189697f, -1.1816829442977905f, -1.7685118913650513f, -0.9638542532920837f, -3.106336832046509f, -1.1422789096832275f, 1.2969154119491577f, -0.34567251801490784f, 0.8545842170715332f, -0.4889690577983856f, 1.760667324066162f, 0.1992179900407791f, -0.3820022940635681f, 2.5524239540100098f, -0.3244718611240387f, -1.2212233543395996f, 0.20191000401973724f, -0.038835037499666214f, 1.0663245916366577f, -0.9216338992118835f, 0.804716944694519f, 0.852748453617096f, -0.6676872968673706f, 0.16324400901794434f, -0.8307519555091858f, 2.3458080291748047f, -0.7041395902633667f, -0.45307445526123047f, -1.0658379793167114f, -0.34612128138542175f, -0.0058760265819728374f, 0.7677891254425049f, -0.610486626625061f, -0.18577395379543304f, -1.4164893627166748f, -0.8274022340774536f, 2.755807638168335f, 1.0412431955337524f, -0.7814240455627441f, -1.3373972177505493f, -0.9755828380584717f, -0.021690860390663147f, 0.0347277894616127f, -0.744360625743866f, -1.2865744829177856f, 1.4223785400390625f, 0.45168545842170715f, -0.37456801533699036f, -0.2206612080335617f, -0.5295304656028748f, -2.9360454082489014f, 0.11566182971000671f, -1.0705443620681763f, -1.0026843547821045f, -0.6402624249458313f, 0.7323017120361328f, -1.1705307960510254f, -1.4342814683914185f, 0.6398520469665527f, 0.7543689012527466f, -0.9589337110519409f, 0.5623976588249207f, -0.29163244366645813f, 0.30129218101501465f, -1.2609602212905884f, 0.8328944444656372f, 1.203258991241455f, 0.6370732188224792f, 0.5583399534225464f, -3.77227520942688f, 0.2606297433376312f, -0.02544531598687172f, -0.14704550802707672f, -0.6305779814720154f, 0.05536497384309769f, 0.4121173918247223f, -0.2637881636619568f, -0.4633241295814514f, 1.229753851890564f, -1.1053670644760132f, 1.0301551818847656f, 0.17681246995925903f, -0.8043056726455688f, -0.2899819016456604f, -0.9199935793876648f, 0.6750645041465759f, 0.34790176153182983f, -0.5567961931228638f, -1.1022182703018188f, 0.3017160892486572f, 0.9573855996131897f, -0.11383634805679321f, 0.41835251450538635f, -0.3760271370410919f, 0.06756920367479324f, -0.29128292202949524f, 0.2940421402454376f, -1.509772539138794f, 0.6441905498504639f, -0.2299324870109558f, 0.35860806703567505f, -0.34031012654304504f, 0.3203611969947815f, -1.07256281375885f, 1.1891543865203857f, -1.7035446166992188f, -1.0392388105392456f, 0.23566606640815735f, 1.4628422260284424f, 0.2781262993812561f, -0.24790845811367035f, -1.4250901937484741f, -0.1912766695022583f, -0.019877010956406593f, 1.6905686855316162f, 0.6221252083778381f, -1.5290929079055786f, 2.0267791748046875f, -0.3950098752975464f, -0.8794597387313843f, 1.4748226404190063f, -0.04975575953722f, -0.3674026131629944f, 0.21878598630428314f, 0.8448888063430786f, 0.9933362007141113f, -1.3752024173736572f, 1.9984815120697021f, 0.9468615651130676f, -0.3792010545730591f, -0.8186598420143127f, -0.969012439250946f, 0.1233784407377243f, -0.6480162739753723f, -0.7648739814758301f, 0.8112543821334839f, 0.3645673394203186f, -0.3945712447166443f, 0.734247624874115f, 1.36737859249115f, -1.0944963693618774f, -0.6032918691635132f, 0.9426218271255493f, 0.7189405560493469f, 0.2266988605260849f, 1.1624212265014648f, -1.0882117748260498f, -1.4791377782821655f, -0.866507351398468f, 0.12254409492015839f, -0.7960867881774902f, -0.48721814155578613f, -0.9750001430511475f, -0.6204291582107544f, -1.0047872066497803f, 0.3674662113189697f, 0.7948910593986511f, -0.4804459512233734f, -0.20726579427719116f, -0.5810325741767883f, 0.5312511920928955f, 0.08905603736639023f, 1.5941568613052368f, -1.095471978187561f, 0.36250248551368713f, 0.44399139285087585f, -0.3604401648044586f, 0.5835341215133667f, -1.4385226964950562f, 2.118803024291992f, -1.342044472694397f, 0.9198072552680969f, -1.1211227178573608f, 1.1508830785751343f, -0.38477402925491333f, 0.15842290222644806f, 0.0533437542617321f, 1.1007341146469116f, -0.3215474486351013f, -2.967183828353882f, -0.7600587606430054f, 0.18371231853961945f, -0.4404681921005249f, 0.7698208689689636f, 1.015326976776123f, -0.14777180552482605f, -1.4896453619003296f, 1.3841651678085327f, 1.083053469657898f, -0.2991911470890045f, 2.108288526535034f, -0.3488754630088806f, -1.1371197700500488f, -0.15587343275547028f, 1.0778337717056274f, -0.9374534487724304f, 1.9512250423431396f, -0.8965262174606323f, 0.9544222950935364f, 0.5444623827934265f, -0.15405705571174622f, 1.0805330276489258f, -1.4997987747192383f, 1.3575718402862549f, -0.06368403136730194f, -0.5424352288246155f, 0.7491740584373474f, 1.0598989725112915f, 0.7697954177856445f, 1.9995038509368896f, 1.0807260274887085f, 1.2835066318511963f, -0.5398639440536499f, 0.1065237745642662f, 0.5629825592041016f, -0.017742237076163292f, 0.3016352355480194f, 0.42610475420951843f, 0.8442439436912537f, -0.10160888731479645f, -0.3497992157936096f, -0.8283156752586365f, -0.8917323350906372f, 1.1724512577056885f, -0.08452148735523224f, 0.7869443893432617f, -1.2973638772964478f, -1.9381680488586426f, -1.0490912199020386f, 1.1466269493103027f, 1.0680774450302124f, 0.33203861117362976f, -0.8021701574325562f, -0.13080264627933502f, -0.2977604866027832f, -0.3449733555316925f, -2.5060698986053467f, -0.8579263687133789f, -0.19010888040065765f, 1.516427755355835f, 0.16074305772781372f, 1.4008883237838745f, -0.39370691776275635f, -0.25268858671188354f, -3.8994216918945312f, 0.46333032846450806f, 0.5470956563949585f, 1.7637590169906616f, -0.486761212348938f, 0.09415415674448013f, -0.7055279612541199f, -1.1762570142745972f, -0.7131079435348511f, -0.3449985384941101f, 1.355437994003296f, 0.0022116026375442743f, -0.7905448079109192f, 0.14187783002853394f, 0.21757136285305023f, -0.6762320399284363f, 1.1432336568832397f, -1.888348937034607f, -0.21354462206363678f, 0.6650660634040833f, -1.3384325504302979f, 0.3612537384033203f, 1.2928930521011353f, 0.45367127656936646f, -1.6901599168777466f, -0.7281950116157532f, 1.2323033809661865f, 0.2983352541923523f, -0.009858938865363598f, 0.4412005841732025f, 0.7210489511489868f, -0.7084652185440063f, -0.29040008783340454f, 0.14291365444660187f, -0.5439577102661133f, -0.13345155119895935f, 1.297871708869934f, -0.96781986951828f, 1.9266626834869385f, 1.8793443441390991f, -1.7134394645690918f, -0.1410226672887802f, 0.342691570520401f, -0.7608711123466492f, -0.7410805225372314f, -0.23741570115089417f, 0.7391780614852905f, -0.5113338232040405f, 1.8266937732696533f, 0.28997400403022766f, -0.10257528722286224f, 1.449259638786316f, 0.626281201839447f, 0.36928677558898926f, -0.3311403691768646f, 1.8139855861663818f, 0.8118215799331665f, -0.20341134071350098f, -1.577199101448059f, 0.37295153737068176f, -1.1437400579452515f, -1.7159459590911865f, -0.2791514992713928f, 0.2814711034297943f, 1.2824811935424805f, 0.2824518382549286f, 0.8060195446014404f, -1.225882649421692f, -0.022532178089022636f, 0.12421131879091263f, 0.8622461557388306f, 0.11606067419052124f, 0.8040789365768433f, -0.5041992664337158f, 0.3579549193382263f, 0.4148663878440857f, -1.249775767326355f, 0.17553862929344177f, -0.32036253809928894f, -1.9040879011154175f, 0.9584066867828369f, -0.36185866594314575f, -0.8523900508880615f, -0.37731674313545227f, 0.1382002979516983f, 1.5079095363616943f, -0.16593320667743683f, 0.4724074900150299f, 1.3735793828964233f, 0.5335505604743958f, 1.0685641765594482f, -0.47650986909866333f, 0.7710493206977844f, -0.057976000010967255f, 1.0744112730026245f, -1.0035595893859863f, -0.7795577645301819f, 1.2687315940856934f, -0.19608397781848907f, -0.35896065831184387f, 0.07757242023944855f, -0.6894974708557129f, 1.3319413661956787f, -1.2491626739501953f, -0.15059800446033478f, 0.34695279598236084f, -0.10444706678390503f, -0.8022875189781189f, -0.8683891892433167f, 0.4253944158554077f, -1.0304805040359497f, 0.6462426781654358f, -1.5241483449935913f, -0.5549830794334412f, 0.036306023597717285f, -1.2521519660949707f, 0.6520108580589294f, -0.018538814038038254f, -1.0360736846923828f, -1.518888235092163f, -1.565589427947998f, 0.05103394389152527f, -1.156830072402954f, -1.3648796081542969f, -0.23122593760490417f, 2.277500629425049f, 0.2775403559207916f, 0.7629188299179077f, 0.21271835267543793f, 0.7829821705818176f, -1.3430886268615723f, -0.4305119812488556f, 0.2613508403301239f, -0.017916815355420113f, -0.19199322164058685f, -0.6658760905265808f, -0.2583830952644348f, -0.7741978168487549f, -2.421833038330078f, -1.19450843334198f, 0.47565293312072754f, 1.5570780038833618f, 1.8135801553726196f, 0.09675174206495285f, 0.8933836221694946f, 0.9079779386520386f, -0.6922591924667358f, -1.6979398727416992f, 0.030887318775057793f, -1.762200951576233f, -0.3199295997619629f, 0.6081171035766602f, -1.4200694561004639f, 0.032295383512973785f, 1.2400181293487549f, 0.3615124821662903f, 0.5223217010498047f, 0.9067404270172119f, 1.7329630851745605f, 0.15142308175563812f, 1.2295008897781372f, -0.06416921317577362f, -0.5461688041687012f, 0.3148209750652313f, -0.6058128476142883f, -0.5731292366981506f, -0.6077406406402588f, -2.295424222946167f, 0.10549947619438171f, -1.2638353109359741f, -0.10726912319660187f, 1.4499688148498535f, -0.521000325679779f, -0.542009174823761f, 1.363909363746643f, 0.546305775642395f, 0.9765270948410034f, -0.3552912473678589f, 0.748083233833313f, -0.6861686110496521f, -0.6760017275810242f, 0.5962442755699158f, -0.5983731746673584f, 0.767118513584137f, 2.3916845321655273f, -1.6861525774002075f, -0.7522043585777283f, 1.1201461553573608f, -0.1450781673192978f, 1.1610898971557617f, -1.0100642442703247f, 0.3313441872596741f, -0.1505563110113144f, 0.14037072658538818f, 0.3311160206794739f, -1.2200063467025757f, -1.0741374492645264f, 1.399243950843811f, 0.29321372509002686f, 0.10634633153676987f, -0.04407472163438797f, 0.3565424978733063f, -1.1559367179870605f, -0.9990273118019104f, 1.3045082092285156f, 0.15127521753311157f, 0.8503008484840393f, -0.6056640148162842f, 1.376725435256958f, 0.34527841210365295f, 0.48124581575393677f, 0.5487293601036072f, -0.7970092296600342f, -1.8657208681106567f, -1.0748026371002197f, 1.6305228471755981f, 1.3006839752197266f, -0.3469213545322418f, -0.30167633295059204f, 1.0366058349609375f, -0.16840986907482147f, -1.299259901046753f, 1.2655431032180786f, 0.47717857360839844f, -2.5163397789001465f, -0.3131901025772095f, 0.1436702013015747f, 0.48124682903289795f, 0.1521511822938919f, -0.6357417702674866f, -0.11575904488563538f, 0.2948003113269806f, -0.26800408959388733f, -0.3719007074832916f, 1.2520838975906372f, -0.9466077089309692f, -0.34946346282958984f, -2.031269073486328f, 0.540969967842102f, 0.8282644748687744f, 0.5484868288040161f, 0.9176725149154663f, 0.440706729888916f, 0.34251537919044495f, 0.47394707798957825f, -0.26730844378471375f, 1.1883279085159302f, -0.3485720753669739f, -1.46235191822052f, 0.8497835993766785f, 1.8507027626037598f, -0.9601511359214783f, -0.10163112729787827f, -0.6854420304298401f, -0.380583256483078f, 0.04609297215938568f, -1.2418084144592285f, -0.27765366435050964f, -1.4659674167633057f, -0.5682276487350464f, -1.1860696077346802f, -1.0590606927871704f, -1.7199106216430664f, 1.2193546295166016f, 0.5090590715408325f, -1.917464017868042f, -0.5968275666236877f, -0.6704385876655579f, -0.6909441351890564f, -1.4468835592269897f, 0.7543857097625732f, -0.39586377143859863f, 0.4681489169597626f, 0.5267557501792908f, 1.3754453659057617f, -1.8148722648620605f, 1.7386021614074707f, 1.268815279006958f, 0.573065996170044f, 2.383592128753662f, 0.2049786001443863f, 0.8214789032936096f, -0.7384139895439148f, 1.1343574523925781f, 0.16782596707344055f, -0.4512001574039459f, 2.1169393062591553f, -0.3047996759414673f, 0.008861327543854713f, -0.19727995991706848f, -0.7556709051132202f, 0.5312724113464355f, 0.7384095788002014f, 0.3543725311756134f, -2.3605782985687256f, 1.0079970359802246f, -0.3502383530139923f, -1.2163233757019043f, 0.6032809615135193f, 0.5628494024276733f, -1.0430736541748047f, 2.472435712814331f, -1.20962655544281f, -1.7330026626586914f, -1.1541714668273926f, 1.4207998514175415f, -0.17585672438144684f, -0.3720566928386688f, -0.06215772032737732f, -0.596613883972168f, -0.6902633905410767f, -0.6412155032157898f, 0.707955539226532f, 1.0204558372497559f, -1.0550925731658936f, 0.23922796547412872f, 0.7882072329521179f, -1.0817519426345825f, -0.5025665760040283f, -1.0380641222000122f, -1.2910284996032715f, 0.10186287015676498f, -0.7361323833465576f, 0.6311290860176086f, -0.02942192181944847f, 0.41262736916542053f, -0.29228290915489197f, -0.6349973678588867f, -0.09067313373088837f, -0.004996130242943764f, -0.7058554887771606f, 0.42659544944763184f, 0.7465948462486267f, 0.15808270871639252f, 1.7134908437728882f, -0.6323390007019043f, 0.520596444606781f, -0.4087347984313965f, 0.23462949693202972f, -0.8299493193626404f, 1.1151233911514282f, 0.17602090537548065f, 1.192244529724121f, -1.266095519065857f, -0.4935152232646942f, -0.8925657868385315f, -0.5319418907165527f, -0.6926096677780151f, -0.12054093182086945f, -0.017247144132852554f, -0.0409848652780056f, -0.5555238723754883f, 0.1874251812696457f, 0.8756154775619507f, -0.902275562286377f, 0.0008886249852366745f, -0.07407088577747345f, 0.46835464239120483f, -0.06385858356952667f, -0.015664802864193916f, -0.991095781326294f, 0.02170383930206299f, -0.9218844771385193f, 0.5157042741775513f, -0.1032189354300499f, 0.03985841944813728f, -0.8911903500556946f, 0.8037576079368591f, 0.6923139095306396f, 0.8615239262580872f, 2.227385997772217f, -0.052519381046295166f, 1.2034028768539429f, -0.12382780760526657f, 0.3940872848033905f, 0.36533743143081665f, 0.2645917534828186f, 0.6582561731338501f, -0.3039363920688629f, 0.04093228280544281f, 0.5353096723556519f, 1.7478538751602173f, -0.8423566818237305f, -1.8061326742172241f, -0.4840855002403259f, 0.08992843329906464f, 0.17497709393501282f, 0.09221778810024261f, 1.1827901601791382f, 0.9760497808456421f, -0.049267906695604324f, -0.4695471227169037f, -0.34600886702537537f, -0.3563041388988495f, -0.225599467754364f, -1.5726505517959595f, -0.461040735244751f, -0.4248800277709961f, -0.18888038396835327f, -0.25429999828338623f, 0.672007143497467f, -0.5319433808326721f, -0.43857771158218384f, 0.5419387817382812f, -0.23531484603881836f, 0.21645472943782806f, 0.6693357229232788f, 0.4219695031642914f, 0.2501624524593353f, -0.19644156098365784f, 0.6818941235542297f, 0.1755499392747879f, -0.5048527717590332f, -0.150809183716774f, -1.2181293964385986f, -0.9615559577941895f, -1.8829079866409302f, -0.6799314022064209f, 1.3355454206466675f, -0.5564888119697571f, 0.7875407934188843f, -0.0034498542081564665f, -0.7005488276481628f, 1.3382794857025146f, 0.5822058320045471f, -1.751800537109375f, 1.0414022207260132f, -1.0747915506362915f, -0.17791394889354706f, 0.6681134104728699f, -0.2998531460762024f, 1.1189440488815308f, 0.7612637877464294f, -1.5768755674362183f, -0.4724341630935669f, 0.2820737361907959f, -0.574998676776886f, -0.21627651154994965f, 0.7997848987579346f, 0.31678131222724915f, -0.920619010925293f, 0.17460636794567108f, -0.6122696399688721f, -1.2151923179626465f, -1.1300559043884277f, 0.2869555354118347f, -0.028113706037402153f, 0.005431808531284332f, -1.1462090015411377f, -0.18392954766750336f, -1.0371675491333008f, -0.9263938069343567f, -0.1651267558336258f, -1.3833904266357422f, 0.6692672371864319f, 2.4868829250335693f, 0.4588232636451721f, -1.042903184890747f, -0.2711855173110962f, -1.5554379224777222f, -0.37761637568473816f, 0.5073139071464539f, 0.5893847942352295f, -1.031742811203003f, 0.2991456389427185f, 1.1564080715179443f, 1.7550915479660034f, -0.7007948756217957f, -0.8641999959945679f, 0.05441587045788765f, -2.9280900955200195f, -0.531033992767334f, -0.2709749639034271f, -0.45934197306632996f, -1.5838732719421387f, -0.24555110931396484f, -0.7766086459159851f, 0.7574830651283264f, -0.9184747934341431f, -0.28234511613845825f, -0.2329479306936264f, 0.5675714015960693f, -2.5459046363830566f, -0.34062492847442627f, 0.7596151232719421f, -0.3616882264614105f, -1.5269370079040527f, 0.3265981674194336f, 0.336686909198761f, -0.2704893946647644f, -1.1597957611083984f, -0.740675151348114f, -0.3137564957141876f, -0.875532865524292f, -1.9201782941818237f, -0.7692868113517761f, -0.06174393370747566f, -0.5070600509643555f, -0.07557284086942673f, 0.08365797996520996f, 0.8965755105018616f, 2.203824043273926f, 0.7317788600921631f, -1.4043285846710205f, -2.656944990158081f, -0.09446217119693756f, 0.07138843834400177f, -1.1618733406066895f, 0.27203214168548584f, -0.7669395804405212f, 0.4026697278022766f, -0.3255181610584259f, 0.3974625766277313f, -1.7431951761245728f, -0.438466876745224f, -0.14859600365161896f, -1.4248747825622559f, 1.882338285446167f, -0.5407733917236328f, 1.3899717330932617f, -0.6643421053886414f, -0.22997115552425385f, 1.1839019060134888f, 0.30382683873176575f, 0.19205434620380402f, 0.2659434378147125f, -1.36615788936615f, -0.3895534873008728f, -0.9564456343650818f, 0.19741365313529968f, -0.543998122215271f, -0.04405912011861801f, -0.0772925615310669f, -0.03637038543820381f, -0.03474712371826172f, -0.6523780822753906f, -1.0540027618408203f, -0.6643562912940979f, 1.0715383291244507f, 0.37416180968284607f, 0.5869553685188293f, 1.3799679279327393f, -1.1794309616088867f, 0.5099524259567261f, -1.0750740766525269f, -0.33433258533477783f, 0.4842398464679718f, 1.6143453121185303f, -0.7821649312973022f, -0.09479625523090363f, 1.1562367677688599f, -1.4898080825805664f, 0.3621129095554352f, -0.3082781434059143f, -0.8816949725151062f, 0.14663082361221313f, 0.5949258804321289f, -0.9120997786521912f, 0.37998977303504944f, 0.17336998879909515f, -1.2418133020401f, 1.553412914276123f};
+float32_t testInputVector1[] ={1.089902639389038f, -0.8599267601966858f, -0.5866308808326721f, 0.7707802057266235f, -0.495449036359787f, -1.8397185802459717f, 1.0488821268081665f, 0.00878142286092043f, 1.9070261716842651f, 0.3574671149253845f, 0.19099248945713043f, 2.8745005130767822f, -0.17186734080314636f, -0.9518157839775085f, 0.22919797897338867f, 1.135754942893982f, -1.1651201248168945f, -0.9082651138305664f, 0.44977709650993347f, -3.197345495223999f, -1.0926786661148071f, 0.7954840660095215f, -0.5867398977279663f, -1.6264830827713013f, 1.9255666732788086f, -1.410535216331482f, -0.5233655571937561f, -0.3727315068244934f, 0.08314439654350281f, -0.3695051968097687f, -0.0809650793671608f, 0.05749458074569702f, -0.08667642623186111f, 0.0932738408446312f, -2.3789258003234863f, 0.4410646855831146f, -1.4044567346572876f, -2.1666455268859863f, 1.381347894668579f, -1.285515308380127f, 0.17986910045146942f, -0.7725614905357361f, -0.6784662008285522f, 0.48365476727485657f, -1.048224925994873f, 0.37267428636550903f, 0.3806924819946289f, 1.1644479036331177f, -0.33621323108673096f, 1.0465822219848633f, 1.720694661140442f, 1.5866823196411133f, 0.5860769748687744f, 0.44916605949401855f, 2.849454879760742f, 2.2321760654449463f, -0.7666172981262207f, 0.9236090183258057f, 0.601959228515625f, 0.07226745784282684f, 0.1533122956752777f, 0.48778510093688965f, 0.9373584985733032f, 0.2187698632478714f, 0.33979371190071106f, 1.39214026927948f, 0.3177202343940735f, 0.5450224876403809f, 0.9902300834655762f, 1.6332623958587646f, 1.2270408868789673f, 0.3772149384021759f, 0.20781545341014862f, -1.22360360622406f, 0.29206255078315735f, -1.0371698141098022f, -1.024039387702942f, 0.6505089402198792f, -0.10057718306779861f, 0.47220948338508606f, -0.6269631385803223f, 1.2012040615081787f, 0.1437721848487854f, 1.1877282857894897f, 0.6734405159950256f, 0.1652490347623825f, -0.47852739691734314f, 0.03150757774710655f, 0.8280104994773865f, 0.6976577043533325f, -1.1955846548080444f, 1.0256820917129517f, -0.21390794217586517f, 0.8152637481689453f, -0.6974882483482361f, 0.6378552913665771f, -0.7965918779373169f, 0.12935683131217957f, -0.2980298101902008f, -0.2855725586414337f, -0.5665872693061829f, -0.15357910096645355f, -1.7406346797943115f, 0.8765996694564819f, 0.9616866111755371f, -0.44277387857437134f, -1.379754662513733f, -0.6467092633247375f, 0.947614312171936f, 0.6255207657814026f, -0.3003535568714142f, 0.8972747921943665f, -1.0414807796478271f, -0.6126363277435303f, 0.4746072590351105f, -0.09591332823038101f, -0.589225709438324f, -2.512127637863159f, 0.6712163090705872f, 0.32372182607650757f, -1.742922306060791f, 0.6003257036209106f, -0.014363759197294712f, 0.2788347899913788f, 0.9451932311058044f, -0.7398868203163147f, 0.7135642170906067f, 0.6838541626930237f, 0.761515736579895f, 1.635955810546875f, 0.6587348580360413f, -0.5615577101707458f, 1.798384428024292f, -1.107312560081482f, -0.46272358298301697f, -0.9644697308540344f, -0.10276079922914505f, 1.0822192430496216f, 1.297785997390747f, 0.463517427444458f, -0.6093910932540894f, -0.5536205768585205f, -0.6031961441040039f, 0.9528406858444214f, -0.9065393209457397f, 0.8645262718200684f, -0.032594069838523865f, 0.1720510721206665f, 1.5117183923721313f, -0.4753340184688568f, 1.6617286205291748f, -1.4094526767730713f, -0.8247637152671814f, -1.578391432762146f, -0.7467818856239319f, 0.5828821063041687f, 0.7377290725708008f, 0.30677530169487f, 0.2670919597148895f, -1.1733269691467285f, -1.3268318176269531f, 0.30389001965522766f, 1.3478069305419922f, -0.3641347587108612f, -1.2685595750808716f, -1.5332804918289185f, -0.6806517243385315f, 1.5795438289642334f, -0.20773953199386597f, -1.0379433631896973f, -0.6094708442687988f, -0.4835449755191803f, 0.2656134068965912f, -0.6600164771080017f, -0.889939546585083f, -0.18801698088645935f, 0.4686703383922577f, 0.7170437574386597f, 0.5505320429801941f, -0.4574969410896301f, -1.6950770616531372f, -0.7985161542892456f, 0.2840813994407654f, -1.3336353302001953f, 0.2526192367076874f, -0.5899759531021118f, -0.58216392993927f, 1.1195069551467896f, 0.21873262524604797f, 1.3702561855316162f, -0.9392529726028442f, 1.1307412385940552f, 0.9090803861618042f, -2.9950027465820312f, -0.08827070891857147f, 1.542224407196045f, 0.7780573964118958f, -0.44132116436958313f, -0.23279039561748505f, -1.3030487298965454f, 0.20629249513149261f, -1.7931721210479736f, -1.0153067111968994f, 1.1191643476486206f, -0.02056504413485527f, -0.3634260594844818f, -0.10591112077236176f, 2.741894006729126f, 1.0351879596710205f, -0.7756413817405701f, 1.6667497158050537f, -0.08879493921995163f, 0.7397169470787048f, -0.5866304636001587f, -0.9378559589385986f, 0.8019126653671265f, -0.7688867449760437f, -0.7813181281089783f, 0.897834300994873f, -1.1620690822601318f, -1.4192520380020142f, 0.5450543761253357f, -1.9598816633224487f, -0.7517256736755371f, -0.3656461238861084f, -1.3453069925308228f, -1.117390513420105f, 0.6658729314804077f, 0.2924530804157257f, -0.9457114934921265f, 0.5294855833053589f, 1.5192784070968628f, -1.2824177742004395f, 0.061255794018507004f, 1.9766513109207153f, 0.6111598610877991f, 0.8133851289749146f, -0.2001526653766632f, -0.7979637384414673f, 1.1433717012405396f, 0.6537249684333801f, -0.05152318626642227f, -0.4653357267379761f, -1.747725248336792f, 0.15590623021125793f, -0.6917127370834351f, -0.13185426592826843f, 0.670975387096405f, 0.8200027346611023f, 0.7190009951591492f, 2.2550642490386963f, 1.1651185750961304f, -0.7460781931877136f, -0.8183019161224365f, 2.328150749206543f, -0.6633261442184448f, -0.04413534328341484f, 1.7448590993881226f, 1.715315818786621f, -0.0546320304274559f, 0.24194307625293732f, -1.635109305381775f, -0.9083486795425415f, -0.3652591407299042f, -0.005660169292241335f, -0.3233204782009125f, 0.15229398012161255f, 2.192701578140259f, 0.46434086561203003f, 0.30870717763900757f, 0.0018263559322804213f, -0.17190760374069214f, 1.2329446077346802f, -0.9912614226341248f, -0.12557952105998993f, -1.0957772731781006f, 0.08712970465421677f, 0.11905032396316528f, 0.9205065369606018f, 1.1976616382598877f, 0.6630643606185913f, 1.622259259223938f, 1.5885032415390015f, 0.3153586983680725f, 0.37334686517715454f, -1.936281681060791f, 0.3202432096004486f, -0.005091554019600153f, -1.68849515914917f, -0.4313860237598419f, 0.957423985004425f, -1.238774299621582f, 1.2929511070251465f, 0.4747993052005768f, -0.22838808596134186f, -0.14232729375362396f, 0.8299270868301392f, -1.431394338607788f, 2.040761947631836f, -0.81341952085495f, -0.7652832269668579f, 1.2207682132720947f, 0.7900523543357849f, 1.3253916501998901f, 1.0459810495376587f, 0.37639594078063965f, -1.2763841152191162f, -0.47283992171287537f, 0.198439359664917f, -0.017182569950819016f, -2.0527827739715576f, 1.0444053411483765f, 1.731142520904541f, 1.4640952348709106f, -1.0178595781326294f, 0.4359667897224426f, -2.126497983932495f, 1.6900181770324707f, -1.939876914024353f, 0.41050875186920166f, 1.1625796556472778f, 1.2913217544555664f, 0.34397050738334656f, -1.4256500005722046f, -0.10117579251527786f, -0.2683184742927551f, 0.36835914850234985f, 0.987746000289917f, 0.6620408892631531f, 2.1216166019439697f, 0.6610508561134338f, -0.38881751894950867f, 1.6299796104431152f, -0.31452807784080505f, 0.2818635106086731f, 0.1807779222726822f, -2.293231248855591f, 0.27681994438171387f, 0.28943994641304016f, -0.20970505475997925f, -0.1412869691848755f, -1.2844034433364868f, 0.08246330916881561f, 1.5029255151748657f, -0.1772695630788803f, -0.522125780582428f, -0.607728898525238f, 2.017087936401367f, -1.355243444442749f, 0.8449497818946838f, 0.11141180247068405f, 1.9208964109420776f, 1.311265468597412f, -0.08831802755594254f, -1.541468620300293f, 1.4296398162841797f, 1.4580436944961548f, -1.1049020290374756f, 0.7452334761619568f, -0.8007665276527405f, -0.7761902809143066f, -1.6093133687973022f, 0.9329052567481995f, 0.27112841606140137f, 0.49449974298477173f, 1.4524749517440796f, 0.6686246395111084f, 0.5845627784729004f, 0.7492738962173462f, -1.0645718574523926f, -0.034465134143829346f, -1.2062615156173706f, -0.8999131321907043f, -0.0918164998292923f, 1.0618876218795776f, 2.058213949203491f, -1.085193157196045f, 0.1733304113149643f, -0.07091043889522552f, 0.5272356271743774f, 0.5824098587036133f, 0.3624211549758911f, -0.9671765565872192f, 0.39467543363571167f, 0.8923267126083374f, -0.513390839099884f, 1.9781649112701416f, -0.2349131852388382f, -0.633860170841217f, 0.296379029750824f, -0.2575894892215729f, -1.3671728372573853f, -0.02615678682923317f, 1.5957024097442627f, 2.0025322437286377f, -0.5670414566993713f, 0.9052746295928955f, 0.13252945244312286f, 0.2838866412639618f, 1.2673711776733398f, 0.8520715236663818f, 0.15432041883468628f, -0.9287442564964294f, -1.1239808797836304f, -0.06401810795068741f, 0.32361331582069397f, 0.5031719207763672f, 0.7819693684577942f, 0.9795851111412048f, -2.403076648712158f, 0.9034403562545776f, -1.0474478006362915f, 1.114068627357483f, 0.33664432168006897f, 0.6305598020553589f, -0.5409257411956787f, 0.2826513350009918f, -1.8672125339508057f, 1.09524667263031f, -0.33083873987197876f, -2.589080333709717f, 1.0614835023880005f, 1.6767736673355103f, -0.8761295080184937f, 1.212709903717041f, -0.7497554421424866f, -2.2665207386016846f, -0.3578924834728241f, 0.32613644003868103f, 0.13355113565921783f, 0.10359794646501541f, 0.2964228689670563f, 0.2165556699037552f, -0.2160383015871048f, -0.6013813614845276f, -0.2658008337020874f, -0.35167255997657776f, -0.30292263627052307f, -1.1029534339904785f, -0.5425943732261658f, 0.08222618699073792f, 0.3094189167022705f, -0.06402894854545593f, -0.18365991115570068f, 0.5344498753547668f, 0.8144686818122864f, 0.6800798773765564f, -1.7499090433120728f, -0.4554050862789154f, 0.7056545615196228f, 0.515397310256958f, 0.6798105835914612f, 0.31435149908065796f, -0.8535367846488953f, 1.2225645780563354f, -1.359588861465454f, 0.9857577681541443f, -0.016375131905078888f, -1.4726542234420776f, -0.3961588144302368f, 1.203751802444458f, -0.5884016752243042f, -1.2106024026870728f, -0.2887902855873108f, -0.8180749416351318f, -1.250599980354309f, 0.4375377595424652f, 0.7981722950935364f, -0.5517314076423645f, 0.5236229300498962f, -0.3870270252227783f, -0.09971413016319275f, 0.12340240925550461f, 1.4932835102081299f, 0.5075588822364807f, -0.9991130828857422f, 0.5158292651176453f, -0.2211882770061493f, -0.4663604199886322f, -0.8397613763809204f, -0.026260262355208397f, -0.06013243645429611f, -0.40218237042427063f, -1.3911473751068115f, -1.7071722745895386f, 0.12798449397087097f, 0.1782047599554062f, 2.183128595352173f, -0.17866301536560059f, 1.0214240550994873f, 1.1952037811279297f, -0.061066754162311554f, 0.07680100202560425f, -0.4298437237739563f, 1.775159239768982f, -1.508432149887085f, -0.039646148681640625f, 1.3841229677200317f, -0.1076800599694252f, -0.5709375143051147f, 0.23288263380527496f, 0.5269880294799805f, 0.5674430727958679f, 0.2816433012485504f, 0.7500911355018616f, 0.9457010626792908f, -1.106882929801941f, -0.37889182567596436f, 0.8696913123130798f, 0.48862001299858093f, 0.23460011184215546f, 0.6724789142608643f, 0.952153742313385f, -0.8580470681190491f, -1.2269444465637207f, -1.1536815166473389f, 1.858674168586731f, -1.0544326305389404f, -0.23458711802959442f, -0.1854782998561859f, 1.0310602188110352f, -1.73832106590271f, -0.03926821053028107f, 1.214388370513916f, 1.114899754524231f, 0.409311980009079f, -0.2609390914440155f, 1.7576833963394165f, -1.6719471216201782f, 0.9809852838516235f, 0.5081778764724731f, 0.5910366773605347f, 0.2658088207244873f, 0.20518015325069427f, 0.930787980556488f, -1.1530448198318481f, -1.2465519905090332f, 0.16245323419570923f, 0.05215079337358475f, 0.1636601686477661f, 1.5904330015182495f, -0.579309344291687f, 0.7513187527656555f, 0.38444769382476807f, 2.3665623664855957f, -1.402186632156372f, -0.5460070967674255f, -0.456790030002594f, 1.3206028938293457f, -0.8199185729026794f, 1.6579430103302002f, 1.5981082916259766f, 0.8656126260757446f, 0.4373760521411896f, -1.5561782121658325f, 0.1821494996547699f, -1.4306716918945312f, -0.36262640357017517f, 0.20310072600841522f, -0.30887138843536377f, 0.9508056044578552f, -0.12917613983154297f, -1.5485821962356567f, -1.060057282447815f, -1.2739083766937256f, -0.31643038988113403f, 1.2475848197937012f, 0.505746066570282f, 0.3395094573497772f, -1.2853814363479614f, 2.369163751602173f, -0.028263162821531296f, 2.41691255569458f, -0.8674214482307434f, -0.5678464770317078f, 2.5996615886688232f, -1.0749939680099487f, 0.4187058210372925f, -0.3382052779197693f, -0.8134123682975769f, 2.1610796451568604f, -1.0041310787200928f, 0.8974350094795227f, 1.104312539100647f, -1.0118014812469482f, -1.897225260734558f, -1.780639886856079f, -0.7995834946632385f, 0.22266466915607452f, 0.33544212579727173f, -0.18904657661914825f, -0.10530658811330795f, 0.9740473628044128f, 0.7681529521942139f, 0.37875422835350037f, -0.6169671416282654f, 0.777572751045227f, 0.18120968341827393f, -0.7478351593017578f, -0.5768958926200867f, 1.2286477088928223f, 1.8453819751739502f, -0.5297267436981201f, -2.078068256378174f, 0.5874637365341187f, -0.9032628536224365f, 0.7324981689453125f, -0.37595728039741516f, 2.2295985221862793f, 0.11224450170993805f, 0.9028506875038147f, -1.215053677558899f, -2.819291353225708f, 0.13533112406730652f, 0.2619630992412567f, 0.7202996611595154f, -0.5538114309310913f, -1.291838526725769f, -1.6004953384399414f, 0.5531409382820129f, 0.7102909088134766f, -0.8757583498954773f, -0.5280346274375916f, -0.7281854152679443f, -1.8952075242996216f, 0.1991156041622162f, 0.8460161089897156f, -0.2233497053384781f, -1.422472357749939f, -0.1983218789100647f, 1.3644226789474487f, 2.129906177520752f, 0.26909714937210083f, -0.7889410257339478f, -1.9855754375457764f, -1.545936107635498f, -0.08888754993677139f, 0.2257654368877411f, 0.25663992762565613f, -0.2629774510860443f, -1.5432220697402954f, -1.5764559507369995f, 0.1473243683576584f, -0.8245678544044495f, 1.304835557937622f, -1.45891273021698f, 1.6870979070663452f, -0.6664961576461792f, 0.22318899631500244f, 0.22316193580627441f, -0.34400755167007446f, -2.0134828090667725f, -0.48239538073539734f, 1.5224602222442627f, -1.280793309211731f, -1.842109203338623f, -0.2188735008239746f, -0.41238707304000854f, -1.2928417921066284f, -0.7525727152824402f, -0.4810790717601776f, -0.4128744602203369f, 0.16277381777763367f, 0.7066632509231567f, 0.38707491755485535f, 0.34174874424934387f, 1.6801429986953735f, 1.0953031778335571f, -2.9128401279449463f, -0.3631618320941925f, -1.5765502452850342f, -0.6891364455223083f, 0.7710738778114319f, -0.20118612051010132f, -0.4283892512321472f, 1.3169715404510498f, -1.5037779808044434f, -0.09381435066461563f, 0.548758864402771f, 0.02413470484316349f, -1.1632752418518066f, -0.022567562758922577f, 0.8075121641159058f, 0.3572499752044678f, 0.3176914155483246f, 0.30744802951812744f, 0.13519169390201569f, -1.2412607669830322f, -0.3091021776199341f, 0.4308376908302307f, -3.114509105682373f, 0.7571779489517212f, 0.33742445707321167f, -1.0841797590255737f, -0.746350109577179f, -0.20384129881858826f, 0.4134349524974823f, -0.37402665615081787f, 1.1670031547546387f, 0.413125604391098f, -0.7865713834762573f, -0.4711819291114807f, 0.22757962346076965f, 0.7283740043640137f, 0.680015504360199f, -0.097593754529953f, 0.14949505031108856f, -0.025101041421294212f, 0.8219899535179138f, -0.9862444996833801f, 0.6028426885604858f, -1.8524030447006226f, 0.45103296637535095f, 0.25621283054351807f, -0.0003741519176401198f, -2.1326093673706055f, 1.5667240619659424f, 0.8984111547470093f, 0.025448333472013474f, 0.458707332611084f, -0.9393821358680725f, 0.5122731328010559f, 1.5600872039794922f, -1.1780855655670166f, 2.6927573680877686f, -0.43692895770072937f, 0.8274078965187073f, -0.8261107802391052f, 0.3904056251049042f, -1.2739393711090088f, -0.6589940190315247f, -0.22857728600502014f, -0.6558216214179993f, -0.24142996966838837f, 0.9759528636932373f, -1.2770851850509644f, -1.1957532167434692f, 0.047059256583452225f, -0.5641896724700928f, -1.0037490129470825f, 0.13203279674053192f, -0.56436687707901f, 0.3361401855945587f, -0.03976007178425789f, -0.20121490955352783f, -0.0682399570941925f, 1.0232404470443726f, 1.314104437828064f, -0.1596042960882187f, -1.0299675464630127f, -1.5112916231155396f, -2.2335782051086426f, -1.175955891609192f, -0.8523197174072266f, -0.05253554880619049f, -1.880538821220398f, 1.429691195487976f, 1.0635557174682617f, 1.2451703548431396f, -0.5128902196884155f, 0.24400125443935394f, -0.947364330291748f, 1.5498095750808716f, -1.2130250930786133f, -0.5136253237724304f, 1.4234158992767334f, 2.489812135696411f, -0.09172648191452026f, -0.4142342209815979f, -2.507132053375244f, 1.7104519605636597f, 0.3081821799278259f, -1.8839408159255981f, 0.8713569045066833f, 0.6138812899589539f, -0.3543996214866638f, -0.5578363537788391f, 0.7301253080368042f, 0.2339453399181366f, 0.4868336319923401f, 1.2264947891235352f, 1.1931899785995483f, 0.7605131268501282f, 0.5852847099304199f, -1.2781847715377808f, -1.1154592037200928f, 0.8185226917266846f, 0.6472027897834778f, 0.5181817412376404f, 0.840347170829773f, -0.5540033578872681f, 0.5649234056472778f, -0.98888099193573f, 0.06238013878464699f, 0.9293259382247925f, -0.6768644452095032f, 1.952907919883728f, 1.1340794563293457f, 1.3721071481704712f, -0.21115639805793762f, -1.3889493942260742f, -0.6985898017883301f, 0.5516669750213623f, -0.2790030241012573f, 0.7213651537895203f, 0.15045492351055145f, -0.5897537469863892f, 0.9342153072357178f, 1.3517446517944336f, -0.7321491837501526f, 0.5119076371192932f, 0.1565941721200943f, 0.2808796465396881f, -0.10410746186971664f, -1.2526813745498657f, 1.4095237255096436f, -1.043591856956482f, -0.8706263303756714f, 0.6562705636024475f, 0.17987479269504547f, -0.7960370182991028f, -0.6575473546981812f, -0.1586974859237671f, -0.4360821843147278f, 0.6465263366699219f, -1.1642191410064697f, 0.3633206784725189f, 1.5305348634719849f, 0.20136219263076782f, -0.8882933855056763f, -0.7230384945869446f, 0.04366447776556015f, -0.6242141127586365f, 1.2346022129058838f, -1.8403836488723755f, 1.6389628648757935f, -2.0249898433685303f, -0.04100887477397919f, -1.0829721689224243f, 0.8201832175254822f, -0.7740336656570435f, -1.1330678462982178f, -0.3400249779224396f, -0.41100871562957764f, -1.9350301027297974f, 0.45451614260673523f, -2.392625570297241f, 1.1763373613357544f, -0.3300648629665375f, 0.9530068039894104f, -0.6005581617355347f, -0.7931070923805237f, 0.6517481207847595f, -0.5841397643089294f, -1.547606110572815f, -0.08707687258720398f, -1.3770695924758911f, -0.012907221913337708f, 1.3789395093917847f, 0.9626683592796326f, 0.00185173109639436f, -0.16571873426437378f, -0.31678539514541626f, -0.6375454068183899f, 0.35507386922836304f, -0.1578850895166397f, -0.3816991448402405f, 0.27004775404930115f, -2.0183768272399902f, 1.9564801454544067f, 0.630133867263794f, -1.3937633037567139f, 0.11504650861024857f, -1.1290851831436157f, -0.5392683148384094f, -0.8951094150543213f, 1.0918608903884888f, -1.9207334518432617f, -0.3543933928012848f, -1.649062991142273f, -0.020449621602892876f, -0.31770801544189453f, -1.4067199230194092f, 1.4397344589233398f, 1.5634429454803467f, -0.5641825199127197f, 0.5219281911849976f, -0.14880667626857758f, 0.24344070255756378f, 1.5321309566497803f, -0.2686406075954437f, 1.7921674251556396f, -0.288194864988327f, -0.09355393797159195f, 1.8893173933029175f, 0.275217205286026f, -2.0319416522979736f, 0.2248028814792633f, -1.281853199005127f, -1.6626029014587402f, -0.942642867565155f, 0.3260803818702698f, -1.1133676767349243f, -1.4012584686279297f, -0.37976154685020447f, 0.40461063385009766f, -0.6963782906532288f, -1.3064364194869995f, -2.1726925373077393f, -0.7762024998664856f, 0.8443084359169006f, 1.0020902156829834f, 0.7898114323616028f, -0.1752912402153015f, 0.12935137748718262f, 1.2677034139633179f, -0.8686774373054504f, 0.36407557129859924f, -1.870896339416504f, 0.6822976469993591f, -0.451043039560318f, -1.155631422996521f, 0.7728339433670044f, -1.1112349033355713f, -0.8672816753387451f, 1.5368183851242065f, -1.046025037765503f, -0.6560050249099731f, -0.6832544803619385f, 0.7848009467124939f, -1.835911750793457f, 1.250395655632019f, -0.24335385859012604f, -0.31686636805534363f, -0.8966814279556274f, -0.14545132219791412f, 1.4703935384750366f, 0.2128523886203766f, -0.9325401782989502f, -0.3473551571369171f, 0.5344530940055847f, 0.08532506972551346f, -0.2573105990886688f, 0.6045728921890259f, 0.3610866963863373f, -1.0777159929275513f, -1.9149163961410522f, 0.5004882216453552f, 1.857444167137146f, -0.8207314014434814f, -0.14101171493530273f, 1.354081392288208f, 1.7396339178085327f, 0.06523589044809341f, 1.2497252225875854f, 0.750633955001831f, -0.5558157563209534f, -2.0188117027282715f, -0.9094275832176208f, 0.3692293167114258f, 0.4192548394203186f, -0.5022445321083069f, -0.8576999306678772f, -1.600305199623108f, -1.6803337335586548f, -0.12212011963129044f, -1.5747339725494385f, -0.015105989761650562f, -0.7979808449745178f, -0.42616453766822815f, 2.1253676414489746f, 0.04826252907514572f, -0.34355291724205017f, -0.17333583533763885f, -1.473657250404358f, 1.3391492366790771f, 0.8478164076805115f, -0.5319951176643372f, 0.22928817570209503f, -0.6715777516365051f, 0.39628124237060547f, -1.342972755432129f, 0.26747071743011475f, 1.501269817352295f, 0.4462812840938568f, -0.5900893807411194f, 0.9497699737548828f, 1.9505430459976196f, 0.7309340238571167f, 0.09723401069641113f, -0.8022183179855347f, 0.43563902378082275f, 1.9222667217254639f, -2.0168802738189697f, 0.9772894382476807f, 0.14779187738895416f, 1.5133566856384277f, -0.1279350221157074f, -2.163722515106201f, 1.9914374351501465f, -1.159382939338684f, 0.8003202080726624f, -0.1275702863931656f, -0.03958629444241524f, 0.1376238614320755f, -0.545866072177887f, 0.18658386170864105f, 0.3076750338077545f, 0.8016005754470825f, 0.12502151727676392f, 0.318692147731781f, 1.3281844854354858f, -0.9020218253135681f, 0.07014389336109161f, 0.47831252217292786f, 1.0354363918304443f, -0.06358214467763901f, 0.09934888780117035f, -0.3449469208717346f, 1.2402560710906982f, -0.3211720585823059f, 0.6852926015853882f, -0.10187509655952454f, 0.030844714492559433f};
+void* testInputVector[2] = {testInputVector0, testInputVector1};
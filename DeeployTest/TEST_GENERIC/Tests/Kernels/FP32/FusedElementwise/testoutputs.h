@@ -0,0 +1,4 @@
+#define OUTPUTTYPE float32_t
+#define ISOUTPUTFLOAT 1
+float32_t testOutputVector0[] ={1.089902639389038f, -0.8599267601966858f, -0.3179504871368408f, 1.3549020290374756f, -0.495449036359787f, -1.0936217308044434f, 1.0488821268081665f, 0.24740156531333923f, 2.421626329421997f, 0.4673383831977844f, 0.19099248945713043f, 2.8745005130767822f, -0.17186734080314636f, -0.7788531184196472f, 0.22919797897338867f, 1.135754942893982f, -1.1651201248168945f, -0.5749772191047668f, 0.619971752166748f, -2.956794023513794f, -1.0926786661148071f, 0.7954840660095215f, -0.1318870484828949f, -0.8169023990631104f, 1.9255666732788086f, -0.5907082557678223f, 0.2124372124671936f, 0.08078929781913757f, 0.27823731303215027f, -0.3695051968097687f, 0.7109103798866272f, 1.1004889011383057f, 0.8770061135292053f, 0.8136908411979675f, -2.1373705863952637f, 0.4410646855831146f, -1.3438186645507812f, -1.775542974472046f, 1.381347894668579f, -1.025089144706726f, 0.4576660394668579f, -0.3616750240325928f, -0.6784662008285522f, 0.48365476727485657f, -1.048224925994873f, 0.37267428636550903f, 1.3132414817810059f, 1.1644479036331177f, -0.10886330902576447f, 1.0465822219848633f, 2.57529616355896f, 2.309727907180786f, 0.965618371963501f, 0.44916605949401855f, 2.9383344650268555f, 2.6368842124938965f, -0.20177137851715088f, 0.9236090183258057f, 1.5758299827575684f, 0.07226745784282684f, 0.1533122956752777f, 1.0181752443313599f, 1.0247509479522705f, 1.2828313112258911f, 0.368000864982605f, 1.39214026927948f, 0.3177202343940735f, 0.5450224876403809f, 0.9902300834655762f, 1.882415771484375f, 1.4515713453292847f, 0.9584418535232544f, 0.20781545341014862f, -0.445102334022522f, 0.29206255078315735f, -0.31601810455322266f, -1.024039387702942f, 0.6505089402198792f, -0.04173692315816879f, 0.9218835830688477f, -0.6125108003616333f, 1.2012040615081787f, 0.1437721848487854f, 1.1877282857894897f, 0.8587294816970825f, 0.5940530896186829f, -0.47852739691734314f, 0.03150757774710655f, 1.198479175567627f, 0.6976577043533325f, -1.1955846548080444f, 1.2701386213302612f, -0.21390794217586517f, 0.9423961043357849f, -0.6974882483482361f, 0.6378552913665771f, -0.7965918779373169f, 0.1643615961074829f, -0.016996264457702637f, -0.2855725586414337f, 0.0778512954711914f, 0.14341534674167633f, -1.384820818901062f, 1.3929791450500488f, 1.2894282341003418f, -0.08678698539733887f, -1.379754662513733f, -0.6467092633247375f, 0.947614312171936f, 0.6255207657814026f, -0.3003535568714142f, 0.9604487419128418f, -1.0414807796478271f, -0.6126363277435303f, 0.4746072590351105f, -0.02775721251964569f, -0.4759421646595001f, -1.9169514179229736f, 0.6712163090705872f, 0.7785892486572266f, -1.1078423261642456f, 1.109356164932251f, -0.014363759197294712f, 0.8271242380142212f, 1.0489507913589478f, -0.5940535664558411f, 0.8331254720687866f, 0.8091803193092346f, 1.241434097290039f, 1.7767105102539062f, 0.6587348580360413f, -0.2958037555217743f, 1.798384428024292f, -0.24701952934265137f, -0.2868955135345459f, -0.6025207042694092f, -0.10276079922914505f, 1.1471192836761475f, 1.6122307777404785f, 0.463517427444458f, -0.13883721828460693f, -0.28644537925720215f, -0.6031961441040039f, 0.9528406858444214f, -0.32980191707611084f, 1.0359455347061157f, 0.022613033652305603f, 0.37418508529663086f, 2.7401676177978516f, -0.180023193359375f, 2.025249481201172f, -1.4094526767730713f, 0.31911712884902954f, -0.799436092376709f, 0.10689681768417358f, 0.9269298315048218f, 1.5162677764892578f, 0.8124600648880005f, 0.8938978910446167f, -0.9292120933532715f, -1.3268318176269531f, 1.1385284662246704f, 1.3478069305419922f, -0.1638917624950409f, -1.0506094694137573f, -1.5332804918289185f, -0.053878843784332275f, 1.7995903491973877f, -0.10596238076686859f, -0.457811176776886f, -0.5275490283966064f, 0.5311564207077026f, 0.7615522146224976f, -0.5769716501235962f, -0.889939546585083f, -0.18801698088645935f, 1.3322970867156982f, 1.0119531154632568f, 0.7291808128356934f, 0.6843401789665222f, -1.6950770616531372f, -0.7711337208747864f, 0.3679988980293274f, -0.7202553749084473f, 0.2526192367076874f, -0.576473593711853f, -0.58216392993927f, 1.80439293384552f, 0.9420136213302612f, 1.4522790908813477f, -0.5373716950416565f, 1.1307412385940552f, 0.9090803861618042f, -2.25357723236084f, 0.03204470872879028f, 2.7498562335968018f, 0.7780573964118958f, -0.09872889518737793f, -0.23279039561748505f, -0.9676897525787354f, 0.2551368772983551f, -1.7931721210479736f, -1.0153067111968994f, 2.7046327590942383f, -0.006787516176700592f, -0.3634260594844818f, -0.10591112077236176f, 3.133363962173462f, 1.0351879596710205f, -0.04296821355819702f, 2.2203989028930664f, -0.08879493921995163f, 0.7397169470787048f, -0.5866304636001587f, -0.9378559589385986f, 0.8019126653671265f, -0.11423856019973755f, 0.0664823055267334f, 0.897834300994873f, -1.1620690822601318f, -1.4192520380020142f, 0.5450543761253357f, -1.9598816633224487f, -0.7517256736755371f, 0.33526164293289185f, -1.3453069925308228f, -0.637648344039917f, 0.6658729314804077f, 1.2252367734909058f, -0.7936524152755737f, 0.5294855833053589f, 2.847940444946289f, -1.2824177742004395f, 0.061255794018507004f, 2.130056381225586f, 0.6441923975944519f, 1.3989975452423096f, -0.2001526653766632f, -0.3431552052497864f, 1.6221959590911865f, 0.6537249684333801f, 0.08254887908697128f, -0.4653357267379761f, -0.5223711729049683f, 0.15590623021125793f, -0.6917127370834351f, -0.13185426592826843f, 0.670975387096405f, 0.8695147633552551f, 1.1553456783294678f, 2.2550642490386963f, 1.1651185750961304f, -0.7460781931877136f, -0.8183019161224365f, 3.758504629135132f, -0.09025448560714722f, -0.04413534328341484f, 1.7448590993881226f, 1.715315818786621f, -0.0546320304274559f, 0.24194307625293732f, -1.635109305381775f, -0.9083486795425415f, 0.0780954360961914f, -0.005660169292241335f, -0.3233204782009125f, 0.15229398012161255f, 2.192701578140259f, 0.46434086561203003f, 0.30870717763900757f, 0.0018263559322804213f, -0.17190760374069214f, 1.2329446077346802f, -0.8929452896118164f, -0.12557952105998993f, -1.0957772731781006f, 0.13922104239463806f, 0.2284000813961029f, 0.9205065369606018f, 1.2110257148742676f, 0.6630643606185913f, 1.622259259223938f, 1.5885032415390015f, 0.46397122740745544f, 0.707141637802124f, -1.8855798244476318f, 0.33157849311828613f, -0.005091554019600153f, -1.68849515914917f, -0.4313860237598419f, 0.957423985004425f, -1.238774299621582f, 1.2929511070251465f, 0.4747993052005768f, -0.22838808596134186f, -0.14232729375362396f, 1.176969289779663f, -1.431394338607788f, 2.2880048751831055f, -0.81341952085495f, -0.7652832269668579f, 1.2207682132720947f, 0.7900523543357849f, 1.3950891494750977f, 1.0459810495376587f, 0.37639594078063965f, -1.2763841152191162f, -0.47283992171287537f, 0.40929746627807617f, -0.017182569950819016f, -2.0527827739715576f, 1.0444053411483765f, 1.731142520904541f, 1.4640952348709106f, -1.0178595781326294f, 0.4359667897224426f, -2.072237491607666f, 1.6900181770324707f, -1.939876914024353f, 0.41050875186920166f, 1.503557801246643f, 1.2913217544555664f, 1.1193451881408691f, -1.4256500005722046f, -0.10117579251527786f, 0.03031209111213684f, 1.2805777788162231f, 1.3076066970825195f, 0.7188841700553894f, 2.1216166019439697f, 0.7462100386619568f, -0.2179584950208664f, 2.6560616493225098f, 0.1773320734500885f, 0.2818635106086731f, 1.3749650716781616f, -2.293231248855591f, 0.27681994438171387f, 1.207648754119873f, -0.05378539860248566f, -0.1412869691848755f, -0.9942129254341125f, 0.6857052445411682f, 2.1803910732269287f, -0.1772695630788803f, 0.65791255235672f, 0.046499431133270264f, 2.017087936401367f, -1.355243444442749f, 0.8449497818946838f, 0.3538985550403595f, 1.9208964109420776f, 1.311265468597412f, 0.4981066882610321f, -1.1783874034881592f, 1.4296398162841797f, 2.005964994430542f, -0.24041521549224854f, 0.7452334761619568f, -0.8007665276527405f, -0.12408185005187988f, -1.0690455436706543f, 1.2270522117614746f, 1.0331366062164307f, 0.49449974298477173f, 1.4524749517440796f, 0.6686246395111084f, 0.8266323804855347f, 0.7492738962173462f, -1.0645718574523926f, -0.034465134143829346f, -1.2062615156173706f, -0.8999131321907043f, 0.27271413803100586f, 1.6401307582855225f, 2.058213949203491f, -1.008028507232666f, 0.1733304113149643f, 0.37551265954971313f, 0.7525612115859985f, 1.5602858066558838f, 0.3624211549758911f, -0.6051278114318848f, 0.7974686622619629f, 1.3641066551208496f, 0.43037623167037964f, 1.9781649112701416f, 1.4764882326126099f, -0.633860170841217f, 1.40828275680542f, -0.16615083813667297f, -0.1397312879562378f, 0.4334562122821808f, 2.326913833618164f, 2.681204080581665f, 0.6353256106376648f, 1.3965009450912476f, 0.13252945244312286f, 0.5558573007583618f, 2.0112273693084717f, 1.2838374376296997f, 1.1912307739257812f, 0.23091918230056763f, -0.5458667874336243f, -0.06401810795068741f, 1.6676958799362183f, 1.6966986656188965f, 1.2843737602233887f, 2.685729503631592f, -1.9255143404006958f, 0.9868804812431335f, -0.4733844995498657f, 2.304985523223877f, 0.5199176073074341f, 2.2581725120544434f, -0.33718883991241455f, 1.4118624925613403f, -0.9429813623428345f, 1.6702182292938232f, 0.8614277243614197f, -2.589080333709717f, 2.3922696113586426f, 2.296931743621826f, -0.49534711241722107f, 2.2392969131469727f, 0.4321940541267395f, -1.2296230792999268f, 1.2938594818115234f, 1.518499493598938f, 1.4273045063018799f, 0.4856659770011902f, 1.0016847848892212f, 1.150046944618225f, 0.427090585231781f, 0.20143628120422363f, 0.5992515683174133f, 0.7224494218826294f, 0.2982729375362396f, -0.6258530616760254f, -0.3047522008419037f, 0.28836002945899963f, 1.5476446151733398f, 0.5457103252410889f, 0.8618122339248657f, 0.5377679467201233f, 0.8144686818122864f, 0.8075342774391174f, -0.5245956182479858f, 0.5521740913391113f, 1.3452143669128418f, 0.5878527164459229f, 1.0879497528076172f, 0.6390117406845093f, -0.5524829626083374f, 1.2225645780563354f, -1.3150115013122559f, 1.364243745803833f, 1.2153791189193726f, -0.9187421798706055f, 0.7778258323669434f, 1.4804388284683228f, -0.24120548367500305f, -1.2106024026870728f, 0.41641539335250854f, -0.07098662853240967f, 0.10482001304626465f, 0.6676976680755615f, 1.3187898397445679f, -0.4309549033641815f, 0.5236229300498962f, -0.27004051208496094f, 0.20132708549499512f, 1.2746617794036865f, 1.9679298400878906f, 0.5858269929885864f, -0.4546337127685547f, 1.0981554985046387f, -0.08576381206512451f, 0.5787968635559082f, -0.8397613763809204f, 0.3405079245567322f, 0.7459411025047302f, -0.40218237042427063f, -0.7369800209999084f, -0.587185263633728f, 0.8283606767654419f, 0.1782047599554062f, 2.292571544647217f, 0.9110291004180908f, 1.644132137298584f, 1.6638147830963135f, 0.6330740451812744f, 0.9108659625053406f, -0.31053584814071655f, 2.1034996509552f, -0.9634348154067993f, 0.16191548109054565f, 1.7909376621246338f, 1.014796257019043f, -0.5709375143051147f, 1.6697543859481812f, 1.940200686454773f, 0.5674430727958679f, 0.684672474861145f, 1.394977331161499f, 1.0388059616088867f, -1.003882646560669f, -0.024059176445007324f, 1.7128207683563232f, 0.706493616104126f, 1.6214873790740967f, 1.291006326675415f, 0.952153742313385f, -0.48528486490249634f, -1.2269444465637207f, -1.1536815166473389f, 1.858674168586731f, -0.49930745363235474f, -0.1805439442396164f, -0.1854782998561859f, 1.0310602188110352f, -1.73832106590271f, -0.03926821053028107f, 1.214388370513916f, 1.114899754524231f, 0.409311980009079f, 0.028433889150619507f, 1.7576833963394165f, -1.620805025100708f, 0.9809852838516235f, 0.5081778764724731f, 0.5910366773605347f, 0.34506428241729736f, 0.20518015325069427f, 0.9809598326683044f, -1.1530448198318481f, -1.2465519905090332f, 0.16245323419570923f, 0.05215079337358475f, 0.1636601686477661f, 1.5904330015182495f, -0.579309344291687f, 0.8786544799804688f, 0.38444769382476807f, 2.3665623664855957f, -1.402186632156372f, -0.5460070967674255f, -0.05470287799835205f, 1.3206028938293457f, -0.8199185729026794f, 1.9928650856018066f, 1.5981082916259766f, 1.0480270385742188f, 0.4373760521411896f, -1.5225211381912231f, 0.1821494996547699f, -1.2453336715698242f, -0.36262640357017517f, 0.20310072600841522f, -0.026373207569122314f, 0.9508056044578552f, -0.12917613983154297f, -1.5485821962356567f, -1.060057282447815f, -0.9598053097724915f, -0.31643038988113403f, 1.2475848197937012f, 0.505746066570282f, 0.3395094573497772f, -1.2853814363479614f, 2.369163751602173f, -0.028263162821531296f, 2.41691255569458f, -0.8674214482307434f, -0.5678464770317078f, 2.5996615886688232f, -1.0749939680099487f, 0.4187058210372925f, -0.3382052779197693f, -0.8134123682975769f, 2.1610796451568604f, -1.0041310787200928f, 0.8974350094795227f, 1.104312539100647f, -1.0118014812469482f, -1.897225260734558f, -1.780639886856079f, -0.2935439348220825f, 0.22266466915607452f, 0.33544212579727173f, -0.18904657661914825f, -0.10530658811330795f, 0.9740473628044128f, 0.7681529521942139f, 0.37875422835350037f, -0.6169671416282654f, 0.777572751045227f, 0.18120968341827393f, -0.7478351593017578f, -0.5768958926200867f, 1.2286477088928223f, 1.8453819751739502f, -0.5297267436981201f, -1.9322400093078613f, 0.8615430593490601f, -0.9032628536224365f, 0.7324981689453125f, -0.37595728039741516f, 2.2295985221862793f, 0.11224450170993805f, 0.9028506875038147f, -1.215053677558899f, -2.819291353225708f, 0.13533112406730652f, 0.2619630992412567f, 0.7202996611595154f, -0.5538114309310913f, -1.291838526725769f, -1.6004953384399414f, 0.5531409382820129f, 0.9440616965293884f, -0.8757583498954773f, -0.5280346274375916f, -0.7281854152679443f, -1.8952075242996216f, 0.1991156041622162f, 0.8460161089897156f, -0.2233497053384781f, -1.422472357749939f, -0.1983218789100647f, 1.3644226789474487f, 2.129906177520752f, 0.26909714937210083f, -0.6966673731803894f, -1.9855754375457764f, -1.545936107635498f, -0.03964362293481827f, 0.2257654368877411f, 0.25663992762565613f, -0.2629774510860443f, -1.4808176755905151f, -1.5764559507369995f, 0.1473243683576584f, -0.8245678544044495f, 1.304835557937622f, -1.3869906663894653f, 2.571302890777588f, -0.6664961576461792f, 0.22318899631500244f, 0.4715977907180786f, -0.34400755167007446f, -1.744575023651123f, -0.48239538073539734f, 1.5224602222442627f, -1.280793309211731f, -1.842109203338623f, -0.2188735008239746f, -0.41238707304000854f, -1.2928417921066284f, -0.3645879626274109f, -0.4810790717601776f, -0.4128744602203369f, 0.16277381777763367f, 0.7066632509231567f, 0.38707491755485535f, 0.34174874424934387f, 2.0207598209381104f, 1.0953031778335571f, -2.7993268966674805f, -0.3631618320941925f, -1.1998248100280762f, -0.6891364455223083f, 0.7710738778114319f, -0.20118612051010132f, -0.4283892512321472f, 1.3169715404510498f, -1.5037779808044434f, 0.4098098576068878f, 0.8874636292457581f, 0.02413470484316349f, -1.1632752418518066f, 0.18409812450408936f, 0.8075121641159058f, 0.3572499752044678f, 0.6388257741928101f, 0.30744802951812744f, 0.13519169390201569f, -1.2412607669830322f, -0.3091021776199341f, 0.4308376908302307f, -3.114509105682373f, 0.7571779489517212f, 0.33742445707321167f, -1.0841797590255737f, -0.746350109577179f, -0.20384129881858826f, 0.7278397083282471f, -0.37402665615081787f, 1.1670031547546387f, 0.413125604391098f, -0.7865713834762573f, -0.3686869144439697f, 0.22757962346076965f, 0.8755730390548706f, 0.9210318326950073f, 0.0943269282579422f, 0.407131552696228f, -0.025101041421294212f, 1.436816930770874f, -0.9862444996833801f, 0.6028426885604858f, -1.4068481922149658f, 1.3970472812652588f, 0.25621283054351807f, -0.0003741519176401198f, -2.1326093673706055f, 1.5667240619659424f, 0.9421206116676331f, 0.025448333472013474f, 0.458707332611084f, -0.9393821358680725f, 0.5122731328010559f, 1.5600872039794922f, -1.1780855655670166f, 2.6927573680877686f, 0.19341132044792175f, 1.1026004552841187f, -0.8261107802391052f, 0.3904056251049042f, -1.2739393711090088f, -0.6589940190315247f, -0.22857728600502014f, -0.2579657733440399f, -0.24142996966838837f, 1.2306902408599854f, -0.9930443167686462f, -0.48736757040023804f, 0.047059256583452225f, 0.3257743716239929f, -0.3486784100532532f, 0.43922877311706543f, 0.6480922102928162f, 0.459292471408844f, 0.39164236187934875f, -0.20121490955352783f, 0.5196017026901245f, 1.1278164386749268f, 1.314104437828064f, 0.9195283651351929f, -1.0299675464630127f, -1.4861979484558105f, -2.2335782051086426f, -1.175955891609192f, -0.5660204887390137f, 0.33733224868774414f, -1.6826895475387573f, 1.429691195487976f, 1.5882172584533691f, 1.2451703548431396f, -0.5128902196884155f, 0.5663047432899475f, -0.645276665687561f, 1.5498095750808716f, 0.04385578632354736f, -0.5136253237724304f, 1.4234158992767334f, 2.489812135696411f, 0.6393364071846008f, -0.4142342209815979f, -2.507132053375244f, 1.7104519605636597f, 0.3081821799278259f, -1.8839408159255981f, 0.8713569045066833f, 0.6138812899589539f, -0.3543996214866638f, -0.5578363537788391f, 0.7301253080368042f, 0.2339453399181366f, 0.4868336319923401f, 1.2264947891235352f, 1.1931899785995483f, 0.7605131268501282f, 0.5852847099304199f, -1.2781847715377808f, -1.1154592037200928f, 0.8185226917266846f, 0.6472027897834778f, 0.5181817412376404f, 0.840347170829773f, -0.5540033578872681f, 0.5649234056472778f, -0.98888099193573f, 0.06238013878464699f, 0.9293259382247925f, -0.6768644452095032f, 1.952907919883728f, 1.1340794563293457f, 1.3721071481704712f, -0.21115639805793762f, -1.3889493942260742f, -0.6985898017883301f, 0.5516669750213623f, -0.2790030241012573f, 0.7213651537895203f, 0.15045492351055145f, -0.5897537469863892f, 0.9342153072357178f, 1.3517446517944336f, -0.7321491837501526f, 0.5119076371192932f, 0.1565941721200943f, 0.2808796465396881f, -0.10410746186971664f, -1.2526813745498657f, 1.4095237255096436f, -1.043591856956482f, -0.8706263303756714f, 0.6562705636024475f, 0.17987479269504547f, -0.7960370182991028f, -0.6575473546981812f, -0.1586974859237671f, -0.4360821843147278f, 0.6465263366699219f, -1.1642191410064697f, 0.3633206784725189f, 1.5305348634719849f, 0.20136219263076782f, -0.8882933855056763f, -0.7230384945869446f, 0.04366447776556015f, 0.38008302450180054f, 1.2346022129058838f, -1.3480780124664307f, 1.6389628648757935f, -1.9373420476913452f, 0.03226400911808014f, -1.0600721836090088f, 1.0399154424667358f, -0.7740336656570435f, -1.1330678462982178f, -0.18176597356796265f, 0.3535224199295044f, -1.9350301027297974f, 0.45451614260673523f, -2.392625570297241f, 1.1763373613357544f, -0.3300648629665375f, 0.9530068039894104f, -0.11855891346931458f, -0.41447803378105164f, 0.6517481207847595f, -0.5841397643089294f, -1.547606110572815f, -0.08707687258720398f, -1.3770695924758911f, -0.012907221913337708f, 1.3789395093917847f, 0.9626683592796326f, 0.00185173109639436f, -0.16571873426437378f, -0.09017765522003174f, -0.6375454068183899f, 0.35507386922836304f, 0.0036884695291519165f, -0.3816991448402405f, 0.27004775404930115f, -1.7931047677993774f, 2.0580689907073975f, 0.6458192467689514f, -1.3937633037567139f, 0.34659773111343384f, -1.1290851831436157f, -0.5392683148384094f, -0.8951094150543213f, 1.0918608903884888f, -1.9207334518432617f, -0.3543933928012848f, -1.649062991142273f, 0.5379272699356079f, -0.31770801544189453f, -1.1223453283309937f, 1.4397344589233398f, 1.5634429454803467f, -0.004438638687133789f, 0.7036352753639221f, -0.14880667626857758f, 0.6547459959983826f, 1.5321309566497803f, -0.2686406075954437f, 2.0168282985687256f, -0.288194864988327f, 0.35652226209640503f, 2.160553455352783f, 0.275217205286026f, -2.0319416522979736f, 0.2248028814792633f, -1.281853199005127f, -1.6626029014587402f, -0.942642867565155f, 0.3260803818702698f, -1.1133676767349243f, -1.4012584686279297f, -0.37976154685020447f, 0.40461063385009766f, -0.6963782906532288f, -1.3064364194869995f, -2.1726925373077393f, -0.7762024998664856f, 0.8443084359169006f, 1.0020902156829834f, 0.7898114323616028f, -0.1752912402153015f, 0.12935137748718262f, 1.2677034139633179f, -0.8686774373054504f, 0.984561562538147f, -1.870896339416504f, 0.6822976469993591f, -0.451043039560318f, -1.155631422996521f, 0.7728339433670044f, -1.1112349033355713f, -0.8672816753387451f, 1.5368183851242065f, -1.046025037765503f, -0.6560050249099731f, -0.4286642074584961f, 0.7848009467124939f, -1.835911750793457f, 1.250395655632019f, -0.24335385859012604f, -0.31686636805534363f, -0.8966814279556274f, -0.14545132219791412f, 1.4703935384750366f, 0.2128523886203766f, -0.9325401782989502f, -0.3473551571369171f, 0.5344530940055847f, 0.08532506972551346f, -0.2573105990886688f, 0.6045728921890259f, 0.3610866963863373f, -1.0777159929275513f, -1.9149163961410522f, 0.5004882216453552f, 1.857444167137146f, -0.8207314014434814f, -0.14101171493530273f, 1.354081392288208f, 1.7396339178085327f, 0.06523589044809341f, 1.2497252225875854f, 0.750633955001831f, -0.5558157563209534f, -2.0188117027282715f, -0.9094275832176208f, 0.3692293167114258f, 0.4192548394203186f, -0.5022445321083069f, -0.7755458354949951f, -0.8645268678665161f, -1.6803337335586548f, -0.12212011963129044f, -1.5747339725494385f, -0.015105989761650562f, -0.7979808449745178f, -0.42616453766822815f, 2.1253676414489746f, 0.04826252907514572f, -0.34355291724205017f, -0.17333583533763885f, -1.473657250404358f, 1.3391492366790771f, 0.8478164076805115f, -0.5319951176643372f, 0.22928817570209503f, -0.09654229879379272f, 0.39628124237060547f, -1.0141205787658691f, 0.26747071743011475f, 1.501269817352295f, 0.6720985174179077f, -0.5900893807411194f, 0.9497699737548828f, 1.9505430459976196f, 0.7309340238571167f, 0.09723401069641113f, -0.8022183179855347f, 0.43563902378082275f, 1.9222667217254639f, -2.0168802738189697f, 0.9772894382476807f, 0.14779187738895416f, 1.5133566856384277f, -0.1279350221157074f, -2.163722515106201f, 1.9914374351501465f, -0.9897474646568298f, 0.8003202080726624f, -0.1275702863931656f, 0.2842639684677124f, 0.1376238614320755f, -0.545866072177887f, 0.18658386170864105f, 0.3076750338077545f, 0.8016005754470825f, 0.566060483455658f, 0.318692147731781f, 1.3281844854354858f, -0.6900371313095093f, 0.07014389336109161f, 0.47831252217292786f, 1.0354363918304443f, -0.06358214467763901f, 0.09934888780117035f, -0.3449469208717346f, 1.2402560710906982f, -0.3211720585823059f, 0.6852926015853882f, -0.10187509655952454f, 0.44141748547554016f};
+void* testOutputVector[1] = {testOutputVector0};
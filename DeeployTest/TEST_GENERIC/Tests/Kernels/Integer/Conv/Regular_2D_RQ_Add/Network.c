@@ -0,0 +1,169 @@
+#include <stdio.h>
+    #include <stdlib.h>
+    #include <math.h>
+    #include "DeeployBasicMath.h"
+
+    #include "Network.h"
+    #include "NetworkConstants.h"
+
+    int8_t* DeeployNetwork_input_0;
+int8_t* DeeployNetwork_input_1;
+int8_t* DeeployNetwork_output_0;
+void* DeeployNetwork_inputs[2];void* DeeployNetwork_outputs[1];
+        void RunNetwork(__attribute__((unused)) uint32_t core_id, __attribute__((unused)) uint32_t numThreads){
+        int8_t* DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input;
+int8_t* DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input;
+int32_t* DeeployNetwork_skip_conv_out_tensor;
+int32_t* DeeployNetwork_conv_out_tensor;
+{
+DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input = (int8_t*) deeploy_malloc(1 * 800);
+
+
+
+
+// 2D Pad (Name: _EXTRACT_CONV_PASS_0_pad, Op: Pad)
+BEGIN_SINGLE_CORE
+    memset(DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input, 0, 800*sizeof(int8_t));
+    uint32_t xoffset_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0;
+    uint32_t offset_in_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0 = 0;
+
+    // NCHW Layout
+    for(uint32_t n=0; n<1; n++){
+        xoffset_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0 = n*800 + 1*10+1;
+        for (uint32_t c=0; c<8; ++c) {
+            for(uint32_t h=0; h<8; h++){
+                memcpy(DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input + xoffset_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0, DeeployNetwork_input_0+offset_in_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0, 8*sizeof(int8_t));
+                xoffset_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0 += 10;
+                offset_in_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0 += 8;
+            }
+            xoffset_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0 += 2*1*10;
+        }
+    }
+END_SINGLE_CORE
+
+}
+{
+DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input = (int8_t*) deeploy_malloc(1 * 400);
+
+
+
+
+// 2D Pad (Name: _EXTRACT_CONV_PASS_1_pad, Op: Pad)
+BEGIN_SINGLE_CORE
+    memset(DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input, 0, 400*sizeof(int8_t));
+    uint32_t xoffset_DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input_DeeployNetwork_input_1;
+    uint32_t offset_in_DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input_DeeployNetwork_input_1 = 0;
+
+    // NCHW Layout
+    for(uint32_t n=0; n<1; n++){
+        xoffset_DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input_DeeployNetwork_input_1 = n*400 + 1*10+1;
+        for (uint32_t c=0; c<4; ++c) {
+            for(uint32_t h=0; h<8; h++){
+                memcpy(DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input + xoffset_DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input_DeeployNetwork_input_1, DeeployNetwork_input_1+offset_in_DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input_DeeployNetwork_input_1, 8*sizeof(int8_t));
+                xoffset_DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input_DeeployNetwork_input_1 += 10;
+                offset_in_DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input_DeeployNetwork_input_1 += 8;
+            }
+            xoffset_DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input_DeeployNetwork_input_1 += 2*1*10;
+        }
+    }
+END_SINGLE_CORE
+
+}
+{
+DeeployNetwork_skip_conv_out_tensor = (int32_t*) deeploy_malloc(4 * 1024);
+
+
+
+
+// 2D Conv (Name: skip_conv, Op: Conv)
+BEGIN_SINGLE_CORE
+    int8_t* ref_DeeployNetwork_skip_conv_out_tensor_DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input = DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input;
+    int32_t* ref_DeeployNetwork_skip_conv_out_tensor_DeeployNetwork_skip_conv_out_tensor = DeeployNetwork_skip_conv_out_tensor;
+
+    for (uint32_t n=0; n<1; ++n) {
+        Conv2d_s8_s8_s32_NCHW(
+            ref_DeeployNetwork_skip_conv_out_tensor_DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input, 4, 10, 10,
+            DeeployNetwork_skip_weight_tensor, 16, 3, 3,
+            1, 1,
+            ref_DeeployNetwork_skip_conv_out_tensor_DeeployNetwork_skip_conv_out_tensor, 0, 0
+        );
+        ref_DeeployNetwork_skip_conv_out_tensor_DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input += 400;
+        ref_DeeployNetwork_skip_conv_out_tensor_DeeployNetwork_skip_conv_out_tensor += 1024;
+    }
+END_SINGLE_CORE
+
+
+SINGLE_CORE deeploy_free(DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input);
+
+}
+{
+DeeployNetwork_conv_out_tensor = (int32_t*) deeploy_malloc(4 * 1024);
+
+
+
+
+// 2D Conv (Name: conv, Op: Conv)
+BEGIN_SINGLE_CORE
+    int8_t* ref_DeeployNetwork_conv_out_tensor_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input = DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input;
+    int32_t* ref_DeeployNetwork_conv_out_tensor_DeeployNetwork_conv_out_tensor = DeeployNetwork_conv_out_tensor;
+
+    for (uint32_t n=0; n<1; ++n) {
+        Conv2d_s8_s8_s32_NCHW(
+            ref_DeeployNetwork_conv_out_tensor_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input, 8, 10, 10,
+            DeeployNetwork_weight_tensor, 16, 3, 3,
+            1, 1,
+            ref_DeeployNetwork_conv_out_tensor_DeeployNetwork_conv_out_tensor, 0, 0
+        );
+        ref_DeeployNetwork_conv_out_tensor_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input += 800;
+        ref_DeeployNetwork_conv_out_tensor_DeeployNetwork_conv_out_tensor += 1024;
+    }
+END_SINGLE_CORE
+
+
+SINGLE_CORE deeploy_free(DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input);
+
+}
+{
+
+// Fused Elementwise (Name: _FUSE_ELEMENTWISE_PASS_0, Op: FusedElementwise)
+BEGIN_SINGLE_CORE
+    for (uint32_t i = 0; i < 1024; i++) {
+
+
+        int32_t x0 = (int32_t) DeeployNetwork_conv_out_tensor[i];
+        int32_t x1 = (int32_t) DeeployNetwork_skip_conv_out_tensor[i];
+        int32_t x2 = (int32_t) DeeployNetwork_rqs_convmul_tensor[((i / (8 * 8)) % 16)];
+        int32_t x3 = (int32_t) DeeployNetwork_rqs_convadd_tensor[((i / (8 * 8)) % 16)];
+        int32_t x4 = (int32_t) DeeployNetwork_skip_rqs_convmul_tensor[((i / (8 * 8)) % 16)];
+        int32_t x5 = (int32_t) DeeployNetwork_skip_rqs_convadd_tensor[((i / (8 * 8)) % 16)];
+        int32_t x6 = (int32_t) DeeployNetwork_rqs_outmul_tensor[0];
+        int32_t x7 = (int32_t) DeeployNetwork_rqs_outadd_tensor[0];
+        int32_t t0 = (x0 * x2 + x3 + 32768) >> 16;
+        t0 = CLAMP(t0, -128, 127);
+        int32_t t1 = (x1 * x4 + x5 + 32768) >> 16;
+        t1 = CLAMP(t1, -128, 127);
+        int32_t t2 = t0 + t1;
+        int32_t t3 = (t2 * x6 + x7 + 2) >> 2;
+        t3 = CLAMP(t3, -128, 127);
+        DeeployNetwork_output_0[i] = (int8_t) (t3);
+
+    }
+END_SINGLE_CORE
+
+
+SINGLE_CORE deeploy_free(DeeployNetwork_skip_conv_out_tensor);
+
+
+SINGLE_CORE deeploy_free(DeeployNetwork_conv_out_tensor);
+
+}
+
+        }
+        
+        void InitNetwork(__attribute__((unused)) uint32_t core_id, __attribute__((unused)) uint32_t numThreads){
+        DeeployNetwork_input_0 = (int8_t*) deeploy_malloc(1 * 512);
+DeeployNetwork_input_1 = (int8_t*) deeploy_malloc(1 * 256);
+DeeployNetwork_output_0 = (int8_t*) deeploy_malloc(1 * 1024);
+DeeployNetwork_inputs[0] = (void*) DeeployNetwork_input_0;DeeployNetwork_inputs[1] = (void*) DeeployNetwork_input_1;DeeployNetwork_outputs[0] = (void*) DeeployNetwork_output_0;
+    }
+    
\ No newline at end of file
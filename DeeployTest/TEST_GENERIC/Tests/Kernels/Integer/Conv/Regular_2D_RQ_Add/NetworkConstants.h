@@ -0,0 +1,14 @@
+
+    #ifndef __DEEPLOY_CONSTANTS_HEADER__
+    #define __DEEPLOY_CONSTANTS_HEADER__
+    static int8_t DeeployNetwork_skip_weight_tensor[576] = {7, 24, -13, -26, 14, -19, -7, 15, 30, 23, 15, 0, 20, 23, 20, 28, 30, -26, 25, -4, 18, -13, 32, 22, 24, 26, -15, 16, 29, -1, -30, 11, -10, -11, -30, 12, -4, -16, 21, 5, -10, -24, -9, 12, 4, 6, -22, 2, 16, 3, -22, -30, -30, -12, -31, 13, -13, -13, -26, -14, -10, 11, 1, -2, -1, -17, -18, -30, 4, 5, 28, -32, -17, 29, 10, 15, -15, -16, 27, -15, -13, 0, 17, 10, -3, 27, -20, -5, 18, 9, -6, 12, 16, -13, -25, 31, 9, 6, -21, 16, 2, 1, -16, 24, -29, 10, -11, 2, -18, -5, -19, -10, 16, -32, 4, 2, 27, 30, 21, 32, -30, -29, 0, -1, 8, 21, 19, 21, -5, -6, -12, -12, -23, 15, 2, 5, -13, 28, 25, -29, 12, 4, 0, 19, 19, -19, 9, -16, 23, 27, 21, 21, -31, 4, -1, 5, -8, 13, 16, 17, 17, 12, 26, -16, -1, 31, -32, -7, 26, 21, 15, 1, -11, -11, 17, 13, -6, 23, 11, -16, -20, 4, -24, 6, 8, -2, -17, -23, -6, -7, -4, 0, 15, -7, -17, -3, 19, -13, -24, 18, -4, -22, 15, -10, -32, 1, 22, 1, -17, 10, -15, 22, 15, 5, 14, -27, -29, -2, 23, 27, -20, -2, 20, 9, -23, 10, 29, -6, -27, 15, 3, -7, 20, 10, 9, -18, -23, 12, -15, -20, 18, -14, 25, 31, 26, -32, -10, -10, -16, -30, 4, 27, -14, -4, 10, -32, -9, -14, -28, -14, -14, 31, 10, -19, -6, 0, 22, -26, -18, 27, -20, 17, 31, -22, 31, -23, 32, 22, -20, 18, 7, -16, 12, 15, -31, -25, 18, -16, 22, 15, 23, -2, 15, -20, 23, -16, -25, -21, -9, 12, -10, -6, -17, -2, -32, -11, -2, -20, 11, 1, -26, -20, -3, 19, 10, -15, -23, -25, -26, -1, -24, 0, -7, -11, 0, 19, 27, -19, 23, -13, 23, -22, -16, -25, 13, 3, 9, 1, -15, 26, -21, -24, 2, 23, -6, 19, 29, 13, -10, 10, 9, 10, 12, -13, 17, 1, -10, 16, -32, 23, 0, 27, 26, 8, 13, 31, 22, -26, -3, 10, -8, 19, -7, 23, 6, -18, -16, -18, 21, -14, 10, -4, 22, 17, -19, -24, -31, 1, -7, 10, 13, -9, 17, -28, 11, 2, 1, 9, -14, -32, -26, 29, 30, 1, 24, -32, -25, 10, -18, -5, -21, -7, -32, 12, -31, 32, 22, -9, -20, 19, 6, 20, 23, -9, -2, -13, -13, 2, 11, 5, -22, -31, -11, 4, -2, 12, 29, 15, -18, -17, -3, 3, 31, 12, -23, 15, 15, -24, -29, 2, 31, 22, -7, 9, 30, -8, -7, -14, -16, -9, 3, 0, 27, -12, 8, 31, -18, 6, -20, 6, -12, 29, -26, 3, -10, -14, 23, 9, -32, -1, -32, -30, 26, -29, -13, -14, 7, 31, 32, -28, 13, 3, 32, -26, 25, 26, -31, -9, -16, 21, 6, -12, -20, -26, -18, 6, -1, 19, 10, -22, 21, -12, 10, 12, -18, -6, 2, 15, 29, -32, -10, 16, -13, -22, -27, 30, 2, -28, 32, 0, 20, -23, 6, -22, -29, -10, -19, -17, 29, -20, 4, 27, -19, 23, -16, 4, -13, 27, 8, 2, -19, -2, 12, -2, 28, 16, 16, -25, 15, -27, -23, 22, -11, -22, -6, 18, 14, -30, 14, -26, 4, -5, 26, -15, -26, -16};
+static int8_t DeeployNetwork_weight_tensor[1152] = {26, 22, -11, 14, 17, 15, -25, -8, 18, -5, 22, -17, 26, 18, -26, 15, -8, -5, 17, -27, -21, 20, -13, 32, 23, -30, -10, -23, 26, -30, -11, -28, -32, -29, -24, 9, -14, -10, 16, 4, -17, 31, 19, -11, -10, 30, -4, -19, -30, -19, 18, 2, 18, 29, -1, -22, -4, 18, -5, 25, -18, 32, 8, -8, 4, 0, 7, 31, 17, 19, -25, -13, -3, -12, -10, 13, 8, 27, 4, 9, -3, 13, 20, -13, -23, 6, 0, 6, -6, 24, 19, 15, 29, -31, -23, 17, -20, -14, 0, 26, 3, -5, -22, 14, -9, 15, 11, 15, 20, 32, -6, 6, 17, 31, 4, -29, 18, 18, 12, 19, -28, -20, 7, 22, -24, 12, -29, -15, 11, -7, 32, -21, 11, -28, -31, -19, 24, 3, 22, -29, -27, -31, 21, -7, 30, 30, 8, 24, 5, -28, -11, 9, -28, -6, 2, 0, -18, 28, -12, -21, 24, -6, -25, -5, 12, 21, 12, 13, 3, -16, -14, -29, 19, 31, -31, 17, -31, 25, 24, -24, -30, -29, -16, 19, 9, -20, -14, 1, 20, -20, -11, -6, 15, -3, 18, 10, 12, 5, 9, 23, -7, -3, 25, -31, 15, 19, -17, -28, 15, 18, 5, 10, -4, -21, 9, 25, 10, 29, -13, -4, -15, 4, 4, -24, -21, 23, 18, 29, 9, -15, -24, -31, 25, -6, -31, 8, 20, -22, -4, 12, -24, -21, -9, -32, -29, 6, -26, 10, 21, 29, 26, -25, -11, -12, -4, 25, -15, 28, -3, 19, 18, -15, -5, -25, -27, -4, -1, 15, 13, 12, 2, -20, -26, -30, -11, 14, -2, -15, 16, 30, 10, 32, 3, -16, -22, -26, -2, 1, -31, 5, 9, 14, 16, -20, -17, -26, -16, -14, -30, -16, -32, -1, 31, 17, 18, -12, 10, -9, -16, -15, 16, -18, -14, -12, 2, 25, -27, 15, -32, 8, -25, 23, 5, 9, -27, 1, -14, -10, 24, -30, 15, 21, -29, 4, 1, 15, 16, -27, 6, -26, -27, 21, 32, 17, 5, -9, 13, 9, -11, -7, -15, -25, 0, -26, 1, -6, 29, -7, -32, -3, -9, 26, 1, 11, -4, -28, 7, 18, -15, -25, 9, -29, -9, 29, -24, 24, -7, -9, 22, -20, 16, -25, -3, 14, -27, -9, -16, -23, -19, -3, 18, -8, 25, 8, 4, -20, 1, 17, -21, 6, 6, -26, -4, 29, -27, 7, -15, 20, -6, 17, 7, -21, -23, 25, -16, 25, 4, -6, -14, 16, 1, 19, 11, 1, -24, 32, -21, 4, 19, 1, 30, 32, 14, -5, -5, 23, -6, -30, 8, 23, 29, 3, 29, 18, -11, -12, 23, 10, -21, -2, 22, 22, 13, -23, 23, -9, 24, -11, -8, -14, -20, 12, -9, 2, -5, 25, 20, 17, 17, -15, 0, -13, -7, -2, -24, -10, -9, -21, 24, -12, 16, 6, 8, -14, -10, -25, 32, -4, 9, -22, -19, 25, 16, -15, 15, 9, -23, 22, 1, 28, -14, -11, -6, 16, 4, -8, -11, -24, -2, -16, -11, 32, 26, 22, 6, -32, -21, -25, -32, -25, 13, 22, -10, -20, 24, -26, -7, -7, 16, 24, -19, -13, 9, 31, 16, 27, 27, 25, 13, 0, -10, 24, 6, 23, -12, -29, 6, -16, -32, 8, 32, 0, 31, 14, -9, -29, 31, 19, 3, -25, 23, -25, -5, -22, 7, -4, 24, 11, 24, -7, 30, 0, -15, -8, -6, 32, 7, -24, -6, 19, -23, -5, -7, 29, 11, -17, 21, -31, 0, 14, -26, 17, 10, -18, -21, -30, 32, 19, -27, 18, 24, -3, 2, -14, -23, 20, -28, -29, -5, -14, -20, 26, -14, -30, -11, -24, -10, -8, 19, -15, 31, -20, 25, 27, -30, -22, 15, -27, -6, -30, -26, -10, 29, -31, 6, -4, -23, 2, 2, -4, 19, -6, 5, 1, 7, -25, -22, -22, 30, 11, 10, 27, 2, -2, 8, -22, -23, 16, 16, -31, 28, -25, 18, 12, 29, 7, 5, -15, -19, 6, 21, -2, 22, 32, -7, -7, 25, 18, -1, -14, 5, -28, 16, -31, -1, 31, -14, -1, 13, 23, 10, 29, -17, -3, 0, -20, -29, 20, 13, -21, -20, -13, 31, -32, -17, -28, -8, 27, -6, 19, 3, 18, 29, 28, 7, -1, 8, -21, -4, -1, 27, 16, -2, 23, -10, 27, 1, 2, 6, 20, -21, 21, -23, -13, -9, -16, -20, 19, 2, -21, 1, 18, 2, -14, -20, 24, 4, -27, 22, -6, -26, -8, 11, 29, -7, 8, 16, 11, 28, 7, 14, 3, 32, 1, -23, -7, -30, -10, -9, 21, -19, 30, -15, 30, -17, 21, 4, 5, 8, 26, 18, 16, 17, -1, 6, 12, -30, -17, 30, 17, -14, -3, 30, -28, 28, -28, -31, -18, -17, 9, 3, 22, 31, 17, 23, -19, -21, -14, 32, -17, 12, -17, 8, 8, -8, -15, -11, -19, 30, 3, -23, -9, -8, 18, -14, 26, -14, -15, -21, 10, 9, 24, -32, 9, 16, 16, -17, -5, -32, 15, -29, -23, 32, 16, -6, -12, 23, -28, 22, -28, 24, -1, -2, -30, -30, 23, -23, 19, -9, -21, -24, 8, 19, -5, -22, -23, 13, 6, 10, 19, -28, 19, -17, 19, 12, 17, -22, 13, 28, -7, 30, -13, -22, 15, -10, 23, 17, -4, -26, -26, -16, -27, 7, 20, 24, 4, -29, -24, -16, 20, 24, -25, 15, 23, 26, 15, -19, -17, -9, 3, -19, 1, -32, 26, -6, -19, 24, -13, -31, 26, 23, -22, -2, 13, 1, 23, -29, 28, -4, -14, -8, -16, -20, -22, 31, 8, -10, 31, 21, 11, -19, 16, 32, -10, 8, -29, -30, 17, 16, 16, -6, -32, 20, 19, 20, -24, -26, 13, -4, -9, -10, 29, 15, -5, 15, -16, -26, 26, -1, 17, -4, -2, 8, -14, -22, -7, 26, -26, 16, 0, 28, -3, 18, 10, -10, 27, 0, 21, -29, 26, 2, -2, 28, 10, 8, 4, -14, -30, 30, 18, -30, -24, -18, -31, 4, -1, 2, -1, -25, -20, 0, 29, 5, 30, 2, 9, -32, 26, 30, -8, 13, 14, 19, -22, -21, 0, 0, 21, 23, 24, -16, -16, 14, 11, -26, -27, 18, 13, 32, -9, -29, 21, -20, -9, 9, -21, 8, -1, 6, 29, -3, -28, -12, -20, 13, 2, -20, 12, -17, -24, 28, 29, 32, -6, 24, 19, -14, -22, 32, 9, -32, 20, 11, -24, -16, -12, 18, 1, -21, 16, -20, 2, -21, 14, 31, 21, -23, -20, 27, -21, 16, 28, -29, 14, 23, -10, 18, -18, -26, 4, -17, 32, -3, -2, 13, -13, 27, -26, 27, 12, -29, 10, 0, -9, 10, -25, -28, -13, 17, -3, -7, 3, 16, 29, 0, -10, -6, 11, -19, 10, -21, 12, 2, -17, 18, 27, -15, -28, 28, 30, -20, -8, 31, -19, 27, 32, -1, 0, 13, 12, -26, 15};
+static int32_t DeeployNetwork_rqs_convmul_tensor[16] = {335, 242, 109, 166, 172, 208, 356, 344, 242, 338, 193, 347, 385, 277, 271, 217};
+static int32_t DeeployNetwork_rqs_convadd_tensor[16] = {-5695.0, 4598.0, 5232.0, -4980.0, -4644.0, 5200.0, -13884.0, 10320.0, -3146.0, -6760.0, -6176.0, 1388.0, 6545.0, 10249.0, -12737.0, -3472.0};
+static int32_t DeeployNetwork_skip_rqs_convmul_tensor[16] = {287, 356, 185, 396, 194, 198, 222, 377, 348, 273, 385, 223, 135, 317, 314, 274};
+static int32_t DeeployNetwork_skip_rqs_convadd_tensor[16] = {-11193.0, 1780.0, 3515.0, 13068.0, 4074.0, -4752.0, 9990.0, 16211.0, -4524.0, 1911.0, 10395.0, -1784.0, 5400.0, -5072.0, -1884.0, -6850.0};
+static int32_t DeeployNetwork_rqs_outmul_tensor[1] = {3.0};
+static int32_t DeeployNetwork_rqs_outadd_tensor[1] = {0.0};
+
+    #endif
+    
\ No newline at end of file
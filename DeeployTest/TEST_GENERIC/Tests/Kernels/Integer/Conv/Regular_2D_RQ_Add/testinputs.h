@@ -0,0 +1,3 @@
+int8_t testInputVector0[] ={96.0, -28.0, 34.0, -37.0, -3.0, 124.0, -87.0, -100.0, -16.0, -115.0, -95.0, -75.0, -12.0, 54.0, -43.0, -119.0, -71.0, -33.0, 87.0, -66.0, -87.0, -64.0, -84.0, -106.0, -10.0, 101.0, 122.0, 70.0, -126.0, 82.0, -5.0, -53.0, 86.0, -100.0, 99.0, -46.0, 47.0, -90.0, -70.0, 25.0, 61.0, -8.0, 102.0, 43.0, -48.0, -101.0, 122.0, -113.0, 31.0, -23.0, -85.0, -42.0, 115.0, 28.0, 11.0, -97.0, 68.0, -37.0, 68.0, -30.0, -118.0, 66.0, -71.0, -112.0, -68.0, 80.0, -99.0, 37.0, -81.0, -22.0, -107.0, 19.0, -38.0, -29.0, 113.0, 30.0, -32.0, -98.0, 101.0, -88.0, 98.0, -112.0, 66.0, -68.0, -90.0, 25.0, -113.0, 29.0, -94.0, -123.0, -95.0, -101.0, 59.0, -108.0, -3.0, -43.0, -86.0, -72.0, -6.0, -3.0, -15.0, 59.0, -71.0, 6.0, -97.0, 93.0, 85.0, 0.0, 59.0, 3.0, 110.0, -9.0, 56.0, 123.0, 14.0, -107.0, 70.0, -111.0, 63.0, -81.0, 54.0, 20.0, 68.0, 31.0, -42.0, 104.0, 62.0, -93.0, -125.0, -62.0, -88.0, -78.0, 61.0, 29.0, -115.0, -78.0, -45.0, 93.0, 89.0, 20.0, 13.0, -105.0, 33.0, -2.0, -92.0, 45.0, -1.0, -48.0, -63.0, 52.0, -107.0, -28.0, 54.0, -39.0, 62.0, 94.0, -26.0, -94.0, 59.0, 53.0, 82.0, 9.0, -124.0, -108.0, -87.0, 102.0, 82.0, 112.0, -120.0, 10.0, -33.0, 123.0, -111.0, -39.0, -108.0, -12.0, -23.0, 33.0, 104.0, -49.0, 23.0, 36.0, -27.0, 34.0, 72.0, -53.0, 31.0, 25.0, 88.0, -117.0, 92.0, 25.0, -76.0, 107.0, -90.0, -24.0, 48.0, 23.0, -105.0, -74.0, -65.0, -85.0, 2.0, 89.0, -1.0, -122.0, 69.0, 36.0, -55.0, -125.0, -42.0, 118.0, -108.0, -57.0, 69.0, -114.0, 57.0, 55.0, 74.0, -42.0, 104.0, 95.0, -38.0, 33.0, 107.0, -114.0, -118.0, 118.0, -83.0, -44.0, 52.0, -5.0, -123.0, -81.0, 80.0, -65.0, -63.0, -34.0, 110.0, -121.0, 5.0, -67.0, 41.0, -59.0, 24.0, 124.0, 16.0, -29.0, 58.0, -60.0, 112.0, -24.0, -67.0, 68.0, 29.0, -7.0, 60.0, 29.0, 98.0, 36.0, 34.0, 37.0, 115.0, 47.0, 123.0, 3.0, -50.0, 113.0, -70.0, -5.0, -111.0, -112.0, -98.0, -17.0, -99.0, 48.0, 59.0, -28.0, 20.0, -4.0, 40.0, 29.0, 21.0, -15.0, -113.0, -77.0, 42.0, 63.0, -17.0, 83.0, -53.0, 98.0, 7.0, -12.0, 120.0, 23.0, 84.0, 34.0, -98.0, -52.0, -19.0, 67.0, -107.0, -68.0, -23.0, -54.0, -4.0, 20.0, -49.0, -80.0, 98.0, -85.0, 83.0, 32.0, -70.0, -32.0, 23.0, 74.0, 12.0, 5.0, -104.0, -106.0, 121.0, 35.0, 48.0, 64.0, -74.0, 6.0, 68.0, -67.0, 93.0, -17.0, 60.0, 91.0, 31.0, 46.0, -33.0, 112.0, -113.0, 24.0, -70.0, -55.0, -19.0, 57.0, -21.0, -14.0, -111.0, 122.0, -52.0, -22.0, 56.0, 89.0, -107.0, -60.0, -3.0, -38.0, 120.0, 92.0, 19.0, -16.0, 74.0, -5.0, 100.0, 105.0, -128.0, 125.0, -26.0, 31.0, 0.0, 24.0, -58.0, -100.0, 92.0, 82.0, 13.0, -52.0, 93.0, 15.0, -26.0, 82.0, -7.0, 15.0, 76.0, 41.0, 83.0, 64.0, -128.0, 100.0, -113.0, 111.0, -127.0, -17.0, 103.0, 51.0, 41.0, -77.0, -25.0, 73.0, -101.0, 127.0, 4.0, 8.0, 5.0, -48.0, 15.0, -12.0, 13.0, -37.0, -95.0, 35.0, 76.0, 42.0, 4.0, -24.0, -109.0, -69.0, -84.0, -59.0, 116.0, 75.0, 60.0, 99.0, 92.0, 98.0, 99.0, -112.0, -42.0, 80.0, -113.0, -85.0, 2.0, -33.0, 44.0, -93.0, -17.0, -50.0, 90.0, -113.0, -4.0, -117.0, 40.0, -28.0, -77.0, -51.0, 118.0, -94.0, 57.0, -103.0, 120.0, 34.0, -96.0, -121.0, 24.0, -106.0, -59.0, -44.0, 74.0, 6.0, -38.0, 125.0, 92.0, -81.0, 25.0, 33.0, -15.0, 112.0, 5.0, -69.0, -121.0, 77.0, 15.0, 74.0, -107.0, 49.0, 119.0, -55.0, 12.0, 124.0, 4.0, 41.0, -68.0, 78.0, 119.0, 45.0, 89.0, 91.0, 10.0, -127.0, -9.0, -126.0, 12.0, -114.0, 53.0, 4.0, -6.0, -94.0, -57.0, -105.0, 76.0, 117.0, -44.0, 7.0, 100.0, 64.0, -16.0, 50.0, -106.0, 79.0, -23.0, -63.0, -41.0, -60.0};
+int8_t testInputVector1[] ={58.0, -21.0, -74.0, -47.0, -45.0, 57.0, 19.0, -16.0, -72.0, 10.0, 114.0, 78.0, 44.0, 127.0, 119.0, -102.0, 79.0, 111.0, -38.0, -98.0, -54.0, -20.0, 108.0, -19.0, -59.0, -127.0, 45.0, 118.0, 4.0, 1.0, 94.0, 32.0, 14.0, -80.0, 98.0, -45.0, 87.0, -103.0, -123.0, -31.0, -121.0, -23.0, -99.0, 7.0, -71.0, -109.0, -13.0, 50.0, -35.0, 109.0, -33.0, 94.0, -117.0, 60.0, 52.0, 38.0, 56.0, 72.0, 42.0, -114.0, 18.0, 114.0, 83.0, 4.0, 21.0, 7.0, 29.0, -98.0, 57.0, 44.0, 96.0, 2.0, -45.0, 16.0, -18.0, -63.0, -67.0, -4.0, 52.0, -16.0, -97.0, 70.0, 67.0, -56.0, -42.0, 10.0, -85.0, -81.0, 89.0, 0.0, -2.0, -6.0, -112.0, -55.0, 50.0, 9.0, 36.0, -79.0, 68.0, 117.0, 42.0, -52.0, 87.0, 90.0, 92.0, -11.0, -1.0, 16.0, 109.0, 105.0, -112.0, 46.0, 24.0, -89.0, -81.0, 118.0, 88.0, -88.0, -20.0, 7.0, -9.0, -38.0, 37.0, -68.0, 71.0, 19.0, -56.0, 28.0, 39.0, -113.0, 13.0, -110.0, 28.0, 48.0, -84.0, 50.0, 97.0, 104.0, -93.0, -101.0, 118.0, -21.0, -28.0, -5.0, -33.0, 70.0, -103.0, 27.0, 75.0, 31.0, -113.0, 78.0, -98.0, 69.0, -68.0, 31.0, 50.0, 107.0, 55.0, -23.0, -23.0, 26.0, -58.0, 1.0, 39.0, -73.0, -4.0, 83.0, 22.0, 32.0, 92.0, -22.0, -6.0, 79.0, -26.0, -9.0, -22.0, 32.0, -81.0, 9.0, -107.0, 119.0, -89.0, 104.0, 64.0, 72.0, -125.0, -89.0, -17.0, 58.0, -21.0, 6.0, -60.0, 74.0, 89.0, -67.0, -82.0, 103.0, 59.0, -5.0, -62.0, 110.0, -103.0, -100.0, 32.0, 124.0, -82.0, -40.0, 121.0, 7.0, -6.0, 102.0, 82.0, 8.0, -48.0, 62.0, 49.0, 90.0, 13.0, -125.0, 103.0, 47.0, 30.0, -17.0, -98.0, 31.0, -121.0, 77.0, -39.0, -64.0, -28.0, -101.0, 22.0, 60.0, -43.0, -126.0, 92.0, 63.0, 55.0, -84.0, 82.0, -113.0, 86.0, 58.0, 30.0, 64.0, 76.0, -117.0, 80.0, -41.0, 23.0, 110.0, 126.0, -18.0, 76.0, 50.0};
+void* testInputVector[2] = {testInputVector0, testInputVector1};
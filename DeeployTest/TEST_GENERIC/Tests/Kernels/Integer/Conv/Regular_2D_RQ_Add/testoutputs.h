@@ -0,0 +1,4 @@
+#define OUTPUTTYPE int8_t
+#define ISOUTPUTFLOAT 0
+int8_t testOutputVector0[] ={6.0, 64.0, 28.0, -78.0, 65.0, 37.0, -46.0, 15.0, 18.0, 47.0, -46.0, -43.0, -35.0, 12.0, 62.0, -76.0, 23.0, -79.0, -52.0, 25.0, -74.0, -60.0, 18.0, -31.0, -19.0, -43.0, 111.0, 9.0, -24.0, -25.0, 20.0, -34.0, 59.0, 29.0, 66.0, -8.0, 77.0, 77.0, 46.0, 17.0, 49.0, -43.0, -28.0, 3.0, 95.0, -79.0, -128.0, -35.0, -46.0, 33.0, 4.0, -14.0, 65.0, 20.0, 5.0, -20.0, 2.0, -45.0, -8.0, -15.0, -57.0, 35.0, 14.0, -62.0, -35.0, 127.0, 1.0, 55.0, -8.0, 36.0, -13.0, 10.0, -10.0, -90.0, -16.0, -19.0, 14.0, -32.0, -55.0, 55.0, -52.0, -34.0, 61.0, 29.0, 37.0, 6.0, 17.0, -26.0, 31.0, -37.0, -88.0, -30.0, -33.0, -87.0, -79.0, -34.0, -25.0, 29.0, 44.0, -34.0, 15.0, -10.0, 32.0, 44.0, 47.0, 75.0, -62.0, -25.0, -67.0, 65.0, 41.0, 10.0, -2.0, -4.0, -14.0, -71.0, 67.0, -61.0, -24.0, -21.0, -22.0, -20.0, 63.0, -43.0, -57.0, 17.0, 10.0, -35.0, -23.0, 15.0, -1.0, 11.0, -25.0, -1.0, 27.0, 5.0, 5.0, 4.0, -23.0, 11.0, -13.0, -5.0, -1.0, 2.0, -3.0, -33.0, 12.0, -10.0, -35.0, 11.0, 30.0, -18.0, 22.0, -3.0, 11.0, -5.0, 20.0, -4.0, -25.0, -8.0, 11.0, -21.0, 4.0, 50.0, 11.0, 13.0, 29.0, -16.0, 5.0, -8.0, 29.0, -15.0, 33.0, -39.0, 9.0, -31.0, 20.0, -19.0, 23.0, -10.0, 11.0, -25.0, 35.0, -7.0, 14.0, -19.0, 6.0, 1.0, 14.0, 3.0, 11.0, -8.0, 40.0, 1.0, -17.0, 61.0, 65.0, -47.0, -7.0, 13.0, 61.0, -43.0, -36.0, 0.0, -1.0, -16.0, 15.0, 25.0, -8.0, 32.0, -15.0, -55.0, -33.0, 24.0, 43.0, -19.0, -14.0, 28.0, 11.0, 42.0, -39.0, -30.0, -28.0, -33.0, 31.0, -69.0, 23.0, -83.0, -24.0, 11.0, 6.0, -17.0, -22.0, -48.0, 74.0, -7.0, -31.0, 38.0, -22.0, 71.0, -12.0, 94.0, -40.0, 127.0, 7.0, 76.0, -9.0, 47.0, -73.0, 46.0, 11.0, 6.0, -7.0, 18.0, -34.0, 14.0, 0.0, 11.0, -30.0, 11.0, -43.0, 21.0, 41.0, -11.0, 8.0, 21.0, 26.0, -11.0, 4.0, 34.0, 44.0, -46.0, 24.0, -22.0, -8.0, -36.0, 2.0, 42.0, 29.0, -4.0, -16.0, -18.0, 34.0, -22.0, 14.0, -16.0, -9.0, 14.0, 1.0, 37.0, 33.0, 11.0, 5.0, 20.0, -11.0, 3.0, -24.0, 41.0, -28.0, 24.0, 3.0, -46.0, 59.0, 2.0, 33.0, -12.0, 22.0, -25.0, -10.0, -7.0, 64.0, -13.0, 18.0, -36.0, 14.0, -17.0, 29.0, -22.0, 2.0, -31.0, 14.0, -14.0, -30.0, 20.0, -2.0, -25.0, -13.0, 20.0, 34.0, -7.0, -61.0, 67.0, 6.0, 8.0, 32.0, 11.0, 39.0, -4.0, 17.0, -9.0, -21.0, 34.0, -22.0, -8.0, 20.0, 32.0, -7.0, 60.0, 78.0, -38.0, 34.0, -16.0, -2.0, 35.0, -13.0, -16.0, 44.0, 5.0, -48.0, -23.0, -9.0, -19.0, 32.0, -10.0, 21.0, -4.0, 11.0, 29.0, 8.0, 10.0, -8.0, -16.0, 26.0, -29.0, 4.0, -41.0, -10.0, 12.0, -13.0, 52.0, -19.0, -5.0, 32.0, -22.0, -19.0, -94.0, -37.0, 3.0, 0.0, -34.0, -3.0, 5.0, -56.0, 0.0, 5.0, -1.0, -49.0, -80.0, 65.0, -23.0, 1.0, 107.0, 101.0, -29.0, -34.0, 70.0, -15.0, -43.0, 18.0, -13.0, -8.0, -26.0, -67.0, -39.0, -12.0, -7.0, -26.0, -18.0, -44.0, 75.0, -9.0, -19.0, -49.0, -52.0, -69.0, -42.0, 40.0, 23.0, 29.0, 36.0, 1.0, 42.0, -41.0, 23.0, 41.0, 13.0, -103.0, 10.0, -43.0, 49.0, 19.0, 43.0, -21.0, 27.0, 16.0, -25.0, -13.0, -14.0, -47.0, 7.0, 34.0, -2.0, 13.0, 86.0, -79.0, 5.0, -40.0, 2.0, -61.0, -118.0, 75.0, -18.0, -29.0, 38.0, 10.0, 35.0, -6.0, 43.0, 59.0, 13.0, 15.0, 5.0, -38.0, 127.0, 17.0, 15.0, -8.0, 5.0, 10.0, 39.0, -40.0, 48.0, 75.0, -1.0, -20.0, 12.0, 65.0, 13.0, -43.0, -39.0, -10.0, 55.0, -26.0, 86.0, 125.0, -93.0, 11.0, -22.0, 19.0, -66.0, -40.0, 62.0, -8.0, 13.0, -18.0, 26.0, -62.0, -50.0, 74.0, 1.0, 17.0, 25.0, 7.0, -23.0, -13.0, 2.0, -58.0, -54.0, -25.0, 17.0, -73.0, -23.0, 20.0, 67.0, -12.0, -40.0, -48.0, 44.0, 41.0, 17.0, -3.0, 27.0, 20.0, 31.0, 56.0, 17.0, 59.0, -26.0, 5.0, -128.0, -52.0, -12.0, -10.0, 34.0, -31.0, -12.0, 74.0, -19.0, -2.0, 2.0, -1.0, -47.0, -73.0, 28.0, 42.0, -40.0, 39.0, -4.0, -57.0, -36.0, -45.0, -7.0, 46.0, -25.0, -57.0, -92.0, 23.0, 20.0, -32.0, -15.0, 44.0, -14.0, -4.0, -94.0, 37.0, -13.0, 58.0, -64.0, 72.0, 16.0, -23.0, -102.0, 29.0, 8.0, 16.0, 2.0, -1.0, -26.0, -4.0, 4.0, 18.0, -72.0, -54.0, -11.0, -97.0, 84.0, 16.0, -63.0, -31.0, -68.0, 47.0, 32.0, -61.0, 42.0, -80.0, 29.0, 29.0, 43.0, 2.0, 29.0, 41.0, -8.0, 88.0, 28.0, 29.0, -34.0, 5.0, 47.0, 53.0, 32.0, -70.0, -13.0, -88.0, -1.0, -46.0, 2.0, -51.0, 23.0, -58.0, 74.0, -29.0, 12.0, 2.0, -7.0, 7.0, 8.0, 7.0, 30.0, 58.0, 17.0, -10.0, 8.0, -58.0, 2.0, 76.0, 3.0, 8.0, 47.0, 41.0, -10.0, -31.0, -10.0, -2.0, 16.0, 16.0, 17.0, 20.0, 29.0, -8.0, 9.0, 16.0, 8.0, -58.0, -25.0, 24.0, 44.0, -51.0, 49.0, 9.0, 16.0, 59.0, -38.0, -24.0, 9.0, 36.0, -4.0, -42.0, -40.0, -36.0, 23.0, 22.0, -25.0, 39.0, 26.0, -25.0, -6.0, -106.0, -7.0, -47.0, -22.0, 31.0, 29.0, -12.0, -59.0, 17.0, 7.0, 15.0, 1.0, -6.0, -30.0, 10.0, 39.0, -10.0, 8.0, -18.0, 44.0, -5.0, 67.0, 38.0, 32.0, -10.0, 2.0, 17.0, 11.0, 11.0, -89.0, 101.0, -112.0, -40.0, 89.0, -13.0, -59.0, -16.0, 54.0, 23.0, 66.0, 87.0, -31.0, 51.0, -14.0, -64.0, -58.0, 23.0, -39.0, -77.0, -9.0, 17.0, -48.0, 0.0, -62.0, -17.0, -94.0, 82.0, -29.0, 5.0, 19.0, -10.0, -18.0, -3.0, -64.0, 127.0, 2.0, -4.0, 57.0, -4.0, -32.0, 23.0, -16.0, -94.0, 73.0, -24.0, -16.0, -2.0, 55.0, -42.0, -1.0, -3.0, 41.0, 1.0, -64.0, 97.0, -31.0, -20.0, 80.0, 33.0, 18.0, 36.0, 53.0, 5.0, -59.0, 25.0, 53.0, -79.0, 38.0, -97.0, 62.0, -83.0, -52.0, 42.0, -1.0, -48.0, 7.0, -64.0, -27.0, 104.0, -17.0, -66.0, 18.0, -63.0, -21.0, 6.0, 17.0, -10.0, -80.0, -4.0, -48.0, 12.0, 35.0, 1.0, -43.0, 102.0, -21.0, -10.0, 22.0, 38.0, -34.0, -4.0, -11.0, -27.0, 9.0, -74.0, 41.0, 26.0, -73.0, 40.0, -10.0, -15.0, 37.0, 19.0, -12.0, -68.0, 31.0, -61.0, 59.0, 16.0, 14.0, 18.0, -31.0, -8.0, -25.0, 24.0, -128.0, -2.0, -6.0, 38.0, 6.0, -31.0, 28.0, 29.0, -49.0, -4.0, -10.0, 29.0, -42.0, 26.0, 18.0, 5.0, 35.0, -99.0, -10.0, 53.0, -11.0, -4.0, -23.0, -86.0, 69.0, -11.0, 83.0, -79.0, -30.0, 8.0, -13.0, 17.0, -3.0, 48.0, -67.0, 8.0, -69.0, 23.0, 38.0, 13.0, 16.0, 113.0, -29.0, -63.0, -8.0, 31.0, -60.0, 23.0, -13.0, -101.0, 43.0, -2.0, 10.0, -9.0, 41.0, 4.0, 56.0, 29.0, -52.0, -12.0, 123.0, 18.0, -28.0, -15.0, -25.0, 29.0, -55.0, 18.0, -26.0, -88.0, 17.0, -55.0, 11.0, 23.0, 30.0, 29.0, -39.0, 37.0, -26.0, -2.0, -1.0, -61.0, -7.0, -80.0, -3.0, -13.0, 2.0, 11.0, 29.0, -35.0, 11.0, 21.0, -94.0, -62.0, 3.0, 25.0, -80.0, 8.0, 26.0, 83.0, 2.0, 62.0, 0.0, -31.0, -19.0, 47.0, -51.0, -88.0, -33.0, 47.0, -19.0, 5.0, 52.0, 10.0, -14.0, -50.0, -19.0, -59.0, 4.0, 45.0, 5.0, -25.0, 31.0, -13.0, 2.0, -23.0, -8.0, 32.0, -12.0, -50.0, -37.0, -42.0, -5.0, -20.0, -9.0, -45.0, 32.0, 89.0, -7.0, -70.0, -27.0, 8.0, -7.0, 22.0, 49.0, -1.0, -13.0, -7.0, -10.0, 35.0, 57.0, -63.0, 0.0, 59.0, -44.0, -22.0, 23.0, -19.0, -23.0, 4.0, -17.0, 14.0, 41.0, -10.0, 16.0, -33.0, -55.0, -37.0, -27.0, -16.0, -43.0, 24.0, -12.0, -16.0, -63.0, -3.0, 2.0, 44.0, -1.0, -37.0, 8.0, -4.0, -68.0};
+void* testOutputVector[1] = {testOutputVector0};
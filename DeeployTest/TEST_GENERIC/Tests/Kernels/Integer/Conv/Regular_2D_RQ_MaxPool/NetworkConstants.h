@@ -0,0 +1,9 @@
+
+    #ifndef __DEEPLOY_CONSTANTS_HEADER__
+    #define __DEEPLOY_CONSTANTS_HEADER__
+    static int8_t DeeployNetwork_weight_tensor[1152] = {-21, -21, 21, -29, -8, -22, -22, 32, 19, 9, -15, 24, 11, -10, -29, 17, -6, 12, -3, -25, 11, 8, 4, -4, 26, 7, 4, 29, -7, 0, 27, 2, -23, 16, 19, 15, -9, -25, 13, -14, -20, -25, -9, 15, -20, -17, -25, 20, 4, 27, 28, -4, 28, 26, 2, 23, 6, 18, -18, -8, 5, -1, -31, 20, -4, 30, 26, -31, -7, -21, 19, 18, -22, 4, 0, 28, 19, 21, 25, 11, -19, 23, 16, -25, -25, -30, 24, -13, 27, -18, 19, 16, 26, 6, 12, 14, -30, 17, -26, -18, -3, 21, 7, 14, 2, -13, -19, 9, 6, -10, -13, 30, -19, -8, 6, -3, -4, 7, -18, 17, -6, 5, 16, -19, 31, -5, 4, -23, -9, -29, -30, -21, -26, 12, -24, 32, -30, 26, -2, 5, 1, 28, -25, -9, 11, 7, -30, 27, -13, -1, -21, 16, 4, -11, 0, -27, 7, 21, 19, -6, -21, -3, -22, 31, -3, -27, 32, 23, 3, 20, 12, 21, 23, 23, 31, -6, 10, 10, -12, 0, 1, 30, -3, -31, 22, -11, 31, 0, 0, 0, 19, -15, -19, 12, 6, 22, 7, -30, 3, 20, -18, -30, -32, -31, -12, 15, 14, -23, -11, -25, -29, -11, 6, -1, -31, 25, -6, -32, -2, -8, 26, 9, -27, 5, -23, -30, 3, 17, -18, -12, -15, 7, -9, 3, 15, -3, 1, -9, 16, 25, -10, 22, 31, -10, 31, -13, 6, -6, -16, 16, -8, 6, 1, 31, 18, 30, -32, -4, 20, 31, 27, 21, -21, 5, -14, -13, 25, 10, 11, 15, 1, 11, -32, 28, 12, -13, 8, -19, -11, 1, 28, -15, 22, -22, -4, 18, 30, 22, 19, 5, -29, 6, 24, -2, 16, 3, 18, -19, 31, 20, -19, -17, 16, -5, 7, 12, 3, 30, -32, 11, 13, -28, 15, -31, 1, 22, 29, -24, 31, -9, -4, 8, 7, -8, -25, -5, -21, -12, 12, -8, -21, 1, -8, 8, 8, 4, 31, 21, 2, 20, 8, 12, 32, -14, -20, 24, 3, 31, 28, -22, 21, -13, -1, 16, -15, 8, 27, 13, 27, 0, -11, -2, -9, 5, 6, -5, 19, -16, 12, 21, -11, -23, 3, 23, 11, -19, 28, -9, 21, -21, 17, -8, -23, 18, 2, -1, -16, -21, 2, 15, 19, 0, 21, -9, -16, -27, -19, -23, -28, -18, 9, -28, 2, -6, -3, 13, -13, -12, 9, -22, 9, 7, 7, 10, 17, 15, 10, 2, -14, 16, -19, 21, 23, 28, -5, 27, -16, 29, 14, 15, -24, 9, 25, 21, 3, -12, 5, 1, -18, 27, -32, -28, 23, 17, -18, 1, -2, 2, -1, 25, 12, 24, -17, -4, 5, -23, -16, 25, 5, 15, 24, 14, -14, 21, 21, -3, 17, -9, -18, 2, -13, 23, 14, -24, 22, 16, 4, 22, 2, -22, 3, -22, 11, 4, -20, 11, 2, 14, 7, -19, 20, 29, -7, -11, -27, 20, -24, 16, -8, -31, 2, -16, -28, -2, -18, -8, -31, 27, 13, 9, 1, 25, 27, -22, 26, 17, 0, 29, -18, 23, 8, 29, 2, 30, 6, 23, 30, 18, -8, -22, 27, 26, -19, -31, 19, -30, 31, -6, -32, -11, 26, -20, -2, 22, -16, -29, -22, 15, -32, 23, 27, -15, -28, -10, 16, 11, -20, 9, -25, -23, 6, -15, -28, 29, -14, 17, 31, 29, 23, -10, -15, -11, 9, 13, -27, 22, -26, -31, 31, -32, 2, 23, -7, 25, -20, -14, -11, 6, -31, -25, 32, -18, 26, -28, 0, -16, -5, -31, -17, -8, 9, -7, -2, 10, -32, 25, -29, -11, 22, 29, 28, -12, -17, -6, -12, 4, -31, -2, -10, 12, -2, -29, -9, 23, -1, -27, 29, -16, -11, 14, 8, -21, -13, -15, 27, 31, -21, -22, -14, -3, -15, 15, -25, 24, -27, -30, 6, -31, -2, -24, 11, -30, 18, -8, 21, 21, 27, -5, 20, 3, -9, 27, -28, 6, 3, 23, 1, 19, -20, -2, 27, 14, -5, -1, -14, 16, 26, 30, 17, -5, -10, 27, -15, -2, 25, -29, 0, 1, -10, -18, 2, 6, 2, 12, -6, 21, -23, -30, -10, 9, -5, 32, -31, -12, 5, -28, 19, 18, -7, -3, -15, 20, 0, 5, -9, 23, 11, 18, 26, 20, -11, 7, -25, 12, -17, -28, 22, 30, -27, -32, 26, -17, 20, -28, -5, 0, 1, 5, 5, 12, -7, -5, -14, 9, -28, 14, 25, -7, 24, 24, 13, -10, -16, -11, 31, -32, 14, -27, -14, -26, 24, 23, -21, 6, -24, 14, -30, 8, 0, -25, -13, -13, 16, 4, -6, 5, -27, 5, 3, 21, 31, -26, 26, -24, -11, 5, 17, -23, 26, -11, 15, -19, 22, -27, 7, 31, 25, 16, 28, -3, -22, 28, -11, -14, 25, -3, 21, 23, 0, -3, -17, -14, 26, -31, 7, 19, 16, -18, -32, -25, 3, -4, -18, -29, 7, -29, -21, 3, 13, 0, 32, -22, 13, 12, 11, -13, -1, -26, -5, -30, -17, -9, -28, 16, -14, 3, -10, -12, 31, 32, 1, 5, 21, -17, -3, -5, 23, -6, -31, -31, -19, 5, 1, 5, 5, 16, 31, 31, -23, 31, -20, -26, 15, -2, -6, -4, -16, -29, 3, -1, -3, 28, 24, 4, 28, -29, 11, -23, -24, 3, -28, 7, -12, 13, -2, -23, -19, 24, 14, -21, 1, -20, -2, -19, -11, 19, 19, -7, 23, -26, -27, -18, 9, 23, 8, 5, -31, -26, 28, -22, -5, -6, 21, -5, 28, 21, -4, 23, -27, 29, -9, -3, -9, -3, -12, -31, -28, -13, -10, -5, 21, 12, -32, -12, 15, 6, 2, 7, -13, 28, -28, 1, -27, -4, -11, 15, -6, 28, -28, -13, 16, -13, -3, -25, 18, -23, -29, -22, 21, 16, 1, 2, 28, 13, -18, 22, 9, -3, 13, -2, 22, 12, 18, 11, 23, 31, 12, 23, -9, -10, -30, 20, -4, 13, 9, 11, -6, 18, -11, 29, 23, -21, -4, -32, 11, 17, 16, -18, -29, -14, 13, -19, 0, 11, -8, -9, -29, -5, 14, 16, 32, 1, -9, -7, -13, -32, -20, 18, -12, -29, 13, 3, 4, -15, 0, 2, 7, -4, -30, 21, 6, -15, 4, -17, 21, 2, 9, 23, -19, 14, -27, 9, 5, -24, 19, -27, 6, 15, -4, 9, -11, -23, -14, 6, 9, -6, 25, -16, 0, 15, -31, -11, 29, 20, 4, 4, 17, 30, -27, -9, -31, -6, 17, 26, 28, 7, -4, -23, 16, -25, -19, 17, 22, 2, -3, 9, 29, 15, 3, 19, 2, 18, -7, 1, 0, -7, 6, 14, 12, 2, 16, -6, -31, -11, -31, -30, 0, -11, 7, -1, -8, 25, -8, -12, 9, -16, 32, -30, 9, -21, 31, 10, -19, 31, 11, 14, -20, -9, 15, -23, 9, 5, -10, 3, 28, -21, 17, -25, -19, 14, 25, -9};
+static int32_t DeeployNetwork_rqs_convmul_tensor[256] = {146, 252, 159, 134, 329, 337, 178, 330, 177, 140, 330, 282, 389, 218, 124, 150, 146, 252, 159, 134, 329, 337, 178, 330, 177, 140, 330, 282, 389, 218, 124, 150, 146, 252, 159, 134, 329, 337, 178, 330, 177, 140, 330, 282, 389, 218, 124, 150, 146, 252, 159, 134, 329, 337, 178, 330, 177, 140, 330, 282, 389, 218, 124, 150, 146, 252, 159, 134, 329, 337, 178, 330, 177, 140, 330, 282, 389, 218, 124, 150, 146, 252, 159, 134, 329, 337, 178, 330, 177, 140, 330, 282, 389, 218, 124, 150, 146, 252, 159, 134, 329, 337, 178, 330, 177, 140, 330, 282, 389, 218, 124, 150, 146, 252, 159, 134, 329, 337, 178, 330, 177, 140, 330, 282, 389, 218, 124, 150, 146, 252, 159, 134, 329, 337, 178, 330, 177, 140, 330, 282, 389, 218, 124, 150, 146, 252, 159, 134, 329, 337, 178, 330, 177, 140, 330, 282, 389, 218, 124, 150, 146, 252, 159, 134, 329, 337, 178, 330, 177, 140, 330, 282, 389, 218, 124, 150, 146, 252, 159, 134, 329, 337, 178, 330, 177, 140, 330, 282, 389, 218, 124, 150, 146, 252, 159, 134, 329, 337, 178, 330, 177, 140, 330, 282, 389, 218, 124, 150, 146, 252, 159, 134, 329, 337, 178, 330, 177, 140, 330, 282, 389, 218, 124, 150, 146, 252, 159, 134, 329, 337, 178, 330, 177, 140, 330, 282, 389, 218, 124, 150, 146, 252, 159, 134, 329, 337, 178, 330, 177, 140, 330, 282, 389, 218, 124, 150};
+static int32_t DeeployNetwork_rqs_convadd_tensor[256] = {-5840.0, 252.0, 3021.0, 6566.0, -16121.0, -16850.0, 356.0, -990.0, 7080.0, -6440.0, -1980.0, 12126.0, -778.0, 7630.0, 868.0, -150.0, -5840.0, 252.0, 3021.0, 6566.0, -16121.0, -16850.0, 356.0, -990.0, 7080.0, -6440.0, -1980.0, 12126.0, -778.0, 7630.0, 868.0, -150.0, -5840.0, 252.0, 3021.0, 6566.0, -16121.0, -16850.0, 356.0, -990.0, 7080.0, -6440.0, -1980.0, 12126.0, -778.0, 7630.0, 868.0, -150.0, -5840.0, 252.0, 3021.0, 6566.0, -16121.0, -16850.0, 356.0, -990.0, 7080.0, -6440.0, -1980.0, 12126.0, -778.0, 7630.0, 868.0, -150.0, -5840.0, 252.0, 3021.0, 6566.0, -16121.0, -16850.0, 356.0, -990.0, 7080.0, -6440.0, -1980.0, 12126.0, -778.0, 7630.0, 868.0, -150.0, -5840.0, 252.0, 3021.0, 6566.0, -16121.0, -16850.0, 356.0, -990.0, 7080.0, -6440.0, -1980.0, 12126.0, -778.0, 7630.0, 868.0, -150.0, -5840.0, 252.0, 3021.0, 6566.0, -16121.0, -16850.0, 356.0, -990.0, 7080.0, -6440.0, -1980.0, 12126.0, -778.0, 7630.0, 868.0, -150.0, -5840.0, 252.0, 3021.0, 6566.0, -16121.0, -16850.0, 356.0, -990.0, 7080.0, -6440.0, -1980.0, 12126.0, -778.0, 7630.0, 868.0, -150.0, -5840.0, 252.0, 3021.0, 6566.0, -16121.0, -16850.0, 356.0, -990.0, 7080.0, -6440.0, -1980.0, 12126.0, -778.0, 7630.0, 868.0, -150.0, -5840.0, 252.0, 3021.0, 6566.0, -16121.0, -16850.0, 356.0, -990.0, 7080.0, -6440.0, -1980.0, 12126.0, -778.0, 7630.0, 868.0, -150.0, -5840.0, 252.0, 3021.0, 6566.0, -16121.0, -16850.0, 356.0, -990.0, 7080.0, -6440.0, -1980.0, 12126.0, -778.0, 7630.0, 868.0, -150.0, -5840.0, 252.0, 3021.0, 6566.0, -16121.0, -16850.0, 356.0, -990.0, 7080.0, -6440.0, -1980.0, 12126.0, -778.0, 7630.0, 868.0, -150.0, -5840.0, 252.0, 3021.0, 6566.0, -16121.0, -16850.0, 356.0, -990.0, 7080.0, -6440.0, -1980.0, 12126.0, -778.0, 7630.0, 868.0, -150.0, -5840.0, 252.0, 3021.0, 6566.0, -16121.0, -16850.0, 356.0, -990.0, 7080.0, -6440.0, -1980.0, 12126.0, -778.0, 7630.0, 868.0, -150.0, -5840.0, 252.0, 3021.0, 6566.0, -16121.0, -16850.0, 356.0, -990.0, 7080.0, -6440.0, -1980.0, 12126.0, -778.0, 7630.0, 868.0, -150.0, -5840.0, 252.0, 3021.0, 6566.0, -16121.0, -16850.0, 356.0, -990.0, 7080.0, -6440.0, -1980.0, 12126.0, -778.0, 7630.0, 868.0, -150.0};
+
+    #endif
+    
\ No newline at end of file
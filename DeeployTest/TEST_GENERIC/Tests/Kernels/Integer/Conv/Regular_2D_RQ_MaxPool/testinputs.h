@@ -0,0 +1,2 @@
+int8_t testInputVector0[] ={-128.0, 50.0, -74.0, -48.0, 123.0, -97.0, 24.0, -46.0, -17.0, 110.0, -78.0, 74.0, 62.0, -126.0, 103.0, -78.0, -47.0, -53.0, 123.0, 113.0, -52.0, -25.0, 37.0, -82.0, -28.0, 92.0, -127.0, 104.0, -95.0, -51.0, -50.0, -38.0, -12.0, 64.0, 40.0, -60.0, 10.0, 74.0, 114.0, -13.0, 63.0, 37.0, 116.0, 101.0, 118.0, -121.0, 65.0, -40.0, -121.0, 69.0, -30.0, 25.0, -87.0, -100.0, 63.0, 99.0, -65.0, 120.0, -72.0, -125.0, 124.0, -17.0, -86.0, -39.0, 31.0, 102.0, -61.0, -118.0, 106.0, 90.0, 61.0, -71.0, 36.0, -106.0, -113.0, -10.0, -120.0, -53.0, -115.0, 15.0, 56.0, -127.0, 104.0, 126.0, 66.0, -25.0, 109.0, 37.0, -13.0, -49.0, 100.0, 74.0, -110.0, 86.0, 116.0, 115.0, -48.0, 31.0, -109.0, -83.0, 13.0, -93.0, 26.0, -114.0, -85.0, 37.0, -103.0, 107.0, 26.0, -123.0, 14.0, -15.0, -74.0, 103.0, 54.0, 73.0, -50.0, -104.0, 34.0, 10.0, -18.0, 125.0, -89.0, -28.0, 71.0, 47.0, 104.0, -54.0, -84.0, -12.0, -14.0, -115.0, -103.0, 28.0, -87.0, 60.0, 3.0, -23.0, -45.0, -94.0, -110.0, 31.0, 94.0, 66.0, 5.0, 14.0, 70.0, 27.0, -83.0, 57.0, -77.0, -70.0, -119.0, 41.0, 31.0, 4.0, 84.0, 17.0, 104.0, 4.0, 83.0, 50.0, -11.0, -71.0, 115.0, 110.0, 27.0, 1.0, -56.0, 60.0, -85.0, 90.0, 73.0, -120.0, -105.0, 121.0, -32.0, -126.0, 4.0, 38.0, 55.0, -59.0, -93.0, 43.0, 46.0, 122.0, 15.0, -79.0, -92.0, 127.0, -86.0, 71.0, -72.0, -31.0, 58.0, 91.0, -99.0, -74.0, -124.0, 1.0, 9.0, -11.0, 77.0, -68.0, 58.0, 121.0, -12.0, 55.0, -84.0, 99.0, -56.0, -14.0, 35.0, 61.0, 103.0, 14.0, 33.0, 77.0, 59.0, 10.0, 102.0, -54.0, -106.0, -68.0, 36.0, -78.0, -51.0, 34.0, 56.0, -116.0, 98.0, 13.0, -15.0, -72.0, 118.0, -12.0, 75.0, 43.0, 69.0, 81.0, -44.0, -121.0, 125.0, 24.0, -22.0, 19.0, 89.0, -37.0, -111.0, 77.0, 86.0, 24.0, 97.0, 99.0, -128.0, -127.0, 44.0, 99.0, 103.0, -36.0, 12.0, 51.0, 46.0, -125.0, 81.0, 50.0, 43.0, -121.0, 112.0, -74.0, -23.0, -26.0, -107.0, -14.0, -26.0, -116.0, 13.0, -20.0, -48.0, 51.0, 4.0, 118.0, 46.0, 88.0, 15.0, 123.0, -71.0, 120.0, 67.0, 93.0, 65.0, -67.0, 35.0, 13.0, -16.0, 69.0, 78.0, 11.0, -109.0, 85.0, -84.0, -80.0, -99.0, 15.0, -73.0, -105.0, -128.0, -1.0, -36.0, 52.0, -88.0, 116.0, -84.0, -108.0, 52.0, -125.0, -50.0, 25.0, 27.0, 72.0, 33.0, 65.0, 64.0, 126.0, 63.0, -59.0, -93.0, -32.0, 92.0, -118.0, 82.0, -28.0, 49.0, -96.0, 74.0, 119.0, 49.0, 10.0, -104.0, 12.0, 18.0, 4.0, -128.0, 56.0, 6.0, -2.0, -103.0, 54.0, 85.0, 123.0, -103.0, 45.0, -87.0, 27.0, -126.0, 14.0, 56.0, -27.0, 115.0, 88.0, -105.0, 63.0, 112.0, 123.0, -128.0, -120.0, -77.0, -8.0, 58.0, -97.0, 24.0, -84.0, 16.0, -19.0, -54.0, 27.0, 64.0, 23.0, 28.0, 53.0, -19.0, -61.0, 41.0, -111.0, -93.0, -120.0, -47.0, -30.0, 46.0, 41.0, -120.0, -8.0, -39.0, 101.0, 116.0, -66.0, -127.0, 124.0, 87.0, -54.0, -97.0, -117.0, 22.0, -3.0, -68.0, -75.0, -18.0, 26.0, -11.0, 76.0, -121.0, 15.0, 89.0, 30.0, -127.0, -39.0, 92.0, 118.0, -95.0, 97.0, 76.0, 28.0, 106.0, -91.0, 119.0, 111.0, 64.0, -96.0, -116.0, 48.0, -61.0, -15.0, 117.0, -89.0, -123.0, 94.0, -90.0, 20.0, 77.0, 34.0, -25.0, 122.0, 56.0, 39.0, -11.0, 68.0, -54.0, 93.0, -124.0, -119.0, -89.0, -37.0, -32.0, 1.0, 84.0, 118.0, -124.0, -115.0, 100.0, 126.0, 13.0, 67.0, 5.0, -20.0, -96.0, 21.0, -86.0, 54.0, -59.0, 112.0, 37.0, 85.0, 76.0, 13.0, 9.0, 84.0, -57.0, 41.0, -6.0, 80.0, -7.0, 73.0, -117.0, -95.0, 91.0, -36.0, 94.0, 39.0, 93.0, -126.0, 124.0, -103.0, -36.0, -47.0, -26.0, 0.0, 13.0, 72.0, 39.0, -101.0, 5.0, -40.0, 47.0, 113.0, 7.0, -37.0, -13.0, 92.0, -112.0, 38.0, -42.0, 41.0};
+void* testInputVector[1] = {testInputVector0};
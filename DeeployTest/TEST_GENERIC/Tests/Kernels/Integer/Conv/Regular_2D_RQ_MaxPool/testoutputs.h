@@ -0,0 +1,4 @@
+#define OUTPUTTYPE int8_t
+#define ISOUTPUTFLOAT 0
+int8_t testOutputVector0[] ={6.0, 40.0, 2.0, 37.0, 1.0, 20.0, 23.0, 46.0, 3.0, 70.0, 13.0, 5.0, 16.0, 19.0, 22.0, 48.0, 28.0, 49.0, 7.0, 56.0, 80.0, 47.0, 40.0, 49.0, 22.0, 121.0, 50.0, 57.0, 56.0, 46.0, -4.0, -1.0, 59.0, 50.0, 26.0, -3.0, 45.0, 26.0, 52.0, 23.0, 35.0, 53.0, 23.0, 36.0, 10.0, 54.0, 39.0, 56.0, 7.0, 13.0, 38.0, 23.0, 13.0, 42.0, 11.0, 21.0, 46.0, 35.0, 4.0, 36.0, 10.0, -3.0, -4.0, 19.0, 37.0, 84.0, 89.0, 32.0, -14.0, 116.0, 85.0, 36.0, 65.0, 96.0, 127.0, 49.0, 41.0, 81.0, 57.0, 25.0, -1.0, 2.0, 28.0, 68.0, 68.0, 38.0, 120.0, 65.0, 46.0, 30.0, 56.0, 53.0, 127.0, 34.0, 41.0, 62.0, 38.0, 10.0, 38.0, 5.0, 31.0, 51.0, 12.0, 46.0, 35.0, 38.0, 20.0, 8.0, 25.0, 36.0, 72.0, 21.0, 52.0, 11.0, 103.0, 34.0, 43.0, 104.0, 47.0, 44.0, 127.0, 90.0, 127.0, 70.0, 87.0, 9.0, 114.0, 29.0, 18.0, 47.0, 23.0, 49.0, 26.0, 59.0, 16.0, 1.0, 25.0, 34.0, 15.0, 21.0, 75.0, 45.0, 90.0, 70.0, -2.0, 33.0, 19.0, 26.0, 10.0, 35.0, 44.0, 26.0, 22.0, 26.0, 22.0, 26.0, 21.0, 27.0, 20.0, 12.0, 127.0, 9.0, 87.0, 42.0, 62.0, 66.0, 110.0, 69.0, 51.0, 96.0, 0.0, 38.0, 33.0, 29.0, 127.0, 97.0, 60.0, -18.0, 31.0, 27.0, 50.0, 8.0, 65.0, 57.0, 55.0, 64.0, 97.0, -3.0, 11.0, 83.0, 61.0, 67.0, 77.0, 101.0, 99.0, 41.0, 83.0, 52.0, 127.0, -3.0, 97.0, 81.0, 127.0, 42.0, 30.0, 126.0, 122.0, 57.0, 67.0, 53.0, 11.0, 53.0, 44.0, -6.0, 23.0, 22.0, 65.0, 28.0, 59.0, 42.0, 19.0, 7.0, -17.0, 11.0, 9.0, 6.0, 7.0, 23.0, 30.0, 6.0, 25.0, 13.0, 15.0, 20.0, 15.0, 22.0, 11.0, 8.0, 7.0, 23.0, 2.0, 36.0, 12.0, 3.0, 15.0, 51.0, 7.0, 86.0, 50.0, 11.0, 34.0, 0.0, 4.0, 51.0, 26.0, 23.0};
+void* testOutputVector[1] = {testOutputVector0};
@@ -0,0 +1,10 @@
+
+    #ifndef __DEEPLOY_CONSTANTS_HEADER__
+    #define __DEEPLOY_CONSTANTS_HEADER__
+    static int32_t DeeployNetwork_rqs0_mul_tensor[8] = {93, 23, 114, 109, 47, 72, 60, 79};
+static int32_t DeeployNetwork_rqs0_add_tensor[8] = {2790.0, -414.0, 456.0, 3706.0, -47.0, 720.0, -60.0, -2607.0};
+static int32_t DeeployNetwork_rqs1_mul_tensor[8] = {41, 20, 97, 45, 115, 38, 63, 75};
+static int32_t DeeployNetwork_rqs1_add_tensor[8] = {164.0, 160.0, 1649.0, -855.0, 4025.0, 418.0, -2520.0, -2475.0};
+
+    #endif
+    
\ No newline at end of file
@@ -0,0 +1,3 @@
+int8_t testInputVector0[] ={92.0, -3.0, 13.0, -68.0, -28.0, -111.0, -37.0, 54.0, 67.0, 80.0, -3.0, 12.0, 113.0, 34.0, 45.0, -85.0, 109.0, 13.0, -112.0, -83.0, 102.0, 1.0, 72.0, -41.0, -104.0, 118.0, 114.0, 5.0, -55.0, -77.0, 54.0, -63.0, -80.0, 12.0, 109.0, 89.0, -53.0, -42.0, -6.0, 103.0, 63.0, -67.0, 41.0, 106.0, -127.0, 58.0, 106.0, 110.0, -126.0, 115.0, -71.0, -88.0, 61.0, 51.0, 125.0, -67.0, 77.0, 29.0, -103.0, -63.0, 60.0, -10.0, 127.0, -28.0, 121.0, -112.0, 8.0, 32.0, 119.0, 45.0, 9.0, 97.0, -23.0, 54.0, -51.0, -80.0, 58.0, 30.0, 112.0, -8.0, -103.0, -56.0, -106.0, -101.0, 106.0, -113.0, 126.0, 74.0, -83.0, -50.0, 112.0, -58.0, 71.0, 69.0, 3.0, 51.0, -91.0, -68.0, 26.0, 61.0, 83.0, 46.0, -87.0, -4.0, 81.0, 15.0, 11.0, 109.0, 117.0, 24.0, 99.0, 127.0, 104.0, 30.0, 50.0, 2.0, -21.0, -63.0, -90.0, 3.0, 11.0, 86.0, -122.0, -128.0, -107.0, -73.0, 5.0, 119.0, -53.0, -15.0, -27.0, 93.0, -78.0, -36.0, 11.0, 59.0, -70.0, 50.0, -83.0, -76.0, 69.0, -107.0, -20.0, -68.0, -3.0, -2.0, 78.0, 85.0, -56.0, -77.0, 94.0, -46.0, -44.0, 71.0, -36.0, -120.0, 90.0, 35.0, 5.0, 111.0, 42.0, 45.0, 94.0, 33.0, -113.0, -113.0, -122.0, -12.0, 8.0, -64.0, -82.0, 99.0, -85.0, -73.0, -76.0, -60.0, 92.0, -43.0, 21.0, 70.0, 96.0, -27.0, -22.0, 32.0, -93.0, -48.0, -92.0, -53.0, -85.0, 85.0, 120.0, 121.0, -66.0, 107.0, -89.0, -43.0, 88.0, -96.0, 49.0, -69.0, 66.0, -86.0, 29.0, 126.0, 11.0, 104.0, 63.0, -75.0, 33.0, 55.0, -25.0, -38.0, 55.0, 2.0, 21.0, -56.0, -79.0, -110.0, -26.0, -73.0, -70.0, -126.0, 59.0, -111.0, -12.0, -56.0, 86.0, -33.0, -94.0, 31.0, 25.0, -39.0, -50.0, 98.0, 115.0, 41.0, 17.0, 86.0, -82.0, -7.0, -17.0, 31.0, 56.0, -34.0, 80.0, 72.0, 76.0, 115.0, 29.0, -45.0, -80.0, -59.0, -1.0, 102.0, -110.0, 17.0, 127.0, -14.0, 4.0, -41.0, -42.0, 83.0, -119.0, -83.0, 53.0, 121.0, 44.0, -54.0, -108.0, 27.0, -6.0, -34.0, -29.0, 112.0, 110.0, 126.0, -71.0, 102.0, 98.0, -40.0, -128.0, -64.0, 39.0, -122.0, -16.0, -86.0, -78.0, 37.0, -32.0, -55.0, 23.0, -14.0, -1.0, 58.0, 111.0, 92.0, 83.0, -5.0, 91.0, 114.0, 107.0, -113.0, 18.0, -7.0, 126.0, 106.0, 81.0, -86.0, -118.0, 113.0, 109.0, -31.0, 19.0, -78.0, 23.0, -123.0, 81.0, 111.0, 60.0, 5.0, 110.0, -94.0, 45.0, 105.0, -67.0, -77.0, 66.0, -1.0, 12.0, 122.0, 85.0, 105.0, -37.0, 117.0, 74.0, -56.0, -82.0, -23.0, 89.0, 45.0, 41.0, 8.0, -102.0, 85.0, -49.0, 127.0, 1.0, -113.0, -104.0, -30.0, -26.0, 20.0, -70.0, 54.0, 3.0, 77.0, -107.0, 117.0, 37.0, 110.0, 61.0, 69.0, 95.0, -66.0, -43.0, 34.0, 80.0, 70.0, -128.0, -89.0, 33.0, -62.0, 17.0, -13.0, -120.0, -7.0, -81.0, -80.0, -109.0, -99.0, -99.0, -50.0, -2.0, 108.0, 94.0, 107.0, -32.0, 33.0, -94.0, 87.0, -24.0, -115.0, 117.0, -37.0, 54.0, -89.0, -12.0, -50.0, 111.0, 90.0, -58.0, 1.0, -31.0, -18.0, -117.0, 24.0, -30.0, -69.0, -26.0, -77.0, 63.0, -80.0, 97.0, -125.0, 7.0, -20.0, 116.0, -6.0, -63.0, -6.0, 35.0, -24.0, 75.0, 76.0, 44.0, -98.0, 94.0, 7.0, 106.0, -55.0, 31.0, -83.0, 81.0, -86.0, 36.0, 46.0, 7.0, 9.0, -24.0, 19.0, 79.0, -116.0, 116.0, 50.0, 42.0, 26.0, 10.0, 49.0, -21.0, -72.0, -107.0, 75.0, 114.0, -10.0, 114.0, -117.0, -96.0, -73.0, 47.0, -122.0, -27.0, -104.0, -56.0, -47.0, 22.0, -63.0, 70.0, 127.0, 21.0, -56.0, -115.0, 44.0, -37.0, -45.0, -85.0, 32.0, 61.0, 107.0, -38.0, -7.0, 121.0, 126.0, 91.0, -80.0, 24.0, 91.0, -9.0, 73.0, 96.0, 80.0, -68.0, -4.0, 22.0, 59.0, -74.0, 86.0, -31.0, -75.0, 58.0, -6.0, 92.0, 93.0, 6.0, -118.0, -103.0, -119.0, 67.0, -20.0, 58.0, 60.0, 89.0, -90.0};
+int8_t testInputVector1[] ={96.0, -15.0, -6.0, 54.0, -101.0, -23.0, 108.0, -90.0, -123.0, 67.0, 59.0, -103.0, -56.0, 54.0, -15.0, 97.0, -86.0, 66.0, 65.0, 24.0, -118.0, 61.0, -110.0, -95.0, -96.0, -15.0, 85.0, -33.0, -91.0, 122.0, 39.0, 35.0, -84.0, 125.0, 0.0, -89.0, 88.0, 123.0, -119.0, 4.0, -108.0, 86.0, -2.0, 120.0, 113.0, 5.0, 25.0, -110.0, 38.0, -8.0, 108.0, -97.0, -39.0, -104.0, 61.0, -87.0, 80.0, -22.0, 29.0, 61.0, 45.0, 118.0, -104.0, 1.0, 78.0, 124.0, 75.0, 0.0, 93.0, 118.0, -1.0, 8.0, 51.0, 75.0, -77.0, 66.0, -1.0, 56.0, 23.0, 17.0, -3.0, -1.0, -106.0, 88.0, 54.0, -49.0, 103.0, -21.0, 121.0, 68.0, -86.0, 66.0, -20.0, 76.0, 17.0, 106.0, 20.0, -93.0, -83.0, -57.0, -107.0, 83.0, 89.0, -12.0, 127.0, -8.0, -45.0, 99.0, 88.0, -76.0, 42.0, -91.0, -76.0, 12.0, 119.0, -52.0, -50.0, 112.0, -42.0, 71.0, -74.0, 42.0, 65.0, 72.0, 88.0, -114.0, -88.0, 34.0, -73.0, -25.0, 3.0, 30.0, 25.0, -87.0, 123.0, 60.0, 63.0, -20.0, -78.0, 29.0, 96.0, -32.0, 102.0, -31.0, 97.0, -117.0, 116.0, -56.0, -5.0, 114.0, -102.0, 3.0, -70.0, -64.0, -103.0, 18.0, 101.0, 6.0, -111.0, -65.0, -115.0, 110.0, 57.0, 121.0, -59.0, 57.0, 103.0, -125.0, 122.0, 100.0, -29.0, 122.0, 115.0, 46.0, 75.0, 1.0, -15.0, 3.0, -43.0, -115.0, -102.0, 29.0, -28.0, -118.0, -7.0, 34.0, 50.0, 8.0, -37.0, 29.0, -13.0, 114.0, 63.0, -110.0, -31.0, -70.0, -86.0, 82.0, 25.0, 55.0, 28.0, 107.0, 105.0, -64.0, -40.0, -17.0, 52.0, 2.0, 56.0, -77.0, -60.0, -53.0, -28.0, 110.0, -38.0, 48.0, -60.0, -73.0, 94.0, -18.0, 68.0, -51.0, -55.0, 72.0, 31.0, 16.0, -106.0, -61.0, 119.0, 1.0, 45.0, 43.0, -36.0, 122.0, -13.0, 65.0, 56.0, -32.0, 92.0, -25.0, 118.0, 112.0, -110.0, -22.0, 3.0, -64.0, 9.0, 94.0, 106.0, 14.0, -12.0, -79.0, -108.0, 77.0, -6.0, -51.0, 44.0, -44.0, 69.0, 13.0, 32.0, -40.0, 35.0, 99.0, -62.0, -47.0, 11.0, -78.0, -80.0, 20.0, 113.0, 37.0, 79.0, -39.0, -90.0, 14.0, -67.0, -118.0, -91.0, -10.0, 33.0, -124.0, -86.0, 127.0, -97.0, 1.0, 29.0, 126.0, -18.0, -48.0, -77.0, 59.0, -2.0, -74.0, 113.0, -84.0, -96.0, -79.0, -116.0, 43.0, 79.0, 80.0, -64.0, -78.0, 13.0, -66.0, -83.0, -30.0, -85.0, -12.0, 60.0, 104.0, -121.0, 103.0, 59.0, -16.0, -109.0, 76.0, -93.0, 101.0, 29.0, 46.0, 124.0, -39.0, 88.0, 127.0, -8.0, -87.0, 114.0, -66.0, -16.0, 109.0, 68.0, 66.0, 19.0, 5.0, -47.0, -108.0, 116.0, 20.0, -12.0, 118.0, -97.0, -75.0, 1.0, 19.0, 39.0, -107.0, 41.0, -67.0, -59.0, -122.0, 17.0, 23.0, -74.0, 2.0, -40.0, -36.0, -35.0, 1.0, -55.0, 25.0, -28.0, -48.0, 60.0, -13.0, -95.0, 51.0, -121.0, -93.0, -42.0, 13.0, 113.0, -77.0, 0.0, -97.0, -99.0, 86.0, -10.0, 35.0, 46.0, -128.0, -22.0, 53.0, 91.0, 82.0, 68.0, -50.0, 107.0, 108.0, -80.0, 12.0, -102.0, 107.0, 11.0, 6.0, -16.0, 79.0, 74.0, 63.0, -59.0, -11.0, -97.0, -104.0, 1.0, -83.0, -50.0, 112.0, -62.0, 112.0, -102.0, 47.0, -115.0, -55.0, -80.0, -106.0, 45.0, 79.0, -31.0, -121.0, 41.0, -117.0, -26.0, 114.0, 42.0, 34.0, 78.0, 62.0, 36.0, -117.0, -34.0, -82.0, -42.0, 53.0, -92.0, 82.0, 7.0, -121.0, 84.0, 99.0, -63.0, -40.0, 95.0, 112.0, -47.0, 96.0, 97.0, 94.0, 38.0, -67.0, -61.0, -59.0, -42.0, -119.0, 61.0, 32.0, 9.0, -120.0, 42.0, 76.0, 92.0, -47.0, 19.0, 71.0, 44.0, 55.0, -77.0, 53.0, 126.0, -87.0, 17.0, 14.0, -92.0, -1.0, 9.0, -102.0, -105.0, -52.0, -58.0, -25.0, 5.0, 113.0, -80.0, 106.0, -80.0, -52.0, -37.0, 40.0, 54.0, -70.0, -110.0, -55.0, -108.0, -101.0, -23.0, -47.0, 111.0, -62.0, -23.0, -113.0, -91.0, -94.0, 5.0, -91.0, -7.0, 83.0, -14.0, -86.0, -103.0, -34.0, 10.0, 119.0};
+void* testInputVector[2] = {testInputVector0, testInputVector1};
@@ -0,0 +1,4 @@
+#define OUTPUTTYPE int8_t
+#define ISOUTPUTFLOAT 0
+int8_t testOutputVector0[] ={73.0, 9.0, 19.0, 1.0, -30.0, -44.0, 33.0, 12.0, 3.0, 63.0, 33.0, -12.0, 24.0, 48.0, 31.0, 7.0, 14.0, 42.0, -16.0, -16.0, 4.0, 35.0, 7.0, -34.0, -64.0, 37.0, 69.0, 7.0, -39.0, 19.0, 53.0, -3.0, -49.0, 61.0, 42.0, 13.0, 19.0, 35.0, -26.0, 43.0, 7.0, 12.0, 34.0, 80.0, -4.0, 44.0, 50.0, 7.0, -28.0, 39.0, 17.0, -57.0, 29.0, 6.0, 62.0, -44.0, 68.0, 22.0, -23.0, 5.0, 56.0, 48.0, 9.0, 3.0, 19.0, 13.0, 12.0, 2.0, 21.0, 21.0, 1.0, 7.0, 7.0, 15.0, -15.0, 6.0, 3.0, 11.0, 10.0, 3.0, -6.0, -3.0, -22.0, 8.0, 15.0, -14.0, 23.0, 1.0, 15.0, 8.0, -7.0, 7.0, 1.0, 16.0, 3.0, 20.0, -2.0, -18.0, -11.0, -5.0, -12.0, 16.0, 9.0, -2.0, 25.0, 0.0, -6.0, 22.0, 21.0, -10.0, 12.0, -7.0, -6.0, 4.0, 22.0, -8.0, -9.0, 14.0, -11.0, 12.0, -11.0, 12.0, 4.0, 4.0, 8.0, -22.0, -13.0, 12.0, -108.0, -21.0, -16.0, 127.0, -65.0, -96.0, 127.0, 127.0, -29.0, 70.0, -128.0, -62.0, 127.0, -108.0, 69.0, -97.0, 88.0, -73.0, 127.0, 67.0, -61.0, 2.0, 32.0, -42.0, -94.0, 61.0, -108.0, -70.0, 127.0, 70.0, -59.0, 60.0, -12.0, 127.0, 127.0, 127.0, -128.0, -41.0, -6.0, -92.0, 121.0, 8.0, -106.0, 127.0, 3.0, -45.0, -27.0, -62.0, 98.0, -37.0, 14.0, 22.0, 32.0, 4.0, -33.0, -28.0, -89.0, -20.0, -46.0, -47.0, -112.0, 127.0, 99.0, 127.0, -4.0, -1.0, -51.0, -37.0, 8.0, -15.0, 47.0, -8.0, 48.0, 0.0, 68.0, 15.0, 6.0, 32.0, 56.0, -31.0, 53.0, 11.0, -22.0, -28.0, 28.0, 53.0, 13.0, -3.0, -55.0, -77.0, 31.0, -36.0, -4.0, -70.0, 19.0, -26.0, 17.0, -14.0, 1.0, -27.0, -1.0, 33.0, 44.0, 5.0, -29.0, 81.0, 33.0, 61.0, 44.0, 27.0, -3.0, 1.0, 45.0, 72.0, -1.0, -14.0, 39.0, 15.0, 41.0, 71.0, 68.0, -8.0, -38.0, -50.0, -25.0, 65.0, -54.0, 6.0, 127.0, -18.0, 95.0, 15.0, 31.0, 49.0, -16.0, 65.0, 10.0, 68.0, 70.0, -75.0, -112.0, 66.0, 127.0, 41.0, 83.0, 70.0, 22.0, 127.0, -76.0, -8.0, 13.0, -4.0, -24.0, -123.0, -21.0, 65.0, -66.0, -25.0, 5.0, 127.0, -6.0, -49.0, -23.0, 75.0, 29.0, 3.0, 127.0, 16.0, -1.0, -43.0, -13.0, 127.0, 127.0, 28.0, -15.0, -44.0, 126.0, 41.0, 10.0, -53.0, -123.0, 94.0, 127.0, 104.0, -66.0, 72.0, 99.0, -65.0, -13.0, 127.0, -13.0, 125.0, 50.0, -11.0, 58.0, 29.0, 10.0, 19.0, 26.0, -20.0, 45.0, 21.0, 30.0, 73.0, 15.0, 61.0, 37.0, -11.0, -35.0, -33.0, 71.0, 28.0, 17.0, 44.0, -56.0, 13.0, -9.0, 47.0, 18.0, -63.0, -16.0, -23.0, -20.0, -23.0, -12.0, 31.0, -14.0, 33.0, -41.0, 30.0, 9.0, 41.0, 11.0, 37.0, 30.0, -30.0, 10.0, 14.0, 5.0, 45.0, -71.0, -51.0, 5.0, -10.0, 46.0, -20.0, -34.0, -25.0, -50.0, 5.0, -33.0, -16.0, -13.0, -48.0, -1.0, 57.0, 68.0, 69.0, -1.0, -30.0, -11.0, 73.0, -70.0, -67.0, -16.0, 15.0, 10.0, -58.0, -33.0, -4.0, 67.0, 52.0, -76.0, -25.0, -82.0, -80.0, -74.0, -50.0, -59.0, 3.0, -63.0, 0.0, -41.0, -34.0, -32.0, -105.0, -56.0, -82.0, 56.0, 16.0, -64.0, -83.0, 16.0, -89.0, 1.0, 71.0, 21.0, -49.0, 62.0, 14.0, 46.0, -103.0, -23.0, -99.0, -3.0, -34.0, -49.0, 41.0, -13.0, -75.0, 10.0, 37.0, -15.0, -94.0, 80.0, 58.0, -24.0, 39.0, 32.0, 49.0, -36.0, -128.0, -128.0, -23.0, 15.0, -120.0, 75.0, -76.0, -89.0, -128.0, 15.0, -50.0, -9.0, -122.0, -73.0, -36.0, -2.0, -56.0, -37.0, 80.0, 46.0, -128.0, -84.0, -3.0, -124.0, -76.0, -89.0, -80.0, -60.0, 4.0, -105.0, -63.0, 47.0, 114.0, -24.0, -32.0, -73.0, -8.0, -71.0, 33.0, 58.0, -26.0, -128.0, -79.0, -91.0, -60.0, -108.0, -9.0, -1.0, -128.0, -15.0, -114.0, -30.0, -31.0, -36.0, -128.0, -98.0, -46.0, -3.0, -108.0, -62.0, -20.0, 27.0, -25.0};
+void* testOutputVector[1] = {testOutputVector0};
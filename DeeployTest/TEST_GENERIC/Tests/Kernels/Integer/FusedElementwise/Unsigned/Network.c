@@ -0,0 +1,47 @@
+#include <stdio.h>
+    #include <stdlib.h>
+    #include <math.h>
+    #include "DeeployBasicMath.h"
+
+    #include "Network.h"
+    #include "NetworkConstants.h"
+
+    int8_t* DeeployNetwork_input_0;
+int8_t* DeeployNetwork_input_1;
+int8_t* DeeployNetwork_output_0;
+void* DeeployNetwork_inputs[2];void* DeeployNetwork_outputs[1];
+        void RunNetwork(__attribute__((unused)) uint32_t core_id, __attribute__((unused)) uint32_t numThreads){
+        {
+
+// Fused Elementwise (Name: _FUSE_ELEMENTWISE_PASS_0, Op: FusedElementwise)
+BEGIN_SINGLE_CORE
+    for (uint32_t i = 0; i < 512; i++) {
+
+
+        int32_t x0 = (int32_t) DeeployNetwork_input_0[i] + 128;
+        int32_t x1 = (int32_t) DeeployNetwork_input_1[i] + 128;
+        int32_t x2 = (int32_t) DeeployNetwork_rqs0_mul_tensor[((i / (8 * 8)) % 8)];
+        int32_t x3 = (int32_t) DeeployNetwork_rqs0_add_tensor[((i / (8 * 8)) % 8)];
+        int32_t x4 = (int32_t) DeeployNetwork_rqs1_mul_tensor[((i / (8 * 8)) % 8)];
+        int32_t x5 = (int32_t) DeeployNetwork_rqs1_add_tensor[((i / (8 * 8)) % 8)];
+        int32_t t0 = (x0 * x2 + x3 + 32) >> 6;
+        t0 = CLAMP(t0, 0, 255);
+        int32_t t1 = t0 + x1;
+        int32_t t2 = (t1 * x4 + x5 + 64) >> 7;
+        t2 = CLAMP(t2, 0, 255);
+        DeeployNetwork_output_0[i] = (int8_t) (t2 + -128);
+
+    }
+END_SINGLE_CORE
+
+}
+
+        }
+        
+        void InitNetwork(__attribute__((unused)) uint32_t core_id, __attribute__((unused)) uint32_t numThreads){
+        DeeployNetwork_input_0 = (int8_t*) deeploy_malloc(1 * 512);
+DeeployNetwork_input_1 = (int8_t*) deeploy_malloc(1 * 512);
+DeeployNetwork_output_0 = (int8_t*) deeploy_malloc(1 * 512);
+DeeployNetwork_inputs[0] = (void*) DeeployNetwork_input_0;DeeployNetwork_inputs[1] = (void*) DeeployNetwork_input_1;DeeployNetwork_outputs[0] = (void*) DeeployNetwork_output_0;
+    }
+    
\ No newline at end of file
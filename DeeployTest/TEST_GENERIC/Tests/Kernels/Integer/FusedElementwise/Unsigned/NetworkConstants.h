@@ -0,0 +1,10 @@
+
+    #ifndef __DEEPLOY_CONSTANTS_HEADER__
+    #define __DEEPLOY_CONSTANTS_HEADER__
+    static int32_t DeeployNetwork_rqs0_mul_tensor[8] = {89, 67, 37, 25, 38, 51, 62, 99};
+static int32_t DeeployNetwork_rqs0_add_tensor[8] = {-445.0, 2613.0, -1258.0, -875.0, 418.0, 1734.0, -1984.0, 1089.0};
+static int32_t DeeployNetwork_rqs1_mul_tensor[8] = {27, 41, 119, 104, 94, 106, 22, 78};
+static int32_t DeeployNetwork_rqs1_add_tensor[8] = {783.0, 287.0, 2023.0, -104.0, -470.0, -636.0, -704.0, 2496.0};
+
+    #endif
+    
\ No newline at end of file
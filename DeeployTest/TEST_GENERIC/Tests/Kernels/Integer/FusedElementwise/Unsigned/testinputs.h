@@ -0,0 +1,3 @@
+int8_t testInputVector0[] ={79.0, -80.0, 26.0, -62.0, 60.0, -21.0, 49.0, -92.0, 10.0, 113.0, 9.0, -31.0, -23.0, -88.0, -73.0, -50.0, 80.0, 14.0, 94.0, 106.0, 112.0, 127.0, -21.0, -21.0, -121.0, 83.0, 23.0, 28.0, 119.0, -88.0, 48.0, 38.0, -4.0, -3.0, 102.0, 90.0, -42.0, -105.0, -50.0, 108.0, 6.0, 92.0, -92.0, 110.0, -22.0, 11.0, 119.0, -31.0, -79.0, 97.0, -34.0, 13.0, 32.0, -34.0, 121.0, 36.0, -16.0, -64.0, -65.0, 8.0, -83.0, 107.0, 73.0, 63.0, 6.0, -90.0, -109.0, -9.0, -14.0, 116.0, -57.0, -17.0, -97.0, -58.0, 74.0, -75.0, 119.0, -25.0, -96.0, -5.0, 119.0, -117.0, -84.0, 83.0, -16.0, 7.0, -3.0, 127.0, 112.0, 31.0, 45.0, -102.0, 61.0, -66.0, 121.0, 92.0, 44.0, -28.0, -5.0, -19.0, 105.0, -80.0, 87.0, 109.0, -89.0, -62.0, -57.0, -9.0, -114.0, 29.0, 116.0, -66.0, 81.0, 113.0, 50.0, 54.0, 125.0, 83.0, -77.0, 0.0, -28.0, -40.0, -60.0, -13.0, 18.0, 1.0, 98.0, 78.0, 42.0, -93.0, -1.0, 31.0, 41.0, -64.0, -20.0, -55.0, 13.0, 27.0, 0.0, -84.0, -2.0, -128.0, 31.0, 98.0, 116.0, 89.0, -83.0, 76.0, -115.0, 6.0, -16.0, 16.0, 56.0, 85.0, -93.0, 61.0, 116.0, 33.0, -97.0, -52.0, 36.0, -21.0, -107.0, 95.0, -72.0, 113.0, -51.0, -55.0, -30.0, -90.0, 37.0, -21.0, 98.0, 23.0, -104.0, 26.0, 101.0, -4.0, 27.0, -89.0, -40.0, -99.0, -100.0, 77.0, 43.0, 121.0, -82.0, -77.0, 35.0, 61.0, -48.0, 40.0, -116.0, 120.0, -30.0, -78.0, 126.0, 64.0, -31.0, 103.0, 63.0, 27.0, -36.0, -20.0, -102.0, 73.0, -13.0, 118.0, 10.0, 79.0, 70.0, -73.0, -66.0, -35.0, -53.0, -45.0, 37.0, 98.0, -86.0, -124.0, 14.0, 91.0, -27.0, 26.0, 102.0, -88.0, 102.0, 17.0, 66.0, -3.0, -19.0, 0.0, 15.0, -109.0, -26.0, 19.0, 93.0, -123.0, -120.0, -7.0, 78.0, 73.0, 112.0, 87.0, -116.0, 96.0, 83.0, -113.0, 40.0, -65.0, 92.0, 56.0, -108.0, -17.0, -117.0, 18.0, -12.0, -104.0, 40.0, 31.0, -88.0, 1.0, 6.0, -40.0, -21.0, -113.0, -64.0, -72.0, -72.0, 19.0, -45.0, -41.0, -124.0, 93.0, 115.0, -122.0, -116.0, 53.0, -35.0, -29.0, -121.0, -62.0, -67.0, -93.0, -80.0, -92.0, -28.0, -80.0, -45.0, -108.0, 1.0, -24.0, -31.0, -127.0, -39.0, 93.0, -87.0, -119.0, -64.0, 52.0, 5.0, -2.0, -49.0, -109.0, 58.0, -79.0, -91.0, 56.0, 74.0, -44.0, -77.0, 64.0, 86.0, -91.0, -40.0, 62.0, -55.0, 58.0, -97.0, 31.0, 94.0, -120.0, 52.0, 9.0, 89.0, 36.0, -49.0, 42.0, 69.0, 41.0, -99.0, 72.0, 105.0, -3.0, -77.0, -51.0, -94.0, 91.0, 28.0, 1.0, -27.0, -35.0, 127.0, -47.0, -117.0, -85.0, 30.0, -89.0, -13.0, 50.0, -28.0, 97.0, 24.0, -38.0, 1.0, -27.0, -103.0, -107.0, -21.0, 3.0, 126.0, -127.0, -47.0, -71.0, -120.0, -21.0, 97.0, -21.0, -64.0, 28.0, 92.0, 110.0, -123.0, -86.0, -11.0, -1.0, -27.0, -40.0, 120.0, 31.0, 68.0, 10.0, 63.0, 25.0, -3.0, 31.0, -100.0, -27.0, -94.0, 124.0, 67.0, 67.0, -89.0, -72.0, 73.0, 43.0, 2.0, 41.0, -14.0, -52.0, -72.0, 45.0, -46.0, 69.0, 46.0, -62.0, -5.0, -14.0, 13.0, -92.0, -117.0, 61.0, -121.0, 108.0, -98.0, -32.0, -118.0, -70.0, 84.0, -68.0, 72.0, -120.0, 7.0, 98.0, 122.0, 104.0, 38.0, 87.0, -92.0, -52.0, 77.0, 81.0, 8.0, 58.0, -116.0, -66.0, 115.0, -5.0, 16.0, 68.0, 2.0, 53.0, 117.0, -107.0, 45.0, 40.0, 19.0, 37.0, -102.0, -108.0, 93.0, 2.0, 52.0, -101.0, 83.0, 46.0, 24.0, -42.0, -21.0, -117.0, 113.0, 119.0, 104.0, -67.0, 12.0, -111.0, -55.0, -124.0, 91.0, 70.0, 26.0, 26.0, -51.0, -77.0, 32.0, 59.0, -101.0, -17.0, 107.0, 19.0, 9.0, -8.0, -52.0, -2.0, -5.0, 23.0, 84.0, 111.0, -87.0, -45.0, 84.0, -11.0, 40.0, -91.0, 43.0, 104.0, 24.0, 45.0, 92.0, 85.0, 109.0, 59.0, -91.0, -71.0, -114.0, -69.0, 27.0, 121.0, -4.0, -93.0, 94.0, 0.0};
+int8_t testInputVector1[] ={-98.0, -37.0, 100.0, -31.0, 39.0, 90.0, 77.0, -106.0, -36.0, -14.0, 94.0, 108.0, 121.0, 114.0, -48.0, 93.0, 97.0, 22.0, 44.0, 64.0, 91.0, 117.0, -65.0, 75.0, -61.0, -74.0, 45.0, -9.0, 69.0, -61.0, -42.0, 112.0, -54.0, 20.0, 122.0, -31.0, 49.0, -16.0, -117.0, -60.0, -20.0, -94.0, 127.0, -102.0, 18.0, 40.0, -65.0, -56.0, 84.0, -100.0, 121.0, -18.0, -4.0, 83.0, -71.0, -31.0, 25.0, 98.0, -120.0, 123.0, -61.0, -128.0, 20.0, 92.0, 124.0, 13.0, 79.0, 43.0, -82.0, -67.0, -77.0, 22.0, -46.0, 94.0, 115.0, 47.0, -25.0, 94.0, 75.0, -71.0, -98.0, 63.0, 1.0, 79.0, -31.0, 2.0, 117.0, 61.0, 67.0, 51.0, 18.0, -127.0, 8.0, -109.0, 11.0, 33.0, -25.0, -14.0, 86.0, 63.0, 98.0, 58.0, -115.0, 103.0, -62.0, -9.0, 44.0, -92.0, 48.0, 67.0, -22.0, -122.0, 61.0, 105.0, -106.0, 120.0, -86.0, 85.0, 101.0, -50.0, 83.0, 65.0, 74.0, -117.0, 104.0, 103.0, 27.0, 16.0, 9.0, -53.0, 115.0, -106.0, 14.0, -87.0, -83.0, 10.0, -118.0, -42.0, 25.0, 83.0, -49.0, -73.0, 0.0, 77.0, 41.0, 99.0, 102.0, -107.0, -35.0, 59.0, -6.0, 105.0, 16.0, 31.0, 102.0, 40.0, -84.0, 112.0, -120.0, 69.0, 89.0, -102.0, -36.0, -24.0, -104.0, -17.0, 43.0, -64.0, -29.0, -44.0, -25.0, -12.0, 65.0, -122.0, -70.0, -33.0, 69.0, 17.0, -98.0, 34.0, 45.0, 7.0, 84.0, 113.0, 49.0, 94.0, -26.0, -70.0, -85.0, -5.0, -126.0, 123.0, -62.0, -5.0, -52.0, 23.0, -76.0, 12.0, 4.0, 0.0, 25.0, -38.0, 52.0, -4.0, 6.0, -67.0, 13.0, 4.0, -74.0, 99.0, -81.0, -118.0, 92.0, -71.0, 57.0, -109.0, -107.0, -31.0, 98.0, -122.0, 126.0, 121.0, -82.0, 109.0, -36.0, -78.0, -1.0, -3.0, 127.0, 38.0, -35.0, -27.0, -66.0, 80.0, -76.0, 122.0, -97.0, -61.0, 62.0, 113.0, -71.0, -116.0, -48.0, -31.0, -94.0, -104.0, 107.0, -89.0, 109.0, -107.0, 126.0, 127.0, -70.0, -93.0, 104.0, -24.0, -108.0, 81.0, -25.0, -124.0, -74.0, 5.0, 70.0, 40.0, 125.0, 53.0, 44.0, -40.0, -98.0, -42.0, 39.0, 116.0, 79.0, 89.0, -35.0, 91.0, -125.0, -20.0, 54.0, 4.0, -101.0, 72.0, -92.0, -77.0, 78.0, -19.0, -93.0, -125.0, 28.0, -114.0, -9.0, -107.0, 33.0, -35.0, -52.0, 51.0, -81.0, -105.0, -14.0, 104.0, -35.0, -68.0, 6.0, -20.0, -119.0, -45.0, -24.0, 23.0, -42.0, -50.0, -128.0, -37.0, -1.0, 32.0, 96.0, 94.0, -88.0, 117.0, 80.0, 14.0, -13.0, 7.0, -26.0, -16.0, 110.0, 43.0, -60.0, -43.0, -59.0, -67.0, 50.0, -33.0, -54.0, -124.0, 29.0, 8.0, -3.0, 14.0, 36.0, 12.0, -92.0, 21.0, -71.0, 94.0, -55.0, -19.0, 67.0, 117.0, -26.0, 21.0, -52.0, -85.0, 38.0, 126.0, 57.0, 91.0, 98.0, -21.0, 90.0, 19.0, -68.0, -13.0, -113.0, 17.0, 65.0, -57.0, 65.0, 49.0, -44.0, 63.0, 18.0, 35.0, 121.0, -46.0, -107.0, 3.0, 4.0, -111.0, -45.0, -104.0, -124.0, -93.0, 115.0, 69.0, -112.0, -112.0, -76.0, -80.0, -111.0, -7.0, -103.0, -62.0, -79.0, -88.0, 5.0, 119.0, 85.0, -52.0, 61.0, -9.0, -72.0, 25.0, 91.0, -99.0, 63.0, 110.0, -93.0, 36.0, 48.0, -53.0, -79.0, 38.0, -93.0, 23.0, 63.0, 48.0, -1.0, 55.0, -34.0, -46.0, 101.0, 97.0, -61.0, 52.0, 125.0, 3.0, -16.0, 123.0, 124.0, 104.0, -16.0, -99.0, 100.0, -51.0, 64.0, -46.0, 116.0, -16.0, -74.0, 120.0, -22.0, -34.0, -61.0, -72.0, 26.0, 98.0, 112.0, -42.0, 76.0, 69.0, 10.0, -118.0, -40.0, -123.0, 92.0, 17.0, -83.0, 40.0, 52.0, 28.0, 76.0, 9.0, 12.0, 12.0, 112.0, 103.0, 51.0, -103.0, -74.0, 114.0, 10.0, 20.0, -38.0, -90.0, 109.0, 80.0, -121.0, -25.0, 31.0, -45.0, -41.0, -33.0, -26.0, 102.0, 122.0, 82.0, -55.0, 27.0, -90.0, 120.0, -41.0, -114.0, 25.0, 59.0, -46.0, 89.0, 77.0, -106.0, -106.0, -27.0, 70.0, 11.0, -78.0, -54.0, 96.0, 13.0, 29.0, -48.0, -47.0, 86.0, -41.0, 68.0};
+void* testInputVector[2] = {testInputVector0, testInputVector1};
@@ -0,0 +1,4 @@
+#define OUTPUTTYPE int8_t
+#define ISOUTPUTFLOAT 0
+int8_t testOutputVector0[] ={-62.0, -90.0, -30.0, -83.0, -33.0, -46.0, -28.0, -108.0, -63.0, -44.0, -36.0, -45.0, -40.0, -60.0, -90.0, -54.0, -21.0, -50.0, -32.0, -28.0, -22.0, -16.0, -79.0, -49.0, -107.0, -57.0, -43.0, -52.0, -27.0, -97.0, -54.0, -24.0, -71.0, -55.0, -15.0, -48.0, -61.0, -93.0, -98.0, -54.0, -61.0, -61.0, -59.0, -63.0, -62.0, -47.0, -55.0, -80.0, -64.0, -62.0, -43.0, -59.0, -50.0, -51.0, -56.0, -55.0, -58.0, -57.0, -103.0, -31.0, -96.0, -68.0, -37.0, -22.0, 13.0, -55.0, -40.0, -18.0, -60.0, -25.0, -73.0, -27.0, -76.0, -18.0, 33.0, -39.0, -11.0, -7.0, -37.0, -53.0, -34.0, -48.0, -57.0, 22.0, -44.0, -26.0, 8.0, 16.0, 18.0, -2.0, -8.0, -104.0, -6.0, -86.0, 0.0, 7.0, -22.0, -42.0, -3.0, -15.0, 28.0, -37.0, -40.0, 30.0, -78.0, -52.0, -34.0, -61.0, -52.0, 2.0, -10.0, -90.0, 16.0, 31.0, -46.0, 28.0, -31.0, 24.0, -22.0, -45.0, -11.0, -21.0, -25.0, -71.0, 11.0, 5.0, 6.0, 2.0, 89.0, -42.0, 127.0, -25.0, 92.0, -58.0, -30.0, 37.0, -45.0, 33.0, 80.0, 90.0, 11.0, -61.0, 74.0, 127.0, 127.0, 127.0, 107.0, -2.0, -26.0, 116.0, 43.0, 127.0, 103.0, 127.0, 103.0, 127.0, 41.0, 127.0, -105.0, 93.0, 127.0, -49.0, -27.0, 86.0, -78.0, 103.0, 70.0, -31.0, 14.0, -32.0, 54.0, 35.0, 127.0, -43.0, -58.0, 40.0, 127.0, 71.0, -19.0, 41.0, 77.0, 13.0, 85.0, 127.0, 126.0, 127.0, -11.0, -49.0, -2.0, 86.0, -85.0, 127.0, -75.0, 39.0, -47.0, -1.0, -17.0, 35.0, -2.0, 38.0, 45.0, -17.0, 35.0, -4.0, -20.0, -26.0, 11.0, 45.0, -52.0, 110.0, -39.0, -114.0, 59.0, -64.0, 35.0, -98.0, -70.0, 11.0, 57.0, -124.0, 112.0, 127.0, -70.0, 101.0, 8.0, -87.0, 36.0, 8.0, 127.0, 35.0, -30.0, -17.0, -44.0, 40.0, -65.0, 110.0, -44.0, -74.0, 26.0, 95.0, -28.0, -66.0, 1.0, 7.0, -101.0, -49.0, 118.0, -97.0, 106.0, -103.0, 127.0, 126.0, -82.0, -76.0, 60.0, -9.0, -62.0, 37.0, 22.0, -55.0, -70.0, 27.0, 77.0, 35.0, 106.0, 12.0, 28.0, -38.0, -80.0, 1.0, 32.0, 90.0, 27.0, 127.0, 48.0, 37.0, -119.0, 31.0, 48.0, 13.0, -104.0, 49.0, -74.0, -74.0, 45.0, -31.0, -57.0, -104.0, 24.0, -108.0, 17.0, -66.0, 34.0, -58.0, -33.0, 101.0, -74.0, -106.0, -15.0, 122.0, 0.0, -28.0, 6.0, -39.0, -39.0, -44.0, -34.0, 64.0, 24.0, -33.0, -104.0, 24.0, 60.0, 7.0, 76.0, 119.0, -66.0, 127.0, 39.0, 47.0, 127.0, 6.0, 93.0, 72.0, 127.0, 127.0, -2.0, 72.0, 77.0, 52.0, 56.0, 100.0, 105.0, -24.0, 53.0, 53.0, 15.0, 127.0, 127.0, 91.0, -14.0, 74.0, 105.0, 127.0, -43.0, 8.0, 127.0, 118.0, 50.0, 127.0, 19.0, 73.0, 127.0, 127.0, 127.0, 127.0, 93.0, -8.0, 127.0, 97.0, 107.0, -15.0, -44.0, 48.0, 54.0, 19.0, 127.0, 106.0, 1.0, 127.0, 127.0, 127.0, 99.0, -15.0, -16.0, 82.0, 66.0, -39.0, 122.0, 14.0, 22.0, 9.0, 127.0, 127.0, -115.0, -110.0, -125.0, -114.0, -128.0, -76.0, -102.0, -95.0, -124.0, -123.0, -82.0, -68.0, -81.0, -98.0, -87.0, -106.0, -120.0, -84.0, -88.0, -101.0, -77.0, -87.0, -112.0, -92.0, -85.0, -120.0, -125.0, -79.0, -127.0, -74.0, -101.0, -93.0, -112.0, -98.0, -87.0, -115.0, -66.0, -95.0, -105.0, -70.0, -54.0, -78.0, -92.0, -60.0, -89.0, -86.0, -85.0, -99.0, -77.0, -95.0, -100.0, -114.0, -56.0, -99.0, -105.0, -64.0, -99.0, -93.0, -87.0, -124.0, -83.0, -72.0, -73.0, -97.0, 51.0, 41.0, 127.0, 30.0, 101.0, -69.0, 127.0, 127.0, 72.0, 85.0, 113.0, 7.0, 127.0, 127.0, 127.0, 44.0, 127.0, 58.0, 80.0, -79.0, 80.0, 127.0, 127.0, 127.0, 29.0, -27.0, 127.0, 127.0, -68.0, 69.0, 127.0, 91.0, 84.0, 73.0, 36.0, 127.0, 127.0, 127.0, 91.0, 127.0, -37.0, 127.0, 100.0, 21.0, 127.0, 51.0, 97.0, 127.0, 127.0, 60.0, 60.0, 108.0, 127.0, 127.0, -33.0, 1.0, 52.0, 43.0, 127.0, 96.0, 68.0, 65.0, 100.0, 127.0};
+void* testOutputVector[1] = {testOutputVector0};
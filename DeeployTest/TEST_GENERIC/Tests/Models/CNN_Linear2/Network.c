@@ -0,0 +1,503 @@
+#include <stdio.h>
+    #include <stdlib.h>
+    #include <math.h>
+    #include "DeeployBasicMath.h"
+
+    #include "Network.h"
+
+    int8_t* DeeployNetwork_input_0;
+int8_t* DeeployNetwork_output_0;
+static int8_t DeeployNetwork_net_QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_0weight_tensor[432] = {-21, -20, -16, -5, -22, 7, -15, -18, 18, -8, 9, -16, -22, -13, 13, -10, 1, -9, -8, 2, -7, 13, -22, -1, -18, 24, -15, 20, -18, -20, -1, -17, 1, -22, -15, 13, -3, 0, 7, 8, 0, -6, -10, -11, -3, 14, 12, -21, 11, 9, -14, -18, -6, -1, -4, -9, -12, 19, 23, 24, 8, -18, 22, -2, -19, 1, 9, 8, 11, -13, 18, -15, 22, -5, -10, 3, 19, -9, -6, -11, -5, -17, 12, -23, -1, 16, -22, 15, 0, 10, -10, 3, 0, -20, 23, 15, 22, 19, 12, 3, 15, 7, 24, -3, -8, -13, 12, 19, -1, 9, -16, 8, -18, -8, 15, 16, 20, -4, 21, 7, -12, -10, -13, 13, -8, 8, -22, -12, 16, -8, -12, -10, 3, 0, 16, 14, 11, -13, 18, -18, 0, 15, -23, 20, -11, -20, -10, -15, 3, 11, -3, 23, -21, 17, -16, -6, 21, -18, -2, -11, -2, -21, -4, -1, 2, -16, -23, -20, 6, -18, -20, -10, -2, -11, -15, -8, -20, 9, 1, 1, -6, -20, 3, -4, 25, -6, -5, -10, -5, -3, -4, -14, -23, 19, 20, -5, 13, 2, -13, 4, -10, 14, -11, 12, 13, -17, -6, -17, 6, -2, 9, 16, 8, -8, -1, 11, 16, 17, -17, -3, -17, 16, 10, 5, 14, 9, 8, -13, -14, -10, 3, 16, -14, -8, 2, -21, -22, 19, -6, 5, -8, 15, -13, 20, 14, 2, -5, 1, 6, 7, -23, -14, -18, -4, 17, -4, 17, -2, -7, -4, 24, -11, 22, 8, -14, 20, 11, 23, -20, -14, -1, 3, -23, 24, -21, -24, -9, -6, -6, -8, 11, -12, -5, -3, -1, 24, 14, 15, -19, 15, -12, -14, 6, 4, -10, 6, -2, -5, -14, -2, -4, 0, 7, -15, 16, 4, 4, 15, 11, -18, 10, 5, -12, 7, 11, -16, -2, 5, 7, -5, -1, -5, -8, 17, 2, -23, -4, 10, -3, -13, 14, -12, 0, 13, 12, 17, -6, 21, 20, 4, 4, -23, -10, 17, 23, -5, -13, 2, -23, 4, -12, -8, 10, 12, -15, 12, 0, 21, -7, -3, 6, 16, -4, 25, -8, -10, 14, -17, -6, -21, -22, -2, 12, -5, 13, -12, -11, -16, 3, -11, 20, -19, 16, -10, -8, 23, -5, -5, -19, -1, 0, 21, -8, -5, -16, 13, -14, 22, -21, -3, 9, -1, -4, -12, 21, -16, -12, -23, 15, 16, 12, -13, 19, -17, 19, 10, -18, 14, 3, 8, -18, -19, 2, 21, 5, 15, 13, -19, -24, -23, -20, -20};
+static int32_t DeeployNetwork_net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_0mul_tensor[16] = {257.0, 257.0, 257.0, 257.0, 257.0, 257.0, 257.0, 257.0, 257.0, 257.0, 257.0, 257.0, 257.0, 257.0, 257.0, 257.0};
+static int32_t DeeployNetwork_net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_0add_tensor[16] = {-259313.0, 488814.0, 606520.0, 668457.0, -692872.0, 71446.0, -1593914.0, -1542.0, -700325.0, -997931.0, -59110.0, -546125.0, -139294.0, -1514244.0, -1596741.0, 838077.0};
+static int8_t DeeployNetwork_net_QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_1weight_tensor[4608] = {-5, -8, -9, 8, -8, 4, -9, 2, -8, 5, 8, -6, 11, 0, 6, 10, 2, 1, 7, 4, 8, 7, 6, 6, 5, -9, 4, 10, -8, -10, -3, 8, 11, 8, 5, 8, -3, -3, 10, 10, 4, 3, -4, 6, 4, 8, -7, 3, -6, -6, -7, 3, -10, -4, 0, 2, -6, 9, -6, 1, 8, 10, 6, 11, -1, 5, 2, 8, -6, -3, -7, -1, -1, 9, -6, 1, 2, 0, 5, -10, -10, 9, -9, -5, -2, 0, 2, -10, -5, 5, -4, 6, -8, -2, 4, 4, 7, 8, 6, 2, -4, -4, 9, 6, -10, 9, -4, 8, 2, 4, -8, -5, 3, 7, -5, 3, 6, 1, -5, 4, -8, 1, -2, 8, 2, -6, -9, -6, -10, -5, -1, -2, 4, 1, -3, 5, -8, -7, 8, -1, -6, 8, -3, -5, -1, 10, 3, 3, 6, 11, -4, -1, -8, 9, 3, -10, -7, 8, -7, -3, 2, 4, -4, -8, 1, 9, 3, -6, 0, -9, 6, -2, -10, -5, 9, -3, 4, 1, -3, 9, -2, 10, -6, 9, 3, -5, -2, 8, 7, 5, -4, -7, 5, -3, 10, 9, -8, -2, 7, 11, -6, 8, -2, 9, 9, 4, 8, -3, 0, 3, 9, 4, 6, 11, -3, 4, 0, 2, 3, -3, 5, 9, 1, 4, -4, 8, 0, 6, -7, 5, -6, 9, 2, -6, 7, 7, 7, -6, 3, -2, 8, -7, -8, -1, -4, 1, 11, -9, -2, -5, 6, -9, -7, 8, 11, 3, 7, 4, 1, 8, 10, 10, -6, 4, -2, -2, 0, -3, -9, 4, -5, -5, -8, 4, 4, -4, 8, -8, -4, -2, -1, 1, 1, 11, -8, 2, 8, -7, 9, -8, -6, 2, -9, -3, -6, 4, -2, -2, 0, -5, -8, -2, -7, 2, -7, 8, -1, 1, -5, -5, -9, -3, 6, -1, 9, 0, -3, -5, -2, 4, 9, -8, 0, -8, -4, 6, -6, 10, -8, 11, 10, -3, 3, -8, -2, -7, -5, -3, -6, 6, 2, -3, -1, -2, -9, -1, -10, 6, -8, 4, -6, 0, 10, 8, -5, -4, 8, 3, -1, 8, -8, 10, 9, -3, 7, -1, 4, -2, 9, 8, -4, -4, -4, 0, 1, -7, -6, 6, -3, 0, -4, 3, -3, 4, -5, 5, 0, 1, 8, -4, -2, 1, -5, 1, 9, 7, -4, -6, -5, -10, 2, -6, -3, -5, -2, 6, -1, 11, -5, 5, -2, 4, 5, -6, -7, -9, 10, 1, 2, -6, 10, -9, 7, 3, 11, -1, 11, 4, 0, -10, 2, 9, 8, -9, 7, 11, -1, 3, -3, -8, 4, 0, 6, -2, 6, -2, -8, 3, -2, -5, -3, 11, -4, 4, 8, -9, 5, 8, -3, 7, -1, 1, 11, 4, 5, 9, -4, 5, 6, -8, 7, 1, -7, -1, 1, 9, -6, 1, 9, -2, 9, -1, 10, 0, 11, -3, -3, -7, 5, 7, -7, -7, -2, -5, 5, 10, 0, 2, -9, 10, 3, -4, 9, -4, 9, -7, 9, -8, -5, -6, -7, 9, -5, -8, 11, 1, -1, 2, 8, -10, 8, -7, -5, 10, -4, -2, 6, 5, -2, -3, -4, -8, -6, 2, 2, 3, -5, 3, -2, 11, 3, 10, -10, -2, -4, -10, -4, -4, -3, -10, 3, -8, -6, 1, -8, 4, 0, 2, 9, -5, -7, -3, 0, 7, 2, 8, 1, -9, -7, 0, 8, -2, -5, 5, -4, 11, -10, -3, -1, -3, 0, -7, 0, -2, -8, -10, 4, 9, 6, 7, -9, 0, -5, 4, 6, 8, 0, 8, 2, -6, 4, 7, -3, 10, -4, 0, 10, 9, 1, 10, -3, -3, -9, -5, 0, 7, -1, -6, 2, 2, -8, 10, 5, -4, 8, 2, 3, 8, 7, -6, -5, 11, 0, 5, 9, 1, 4, 7, 7, 5, 6, -6, 2, -6, -3, -3, 4, 5, 2, 4, 2, 3, 8, 2, -7, 9, 7, -1, -6, -9, 0, 8, 9, 3, 5, -8, -9, -2, -7, 5, 5, -9, 4, -1, 11, -4, -1, -7, 8, -4, -9, -8, -4, -4, -5, 1, 7, -7, 7, 6, 11, 4, 5, -8, -8, 5, 11, -8, 5, 8, -1, -8, 10, 3, -4, -5, -3, -9, -4, 7, -4, 2, 6, 1, -9, 1, 4, 3, -1, -7, 10, -1, -1, 9, 0, -6, -3, -9, -5, -3, -6, -4, 9, 7, -4, -2, 9, 2, 11, 10, 9, 5, 0, 1, 4, -5, -10, 11, 4, -2, -3, -1, -7, 9, 6, -4, -4, 2, -7, 2, -5, -6, -3, 10, 8, 10, -7, 8, 7, 8, 3, -10, 1, 9, 4, -8, 8, -4, -6, -6, 8, -6, -1, 4, 9, -2, 3, -2, -8, 2, -9, 1, -4, -8, 3, 0, 10, 10, 7, 5, -4, 11, -2, 0, 6, 11, 9, -8, 7, 6, 1, 5, 7, -1, 1, 11, 11, -9, -7, 4, 1, 2, -7, -2, 0, 5, 9, 4, -3, 8, 3, -10, -2, 3, 0, 9, 2, 0, 8, 6, 9, -1, 3, -6, -9, 11, 4, -1, -5, 6, -7, 0, -7, 11, -7, -3, 2, 10, 8, 4, 10, -5, -3, 11, -1, -3, -6, 1, -2, 2, 6, 1, 4, -1, -6, 9, 3, 5, -4, -5, 4, -5, -5, 0, -4, 4, 5, 10, 2, -9, -8, -1, 10, -1, -6, -4, 5, 3, 10, -3, -4, 3, 2, -5, 3, -4, -3, 1, 10, 2, -3, 4, -1, -5, -4, -9, 0, -7, 3, 1, -6, 2, 7, -4, 6, 2, -2, 8, -5, 5, -3, -6, -2, -1, -7, 3, 5, -3, 4, 2, -10, 0, -2, 2, 0, 1, -7, -8, 9, -8, -7, 5, -5, -7, -7, -9, -3, -9, -4, 6, -1, 10, 5, -1, 7, -3, 4, 5, 9, -10, 7, 6, -10, -7, 9, -5, 3, 4, -7, 6, -5, -5, -2, -5, -4, 1, 5, 2, -3, -9, 9, -4, -6, 2, 0, -7, -6, 7, -7, -8, 4, -4, 2, 11, 8, 11, 1, 0, -1, -10, -2, 7, 0, 5, 5, 1, 6, 9, 7, -5, -8, -2, 0, 4, 0, 8, 9, -8, 0, -3, -8, -2, -4, 10, 1, 8, 2, 0, -7, 5, 2, 11, -9, 8, 6, 10, 2, -8, -5, 0, 1, 7, 8, -8, 0, 11, 5, 1, 1, -10, 11, 11, 5, -8, 8, 1, -9, -6, 9, 2, -3, -10, 3, -3, -4, 7, 3, 1, 9, 1, 3, 7, -8, -5, 9, -7, 11, 1, -10, -4, 2, 4, -1, -2, 10, -2, -8, 5, -2, -2, 6, -6, 7, -9, 8, 9, 0, 2, -6, 8, 10, 0, -6, 4, -1, -6, -2, 8, -4, 7, -6, 9, -1, 6, 4, 1, -6, 9, 5, -8, -5, -3, -3, -4, -4, -1, -5, 0, -9, 1, 4, -2, -10, 7, -5, 4, -1, 8, -9, 7, -6, -8, 2, 8, -7, 7, -4, -4, -10, 6, 8, 8, -5, 2, 4, -4, -8, -4, 2, -3, 2, 8, 1, -1, 8, -6, 6, -10, -1, -4, -2, -2, 9, 1, 2, -3, -4, 9, -1, 9, -6, 6, -6, 6, -10, -1, 9, -8, 10, -7, 7, -5, -9, -1, -9, 10, -7, 2, -7, -1, -9, 9, -3, 2, 4, 0, -6, 10, 5, 0, -5, -9, -3, 9, -9, 0, -5, 4, 9, 0, -5, 10, 10, 10, 7, 5, -3, 9, 8, 2, 0, 2, -5, -9, -2, 8, 9, 3, -8, -5, 4, 4, 11, 10, -4, -3, 5, 11, -8, 11, 7, -5, -8, -9, -9, 8, -2, 0, 2, -5, -3, 5, -8, -4, 5, -2, 2, 2, -1, -5, -4, 6, 5, -9, 3, -3, -9, 1, -3, -4, 9, 3, 0, -5, 5, -5, 4, -1, 11, -2, 6, 9, -5, 9, -4, -9, 1, -1, 10, 7, -5, 5, 6, 3, 5, -1, 5, -3, -7, -9, 1, -6, 9, 8, -6, -1, 9, -5, 8, 7, 5, -4, 1, 5, 7, 0, -9, 10, 11, -7, 0, -3, 6, 1, 2, 5, 8, 9, 8, 3, -4, 5, -4, -9, 5, 9, -6, 9, -4, -9, -2, -5, 0, -7, 4, 9, -2, 0, 9, 4, 10, 1, -10, -6, -6, 8, -4, 4, -3, 0, -9, -4, 8, 0, -7, 7, 10, 8, -6, 4, -8, 4, -8, 5, -5, -9, 8, -3, 4, 4, 2, -9, -2, 0, 10, 10, 5, 9, 10, -3, 3, -5, -4, -3, -5, -1, 1, -1, 8, 0, 6, -6, -5, 5, 11, 5, 7, 9, -6, -5, -6, 7, 4, 7, 2, 8, 3, 3, -9, -4, 2, -6, 5, 11, -6, -10, -2, -2, -2, 8, 5, -7, 7, -2, 2, 11, 7, -8, 2, 2, -7, -5, -1, -4, 7, 4, 10, 2, 7, -10, -2, 5, 11, -4, -1, -10, 8, 4, 11, 2, -6, 3, 0, -4, -6, -1, 5, -10, -7, -7, -6, -1, -7, -3, 1, 5, -2, 8, 7, 5, -10, 2, -6, -2, 11, -6, -2, 3, 4, 4, 3, 8, 2, 1, -9, 11, -7, 9, 3, 1, 10, 6, -9, -1, -8, 7, 6, 6, 6, -6, 0, -3, -1, -4, -10, -5, -3, 11, 3, -5, -1, -3, -9, 1, 7, 6, 2, 6, -3, -6, -4, 1, -2, 2, -3, -7, 1, 6, -4, 0, 9, -2, 2, -3, 8, 9, -3, -4, 9, -5, 3, -7, 3, 2, 3, -7, 1, -5, -4, 6, -9, 3, 6, -7, -3, 9, 8, 3, 5, -6, -7, 6, 9, 7, 2, 6, 2, 2, 1, -4, 5, 2, 2, -8, -4, 5, -10, -9, -2, 1, -5, -7, -1, -1, -7, 1, 3, 10, -6, -2, -2, 8, -6, -7, -7, 3, -10, 1, 11, 1, -9, -3, -6, -6, 7, -1, 5, 2, 11, -9, -8, 2, 5, 4, 4, 11, 1, -9, 3, -4, 0, 5, 9, -2, 10, 1, 7, 7, -6, -6, 2, -3, -9, -2, -7, -9, 3, -3, -7, 9, -2, 10, 4, -7, 10, 5, -9, 6, -3, 11, -7, -9, 4, 10, -2, -6, -4, 7, 4, -2, -2, -6, -5, -10, 4, -8, -2, 10, -3, -5, 10, 3, 5, -7, -8, -1, -8, -1, 9, -7, 1, -3, 1, 8, -6, -5, -7, -8, -7, -6, 1, -5, -8, 5, 9, -8, -3, 0, -4, 11, 8, -1, -2, 8, -9, -4, 8, 10, -10, 9, -1, -5, -2, 9, -1, -1, 3, 6, 7, -10, -4, -1, 1, 10, 8, 2, -7, 9, -10, -3, 2, -5, 7, 11, -1, 9, 7, -3, -9, 3, 11, 2, -1, 2, 10, -3, 5, -9, -1, 9, 1, 10, 0, -2, -1, -2, 1, -3, -5, 0, 6, -5, -3, -4, -9, 3, 4, -7, 3, -6, 7, 10, 10, 10, 3, 8, -4, -2, -8, -2, 0, 0, -1, 6, -1, 8, 4, 11, -2, -4, 2, -9, 6, -4, 6, -5, 3, 11, 0, 4, -1, -10, 5, 1, 6, 7, -6, -3, 0, -7, 1, -7, 3, -7, -2, -2, 0, -4, 6, 7, 10, 4, 0, 2, 8, 4, 4, 2, -4, 10, -7, -1, 4, 9, 1, -5, 6, 4, -3, -7, -8, 0, 5, 6, -10, -2, 7, 1, 3, -8, -9, 9, -7, 0, 6, 2, 3, -10, 0, 0, 2, 11, 1, 0, 11, -8, 10, 6, -9, 1, 6, 0, 9, -5, 9, 9, 2, -6, 2, 8, 2, 3, 10, -3, -3, 10, 10, 6, 4, 1, -7, -8, 0, -10, 1, 3, -9, 2, -6, -8, 11, -2, 6, 10, 4, 10, 3, 10, 8, -5, -8, 8, 1, 4, -9, 0, -3, 2, 1, 2, 2, -1, 9, 7, 8, -10, -2, -8, 8, 3, 2, -9, -7, -1, -3, -8, -4, 3, 8, 7, -4, -4, -4, 11, -4, 4, -5, -4, -7, -7, 2, -10, -4, 6, -3, -5, -7, 5, -9, 2, 11, 3, 4, -3, -1, 7, 11, 0, 10, 9, -9, 10, -7, -2, 2, -4, -5, -2, -2, 1, 0, -2, 0, 5, -6, -7, -6, 7, 4, 5, 5, 4, 10, -4, -1, 5, 9, -4, 1, -4, 6, -3, 2, 0, -6, 8, 9, 6, 11, -6, -2, -3, -7, 1, 8, 1, 3, 5, 9, 11, -6, -2, -2, -9, -4, 1, -2, 7, -4, 5, -5, -7, -4, 2, -7, -10, -10, 8, -6, 10, 9, 0, 2, 9, 9, 10, -1, 0, 4, 9, 10, -4, -1, 2, -1, 2, 7, 4, -6, 0, 7, 4, 3, 0, -6, 8, -4, 1, 3, 8, -7, -6, 4, -5, 8, -9, 8, 1, -9, 9, 10, -6, 2, 10, 1, 4, -2, 1, -7, 0, -7, 9, 7, 6, -8, -9, -4, 1, -7, -3, -1, -1, 3, 2, 5, -4, -5, 11, 2, -3, 1, 2, 3, -8, -8, -2, 5, 3, -1, 4, 0, -10, -3, 10, 9, 9, 10, 3, -1, 3, 0, 3, -4, 9, 2, -10, -4, -6, 11, -6, 11, -2, 1, -5, -4, 4, -3, -9, 0, 2, 5, -10, 5, -7, -4, -9, -7, 7, -5, 10, -4, -8, 1, -5, -7, 10, -9, -3, -7, 10, 4, -1, 11, -6, -6, 4, 0, -7, -7, 0, -10, 2, 6, 11, 4, -1, 9, -7, 9, -3, -2, 6, 10, 7, 11, 5, 9, 6, -4, 2, 3, 3, 3, 8, 9, -1, -3, -6, -2, 8, 7, 6, -1, 0, -7, -6, 6, 2, 1, 8, 11, -10, 1, -3, 10, -5, 1, -4, -5, 0, -1, 7, -9, -4, 0, 4, 7, -4, -2, 3, 6, 0, 6, 8, 1, 4, 10, -10, 5, 7, 11, 8, 9, -5, -10, -4, 3, -1, -1, 2, 6, 0, 6, 8, -1, -3, -1, -1, 10, 5, -4, -1, 11, -9, -10, -3, -3, 7, -4, -1, -9, 9, -6, -4, 8, 11, -1, 2, -3, -3, -1, 1, -2, 0, 1, 9, 1, -6, 8, 8, 7, -7, 11, 5, 9, 7, -5, -5, 2, -2, 6, -1, -3, -6, 6, 10, -9, 4, -9, 10, -1, -4, 1, 7, 10, -6, 8, 11, 9, 10, -8, -5, 6, -5, 11, -9, 7, 1, -4, 2, 2, -4, 5, 7, -2, 0, -7, 10, -9, 2, -1, 6, -5, -2, -10, -4, 7, 5, 1, 5, 3, -1, -8, -3, 1, -1, -1, -6, -4, -4, -10, -2, 11, -9, 0, 1, 9, 0, -3, -1, 11, 1, -2, 4, 11, -6, 1, 3, 10, 9, 2, -7, -3, 10, -10, -2, -5, 1, 7, 10, 7, -1, -5, -2, -2, 6, -10, 0, 10, -2, 4, -7, 3, -3, 7, 11, -6, -3, 0, 6, 10, -10, 7, -8, 1, -4, 7, 10, -4, -2, 5, 2, -5, -1, 10, 9, 0, -5, -6, 8, 2, 5, 10, -3, -2, -4, -1, 9, -2, 10, -9, 11, -4, 2, 6, 7, 5, -8, 3, 8, -2, -4, 5, -6, -2, -8, 0, 6, 10, -1, -5, 4, 6, 6, 7, 1, -9, 8, -9, -9, -2, -3, -4, -5, 7, 8, 7, 1, 8, 4, 1, 6, 1, 10, -9, 6, 2, 10, -9, 0, -9, 0, 6, 6, -9, 5, 3, 3, 4, 0, 10, 5, -2, 3, -7, -2, 0, -3, -4, -8, 0, 7, 0, 5, 5, 3, 1, 11, 5, -7, -7, 6, 3, -3, 6, 8, 2, 10, -9, 4, -9, 7, -5, -3, -1, -6, -6, 1, 7, 0, -1, 7, -8, -8, 8, 4, 0, -5, 2, -7, -6, 4, 10, -2, -8, -6, -5, 7, -8, -4, -2, 9, -1, -8, 7, 5, 3, 4, -6, 7, -6, 5, -2, -1, -4, 6, 7, 0, -3, -9, -6, -7, 11, -8, -2, -6, 4, 3, 10, 2, 3, -6, 3, 11, 0, -2, -1, 7, 9, 3, -9, 10, -4, -3, -7, 10, -6, 5, -7, 4, 10, -4, 6, 4, 4, 4, 0, -3, 8, -5, 0, 2, 0, 10, -3, 9, -10, -5, 4, 10, -4, 10, 7, -10, 1, 9, -10, -1, 10, 6, -6, -7, 1, 5, -2, -3, -10, -6, -1, 4, 4, -5, -10, 0, -1, -9, 7, 8, 3, -8, 4, 11, 6, 2, 10, 11, -2, 4, -2, 6, -3, -9, 9, -6, -4, 3, -3, 0, 2, -4, -4, 6, 7, 3, 7, 11, 1, 4, -4, -1, -4, -2, 7, -4, 1, -7, 6, 0, -7, -9, 11, -8, -5, -5, 3, -5, 4, -2, 10, 11, 5, -2, -9, 5, 7, -5, 7, -8, 8, -7, -2, 0, -3, 5, -4, 8, 9, -1, -6, -4, 7, -2, -9, -8, 10, 0, -6, 1, -8, 8, 5, -6, 3, -5, 6, 3, 1, -2, 6, 5, -9, -10, -4, 0, 8, 3, 0, -6, -1, 11, -6, -1, -1, 4, -7, 2, 8, -2, 3, -4, -6, 1, -6, -3, 1, 7, 8, -9, -4, 5, 11, 3, -5, -2, 6, -10, 8, -2, 4, -8, 9, 5, 8, 4, 4, 4, -2, -8, -5, 11, 6, 0, -9, -4, 2, -5, 9, 9, 9, 4, 6, 7, 5, 8, -9, -4, -9, 10, 1, -3, -9, 1, 7, -1, -2, -5, 3, 1, 3, 9, 4, -6, -3, 2, -9, -9, -7, 11, -9, 4, -6, -6, -2, 8, 8, -1, 5, -6, 6, 2, -5, 7, 7, 8, -4, -8, -3, -2, 4, -8, 10, 2, 2, -5, -4, -9, -7, -1, -3, -6, -10, 5, -4, 6, -5, -6, -4, -8, -4, -2, -2, -10, -3, 5, 11, -9, -10, -2, -1, 9, 2, 11, 7, -4, -7, 2, 9, -6, -8, -5, -6, 5, 6, 3, 6, 8, -6, 8, 5, 7, -9, -8, -6, -1, 4, 10, 3, 7, -4, -8, -4, -1, -1, 2, -4, -7, -7, -5, -4, 1, -9, -2, 10, -4, 6, 5, 2, 4, -4, -2, -9, 8, 4, 1, 3, -2, -9, 8, 1, 8, -8, 6, 8, -5, 9, -5, 4, 8, 8, 2, -7, 3, -2, 1, -4, -10, 7, 9, 7, -9, 9, 3, -1, 0, -3, 7, -2, -7, 4, -3, 10, 8, -8, 4, -4, 3, -8, 8, 1, 6, -2, -4, 5, 9, -2, 7, 10, 4, 9, -8, 9, -5, 7, 7, -4, -8, -8, -4, 11, 1, -3, 5, 8, -2, 10, 6, 8, 3, -1, -1, 10, -2, -3, -3, -7, -6, 11, -8, -9, -9, 0, -1, 0, -2, 2, -2, 11, -4, -3, -3, 11, -9, 7, 7, 2, -1, -1, 0, -3, -10, 9, 7, 0, 5, 0, 9, -3, 9, 3, -6, 9, 6, -1, -8, -5, 4, 1, -3, 8, 0, 0, 6, 1, -2, 0, 0, 2, -4, 3, -2, 7, 9, -10, 0, 8, -6, -8, 0, -8, -7, 1, -9, 0, 2, -5, 1, -9, 10, 0, -9, -9, 1, 7, 3, 6, 10, 4, -9, -10, -1, -3, 4, 0, -9, 9, 1, 1, -4, -7, 10, -9, -10, 8, -6, -5, -9, -5, -6, -2, 3, -10, -3, -3, -8, 8, -2, 7, 8, -2, -5, 9, 9, 1, 6, 4, 8, -9, -2, 5, -2, -4, -7, -8, 6, 2, 0, 1, -7, 9, 7, -4, -10, -2, -9, 9, -9, 6, 2, 11, 5, -5, -9, -5, -3, -6, -10, 11, -6, 9, -2, 6, 7, 2, 8, -6, 4, 0, 9, -3, 9, -4, 2, -6, 6, 4, -2, 6, 2, -3, -3, -2, 3, -4, -6, 2, -2, -2, 8, -2, 11, 11, -6, 3, 4, 7, 1, -5, -4, 4, -7, 10, 3, -5, 9, 2, -3, -4, 1, -3, -7, -1, 9, -2, -1, 5, 9, 8, -4, 4, 9, 5, 4, -2, -9, 1, 9, -9, -6, 1, -8, -1, 1, -3, 0, 3, -8, 4, -5, -2, -5, -9, 0, -3, -1, -10, 2, -7, -2, 0, 10, 8, -7, -7, -7, -7, 10, -7, -7, -2, -10, -3, 4, 8, -7, -1, 8, 0, 5, -1, 3, -2, 2, -2, -3, 7, -1, -5, -10, 5, 5, 8, -3, 10, 11, 4, 2, -5, -3, 4, 10, 2, 7, -1, 4, -10, 6, 5, -3, 2, 2, 8, -4, -10, 3, 2, -2, -6, -7, -9, -3, -2, -10, -3, 2, 11, 7, -6, 5, 0, 2, 5, -4, -8, -8, 2, -3, -7, -10, 11, 8, -10, -8, -2, -5, -7, -4, -1, 5, 1, 0, 4, -1, -4, 2, 4, 3, 6, 2, 1, 7, -5, -1, 6, -4, 6, -8, -10, -2, 4, -5, -3, 10, -7, -8, -7, 5, 0, 3, 5, -6, -3, -3, 6, 10, 6, 1, -4, 8, 4, -6, -2, -5, -4, 0, 7, 8, -6, -7, 6, 1, -2, -3, 2, 8, -4, 1, -2, -4, -8, 11, 8, 4, -10, -2, 9, 2, -3, -5, 8, 3, 2, -6, 4, 10, 1, -3, -2, 3, -4, -7, -5, 1, -1, 9, 10, -2, 9, 10, 8, 2, -9, 1, 3, 9, 5, -9, 2, 2, 8, -8, 10, 6, -6, 5, 9, 4, -9, -9, 4, 7, -5, -1, 3, 8, 4, -5, 9, 7, 11, 3, 11, -7, 5, 2, -8, 4, -2, 0, 8, -2, 2, 8, 6, 1, 2, 9, -2, -9, -8, -4, -9, -3, 4, -7, 1, 9, 11, 1, 2, 3, 8, -4, -2, 9, -6, 7, 1, -1, -4, 0, 1, 1, 1, 0, 1, -6, 8, -8, -10, 9, 2, 0, -6, 2, 2, 10, -10, 10, -3, 9, 11, -2, -7, 10, 2, -4, -5, 7, 10, -6, 8, 8, 3, 5, -2, -6, -9, 8, 6, -2, -3, -7, 6, 5, -5, -8, -10, -8, -3, 9, 6, 10, -3, 3, -2, 3, 4, -2, -4, 10, 2, -3, -1, 4, 2, 0, -1, 9, -5, -9, 1, -7, 5, 8, 1, -9, -9, -2, -5, 10, -8, -2, -4, -3, -8, -2, 1, 7, 1, 9, 9, 10, 10, -5, -1, -7, -4, -7, -5, -8, 3, -3, -5, -6, 5, -1, -5, 2, 6, -2, 5, -9, -1, 9, -6, 1, -9, 2, -6, -1, 10, -7, -7, -3, 11, -1, 4, 0, -2, -6, 9, 3, -9, 7, -6, 7, -3, -2, -6, -3, 2, -2, 2, -5, 2, -1, 1, 8, -6, 2, -1, -5, -3, -7, 10, 9, 6, -9, -9, -6, -4, -2, -6, -1, -5, 9, -5, 4, -10, 10, 2, -6, 8, 4, -5, 6, -8, 3, 7, 9, -9, 7, 3, 0, -4, -7, 9, -9, 5, 3, 11, 3, 1, -6, -7, 7, 7, -6, -9, -10, 8, -6, 1, -2, -10, -7, 8, 1, 9, -9, 0, -6, -3, 3, -8, -10, 0, 11, -2, -4, 2, -9, 0, -9, -9, -8, 11, 3, 4, 6, -2, -1, 2, 9, -5, 5, -1, 0, 4, 3, -7, 7, -6, -5, 4, 11, -7, 9, -5, 4, -3, -3, 11, 11, 10, -9, -1, 0, 5, 5, -6, 4, 2, 2, 2, -8, 0, 5, -8, -7, 9, 8, 3, -9, -5, 6, 10, -10, -6, -4, -3, -1, -9, 11, -3, -4, 8, 9, -7, 4, 5, 0, -2, -6, -8, 0, 6, 0, -4, 9, -6, 5, -8, -3, -4, 2, 3, 5, -1, 11, -7, 6, -1, 8, 0, 2, -5, 1, 10, -2, 4, 7, -5, -3, 4, -5, -10, -6, -3, 5, -6, -9, 8, 4, 7, 1, 6, -3, -5, 7, -5, 5, -4, 0, 5, -3, -8, 9, -3, 4, 11, -1, 7, 10, -7, 7, 5, -6, -7, 11, 3, 5, -5, 2, -5, -10, 8, 3, 4, 7, -7, 2, 11, 4, 2, -1, -1, -1, -7, -9, -1, -9, -1, -1, 4, 0, 9, -5, -3, 4, 6, -8, -8, -6, -2, 9, -1, 0, 4, 3, -6, -5, -3, -5, 6, 9, -8, -4, 3, -4, -4, -6, -7, 6, 9, 11, 4, -5, -7, -5, 11, -3, 3, -6, 11, -3, -1, 2, 8, -10, -10, 1, -1, -4, -1, -2, 0, -6, -1, -9, -9, 8, -1, 6, -5, -4, -8, -10, 2, 0, -8, -6, 5, 2, -7, 2, 0, -1, -7, 10, 3, -1, 4, -6, 9, 10, -6, 4, 8, 9, -5, -5, 5, -6, -5, 10, 9, -8, -10, 10, 11, 5, 2, 7, 3, -5, -2, 0, 7, -1, -9, 7, 6, 0, 9, -9, 10, 7, 6, 1, 5, -4, 3, -7, 9, -1, -1, 0, 7, 9, 0, 8, 5, -2, 9, -8, 0, -9, -8, -1, 1, -8, 4, -3, 9, 0, -5, -1, 3, 4, 1, -4, -4, 0, -8, -5, 8, 10, -3, 5, 8, 1, 6, 11, 6, 8, -3, -5, 5, 2, -9, -8, 0, 5, 7, -3, -8, -8, 7, -8, 9, 6, -10, 3, 1, 10, 1, 8, -1, 9, 11, 6, -7, -9, -8, -3, -4, 5, -9, 2, 10, 7, 3, 7, -10, 5, -8, -6, 9, 8, -9, 9, -10, 1, -7, -2, -8, 8, 4, -5, 1, -2, 4, -4, 4, -2, 6, -8, 0, 5, 8, -6, 1, 0, 6, 7, -4, -2, 3, 10, 7, 9, -3, -3, 9, -5, 6, 6, -3, 10, 5, -2, -4, 10, 7, 3, -5, 8, -6, -6, -8, 7, 5, 0, 8, -1, -1, 9, -3, 2, 1, 2, 8, -4, 10, 5, 0, -8, 11, 5, -3, -9, -7, 7, -6, 9, 6, -7, -2, -7, -8, -2, -5, 4, -7, 2, -1, 7, -2, 7, 10, -10, 2, 8, -4, -10, 11, 9, 8, 0, 2, 2, -5, -3, 2, 9, -3, 5, 4, 3, 5, -5, 1, 0, -5, 1, 1, 1, -7, -1, 7, -8, 2, 9, 11, 3, 5, 5, 0, 9, -1, 7, 1, -7, 9, 7, -4, 6, -2, 6, -4, -9, 1, 7, -7, -3, -2, -3, 1, 9, 5, 3, -7, 5, -8, -4, -7, 0, -10, 5, -2, 9, 11, 6, 7, 5, 4, -1, 7, -1, -2, -6, 2, 10, 3, -4, -1, -6, -5, -10, 7, 9, 0, 6, -3, -7, -4, -8, 4, 8, 2, -7, 8, -5, 4, -2, -4, -7, -10, 2, 9, 9, 6, -8, 7, -10, 6, 2, 7, -3, -4, -9, -3, 2, 1, 6, -9, 9, 7, 5, 3, 3, -2, 8, -6, -1, 10, -6, 4, -4, 4, -2, -4, 5, 6, 10, 9, -2, -9, -5, 3, -6, -5, 2, -9, -3, 6, -9, 0, 8, 1, 3, -1, -7, 8, 2, 9, 4, 6, -5, -2, -9, -3, -1, 9, 9, -8, 9, 10, -1, -5, 10, 7, 8, -5, -1, -8, -7, 1, 8, -3, -6, -9, 11, 0, 2, 11, 7, -4, 5, 5, -10, 10, -10, -9, -4, -8, 0, -5, 3, 3, 3, -1, 1, 4, -8, 10, 4, 7, 8, -8, 4, -8, -8, -9, -9, 7, -5, 6, 8, 10, 8, -8, -3, 7, -9, 4, 3, -9, 6, -2, 1, 9, 5, 10, -6, -5, -6, 0, 3, -7, -9, -1, -9, 3, 9, -1, 7, 10, -6, 9, 3, 10, -4, -1, -9, 7, -3, -2, -2, 10, 3, 8, 7, 8, 1, -3, 10, -8, -9, -8, 7, 5, -8, 4, -6, -7, 10, 3, 4, 9, -9, -5, -6, -2, -5, -3, -9, -3, 11, 5, -5, 1, -4, 2, -3, -2, -8, -4, 3, 4, -10, 2, -3, -5, -6, -6, -1, 11, -5, -2, 9, 7, -4, 5, -2, -5, -6, 5, -3, -7, 6, 4, 11, 8, 3, -7, -10, -6, -1, -1, 11, 10, 8, 1, 2, -1, 7, -1, 8, 8, -9, -1, 6, 8, -8, 3, -8, -3, 8, 2, -8, 1, 0, 0, 0, 8, 6};
+static int32_t DeeployNetwork_net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1mul_tensor[32] = {514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0};
+static int32_t DeeployNetwork_net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1add_tensor[32] = {260598.0, -200974.0, 160882.0, 426106.0, -107940.0, -116164.0, 272934.0, -599838.0, -365968.0, -542270.0, -49344.0, 525822.0, -529420.0, 221534.0, -450264.0, 1028.0, -10794.0, 294008.0, 579792.0, 245178.0, 555634.0, 113594.0, 164480.0, -296578.0, 158826.0, -595212.0, -46774.0, 35980.0, 15420.0, -456946.0, -457460.0, 129014.0};
+static int8_t DeeployNetwork_net_QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_2weight_tensor[18432] = {-5, -6, -4, -3, 3, -3, 1, 2, 8, 4, -1, 7, 1, -2, 3, 4, 3, 1, 6, -6, 0, 3, 2, -6, -6, 6, -6, -6, 7, 5, 0, 5, 4, 8, 8, -1, 8, -6, -3, 8, 2, -3, 2, 8, -4, 2, 1, 8, 6, -3, 2, 4, 2, -5, 7, 8, -5, -1, 1, -3, -2, 4, -2, -6, 0, -4, -1, -7, -4, 2, 3, 0, 3, 5, 1, -7, -5, 0, 0, -4, 5, 4, -4, -3, -5, -6, -7, -7, 0, -7, 1, 3, -6, -5, 8, -6, 2, 2, 7, 1, 1, 4, 7, 8, 0, -2, -3, -4, 8, 1, -5, -2, 0, -5, 6, -2, -2, -1, 2, 8, -3, -4, -4, 3, -5, 7, 7, 5, -7, -7, 1, -7, 6, 6, -1, 6, -3, -2, 4, -5, -1, 5, 0, 3, 3, 4, -2, -1, -1, 6, -3, 7, 6, -7, -2, 1, 0, -2, -7, -1, -6, 5, -6, -5, -3, -2, -2, 7, 5, -3, 5, 0, 5, 1, -2, 3, -1, -6, -3, -6, 3, 1, 8, 4, -1, -5, -6, -6, -6, -6, 8, -2, -2, 2, 8, -6, -5, 1, 8, 4, -2, -6, 2, 6, 6, -1, 6, 3, 3, -6, -7, -1, -5, 5, -6, 6, 1, 6, 0, -6, -3, 8, 7, -2, 5, -3, 2, -4, 4, -2, 1, -6, -7, 5, 4, -2, 8, -3, -6, -6, -1, 4, 2, -5, -2, 4, 8, -7, 0, -2, 7, 1, -7, 5, -2, 4, 0, 3, -2, 6, 0, -2, 3, 3, 4, 7, 3, -2, 6, 4, 2, 7, 6, 8, 2, 1, 0, 1, 3, -6, 5, 0, 7, -5, -4, -1, -1, -4, 2, 6, 1, -7, -3, 1, 7, 3, 4, 6, -3, 5, 8, -5, -6, 2, -5, -1, 0, -6, 2, -2, -5, 1, 7, 0, 4, 4, -1, -3, 3, -4, 8, -6, 5, -7, -5, 7, -3, -6, -4, -2, 7, -6, 0, -4, -7, 8, 6, -5, -5, 7, 4, 2, 3, -3, -3, 6, 0, 5, 5, 1, 3, 6, -3, 2, 7, -5, -1, 1, 2, -2, 1, -1, 5, 7, 3, -6, -3, 2, 7, 2, -4, 0, 8, 1, 3, 1, -4, 7, -6, -2, 5, 3, 8, 6, 2, 4, -6, -3, 1, 5, -2, -2, 1, 0, 4, -5, 8, -5, 0, 1, -1, 8, 8, -4, -3, 7, -5, -1, 4, 4, 7, 2, -3, -5, 6, 3, 1, -4, -7, 4, -5, -4, -2, -4, 8, -4, 6, 8, 3, 1, 0, 3, 0, 2, 7, -5, 5, -4, 1, 2, -7, 2, -5, -3, 0, 4, 1, 4, -6, -3, -1, -1, 1, 0, 3, -1, 7, -3, 3, 6, 6, 2, -6, -7, 6, 1, -3, -2, 3, 5, -1, 2, 6, 0, -6, 1, -3, -5, 2, 5, -7, -2, 7, -1, 0, -1, 4, 7, 8, 1, 5, 1, -5, -6, -4, 4, -1, -5, -5, 3, -5, -5, 7, 7, 2, 1, 4, -4, 1, -2, 1, -3, -3, -1, 8, -4, -7, -5, 0, 6, -4, 6, 8, 5, -3, -2, -2, 0, 6, -2, 8, -3, -6, -6, 7, -3, 2, -3, -5, -2, 2, -1, -3, -4, 2, 0, 6, 0, -5, 1, -7, 6, -2, -6, -6, -5, -2, -6, 5, 0, 4, -7, 4, -1, 0, 4, -1, -3, -6, 6, 1, 4, 5, 4, 4, 7, 2, 4, 7, -4, 3, 7, 0, -4, 1, 2, -4, 4, -1, 6, 7, -4, -3, 4, -1, -1, 6, 1, -6, 0, 5, 2, 2, -3, -3, -2, 4, 1, -6, 0, 3, -5, 5, 1, 3, 1, 4, 7, -1, 3, 0, 8, 3, 7, 0, -4, 8, 6, 3, 4, -7, 1, 5, 1, -1, 1, 4, 7, 0, 0, -5, -2, -3, -4, 1, 1, 4, 7, 5, 6, -7, 1, 7, -6, 0, -2, -4, 8, 4, -1, 2, 8, -3, -3, -6, 1, 0, 2, 4, 0, -2, 3, -1, -3, 2, 1, 8, 6, 6, 6, 6, -6, 4, 3, -3, 8, -3, -5, 1, 2, -1, -7, 4, 7, -2, -1, -7, 3, -4, -6, 2, -7, 0, 3, 4, 4, 1, -1, 0, 2, -2, 5, -5, 4, 5, 6, 4, -3, -2, 6, 1, 3, 6, -6, -7, -6, 6, 3, -4, 4, -3, -7, -5, 3, 0, -2, 8, 2, -4, 6, 4, 5, -1, -1, -6, 1, -2, -5, 3, 0, 4, 6, 4, 4, -1, -2, -5, 3, 2, 0, 3, 2, 5, 0, -5, -4, 7, -2, -2, -7, -1, 1, -1, 5, -3, 3, -1, -3, -4, 2, 6, 2, 6, -3, 5, -1, -7, -4, 1, 4, -3, 1, 6, 4, 0, -3, 7, -4, 6, -2, -3, -4, 0, 4, 0, 6, -7, -2, 3, 7, -4, -1, -3, 4, 2, -2, 7, 1, -5, 6, 7, -1, -5, 8, -6, -5, -3, -3, 5, 5, -2, 0, 1, -6, 6, -3, 8, 3, 2, 0, 2, 5, 1, 1, 0, 8, -5, -3, -4, -5, 7, 1, -6, -4, 4, 2, -6, 5, -2, -4, 3, 4, -4, 3, -1, 1, -5, -4, 1, -3, -6, 6, 4, 6, 0, -6, -3, -4, 7, 1, -2, -4, 0, 4, -5, 7, 4, 1, 2, -1, -2, 7, 4, 7, 8, 0, -5, 2, -6, 3, -3, 7, 5, 1, -4, 4, -4, -3, -1, -1, -1, -4, 4, -7, -4, -6, 0, -1, -4, -6, -2, 4, 4, -3, -7, 4, 2, 1, 1, -3, -5, 7, -2, -1, 8, -6, 4, 6, 4, 5, -4, 5, 4, 5, 3, -2, 3, 4, -5, -5, 1, 5, -6, 1, -1, 0, -1, 6, 4, -2, 0, -1, -3, 7, -2, -2, 2, 2, 6, 1, -4, 1, 3, 2, 8, 3, -7, -5, -4, 4, -2, -5, 2, -3, -1, -2, 4, 5, 6, 7, -4, 3, -4, 4, 0, -6, 6, -2, 1, 3, -4, -3, -5, -6, -5, -7, 6, -6, -5, 3, 4, -4, 1, 1, -4, 5, 6, 0, -1, 3, 0, 7, 3, 3, 6, 6, -6, 7, 7, 6, 6, -4, 6, 8, -1, 7, -4, -6, 2, 7, -5, -6, -1, 5, 5, 2, -7, 7, 5, -6, -3, -4, 7, -4, 6, -4, 7, -5, 6, 2, 3, -6, 1, -2, 0, 3, 7, 2, 8, -4, 5, 7, -6, 3, -4, 7, -4, -2, 8, -4, -5, 6, -1, 6, 8, 6, 1, 6, -5, -3, 6, -1, 4, -5, 5, 0, 3, 2, 6, 1, 3, 0, 7, 4, -2, 0, 0, 7, 0, 0, 0, 2, 5, 3, 3, -6, -3, 0, -5, 0, -2, -3, 7, 4, 2, 4, 2, 0, 7, -5, 2, 0, -2, 2, -4, 7, 0, 7, -2, -7, -1, 0, -1, 4, 8, -5, 1, -3, -5, -2, 2, -4, -2, -6, -1, 4, 6, -2, 2, -1, 5, -4, -2, 1, 1, 7, -4, -5, -1, -2, -5, 1, 0, -2, -2, 5, -1, -6, -1, -2, 3, 6, -2, 3, -5, 6, 0, 5, 6, 2, -4, -2, -3, -5, 3, 0, -6, -6, 0, 2, 0, 1, 4, 3, 3, 6, 5, 6, 2, -5, 1, 0, 8, 6, 8, 7, -3, 5, -2, -6, -4, -1, 0, 4, 2, 1, -5, 5, 5, -5, 1, -4, -1, -1, 4, 0, -4, 3, -6, 8, -7, -5, -7, 4, 0, 3, 6, 3, 5, -1, -5, 8, 7, -2, 5, 5, 3, 2, 2, 1, 1, -3, -1, 2, 1, 3, 5, -6, 3, -5, 2, -5, 7, 1, -7, -4, 7, 1, -3, -6, 2, 1, 3, 1, 8, 7, -3, 5, 6, -1, -2, 2, -5, -1, 0, -6, -4, -1, -5, 6, 4, -6, 7, -2, -3, 4, 5, -5, -7, -3, -3, -4, 7, -1, 4, -5, 3, 6, 0, 3, 4, 4, 0, -4, -4, -1, 4, 7, -2, 1, -1, 3, 6, -2, -3, -6, -2, -6, -3, -1, -1, -2, -3, 6, -2, 5, 6, 3, 1, -1, -5, 3, 4, -2, 3, 0, 5, 4, 5, -6, -3, 4, 2, 7, -2, 1, 5, 1, -2, 5, 2, -6, 4, 6, 8, -1, 0, -4, 3, -6, 4, -3, 1, 2, 0, -2, -6, -5, 2, 3, 4, 3, 1, 3, 7, -2, 6, 2, -5, -2, -5, 8, 4, -6, 6, 7, 6, 1, 6, 7, 7, -5, 7, 4, -5, 8, -4, 7, -3, -3, 6, 0, -6, 2, -4, 4, 0, 4, -2, -6, 6, 7, -6, -5, 0, -6, -4, -5, -1, 5, 0, -1, 6, 6, 5, -4, -2, 3, 6, -2, -5, -2, 7, -5, 6, -3, 5, -3, -2, 3, 8, 3, -2, 4, 0, 3, 0, 3, -4, 5, -3, 8, 7, 4, 4, 6, 1, -1, 4, -3, 8, 7, 7, 5, 5, 2, -4, 4, 7, 4, 6, 6, -6, 4, 5, 3, 0, -2, 1, 0, 3, 8, 3, 0, -1, 6, 6, 0, -5, 5, 2, -1, -5, 6, 6, -5, 0, -5, -4, 8, -5, 7, 0, 7, -4, -2, 8, 5, 0, 2, -4, 3, -4, 3, 5, 7, -2, -4, 1, 7, 1, 7, 0, 0, 4, 0, 1, 3, -5, 6, 6, -7, 8, 2, 8, -2, 7, -5, 2, 6, -1, 5, 0, 1, -2, -1, 7, -1, 4, -6, -3, -4, -5, 5, -2, 4, -2, -3, 7, -2, 8, 8, -5, 2, -3, 7, -3, -2, -2, 2, -6, 6, 1, -4, 4, 4, 7, 4, 8, -1, -4, 1, -2, -1, 3, 2, 6, 2, -2, 6, 8, -1, 5, -3, -1, 1, 4, 5, 4, 0, 1, 4, 0, -5, 6, 4, -3, -4, 0, -4, 0, -4, 7, -4, -2, -1, 2, -3, -3, -7, 3, 5, 4, -7, -6, 6, -6, -4, 4, 7, 4, 6, -2, -1, 0, -7, -3, 7, 7, 7, 7, -4, 3, -6, 5, -5, 1, 6, 6, -4, -5, -1, -3, 6, 2, 0, 6, -5, -4, 1, -2, 0, 6, 4, -1, 7, -6, 8, 6, 2, -2, 1, -6, 3, -5, 5, -5, 0, 4, 8, -4, 4, 7, 1, 8, 7, 1, 4, -6, 0, -3, 3, -4, -3, -3, 5, 4, -3, 2, -1, -2, 7, -4, -4, -1, 0, 5, 1, -4, 7, -1, 4, 3, 0, 0, 2, -6, 3, 6, 8, 4, 6, 1, 2, 8, -4, -4, 1, -4, 0, 3, -5, -3, 4, -6, 1, 4, 5, -2, -7, 1, -4, 7, -6, 6, -4, 3, 3, 3, -3, -5, -4, 0, -6, 4, 1, -2, 1, -5, 0, 3, -4, 3, -3, 2, -2, 2, 8, -2, 5, -2, -4, 8, 1, -1, 7, 1, -6, 1, -1, -5, 2, -3, -4, -4, 5, -1, -7, 6, -2, -5, -2, 1, 1, -2, 5, 5, 1, -1, -3, 6, -7, 1, -3, 7, 2, 5, -1, 1, 8, -7, 1, 5, 4, -4, 7, 0, 7, 5, 0, -4, -4, 8, 8, 3, -1, 5, 2, -5, -3, -7, 4, 8, 8, 5, -1, -1, 5, -6, 2, -1, 5, 8, 6, 3, -3, 0, -1, 7, -6, 7, -5, 6, 0, -7, -5, -6, 2, 7, -6, 2, 4, -2, 2, -6, -6, 5, -4, 5, 7, -6, -5, -4, -5, 3, -4, 2, -1, 8, 5, 1, -1, -3, -4, 1, 5, 7, 4, 7, 0, 2, 2, -1, 2, -4, -2, 0, -5, -2, 5, -6, -3, -6, -4, -6, -3, -2, -1, 6, -7, -2, 5, -2, 6, 3, -4, 2, -3, -1, -6, 5, 2, 6, -5, -6, 0, -1, -6, 3, 4, 5, 5, -6, -6, 7, 6, 5, -1, -2, -2, -4, 2, -5, -4, -5, 6, 8, -6, -1, -7, 4, -4, -3, 5, -5, 3, -6, 7, 6, -4, -1, 4, -2, 1, 5, 8, -1, -4, 1, -3, -5, 1, 0, -4, 3, 6, -5, -5, 2, 4, 0, 6, -5, -1, -3, 0, 4, -3, 2, 6, -5, -1, 0, 5, 3, 1, 1, 1, 2, -1, -2, 3, 7, -2, -4, 2, -5, 6, 6, -2, -5, -3, 3, 5, 1, 2, 1, 2, 2, -1, -1, -2, 3, -7, 1, -6, 2, -1, 2, 8, 5, 4, 3, -1, 0, -5, -6, 5, 1, 2, -3, 3, 1, 4, -7, -3, -7, 2, 2, 1, 2, 1, 1, -6, 1, 1, 1, 1, 8, 5, 0, -6, -2, 4, 0, 2, 3, 2, 7, -6, -2, 6, 5, 4, 6, -2, -2, 0, -5, -3, 6, 4, 1, 5, 6, 4, -4, 5, 5, 2, 1, -6, 4, 0, -3, -6, 1, 4, -5, 8, 2, 2, 6, 7, -5, 0, 7, -5, 4, 7, -4, 6, -3, -7, 7, 4, -7, 6, 0, -1, 5, 1, -4, -6, 1, 4, 1, 6, 3, 5, -3, 2, 0, 8, -7, 4, -6, -2, 5, -5, 7, -4, 7, -4, -5, 8, -2, -4, -1, -1, 5, 8, -5, -2, -6, 6, 1, -2, 7, -2, 6, 7, 1, 4, 6, -6, -2, 2, -4, 1, 8, 2, 0, 7, 5, 3, 1, 7, 1, 6, -7, -2, -3, -3, 1, -6, 4, -2, -7, 4, -3, 7, 2, 2, 0, 7, 0, 6, 4, 2, -1, 6, -1, 1, 7, -2, -5, 4, -2, 6, 2, -4, -4, 6, -1, -6, 5, -1, -1, 4, -3, 2, -1, 0, -2, 6, 3, -4, 5, -5, -4, -6, 5, -6, 8, 2, -5, 4, 6, -5, -6, -5, -6, -2, 3, 6, -4, 6, -3, -5, 1, -1, -2, 2, 4, 1, 1, 4, -3, 4, 3, -1, -7, 2, -2, 1, -3, -5, 3, -1, -4, 5, 5, -1, 7, -2, -5, 7, 0, 0, 7, 5, 6, -7, 2, -6, 8, 1, 5, 6, 2, -7, 2, 6, -2, 2, -2, 7, -6, -2, -5, 2, -4, -4, 0, -7, 0, -4, 4, 8, 4, 6, 3, -1, 7, 8, -6, 4, 5, 6, 5, 4, 7, -5, -4, 2, 8, -7, 5, 3, 1, 7, 6, 3, 7, -7, -5, -3, 7, -3, -2, 7, -4, 6, -4, 1, 6, -2, 6, 1, 2, 0, 5, -6, 2, -1, -6, -2, 4, 4, 3, 2, -1, 6, 0, 7, 5, 1, 4, -3, 0, 6, 6, 2, 2, 1, 1, -5, 0, -6, 2, -3, 1, -2, 0, 4, -3, 3, -7, 5, -2, 3, 4, 1, 6, 0, 2, 3, -5, 1, -3, 7, 7, 5, -5, 7, 0, 4, 8, 2, -6, -3, 1, 6, 2, -3, 5, 3, -3, 5, -6, -2, -5, 2, 5, 2, 3, 1, 4, -1, 0, -2, -4, 0, -1, -6, 7, -4, 6, -4, 5, 3, -6, -3, 3, 2, 0, -4, 8, 5, 6, 7, -5, 4, -3, 0, 1, 0, 1, -3, 6, -4, 3, -3, -1, 5, 2, 6, 8, 4, -5, -1, 3, 4, 6, 8, 6, -6, 3, 7, 2, 4, -4, 7, 4, 5, -4, 5, 5, -4, -7, 3, -6, -3, 4, -3, -4, 5, 6, 4, 8, 3, 5, -6, 1, -7, 5, 0, -5, 4, 6, -6, -3, -1, 6, -3, -3, -6, 7, 8, -5, -4, 7, -4, 1, -5, -3, 1, -4, -1, -7, -4, 1, -3, 5, -6, 4, -5, 5, 4, 0, 1, 0, 0, -5, 5, -5, 1, -1, -6, -3, 4, -6, -4, -1, 7, -1, -4, 0, -6, -6, 3, 7, -5, 6, -6, 7, 3, -6, -1, 2, 3, 0, -5, 0, 3, 8, -3, 8, -2, -6, -1, 2, 4, 2, 4, -2, -1, 3, 7, 0, 7, 4, -1, 1, 2, 5, 4, 0, -6, 5, -1, 7, -5, 6, -6, 0, -1, 1, -3, -5, -4, -2, -1, 0, 1, -5, -1, -6, -5, -1, 0, 4, 7, -3, -5, -3, -6, -1, 7, -5, 4, -5, -6, 3, 0, -2, -2, 0, -5, 2, 7, 0, -1, 4, 7, 4, 2, -5, 2, 7, 7, 1, -3, -4, 1, 3, 0, -4, -6, 0, 5, 0, 7, -3, 1, -7, 8, -4, -2, -1, -6, 2, 5, 2, -5, -4, 7, 0, 3, 4, 0, -1, -4, -6, -4, 1, 6, -6, 3, 2, -4, 5, 3, -6, -7, -6, -6, -1, 4, 5, 5, -5, 4, 7, 0, 6, -3, 6, -1, -4, -2, 1, -2, 1, -2, 6, 6, -1, 0, -5, 3, -4, -1, 0, 8, -4, 0, 3, 3, -1, 7, -5, 0, -3, -6, 1, 3, 5, -5, -2, 2, -5, -3, 6, 3, 2, 1, 6, -3, 1, 7, -4, 6, 4, 2, -2, -3, 1, -2, 2, 2, 7, 6, 4, 8, -4, 7, 0, -4, 2, 6, -1, 6, -7, -4, -3, -3, -3, -7, 3, -7, -3, 7, 1, -5, -6, -1, -7, -1, -5, 2, 1, -3, -2, 2, -5, -5, -4, 0, -1, 5, 3, 4, -3, 0, -4, -5, 1, 8, 6, -7, 5, 6, -2, 1, -4, -5, -4, -2, -1, 0, 3, -1, 2, -1, 2, 6, 3, 5, 7, 7, 3, -1, 3, 2, -5, -6, -5, 3, 4, 7, 3, 7, -1, -3, 0, 0, 5, 7, 7, 7, -3, 4, 7, -6, -3, -7, 0, 8, -4, 7, 6, -2, -3, 3, 2, -2, -4, 2, -7, -5, 1, 0, 8, 2, 1, -1, 8, 7, 7, 4, -6, 5, 5, -4, -1, 8, -4, -2, 0, -3, 4, -2, -6, 3, 1, -1, 1, -1, 1, 7, 5, 0, -2, 3, -7, 3, -2, -3, 7, 7, 1, 3, 8, 6, 1, -2, 2, 0, 4, 2, 5, 4, 0, -2, 0, 4, 1, 8, -4, 2, -4, 6, -3, -5, 5, 5, 7, -2, 3, -3, -3, -4, 4, 0, -6, 3, 6, 0, 6, 1, 7, 5, 5, 6, -6, -6, -2, -6, 4, 5, 0, 7, 7, -7, 8, 1, 6, 1, 8, -6, -1, 2, 3, 3, 2, 6, -5, -2, 4, 0, -4, -5, 8, 4, -1, -4, -2, 7, -2, 0, -4, 1, 1, -1, 5, 5, -3, -1, 4, 1, -2, -6, -4, -7, -3, -3, -4, -3, -7, 5, 7, 1, -6, 4, -3, 1, -5, 0, 0, 3, 4, -1, 6, 1, -4, 7, -1, 2, -7, -4, 0, -4, 6, -4, -1, -6, 0, 7, 6, -1, -3, -5, -7, -4, 3, 7, 2, -3, 2, -3, 0, 0, -1, -4, -6, 1, 0, 2, 4, -2, 2, 2, 7, 2, -1, 3, -1, -2, -5, -5, 0, 5, -3, -2, 7, 6, -5, -2, 6, -4, 5, 6, -6, 8, 0, 6, 7, -5, 2, -6, 7, -2, -3, 3, -3, -3, 3, 0, 7, 7, -7, -6, 8, -3, -2, 1, 5, -5, 6, -1, 7, 1, -4, 2, 2, 6, 4, 4, 6, 4, 6, -4, -2, -1, 1, 6, 4, 6, 0, -4, 0, 1, 6, 6, -2, -3, -4, -5, -6, -2, -1, 6, 7, -1, 1, 5, 8, 2, -5, -5, -3, 1, 5, 2, -4, 5, 2, -4, 4, 3, 0, 5, -3, 1, 1, -3, 3, 6, 6, 6, -1, 0, -2, 2, 3, 8, 7, 4, -2, 2, 7, -4, -1, 1, 6, 1, -2, -4, 7, 5, -3, -4, 0, -6, 3, 0, 3, -1, -6, 0, -6, 1, -6, 7, 2, -2, 4, -7, -5, 7, -6, 4, 7, -3, 3, -4, -1, 3, 7, -6, -5, -1, -2, -6, 4, 7, 3, -1, -5, -3, -6, 6, -5, 7, 6, 2, 7, 5, 0, 4, 4, -4, 1, 1, -7, -2, 2, -4, 5, 5, -4, 5, 7, -2, 5, 0, -4, -6, 0, -3, 2, 5, 1, -5, -6, -1, -3, 6, 5, -1, -1, 3, -6, -4, -6, -7, -6, 6, 4, 5, -3, 3, 4, 2, -5, -4, 0, 3, 7, -2, 0, 5, -2, 3, 5, 2, 7, -4, -1, 7, -2, -2, -1, 6, 2, 6, -4, 4, -3, -6, 6, 0, 0, -4, -5, 5, -7, -5, -5, -7, -5, -3, 3, 5, 8, 3, 5, -6, 5, -4, 3, -3, 5, -3, 6, 4, 3, 1, -2, -1, 3, -6, -2, 4, -6, 2, -6, -5, -5, -1, 4, -3, 1, -5, -4, -5, -2, 7, 1, 0, 3, -5, -5, 7, -4, 4, -3, 5, 8, -3, 0, 2, 6, 4, -5, -6, -5, 8, -7, -3, 6, 2, -5, 4, -4, 3, -4, -7, -3, -2, -1, -5, 6, -3, -6, 0, -1, -3, -6, -4, -2, 7, -1, 7, -4, -6, -2, -2, 0, 5, -4, -5, -5, 4, 6, -6, 6, -2, 3, 1, 7, -6, -2, -6, -1, 4, -6, 0, -5, -7, 2, -2, 4, -1, -6, -4, 2, -5, -4, 1, -2, -4, -4, -1, 0, -1, -4, -1, -4, 5, -4, -5, -6, 5, 6, 3, 0, -1, -3, -2, 1, 5, 6, 2, 5, -5, -2, 4, -2, 2, 2, -2, -3, 3, 1, -5, 4, -6, 0, -5, 1, 4, -2, -5, -4, 7, -3, -3, 5, 3, 4, 6, -1, -2, 2, -1, -4, 4, 6, 4, 5, 0, 2, 6, 2, 7, -2, -3, 7, 0, 0, -6, 2, 3, 0, -1, 3, -7, -3, 6, -7, -1, 1, 0, 5, 3, 5, 1, -4, -3, -2, 2, -7, 5, -2, -4, -1, -2, -2, 7, -1, -2, 5, 3, -6, 1, 2, -3, 1, 1, -5, -6, 4, 8, -1, -3, -6, -1, 8, -4, -2, -6, -4, 4, 5, 2, 0, -4, 3, -3, 4, -6, -7, 3, -1, 5, 0, -1, -4, -6, -6, -6, 4, -3, 3, -1, -7, -2, 5, 5, 2, 6, 7, 1, 7, 5, -1, -1, -6, 7, 7, -3, -1, -6, 0, 5, -1, -2, 0, -2, 5, -5, 1, 4, 5, -5, 1, 0, 4, -5, 5, -3, -4, -5, 3, 4, 6, -4, -4, -3, 1, -2, 1, 4, -1, -4, -7, 7, -5, 5, -4, 0, 1, -4, 2, -4, 7, 2, 6, -3, 5, 8, 5, -1, 1, 1, 5, 6, 5, 4, -3, 7, 5, -3, 1, -7, -5, 5, 5, -2, -5, -6, 5, 5, 7, 6, 7, -5, 6, 4, -3, 4, -1, 1, -4, 6, -5, 7, 6, 7, -5, -3, 6, -6, -3, -3, -4, 4, -2, 8, 3, -6, 2, 1, 0, 6, -3, 6, 5, -5, -4, 6, -3, 4, 1, -7, 5, 1, 1, -4, -1, 7, -5, -4, 1, 6, 2, 5, -7, 7, 5, 3, -1, 0, 5, 3, -3, 5, 7, -6, 7, -2, -2, 1, 2, -3, 6, 6, -7, 3, -6, -3, -5, 3, 3, 7, 6, 3, 6, 0, 2, 0, -1, 0, 3, 5, 3, -1, 6, 1, -1, 1, 7, 8, 3, 0, -3, 6, 2, -5, -2, -1, 2, -6, 7, -2, -5, 6, 1, -5, -1, 3, -4, -2, -4, 7, 4, -1, -1, -2, -3, 1, -2, 5, -4, 8, -1, -2, -4, 6, -6, 3, 8, -6, -5, 1, 0, -3, 2, -5, 2, 0, -5, -4, -1, 1, -3, 3, -7, 4, 2, -1, 6, 3, 7, -1, 4, -4, 6, 5, 6, 1, 2, 7, 8, 7, 6, 3, 1, 7, -5, 6, 0, 8, 4, -7, -2, -6, -4, -1, -2, -4, -4, 5, -7, -4, -2, 2, -3, 5, 6, 5, 1, 8, 3, 0, 6, 0, -2, 3, 4, -2, 1, -1, -6, 6, -4, 8, 2, -4, 2, 4, 6, 2, 7, -5, 7, 8, 6, -5, -5, -2, 2, 0, -2, 5, 6, -3, 4, 0, 4, 0, 6, 7, 1, -5, 1, -5, 1, -3, -2, -4, -7, 2, 1, -2, 3, 2, 4, -6, 0, 3, 5, -5, 5, 7, 6, -2, 2, -5, 4, -6, -4, -6, 0, 3, 0, 3, 0, 0, -6, 7, -2, -6, 0, 1, 6, -3, 6, 1, -1, -2, -6, 3, -1, -7, 6, -6, -2, 4, -5, 2, -6, -4, 6, 1, -3, -5, 6, 1, 6, 6, 1, -4, -2, 3, 3, -3, 2, 7, 5, 7, 0, -1, 3, -4, -7, 8, 0, -2, -5, -3, -6, 3, -6, 6, 6, -1, -1, 3, -6, 1, -4, 2, 7, -7, 5, -5, 2, -4, 4, 1, 4, 3, -4, 2, -2, 0, -2, -3, -4, 8, -5, -4, 5, -5, 6, -6, -3, 2, -4, 1, -6, 4, 1, -5, -4, 0, 0, 2, -4, -6, 2, 8, -6, 6, 2, 6, 3, -5, 7, -2, 5, 8, -2, -2, -1, 4, -4, -6, 0, -6, 0, -1, 8, -4, -5, 7, -4, 2, 1, 1, -4, -4, 4, -6, -1, -4, -5, 7, -1, 7, 6, 2, -3, -4, 0, 7, -6, 7, -3, 5, -4, 3, 2, -2, 0, -4, 3, -5, 1, 6, 1, 6, -5, 2, 0, 1, -1, -1, -1, 4, -3, -4, -2, -3, -4, -3, -5, 1, -6, -1, 2, -1, 4, 4, -2, 4, -1, -2, -4, 7, 1, 5, -3, -2, 3, 3, -3, 6, -2, -5, 1, -2, -6, 5, 3, -6, 5, 3, 4, 6, -5, 5, -1, 6, -2, 3, -1, 1, 4, 6, 8, 2, 4, 4, 3, 2, -6, 8, 1, 8, 6, -3, 1, 6, -5, 7, -5, 1, 2, 2, 7, 3, -7, 4, 8, 5, 3, -4, 1, 2, 4, 3, -1, -6, 0, -5, -2, -3, 2, -1, -3, 0, 2, -2, -1, -1, 6, 5, -6, -6, -5, -4, 7, 0, -4, 4, 0, 1, 8, 2, 7, 4, -7, 1, 8, -5, -4, 6, 2, 7, 1, 0, 4, 3, 7, 3, 1, 5, -4, 3, 3, 6, 4, -2, 0, 1, -2, -5, 1, 2, -3, 5, 2, -3, 0, 4, 5, 2, -3, 7, 3, 2, 6, -4, -7, -5, 1, -1, 7, -4, 0, -6, -7, -7, 2, -2, 0, -5, 4, -3, 6, 4, 2, -5, 4, 5, 2, 5, 1, 4, 0, -4, -7, -3, 3, -6, -7, 0, 0, 3, -4, 2, 7, 2, -2, 5, -4, -4, -7, 7, 0, -3, 5, -4, -3, 5, 4, -4, -6, -3, 2, 2, -6, 4, 3, 1, -4, -4, 6, -4, -2, 1, 2, -4, -6, 8, 6, 8, 5, -6, 3, -4, 0, 7, 0, 1, 8, 8, 8, 0, 7, 6, 0, 3, -2, 1, 0, 4, -1, -3, -2, -3, 0, -6, -1, 4, 2, -4, 7, 1, -5, -3, -6, 3, -5, 7, -1, -3, -2, 5, -1, -6, -4, 1, 6, 3, 3, 2, 0, 5, 8, 3, -7, 5, 2, 2, 7, -4, -2, 6, -5, -1, -6, 7, 6, -2, -5, -3, 4, -4, -6, 6, 1, 2, 7, -2, -2, -4, -5, 5, -3, 4, 1, 3, -3, -4, 8, 5, -4, 7, 1, -1, 1, 7, -5, 0, 1, -2, -6, 7, 7, 6, 5, 1, 3, -5, -2, 5, 8, 3, -5, -4, -2, -1, -6, 5, 3, 0, -5, 6, -5, 1, 5, 0, 4, 5, -3, -7, -1, 2, -4, 4, 3, -1, -5, -6, 7, 6, -5, -4, 1, 4, -3, 2, 6, -4, -6, 0, -3, -4, -1, -1, -4, -6, -1, 2, -4, 5, -2, -3, -1, 0, 0, 6, -3, -2, -3, -6, -2, 8, 8, 4, 7, 2, 1, -5, -6, 8, 8, 0, -3, 6, -6, 5, -5, 0, 5, 7, 5, 2, 8, 1, 3, 2, -7, 2, 5, 0, 4, -1, -2, 3, 1, -3, -3, -3, 0, -2, 4, 2, -3, 3, -1, -2, -4, 0, -3, 3, -5, 3, 6, -2, 6, -2, 7, -5, 4, 5, 7, 6, -6, 3, 4, 1, -3, -3, 6, -3, 6, 1, 8, 5, 4, -3, -3, 0, 8, -4, 7, 1, 7, -6, 2, -3, 3, 1, -2, -4, -6, -5, 4, 6, 7, 0, -6, 2, 5, 0, -1, -6, -6, -5, 3, 5, -4, -6, -2, 5, 1, 3, 0, -4, 3, 4, 6, -6, -4, 3, -1, 2, 3, -2, 8, -3, 7, 0, 8, 7, 8, 3, -2, -6, 4, 6, 4, 6, -2, 3, 0, 3, 0, -1, 6, 7, -3, -3, -1, -7, -2, -3, 6, -5, 3, 5, -1, -5, 2, -5, 6, -4, 2, 4, -1, -1, -1, 5, 8, 4, 1, 6, 1, -1, -2, 1, 5, -1, 6, 0, 3, 6, 1, -3, 6, -3, 6, 1, 1, 5, 7, -3, 4, 5, 2, -4, 1, 5, 1, -5, -6, -2, 1, 2, -3, 2, 7, 3, 4, 1, -3, -3, 5, -3, -3, -1, 5, -3, -6, -7, 6, 7, 4, 8, 1, -6, -1, 0, 2, 0, -1, 7, 4, 1, -3, 4, -4, -4, 6, 6, 0, 7, 8, 6, 6, -5, 0, -4, 4, -3, -6, 8, -5, 0, -5, 7, -5, 8, 2, -5, -7, 2, 0, 6, 3, -1, -3, -4, 5, 4, 3, -3, 1, -1, -4, 0, 5, 3, 3, -4, 2, -2, 4, -6, -5, -5, -3, 3, -3, -5, 1, 8, -4, -1, -5, 5, 2, -6, -3, -4, 4, 0, -4, 3, 3, -5, -4, 0, 2, 4, -4, 1, 7, -1, 3, 3, 1, 0, -1, 3, -2, 4, -2, 7, 3, 6, 4, 7, -7, -2, -5, 0, 1, 7, -2, 3, -3, 7, 1, -2, -3, -3, -4, -5, -4, 7, -5, 5, -5, -6, 5, -3, 1, 7, 0, -2, -5, 0, 3, -1, -4, -5, 5, 3, -4, 2, 6, 4, 6, 6, 4, -1, 0, -2, 1, -2, -6, 0, -6, -2, 8, -4, 7, -4, 1, -1, 5, -4, -6, 6, 7, -7, 1, 2, 2, 1, -1, 2, 6, 4, 1, -1, 0, -5, 6, 6, 7, 5, -7, 3, -4, -1, 4, 2, -1, -2, 8, 5, -2, 1, 7, 1, -3, 8, 4, 0, 7, -1, -5, 5, -1, -3, 7, 6, -1, -2, 0, -2, -7, 7, 3, 3, 0, -5, -3, -5, 5, -4, -2, 5, 0, 1, -6, -6, 2, 5, 6, -2, -5, 6, 4, 8, 5, -1, -5, -4, 7, -4, 2, 2, 8, -1, -3, -4, -1, 6, -3, 7, 4, 1, 6, 0, 8, -5, -6, -3, 4, -5, 5, 3, 5, 8, -5, -2, 5, 6, 8, -7, 1, -1, -1, 3, 2, 0, 6, 1, -3, 4, 4, -4, -5, 1, -5, -5, 3, 4, -4, 4, -4, 7, 4, 0, -3, -6, 5, -4, -2, 0, 6, 7, -2, 3, -6, 7, -6, 0, 2, 4, -4, 4, 2, 5, 5, 1, 3, -3, 6, -1, 6, -5, 1, -5, -1, -5, 2, -1, -4, -3, -3, -6, 6, -1, -7, 6, 7, 5, 7, 0, 5, 5, 3, 3, 0, -6, 8, -2, 3, 6, -6, 7, -5, 7, 4, -5, -3, 7, 1, 7, -1, 3, -1, 1, 1, -7, 4, 1, -4, -1, 5, -6, -6, 6, -3, -6, -5, 7, -3, 6, -4, 2, -3, 2, -2, -4, 6, -1, 0, -2, -2, -6, -6, -6, 2, -4, 5, 7, -6, 6, -3, 0, 3, -5, -5, -3, 0, -6, 4, -4, -6, 4, 2, -4, -6, -2, -4, 6, 3, -1, 0, -1, 3, 4, 3, 7, 4, 1, -6, 6, -4, 4, -3, 1, 8, -6, -3, -7, -5, -4, 7, 6, -4, 2, -6, -1, 6, 3, 0, -2, 6, -5, -5, -5, 5, 0, 2, -2, 5, 7, -6, -4, 8, 2, 8, 6, -6, -5, 1, -1, 5, -2, 4, 6, 7, -2, -5, 0, -5, -7, 5, -6, 4, -7, -6, 7, -4, 1, -2, 6, 0, -6, 2, -2, 3, -5, 2, 0, 1, 8, 4, -2, 7, -1, -4, 6, -6, -1, 5, -6, 2, -7, 0, 7, -3, -3, -5, 5, 4, 7, -5, 4, 4, -2, -6, 0, -1, 1, 0, -3, 8, 7, 2, -7, -5, 1, -3, 6, -4, 3, -5, -2, 2, -2, 3, -3, -4, 1, -5, -3, -4, 7, 2, -2, 2, -2, 3, 0, -1, 4, 6, 6, -6, -4, 4, 3, 3, 2, 5, 1, 5, 0, 3, -5, 0, 4, -1, 6, 4, 5, -1, 0, 4, -6, -4, 8, 3, 1, 2, 4, -1, 4, 3, -6, -2, -2, -1, 7, 0, 2, 6, -3, 2, -3, 5, 6, 4, 4, 5, -7, -3, -1, 7, -1, -1, 2, 7, 7, 6, 1, -1, -6, -2, -2, 3, 1, -1, 4, 0, -2, 5, 6, 5, -1, -5, 2, 2, 4, -6, 6, -5, 3, 6, 5, -1, 7, 2, 3, 2, 2, -6, -2, 1, 3, 1, 3, 5, -2, 5, 1, -6, -3, 2, 1, 1, 4, 0, 3, -3, 4, -6, 8, -1, -3, -1, -2, 1, 7, -1, 1, 4, 7, -1, 5, -4, -3, 5, 0, 6, -6, 5, -1, 3, -1, 6, -3, -7, 7, 0, 3, -2, -4, -6, -3, 7, 4, 2, 1, 3, -1, 7, 7, 7, 2, 3, 5, 0, -1, 6, 6, 0, -6, -7, 5, -1, 2, 6, 6, 2, 1, 7, 4, 0, 5, -2, 7, -2, -1, -4, -1, -4, -3, 4, 5, 2, 2, 3, 7, -6, -6, 1, 1, 7, 7, -5, 4, 3, 2, -6, 5, 7, -3, 4, 4, 5, 8, 2, -3, -3, 2, 5, -5, -2, -1, 4, 7, -3, 2, -5, 0, 3, -2, -2, 8, 3, -4, 4, 7, 8, -7, -6, -2, 8, -4, 6, 0, 1, 1, 6, 5, 4, 5, 0, 3, 5, 6, 2, -4, 7, -6, 0, -1, 8, 2, 3, 4, 3, -6, -7, 7, 6, -3, 6, 2, -1, -1, 0, 7, -3, -1, 4, -4, 3, 3, -6, -3, 8, -2, -5, -6, 5, 2, -1, 7, -3, -2, -5, -3, -4, 0, 7, 5, 1, 3, 1, 2, 4, 6, -3, 2, -5, 8, 6, 1, -5, -6, 4, 5, 6, 4, -1, 8, -3, 5, 3, 7, 7, 8, -2, 4, -2, -5, -1, -4, 3, -5, 0, 5, 8, -6, 7, -3, -4, -6, 3, 1, 4, 5, -2, -1, -4, 6, -3, 1, 1, 2, 7, -6, -2, -6, 7, -4, 2, 4, -5, 4, -1, -6, -6, 1, 3, 0, 7, 4, 7, 3, 7, 4, -4, -4, 7, -5, 8, 1, -3, 4, 2, -4, -5, -1, -6, 3, -1, 5, 0, 6, -1, -5, -3, 8, 6, -3, -7, 0, 6, 1, 3, 4, 7, -3, 6, 2, 0, 8, 3, 3, 7, 7, -4, 1, -6, -4, -6, 8, 0, 7, 4, -3, -7, 2, -7, -3, 3, -3, 2, -2, 4, 5, -1, -5, -4, 2, 5, 6, 2, 0, 5, -1, -2, 0, 0, -3, 8, 3, 6, -3, -5, -5, 2, -1, 1, -3, -6, -1, -6, -2, -6, 0, -3, -5, -4, 7, 4, 5, -2, -3, 0, 2, -3, 0, -4, -3, -4, -6, 7, -3, -4, 4, 3, 1, 4, 6, 4, 2, -5, 3, 7, -2, -4, 8, -3, -1, 7, 4, -6, -1, -3, -4, 5, 2, 0, -3, 3, 1, -1, 3, -2, 3, 3, -3, -1, -1, 6, -5, 6, -1, 2, -4, -2, -7, -4, 1, 8, -7, -6, -4, -5, -7, -1, -6, 0, 1, -7, 4, 2, 7, 6, -6, -4, 3, 5, 3, 8, -5, 4, -5, 6, -1, 4, 5, -7, 1, 2, -2, 1, 6, 5, 3, -4, 5, 5, 1, -6, 2, -4, 1, -5, -7, -1, -2, 2, 2, 1, 4, 5, 4, -7, -7, -5, -4, -2, 5, -4, -1, -3, 3, -1, 5, 6, -1, 6, 7, -5, 2, -6, -2, -4, 5, -6, -5, 0, 0, -1, -2, 1, -2, 4, 1, 3, -4, 5, -4, -3, 0, 4, 0, 3, -3, 7, -7, -1, 3, -1, 5, -3, 7, 0, 3, -5, -1, -5, -3, 3, -4, -1, 0, 7, -5, -7, -7, 3, 2, 0, 6, 6, 3, -7, 0, -3, 8, 6, -2, -1, 3, -5, -5, 4, -7, 2, -1, -3, -7, -6, 6, 7, 2, -1, 5, 8, -1, 1, 3, 8, -5, -1, -2, 4, 4, -2, 3, 6, 8, 8, 6, 0, -1, 7, 5, 1, -3, 7, -6, 5, -5, 4, 5, 6, -6, -1, -1, 2, 2, -5, 4, -6, -2, 3, 7, 4, 1, 0, -3, 7, -7, -6, 3, -4, 7, 5, -6, -1, -6, -3, -3, 2, 8, -2, 7, 2, 8, 0, 1, 6, -3, 4, 1, 0, 1, -4, -2, 4, -3, -3, 2, 6, 0, 4, 3, 3, 0, -7, -6, -4, 3, 6, 2, 3, 6, 3, 0, 4, 0, 3, 0, 6, 7, 0, -5, -5, 1, -7, -7, 1, -1, 2, 0, -6, 3, -6, 2, -3, -4, 7, 6, -6, 4, 6, 1, -5, -3, -7, 4, -1, -5, -4, -5, -2, 5, -3, -3, -6, 3, 1, 3, -3, 3, 5, 8, 4, 4, 7, 7, -5, -5, -7, -6, 2, 6, 7, -1, 0, 5, -1, 5, 3, 7, 1, 1, 1, -5, 6, -5, -4, 1, -6, 0, -3, -4, -1, 7, 4, -6, 1, 5, 7, 2, 3, 3, -6, -6, 5, 3, 8, 4, 0, 3, 1, 3, -5, 1, 3, -1, 6, 5, 8, -6, 3, -3, 0, -6, -7, 0, 4, -5, 8, 6, 6, 3, -1, -2, -1, 6, 2, -6, 2, 7, -6, 2, -3, 1, 8, -3, 5, -5, 8, 2, 2, -2, 6, -7, 0, 7, -1, -6, 3, 7, 1, 5, -3, 3, 6, -1, 2, -5, -4, 0, 2, -5, 3, 2, 5, 0, -4, -3, 2, -4, 0, 7, 5, 0, 8, 5, 4, -4, 4, -5, 8, 4, 0, -5, -4, 7, 8, 0, 7, 8, -5, -6, 2, 2, -4, 1, -7, 6, 3, 6, -3, 8, 3, 1, 3, -4, -1, 0, 1, 4, 1, 2, 0, 3, -7, 7, 0, -7, 4, -1, 3, 6, -2, -2, 2, 6, -7, 4, -5, 2, 1, 6, -2, -2, 6, -5, 6, 3, -4, -3, -6, -1, 1, 2, 8, 3, 6, 6, -5, -3, 3, 5, 0, 6, -3, -2, -3, 4, -3, 6, 1, 2, -5, 5, 1, -6, -5, -1, -3, 6, -4, 8, 5, 0, -4, -4, 0, 2, -2, -6, -7, -4, -3, 0, 2, 2, -3, -5, 5, 5, 7, -1, -5, -1, -6, 4, 1, 1, 2, 3, 5, 3, 6, -6, -6, 6, -3, 2, 7, 5, -7, 1, -3, -7, 2, -3, 1, -3, 1, -5, 8, -4, 4, -2, -5, 1, -2, 4, 4, -7, -1, -6, 7, -4, -5, 0, 1, 6, -7, 2, 1, 7, 0, -3, 4, -3, 8, -1, 8, 2, 1, 5, 7, 1, -6, -3, -1, -5, -6, 3, -1, 6, 3, -3, 4, 3, 1, 0, -2, -4, 1, 5, 2, 6, 5, -2, 7, -4, -7, 3, 4, 7, -3, 8, -1, 6, -5, -6, -3, 4, -2, -6, 1, 2, 2, 3, 3, -2, 4, -5, -3, -6, 8, -1, 3, 4, 3, 7, 2, 3, 2, 2, 7, -7, 4, -7, 7, -2, -6, 6, -3, 3, -5, -4, -6, 6, 0, 2, -3, -1, 7, -4, -1, 3, 0, 1, -2, 2, 2, -1, -5, -5, 5, 8, -7, -6, 7, 3, -6, 2, -2, 7, -1, -6, 4, -3, 8, -5, -6, 3, 4, 1, -4, -5, -7, 3, 4, -2, -5, 0, 6, 6, 0, -3, -1, 7, 0, -3, -2, -5, 3, -3, -2, -4, -2, 5, 1, 4, 6, -7, -3, -6, -1, -2, -6, -7, -5, -4, -4, 5, -6, 3, 6, 7, 7, -4, -5, 6, -7, 4, -6, -2, 5, -3, 6, -4, 2, 3, -5, 3, -4, 4, 3, -1, 1, -4, -3, -4, 8, -1, 0, -6, 6, 5, -7, -6, 7, 1, 0, 8, 7, 1, 2, 4, 5, 7, -6, -6, -4, 7, 6, -1, -6, -6, -5, -6, 5, -4, 2, 5, -2, -3, 2, -2, -4, 5, -5, -7, 6, 7, 0, 7, 3, 6, 2, 5, 5, 1, 1, -5, -2, 6, -7, -5, 3, 2, 6, -1, -4, 3, 7, -7, -3, -6, -2, -2, 8, 7, -6, 6, 7, 0, -1, 4, -3, -2, -2, 8, -6, -5, -3, 5, -2, 3, 4, -4, 5, 1, -2, 4, 5, 1, -4, 0, -4, 2, 6, -3, 5, -7, -4, 2, 6, -1, 8, 1, -7, 4, -5, 0, -3, -6, -5, 5, -4, 2, -4, 5, 8, -3, -4, 6, -5, -7, -6, 6, 5, -6, 2, 3, -3, 5, 0, -1, -2, 7, -3, 7, 7, 6, -4, -3, 1, 3, -1, 5, -7, -5, 5, -3, 7, -4, 3, 0, 1, 4, -6, -1, 8, 5, 8, 0, -6, 6, -2, -6, 4, -3, 6, -7, -6, -1, -2, -4, 7, 0, -7, 7, -2, 3, -6, 7, 3, 4, 1, -4, -4, 1, 0, -3, 4, 3, -2, -3, 5, 0, -4, 5, -1, 6, -3, 5, 7, -2, 1, 1, 7, 3, -6, 7, 8, 2, -4, -6, 5, 6, 3, -1, -2, 5, 5, 2, 3, 0, 0, -5, -2, 2, -4, -4, -2, 5, 2, 4, -2, 1, 5, 8, 3, -4, 8, -4, -6, -7, 2, -6, 5, 1, 6, -1, 7, 1, -6, 7, 4, 3, -7, 3, 1, -5, 3, 0, 6, -6, 0, -2, -5, 1, -7, 4, 0, 1, -5, -6, -2, 6, 6, -6, -2, 2, 0, -5, -7, 1, -7, 6, 4, -1, 3, 1, -1, 7, -5, -4, 2, 2, -6, 2, -3, 3, 3, -5, -3, -6, 5, -1, 5, 6, 3, 1, -3, 1, 3, -2, 6, 0, -3, 7, 0, 3, 7, -5, -4, -1, 7, -4, 4, 7, -1, 8, 0, -4, -5, 8, -6, -1, -4, 7, -5, 6, 1, 8, 3, 0, 0, -5, 4, 1, -5, -6, -7, -4, -2, 5, 1, 7, 2, -3, -7, 3, -1, -2, -1, -7, -1, 2, 2, -5, 6, 0, -1, -4, -4, -3, -5, 0, -6, 1, -1, -5, 2, 2, -6, -4, -5, 6, 6, 7, -7, -5, -6, -2, 7, 0, -2, 7, 7, 2, 4, -2, 5, 5, 1, 5, 7, 5, 4, 8, -2, 1, 0, 4, 8, 6, 1, 1, 2, 8, -3, -4, 7, 4, -7, 3, 2, 7, -4, 1, -2, -4, -6, -3, 5, 1, 4, 8, -5, 8, 3, 2, 4, 6, 0, -1, 0, 1, 6, 5, 6, 7, 2, 4, -1, 5, -3, -2, -6, -7, 2, 0, 5, -3, 4, -2, 6, -4, -7, 0, 4, -2, 7, -6, 2, 3, 2, -4, 2, 3, 7, -1, -2, 2, -5, -6, -3, 0, 4, 0, 3, -6, 6, -1, 0, -5, -6, -5, 1, 3, -1, -5, 0, -5, 0, -4, -2, 6, 8, 6, -5, -5, 2, -1, -3, 1, -5, -1, 7, 0, 2, 4, -6, -2, -3, 3, -6, -4, 2, 1, 6, 7, 0, 5, 4, 6, -2, -6, 5, -3, -7, 7, -3, -4, -3, 3, 0, 1, 0, -1, 5, 0, 5, -5, 3, 2, 7, 5, 1, 7, -7, -2, -7, -7, -1, -2, -5, 5, -3, -3, -3, 5, -1, -4, 7, -4, 5, -1, -4, -2, 2, -2, 1, 4, 1, -3, -6, -4, 2, -4, -5, -5, -1, 6, 7, -1, -5, -1, 2, -3, -2, 1, 2, 2, -3, 3, -5, 5, 3, -2, 5, -6, 0, 3, -1, 3, 6, 4, -3, 7, -4, 4, 1, -5, 8, -3, -1, 2, -5, 1, 1, -3, 5, 2, 6, 8, 3, -6, -2, 6, 1, 1, 3, -6, 4, 4, 2, 0, -5, -6, 7, -5, -2, -1, 4, -4, 2, 7, -5, 0, 7, -1, -1, 7, -3, 1, -5, 6, -7, -4, -5, 0, -1, -2, -4, 3, 7, -3, -6, -4, -2, -5, 3, 7, 3, 5, 0, 2, 2, -4, -5, 0, 0, 8, 3, -6, 1, 1, 2, 2, 2, 0, -3, 7, 0, -3, -6, 6, 2, -4, -4, 7, -7, 5, -1, -2, 8, -2, 6, 8, -5, 6, -4, -3, -4, 7, -5, 0, -5, -3, -4, -1, -6, 7, -2, -5, 6, 1, 1, 7, 2, 1, 7, 1, -5, -5, -2, -6, 8, -4, 4, -2, -4, 4, 2, 6, 2, 8, 6, 6, -1, 1, -2, 8, 0, 5, -2, 5, 2, -1, -6, 4, 5, -3, 7, 3, -2, -5, 6, 4, 6, -2, -1, 1, 1, -3, 0, 4, -1, 7, 4, 0, -4, 0, 0, 7, -5, 3, -2, 5, -3, -4, 2, 0, 2, -6, -3, 8, 5, -1, -5, 0, -1, -5, -4, 5, -3, -6, 2, 7, -1, 1, 1, 7, -2, 6, -5, -4, 1, 2, 0, 0, 8, 3, -6, 1, 5, 6, 5, -1, 6, -5, 5, 3, 1, 5, 5, -1, 4, 8, -1, 1, 3, 6, 4, 6, -5, 0, 5, -6, 6, 7, 5, 7, 4, 3, -6, -1, -2, -4, 8, 7, 0, -3, 5, 4, 6, 1, 7, 5, 5, -6, 5, 5, 2, -7, -3, 6, 1, -1, 1, 4, 2, 4, 5, 3, 6, 1, -5, -5, 6, 6, -4, 6, -6, 7, 2, 4, 1, 4, 6, -4, 4, 3, -2, 2, 0, 7, -5, -3, -6, 5, 5, 2, 2, 5, -5, 6, 5, 3, 3, -1, -3, 5, -5, -5, -6, -2, -7, -2, 7, 8, -5, 4, 2, 5, 8, -1, 1, 7, -3, 1, 5, 7, 4, -3, -6, -3, -1, 5, 4, -3, 5, -1, 1, 0, 4, 6, 5, 6, -6, 7, 5, -4, 1, -3, -1, 0, -5, -3, -1, -2, -2, 7, -2, -1, 5, 6, -6, 4, -2, 6, 6, 7, 1, 8, -4, 2, -6, -7, 3, -2, 3, 7, -7, 1, -5, 8, -1, -4, -2, 0, 8, -6, -5, -4, -5, -3, 5, -2, -3, 4, -1, 0, -3, 2, 4, 1, -5, -1, 5, 3, -3, 1, 5, 2, 2, -3, -6, -2, -2, -4, -7, 1, 4, 1, -4, 0, 5, -3, -1, 1, -1, 7, -6, 1, 4, 0, -5, 5, 7, 2, 5, -5, 7, -3, 7, 6, 4, 8, 3, 1, -6, -4, 4, -7, 4, 3, -6, 4, 4, -2, 7, 2, 1, -2, 0, -3, -1, 8, 5, -4, -2, -5, -5, -5, 3, 3, 3, 0, 6, 5, 7, 1, -3, -6, 6, -2, 4, 7, -1, -1, -3, -2, -6, -7, 0, 4, 2, 3, -6, 2, 7, 6, 3, 8, 0, 8, -2, 7, -6, -3, -3, 1, 8, 3, -5, 4, -6, 2, 4, -5, 5, 7, -1, 5, -2, 8, 0, 4, -2, -6, -5, 7, -5, -1, 6, 7, 7, 2, -5, 0, 7, 2, -6, -1, -1, -6, 3, -4, 4, 3, -7, -3, 4, -4, -1, -3, 8, 2, 5, 6, -4, 1, -2, -6, 7, -7, 1, 4, -6, -2, 3, -1, -5, -3, 5, -6, 7, 3, 2, 8, -2, 3, -5, -5, 6, -5, 6, -3, 6, 5, -2, 0, 6, 5, 8, -7, 4, -3, 3, -5, 2, 1, 2, -3, -5, 0, -7, 4, 2, 2, 3, -4, 1, -1, 2, -2, -7, 5, -3, -6, 2, -7, 3, -4, -6, 7, 2, 8, 1, 4, 8, 6, 7, -2, -1, 4, 7, -2, 5, -4, -4, -3, -1, -6, -6, -5, 4, 5, 5, 7, 7, 1, -1, 5, -3, 6, -2, -6, -4, -4, -6, 2, 4, -6, -5, 2, -3, -3, -7, 5, -4, -5, 0, 0, -5, 6, -6, 4, 4, -3, 6, -6, -5, 0, -4, 4, 0, -2, -4, 2, -3, -4, -2, 6, 6, -7, -3, 5, 5, 3, 5, -2, 5, 5, 3, -3, -2, -3, 6, -6, -4, -6, -5, 8, 6, 7, 5, 2, 6, 2, 4, 2, 3, 8, -6, 3, 2, 3, 3, 3, -5, 3, -2, -4, 8, 3, 4, -4, -5, -5, -4, -1, -1, -3, 1, 3, -6, -6, 2, 5, 6, -4, 1, -3, -6, 0, 8, -7, 3, 6, -4, 3, 2, -6, -1, -7, 1, 1, -3, 2, -6, -2, 2, -7, 1, -6, -7, 3, 2, 5, 8, 1, -5, -6, 3, 6, 1, -2, 8, 7, 0, 3, 4, -7, 0, -1, 5, 5, 4, 5, 7, 5, 5, 8, 4, -1, 8, 7, 1, 1, 7, 6, -2, -4, -3, -6, 3, -2, -2, -5, 2, -5, 4, 3, -7, -3, -5, -4, 0, -5, -2, 0, -3, -6, -7, -2, 6, 2, -2, -4, -2, 2, 4, -4, -3, 7, -2, 6, -3, 2, 5, 6, -7, 6, 2, 0, 8, 1, -3, 2, 6, 1, -1, -1, 2, -1, 1, 1, 5, -1, 5, 6, 4, 5, 4, -5, -2, 0, 3, -4, -6, 3, 2, -6, 6, 3, -2, -1, -3, -6, 8, 7, 4, -3, 3, 0, -4, -2, -4, 2, -2, 7, 3, 5, -4, 7, -1, -6, 7, 7, -3, -1, -7, -6, 5, -1, -1, -7, 1, -4, -1, 7, 2, -5, 6, 2, -2, -3, 6, 1, -5, 2, -3, -6, 4, 3, -6, 1, 5, 1, 7, 5, -5, 7, 0, -3, -5, -6, 0, -3, 0, -1, 0, -6, -4, 7, 4, 7, 3, 4, 2, -5, -7, -1, -6, 8, 2, 4, 8, -6, 4, 5, 2, 3, 1, 7, -7, -5, -4, 1, 7, 5, 5, 4, -7, 6, -1, -6, 0, -1, -7, 2, 0, -5, -5, -2, 1, -2, -6, -2, -5, -3, 2, -1, 8, -2, -3, -4, 3, -6, 6, 7, 4, 3, -6, -7, -1, 8, -6, 7, 6, 7, -3, -2, 4, -1, -5, 5, 1, 7, 4, -4, 5, 0, -5, 8, 7, -1, 3, 7, 8, -1, 2, -5, -5, -1, 2, -4, 1, 2, 6, -1, -4, 3, 6, -4, -2, -1, 4, 5, -1, 1, -7, 3, 3, -1, -1, 0, -2, -3, -1, 4, -1, -4, 5, -3, 7, 7, -5, 7, -7, 8, 1, -1, -1, 4, -3, 2, 3, -5, 0, -3, -6, 3, 1, 1, -4, 3, -4, -5, -2, 4, -4, 6, 4, -6, 3, -3, -7, 1, 6, 2, -3, -4, 5, 6, -5, -2, 1, 6, 5, 1, -1, -2, -5, -3, 7, 6, -2, 0, 6, 4, -3, 3, 3, 6, -3, 3, 6, -3, -2, -2, -5, 0, 0, 4, 1, -3, 5, 7, -3, 1, 4, 3, 4, -3, -2, -2, 8, 7, -1, -2, -2, 2, -6, 5, 6, 2, 7, -4, -2, 8, -4, 7, 2, -3, 1, -5, 6, 5, 6, 7, 1, 4, -4, 7, 7, 1, -4, 3, -5, 2, 0, -5, 6, 1, -1, 3, -2, -7, 1, 8, 1, -1, 6, -3, 2, 1, 5, 2, -5, 7, 6, 0, 6, -7, -3, -1, 6, -7, -2, -7, -4, -7, 1, -5, -3, -5, 4, 8, -6, -5, -3, 8, -2, 7, 4, 1, 0, 0, -4, -1, -2, 3, 3, 3, 3, 8, 1, 1, 1, 6, -6, 6, -3, 7, 6, 3, -4, 5, 1, 8, -7, -2, -2, 3, 1, 6, 0, -2, 0, -4, 6, -5, 6, -6, -5, 5, 5, 8, 2, -3, -1, 6, 5, 5, -6, -5, 4, 3, -2, 1, 0, -3, 3, 3, -4, -4, 0, 4, 5, 0, -4, 1, -2, 7, 1, -7, 2, -6, 2, 7, 2, -2, -1, -6, 3, -6, -2, 2, 4, 5, 5, 5, -5, 7, -5, 1, -2, -1, 6, 1, 5, 5, -3, 2, 7, -4, 4, 1, 2, 3, -5, -3, -3, -6, -6, 5, -1, 1, 8, -3, 4, -5, 1, 0, -5, 4, 2, -4, 8, 6, 4, 5, 7, -4, -1, 0, -1, 6, 0, -6, 7, 5, 1, 6, 2, 2, 5, -6, 4, -3, 2, -5, 3, -5, 7, 1, 4, 2, -1, 0, -3, -6, 8, 2, 8, 2, 5, -5, -7, -1, -3, 0, 2, 8, -4, -6, -4, 4, 5, 7, 4, 8, 5, 4, 1, 7, -6, 4, 3, 3, 4, 2, 3, -1, 7, 8, -7, 0, -4, 4, -2, 4, 3, -4, -1, -2, 8, -1, 7, -2, -5, 2, 3, 4, -2, 2, -1, -1, 2, 5, -2, -1, 2, -6, -3, 3, -7, -3, 2, -5, 6, 2, 0, 8, 4, -5, 8, -1, -5, -2, -6, 5, 2, 3, 4, 0, 1, -5, 1, 4, -7, -5, -6, 7, 4, 8, -5, -2, -2, -4, 2, 0, 2, -6, -7, 3, 3, 7, 3, 4, -4, -6, -2, 5, 7, 7, 8, 5, -3, -1, 7, 8, -6, -2, 8, 8, 7, 7, 7, -6, 2, -3, -4, 0, 7, 7, 6, -3, -4, 1, 1, 4, 1, -3, -6, 1, -1, 7, 5, -7, -3, 4, 1, -6, -4, -5, 5, 0, -3, 1, -7, 5, 5, 5, -5, -5, 7, -5, -3, -6, -4, -1, -1, 2, 1, 3, 8, -1, 3, 0, 7, -6, 6, 4, 6, 5, 3, 5, 0, 3, -2, -6, -2, 5, -5, 3, 8, 6, -3, -6, 5, 8, 0, 3, -2, -5, 7, -3, -1, 4, 1, 2, 5, -5, 7, 3, 4, 5, 4, -3, 1, -6, -5, -5, 3, 3, 6, -6, 2, -1, -4, 1, 3, -1, 5, -7, 2, -1, 6, -5, -2, -5, 3, 1, -4, -1, -7, 3, -1, -1, -1, 0, 3, -7, 2, 4, 3, -1, -6, -4, -3, 0, -1, -3, -1, -5, 7, 5, -3, 5, 0, -5, 1, 7, -5, -4, 3, 2, 6, 4, 5, -1, -1, -4, 1, -7, 4, 5, 6, 4, -2, 2, 6, -3, -2, 3, -4, 5, 6, 4, 8, -2, 8, 7, 0, 3, 3, -5, 6, 2, -5, 5, 0, 8, 1, -3, -4, -5, 6, 7, 0, 7, -6, 4, 4, 1, -2, 0, -5, 7, 4, 1, -3, 7, 1, -5, 7, 0, 2, 4, -2, -4, 3, 7, -4, 2, 4, -5, 7, 4, -2, 6, 6, 1, 0, 8, -4, 4, -2, -7, -5, 5, 2, 7, 0, -4, -3, -7, 5, 1, 8, 0, 6, 5, -3, -2, 3, -7, 5, -6, -4, -3, 3, 7, -6, 4, -5, 6, 0, 5, -7, -1, -4, -1, 6, 1, 7, 7, -1, -4, 5, 5, -6, 7, -6, -7, -5, 6, -1, 5, -4, 7, -3, 0, -2, 4, 5, 7, -4, 0, 7, -3, -1, 0, -5, 2, 4, 7, 5, -7, 1, -3, -4, -5, 6, -4, 4, -1, 2, 4, -3, 1, 5, -1, 6, 2, 2, -6, -4, 0, -3, 2, -5, 7, -6, 3, 3, 6, -3, -4, -5, 7, -3, -1, 4, 4, -1, -5, 6, 2, 2, -6, 7, -2, -1, 4, 4, -4, 8, 5, -4, 0, 6, 4, 6, -2, -4, 7, -5, 1, -5, 8, 8, -4, 0, 6, 0, -5, 3, 6, 7, 0, -3, 6, -6, -1, 0, -4, -1, -4, 6, -1, 2, 6, 5, -5, -4, 0, 1, -1, 2, -4, 1, 4, -6, 1, -1, 4, 7, 0, -2, -5, -3, -3, -4, -2, 7, -6, -2, 4, 3, 8, 3, 1, -3, -3, 2, 4, -2, -6, -4, 5, 0, -2, 1, -2, 4, 6, 4, 0, 4, 4, 6, -6, 3, 6, 1, 5, -4, -6, 5, 4, 7, 1, -4, 4, -1, -2, 4, -7, -1, -6, -4, 4, -1, -2, -1, -6, -3, -5, -4, -1, -6, 2, -6, -1, -6, 7, 1, 0, -1, 1, 5, 1, 3, -4, -4, -5, 7, 0, -7, -6, -3, 4, 2, -6, -4, -7, 7, 7, 1, 0, -5, -4, 7, 2, 4, 2, -4, 5, 2, -3, -5, -2, 1, -4, -3, 8, -6, -1, 6, 0, -3, 2, 3, -1, 5, 4, -4, 3, -2, 8, 6, -6, 6, -7, 3, -4, -6, 4, -5, -1, 3, -4, -2, -2, -4, 6, -6, 7, -1, 2, 7, -6, 0, 5, 5, 0, 5, 5, -5, -6, 0, 6, -5, -6, -4, 6, -4, 1, 5, -6, 1, 7, -7, 3, 2, -2, -6, -4, 3, -4, -6, 0, 3, 5, -4, 4, -3, -2, -2, 5, 3, 4, 7, 6, 5, -1, 4, 5, 3, -5, -3, 0, 6, -3, 7, -5, -4, -7, -1, -4, -7, -5, 8, 0, 2, 3, -4, 7, -7, -5, 3, 0, 0, 3, -1, 4, 1, -5, 0, 7, -2, 5, 6, 7, 3, -2, 4, 5, 6, -6, -6, 2, 5, 1, 5, 5, 8, 4, -1, 8, -7, 6, -2, -6, 4, -4, -3, -3, -2, 5, 4, 2, -6, 0, 1, 7, 2, -7, 4, -5, -1, -4, 0, -5, 0, 3, -6, 5, 1, -5, 8, 0, -3, 1, 6, -1, 1, 6, 2, 6, -5, -5, -3, -4, 2, 4, -3, -1, -3, -6, 5, 7, 0, -4, -2, -6, -2, -1, 0, -4, -3, -7, 8, -5, -3, -4, -2, 6, -2, 5, -1, 4, 7, 3, 6, 8, 0, -2, -6, 6, -2, 1, 5, 0, -1, -1, 3, -4, 0, -5, 0, -3, 8, 4, -6, -7, 3, -2, 2, 3, 7, 6, -6, -7, -1, -2, 6, 4, 3, 5, 6, 4, 7, 0, 6, 0, 8, -3, 4, -1, 7, 0, 7, 7, 0, 2, 3, 3, -6, -1, 1, 6, 6, -7, 0, 4, -5, 5, 0, 2, 2, 5, 7, -3, 6, -1, 8, 5, 7, -5, -4, 1, -5, 5, 6, -2, -5, -4, 1, 1, 8, 0, 7, 2, 3, -5, -4, 3, -5, 2, 6, -5, 3, 6, 2, -3, -4, 8, 3, -2, 4, -5, 2, -6, 2, 3, -6, 6, -4, 6, 3, -7, 1, -3, 4, -5, -4, 3, -3, 1, 8, -4, 1, -4, 5, -1, 2, 6, -2, -2, -4, 0, 0, 5, 2, 4, 4, 5, -4, 5, 0, -1, 7, 5, 7, -7, -7, 1, 6, -4, 7, 1, 4, -2, -1, -6, -1, 6, 5, 3, -1, -7, 6, -6, 1, -1, 3, -7, 0, -2, 5, 6, 3, 1, 6, 5, -6, 3, 5, 7, 4, 3, 4, 3, -7, 6, -5, -6, -6, 0, 0, -4, 8, 3, -4, 6, -1, 3, -5, 6, 6, 1, 5, 1, 6, 8, 5, 3, -2, 4, 4, 2, -2, -4, 2, 2, -5, 7, -6, 6, 3, 7, -3, -6, 1, 4, 0, 1, 1, -5, -1, -4, -6, -1, 3, 3, -5, 4, -5, -4, -6, -6, 8, -2, 2, 5, -3, -3, -4, 6, 4, -2, 8, -4, -1, -1, 5, -6, -1, 4, -1, -1, 4, 6, 7, -5, 2, -3, -1, -2, 0, 0, -3, -1, 3, 2, 6, 1, 2, 6, 1, 2, 1, 5, 4, 4, -2, 3, -2, 6, 5, -3, -4, 8, -7, 0, -2, 3, -3, 2, 2, 6, 3, 6, 0, 6, 7, -2, 4, -4, -1, -1, -5, -1, -6, -4, 2, -4, -2, -5, 5, -6, 4, -4, -5, 5, 2, 8, 3, 3, -3, 5, 6, -1, 5, 3, 3, -2, -3, 3, 1, 8, -4, 6, 4, 6, -2, 4, 2, -4, 6, -5, 7, 5, 5, -7, 7, 7, -1, 3, -3, -3, -6, 5, -4, 0, -4, 5, 4, -4, 2, -2, 4, 2, 1, 2, -2, 0, -3, 3, 0, -2, 2, -5, 3, 2, -7, -5, -2, -3, 7, 7, -2, -5, 3, 3, -4, -6, 3, 5, -3, 7, -4, -1, -5, 6, 4, 0, -4, 0, 0, -6, 4, -2, -1, 3, -6, 5, 2, 2, 6, -2, 7, -5, 0, 1, -5, -4, -5, -7, 3, 3, 5, 5, 7, -2, -2, -3, -5, -6, -4, -4, -5, -3, 2, 5, 6, -1, 6, 4, -5, -4, 6, -2, 4, -1, 2, -5, 0, -1, -1, 3, -6, -5, -6, 3, -5, -3, 8, -2, 4, -7, 8, 1, -5, 3, -6, 1, -3, 1, -4, 8, -5, -7, 3, -7, -3, 6, 6, -3, 8, 1, -1, 6, -4, -2, -3, -6, -1, 4, -6, 0, 8, -2, -1, -1, 0, -2, 4, 3, 0, 8, 3, -2, 4, 1, 5, 5, 2, 2, 8, -5, -6, -3, -6, 4, 4, -2, 7, -3, -4, -7, -6, 5, 3, 2, 8, 5, -5, 3, 2, -1, 1, 7, -1, -6, 5, -4, -2, 7, -2, 7, 1, -2, -2, 8, -5, 7, 8, 4, 7, 0, -4, 2, 7, -7, 0, 5, 0, 1, 4, 7, 1, -3, -2, -4, -5, -3, 8, 0, -7, -7, 1, 6, 1, 7, -5, -5, 8, 4, -5, 5, -3, 4, -1, 2, -5, -1, 5, -6, -2, 5, -2, 3, 4, 5, -1, 7, -3, -7, -5, -4, -6, 6, 5, 2, 0, 5, 6, -1, 3, -6, 0, 3, -2, 0, 8, 0, 7, -6, 3, -6, 6, 5, -2, -2, 3, -1, 6, -2, 0, 6, 2, -6, -3, -3, 6, -4, -2, 7, 4, -1, -1, -6, -6, 6, 7, 4, -2, -4, -5, -5, 4, 2, 6, 7, -2, 0, 4, -2, 2, 6, -3, 2, 1, 0, 5, 1, -5, 5, 5, -3, -2, 1, -2, 2, 3, -5, 2, -6, -3, 2, -6, 6, -2, 2, 3, 1, 1, -1, 5, 2, -5, 1, 5, 3, 6, 5, -6, 2, 8, -2, 7, 4, 1, -2, -4, 2, 4, 7, -5, 2, -2, 1, -6, -4, 2, 6, 3, 4, -5, 3, 7, 6, 1, 4, -6, -2, -2, 3, -5, 7, -4, -5, 3, -4, -5, -4, 3, 1, 4, 6, 1, -1, -5, -5, 6, -6, 6, -7, -1, 8, -7, 2, -3, 4, 0, 5, -5, 2, -5, 8, 7, 7, 4, 2, 6, 4, 7, -2, 8, -4, -2, 8, 4, 4, 7, 6, 3, 2, -2, 4, -4, 5, 2, -5, 5, -1, -3, 7, -2, -5, -4, 3, 6, 0, -5, -7, 5, -5, 0, 6, -4, 8, 4, -6, 0, -6, 3, 2, 1, 3, -5, -5, -4, -4, 2, 3, 3, 4, -6, 1, -1, -4, 7, 1, -2, 5, -2, -6, -3, 7, 1, 0, 2, 5, -1, -3, -1, 6, 0, 6, 0, -2, -5, 6, 4, -5, -5, 6, 4, -2, -4, -6, -5, 0, -4, 3, 6, -6, -1, 7, -6, -7, 4, -1, 4, 5, 0, 3, 0, 0, -7, 5, -2, 2, 3, 2, 4, 7, -1, -3, 7, 1, 0, -2, -3, 6, 0, -6, -4, 6, -3, -2, -5, 7, 2, 1, -2, 5, 7, 7, 7, 6, 0, 0, -6, 5, 2, 0, -6, -2, 6, -3, 2, -7, 0, 2, -3, 8, -3, 1, 3, -2, 0, 1, 3, 4, 0, 4, 3, 0, -2, 0, -1, -5, -5, -7, 6, -2, 5, 8, -3, -2, 3, -5, -6, -7, -1, -1, 3, 7, 4, -5, 5, -4, 7, -6, 1, -4, 5, -3, -1, 3, 0, -4, 6, 6, 6, 3, 2, 5, 0, 6, -3, 1, -4, -2, -1, -6, 7, 1, 3, 2, -3, 4, 1, 5, 1, 4, -4, 5, -4, -2, 1, -4, 8, 7, -2, 2, 7, -2, -2, -6, -7, -4, 0, -6, 6, -7, -4, 5, 1, -6, -7, 0, -1, 1, -1, -5, -1, 2, -3, -7, 7, -3, 0, -3, 1, -2, -2, 5, -6, 0, 2, -5, -2, -3, -3, -2, -2, -7, -6, 0, 1, 3, 1, 6, 7, 7, -4, -4, 1, 3, 8, -7, 2, 6, -1, -7, 6, 6, -1, 3, 0, 5, -4, -6, -2, 5, -2, -2, 2, -7, 7, 3, 2, 0, 1, -2, 2, -4, -3, -5, -1, 0, -1, 1, 7, 6, -2, -6, -4, 0, -6, -3, -6, -1, 4, -7, 0, -2, 4, 3, -4, 4, -6, 2, -3, 3, 6, -5, 5, -1, 7, -2, 5, -5, 5, -4, 6, 4, 3, 6, -4, 7, 7, 4, 5, 3, -6, -6, 0, 0, -4, 1, 2, 0, -2, 7, -4, 2, 1, 2, -6, -7, 4, 8, -7, 5, 0, -2, 5, -5, -4, -2, -6, 2, -2, 5, 3, -7, -2, -3, 7, 2, 3, 4, -5, -4, 0, 6, 1, -5, 3, -4, 8, -6, -1, 2, 6, 7, 3, 7, -3, -6, -5, -2, -6, 6, -4, -4, 3, 2, 0, -6, -4, -7, 2, 4, -4, 1, -7, 2, 4, -6, -3, 5, -6, -2, 2, -3, -7, -6, -1, -5, 0, 6, 4, 0, 7, 7, 0, 7, 0, 1, -7, -7, 5, 5, -3, 7, 1, 2, 6, 2, 3, 1, 7, -7, -5, 4, 4, 2, -2, -6, -3, 7, 2, 2, -3, 8, -5, 8, -5, 6, -3, 5, -4, -2, -1, 7, 2, -1, -6, -3, 3, -4, 3, -2, 4, -2, 8, -2, 3, 3, 6, -1, -2, -3, 4, -3, -4, -1, -4, -5, -2, -4, -6, 0, -1, 5, -2, 2, -4, 4, 0, 8, 1, 7, 7, -5, 7, 2, 7, 1, 6, 8, 6, 0, -5, -2, 3, 1, 1, 1, 3, 1, 0, -6, -6, 1, 2, -4, -6, 0, 1, 8, 2, -2, -6, 7, -3, -2, 2, 6, -4, 4, 6, 4, 5, 1, -6, 4, 7, -5, -4, -2, 5, 4, -1, -2, -3, -2, 0, -1, 2, 0, 1, -5, -1, -4, 4, 0, -7, 1, 4, 0, -6, 1, 2, 8, 5, 1, -3, -3, -3, -6, 7, 6, -1, -4, 2, -6, 6, -6, -3, -1, 1, 8, 4, 7, 0, -6, 3, -6, 6, 3, 8, 7, -6, 3, 4, 1, -3, 6, -4, -5, 7, -2, -5, 2, 5, -5, -2, -7, -4, 3, 3, 4, -1, 5, -1, -7, -6, -4, 7, 6, -2, -4, -6, -4, -2, 6, -5, 8, -6, 1, -1, -7, -6, -1, -3, 8, -3, 1, 1, 1, 0, 2, -5, 6, -6, 8, -3, -4, -5, 4, 4, 2, -3, 2, 1, -1, 3, 6, 6, 5, 7, -3, -3, 5, -4, 5, 2, 0, 4, 2, 3, 3, 8, -5, 7, -5, -4, 2, -7, 6, 4, -3, -6, -1, 5, 0, 4, -5, 5, 1, 4, -2, 1, -3, 4, 8, 7, 3, -5, 3, 4, -2, -4, 0, -2, 0, 1, -1, 0, 5, 1, 6, -1, 7, 3, -6, 4, -2, 3, 3, -5, -2, -5, -5, -6, -3, 3, 6, 7, 2, 8, -1, 7, 7, -6, 4, 1, -1, 4, -4, -3, -3, 8, -6, 0, 6, 7, -6, 3, 4, 5, -7, 7, 4, 6, -6, 8, -1, -4, -3, 1, -6, -4, 2, -6, 2, 5, 7, 5, 6, -6, -4, 2, 1, 2, -1, 5, -5, -7, 5, -6, -2, -5, -3, 0, 1, -4, -6, 1, -2, 2, -4, 0, 1, -5, 2, -5, -2, -2, 3, 2, 2, 2, -3, -2, 6, 4, -3, -4, -1, -4, 1, -4, 6, -4, -2, 8, -4, 8, -5, -4, 5, 6, 7, 4, -4, 3, -4, 6, -1, 6, -7, -6, 5, 5, 5, 7, 2, -7, 0, 4, -2, 6, 3, 2, 2, -2, -2, 1, -7, -1, -4, -1, 1, -4, 1, 8, -6, 4, 2, -2, 4, 0, 6, -5, 6, 7, -2, 3, 3, 5, -6, -4, 0, -7, 0, 2, -5, -6, 7, 2, 5, -2, 7, 6, 4, 3, 4, 4, 2, 2, 6, -7, 0, 5, -6, -2, 7, -3, 7, 6, 6, 3, 0, 8, 1, -5, 0, -2, 6, 0, 4, 6, 6, 4, 5, 5, -4, 4, 1, 7, 0, 0, -7, -1, -6, 6, -5, -5, -7, 0, 1, 4, 3, -6, -6, -3, 4, 1, -2, -2, -4, 5, 4, 7, -7, -4, 1, 0, -1, -6, 2, 2, 4, -3, 4, -3, -5, 7, 1, 3, 8, -6, -4, 7, -6, 2, 3, -7, -3, 7, 1, 4, 7, -3, -2, -4, -2, 8, 5, -3, -6, -2, -2, 4, 8, 4, 7, 6, -3, -6, 0, 2, -3, 1, 5, 0, 2, 2, 1, -5, 5, -3, 5, 8, 5, -5, 0, -5, -5, 7, -5, 1, 5, -4, -5, 3, -7, 5, 7, -4, 8, 1, 1, 0, 8, 7, -2, 5, 2, 5, 2, 0, 2, 3, -3, 5, 6, 5, -5, -1, -2, -2, -4, -6, 0, 4, -2, -1, -6, -1, -5, 0, -3, 5, 7, 7, 1, 2, 2, 5, 0, -2, -2, -5, 7, 8, 1, 4, -4, -5, -3, 6, 2, -6, 6, 4, 6, 5, 8, -4, -6, 8, -5, 7, 1, 8, 1, -2, -2, 5, 1, -4, 3, -1, -3, 1, -1, 7, 2, -6, 6, -6, 2, 4, 6, -2, -5, 0, 3, 4, 5, -2, -6, -5, -4, 0, 0, 8, -1, 7, 4, -4, -3, 1, 3, -5, -2, -3, 3, -3, -5, 8, -5, 0, -4, 2, -7, 3, -5, -3, 6, -7, -7, -7, -3, -4, 0, -4, -1, -5, 6, 7, 4, 5, -1, -6, -3, 6, 4, -5, 4, -7, -1, 4, 6, -1, -4, 2, -2, -2, 6, -5, 8, 2, 2, 5, -6, -1, 0, 1, -6, 5, 5, -3, 0, 2, -5, 1, 2, 5, -1, 3, -6, 5, 3, -3, -6, 0, 0, -2, 8, 7, -6, 4, -2, 4, -7, 1, 4, -3, 7, 3, -3, -1, 7, -6, -6, -6, 3, 0, 3, 6, 1, 4, 7, -7, 7, 4, 8, 7, -5, 2, 1, 5, -4, 3, -4, -6, 2, -1, 3, 4, 5, -5, 2, -6, -6, 1, -2, 5, -1, 5, 0, 4, -2, 4, -1, -3, 7, -4, -2, 8, 3, -4, 6, -6, -5, -3, -4, 6, -2, -5, -6, -5, -1, -4, 0, -4, 8, 0, 5, -6, 6, 4, -6, 2, 0, -7, 7, 7, 5, 5, 3, -3, 1, 0, 6, -4, -4, -2, 7, 8, 4, 6, 6, 2, 4, 5, 1, -1, -1, 5, -6, -7, -2, 0, 2, 5, 2, 7, -1, -2, -4, 8, 2, -6, -4, -4, 1, 1, 8, -1, -5, 4, 2, -2, -6, -2, -3, -7, 3, 4, 4, -4, 4, 8, 4, 7, -6, -7, 0, 4, 4, -7, -4, 0, 2, -3, -4, -3, 6, 3, 3, -5, -7, 4, -7, -1, 6, 3, 8, -2, 7, 2, -3, -2, 7, -3, 5, -6, 2, -7, 7, 7, 4, -4, -3, 1, -3, 5, -5, -1, -4, -5, -4, 5, -2, -2, -2, -4, 0, -4, -1, 6, 8, -1, 1, -1, 3, 5, -2, -1, 2, 1, 2, 7, -2, 0, 0, 2, -7, 7, -2, 7, 3, -3, -5, 2, -5, -2, 7, -4, 3, 3, 4, -6, 0, 5, -2, 7, -2, -2, 6, -6, 7, -5, -2, 4, 5, -5, 5, -5, 5, -2, -6, 6, 7, 6, 6, -2, -1, 6, 7, 1, 3, 2, 5, -4, -6, -5, -4, 6, 1, -4, 3, 5, -6, -4, 4, 3, -3, 5, 0, -7, 8, 0, 3, 4, 0, -5, -6, -1, 5, -6, -5, 4, -4, 7, 1, 0, -4, 3, -4, -6, -4, 2, 3, -3, 4, 1, -4, 8, -2, 2, -5, 4, 0, 3, 6, 4, -6, -2, 3, 6, -6, 3, -2, 3, 1, -4, -7, -5, 3, 1, -1, 1, -5, -5, -5, 4, 5, 4, -1, -2, -1, 6, 7, -5, -2, -5, -2, -3, -5, 7, 6, 3, -4, -1, -5, 6, 6, 4, -3, 3, -3, 7, 5, 2, 3, 0, 1, 2, -5, 7, -1, 5, 4, 0, 0, -1, 7, 0, 4, 2, -3, -6, 2, 2, -7, 4, 1, 7, 2, -5, 8, 7, 3, 2, -3, 2, 7, 7, 3, -2, 3, 2, -1, 0, -2, 8, -4, 0, 4, -4, 4, 1, -3, -2, -5, 5, 8, -6, 7, 5, -3, -1, 8, 1, -3, 3, -3, 2, 1, 8, -6, -2, 0, 3, 5, 0, -4, -5, 7, -4, -5, 0, 7, -6, -4, 7, -7, 8, -5, 0, -7, -3, 7, 4, -6, -5, -6, -5, 7, 8, 3, -6, -4, 5, -5, -1, 7, -6, 6, -2, -4, 2, 3, 5, 2, 6, -3, 4, -1, -3, -5, 2, 3, 2, 7, 3, -1, 6, -3, -2, -5, -3, 0, -5, -3, 0, -2, 8, -7, 1, -5, 2, -6, 6, -6, 5, 8, 6, 3, 7, -6, 2, -2, 3, -6, 0, 7, -3, 3, 3, 0, -6, 3, 4, 7, -4, -7, -3, 1, -6, -4, 4, 6, -4, 5, 3, -4, 5, -4, 6, -3, 6, 0, 3, 5, 7, 8, -7, -1, 7, -6, 7, 0, 2, 6, 6, 2, -1, -6, 2, -4, 6, -7, 0, 8, 7, 7, -4, 3, -6, 2, -7, -3, -4, 3, 0, 7, -5, -3, 2, -6, 6, 8, 4, -5, -2, 8, 1, 4, -2, 8, -6, 1, 0, -2, 7, 0, 3, -2, -7, 0, 0, -2, 2, -2, -1, 5, 0, -1, 8, 3, 2, -2, 0, -3, 3, -4, 5, 0, -6, 3, -4, 7, -2, 6, 2, 3, 4, 8, -4, 5, 3, 6, 7, 2, 1, -3, 6, 0, 3, -2, 7, -6, -2, -5, 1, -6, -2, -7, 7, 8, 1, 3, 3, -4, -7, 1, -6, 6, 0, 3, 2, 5, 0, -3, 2, 1, -5, 5, 2, 7, -1, -4, -5, 2, 7, -1, -1, 4, -2, -3, 5, -1, 7, 4, 2, 3, 6, 5, -2, 0, -2, -6, 7, -3, -1, 6, 4, 3, 1, 3, -1, -2, 1, -3, -5, 0, 0, 7, 4, -3, -6, 2, 4, 7, 8, 5, -5, -1, 1, 7, -6, 2, 7, 6, -3, -4, 3, 3, -6, -3, -6, 5, 3, 2, 4, -5, 1, 6, -7, -1, -2, -4, -1, 2, 0, -1, 2, 3, -2, 5, 6, 2, 6, -3, -4, -7, 6, -6, -1, -5, 2, 6, 5, 1, -4, 1, -1, 0, -5, -1, -5, 2, -5, 0, -5, -1, -1, 4, 3, -6, 3, 1, 3, -7, 1, 4, -7, 1, -5, -2, 4, 6, -1, 2, -1, 5, 6, -2, -4, 7, -2, -3, 5, -6, 3, -4, 4, -6, 1, 6, -6, 7, -6, 7, -3, 0, -4, -4, 5, -1, 1, -5, -1, 5, -6, -5, 4, 2, 6, 1, -5, 4, -1, 5, -2, 4, 7, 1, -6, -1, -3, 0, -1, -6, -4, 3, 1, -1, 5, 5, 6, 3, 0, -7, -1, 0, -4, 1, 3, -1, 6, -2, 1, 8, 1, -1, -6, 0, -2, -1, 7, -2, 6, -3, 4, 6, 2, 4, 3, -2, -5, 1, 2, 4, -4, -6, 2, 7, 1, -7, 3, 1, -4, 1, -4, -7, 3, -6, 0, -5, 1, -5, -6, 6, 1, 4, 5, 7, 0, 3, 5, -6, 5, -3, 3, 4, 4, 2, 4, 0, 1, -1, 1, 2, 7, -1, 2, 6, -5, -5, 2, -3, -1, -5, -2, 1, 0, 2, 8, -4, 4, 0, -2, -2, 4, 6, 5, -5, 6, -3, -2, 4, 7, 6, -6, -6, -6, -5, 2, 0, -5, -1, 7, 3, 6, -5, -2, -2, 8, -5, -2, -2, -3, 8, -1, 5, -4, 1, 2, -5, -4, -3, 5, -4, 2, 7, 6, -1, 3, 6, -5, 5, 0, 5, -6, 8, 5, 1, 3, 3, 5, 2, 8, 0, 1, -6, -5, 3, -5, -2, -2, -5, 7, -2, -5, 3, 2, 6, -4, -4, -2, 3, 0, 3, -5, -6, 5, 0, -6, 1, 7, -4, -6, 6, -6, 2, -1, -3, -5, 7, -4, 4, -4, 0, 0, -5, 7, 7, 0, 7, 7, 7, 6, -1, 5, 6, 3, -4, -3, -4, 4, 3, 4, -2, 0, 0, -3, 4, 1, 2, -4, 4, -5, 4, 6, 2, 7, -3, -2, -6, 1, 0, 3, 5, 7, 1, 4, -1, 1, 5, -6, 1, 1, -2, -2, -7, 2, -7, 0, 6, 7, -2, -2, -5, -5, 6, -1, -1, -4, 0, 7, -5, 3, 5, 0, -1, 7, 0, 2, -4, -4, 7, 4, -4, 7, 5, 0, 4, 0, 0, 3, 0, 0, 6, -3, 1, 6, -6, -7, 7, 4, -3, 8, 5, -6, 1, 6, -5, 0, 6, -3, 1, 7, 1, 4, -2, 2, 4, 1, -7, 0, -6, 7, 5, 4, -1, 0, 7, 4, -3, 8, -5, 4, 7, -3, -1, 1, 0, -2, 2, -2, 5, 0, -1, 4, 5, -2, -5, -5, 2, 4, -1, 0, -7, 1, -4, 4, 6, 0, -4, -3, 4, -1, 6, 3, -4, -4, 4, -6, -3, 2, 3, 7, 6, -4, -4, 5, -2, 1, -1, 1, 7, 5, -6, 6, -2, 2, 7, -6, -4, 2, -3, 4, 2, 3, 3, -3, 8, -6, 4, 4, 3, 2, 5, 2, -7, -6, -7, 7, -1, 4, 7, 4, 5, -7, 0, -2, -6, 0, -3, 4, 1, 3, -6, -3, -4, 2, -7, 4, -6, -1, 7, -4, 6, 1, 1, 3, -3, -1, -7, -1, -3, -2, 5, 0, 4, 2, 2, 6, 8, -7, -4, 3, 6, -5, 5, 6, 8, 4, 1, 5, 2, 3, 2, -1, -4, -2, 6, -7, -7, -6, -2, 5, 3, -2, -2, 6, -4, -2, -4, 2, -6, 3, 1, 8, 5, 8, -1, -4, 0, -5, -1, -1, 0, -3, -5, -4, -3, 5, 7, 1, -3, -4, 1, 3, 1, 1, 3, -1, -4, -6, -2, -1, -1, 3, 8, 5, -4, 7, 3, -2, -5, -2, 3, -3, 2, 7, -5, -3, -4, 7, 3, -3, -1, -6, -3, -4, -6, 3, 6, 4, -5, 0, 7, -7, -4, 2, -4, -6, 4, 7, 2, -2, -1, 3, 2, 3, -5, 3, -2, 4, 4, -7, 6, 7, -6, 7, -1, -4, -2, -3, 1, -1, -6, 2, 7, 1, 3, 7, -5, 2, 7, 0, 4, -1, 1, -2, 6, 6, -2, 5, -2, 6, 7, 7, -3, -5, 1, 7, 5, -3, 1, -1, 5, -2, 5, 7, -3, 3, 2, 7, -1, 7, -3, 1, 4, 4, -3, -4, 4, 6, -6, -3, 0, 8, -1, 1, -7, 4, -7, -4, 2, 5, 5, -3, 2, -4, 0, -7, 4, -6, 3, -3, -2, -5, 0, 1, 1, 3, -3, -4, 3, 8, 4, 3, -6, -7, -3, 2, 6, -2, 0, 3, -6, 6, 7, 1, -4, -3, 3, 5, 8, -7, 4, 8, 1, 8, -1, 3, 7, 2, 8, 0, 3, -6, 4, -1, 0, 1, 8, 7, 4, 4, 2, 6, 7, -6, 2, -4, -7, 5, -4, 7, -1, 0, 6, 2, -4, 7, -4, 7, 1, 7, 5, -1, 5, -7, -4, 4, 6, -5, -5, -2, 6, -6, -1, 4, 1, 0, 2, 7, 5, 5, -6, -4, -5, -4, 4, 6, -1, 1, -4, -1, -2, -6, -1, 4, 1, 1, 3, 4, 4, 4, 0, 1, -6, -4, 1, -5, 5, 5, 1, -6, -2, -3, -4, -7, 0, 7, -6, -4, -6, 1, 3, 0, 2, 6, -3, -4, 4, 5, 5, 7, 6, 0, -7, 0, -2, -5, -2, 1, -3, -5, -4, -5, 4, 3, 7, 3, 7, 7, 1, 3, 7, 7, 2, 5, 5, 0, 3, 7, 2, 2, 7, 1, 1, -5, 7, 0, 5, -5, -6, -6, 8, 7, 6, -4, -2, 3, 6, -1, 5, 6, -5, -4, 2, 6, -2, 5, 3, -4, 7, -4, 5, 8, -5, 1, 8, 0, 0, 1, -6, 2, -5, -7, -2, -1, -4, -2, 3, 1, 8, 4, -3, 8, -1, 5, 4, -1, 1, -3, 3, -4, 0, -4, 8, 0, 3, -3, -5, 3, 5, 0, 7, 6, 0, 5, 5, 2, -1, 0, 2, 2, -2, 4, 4, 7, 4, 5, 1, 7, 5, -5, -2, 5, -4, -2, -5, 0, -5, -5, -2, -4, -5, 7, 5, -2, -5, 6, -3, 1, 1, 4, 2, 0, -3, 1, 6, -2, -1, -5, -5, 8, -1, -3, 0, 2, -4, -7, -1, -2, -4, 2, 3, 2, 3, 2, -3, -5, 0, -4, 1, -4, 4, -5, 2, 8, 8, 5, -4, -7, 0, 3, 3, 5, -2, 0, 0, 6, -3, 5, 7, -5, 5, 5, 0, 8, -3, 7, 8, -6, -3, -5, 3, -6, 5, 3, -7, -1, -2, 5, 2, 4, 6, 1, 3, -3, 0, 4, 5, -3, -1, 0, -5, -4, -3, -7, -2, 2, -1, 4, 5, -2, -6, 0, -6, -5, -4, 1, 0, 4, 7, -6, -7, 6, -7, 5, -1, 3, 4, 3, -4, -5, -6, 4, -6, -2, -2, -5, -4, 0, -5, -7, -1, 0, -6, 7, -1, -6, -7, 6, -3, -5, -1, 1, 8, 7, -1, -2, -1, -5, 0, 4, 1, 1, -6, 3, 6, 7, 0, -4, 4, -4, 5, 6, -2, -1, 4, -6, 5, -4, 3, -4, 1, 2, 6, -7, -2, 0, 5, -1, 4, 3, -1, -2, 3, 1, 8, 4, 5, -4, -6, -5, 5, 8, -4, -2, 0, 4, 7, 6, 3, 7, 4, 5, 8, 3, -1, 0, -3, -5, -3, -4, -5, 5, 2, 4, 3, 1, -2, 3, -5, 1, 1, 1, 3, -1, 6, 7, -1, 4, 6, 1, 6, -5, -7, 7, -1, -3, -2, 1, 2, 5, 7, 2, -1, -4, -5, -6, 8, 7, -5, 4, -7, 0, 2, 3, -6, 3, -1, -6, -1, -5, -2, 4, 5, 3, 5, 5, -1, 0, -4, -1, 0, -2, 6, -3, -4, -4, 4, -4, 6, 2, 0, -7, 6, 0, 2, 5, 0, -2, 5, -4, 8, -5, 5, 2, -2, 7, -2, 6, 2, -2, -6, 2, -1, -2, 0, -4, 4, -5, 3, 6, -6, -3, 5, 1, 5, -5, -1, -1, 0, 5, 4, 7, 3, 2, 8, -3, -3, 6, -3, 1, 2, 2, -2, 4, 0, 6, 8, 3, 1, -5, 3, -2, 1, -5, 3, -1, 3, -7, -3, 0, 2, 5, 4, 1, 0, -4, -6, -1, -3, -3, -3, 8, 4, 4, 0, -4, 6, 0, 3, 7, 7, 7, -4, 8, 2, 8, 4, -7, -7, -3, 4, -3, 2, 8, 6, 7, 7, -7, 7, -7, -6, 0, -6, -4, -1, -1, -4, -2, -2, -6, 6, 5, -1, 1, 7, -7, 4, -5, 2, 0, 5, 4, -3, -2, 2, 8, -1, 5, 4, 2, 0, -6, 8, 2, 0, -1, 5, -2, -6, -7, 1, 2, 3, 0, 7, -7, 4, 6, 2, 8, -4, 5, -2, 1, -4, 5, 0, -1, -5, -7, 5, 5, 2, 4, -5, -4, 7, 6, 5, 4, -3, -6, 3, -6, -4, -5, -4, -3, 1, -4, -7, -3, 1, -4, 2, -4, -3, 3, 0, -2, 2, 0, 6, 0, -4, 5, -3, -2, -2, -3, 4, 0, 3, -5, 3, 4, 3, -4, 6, -3, -5, 1, -2, -2, -7, 3, -4, -6, -4, 1, -6, -1, -3, 5, 4, -4, -1, 3, 3, 6, -1, 5, 6, 3, -3, 0, -5, -1, 8, 5, 7, 4, -5, -3, -6, -2, -5, 2, -7, 2, 0, 8, 7, -5, 7, 4, -4, -2, 1, 7, 7, 3, 7, -5, 5, 3, 1, -3, 3, -5, 7, -5, 8, 1, -1, -7, -5, -7, 2, -3, 0, 3, 6, 5, -6, -1, 5, -6, 7, -2, 8, -1, 3, 0, -1, 3, 1, -4, 4, 3, -1, -7, -5, -5, -6, 0, -4, 4, -6, 6, -1, -6, -2, -1, -6, -1, 7, 1, 6, 5, -1, 5, -4, 7, -4, 1, 4, 5, 4, 1, -7, 5, -7, -7, -3, 3, -2, -4, -2, -7, 5, 2, 7, 1, -2, -4, -5, -7, -5, -6, 7, -5, -4, -1, 2, 2, 2, 0, -6, 7, -6, 0, 4, -5, 0, -1, -4, 4, 7, -2, -5, -3, 3, -6, 7, 7, 2, 7, -1, 2, 5, 0, 4, 0, 1, -3, -6, -4, 1, 3, 3, 5, -6, 0, -4, -3, 7, 7, -6, -2, -1, 4, 0, -1, 1, -3, 1, 2, 0, 5, 3, 6, -7, 5, -2, 4, 1, -6, 5, -3, 4, 3, -4, 4, -2, 2, -2, 8, 5, 7, 3, -7, -7, 2, 2, 6, -3, -6, 2, 6, 7, -6, -1, 1, 5, 7, -3, 4, 6, -4, -7, -2, 6, -6, 6, -2, -1, 5, 4, 7, 5, -6, 8, 1, -7, -7, -4, 4, -5, -3, 2, -5, 2, -2, 8, 1, -7, -4, -6, 0, 8, -4, -3, -4, -4, 6, 0, -3, 5, 4, -3, 8, -5, 5, 8, 5, 6, -3, 1, -6, -5, -1, -7, 4, 5, 0, 2, 6, -4, 4, -4, 4, 4, 1, -6, -4, -4, 5, 6, 1, 1, 4, 0, -4, 2, -7, -4, 8, 6, 6, 3, 8, 4, -2, 1, 7, 1, -6, 5, 0, 4, 3, -3, 2, -2, 5, 8, -5, 2, 5, 1, 4, 8, 6, -6, -4, 5, -6, 1, 2, 7, 6, -4, -2, 5, 0, -4, 1, -7, 2, 0, -4, 7, 4, -2, 5, 4, -6, -1, 1, -3, 1, -2, 5, -6, 5, 4, -5, 2, -5, -7, 1, 3, -2, 4, 6, 2, -6, 3, -4, 2, 4, 7, -1, 4, -1, -6, -7, -4, 6, 4, -7, 2, -1, -2, 8, 5, -6, 2, 2, -1, 8, -1, 6, -4, 4, -2, 1, -3, 4, 5, 5, 2, 6, 5, 0, 8, 3, -7, 3, 4, -6, 0, 4, -2, 0, 3, 8, 5, 3, 0, -1, -4, -7, -5, -6, -4, 5, 8, 7, 2, -5, -3, 6, -6, 4, 5, -2, -6, -5, -6, -6, -5, -2, 8, 2, -1, -5, 3, 0, -3, 5, 0, 7, 4, 7, 5, 6, 1, 4, -4, -4, 6, 1, 1, 7, 4, 6, -4, -2, 2, 6, -3, 1, -4, 3, 8, -5, -4, 2, -6, 3, -3, -4, 2, 6, -1, -4, 3, 0, 3, 6, -2, -6, 5, 8, -1, -5, 0, 1, -4, 6, -5, 7, 7, 8, 1, 0, -6, 0, -3, -5, -5, -5, 0, -3, -3, 6, -6, -1, 3, 7, 3, 0, -2, -7, 2, 7, -4, 1, 5, 0, 4, 7, 0, 7, 3, 8, 3, -4, 2, 2, 3, -5, 7, -3, -5, 7, -1, -5, 2, -2, 8, 2, -6, 0, 5, -2, -1, -4, 6, 3, -7, -3, -5, 1, -1, -2, -6, 1, 8, 7, -2, -4, -4, -4, 0, 1, -1, -1, 7, 7, -6, -3, 2, -3, -1, -3, -3, -6, -5, 3, 1, 7, -7, -3, 0, 1, 8, -3, 5, 1, -4, -3, 8, 7, -4, -6, -2, 1, -6, 0, -4, 0, -7, 1, 3, -5, 3, -3, -4, 2, -6, 4, 5, 5, -4, 6, -3, -7, 3, -1, -5, -3, -4, -2, 0, 5, 2, 4, -1, -1, -5, -4, 7, -2, 8, -3, 3, -4, -5, 6, 4, 1, 0, 1, 7, 4, -7, -6, -2, -5, 3, -2, 3, -3, 0, 7, -4, 3, -4, 4, -4, -3, 7, 5, 5, 2, -7, 0, 1, -5, -5, 6, -4, 3, 3, -5, 6, 6, 0, 4, -4, 0, -6, 2, -7, -7, -1, -4, -1, 6, 5, -3, -2, -7, 2, 6, -1, 1, -4, -1, -3, 1, -5, -2, 5, -3, 7, -6, -2, 0, 7, 4, -5, -4, 5, -1, -6, -6, 2, 7, 2, 0, 6, 5, -1, -7, 5, 2, 6, -3, 1, 6, 6, -6, -2, -6, -4, 5, 7, 7, -1, 5, -6, -4, -3, 6, -1, -5, -1, 7, 2, 2, 2, 6, 3, 4, 3, 6, 0, -1, -5, 3, -1, 3, 2, 7, 3, 6, -2, -7, -6, -5, 7, -4, -1, 8, 0, 1, 1, 2, -5, 4, -6, 3, 7, -3, -2, 4, 8, -5, -3, 5, 2, -2, -5, 8, -4, 4, -4, -4, 3, -1, -5, -1, -7, -1, -2, -1, 5, -2, -1, 1, -1, 1, 5, -2, 3, 2, 6, 3, 0, -2, 6, 1, 5, 3, 5, -6, -1, 4, -4, 8, -1, 2, 0, 2, -3, 0, 7, 6, -4, -7, -5, -1, 6, -3, -4, 8, -1, 1, 4, 1, 2, 1, 4, 0, -1, -5, 2, 3, 1, -5, 7, 0, 1, -1, 3, 7, -6, 8, 2, -4, 6, 1, -5, 1, 4, 1, -1, -4, 5, 3, 5, 2, 1, 0, -6, 4, -4, 3, 8, -3, -6, -3, 6, -6, -2, -3, 5, 4, -3, -6, -5, 5, -2, 4, 7, 0, 1, 1, 8, 4, -7, 4, 5, 3, 8, 4, -1, 5, -3, 2, 3, -3, -1, 3, 8, -2, 1, 2, 7, 6, -2, 0, -1, 4, 2, 4, 6, 3, -1, 0, -3, 2, -2, 3, -1, 5, -3, 4, -4, -2, -7, 7, 5, -4, 1, -2, 7, -3, -4, 0, -6, -2, -6, 3, 0, 7, 0, 2, -1, 4, 6, 5, -4, -5, -4, 3, 8, 4, 5, 8, -4, -4, -4, 7, -3, 7, -7, 0, -5, 0, -4, -1, 5, 6, -2, -4, 4, -2, -4, -1, 1, -1, 6, 0, -6, -5, -3, -1, -5, -6, 4, -2, 1, 7, -4, -5, 6, 8, -3, 5, 2, 2, -2, 3, 2, -5, -5, 6, -3, 2, 8, -7, 5, -2, 4, 7, 1, 0, 4, 4, -7, 6, 3, -4, -6, 6, 8, 4, 6, 5, -2, 7, 0, 7, -3, -4, -3, 5, 1, 4, 5, -2, -6, 2, 7, 2, 2, 5, -3, -2, 7, 3, 2, 8, -4, 1, 1, 0, 3, -1, -2, 7, 7, 4, 0, 4, 5, -4, -2, -3, 4, 4, -6, 7, 7, 7, -3, 8, 1, -5, 0, -2, -2, 6, 8, 5, -3, 4, -6, 4, 2, 4, -4, -6, 1, -4, 1, 3, -3, -3, -3, -6, -1, 6, 6, -1, 3, 4, 6, -3, -3, -1, -1, -6, 1, 4, -5, -3, -3, -2, -4, 3, -4, -4, 5, 8, -3, -6, 7, 4, 7, -4, -3, 5, -7, 3, 3, -2, -7, 6, 3, -4, -5, 1, 7, -1, 4, 2, -1, 6, 1, -2, -3, 2, 6, -4, 5, 8, 6, -6, 1, 2, 2, 5, -1, -1, -2, -6, 6, 1, -7, -6, 3, -7, 6, 6, -3, 3, 2, 3, -2, 6, -5, -3, -1, -7, 6, 2, -6, 6, 2, 5, 1, 6, 2, 7, -2, -5, -4, -4, 4, 3, 3, -5, -2, -2, -3, -3, 8, -6, -4, -3, -6, 3, -7, -1, -5, 8, 6, -2, -2, 3, 0, -2, -2, 5, 2, -3, -6, -3, 7, -3, 1, -3, 3, 6, -6, 3, -4, -3, -7, -4, -5, 1, -4, -1, -2, 1, 8, 1, 5, 7, 4, -1, -1, -1, -4, 0, 4, -2, 8, 5, -2, 1, -4, -7, 7, 6, 5, 6, -1, 8, -1, 3, -1, -4, 3, 2, 7, 2, -3, -1, -3, 8, 6, 2, 5, 3, 7, -1, 0, 7, 6, 7, 0, 8, -1, -6, 1, -4, -6, 1, -6, 0, -5, -4, 3, -7, -6, 4, -3, -4, -5, -6, -7, 6, -2, 1, 7, -7, 1, 2, 1, 8, -2, 0, -4, -1, -5, 3, 3, -4, -6, 5, 4, 5, 7, 6, -2, 7, -3, -3, -6, -5, -4, 7, 4, 8, 1, -4, -1, 5, -3, 0, 7, 0, 5, 3, -3, 7, -4, -3, -7, -5, 2, 4, 2, 4, 1, -4, -4, 3, -6, -5, 7, 1, 0, 3, 2, 1, -6, -2, 3, -4, -6, -5, -7, 5, -6, 1, 7, 6, -5, 1, 3, 2, 2, -5, -4, 7, -5, -4, 7, 0, -6, 3, 0, 7, 3, -6, 6, -1, -3, -2, -2, 6, -6, 4, -4, -7, 2, 2, 5, 2, -3, 3, 8, 0, 7, -1, 7, -2, -1, 3, 8, 2, 2, -6, -7, 4, -2, -4, 7, -2, -1, -7, -7, -7, 7, 1, -4, -1, 5, -3, 7, 5, 4, 8, 5, -2, -6, 0, 5, -3, 4, -3, 2, 2, 3, 3, 5, -2, -4, -5, -7, -4, -2, 3, 7, 0, 2, -6, 8, 6, 2, -7, 6, 4, -2, -1, 0, 2, -6, -2, 4, 2, 5, 3, 4, 4, 7, 2, 5, -2, -2, -3, -7, 0, 6, -4, 2, 0, 8, -1, 8, -3, -5, -6, 3, 3, -6, -7, -3, 6, -3, -2, 2, -4, -4, 8, 5, -1, -4, -6, 7, 7, -3, 5, 3, 3, -6, 2, 1, 4, 7, -6, 7, -5, -2, -5, -3, 8, 4, 2, 5, 5, -4, 4, 3, 6, 1, 6, -1, 2, -2, 4, 6, 7, 4, -1, 6, 0, -6, -3, 1, -7, 7, 4, 2, 8, 7, -4, -7, -1, -5, -5, 4, 7, 8, -5, 7, -5, 6, -6, -5, -5, 5, 3, 5, 8, 7, -3, 0, -7, -6, 2, 7, -7, 4, 2, 8, 2, -4, 7, -6, 6, 3, -1, 6, 6, -4, -6, -3, -2, -1, -4, 8, -1, -2, 4, -3, 2, -1, 1, 3, 2, 7, -3, 6, 7, 3, -4, -3, 3, 5, 0, 6, 4, -6, -4, -1, -5, 0, -5, -6, 0, 5, -1, -3, 3, 6, 3, 0, 5, 1, 4, 6, -4, 0, 4, -4, 1, 1, 2, -7, -1, 7, -4, -3, 5, 1, 7, -2, -4, -4, -7, -2, 1, 0, -1, 7, 2, -4, 1, -7, -7, -4, 2, 1, 0, 6, 7, -3, 1, -7, 7, 6, 5, -5, 7, -2, 2, -2, -4, -5, 3, 6, -2, 0, -7, 1, 5, 0, 3, -4, -4, -6, 6, 5, -6, 2, -2, -1, 3, 3, 6, -4, -1, -5, -4, 4, 2, 6, -7, -6, 2, -7, -4, -5, 5, -4, 4, -4, 7, -4, 8, -3, -7, -4, -5, 2, 8, 3, -1, -4, -3, 1, 7, 2, 7, -1, 4, -2, 2, 5, -6, -5, 2, -2, 4, 5, -2, -1, -4, -3, 7, -6, 2, 1, 1, -7, -2, -7, 4, 8, -1, 2, 6, 7, -5, -4, -2, 6, -6, -2, 0, 4, -1, -2, 1, 2, 3, -6, -3, 5, -1, 1, 5, 2, 0, 2, 4, -4, -5, 5, -5, 3, 4, -7, 6, -5, 3, -3, 6, 4, -2, -1, 2, -5, -5, -3, 4, 2, 8, 4, -7, -1, -5, 6, -5, 2, 5, 2, 3, 5, 6, -3, -4, 0, 5, -1, -6, 3, 7, -6, 0, 7, -6, -3, -3, -1, 4, 3, 1, 3, 2, -3, 4, -4, -3, -5, 0, -6, -5, 1, -5, -1, 4, 0, 1, -2, 1, -7, -5, 0, 1, 2, -3, 5, -6, 7, 0, -2, -6, -1, -6, 0, 7, 6, -3, -6, 5, -6, -1, -5, -2, 3, 6, 4, -1, -4, 7, 2, 1, -1, 5, 7, -6, 8, 5, 7, -2, 0, 0, -6, -6, 8, 7, -2, 0, -1, -4, 1, -3, 0, -3, -6, -1, -2, -6, -6, 1, 7, 7, 5, 7, 5, 5, -5, -1, 7, -4, -2, -4, 0, 2, 3, -4, 3, 5, 1, -5, 5, -1, 7, 7, 4, 6, 3, 1, -3, 0, 1, 2, 2, 4, 0, 4, -3, -2, -2, -4, -3, 2, 3, -3, -3, 7, 7, 7, -4, 4, 6, 4, -7, 6, 0, -5, -2, 4, -4, -1, 1, -1, -6, 4, 4, 1, 1, 0, 3, -3, -2, 8, 1, 5, 8, 4, 2, -7, 6, -2, 7, 5, 4, 7, -2, 6, -2, -3, 6, 8, 5, 0, 3, 0, -7, 3, -6, -3, 2, 6, -5, 8, 3, 4, 4, 2, -4, 1, -3, -3, 3, 1, 1, 2, 3, -3, 7, 1, 0, -1, -5, 6, 0, -4, 8, 5, -7, 3, -4, 3, -1, -6, -4, 3, 2, -6, 1, 3, -5, 2, -6, 5, 0, 2, 5, 4, -4, 3, 6, 7, 5, 8, 0, 2, 4, 5, 7, -5, 3, 2, 4, 3, -7, -4, 7, -7, 3, 6, 0, -4, -3, -5, 8, -6, 6, -3, 7, 6, -7, 2, -2, 7, 2, 4, -6, 5, -2, 7, -3, 1, -1, 0, 4, 4, -4, -3, -1, 0, 6, 0, -3, -6, 3, 0, 1, -1, -5, 7, 0, -1, 3, -4, 5, 3, -6, 4, 4, 4, 5, 1, 3, -7, 5, -3, -6, -5, -4, -2, -1, 4, 7, -2, -1, 6, 3, -6, 6, -3, 1, 5, -6, 6, -5, -7, -2, 1, -3, -5, -5, -3, 4, 3, -4, -7, -1, -6, -2, 0, -1, 0, 1, 7, 3, 8, -6, -3, 8, 7, 5, -5, 4, 4, 4, -5, 5, 6, -2, 3, 1, -1, 1, 6, 5, 4, 6, 5, -1, 8, -1, 8, -4, 7, -4, 6, -3, 7, 7, 6, 2, 7, -1, 5, 4, 0, -2, 7, -2, 3, 3, 1, -3, -5, 0, 3, -4, 2, 4, 4, -6, -6, -1, -4, -1, -6, 4, -1, 0, -2, -5, 0, -6, -1, 6, -5, 6, 5, 8, -4, -4, 2, 5, -4, -4, 5, 1, 5, -1, 7, -7, 7, 7, 1, 5, 1, 6, -3, -6, -6, -6, -3, 0, 6, 5, -3, -5, -1, -4, 4, 7, 5, 7, -5, -6, -4, 2, -6, 7, -2, -6, 8, 6, -6, -5, 2, 4, 2, 7, -1, 5, -5, 7, -2, -6, 7, -1, 6, -4, 0, 1, -2, -1, -5, 5, 7, 3, 0, 4, 6, 6, -4, 5, -6, 1, -5, 6, 5, 4, 0, -1, 5, 2, 0, -3, -1, 7, -2, 0, -7, -5, 4, -6, 8, 2, 2, -7, 6, -2, 1, 1, -6, 1, -5, 5, -6, 8, -7, 1, 3, -3, 8, 5, -2, 7, 2, -6, 1, -1, -1, -7, -5, -1, -2, 7, 3, 0, 4, 4, -7, 2, 5, 4, -2, 0, 6, -1, -1, -6, -4, 6, -1, 3, 7, 4, 5, -4, 7, -6, 2, -6, 7, -6, -5, -6, -3, 8, -7, -3, 2, 7, 1, 5, 0, 3, 5, -3, -5, 7, 2, -6, -6, -1, -6, 5, 0, -3, 5, 5, 1, 3, -4, 3, 8, 2, -2, -3, -1, -1, -2, 8, 4, 7, -4, -6, -7, 5, -7, -3, 5, -6, -3, 1, -4, 3, -6, 6, -5, 4, -2, 2, -7, 4, 6, 7, 1, 6, -3, -6, -2, -6, -6, 7, 3, 3, 7, 2, 5, 0, 7, 2, 2, -7, 4, 1, -4, -7, -2, -4, 8, 8, -1, 3, -4, -5, 3, 4, 0, 3, -4, 3, 2, 8, -6, -2, 7, -4, -4, -4, 4, 7, -5, 0, 3, -2, 5, 8, -6, 8, 7, 7, -5, 7, 5, 3, 3, 7, -4, 2, 2, 4, -4, -1, -1, -4, 2, 4, -2, 7, 5, -3, 3, 3, 7, 2, 1, 5, 2, 1, -3, 7, -3, 1, 5, 4, 1, 1, 0, 3, 3, 4, 7, 5, -7, 0, 1, 4, -3, -4, 5, -4, 5, 2, 7, 0, -5, 4, 5, -2, -3, -3, -6, -6, 6, 5, -5, -3, -1, -2, -4, 3, -4, 2, 6, -5, -4, -3, -5, -5, -4, 8, 3, 2, 8, -5, 4, -3, 5, -5, 7, 0, 7, 7, 0, -5, 5, 6, 4, 6, 5, -6, -6, 4, -7, 4, -1, -2, -6, -4, -3, 0, -6, 1, 4, 7, -7, -1, 4, 5, 3, 6, 5, -4, -6, 3, 0, -6, -7, -3, -5, -4, 1, -4, 5, 7, 6, 2, -3, -5, -4, -7, 5, 8, 7, -5, -5, -5, 5, -1, 3, -6, 7, -3, -2, -3, -5, 0, 1, 1, -6, 7, 7, -5, 5, -6, 7, 1, 5, 7, 2, -3, 4, -1, 1, 7, 1, 4, 3, -1, -4, -6, -6, 1, -4, 3, 4, 1, -1, 0, -5, -5, 2, -2, 6, 2, -6, 7, 8, 4, -1, 0, 7, -6, 1, -2, 8, 8, 6, 3, -6, 3, 7, 6, -6, -5, -4, -2, 5, 2, 6, 6, 1, -4, 0, 4, 5, 2, 4, -1, 5, 1, -4, 7, 4, 6, 4, -5, 2, 0, -3, 7, -3, 3, 5, 1, 2, -1, -5, 7, -5, 3, -3, 1, -5, -1, -5, 4, 6, -3, 3, 7, 3, 2, -3, 2, 2, -6, -2, 0, 4, 0, 7, 2, 2, -5, -3, -5, -4, 1, -2, -4, 4, -2, 5, 7, 3, 6, -2, 1, 8, -5, -3, -7, -4, -1, -6, 4, -7, -7, -6, -6, 1, -4, -3, 1, -6, -1, 5, 6, 6, -3, -6, -1, -5, 0, -5, 6, 3, 0, -5, -7, 7, -6, -6, 5, -5, 3, 7, -3, -7, 1, 5, 7, 2, 3, -2, 2, 7, 7, 6, 3, 3, 1, -6, 5, 7, 8, -5, 4, 0, 5, 7, -1, 7, 4, 3, -5, 7, -5, 5, -4, -6, 1, -2, 5, 5, 1, -6, 3, -4, -1, -6, -6, 5, 1, 5, 6, 4, 2, -2, 2, 1, 0, -7, 5, 1, -1, -6, -7, -4, -6, 3, 1, 6, 1, 3, -5, 3, 7, 5, 7, 2, -3, -7, 3, 7, 2, 2, 5, 0, -2, 2, -3, 8, -7, 5, 2, 0, 0, -5, 2, -6, 5, 7, 4, -4, -6, -3, 4, 7, -6, -7, 0, -5, 8, -5, 4, 6, 4, -5, -6, 7, 7, 2, 6, 8, 3, -4, -2, 2, 1, -7, 4, -2, -5, -7, 5, -6, 2, 1, 1, -4, -2, 5, 8, 6, -4, 8, 8, -6, 5, 5, 7, -3, 0, 1, -3, 5, -3, -6, -4, -1, 2, 0, 6, 4, 0, 6, -2, 0, 1, 2, 2, 1, -3, -3, -6, -6, 1, 1, 3, -6, 5, -1, 1, -1, 4, -3, 4, 5, 1, -2, 2, -3, -4, -6, -6, -4, 0, -6, 6, 2, 6, 3, 0, 5, -2, 4, 3, -2, 2, 0, 8, -1, -6, -1, -1, 7, 0, 8, 5, 2, 5, 4, 5, 5, 4, 0, -4, -2, -4, -6, -2, -2, -2, -6, -6, 8, 5, 0, 3, 3, -2, -2, 6, -3, -4, -5, 0, -5, -2, 6, -5, -7, -5, -1, 4, 4, -2, 0, -5, -5, -1, 5, 7, -5, 0, 1, -4, 6, 4, 2, -1, -1, 5, 5, 5, 7, 2, -2, -5, 6, -7, -5, -5, -1, 4, -1, 2, -5, 0, 7, -6, -5, 7, 1, -1, -1, -2, -6, 7, 5, -5, 1, 5, -1, 1, 6, -4, -6, -2, 6, -6, -2, 5, 3, 2, 1, 0, 3, 6, 3, 5, 2, -5, 3, 6, -3, -5, 1, -6, 6, 3, -6, -6, 0, 1, 6, 7, 3, -2, -4, 2, 4, 4, 4, -2, 5, 1, 6, 0, 4, 3, -2, -6, 1, 7, 4, 4, 8, 4, 6, 7, -1, 6, -1, -2, -4, 7, 3, 0, 0, -6, -7, 4, -6, 6, 3, 2, -6, -6, 1, -3, -5, -6, 2, -4, 6, 7, -2, 0, 5, 3, 2, 1, 4, 5, -5, -2, 6, 7, 1, 4, 1, -4, -1, 6, 8, -6, -3, -6, 2, -5, -6, -6, 3, -5, -4, 3, -5, -4, 2, -3, 5, -5, 4, 0, 2, -5, 1, -2, -3, -6, 2, -3, -7, -1, 7, -5, -4, 7, -1, -3, 6, 1, -4, 4, 5, -2, -2, 7, -4, -5, -4, -4, -7, 0, 1, 0, 3, 6, 1, -5, 2, -6, -1, 3, 2, 3, 3, 0, 8, -4, -6, -2, -7, 6, 8, -6, -3, 1, 2, 6, 2, 7, -3, -5, -4, -7, -1, -6, 5, -1, -1, -6, 6, 4, -5, -4, 0, -1, 5, 2, 5, -2, -5, 1, -1, 8, 3, 8, 5, 8, 7, -1, 2, 0, 3, 4, -7, -6, -2, -6, 5, -2, 2, -5, 6, 4, -7, -1, 5, 8, 1, -6, 7, 7, 1, -3, -2, 5, 1, -4, -2, 5, 8, -4, -4, -1, -6, -3, -1, 5, 8, 5, 3, -1, 5, 7, -7, 0, 4, -6, -2, 4, -1, 2, 5, -5, 2, 3, -3, 3, 2, -4, -5, -4, 3, 0, 7, 7, -5, -6, -6, -1, 6, 6, -6, 8, -2, 6, -3, 2, -5, 2, 5, -2, -2, 2, -6, 5, -1, 2, 8, -6, 2, -2, 4, -3, -1, 2, 5, 2, 5, 3, 0, 2, 1, 7, 7, 1, -4, 3, -6, 6, 2, -4, 3, 8, -1, -1, -4, -3, -1, 4, 1, 2, 7, 1, 8, 3, 0, 3, -2, -3, -4, 1, -5, -2, 3, -2, 2, -3, -4, -2, 2, -5, 6, 4, -3, -5, 7, 1, 1, 5, 0, 2, -1, 2, -6, 7, 4, 6, 6, 3, 2, -7, -7, 5, -3, 4, 5, -3, -5, 2, 6, 7, 1, 4, -3, 5, 5, -7, 1, 1, 7, -4, -1, -4, 6, -5, 3, 3, 7, -4, -6, -3, 6, 2, 1, -4, 6, -3, -2, 6, 1, 6, 4, 6, 1, 6, 4, 2, -3, 7, 6, -1, 2, -4, -4, -7, 7, 0, -3, -3, 2, -6, 3, -4, 1, -1, 0, -2, -3, -4, 8, 4, 7, 6, -2, 2, 4, 4, -2, 8, -5, -3, 7, -1, 8, 2, 3, 4, 6, -4, 0, 0, -6, 0, -3, -7, 1, -2, 7, -6, 3, 7, 3, 2, 8, 1, -6, -6, -3, 6, -2, 2, 6, -5, -5, 7, -7, 0, 1, -2, 5, 7, -6, -5, -2, 0, 7, 0, 3, 6, 7, 1, 5, -1, -4, 3, 6, 7, -4, -4, 4, 2, 1, 0, 0, 0, -3, -5, 6, 1, -6, 6, 7, 5, 7, -2, -3, -6, -3, -5, -3, 6, -2, -6, -1, -7, -3, 1, 2, -1, -4, 5, -7, 4, 2, 4, 7, 2, -6, -3, 0, -3, -5, 6, 0, 2, -1, -5, 4, 0, -2, 0, 4, -2, 2, 8, 5, -3, -6, 0, -6, -4, 8, -3, -1, 2, 4, 8, 4, -2, -2, 3, -7, -3, -3, -2, 8, 0, -5, 6, -3, -7, -3, -4, -6, -2, 2, 1, 7, 4, 5, 1, 6, 0, -1, 2, -6, 4, -3, -4, 4, -3, -3, 6, -5, -2, 5, 2, -4, 2, -4, -2, -5, -1, 3, -6, -6, 6, -2, 8, 0, -2, -1, -1, 4, -6, 5, 7, 6, -1, 3, 3, -5, 8, -6, 0, 8, 0, 0, 1, 5, -1, 0, 5, -4, -3, -5, -2, 5, -4, 6, 7, -7, 5, -7, -2, 5, -3, 2, -1, 6, 4, 1, -4, -5, 3, -2, 4, -5, 7, -3, 4, 2, 5, -7, 6, 6, -4, 1, -2, 0, 1, 4, -5, -2, 4, 0, -3, 6, -2, 6, 0, -5, -5, 7, -3, 0, -6, -6, -3, 4, 5, 2, -6, 1, -4, -6, 1, -7, 4, 7, -2, -5, -6, -3, 7, -3, 6, -1, -4, -5, 1, -2, 0, -7, 6, 4, -4, -2, -5, 8, 1, -4, -4, -3, 2, 0, -4, -5, -1, -7, -1, 0, 0, -3, -3, 0, 5, -1, 0, -2, 5, -7, -3, -4, -1, 7, -1, -3, -2, -1, -6, -4, -1, 2, -4, -5, -3, -2, 6, -1, 4, 7, -1, 2, 2, 0, 7, -2, 5, -6, 1, -2, -4, 6, -5, 8, 3, 0, -6, -3, 0, -4, 6, 1, -6, -6, -2, -2, -3, 2, 2, 8, 3, -1, -3, 0, 4, 0, 7, -5, 0, 0, -7, 8, 4, -5, 3, 1, 8, -3, -4, -5, 7, -6, 7, 8, 5, 5, 6, -5, -7, -2, -5, 8, 5, -3, 6, -5, 3, 1, 0, -7, 4, -1, 5, -2, 4, -4, -4, 3, 3, -5, 1, 1, 1, 3, 0, 4, -4, -1, -1, -1, 0, 5, 4, 1, 4, -6, -3, 5, -5, 1, 0, -1, -2, -4, 3, -1, -2, 1, 4, 0, 4, -1, 1, 7, 6, 1, -4, 2, 5, 6, -2, 8, -4, 4, 7, 7, -1, -4, 5, -1, -1, -3, -4, 5, -4, -6, -5, -4, 4, 3, 1, 2, 1, 4, 4, 8, 8, 4, 6, -1, 3, 2, 6, 4, -2, 6, 2, -6, -6, 7, -6, -6, -3, 6, -2, 6, 1, 4, -7, -2, -2, 2, -5, 7, 7, 3, 4, 2, 6, -3, 5, -5, 5, 1, 2, 8, 7, -6, 0, 0, -4, 1, -5, -6, -4, 8, -4, -4, -4, 6, 2, 4, 7, 5, 7, 8, 1, -7, -5, 4, 5, -5, 2, 7, 7, 7, -4, 1, 7, 8, 1, -3, -1, 2, -6, 5, 0, 5, -5, -1, -4, -7, 5, -6, 4, 4, 7, -6, -6, 0, 1, -3, 5, 6, -2, 0, 6, 5, -2, 8, 6, -5, -2, -1, 4, 2, 4, 1, 8, 2, 3, -2, -5, 7, 2, 2, 8, 8, 7, -2, -7, -5, 7, 1, 2, 5, -5, 0, -5, -5, 5, 0, 3, 5, 1, -1, 4, -6, 3, 1, 1, 0, 2, -3, -6, -3, -4, -1, 5, 6, -5, 2, 2, -6, 4, -5, -6, 0, 1, -6, -5, 4, -3, -2, 3, 7, -1, 5, 3, -4, 0, 7, 7, 2, -1, 5, -1, -2, 1, -7, 5, -3, -2, -4, 3, 4, 3, 6, 5, 2, -6, 7, 0, -6, 8, 6, 7, -6, -3, 8, 7, 3, 4, 4, 3, 3, 1, -6, -3, 4, 6, -5, -5, 6, 3, -1, 2, 7, 1, 7, 6, 5, 2, -6, -4, -3, -6, 6, 6, -3, 4, 7, 2, -6, -2, -7, 2, -3, -4, -4, 8, -3, 5, 6, -4, 7, 4, 8, -3, 2, -2, 0, 8, 7, 5, 1, 6, -4, 4, -6, 1, -2, -5, 0, 3, 8, -6, -3, -5, -4, -4, 6, -6, 5, 1, 8, -6, 5, 2, 0, -3, -1, -1, -1, 2, 3, -6, 4, -2, -3, 0, -7, -6, -2, -5, -1, -6, 7, 4, -1, 4, 1, 4, -6, -5, -2, -7, 6, 7, -1, -6, 5, 5, -5, -2, 7, 6, -6, 3, -4, -6, 1, 4, -2, 7, 4, 4, 7, 2, -4, 6, 0, 1, -2, -2, 0, 6, 7, 3, 2, 5, 5, 6, -2, 6, 1, 5, 1, 3, 1, -6, 0, -1, 0, 4, -7, 7, 7, 1, -4, 5, -2, 1, -2, 0, -3, 6, 5, -5, 2, 5, 8, 3, 4, 5, 0, 5, -1, -3, -2, -3, 0, 4, -1, 3, -4, 1, -7, 3, 1, -7, -6, 1, -3, 3, 6, 4, 2, 5, 7, 2, -3, -3, 5, 5, 1, 3, -3, 6, 0, -6, -6, 6, 7, -2, -3, 0, 5, -7, -6, 6, 2, 4, -1, 3, -6, -6, -4, 2, 5, 6, -7, 1, 7, -3, 7, 7, 6, -2, 5, 6, 5, 7, 2, 7, -6, 0, 5, 2, -6, -3, -4, 7, 0, 7, -3, 4, -7, 1, -4, 7, -5, 4, 2, 1, 4, 2, -7, -6, -1, 6, -6, 1, 1, 1, 2, 7, 2, 7, -3, 1, 4, -4, 1, -2, 7, 4, 1, 6, -2, 0, 8, -4, 2, -4, 3, -4, 7, -6, -4, -5, 1, 0};
+static int32_t DeeployNetwork_net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_2mul_tensor[64] = {514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0};
+static int32_t DeeployNetwork_net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_2add_tensor[64] = {192750.0, 421480.0, 430732.0, 15420.0, -482132.0, 247748.0, 318680.0, 223076.0, -229244.0, 137238.0, 430732.0, -378304.0, -484188.0, 238496.0, -71960.0, -393724.0, -27756.0, 312512.0, -338212.0, 342324.0, 268822.0, -239524.0, 304288.0, -120790.0, 446666.0, -354660.0, -332044.0, 427648.0, -332044.0, 406060.0, -484188.0, 459516.0, -295036.0, 188638.0, -73502.0, -336670.0, -362370.0, -354146.0, -307886.0, 189666.0, 30840.0, -130042.0, -332558.0, 449750.0, -200974.0, -157284.0, -295550.0, 265224.0, 310456.0, -137238.0, 111024.0, 59110.0, 305830.0, 285784.0, -445638.0, 424050.0, 443068.0, -138266.0, 132098.0, -175274.0, -241066.0, -393724.0, -164994.0, 377790.0};
+static int8_t DeeployNetwork_net_QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_3weight_tensor[73728] = {-1, -1, 5, -3, 0, 2, -2, -1, 0, 5, -2, 1, 0, -1, 4, -1, 3, -4, 5, 3, 1, -2, 2, 5, -1, 0, -4, -2, 5, -1, 3, -2, -2, 4, 3, 5, 1, 6, 1, -3, 4, 2, 6, 1, -5, -4, 4, 0, 1, 1, -4, -3, 2, -2, 5, 3, -2, 1, 2, 3, -2, 4, -1, -4, 2, 1, -4, -4, 2, -2, -1, 1, -4, 5, -1, -4, 0, 0, 5, 1, -5, -5, 2, -1, -5, 4, 5, -3, 4, -2, 0, 3, -4, -1, -1, -2, 0, 0, -2, -5, 1, 5, 3, -1, 1, -4, -2, 3, -4, -1, 0, -2, 2, 2, -4, 0, 0, 3, -1, 1, 0, 1, 4, -4, 1, -3, -4, -2, 3, 4, 3, 0, 3, 2, -4, -3, -3, -2, 6, 1, 0, -1, 2, -3, 2, 6, 5, -4, -4, -2, -4, -5, -5, 6, 4, 5, 1, 0, -4, 1, -1, 5, -5, 5, 3, 1, -4, 2, 4, 1, -2, -1, 2, -4, -3, 3, 3, 1, 5, 2, -2, -4, 2, 4, 2, -3, -2, 3, -3, -4, -3, -3, 2, 4, -2, -2, 4, 2, 5, 0, -4, 5, 2, -2, -3, 4, -1, 4, 2, 3, -3, 5, 5, 1, 0, -3, -3, 1, 0, 4, -3, -3, -1, 5, 3, 1, 2, -3, 2, 3, -2, 2, -3, 5, 3, 0, -4, -4, -4, 5, -3, -1, 1, 1, 0, 4, 1, 0, 4, 3, 1, 0, 1, -4, -4, 2, 0, -5, -3, 2, 0, 4, 3, 1, -5, 4, 0, -5, -2, 5, -3, -1, 3, -3, 3, 3, -1, -4, 1, -1, 2, 1, -1, -4, -4, -3, 2, 5, -1, -3, 5, -2, -4, -2, -1, -2, -4, 4, 1, 4, 5, -1, -3, -3, -4, 5, 5, 2, 4, -4, 0, 6, 4, 2, 0, 3, 5, 0, 1, -4, -1, 1, -2, 1, 1, 5, 1, 1, 5, 1, 4, -3, -1, -4, -2, -3, -1, -4, 4, 3, 0, 3, 2, 5, -2, -3, 2, 0, -5, 0, -4, 2, -3, 4, -3, 2, 5, 3, 4, 3, 3, -4, 1, -4, -3, -3, -1, 2, -5, -2, -5, 5, -2, 5, -4, -3, 4, 1, 1, -2, 0, -4, -5, 0, 1, -5, 4, -2, -2, -2, 4, 1, 4, 5, 4, -4, -3, -2, 2, -1, 0, 6, -2, -2, -3, 2, -2, -3, -2, -3, 5, -4, 1, -4, -1, -3, 4, 4, -3, -1, 0, 5, -1, 5, 4, -2, 3, 2, -4, 0, -4, 3, 2, -1, 1, 5, -3, -1, 0, 3, 4, 0, -2, -2, 3, -1, -1, -1, -1, 3, 3, -3, 4, -1, -1, 1, -2, 5, -3, 3, 5, -2, 1, -4, 3, -3, 4, -3, 4, 2, -2, 4, 4, -1, 3, -1, 0, -2, -2, 0, 4, 1, 0, 4, 0, 0, 0, 0, 5, -2, 4, -1, 2, 4, 6, -1, -1, 5, 2, 2, 3, 0, 2, -1, 3, 5, -3, 5, 5, 3, -3, 5, -2, 3, -4, 2, -4, 3, 1, -4, 2, 5, -4, -5, -2, 6, 0, 3, -3, 0, 1, 1, 4, 6, 3, 3, -5, 0, 1, 1, -2, -3, 1, 4, 3, 1, -5, 4, 2, 0, -1, 5, -4, 5, 2, 4, 0, 5, -5, 5, -4, 5, 2, 2, 1, 0, -3, 0, 2, 5, 2, 4, -1, 5, 5, 0, -4, 5, -2, 0, 3, -2, -4, 1, 5, -4, 3, -5, 4, -5, 5, 1, 4, 1, -4, 2, 1, -2, 1, -4, 0, -3, -2, 5, -1, 1, -2, 0, 2, -5, -3, -4, -2, 3, -2, 3, -2, -1, 0, -4, -4, 5, 4, 1, -3, 3, -2, -2, 0, 0, -1, -1, 3, 5, 5, 0, -2, 2, -4, 2, 1, 5, 4, 6, -4, -3, 1, -1, 4, 4, -3, -3, 0, 3, 0, -3, -3, 4, 5, -2, 5, 5, 4, -4, -3, -3, -2, 0, 1, -1, 0, 0, -1, 2, -4, 2, 0, 0, -4, 0, 4, -2, 2, 3, 0, 5, -2, 4, -1, 0, -1, 1, -2, 1, 3, 4, 3, 3, 3, -3, -2, 1, 4, -4, 5, 1, -4, -1, -1, -2, -3, 2, -3, -3, -2, -1, -1, 0, 0, -5, 6, -1, 5, -4, 3, -4, -4, 3, 4, 0, 1, 5, 5, -2, -2, -5, 2, -2, -3, 4, 0, 3, 3, -2, -1, -5, -2, 0, 2, -4, 0, -4, 2, 1, 3, 3, 5, 2, 0, 3, 1, -3, -1, 4, -1, -1, -2, -2, 4, 1, 3, 3, -4, -1, 1, -2, 4, -3, 5, 4, -1, 2, 5, 5, -1, -5, 2, 6, -1, 4, 2, -1, 5, 0, -2, 0, -3, 4, 0, 0, 3, 2, 6, 2, 2, 3, 3, -5, 2, 3, -4, 2, 3, 2, 5, 3, -2, 2, 5, 5, -1, -4, 1, 5, -1, -4, 3, -1, 5, 1, 1, -1, 5, 1, -1, -3, -1, -3, -5, 3, 2, 0, -4, -5, 2, 2, -2, 2, 4, -2, 1, 0, -3, 2, -1, -1, 2, 4, 4, 2, -1, -1, 2, -1, 2, 2, 3, 5, 5, -1, -1, 1, -2, 5, -3, 2, 2, 0, 3, -1, -2, 2, 2, -4, -4, 5, -4, 0, -4, 3, 4, 3, 2, 4, -4, -3, 2, -3, -3, 5, 4, -3, 4, 4, -2, 3, -4, -3, 0, -4, 5, 2, 4, 5, 3, 0, -4, -4, 4, -2, 3, 1, 2, -3, 2, -4, -2, -4, 1, 5, -3, 3, 6, 5, 0, -4, -2, 6, -2, 0, 0, -4, 4, 0, 0, 3, -5, -1, 4, 2, -3, 5, 0, 0, 3, -1, 4, 0, -4, 3, -3, 1, 2, 2, 0, 1, -3, 4, 4, 3, -3, -2, -2, -5, -3, 4, -1, 2, 3, -1, -1, 5, 5, 2, 5, 5, 3, -4, 1, 5, 4, -1, -4, 0, -3, 3, 4, 0, 2, 0, 0, 5, 4, 1, -2, 2, -4, -3, 4, -5, -1, 4, 3, -5, 3, -4, 0, 2, -1, -2, -4, 1, 4, 0, -4, 1, 2, 0, 0, -5, 5, 6, -4, -2, -2, 0, 0, 2, 4, -1, -2, 2, 5, 3, -2, -3, -2, -3, -3, 2, -2, 1, 3, 4, 1, -2, 1, -4, 3, 1, 6, 2, 6, -1, 0, -1, -4, 6, 1, 4, -5, 5, 3, 1, -3, -2, 5, 0, 2, -4, -3, -3, 5, 3, -2, 4, -5, 2, -5, 3, 0, -1, 6, 3, 1, -1, -1, 3, -4, 4, 0, 5, 5, 5, 3, -3, -1, -1, 2, 5, -4, -4, 4, 2, 5, 4, -1, -3, -4, 3, 6, 0, 4, 0, -1, -5, 1, 2, 5, 4, 4, -2, 2, 1, -2, -3, -3, 4, 0, 1, -1, 2, 3, 3, -3, -1, 6, -4, 0, -1, 1, 4, 1, -4, 3, 5, 1, -1, -1, 1, 5, 2, 1, 1, -5, 1, 5, 2, 2, -4, -3, -3, 0, 3, 5, -1, 5, -4, 4, 5, -5, -4, -3, 6, 3, 4, 5, 0, 3, 0, -1, -4, -3, -1, 4, 6, 5, 1, 5, -1, -1, 5, -4, -1, 3, -2, -5, 0, -1, 3, 3, -3, -1, -4, -1, 4, -5, 2, 1, -4, -4, -4, 2, -2, -4, -3, 3, 4, 3, 3, 1, -2, 0, 5, -4, -2, 3, 0, 5, 3, 5, -2, 0, -1, 4, -1, 2, -1, 2, -2, -4, -2, -3, 2, 0, -4, -4, 4, 1, 4, 0, 3, -2, 5, 2, 3, -1, 0, 1, 3, 3, -1, -3, -2, -3, 4, 2, 1, 5, -1, -4, 3, -3, -1, -5, 1, 5, 0, -2, 4, 4, -3, 3, 3, 1, -1, -4, 2, 4, 0, 5, 4, 4, -5, 5, -3, -2, 2, 3, 1, -4, -3, 1, 6, 0, -4, -4, 4, 0, -1, 3, -3, 5, 3, 0, -3, 5, -1, 3, -1, -2, -1, 4, -3, -2, 4, 1, -5, 0, -2, -3, -1, -4, -4, -4, -4, -4, -2, 2, 2, -3, 3, -4, 1, -2, -1, 3, -3, -2, -4, 4, -3, -1, 2, 2, 0, 0, 1, 5, 4, -2, -4, 3, 5, 1, -3, -1, -2, -3, -1, -1, -2, -1, 3, -2, -1, 3, -2, 4, -5, 4, -3, 1, -4, 2, -2, 4, 5, -2, 5, -2, 3, 4, -3, -4, 3, 1, -2, 4, 0, 3, -3, -3, -1, 3, 5, -2, -3, 2, 0, 3, 0, 5, 3, -4, 1, -2, -2, 1, 0, 5, -3, 0, 0, 1, 5, 4, 4, 0, 0, 6, -3, -3, -4, 0, 1, -4, 2, 1, 3, 4, 3, -4, -1, -4, 2, 0, 4, 4, -1, 3, -3, 0, 0, -4, 5, -4, 0, -4, 2, 1, 5, -4, 4, 0, 0, 0, -4, 1, -2, 3, 5, -2, -3, 4, 0, 3, 2, 1, 0, 4, -3, 2, -1, 2, -4, -3, 5, 0, 3, -3, -3, 3, 3, 0, 1, 0, -1, 1, 5, -3, 0, 4, -1, -4, 6, 1, 4, -4, 2, 0, -3, 3, -2, 3, 6, 5, 1, 2, 2, 0, 0, 0, -2, -4, -1, 5, -3, -3, 0, 0, -3, -5, -4, -3, 4, 4, -4, 0, -2, 1, 4, 0, -3, 5, 4, 3, 3, 3, -5, 2, 2, -2, 6, 0, 1, 5, 4, 2, 5, -2, 6, -3, 1, -1, 1, 1, -4, 4, 3, 1, 3, 2, 2, -4, -3, -4, 0, 0, 5, -4, 0, 2, 3, -5, -3, 1, -1, 2, -4, 3, -2, -2, -4, -1, 5, 2, 2, 3, -3, -3, 5, 4, 5, -2, 6, -2, 0, -1, -2, 5, 3, -1, 0, 1, 4, 0, -1, 0, 3, 2, 0, 4, -1, 4, -3, 5, 5, 6, -4, 0, 1, 3, 0, 5, 1, 2, 3, -3, -1, -4, -1, 3, -3, 5, 2, 2, 0, -2, 4, -4, 3, -2, 5, 4, 5, 0, 5, 4, 4, -4, 1, 5, -1, -4, 4, 1, 0, -4, -1, -4, 2, -4, -1, -3, 3, -4, -4, 1, 5, -2, -3, 4, -5, 4, 5, -3, 6, -1, 0, 1, 1, 3, 3, 2, -3, 0, 3, -4, -2, 5, 1, 3, 6, -2, 4, -2, 3, 0, 1, -4, -2, 5, -3, -2, 0, 1, -1, 0, -3, -5, -1, -3, -4, -3, 2, -4, 1, 5, 5, -1, 1, 0, 1, -3, 3, 0, 2, -2, -2, -4, -3, -3, 5, -1, 5, 4, 5, 4, -2, -2, 5, 3, 2, -3, -3, -3, -2, 5, 2, -5, 2, -1, -4, 0, 2, 0, -4, -3, 3, 3, -2, -3, -3, 3, -1, -1, 1, -1, 6, 1, 2, 1, -5, 1, 0, -3, -4, 0, 5, -3, 4, 2, -4, 0, 1, 1, -1, 2, -4, -2, 3, 4, 5, -1, 1, 4, 4, 6, -1, -2, 5, 2, 1, 2, 1, -4, -4, -3, -3, 3, -2, -3, -2, 3, -3, 5, 0, -2, -3, 3, 0, -4, -1, 0, 1, 4, 1, -1, 1, 0, 0, -3, 4, 2, -1, -1, 5, -4, 4, 6, 5, -4, -4, 3, 2, -4, 3, -3, -4, -3, 0, -3, -1, -3, 4, 3, 0, 2, 2, -3, 5, 3, -4, 0, -4, -4, -2, 2, 0, 2, 1, -4, 1, -2, 5, 4, 3, 4, 2, 1, 6, -4, 6, 5, 4, 2, -3, 4, -2, -4, -3, -3, -2, 3, 2, 2, -2, -4, -1, -1, 2, -4, 3, -3, 2, 0, -4, 1, -1, -2, 3, -3, 0, 2, 2, 5, 3, -2, -1, 0, 3, 6, 4, -1, -2, -3, -2, -2, 2, 6, 1, 5, 4, -3, 4, -4, -3, -4, 5, -3, 3, -5, 3, 4, 5, 0, 3, -3, -1, -3, 3, -2, -3, -3, 5, -4, -2, -3, 3, 0, 0, 0, 2, 5, -1, -3, -1, 4, -3, 1, -2, 3, 0, 2, 2, 3, -1, 2, 0, -5, 4, -1, -4, -4, -4, 2, 3, 3, 1, -2, -3, 5, 0, 5, 2, -2, 0, -2, 2, 1, 3, 3, -4, 3, 2, 2, 1, -5, 3, 0, 1, -2, 2, -2, 2, 1, 4, -2, 0, 5, -1, 0, 3, 4, -3, 0, 0, 3, 6, 3, 5, 4, -3, -2, -1, 4, 5, -5, 0, 2, 0, 1, 2, 2, 1, 1, 2, 4, -4, 3, 1, -1, -2, -5, 5, 3, 2, -1, 0, 4, -5, 5, 5, -4, 0, 3, -2, 5, 4, -3, 5, -4, 1, 4, 0, -2, 5, 1, 0, -3, 2, -1, 5, -4, 3, 4, 0, 0, 2, 0, 0, -5, 4, -3, -1, -1, 4, 4, 0, -1, 3, -2, 1, -1, -2, 3, 1, 5, 4, 1, 1, 4, -4, -5, -1, 5, 1, -5, -1, 0, -3, -4, -2, 0, 2, -3, 0, -2, 2, -2, 4, -5, 3, -4, 0, 4, -2, 0, -3, 6, 0, 0, 5, -2, 5, -2, 2, 3, 2, 2, -2, -4, -2, 3, 1, 1, -4, 3, 1, 0, 2, 3, -1, 0, -2, -3, 3, 1, -4, 4, 5, 5, 1, 2, -1, 3, -2, 2, -2, 5, 2, -3, -3, -4, -1, 5, -4, 3, 1, -3, 5, -2, 5, -2, -3, 5, 1, 0, 1, 3, 2, 5, 0, -2, -5, 5, 2, 3, 0, 0, 5, 1, 5, 2, 1, 2, -2, -3, 3, -3, 3, 5, -2, 4, -2, 2, 2, 5, -2, -5, 3, 1, 3, 1, 1, -5, 0, 6, -3, 3, -4, 0, -3, 0, 4, 1, -1, 2, 3, -2, 3, 0, -3, 0, 0, -1, 2, 3, -1, -2, 2, 5, -4, 0, 4, 5, 1, -2, -4, 0, -1, 3, 5, 2, 1, -2, -3, -2, 1, 1, 0, -1, 5, 0, 4, -3, 6, 5, -4, -4, -4, 3, -4, -2, -1, 2, 4, 3, -4, 2, 5, -5, 1, -2, 5, -2, 5, 5, 3, -4, -1, 4, -3, 5, -3, 4, 5, -1, 1, 3, -2, 3, 4, -4, 5, -3, 2, -3, 2, 5, 5, 1, 4, 4, -2, 1, 5, -3, -1, 6, 5, -4, -5, 2, -3, 1, 4, 3, -3, 2, 4, -3, 4, 0, -3, -4, 5, 4, 1, 1, 2, 1, 1, 3, -2, 1, -3, -3, -2, 0, 3, 0, -1, -1, -1, -3, 1, 3, 4, -4, -1, -4, 0, -2, -4, 4, -5, 0, 0, 1, 1, -2, -1, 2, -2, 1, 5, 0, 4, 2, -4, 4, -1, 0, -4, -1, 5, 0, -4, -2, 0, -3, 1, -1, 2, 3, 3, 5, 2, 0, 4, 1, -3, 5, 5, -3, -2, 5, 3, 6, -1, -1, 2, -3, 2, 5, 3, -5, 5, -1, -2, -1, 1, 5, 3, 2, -1, 5, -4, 1, 4, 1, 5, 5, -4, 0, -2, 0, -5, 1, 1, -2, 4, -1, -2, -4, 5, -4, -4, 2, 3, 6, -1, -1, 1, -1, 5, 2, -4, -3, 0, -5, -3, 3, -3, -1, -3, -1, -3, -2, 0, -1, 3, 1, 5, 1, -4, 0, -4, 3, -3, 0, 4, 2, -2, 0, 1, 4, -1, 3, -1, -5, -3, -2, 4, -3, 5, 5, 0, 4, 3, -4, 5, 5, 6, 2, 5, 2, 1, 3, -1, -3, -2, 3, 1, 1, 0, 2, 5, 3, -2, 2, -4, 1, 0, 1, 0, -3, 5, 3, 2, -4, 4, -2, -3, -3, 4, -1, -3, 3, 0, -5, -1, 4, 4, 1, -3, 3, -3, -3, 2, 5, 1, 2, -1, -2, 5, 0, -4, -2, 6, 4, -4, 0, -4, -4, 2, -1, -4, 2, -1, -1, 4, 4, 0, 5, 2, 1, -1, -3, 2, -5, -1, 1, 5, 1, 0, 5, 4, 3, 0, -4, -1, -2, 3, 2, -1, -2, 1, -2, 1, 4, 2, -3, 3, -4, 1, 0, -3, -2, -2, -3, 2, 5, 4, 6, 4, -3, 2, -2, -3, 1, -2, 2, 3, 5, 3, -2, -4, 2, 0, 3, 3, 1, -3, 3, -5, 1, -4, 4, 5, 5, -2, 3, -1, 3, -2, -2, -2, 0, 5, 5, -1, 5, -2, -3, 6, 4, 1, 4, 5, -1, 6, -3, -1, 5, 4, 1, 2, 3, 4, 2, 0, -2, 0, -1, 5, 2, 5, -1, 5, 2, 4, 5, 5, 3, -4, -3, 4, 1, -3, 1, 3, 1, 2, -1, 3, -1, -3, -3, 1, 5, 5, -2, 1, -1, -2, -1, 6, -2, -4, -1, -2, 1, -1, 5, 1, 3, 5, 2, 0, -2, -2, 2, 1, -2, 5, 3, 2, 1, 6, -3, -5, 5, 5, 5, 2, -3, 1, 0, -2, -3, -2, 2, -3, 3, 3, -1, 0, 0, 3, -3, -4, -4, -4, 2, -2, 3, 0, 3, 0, 3, 5, -2, 2, 0, -4, -4, 2, 3, 5, -1, -2, 1, 2, 1, 4, 2, -2, -1, 5, 5, -2, -4, 3, 1, -2, 3, 6, 4, 4, -2, 3, 4, 4, 1, 5, -4, 2, 4, -1, 3, 1, 4, -4, 5, 0, -3, 2, -1, -2, 0, 1, 2, -5, -2, 3, 1, -1, 3, -4, -4, 5, -2, -4, -2, 2, 4, 1, 4, 2, 1, -4, 2, 4, 2, -1, -4, 3, 3, -3, 2, 4, 3, 4, 2, 4, -3, 2, -3, 2, 4, -1, 4, -2, 4, -2, 0, -4, 3, -4, 3, 2, -5, -5, 3, 4, -4, -3, 3, -1, 4, -2, -4, 0, 1, 2, 2, -1, -2, -3, 1, 3, 5, 2, 4, 4, 6, 2, -4, -2, 5, 5, -3, -4, -1, 1, -5, 5, -5, -2, -5, -2, 6, 2, -1, 3, -2, 0, 5, 5, -4, -1, -4, 2, 1, -4, 0, 2, 2, 1, -3, 5, 1, -1, -4, -4, 4, 3, -2, 0, -2, 5, -4, -1, 2, 0, 6, 4, -4, 3, 3, -1, -5, 2, 5, 0, 1, 1, 2, 3, 4, -2, -2, 2, 3, 0, 5, 1, 6, 0, -3, -2, -3, -5, -2, 0, -4, -3, 3, -1, 1, 0, 1, 2, -4, 0, -1, -5, 6, 4, 0, 4, 2, -5, 5, -4, 3, 0, -4, -1, 2, -3, -4, -2, 0, 0, 2, -3, 6, 3, 4, 1, 6, 1, 0, -2, -4, 3, 3, 4, 0, 6, -4, 1, -4, -1, 3, -4, -1, 0, 2, 5, 5, 2, -1, 5, -5, 4, -4, 1, 3, -1, 1, -4, 5, 1, -3, 1, 1, -3, -1, -4, 0, 2, 5, 0, -1, -2, -1, 5, -3, 3, -3, 4, -4, -1, -1, -3, -1, 4, 5, 4, 5, 3, -1, 4, 0, 5, -3, -1, 4, 3, 4, 5, -3, 5, 0, 6, 5, -4, 1, 1, 4, 0, 0, -1, -4, -3, 6, 0, 2, -1, 5, 5, 5, -2, 4, -3, -1, 4, 6, 2, 5, -4, 5, 1, -1, 5, 2, 1, 3, 2, 2, 2, 5, -3, -1, -3, 6, 2, -1, -3, -4, -1, 5, 3, -2, 1, -1, 0, -1, 4, -1, -4, -3, -4, 4, 0, -1, 4, 5, 6, 0, -5, -2, 0, -2, -1, 1, 3, -3, 2, 6, 1, -5, 6, 3, -2, -2, -2, 0, 5, 3, 1, -2, -1, 2, 2, 4, 4, 0, -3, 4, 5, -3, -3, 6, 0, 3, -2, 6, 0, 3, 0, -3, 3, -4, -3, -4, -4, -2, -3, 6, -1, 5, 5, 0, 1, -4, 0, 2, 0, 2, 0, 6, -2, 5, 6, -3, -3, 3, 0, 3, 1, 0, -3, -1, -4, -4, 0, 4, -3, 1, -1, 0, -1, -2, 1, 0, 5, -5, 2, 2, 4, -3, 0, -4, -2, -4, 2, 1, 5, 5, 5, -5, 4, 0, -3, 5, -4, -2, 2, 0, 1, 1, 2, 1, 3, 1, 4, 5, 3, 3, -1, 1, 5, -2, 6, -2, -1, -3, 6, 0, -4, 5, 5, 4, 4, 1, 3, 2, -4, 1, 3, -4, -1, 1, -3, 3, -1, 0, -3, 0, -2, 1, -3, 0, 5, 0, 5, -2, 4, 4, -4, 1, 0, -2, 0, 2, -2, 5, -4, 6, -5, -5, -1, -2, -2, 4, 1, 4, 2, 3, -2, 4, -3, 2, 5, 2, -4, 4, 2, 1, 3, 4, 4, -1, -5, 1, -2, 4, 2, 3, -5, 5, 0, 3, 5, -2, 0, 1, 3, 1, 5, -3, 0, 1, 0, 2, -1, -2, -2, 5, 5, -4, -2, 4, 6, -1, 3, 0, 0, 1, 4, -3, 4, -4, 2, 4, 5, 1, 1, 3, -1, 1, 0, 3, -4, -2, -4, 3, -5, 1, 2, 2, -2, 1, 4, -2, 2, 5, 3, 0, -2, 1, 5, 1, 1, 1, 1, -4, -2, -1, -3, -3, 2, 1, -5, 3, -3, -3, 1, 0, -5, 2, 0, -1, -5, 3, 3, 0, -4, 1, 0, 4, 4, -2, 5, 4, -1, 5, 5, 2, 5, 0, 1, 3, 2, 3, 5, -1, 3, 2, 3, -4, -3, -2, -3, 6, -3, -2, -2, -4, -1, 0, 5, -3, 2, -2, 1, -2, 2, 3, -3, 5, 1, -1, 2, -1, 5, -3, 2, 1, 0, 4, 5, 3, 4, -3, -3, 4, 1, -2, -3, 4, -4, -4, 0, -4, 6, 1, -2, 1, -4, -1, -2, 5, -3, -2, -4, 2, 5, -2, 3, -4, -4, 3, 3, -2, -3, 3, 1, 3, -3, -4, 1, 1, 0, 1, 3, -2, -4, -2, 2, -2, 2, -1, 3, -2, -2, 2, 1, -1, 2, -4, 4, -3, 5, 6, 4, 4, 3, -3, -2, -3, 4, -4, -1, 1, 2, 1, 1, 1, 0, 4, 4, -2, 3, 5, 1, 0, -3, 2, -5, 1, -2, 2, -5, 5, 3, 2, 2, -1, 1, 1, -5, 5, 1, -4, -5, -3, -4, 2, 3, -2, 1, -3, 4, -4, -2, -4, -4, 0, 4, 1, 2, 5, 0, 3, -2, 4, 5, 5, -4, 1, 0, -1, 2, 5, -1, 1, 1, 3, 5, 1, -2, 3, 2, -2, 3, 3, 4, 4, 1, -4, 1, -3, -3, -3, 1, 1, -2, -4, -4, 4, 5, 3, 2, 5, 3, 4, 1, 4, 1, 1, 3, 6, -4, 5, 0, 1, 4, 2, -1, 1, 4, 4, -4, 6, -3, 5, 6, -1, 3, 3, 0, 6, 3, -4, 2, 2, 6, 0, 5, -3, 2, -1, -3, 0, 5, 0, 3, 2, 6, -3, -3, 3, -2, 4, 4, -2, 4, -3, 6, -1, 5, 1, -2, 5, 1, -2, 2, 2, -1, 0, 4, 4, 2, -1, -2, -3, 5, 4, 3, 1, -3, 1, 3, -2, -4, -2, 4, 4, -3, -4, -1, -5, 3, 3, -2, -3, -2, -2, -4, -4, 1, 1, -1, 3, -4, 1, 0, 1, 4, -4, -2, 1, -1, 2, 6, -5, 1, 3, -2, -1, 2, -5, -4, 0, 1, 0, -3, -3, 2, 5, 2, 1, -4, 3, 2, 0, -1, -3, 5, -4, 4, 4, 2, 1, 3, 3, -3, 6, 2, 2, -1, -1, -4, 1, -4, 4, 4, -1, 5, 3, -1, 1, -3, 2, 0, 2, 3, -3, 4, -3, 4, -2, 3, 5, 4, 2, 1, 4, -1, -4, 3, -3, -3, -1, 4, -3, -4, 0, 5, -4, 5, -3, 0, -2, 5, 1, -1, 3, 5, -2, -3, 5, -5, -1, 1, -1, -3, 5, 3, -4, 4, 4, 4, -4, 4, -4, -3, 4, 2, -5, 0, 2, -2, 6, 2, 3, -4, 2, 1, -2, -1, 3, -4, -3, -5, -4, -3, 6, -2, -3, 5, 3, -2, -3, 0, 5, 5, 5, -4, -1, 5, -2, 1, 3, 2, 1, 0, 1, -4, 2, -5, 4, 6, 4, 1, 0, -3, 3, 0, -4, -3, -4, 5, 1, -2, 5, -1, 0, -4, -1, -3, 0, 2, -1, 0, -1, 3, 6, 5, 2, 5, 0, 0, -4, 4, 2, -3, 5, -4, 6, 3, -2, 3, -2, -3, 1, 5, -4, -4, 6, 6, 3, -1, 1, -3, 1, 4, -1, -2, -1, 4, 1, -3, -2, 4, -3, -2, -4, -4, 1, 2, 2, 4, 3, -2, 3, 1, -5, -1, -2, 4, -2, -3, 2, 0, 4, 0, 2, -2, 2, -3, 3, 2, -3, 2, 6, 3, -3, -1, 5, -2, -1, 0, -1, 5, 0, 2, -4, 3, -3, 0, -1, -3, -1, -1, 4, -2, 2, 3, 2, -1, -1, 5, 6, 3, 1, 5, -3, 2, -2, 5, -4, -2, 5, -4, 3, 4, -4, 2, 2, 5, 5, -1, -1, -4, 4, 2, 5, 1, -4, 1, 2, 3, 1, 6, -2, -3, 5, 0, -4, -3, -1, 0, -4, 3, -1, 2, -4, 4, 5, 5, 5, 1, -2, 3, -1, -1, 3, -5, -1, 5, 5, 4, 1, 1, 6, 2, -3, -3, -1, -5, 0, 5, -2, -3, 2, 0, -1, 0, -1, -1, 6, 3, -3, 4, -1, -1, 6, -5, 5, 1, 3, 2, 1, 2, 3, 0, 3, 3, 5, 5, 2, -3, 2, -3, 0, 3, 0, 1, 5, 1, -4, 5, -3, -4, -1, 4, 1, 3, -1, 0, -3, -2, -4, 2, 3, 5, 5, 1, 0, -3, -2, 4, -4, -1, 2, -2, -3, -2, 0, -2, 0, -3, 0, 1, 2, 0, 0, 1, 1, -2, 3, -2, 0, -1, 3, 6, -3, 2, 5, -3, -3, -1, 0, -4, 3, 4, -3, 3, -3, 5, -4, 2, -5, -4, -1, -3, 4, 1, 2, 2, 5, -3, 2, 3, 4, 5, -2, 0, 0, -2, 2, 1, 0, -2, 3, 6, 4, 5, 3, 1, -3, 5, 0, 3, 1, -3, -2, 4, 4, 4, 0, 1, 3, 2, -5, 2, 2, 5, 5, -2, -5, 2, 4, 2, 0, -2, 1, 0, 2, 5, -3, 2, -4, 5, 1, -3, 5, 5, -2, -3, 1, 1, 2, 1, 5, 2, 4, -4, -1, -1, -4, 1, 1, -3, -4, -3, 1, 4, 5, 1, 5, 2, 3, -4, 1, 2, 6, -2, 4, 2, 5, 0, 3, 5, 0, -4, 3, -2, 3, -4, 1, -5, 4, 4, 6, -5, -2, 3, -2, 6, 2, -2, -4, -4, 1, -3, 2, 2, 2, 4, 0, 4, 3, 2, 1, 1, 2, 1, 3, 3, 4, 0, -2, -2, 0, -1, 5, -1, -1, 3, 3, -3, 2, 3, 3, -1, -5, 4, -3, 2, -4, 2, 0, 3, -3, 4, 3, -2, -4, 4, 3, 4, 3, -3, 3, 1, 1, 0, -4, 5, 4, -4, -2, -5, -1, 3, 4, -4, 0, 3, 1, 6, 2, -1, 5, -3, -3, 1, 1, -2, -1, 1, -3, 4, 3, -3, -3, -3, 0, -2, -2, 1, -1, -1, -3, 4, -3, 1, 2, 3, -1, -3, -1, 4, 4, 6, 0, 0, 5, 4, 4, 0, -2, -4, 4, 1, 1, 1, 1, 1, 1, 4, -1, -1, 1, -1, 1, 4, 5, 3, 2, -3, 0, -4, 6, 2, 3, -4, -2, -4, -3, 2, -5, 4, 1, -2, 5, 1, 3, 5, 1, -2, 2, 3, -3, -4, -4, 3, 0, 1, -4, -4, 0, 1, 2, -1, -1, -1, -1, 4, -2, 5, 0, 0, -3, 4, 4, -2, 1, -3, 2, -4, -4, 0, 3, -2, 5, 4, -4, 1, 4, 2, 3, -2, 4, 1, -4, 2, 3, 1, 1, -4, -4, 6, 2, -1, 2, -1, 2, -4, 3, 4, -2, 0, 2, 3, 0, -4, 6, 3, -4, -1, 4, -3, 1, 0, 0, 0, -3, 0, -1, -2, -1, -1, -2, 5, 3, -2, -1, 0, 0, -4, 4, 2, 2, 1, 2, 0, -2, 3, -1, 1, -1, 4, 1, -1, -1, -1, 0, 1, -2, 2, 3, -2, 4, 1, 1, -2, 3, 0, -2, 3, 0, -2, 5, -4, -4, -2, 4, -1, -1, 1, -2, -1, -1, -2, 5, 0, 6, 4, 6, -1, -3, 0, 6, -4, 2, 1, -4, 1, -3, 4, 4, 0, 2, -3, -2, -4, 0, 1, 2, 2, 1, -1, 3, 2, 0, -1, 4, 0, 1, -1, 5, 2, 0, 4, 4, -3, 2, -3, -4, -1, -4, 5, 0, -2, 5, 4, -3, 5, 5, 0, 1, 3, -2, 3, 0, 0, 0, 0, -5, 2, 2, 0, -3, -3, -2, 1, -2, 5, -4, -2, -4, 3, -2, 2, 4, -3, -1, -2, -3, 4, 5, -2, -4, -1, -4, -1, 3, -3, 5, 1, 6, 5, 4, 0, -2, 2, -2, -2, -3, -1, -1, 3, 2, 0, -4, -2, 0, 0, 1, -3, -1, -4, -3, -3, 2, 2, -1, 0, -4, 4, -1, 2, 1, 4, 3, 6, 4, 1, -3, -1, 4, -1, 3, -2, -2, 0, -4, 2, 2, -4, -3, -2, -3, 4, 4, -1, -4, -4, 5, -4, 0, 0, -2, 2, -2, 0, -1, -1, 3, -3, 0, 5, -5, 2, 0, -4, 4, -3, -5, -1, -2, -2, 2, 3, 2, 5, -1, 5, 0, 0, 2, 3, -1, -3, 4, 0, 0, 3, -4, 5, 1, 5, 2, 4, -3, 5, 3, -1, -3, -2, -3, 0, 5, 1, -1, 3, 2, -3, 2, 1, -4, 3, 3, 2, 0, 1, 0, 4, -5, 0, 0, -1, -2, 6, -4, 5, 4, 0, -3, -1, 4, 5, 1, 0, 5, -2, 2, 2, 4, -1, 4, 3, 0, -2, 2, 0, -4, 3, -1, 2, 4, 2, 5, -3, 6, -3, -5, 3, 2, -2, 3, 0, 5, 0, 4, 0, -5, 6, -2, 3, 0, 4, 4, -2, 2, -2, -2, -2, 2, 0, 2, -4, 0, 0, -1, 1, 0, -5, 4, -4, -2, 1, 6, 2, -1, -4, -4, -1, 4, -1, -2, -3, -3, 5, 1, -2, -1, 5, -3, 2, -2, 4, 1, -1, 5, -3, 1, 5, -1, -3, 0, 5, 1, 0, 5, -2, 1, 6, 5, 2, -2, -2, 1, 1, 2, 5, -4, 2, -2, 1, 2, 4, 5, 0, 5, -2, 5, -3, 2, -1, -3, -1, 2, 6, -1, -3, -4, 3, -3, 4, -4, -2, 5, -2, 2, -1, 1, -1, 4, 0, 1, 3, 1, -2, 2, -4, -3, -3, -1, 1, 1, 0, -4, -3, 6, 0, 5, 2, -4, 0, 3, -4, 3, 1, 4, 1, 4, 2, -4, 6, 5, -3, 5, -2, 3, -2, 1, 2, 0, 1, -4, -4, 3, -3, 1, 5, 1, 4, 1, -2, -1, 5, 2, -3, 2, 1, 4, 3, 4, 3, 2, -4, -2, 5, 3, 0, 2, -3, -3, 2, 0, 1, 0, 2, 0, 0, 2, -1, 5, -3, -2, -1, -3, -5, 0, -2, -4, -1, 2, 5, 1, -1, -1, -4, -1, -5, 4, -4, 4, -4, 4, -3, 5, 1, 5, 0, 0, -1, 5, -3, -1, -3, -4, 2, -2, -5, -2, 4, -1, 2, 1, 2, 4, -1, 4, 2, 3, 1, 4, 0, 6, -3, 1, 1, 1, 5, 0, -4, 0, 2, 1, -3, -1, 4, 0, 0, 0, -3, -3, -2, 1, 0, -2, 4, -2, 6, 2, 6, 0, -4, 1, 0, -1, 3, 5, 6, 6, 4, 2, -2, -5, 2, 0, 3, 4, 4, 5, 5, 0, 6, -1, -3, -2, 0, 3, 0, 0, -1, 5, 5, -2, 2, 4, 4, -4, 5, 4, 0, 4, -2, 3, -1, 2, 1, -1, -1, 3, -2, 0, 5, -2, 2, 5, -3, 0, 5, 5, 0, 2, 1, 1, 3, -3, -4, -4, 1, 4, -3, 1, -1, -4, -1, -4, 0, -3, -1, 5, 1, -2, -3, -1, 1, 1, 3, 4, -2, 5, 1, 1, 1, 3, 5, 1, 3, 5, -2, 1, -3, -3, 1, -1, 1, -1, 0, 1, 6, -4, -3, -2, -4, 5, 5, -5, 3, -4, -4, 5, 3, -2, 3, -3, -5, 5, 6, 1, -3, 2, -1, -2, -3, -2, -1, -4, 2, 0, 1, 4, 0, -2, 6, 5, -1, 1, 2, 1, -4, -4, 0, 5, 3, -3, 3, 3, 0, -2, 4, 3, -5, -2, 5, -4, 6, 3, 4, 2, 5, 0, 1, -2, 4, -1, 0, 0, -3, -3, -1, 3, 5, 3, -4, 2, -4, -3, 5, -1, -2, 2, 4, -4, -5, -4, 0, 5, -2, -4, -3, 1, 1, 5, -1, 4, -4, 3, 6, 5, -4, -3, -4, -3, -3, 0, 2, 6, -2, -2, 5, -1, -3, -1, 3, 4, 4, -4, 1, 0, -3, 4, 3, -5, 0, -3, 5, 0, 2, -2, -3, 2, 3, -1, 0, 5, 2, 2, -3, -4, 1, -1, -5, 2, -1, 3, -2, 3, 1, 3, 5, -1, 4, -2, 5, 4, 5, 4, 4, 3, -3, -4, -4, -1, 6, -4, -4, 2, 4, 0, 6, 0, -1, 4, -2, 5, 2, 0, 4, -2, -1, 4, -1, 0, 4, 2, -3, 0, 1, -5, -5, 5, 2, 5, 5, -1, 1, 5, -4, 0, 3, -3, -1, 1, -3, 3, 5, -2, 4, -3, -2, 5, -4, 4, 0, 4, 5, -4, -1, 2, 0, 2, 0, -3, -1, -4, 4, 2, -1, 0, -1, 4, -4, -1, 4, -1, 2, 5, -4, 3, 5, -3, -2, 4, -3, 4, 5, 2, 0, -3, 2, 6, -4, -4, -3, -3, 5, -4, -3, 1, 1, -4, 0, -3, 3, 6, 2, -2, 1, 6, -5, 0, 2, -3, -2, 2, 5, -4, 3, -1, 4, -3, -3, 3, -5, -3, -1, -4, -1, 2, -1, 2, 6, 5, -5, 1, 4, 3, 2, 2, 5, 0, -3, 1, 3, 5, -4, 5, 0, 0, 0, -5, 2, 5, -1, 2, -1, 1, 1, -1, 1, 1, 1, -3, 1, 0, 2, -5, -2, 1, 5, 5, -1, -2, -1, 3, 0, -3, 3, 1, -1, -2, -1, 4, -5, -1, 2, 0, -2, 2, -1, -1, -4, -2, -1, 0, 3, 3, 1, 0, 4, 2, -4, 4, -4, 5, -2, -5, 3, -1, -3, 5, 5, -2, -3, -3, 0, 2, -2, -2, 5, 3, 3, 3, -4, 2, -4, 0, -4, 1, 5, -2, 5, 1, 1, -3, 3, 4, -4, 3, -4, 3, 5, 0, -2, 4, -1, 1, -1, 1, -4, -3, -1, 5, -2, -5, -3, 2, -3, 1, -2, -5, -1, 4, -1, 0, 5, 5, 6, -1, 4, 3, 2, -3, 4, 5, -4, 2, 5, 0, 0, 1, 0, 2, 5, -1, 1, -2, 6, 0, -1, -2, -3, 2, 1, 0, 4, -1, 1, 1, 5, 6, -1, -3, -3, 4, 3, 3, 0, -2, 4, -3, -5, 2, 5, -4, -2, -3, -3, -4, 3, -1, 0, 1, 5, 6, 5, 0, 5, 4, -4, -3, 4, 5, 0, -4, 0, 0, -2, 5, 2, 4, -2, 3, -1, 3, 1, -4, 1, -1, 4, -3, -2, -3, -4, 1, -2, -1, -1, -3, 4, -2, -2, 5, 3, 1, 3, -4, -2, 0, -3, 6, -3, -5, 0, -2, 5, -3, 5, 1, -2, 4, 6, 1, 1, -2, 5, -3, 3, 3, -3, -3, -1, -2, 0, -2, -1, 1, -4, 0, 1, -3, -2, 0, 5, 3, 1, -1, -5, -2, 0, 5, 4, 3, 3, 6, -4, 0, 5, -4, -4, 3, 2, 6, -3, -3, 5, 0, -4, 3, 5, -1, -2, 4, -4, 3, -3, 1, -2, -3, 2, 0, 5, -2, 4, 6, 2, 4, -3, 3, -2, 5, 5, -2, 1, 2, -2, 5, -2, 3, 3, 2, -3, 2, -4, -4, 3, -3, 4, 0, -5, -1, 0, -1, 3, 3, 1, 2, -4, -3, 5, -3, 6, -3, 5, -1, 5, 4, 5, -4, -1, -4, 4, 1, 5, 2, -2, 1, 3, -5, 3, -1, 2, 5, 2, 3, 0, 1, 3, 5, -3, 1, -2, -4, 4, 2, 0, -1, 2, 5, 2, 4, 2, 0, 4, 6, 2, 5, 0, 0, -5, -2, 2, -1, -1, 0, -1, 6, 5, 3, -2, -4, 1, -3, 2, -4, -2, -5, 0, 5, -4, 5, 3, -4, -4, 4, 5, -1, 5, 4, 6, -3, 4, -4, 1, -3, 3, -1, -4, 4, 0, -1, -4, 2, 5, 5, 4, 5, -2, -2, -2, -3, 4, -4, -3, -4, -1, 3, 5, -3, -3, -3, -1, -2, 5, 2, -5, 3, -3, -2, 6, -4, -4, 2, 1, -1, 3, -4, -2, 1, -5, -4, 1, -3, -3, 2, -1, -4, 2, 4, 4, -5, 2, 5, -2, 6, -1, -4, 1, -3, 2, 3, -4, 2, -5, -1, 1, 5, 5, 4, 4, 1, 0, 3, -5, 4, 5, -3, -1, -2, 2, -1, 5, 1, -3, 4, 0, 5, 5, -2, 3, -3, -1, 0, 1, 4, -4, 3, -1, 0, -1, -3, -1, 3, 1, 0, 2, 6, 1, -4, 3, -4, -2, 1, -4, -4, -4, 4, 3, -3, -2, 2, 5, 0, 3, -1, -5, 5, -4, 0, 4, 2, 1, -3, 0, -2, -1, 3, -3, 2, 1, 5, 1, 3, -3, -3, 2, 2, 5, -4, 5, 3, 0, -3, -1, -4, 4, 2, 2, 2, 6, -4, 1, -2, -3, 5, 1, 3, 3, 5, 0, 6, 0, 2, 1, -2, 1, -3, 4, 3, -1, -1, 1, 0, -1, 5, 1, 5, -4, -3, -2, 5, -2, -4, 1, 2, 0, -4, 1, 3, -5, 3, 4, 0, 4, -3, 1, 0, 0, -3, 6, -2, 1, 4, -4, 0, 4, 3, 0, -1, -3, 1, 3, 5, -2, -3, -3, 5, -1, 4, -3, 0, -3, 6, -1, 0, 1, -4, -4, 3, -4, -1, 4, 2, 4, 0, 1, 2, -3, -3, -1, -4, -1, -4, 5, 0, -2, 6, 1, 4, -1, -1, -2, 1, 2, -3, 5, -2, 0, -3, 4, -4, 1, 4, 4, 3, -1, -3, 2, 5, 3, -2, 0, -3, -1, -2, 2, -2, 0, 5, -4, 0, 3, -2, 5, 0, -2, 4, 0, -4, 3, 4, 4, -3, 3, -1, -3, 6, 4, 2, 0, -4, 2, -1, -1, -3, 1, -3, 2, -2, 1, 5, 4, 5, -3, 1, 4, 4, 3, -2, 4, 3, 4, -5, -4, 2, -1, 2, 4, 1, 2, 0, -2, 5, -3, 4, 2, -5, 2, 4, 3, 5, -1, -1, 0, 0, 0, 4, -2, 5, 2, 1, -3, -4, 2, -3, 4, -1, 3, 0, 6, 3, 5, 1, 5, -2, 1, 0, 1, -2, -4, -3, 2, -3, -2, -4, -1, 3, 0, -3, -3, -1, 1, 1, 1, -4, -3, -1, 3, 1, 3, 5, 4, 6, 5, -5, -3, -2, -3, 0, 2, 0, -3, -1, 4, -2, 2, -3, 5, 0, 4, 2, 5, 2, -1, -3, 4, 2, -2, -5, 4, -2, -4, -3, -4, -4, 1, 1, -1, 0, 6, 5, 2, 4, 0, -1, -3, 4, -2, -2, 5, 2, 5, -3, 0, 5, -3, 2, -4, -2, 3, -1, 2, 2, -2, -2, -2, 1, -3, 5, -4, 5, -4, -4, 1, -4, 0, 2, 0, -3, 0, -5, 4, -2, 4, -4, -1, -2, 1, 4, -4, 1, 5, 3, 0, -2, -5, 5, 3, -3, 6, 1, 3, 4, -3, -4, -5, -3, 3, -3, 4, 2, 2, 6, 5, -1, -1, 2, 4, -4, -4, 3, 5, 5, 4, -4, 5, 5, 0, 4, -2, -4, 4, 0, 2, -3, 0, 5, 3, -5, -3, 5, 0, 4, 0, 2, 5, 1, 2, 3, 2, 4, 0, -2, 2, 2, -3, -2, 2, 1, -1, 0, -1, 4, -3, -2, 4, 0, 0, -4, -1, -5, 1, -3, 4, -1, 0, 5, 4, 4, 0, 3, 0, -3, 5, 0, 1, -4, -2, 0, 1, 0, -1, 0, -3, 1, 2, 2, 2, -2, 4, 3, -3, -2, 5, 3, -4, 1, 6, 0, 1, 4, 4, -4, 4, 0, 1, 1, -4, -4, 5, -3, 1, 2, 6, -4, 4, 3, 2, 2, -5, 0, -1, 4, 0, 0, 3, 3, 3, 4, 0, -2, 3, 5, 1, 4, 4, -5, -1, -4, -2, -2, 2, 4, 3, 1, 2, 3, 3, 0, -1, -5, 1, -3, -2, -2, -2, -1, -3, 3, -5, 0, -1, -5, -4, -1, 4, 2, -3, -4, -1, -4, 5, 1, 5, 5, 5, -3, 3, 3, -3, -1, 3, 5, -2, 2, 3, 1, 4, 4, 6, 5, 3, 5, 0, -3, 1, 0, 0, 3, 3, -2, -4, -5, 4, -4, 2, -4, 0, 2, 5, -1, -1, 4, -2, 5, 5, -2, 2, -1, 5, 0, -2, 1, 1, 2, -4, 3, -1, -1, -2, 2, 5, 4, -5, -3, 3, 6, 2, -4, 5, 3, 1, -1, 2, -1, 0, 1, -5, -1, 0, -1, 1, 2, -3, -2, -3, 5, 3, -4, -1, -3, -3, 1, 4, -4, 3, -4, 2, 0, 0, -4, 2, 2, 1, 5, 1, 1, 1, 2, -4, -3, -4, 6, -4, 3, -1, -4, 0, -4, -3, -5, -4, 1, 1, -1, 0, 2, 5, 1, 2, 3, -3, -4, 2, -5, 2, 2, 1, 5, 0, 0, 4, 3, 0, -1, -1, 1, 4, -3, -4, 6, 0, 2, -4, -2, 5, -2, 1, 3, 2, -1, 5, 3, -1, 2, -1, 2, 4, 5, 4, 5, 2, 0, -1, -2, 1, -1, -2, -1, 3, 5, -2, -4, 5, -1, 0, -4, -2, -4, -4, -1, -1, -3, 2, -1, -4, 5, 4, 5, 4, -5, -1, 1, -3, -1, -2, -3, -3, -4, 2, 5, 4, 4, 6, -2, -1, 0, 3, 4, -2, -1, 4, 1, 3, -1, 1, -1, -4, 4, -1, -4, 3, 1, 1, 1, -3, -1, -2, 1, -4, 1, -3, 1, 5, 2, 4, 4, 4, 3, 3, 0, -4, 4, -1, 5, -2, 3, 1, 2, 2, 3, 1, 4, 0, 1, 3, -5, 0, -3, -1, -3, -4, 4, -2, 3, 5, 5, 5, -4, 6, 5, 6, -1, 5, 0, -1, 3, 5, -1, -1, 2, 5, 4, 5, -5, 4, 2, 0, 2, 4, -1, -4, 1, 3, -2, 5, -5, 3, -1, -3, 1, 3, 6, -4, 3, 4, -3, -3, 1, -2, 5, 1, 1, -1, -3, 2, -3, 5, -5, -3, -3, -5, 5, 1, -5, 0, -1, -1, 5, -2, -4, 2, 5, -1, 2, -1, 3, -2, 4, -3, -5, 5, 3, 2, 3, 4, -1, 5, 4, -3, -3, -2, -2, 0, -4, -3, 0, 3, 6, -4, 6, 3, -1, -4, -5, -2, -1, -1, -1, 3, 5, 4, 5, 0, -1, -3, 4, 3, 3, 2, 1, -4, 2, 0, -2, 4, -3, -3, 1, 0, 4, 4, 3, -4, 3, -3, -1, -3, 5, -2, 1, 1, 5, -4, 3, 1, 0, 2, -2, 5, -3, -4, -2, 3, 5, 1, 3, -2, -5, -4, -1, 1, 4, 0, 3, 0, 3, 4, 6, -1, -2, 3, 2, 4, -2, 1, 0, 3, -2, 5, 4, 1, 2, 0, -2, -2, -1, -2, -1, 1, 1, 3, 4, -1, 5, -3, 6, 3, -4, -1, 4, 5, -4, 1, 0, -5, -4, 6, 0, -4, -2, 1, -2, 4, -4, 5, 2, 2, -3, 6, 1, 6, 4, 1, -3, 0, 2, -4, 5, 4, -3, -2, -2, -3, 3, 0, 6, 3, 5, 0, 5, -5, 0, 0, 0, -1, 5, 5, 2, -2, 2, -5, 5, 2, -1, 4, -5, -2, 4, 1, 3, 1, 2, -3, 5, -2, 4, -3, 5, 5, -1, -4, 0, 2, -4, -2, 0, -1, 2, 6, -1, -3, 5, -4, -3, -1, -3, 1, 6, 0, -3, -4, 0, -4, 4, -2, 2, 3, 1, 5, -3, 4, -2, -5, 5, -2, -3, 0, 5, 1, 3, 1, 5, -4, -1, 3, 0, -4, -1, 4, 3, -4, -2, -4, 0, -3, 2, -4, 3, 1, -1, -4, 4, 3, -1, 4, 4, 0, -4, 4, 1, 0, 4, 4, 2, -1, 6, 5, -3, 2, 5, -4, 4, -2, 1, 0, 5, -2, 4, -4, 3, -2, -4, 2, 3, 2, -5, -3, 6, 2, -4, -4, -5, 5, -3, -2, 6, -1, -3, 2, -3, -4, -1, -2, -1, -2, -4, -5, 3, 1, -3, 4, 1, 4, 4, 1, -1, 3, 1, 0, 2, 2, -3, 4, -1, -5, 5, 0, 2, -5, -3, 3, -5, -3, -3, 5, -1, 4, 4, 2, -1, -1, -3, -3, 5, 1, -2, -4, -1, 3, 0, 2, -4, -3, -2, 3, 1, -5, -2, 4, 2, 2, 1, -3, -3, 1, -1, 0, -1, 1, 3, -2, 2, 5, 0, 0, 4, 4, 3, -1, -2, 3, -4, -4, 1, -1, 5, 5, -4, -3, 4, 6, 5, -2, -1, 4, 3, 4, 0, 4, -3, -4, 4, 3, -2, -4, 3, -2, 3, -5, 3, -2, 1, -2, -1, 2, 5, -2, -5, 3, 0, -1, 1, -5, 3, -3, -1, 5, -2, 4, -3, -1, 0, 3, -3, 0, -2, -3, -4, 5, -1, 3, 1, 1, -4, 5, -2, -1, -2, 4, 5, 4, 0, 4, 4, 3, -3, 0, -1, -3, -2, -5, -1, 2, 0, 6, -4, 5, 5, 4, -3, 5, -1, 2, 0, 2, 5, -1, 0, 1, -1, 0, 3, -4, 5, -2, 0, -2, 1, -3, 0, 2, 4, 1, -2, 1, 4, -1, -1, 0, -4, 5, 1, 2, -2, 1, 4, -3, 1, 4, 3, 1, 0, 1, -5, 1, 1, -1, -3, 0, 2, 0, 6, 1, -4, 1, -3, -1, 5, 1, -3, 0, -1, 3, 4, -4, -3, 1, 5, -3, 5, -1, -1, 4, -1, -3, 0, 0, 2, -3, 5, 4, -1, -1, -4, 0, 3, 1, 1, 0, 2, -4, -4, 4, 2, -4, -1, -1, 0, 5, 2, -1, 5, 2, -1, -2, 6, 0, -4, 3, 3, 1, 0, -2, -1, 4, -4, 3, -1, 2, -4, -3, 1, 1, 0, -1, -1, -3, -1, -1, 1, -3, 4, -4, 1, 0, 0, 3, 4, 1, -3, -4, -1, -4, 4, 1, 5, 1, 6, 6, 0, -1, -3, 4, 4, 2, -4, 3, 2, 1, -2, 3, 1, 2, 5, -1, 3, 4, -1, 2, -2, -3, 3, 5, 5, 6, 3, 0, -1, -2, -1, 4, -3, 1, -2, -4, 0, -5, 0, 1, 1, -1, -2, 4, 3, -1, 4, 4, -1, -1, 1, 1, -4, 3, -2, -4, -3, -4, 0, -1, 4, 2, 2, 2, -1, -5, 1, -5, -3, 4, -1, 5, -2, 5, 4, 2, -1, 4, -4, 1, 4, -2, 6, -5, 4, 5, -2, -3, 5, 2, 2, -1, 3, 0, -4, -1, 4, 1, 3, -4, 4, -4, 1, -4, 1, 4, -4, -4, 3, 4, -1, -2, 0, 2, 0, 0, -5, 6, 3, -2, -1, 5, 4, 5, -1, -2, 2, 2, 0, -4, -4, 1, -4, -2, -4, -3, -3, 4, 1, 2, 0, 0, 2, 4, -3, 2, 4, -3, 3, -5, -4, -3, 3, -3, -3, -4, 3, -5, 1, 0, -4, 2, -3, -1, -3, -1, -3, -1, 2, -2, -1, 0, 4, 3, 3, 0, 1, -4, 2, 5, -5, 1, -4, -3, 2, -4, -2, 1, -2, -4, -1, 5, 0, 6, -4, -3, -4, 5, -3, -4, -2, 0, -4, 0, -4, 6, -2, 1, -4, 2, 5, -4, -4, -1, -4, 3, -5, 6, 0, 1, -4, -1, 5, 2, 0, 4, -3, -2, 5, -1, -3, 1, 0, -4, -1, 3, 6, -2, -2, -4, -2, -2, 3, 0, -4, -4, 3, 3, -4, -3, 4, -3, 1, -3, 3, 6, -1, 2, -4, 2, 6, 3, 3, 2, 5, -4, -4, -1, 6, 1, -4, 1, 2, 1, 6, 1, -2, 2, 3, -5, 2, -4, 1, 3, 5, 1, 3, -3, 5, -1, -4, -4, -3, 1, -1, 6, 2, 5, 4, -3, -5, 3, 5, 2, 0, 3, -3, 2, -3, 1, 2, 3, -1, -4, 6, 3, -3, 6, 2, 1, 1, 5, -4, -4, 1, -5, 3, 5, 2, -2, 0, -5, 3, 1, -2, 3, -1, -1, -3, 2, 0, 1, 1, 5, -1, -2, 3, 5, 5, -4, -4, -2, 2, 4, -1, 3, -2, 1, 0, -5, -2, 5, -1, 2, 2, -1, 1, 0, 5, 2, 5, 0, -3, 5, -4, -3, 1, -4, -2, 4, -2, -4, 0, 2, 0, -1, 0, -3, 4, -2, 5, -2, 1, -2, -4, -1, 4, -4, -2, -3, 4, 0, -1, 5, 3, 5, -2, 0, 5, -3, -2, -4, -4, 3, 5, 6, 5, 5, 5, -2, 0, -3, 0, 4, -1, 3, 0, 5, 4, -4, 0, 3, -4, 5, 5, -1, -2, 5, 1, 3, 3, -5, 3, 3, -1, 5, 0, 3, 4, 1, 0, -4, -5, -1, -5, -3, -4, 1, -3, 3, 5, 5, 1, 1, -5, -4, -3, 0, -1, 0, -2, 5, -4, -3, 5, 2, 0, 4, 4, 0, 3, 1, -3, 3, 0, -2, -2, 5, 4, -2, 2, -3, -1, 3, -4, 2, 3, 1, -2, 0, 2, -4, 0, -3, -1, -4, 4, 2, 3, -3, 4, -4, 1, 2, 1, -2, 1, 5, 3, -3, 2, 0, 0, -5, -2, 5, 2, -3, -3, -1, -1, 4, 5, 3, 0, 4, 5, -2, 6, -5, 2, -1, -2, -2, -2, 4, -1, -4, -4, 4, -4, 4, 4, -5, -1, 0, 2, -2, -2, 2, 3, 5, 5, -3, 0, 5, 4, 3, -2, -1, 3, -4, -1, -1, 3, -4, -2, 4, -4, 0, -1, 0, -2, 1, 2, 0, 1, 3, 3, 2, -3, 0, -2, 1, 1, 0, -2, 3, 1, 2, 4, -3, -3, -1, -4, -4, 6, 0, -3, 0, 0, 2, -2, 3, 5, -2, -1, -1, -4, 3, 5, 0, -1, -3, 1, 4, 4, -4, -1, 1, 0, 6, 1, 0, 2, 2, -1, 1, 2, 4, 2, -4, 2, 1, 3, 2, -3, 2, 2, 3, 5, 0, 1, 4, -4, 0, 0, 3, 3, -1, 4, -3, -1, -3, -3, 5, 0, -2, -3, 5, 0, 4, 3, 4, -1, 2, 5, 5, -3, 0, 2, -3, -4, 0, 0, -2, 5, 3, 0, 1, -3, 1, 4, -3, 1, -4, 1, 2, -3, 4, -4, 3, -1, 3, 4, 3, -2, 3, 1, 0, 3, 6, 5, 3, 2, 5, -3, -5, 0, -2, 0, 2, 2, 6, 6, 6, -2, -2, 1, 1, 3, 3, -5, 4, 1, -2, -3, -1, 1, -4, 5, -1, 2, 4, 0, 1, 0, 0, -4, 0, 4, 5, 3, -1, 0, 5, -3, 0, 4, 2, -3, 1, -2, 6, -1, -4, -4, 1, 4, -3, 2, 3, -5, -2, -3, 5, -4, -3, 1, 5, 3, 3, -5, 0, -3, 4, -3, -1, -2, -4, -4, -1, -2, 5, 4, 0, -1, 2, -4, -1, 2, 4, 3, 1, 3, -2, 1, -1, 6, 5, -1, -5, -2, 3, -1, 0, -4, 5, 2, 4, 0, 3, 3, 1, -5, 3, 0, -3, 5, 0, 2, 4, 2, 4, -4, 1, 0, -5, 3, -1, 0, 2, -2, 3, 3, -3, -3, 0, -4, -1, -4, 1, 6, -1, 2, 4, 5, -2, 4, 0, -1, 2, 5, 5, 5, -2, -2, -1, -3, -2, 0, 5, 1, 0, 4, -5, 1, 5, -2, -1, 0, 4, -4, 1, 0, 5, 2, 0, 4, 4, 2, 2, 1, 1, -1, 3, 4, -2, 4, 3, 2, -4, 5, 2, -4, 4, 1, -3, 3, 3, 2, -4, 6, -1, 3, 4, -3, -3, -1, 2, 2, 6, -2, 5, -2, 5, 0, 2, -3, 4, -2, 3, 0, 1, 1, -2, -4, 0, 3, 2, 2, -2, -4, -2, 1, 4, -3, 5, 0, -4, 0, 3, 5, -3, 5, 0, 0, 5, -3, -5, 6, -4, 0, 2, -4, 3, -3, 0, 4, -2, -4, 3, 4, 2, -3, -4, 3, 4, 2, -1, -5, 4, -4, 3, -4, -3, 1, 3, 5, 3, -2, -1, -2, 5, -3, 4, 1, 3, -4, 2, -1, 5, 2, 1, -2, 0, -1, 2, 0, 2, -4, 4, 5, -2, -2, 5, -4, 3, 0, 3, 1, -5, 5, 5, 2, -1, -1, -4, 3, -3, 2, 5, -2, -2, 2, -2, 3, 0, 1, -1, 5, 6, 0, -3, 3, 4, 1, 4, -4, 0, 2, 5, -1, -4, 1, -1, -2, 6, 3, 5, -3, 0, 0, 2, 2, -4, -1, -4, -2, 1, -4, -3, 3, -4, -2, 2, 6, -2, 6, 6, 0, 3, 6, 1, 1, 3, 3, -1, -2, 3, 0, 0, -3, -5, 5, 3, 2, 1, -1, -4, 3, 4, 1, -2, -1, 0, 1, -4, 1, 1, 6, -2, -4, 3, 0, 0, -2, 0, 4, -1, 4, -3, 0, 5, -2, 0, 1, -3, 2, 1, 2, -5, 4, 3, 5, -2, 2, -2, -1, 4, -4, 1, 2, -2, -3, 0, 5, -1, -3, 2, -3, 0, 0, 2, 2, 2, 5, 0, -2, 2, 2, -2, 6, 2, 3, 0, 6, 5, 5, -3, 5, 1, 3, 2, 5, 5, -4, -2, 3, -3, 1, -1, 4, 1, -1, -2, -2, 0, 3, 3, -4, -4, 1, 0, 5, -2, 3, 3, -2, 2, -5, -1, -1, 6, -3, 3, -1, 3, -3, 5, -3, 6, -4, -3, 0, 6, 4, -2, -4, 5, 3, 3, -4, 4, 4, 4, -1, 0, -1, -2, 0, 6, -1, 3, 2, 2, -4, -3, 0, 6, 6, 0, -2, 5, -4, 2, 3, 5, -3, 5, 0, 3, 0, 1, 6, 1, 6, 4, 1, 1, 0, 1, 4, 3, -4, 2, -3, 3, 6, 5, 0, 4, 2, -2, -2, 2, -4, 5, 5, 5, -4, 0, -2, -3, 2, 4, -4, -4, 5, -1, 2, 1, 0, 1, -1, 6, -2, 3, 1, -3, -2, 2, -3, 2, -3, -4, 0, -2, 4, -2, -4, 3, 0, 0, -2, -3, 4, 5, -1, 0, 6, -5, -4, -2, -5, -1, 5, -1, 2, -2, 1, 4, -1, -3, -3, 1, 1, -2, 4, 5, 6, -4, 4, 0, 2, -3, 4, -3, 1, -1, 1, 4, -4, -2, -2, 5, 4, 3, 1, 4, -5, 2, 4, -3, -3, 4, -2, -1, -4, -5, 1, 1, 2, 3, 2, 5, 0, 6, 6, -3, 6, 1, 2, -5, 3, 3, -2, -3, 4, 5, 2, 6, -3, -1, 4, 2, -1, -4, 1, -1, 4, 0, 6, 0, -2, -3, -3, 1, -1, 1, 5, -1, 4, -2, -4, 1, 6, -3, -1, -5, 3, -3, 4, -3, 3, 4, 2, -4, 0, 3, 4, -3, 2, -1, 5, 3, -3, 5, 0, 2, -4, 3, -5, 4, 1, 5, -3, -4, 3, 5, -1, -3, 5, -3, 5, 1, -4, 0, 3, -1, 5, 5, -4, -1, 5, -4, 2, 5, 2, -3, 4, -5, 6, -3, -3, -5, 1, 4, 5, 3, -3, -1, 1, 3, 5, 3, 1, -3, 5, 4, -2, 6, 0, 5, 1, -4, -4, -5, -3, 4, 4, 1, 0, 0, 2, -3, 6, 3, -4, 0, 5, 5, 0, -1, 0, 3, 0, 1, -4, 5, 1, 3, -1, -3, 0, 4, 4, 0, 2, -1, 5, 0, -1, -1, -1, -2, 6, 4, 4, 3, 5, 1, 5, -1, -1, 1, -1, 3, -3, 4, -3, 2, 5, 1, 1, 0, -1, -1, -4, 2, -3, -3, 4, -1, 2, 3, 1, -3, 1, -4, 0, 0, 5, 3, 0, 4, -2, 2, 3, -1, 4, 5, -2, 2, -2, -1, 0, 2, -2, 2, 2, 1, -4, 2, 0, -4, 5, 1, 3, 5, -4, 1, 3, 5, 5, 5, 5, -5, 4, 6, 4, 5, -3, -2, -2, 1, 4, 0, -1, 1, 6, -1, 0, 0, 4, -2, 2, -3, 3, 6, 4, -2, -5, 1, -1, 0, -2, -1, -3, 2, 2, 0, 1, -1, -4, 4, -3, -3, -5, 5, -2, 1, 2, 4, 5, 3, 4, -5, -4, -3, 2, 0, -1, -3, 1, 4, -3, -2, -1, -1, 4, 2, -2, 4, -2, 4, -3, 5, 3, 3, -2, 2, 2, -4, 2, 3, -3, 2, -1, -4, -3, -1, -1, -3, 4, -4, 1, 0, -2, 0, 3, 6, 4, -3, 4, -4, 4, 2, -2, 5, 3, 2, -2, -2, -5, 2, 3, 0, 2, 3, 2, 2, 4, 0, -5, -4, 6, 4, 4, -1, -1, 5, 1, 5, 5, -2, 4, 1, 2, 0, 0, -2, 5, 3, 3, 4, 3, 6, 0, 3, -4, 4, -4, 6, 2, 5, 1, -3, 1, -2, 6, 2, 2, 3, 4, -1, 6, 0, 6, -3, -1, 5, 1, 0, -3, 0, -4, -2, -4, 0, 4, -4, 0, 0, 3, 4, 3, -1, 1, 6, 1, 3, -2, 0, -4, -4, 6, 5, -1, -3, 5, -4, 3, 6, -4, -3, -2, 4, 6, -3, 5, 5, 3, 3, -2, 3, -2, -5, 3, 5, 4, -3, -5, 6, -4, -4, 3, 4, -1, -3, 0, -2, 0, 3, 4, 4, 4, 0, -1, 2, 2, 1, -2, 1, 1, 5, 0, 3, -2, 1, -4, -1, -1, -4, -4, 5, -1, -2, -1, 5, 3, 5, 1, -4, -3, -1, -1, -5, -3, 5, 3, -4, -2, 3, 3, 4, -1, 1, -3, -2, 0, 4, 1, -4, -1, 5, 0, -4, 4, -1, -4, 4, -1, 0, 5, 5, -4, 5, 1, -4, 0, -5, 0, 4, 5, -1, 4, 6, 3, -2, 4, 4, 4, 5, -1, 2, -3, -3, -3, 4, 5, -3, 3, -2, 0, -5, 0, 3, -2, 2, -5, 5, 1, -2, 0, -3, -2, 0, 4, -4, 4, 1, 6, -3, 1, -3, 4, 2, 2, -3, 0, -4, -4, -1, 2, 3, 1, -4, -2, 0, -1, 0, -3, 3, -3, -1, -2, 5, 2, -2, -4, -3, -4, -2, 4, 3, -1, -3, 4, 0, 4, -3, 4, 6, 1, -4, 2, 1, -3, 3, 6, -3, -2, -4, -3, -3, -3, -4, -1, 1, 3, -2, -2, 2, 0, 1, -5, 2, 4, -1, 0, 0, 6, 1, -2, 1, -4, 2, -3, 5, 4, 5, -5, 5, -3, 2, -3, 4, -5, 1, -1, -4, 4, -1, 6, -3, 0, 3, -5, 2, 5, 1, 5, 4, 5, 1, -2, -2, 5, 1, -3, -2, -4, 1, 2, -2, -4, 3, 2, -3, 1, 3, 3, 5, -4, -4, 2, -5, 0, -3, 1, 0, -2, 3, 5, 3, 5, 4, 5, -3, 5, -2, -3, 0, -2, 2, -2, -3, -1, 1, -2, 1, 1, 0, 0, -4, 5, 5, 4, -1, 0, 4, 0, -1, 3, -4, 4, 2, 1, 4, 4, -2, 0, 5, 4, 2, -5, 5, -1, -2, -3, 1, 2, -3, 6, 0, -3, 2, -4, 4, -1, 1, 4, 5, 2, -1, 5, 4, 4, -4, 1, -2, -5, 0, -1, 0, 3, 5, 0, 2, -1, 3, 1, 3, -1, 0, -3, 4, 4, 4, -4, 2, 4, 0, -5, 1, 3, 2, -4, 3, -2, 5, 1, 2, -2, 1, -3, 3, 1, 0, 1, -2, -4, -2, -5, 3, -1, 0, 1, -2, 3, 1, 2, 0, 4, 2, 5, 1, -4, 4, 2, -2, 3, -3, -5, 4, 2, -1, -4, 0, 1, 4, 0, -4, -2, 3, 4, 4, 1, 4, 0, 5, 5, 5, 5, 3, 0, 2, 0, -3, 5, 0, 2, 2, -4, 4, 4, 4, -3, 6, 3, 3, 2, -2, 1, 4, 5, 6, 0, 3, 1, 0, 2, 4, 1, 1, -5, -5, 5, 4, 1, 5, 3, 0, -2, 1, -4, 5, 1, 5, 1, -3, 0, 3, 6, 5, 0, -3, 1, 3, -2, -3, 4, -3, 1, 3, 3, -3, 4, 6, -3, 3, 2, 0, -1, -4, 3, 4, 6, 2, 4, 6, -3, 3, 0, 5, 4, 0, -2, 4, 0, -2, 2, -3, -4, -3, -1, -3, 1, -1, -1, -1, -4, 1, 2, 4, -4, -3, 3, -1, -4, 1, 1, 4, -2, 1, 2, -1, -3, 5, -2, -1, -2, 3, 5, 5, 5, 2, 5, 4, -4, 4, 0, 1, -4, 4, 6, -3, 2, 6, 5, 4, 1, 5, 4, -2, 0, -1, -2, -4, 1, 1, -3, -1, 0, 2, -2, 4, -1, 6, -2, 4, 3, 5, -2, -1, 3, 0, -4, 4, 3, 1, 0, 0, 0, 1, 2, -4, -4, 0, -1, 4, 0, -4, 2, -5, 0, 3, -4, 3, -2, 0, -2, -2, 1, -4, 2, -1, 3, 1, -2, 4, -4, -3, -3, 6, 2, 4, 3, 2, -2, -1, 4, 4, 5, 3, 4, 3, 4, 0, -1, 0, -4, 3, -2, -4, 0, 3, 6, 0, -1, 3, 2, 3, 6, 1, -3, 4, 2, 2, 5, 5, -1, -2, 0, 2, 2, 4, 0, 3, 3, 0, -5, -1, 6, 4, -4, -5, 4, 3, 1, -3, 4, 0, 1, 5, 1, 2, 2, 4, 1, 3, 0, 4, 5, 1, -2, -3, 1, 2, 4, -3, 5, -3, -3, -1, -4, 4, 6, -4, 2, -4, 5, -5, -2, -2, 5, 4, 2, -1, 2, 3, 1, 0, -4, 0, -3, -2, -1, 4, -2, -3, 4, 0, -2, 2, 3, 5, 0, -3, -4, 5, -2, 4, 2, 5, -4, 0, 1, 6, -1, 6, 3, 2, -3, 3, 2, -3, 3, -2, 4, 5, 0, 6, 2, 0, 2, -5, -4, 1, 1, 0, -1, 4, 0, -2, -3, -2, 4, 4, 3, 1, 4, 3, 1, 4, -2, 2, 2, -1, -2, 5, 2, 1, 1, -2, 3, 1, -3, 0, -2, 6, 0, 4, 4, -5, 0, -3, -2, -5, -1, -1, 0, 1, 2, 2, 5, 5, 5, 3, 5, 0, 0, -2, 5, 4, 3, 4, 3, 0, 3, 6, 0, -3, -1, -5, -4, -3, -2, 0, -3, -3, 6, -3, 0, 5, 0, 4, -3, -5, 3, 0, 6, 1, -2, -1, -3, -1, 2, 1, -2, 3, 3, 1, 2, -1, 2, -3, -1, -4, -1, 1, 4, -5, -4, 3, -2, 6, -3, -2, 5, -2, -4, 3, -4, 2, -1, 2, 3, -4, -1, -1, 1, -5, 2, 1, -4, 1, 0, 0, -2, 2, -4, -3, 6, -3, -3, 3, 2, -1, 0, -1, 2, 0, 5, -4, -5, 0, 6, -4, -2, -4, 3, 3, 3, 0, 2, 1, 1, -3, -4, 2, -3, 0, -4, 1, -5, 5, -3, -4, 4, 4, 2, 0, -2, -3, 1, -4, 1, 2, -4, -2, -4, 2, 5, 6, -3, -3, 4, 4, -5, 0, 3, 1, 5, 2, 6, 1, 5, 4, 0, 1, 5, 4, 0, -2, -3, -4, -3, -4, -1, 4, 1, 1, 4, 2, 5, -3, 4, -3, 4, -3, 3, 3, -1, 6, 0, 3, 0, 1, 5, -4, 1, -3, 5, 5, 0, -1, -3, 3, 3, -1, -3, -2, -1, -3, 0, 4, 2, -3, 3, -2, 5, 4, 4, -1, 3, 0, -3, -2, 0, 5, 0, -5, 2, 4, -4, 4, -1, 0, -2, 5, -2, -1, 2, 2, 3, -1, 0, -1, -1, 1, 2, 5, 1, -2, 0, 3, -1, 2, -2, -3, -5, -1, 2, 4, 3, 3, 0, 2, 5, 5, -4, 0, 3, -4, -4, 4, 3, -1, 0, 5, 1, 3, 1, 5, -5, 4, 4, -2, 0, 0, 3, -1, 4, 6, -4, 4, 5, 1, 1, 0, 0, -5, -3, 3, -3, 5, -2, 6, 3, 2, 6, 3, -5, -1, 5, 0, 5, -4, -2, -2, 4, -3, -2, 3, -5, 3, 0, -5, 0, 2, 0, -1, -3, 4, 1, -2, 2, -1, -2, -4, -1, 3, -2, 2, 5, -1, -4, -3, 2, 5, 4, -5, -1, -4, 5, 1, 0, -3, 6, -1, 4, -1, 0, 4, 3, 0, 0, 3, -4, 5, 0, 5, -1, 1, 1, -5, 2, 0, -2, -1, -2, -1, 5, -2, 4, 1, -4, 1, 6, 1, -2, 5, 5, 2, 6, 1, 4, -1, 5, -1, 2, -1, -2, -1, 4, -3, 1, 0, 2, -4, -5, 4, -5, -1, 5, 3, 0, -4, -2, 5, 1, 5, -4, 1, 2, 2, -5, 4, -1, -3, 2, 2, -1, 6, -4, 5, -1, 6, 1, -4, 3, 0, 0, -2, 1, -2, 5, 0, 1, 4, 0, 1, 0, 4, 5, 4, 1, 4, 4, -1, 4, 4, 4, 0, -4, -2, -1, 0, -2, 0, -3, 4, -2, 1, 4, -1, 2, -1, -1, 0, 2, 1, -2, -4, -3, 4, -1, 4, 6, -2, 1, -4, 1, 4, -3, 3, 4, 0, -4, 0, -1, 3, 1, -3, 2, -2, -3, 3, -4, 2, 2, 1, -4, 5, 1, 6, 5, -1, 5, 3, 3, 4, -2, -1, 6, -1, 0, -1, -2, 5, -2, -2, -3, -5, -3, 4, 4, -4, 1, 6, 1, -2, 4, 4, 4, -1, 5, 1, -4, 5, -2, 3, 6, -2, -2, -5, 3, 2, 1, -3, 1, 4, -1, 4, -3, -2, 0, 1, 4, -2, 2, -3, -1, 2, 2, -2, 6, 2, 0, -4, -5, 0, -1, -4, -5, 0, -3, -2, 5, -5, -4, 5, 0, -5, 4, 5, 3, 0, 0, 5, 2, 5, -2, 1, 1, 0, -4, 3, 6, -2, 5, 4, 1, 5, -3, 0, 3, 0, 0, 1, 2, -3, 2, 1, 3, 0, 1, 3, 0, 0, 1, -1, -2, 2, 6, 5, -3, 4, -2, 3, -4, -5, 5, 2, -5, 0, 4, 0, -1, -1, -1, 5, 1, -4, -2, -3, -2, 2, 4, 3, 2, 3, 4, 2, 5, 4, 2, 6, 2, 4, 4, 5, 2, 1, 5, -1, 4, 5, -5, 1, 3, -4, -3, -1, -2, -2, 5, 3, -3, 5, -5, -3, 6, 1, 3, 1, 0, 4, 2, -2, -5, 3, -2, 4, -2, 1, -2, -1, 5, 3, 3, -3, -4, 5, -1, 3, 3, -4, -1, -1, 0, -5, 1, -1, 0, -2, 3, 2, 1, 2, 2, -2, 2, 2, 0, 3, -1, -2, -5, -2, -2, 0, 3, 0, -2, 4, -5, -1, 0, 3, 6, 0, -3, 2, 0, 2, 1, 4, 4, -4, -2, 0, 3, 6, 0, 4, -2, 3, 3, 2, -2, 2, 2, 4, -1, 3, -1, 3, -4, 2, -4, 1, 3, 2, 2, 2, -4, 4, 4, 3, 0, 4, 2, 1, 5, -4, 2, -1, 3, 4, 2, 1, 1, -3, -2, 5, 5, -4, -2, 1, 5, 3, 2, 5, -2, 3, 1, 1, -3, -2, -3, 4, 2, 4, 1, -1, 1, -4, -3, 3, -5, 3, -3, 1, 6, -4, -4, 5, 1, 1, 4, -4, 0, 1, 1, 1, -3, -1, 4, 1, 2, -4, 3, 1, 0, -4, 2, -2, 6, 1, -2, 2, 3, 2, 5, 5, -2, 5, -1, 5, 3, 1, 1, -1, -1, 0, 2, 5, -4, -3, -1, 0, 2, 3, -5, -1, 2, 5, -3, -2, -1, 0, -3, -4, -5, -2, -3, -3, -3, 2, 0, -3, 5, 1, 5, 3, 5, -1, -4, -2, 5, 2, -2, -3, 1, 5, 1, 4, 5, 6, 4, -2, 1, 5, 2, 0, 2, 0, 5, -3, 0, -4, 0, 1, -2, 2, 4, 0, 1, 6, -2, -2, 5, -2, 1, -3, 2, -2, 3, 5, 5, 3, 5, -5, -1, 6, -5, -4, 1, -2, 4, 1, 2, 4, -4, -1, -1, -5, 5, -2, 0, -2, 1, -3, 3, -4, -2, 6, 2, 3, 3, -3, 2, -2, -4, 5, -1, 4, 1, 1, 0, 3, 0, 4, 5, -3, 2, -1, -5, 2, 1, 1, 2, 4, 4, -3, 3, 4, -3, -2, 0, -1, -2, 3, -1, -3, 2, 0, 5, 3, 4, 2, -2, 4, 1, -3, -3, -3, 3, -2, -5, -4, 3, 0, 5, -1, 0, -3, -2, 3, 3, -3, 5, -2, 5, -2, 2, 3, 3, -4, 1, 2, -3, 0, 5, 5, 1, 3, 2, 3, 3, 1, -2, 0, -3, -4, -1, -3, 4, -4, 1, -1, 3, -3, 5, 2, 6, -2, -2, 3, -4, -2, -3, 3, 2, 1, -3, -4, -5, -3, 0, 3, 2, 5, 1, 4, -2, 5, 3, 4, 4, -5, 5, 5, -1, -4, 5, 1, 5, 2, 4, -2, 1, 0, 1, 4, -1, -1, 2, -4, 4, -2, 0, 5, 4, 2, 2, 4, -5, 2, -2, -2, 5, 3, 2, -2, -2, 4, -2, 5, -2, 5, 5, 4, -5, 1, 4, 4, 1, -3, -1, -3, -4, -1, 6, -2, 1, 3, 2, -5, -1, -1, 1, -5, -4, 5, 2, -3, 6, -2, 2, 0, 5, 3, -2, 3, -4, -3, -3, 2, 1, -1, -3, 6, -3, 3, 4, -4, 4, -1, 4, 6, 5, -1, 1, -3, -4, -2, -4, -3, -1, -2, -1, 5, -1, 1, -3, 1, -4, 6, 5, 2, 6, 0, 5, 4, 4, -2, -4, -5, 0, -3, 1, -4, 1, 0, -2, -1, 3, -5, 2, 3, 3, -2, 3, -4, 4, 3, 3, 2, 4, -2, 3, -2, -2, 4, 1, 5, 2, 1, 1, 5, 1, -4, 1, -5, 4, 4, -1, 3, -2, 2, -4, 2, -2, 3, 4, 5, 0, 2, 0, 3, -3, 0, 4, -1, 4, -2, -3, 1, 5, 4, 1, 6, -4, -1, -2, -2, 2, 3, -2, -1, 4, 2, 1, 2, 0, 1, -2, 6, -4, 0, -3, -3, -4, 5, 4, 4, 5, -3, -4, 0, -4, -2, -4, 1, -2, -4, -4, 3, 3, 2, -3, 4, 4, -1, 2, -2, 5, 3, 3, 0, -2, -1, 4, 1, -3, -2, -1, 4, -5, -1, -4, 4, 4, -4, -2, 4, -4, 2, -1, 4, -1, -1, 0, 3, -4, 5, -3, -2, -4, -4, -1, 3, -3, 0, 2, -2, 0, -1, -4, -3, -3, 5, -1, 4, -4, -4, -4, 4, -5, -3, -4, -2, -2, 5, 4, 6, 5, 0, -1, 1, 1, 1, -4, 0, -4, 4, -4, 3, 1, 3, -2, -4, 3, -4, -5, 1, 3, 4, 3, 2, -4, 0, 3, 1, 0, 2, -3, -1, -2, 4, 5, 4, -2, -4, -1, 5, 6, -2, 0, -3, 0, -4, -3, -4, 0, -1, 0, 3, 3, 5, 2, -3, 4, 2, 2, -1, -4, 2, 3, 6, 4, -1, 5, -5, -5, 0, 3, 2, -2, -2, 1, 4, -1, -3, -3, 1, 4, 0, 5, 5, 5, -4, -2, 4, -5, -4, 3, -3, -2, -4, 2, 4, 1, 5, -1, -4, 6, 3, 5, -2, -2, -4, -3, -2, 0, 1, -2, -5, 3, 2, -1, 5, -4, 4, 0, -4, 5, -4, -2, 4, -1, 3, -1, -2, 3, 4, 5, -1, -4, 3, -3, -3, 0, 3, 0, -5, 6, 3, -1, 5, 1, -1, 4, 1, 2, -1, -4, 4, 5, 2, 0, 2, -4, 5, -1, -1, 5, 1, -4, 1, 4, -3, 4, 0, -4, -1, -2, 3, 5, 5, 5, -2, 0, -5, -3, 5, -2, 5, -1, 0, -2, -4, 0, 6, -5, -3, 0, -1, 2, 6, 4, 1, -2, 2, -4, -4, 3, -4, 5, 0, 3, 5, -3, -4, 1, 5, 3, -1, -4, -4, -5, -2, -2, 4, -5, -4, 2, 4, 3, -2, -1, 3, -2, -4, 1, 1, 1, 3, 0, 3, -2, -1, 5, -5, 1, 1, -2, 2, -3, -2, -4, -2, -2, -3, -1, 4, 5, 0, -1, -2, -2, 3, 5, -4, 4, 3, 4, -1, -1, 4, 5, -3, -1, 6, 5, 6, 0, 4, -2, -1, -4, 1, 0, 4, 2, 1, -4, 1, 5, -2, 2, 6, 5, -5, 0, 5, -4, -4, 2, 0, 1, 6, 1, -5, -2, -2, -4, -1, -4, -2, 3, 3, 4, -4, 0, -3, 6, 2, 6, -4, -3, 0, 2, 1, -4, -3, 5, 4, -5, -2, 4, 2, 1, 2, 1, 5, -4, 4, 0, -2, 3, -4, 5, -2, -1, -5, 5, 0, -1, -2, -4, 3, 2, 1, 2, 6, -3, -1, 4, 3, 1, 5, 3, 4, -4, 2, -3, 0, -3, 0, 4, 1, 5, -3, -4, 5, 1, -2, -1, -2, 4, -4, -2, 4, -4, 4, 1, -2, 4, -4, 3, 0, 0, 0, 3, -4, 5, 6, -2, 0, 1, 1, 5, -3, 6, 5, -3, -2, -1, -3, -2, -3, -5, 1, 0, 4, -2, -1, 5, 4, 1, -4, 0, 0, -1, 4, -2, -3, 4, 5, -5, 2, 2, -3, 1, 0, 1, -1, 3, 0, -2, 4, 0, 4, 1, -5, -3, -2, -4, -3, 0, 0, 2, 1, 4, 4, -4, -3, -1, 2, -5, -1, 3, -2, -3, 4, 3, -1, -4, -3, 1, 0, 3, 5, -4, -2, 1, -3, -1, 4, -2, -2, 5, -1, -1, 2, -4, -5, 4, 3, 1, 3, -4, 3, 5, -5, 1, 4, 2, 1, 0, -2, 5, 4, -3, 5, 5, 5, -2, -3, 5, 3, 2, -4, 3, -2, 0, 3, 0, 3, 0, 6, -4, -2, -2, 0, -3, 1, 5, 5, -2, 1, -2, -1, -5, 1, 2, 2, -4, 0, 4, 2, 4, -1, -1, 2, 5, 4, 3, -2, -1, -2, 5, -4, 4, 4, 2, -4, 3, 4, 5, -5, 4, -3, -4, -5, -4, 3, 1, 4, 2, 0, -2, -1, -1, -1, -1, 1, 1, 6, 0, 2, 4, 4, 0, 4, 5, 4, -1, -4, 1, -1, -4, -2, 3, 3, 2, 3, -1, 4, 5, -1, 5, 0, 5, 3, 4, -5, 1, -3, -4, 0, 1, -3, 1, 6, -1, -5, 1, -1, 0, 0, 0, 2, 2, -5, -5, 4, -4, -3, 5, -4, -3, 1, 5, -3, -3, -4, -5, -5, 5, 0, -1, 4, -1, 4, 5, -4, -5, 3, 0, 5, 1, 1, -1, 5, 3, 5, -1, 1, -2, -4, -2, -3, -4, 1, 0, -1, 5, -5, -3, 4, 2, -4, 2, -4, 0, 1, 4, 3, 0, -1, -1, 0, 3, 2, 5, 0, 4, -1, 5, -3, 1, 0, 4, 4, 5, -2, -3, 0, 2, -3, 5, 0, -2, 2, -1, -2, 3, 2, 1, 1, 4, -1, 4, 4, 0, -1, 5, -1, -1, 0, 1, 0, 5, 1, -1, 3, 6, 0, -4, -4, 0, -4, 4, 1, -4, -3, 1, -2, 2, 6, -3, 0, 5, 2, -1, -2, 6, 5, -1, -4, -1, 0, 6, 3, -1, -2, 1, 4, -1, -5, 1, -2, -1, -5, -3, -3, 4, 4, -2, 0, 1, 3, -3, 0, -2, 1, -4, 1, 3, -2, 2, -2, 5, 4, 2, 0, 3, 5, -2, 4, -3, -2, 6, 5, 0, 2, 0, 0, 3, 5, 1, 5, -3, 3, 5, 0, 1, 5, 3, 5, 2, -3, 4, 3, -4, -3, -1, 1, -4, -1, 5, -1, 3, 0, 0, -3, -2, -1, -1, -4, 5, 4, 0, -2, 5, 3, 1, -5, 1, 2, 4, 1, 1, -4, 2, -2, -4, -1, 1, 5, 3, 3, -5, -5, 0, 1, 2, -2, -2, -4, 1, -1, 5, 6, -2, 4, 0, -4, 4, -1, 5, 3, -2, 3, -2, 1, 5, 0, -1, 0, 1, 4, -1, 4, 0, 2, 5, 2, 0, -2, -2, 2, 5, 0, -2, 4, -3, 3, 4, -2, -1, 1, -2, -1, 0, -4, 1, -1, -3, 1, -2, 1, -1, 1, 0, 0, 5, -5, 5, 6, -1, -3, 4, 2, 0, -3, -4, -4, 0, -3, 5, 4, -3, 0, -1, 1, -3, -1, 3, 5, 1, 5, -2, 2, -2, -2, 3, 0, 0, 1, 2, 4, 3, 2, -2, 0, 5, 5, 4, -1, 5, -2, 1, -1, 5, 1, 6, 6, -3, 1, -2, -2, -3, -1, -4, -2, -4, -2, 3, 2, 4, -4, -2, -1, 0, 5, -4, 5, 2, -4, -4, 4, -2, -2, 3, 5, 1, 4, 0, -4, -4, -4, -3, 4, 0, 4, 0, -2, 4, 5, 3, 6, -1, 1, 5, -4, -4, 2, 3, 3, 3, 4, -4, 5, 2, 3, -3, 5, -4, -3, 4, -3, -2, -1, 5, -4, 3, 2, 2, -1, 2, 3, 1, 1, 1, 5, 3, 0, -1, -4, -4, 2, 2, -1, -2, -3, 0, 5, 6, -2, 4, -2, 2, -4, 4, -2, 3, 4, -2, 4, -5, -4, -1, 5, 4, 1, 4, 4, -3, 2, 4, -3, 2, -1, -2, 4, -1, 5, 4, 0, 5, 2, 0, 0, 4, 5, -3, 0, 2, -1, 3, 4, -3, 3, 3, -2, 2, -2, -1, 0, -3, -1, 6, -4, 3, 3, -3, -1, 3, 5, -4, -3, -3, -2, 5, 1, -5, 4, 4, -1, 2, 0, -2, 1, 0, 3, 5, -1, 0, 4, 5, 5, -4, 5, -4, 4, 1, 0, 2, -4, -4, 2, 0, 0, -2, 1, 1, 2, 0, 4, -2, 5, 5, -2, -3, 3, -2, 2, -1, -5, 0, -3, 1, -4, 1, 4, -3, 1, 1, 4, -3, 4, 2, -3, 5, -3, -4, 0, -2, 2, 5, -1, 4, 4, 3, -3, -2, 2, -3, 5, 4, 4, 1, -4, -3, -4, 5, 0, -3, 0, 4, 5, 3, 1, 0, 0, -5, 3, -3, 1, 3, -4, 5, -2, 1, -1, -1, 0, 0, 6, 2, 2, 1, -1, 5, 3, 4, 3, -1, 5, -2, 0, 1, 0, -2, 5, 1, 1, -1, -3, -3, 4, -4, -1, 5, 2, 3, 1, 0, 4, -5, -2, 5, -1, -2, -4, 2, -1, 5, 6, -5, 2, 1, -3, -2, 2, 4, 1, -2, 0, 1, -2, 2, 4, -2, 2, -3, -2, 2, 1, -1, -3, 4, 2, -1, 2, -4, -4, 4, -2, 1, 2, 3, 1, 5, 6, 5, -2, -4, 5, 1, 0, -3, -3, -2, -2, 1, 2, 0, 6, 0, 3, 2, 6, -5, 5, 5, -3, 0, 5, 3, -2, 0, 1, -3, 5, 0, 0, 2, 2, 3, 0, -2, 3, -2, -4, 5, 0, -3, -4, 2, -2, 5, -1, 3, -2, 3, -4, 4, -4, 5, -1, -2, 0, 1, 3, 0, 2, 1, 0, 0, 3, 2, -1, -1, 5, -5, 4, -4, 5, 0, 2, 0, 5, -1, -5, -3, 1, 4, 0, 0, 0, 0, 1, -4, 4, -3, -2, 0, 4, 1, -4, -1, 5, 5, 4, -4, -1, 2, -3, 6, 3, -3, 1, 1, 4, -1, -2, 2, 3, 4, -5, 2, -1, -4, 5, 1, 5, 3, 1, 0, 2, -1, 3, 0, -5, -4, 4, 5, -5, 0, -1, -3, 3, -2, 4, -3, -2, 2, -4, 1, 4, 5, -4, -2, 2, 4, 2, 0, 4, 2, 3, -4, 2, -1, 2, 5, -5, 1, 4, -3, -4, 1, 5, 5, 0, -3, 2, -3, -3, -3, 3, -3, -1, -4, 4, 5, -1, -1, 1, -3, 5, 5, 6, -1, -4, 0, 0, 1, -1, 6, 4, 5, 2, -3, -2, 1, 5, -1, 2, -2, -4, 5, 3, 5, -2, 2, 3, 0, -3, 1, 2, 2, 2, -3, -3, -4, -3, -4, 0, -3, 3, 3, 0, 3, 0, 5, 3, -1, 5, 4, 1, 0, 2, 2, -4, -2, 1, -3, -2, 1, -2, -4, 1, -3, -4, 5, 4, 5, -5, -1, 4, -4, 2, 5, -1, -4, 5, 5, 1, 0, 4, 1, -2, 4, -2, -2, 3, -4, -1, 2, -4, 4, 3, 1, -2, 1, -4, -1, 3, 6, -2, 6, -3, 0, -4, 2, 3, 5, -3, 5, -3, 0, 2, 2, 5, 3, 1, 4, 5, 1, -2, 5, -4, 6, 1, -1, 0, 5, 5, 0, 4, 5, 0, -3, 3, 5, 3, -4, -1, 3, 6, 3, 3, 3, 2, 4, 0, 2, 6, 4, 3, -1, 4, 5, 3, 4, 3, 1, 3, -3, 3, 4, -3, 6, 4, 4, -4, -2, -4, 0, 0, 3, -1, -5, -2, 3, 1, 5, -3, 3, -4, -5, 5, 2, 5, -3, -5, 5, 0, 2, 3, 3, -3, 3, -3, 5, 4, -3, -1, -1, 2, 3, -5, 3, 0, -3, 5, 5, -4, -1, 2, 3, 1, -5, 5, -5, 6, 3, -1, 0, 4, 1, 3, -4, 1, -3, 5, -4, 1, -2, -4, -3, -1, -1, -4, -3, -1, 5, -4, 2, 4, 0, -3, 2, 2, 1, 4, 4, 5, -2, -1, -3, 5, 6, 3, 0, 3, 4, 3, 2, -2, 2, 2, 0, -4, 4, 3, -2, -3, 2, -2, -4, -5, -1, 2, -3, -3, 2, 5, -2, 5, -3, -1, -3, 1, 2, 2, 4, 4, 1, 2, -2, 4, -2, -3, 5, 1, 1, 1, -2, 0, 4, -2, 2, 1, -5, -2, -1, 1, -4, -5, 0, -1, 0, -2, -2, 5, -1, -4, -4, 0, 1, 3, -1, 2, 6, 5, 1, 0, -1, -3, -1, -3, 2, -1, -2, -2, 3, -4, -3, 5, -2, 5, 3, -1, 5, 1, -4, 4, 2, 1, -2, 1, 2, 4, -5, 1, -1, -2, -4, 1, 0, -3, -3, -2, -4, -4, 2, -3, 5, 6, -3, -1, -4, 0, -4, -2, 0, 1, -2, -4, 3, 1, 3, 6, 2, 2, 0, -2, 3, 5, -4, 0, -3, -4, -2, 0, 0, 5, -1, -3, 5, 6, 0, -1, -2, 5, 5, -4, -2, -1, 3, -3, 3, -5, 1, -2, -4, 3, -2, 3, 1, -3, 2, 5, 4, -2, -1, -4, 0, 0, -2, -2, 2, 5, 0, 0, 2, 4, 3, -4, -2, -4, -3, -1, 4, -3, 6, -1, -3, 1, -3, 1, -3, -2, 1, -1, -2, -4, 2, -4, 0, -2, -2, 4, -1, -3, 6, -5, -3, 4, -4, -1, 2, 5, 2, 6, 0, -5, 5, 2, 5, -1, 4, -4, -3, -1, 2, 5, -5, -3, -1, 3, 2, 3, 3, -1, -3, 0, 0, -2, -3, -4, 6, 4, 4, 4, 5, 2, 5, 4, 5, 5, -4, -1, 1, 2, 3, 3, -5, -2, 1, 6, 3, 2, 0, 4, -5, 4, -1, -5, -3, 1, 1, 2, -5, -2, -3, 2, -4, -1, 1, -3, 5, 5, -3, 1, -4, 0, 1, -1, 5, 3, -2, -3, 4, 3, 6, 5, 1, 2, 0, -4, -2, 3, 4, -2, -4, 1, 0, -1, 1, -1, 0, -1, 3, 0, 2, -4, -4, -1, 3, 2, 5, 3, -2, 5, -1, 2, -3, 5, 4, -5, 3, -4, 2, 3, 5, 5, -3, -2, 3, -3, 4, -4, -1, -3, -1, -4, 3, 5, -1, -3, -1, -2, -5, 2, -4, 2, 5, 5, 0, 0, 3, 0, -2, 3, 4, -2, 2, -1, -1, -2, -3, -3, 1, 5, 4, 4, -1, 0, 2, 1, 4, 5, 4, 4, -4, 2, 5, 3, 1, 4, 0, -2, -4, 6, -4, -1, -1, 3, 1, -2, 6, 6, -3, -3, 3, 2, 2, -5, -3, 5, -1, -2, 0, 2, -3, 1, -3, 3, 4, 4, 6, -3, 1, 3, 1, 4, -2, -1, 1, 3, 0, 5, -3, 2, 3, -5, 1, 5, -4, 5, 3, 5, 3, 3, 0, -3, -3, 3, 1, 4, -1, 6, 1, 2, 0, -4, 0, 5, -3, 2, 1, 3, -2, 2, 0, -2, -1, -1, 3, -2, 1, -2, 2, 2, -5, 0, -2, -1, -3, 2, 2, 5, -4, -3, -1, 4, 0, -1, -3, 1, -2, 1, -4, 4, -3, -2, 3, 1, 0, 5, 5, -3, 2, 3, -4, 1, 5, -2, 4, 4, -4, 1, -4, -4, -5, 4, 4, 3, -1, 5, -5, 2, 3, -1, 1, -2, -3, 1, -3, 4, 5, 3, 1, -1, 2, -3, -2, 4, 3, 0, 3, -3, 0, 0, -2, 4, 0, 6, 2, 3, 4, -4, 5, -2, -1, -3, 4, -4, -4, 4, -1, 2, -4, 4, 4, 2, -4, 0, 5, 2, 2, 3, -4, -4, 2, -5, -3, 5, 4, -1, 0, 6, 1, -4, -4, -1, 2, -1, -3, 1, 2, -3, -1, -3, -4, 3, -2, 2, 5, -2, 0, -4, -1, -2, 1, 2, -1, -1, -3, 4, 2, 6, -3, 5, 5, -4, 3, 2, 2, -2, 0, 4, 3, 2, 3, 3, -3, -2, 1, -3, -5, 0, -1, 4, 0, 6, 5, 1, 4, -4, 3, -3, 5, -2, 1, -4, -1, -5, -4, 4, -2, -1, -3, -3, -1, 0, 1, 4, 3, 3, 0, -5, 5, -2, 3, 6, 0, -2, 5, 1, 1, -3, -4, -1, -2, -3, -5, 0, -2, 1, 6, 2, -3, 3, -1, 4, 5, 3, 1, -2, 5, 1, 2, 0, 4, 0, 3, -2, -2, 0, -1, 4, 1, -1, -5, 4, -1, -4, -4, 2, 5, -1, 0, -4, 3, 6, -3, -1, 2, 2, 1, 4, 2, 0, 5, -5, 2, -4, 5, -3, 3, 1, 3, 2, -3, 4, -2, 5, -5, 1, -2, -5, -3, 2, 4, -4, 0, 0, -4, 5, -1, -4, 0, 3, 4, -5, -3, 6, 3, -2, -5, 0, 0, 4, 4, -3, -2, 3, -2, -5, 5, 5, -1, -3, -3, -3, 1, -1, -1, 2, 0, -1, -4, -4, -3, 5, -1, 4, -3, -4, -4, -3, 0, -2, 5, 5, -3, -1, 3, 3, 3, -1, 3, 0, -2, -1, -1, -1, 1, 1, -3, 2, -5, -1, -4, 1, 4, 1, -4, 5, -4, 3, 6, 5, 6, 4, 4, -2, -4, -3, 3, 0, 3, 2, 4, -4, -1, -4, -2, -3, 1, 5, -3, 0, -3, -1, 3, -4, 3, -3, -4, -2, 0, 1, 0, 2, 6, 1, -2, 3, 3, -4, 5, 5, 2, 5, -3, 1, 0, -5, -3, 5, 3, 3, 5, 6, -3, -4, 2, -1, -3, 4, 2, -5, -1, 1, -2, -4, 2, -4, -4, 5, -3, 0, -4, 2, 1, 5, -1, 2, 4, 4, -3, -3, 5, -1, -4, 4, 5, 4, 5, -1, 0, 2, -2, 5, 2, 5, 4, 1, 2, 4, 2, 4, 4, 2, 5, -3, 5, -2, -4, 4, 3, -3, 0, 6, 2, 1, -2, -4, -1, -3, -2, -5, -1, -3, 2, 5, 4, 0, -1, -4, -1, 3, 5, 2, -1, 3, -2, -5, 2, 3, 4, -1, 6, 5, -4, 4, -3, 3, 0, -3, 0, -5, -1, 3, 3, 4, 4, 4, 4, 4, -2, 2, -1, 4, 2, 5, 2, 5, 2, 2, 5, 5, -2, 2, 5, -2, -4, -4, 3, 1, 4, 2, -3, 2, 2, -4, -3, -2, -5, 5, -1, -4, 3, 5, -3, -4, -1, 5, 1, 4, 4, 1, -2, 0, 5, 5, 4, 1, 4, 4, 6, 3, -4, 3, 0, -4, -3, -4, 3, -4, 1, 2, 5, 3, 1, 1, -4, 4, 5, -1, 2, 3, 2, -4, 4, 4, 2, 5, -4, -2, 0, -5, 5, 1, 2, -3, 5, 3, -1, -2, -3, 3, -2, 4, -3, 2, 0, 3, -3, -2, -4, 0, -1, 0, -4, 3, 5, 5, 2, 3, 0, -1, 4, -2, 0, -4, -5, 4, -3, -4, 3, -3, 6, -4, 5, 5, 0, 2, -4, 4, 2, 4, -1, 4, 2, -2, 1, 0, 5, 1, 4, 2, 6, -4, -4, 1, -2, 4, 4, -2, 1, -1, -2, 3, -4, 0, -4, -3, 0, 6, -3, -1, 0, -3, -3, 5, 6, 5, 4, 1, -3, 6, -5, 0, 1, -3, 4, 1, -4, -3, -1, -3, 0, 3, 5, -4, -2, 3, 5, 2, 0, 0, -2, -3, 4, -4, 1, 2, -1, 1, 1, -3, -5, 2, -2, -4, -1, -3, 3, 0, 1, 3, -1, 2, 5, -5, 0, 1, -4, -2, -2, -4, 6, 0, -4, -5, -3, 1, 4, 2, 3, 5, 0, -5, -2, 5, -1, 0, 1, 1, 0, -1, -1, 5, 3, 3, 3, -4, 4, 5, -3, 0, -3, 3, 1, -3, -3, -4, 0, 4, -2, 0, -4, 1, 2, 0, 5, 5, -1, 4, 3, 4, 3, 5, 2, -3, 0, 5, 0, 5, 3, 0, 4, -3, 4, -4, 5, 3, 2, -4, 2, 4, 4, -3, -4, 2, 4, 1, 3, 3, -1, 1, 3, -1, 5, -3, -4, -2, -2, 5, 0, 2, 4, 2, 4, 2, 5, 0, -1, 6, -4, 4, 0, -4, -4, -5, 1, 2, 4, 0, 5, 3, -1, 1, 5, 3, 2, -4, 1, 2, 0, 3, 1, -3, 1, 4, -3, 3, 3, -3, 1, 1, -4, 4, 5, 6, -4, -3, -5, 4, 5, -2, 4, -4, 1, 6, -2, 2, -3, 6, -1, 0, -1, 0, -3, 1, 5, 0, 1, -3, -2, 2, 0, 3, 2, 3, 3, 6, 2, 6, 2, -1, 1, -3, 3, -3, -3, 2, -1, -3, -2, 2, 5, 5, -4, 0, 5, -1, 5, 3, 2, 0, -3, 6, 5, 1, 0, 4, -2, -2, -1, 4, 3, -1, -1, 3, -2, 5, -4, -4, -2, 4, 2, 6, 1, 3, 2, 2, 0, -3, -3, 4, 4, -4, 1, -1, 4, 3, 5, 6, 3, 0, 3, 4, -3, -3, -2, -3, 2, 1, 5, 5, -2, 6, 2, 4, -1, 0, 4, -2, 0, 1, -4, 4, 3, -3, -4, 5, -2, 3, -3, -1, 1, -3, -3, -4, 1, 5, 4, 3, -4, 1, -3, -1, 6, 0, -2, 2, -3, 5, 4, 4, 0, -3, -2, 5, 0, -1, 1, -1, -2, 0, -3, 0, 5, -3, -1, 2, 3, -2, -4, 5, 3, 4, -3, 0, -5, -1, -3, -1, 2, 3, -4, 0, -1, -2, -3, 1, 0, 2, -2, 2, 3, 3, 2, -1, 1, 3, 5, -4, 3, -4, 5, -3, 2, -3, 4, 3, 2, -4, 4, 5, 5, 4, 4, -4, -2, 0, -4, 4, -4, 4, -3, -3, -3, -3, 3, -3, -2, 5, -4, 1, 0, 3, 5, 2, 3, -4, -4, -3, -4, 1, 0, 5, 0, 6, 1, 5, 0, -2, -5, 3, -4, 6, 2, 5, -4, 1, -2, -4, -1, -3, 3, 1, 4, 5, 4, -3, -4, -3, -3, 1, -2, -3, 4, -1, 5, -3, -1, -3, 3, 2, 4, -1, -1, -2, -3, 5, 1, 2, 5, 2, 3, 1, 1, 2, -4, 3, 5, -4, 1, -2, -3, -4, 0, 4, -4, -1, 4, 1, 1, 1, 3, 1, -1, 4, -4, 5, 4, 2, 3, 1, -3, -5, -3, -4, -1, -1, 3, 5, 4, -4, 5, -5, -5, 6, 3, -4, 2, 4, -3, 4, 3, 2, 5, 3, -5, -4, 0, -3, -1, -1, -3, 1, -1, 2, -2, 0, 3, 6, -1, 4, 4, 2, 1, -1, 0, 2, 1, 1, 5, 1, 2, 0, 5, -2, -1, 1, -1, -3, -4, 2, 2, -1, 3, -4, 3, -1, -3, -2, -3, 3, -2, 1, -3, -5, 2, 3, 0, 2, 0, 0, 1, 6, -3, 3, -2, 4, 2, 5, 2, 1, 5, 5, -4, 1, -3, -3, 5, -4, 2, 0, -4, 0, -2, 2, 1, -1, 1, -4, 0, -5, -3, -3, 2, -1, 2, -3, -1, -2, -2, 2, -2, 1, 1, 2, 4, 5, -1, -3, 3, 5, -3, -4, 0, 2, 0, 1, -2, -4, -5, 5, 5, -3, 3, -4, -5, -4, -3, -2, -1, 0, 4, 3, 5, 3, -3, 2, 2, 0, 1, 2, 3, 5, 2, 5, 2, 3, -3, 5, 3, 0, -4, 3, -4, -4, 3, 3, -1, 2, 1, 2, -3, -3, 0, 0, 0, -2, -3, 3, -4, -2, 3, 1, 0, 5, -2, 5, 3, 2, -2, -2, -1, 3, 4, -4, 0, 4, 2, 4, 1, 3, 0, -3, -2, 5, 2, -4, -2, 4, 1, 5, 5, -3, -3, 1, -3, -2, 2, 5, 4, -4, 0, 0, 5, 5, 1, -1, 4, -3, 2, -1, -1, 1, -3, 2, -2, -3, -2, -3, -4, -1, 3, 4, 0, 2, 4, -2, 3, -4, 3, 5, 5, -1, 4, -2, -1, 1, 5, 0, 1, 6, -2, -2, -1, -2, 4, 5, 2, 1, -4, 2, -2, -4, -1, -1, 5, -2, -1, -1, -4, 3, 4, 3, -2, 3, -1, 1, -3, 4, -2, -2, -3, -3, -2, 2, 4, 4, 0, 4, 5, 4, 5, 4, -3, 3, 4, 2, 4, 3, 0, 5, 5, -1, 1, -4, -2, 1, 0, 0, -2, 0, 0, 0, -3, -4, 5, -4, -4, 5, -3, -2, -2, -3, 0, 4, 1, -1, -4, 5, 2, 4, 3, -1, 3, -1, -3, 5, -2, 3, -2, -5, -1, -3, 2, 5, -1, -1, 5, -4, 0, 0, -4, -4, 3, -2, 4, -3, 3, -3, 3, 6, -2, 4, -3, 4, -5, -5, -4, -2, -3, 5, -2, -1, -2, -2, -5, -4, -4, -2, -3, 4, 0, 3, 4, 1, 3, 2, -2, 1, 1, -2, 5, 2, 3, 5, 0, 1, -1, 1, 1, -1, 3, -3, 4, 2, 1, 1, -3, 4, 1, 3, 1, -2, 5, -4, 3, 2, -4, 1, -3, -4, -5, 1, -3, -1, 5, -1, 2, 4, -4, -2, -4, 0, -2, 2, -1, 1, 1, -3, 5, 5, 3, 3, -4, 4, -5, -3, 3, 3, -2, 0, 0, -2, -1, -2, 4, 5, -4, 4, 3, -3, 2, 3, 1, 1, 6, -2, -2, -2, 3, 2, 4, 3, 1, -1, -3, -2, -4, 1, 0, 0, -4, 1, 3, 0, 4, 0, 0, -2, 2, 4, -1, 2, 1, 2, -2, 5, 4, 5, 2, 3, 2, 0, -1, -1, 2, 5, -2, -2, -1, -1, -4, 5, 4, -3, -1, 4, 6, -5, 1, -4, 5, 2, -1, 1, -4, 1, 5, 6, 3, 1, 5, -4, -1, 4, -2, 3, -3, -2, -3, -4, 1, -2, -3, 3, 4, 0, 1, -1, -2, -1, 5, 3, -1, -5, 0, -2, -2, 4, -1, -3, -2, -3, -2, 4, 3, 1, 1, -4, 2, -2, 2, 1, -3, 4, 0, 1, -1, 4, -4, 1, 4, -2, 2, 0, -3, 5, -1, 3, 6, 1, 1, 3, 6, 4, 5, -3, 1, 2, 1, 0, 1, 0, -3, 0, -4, 4, 0, -1, -2, -1, 3, 1, 4, -2, -2, 3, -4, 4, 3, -2, 1, -5, 4, 0, -3, -4, -2, 4, 4, 5, 4, 3, 2, 4, 5, 3, -2, 0, 5, -1, 0, -2, -2, 0, -2, -2, 4, 2, 0, 5, -1, -3, 0, 5, 1, -5, 2, 4, -1, 5, 0, 3, -2, 6, 3, -4, -3, 5, -4, 4, -4, -2, -1, 1, -4, 2, 4, 4, 0, -2, -1, -2, 0, 0, 0, 3, 5, 6, 2, 4, -4, 0, 3, -4, -4, -3, -1, -4, 2, 4, -1, 4, -1, 4, -4, -2, 2, 4, -5, -5, 2, 2, 5, -2, 3, 0, -4, -1, -1, 5, -2, 2, -3, -1, 5, -4, 1, 2, -3, 3, -5, 6, 2, 3, 4, 4, -3, 0, 2, -4, -1, 2, 5, -3, 1, -2, -1, -4, 4, -1, 4, 2, 4, -3, -3, 6, 5, 2, -3, 3, 1, -2, 6, 5, 6, -2, -1, 1, -3, -1, 1, -1, -2, 4, -5, 2, -3, 5, -1, -1, 3, 1, 0, -1, -1, -1, 2, 5, 3, 1, 5, 6, 2, -3, -1, -2, 5, -3, 6, 5, 4, -1, 1, -1, 4, -4, 5, -2, 5, -3, -4, 4, 2, 0, 0, 2, 3, 2, 5, -5, 6, 4, -4, 1, -1, 0, 2, -2, 5, 5, 2, 0, 5, 5, -3, -3, -1, 3, 2, 0, 5, 5, 5, -1, -3, -2, -4, -4, 1, 2, 3, -4, 5, -1, -2, -2, -4, 5, -5, -4, 2, 3, 4, -3, 5, 2, -3, -4, 1, -2, 3, -2, 4, -3, -4, 4, 0, 4, -4, 0, -1, -4, 2, -3, 1, 2, -4, 5, 4, -3, 3, -2, -3, -1, 0, -5, 6, 5, 6, -4, -1, -2, -3, 6, -4, -1, 4, 5, 4, 1, 5, 1, -1, 2, 3, 0, -1, -1, -4, 6, 1, 2, -1, -4, 5, -4, -3, 0, -4, -4, -2, 1, -2, -4, 6, 3, 0, -3, 2, -2, 5, 2, 5, 0, 5, -2, 6, -2, 2, -1, 5, -4, 1, -1, -1, 2, 3, -4, 1, 0, 1, 3, -3, 5, 2, -1, -4, -4, -3, 3, 2, -2, 1, -2, 3, -3, 3, -3, -4, -3, -2, -4, -3, -5, -2, -3, -3, 3, -4, -4, 2, 0, 5, 4, 6, -3, 1, 6, -3, 4, 3, 4, 2, -4, 5, 1, 5, 5, -3, -4, -5, 2, 0, -5, 0, -4, -4, 3, -4, -4, -1, 5, -2, -3, 4, -4, -2, 2, 6, 5, -3, -3, -4, -4, -1, -1, 4, 0, 6, 5, 1, 5, 0, -4, 5, -4, 4, 5, -2, 0, -5, 3, 1, -4, -1, 0, 4, 1, -2, 2, 3, 5, -1, -2, -1, 2, -2, 5, -5, 3, -2, -2, -3, 4, 1, -3, -1, 5, -4, -4, 1, -3, 4, 1, -4, -4, 2, 4, 5, -4, -4, -4, 5, 4, 1, -2, -2, -3, -2, 0, 3, -3, -2, 0, -1, 5, 2, -4, -4, 3, -3, -1, 0, 1, 6, 6, 6, -2, 1, 2, 3, 5, 2, 0, -1, 4, 5, 4, -3, 2, -2, 6, -3, 2, -1, -3, -4, -2, 4, 2, 4, 5, 0, -1, -2, -3, 4, -1, 4, 5, 0, 6, 0, 2, 4, -1, 1, 3, -5, -4, -1, 5, -3, -4, 4, 3, -2, -5, -2, 1, 0, 2, 4, -3, -1, -3, 3, -4, 0, 4, 1, 2, 5, 2, 5, 1, 3, 4, -3, 2, 4, -1, -4, -4, 2, 1, -3, 1, 5, -3, -4, 1, -3, 2, -1, 1, -2, -1, 2, 3, -2, -3, -3, 2, 3, -2, -2, 4, 3, -3, 0, -3, 2, 3, 5, -2, 4, 5, -1, 5, -3, 6, 0, 5, -5, -4, 0, 2, 4, 0, 4, -1, -4, -4, 3, 6, 0, -4, 5, 4, -3, 0, -2, 0, -2, -4, 5, 6, 2, 0, -2, -4, 4, 1, 1, 1, -1, -1, 5, 6, 5, 2, 0, 2, 2, 1, 0, 0, -3, -3, 0, 4, 5, 5, 6, 1, 3, 2, 4, 0, 5, -4, -3, -1, -3, 1, 5, 4, 2, -3, 0, -5, -4, -2, 1, -4, 4, 6, -4, -1, -3, -1, 3, -2, 5, 1, -4, 5, -1, 0, 0, -3, -3, 0, -3, 0, -1, -4, -3, 2, 6, 5, 1, -5, 2, -3, -4, -3, 4, 0, 3, 4, -3, -3, -4, 5, 2, 2, -2, 1, -2, -3, 0, 0, 6, -3, 3, -1, 1, 6, 1, 2, 1, 4, 0, -4, 3, 0, 4, -4, -1, -4, 4, 3, -4, 1, 5, 6, 5, -2, 3, 3, -3, -2, 0, 3, 4, 0, 2, -5, -1, 2, 2, 1, 0, 3, 0, -4, 6, 2, 2, -5, -4, 5, -3, -5, -1, 2, 4, 1, 0, 5, 0, 3, -2, -3, 1, 2, 1, 2, -4, -4, 5, 5, 1, -1, 5, 2, 2, 2, -4, -5, -1, 4, 5, 1, 4, 0, 5, -5, 2, 1, -5, 2, 0, -1, -3, -3, -4, 3, -3, 0, -2, -1, 1, -2, 3, -4, -2, 1, -2, -4, 3, -1, -3, -2, -4, 1, -1, 0, 4, -4, 4, 1, -1, 4, 4, 0, 3, 0, -4, -3, 5, -5, 5, -3, 1, 0, 6, 1, 4, 3, 4, -1, 3, 3, 1, 0, -2, 5, -4, 0, 0, -2, 3, -2, 2, 1, 2, 3, 3, 3, 4, 1, 3, 0, -1, -4, -1, 2, 5, -3, 0, -4, -3, 4, 3, -2, 5, -3, 6, 1, 4, -4, 3, -4, 5, -1, 5, 2, 3, -1, -2, 5, 1, -5, 2, -2, 4, 3, -5, 2, 2, 4, -3, -2, 2, 5, 0, -4, -5, 2, 0, 2, -1, 0, 5, -1, -1, 1, -4, 6, 4, -3, -4, 1, 4, 1, -5, 4, 0, 0, 2, 0, -1, 2, -3, 2, 3, 2, 2, -1, 1, -3, 4, 0, -1, -2, 4, 1, -1, 0, -3, 3, -4, -3, 0, 2, 3, -1, 2, -1, 4, -3, -4, -3, 1, 0, 5, -3, -4, -2, 2, 4, 2, 1, 2, 3, 5, -2, -4, 1, 3, -3, 5, -1, 3, 4, 5, -3, 4, -3, -4, 0, 4, 3, -5, 3, 1, 0, 0, 3, 2, -1, 1, -2, -3, 2, 0, -1, 1, 4, 2, 2, 1, -4, 2, 4, 5, -5, -2, 2, -1, -4, 1, -2, -1, -2, 2, -4, 2, 3, -3, -1, 1, 3, 1, -2, 3, -2, -2, -3, -4, -3, -2, 1, 5, -3, 1, -1, 3, 4, -1, 0, 2, 2, 0, -2, 0, 4, 1, 3, -1, 2, 1, 3, 0, 2, -4, 2, 5, -1, 5, 3, 3, 6, -4, 2, 6, -4, -1, -4, 5, -3, 4, 3, 3, -1, 5, -3, 4, -2, -3, 1, 1, 2, 1, -2, 0, 4, -5, -5, 5, -3, 2, 3, 5, 1, -2, 5, 6, 0, 3, -4, 6, -2, 2, -2, -3, 0, 0, -1, 5, 6, 2, -4, 5, -1, -2, 6, -1, -3, 1, -1, -3, -2, 5, -1, 1, -3, -3, -5, 3, 2, -1, 4, 0, 2, 4, 1, 2, -3, -1, 2, 0, -1, -4, 3, 4, -4, 6, 5, 0, -1, 5, 3, -2, -4, 3, -2, 0, 2, -3, -1, -2, -4, 0, 1, 4, -3, 3, -1, -2, 2, -3, 2, 5, -2, 6, 0, 6, 0, -1, -2, -3, 4, -1, -3, -3, 3, 0, 6, 4, 4, 2, 4, -5, 0, -4, -1, -2, 6, 5, -3, -2, 3, 0, -2, 1, 3, 2, 3, -2, 0, 0, 4, 1, -2, 5, -1, -1, 5, 1, -2, 0, 5, -2, -3, 3, -2, 2, 2, 4, -2, 0, 5, 0, -4, -4, 5, 2, 4, 4, 6, -4, -2, 2, -2, -1, 3, 6, -4, 5, 2, 5, 0, 3, 4, 1, 5, -4, 2, -4, 6, 6, 5, 1, -2, 2, 1, 1, 2, -3, 5, 1, -2, 5, -1, 5, 1, -3, 2, -3, -3, 5, 3, -4, 5, -2, 5, 3, 3, -1, -1, 4, 3, -3, 4, 5, -1, -2, -2, -2, -1, -3, -4, 0, -5, -2, -4, 3, 2, -4, 1, 2, 0, 3, 2, -2, 4, -1, 1, -2, 0, 4, -3, 1, 5, -2, 2, -3, 4, 2, -3, 3, -5, 1, 4, -2, 3, -4, 2, 4, 3, -3, 4, -1, 5, 2, 4, -3, 4, 4, -3, -1, 5, 4, 6, 2, 5, -2, -5, 2, 4, 0, -3, 3, 5, -4, 1, -3, 5, 2, 6, 4, -2, -2, 3, 5, 5, -4, 0, 3, 1, 3, -4, -4, 1, 2, 0, -3, 3, -2, 2, 0, -2, 1, -1, -1, 0, 1, -5, 2, 6, -4, 2, 1, 0, 2, 4, 4, 2, -3, 2, 4, -2, 0, -5, 1, 4, -2, -1, -2, 6, 4, 3, 0, 5, 3, -2, -2, -1, 2, 5, -2, 0, 1, -1, 3, -4, 0, 3, 3, 4, 2, 1, -3, 5, 5, 2, 0, -4, 2, -5, -3, -2, 3, -4, -5, -3, -1, 4, 6, 1, -1, -3, 0, 4, 3, -2, -5, -1, 5, 0, 5, 2, -4, 0, 3, -4, 1, 1, 4, -4, 3, 6, -1, 1, 4, 1, 3, 6, 5, -1, -1, 0, 0, 3, 3, -2, -2, -2, 0, 3, 1, -4, 2, 1, 1, 5, -3, -3, 0, 0, -3, 3, 1, 1, 2, -1, 6, 1, 0, 4, 1, 2, -5, 6, 3, 2, -1, 4, 2, 1, 5, 2, -1, -3, 1, -1, 0, -4, 5, -4, 4, 1, 2, 1, 3, 0, 0, -2, 3, -3, -1, 6, 5, 3, 5, 0, 2, 1, 6, 5, 0, 4, 5, 2, 4, -4, -4, -3, -2, -2, -1, -2, -1, 0, -1, 0, -5, -4, -1, 3, 1, -4, -1, -2, 4, 5, -5, 1, 2, 0, 1, 6, -4, 3, 5, 6, 5, 5, 0, -1, 0, -5, 4, -2, 0, 3, -1, 0, 1, -3, 4, -3, -3, -3, 4, -1, 0, 4, -1, 6, 5, 0, 5, 5, 5, 2, -4, -2, 0, -2, 1, 6, 5, 0, -2, -5, 0, -2, -1, 2, 3, 1, -4, 2, -5, 2, -2, -4, 3, -4, -4, 2, -2, -2, 3, 2, -1, 0, -2, 4, -2, 3, 2, 3, -5, 2, 5, -1, 3, 4, -4, -4, 0, 5, -1, -1, 2, -1, 1, 1, 0, 0, 2, 2, 2, 3, -1, -2, 5, 0, 2, -2, 4, -2, -1, 2, 3, -4, -5, 0, 4, -2, -4, 0, 5, 1, -4, 0, 1, 0, -2, -1, 5, 4, -1, 4, -3, 6, 2, -4, 5, 5, 0, 3, -1, -2, 0, 1, 0, -1, 3, 4, -3, -1, 4, 2, -3, 1, -1, 2, -2, 5, 4, 4, 5, 6, 1, 1, 5, 6, -5, -2, 4, 0, 3, 1, 3, 4, -4, 1, 5, 4, -4, 3, 2, 4, 3, 5, 4, 6, 6, -2, 0, -1, 3, -3, 1, 5, -2, -4, 6, -1, -5, 0, 6, 1, -1, -5, -2, -1, 2, -3, 0, 2, 2, 3, 3, -3, -2, 5, -3, 4, 1, -4, -2, 2, 0, 0, 2, -3, -3, -3, 3, -1, 1, 3, -1, 3, 3, 2, -2, 3, 5, 4, 1, -4, 1, 1, 2, -3, 4, -3, 2, 2, 0, 1, 4, -2, 0, -3, 6, 1, -4, 2, -2, 4, 3, 5, 6, -1, -3, -2, 4, -1, -4, -1, -1, -3, 0, -4, 3, -4, -5, 6, 0, -5, -2, 2, 5, 5, -1, 3, 5, 2, 2, -5, -3, 2, 1, -2, -4, 1, 5, 0, 2, 4, 5, 0, 2, 5, -4, 2, 0, -4, 6, 1, 1, 0, -2, 0, 5, -2, -1, -4, 5, 5, 2, 4, -1, -3, 1, 5, 5, -1, -1, -3, 3, -3, -2, 1, 4, 3, -1, -4, -3, 2, 4, -4, 5, -1, -3, 0, -4, 5, 5, 5, 1, 4, -4, 4, 5, -1, 4, -2, 4, 0, 4, 1, 2, 2, 5, 3, -2, 0, -1, 0, 2, -5, -4, 3, -4, 0, -5, 4, 5, -1, -2, 4, 3, 4, -2, -2, 5, -4, -2, 0, 1, -2, 5, -4, -2, -1, -1, 4, -1, 5, -4, -1, 0, -4, 3, 0, 3, 1, 1, -1, 4, 3, -4, 2, 3, 1, 5, 0, -3, -4, 4, -2, 3, 2, 1, 0, -2, -1, -3, -3, 3, -3, 4, 1, 5, -4, -3, 0, 2, 1, -4, -2, 4, 3, -4, -2, 5, 4, 5, -3, -1, 0, 0, -1, -1, -4, 3, 2, -2, 3, -3, 3, -2, -1, 5, 3, 1, -4, 2, 3, 4, -3, 2, -1, 4, 2, -2, -4, -4, 0, 5, -1, 5, 0, -4, 5, 1, -4, -4, 2, 5, -4, 1, -3, 4, -2, -5, 4, -5, -1, -2, -1, 1, -1, 3, 1, -5, 2, -1, 5, -2, 1, 6, 5, 2, 6, 0, -3, 4, 4, -4, -3, 3, -4, -4, 1, 1, 4, 6, -3, 2, -2, 4, -1, 4, -2, -4, 1, -1, 2, -2, -2, 4, 0, -4, 2, 1, 1, 4, 5, 4, 2, -3, -4, -5, 0, 3, -4, 0, 1, 0, -2, -5, -3, -1, 3, 4, -2, 5, 2, -2, -3, 1, 3, -5, -4, 0, 5, -2, 0, -3, -1, -4, -5, -2, 2, 2, 4, -2, 5, 2, -4, -2, 2, 4, -1, -1, 4, 0, -4, 3, 3, 0, -3, 5, 3, -2, 5, 3, 5, -2, 5, 3, 4, -3, 4, 2, 5, 4, 3, 1, 2, -3, 5, 0, 5, -3, -1, -3, 4, -1, -2, -4, 4, -2, 1, 0, 5, -2, 1, 4, -1, 0, -2, -1, 2, -2, 3, 4, 2, 5, 3, 2, 4, 1, -2, 1, -4, -5, 4, 4, 4, 4, 0, 1, -4, -2, -3, 5, -1, 3, -1, 4, -3, -1, -3, 3, 0, 1, 1, 2, -1, -1, 2, -2, 4, 4, 1, 3, 2, 1, -4, 0, 5, 3, 5, 1, 4, 2, 4, 3, 4, -3, -4, -2, -5, 3, 2, 0, 2, 0, -3, -1, 2, 3, 3, -1, -4, 1, -1, 3, 3, -4, -5, 4, -1, -2, 2, -2, 1, 3, -4, -3, 1, 1, 2, -1, 4, 5, -2, -1, -3, 3, 4, 2, 5, 4, -2, 2, -3, 4, 3, -5, -1, 3, 5, 1, -1, 4, -4, 4, 2, 2, 0, -3, 3, -1, 4, -1, -2, -3, -2, -2, 4, 1, 2, 6, 2, 2, 0, -4, 0, -4, 0, 5, 5, -1, 6, -3, 2, -3, -3, -4, 0, -5, -2, 3, 1, -3, 4, 3, 4, 0, 1, -2, 2, -2, -1, 2, 2, 0, 5, 1, -3, 1, -3, -3, -4, -4, 0, -2, -2, -4, 2, -2, -4, -2, -3, 2, -4, 3, 5, -1, 5, 0, 3, 1, 0, -4, -4, 1, -3, 0, 1, -2, 0, 2, -4, -4, -1, 4, -2, 3, 5, -2, -5, 1, -2, 6, -3, -2, 1, -3, 2, 2, 4, 0, 3, 3, 4, -4, 5, -3, 3, -1, 3, 0, 0, -3, 0, 0, 2, 3, -4, 5, 1, 1, 2, -1, 6, -4, 2, -5, 3, -1, -1, 1, 2, -1, 2, 0, 5, -2, 1, -4, -4, -4, 3, -4, 2, 3, 2, 3, 3, -4, 0, -3, -1, -2, -2, 5, -2, 2, -5, -4, -1, -1, 5, 4, 5, 2, -2, 1, -3, 6, 5, -2, -2, -1, 4, -3, 2, -2, 3, -2, -4, 4, 3, -4, -1, 2, -1, 5, 4, -4, 5, 3, 2, -4, 0, 2, -3, -1, 4, 3, -1, -2, 1, 3, 3, 2, 2, -2, -2, 5, 0, 3, -1, -3, 1, -3, -1, 2, 4, -3, -3, 4, -2, 5, 0, -4, -2, 1, 4, -4, -1, 0, 4, -2, -3, 2, -4, -4, 2, 1, 1, -2, 0, -2, 1, 0, -5, 0, -2, -4, 0, 5, 4, 1, -3, 5, -4, 1, 4, -4, 4, 5, 4, 3, 4, 0, 3, -2, 4, -3, 2, 3, -1, 5, -1, -1, 4, 0, 2, -4, 5, -1, -5, 5, 4, -4, 5, 1, 0, -3, 1, 3, 5, -2, -2, 4, 0, 5, 2, -4, 2, -1, 0, 3, 4, 3, 1, -1, 3, 4, 2, 3, -2, 0, -3, -4, -4, 4, 3, 5, -3, 5, 4, -2, 6, 1, 1, -3, 4, 5, -1, -2, -1, -1, 4, 4, 3, 5, 5, -2, -3, -4, 3, -1, 4, 0, -1, -4, -3, -1, -2, -3, 5, -2, -2, -4, -2, -1, 1, -3, -1, 4, -2, -2, 6, 0, -3, 5, 5, 3, 4, 5, 3, -4, -1, 5, 3, -1, 4, 1, 0, 2, 0, -2, 5, 5, 0, -4, -1, -1, -1, -5, -1, 3, -3, -2, 5, 3, -3, -1, 2, -2, 3, -3, -1, 3, 6, -2, -3, -1, -4, -3, 1, -3, -3, -4, 2, 3, 3, -1, -1, 4, 3, 2, 0, -2, -4, 2, 5, 5, 0, 1, -2, -1, -4, 1, -3, -4, 6, 6, 3, -1, -3, -2, -3, -5, 3, 5, 1, -5, 6, 6, -2, 3, 3, 2, -3, -3, -2, 0, 2, 3, -1, 1, -2, -1, 2, 0, 0, 6, -3, 4, -2, 2, 4, -1, -4, 4, 5, 4, 1, 4, 0, -3, -5, 5, -2, -5, 3, -4, -1, -2, -1, 2, -1, 0, -3, -2, 6, 6, 6, -1, 2, -4, 5, -4, 2, 4, 2, 1, -4, 5, -2, -3, 0, -5, -3, 6, 3, -2, -3, -5, -4, 1, 5, -3, 0, 5, 4, 1, 3, 1, 6, 2, 5, -1, 5, 4, 5, 0, 5, -4, 6, 3, 5, 3, -1, -4, 3, -4, 4, 1, -3, -1, -3, 3, 3, -2, -1, 4, -1, -5, 4, 0, 2, 1, -2, -4, 0, 3, -4, -4, -1, 5, -4, 3, -1, 0, 1, 0, 2, 5, 5, 2, 3, -3, 2, 2, 2, -1, 2, -1, 3, 3, 2, -5, 5, 0, -4, -2, -2, -1, 0, 1, -4, -3, -2, 4, 2, 3, 0, 1, -3, -1, -4, 4, 3, -2, 5, 3, 3, -4, 0, -2, 3, 1, 4, 0, -3, 4, -1, -2, -4, 2, 5, 1, 1, 0, -5, -2, 2, 5, -1, 5, -1, 2, -3, -2, -1, -4, 2, -1, -3, -4, 1, 5, 3, -1, 4, 1, 1, -2, -1, -2, -1, 2, 3, -1, 3, -4, 6, 2, 5, 5, 1, 3, -1, 5, 0, -1, -5, 2, 1, 3, -3, 2, 2, 2, 2, 5, 1, -1, -1, 3, 2, 2, -4, -3, 3, 1, 5, 0, 4, 2, 2, -1, 0, -3, 6, -4, -3, 2, 5, 5, 2, -1, -3, -4, -3, 2, -4, -1, 1, 5, -4, 4, -2, 0, 1, -1, -2, 0, 2, 5, -5, 4, 4, -4, 2, 1, 6, 3, 1, -2, -2, 1, 4, 4, 1, 3, 5, 3, 3, 3, 1, 4, -1, 4, 5, 1, -2, 4, -4, 0, 1, 2, -4, -5, 6, 4, 4, -2, 5, -3, 0, -2, 1, 0, 4, 5, 4, 4, 2, -2, -4, 2, 2, -3, -4, -4, 4, -1, 0, -1, 5, -2, 1, 4, 6, -1, -2, 6, 6, 4, -1, 4, 6, 4, 3, -1, 4, 2, -5, 3, 1, 5, 5, 2, 3, -2, 4, -3, -2, 1, 1, 4, 1, -3, 1, 4, -1, -4, 0, -4, 5, 1, 3, -1, -2, -4, -4, -2, 0, 4, 4, 4, 1, -2, 2, -3, 4, 5, 1, 5, -2, 6, -2, 1, -5, 0, 1, -3, 2, 1, -3, 0, 3, 3, -1, 2, 4, -1, 2, 1, 5, -4, 5, 0, 5, -5, -4, 0, 3, 2, 0, 2, -1, -2, 3, 0, -1, 1, -4, 2, 1, 4, 3, 1, 3, 3, 3, -2, -3, 1, 5, 4, 3, 6, 4, -3, 1, 4, 3, 2, -1, 3, -3, 3, 3, 5, -3, -4, 5, 4, 5, 2, -3, -1, -2, -3, 5, 4, -2, 4, 4, 0, 0, 5, 3, 2, -3, -4, -3, 3, 3, -5, 3, 2, 5, 5, 3, 5, 2, 0, 1, 3, -4, 6, -1, 0, 5, -3, 0, -4, 0, 5, 0, 3, 1, 1, 3, -4, -3, 4, -4, 1, -3, -3, -4, -3, -3, -4, 2, 1, 1, 1, -2, -3, 1, 3, -2, -3, -2, -2, -3, 5, -3, 1, 0, 6, -2, -1, -3, 1, 2, 6, -2, -1, 1, 0, -2, 1, 4, 0, 0, -1, 3, 2, 4, -3, -2, -3, 3, 1, -4, -4, 5, 2, -2, -4, -5, 1, 0, -5, 0, 5, 5, 0, 0, 1, -4, -3, -4, -4, -1, 6, 5, -4, 5, 5, 6, 3, 1, 1, -3, -2, 6, -4, 3, 3, 4, -4, 3, 0, -3, -4, 0, -2, -2, -3, 4, -1, 5, 1, 5, 2, -3, 1, -2, 3, 1, -4, 0, 0, -3, 2, 0, 1, 0, 5, 5, -3, 3, 0, 4, 3, -4, 3, 5, 2, -3, 5, 5, 5, -4, 3, 3, -1, 2, -3, -5, 2, 6, -3, 1, 4, 1, -2, -2, -4, -4, -4, -1, -1, 0, -4, -2, -4, -5, -2, -2, 4, -4, -2, -1, 3, 3, -5, -3, -4, 3, -4, 2, 4, -4, 4, -4, 5, -4, -4, 2, -2, 3, 0, 4, 3, 5, -1, -4, 1, 2, 1, 2, 1, 2, 2, -1, 5, 3, -1, 1, -2, 0, 2, -3, 5, 2, -4, 4, -3, -3, 5, 2, -2, -3, -3, 5, -2, -3, 1, 2, 5, 0, 4, -5, 4, 2, 1, -2, 1, -2, -1, -3, -4, 2, -3, -4, 2, 2, -2, -1, 4, 3, -3, -4, -3, 0, -2, 4, -2, 0, 0, 3, -1, 2, -4, -1, 2, 5, 3, 2, -4, -2, -4, 5, 3, 3, 0, 3, 1, 0, -1, -2, -1, -2, 2, 5, -1, 4, 4, 4, -1, 2, 4, -2, -2, 1, 6, 0, 1, 1, 2, 2, 1, -2, 3, 4, -1, -4, -3, 0, 4, 2, 3, 5, 0, 5, -3, 0, 2, -5, -4, -2, 4, -2, 2, 2, -2, 4, -1, 1, 3, 5, -2, 4, -3, 6, -1, 3, 1, 1, 2, 0, -2, 6, -4, -3, 3, 2, 1, -3, 4, 2, 5, -5, 2, 5, 0, -1, -1, -4, 1, 1, 4, -1, -1, -2, -4, -4, -1, 5, 3, 1, -3, -4, 2, -3, -3, -1, -1, -1, 5, -3, -2, -3, -4, 3, 0, 4, -2, 5, 1, 5, -5, 2, 1, 2, 2, -3, -4, -1, 6, -5, 3, -2, 0, 4, 2, -5, 4, 2, 1, -3, 1, 1, 3, -2, -5, -4, 2, -2, 2, 1, 4, 4, 4, 0, -3, 1, 4, -1, -4, 2, 6, 1, -4, -2, -4, -1, -3, 3, 2, -4, -3, -1, -2, 5, 5, -2, 3, 3, 4, 5, -2, 2, -2, 1, 5, -1, 3, 5, 4, -3, -2, -4, 4, 5, 4, -4, -1, -1, -4, -2, -2, -4, 5, 3, 1, -1, -3, -3, -2, 0, 6, 2, 1, -2, 1, 2, -5, 1, 2, 3, 2, -3, 4, 4, -3, 0, 5, -3, 0, 4, 4, -1, 4, -4, 5, 6, -4, 0, 4, -1, -3, 1, 5, -3, 2, 2, 0, -3, -1, -3, 4, 5, -4, -3, 4, 0, 3, -4, 6, 5, -4, 5, -3, -3, 5, -1, 3, 5, 0, -3, 4, -1, 1, -2, -3, -2, 5, -2, -4, 1, 0, -5, -3, 0, 3, 2, -5, -2, 2, -1, -4, -4, 5, -1, 0, -1, -2, 1, 4, 6, -3, -1, -4, 1, 1, 1, -2, 6, -1, 2, 4, 3, 1, 4, -1, -2, -3, 3, -3, -3, 5, 3, -3, 1, 1, -3, -1, -3, 4, -1, 6, -3, -3, -1, 2, 1, 4, 3, 1, 4, -3, -2, 6, 2, 4, 1, 3, -1, -1, 5, 1, 5, 2, -3, 5, -2, 0, 5, 1, -1, 5, 5, 3, 1, -1, 1, -3, 3, -2, -2, -3, -1, 3, 5, -1, -1, 3, -2, 2, -2, 4, 5, 3, -1, 1, -1, 0, 2, 4, -1, 0, -1, 0, 3, -5, 3, 4, 3, 4, -1, 2, -3, 4, 0, -4, 0, -1, 5, 3, 5, 4, 3, 5, 1, 3, 3, 4, 1, 5, 5, 0, -1, 2, -3, -4, 4, -3, 6, 2, 3, 5, 0, 4, 5, 4, 4, 1, -1, 5, -2, -3, -4, 3, 3, -2, 4, -4, 0, -1, 4, 6, 4, -1, 1, -5, 2, 2, 6, 5, 3, 2, 5, -3, 5, 5, 1, 4, -2, -1, 0, -4, 2, 2, 0, 0, 0, -2, -4, -1, 5, 6, -4, 1, 5, 2, 5, -4, -1, 1, 0, -4, 2, 1, -1, 2, 3, 4, 1, -2, 4, 3, 0, -1, 2, 2, 0, 3, 5, 4, 4, -1, 4, -4, -4, -4, -1, -3, 5, 0, -3, 2, 0, 2, 3, 3, 3, -2, -2, 2, -1, 0, 4, 1, 4, 0, 4, 2, -3, -2, -1, -4, 2, -2, -2, -2, -1, -3, 1, 1, 3, -4, -3, 0, -2, 3, -2, -3, 2, -1, 5, 3, -4, -2, 0, 5, 1, 5, 4, -4, -2, 1, -2, 1, 4, 0, -1, 5, 0, 2, 2, -1, -2, 3, 0, -1, 0, -2, 0, 1, 1, -5, 3, 3, -3, 1, -3, 4, 1, 5, 1, 5, -1, -2, 3, 2, 5, 5, -2, 4, -1, 5, 4, 1, -3, 2, 0, 1, 5, -4, -1, -4, 3, 6, 5, -4, -5, 4, -2, 0, 2, 3, -2, -5, 0, 2, 1, 1, 2, 4, 1, 6, -5, 2, -1, -2, -5, 0, -1, 5, -2, 1, 3, 2, 5, 1, 0, -4, 0, 1, -3, 2, -2, 4, 1, -5, 0, 6, -4, -4, -3, 3, 3, -4, 6, 5, 4, -4, -2, -2, 0, 0, -3, -2, 3, 5, 5, 1, 5, 1, 5, -2, 1, 2, 4, 1, 3, 0, 2, 5, -3, -1, 1, 1, 1, -2, -5, -3, 5, -4, -1, 2, -5, -2, -3, 4, -4, 1, -3, -3, -2, -4, -1, 5, -2, 0, -1, -3, 4, 4, 5, 2, 1, 1, 3, 4, 3, 3, 5, 2, 2, -3, -3, -4, 2, 6, -1, 6, -5, -4, 0, 0, -1, -3, -1, 0, 0, -2, -3, -3, -2, 2, 5, 2, -3, 3, 2, 4, 5, 0, -1, -3, -3, 3, 0, -1, 3, 5, 2, 1, 5, -4, -3, -2, 6, 4, 5, -1, -5, -1, -3, 1, -2, 0, 3, -5, 3, 0, 5, -4, -4, 2, 3, 1, 2, 4, 1, -3, -4, -3, 0, -3, 5, -1, 3, -4, 5, 0, -3, 1, 4, 2, 2, -2, 5, -3, -5, -3, -4, -2, 0, -3, 5, 0, -3, -2, 3, 5, 2, -2, 1, -3, 0, 2, 1, 3, 4, -2, 2, -1, 2, -1, 3, -2, -5, -3, 1, 1, 5, 4, 0, 2, 1, 0, -4, 1, 1, 3, -3, 4, 3, 2, -2, 3, 1, -1, -3, 2, -2, 0, -3, 3, 3, -1, -3, 4, 1, -2, 0, -2, -2, -2, 0, -5, -3, 5, 4, -3, -2, -4, 4, 4, 2, 0, 4, 3, 2, 1, 5, 3, 3, 5, 6, -1, -2, -3, 4, 1, -1, 1, 0, 0, 4, 2, 1, -3, -4, 5, -4, 4, 4, 1, -3, 3, -2, -4, -3, 2, 3, 2, -1, 2, -1, -4, 1, 2, 0, -4, -3, -2, 1, 6, -2, -4, 1, -2, 1, 5, -1, 1, -1, 3, -2, 0, 2, -2, 1, -3, -5, -3, -3, 3, -2, 0, 0, 4, -1, -2, 3, 5, 2, -1, 5, -3, -4, 2, 0, 1, -4, 1, -4, 0, 4, 0, -2, -1, 2, 4, -1, -3, 5, 1, 3, 3, -1, -5, -3, 0, 4, -3, 4, -4, 2, 6, 0, -3, -1, 2, -2, 4, -2, -2, 5, 1, -1, 4, 5, 2, -3, 3, 2, 2, 3, -1, 1, 1, -3, 1, 5, 6, 2, 2, 0, -3, 0, 5, -5, -3, 4, 5, 6, -4, -4, 0, 6, 3, -3, 4, 0, -4, -1, 3, 0, 5, 6, 2, 1, -2, 2, 2, 4, 1, 1, 4, 4, 5, -1, -3, -1, 1, 0, 2, 1, 0, 3, 3, 2, -2, 3, -1, 2, -3, 6, 0, -4, 1, -4, 2, 4, 0, -4, 0, 0, 4, 5, -3, 3, 2, -3, -3, -4, 1, -3, -4, -2, 5, 1, -4, 1, -4, -2, -2, 0, -2, -1, 1, -3, 1, 2, 3, -4, 4, 4, -4, -4, 2, -1, 4, 1, -4, -3, 5, -5, 2, 5, 5, -4, 0, -4, -2, 0, 4, -3, -4, 2, 0, -2, 1, 5, 1, 0, 1, -4, 3, -4, -4, 2, -4, 4, 3, -4, 5, 5, 5, 3, 2, 2, 1, 4, 2, 4, 2, 5, 5, 0, -4, 2, 0, -4, 5, 5, -3, 1, -3, 1, -5, 2, -2, -1, 1, -3, -3, -4, -1, 0, 5, 5, -5, 0, 1, 0, -2, 5, -3, 2, -3, 1, -4, -4, -3, 1, -3, 2, 1, -2, -4, -4, -3, 5, -1, 2, -2, 1, -2, 4, -1, -2, -1, 3, 2, 5, 2, -2, 3, 5, -3, -1, 2, 0, -4, 5, 3, -5, 5, 1, -2, -4, -3, 0, 1, 5, -1, 1, 4, -4, -1, 0, 3, 0, 5, 6, -1, 4, -4, 2, 4, 3, 1, 2, 3, -4, 4, 1, 3, 4, -2, -1, -2, 2, -2, -5, 0, 6, 3, 6, 0, 1, -3, 3, 5, -3, -4, 1, -2, 2, 0, 5, 0, -1, 5, -4, 1, 4, -3, -4, -4, 4, -1, 1, 0, -4, 1, 2, 0, 3, 4, 4, 5, 1, -4, 3, 2, 0, -3, 1, -3, 4, 2, -5, 5, -1, 0, -2, -1, 3, -3, 1, -3, 3, 0, 5, 0, -2, 3, 0, 5, 1, -3, -4, 0, 5, 0, 2, -2, -5, 1, 1, -2, 0, -2, -4, 1, 0, -2, -4, -1, 5, -2, 5, -3, -3, -1, 6, 1, 0, 1, -1, 4, 0, -4, -1, -2, 1, -5, -3, -3, -2, 5, 3, 3, -3, 2, -2, 3, 3, -4, -2, 2, -1, 0, 3, -1, -3, -4, -1, -3, 3, 4, -4, 3, 0, 5, 5, 2, -5, 5, 2, 3, 0, 1, -4, 4, 3, 1, 5, 4, 0, -3, 3, -2, -3, -2, -2, 2, 0, 3, 0, 3, 2, 0, -2, -3, -4, 5, -4, 4, 4, -2, 0, -4, 1, 3, -3, 4, 3, 2, 3, 4, 0, 5, 4, -4, -2, -4, 1, -4, 4, 3, -4, 5, -3, -5, 0, 2, -1, -1, -3, 6, 1, -4, 0, -1, 2, -1, -2, 0, -3, 2, -3, -2, -1, -1, 0, 3, 2, -4, -4, 2, 4, 5, -2, -1, -3, -5, -4, -2, -2, -3, 2, 0, -1, 5, -1, 0, -4, -1, -3, 1, -2, 0, -4, 1, -3, 2, 0, 5, 4, 3, 4, 0, 5, 2, -1, 1, -3, 6, 4, -1, 0, -3, 3, -3, 3, 1, 5, -3, -1, -3, 0, -2, 1, 1, 1, 3, 5, 1, -1, 3, 4, -4, -1, 2, -3, 1, 4, -2, -5, 0, 3, -1, 2, -1, 0, -1, 6, -3, -1, -3, -4, 2, -4, 0, 3, -1, -2, 0, 1, 1, -1, 6, 4, -4, 1, 3, -5, 5, 3, -1, -2, 4, -1, 1, 5, 0, -3, -2, 4, 1, -4, -1, 1, 3, 5, -2, -1, 3, -2, 2, 0, -4, 3, -1, 0, 1, -4, -3, -1, -3, 1, 5, -3, -1, -1, 4, -5, -4, -4, 2, -3, -2, 3, 5, 3, -1, 0, -5, -5, 2, 5, -1, -2, 1, -2, 0, 4, 1, 4, 6, -4, -4, 2, 1, 0, -5, 0, -2, -2, -2, -4, 0, -5, -1, 4, 4, -2, 1, -2, -1, 2, 0, 2, 4, -3, -3, -1, 3, 2, 5, -4, 0, 5, -1, 3, -2, 1, -4, 0, -2, 5, 4, 5, 1, 5, 4, 3, 2, 0, -4, 4, 4, -1, -1, -2, -3, -3, -4, 2, 1, 4, -2, 6, 0, 5, 5, 5, 5, -4, 5, 4, -1, -2, 5, 5, -4, 4, 2, 1, 1, -3, 0, -5, 4, -4, -1, 0, -4, -2, -1, 4, -1, -1, -2, 1, -2, -2, -3, 0, 0, 3, -3, 5, -1, -2, 3, 4, -2, 2, -3, 4, 4, 5, -2, -4, 4, 0, 5, 4, 4, 0, 5, 4, 0, -3, -2, 6, 3, 1, -1, -1, 4, -1, -2, -5, 3, 4, 4, -4, 4, -1, 3, 3, 4, 1, 5, 4, -4, -1, 3, 1, 3, -2, -4, 0, 4, -2, -1, 1, 3, 2, -4, 1, 2, -1, 3, 0, 4, 2, -5, 1, 2, -5, -3, 3, 3, 0, -2, -5, 2, 5, -3, 1, 1, -5, 4, 3, -3, -3, 4, -1, -3, 3, -2, -3, -2, 5, -2, -4, -1, -5, -2, -1, 5, 6, 2, -2, -5, -4, -5, -3, 4, 3, 2, 2, 4, -3, 3, 4, 0, 5, 4, -3, 5, 5, -1, -2, 5, 3, -4, -4, 1, 4, -5, -1, -1, 5, 4, 3, 3, 1, 5, 0, 5, -4, -1, 0, 1, 5, 1, -3, 4, 0, 3, -1, 4, 3, 3, -1, -4, 0, 0, 6, -2, -1, 3, 5, -2, 0, 1, 1, 5, -4, 0, 1, 5, 4, -1, -5, 5, -1, 2, 2, -4, 3, 6, 2, 6, -1, 4, 1, 0, -3, 4, 3, 5, 4, 4, 5, 5, -1, 4, -4, 2, 4, -4, 1, 1, -2, -4, 2, -2, 4, 4, 2, 5, -2, -4, 3, 6, -1, -4, -4, -2, -1, 1, -4, -2, 0, -2, -3, 4, 5, 5, -1, 5, 4, 4, 2, 3, -3, 3, 1, -3, 2, 0, 0, -2, -1, -1, -2, 3, 1, -3, 6, -4, 5, -1, 3, -1, 2, 2, 5, 5, -1, 0, 3, 3, -1, 6, 3, -2, 5, -3, 5, 0, -2, -1, -1, -2, 1, -2, -3, 5, -5, -1, 2, -4, 6, -1, -3, 4, 2, -4, -2, -2, 1, -1, 5, -4, -4, 1, 2, 4, 4, 5, 5, 5, 2, -3, 4, 1, -1, 3, 0, 0, -4, 3, 1, 0, 0, 1, -2, 0, 0, 2, 5, 5, -2, -4, -2, -1, 3, -2, 2, -1, 5, -1, -3, 4, -5, -4, 3, -3, -4, 1, -2, 3, -4, 4, -3, 4, 4, 0, -1, 3, 0, 5, -2, 0, 4, 2, 5, -5, 5, -2, 5, -2, -4, 2, 1, -2, -1, -2, -3, 1, 2, -4, 0, 3, -4, 1, 0, -3, -2, 5, 2, -3, 0, 4, 3, 2, 5, -1, -3, 1, -1, 3, -4, 5, -3, -3, 3, -1, 0, 1, 1, 2, 5, 5, 1, 4, -3, 3, -4, -4, 3, -3, -4, -1, 1, -3, -5, 6, -3, 4, 3, 1, 4, -2, 2, 2, -4, -5, 2, -3, 4, 0, 0, -5, 3, 4, 1, 4, 1, 1, 3, 4, -4, -2, 1, 2, 0, -2, 3, 0, -4, -1, -1, 3, 0, -2, 5, -4, -4, 3, 4, 2, 5, 3, -2, -1, 0, -1, -4, 1, -1, 1, 0, 2, 5, 5, 2, 2, 0, 1, -3, -3, -5, 3, -1, -1, -1, 5, 2, 1, 0, 4, 0, 5, 2, 3, 5, -1, 3, 2, 2, 5, -2, 3, 5, -3, 2, -4, 2, 2, 6, 5, -2, 1, 2, 4, -2, -3, 3, -2, -2, 3, -4, 2, -3, 5, 0, 2, 5, -4, 3, -4, -5, 4, 0, 3, -3, 0, -3, -1, 4, 1, -2, -5, -3, -1, -2, -3, -3, -1, 3, 4, 0, 5, 5, 1, 3, 4, -4, -2, 1, -1, -2, 0, 1, 1, -3, -1, 6, -1, -2, 3, -4, -2, 3, 6, -3, -3, -3, 1, 0, -3, 4, -3, 2, 0, 2, 4, -2, -3, -2, -3, 4, 5, 0, -4, -5, -1, 4, 3, -4, 4, 5, 1, 6, 4, 0, 0, 0, 1, 3, -1, -1, -1, 3, -1, 3, -2, -3, 1, 2, 5, -3, 0, 3, 3, 2, 4, -3, 6, -4, 3, 3, -4, -2, 1, 4, 0, 3, -2, -2, -2, 2, -2, 1, -1, 1, 2, -2, -4, -2, -1, 4, 4, -2, 1, -3, -1, 0, -3, 2, -1, -2, 0, -1, -3, -3, -2, -5, 0, 0, 5, -1, 4, -1, 0, 2, 3, -4, 6, -4, -4, 5, 2, -3, -3, 3, 0, -3, -2, 2, -3, 0, 3, -4, 5, -2, 0, -5, 2, 4, -3, 0, 2, 4, -2, 4, 5, 4, 1, 0, -4, -2, 0, -4, -1, 5, 4, 2, 1, 2, 0, -2, 0, 5, -3, -1, -1, 0, 6, -1, 5, 1, 0, 1, 4, -2, 0, 1, 1, -1, -1, -4, 4, 5, 4, 1, -3, 0, -3, -1, 1, 3, 0, -2, -1, 0, -2, 5, 0, 2, -4, 4, 2, -2, 1, 1, 6, 1, -3, 4, -4, -1, -4, 4, -2, -2, -1, 0, -3, 0, 0, -4, 0, 0, 6, 0, -2, 2, -1, 0, 3, 3, 1, 4, 4, -3, 3, 2, 0, 6, 5, -1, 0, -1, 5, 4, -3, 1, 0, -4, -1, 1, -4, 6, 4, -2, -4, -4, -5, -5, -3, 2, 3, 1, -1, -3, 0, -2, -2, 0, -2, -1, -4, -2, 0, 3, -3, 4, -2, -1, 0, 5, 1, 4, 1, 1, 0, 1, 0, 2, 1, -1, 3, 4, 4, -4, 2, 2, -2, 1, -1, 3, -2, 5, -4, 4, -2, 0, -2, 0, -1, 5, 0, 1, 4, 3, -4, 1, -4, 1, 4, 0, -1, 3, 2, -4, 1, 3, 2, 5, 4, 5, 3, 3, 5, -4, -4, -2, -4, -1, 3, 3, 2, 4, -5, 5, -4, 1, -1, 6, -1, 0, 5, 0, 2, 1, -4, 0, -4, -4, 3, -3, -3, -1, 0, 1, -2, 3, -1, -2, 3, 3, 0, 5, -2, 5, -3, 2, 0, 1, -1, 3, -2, 0, 0, -1, -4, 4, 2, 6, -3, 0, 4, 1, 3, 3, 3, -1, 5, -3, -3, -3, -5, 3, -4, 5, 4, 3, -4, -1, -4, 0, 5, 4, -1, -4, -2, 0, 1, 0, -1, 0, -4, 3, -2, -1, -4, 5, -4, 2, -5, 2, 3, 5, 4, -2, 1, 3, -4, 1, 1, 3, -2, -2, -4, 0, -1, -5, -3, -4, 1, -4, 2, 0, 2, -1, 4, -1, 4, -4, 3, 2, 4, 2, -1, 4, 2, 1, -2, 5, -3, 0, 3, -2, 4, -3, 0, -1, 1, 3, 6, 0, 4, 1, -2, -4, 2, -1, 2, 3, -4, -4, -2, -5, 3, 6, 1, -2, 3, 6, 2, 3, -1, -5, 2, -4, 1, 4, -4, -1, -1, 1, 4, 2, -1, -3, -2, -2, 5, -1, -2, 0, 3, -2, -3, 1, 3, -1, -3, 2, 2, -3, 1, -2, 4, 6, -1, -3, 2, -3, 1, 1, -3, 0, 3, 3, 0, -2, -4, 2, -1, 2, 1, -1, -3, -4, -3, 2, 3, -1, -4, 4, -5, -2, 0, -2, 4, -2, -3, 0, 3, 1, -4, 0, 4, 2, -3, 5, -3, -3, 2, 3, 2, 2, -4, 1, -3, -3, -1, 4, -1, 2, 4, -3, 4, 0, -5, -2, 4, -2, 5, -2, 0, -2, 1, -3, 6, -4, 4, -1, 4, 1, 0, -3, -3, -3, -4, 0, 1, -3, 6, 4, -3, -1, 1, 1, 4, 2, 6, -4, -2, 5, -2, -2, 1, 2, 1, 4, 1, 0, 1, -2, 1, -4, 2, 5, 3, -2, 2, -3, -4, 3, 4, 2, -4, -2, -2, 3, -2, 6, -1, 1, -2, 6, -2, 3, 0, -3, 2, -3, -2, -1, 3, -4, 0, -1, 0, -3, 0, -2, 0, 2, 4, 2, -1, 2, -4, 4, 3, 3, 0, 1, -5, -2, -2, -2, -1, -5, 3, 0, 4, -1, 0, -1, 3, -1, -1, -1, -1, 2, 0, 3, -1, -4, 2, 0, -4, -4, 3, -4, 4, 4, -2, 4, -1, 6, -3, -1, 2, -1, -5, 5, -4, 6, 4, -4, -2, 0, 3, 4, 1, -2, -1, -2, -3, 2, 6, -1, -3, -5, -2, 4, -2, 5, 1, -1, -5, -2, -2, 2, 4, -3, 5, -3, 0, 1, -2, -1, 5, 4, 0, -3, -1, 5, -3, -4, -4, 5, -3, 4, -4, -4, 6, 2, 5, 1, 3, -4, 0, -3, 3, 1, 5, -2, 1, -4, 3, 1, -1, 4, 2, -1, 4, -3, -3, -3, 2, 1, -1, 6, 0, -2, 5, -5, 1, -4, -3, 5, 4, 6, -1, 4, -4, 1, 1, -1, -2, 4, 2, 1, 3, 1, 1, 6, 4, 1, 4, 0, 1, 2, 1, -2, -2, 4, -2, 5, 3, 1, 4, -3, -1, -4, 3, 3, 0, 4, 1, -2, -2, -3, 0, 4, 1, -3, 0, 5, 3, 4, -2, 0, -2, -1, 1, 3, 5, 0, -1, -1, -2, 4, 0, -5, -3, -4, -1, -4, 1, 6, 5, 2, -1, -3, -1, 6, 3, 6, 0, 2, 5, -4, -1, -1, -3, 5, -4, 3, 5, 0, 5, 4, 3, 5, 3, 6, 0, 3, 1, -1, -3, -1, 3, 6, 6, 0, -2, 0, -3, -4, 5, 6, 5, 4, 3, 3, -4, -3, 3, 1, -4, 0, -3, -1, 1, -1, 3, -5, -2, 0, 3, 2, 4, 0, -1, 3, 0, 5, 0, -2, 4, -3, -3, -3, -2, 5, -4, 2, 0, -3, 4, -1, -1, 4, 3, -5, -4, 1, 1, 2, -5, 0, -4, -3, 2, 4, 3, 5, 5, 2, -1, 1, -5, -3, -5, -3, 4, 1, 1, 0, 4, 5, 4, 4, -4, 2, -2, -3, 4, 3, 3, 4, 3, -1, 5, 2, -3, 4, -5, 5, -1, -4, 5, 6, 0, 5, 0, 4, 4, 0, -3, -3, -2, 0, -2, 5, -2, 4, 2, 1, 0, -2, -2, -1, -4, -3, -3, -5, 4, 1, 0, 0, 4, 2, -2, -5, 5, -2, -4, 3, -1, -3, -1, 0, 4, -4, 3, -1, -2, 3, -2, 1, -3, -4, 3, 4, 3, 6, -1, 0, 0, 3, 3, -1, 2, 2, -4, 0, 4, 2, -4, 1, -3, 5, -4, -3, 1, -3, -2, 3, 2, 6, 4, 3, 3, -4, 3, 2, 5, 0, -2, 4, -4, -3, -4, -2, -1, 2, 6, 5, 2, 3, 5, 2, 0, -2, 1, 3, 3, 2, -4, -1, 4, -1, 1, -4, -3, 5, 3, -1, 3, 4, -2, 3, 1, -1, 0, 4, 3, 6, 0, 4, -4, 5, -2, 0, 0, -3, -4, -1, 4, -4, -4, 5, -3, 5, -1, 2, 1, 2, 2, 3, 0, 0, 0, -4, 2, 0, 0, -3, 4, 1, 4, 5, -1, 5, -1, 0, -2, 3, 4, -3, 4, 5, 5, -5, 2, 5, 1, 2, -4, 4, -3, 4, 2, 3, -3, -3, -1, -1, 4, -1, -3, 1, 3, -3, -4, -3, -3, -2, 5, 5, -4, 2, -3, 1, 4, 2, -1, 1, 1, 1, -1, -3, 5, 1, 3, -3, 0, -4, 1, -1, -2, -1, -2, 4, 2, -2, 2, -5, 2, 3, 1, -4, 5, 3, 4, 0, 5, 5, -1, 3, -4, 1, -1, 0, 5, 3, 3, 2, -5, -3, 2, 2, -1, 1, -3, -2, 4, -1, 2, 1, -3, 0, 4, -1, 4, -1, 1, 3, -4, 2, 4, -4, 2, 2, -4, -4, -2, 3, 2, 1, 3, 0, -2, 2, 3, 3, -2, 1, 5, 5, 5, -1, -1, -1, 3, 0, 0, 1, 3, 4, 3, -3, 0, -2, 3, 1, -3, -2, -1, -4, -2, 4, 4, 3, 4, 2, -4, -1, -1, 2, -1, 3, -1, -5, -4, 1, -2, 6, 0, 4, -1, -1, 1, 2, 0, 0, 2, 3, 1, -1, -1, -2, -2, -3, 5, 4, -2, 1, 5, 1, -3, 4, -3, -1, 3, -1, 6, 2, 1, 0, 5, 4, 1, -4, 5, 6, -2, -4, 3, -3, 3, -4, -2, 4, -2, -4, 1, -4, 5, 5, -1, 3, 2, 5, 2, 1, -4, 5, 3, -1, 5, 4, 1, -4, -4, -3, 2, 0, -3, -3, 3, -1, 2, 2, 0, 4, 1, 3, 3, -1, 1, 0, 4, 2, 1, 1, -2, -4, -4, -4, 1, -4, -2, -2, -2, 0, -2, 3, -2, 2, -4, 3, 5, 2, 5, 0, -3, -1, -2, 1, -1, 2, -2, -3, -3, 5, 3, 0, 5, 2, 4, 5, 2, 0, 2, -1, -2, 2, 5, -4, 4, 5, -5, 6, -4, 5, -4, 6, -4, 2, 1, 3, 2, -4, -2, 0, 0, 1, 3, -3, 5, 0, 1, -3, -3, 3, 4, 3, -2, 4, -4, -5, -4, -2, 2, 3, 5, -5, 2, 1, 2, -3, 5, -1, 5, 2, -2, -4, -3, -3, 2, 0, -1, -1, -1, 5, 4, -2, -5, -3, 0, 3, 3, -1, -4, 0, -3, 3, 3, -2, -3, 4, 6, 3, 0, -1, -4, 0, -2, 0, -2, -3, 4, 0, 5, -1, -2, -4, -3, 0, 2, -1, -2, 6, -2, -4, -2, 0, -4, 5, 4, 0, 1, -3, 0, -4, -2, -4, 2, -1, -2, 0, -4, -5, -5, -1, 0, -5, -4, -4, 3, 5, -4, -4, 4, -1, 1, -2, 0, -2, 5, -1, 4, 1, 5, 4, -3, 3, 1, 5, 6, -4, 0, -4, 3, 3, -3, -1, 4, -1, 2, -2, 1, 1, 4, 2, 3, 4, 0, -4, 1, -2, 4, 1, -3, -4, 0, -1, 0, -1, -3, -4, -3, 4, -1, -2, 4, 1, 0, -4, -3, 2, 0, -2, -4, 0, 0, 3, -4, 5, -2, 4, 3, 4, 2, -2, 5, 5, -2, -1, -1, 1, -2, -2, 0, 3, 0, -1, 2, -4, -5, -5, 4, 5, 2, 4, -4, -4, -3, 3, 1, 6, 0, 0, 4, 1, -2, 3, 5, 4, 2, 0, 0, 4, 2, 6, 2, -1, 1, 1, -4, -2, 6, -1, -3, 4, 4, 0, -4, -3, 1, -3, 0, 5, 2, 5, 6, -3, 3, 2, 6, 4, 4, 3, -2, 5, -4, 4, 4, -3, -4, 0, 0, 2, 5, 1, -2, 4, -1, -3, -3, -5, 3, -4, -2, 2, -4, -4, 4, 1, -2, 3, 3, -1, -1, -1, 2, 4, -2, 5, 3, 0, -4, -2, 6, 4, 4, -4, -3, 2, -3, -1, -3, 4, -1, -1, 1, 2, 0, 0, 5, 6, -2, -1, 0, -4, 5, 0, 3, 4, 5, -4, -3, -4, -2, 2, -1, 3, 3, 0, 2, -2, 2, -4, 0, 4, -3, -4, -1, -5, 5, 3, 5, 2, -5, 3, 6, 1, -3, 0, -3, -4, -1, 0, 3, -4, -2, 3, -3, -3, 5, 0, -4, 6, 0, 2, -4, 0, 1, 2, 3, 5, -3, -3, 4, -5, -4, 6, -4, 5, 5, 1, 0, -4, 3, -4, 0, -2, 5, 2, 3, 0, -3, 5, 5, 5, 1, 2, 1, 1, 0, 1, 1, 1, -5, 5, 6, 4, -4, 5, 0, -5, -4, 4, 4, -1, 5, -1, -1, 0, 3, -4, 2, 3, 2, -3, -4, 6, 4, -1, 2, -4, 4, 5, 3, -2, 2, 0, -1, 2, 5, -4, 2, 3, 0, -5, 0, 2, 2, 0, 1, -2, 5, 2, -2, -4, -4, 5, -3, 2, -4, 3, -4, 2, 2, 1, 4, 4, 2, 3, 2, 0, 4, 4, 1, 5, 1, 1, -1, -3, 6, 5, -1, 5, 1, 5, -2, -1, 0, 4, 4, -2, 3, -5, 2, -3, 2, -4, 1, 2, -2, -5, -1, -5, 5, 2, -4, 3, -2, 4, -4, -3, 0, 4, 0, 5, -1, 0, -1, 4, -4, -1, -3, 3, 6, 5, 0, -1, -1, -4, 1, 0, 3, 5, 2, 3, -3, -3, -4, 4, -4, -2, 2, -2, -5, 1, -1, 1, 1, 1, -1, -3, -4, 4, 0, 1, 2, -3, 3, -1, -4, -3, -5, 5, -1, 3, 2, -3, 4, 4, 3, -3, -3, 5, 4, 3, -1, 3, 6, 5, -4, -2, -1, -3, 5, 5, -1, -2, -2, 5, 4, 5, 4, 2, 6, 3, -2, 1, -1, -3, 3, 0, 1, 5, -2, 1, -2, 0, 5, -2, 4, 4, 4, 5, -4, 0, 1, -4, -1, 2, 3, 0, 2, -2, 3, 2, -4, -2, -2, 4, -2, 5, 3, 3, 0, 4, 1, 4, 3, -2, 4, -3, -2, 1, 5, 4, 5, 0, 4, 5, -1, 3, 0, -4, 4, 2, 2, 2, -1, -5, -4, 2, 4, 5, 5, 3, -2, 1, 1, 4, 3, 2, -1, 2, -3, 2, 0, 2, 6, -1, -3, 3, -3, 5, 2, -2, 1, 1, 5, -3, 2, -1, 2, 3, -1, -5, -4, -1, -2, 0, -2, 3, -1, -3, 4, 1, 3, -4, -1, -5, -2, 0, -2, -4, 0, 3, -5, 0, 3, -4, -1, -1, -2, 3, 0, 1, 3, 4, -2, 0, -3, -2, 4, 1, 1, 3, -1, -4, 3, 3, 4, 4, 4, -3, -2, -4, -2, 1, 2, -1, -2, -1, 6, 3, -4, -2, 0, 0, -4, 3, 2, 3, 2, -4, 3, 6, 1, 5, -2, -3, 2, -4, 0, 1, 0, 5, -3, 2, -5, -4, 5, 1, 2, -4, -3, 0, 1, -4, 0, 3, 4, 5, -3, 3, 3, 4, -4, 1, 5, 1, 1, 3, 5, -1, 5, -3, -3, 4, -1, -2, 4, -4, -2, -1, 2, 2, 4, 2, 3, 2, 4, 2, 1, 1, 4, -5, -5, -5, 3, 1, 3, -3, 4, -4, 4, -4, 3, -4, -2, -1, 1, 3, 2, 4, 5, 1, 3, 1, 3, -3, 0, 2, 5, -1, -1, -4, -1, -4, -4, -1, -3, -2, 1, -1, 1, 5, 4, 5, 5, -1, 2, -1, 3, -2, 3, 5, 0, 2, 4, 1, 3, 5, -4, 4, 3, 4, 3, -4, -3, -2, 5, 4, 2, 0, 5, -1, 3, 0, 1, -1, -2, -4, -2, 2, 2, -1, 0, 1, -4, -2, 1, -1, 2, 0, 1, -4, 5, 4, -4, 5, 3, -3, 1, 1, 1, -2, 5, -2, 2, 0, -1, 2, 0, -3, -3, -5, -1, 2, -1, 3, 5, -1, -1, 4, 2, 4, -2, -2, 3, 0, 1, 5, -5, -2, 0, -2, 6, -1, 6, 1, 2, 1, 4, 3, 5, 3, 1, -2, -1, -1, 0, -3, -2, -4, 0, -4, 0, 2, -5, 2, -3, -4, 3, 1, 3, -3, 3, 0, 2, -3, 2, 3, -3, -1, -1, -3, 1, 0, 2, 1, 5, -3, -1, -5, -4, 5, -3, 2, -4, 0, 4, -3, 1, 5, 4, 0, -4, -5, 1, -4, -1, 2, 5, -1, -3, 3, 2, 2, -1, -2, 0, 1, 6, 3, 1, -5, -3, -4, 4, 0, 3, 2, 6, -2, -3, -4, -2, 5, 4, 4, -1, -2, -2, 6, -1, 3, -1, 0, -4, 3, -4, 3, 2, -4, 5, -2, -2, -1, -3, 1, -3, 4, -2, 3, -4, 2, -2, 3, -4, -4, 4, -4, 6, -2, 2, 2, 5, -3, -4, -1, -2, 2, -1, -2, 1, -4, -4, -1, 2, -4, -4, 4, -3, 1, 6, 0, 4, 2, 3, 2, 5, 0, 4, 1, 5, 4, 2, -4, -1, 2, -3, 5, -1, 5, -3, 6, -4, 5, 5, -4, -4, 0, -4, 4, 4, -3, 2, -3, -2, -2, -3, -5, 5, -4, -4, -2, -4, -2, 1, -5, -3, -4, 0, -4, 3, 5, -2, 0, 4, 5, 1, -1, 4, 0, 5, -1, -2, -2, 5, -2, 5, 2, -4, 2, 2, 4, 0, -3, 2, 3, -3, 0, 3, 2, -3, 2, 1, -4, 3, 4, 2, 4, 2, 2, -3, 4, 2, 5, 0, -4, 4, 1, 3, 2, 5, -4, -1, -4, 1, 3, 1, 5, -4, -3, -4, 1, 3, -4, -5, -3, 3, -4, 4, 2, -2, 5, 5, 4, 5, 1, -1, 5, 0, -1, 5, 2, -1, 5, -5, 2, 5, -1, 5, 4, 3, -2, -1, 2, -2, -3, 1, 0, 4, -2, 0, -3, -3, 0, 5, 6, 0, 1, -3, 0, 0, -4, -3, -3, -3, -1, 1, 2, -4, 5, -3, 4, 1, 3, 6, -1, -1, 2, 3, 4, -1, -5, -2, 5, -3, 3, 0, 6, 0, -3, 2, 5, 0, 2, -1, 2, 2, -2, 2, -2, -2, -3, 4, 1, -1, 1, 3, 3, -2, 4, -2, 4, -1, -1, 1, 1, 3, -1, 5, -2, -4, -2, 2, -2, 5, 5, -3, 1, -2, 3, 1, -5, 4, 1, -3, -2, 4, -2, -2, 4, -3, 5, -3, -4, 1, 3, 3, -3, -2, 0, -4, 4, -4, 6, 1, 1, 2, 0, 4, 3, -3, 4, 4, 2, -4, 3, -4, -2, -1, 3, -3, -3, 4, 3, 2, 3, 1, 4, -2, -1, 0, 2, -5, 5, 3, 3, 5, 3, 4, 4, -3, 3, 4, -1, -4, 0, -4, -2, -1, 0, -4, 5, -4, 2, -1, 4, -4, 3, 4, 4, -4, -2, 3, 5, 1, 2, 2, 0, -4, -3, -3, 6, -4, 2, 2, 4, 2, 1, -1, 5, 5, 3, -2, 0, -5, -3, 6, -3, -1, 5, 4, -2, 6, -3, 3, -3, 5, 4, 2, 6, 0, -3, 1, -1, -5, -1, 3, -3, 2, 5, 3, 4, -2, -4, -4, 5, 3, -4, 1, 1, 5, 1, -3, 4, -4, 1, -3, -2, 0, -1, 4, 4, 3, 5, 5, -1, 3, -1, 1, -1, 3, -1, 5, -1, -1, 5, -1, 4, 2, -3, 4, -5, 3, -2, -4, -4, 4, 1, -1, -4, 6, 2, 3, 2, -4, 2, 0, 3, 5, 4, -4, -4, 1, 4, -2, 3, -2, -1, -4, -3, 0, 2, 6, -4, -1, 1, 1, -2, -3, 1, 2, 2, -4, -3, 3, -4, -3, 4, 3, 5, 0, -2, -2, 3, -4, -1, 0, 4, 0, -2, 1, 0, -1, 5, -5, 5, 0, 2, 3, 2, 4, 3, 2, -1, 6, 5, 0, -4, -3, 0, -5, -1, 5, 3, 5, -1, 1, -3, 3, 3, -5, -3, 1, -2, 5, -2, 0, -2, -4, -4, 6, 1, -3, 0, -1, -5, -3, 5, 2, 5, 0, 3, 0, 4, -5, 3, -2, 4, 4, 1, 3, -4, -2, 1, -2, -2, -2, -1, 5, -5, -1, 6, -4, -3, 0, 5, 5, -3, 2, -4, 5, 3, -1, 5, 3, 6, 3, -3, 1, 5, -2, 5, 0, -4, 4, 2, -3, 1, 1, 4, 2, -4, -1, -2, -3, 0, 2, 4, 3, 0, 2, -1, -3, 4, 2, -4, 3, -1, 1, 4, 3, -4, 1, -1, -2, 3, -4, -3, -4, 2, 0, -5, -1, -2, -2, -4, -5, 5, 4, -1, 1, 5, 2, 4, -1, 5, -4, 5, 2, -4, -2, 4, 4, 5, -1, -4, 4, 3, 1, -4, 3, 1, 1, 0, -3, 1, 0, 6, -1, 1, 6, -4, 6, 2, 0, 0, -1, 5, -2, 6, 4, 1, -2, -2, 2, 5, -4, 3, 0, -3, -2, 6, 5, 3, 0, 0, 5, 2, 1, 5, -2, 1, 3, 0, 2, -4, 5, 6, -2, 6, 4, -4, -1, 0, -3, -3, -4, -3, 4, 2, -5, 4, 0, 1, -4, 6, 6, -3, -2, 0, -4, -1, -2, 1, 0, 2, -5, -2, 3, 0, 0, 0, -1, 1, -3, -3, -3, 3, -3, 3, -5, 5, 3, 5, 3, -4, -3, 2, 3, 3, 3, -1, -2, 1, -3, -1, 1, 4, -2, 5, 0, 3, -2, 2, -4, -4, -4, -1, -5, 5, 0, 2, -4, 2, 1, -1, -2, 0, 4, 4, -3, 5, 4, -2, 0, -2, 1, 5, -1, 5, 5, -3, -2, -2, -2, 2, 5, 4, -3, 5, 5, 6, 3, -2, -1, -4, 5, 3, 1, -5, 5, 3, 6, 1, 2, -5, -1, 6, -3, 1, 2, 3, -3, 1, 5, -2, -3, 1, 3, 0, 0, 1, -4, 5, 3, 5, -1, -4, 0, 0, -3, 4, 6, -2, -2, 4, 2, 1, 3, 4, -2, 3, -2, -2, -4, 5, -2, 4, 1, 5, 0, 2, -4, -2, -2, -2, -2, 4, 0, 2, -2, -2, 6, -2, 0, 0, -2, 0, 2, -5, 0, -1, -4, -1, 2, 3, -3, 4, -3, -3, 2, 5, 4, -2, 4, 6, -4, -1, -3, 2, 6, -4, 5, 4, 3, 5, 5, 4, -2, 3, 1, -2, 1, 0, 3, 5, 2, 0, 0, 4, -2, -2, 5, 4, 0, -1, 5, 5, -2, 2, 2, 5, 0, -2, 3, 2, -4, -5, -3, -3, -3, 0, 5, -4, -2, -4, -3, 0, 3, -1, 0, -3, 4, -5, 3, 4, -1, 0, 2, 1, 0, 6, 4, 2, 5, -4, 6, 2, 4, 1, 3, -2, -5, 3, 3, 2, -4, 2, 5, 2, 4, -1, 0, 0, -4, 0, 4, -3, 3, 1, -4, -3, 5, 5, -1, 3, 5, -2, -2, -2, -4, 3, -1, 1, -1, 4, -2, 4, 1, -1, -3, 2, 3, 0, 2, 1, 4, 5, 4, 6, -4, 2, -2, -1, -4, 1, 3, -4, 3, 2, -4, 6, 3, 4, 0, -5, 1, 3, -2, -4, 2, -1, 0, -3, 3, 4, -5, -1, -3, -3, -4, 0, 5, 3, 5, 3, -3, -3, -4, 0, -2, 1, 1, -4, -3, 3, 3, 5, 4, 4, 1, -4, 6, -1, 4, 1, -1, -4, 3, -5, 4, 4, 3, -4, -3, 6, -1, -1, -2, -4, 0, 5, -2, -2, 2, -4, 3, 4, -1, 6, -2, -3, 4, 0, 1, 0, 2, -4, 5, -3, 4, 5, -2, -1, 6, -2, 3, 4, -4, 3, 4, -2, 3, 0, 5, 2, -4, 0, 2, 3, 0, 0, 0, 2, 6, -3, -3, 3, -4, 5, -5, -2, 3, 2, -2, 6, 4, 1, -3, 0, 2, 0, 1, 5, -2, 6, -1, -3, 4, -3, 2, 2, 5, -1, 3, 2, 0, -2, 3, -3, -1, 2, -3, -3, 4, -1, 2, 2, 1, 1, -5, 1, 1, 2, 1, 3, 5, 5, 1, -3, 0, 2, -2, -1, -4, 1, -4, -4, -5, 2, 0, 0, 6, 2, 3, 4, 5, -3, -1, 2, 1, -4, 1, 5, -1, 4, 5, -4, 0, 3, 4, 0, -1, -1, -1, -4, -2, -4, 1, 6, 0, 3, 1, 1, 2, -2, 3, 2, -2, -3, 0, 5, 0, 3, -4, -1, 6, -3, 5, 1, -2, 3, -2, 0, 1, -1, -1, -4, 2, -4, 2, -2, 2, 2, -2, 4, 3, 2, 2, 0, 5, 2, 5, 0, 5, -4, -1, -5, 0, 3, 0, -3, 5, 4, -1, -1, 4, 5, -1, -3, -3, -1, 0, 4, 2, 3, 1, -3, -1, -2, -2, 1, 1, -1, 0, 5, 1, 2, 2, -3, 1, 4, -1, 0, 4, 4, 3, 4, 1, 5, 3, 4, 6, 2, 5, -2, -3, -2, 4, -3, 6, -2, -4, 2, -1, 4, 5, 4, -5, 4, 1, 6, 3, 5, -4, 1, -2, 5, 2, 0, 2, -3, 3, 0, -2, 4, -4, 2, 1, 3, -3, 3, 4, -2, 5, 5, 1, -2, 5, -4, 5, 3, 0, 1, -3, -5, -3, -5, -3, 2, 4, 2, 0, 2, 4, 2, 1, 2, 2, 3, -4, 5, 2, 4, 3, -1, -1, 1, -2, 2, 1, -1, 3, 0, -4, 2, 4, -3, -3, -3, 5, -1, -5, -3, -1, 4, -4, -2, 0, 2, -3, 4, 3, -1, 4, 1, 3, 4, 4, -1, 3, -3, 4, 2, -1, 5, 2, 1, 0, 1, 2, 6, 5, -1, -1, -1, 4, 1, 2, -2, 2, 5, 5, -2, -4, 0, 6, -1, -1, -4, -2, 1, 1, 0, -5, 0, -5, -2, 3, 3, 0, -2, 2, -5, 5, 5, 2, -3, -2, -1, 4, 5, 2, -1, 3, 0, -1, -4, 0, -3, 4, -2, -2, 6, -5, 4, 5, 5, -2, -1, 0, -2, -3, 1, 5, -5, 3, -3, -3, 1, 1, -5, 2, 3, 3, 0, -3, 2, 3, 3, -3, 2, 0, -3, -1, -5, 5, 2, 2, 3, 4, 5, 5, 2, -1, 6, 4, 4, 2, 0, 5, -2, 4, 0, 5, 1, 4, -4, 0, 4, 1, -4, -1, -1, 0, 6, 1, -1, 5, -5, 2, 1, 5, 1, 0, 6, 5, 3, 2, -4, -3, 5, -2, -1, 3, -1, 4, -2, 1, 4, -4, -3, 1, -5, -1, 4, -3, 4, 2, 0, 2, 4, 4, 0, 5, -2, -1, 1, 0, 3, 2, 1, 0, 1, -2, 1, 0, 5, 2, -5, -5, 1, -1, 5, 5, -4, -5, 3, -2, -2, -2, -5, -2, -3, -4, 0, 4, -2, -4, 5, -1, -5, -5, 1, 2, 3, -2, -3, -1, 4, 3, -4, 0, -1, 5, -2, 4, -4, 0, 1, 4, 0, -1, 5, -1, 0, -4, -1, -3, -1, 0, -3, -4, -4, 0, 2, 0, 3, 5, 5, -3, -2, 5, -2, 1, 3, 1, -1, -2, 4, -3, -2, -1, 1, 3, 0, 3, 0, -1, -1, 1, 5, 1, 5, -3, 3, -3, -3, 0, 3, 5, 5, -1, 4, 1, 0, -1, 6, -1, 2, 3, -4, -3, 2, -4, 3, 0, 0, -4, -1, -2, 4, 1, 3, 6, 1, 4, 5, -5, -3, -4, 3, 3, -4, 3, 0, 4, -4, -3, 4, 1, 2, -2, -1, 3, -2, -2, 1, 2, -4, 2, -4, 3, 4, -2, 1, 0, -3, 4, 2, 5, 5, 0, 0, 0, 3, 0, 0, -2, -2, 5, -1, 1, 6, -3, -1, -1, -2, 0, 3, 1, 2, 2, 0, -4, 1, -2, -4, 5, 5, 2, 4, -5, 4, 4, -2, -3, 2, -4, 2, 2, 0, 4, 5, -1, -2, -2, -3, 1, -3, 3, 2, -5, -3, 1, -2, 4, 4, 5, -3, 0, -1, 3, -2, 2, 0, 2, -1, 5, -2, -2, -1, -1, -4, -4, 4, -2, 4, 6, 3, -1, -2, -4, 0, 1, 1, 2, 5, 0, 5, 1, 5, 4, -2, 0, -1, -5, 3, 3, -1, -4, 1, -2, 4, 0, -4, 2, -5, 5, 2, 2, 0, 3, 3, 2, 2, -2, 1, 1, 3, 3, -2, 1, 4, -2, -4, 0, 2, 6, 3, -2, -2, -1, -1, 1, 5, -3, 6, 3, -4, -2, -1, -5, 4, 4, -2, 5, -4, -1, 3, -1, -4, 0, -2, 5, 4, 5, 1, -4, -1, 1, -1, 4, 2, -3, 2, 5, -3, -1, 6, 6, -2, -2, -1, -3, -2, -5, 0, 4, -2, 5, -4, -3, 6, -1, 0, 2, 6, 0, -4, 1, 2, 3, -1, -2, 2, 0, 4, 4, -2, 0, 6, -1, 0, 5, 5, -1, -3, -4, -1, -4, 3, 4, 5, 0, 1, 4, 0, -3, -2, 2, 1, -2, 4, 3, -4, 3, 3, -4, -1, 0, -4, 2, -2, 2, 3, 2, 5, -3, 1, 5, 4, -4, -1, 1, 6, 4, 5, 2, -5, -1, -1, -1, 1, -3, -2, 3, 4, 3, -5, 4, 1, -2, -4, -1, -3, 2, 5, 3, 2, -5, 6, 0, 0, 6, 4, 0, 2, -1, 0, 2, 0, 2, 1, 3, -1, -2, -3, 0, 5, 4, 3, 1, 6, -5, 1, -3, 2, -2, -3, 1, -1, -1, 5, 2, -3, 5, 6, 1, 5, 3, 5, -3, -3, -2, -2, -4, -1, -3, -2, -4, -1, 1, 4, -1, -3, 5, 5, 1, 4, -4, 1, -2, 2, 4, -5, 4, -2, 1, 5, -4, -1, -3, 1, -3, 3, 5, 2, 2, 2, 5, -4, 2, 0, -1, 4, 5, 4, 3, -4, -3, -4, 1, 4, 1, 5, 3, -4, -4, 2, 4, -1, 1, 2, -1, 0, 4, 5, -4, -2, -1, -5, 1, 0, 1, 1, 5, 6, -2, 5, -1, 4, -4, -2, -2, -4, 1, 6, 3, 1, 0, 2, -4, 5, 6, 4, -3, -1, -4, 6, -3, 5, -3, 0, 0, 0, 3, 2, 4, 4, -5, -4, -3, 4, -3, 2, 6, -2, -3, 4, -4, -4, -4, 2, -1, 1, 0, -1, 6, 2, 2, 6, 1, 6, -1, 1, -4, -3, 4, 6, 2, 4, 4, 2, 1, -3, 1, 5, -4, 5, 3, 5, 1, -3, 5, 5, 2, -3, -2, 1, 5, -3, -1, 4, -2, -1, 1, 2, 2, 0, 5, -2, 2, -4, 0, 1, -2, 6, 2, 5, 6, -4, -3, -4, 3, 0, 1, -3, -3, -1, 0, -1, -2, 4, 1, -3, 5, 4, 1, -2, 0, 3, 5, -4, 3, 4, -1, 0, -3, -4, 3, 4, -3, 4, -5, -1, -3, 5, -4, -4, 2, -3, -2, 3, 4, 5, -2, 4, -3, 0, -3, -1, -4, -1, 0, 5, -3, -1, 1, 4, -4, 5, 0, 1, 3, 0, -1, 0, 1, 0, -1, -4, -3, 1, 0, -1, 5, 1, -1, 2, 0, 4, 1, 1, 3, 0, -2, 3, 1, 3, 3, 4, -4, -4, 5, -4, -4, 5, 4, 5, 5, -2, 5, 2, 3, 6, -1, 0, 5, 3, 2, 2, 4, 2, 5, 5, 4, 2, 3, 1, 0, 2, -4, -2, -3, 5, -4, -5, 4, -2, -4, -1, 1, 4, -5, 0, -3, 3, 0, 1, 5, -1, 1, -4, 2, 6, -2, 3, 0, 2, 0, 0, 2, 1, -4, -4, -2, 1, -1, 2, 0, -2, 5, -2, -2, 3, 6, 3, -4, 3, -3, -1, -3, 2, -1, 0, 1, -3, 1, 5, 4, 1, 1, -4, -4, 2, -4, 0, 1, 1, -3, -4, -4, 5, -5, 4, -3, 3, 4, -2, 1, 0, 1, 4, 2, -1, 0, -1, 5, 3, -3, 2, 3, -1, -1, 0, 1, 2, -3, 2, 2, -4, 3, 0, 1, -3, 5, 3, -1, 3, -5, -4, 4, -1, 5, -3, -1, 5, 4, -3, -3, 3, 5, -1, -3, 1, 4, -3, 4, 2, -4, 3, 4, -2, 4, 1, 1, -4, -3, 5, -1, -1, 4, 6, 3, 3, -2, -1, -3, 3, 0, -3, 3, 4, -2, -4, 6, -3, 0, 1, -3, 5, -3, 2, -1, 5, -1, 2, 5, 5, 4, -4, 3, -4, 0, 2, -2, 5, 3, 3, 2, -2, 0, -2, -5, 5, 0, -4, 4, -1, 0, -1, 0, -4, -1, -2, -3, 4, 4, 5, 4, -4, -5, -4, 5, 6, 2, -2, 2, 2, 0, 4, 3, 0, 5, 5, -1, 1, -4, 3, 5, -2, -3, 5, 4, 4, 3, 5, 4, 5, 3, -3, 1, 2, 2, 2, -3, 0, 5, 3, 1, 1, 4, -3, 4, -1, 2, -4, -2, -3, 4, -4, 2, 3, 4, 5, -2, 5, -5, 3, 5, -3, -1, 6, -4, 5, -2, 5, 2, 3, 4, -3, -1, 0, -4, 6, 1, 5, -3, -2, 3, 4, -2, -4, 5, -4, 5, -1, 3, -3, 3, -4, -4, 3, 6, -4, -2, -4, 3, 3, 1, 2, -3, -3, -5, 0, 5, -4, 1, 0, -1, -3, 4, 5, -4, 0, 4, 5, -1, -2, 2, 1, 0, 0, 4, -2, -3, 3, 3, -4, 1, 1, 5, 4, 0, 6, 4, -2, 1, -3, 2, 2, -3, 0, 0, -2, -3, 0, 3, 1, 1, -4, -5, 3, -2, 0, -1, -2, 4, -2, -5, -4, 5, 5, 4, 1, -2, 0, -1, 5, 3, 5, 4, 0, 1, -1, -3, 2, 1, 3, 0, 0, -2, 0, -1, 3, -4, 4, 4, 0, -1, -1, 3, 0, -2, 2, 1, 2, -1, -3, -3, -2, 4, 2, 5, 3, 5, 5, 4, 0, -3, -4, -2, -1, 0, -2, 4, -1, -5, 3, -5, 4, 0, -2, 4, -5, -2, -3, 3, -4, -2, 2, -2, -2, 1, -4, -4, 4, 0, -3, -3, -3, 1, 3, 2, 1, -3, -3, 3, -5, -1, 4, 1, 1, 2, -1, 1, 5, 6, -1, 1, 0, -2, 0, -3, 5, -3, -3, 4, 3, 1, -1, 1, 0, 1, 2, 1, -3, -2, -2, 0, -3, -4, 5, 1, 2, -1, 3, 6, 2, 5, 6, 6, 3, 4, -2, 3, 4, 3, -3, 4, 6, 1, 5, -1, 4, -1, -1, -1, -2, -1, 5, 1, 2, -3, 5, -1, -3, -3, 6, 3, 0, 1, 4, 5, 2, 1, -2, -1, 5, 3, 5, -3, 5, -3, 3, 1, -5, 2, 4, 3, 2, -3, -4, 3, -3, -2, 4, -4, -4, 0, -1, 5, -5, 5, 2, 5, -3, 4, 4, 2, 6, 1, -2, -4, -3, 5, 5, -5, 1, 3, -4, 2, 4, 2, -2, 4, 5, 5, -1, 4, 4, -3, 0, -5, -3, -4, 2, 1, 0, 0, 6, -3, -1, -1, 4, 1, -2, 0, -2, 0, 2, -4, 1, -2, -3, -4, 6, -3, -2, 1, -2, 2, 1, 4, -1, 4, -4, 4, 3, 6, 4, 2, -3, -4, -3, -4, -2, -2, -2, 3, 5, -3, 2, -2, 3, 0, -4, 1, 3, 5, 2, 4, -1, 1, -4, 0, 3, 0, -3, 5, 0, -4, 0, 0, 5, -4, 0, 2, 3, 6, 4, -4, 0, 3, 5, -4, 4, 2, 0, 3, -4, 3, 2, 1, 3, -2, -5, 3, 5, 0, 2, 3, 6, 5, 4, -1, 0, 1, 4, -3, 1, -3, 3, -4, 0, -3, 5, 2, -3, -2, 3, 2, 1, 1, 0, 5, 6, -2, 1, 0, 0, 6, -2, -4, -1, -5, 2, -4, 0, 3, 3, -4, -3, -1, 2, 2, -4, 1, 6, 1, 4, 4, -1, 5, 5, 2, -3, 0, -2, -3, -3, 1, 1, -1, 5, -4, -4, -4, -3, -1, -5, -1, 0, 5, -4, -2, 0, 4, 3, 5, -1, -2, -4, -1, -3, 5, 2, -2, 2, 6, -1, 3, 4, 0, -2, -5, 3, 2, 4, 1, 5, -5, 3, 3, -2, -4, 0, -2, 0, 4, 1, 2, -2, 3, -1, 3, -1, -5, 0, -4, -4, 1, -3, -1, -4, 2, 0, 5, -2, -1, 3, 0, -2, -3, -1, 3, 4, 1, 5, -1, 5, -1, 1, 3, -4, 0, 1, -3, 4, -2, -1, -3, -2, 1, 0, 2, 0, -1, 3, 0, -2, -2, 2, 3, -2, 6, -4, 4, -3, -5, -2, 2, 3, -2, 5, 3, -1, -2, 4, -1, -2, -2, 4, 4, 0, 3, 2, 1, 5, -2, 4, -1, -2, 1, -2, 5, 0, 1, 4, 0, 5, -2, 3, -4, -1, -4, 2, 1, -1, 2, 3, -3, -4, -3, 3, 2, -4, 1, 4, -4, 3, 3, -3, 3, -1, -4, 3, 4, -1, 1, 1, -2, -1, -4, 4, -3, 3, 2, 5, -1, 5, 0, 3, -3, -2, -1, -4, -3, 2, -2, -2, 2, 4, 5, -3, -1, 0, -1, -1, 0, 2, 0, 5, 3, 4, 0, 0, -1, -3, -3, 0, 1, 0, 1, 3, 2, -2, 0, 4, 0, -5, -4, 5, 4, -1, 1, -1, -2, 2, 0, 4, -2, -3, 2, -2, 4, 4, 1, -3, 3, 4, -2, 0, 4, 3, -1, -4, -1, 6, -1, 5, 6, -2, -1, -3, -4, 5, -1, 2, 3, 4, 1, 5, 4, -4, 3, 0, 3, 2, -4, -3, -4, -4, 3, -3, 2, -2, 1, 4, 6, 4, -4, -1, -4, -3, 0, 3, -3, -2, 0, -1, -5, -1, 3, -2, -3, 6, 4, -2, -2, 2, -4, 5, 3, 1, 0, -1, 2, 0, 3, 3, 3, 5, -2, -1, -5, -1, -3, 3, 2, 2, 1, 3, 0, 5, 3, 1, 3, -2, 4, 3, 2, 1, 2, 1, 1, -4, 4, -2, -4, 2, 4, -1, -3, 0, -4, 4, -3, -2, 5, 1, 2, 0, 0, 3, 5, -2, 1, -3, 3, -4, 2, 4, 2, -1, 4, -2, -3, -2, 5, 6, -1, 0, 4, -3, 4, 2, -2, -2, 3, 3, -3, 2, 1, 2, -3, 3, -3, 2, 5, -2, 1, 0, -3, -4, 3, 1, -4, -4, -1, -1, 1, 0, 3, -1, -1, 3, -2, -1, -1, -3, -2, -2, 3, 6, -1, 3, -1, -2, -2, 3, 1, -3, -4, 1, 2, -2, -2, 5, -3, -1, -3, -5, 1, 2, -3, 4, -2, 3, -3, 1, 4, 0, 2, 5, -2, 2, -2, 0, 2, 3, 4, -1, -1, 2, -4, 3, -4, -4, 4, 2, 4, 4, -4, -5, -4, -5, 5, -2, -5, -2, -1, 2, 6, 1, 4, -4, 3, -1, 3, -2, -1, 2, -2, 0, 4, 2, 5, -2, 5, -1, 1, 4, 0, 0, -1, -2, -1, -4, -1, 0, 0, 5, -4, 3, 2, 2, 4, 1, 2, -3, 1, -4, -4, -2, -1, 2, 2, 3, 4, 5, 1, 1, 4, 0, -3, 4, 3, 6, 2, -3, 3, -4, 5, 2, 0, 1, -3, -2, -1, 1, -1, -2, 1, 2, -3, 5, 2, 0, -4, 3, -4, 3, 5, -5, 2, 3, 4, 4, -2, 2, 1, 3, 2, 2, -2, 0, 5, -4, 0, 1, -3, -4, -5, 2, -3, -4, 2, -4, 2, -2, -3, 3, 4, 4, 3, -2, 1, -3, 5, 2, 4, -2, -2, -3, 6, 6, -3, 4, 5, 1, -4, -4, -3, 5, -1, -4, 4, -1, -3, 2, 2, -4, 6, 4, 5, 5, 1, -4, 1, -1, 3, 4, 4, -1, -4, -3, -3, -3, -5, 4, 3, -3, 3, 5, 5, 4, 3, 2, 1, -5, 4, -5, 4, 3, -3, -2, 3, 4, -1, 3, -1, 4, 3, -2, 0, -3, -5, -4, 1, 1, 4, 1, 2, 0, 1, 3, 6, 2, 5, 2, 2, -1, -4, -3, 3, 1, 5, 5, -1, 0, -1, 6, -3, 5, 4, -1, -3, 4, -3, -2, -2, 1, -3, 0, -3, 3, 1, 5, -1, 1, -4, -5, 2, -2, -5, -3, -2, 0, -5, 3, -1, 1, -3, -2, -2, -1, -3, 5, 0, -2, -2, -5, -2, 5, 5, -3, 1, 4, -4, 1, 2, 3, 3, -4, -3, -4, 4, -1, -4, -3, -4, 2, 2, -4, 3, -2, -1, 0, 4, -3, -1, -4, 0, -3, -3, 2, 3, 4, -4, -1, 5, -2, 3, -3, -3, -3, 6, -4, -1, -4, 4, 2, 3, 4, 4, -4, -3, 5, -1, 4, 3, 3, -1, -2, -1, 4, 3, 3, 2, 5, 0, -4, -4, -2, 0, 4, -2, 3, 3, 6, -2, -4, 0, 4, 0, 2, 2, 1, 4, -3, 3, -4, 3, 5, 3, -4, -4, 4, -1, -3, 1, 1, 4, 2, 0, 0, 3, 3, 0, -4, -4, 4, 4, 1, 2, -5, 1, -4, -3, 2, -1, -1, -3, -4, 1, 3, 2, 4, -3, 6, 4, 0, -2, 2, 4, -2, -1, 4, 3, 5, 5, 1, 3, 5, -4, -4, -4, -5, 3, -3, 5, 5, -2, 1, 4, -3, 1, 4, 3, 1, 3, 2, 4, 3, -4, -2, 5, 3, 2, 3, 3, -3, -3, 1, 5, -2, 1, 5, -3, -2, 2, -2, -1, 0, 5, 1, 4, 2, 3, 5, -2, 0, 3, -3, 5, 3, 5, -1, 1, -3, -2, 4, 2, -4, -3, -4, 3, 6, 3, 0, 0, 6, -5, 3, 0, -4, -3, -2, 1, 3, 4, 0, -2, 0, 1, -1, 3, -1, 2, 3, -4, -1, 2, 0, -1, 0, -3, 0, 1, 3, 4, -1, -3, 5, -2, 1, -1, 5, 0, -1, 2, -3, 3, -2, -1, 4, 0, 5, -2, 3, 1, -2, 3, 0, -3, 1, 6, 1, 4, -2, -4, 2, 0, 4, -4, -2, -1, 2, 3, 3, 3, -3, -4, 1, 1, 2, 0, 0, 5, 6, 5, -1, -5, -1, 4, 5, -3, -3, 1, 0, 4, 0, 6, -4, 6, -1, 2, -1, -4, -4, 2, 5, -2, -4, -2, 4, -1, 0, -1, 4, 5, 5, 4, 3, 3, 4, 3, -4, -1, -2, 3, 2, 1, 2, 0, -3, 5, 4, -1, -3, 0, 5, -5, 0, -2, 2, 4, 1, 0, 6, -3, -2, -1, 2, 1, -1, 0, 2, -1, 5, -2, -1, 4, 1, -1, 5, 0, 1, -4, 4, 3, 2, -3, 4, -4, -3, 1, -5, 0, -3, 1, 4, 3, 0, 6, 0, 1, -4, 1, 2, -1, -1, 5, 2, -4, 0, 1, -1, -1, -1, 4, 1, 1, 5, -1, 0, -4, 4, 5, 0, 5, -2, -3, 4, 5, -4, 1, -4, 5, -1, 3, -3, -3, -5, -1, -2, -2, -3, -1, 0, -2, 0, -3, -1, 2, 3, -4, 5, -1, -3, 3, 3, -1, 2, -4, -2, 0, -3, 0, -5, -4, 2, -4, 0, 3, -3, -2, 5, 5, 1, 3, 2, 5, -4, 3, 6, -3, -1, 5, -4, 2, -3, 5, 0, 0, -4, -3, 2, -1, 0, 1, -5, 2, -5, 5, 1, 2, -4, 1, -4, 5, 4, -1, -2, 2, 5, 6, 4, 0, 0, 0, 4, -3, 1, 3, -3, 2, -3, -3, 3, 4, 2, 0, -1, -1, 4, 2, 5, 1, -2, -3, -5, 0, -4, 6, 4, 1, 4, 2, 5, 2, 1, 5, 3, 1, -4, 4, -4, 0, -3, -5, -4, 5, 4, 2, 5, 0, -1, 1, 5, -2, 0, -4, 5, -2, -4, 5, 4, 1, -1, -4, -3, 4, 1, -1, 3, -2, 4, -1, -2, 5, -3, -2, -2, 4, 0, -4, -3, -1, 4, 4, 0, 0, 5, 3, 5, -4, 5, -1, 5, -1, 6, 1, -2, 4, 6, -1, -4, -1, 5, -3, 2, 3, -1, -4, 6, 4, 6, 0, -4, 2, 2, 5, 5, 0, 5, 1, 1, -2, -1, -4, -4, 0, -2, 0, -1, -2, 3, -4, -2, -2, -3, 3, 3, 5, 1, 4, 2, 5, -4, 0, 3, -3, -3, -4, 5, -4, -3, -1, 4, 2, -3, 3, -4, 0, 0, -2, 4, 5, 2, 2, 1, 1, -3, -3, 5, -1, 2, -4, -2, -2, 3, 0, -4, 3, 5, 1, -2, -2, 2, -3, 5, -1, 0, 4, 2, -3, 4, -3, -4, 5, 3, 0, -1, -2, 1, -2, -4, 1, 5, -3, 3, -2, 4, 2, -5, 4, -2, -4, 5, 4, 3, 3, 4, 5, -4, -1, 4, 6, -1, -2, 0, 6, -3, -5, 4, 3, -3, 3, -3, 4, -3, -4, 3, -1, 5, -3, -4, -1, -1, -4, 5, 3, 6, 0, -4, 2, 5, -1, -1, -2, 5, 5, 6, -4, 2, -1, -2, 1, 6, 5, 3, 3, 1, 3, 4, -4, -2, 2, 2, 6, 5, -4, -5, 3, -3, 5, 0, 2, 3, -1, 0, 1, 1, 2, 4, -4, -1, -1, -2, -5, 1, -4, 4, 1, 6, -4, -2, 0, -3, -4, -4, 3, 1, 0, 0, -5, 4, 1, -4, -3, 4, 2, 2, 5, 2, -2, 3, 3, 1, 2, 2, -1, 1, -1, 2, 4, 5, -4, 5, -4, 0, -2, 1, 4, -4, 3, -4, 4, -4, 3, 1, 3, 0, -4, 4, 5, 5, -4, -2, -4, 5, -1, 3, 0, 6, 5, 2, 5, 0, 4, -4, 4, 2, 1, 4, -3, -3, -4, 6, -1, -3, 1, 5, -2, -2, -1, -1, 2, -3, -5, 2, 1, 2, -3, -3, -3, -2, -2, -1, 0, -4, 4, 2, 2, 5, 3, 3, -1, 5, 5, 2, -1, -2, 1, 0, 4, 5, -4, 0, 5, 2, -4, -4, 2, -3, 1, 1, -2, 0, -3, 4, 3, -1, -5, -4, 4, 3, -5, 5, 1, 5, 4, 1, -1, 3, -3, 5, 4, -1, 2, 6, 3, 0, 4, 6, 4, 3, 5, -2, -4, -1, 0, 2, -2, -2, -1, 3, -3, 4, 4, -2, 2, 5, 5, -3, -1, 5, 4, -3, 1, 1, -3, -2, 1, 2, 4, 6, 1, -1, 1, 0, 4, -3, 2, 1, 2, 1, -3, -1, 6, 4, 3, -1, 3, 4, 6, -1, -3, -1, -2, 3, 0, 3, 2, 1, 1, 5, -2, 5, -2, -3, -5, -2, 6, 1, 4, -4, 2, 3, 0, -2, 3, 4, 1, 5, 1, 3, 2, 0, 3, -4, 1, -2, 3, 2, 3, 5, 2, -2, -3, -1, 2, -2, -3, 1, 0, 0, -3, -4, 5, -1, -5, 6, 3, -3, 0, -4, 5, 4, 4, 3, 2, -4, -1, -1, 5, 4, 1, -1, -2, 4, 5, 1, -4, 4, 2, -3, -1, 0, -4, 3, 0, -3, 5, -2, -1, 2, -1, -2, -4, -2, 2, 3, 3, -4, -2, -2, 0, 4, -1, 1, 2, 2, 0, 4, -5, -4, 3, -4, 2, 3, 5, -3, 2, -2, 2, -1, 5, 6, 4, -4, -4, -1, 3, 3, -4, 0, 2, 2, -2, 1, 6, -3, -3, -1, 2, -2, -4, 2, 6, 5, 2, -2, -4, -3, 0, -2, 4, 1, 0, 4, 0, 3, -4, -1, -5, 5, 2, 6, 6, 2, -3, 3, 2, 5, -3, 1, -4, 0, -4, -4, 0, 2, -1, 0, -3, -1, -1, 4, 3, 4, -3, 1, -4, 5, -3, 5, -1, -2, 5, 0, -4, 5, 5, -3, -1, -3, -4, 3, 5, 4, 4, 6, -3, 3, -2, -2, 3, 0, 3, -1, -3, -1, 2, 3, -1, 3, 5, 6, 0, -1, -3, -3, 5, -1, -1, 2, -1, -4, 1, -3, 3, -4, -3, 2, -3, 3, 5, 3, -2, 0, 4, 3, -4, 5, 1, 5, -4, -3, 3, -3, 5, 1, 3, 5, -5, 4, 3, -3, -2, 2, 4, 0, -2, 0, -3, 4, 4, -3, -2, 0, 1, 4, 1, -2, -3, 6, -1, 4, 3, 1, 2, 3, 2, 0, 0, -3, -3, 3, -2, -2, 2, 4, 4, -1, 5, -1, 4, 0, -3, 2, 0, 6, 4, -2, 1, 3, -3, 2, 0, 2, -1, -1, -1, 2, -1, -3, -4, -4, 2, 4, 5, 0, 0, -3, 1, 3, 1, 0, -3, -1, -4, 5, 6, 4, 4, 5, 3, -3, 1, -4, -1, 2, 5, 4, -1, -2, -3, 1, -3, -1, 4, 2, -4, -4, 0, 0, 1, -3, 3, -2, 3, 1, -1, 5, -4, 2, 4, 5, 0, 3, -3, -3, -1, 3, -1, 3, 1, -1, -2, 5, -2, 4, 1, 5, 0, 3, -2, -3, -3, -5, 4, -3, -4, -5, -2, -3, 1, -5, 4, -3, -2, 4, 2, 2, -2, -4, -2, 4, -1, -2, -3, 5, 6, 5, 1, 3, 3, 3, -2, -1, 3, 2, -3, -3, -2, -1, -1, 1, 5, 4, -3, -2, 2, 2, 4, 3, 5, 3, -1, -3, 2, -1, -4, -4, 2, -5, 4, -3, -4, 5, 5, 1, 5, -3, 3, 3, -2, -2, 1, 0, 2, 2, -5, 0, -4, 4, -1, 1, 4, 3, 3, -2, -3, 0, -2, 1, 2, 2, 4, 2, 6, -3, 3, 5, 6, -4, -3, 3, -4, -1, 2, -1, -1, 3, 5, -3, 0, -3, 1, 6, -1, 1, 1, 3, 5, -1, -3, 1, 4, -2, 6, -1, 3, 1, 1, 1, -3, 3, 1, 2, 2, 0, 2, 4, 0, -4, -1, 0, 3, 4, 4, 1, -1, -4, -5, 4, 3, 4, -5, 2, 2, 6, 0, 2, -4, 2, 2, 1, 4, 5, -1, 5, 5, 5, -3, -5, 1, 6, 4, 2, -3, -5, -2, 3, 5, 2, -2, -1, 3, -1, 1, -1, 6, 1, 3, 0, 2, 3, -4, 5, -2, 4, 2, 0, 0, -2, 3, -1, 0, -1, 4, 3, 5, -4, -4, -2, 0, 1, 5, 1, -4, 5, 1, -1, -2, -2, 3, 4, -5, 2, 4, -2, -1, -5, 4, -1, -3, -1, -2, 2, -5, 4, -2, -2, -2, 2, 1, 6, -2, -3, 1, -2, 4, 4, 4, -2, 5, 4, -4, 5, 0, 4, 2, 6, 4, 4, 0, -3, -4, -2, -4, 3, 3, 6, 3, 5, -3, -1, 4, -2, -2, -3, -1, 0, -2, 0, -1, -2, -1, -3, 1, -4, 5, -1, -2, -1, 2, 0, 2, 3, -1, 1, -4, 0, -4, 3, 0, 0, 5, -2, 1, -1, -2, -4, 2, 0, 6, -2, -3, 0, -1, -3, 3, -2, -3, 4, -1, 3, 3, -4, -2, -3, 0, 5, -3, -4, 2, -1, 4, 3, -2, 5, -1, -3, 3, -1, -3, -2, 3, 0, -1, -2, 2, 4, -5, 0, -1, 1, -4, 6, 5, 1, -5, 3, 3, -2, 4, 4, 0, 5, 0, -3, -3, 1, 4, 4, 0, 1, -2, -5, -2, -1, -1, 3, -2, 4, 5, -5, -2, 2, 1, 3, 5, 5, 2, 2, 3, 4, 0, 4, -2, 2, 2, -4, 1, -1, 0, 0, -2, 2, 4, 0, -1, 4, -5, 5, 3, 0, 3, 5, -2, -4, 2, 2, -5, 0, 6, -3, 5, 2, 2, 4, -3, 0, 4, 3, 4, -3, 2, -3, 0, -2, 5, 4, 5, -2, -3, -1, -3, -2, 1, -1, 6, 0, 0, 0, 0, 0, 3, -3, -3, -2, -1, 0, -3, 3, -1, 5, -1, 5, -2, -4, -3, 2, -2, 4, 2, -3, -4, 4, -2, -1, -1, 0, -3, -3, 2, -3, -2, -2, 4, -4, 1, 2, 0, 2, 1, 1, -4, -3, 1, -2, -3, 5, 0, 1, -4, 4, -4, -4, 1, -1, 4, 1, -2, 0, 0, 3, 2, 5, 0, 4, -1, 0, 6, 3, -2, 0, 2, 0, -4, -3, -4, 3, -3, 6, 5, -2, -5, -2, -4, -4, 0, -3, 2, 3, -1, 4, 1, 1, 5, 2, 4, -1, 5, -4, 5, -4, -1, 0, -4, 4, 2, -1, 2, 5, -4, 2, 2, 0, 0, -2, 6, -4, -5, 0, -4, 5, 3, -2, -4, -2, -1, 0, 4, 3, -4, 2, -1, -4, -1, 1, 3, -1, 6, 4, 5, -4, 4, 3, 5, -3, -2, 0, 5, 5, -3, 1, 4, -3, -3, 0, -1, 4, 3, 4, -4, 0, 6, -2, -2, 0, 3, 1, 3, 3, 4, 6, -1, 4, -1, 5, 5, -4, -3, 4, 0, -5, 3, 5, 1, 1, 1, -2, 1, -2, 4, 2, 1, 1, -4, 4, 5, -1, -1, 3, 1, -1, 2, 5, -4, 5, -3, 4, 1, -4, 1, 0, -1, 5, 5, 3, -2, 6, 3, -2, 5, 3, 2, 0, -3, 1, -3, -3, -1, 3, 3, -3, 3, -4, 2, 4, 2, -1, 4, -1, 2, 2, 1, -4, 2, -3, -4, 5, -1, -1, -4, 5, 5, -4, 1, 2, -1, -2, 5, 6, 0, 0, 3, 3, 5, -3, -3, -3, -1, -4, 4, 5, 0, -3, 3, 4, 3, 3, 3, 6, 0, -2, 5, 5, 1, 5, 0, -4, -2, 3, -1, 3, -1, -5, 3, 1, -5, -4, 5, 0, 3, 2, 5, 2, -1, -1, -4, 5, 2, 3, 0, 5, 0, -4, -4, 3, -3, -1, 4, -4, 4, 3, 1, -1, -3, 0, 4, -2, 2, -4, -2, 0, -3, -2, 1, -1, 6, -3, 4, -3, 0, -3, -3, -2, 2, 1, 6, 1, 0, 4, -4, -4, 4, -5, 5, 2, 3, 1, 5, 0, 5, -5, 4, 1, 3, -4, 2, 0, -4, 3, -1, 0, 2, -2, -2, -4, 4, -2, 5, 3, 4, -4, 0, -4, -1, 4, 1, -1, 0, 5, 4, -1, -3, -4, -4, -5, -4, -4, 1, 1, -2, 0, -1, 1, -2, 5, 1, 3, -1, 4, 0, 0, -1, -5, 5, 4, 2, -2, 5, 0, -2, 1, -4, 5, -5, 6, 3, 2, -3, 3, -4, 1, 4, 1, -5, 5, -3, 1, 4, 6, -3, 2, 5, 0, -1, -2, -2, 4, 3, 1, -1, -2, -3, 5, 3, 5, 2, -2, 2, -3, 5, 4, -3, -2, 2, -4, 3, -2, 3, -1, -4, -5, 0, 4, 3, -3, 0, -4, 5, -1, 4, 4, -4, -4, 5, 2, 5, 0, -2, -4, 4, 6, -1, -4, 1, -4, -5, 5, -1, 4, -3, -1, 6, -3, 3, 4, 0, 0, -2, -2, 5, -1, -4, 2, -5, 1, 2, -3, 5, 2, -4, 4, -4, -3, 3, 6, 1, -4, 6, -1, -4, 1, 0, 1, 4, -2, 1, 1, 4, -3, 4, -4, 0, -1, -1, -2, 6, 5, -2, 0, -3, -1, 4, -5, 4, 0, -1, 2, 1, 1, 0, -1, -4, -3, -2, 4, 3, 3, 6, -2, 3, 0, -2, -3, 3, -3, 4, 6, 4, 3, -4, 5, 5, 1, 1, 4, 5, 1, -2, -2, 2, -1, 4, 3, -4, 1, 3, -2, -4, 6, 2, -5, -4, -3, 0, -4, 4, 1, 4, 3, 5, -1, 1, 0, 3, -2, 4, 3, 4, 2, 2, -5, 5, 6, 1, 4, 4, -2, 4, -1, 4, 0, 2, 4, -2, 5, 2, 2, -1, 0, -2, 5, -1, -1, -2, -2, 0, 1, 0, 6, 4, 0, 2, -1, -4, 0, 1, -1, 5, -2, -4, 3, 0, -2, 5, -3, -4, -2, 3, 6, -2, 1, 4, 1, -3, 5, 0, -2, -4, -4, 6, 6, -1, 2, -2, 0, -1, -1, -3, 5, -1, 1, 4, -1, 0, -1, -4, 5, -2, -3, -5, -4, -5, 4, -4, 5, 1, 6, 4, 5, -1, -2, 5, 4, -4, 4, 4, 3, 0, 4, -4, -2, 2, 6, -3, 2, -3, -3, -2, -4, 4, 3, -2, -3, -1, 0, 1, -2, -1, 3, 0, -2, 1, 0, -2, -5, 1, -1, -3, -3, 1, -2, 3, 4, 1, -1, 4, 4, 1, -5, 2, -1, -1, 4, 0, 3, -1, 1, 6, 4, 3, -4, 4, -2, -3, 5, -2, -4, -4, 3, 1, 2, -2, -1, -2, -4, 0, 3, 2, 2, 2, 1, -3, 3, 1, -3, 4, 2, -4, -3, 6, -1, 5, -3, -4, 3, 2, 4, 0, -2, -3, -1, 3, -4, 0, -3, 0, -4, -1, -3, -4, 5, 4, 2, 3, 1, -4, -1, 0, -1, -1, 0, 1, 2, 0, 1, 0, -4, -3, -3, -4, 1, 4, 0, 4, 4, 2, 1, 5, -3, -5, 4, -4, -1, -4, 0, -3, -3, 0, 3, 4, -5, 4, 2, -3, 2, 3, 4, 0, -2, 4, -2, 1, 5, -3, 4, -4, -1, -1, -4, 0, 0, 1, -2, -2, -2, -4, 2, 2, -3, 0, 2, 5, -4, 1, 2, -2, -4, -3, -5, 6, -4, 5, -3, 2, 4, 3, -4, -5, 3, 2, -1, 2, 4, -3, 6, 1, 0, -4, -1, 0, 0, 5, 0, -2, 0, 0, -1, 0, -4, 2, 3, -4, -4, 3, 6, -3, 3, 2, 4, 3, -4, 3, 5, 2, -1, 6, 5, -1, 4, -2, 5, 1, 4, 3, -1, 2, -1, 0, -3, 1, -3, 4, -1, 5, 0, 0, -2, -1, -4, -3, 2, 3, 0, 2, 5, -5, 4, 3, 3, -3, 5, 0, 4, 5, -1, 0, 0, 2, -3, 2, -2, -2, -2, -3, 2, -4, -2, -5, 0, 1, 0, -4, 2, 6, -5, -4, -2, -4, 2, 1, 4, -4, 3, 4, 4, -4, -3, 5, -3, 6, -1, 0, -4, -5, 5, 0, -4, 1, 2, -3, 5, 3, 5, -2, -2, 4, -5, -3, 0, 6, 3, 2, -3, -1, -2, 0, -5, -4, 1, 6, 2, 4, 2, -3, 0, -2, 2, -3, 0, -5, -4, 0, -1, -1, 6, 5, -4, 5, 1, -3, 2, 4, -1, 4, -2, 2, 1, 0, -3, -3, -1, 2, 2, -5, 5, -2, -1, -1, 0, 1, 3, -3, 1, -1, 0, -5, -2, 0, -1, 0, 2, 0, 3, 4, 3, -1, 1, -3, 3, 0, -1, -2, 0, 5, -4, 0, -2, 5, -4, 2, -5, 0, -4, -2, -1, 5, -1, -4, 6, 1, 4, 3, -3, 0, -3, -4, 6, 5, 4, 1, -3, 0, 2, -1, 5, 4, 4, -1, 5, 2, -1, 1, 2, -1, 4, -1, 2, -4, -3, 3, -1, -3, 5, -1, -4, 0, 1, 0, 2, 5, -4, 3, -3, -4, 3, 3, -1, 3, -1, 3, 2, -2, 1, -5, -1, -1, -3, -3, 2, -1, -4, 4, 4, 4, 2, 2, -2, 6, 3, 1, -2, 3, 2, 1, -2, -4, -3, 2, 4, 3, 6, 0, 5, 6, 0, 4, -3, -4, 4, -5, 3, -4, -1, -2, -4, 1, -5, 0, 2, -3, 5, -1, 1, -2, -2, -3, 1, -1, 3, -1, -3, -3, -4, 0, 0, 4, 4, -4, 2, 0, -3, 1, -4, 6, -4, -2, -4, -3, -2, 1, 2, 2, 5, 4, 3, 2, -3, -3, 5, -1, 4, 1, -3, -5, 5, -3, 0, 4, -2, -3, 5, 4, 0, 0, 0, -3, -4, 4, 0, -2, -5, -2, -1, -4, 0, -2, 1, 0, 6, -5, -4, 4, 4, 5, 1, 5, 6, -2, 2, 4, 4, -1, -1, -3, -3, 4, -2, 5, 2, 1, 2, -1, 6, 0, -2, -3, -4, 1, 4, 4, 1, 2, 0, 0, 5, 0, -1, -3, -4, 6, -5, -4, 0, -3, -3, 0, -2, 2, 4, -2, 0, -1, -1, 4, -4, 5, 1, -2, -2, 3, 2, 5, -4, 3, 1, 4, -4, -3, 2, 0, 3, -4, 6, -2, -1, 1, 4, 5, -2, -4, -4, 4, -2, 6, -1, 2, -4, 0, -4, 5, 1, 6, -3, 1, 6, -3, 0, -2, -2, 4, 0, 5, 0, 5, 0, 0, 2, 4, -3, 5, 3, 5, 3, 1, -4, 0, -4, 2, 4, 4, -4, 5, 0, 4, 5, -3, 2, 1, 3, -1, 2, -3, 1, -1, 4, 2, 2, -3, 4, 3, 1, -1, 1, 2, 6, 2, -2, -5, -4, -4, 1, -2, 1, -1, 2, -4, 2, -2, -1, -1, 2, 3, 3, 0, 2, -1, 6, 0, -3, 0, -4, -2, -4, 1, -2, 6, 5, 6, -2, 5, -3, -3, 4, 4, -4, 2, 0, 5, -5, -4, 5, 5, 2, -5, 2, 5, 4, 4, -2, 4, 5, -3, -2, -1, 0, 0, 1, -1, 4, -3, 5, 4, -3, -1, -4, 6, -4, 4, 4, 5, 4, 1, -3, 1, -5, 3, -1, -3, 2, 1, 0, 4, -3, -3, 3, -1, -3, -1, -3, 0, 5, -1, -2, 5, 5, -1, 4, -4, 2, 0, -1, 5, 1, -2, -2, 4, 3, -4, -2, -2, 2, -5, 0, 6, 1, 4, 0, 2, 3, -3, -4, -3, 0, -2, -1, 0, 5, 6, -4, -4, 2, 0, -3, -3, 1, -5, 0, 1, 1, 5, -3, -1, -2, -2, -3, 5, 3, -2, 5, -3, -5, 1, 0, 0, -1, 0, 0, -4, 5, 5, 4, -4, 0, 3, 5, 1, 3, 1, 1, 3, 5, 0, -2, -2, 0, 3, 1, 3, 3, 2, -2, -3, -2, -4, -3, -3, -1, 5, 3, 0, -4, 1, -2, 2, -5, 4, 2, -4, 1, 4, 2, 5, 6, -4, 2, -3, 4, -2, 5, 0, -3, 2, 2, 2, 3, 3, -3, 3, 2, 4, 3, -4, -1, 5, -3, -2, 0, 0, 5, -4, -2, 2, 3, 6, 5, 1, -5, 1, 4, -4, -1, 0, -1, 3, 4, 0, -2, 1, -4, 5, 2, -1, 0, -2, 3, 2, 2, -1, 4, 2, -3, 6, 0, 2, 5, 2, 2, 4, -3, -3, -1, -4, -3, 4, 6, 3, -4, 1, -4, 1, 4, 1, 5, 5, -5, 4, 0, -4, 3, -2, 5, 0, -1, 3, -2, -4, -4, 5, -4, -1, 5, -2, -3, 2, 3, -4, 1, 3, 3, 1, -4, 2, 5, -1, 1, -1, 0, 3, -1, 2, 4, -2, -4, 5, 3, 3, 2, -2, -4, 3, -3, 2, 3, 1, 4, 2, -5, 1, -3, -3, -2, -3, 4, 4, 4, -2, -2, 2, -3, 3, 5, -3, -3, 5, 2, 1, -4, -3, -4, 5, 5, 1, 1, 2, 5, 5, -4, -4, 4, 2, 0, -4, 5, 0, 3, 3, 3, 5, 6, -4, 5, 2, 1, -2, -2, 5, 0, 5, -1, 0, -1, 1, -1, -2, 2, -4, 5, -5, -4, -3, 3, 0, 4, 0, 0, 0, 4, 5, 2, 0, 3, -4, -3, -1, -4, -2, -1, 2, 2, 4, 1, -5, 5, -3, -2, 2, -3, -3, -1, 2, 6, 4, -4, 0, 0, -4, -3, 5, 2, 2, 0, 5, 4, -4, 4, 0, 5, -4, 1, 5, 5, 5, -2, 2, -4, -4, 4, -2, -3, -2, -4, 3, 1, -1, 3, -4, 1, -2, 0, -3, 5, 2, -5, 1, -5, -1, 0, -2, 2, 6, -2, -3, -5, 1, -4, 4, 5, -1, -2, 5, 4, 5, 0, 1, 3, 6, 5, 1, 0, 3, 5, 3, 6, 2, -4, -1, -2, 3, -2, 0, 4, -1, 4, -2, 3, 4, 3, 4, 4, 2, 1, 0, -1, -1, -2, 2, -4, 4, -3, 2, -4, -3, 5, 4, -3, 5, -4, 2, 3, 2, 0, 0, 2, -1, -2, -4, 3, 0, 0, 1, -2, -1, 1, -4, 2, 0, 4, -1, -2, -3, 5, -4, -2, -5, 3, 0, 6, -3, -2, -2, 1, -4, -3, 4, -5, -3, 2, 4, 1, 3, 5, 2, 5, 2, -3, -3, -2, -1, 3, 1, 5, -1, 0, 2, 0, -1, -3, 5, -1, 3, 1, -4, 4, -3, -1, -3, 1, 0, 5, -3, 4, 5, 0, 1, 5, 5, -4, -3, 2, 2, -2, -3, 0, -5, 3, -2, 1, -3, -1, 5, -4, 2, 0, 3, 5, 5, -1, -4, -1, 4, -4, -2, 5, 4, -4, 2, 5, 2, -5, 1, -2, 1, 0, -3, -2, -2, -3, -2, 1, 3, -4, 1, 0, 1, 1, -4, -3, 4, 2, -1, 4, 6, 2, -3, -2, 3, -5, -2, -1, -3, -2, 2, 0, 4, 1, 5, -5, 6, 2, 2, -3, -3, 6, -1, -4, -3, 3, -1, -3, -1, 0, -2, -3, 1, -5, 4, 5, 4, 5, -4, 1, -4, 3, 0, -5, -2, 3, 5, 4, 5, 5, 0, 4, 0, -4, -1, 4, 4, -2, -1, 5, -3, -2, -2, 4, -3, 2, 5, -2, 3, 1, 0, 5, 5, -4, 4, 5, -2, 2, 3, 5, 4, 0, 5, -5, 5, 4, 5, -2, 1, 5, 1, 5, -2, 6, 2, 0, -1, 2, 2, -1, 3, 1, 5, -3, 1, 5, 4, 3, -4, 1, -4, 2, -3, 0, 1, -1, 5, 0, 1, 0, -3, 4, 0, 6, 4, -3, 6, 2, 0, -2, -3, -3, 3, 5, -4, 2, -1, -2, 1, 3, 4, 1, -3, 0, -4, 2, 1, -4, 1, 1, 3, -5, 6, 5, 4, -4, 3, -1, 4, -2, 4, 0, 5, -1, -4, 5, 3, -2, -4, 2, 4, -3, -2, 0, -2, -4, 3, 5, -4, 2, -2, -4, 2, 2, 0, 1, 0, -1, -4, 4, -1, -4, -4, -4, -4, 5, -3, 3, 1, 2, 2, 1, 0, 1, 5, -2, -4, -1, 2, 3, 2, -3, 1, -2, 1, -4, 4, -4, -1, -1, -3, -2, 1, 0, 2, -4, 2, -4, -4, -2, -4, 6, -2, -1, -2, 6, 0, 2, 3, 6, -3, -2, 2, 3, -4, 4, -4, 2, 0, -1, 1, -3, -4, 4, -1, 2, 4, -3, 4, -2, 5, 1, 4, -1, -3, 2, 6, 0, -1, 3, 1, 3, -2, 1, 1, -2, 0, -2, -1, 1, -1, -2, -2, 3, 0, -2, -1, 4, 3, -3, -2, 3, -4, 3, 4, 2, 5, -1, 0, -3, 4, -2, 0, 2, 3, 0, 4, -2, 3, -4, -3, -4, -5, 5, 2, -3, -1, 0, -2, -5, -1, -1, 0, -2, 1, 1, 0, -1, 2, 5, 3, 0, 1, 0, -4, 2, 2, 5, 4, 3, -3, -3, -4, 3, 5, -3, 3, 0, 4, 3, -4, -2, -1, 5, -2, 3, -3, -5, 4, -1, 4, 4, 2, 3, -3, 1, 1, -3, -3, -1, -2, -4, 5, -5, 2, 4, -2, 3, 2, -3, -2, -1, 4, 2, 3, -2, -3, 4, 5, 3, -2, 4, -1, -1, -1, -1, 2, 6, 2, 1, -2, 5, -2, 5, 2, -2, 4, 6, 2, -4, 5, 3, -4, 2, -1, 0, 1, 4, 2, -3, 4, 6, 4, -5, 2, 4, 6, 4, 3, 2, 0, -4, -5, 6, -2, 2, -1, -3, -3, 3, 0, 5, -3, -1, -3, -4, 5, -2, -1, -3, -5, 1, -4, 0, -1, -4, 4, 2, 3, 6, -1, 5, -1, -1, -1, 6, 3, 1, 0, -2, -3, 1, -4, 3, 3, -2, 5, -2, -4, 3, -3, 3, 4, -1, -4, 1, -3, 3, 3, 4, 0, 0, 1, -4, 0, 3, 2, 0, 0, 1, 3, 4, 3, -2, -2, 4, 1, 1, -3, -4, 0, -1, -4, 1, -3, 2, 5, 4, 4, 5, -1, 4, 1, 2, 4, -2, 2, 6, 4, 3, -4, 0, 5, 3, -1, -4, 6, -4, 4, 3, 1, 5, -4, 1, -1, -3, 0, -2, 2, -1, -4, 3, 2, -4, 3, -5, -2, -5, 2, 1, -4, 1, 2, 0, 2, -3, 5, 2, 0, -2, 5, 5, 0, 1, 5, -3, 4, -1, -4, -2, -1, -1, -2, 0, -1, -2, 5, 3, -3, 1, 5, -4, 0, 5, -4, 5, -4, -1, -4, -5, 5, 5, 0, -4, -1, -1, -4, 0, -3, -5, 1, 1, 0, -1, -1, 2, 3, 2, 1, -2, -2, 2, -4, -2, 5, -3, -4, 4, 0, -3, 4, -1, -2, 3, 2, 0, -2, -1, 4, 6, -4, 1, -4, -4, 0, -2, -2, -2, -1, 0, 4, 1, 4, -4, 5, -3, -4, -1, 5, 1, -1, 1, 5, 3, 0, -1, -1, -2, -2, -2, -4, -2, 5, 0, 2, 2, -4, -5, 5, -1, -3, 4, 5, -1, 4, 2, -3, 4, 0, -2, 4, -3, -2, -1, 3, 4, 3, 4, -4, 3, -4, 1, 0, 0, 1, 0, 5, -2, -4, 4, -2, 3, 3, 6, 0, 6, -3, -3, 1, 0, 3, 5, -4, -3, -4, 4, 6, 3, 2, -5, 2, -2, -2, 5, -2, 4, -3, 1, 3, -3, -4, 3, -1, 5, -4, -4, 3, -2, 2, -2, 3, -4, 3, 4, 0, 2, -2, 4, -3, 0, 2, -4, -3, 4, -3, -3, 0, -4, -2, -3, -1, -3, 0, -5, 6, -4, 5, -4, 3, -3, 3, -1, 3, 4, 3, 3, 4, -2, 5, -1, -2, -4, 1, 3, -2, -1, -4, -2, 5, 1, 0, 2, -2, 0, -2, 2, -1, 3, -1, 2, 3, -3, 4, 3, 1, -5, -1, 3, 0, -4, -3, 2, 3, 1, 0, 0, 0, 1, 2, 3, -1, 0, 2, -1, 0, -1, -2, 0, -1, -4, 2, 1, 1, 0, 4, 5, -4, 5, -1, 5, 0, 0, 0, 5, -2, 3, -4, 3, 0, -1, 1, -3, -1, -4, 5, 3, 3, -2, 1, 0, 0, 4, 3, -1, 3, -3, -4, 4, 4, 5, 4, -3, 3, -2, -3, -5, 2, 4, -4, 2, 3, 4, -3, 0, 2, 3, -1, -4, 2, 1, -2, -5, 2, -4, 4, -4, -4, 5, -5, 0, -1, 2, 2, 1, -2, -2, 5, -2, 0, -1, -2, 2, 4, 6, 3, -4, 4, 2, 2, 6, -4, -4, -4, 5, 3, 1, -2, 1, 5, -2, 5, 5, -4, 1, 5, 2, 2, 3, 2, -2, 2, 2, 2, 0, -2, -1, -5, -4, 2, 3, 0, -3, 2, 5, -1, 1, -4, 2, 1, 5, 3, 0, -1, 5, 3, -3, 3, 0, -4, 3, -1, -1, -2, 4, 0, 4, 5, 1, 0, 2, -2, -2, -4, -3, 4, -1, -3, 1, -4, 0, -1, 1, -4, 5, 4, -1, -5, 0, -3, 0, -4, -4, 3, -1, 2, -4, 0, 5, 1, 2, 3, 0, -4, 1, 6, -4, 1, -1, -2, 2, 5, -1, -4, -4, -2, 3, -4, -1, -2, 3, 4, -5, 5, 5, -3, -4, -1, 5, 4, 2, 3, -4, 0, -1, 4, 1, 4, 5, 4, -3, 2, 2, 3, 2, 5, -5, -1, 4, -3, -3, -1, 1, 0, 5, 1, -3, 1, 3, 4, -2, -3, -3, -1, 2, -1, -1, -1, -2, 3, 2, 3, 5, -4, 2, 5, -4, 1, 4, 4, 1, 0, 6, -1, 1, 1, 1, -3, 1, 5, 4, -1, -3, 3, 2, -2, 2, -1, -1, -4, -5, -3, 4, 0, 5, 3, -4, -1, -1, 1, 1, 0, 2, 0, -4, 4, -1, -1, -2, 5, -2, -2, 4, 1, 2, -1, -4, 3, -4, 3, -3, -3, 1, 4, -4, 3, -1, 6, 2, 5, 2, 2, 0, -2, -5, 1, 3, -2, 5, 2, 2, 5, -4, 0, 6, 5, 2, -3, 1, -5, 1, 1, 5, -1, -4, 3, -3, 4, -3, -3, -5, -5, 2, -3, 3, 1, 0, -3, -4, 2, 0, 1, -3, 3, -4, -2, -4, 4, 1, 1, 3, -2, 4, 1, 2, 0, -2, -5, 5, 5, 2, 1, -1, -3, 4, -3, 5, 5, -3, -2, 1, -4, 2, 6, -4, 2, 5, -4, -2, 0, 2, 3, 2, 0, 2, -4, -4, -3, 0, -2, 5, 1, 3, 4, 2, 1, 2, -5, 0, 2, 4, -4, 2, 4, -2, -4, -2, 0, -4, -2, -3, 3, -4, 3, 4, -1, -1, -4, 3, 1, 6, -4, -5, 0, 5, 2, -1, 0, 3, 3, -3, -2, -2, 0, 2, 4, -2, 5, -4, -2, -2, -4, 1, 4, -3, -2, -1, 0, -5, 0, 5, 0, -2, 4, -5, -4, 5, 3, 0, 2, 3, 3, 4, 5, -3, 0, -2, -3, 1, 5, 0, -4, 2, 4, 4, 1, 1, 0, 5, 0, 2, 2, -4, 2, -2, -3, 0, 4, 2, -5, 0, 2, 5, 3, 5, -3, 0, 5, -4, -2, 2, 4, 5, -2, -2, 4, -2, 4, 2, 4, -2, 4, -1, 1, -3, -4, 1, -1, -4, -1, -4, -2, -3, 0, -2, 0, -4, -1, 5, 5, 0, 2, -2, -2, 0, 0, -2, 4, 1, 2, 5, -4, 4, 5, -2, -3, -2, 1, -2, -1, 1, 5, -1, 5, 5, -4, -1, 5, -4, -2, 1, 6, 0, 3, 4, 5, 3, -2, -4, 4, 4, -4, -4, 3, 3, -2, -4, 5, 5, 4, 3, -4, 2, 2, -4, 5, -1, -3, 5, 2, -2, -4, -3, 1, 4, -1, 1, 4, -4, 1, -3, -1, -4, -2, 0, -1, -4, -5, -1, -4, 1, -3, 3, 2, -4, -1, -2, -2, 1, -2, 2, 5, 4, 5, 4, -5, 1, 0, 2, -1, 5, 1, 1, -5, 6, 5, 3, -5, 0, 3, 2, -2, 5, 4, 4, 3, -4, 5, 3, 0, -4, 5, 1, 5, -3, -2, 4, -2, 4, -3, -2, 1, 1, -3, -2, -1, 2, -3, 2, 2, -2, 5, 5, -5, -2, -4, 5, 5, -4, -1, 4, 4, -2, 2, 6, 3, -2, -4, 5, -2, 5, 0, -3, -4, -4, 2, 3, 0, 3, 1, -5, -4, 1, 1, -2, 5, -2, -4, -3, -2, 2, -2, 4, 2, 0, -3, 2, -4, -4, 2, -4, 0, 3, 1, 4, 3, 4, -1, 0, 3, 5, 0, -2, 0, 1, 4, 5, 1, 0, -2, 3, 3, -4, 2, 4, -4, 1, 0, -3, -3, 2, 3, 3, 4, -3, -4, 6, 0, 3, 3, 0, 1, 0, -1, -4, 1, -3, -1, 5, 5, -4, 0, 1, 1, -4, -3, 0, -5, -2, -4, 5, 3, -2, 6, 2, -2, 1, 5, -2, -5, -1, -3, 2, 5, 4, 3, 1, -4, 2, 2, -4, -1, 3, -4, -3, 6, 4, -2, 4, 4, -3, 1, 5, -3, 5, 2, 3, 0, 6, 3, -1, -2, 1, -3, 3, -4, -2, -2, 5, -3, -2, 5, -5, 3, 0, -1, 1, 6, -4, -3, -1, 5, -1, -3, -4, 3, -3, 0, -4, -2, 0, -1, -1, 2, 3, 1, 1, -3, 5, 1, 1, -3, -1, 2, 6, -3, -3, -3, 0, -3, 0, -3, -2, 4, 0, -3, 2, 4, -1, 6, 5, -3, 1, 3, -1, -1, -2, 5, 5, -2, 2, 4, 1, 1, -1, -1, 2, -1, -4, -1, -1, 2, 6, 3, -2, 2, 2, -1, -2, -2, -1, -4, 5, -3, 0, 6, 4, 1, -1, -4, -1, -4, 2, -2, 3, -2, 5, 5, -2, 0, -4, -5, -2, -1, -3, 2, 3, 2, 4, 6, 2, -2, 4, 3, -3, 3, 4, 3, 0, -2, -3, 1, 2, 3, 2, -1, -2, 2, -5, -3, 5, 2, -3, -1, 1, 0, -1, -2, -3, -4, 0, -4, -4, 4, 2, -2, 3, -3, 3, 0, -1, 1, 3, -2, 5, -3, -4, -1, -2, 3, 6, -1, -3, -4, -1, 5, 1, -1, -4, 4, 1, -1, -3, 6, -4, 1, 3, 2, 4, -2, -4, -3, -1, -5, -2, 4, 1, -1, 5, -2, -1, -5, 5, 2, 5, 0, -5, 0, -2, -3, -4, 6, -4, -2, 4, 6, -1, -5, -1, 6, -2, -3, 5, 4, -3, 1, 2, -2, 0, 1, -2, 0, -1, -1, 0, 4, -2, 0, 5, -1, 4, -5, -3, -4, 5, 0, 1, 4, 1, -3, -1, 4, -1, 5, 1, -2, -3, -3, -2, 3, 3, 5, 2, 4, -4, 3, -3, -1, 3, 2, -5, -1, -2, -3, 2, 5, 5, 0, 5, 5, -4, -5, 5, 3, -1, -4, -5, 4, 1, -4, 1, 4, 3, 4, 4, -4, 5, 3, -4, 0, 2, 5, 3, -3, 5, 3, 2, 4, -4, 0, 0, 6, 6, -3, 3, -2, -2, -2, 1, 0, 1, 5, 2, 6, 5, 4, -4, -2, 0, -5, -4, -1, -5, -4, -4, 6, -1, 0, -5, 0, -4, 0, 3, -2, 2, 1, -1, -5, 4, -1, 5, 2, -3, -5, 5, 5, 3, -2, 3, 2, 0, -5, 5, 4, -2, 2, -4, 4, -2, -1, 4, 3, 0, -2, -1, 2, 3, 5, 1, -3, 4, -3, 2, 3, 4, 3, -4, 5, 5, -4, -3, 1, 2, 4, -1, 2, 3, 5, 4, -3, 1, -2, 0, 1, 1, -3, 4, -5, -1, 0, 3, 6, 5, 2, -4, 3, 6, 1, 5, 4, 1, 2, -1, -2, -4, -4, -2, -3, -2, 1, 4, -3, 5, 5, -1, 1, -4, 1, 4, -3, 3, -1, 2, -3, 3, 2, -4, 5, -4, 0, -5, 1, 1, 3, -2, 1, -4, -1, -1, 5, 5, 4, 2, 5, 3, 0, 2, -1, -4, -3, 3, 1, 3, 4, 6, 4, 3, 5, 1, -2, 2, -3, 4, 2, -3, 2, -1, -4, -3, 2, 2, -4, -2, 5, -2, 2, -3, 3, -1, -4, 1, -4, 3, 2, -1, -1, 0, 5, 1, -2, -3, 2, -3, -1, 1, 2, -4, 4, 2, -3, 4, 3, 6, 3, 5, 1, -3, 1, 2, 4, 0, 5, -1, -3, 5, -4, 0, 2, 3, 0, -4, 1, -4, -2, -5, 0, 4, 0, 2, -3, 0, 5, -4, 2, 3, -3, 0, 2, -3, 2, -5, 2, 0, -4, 4, -2, 1, -1, -2, -3, 4, 0, 3, 5, 2, -4, 0, -1, 2, 0, -1, 0, -4, -2, -3, -5, -2, 1, 2, 0, 0, 0, 2, 1, 2, -3, 5, -1, 1, 5, -3, 4, -2, 1, -5, 1, 6, -2, 5, 2, 0, 5, 4, 5, 5, 4, -5, -4, -4, 5, 6, 3, 3, -4, 4, 2, 2, 0, -1, -4, -4, -2, 4, 6, 3, 4, 1, 0, 6, 6, 0, 0, -2, -2, -1, -1, 0, -3, 3, -3, 0, 5, 5, -4, 1, -2, 3, 2, -3, 5, 2, 4, 1, 4, 5, 1, -2, 5, -3, -4, 4, 3, -3, -2, -1, -3, 1, 1, -4, 4, -2, 3, 2, -1, 1, -2, -5, 0, -1, -4, 5, -4, 0, 3, -2, -2, -3, 5, 4, 5, 2, 0, 3, 1, 1, -1, -4, -3, 5, 4, 2, -2, -1, -2, 6, 5, 4, -4, 0, -4, 1, 3, -4, 2, 5, -3, -4, -5, -3, 0, 5, -3, -1, 3, 5, 2, 5, -2, -4, 4, -2, 5, -1, 3, 4, 4, -3, 0, 2, -1, -4, 0, -5, 1, 0, -2, -4, 4, -4, 0, 5, -5, 0, 0, 2, 1, -4, -3, -4, -5, 4, 0, -3, 2, -2, -2, -4, -4, -2, 2, 1, 5, -2, 2, 2, 2, -2, 4, 4, 5, -5, 4, -3, 0, 1, 2, -4, -4, 2, 3, -5, 6, -1, 1, 2, 6, 4, -1, -2, -4, 2, 0, 3, 1, 4, 1, 2, 5, 0, -3, 3, 1, 4, -2, 6, 2, 1, -4, -2, -3, -1, 4, 3, 3, -1, -3, -3, 2, 4, 2, -2, -4, 4, 4, -3, 2, 0, -1, 0, 3, 1, -2, 2, 6, 0, -1, 2, -1, 3, 3, 6, -4, 1, 5, -3, 4, -1, -4, 1, 0, 3, 5, 2, -5, -2, -4, 1, -3, 4, 3, 3, -2, 3, -4, -4, 4, 2, -1, 0, -4, -3, 2, 5, 1, -4, 2, -1, 4, 1, -1, 3, 0, 1, 4, 0, -4, 1, 3, 4, 3, 5, 3, -3, -2, -4, 4, -1, 3, -1, 1, 0, 5, 2, 0, 0, -3, 5, 0, 4, -1, 1, 1, 6, 3, 3, -5, 0, 2, -2, -4, -3, 3, 2, 2, -3, -3, 4, 4, 6, -2, -2, -1, -2, 2, -4, 1, -3, 4, -1, 3, 0, 5, 2, 4, 1, -3, 4, 0, -1, 1, 2, -3, 5, 2, 1, -4, 1, 6, 0, -4, 3, -1, 2, -3, -4, 2, 1, 0, -4, 3, -4, -2, 2, 2, 1, -3, -4, -2, 4, -2, -3, 4, 3, -3, 3, 3, 2, 4, 5, -2, -1, -1, -3, 0, 4, -4, 3, -5, 2, 3, 4, 1, 5, 2, 3, 3, 3, -3, 0, -3, 1, 6, 3, 4, 3, -5, 0, 3, -3, 0, 2, -5, 0, -3, 2, -4, 4, -1, -4, 3, 4, 5, 3, 0, 4, 4, -3, 0, 3, 2, 1, 5, 5, -2, -4, 2, 0, -5, 0, 6, 0, 3, -1, 0, 2, 0, 4, 0, 3, -4, -1, -4, 0, -3, -3, 2, -4, 4, -1, 0, 0, 5, 2, -1, 1, 5, 4, 2, 5, 1, 0, -4, 2, 0, 5, -1, 4, 5, -5, 6, 3, 4, 1, -3, 2, 2, -3, 2, -3, 3, 3, 4, -4, 0, -4, 4, -3, 2, 2, 5, -4, -4, 6, -3, 0, 5, -2, -4, 5, -1, 2, 0, -4, 3, 1, 1, -1, -2, 0, 2, -2, 4, 1, -4, 1, 6, -2, -1, -2, 4, -3, 6, 6, -3, 1, -4, 3, -2, 5, 0, -1, -5, -2, -2, 4, 5, 3, 3, -2, 0, -2, 3, -1, 0, -3, -3, 4, 1, -1, -1, -3, 5, 2, 6, 1, 1, 0, 1, 5, -1, 0, 3, 0, -3, -5, -4, 2, -3, -4, -3, -3, 4, 3, -4, -4, 0, -4, -1, 4, 1, -2, 2, -2, -4, -4, 0, 3, -1, -3, 0, -3, 2, -4, 2, 0, 2, 6, 1, 6, 3, -1, -2, 4, -3, 4, 5, 6, 2, -3, 3, -1, -2, -4, 3, 3, 6, -4, -3, 3, -3, -3, 1, -2, 5, 1, -2, -3, 5, 4, 0, 4, -1, 1, 2, 1, 4, -2, 4, 3, -3, 4, -2, 2, 2, -1, 0, 6, 5, -1, -1, -3, 1, 0, 5, -5, 4, 5, 2, 4, 2, 3, -2, -1, 3, 0, -3, -2, -2, 0, 1, 5, 1, 3, -2, -2, 1, -1, -1, -5, -2, 2, -4, -5, 5, -2, -2, -3, -1, -4, -4, 0, -3, 1, 4, -5, -4, -3, 2, 1, 5, 2, 4, 2, -2, 2, 3, 3, 2, 1, -2, 2, 3, -3, 5, -5, 3, 2, -1, 1, -4, -4, 5, -1, 2, 0, 2, -4, 5, -1, 5, 3, 3, 3, -3, 5, 3, 5, 5, 1, 4, -4, -2, 1, 0, -1, 3, -2, -1, -4, -2, 4, -5, -2, 0, 2, -5, -5, 5, 4, 2, 4, 3, 0, -1, 2, 4, 5, -2, -4, 5, 1, -4, 1, 3, 0, 4, 1, -1, -3, 1, -2, 0, 3, 3, 4, 3, 5, 6, -2, -2, -1, 1, 4, 5, 2, 5, 3, -1, 5, 3, -2, 1, 0, 5, -3, -2, 0, 2, -2, 2, 3, -3, 1, -1, -3, 1, 3, -1, -4, -2, 3, 0, -2, 0, -2, -4, -1, 4, 1, -4, -4, 1, -3, 5, 4, 0, -1, -2, 5, 0, -1, 2, 4, -3, 0, 6, 5, 4, 5, 5, 1, 1, 0, 4, -3, -1, -2, -3, 5, 1, -1, 3, 3, 3, -1, 3, -3, 3, 4, 3, 3, 0, 2, 2, 3, 0, 0, 3, 3, 6, 5, 3, -5, -3, -3, -3, -3, -4, 4, -3, 4, 2, 4, 3, 5, 4, -3, 4, 1, -3, 1, -1, 0, -4, -1, 3, 3, -4, -3, -1, -1, -4, 2, 0, 5, -1, 4, 5, 4, 0, -1, -1, -2, -2, 3, 5, 3, -3, 5, -3, 2, -4, 2, 0, -2, 0, 5, 5, -1, -2, -4, 5, 2, 6, -1, 1, 1, -4, 0, -4, 2, -2, -5, 3, 0, 1, -1, -4, 4, -4, 3, 1, -3, 3, 0, -3, 0, 2, -1, 4, 1, 2, 4, 3, 3, 2, 1, -2, 5, 5, -2, 4, -3, -4, 4, 0, 2, -3, -3, 4, 4, -2, -2, -3, 1, -3, 1, -4, 0, -4, 3, -4, 2, 2, -1, 0, 3, -4, 5, 2, 1, 2, -1, -2, 3, 2, -5, -2, -4, -2, 3, 1, -2, 5, -5, -2, 0, 2, 1, -4, 1, -3, -2, 4, 1, -3, 1, 3, 1, 3, 0, -3, -1, -4, -4, 4, 3, 3, 5, -5, 1, 4, -1, 5, 1, 0, 2, -2, -4, -2, -4, 3, -4, 5, -2, -3, 3, 3, -3, -4, 4, 0, 5, 5, 3, 0, -1, 2, 6, -5, -1, 0, 0, 1, 0, 3, -5, 0, 5, -1, 4, -3, 5, -4, -1, 1, -1, 2, 1, 2, -3, 4, -5, 2, 0, 4, 3, -2, 0, 1, 5, 3, 4, -4, 4, -2, -1, -4, 5, 2, -4, 5, -1, 3, -4, 3, 3, 0, -4, 3, 4, 2, -5, 0, 3, 3, -4, -3, -1, 4, -2, 4, 1, 2, 0, 5, 2, 1, 2, -3, -2, 5, -1, 2, -5, -1, 3, 6, 4, -4, -5, -1, -2, 4, 5, -3, 0, 5, 4, -1, 4, -1, -4, 0, -4, -3, 2, -2, 1, 1, 3, 4, 1, -2, 4, -1, 4, -1, -3, 2, 6, 0, 0, 5, -4, -2, -4, -4, 2, -4, 5, -3, -4, 3, -1, -4, 0, -5, -2, 2, -4, -1, -2, -3, 0, 4, 4, 5, 5, 5, 0, -1, -2, 2, 5, 4, -4, 1, 3, -3, 2, -1, -2, -5, 2, 3, 4, 5, -2, 0, -4, -1, -4, -4, 0, -1, 3, -2, 1, -2, -1, 5, 2, 2, -5, -4, 2, 4, -4, -1, -3, 2, -1, 0, -1, 0, 5, 3, -3, 2, -3, 0, -1, 5, 1, 3, -2, -1, -4, -3, 2, -4, -3, 2, 3, 1, 2, -5, -4, 4, -1, -4, 0, -2, 1, 6, 4, 0, 3, 0, 1, 0, 4, -3, 1, -4, 5, -2, -1, -5, 6, 6, -2, 5, -3, -2, -5, -4, 6, 2, -4, 1, 3, 2, 5, -3, -1, 2, -1, 5, -4, -4, 3, -4, -5, 3, -2, -3, 3, 3, 1, -4, 2, 1, 4, 3, 0, 3, -3, 3, -3, 1, -1, 0, 2, -3, 5, 2, -4, -4, -4, 0, 2, 0, -2, -4, 0, 6, 1, -2, 3, 3, 4, 1, 5, -3, 6, 3, -2, -3, 5, 4, -5, 2, 0, 5, 6, 1, 3, -1, 2, -3, 2, 1, 4, 3, -1, 3, 3, -1, -2, 3, 3, -1, -3, 4, -3, 6, -3, -4, -4, 0, 4, -4, 3, 4, 4, 1, -2, -1, 2, -1, 2, -4, 0, -2, 1, 3, -2, -1, 5, 0, -5, 6, 0, -4, -2, 2, -3, 0, -3, -5, -4, -3, 4, 2, 1, 3, 5, -5, -2, -5, -4, 6, 4, 5, -2, 5, 0, 0, -3, 1, -3, 4, -4, -2, 1, 2, -3, -4, -2, 3, 4, -4, -2, 0, -3, 2, 3, 2, 0, -1, 0, 4, 3, -4, -3, -1, 0, 1, 5, -4, -2, -4, -5, -1, -2, -2, 2, 4, 0, 0, 5, -1, 0, -1, 3, -2, -5, 5, 0, -2, 5, 0, 0, 2, -1, -2, -3, -3, 3, 0, 5, -1, 2, -3, -3, 2, 5, -1, 0, -1, -1, 5, -1, 3, 1, 5, -2, -4, 0, -1, -3, 4, -3, 2, -5, -5, 5, 1, 3, 1, 1, 0, -5, 1, 1, 1, 6, -3, -2, -2, -1, 0, 4, -3, 4, -4, -5, 6, 2, 2, -1, 4, 2, 2, 4, -4, 2, -1, -2, 4, 0, 2, 5, -5, 5, 4, 0, 3, -4, 3, 0, 6, -1, -4, 5, 3, 5, -2, 3, -3, 4, 3, 4, 0, -3, -5, 1, 4, -2, 0, 3, -4, -1, -2, 3, 5, 2, -3, 3, -5, -1, 3, -1, 5, -3, 0, 4, -2, 5, -3, 0, -5, -4, 4, 0, 2, -2, -2, -3, 0, 6, -1, 6, -5, 4, -5, -2, 4, 4, 6, -1, -2, 2, -4, 0, -4, 3, 3, 2, -3, -5, 4, -1, -2, 0, 0, 5, -2, 6, -4, -5, 0, 1, -3, -2, 3, 4, 3, 3, -2, -1, 1, 1, 6, 0, 3, -1, -3, -1, 0, 3, -3, 2, 6, -4, 5, -5, 5, -3, 6, 0, -4, -2, -4, -4, -2, 1, 0, 1, 2, 4, -4, 3, -5, 1, 4, -2, 0, 2, -2, 1, -1, -4, 3, -1, 2, 3, 1, 4, -2, -1, -3, 5, 5, -3, -3, -5, 2, -3, -2, 5, -3, 2, -2, 0, 6, 4, 1, -1, 0, -2, -4, 5, 5, 1, -1, 0, -1, 0, 5, 2, -2, 3, -3, 2, 4, 0, 2, -2, -2, 5, 1, -3, 4, 5, -1, -3, -3, -2, -2, 5, 0, -2, -1, -3, 0, -4, 3, 6, 2, 3, -4, 1, -3, 2, 0, 4, 1, 2, 3, 4, -5, 4, -3, -1, -4, -2, 2, -3, 0, -1, -1, 0, 1, -2, 1, 3, -1, 3, 3, -3, -2, 2, -2, 2, -4, -5, 3, -2, 0, -4, 0, -1, 4, -3, -3, -1, -1, 5, 3, 3, 5, -3, 2, 4, -3, 2, -4, 1, -4, -3, 1, -1, -2, 5, -4, 3, 1, -4, -4, -2, 4, 2, 5, 4, -2, -4, -1, 5, -4, 4, -4, 2, 2, 0, 3, 3, -2, 0, 4, 0, 3, 3, 0, 2, 1, -2, 2, 3, -4, 2, 3, 1, 4, -2, 1, 2, 3, 4, 2, 3, -2, -4, -2, 1, 1, 1, 6, 0, -4, 4, 5, -3, 2, 4, 4, -4, 5, 4, 3, 4, 1, 6, -1, -1, -4, 0, -2, 3, 0, -3, -2, 1, -3, -4, 4, 2, 2, -3, 5, -1, -4, 2, 3, 5, 4, 4, 5, -4, -5, 2, -2, 0, -3, 5, 6, 3, -2, 5, -2, -4, -1, 6, 2, 4, -2, 4, 1, 3, 1, 4, 2, -4, 1, -3, -3, -2, -3, -3, -3, -4, -3, 5, -5, 1, -1, -1, 1, -3, -2, -1, 0, -3, 4, 1, 0, -4, 1, 4, -4, -4, -1, -5, -1, 2, 4, -2, -4, 0, -1, 5, 5, 6, -3, 0, 1, -2, 3, 0, 2, 5, -2, 4, 1, 3, 5, 3, 4, 0, -4, -3, -5, 1, 0, 4, -2, 5, -4, -1, 1, 4, 3, 2, 3, -2, 6, 0, -1, 5, -3, -1, 3, -5, 3, 2, 1, 1, 1, 2, -3, 5, -5, 5, 5, 6, 0, 5, 0, 0, 0, -3, 2, 3, 1, -4, 0, -2, -2, 1, 1, -4, -3, 2, -5, 4, -4, 1, 4, 0, 0, 2, 2, 1, 4, 5, 1, -2, -2, 5, 2, -1, -5, 1, 5, 4, 5, -4, 1, 2, -4, 5, -5, 0, 4, -3, -4, 0, 4, -4, -3, -4, 3, 3, 4, -4, -1, -1, -1, -3, -5, 5, 0, -5, -4, -2, 4, -4, 5, 0, -4, -2, 1, 3, 2, -5, 0, 1, -4, -1, 5, -5, 2, -3, 4, 5, 1, 5, 3, 0, 3, -4, 4, 4, -3, -2, 2, 6, 3, -4, -1, 2, 0, 2, 1, 2, -2, -4, -1, -3, -3, 4, -4, 3, 3, 6, -3, -1, 1, -4, -3, -3, -4, -1, 5, 5, 4, 5, 3, -1, -3, 5, 5, 1, 3, 2, -3, -3, 2, -2, 4, -5, 0, 1, -4, 0, 2, 3, 2, 0, -1, -4, 4, -4, 3, 4, -3, -4, 0, 4, 4, 3, 0, 4, -4, -1, -4, 0, 3, 1, -3, 1, -4, -2, 3, -1, 4, 2, -5, 2, 3, 1, -3, 2, 5, -1, 5, 3, 3, 0, 2, -3, 2, 0, 1, 2, -1, 3, -5, -3, 2, 4, -1, 2, 5, -2, 1, -1, -2, 1, 2, 3, 5, 1, 6, 2, 1, -1, -5, -3, 5, -1, 4, -2, -2, 2, 1, 1, 2, -2, 5, 0, 5, 3, -1, 6, -4, 3, 1, -3, -3, -3, -1, -2, 0, -4, -3, 5, -1, -1, 4, 4, 1, -4, -3, -2, 5, 0, -1, 0, -4, -3, -4, 0, -1, -2, 4, 0, 2, 4, -4, 2, 1, -2, 5, -4, -3, -4, -4, 3, 6, -5, 1, -1, -2, 3, 0, 5, -4, -3, 2, 2, -4, 0, -1, 3, -3, -1, 2, 0, 3, 4, -1, 5, 1, -4, 4, -3, 3, 3, 0, 3, 1, 4, 0, 0, -3, 2, 1, 4, 2, 4, 2, -1, 5, 5, 3, 4, -1, 0, 0, 5, 5, -2, 6, -1, 5, 3, -1, 5, -3, -1, 2, -3, 4, 0, -2, -4, 4, -4, 4, -4, -3, -3, 4, -4, 3, 1, 4, 5, 5, -2, -5, -1, -3, 1, -2, -3, 1, -1, -5, -4, 5, 5, -3, 1, 2, -3, 0, 5, 0, -4, 4, 0, 0, 4, 0, 6, 1, 0, 3, 2, -4, -4, -1, 2, -2, 1, -3, -1, 5, 3, 3, 1, 4, 0, -4, 2, 0, -1, -1, -4, -1, -3, -4, -5, 5, 5, 3, -2, 4, -3, -1, 2, -4, 1, -1, -1, 2, -5, -1, 2, -2, 4, -1, 3, -1, 3, 3, 4, 4, 2, 1, 1, -2, -4, 3, 4, -1, 3, 2, 4, 4, -1, 3, -1, -1, -2, -4, 5, -3, -2, 1, -2, 0, 0, 6, 3, 6, -1, -4, 1, -2, 4, 2, 3, -1, 2, -4, -3, -4, 4, -3, -1, -2, 4, 3, -1, 4, -4, -5, 1, -5, 4, 6, 5, 2, 4, -2, 2, -2, -3, 0, 5, 4, 5, -5, 3, 5, -3, -1, 1, 1, 6, 4, 4, -3, 0, 0, -1, 0, 1, 1, -3, -3, -3, 4, 1, 5, 1, 5, 3, 6, 4, 5, -3, 5, 4, 0, 4, 2, -4, 5, 2, 1, 2, -4, 4, 1, -3, 2, 5, 3, -3, -1, -5, 0, 3, -2, -3, 5, 3, 4, -3, -4, 0, 3, 1, 2, 4, 1, 1, 1, -5, 0, -1, 1, 3, -2, -2, 4, -3, 4, -1, 4, 2, 5, 1, -3, 1, -2, -4, 6, -5, 4, 2, 4, 0, 0, 6, 4, -4, 4, 2, 6, 2, 3, -3, -5, -5, -3, -1, 2, 0, 0, 0, -1, 1, -2, -4, 0, 5, 1, 2, 3, 2, 3, 4, 0, 4, -2, 5, 0, 4, -4, 0, 3, 5, 4, 5, 1, 2, -3, 4, -5, -2, 1, 2, -2, -3, -2, -1, -3, 5, 0, 5, 3, 2, -3, 1, 2, 4, 5, 5, 0, 2, 2, 4, 3, 2, 1, -1, 6, 0, 4, 5, 1, 4, -4, -1, 2, -4, -4, 2, 4, 2, -3, -2, -3, 4, 5, 1, 5, -3, 0, -2, 5, -4, -1, 1, 2, 6, 0, 0, -3, -1, -3, 4, 5, 5, -1, 5, 0, 0, -2, 3, 5, 0, -1, 5, 4, -3, -2, -4, 0, -3, 0, -3, 2, -1, 1, -2, -2, 2, 6, 0, 3, 0, -4, -2, -1, -4, -4, 3, -3, 2, 5, 4, 3, 5, -2, 3, -3, -2, 0, 4, -3, 0, -4, 1, 5, -3, -1, 4, 1, 2, 0, 2, 2, 3, 3, 1, 1, -1, -1, -2, -2, 2, -3, -1, 1, -3, 3, 1, -5, -2, -5, -5, -4, 1, -1, 1, 3, -3, 3, 5, 3, -2, -4, 3, -1, 4, 2, -1, 1, -3, 1, -4, -3, -4, 2, -4, -4, 4, -4, 0, 5, -4, -3, -5, 2, 5, 0, 3, -4, 4, 2, -2, -3, 2, 4, -4, 6, 1, 5, 0, -1, -1, -4, -4, -4, -5, 4, 0, -1, 3, -4, 6, -4, 3, 4, 2, 2, 1, 0, 3, -3, 2, -3, 2, -2, 1, -4, 1, 6, 4, -3, 3, -5, -5, 6, 3, 5, -4, -1, -4, 5, 0, 6, 0, 0, -5, 1, 1, -3, -5, -5, 2, 6, -4, 2, 1, -2, 1, 4, 6, 0, 1, 5, 2, 1, 1, -4, 2, -2, 6, -4, -4, 2, 5, -4, 4, 0, 4, 1, -2, 3, 1, 5, -1, 4, -2, -4, -4, 1, 2, -4, 4, 3, 1, -2, -1, 4, 1, 3, -1, 4, -2, 4, -4, 4, -3, 3, 2, 1, 0, -1, 2, -2, 0, 5, 1, 1, 3, 0, 3, 5, 2, 0, 3, 2, 1, 2, 3, 1, -1, 6, 1, -4, -2, 0, 0, 2, 5, -3, 1, 2, 1, 5, -2, 4, 5, 5, 2, -1, 0, 2, 2, 0, -3, 4, 1, 5, -1, -2, 3, 1, -1, 1, -3, 5, 0, -1, -2, -1, -2, 0, -4, -4, 0, -2, -3, -5, 2, 5, -4, 4, -4, 0, 2, 3, 2, 5, 0, 1, -2, 1, 0, -3, -1, 5, -1, 4, 1, 2, 3, -1, 5, 0, 4, 5, 2, -3, 3, -2, 3, 2, 3, 3, -1, 5, 1, -4, -3, -3, 4, 3, 5, 4, -1, -3, -2, 3, -5, -2, 0, -2, 4, 6, 1, 3, 3, 1, 1, 0, 4, 1, 5, 2, -1, -2, -3, -4, 1, -5, 5, 2, 1, -4, -5, 3, -2, 3, 3, 3, 4, -4, 3, -2, -2, 3, 2, 3, 2, -3, 0, 3, 4, 1, -2, -3, -3, 4, -4, 0, 4, 1, 4, 6, -3, 1, -1, -2, -1, -5, 2, -1, 1, 5, 1, -3, 1, 3, 4, 0, -2, 6, 4, 0, -1, -3, 0, 6, 4, -1, 3, -4, 3, 5, -1, 3, 3, 5, 2, 1, -1, -4, 1, 0, 0, -2, 2, -2, 4, 6, -1, 4, -4, 0, 3, -1, 0, 3, 5, -2, 4, 3, -4, -3, -4, 0, 3, -2, 4, 5, 3, -1, -3, 1, -4, 3, -2, 1, 2, 0, 2, -4, -1, -3, 2, 4, 5, 5, 6, 0, 0, 3, 0, -4, 3, 0, -3, 0, -4, 4, 5, 4, -4, 4, -2, 3, -3, 1, 5, -4, 3, 0, 0, -2, -2, -1, -4, 1, -2, 2, 5, 6, 3, -2, -4, -1, -1, -3, -3, -2, -4, -3, -2, -5, 1, 0, 5, -5, 5, 2, -3, -1, 2, 3, 2, 2, 5, 2, 2, 5, -1, 4, 4, -4, 1, 1, 1, 0, -1, 1, 1, 2, 0, -1, -3, -3, -1, 6, 4, -1, -1, 0, 3, 2, 1, 1, 3, -4, 2, 3, 2, -1, -2, -3, 3, 3, 5, 1, -2, -2, 0, 2, 3, 1, 0, -5, -4, 0, -3, -4, -3, -4, 3, 1, 1, -4, 6, 6, 0, 5, 0, -4, 1, -5, -3, -3, 1, 3, 5, 3, 6, -3, 0, 5, 4, 3, 0, 2, 4, 2, 3, -4, 4, -3, 5, -1, 0, 6, -2, 5, -3, -3, -1, -2, 5, 5, -5, 5, 2, 2, 5, 0, 4, -4, 5, -4, -2, 1, -3, 1, -3, 2, -3, 4, 5, 1, 1, -4, -2, -5, 1, -3, -4, -3, 0, -1, -2, -1, -3, 5, 3, 3, 2, -2, -1, 2, -4, 5, 0, 2, 4, 1, -4, 3, 3, 5, -1, 2, -3, -1, 3, -2, 0, -1, -2, 2, 0, -5, 5, -3, 5, -2, 5, -5, -2, -3, -2, 4, -3, -3, 0, 2, -1, -2, -2, -2, -3, 4, 4, -4, -5, -4, -4, -5, -2, 5, 4, 4, -2, -4, -3, -5, 2, 0, 2, 6, 0, 1, -2, 5, 4, 2, -4, 2, 0, -4, -1, -4, 4, -1, -3, -2, -1, 3, 0, 1, -5, 4, 1, -2, 4, -2, -3, 5, 4, 3, -3, 0, 4, 2, -4, -3, 3, -3, -1, 3, 1, -1, 4, 2, 3, 3, 4, 4, 3, -4, 3, 4, -1, 2, 4, 0, 6, -3, 1, 6, 0, 4, 3, 3, -3, 6, -1, -5, 2, 2, -2, 1, 0, -1, -2, 1, -2, 0, -5, 3, 0, -4, 4, -3, 4, 4, -2, 3, 3, 0, 5, -1, 5, 3, 5, 0, -1, 2, 3, -1, 1, 0, -4, 1, 0, -1, -2, 3, -4, -4, 0, 0, -1, 1, 6, 6, -3, -3, 4, 1, 0, -4, 3, 3, -3, 6, -5, -3, 1, 0, 5, -1, 1, -4, 1, 5, -1, 0, -3, 1, 1, -3, 1, -1, 1, 3, 2, 1, 4, 4, -3, -4, 1, 1, 0, 4, -4, -5, 3, -3, 1, 3, 1, 2, -5, 4, -4, -3, 4, 0, 2, 5, 0, -2, 3, -1, 4, 1, 5, 3, -3, -3, -2, -3, -2, 1, 1, 3, -2, -1, -4, 5, 6, 2, 1, -1, 3, -2, 2, -2, 4, -2, 3, 6, -2, 0, 1, -3, 3, -2, 2, -3, 5, 4, 1, -1, 1, 5, 0, 3, 1, 0, 2, 2, 3, -3, 0, 4, -4, 4, -4, 5, -1, 1, 0, 1, -3, -3, -3, 4, -1, -2, 4, 1, -4, 3, 3, 5, 2, 3, -4, 1, -4, -4, 0, 0, -4, 5, 5, 1, 4, -1, 1, 2, 6, 4, -3, -2, 5, -2, 3, 4, 6, 1, -3, -3, 1, -2, 2, 4, -3, 1, 6, 2, -2, 1, 4, 3, 5, 4, -1, -5, 4, 1, -1, -5, 1, -4, 4, 5, 1, -5, 6, -4, -5, 3, 6, -4, 3, 2, 1, 5, 5, 2, 4, 0, -3, 3, -1, 2, -2, 0, 1, 1, -5, -1, -4, -4, 3, 1, 0, 3, 4, -5, -3, 1, 6, -3, 2, -2, 1, -5, 3, 3, 4, -1, 2, 4, 2, 3, 1, 0, -5, 4, 2, -3, 1, -2, 2, 4, -2, 2, 4, 5, 3, -1, 3, 0, -1, -3, -4, -1, -2, 0, 4, 5, -3, 1, 0, 5, -5, -4, -3, 5, -1, 0, 0, 6, -3, -3, 3, -2, -3, 2, 2, -4, 2, -4, 0, 0, -5, 4, 3, 0, -2, -4, -1, 5, -1, 0, -2, 5, 0, 1, -2, -5, -5, -2, 0, 3, -2, 2, 0, 2, 0, -2, -1, 0, -1, 1, -1, -3, -3, 2, 0, 5, -2, -4, -5, 1, -3, 0, -4, -3, -4, -2, -3, 2, 1, -2, 5, -1, 3, 5, 0, 5, 3, 5, 0, 3, -4, -3, -2, -3, -2, -4, 2, 2, 2, 4, 4, -3, 1, 0, 0, 0, 3, 1, -2, -4, 3, -1, 5, -4, 0, -4, 3, 1, -1, -1, -1, 3, -1, 0, 1, -4, 3, -4, 0, 5, 2, 4, 0, -5, 5, -2, 1, 1, -1, 5, 3, 2, -3, -2, 1, 6, -3, -4, 1, 5, 0, 5, -3, 0, 4, 0, 5, 0, 0, -3, -4, 5, 5, -3, 4, -2, 1, 5, 4, 0, 4, 0, 2, 4, 0, 1, -4, 4, -1, -4, 6, -3, 1, -4, -5, 2, 6, -1, 3, -2, 2, -3, 4, -2, -4, 3, -2, 3, 0, -2, -2, -5, 0, -1, 0, -2, 1, -1, 3, -2, -2, -2, 3, 5, 2, -4, 0, 2, 2, -3, 4, -4, -4, -2, 1, -2, -3, 5, 4, -3, 5, 0, 3, -1, 2, 0, 4, 4, 1, 2, 1, 5, 2, -1, 1, 3, -3, 6, 2, 0, -1, 6, -3, -2, 4, 3, -1, 2, -1, -2, -3, -1, -3, 4, -3, 0, -1, 5, 1, -1, 4, -1, 5, 5, -1, 1, -4, 0, 1, -2, 4, 0, -1, 2, 3, -4, -1, -1, -1, 4, -2, 3, 5, 0, 2, -1, 3, 4, 1, -1, -4, 2, 3, 3, 4, -1, 2, 5, 4, 4, 1, 2, 5, 0, -3, 0, -4, -5, -4, -4, 5, -4, -1, 0, -2, 3, -3, 3, -2, 2, -2, 4, -2, -1, 2, -2, -4, -3, -1, -5, -2, 5, 2, -1, 4, -3, 3, 3, 3, -1, 2, 5, 4, -3, 2, 3, 5, -2, 4, -4, 2, -5, 4, 3, -4, -3, -2, 3, 3, -4, -2, -2, 1, -4, 5, 5, -2, 5, 0, 2, -1, 2, 2, 6, -4, 4, -3, -2, 1, 4, -1, 0, 5, 5, 3, 0, 0, 4, 0, 6, 3, 6, 1, 5, -2, -2, 5, -3, 4, 5, -1, 1, 0, 1, -4, -3, -1, 0, 1, 1, -3, 5, 5, -4, 1, -1, 6, 3, 1, 3, -2, -4, -3, 0, 4, 6, 4, 2, 5, 6, 4, 3, -2, 3, 3, -4, 2, 0, -2, -5, 1, -1, -4, -2, -4, -3, -4, -1, 0, 4, 2, 5, -5, -5, -1, 2, 6, -5, -1, 1, 2, 0, -1, -1, 3, 5, 1, -3, -3, 0, 4, -1, 0, -1, -2, -3, -2, 0, 3, 1, -3, 2, -2, -1, -5, 1, 3, 0, 1, 1, 1, -4, -1, -1, -1, 5, 3, 1, 6, 2, -4, -5, -5, -3, 2, 1, 3, 1, 1, 5, -3, 3, 4, 0, 5, 0, -4, -3, -4, 5, -4, 1, -4, 0, 1, 0, 4, -1, 5, -3, 2, 5, 1, -2, 1, 1, -3, 2, 6, 5, -4, 2, -3, -1, 4, 4, 0, 2, 4, -2, 2, -1, 2, -1, -4, 5, -1, 2, 0, -4, -3, 1, -3, -3, -3, -3, -4, 0, 0, -2, 2, -3, -3, -4, 2, 2, 5, 6, 4, 2, 0, 4, 1, 4, 5, -4, -4, 1, -4, 1, 4, -3, -3, 3, 2, -3, 3, 4, 5, 2, 2, 5, 1, 2, 1, 0, 5, 5, 3, -1, 1, -1, -1, 5, -1, -1, -2, 4, -3, -2, 4, 1, 3, -4, -1, 1, 4, -3, 2, -3, -3, 3, 6, -3, -5, 1, 1, -1, -4, -3, -3, 1, 2, 5, -2, 5, 4, -1, 1, -1, 5, 0, 0, -2, 0, -4, -4, 1, 0, 0, 4, 4, -3, -3, 4, 4, 4, -1, 2, 3, -3, -5, -4, -4, -4, 5, -1, 5, -3, -2, 0, -1, -2, 0, 4, 5, -1, 3, -4, -2, 5, 3, -4, 5, 5, 4, 0, 2, 5, -2, -3, 0, -2, 2, -5, -5, 2, 1, 5, 1, -2, 5, -1, 1, 5, -3, 3, -1, 2, 5, 1, -3, 3, -3, -3, -2, 0, 5, 6, 5, 4, 0, 1, 1, -1, 2, 4, 2, 4, 0, 1, -4, -2, 1, 4, -3, 1, -4, 4, 2, 4, -3, 2, -2, 5, -3, 6, -2, -4, -1, -5, 4, 5, 0, 2, -3, -3, 2, 1, 5, -4, -3, 3, -1, -4, 3, 1, -2, -1, 1, 3, 1, -3, -1, 5, -4, -1, 3, 3, 5, -2, 0, 1, 1, 1, 5, -4, -5, -1, 4, 5, -3, -4, -4, 4, 1, 2, 4, -4, -3, -3, -3, 4, 5, -1, -1, -1, -3, 5, -5, 1, -3, -1, 1, 5, 1, 5, -2, 2, 5, 2, 5, 5, -2, 3, 6, 1, 3, 3, 4, 3, 0, -3, 0, -4, -3, -3, 5, 2, 5, 4, -4, -4, 0, 5, -2, 2, -2, 6, -4, 5, 4, 1, -1, -3, -1, 1, 4, 0, 1, 4, 2, 1, 3, 4, 5, -2, 6, 0, 3, 3, 3, -4, 5, 2, 1, -5, -4, 3, 4, 3, 0, 0, 2, -3, -3, 2, 3, -4, -2, 2, -1, -4, 3, -3, 4, -2, 4, -1, 5, -2, -1, -3, -1, 0, 5, 0, 2, 6, -5, 0, 4, 3, -4, -1, 3, -4, 4, 4, 6, 2, 2, -4, 3, -1, -2, 2, -2, 2, 1, -3, 0, 4, 3, -1, 6, -1, 5, 2, 4, -1, -4, 6, 3, -2, 4, 1, -4, 4, -3, -3, -3, 3, 5, 3, -3, 3, 3, 5, 5, -1, -4, 2, 1, -2, 5, 5, -4, 5, 3, 0, 1, 5, 4, -5, 2, 4, 5, -4, -4, 1, 5, 0, -5, -1, 3, 2, 1, 6, -2, 5, -5, 1, -3, 1, 3, -3, 5, -2, 2, 3, -2, 6, 4, 0, -4, 5, 2, -4, 5, 3, 5, -1, -3, 5, 0, 1, 2, 6, 2, 5, -2, -1, -4, 2, -3, 4, 5, -1, -1, -2, 0, 3, 0, 2, 1, 6, -4, -3, 3, -3, 3, -2, 1, -3, -4, -5, -4, 4, 3, -3, 6, -1, 4, -2, -1, -3, -4, -1, 3, -5, -5, 4, -3, 5, -1, -2, -3, -3, -1, 4, 3, 2, 0, 2, 3, 2, -3, 5, -3, -1, 4, 2, -4, 6, 3, 5, -2, 4, -2, -2, -4, 4, 1, 5, -3, 2, 4, -2, 5, 1, -1, -1, 0, -1, -2, 5, 5, 5, -2, 3, -1, -3, -3, 3, 0, -5, -2, -3, -2, 5, 5, 2, -2, 1, -2, 1, -2, 1, 0, -4, 2, 4, 3, -3, -2, -1, 6, -1, -4, 3, 5, 1, -2, 1, 5, 0, -3, -2, -2, 4, 1, 1, 3, 5, 0, 0, -2, 5, -3, -3, 5, -4, -1, 0, -1, 4, -1, 2, 4, 0, -2, -1, -2, 4, 3, -4, 4, 3, 5, -1, -1, 3, 4, -4, 3, -5, 1, 1, 3, 4, 3, 4, -5, 3, 0, -2, 2, -1, 1, 0, 3, 0, 3, 1, -3, -5, 5, 0, 5, -1, 0, 5, 4, 1, 4, 3, 5, -2, 3, 3, -2, 3, 2, 3, 1, -1, 0, -2, -4, 0, 1, -3, 2, 5, 4, 0, 0, 0, 3, 5, -1, 5, 1, 0, -1, -1, 2, -4, 2, 1, 2, 5, 5, 3, 5, 3, -2, -2, -1, -3, 4, 0, -1, -1, 2, 3, -2, 0, 3, -1, -4, -1, 2, 4, 0, 1, 4, 5, -1, -1, 3, 2, 1, 2, 4, -2, 1, 0, 1, 5, 4, 3, -1, 3, -4, 2, 0, 2, 2, -3, -3, 1, -4, 5, 1, -2, -4, 1, -2, 0, -5, 2, -1, 0, 0, 2, -3, 2, 1, 4, 1, 1, 1, 2, 1, 5, -1, -5, 3, 1, 5, 6, 2, -1, 1, -5, 5, 2, -1, 2, 0, 3, -1, 2, 0, -3, 1, 4, 2, -3, 1, -3, -2, 3, 4, -4, 3, -3, 1, 3, -1, -3, -1, 4, -4, 4, -4, 1, 0, -4, -4, 0, 0, 2, -4, -3, 3, 5, -2, 0, -2, -2, -2, -4, 2, -3, 0, 1, 5, 1, -2, 4, -4, 1, 6, 1, 0, -2, 0, 1, -3, 4, -3, 4, 0, 1, 1, -1, 3, 2, -2, -4, -1, 5, -3, -5, -3, 5, 1, -1, -1, 0, 4, 2, 4, 6, 1, 0, -1, -4, 5, -2, 4, 5, -4, 4, -3, -4, 3, 0, 2, -1, -1, -1, 1, 5, -1, -2, 6, -1, 5, 1, -1, 4, 2, -3, 1, -4, 2, 1, 0, 5, 5, 5, 4, 5, 5, -1, 3, -3, 0, -1, -5, 3, -2, 0, 5, -1, -4, 3, -1, -1, -2, -5, -1, 4, 1, -2, 4, -4, 6, 1, -3, 2, 4, 1, -1, 3, 1, 3, 0, -2, 4, -3, -5, 4, -1, 3, -3, 5, 3, 4, -4, -1, -4, -3, 0, 6, -2, 4, 2, 1, -1, 3, -3, 1, -1, 5, -3, -1, -5, 3, 1, 1, 4, 0, -1, -2, 1, 1, 5, 1, -2, 3, -1, -3, 2, -1, -4, 2, 3, 1, 4, 0, 1, -3, 3, -4, -5, -4, -3, 3, 3, -4, 4, -3, -5, 1, 2, 3, 0, 5, -3, 3, -4, 0, 5, 6, -2, 5, 3, -3, 0, -4, 2, -2, 6, -3, 4, -3, 2, -4, 1, 1, 0, -2, 6, -2, 4, 3, -2, 2, 1, 4, 6, 1, 5, 6, 5, 0, 2, -3, 0, 0, 4, -3, 0, 2, -2, 4, -2, -1, 2, 5, -1, 2, -4, -1, 1, -4, 0, -5, 4, -3, -1, -3, -1, 2, -3, 0, 3, 4, 2, 5, 3, 4, -3, 4, 1, 0, 5, 2, 4, -3, -4, 5, -3, 4, 3, 3, -2, -2, 4, 6, -2, 2, 3, 5, -1, 4, -3, 3, 2, 3, -5, 3, 5, -4, 5, 4, 2, 1, 5, 4, 4, 2, 4, -1, 2, 2, -2, -4, 0, 2, 6, -2, -1, -2, 1, -2, 3, 0, 0, 0, -1, 5, -4, 3, 4, -3, -2, 4, -5, -4, -1, 4, -2, -2, 5, 6, -3, -1, -1, 1, 5, 5, 1, 4, 3, 4, 3, 5, 6, -1, 5, 2, 3, -4, 0, -2, 0, 1, 3, 3, 0, 3, 5, 5, 5, -5, -4, -3, -2, 4, 4, 0, -2, 2, 2, -3, -2, 4, 3, -1, -2, 5, -4, 1, 2, -2, 5, -3, 1, -1, -3, 2, -5, 1, -5, 5, 5, 2, -4, 2, -1, -1, 5, 1, 3, -3, 0, -4, 3, 4, 4, 1, 1, 2, 4, -2, 1, 1, -3, -2, 0, 4, 1, -2, 2, 5, 1, -2, 3, 3, 3, 5, 1, 0, 1, -1, -3, -5, 2, 0, 0, 6, 5, 5, -3, 5, 3, 0, -1, 3, 3, -4, 4, -4, 5, -5, 4, -1, -4, 4, 2, -4, 0, 1, -2, 2, 5, -1, 4, -4, 1, -3, -4, 0, 3, 1, 4, 0, 0, 3, 3, 1, 3, -3, 6, 4, -3, -2, 4, 1, -4, -1, -1, 3, 1, -4, 2, 5, -4, -1, -1, 3, -1, -2, -2, -4, -2, -4, -3, 0, 2, 4, 2, 2, -3, 3, -1, 5, -4, 1, -5, 5, 3, 4, 2, -4, 0, 4, 3, 2, 1, 4, -2, 1, 0, -2, 0, -1, -2, -3, -2, 0, 1, -3, 5, -3, 0, -3, -3, 6, -3, -2, 4, 0, 4, 1, 4, -3, 0, 5, 1, -1, 1, 3, 4, -3, 1, -4, 2, -4, -1, 1, 4, 3, 3, 5, -3, 0, -1, -3, 6, 4, 2, 2, 4, 2, 3, -3, 6, 2, -2, -4, -3, -3, 1, 2, 4, -2, -3, -1, -1, -4, 5, 4, 1, 5, 3, -5, 1, -4, -5, 1, -3, 4, -2, 3, 2, 1, -4, -2, -3, -5, -1, -4, -5, -5, -1, -1, -2, -5, 5, 3, 1, -2, -4, 4, 3, 3, 2, -5, -3, -2, -2, 5, 0, 3, -1, -3, -1, 4, -2, 1, 4, 2, 1, 2, 5, 3, 2, 5, 2, 0, 0, 6, 5, 4, 5, -4, 1, 2, -4, -2, -3, -3, 2, 4, 1, -4, 4, -2, 2, 1, -1, -5, 6, 2, 0, -4, 3, -1, 6, 6, -2, 0, -1, 0, 1, 3, 5, -2, 5, 4, -3, -3, 5, -3, 4, 0, 1, 5, -4, 3, 6, 5, 3, 0, 1, 0, -4, 4, 5, -3, -3, 5, 1, 0, 1, 3, -4, 0, 5, 4, 4, 6, -2, 2, 0, -3, 0, 1, 0, 1, -5, 0, 2, 0, 3, 0, 2, 2, 5, -1, -3, 4, -5, -3, -1, 4, -3, 5, 0, 0, -4, 0, -2, -3, -5, -3, 2, 4, -4, 2, -3, -3, 3, -3, 2, 4, -3, -3, -4, -3, 6, 0, 3, 2, -1, -3, -3, 0, -2, 4, 4, 0, 5, 3, 3, 5, 2, 3, 3, 4, 4, 0, 3, -3, 0, 4, -2, 1, -2, -1, -2, -2, -5, -1, -4, 1, -1, 3, -1, -5, 0, 3, -2, 4, 1, 6, -4, -2, -4, -3, -5, 0, -4, -2, -4, 1, 4, -4, -1, 1, 4, -3, -1, 0, -3, 3, -2, 5, -1, 3, -1, 3, -4, 5, 4, 4, 2, -2, -3, -1, -2, -5, 4, 3, 2, 4, -4, 2, -4, -3, 4, -1, -4, 2, -2, 4, 1, 2, 0, -4, 1, -2, 3, -5, 0, 4, 4, -4, -3, -3, -5, 0, 2, -3, 5, 3, 5, -2, -1, 0, 5, 0, 0, -3, -2, 1, 1, 1, 1, 4, 4, 3, -1, -1, -4, 1, -3, 2, -3, 1, 3, -5, -4, 4, 3, -4, 5, -3, 0, -1, -4, 1, 1, 4, 1, -1, 3, 4, 2, -4, -1, 0, 1, 3, 5, 0, -4, -1, 4, 2, -1, 0, -3, 3, 4, 1, -4, -1, 5, 3, 0, 4, -2, 0, -4, 4, 1, -4, -3, 4, 1, 1, -4, -3, 0, -1, -2, 0, 4, 5, -2, -1, -3, 4, 1, 2, -3, 5, 1, -2, 5, -1, -1, 0, 6, 4, 3, -5, -2, 3, -3, 1, -4, 4, 1, 0, 4, 2, 1, 5, 5, 0, 1, -4, 0, -3, 1, -2, 0, -4, 3, -1, 4, -1, -4, -4, -2, -4, 3, 2, 3, 0, -2, -1, -3, -3, -4, 4, 6, -1, -3, 0, 5, -1, 5, -4, 4, 5, -3, 2, 0, 6, 4, -4, -5, 5, -5, -2, -2, 5, 0, 2, 3, -2, 0, 4, 5, -4, 6, 1, 3, 3, -1, 1, 5, -4, -4, -4, 4, 2, -4, 1, 0, -1, 5, -4, -1, -5, 3, 4, -4, 4, 4, -2, -3, -4, 3, 2, -1, 5, -1, 3, 3, -4, -3, 5, -2, 5, 2, 1, 0, 6, 0, 5, 1, 3, 4, 2, -3, 3, 1, -4, 0, 3, 3, 0, -1, 1, -2, -1, 0, -1, 0, 0, -4, 5, 5, 1, -2, 1, -2, -5, 6, 2, -2, 5, 0, -1, 0, -3, 1, -4, -2, 2, -4, 4, 3, 4, 4, -5, 5, 6, -1, 5, -1, 1, 5, 0, 1, -1, 3, 3, 0, -3, -5, -3, -4, 3, -4, 0, -2, -2, 4, -3, 3, 6, 5, 1, 5, 0, -4, -2, -5, -4, -1, -1, -1, 2, 0, -1, -2, -3, 3, 1, -4, 4, 5, -1, 6, 4, -4, 5, -4, 5, 4, 2, -1, -2, 4, 1, 6, 3, 5, -1, -1, -3, 0, -3, 2, 4, -1, 5, 0, -2, 2, -5, 0, 0, -3, -4, 1, 0, 5, -4, 0, -2, 2, -4, -4, -3, 1, -3, 3, 6, -3, -2, 1, 3, 4, -1, 2, 1, 3, -2, -3, -4, -1, 3, -2, 5, 5, 3, -2, -4, -2, -2, 5, -3, -3, 0, 2, 0, 0, -4, 1, 1, 3, 4, 5, -4, 4, -1, -4, -2, 4, -1, -3, 6, -1, -1, 5, -1, -1, -2, -2, 4, 3, -2, 3, 3, 5, 5, 4, -1, 2, 2, 3, 4, -1, 0, 0, -2, 4, 0, -4, -2, 3, -2, 2, 5, -2, 1, 2, 0, 4, -2, 0, -2, 5, -4, 6, 0, -1, -4, 2, -4, 5, 3, 3, 1, 5, -4, -5, -4, 5, 0, -4, -2, 2, -1, -1, -2, 5, -1, -3, 3, -2, -1, -4, -3, -3, 1, 0, 0, 0, 4, 1, 0, -2, 2, 5, -4, -4, 2, 4, 3, 5, 3, 3, -3, 0, 0, -4, 3, 4, 0, 5, 4, -5, 1, -2, 6, 3, -3, 5, -3, 2, -4, -3, 4, 2, 1, 4, 1, -3, -3, -4, 2, -1, 5, 0, -3, 1, -2, 6, 5, 5, -4, 3, -2, 3, -3, 5, -2, 0, 3, 4, 3, -3, 4, 0, 2, 0, -3, -1, -2, -1, -5, -1, 1, 2, 2, -5, -1, -2, -3, -2, -3, 1, 2, 0, -4, -5, 0, -4, 1, -3, 0, 6, 5, -2, -1, -4, 3, 3, 5, 5, -4, 2, 5, -3, -1, 2, -4, 4, 2, 1, -2, 1, 1, 0, -5, -4, -2, 5, -3, -3, -1, -2, -5, -4, 5, -1, -4, -3, -2, 2, 4, 4, 2, -1, 2, -3, 4, -2, -4, 1, 4, 1, -4, 2, -4, 0, 2, 5, -3, 0, -4, 5, 2, -4, 2, -4, 3, 1, 1, -2, -3, 1, -5, 3, -4, 3, 0, 2, 3, 1, 0, -3, -3, 3, 5, -3, 4, -2, 4, -1, -2, 4, 4, 0, -3, 0, 6, 3, 1, 3, -3, 2, 4, -4, 2, -3, 2, 5, 0, 5, 3, 3, -1, -1, -1, -4, 4, 1, 5, -4, 3, 0, -5, -1, 4, 4, 2, -4, 1, 4, 3, 3, 5, 6, 1, -2, 0, 3, 3, 1, 0, 3, -4, 1, 2, 3, -3, -3, -4, 1, -4, -1, -1, -1, 2, -2, 2, -3, 1, -1, -1, 0, 3, 6, -1, -2, 4, 2, 1, 1, 3, 5, 2, 1, 0, -3, -2, -4, -5, 5, -4, 4, 2, 1, 2, -4, 4, 2, 4, -4, -1, 1, -4, 2, 2, 4, -1, 0, 5, -3, 2, 4, 0, -3, -3, 3, -4, 3, -2, 5, -3, -4, 3, 0, 5, 5, -3, 4, 3, 2, 1, 6, -1, 0, -2, 3, -1, 2, -2, 0, 0, 0, 4, 1, 3, -2, 0, -1, 0, 6, 0, 5, 0, -1, -1, 5, 0, -3, 2, 4, 3, 4, -2, 0, 1, -2, -1, 0, 1, 5, 3, -1, 1, 1, 3, 3, 2, -2, -4, 0, 4, -4, -4, 5, 2, 0, -2, 0, 0, 2, 4, -4, 0, 3, 0, 3, 0, 1, 4, 2, 0, 0, 4, 0, 4, -4, 3, -2, 2, -4, 1, 5, 5, 2, 4, 1, -5, -5, 4, -3, 3, 0, -2, 1, -2, 3, -1, 2, -2, -4, 6, -2, -2, -4, 4, -5, -2, -1, 3, -3, 5, -3, 5, 4, -3, 2, -2, 4, 5, -3, 1, -4, -3, 0, -3, -2, -2, -4, -3, 3, 0, 3, -4, -4, 2, 6, -5, -2, 2, -4, -2, 2, 4, 0, 5, -3, 1, 0, 2, -5, -1, 0, -1, 5, 2, 2, 3, -3, -3, -2, 1, 4, 1, -1, 0, 5, 4, -4, 1, 3, 2, 1, -4, 3, 0, -3, 6, 4, -4, 5, 0, 2, 1, 4, -2, 4, 3, 0, -1, -1, 3, 6, -4, 5, -2, 0, -1, -3, 2, -3, 5, 3, 5, -1, 2, 5, 0, -1, 3, -2, -3, 3, 1, 0, 1, -3, 5, 4, 5, -3, 1, 3, -2, 3, -1, -1, -4, -3, -4, 5, 5, -3, 4, 2, 5, 4, -1, 3, -1, 3, 1, 2, 3, 3, -3, -2, -1, -4, -4, 3, 2, 4, 0, -4, 1, 4, 2, 1, -3, -5, 3, 3, 2, -4, -3, -3, 1, 0, 1, 0, -4, -3, -2, 2, 5, -1, 5, 2, 6, -3, 2, 3, 5, -4, 3, 4, 1, 5, 4, -2, -4, 4, -4, 1, 0, 6, 2, -4, -1, -1, -4, -2, 0, -4, -4, -4, 5, 4, -1, -2, 0, 4, -5, 3, -4, 0, -2, 5, -3, 4, 4, -2, 3, -3, 3, 1, 3, 4, -4, 0, 2, 1, -3, 2, -3, -1, 4, -1, -2, 0, 0, 2, -3, 5, -3, 0, -1, -3, 0, 5, 0, 0, 0, -5, 4, 2, -5, 4, 0, 4, 3, 4, -3, 5, 2, 0, -2, -2, -4, -4, 6, -5, -5, 4, 2, -1, -1, -4, 1, -4, -4, -2, -2, 0, 5, -1, 1, 5, 0, 3, -2, -2, 3, 2, 1, 0, 4, 3, -4, 5, 3, 5, -2, 0, 0, 0, -1, -4, 5, -3, -2, -3, 0, 4, -2, 1, 4, 2, 3, 3, 1, -3, -3, -2, -2, 5, -5, 1, -4, 1, 5, -3, 1, 3, -2, -1, -2, 0, -2, 5, 6, 0, 2, 2, -4, 5, 3, -2, 1, 5, -2, 4, 6, 2, -4, 4, -1, -1, -4, -2, -4, 5, -1, -1, 4, -4, -3, 5, 6, 1, 1, 2, 3, 0, 1, 0, 2, -2, 0, 2, 6, 3, -4, -4, 2, 0, -4, 0, 2, 3, -2, 4, -3, -2, 2, -4, -2, 0, 6, 5, 4, 1, -3, 0, -2, 1, 0, -4, -4, 2, 1, 1, 3, -3, 4, -1, 5, 2, 1, 2, 5, -3, 6, 1, 4, 6, -4, -2, 1, -1, 3, 5, -2, 2, 2, -5, 4, 3, -4, -4, -4, 0, 1, 3, 4, 1, -3, -2, 6, 0, 1, -1, -2, -2, 6, -2, 3, 1, -2, 4, 4, 1, -3, 2, -1, 3, -3, 4, -4, -1, 0, 3, -3, -1, -2, -3, 5, -1, -3, 1, 0, -4, 2, 0, -1, 3, 2, 5, 2, -1, -3, -4, -1, 4, 0, 4, 3, -3, 5, 5, 3, 3, 4, -4, 4, -1, 4, 4, 5, 2, 3, -2, 3, -4, 4, -2, 3, 6, 0, 4, -2, 3, -2, 2, -2, 2, 1, 2, -4, 3, 0, 1, -3, 3, -2, -1, -3, 1, 1, -4, 5, 4, 0, 2, 1, 2, 1, 4, 3, -2, 3, -2, 3, -4, -3, 5, -4, 1, 2, -1, -2, 3, 0, -2, 1, -2, 2, 5, 0, 4, 4, 5, 0, -4, -4, 1, -4, 3, -4, 1, 1, -4, 5, -1, 4, 3, 0, 5, 5, 3, -3, 1, -3, -1, 0, 0, 0, -1, 3, -3, -3, 6, 0, 1, 1, 4, -1, 6, 0, -4, -4, 0, -1, 4, 1, 2, -4, -4, 3, 5, -4, 4, -1, 4, -3, 5, 5, 3, -2, 3, 3, 5, 0, 0, 0, -5, 6, 6, 0, 0, 0, -2, -4, -3, 4, 3, 6, 0, -2, -4, 5, 3, -4, 1, -5, 2, -2, -1, -3, -3, 4, 5, -1, 3, 1, 0, -1, 4, 5, 4, -2, -2, 2, 4, 3, 2, -1, 2, 6, 0, -1, 4, 1, 1, 5, -1, -3, 6, -1, -2, 4, 5, 4, -2, -2, 3, 5, 1, -1, 3, -3, 1, -5, -1, -2, -1, -1, 3, 2, 2, 6, -4, 5, -3, -1, -3, 4, -3, 4, -2, 4, -3, -5, 1, -3, -4, -2, 5, 6, -4, -3, -3, 3, 3, -1, 1, -1, 1, 4, 4, 4, 3, -2, -3, 0, 4, -5, 0, 1, 2, -1, 2, 1, -3, 5, -2, 4, -2, 5, 5, 5, 6, 6, -2, 1, -4, 1, -4, -4, 3, 0, 4, 2, 4, -1, 2, 3, -2, 5, 4, -2, -1, 3, -3, -1, -1, 5, -1, 0, 6, -2, -4, 4, 4, 5, 5, -3, 1, -3, -2, 5, 3, 4, -1, 0, -3, -1, 2, 3, -1, 0, -1, 5, 4, -5, 2, -3, -3, 5, 2, -3, 4, 5, -4, 0, 5, 3, 3, -4, 3, 3, 5, -3, 0, 3, 0, 4, -3, -4, -4, 5, 0, -3, -3, -1, 5, -3, -4, -3, 1, 6, 1, 1, 5, 3, -2, -2, -4, 1, -4, 2, -2, 0, -4, 1, -4, 3, 3, 5, 2, -1, 5, -1, 0, -2, 0, 0, -2, -2, -1, 5, -1, -2, 4, -5, 4, -4, 1, -5, 4, -2, 2, 0, 1, 5, -1, 4, -4, 2, -1, -2, 3, -1, 2, -1, -4, 2, 0, 4, 0, -1, -1, 2, -1, 4, 1, -3, 2, 1, 5, 1, 2, -1, -2, -4, 3, -1, -4, -3, -2, 6, -2, -3, -4, 5, 0, 6, -2, -3, 1, 2, 1, 4, -1, 3, 3, -1, -5, 0, 0, -2, -1, 3, -2, 2, -4, 0, 0, 3, 2, 1, -1, 2, 3, 5, -5, -2, 1, 2, -2, 1, -3, 1, 1, 1, 6, 1, 1, 3, -2, 0, 4, -1, 3, 3, 1, 5, -2, -2, -5, 1, -4, -4, -2, 0, 4, 1, 4, 3, 2, -2, -1, 4, 5, 1, 1, -2, 0, 6, 4, -2, 5, -1, -3, 4, -4, -2, 4, 4, 4, 0, -3, 3, 5, -3, 3, -3, 0, 1, 2, -5, 3, 1, -4, 4, -2, 4, 3, -2, 2, -3, -3, 5, 3, 5, 5, 3, 0, 3, 3, 4, 1, 5, 0, 2, -1, 3, -4, -4, 0, 2, 2, -4, -5, -5, -2, -3, -1, 5, 1, 5, 1, 1, 5, 3, 3, 6, 1, 0, 1, 0, -3, 4, -3, 3, 4, 5, 4, -4, 4, 2, 1, -4, 4, -1, -1, 4, -4, 5, 5, 1, 5, -4, -3, -1, -3, 0, 4, -3, 2, 3, 3, 6, 5, 2, -1, 4, 5, -1, 3, -5, 5, 0, 0, 0, 2, -3, 0, 3, 2, -1, 6, -3, 5, 0, -2, 4, 2, 0, -5, 0, 6, 3, 5, 2, 6, -2, 4, 4, -1, 4, -3, -2, 2, 4, 4, -3, 2, -2, -1, 5, -4, 0, -3, 1, 5, 2, -2, 5, -3, -3, 5, 5, 1, -2, 0, 6, 2, 2, -1, 4, 6, -1, 2, 1, 1, -2, 3, 0, 3, -3, 0, 2, -4, 0, 4, 1, 6, -4, 1, -2, -2, 5, 3, -2, 1, -1, -2, 3, -2, 4, 0, -1, 4, -2, -3, 3, 4, 5, 2, -2, 3, 1, 1, -1, 5, 1, 5, -3, 4, -4, -1, 0, 1, 5, 2, -2, 0, -4, -2, 1, -1, -3, -4, 5, 5, -3, 2, 2, -1, -2, 5, 1, -5, 4, 3, 1, 1, -2, 4, 2, 1, -1, -5, -3, -4, 2, 3, 5, -4, 2, -2, 4, -2, -1, -1, 2, -1, 0, 0, -3, 6, 5, 3, 1, 4, 3, 1, 1, -2, 1, 1, -4, -2, -4, 1, 0, 2, -1, -3, 3, -2, 1, -2, -5, 2, 1, 3, -1, 4, 2, 1, 5, -5, 0, 5, -3, 1, -1, 6, 5, 2, -4, -4, 4, 0, 4, 1, -1, -4, 5, 3, 1, 1, 4, 4, -5, -1, 2, 2, -3, 2, 1, -1, 1, -1, 2, 1, 4, 5, 1, 4, 1, 5, 1, 3, 1, 4, -3, 0, 6, 5, 5, 1, -1, -1, -1, 5, 4, 0, -1, -1, -4, 0, 1, -4, -3, 5, -1, -2, -1, 6, 2, -1, 5, -2, 5, 4, -1, -1, 1, 3, -4, -2, -3, 1, 5, -3, 5, 1, 5, -2, -4, 1, 0, -1, -1, 2, -2, 0, 1, -1, 4, -3, -3, 3, -2, -1, -1, 5, 4, -2, 1, -1, 5, 0, 1, -2, -5, -2, -5, 0, 1, 3, 0, -1, -1, -4, 0, 5, 1, 5, -1, -4, -3, 4, -1, 1, 3, 0, 3, 5, 1, -2, -4, -4, 1, 5, 1, -4, 1, -1, 2, 3, -2, 4, 2, -2, -3, -5, 3, -4, 2, 4, 1, -2, -2, -2, -4, 0, -3, 1, -1, 5, -1, 5, 2, 2, 1, 1, 5, 0, -1, 3, -2, 0, 4, 4, 1, 0, -3, -4, 2, 0, -2, -1, -4, -4, 5, 0, 4, 3, -4, 4, 4, 3, -2, -2, -3, -2, 3, -2, 0, 0, 3, 4, 2, -3, -2, 3, 3, 3, 0, 4, -3, 6, 4, 5, 3, -3, 4, 3, -4, -4, -2, 1, -4, -2, 4, 2, 5, -1, 3, -2, 2, 2, -5, 1, 2, 5, 5, 4, 4, 4, -3, 1, 5, 4, -2, -3, 0, -3, -4, 5, 2, -4, 5, 6, 1, -2, 3, -4, 4, 4, 5, 0, 4, -4, 6, 0, 3, 2, 5, 0, 4, -3, 3, -3, -2, 6, -2, 4, -4, -5, -4, 2, 3, 4, 2, 5, -4, 0, -3, 3, -1, 3, 3, -3, -2, 1, 3, 0, -2, 2, 3, 3, 0, 1, 3, -4, 3, 0, -4, 2, 4, 2, 6, -3, -5, 0, 1, -1, -1, -3, 1, 1, 3, 4, -1, -3, -1, 5, 3, -3, 0, 2, 3, 0, -3, 5, 0, 2, 3, 5, 0, 1, 2, -4, 4, -1, 6, -4, -2, -1, 0, 2, -3, -4, -1, 2, -3, 1, 3, -4, -4, 6, 1, 3, 2, -1, 1, 0, 3, 5, -1, -2, -1, 6, -2, 1, -3, -2, -3, -4, -5, 2, 0, -2, 5, -4, 4, -2, -5, 1, -4, -2, -4, -3, 3, 1, 4, 5, 3, 2, -5, 0, -3, 0, 1, 2, 1, 0, 4, 2, 0, -2, 2, 2, 3, 0, -1, 5, -4, 0, 4, 0, -4, 1, 3, 0, -1, 3, -5, -2, 4, -2, 3, 1, 6, -4, -3, 3, 4, 5, 2, 2, -1, 5, -2, 4, 6, 4, 5, 0, -5, -1, -3, -1, 4, 5, -1, 5, 4, -1, 2, 2, 2, 3, 2, -1, 2, 1, 4, 0, -3, 4, 2, -4, -3, 1, -3, 5, -2, -5, -4, -1, -4, 1, -1, 1, 6, 5, 3, 2, -4, 4, 1, 6, 0, 4, -2, -3, -1, 2, 1, 0, -1, 2, 4, 0, -1, -2, -1, -1, -2, 2, 1, -2, -3, 4, -5, 1, 0, -2, -3, 3, -4, 0, 0, 0, 4, 1, 3, 4, 4, 0, -4, -1, 6, -3, 0, 0, 5, -3, 1, -3, 2, -3, -2, -1, 5, -1, -5, -1, -2, 5, -2, 5, 3, 2, -4, -4, -3, 1, 5, 3, -3, 2, 2, 3, 6, 0, -4, -4, 4, -2, 1, 2, -1, 4, 2, -4, -4, 3, -5, -3, 5, 4, -1, -1, -4, -3, 3, 5, -1, 4, 0, 0, -1, 2, -4, 3, 5, 2, 0, -1, -1, 2, -4, 3, 0, 5, 2, -1, 2, 1, -1, 2, -2, -1, -1, -3, 3, 2, 1, -2, 3, 5, -3, 0, 3, 1, -4, 6, 5, 2, 5, 5, -3, -2, -4, 2, -5, 0, 0, -2, 5, -2, -1, -4, -2, 2, 2, 1, 1, 3, 2, 5, 2, -5, 3, 2, -2, 5, 4, 6, -1, 5, -2, 3, -3, -2, 2, 4, 4, 0, 4, -4, 1, 1, -1, 2, 1, 1, 5, -4, 5, 5, 0, 5, -3, 3, 1, 1, 0, -4, 2, 6, 5, 2, 0, 3, 2, 1, 0, -2, 5, 3, 2, -2, -1, -4, 3, -4, -2, -5, 2, -2, -2, -1, 3, 5, -1, -1, 2, -4, -4, 0, 1, 4, -1, 0, -4, 4, -4, -5, 2, 4, 6, 0, 2, -1, -4, 0, 3, 2, -1, 0, 0, 6, 6, 4, 3, 2, 5, 0, 4, 1, 3, -1, 4, 4, 2, -1, 3, 2, 4, 1, 2, 4, -1, -4, 0, 4, -5, 2, -5, 0, -3, -2, 5, 3, -1, -5, 5, 2, 2, 1, -2, 3, -3, 1, 3, 1, -3, -3, 3, 5, 6, 2, 0, 0, 2, 0, -1, 0, 3, 6, -2, 4, -3, -3, 5, -3, 0, -3, -5, -1, -3, 4, 5, -4, 6, 1, 4, 4, -2, -3, 6, -3, -2, 0, -2, -3, 2, 2, 4, -5, 6, -1, -1, -1, 5, -1, -2, -1, -1, -1, -3, -5, 5, 4, 1, 3, -1, -3, 4, 3, -2, 0, 4, -1, -2, 5, 5, 1, 4, 5, 1, 6, 1, -3, 3, 0, -1, 6, -2, -4, -2, 4, -2, -3, 6, 0, 1, 5, -3, 5, 1, -3, 5, -1, 0, 2, -1, 5, 0, 5, 0, 1, 3, -4, 2, 0, 2, 0, 0, 3, 5, -2, -2, -1, -2, 4, 2, 4, 5, -3, 2, -4, 0, 5, -2, -4, 4, -4, -2, -2, 2, 1, 4, 2, -1, 3, 3, -3, 3, -4, 1, -3, 3, 3, 0, 0, 1, -2, 4, 3, -1, -2, 3, 2, -2, -4, -5, 4, 4, 1, -2, 0, -1, 2, -2, 3, 5, 3, 0, 5, 5, 5, 2, 5, -1, 4, 6, 2, 1, -4, -3, 0, 4, -3, 0, 5, -3, -2, -2, -3, 5, -1, -2, -4, -2, 3, 1, -1, 3, -2, 5, -4, -4, -4, 2, -4, 1, -4, 2, -1, 5, -3, 5, -2, 5, 6, -5, 1, 1, 4, -3, -3, 4, 5, 1, 3, 5, -3, 3, 1, 4, 4, 4, 5, 4, 1, 5, -5, -1, -4, 2, 3, -3, 1, 0, 2, -3, 2, 2, -4, 0, 5, -2, 0, -4, -3, 6, -5, 3, 0, -4, -1, 4, -2, 2, -4, 6, 1, -4, -4, 0, 4, 5, 0, 1, 0, 2, -2, -3, -1, 0, -1, 5, 4, -4, -1, 3, 2, -2, 5, -1, -1, -2, 1, -3, -4, 2, 5, 6, 4, -3, -4, 3, 1, 4, 5, 5, 5, 2, 3, 2, 1, -4, 3, 1, 2, -3, -2, -3, 5, -3, -3, 3, 1, 5, 5, 0, 1, -1, -1, 4, 5, -1, 6, -2, -1, -3, 1, 4, -1, -3, 2, -1, 2, -2, 1, 3, -3, 5, 1, 3, -3, -3, -1, 4, 1, -3, 3, 2, -1, -4, 1, 0, -4, -3, 5, 2, 6, 2, -2, 5, -5, -1, 0, 4, -3, -3, 3, -5, -5, 2, 2, 4, 2, 3, 1, 2, -2, -1, 2, 5, 4, 4, -1, -4, -4, -5, 4, -4, 1, 4, 6, -4, -4, 1, 2, -5, -4, 5, 2, -4, 5, 1, 3, 2, 3, 3, 2, 4, -4, 1, 2, 2, 0, 0, -3, 1, 0, 1, 2, 4, -3, 0, 4, -1, 1, -1, -4, 4, 1, 5, -1, -4, 4, -1, 0, -2, 4, 5, 5, 3, -4, 1, 2, 5, -4, 1, 3, -1, 5, -4, -2, 2, -1, -2, -1, -4, -2, 5, -1, 2, -1, 2, 3, -3, -2, 2, -2, 4, -4, 1, 2, 1, -3, -3, 0, 1, -1, -1, -3, -2, 2, -2, -2, -1, 5, 1, -1, -1, 4, -3, 0, -2, -2, 4, -3, 5, -3, 3, -1, 6, -1, -3, -2, 3, 2, -4, 3, -2, 2, -4, -2, 5, -2, 0, -2, -2, 0, 1, 0, 3, 0, 5, 6, 3, 1, -3, -1, -1, -1, -2, 3, 0, 5, -2, 5, -1, -2, 5, -4, -5, 5, 0, 5, -4, 5, 1, 4, -1, 2, 3, -1, 1, 0, 4, 5, 4, -1, 5, -2, 5, -4, -1, 2, 0, 0, -2, -3, 0, -5, 4, 3, 1, 3, -2, -1, 3, 1, 1, 5, -2, -3, -1, -2, 1, 1, 5, 1, 0, 5, 3, -3, 6, 1, 5, 4, 3, -3, 5, 2, 4, 0, 6, 1, -2, 4, 4, 3, 2, 3, 3, -3, 0, -2, 5, -1, 4, 0, 1, 4, 4, -1, 5, 0, -2, 3, -2, 1, 5, -5, 4, 3, -3, 5, 5, -3, 6, 4, -3, -3, 1, 4, 1, 0, -3, -1, 1, -4, 0, 4, 3, -1, -2, 2, 2, 2, -5, -1, -3, 4, 2, -1, 0, 4, -4, -4, 2, 6, -1, 1, 2, 3, 5, 4, 0, 2, -1, 3, 5, 5, 4, 5, 3, -3, -3, -4, -1, 2, 3, -2, 2, 4, -2, 0, 5, 2, 0, 3, -1, 5, 2, -3, 5, -4, 2, 2, -3, 3, -3, 2, 4, 1, -2, -2, -1, 2, -2, -3, 4, 3, 1, -1, 1, 0, 1, 3, 1, -1, 2, 0, 1, -3, 3, 3, -2, -1, 2, 4, -3, -1, 6, -4, 1, 3, 5, -4, 5, -1, 1, 2, 5, -2, -2, 0, 4, 2, -5, 4, -2, 1, 3, -1, -1, 2, -2, 2, 0, 4, -1, 5, -3, -2, 6, 3, 4, -1, -1, 5, 3, -2, 3, -4, 1, -3, 3, 4, 6, 2, 2, 3, 4, -1, -4, -3, 1, 1, -3, 4, 5, -3, -3, -3, 2, -3, 0, -5, 1, -1, 4, -1, -5, 4, -2, 5, -3, -2, 2, -2, -2, -1, -5, -4, 3, 1, 0, 4, 0, -5, 6, -1, 1, 1, 1, 4, 0, 5, 0, 5, -3, -1, 0, 2, -5, -3, 4, 3, -3, -4, 1, -2, 5, 1, 1, -2, 4, -5, -2, -3, -3, -2, 4, -2, 0, 3, -3, 6, -3, 1, 1, 1, 4, -4, 1, -2, 0, -1, 0, -4, -1, -1, 0, -1, 2, 2, 0, -5, -4, 2, -1, 5, 2, 0, -2, 0, -5, 2, -5, 0, -4, -1, 0, 3, -3, 0, 0, 3, -1, 1, 4, 0, 4, 0, 5, -2, 6, -4, 4, 0, -2, -5, 5, -5, 3, 0, -2, -2, 2, -4, 3, 5, 6, 6, 6, 5, 5, -1, -3, 0, 2, 0, -4, -2, -3, -4, 1, -2, 5, -4, 0, 3, -1, -4, 2, -1, -4, 0, -2, 1, 1, 1, 2, -4, 0, -1, -1, 2, -1, -1, -2, 3, 1, 4, -3, 0, -3, -4, 3, 4, -4, -3, 5, 2, 3, 1, 1, -3, 4, 1, 5, -1, -3, -4, 1, 2, 6, 1, -3, -3, -3, -3, 1, -4, 0, -2, -3, 0, 6, 2, 5, 6, -3, 1, 0, -3, 0, 5, 2, -4, 0, 4, -2, -3, -2, 2, -4, 3, -4, 3, 1, 0, 3, 3, -4, 5, 5, -1, 1, 3, -2, 1, 1, 6, 3, -1, -3, 0, 6, 3, 1, -2, -4, -4, -4, 3, 5, -4, 4, -2, 2, 5, -2, 5, 2, 3, 5, 1, 3, 4, 6, -1, 1, 5, 3, -4, 1, 5, 4, 0, 4, 3, -2, -3, 1, 2, 3, 3, 4, -4, -3, 4, -4, 2, -3, 3, -1, 4, 2, 5, -5, -4, -5, 0, -1, 4, -1, -1, 2, 3, 4, 1, 1, 4, 0, 4, -2, 4, 0, -2, 3, 1, 5, -4, 2, -2, 1, 3, 1, -1, -2, 4, 2, -5, -4, -4, 2, 5, 2, 6, 2, 4, 0, 2, -1, -2, 2, -1, -3, -2, -4, -2, 3, -2, -1, 3, 1, -2, -2, 3, 4, 4, -3, 5, -1, -2, 5, -4, 4, -3, 2, 4, -5, -2, -2, -5, 3, -4, 4, -4, 1, -3, -2, 4, 4, 4, -5, -1, -2, 2, 0, 4, 3, -3, 4, 1, -4, -3, 4, -3, 4, 2, 0, -2, 4, -4, 1, -2, 0, 2, 4, 3, -1, -4, 1, 4, 5, 0, -3, -2, -3, 1, -3, 5, -3, 6, -3, 6, 2, 5, 2, -1, -3, 5, -2, 0, 5, -2, 0, 3, -1, -4, 5, -2, -1, 2, 6, 0, 0, 3, -1, 4, -1, 4, 5, -3, 2, 1, -2, 2, 2, 4, 3, 3, 0, 5, -1, 1, 2, 5, 1, -1, -3, 5, 1, -4, 3, 1, -1, 2, -4, 6, 1, 2, -3, 4, 3, -4, -5, 5, 3, 3, 5, 1, 0, -4, -1, -5, -1, 2, 0, 3, 4, -2, -3, -4, 5, -3, 5, 3, 4, 3, 0, 3, 0, 3, 5, 3, -4, 4, -3, 3, 2, 5, 5, 2, -2, 3, -4, 4, 5, -2, 0, -1, -1, 2, 6, 1, 1, 6, 0, -3, 0, -2, 1, 5, 0, -1, 6, 1, 2, 0, 5, 3, -1, 5, 5, 5, -1, -2, 5, -4, -2, -1, 4, -1, -1, -3, 1, 4, -2, -1, 3, -1, -4, -2, -4, -3, 2, 5, 5, -4, 1, 4, 3, -3, 4, 1, 0, -3, 0, 5, -4, 2, 0, -5, 0, -1, -2, 4, -2, 0, 0, -3, 1, 2, -3, 0, -4, 2, 3, 6, 2, -2, -1, 3, -4, 2, 1, 5, -2, -1, 5, 0, -4, -4, 1, -1, -1, -4, -3, -1, -2, 2, -1, 0, -5, 5, -5, 3, -2, 5, 4, -3, 1, 1, 1, 4, -4, -3, 5, 6, 6, 2, -4, 2, 2, 0, 0, 0, -3, -2, 1, 4, 2, 2, 4, 1, -1, 0, 5, 0, -4, -2, 2, -5, 1, 3, 5, 1, 0, 3, 3, 1, -4, 2, -1, 2, 2, 0, 1, 1, 0, 2, -3, -2, -4, -1, 6, -2, -2, 3, 6, -2, 2, 4, 0, -2, 0, 4, 1, 5, 4, 1, 5, -1, 4, -1, 4, 5, -5, 4, 5, 3, -1, 0, 4, -2, -1, 6, 0, 0, 5, 5, 2, -1, -2, 4, 0, -3, 0, -2, -4, 5, -4, -5, -4, -3, 3, 5, -1, -2, 2, 1, 4, 0, 2, 1, 0, -1, -2, 4, -5, 2, 1, -4, -5, 3, 4, 0, 4, 5, 5, -2, -2, -2, 2, 0, 2, 0, -4, 2, -1, 3, -3, 2, 4, -4, 3, -4, 5, 0, 3, 6, -4, 5, 0, 2, 5, 3, -2, 4, 1, 0, -2, 3, -2, 4, 2, -3, 4, 2, 4, -2, 5, -1, 5, -3, 0, -3, -2, 3, 5, 0, 0, -3, 5, 5, -4, 3, 1, -2, 4, 5, 0, 0, -3, -3, -1, -2, -2, 3, 2, -4, 3, 5, -4, 1, 3, 0, 0, -1, 6, 4, -1, 1, -4, -3, -3, 3, 3, -4, -4, -2, 0, 6, 1, 0, -4, 3, -3, -5, 2, -3, -2, -4, -1, -2, 4, 1, 2, 2, -5, -2, 2, 2, 2, -1, -2, 5, -4, 0, 4, -4, -1, -1, 5, -1, 2, 0, 4, -5, 1, 1, -2, -4, 1, -4, 0, 2, 4, 4, 0, 2, 2, -4, 3, 2, 0, 0, 1, 6, 5, -3, 0, -4, 1, 0, 6, -2, -3, 0, 3, 4, -3, 1, -3, 3, -1, 4, 2, -1, -2, -3, -3, -4, -3, -4, 4, 0, 3, -4, -3, -2, 5, -2, 1, -4, -4, 3, 3, -3, 4, -1, -2, 5, 0, 1, 0, -2, -2, -5, 4, -1, -4, -3, 2, 5, -1, 2, 4, 3, 0, 1, 5, 4, 1, -3, 4, 4, 1, -3, -3, 2, 5, -4, -4, 2, -4, 3, 1, -5, -3, 5, -4, 6, 2, -3, 2, -3, -4, 6, 0, -4, -2, 1, -1, 3, 5, 0, 0, 3, 4, -5, 5, -1, 1, 3, -2, -3, 5, 4, 5, 6, -5, 3, 4, 2, -3, -4, -1, -4, -4, 6, 2, 2, -2, 4, -1, -3, 3, 4, 1, -1, 2, 0, -1, -1, 2, -1, 0, 6, -1, 4, 6, 2, 2, 1, 2, 0, -2, -4, 4, 0, 3, 3, -3, 3, 3, 2, 1, 2, 4, -1, -4, -2, 3, 1, -1, 0, 5, 5, 3, -2, -3, 0, -1, -5, 0, -3, -1, 0, 0, 1, -5, 4, -4, 3, 0, 5, -2, 1, 0, -3, -1, -4, 2, 1, 3, 6, 0, 3, -4, 4, 4, 3, 1, 2, -4, -2, 6, -4, 2, 5, 0, -1, 1, -4, -2, 4, -1, -3, -2, 2, 3, -1, 1, 4, -2, 4, -3, -1, 4, 3, -4, 5, 1, 2, 1, 1, 3, 5, 2, -3, -3, 5, -1, 5, 2, 3, -3, 0, 2, 0, 5, -4, -2, 4, 5, -1, -4, -4, 1, -4, 2, 4, 2, -1, 3, 6, -1, 4, 5, 5, 2, 1, -3, 3, -4, 4, -3, 0, -4, -4, -2, 5, 2, 4, -2, -1, 4, -4, 1, 5, -3, -4, 2, 4, 3, 3, 1, 4, -3, 3, 5, 3, -3, 3, 3, -1, 1, -1, 0, 5, 4, -4, 5, 3, 1, 0, 3, 5, 6, 0, -4, 5, -5, 1, 5, -1, 2, -1, -3, -2, 6, 4, 3, 5, 1, -1, 1, 2, 5, 6, 2, 0, 2, 4, 3, -3, 1, -4, 0, -1, 4, 0, 5, 5, 4, 2, 1, -3, 5, -3, 4, -3, 4, -4, -4, -4, 2, 2, -4, 5, 2, -3, 5, 2, 3, 1, -2, 5, 4, 0, -1, -1, 3, 3, -5, 3, -1, -3, -4, 1, 5, 3, -5, 0, 2, -4, 3, 6, 4, 4, -4, 3, -2, 1, 2, 2, 3, -2, 0, -2, 1, 3, -3, -1, 5, 1, 3, 0, -1, 2, -1, 0, -1, 2, -4, 1, 3, 0, 0, 2, 3, -3, -5, 2, -3, -2, 1, -1, 3, 4, -1, 6, 5, 4, -3, 5, 4, 3, -5, -2, -4, -4, 2, 3, -2, 0, -3, 5, -4, -2, -4, 5, 6, -1, 3, 5, -3, -3, 5, 0, 4, -4, -1, -1, -2, 4, 0, 4, -1, -4, -4, 3, 3, 5, -3, 1, 2, -3, -1, -1, -1, 6, -4, -1, -4, -1, 3, 2, -2, 4, -2, -1, 4, -2, -2, 5, 5, -3, -1, -1, -3, 5, 0, 0, -3, -4, 2, -2, 6, -2, 1, -2, 3, -1, 1, 0, -4, -2, 3, 1, 1, 3, 3, 5, -2, -4, 4, 4, -2, -4, -4, -1, 1, 5, -4, 4, 0, 3, -2, -5, -2, 4, -3, -1, -3, -4, 1, -2, 3, 5, -3, -2, 4, -3, 4, 0, -2, 1, 1, -3, -5, -3, 2, 4, 4, 1, 0, 4, 0, 5, 3, 0, 5, -4, 4, -4, -1, 5, 0, -1, 1, 0, -3, -4, 5, -2, 0, -3, 3, -4, 3, 2, -2, 2, 5, -2, -1, 1, 3, 0, -4, 2, 1, -2, -3, 5, -3, -4, -3, -4, -1, 4, -3, -3, 3, -3, -3, -4, -5, 0, 2, 6, 1, -4, -3, 3, -1, 2, 4, 3, -2, 2, 3, 3, 3, -5, 3, 3, 1, 5, -2, 5, 3, 1, -2, 2, -2, -3, 5, 2, 5, 6, 1, -1, 5, 4, 0, 3, -4, 2, -4, -4, -2, -1, 6, 3, -2, 0, -2, -4, 5, 2, -1, 1, 1, -3, -4, -2, -3, -4, 2, -4, 2, 5, 4, 5, 5, -2, 3, 1, 3, 4, 6, 0, -2, 5, 2, 6, -3, 6, 3, 5, 4, 0, -3, 0, -3, 5, 3, 3, 6, 3, 1, 3, 1, -5, 1, 5, 4, -3, 1, 1, -1, 3, -1, 1, 1, 0, 3, 3, 2, -2, 2, -1, 3, 1, -1, 4, -2, 1, 5, -3, 1, 5, -3, 0, -5, 1, 0, 4, -4, 0, 0, 1, 5, 2, 3, 5, 3, -1, -3, -3, -1, 4, 0, 5, 6, -2, 1, -3, 2, 4, 0, -2, -3, -3, 1, -2, -4, -1, -2, 6, -3, -5, -2, 2, -2, 1, -4, -1, 5, 0, 4, -3, 4, 2, 3, 6, 2, 0, -1, 3, 0, -4, 6, 2, 1, 4, 0, -4, 3, -3, 2, 4, 1, -5, -4, 3, -4, 2, 3, -2, 2, 5, -3, 2, 3, 1, -2, 2, -5, 4, 2, -4, -3, 0, 2, -3, -2, -4, 4, 1, -1, 3, -4, -2, 2, 3, 3, -3, 2, -2, -5, 4, 1, 1, 0, 4, 4, 5, -2, 4, 3, 0, 2, 1, 4, 5, 5, -2, -2, 0, -3, 4, 4, -1, 1, 2, -1, 2, 4, 4, 0, -3, -4, -4, -4, 5, 2, 5, -1, -3, 1, 0, 2, 2, 1, 4, 5, -3, 3, 5, 2, 2, -2, 4, -3, -1, 2, 2, 3, 1, 5, 5, 2, 2, 4, -3, -1, -4, 6, 6, -3, -1, 1, 2, 5, 1, -4, 6, 1, -1, 0, 3, 5, 1, 4, -1, -3, -1, 2, 1, 0, 3, 3, 1, 4, 1, 5, -3, 4, -2, 3, 2, 0, 4, 3, 3, 4, 2, -1, 1, 4, -2, 1, -2, 2, 0, -1, -4, -5, 3, 1, 1, -2, -4, 3, 1, 3, 2, 5, -1, 3, 0, -2, 1, -4, 5, -1, 6, 4, 6, -3, -1, -3, 0, 0, 0, -4, 4, 2, 3, 3, 4, 3, 4, -4, 2, 4, 4, 5, 0, 5, -4, 4, 4, 2, 6, -4, -2, 6, 0, 4, 5, -1, -2, -4, 2, 4, -1, 1, 1, -1, 2, -2, -3, 0, 2, 1, 1, 0, 5, 1, 3, 3, 4, 1, -3, 6, 3, 4, 4, -1, -4, -3, 2, -2, -4, 0, -5, 1, 5, -4, 2, 3, 0, -1, -2, -4, 5, 4, 3, 4, 3, -1, 6, -2, 5, -4, 0, -1, 2, -4, 1, 2, 1, 3, 5, -1, 4, 1, 5, 4, 4, -4, 4, 5, -2, -1, -3, -2, 3, 5, 0, 0, -2, -5, 2, 2, 1, 4, -4, -2, 4, -1, -2, 5, -4, -4, 6, 2, 1, -1, -5, 3, 2, 1, -2, 3, 6, -1, 2, 2, -5, 5, 4, -3, 0, 5, -2, 4, 3, 1, -1, -4, 1, 5, -4, -2, 3, -1, 5, -2, 3, 2, 2, 1, -2, -3, 1, 5, 5, -1, -4, 2, 4, 0, -1, -1, 1, -1, -4, 5, -3, 2, 2, -4, 6, 5, 1, 5, 2, 4, 2, -1, -3, -1, 5, 6, 1, -3, 5, -1, -4, 3, 3, -2, -4, -3, 6, 0, 0, 4, 2, -3, -1, -2, 2, 4, 1, 4, 1, -1, 0, -2, 4, 5, -2, 3, -3, -4, 3, -1, 3, 6, -1, 4, 4, -1, -3, -4, 1, 5, -4, -3, 4, 2, 1, -2, 2, 3, -4, -4, 4, -4, 0, -3, 1, -2, 5, -3, 2, 1, -4, 5, 5, -2, 4, 3, -1, -4, 3, 1, 2, -3, 3, 4, 6, 0, -1, 5, 3, 4, 5, 4, 2, 5, -3, -4, -4, 2, -2, -1, -1, 6, -3, -3, 4, -3, 4, -1, 3, 0, -4, -3, 3, -4, 5, -1, 5, 0, 4, 2, -4, -3, 0, 5, -1, 3, -1, 3, -2, 3, -3, -4, 2, -5, 1, 0, -1, 0, 0, 1, -4, -3, 5, -1, 0, -2, -1, 3, 0, 4, 4, 0, 4, 3, 2, 6, 6, 5, -3, 3, -3, 1, 4, 1, 1, 5, 2, 4, -1, 0, 5, 4, 0, 3, 1, 1, -3, 4, -3, 3, 6, 5, -4, 6, 3, -4, 4, -2, 4, 4, 2, -3, 5, -2, 0, -2, 1, 5, 3, 3, -5, -1, 4, 5, -4, 3, -4, 5, 6, -1, 0, 5, -4, 3, 4, 5, 4, 2, -1, 1, 4, -3, -3, -1, -1, 3, -2, 0, 5, 5, 5, -4, -5, 3, 5, 3, -3, 4, 3, -3, 6, -3, -5, 0, -1, 5, -4, -4, 4, 4, 5, 1, 2, -2, 2, -1, 0, -2, -2, 3, 0, -2, 1, 4, -4, -4, 0, -4, 5, -1, -1, 1, -5, 6, -4, 2, 4, 3, -5, -4, 4, -1, -1, 3, -3, 1, -4, 1, -2, 1, -2, 1, 5, 0, -5, -3, -3, 3, -3, 4, 2, 3, 1, 2, -2, 1, 5, 5, 3, 5, 1, 1, -3, -2, 2, 0, 3, 2, -1, 6, 4, -1, -1, -3, -3, -4, 4, 0, -4, -2, -3, 3, 4, 3, -2, 0, 0, -3, 4, 2, 3, -1, 3, 0, 0, 3, -3, 2, 2, -4, 4, 1, -2, 2, -4, 4, 1, 5, 2, 0, 5, 0, -3, -5, 1, 0, -3, -3, -1, 0, -3, 5, 5, -5, 4, -4, 3, 6, -4, 1, 4, 5, 6, -4, -4, -1, -5, 4, 2, -2, -2, 0, 5, -2, 1, 4, -1, -1, 4, 1, -2, 1, -2, -2, -1, 2, 4, 3, 5, 5, 5, 5, 4, -2, -2, 5, 5, -2, 5, -4, -4, -3, 5, 4, 5, 1, 2, 5, 1, -3, 3, 3, 5, -4, -3, -2, -1, 3, 6, 0, 1, 0, 3, 5, 5, 1, 1, -2, 2, -5, -3, 1, 1, 4, -2, 0, 2, 5, -3, 2, 3, 0, -2, 4, -4, 2, -2, -3, 3, -2, -4, -1, -2, -3, 1, 1, 3, -4, -4, 6, -5, 0, 2, 4, 3, 5, 4, 6, 1, -3, 6, -1, -5, 0, -1, 2, -4, -2, -1, -4, 5, -3, 2, 5, -4, -2, -1, -5, 0, 0, -1, -1, 4, 2, -3, 1, -1, 5, 2, 4, -3, 0, -1, -1, 4, 2, -4, 3, 0, -3, -4, 2, -2, -3, 5, -4, 0, -4, 3, 3, 0, -2, 4, 2, -4, -3, 1, 3, -4, -1, -4, 2, 1, -3, -4, -3, 3, 2, 1, -4, 3, 3, -3, -4, -2, 0, 1, -3, 1, -2, -3, -5, 4, -3, 5, -3, -4, 0, 3, 3, -3, 1, -2, -2, 3, -3, -3, -3, 3, 5, 0, 5, -4, -2, -4, -3, -3, -2, 0, 1, 3, 4, -5, 5, 2, 1, -4, -1, -1, 4, -3, 0, 4, 1, 0, 4, -2, 2, 4, 1, 2, -4, -4, -1, -2, 3, 5, -4, -1, -1, 3, 2, 0, 5, 4, 1, 0, 2, 0, 5, 3, 5, 4, -2, -4, 1, -1, -1, -4, -3, 2, -4, -4, -4, 2, 5, -4, 5, 0, 3, -4, 5, 5, -1, 6, -1, -1, 1, 1, 4, 3, -3, 6, -2, -1, 3, 6, 4, -1, 5, -3, 3, 1, 4, 0, 5, 1, 0, 1, 2, 2, -2, -2, -1, 2, -2, -2, 0, 3, 3, -3, 3, -1, -5, 0, -3, -3, -3, -1, -3, 4, -2, -3, 1, -1, -2, -4, -1, -2, 1, 1, 2, -1, -3, 3, -4, 2, 1, 2, -2, 4, 1, 1, -3, 1, 0, 0, -4, -4, 0, -2, -1, 2, 2, 5, -3, -2, -3, 4, 5, 5, 2, 3, 2, -3, 4, 5, -1, 5, -3, -1, -1, 1, 1, -2, -2, 1, 5, 2, -1, 2, 3, -2, 1, 4, 1, -4, 3, 0, 3, 2, 1, 3, -1, 2, -2, 0, -3, -4, -1, -1, -3, 5, 1, -2, 5, 3, 2, 6, 3, -5, 2, 3, -1, -4, -1, 2, 5, 6, 0, -1, -4, 5, -1, 0, 2, -3, -1, -4, 2, -3, 4, 2, 2, 0, -2, 0, 2, 5, 3, 6, -2, -2, 0, 5, 4, 2, 2, 1, 3, -4, -3, 0, -2, -3, 1, -5, 4, 3, -2, 0, -2, -3, 2, 1, 4, 5, -4, -2, 3, 5, -2, -4, -5, -1, 0, 1, -3, 1, 5, 0, 1, -1, 4, 0, -4, -2, 2, 3, 3, -4, -4, 6, 4, 0, 2, 4, -5, -3, 2, -2, 2, 3, -3, 0, 2, 0, -2, -3, 0, -1, 0, -2, -4, -2, -4, 2, -5, 3, 0, -1, 5, -2, 2, 0, 5, -2, 6, -3, 0, 2, 3, 4, 4, -5, 6, 2, -3, 4, 1, -1, 6, 0, 5, 0, -2, 5, 0, 5, -1, 4, 1, -3, 1, -4, 1, 6, -3, 0, -5, -1, 3, 5, 2, -2, 5, 6, 1, -2, 3, 2, 1, -2, 1, 1, 1, 1, 3, 5, 3, 1, -3, -4, 5, 1, 5, 2, 4, 5, -2, -1, 0, -4, -2, 3, 1, -3, -1, 6, -2, 3, 3, -1, 5, 0, 2, -4, -3, 4, 3, -1, 4, -3, -2, 5, 0, -3, 4, 0, -4, 2, 5, 0, 0, 3, 0, -3, -3, 1, -2, 4, -2, 6, 4, -1, -1, -1, 0, 4, 3, 5, -2, -2, 0, 1, 1, -4, 0, 4, 4, 3, 4, 2, -5, 0, -2, 2, 1, -3, 2, 0, 6, 1, -2, 4, 1, -3, 3, -1, -3, -1, 6, 0, -4, 2, 1, 2, -1, -3, 4, 3, 2, 3, -4, -4, 5, -5, 5, 5, -2, 3, -5, 0, -4, 3, 2, 4, 2, 2, 0, 6, -1, 5, -3, -4, -3, 3, 2, 2, 2, 3, 3, 1, 6, -1, 3, 5, 4, 3, -4, 3, 5, -3, 2, -1, 0, -1, 1, 5, 5, -2, -4, -4, 0, -1, -3, 6, -2, -2, -1, 3, 4, -3, 4, -4, -1, 2, -4, -1, 1, -2, 5, 0, 3, -3, 5, 1, -4, 3, -5, -1, 0, -4, 2, 5, 5, 4, -1, -2, -2, 4, 3, 5, 3, 3, 3, 4, -1, -1, -1, -3, -2, 4, 3, -5, 2, 5, 3, 6, 4, 4, 1, 0, 2, 5, 0, 1, -2, 4, 4, -3, 0, -1, 1, -4, -3, 3, 0, 1, -4, -4, -4, 4, 1, 2, 4, -2, -3, 5, 3, 4, -2, 2, 5, -2, -3, 2, -5, 1, 2, 3, 2, -5, -3, -5, 5, -4, 4, 2, 1, -3, 3, -5, -3, 3, 3, 1, 6, 2, 1, -2, 3, 4, -3, 0, -2, 5, 5, 6, -4, -3, -1, -4, 4, -3, 5, 3, 3, -1, 0, -4, 1, -4, -4, -2, -2, 1, 4, 3, -1, -1, 1, 2, 0, 1, -2, 4, -4, 2, -3, 1, 5, -5, -1, 4, -2, -1, 5, -4, 0, 5, -3, -3, 2, 0, -4, 3, 1, 2, 2, 3, -4, -3, 3, 3, 1, 4, 4, 1, 4, -4, 3, 3, 4, 0, 0, -3, -1, 5, -1, -3, 1, -4, -4, -1, 3, 5, 5, 2, 6, 1, -2, -1, 0, 1, 3, -3, 1, -2, -2, -1, 1, -3, 3, -4, -3, 0, 3, -3, 1, -2, -2, 5, 4, 4, -4, -1, 6, 6, 3, -4, 1, -4, 2, 1, 4, 4, 5, 3, 1, -3, 1, -4, 1, 1, -2, -2, 0, 0, 2, 0, 3, 1, 0, -2, -2, -1, 0, -5, 1, 5, 3, 0, 1, -2, -3, -3, -2, 1, -4, 0, -1, 1, -4, 3, 3, -1, 1, 3, -1, 3, -3, -4, 0, 1, -5, -4, 0, -2, 0, -5, -4, -3, -3, 2, -5, 0, -4, 5, -3, 2, -2, 0, -1, 3, 4, -2, -2, -4, 5, 3, 1, 0, -2, 4, 1, 3, 5, -1, -3, 2, 1, 1, -1, 4, 5, 3, 5, 5, 0, -4, -1, 2, 3, 5, 0, -1, 4, -3, -5, 5, -3, 1, 2, 1, -2, -4, 4, 2, -4, -5, 1, -4, 1, 0, 5, -3, 5, -4, 1, -3, 4, -3, -1, 0, 4, -3, 1, -2, 4, 3, 4, 5, 4, -2, 3, -4, 1, 3, -3, 0, 0, -1, 1, 4, 3, 1, -3, 4, -3, 2, 3, -1, 3, -4, -3, 2, -3, 5, -3, -2, 0, 3, -1, 3, 1, -3, -4, 4, 0, 0, -3, 0, 3, 3, 6, 0, 2, -1, 5, -4, -1, -2, 2, 1, -3, 2, -4, 2, -2, -2, 6, -4, 0, 5, 3, 4, 1, 2, -3, 2, -4, -5, -2, 2, -3, -4, 1, 5, 1, 0, 4, 2, -1, 4, 2, 3, -1, 6, 3, 4, 1, -4, 0, 4, -3, -3, -5, -1, -4, -4, 5, 5, -2, -4, 3, 1, -1, 3, -4, -3, 4, -3, 3, 4, 4, -2, -3, -3, 3, 4, 2, -4, 2, -2, 6, -3, -4, 4, 2, 2, 5, -4, 0, 0, 4, -2, -2, -4, -2, -2, -4, -3, 3, 0, -4, 4, 3, 0, 2, 3, 1, 3, -1, 2, -3, -1, 0, 1, 4, 3, -2, -4, -5, 0, 3, 0, 5, 2, 0, -1, 6, 5, 0, 2, -4, -1, -3, 2, 0, 5, 1, 1, -2, 3, -2, -2, 3, 0, 1, -4, 0, 0, -3, 2, -2, 2, 6, 2, 2, -5, -2, 6, 2, 0, 6, -1, 3, 0, 3, -3, 4, 3, 3, 2, -3, 3, -3, -3, 3, -4, 5, -1, 0, -4, -5, 2, -2, 1, 1, -5, 1, -1, -5, 3, 1, -5, 4, 2, -1, -1, -1, -3, -4, -3, 2, 3, -2, -4, -1, 1, -3, 6, 1, 0, 0, 5, -2, -2, 0, 2, 3, 0, 3, 3, 6, 2, 2, 4, 0, -1, 5, -2, 5, -5, 4, -1, 2, 2, -2, -1, 6, 3, -5, -1, -3, -1, 4, 5, 5, 4, -4, -4, 6, -3, -4, -1, 5, -2, -2, -3, 0, 0, 5, 3, -2, -3, 0, 0, 0, -1, -1, -1, 6, 1, 2, -2, -5, 5, 4, 0, 4, 5, -4, 1, 2, 0, 3, -3, 2, -1, 3, 2, -4, -2, -3, 5, 5, -5, 5, 3, 3, 3, 5, 2, -1, 3, 4, 3, 0, -5, 3, 1, 4, -3, 5, 1, -1, -3, -5, 1, 2, 4, 0, 5, 4, -3, 2, -3, 1, 1, 2, -3, 6, 3, 2, -4, 4, -1, -2, -3, 4, 0, -3, 1, 3, -1, 3, -3, 2, 5, 2, -1, 6, 2, -4, 2, 2, -1, -2, 3, 5, 0, 4, 3, 0, 0, -2, -4, 5, -5, 1, 2, -2, -4, 5, 5, 3, 3, -3, -3, 1, -1, -1, 4, -1, -4, 2, 2, -3, 0, 5, 2, 3, -2, 3, 1, 1, -2, -3, 1, -4, 2, -3, 6, -2, 4, 5, 3, 2, -1, 3, -2, 4, 3, -2, 1, 4, -2, 2, 0, -4, 3, 5, 2, -1, -3, 2, 1, -2, 5, -5, 2, 4, 4, 5, 0, -1, 5, 5, 6, 5, 2, -3, -1, -4, -3, 1, -3, -3, 2, -3, -1, 6, -1, 3, 2, -3, -3, 5, -4, -1, -4, 3, 3, 2, -3, 5, -4, -3, 4, 1, -2, -3, -5, -3, -1, -3, 0, -2, -3, -1, 3, -4, 4, 0, -1, 5, 5, -5, 4, 1, -2, -5, -3, -4, -4, -4, 5, 3, -4, 2, 3, 0, -2, -5, -4, 4, 2, 1, 1, 0, -3, -5, 0, 5, -2, 6, -2, 2, 0, 1, -5, 4, -5, 0, 0, -1, 5, -2, -1, -3, 0, 5, 1, -1, 0, 0, -1, -1, -2, 6, -2, -3, 0, -4, 1, -1, -4, 1, -3, 0, 5, 5, 4, 2, -5, -1, 1, -1, -2, 3, 4, 5, 0, -1, 0, -3, -1, -4, 4, 1, -3, -3, 1, 0, 4, -3, -3, 4, -2, 4, 2, 2, 5, 1, 5, -2, 3, 4, 1, 1, -2, -2, 4, -1, -3, -1, 5, -1, 4, 4, -5, 2, 5, 0, 4, -4, 5, 1, 3, -1, 1, 2, -1, 1, 5, -4, 2, -3, 5, 2, 5, 1, 3, -5, 4, -2, 2, -2, -1, -1, -5, -1, 0, -4, 4, 1, -1, -2, -2, -3, -1, 1, 2, 0, -3, -5, 5, 0, 4, -3, -3, -2, 4, -2, -1, -4, 2, 5, 1, 0, 0, 0, -2, -1, 2, -2, -4, 4, -4, 6, -4, 0, -5, -4, -1, -4, -3, -2, 5, -2, -2, -2, 0, 2, 0, 5, 4, -5, 6, 2, 1, -2, 3, 0, 1, 1, -3, 4, -2, -3, -3, -3, 1, -5, -2, 5, -2, -2, 1, 5, 2, -2, -3, 2, -1, 1, -4, 5, 5, 5, 3, -2, -3, 4, 2, 0, -4, -1, -2, 4, 2, 1, -2, -4, 5, -2, -3, 2, 3, 2, 5, 4, -2, -1, 2, 3, 3, -1, 3, 0, 2, -1, -3, 3, -1, 1, 3, 2, 2, 3, -3, -5, 2, 4, 2, -2, 3, 5, 1, 2, -4, -3, 4, 0, 3, 3, -1, 4, 0, -3, 5, 4, 1, -2, -3, -3, 4, 0, -2, -3, 0, -1, -1, -2, 1, -3, 3, 1, 4, -3, -1, 0, 0, -1, 5, -1, -1, -3, -2, 2, -2, -4, 5, 0, 0, 1, 2, 3, -3, -1, 4, -5, -4, -3, 0, -1, -3, -2, -3, -5, 5, 6, -1, 6, -3, 6, -3, -4, 5, 0, 1, 5, 3, 0, 5, 5, 4, 0, 0, -2, 1, 5, 4, -4, -3, -4, -1, -4, -3, 3, 1, -1, 3, -3, 1, -4, -4, 0, 0, -1, -4, -4, -1, 0, 3, -4, 0, 4, 2, -3, 0, -3, 3, 4, 1, -2, -1, 4, 2, 0, -3, -5, -5, 5, 4, -3, -3, 5, 1, 4, 6, 6, -5, 2, -5, -2, 4, 3, 1, 6, 0, 1, -4, 5, -2, 5, -4, -3, 1, -2, 2, -5, 1, -4, 2, 3, 3, 1, 0, 3, 1, 4, 3, 1, -1, 6, -5, 2, -3, 3, 0, -1, -5, -3, 1, 3, -2, -2, -4, 3, 4, 4, 5, 4, -3, -1, 1, 4, 1, 4, 1, 5, 3, 2, -1, 2, 2, 0, -4, 2, -3, -1, 4, 4, -1, -2, 6, 2, 4, 3, 3, 5, -1, -1, 0, 1, -2, -5, -1, -1, 5, -1, -1, 2, -4, 0, 0, -1, 3, 4, -4, 5, -3, 2, 1, 4, 4, -2, 1, -1, 3, -3, -1, 5, 2, 5, 5, 3, -3, -2, -3, -3, -3, -3, 3, 3, -1, -4, 4, -2, 0, -4, 5, -1, 1, -2, 4, -3, 5, 4, -2, 0, 4, 2, 2, -3, 0, 0, -4, 0, 5, 1, -1, -3, 0, -3, -2, -2, 0, 5, 3, 3, 4, 3, 0, 5, 2, 5, 2, 6, 0, 1, 1, 1, 2, -2, 5, 0, -5, -4, -2, 2, -1, -1, 2, 4, -2, 2, -1, -4, -5, -3, -3, 2, -4, 3, 1, 3, 0, 1, 0, -4, 4, -2, 3, 5, 2, 5, 3, -2, -4, -4, 3, -4, 5, 3, 1, -4, 5, 2, 1, -3, -3, -1, -5, 0, 3, -2, 0, 4, -1, 5, 0, 2, -4, -2, 0, -3, -2, -1, -2, -5, 3, -1, 0, 0, 0, 4, 5, 2, -4, 3, 0, -3, 5, 4, 3, -4, -3, 6, -1, 2, -1, -4, -3, -2, -3, -3, -4, 0, -4, 0, -1, -4, -5, 4, -3, 5, -3, 0, 4, 2, 0, -4, 2, -5, 2, 3, 1, 3, 4, -1, -3, -4, 6, -2, -2, -1, -2, -4, 4, -3, -4, -2, -1, -4, -1, 2, -4, 4, -5, 2, 4, 0, 5, 2, -4, 3, 5, 3, 2, -1, 4, 2, -2, 3, -1, -4, -5, 4, 5, -1, 0, 5, -2, -4, -1, 5, -2, 0, 0, -2, 3, 4, 3, 5, -4, -1, -3, 3, -3, 4, 5, 2, -4, -5, 0, -3, 4, 3, -2, -5, -3, 2, 0, 5, 1, 0, -1, 0, 4, 1, -2, -3, 5, 5, -3, 0, 2, 4, -3, 2, -2, -3, 2, 0, -4, -1, 5, 0, 1, -4, -3, -4, 2, -3, 3, 1, -4, 0, 5, -1, 0, -4, -1, -1, 0, 0, 5, 5, -5, -4, -4, 0, 3, 5, 5, 5, -4, 3, -3, -2, -5, 0, 4, 2, -2, -1, -3, 2, 3, 0, -4, -2, -1, 5, 4, 2, 4, 6, -3, 5, 0, -1, -4, 5, -1, 2, 3, 6, -3, 3, -1, -4, -3, 6, 2, -1, 6, -3, 4, -4, 6, 4, -1, -3, -3, -3, -3, 4, 0, 6, -2, 2, 4, -2, 0, 1, -2, 0, 6, -1, 5, 2, 6, -4, -4, 1, 0, -1, -4, -4, 0, 3, -5, -1, -1, 5, 1, -1, 5, -1, 0, 4, 6, 2, 5, -1, 2, -4, 1, 3, -5, 5, 1, -3, -1, -1, 3, 4, -4, 5, 5, 4, 5, 3, -2, -3, 2, 1, -2, 4, 4, -5, 3, -3, -2, 6, -4, -3, -4, -3, 2, 0, -5, 5, -1, -3, 4, -1, 0, 1, 4, 0, 5, 0, 2, 5, 5, 1, -1, 5, -1, 2, 5, 4, -4, 6, -4, -3, -3, 1, 0, -3, 4, 4, 1, 1, 1, -2, -1, 2, 1, 4, -3, 5, 5, 1, -2, 3, 0, -2, 5, -1, -2, 1, -3, -2, 4, 4, 6, 1, 4, 5, -3, -1, -4, -1, -2, -2, -3, -2, 1, -1, 4, -4, 6, -1, 3, 6, 1, -1, -3, 0, 2, 2, -4, 2, -2, 2, 4, 4, 1, -3, 1, -3, 2, 1, 0, 3, 3, -4, 0, 1, 5, 5, -4, -4, 3, -2, 3, 1, 4, -1, 0, -2, -4, 3, -3, 2, 6, -3, -1, 3, 0, 0, 0, -4, -4, 3, -4, -3, 5, 5, 0, 0, 3, -2, 6, 4, 4, 3, -4, 6, 4, 1, 4, 0, 2, -1, -1, 6, 5, 0, 5, 1, -2, 2, 3, 2, -3, -4, -1, 0, 1, 4, 5, -3, 4, -5, 4, 2, 3, 0, -2, 0, 2, -2, 4, 2, -4, 1, -3, 2, -4, 0, -2, 0, 5, 4, -5, -1, 3, 2, -1, -3, -1, 4, 0, 1, 0, 3, 2, 0, 5, -1, 6, 1, -3, 3, -3, -1, -4, -1, -2, -2, -4, 0, 2, -4, 3, 2, -2, 0, -3, -1, 5, -1, 4, 3, 1, 0, 5, -3, -3, 4, 3, -3, 1, -1, -3, -1, 0, -3, 3, -4, 1, 1, -3, -3, -2, 3, -2, 0, 1, 2, 0, -3, -3, 1, -1, 1, 6, 2, -3, -1, 5, -1, 1, -2, -3, -4, 1, 4, -1, -1, 0, -2, 1, 0, 3, -2, -3, 6, -2, -1, 2, 0, 1, -3, 5, -2, 0, 2, 2, -3, -4, -4, -1, -4, 2, 2, 6, 0, 4, 0, -3, 4, -4, 5, -4, 4, 2, 4, 0, 5, -5, -4, 2, -3, 3, 5, 1, -4, -3, 3, 0, -1, -2, -1, 6, 2, 5, -1, 3, -1, 1, 4, 4, 2, -2, 2, -4, 0, -3, -4, 5, 0, 2, -3, 0, -1, 3, 5, 6, 2, 4, 0, -3, -3, 1, -4, -3, 2, -4, 2, -3, 3, 2, -2, -5, 0, -4, 5, -1, 5, -4, 5, 5, -1, 1, 5, -1, 0, 1, 2, 5, 5, -5, -1, -2, 4, 0, 4, -2, 5, -4, 5, 5, 3, -1, 5, 1, -4, 1, 1, 4, -4, 3, 1, -4, -1, 4, 2, 5, 0, -3, 0, -1, 4, 1, 0, -4, -2, 3, -4, -5, 5, 6, -2, 0, 5, 1, 3, 3, 2, 3, 2, -4, 3, -3, -1, -2, 3, 0, -4, -1, 2, 1, 4, -1, -4, -3, 4, 0, 1, 4, -1, 5, -1, 1, 1, 5, 2, -1, -3, 2, -1, 6, 2, -1, -4, -2, -3, 5, -1, 2, 5, 5, 1, 1, 0, 1, 2, -4, 0, -4, 0, 6, -4, 4, 1, 2, -2, 1, -4, 5, 6, -3, -3, 4, 5, -1, -1, 3, -2, -5, -2, 5, 3, 1, 5, 5, -3, 3, -2, -5, 6, 6, 5, -4, -2, -1, 1, -2, 3, 2, -2, -4, 1, -3, 2, 4, 4, 1, 4, 4, 3, -2, -3, -5, 4, 2, 5, -1, 2, 1, 1, 6, 0, 1, 4, 4, 1, 4, 5, -3, 3, -2, 4, 3, 1, 4, -2, -2, -2, 2, 0, 4, -2, 0, -2, -3, 6, 5, -2, 5, 2, -3, 1, -3, -4, 1, 2, -3, -1, 0, 4, -4, -2, 4, -1, -3, -4, 0, 4, -1, 4, 1, 4, 2, -2, 1, -3, 2, 4, 4, 4, 0, -4, -4, 6, 0, 2, -4, -1, -1, -5, -1, 5, 0, -1, 3, 1, -4, 3, 5, -5, 3, -2, -3, 0, 4, -4, -2, 5, 1, 1, 2, 1, 5, -3, 1, -2, -2, 1, -3, 6, 3, 0, -4, 4, -1, 5, -2, 4, -4, -1, 2, -2, 0, -4, -2, 4, 5, 0, -5, -4, 4, -1, -2, -3, 1, -1, 0, 1, 1, -1, 3, 0, -4, 1, 1, -3, -4, 4, -3, 1, 0, 4, 5, 5, 4, 0, 4, 2, 3, -3, 0, -3, -2, 2, -2, 6, 1, 2, 0, -4, 0, 6, -3, 2, 0, -1, 4, -3, 3, 2, -2, -1, 2, 5, -4, 1, 2, 1, 2, 1, 1, 0, -2, -5, 3, 1, -2, -1, -1, -4, 0, -1, 4, 4, 4, -2, 4, -2, -1, 0, 1, -1, 2, 0, 1, -2, 1, -3, -2, -2, -4, 4, 5, 2, 2, -4, 5, 4, 2, 3, 3, 4, 1, -3, 2, 3, 5, 4, 5, 2, 5, 3, 3, 0, -3, 3, -2, -3, 0, -4, 5, -4, 2, 6, 0, 5, 0, 0, -1, 4, 2, 4, 6, 5, 2, 1, 5, 2, -3, 3, 5, 4, -3, 3, 1, -3, -3, 2, -2, 6, -5, -2, -4, 4, 1, 5, 0, -1, -2, -4, 1, 3, 3, 0, -2, 0, 1, 2, -4, 5, 1, 2, 6, -3, 6, 0, 1, 3, -3, 2, -4, -3, 0, -1, 5, 4, 2, 6, 2, -2, -4, -2, -1, 0, 4, 5, 1, -4, -1, -2, 2, 2, 0, -1, 5, 4, 4, -3, -4, -5, -1, 3, 3, -1, 4, 0, -2, 2, -3, 4, -2, -4, -5, 2, -4, -1, 5, 3, 5, 3, -1, -2, 2, -3, 1, -3, 2, 5, 2, -3, -3, 5, -4, 4, -2, 1, 0, -2, -1, 2, -4, 2, 0, -1, 5, -4, 6, 3, -2, 4, -4, -4, 1, -4, -2, 3, 3, 3, -3, -1, 4, 0, 6, -4, 2, 4, 4, -2, -3, 0, 1, 2, 4, 1, 1, 0, 1, 3, 0, 0, -2, 5, 4, 0, 1, -1, 1, 5, -2, 4, 2, 1, 4, -2, -3, 5, 0, -4, -5, 5, 0, -4, 2, -4, -3, 4, 3, 2, 2, 4, 0, 2, -1, 1, 5, 1, 1, 6, -1, -3, 2, 3, 5, 2, 3, 0, 5, 1, -2, 3, -3, -3, 5, 2, 5, 1, 0, 2, 6, 4, 1, 4, 5, 3, -3, 4, -3, 5, 3, 0, 0, 1, -2, 5, -4, 5, 5, -2, 3, -3, -3, 3, 0, 2, 0, -2, 5, 4, -4, 5, -4, 4, -1, 1, 5, 0, 3, -4, 1, 2, -1, 5, -4, 2, -2, -2, 3, -2, 0, -4, 0, -3, -1, -1, -5, 0, -3, -2, 4, 2, 4, 2, 0, 1, 0, -3, -4, -4, -3, -4, 2, -2, 2, -1, -2, -2, 1, -2, 1, 4, -3, -2, -3, -4, 2, 3, 4, -1, -1, -4, -2, -3, -5, 4, -5, 5, 3, 4, -4, 5, 5, 3, -4, 2, 5, 1, -4, 4, -4, -1, 5, 0, -2, 3, -2, -3, 4, 5, 2, 6, 0, 2, 3, 1, 3, 6, -3, 4, 0, -2, 3, 1, 4, 4, -1, 0, 4, -2, 1, -3, -3, -4, -1, -1, -3, 2, -1, 1, 5, -3, 0, 0, -4, 2, 1, 6, -3, 3, -3, 2, -3, 3, 2, -3, -2, 3, -1, 3, 4, 5, -3, 5, 4, 1, 1, 3, -4, 2, -2, -3, 0, 6, 2, -3, 1, 1, 3, 1, -4, 1, -1, 5, 3, 1, 5, -1, 1, 6, 1, 2, 3, 3, 3, -3, -1, 2, -2, 2, 5, -2, 0, 0, 0, 4, -5, -4, 6, 2, 2, 5, -2, 1, 4, 0, -3, -5, 5, -1, -2, -1, -1, 3, 0, 3, 1, -1, 4, 2, -2, 4, 0, -2, 5, 1, -2, -4, -3, 1, 1, 5, 3, 3, -5, 0, 5, 3, -4, 3, 3, 4, -3, -2, 1, -3, -3, 2, -1, 0, 3, -4, -1, 0, 2, 0, 1, 3, 4, -5, 2, 3, -1, -4, 0, 4, 2, -4, 5, 2, 0, 4, -4, 1, -1, 5, 2, -1, 6, 5, -1, -3, 4, 0, 4, -3, 4, 3, -4, 3, -3, 5, -1, 5, 3, 6, -2, -3, 0, -2, -1, 4, 1, 1, -3, 5, -1, -1, 3, -3, 3, 5, 0, 1, 2, 3, 4, -3, 2, 0, 4, 3, 5, 6, 4, 1, -4, -3, -4, -1, 4, 0, 1, 2, -2, 0, 3, 0, 5, -4, -2, 1, -4, 4, 5, 4, 5, -1, 4, 0, 0, -1, 2, 2, 5, -4, -2, 1, 0, 6, -5, 4, 2, 3, -3, -2, -2, -2, -3, 2, -2, 4, -2, 5, 0, 2, 5, 2, -1, 2, 1, 0, 5, -1, 0, 2, 0, -2, -1, 2, 6, 3, -4, -1, 4, 0, -4, -4, 4, 0, -2, -3, 5, -2, -3, 2, -4, 1, 0, 0, -2, 4, 3, 2, 2, -2, -3, 5, 1, 5, -3, -4, 5, 6, 5, -3, -3, -3, -3, 4, -3, -4, -4, 5, 3, -3, -5, -3, -5, 3, -4, 0, 5, 3, 3, -1, -5, 3, -4, 3, -5, 1, -4, 4, 0, 0, 2, 3, -2, 3, -1, 1, 1, 3, 2, 4, -5, 1, 5, 4, 0, 4, 5, 1, 0, -4, 2, -3, -3, 3, 4, 0, 4, -3, -1, 1, -3, 2, 5, 2, -4, 5, 5, 1, -4, -3, -3, 2, 2, -1, 2, -4, 3, -4, 1, 4, 0, -3, -4, 4, 3, -5, 5, -3, 1, -2, 6, 3, -4, 5, 3, -4, -1, 0, 4, 5, 3, 1, -3, 4, -2, 1, -3, -4, 5, -4, 3, 4, -3, 4, 5, -1, -3, -3, 2, 3, -1, -1, -4, 0, 5, 1, -1, 3, 3, 5, 6, 1, 5, -2, 3, -2, -4, -3, 1, 0, -3, 2, 5, 0, -2, 4, 3, 2, 3, 3, 1, -2, -2, -2, 3, 3, -4, 1, -3, -3, -4, 2, -2, -1, -1, 4, 2, -4, 0, 4, -3, 1, -3, 0, 1, -5, 6, -1, 1, 0, -2, 0, -4, 1, 3, 1, -1, 3, -2, 3, -3, 4, -4, -5, -5, 6, 2, -2, -2, -3, -3, -2, -4, -3, 2, 5, -4, 2, -3, 6, -3, 3, 3, 1, -4, 4, -2, -3, 4, 5, 4, -1, -1, -1, -4, 4, 1, -3, 1, 1, -1, 5, -4, -4, -3, 5, -3, -4, 4, 4, -2, -2, -3, -5, 1, -4, 2, -3, 4, 2, 1, -4, 6, 3, 5, 4, 2, 6, 3, 2, 5, 2, -2, 3, 2, -3, 0, 4, 5, 4, -2, 6, -1, 2, 6, 1, 2, 2, 6, 5, -3, 5, 0, -4, 4, -2, 1, 5, 6, 0, -3, -4, 3, -3, -5, -2, 1, 3, -3, -1, -4, -3, -2, -4, 1, -1, 1, 1, -2, 3, 2, 3, 2, 2, 3, -3, -2, -4, -5, -1, -2, -2, -4, 2, -3, 3, -1, -3, -3, 4, 1, -1, 1, 1, 5, 0, 4, 0, 2, 6, 3, 1, -4, -1, 1, 6, 4, 4, 4, 0, 6, -3, 3, 0, 1, 1, 1, 0, 1, -2, 2, 3, 4, 0, 5, -4, -2, 0, 2, -1, 4, -2, -3, -1, 4, 5, 2, -1, -5, -4, 0, -2, 3, 0, -3, 5, -1, -4, 1, -1, -2, 2, -2, -3, 4, -1, 0, 3, -1, 2, -2, 4, 0, 2, -1, 3, 2, 4, 2, -4, 5, -1, -1, 0, 5, -4, 0, 4, 5, -1, 2, -1, 2, 5, 3, -2, 0, 2, 0, -1, -2, -3, 2, 4, -5, -4, -4, 6, 0, -4, -4, -1, 0, 6, 3, 2, 3, -3, 0, 3, 0, 1, -4, 0, 5, -4, -4, 1, 5, 1, 3, -2, 4, 4, 1, -3, -1, -2, 3, -1, 3, -1, -4, 1, 3, 0, 2, -1, 2, 3, 1, 5, -4, -2, 4, -2, -3, -1, -4, 4, 2, 1, 5, -3, 1, 1, -5, -3, 1, 5, -1, 4, 4, 3, 6, 1, 5, -1, 6, -4, 1, 3, 5, -2, 3, 5, -4, 5, -3, 0, -3, 3, 0, 4, -5, -4, 6, 5, 2, 0, -4, -3, 1, -1, 2, 2, -2, -2, -1, 3, 3, 1, 1, -2, -4, 5, -3, 2, 4, -4, 3, 4, -1, 3, -2, -2, -1, -4, 1, 5, -3, 4, 0, -3, 2, -1, 6, 3, 2, 3, 5, 6, 0, -2, -2, 2, 4, -2, 2, 3, 2, 4, -4, 0, 5, -1, -3, 2, -5, 5, -2, -1, 2, 1, 1, 3, -1, 2, 0, 0, 2, 4, 4, 2, 2, 1, 1, 0, -4, -2, 1, -4, 5, 5, 4, 3, -3, 4, 4, 3, -4, -5, 0, 4, 4, 4, -2, 4, 1, -1, 2, 1, -2, 1, -5, 5, -3, 6, 3, 4, -4, 4, -1, 3, 0, 2, -4, -1, -3, 1, -2, -2, 3, -3, 1, 6, 0, -1, 3, -4, 0, 5, -2, -1, 3, -5, 3, -4, -2, 5, 5, 0, -4, 3, 4, 1, 5, 4, -3, 2, 1, -3, -2, -2, -1, 0, 0, -2, 1, -3, 3, -3, 3, 3, 2, 4, -5, -3, -3, 1, 2, -3, 6, -3, -3, -5, 0, -1, 1, 2, 2, -4, 4, -2, 5, 4, 0, -3, 3, -4, -3, 4, -2, 4, -4, -3, -2, 3, 5, 1, -1, 0, -2, 1, -1, -4, 4, 4, 5, -2, 3, -4, 3, -3, 4, -3, -2, 1, 3, -2, -3, -2, -1, 5, -2, -3, 0, -1, 5, -4, 2, 3, 5, -4, -3, 0, -4, 0, -1, -1, 4, 2, 1, 2, -1, 3, -1, 2, -2, 3, 0, -3, 5, -4, -1, 4, 4, 2, 0, 0, 2, 4, -3, 5, 3, -1, -3, 3, 5, -2, -4, -1, 5, -3, 2, -4, -3, 1, -2, 4, 3, -2, 0, 2, 3, 1, 5, 1, 3, -4, 3, -5, 0, 2, -4, 1, 0, 1, 3, 3, -1, 3, -3, -1, -3, 0, -2, -3, 1, -1, -4, 5, 4, 6, -2, -4, 0, 0, 0, -2, 4, 5, 3, 4, 4, -1, -3, 2, 3, 3, -2, 5, -3, 3, 1, 2, -5, 0, -5, 6, -3, 6, 5, 4, -1, -4, 2, 1, -5, 5, -1, 3, -1, -4, -2, -1, 2, 5, 1, 1, 3, 3, 4, -4, -3, 2, -2, 1, -4, 1, -1, 5, 3, 1, -1, -2, -2, -1, 2, -1, 4, 3, 2, 4, -2, -2, 5, 5, 6, -4, -2, -1, -3, 5, -1, 2, -2, -4, 1, -2, -2, -1, 0, -1, 0, -2, 3, 1, 2, -4, 0, -3, -2, -4, 2, 5, 0, 1, -2, 5, 4, 5, 5, 1, -4, 5, 2, 3, -1, -1, -3, 3, 3, -3, -2, 2, 3, 3, 1, 5, -1, 3, 0, 5, -3, 1, -2, 1, 4, 4, -1, -4, 1, -1, 2, 5, -2, -2, 4, -2, 2, -2, -4, -2, 2, -4, 5, 5, 5, -2, 2, 3, 5, -3, 4, 5, 4, -3, 1, -3, 5, 0, 5, 2, 4, 2, 1, 1, 0, -1, 2, 4, 4, 5, 0, -2, -3, 1, 3, 3, -2, 4, -1, 1, 0, -4, 3, 3, -2, -5, 0, 4, -3, 5, -2, 2, 0, -1, 4, -5, -2, 0, 0, 1, 2, -4, -5, -3, -2, 0, -4, -4, -4, 1, 2, -1, -4, 4, 0, 4, -1, -5, -4, -2, -4, -4, 2, -4, -2, 4, -2, 0, 4, -1, -2, -1, 2, -4, 2, 5, -3, -4, 3, 2, 4, -3, 5, 3, 1, 1, -4, 4, 0, -1, -1, -1, -3, -1, 4, 1, 5, 5, -5, 2, 1, -5, 0, 5, -5, -5, -1, 6, 3, 1, -2, -4, 1, 5, -4, -3, -4, -1, -4, -2, -3, 1, -2, -1, -1, -3, -3, 4, -3, -4, -4, -2, -4, -4, 0, -4, 3, 3, 2, -1, -3, 5, 2, -1, -1, 5, 4, -4, 5, -5, -2, -1, 0, -4, 3, 1, -2, -2, -2, 2, 5, -1, 1, -1, 0, -2, -1, 5, 3, 0, -4, 5, -3, 5, -3, -3, 3, 4, -4, -3, -1, 4, 2, 3, -3, -3, 4, 5, 0, -3, 5, -2, 6, -1, 3, 3, 3, -1, 6, -1, 1, -1, -1, -1, -3, -1, 1, -3, 5, 4, -5, 2, 2, 4, 5, 0, -4, 3, 2, 1, 2, -2, 3, -2, 4, 1, -3, 5, -4, -2, -5, -3, 5, -3, 2, 6, 3, -3, 4, -3, 5, 4, 3, 5, -5, 2, -3, 5, -1, 0, -2, 2, 4, 4, -1, 3, 6, 5, -5, 6, 2, 2, 2, 0, 5, -4, -4, 3, 0, -4, 1, 0, 3, 2, 2, 5, 0, 3, 4, 4, -4, 5, 3, 0, -1, 2, 3, -1, 0, -2, -3, -2, 6, 1, -3, -4, -4, 3, 6, 4, -3, 0, -4, 3, -1, -3, 4, 3, 5, -3, -3, 1, 0, 0, 0, -5, -1, 4, 2, 6, 3, 0, -5, 5, 3, 5, 5, 2, -5, -2, -2, 2, -4, 6, 4, -1, 1, 1, -4, -4, 5, 3, -1, -2, 5, 2, 0, 5, -4, -2, -2, -3, -1, 3, -2, 4, 4, -4, -2, 2, -4, -5, -4, 1, -3, 2, -3, 5, 2, -4, -1, -4, 5, -4, -4, -3, 1, 2, 4, 2, 2, -3, 2, 2, 1, 4, 4, 2, 5, -4, 4, 1, 1, 3, -4, -3, -3, 2, 0, 4, -5, 0, -1, 5, 2, -3, 3, 0, 4, 4, -2, 5, 4, -4, -3, 1, -4, 3, 0, 4, 2, 3, 1, 5, 6, 3, 2, 0, -4, -2, 1, 2, -1, -1, 4, -2, -2, -2, 0, 4, 4, 2, 2, 1, 4, -1, -4, -4, 1, 4, 1, 6, -2, -3, 0, 0, -4, 2, 0, -2, 2, 5, 1, 5, 3, 0, -4, 1, 4, 2, -4, 1, 2, 0, -4, -4, 5, -2, 4, 0, -4, 2, 3, 1, -3, 5, -1, 0, 5, 0, -3, 5, 3, 2, 5, -3, 5, 4, 1, 2, 4, 1, -2, 4, -2, 3, 3, 5, 2, -2, -1, -3, -3, -4, 5, -1, 0, -1, 1, -4, -2, 4, 5, -3, 4, 5, 0, -3, 0, 2, 3, 3, 0, 5, -4, 1, 4, -2, 0, 5, -3, 0, 0, 2, 3, -3, 3, 1, 2, 3, -1, -3, 1, -3, 1, 1, 2, 4, 1, -3, -1, -2, 1, -4, 1, 4, -4, 3, 1, 0, 5, -4, 3, 3, 1, 3, 4, -3, -3, -4, 2, 5, 6, -2, 5, 5, -4, 5, 4, 3, -2, 3, 5, -1, 4, 2, -1, 2, 2, 4, 3, 4, -1, 5, 0, 1, 3, -4, 1, -1, 5, 2, 1, 5, 1, 4, 4, -3, -4, 6, 1, -4, 3, 2, -2, -1, 1, -3, 1, 2, 2, 2, -1, 3, 3, -2, -1, 3, -4, -1, 3, 1, 0, -4, -2, -3, 3, 0, -3, 5, -3, -1, -4, -1, -2, -1, -4, -5, 3, -4, -2, -2, 2, 2, 1, 6, -2, 3, 1, 3, -3, -3, 4, 2, -1, 0, 5, 0, 5, 5, 5, -4, -4, 2, 1, 2, 2, 4, -5, -3, 6, 5, -2, -1, 0, 2, 4, 5, 4, -5, 5, -3, 6, -1, -1, 1, -1, -3, 3, 5, -1, 5, 6, 5, 4, 1, 0, -2, -2, 2, -4, -3, 6, -5, -3, -1, 1, 1, 5, -1, 1, 4, 4, 2, 5, 0, 3, -2, -2, -4, -2, 3, -1, -1, -2, 3, -4, 2, 2, 5, 4, 1, -5, -4, 1, -3, 5, -3, 3, -1, -3, -4, -3, 1, 1, 1, 2, -1, 4, -1, 2, 3, -3, 1, 5, 0, 3, 2, 1, -4, 5, 2, 4, 3, -4, -2, -2, 0, -4, 2, -2, -2, 6, 2, 5, -4, -1, 3, -4, -1, -1, -2, 3, 2, -3, -4, 0, 1, 2, -4, 2, -3, 2, -5, -1, -1, 2, -2, -2, 3, -2, -2, 3, -1, 3, 0, 0, 2, 5, 6, -2, 5, 4, 1, 1, -3, -3, 4, 0, 2, 3, -4, 0, 5, 1, -3, -3, -5, 4, -1, 1, 2, -3, -4, -3, 3, -4, -4, 3, -2, -5, 2, 5, -3, 5, 3, 0, -3, 4, 4, -4, 5, 5, 4, -4, 2, 5, 6, 2, 4, -3, -3, 5, -1, 5, -3, 4, 0, 4, -3, 3, 2, 2, 3, -1, -3, -3, 3, -4, 3, 0, -2, 5, 2, 4, -1, 2, 3, -3, -1, -5, 2, 3, -2, 1, 5, -3, 5, 6, 0, 0, -4, -3, 1, 2, -5, -3, 5, 4, -4, 4, 3, 0, 1, -2, 4, -4, -3, 2, -1, 0, 2, 5, -2, 2, 1, 1, 5, -2, -4, 5, -2, 0, -4, 3, 2, -1, -3, 1, -2, -1, -1, -2, -2, 1, -4, 2, -2, -1, 0, -3, -4, -2, -4, 0, 4, 5, 0, 0, 4, 2, 0, -5, -3, -1, 3, -3, 4, -1, 0, 5, 3, -4, 5, -1, -2, 3, 4, -3, -3, -4, -2, -2, 3, -1, 5, 2, -1, -3, 3, -2, 3, -3, 2, 2, -4, -2, 1, -4, 1, 3, -1, 4, 3, 1, 4, 6, 4, 5, -1, -3, 1, 3, 4, 5, -4, 2, -1, -3, 0, 0, -3, -2, 0, -2, 1, -1, 2, 6, 1, 1, -3, -2, -4, 3, -5, -1, 4, 1, 5, -1, 0, 5, -1, -4, 1, 1, -1, -4, 0, 2, 4, -2, 2, -4, 0, 2, 0, 3, 0, -3, 4, -4, -2, 6, -3, 2, 0, -1, 3, -2, 0, 4, 4, 2, 0, 3, 0, 1, -4, 0, 0, 4, -5, 6, 3, 0, 3, 1, -4, -3, 6, 0, 4, 2, -2, 5, -3, 5, 0, -1, 2, 2, -2, -2, 1, 3, 6, -3, 4, 0, 5, -1, 4, -4, 1, 2, 2, -3, 0, 5, 6, 2, 0, -4, -4, 3, 0, -3, 3, -2, -1, -2, -1, 0, 4, 1, -1, 2, 5, -1, 1, 0, 2, -3, 2, 2, 5, -5, -4, 0, -3, -5, 0, -2, 2, -4, -4, 3, 3, -2, 5, 2, -3, 1, 3, 0, -4, 2, -2, -1, 0, 2, -3, 2, 3, -4, -4, -2, 3, -2, -4, 2, -1, -4, 2, -3, 3, 0, 2, 4, 2, 5, -1, -2, -3, 2, -4, -4, 5, -4, 2, 5, 5, -1, -3, 5, -5, 3, -3, -4, 2, -4, 4, 6, 2, -4, -4, 6, 2, 0, 2, 2, 1, -2, -1, -1, 5, 2, 4, 4, -5, 2, 4, -3, -3, 4, -1, -3, -3, 1, -1, -4, 0, -2, 2, 4, 4, 3, 1, -3, 3, -3, -3, -1, -1, -4, 6, 3, 2, -3, -1, -3, 6, 0, 1, 0, 2, -1, 3, 4, -2, 2, -5, -3, 0, 3, 5, -1, 5, -4, 2, 1, 3, 2, 5, -2, -4, 1, 4, -4, -4, -2, 5, 6, 5, -1, -1, 2, 3, 3, 5, -1, 0, 2, -3, 2, -3, 5, -4, -4, 2, 5, 1, 3, 4, -2, -2, 2, 1, -3, -4, 3, 6, 6, 1, -1, 1, -4, 3, 1, -4, -5, 4, -3, 3, -2, 2, -3, 2, 1, -3, 3, 4, -2, -2, 5, -2, 4, -5, 0, 1, -5, -1, -2, -4, 0, 3, -3, 1, 6, -1, -5, 2, 4, -1, 1, 4, 0, -1, 5, -4, 0, 5, -5, 5, 2, -3, -2, -2, 3, -2, -4, 2, 5, 5, 0, 1, 1, 2, 2, -2, 1, -1, -2, 5, -4, 1, 5, -1, 1, 3, 3, 5, 2, -4, 2, 2, -1, 5, -1, 4, -3, 0, -5, -4, -2, -2, 4, 3, -2, 0, 2, -3, 4, -3, -1, -2, -2, 5, -3, 2, -3, 0, 4, 3, 0, -5, 5, 3, 2, 5, 2, 0, -4, 3, -1, 4, 2, 0, -1, 5, 2, -1, -1, 4, 0, 2, 2, 2, 4, 4, 1, -2, -5, 0, -2, -4, -1, -4, -2, 4, 2, 2, 4, -2, 5, 3, -1, 6, -4, 5, -2, -2, -3, 4, 4, -1, 4, 0, 5, 2, -1, -2, -4, 1, -2, 4, -2, -1, 1, -3, 4, -2, 5, -4, 4, 4, 1, 2, -5, 1, 1, -1, 5, 5, 5, -3, 4, 4, 0, -1, -4, 0, -4, 5, -4, -3, 0, -1, -2, 2, 1, 5, 0, 1, 3, 2, -4, -3, 3, 1, 5, 2, 3, -4, -3, -1, 2, 2, -1, 4, 0, -1, 4, -3, 2, -2, -4, 2, 4, 0, 1, -1, 3, -4, 2, 2, -1, -1, 3, 3, 1, 3, -5, 5, 4, -2, 2, -1, 3, -4, 4, -2, -3, -1, 3, 2, -4, 0, 0, 0, -1, 5, 3, -4, 0, -2, -1, 2, 2, -3, 0, 1, -3, 1, -4, 6, 0, -4, 2, 4, 3, 1, -3, 5, -1, 6, -4, -2, 2, -1, 5, -1, 4, -2, 4, 4, 2, 2, 5, 1, -3, -4, -5, 3, 3, -1, -4, 4, 2, -1, 0, 4, -2, 1, -3, -3, 3, -4, -1, -3, 2, -5, 2, 1, 3, 0, 4, 3, -4, -4, 4, -5, -1, 3, 1, 0, 0, 5, 3, -4, -1, 1, -1, 1, 1, -5, -1, 4, -2, -3, -3, 5, -3, -1, -3, 1, 3, 5, 3, -2, 5, -3, 2, 6, 4, 5, 0, -3, -2, -1, -5, 5, -1, 1, -5, 2, -1, -3, -3, 3, 0, 2, 2, -2, 4, 3, 2, 1, -2, -3, 1, -2, 5, 4, 2, -1, -2, -1, -2, 2, 5, -4, 5, -4, 5, 5, -4, -3, -2, 3, 1, -1, 1, 5, -1, 0, -1, 3, 3, 2, 2, 5, 0, -1, -2, -3, -2, 2, 3, 1, 2, 0, 0, 0, 5, 2, -2, 2, -2, 0, 3, -1, 2, 3, 3, 6, 4, 6, 5, -1, 5, -5, -1, -1, 4, -4, 1, -4, 3, 4, -2, 5, -2, -2, 0, 2, -2, 5, 1, 1, -5, -4, 5, 3, 0, -1, 2, -3, 1, -2, 2, 1, -1, -1, 4, 0, -4, 4, 4, 1, -3, 6, 2, 6, 3, -3, 1, 0, 4, -4, 5, -1, -3, 1, 3, -2, -4, 3, -3, -2, -1, -5, -3, -2, -1, 5, -3, 1, 0, 6, 0, 3, 2, 1, -2, 2, 1, 0, 2, 4, 1, -1, 2, 2, 3, 4, -3, -3, 3, 5, -4, 3, -2, 2, 1, -4, 4, -1, 6, -2, 5, 5, 5, 3, 0, 1, 0, 0, -3, 2, 0, 2, -3, 1, 5, 5, -4, 2, -1, -4, -1, -5, 4, 1, 2, 4, 4, -1, -2, 2, 3, -4, -1, -4, 3, -4, 2, -2, -2, 5, 5, 1, 4, 2, 4, 3, -3, 3, 4, -5, 3, 5, -3, 3, -3, -1, -1, 5, -3, 5, 3, 5, 0, -4, -5, 4, 3, 3, 4, -3, 4, 1, 2, 5, -1, 3, -1, 1, -1, 4, -4, 3, 2, -1, 1, 0, -3, -1, -1, 6, -4, 3, 3, 3, 0, 5, 5, 5, 0, 1, 1, 2, -4, 2, 5, -3, -3, -4, 2, 4, -1, 0, 3, 5, 1, 4, -2, -3, 5, -4, 5, 6, 3, 6, 4, 0, 1, 1, -3, 3, 0, -1, 0, -3, 3, -4, 3, 2, 2, 4, -1, -1, 0, 5, 3, -2, 3, 1, -1, -1, 1, -4, 5, 4, 5, -1, 5, 2, 2, 2, -1, -4, 5, -1, -4, 1, 3, 0, -1, -2, 3, 3, 0, 5, 6, -1, 3, 4, 3, 6, -1, -4, 4, 2, -2, 4, 2, -3, 3, -4, 3, 1, 0, 0, 3, 3, -2, -2, -4, 5, 4, 2, 3, 6, -3, 6, 2, -1, 3, -1, -4, 3, 5, 2, -2, -1, -4, -1, 5, 1, 1, -4, -2, -3, 4, 5, -1, -1, 3, -2, 5, -2, -2, 3, 1, 1, 3, 1, 4, 5, 1, 0, -2, 4, 3, 3, 0, -2, 4, 5, -1, 1, 1, 2, -3, 1, 4, 4, 2, -1, -5, 5, 2, 1, -1, -3, -3, 5, -3, 4, 4, -1, -1, 2, 4, 3, -1, 4, -3, -2, 2, -2, 1, -1, 1, -1, -4, -4, -3, 2, 3, 2, 2, 5, 2, 0, 3, -5, -4, 3, -1, 1, 0, -2, -1, 3, 5, -1, 2, 4, 3, -4, 4, -1, 4, -2, 0, -4, -3, 2, 1, 5, 2, 5, 0, -4, -1, -1, 2, 2, 4, 2, 3, 0, -1, 4, 4, -5, -1, 3, 2, -3, -1, -2, -3, 2, -3, 6, -4, 1, -1, -5, 0, 3, 5, 1, 3, 2, -1, 4, 5, -3, 4, 1, 5, -2, 5, 0, 5, -4, 6, -2, 4, -4, 2, 4, -2, 0, 4, 1, 3, -4, 1, -4, 5, -4, 3, 4, 0, 3, -3, -3, 3, 0, 3, -3, -4, 4, 1, -4, 5, 1, -4, 1, -1, 4, 1, -2, 4, 5, -4, 2, 2, -4, -1, 4, 3, -3, -2, 4, -4, -1, -3, 4, 4, 0, 2, 3, 2, -2, 4, 5, 1, -2, 1, 4, -2, -4, 5, -4, -3, 2, -3, 0, 1, 3, -2, 1, -4, 3, 4, 4, 1, 3, -1, 5, -2, -1, 2, 2, -1, 0, -3, 1, 1, 2, 2, 2, -3, 0, 3, -1, 4, -1, 3, 6, -3, 5, -3, 0, -3, -1, 5, 3, 0, 4, 1, -3, -4, 4, -3, -4, 2, 5, -4, 4, -4, -2, -4, -2, 2, -4, -1, 0, 0, 2, -4, 0, 5, -3, 0, -2, 0, 4, -3, 1, -4, 3, -2, 4, -1, -2, -4, 0, 3, -4, -5, 2, 2, 5, -3, 2, -4, -2, 4, 4, 4, 1, 5, 1, 1, 4, -1, 4, -5, -2, 3, -2, -1, -5, -1, 0, -1, -1, 1, 4, -3, 0, 1, -3, 5, 0, 0, 6, -4, 6, -5, 0, 4, 1, 2, 0, 2, -3, 1, -5, 3, -2, 2, -4, 0, -1, -1, 4, 4, 6, 1, -4, 5, -2, -1, -2, 6, 0, -3, -4, -3, -4, 5, 2, 3, 3, 3, 3, 2, -1, 0, 2, 6, 1, 3, 3, -1, -3, 4, -4, 5, 2, -4, -4, -3, -4, 5, 2, 2, 4, 3, -2, 3, -2, -2, -4, -1, 4, 5, -4, 0, -1, 2, 4, 5, -2, -1, -1, 4, 2, 0, 1, 4, -4, 2, 5, -2, 1, 2, -2, 3, -4, -2, 4, 5, 2, -4, 3, -3, 3, 2, 3, -1, 5, 4, 2, -4, -5, 3, 4, 2, -2, -3, 5, 1, -3, 3, -4, 2, 2, 2, 3, 3, 0, -1, -2, -2, -3, 2, -4, 1, -4, -2, -5, -3, 0, 3, 5, 0, -1, 4, 4, -1, 1, 0, -1, -3, -1, 2, -4, 3, 1, 4, 4, 4, 1, 5, -4, 3, -1, 3, 3, -4, 3, -1, 0, 3, -3, 0, 5, 6, 4, 1, -3, -1, -1, -3, 0, 4, -1, -3, 3, 0, 4, 1, -4, 3, 0, -1, -1, -3, 1, 0, 3, -2, 5, 2, 2, 2, -1, 1, 0, 3, 2, -4, 0, -4, -2, 6, 6, -3, -4, 1, -3, 2, 3, 5, -3, 3, -4, 1, -3, -5, -3, 1, -4, -2, -5, -5, -2, -2, -1, 1, 3, 3, 1, -2, 4, -3, -2, 3, -2, 2, 0, 1, 2, -4, 2, -4, -3, 0, -1, 1, -3, 6, 1, 0, -2, -3, -1, 3, 6, 5, 2, -1, 5, 2, -3, 1, 1, -5, 0, -4, 0, -4, -4, -5, 2, -4, 2, -1, 4, 3, 3, -3, 2, 3, -3, 5, 5, -4, 4, 3, 1, 6, 0, 4, 5, -2, -1, -3, 0, 4, 5, -4, -1, 2, -4, 2, 2, 3, 3, -1, 4, 5, 2, 4, 0, 4, 0, 0, 6, -1, -2, 5, -4, 3, 4, -2, -4, 4, 0, 3, -3, -4, 0, 6, 4, 5, -1, -3, 4, 0, 3, -1, 5, 0, 0, -2, 3, 0, 4, -5, 4, -4, 3, -1, -3, 0, 6, 5, 2, -2, 5, 1, 1, -4, 4, -1, -4, 1, 2, -2, 1, 4, 5, 1, 1, 4, 5, 5, -4, 4, 6, -3, 5, 0, 4, 2, 2, -4, 3, -4, 3, 6, -3, 1, 2, -3, 2, 3, 1, -3, 2, 0, 2, -1, -4, -2, 3, -1, 0, 2, 3, 5, 3, -3, -4, 0, 3, 6, -1, -3, -2, 1, 5, -4, 5, -2, 4, -4, 1, -5, -2, 3, -3, 0, 0, 5, 3, -1, 1, 5, 4, -1, 4, 3, 3, 4, 4, -1, 1, -5, 0, -3, 4, -4, -1, -4, -4, 1, -3, 3, 0, 0, 4, 0, -4, 2, -3, -1, -1, -4, 1, 1, 1, -1, -4, -3, -4, 6, 0, -5, -2, 5, -4, 1, -2, -4, 2, -4, -2, -1, 1, -4, -1, 3, -2, 4, 6, -2, 6, 3, 4, -3, -4, 0, -3, 5, -3, 2, -4, 2, 3, 2, -3, -3, -2, -3, 0, -3, 4, -2, 5, 4, 4, 3, -2, 5, 2, 4, -4, 0, -2, -3, 1, 3, 0, -5, 3, 3, -1, -1, -4, 2, -3, -4, -3, -4, 4, 1, -2, -3, -1, -4, 5, 5, -4, -3, -1, 3, 1, -1, -1, 0, -4, -4, 2, 1, 2, -1, -2, -3, 3, 4, 3, -4, 1, 3, -5, 1, 3, 5, 2, 3, 5, 4, 5, 0, -2, 0, 5, -3, -4, -3, -2, 2, -1, -4, 2, 3, 2, 2, 2, 5, -3, 4, -5, -2, 0, -1, 1, 2, 4, -4, -1, 4, -4, 5, 2, 4, 3, -1, -3, -4, 4, 6, 0, -1, -3, 1, 2, 5, -3, 0, 2, -1, -4, -4, 3, 4, -1, 2, -4, 2, 4, 4, 3, 4, -2, 2, -3, 6, -2, -5, 0, -4, 2, 4, 5, -1, 0, -1, 2, 4, 2, 1, 3, -2, -4, 2, -3, 5, -1, 5, -2, -2, 1, -4, -2, -1, 4, -2, 5, -4, 1, 3, -1, -2, 5, 4, 2, 1, 5, -1, -1, 5, -2, -3, 1, 0, -1, 5, 1, -1, -3, 3, -2, 1, 5, 1, -1, -1, 2, 1, 3, -4, 1, 3, 1, 2, -3, 6, 3, 0, -4, -1, 1, -4, -4, 4, -3, 2, 6, -5, 5, 4, 4, 6, -5, 0, -4, 5, 6, -1, -2, 4, 6, 4, 2, 4, 0, -3, 0, -3, -3, 1, -3, 5, 3, 4, -4, 2, 6, -2, 3, -3, 3, -1, 0, 0, 1, -1, -2, 0, -4, 2, 4, -4, 2, 5, 0, 1, 5, -1, 1, 0, 2, -3, 4, 5, 0, 2, -1, -2, -2, 4, -1, -2, -5, 5, 5, 4, -2, -1, -5, 2, 0, 1, 1, -5, 2, -3, -2, -4, 1, 4, -1, 1, 4, -1, 1, -1, 1, 3, -3, 3, 2, -5, 6, -2, 6, -1, 2, -3, 5, -1, -2, 5, 1, 0, -3, -4, 5, 0, 2, -3, 3, 1, 4, 3, 1, 0, -1, -2, -4, 5, -4, 2, 1, 2, -4, 3, -2, -5, -4, 4, 3, 1, -3, -2, 5, -4, -2, -5, -1, 2, -1, 1, 4, 3, -1, 3, 3, -4, 1, -4, -3, -4, 0, -2, 2, 1, -1, -4, -3, 2, 2, 0, -1, -4, -4, 0, 5, 0, 2, -3, -3, -2, -3, 4, -3, -1, 3, 0, -4, -1, 1, 5, -3, -1, 2, -2, 6, -2, 4, -2, 5, 4, 4, 5, -2, 4, -1, 5, 2, 5, -2, 2, 4, 0, 1, 6, -1, -4, 5, 6, -4, 2, 2, 4, -4, 5, -2, 3, -3, 2, 5, 2, 6, -5, -2, -3, -4, 0, 0, -1, 3, 1, 4, 2, 1, -2, 0, 2, 3, 6, 4, 2, 0, -4, -2, 0, -4, -1, 6, 3, 2, 0, -5, -4, 1, 1, 4, 3, 0, -1, 4, 2, -3, 4, 3, -2, 3, 1, 3, 2, -3, 1, -4, 0, 6, 0, 3, 1, -3, -4, 1, 1, 4, -4, 1, -4, -2, -1, 2, 0, 5, 0, 0, 4, 3, 3, -3, 3, -1, 4, -1, 5, 0, -1, -1, 5, -5, 0, 1, 4, 3, 5, -4, 2, -3, 3, -4, -4, 3, -2, 1, -5, 1, -1, 0, -1, -1, -2, -2, 0, -1, 6, -2, -1, -4, -2, 0, -4, -5, 4, -3, 1, 1, 0, -2, 3, 2, 4, 0, 5, 1, -4, -2, -4, 1, -2, -2, 3, 5, 4, 2, -3, 4, 2, 2, 2, 0, 1, -3, 5, 3, -3, 2, -3, 1, 3, -3, 0, 1, -1, 3, 0, -3, 4, -4, -2, -1, 3, 5, 3, 4, 4, 3, 4, 1, 4, 4, -1, 5, 1, 0, 5, 1, -5, -5, -2, 4, 4, 0, -4, 5, -4, 3, 5, 0, 2, -1, 0, 2, -4, -5, -3, -1, -2, -3, 0, -3, 1, -3, 2, 2, 2, -2, 5, 3, -3, -1, 0, 2, 0, -4, -3, -2, 3, 4, 3, -3, -3, -5, 2, 2, 4, 5, 5, 5, -3, 4, 5, 5, -4, 6, 4, 4, -5, -4, 0, 4, -3, 3, -5, -2, 0, -4, -3, -2, -4, 5, -4, -1, 1, 2, 6, 4, -3, 3, 3, -3, -3, 4, -1, 2, 2, -1, 0, -4, 3, 1, -1, 3, -3, 1, 1, -4, 1, 1, 1, 5, -3, -3, -5, 0, 5, -1, -4, 0, -3, 2, 1, -5, -4, 3, -5, 4, 4, 4, 5, -2, -2, 2, -3, 0, 0, -4, -3, 2, 3, 3, 2, 3, 3, 5, 3, 2, -4, -4, 1, 0, -4, 3, -4, 5, -3, 1, -4, -1, -2, -1, -5, -1, 3, -2, -4, -3, 2, -3, 1, -1, -2, -4, 5, 1, 1, 2, 1, -5, 0, -4, -1, 2, -5, 0, 0, -4, 4, -4, -4, 4, 2, 2, 2, -2, 3, -1, 0, 6, 5, 5, 1, 0, -3, 0, -4, 6, 3, 0, 5, 5, -4, 6, 1, -2, -1, 6, 0, -2, 1, -5, 3, -3, 3, 5, 0, 0, -1, 5, 3, -2, 2, 1, 3, -4, -2, 1, -5, 1, -1, 3, 2, 3, 1, 1, 0, 3, -4, 3, -1, 5, -1, -5, -1, 4, -4, 3, 6, 4, 5, -3, 5, 4, -3, 3, 2, 2, 1, 4, 6, 1, 1, -2, 0, 2, -5, 0, -2, 1, -4, 3, 5, 3, 1, -4, 3, -2, 3, 3, 2, 1, -3, 5, -4, 2, 4, -3, 5, 0, 4, -2, 5, 3, 1, 2, 1, 0, 0, 0, 0, 2, 0, 1, 1, 0, 2, -5, -4, 1, -3, -4, 2, -2, 2, 5, 0, -5, 4, -2, 5, 0, -3, 0, 2, -2, -2, -3, 5, -2, 3, 6, 3, 2, 0, -3, -3, -3, 0, 1, 4, -3, 0, 5, -4, -4, 1, 3, 6, -3, 3, -1, -4, 5, 5, -4, -2, 6, -2, 3, 1, 4, 3, 5, 4, 2, 4, 1, 0, 5, 3, -1, 0, 2, 2, -2, 4, -1, 3, -1, -2, 1, 5, 0, 3, -3, -1, -4, -3, 3, -4, 1, -1, -3, 1, 3, 1, -3, -2, -2, -2, 6, -5, 0, -4, 1, 1, 2, -1, -1, -5, -3, 0, -2, -4, -1, 0, -4, 5, 6, 3, 4, 6, 5, 3, 0, 2, -5, 4, 3, -4, 5, 3, -3, 3, -3, 3, 0, -2, 2, 2, 6, 5, -2, -4, 5, 2, -2, -1, -2, 5, 1, 3, 4, -3, 3, -3, 4, 2, 2, -4, 2, -3, -4, 2, 1, -2, -3, 3, 5, 3, 3, -2, 5, 3, -1, 5, 0, -4, 4, 5, 0, -2, 6, 6, 0, 3, -3, 6, -3, 2, -4, 0, 0, 5, 0, 0, 2, 5, 4, -4, -1, -4, -4, -4, 5, 2, 1, 1, 5, -3, 0, 3, 5, 0, 3, 4, -5, -2, 1, -2, -3, 3, -3, -3, -3, -4, 1, 1, 4, 5, 5, 6, -3, 3, -4, 1, 3, 2, 2, 2, 4, -3, 1, 3, 2, 0, -4, 5, -2, 5, 5, 0, 3, 4, 4, 0, 3, -3, -5, -1, -4, -2, -3, 5, 6, -5, 1, 0, 4, -2, -1, 0, 3, 0, 0, 5, -1, 6, -1, 5, 3, -1, 1, -2, 2, 6, 4, -4, 3, 5, -4, 3, 5, -3, -1, 0, -3, 0, -3, 0, 2, -2, 5, 0, 0, 5, -3, -3, 2, -2, 1, -2, 5, 2, -2, -4, -1, -4, -5, -4, -4, 4, 1, -5, -5, 0, 0, 3, 1, 3, 0, -1, -3, -3, -1, -2, -4, 2, 1, 5, -2, -1, 2, 0, 2, 0, 3, 4, 5, 1, 2, -1, 5, -1, 2, -3, -1, 3, 2, 2, 5, -1, 4, 4, 0, -2, -3, -2, -1, 1, 2, 2, -4, 2, -1, 3, 1, 3, 3, 2, 6, 0, -2, -4, 3, 3, -4, 2, -1, -1, 3, 2, -3, -2, 0, 2, 2, -3, 3, 1, -1, -1, 0, 3, -1, -1, -4, 5, 2, 3, -4, -2, 4, 5, -2, -2, 1, 2, 3, 0, 0, 3, -5, -1, 5, 1, -1, 4, 0, 2, 4, 5, 2, -2, 1, 6, -4, 1, 1, 1, 2, 5, -1, 2, -4, 6, 6, -2, 0, 0, 0, 1, 2, 0, -1, -4, 4, 2, -5, -4, 5, 0, -4, -3, -2, 2, 1, 5, -2, 2, -2, 5, 4, -1, 2, 2, 4, -4, 3, 4, 3, -3, 5, -3, 4, -2, -1, 4, -4, 1, 3, 0, 3, 3, 0, 4, 4, -5, 3, 4, 2, 5, 5, -2, -2, 4, -2, 0, 5, 1, 5, 5, 4, 5, 1, 2, 0, 4, 2, 0, -1, -1, -2, -1, 4, 2, 3, -4, -1, 4, 0, 0, 3, -4, 4, 2, 0, 3, -1, 1, 3, -3, -4, 3, -5, -3, 4, 2, 3, 5, -2, -4, -2, 3, 4, -4, -3, 0, 3, -4, 3, -3, 5, -4, 1, 5, 4, 3, -1, -2, -3, 0, -1, -4, 0, -2, 1, 4, 0, 6, -1, -4, -1, -2, -2, -1, 2, -1, -1, 1, 0, -2, 0, 4, 2, 0, -5, 2, 5, 1, 1, 4, -3, -4, 1, -1, 0, -2, 3, -2, 3, 3, -3, -2, 0, 6, -3, -1, -3, 3, -5, 2, 2, -5, -4, 4, 3, 5, 5, -4, 4, 4, 1, -2, -1, 3, 3, 5, 1, 2, -2, 2, -3, 0, 1, -2, 2, 1, 1, -4, 3, 2, -2, -3, 2, 1, 2, 1, 1, -2, 2, -3, -3, -2, -4, -4, -5, -1, 1, 4, 3, 2, -4, -1, 5, -3, 2, 4, 3, 1, -1, 2, 4, 4, 2, -4, -1, -2, -2, -1, 2, 0, 2, -1, 4, 4, -1, -4, 5, -1, 5, 5, -5, -4, 6, 5, 0, 1, 5, -4, 4, 1, 3, 2, -1, -1, 4, 1, 4, 5, 0, 5, 2, 0, 3, -2, -3, 1, -4, -5, 5, 3, -4, -2, 1, 4, 0, -1, 0, 4, -3, 0, 4, 1, 2, 5, 5, -1, 4, 0, 4, 3, 0, -4, -3, 2, -1, 5, 3, 5, 3, -2, 5, 3, 5, -1, 3, -1, 4, 3, -2, 2, -1, 5, -3, 3, 3, 0, 0, -2, 4, -1, 1, 1, -1, 4, -3, -3, -2, 4, 3, -3, 4, -1, -3, 2, 6, -5, 0, 2, 1, -3, -2, -2, -1, 2, -3, 3, 6, -2, 3, 5, 6, -4, 3, 2, 3, 0, -5, -4, 0, 4, -3, -2, 3, 4, 3, 2, 4, -2, -3, 3, 2, 3, 4, 0, -2, 2, -2, 2, -3, 5, -2, 0, 1, -3, 1, 4, 1, 0, -1, 0, 3, 2, -1, 2, -3, -4, -1, -4, -3, 5, 5, -4, -4, 0, 2, 1, -1, -2, 6, 6, 5, 2, 0, 1, 4, 0, 4, 4, 5, 4, -3, -4, -2, -4, 3, 3, -4, 1, -3, 1, -5, 4, 4, 2, 5, 5, -4, -3, -1, 5, 4, -3, -4, 5, 0, 4, -4, 5, -2, 0, 1, -1, -3, 2, 0, 4, -2, 5, 5, -3, 4, 2, 0, -4, -2, -2, -2, 1, 4, -3, 2, -4, 3, -1, 2, 3, 0, 1, -3, -3, 5, 3, 3, 3, 3, 1, 5, -3, 3, 2, -4, -3, 2, -3, -3, 1, 5, 3, -2, 4, 0, -3, 2, 0, 2, 5, -1, -2, 2, 3, -1, 1, 2, -5, -2, -3, -2, 0, 6, 4, -3, -1, 2, 1, -3, 0, 6, 5, -2, -2, 5, 5, 5, -3, -5, -1, 5, -1, 2, -4, 2, -2, 2, -4, -1, -1, -3, 5, -1, 0, 5, -2, 0, 1, 4, 6, 5, -4, -2, 3, 0, 5, 5, -4, -4, 4, -2, -4, 2, 3, 6, -2, -1, 5, 2, 4, 1, 3, 0, -3, 1, -4, 3, 1, 0, -1, -3, 4, 3, -3, 2, 3, 5, 1, -1, 4, -2, 0, -3, 5, -2, 6, 2, 2, 3, 0, 1, -3, -3, 1, -3, -2, -2, -4, -4, 1, -3, 2, 2, -1, -4, 2, -4, -3, 5, 1, -1, -3, 4, -3, -5, -1, -3, 4, 2, 2, 4, 1, 6, -2, 1, 1, -3, -4, -3, -1, 4, 5, -3, 0, 0, -2, -4, 5, -4, -3, 0, 2, 3, 4, 5, -1, 0, -1, 5, 2, 3, -4, -2, -3, -1, 1, -1, -2, 3, 4, -2, 0, -4, -4, -4, -2, -4, -5, 0, 2, 2, 4, 0, 0, 2, -4, -4, -2, 3, 2, 2, -5, -1, 3, 5, -5, 5, -3, 0, 3, -1, 1, -2, 4, 4, -1, 0, -4, -4, 2, -4, 3, 3, -2, 2, 6, 0, 6, -3, -3, -2, 5, 2, -2, -4, 0, 4, 4, -4, 1, 5, -3, 3, 5, 1, -1, -1, -4, -1, -3, -1, 5, 5, -2, 1, 3, 2, -4, -3, -5, -5, -3, -2, 0, 1, 4, 1, -2, -3, 2, 5, -1, -2, 3, 4, -2, 0, -5, -1, 2, 2, -4, 6, 4, 4, 3, 3, -1, 1, 4, 2, 3, 6, -1, 1, -2, -2, 3, 4, -4, 4, -1, -1, 2, -3, -1, -1, 4, 0, 4, 4, 3, -2, 4, 5, 5, -3, 4, 2, 0, 3, -3, -1, 3, 6, 0, -2, 6, 0, 5, -3, 3, 3, -2, 5, -3, 5, 4, -4, 1, -1, 1, -4, 5, 1, -4, -1, 5, 2, -3, 2, -3, -1, 0, -5, 5, 1, -3, 2, -4, 1, 4, 0, 3, 1, -5, 6, -2, 4, -2, -2, 0, 2, 6, 1, 4, 4, -1, 1, -1, 1, 1, 5, 0, 5, 5, 4, 1, 0, -1, 1, 5, -2, 1, -4, -5, 3, 4, 6, 5, -3, 0, 4, -1, 2, -4, -4, -3, 2, 2, -3, -1, 2, 3, 4, 3, 5, -5, -1, 1, 1, -5, 5, 5, -3, 2, -5, 1, 5, 1, -5, 4, 1, -4, -2, -2, 4, -1, -1, 6, -1, 1, 3, -2, 3, -4, 5, 4, 3, 1, 3, 3, 1, 3, 6, -2, 2, -2, -1, -1, -1, -4, 0, -2, 5, 0, -1, 5, -2, -3, -4, 4, -3, -4, -4, -1, 5, 1, 4, 4, 4, 4, 2, -3, 5, 4, 5, 3, -5, 5, 3, 5, 5, 0, 1, -5, -3, -4, -3, 3, 0, -3, 2, -1, -4, 0, -5, -4, 1, -3, 4, 1, -3, 3, 3, 5, 1, 1, 6, 4, 1, 4, 0, -1, 0, 6, 0, -2, 3, -3, -1, 1, 3, 4, -3, 1, 4, -1, 4, -3, 4, -4, 2, -1, 1, -3, 0, -4, 3, 0, -2, -4, 3, 0, 3, 5, 5, 2, 1, -2, 2, 0, 6, 1, -2, 4, 4, -2, 1, -2, 6, -2, 6, 5, -4, 3, -5, -5, 5, -2, -4, 0, 4, 4, -4, 2, -4, -1, 1, 0, -3, -3, -3, -2, 5, 0, -2, 0, -3, -4, -2, 4, -4, -2, 1, 2, 4, -3, -4, 5, 0, 4, 2, 0, 5, -3, -3, 1, 1, 5, -2, 3, -2, -3, -5, 3, 1, 5, 0, 4, 4, -2, -1, -3, 0, 3, 1, 1, -4, -3, 2, -3, -1, -4, -1, -4, 5, 2, -4, -3, 1, -3, -4, -2, -4, 0, -3, 4, 0, 3, 2, -3, -1, 2, 6, 3, 4, -2, 5, 5, -2, -2, -1, -4, 1, -1, -2, 4, 5, -5, 5, 2, 1, -3, 1, -2, -3, 2, -2, 5, -1, 0, 0, -1, -1, 5, 4, -3, 3, 2, -4, -4, 1, 5, 4, -1, -3, 5, 2, -3, 1, 1, 2, -4, 6, 1, 5, 0, 4, 2, 3, 4, 5, -4, 1, 3, -4, 2, 1, 0, 0, 3, 0, 5, -2, -2, 4, -2, 2, -1, 5, 0, 5, 4, -2, 1, -4, 0, -1, -5, 5, 1, 0, -5, 1, 0, 2, 1, -2, 2, 3, -2, -4, 2, -2, 2, -1, 4, 2, -1, 3, -5, 4, -1, 1, 3, 0, 0, -3, 5, -4, -5, -4, -1, 6, 6, 6, 4, 5, 2, 2, -5, 1, -4, 1, 3, 1, 4, 3, -2, 4, 4, 5, 5, 1, 4, -2, 1, 6, 1, 3, 1, -5, -4, -2, -3, 1, 1, -2, -2, 1, -2, 2, -2, 2, -1, 1, 5, 4, -3, 1, 4, 2, 1, 5, -3, -1, -2, 2, -3, 0, 0, 3, -4, 3, -2, 2, -4, -1, -5, -4, -1, -4, 0, 2, -1, -3, -2, 0, 0, 0, 5, 4, -3, -5, 5, 2, -3, -3, -2, -4, 3, 1, 4, -3, -2, 4, 2, 1, 4, -4, -3, 0, 0, 3, 5, 3, 1, 2, -2, -2, -3, 2, -2, -2, 3, 0, 3, 4, -5, -5, 4, 6, 4, 2, -2, 2, 0, 0, -2, 1, 4, 4, 2, 6, 1, -1, -2, -1, 0, 4, -2, -4, 4, -3, -2, 3, -1, -2, 5, -5, -2, 2, 1, -4, 3, 2, 1, 6, 3, -1, 1, -2, 1, 2, 5, -3, 4, 4, 1, -3, 4, -1, 2, -1, -3, 0, -4, 0, -1, 0, 3, -2, -2, 2, 4, 6, -5, 4, -1, -1, -1, 1, -3, -1, -3, 5, -1, 3, -4, 3, -4, 4, -1, 5, 2, -1, 4, -4, 5, 0, 4, 3, 5, -2, 4, -4, -3, -1, -1, -1, -3, -1, 3, -2, -1, 0, 4, -3, 0, -3, -3, -1, -3, 6, 4, -1, -2, -2, 2, 2, 4, -1, 5, -2, 2, 1, -4, 2, 4, 5, 5, 3, 2, -4, -1, -2, -1, -1, -3, -1, 5, 3, -4, -3, -2, -5, 2, 0, -3, 6, 2, 2, 3, -3, 1, -3, -2, 6, -1, -4, 1, 1, -4, 3, 5, 0, 4, 0, 5, -3, -4, 6, -2, 0, 1, 6, 0, -2, -4, -4, 2, 0, -3, 0, -3, -2, 2, 4, -1, -2, 0, 1, -3, -4, -2, 5, 5, -3, 3, 3, -3, -3, 3, 1, 6, 1, 5, 3, -4, 4, -2, 2, 4, 5, 4, -3, -3, 2, 0, 0, 3, 2, 3, 1, -5, 2, -4, 0, 2, 5, -2, 1, 2, 3, -2, -3, -4, -4, 2, 2, -3, 4, 1, 5, 3, 3, 3, 6, -5, -2, -1, -2, 5, 2, -3, 6, -1, 5, -1, -4, 2, -1, -3, 3, -1, -2, -5, 2, 2, 6, -1, 2, -2, -1, 4, -3, 3, -3, -2, 2, -4, 4, -2, 2, -3, -1, 3, -2, 2, 2, 2, -4, -1, 6, -2, 2, -2, -5, 2, -4, 5, 5, -2, 4, -4, 2, -1, 0, -4, -3, 6, 5, 4, 6, 5, -3, 4, -2, 1, 1, 3, -3, 0, -3, -4, -3, -1, -2, 3, 0, 3, 4, 5, 0, 4, 1, -1, 2, 4, -2, -2, 5, -1, 0, -4, -2, -2, -2, 1, -5, 3, 3, -2, 0, -4, -2, -3, -5, -3, 4, -1, -4, -1, -2, 1, 0, 4, -5, 2, 2, -4, 0, 2, -2, 4, 6, 2, 5, 6, 1, 4, 3, 4, -5, 1, -1, -5, 0, 4, -1, -3, 1, -3, -4, -4, -1, -3, -1, 4, -1, -4, 5, -1, -1, -3, -1, 6, -4, 4, 2, 2, 4, -2, 5, 2, 2, -4, 1, 5, -4, -1, 4, 2, 4, 2, 3, 2, -4, -2, -3, 0, -2, -4, 0, 4, -4, 1, 3, -3, 0, -3, -1, -2, 2, 4, -1, 0, -4, -3, -4, -4, -5, 6, -1, 3, 3, 1, -3, 3, 5, 1, 0, -1, -2, -2, 2, -3, -3, 2, 1, 5, 1, 5, 2, 1, -1, 4, 0, 3, -4, 0, -2, 4, 3, -5, -3, 3, 0, 1, 5, 3, 0, 1, -3, 0, -4, 1, -1, 5, -3, -3, 2, 1, -4, -1, 0, 2, 5, 4, 3, 6, -2, 5, -4, -4, 4, -1, -4, -2, 0, 4, 4, 0, 6, 3, 4, -4, -5, -3, 3, 5, -5, -4, -1, 2, -4, -1, 1, 0, 5, 1, 4, -3, -1, 6, 0, -1, 3, 1, 5, -4, -5, 6, 0, 4, -3, 0, -1, -2, -1, 0, -2, 0, -4, 3, 1, 2, 3, 1, 5, 2, 3, 3, -1, 4, 3, -2, 4, 2, 5, 0, -3, -2, 5, 5, 0, -1, 6, 0, -2, 0, 2, 1, 1, -1, -2, 5, -4, -2, -1, -3, 4, 0, 2, 1, -2, -4, 0, -3, -1, -2, 5, 0, -4, -5, 5, 5, 4, 4, 4, 3, 1, 0, -3, 2, -1, 6, 4, 4, -3, 3, 1, -5, -5, 2, 2, -3, -4, -2, 5, 1, -4, -3, -1, 0, -1, 4, 1, -1, -1, 5, 3, -2, -3, 3, 1, 4, -3, 0, 3, -5, -2, -3, 2, 2, -1, -2, -2, -4, 1, 1, -3, -2, 2, -5, 3, -3, 3, -1, 0, -1, -4, -1, -2, -4, 5, -3, 0, 3, -3, 6, -1, 4, -4, 5, 3, 2, 3, -2, 0, 0, 4, 4, -5, -1, 3, -2, 3, -2, 1, 2, -3, 0, -2, -5, 5, 1, -1, 3, 0, 0, 1, 6, -2, 0, 0, -3, 5, 4, -2, 6, 3, -2, -3, -5, 0, 4, 1, 0, 3, 1, -1, -4, 2, 4, 3, 3, 4, 1, 3, 1, 2, 4, -4, -2, -4, -3, 1, 1, -3, 2, 4, 3, -3, 3, 4, 0, 6, 3, 3, 0, -2, 0, 4, 2, 0, 2, -4, 3, 2, -1, 4, -3, 0, 4, -2, -3, 0, 4, -4, 2, 2, 3, -4, -2, -3, 1, -2, 3, -3, 0, 4, -4, 3, 2, -1, 5, 4, -1, -1, 2, -3, 6, 2, 1, -4, -3, 0, -4, 0, -5, -1, -2, -1, -2, 1, -3, 3, 4, -4, -2, 2, -3, 0, -1, 5, 5, -1, -2, 4, 3, -1, -3, -4, 5, -3, -1, 4, -3, 5, 4, 4, 3, 0, -4, -4, -2, -2, 0, 3, -3, 3, 0, 4, 0, -2, 0, 1, 4, 1, 4, -3, -3, 6, -3, -4, 5, -4, -1, -3, 4, -1, 1, 5, -1, 2, -2, -4, 5, 0, 4, -1, 1, -3, -1, 1, -2, -3, -4, -3, 5, -4, -2, -3, -2, 2, -4, 5, 1, 4, -2, 5, -2, 4, 3, 0, -3, -4, -3, 0, -2, 1, 2, -4, -5, 6, 1, 2, 2, 0, 4, 1, -1, 0, 2, 0, -2, -1, 3, 0, 2, -2, 4, -3, -4, 1, 2, -3, -5, -3, -3, 5, 1, 2, -2, 1, 6, -4, 5, -3, -2, 0, -1, 1, -4, -3, 5, 6, 5, 4, 0, -2, 2, 4, -1, 1, -3, -1, -3, 0, 2, 1, -4, -2, 4, 5, 4, 2, 6, 5, 0, 4, 5, -2, 3, 4, 4, 1, -4, 1, -4, 5, 3, -4, 1, -4, -4, -3, 0, 1, 0, -4, 4, 2, 4, -4, 1, 4, 1, -3, 2, 5, -4, 1, -3, 1, 4, 0, 3, -1, 5, 0, 0, 0, 3, 5, 1, 3, 4, 5, -2, -3, 1, 4, 4, 4, -1, 5, -2, -3, 0, 4, -1, 5, 3, 4, 4, 1, 5, -4, 0, 4, 4, 0, -2, 3, -3, -2, 5, -4, 0, -3, 1, -2, -3, 4, 2, 5, 0, 4, -2, 5, 0, 2, 3, -2, 2, 0, -2, 3, 4, -3, -4, 0, 1, -3, 5, 4, 0, 2, -1, 6, 5, 4, -3, -2, 2, 1, 0, -1, -2, 3, 4, -2, -4, 0, 0, 3, -2, -2, 3, -1, 1, 1, -1, 4, 4, 2, -3, -1, 4, -3, 3, -1, -3, 5, -4, 0, 3, 4, -1, -2, -3, 3, 4, 6, -4, -1, 5, -4, 3, 0, 5, 4, 4, -1, -1, 1, 6, 0, 1, -2, 1, 1, -3, 1, 3, 4, -4, 5, 5, -1, 1, 2, 1, 4, 0, 2, -2, -1, 5, -4, 0, 5, -2, 3, -2, 5, -4, 2, -3, 1, 4, 2, 2, 1, 5, 1, 2, 2, 4, -1, -1, 2, 5, -2, -4, -3, -2, 4, 0, -3, 6, 0, 2, 4, -1, -3, 5, 4, -3, -2, 5, 5, -4, -2, 0, -4, -4, -4, -1, 3, 5, 1, -2, 1, 1, 2, 5, -1, 2, 5, -1, 3, -1, 4, -4, 0, -3, -3, 2, -3, 3, 3, 1, 4, 1, 4, 0, 3, 4, 1, -3, 4, 0, 1, -2, 0, 5, 2, -5, -4, -1, -2, 4, -3, -4, 0, -5, -2, 1, -2, 2, -2, -4, -4, 4, -4, 1, -1, -2, 0, 4, 5, 4, 0, -1, -5, 0, -4, -2, 0, -3, 1, 3, -3, 2, 5, 1, -2, -4, -1, 6, -4, -2, 5, -1, 3, 1, 4, 2, 2, 0, 4, 3, 2, -3, 5, -2, -3, 3, -3, 0, 2, 6, -4, 0, 0, 4, 1, -4, -3, 5, -1, 2, -4, 1, -3, 4, -4, 2, -4, -2, 4, -2, 2, -3, 3, -1, 6, -3, 0, -4, 2, -2, -4, -3, -3, 1, 3, 1, 2, -3, 5, -2, 2, 4, 5, -3, 3, 2, -3, 2, 0, -3, -3, 1, 6, -1, 4, 2, -1, 1, -3, -4, 4, -4, 1, -2, 0, 2, 6, 3, 1, -3, -3, -4, -4, -3, 1, 1, 2, 6, -1, 0, -5, -3, 4, -2, -4, -4, 4, -5, 0, 3, 0, 1, 4, 3, -2, -4, -1, 2, -3, 0, 3, 5, 5, 1, 3, 2, -5, 1, -4, 3, -4, -4, 3, 0, 5, 3, 2, 0, -3, 5, -2, 6, -1, 6, 5, -2, -4, -1, -4, -1, 1, -3, -4, 3, 2, 2, 3, 5, 5, 2, 4, 1, 0, -3, 5, -4, 1, 2, -2, -4, -2, 2, 4, 0, 1, -3, -2, -2, -1, 3, 3, -2, 0, 3, 1, 2, 4, 3, 5, -4, 2, -4, -4, 2, 1, -1, -4, 5, 0, -3, 5, -1, 3, -3, 4, 0, -1, -5, 4, -3, 4, -3, -2, -5, -2, -2, 0, -4, 0, -1, 2, -4, 5, -4, 4, -4, -4, -1, -3, 0, 3, -5, 2, -1, -3, 4, 3, 0, -5, -2, 0, 2, 0, -2, 2, 3, -2, 1, -3, 0, -3, -5, -3, 0, -3, 3, -4, -1, 5, -3, 0, 4, 4, 0, 1, -2, -5, 2, 3, 2, 3, 6, -3, 0, 3, -3, -4, 1, 3, -2, -3, -5, 0, 6, -1, 3, 0, -2, 0, -4, 2, 2, -2, 4, 3, 4, 2, 6, -2, -5, -4, 5, -1, 0, 3, -2, 2, 1, -4, 2, 0, 4, -1, -2, 0, 3, -4, -4, -3, 1, -2, -4, 3, -3, 5, 5, -4, 1, -3, 1, -2, 4, -2, 0, 0, 4, -3, -4, 0, 6, 4, -4, 5, -3, 1, 1, 5, 3, 0, 5, -3, 2, -4, -2, -2, 1, -3, 2, -2, 2, 1, 4, 2, 1, -2, -4, -4, 0, -2, -4, 0, -1, 2, -3, 0, -5, -1, 3, 2, -3, 2, -4, 4, 5, 5, -2, -3, 1, 2, -1, 5, -4, -2, 1, -2, 5, 3, -1, -4, 4, 1, 4, 0, -3, 4, 3, 0, 0, 4, 2, 3, -1, 5, 4, 2, 3, 5, -4, -4, 0, 1, 6, 5, 2, -1, 5, 0, 4, -2, -3, -3, 5, -3, 3, -2, 5, 3, 0, -3, -3, 1, 0, 5, 4, 3, -1, 2, 3, 1, -3, -5, 0, -3, 4, -2, -4, 4, 5, 3, 2, 0, -1, 1, -1, -5, -2, 3, 1, 4, -3, 5, 2, -1, 5, 3, -4, 4, -2, 3, -3, 2, -3, 5, 1, -3, 0, 0, 3, -1, -3, 1, -3, -2, -3, 1, 0, -2, 5, 4, -1, 2, 4, 0, -3, 0, -5, -2, 4, 2, -3, -2, 5, 2, -2, 3, -4, -1, 2, 5, 0, 3, -1, -2, 0, 3, 0, 5, 3, 1, 5, 3, 3, 0, 5, 2, 2, 6, 2, 5, 2, -2, 2, -2, 1, 5, 6, -3, -1, 3, 4, 2, -1, -5, 5, -3, 5, -3, -3, 5, 1, 3, 5, 4, 5, 5, 6, -2, 4, 0, -1, -3, -1, 6, -4, -3, -3, -1, 3, 3, 4, 4, 1, 2, -4, 4, 4, 3, 4, -1, 4, 2, 3, 0, 5, -4, -3, 2, 0, 4, -3, 2, 2, 4, 0, -4, 4, 3, 3, -2, -3, 5, -3, 3, 3, -1, 5, -3, -3, -2, 3, -1, -2, 5, -3, 4, -3, -2, 4, -3, 5, 6, -2, 3, 2, -1, -4, 0, 1, -4, 4, 5, -2, 2, -1, -3, 4, -5, -3, 2, 4, 0, 1, 1, -3, 0, 0, -3, -2, -3, 1, 3, 2, 5, 1, -3, -2, 5, 3, 5, 5, 1, -2, -5, 0, 0, 2, 1, -3, -1, -4, 5, 0, 0, 1, -2, 2, -3, 5, 4, 6, 0, 1, 1, 4, -2, -4, -3, 6, -4, -3, 6, 5, -5, -5, 0, 5, 3, 3, -2, 6, -3, 2, 3, -2, 4, -1, 1, -4, -4, 5, 2, 5, 4, -4, -4, -4, -2, 4, 3, 1, -5, -5, 4, -5, -2, 3, 4, 2, -2, -4, 1, -1, 3, 1, 3, -2, 1, -1, -1, -2, 5, 4, 0, -1, -2, 4, -3, 1, -1, 5, 1, 3, -1, 2, 4, 1, 2, 4, 2, -2, 5, 3, -3, -4, -3, 0, -1, -3, -1, 3, 5, -1, 0, 5, 1, -2, 1, 6, 3, 4, 2, -1, 3, 5, -1, 3, 0, 1, 6, 3, 6, 4, 6, 3, 5, -2, 5, -1, 4, -4, -4, -4, 1, 1, 2, 3, -1, -2, 5, 4, -4, -4, 5, -2, -2, 1, 0, 4, 1, 1, 5, -1, -2, 2, 1, 3, -3, 3, -4, -4, 3, 5, -5, -3, 4, -2, -4, 2, -4, -5, -1, 5, 3, 2, -2, 1, -3, 5, 6, 3, 0, -3, 4, 3, 0, 5, -4, 3, -4, 4, -4, 3, 5, 5, 0, -4, -3, 1, 0, 5, 2, 1, 3, -3, -3, -4, -4, 0, -2, 3, 5, -3, 0, -4, -3, 5, 4, 0, -4, 6, -2, 1, -1, 6, 3, -4, -4, 3, 0, 3, -2, 5, -4, 5, -1, 2, 0, -1, -3, -4, 0, 3, 3, 0, -1, 3, 0, 2, -1, -1, -3, -1, 0, -4, 1, 1, 0, -1, 5, 2, -3, 3, 1, 5, 6, 4, 3, -2, -3, -3, -1, -4, -3, -1, -2, 2, 3, 2, -4, -5, -1, -1, -4, -5, 4, -2, -4, 1, 4, 0, 4, -4, -1, 3, 1, 3, -1, 5, -1, -1, 2, 0, -5, -3, 2, 4, -4, -1, 5, 3, 3, 1, 4, 0, -2, 0, -1, 2, 1, 5, -2, 2, 3, -2, 1, 0, 5, -3, 3, -1, 4, 5, 0, 2, 2, 0, -2, -2, -3, -2, 2, 5, 1, 6, -1, -2, -3, 0, -1, 1, 5, 2, 3, 5, -4, 5, 1, -4, 0, 4, -2, -5, -1, -5, -3, 4, 1, 3, -4, 1, -2, 3, 4, 1, 2, 6, 0, -4, 2, -3, 3, -3, -5, -4, -3, 3, 3, -5, -1, 4, 4, 5, 4, 0, 4, -1, -5, 1, 0, 2, 6, -4, 4, -1, 0, -3, 5, -1, 5, 6, 2, -2, -1, 3, -5, -2, -5, 1, -2, -1, 1, -4, 4, 2, 3, 5, -5, 3, 1, -3, -2, 0, -4, 5, -1, 4, 4, 4, 0, 1, -4, -3, 1, 3, 4, 4, 2, -3, 1, -1, 3, -2, -3, 5, -4, -5, -2, 5, 0, 1, 1, 4, 0, 5, 4, -4, -2, -1, 4, 1, 4, -4, -1, -1, 1, -2, 4, 1, 4, -1, 0, 0, -2, 0, -3, -5, -2, 3, 6, 4, -1, 4, -3, -2, -1, -3, 5, 3, -1, 4, 1, 1, -1, -2, -4, -3, -1, -4, 3, 1, -1, -3, -5, -3, 5, -2, -2, 2, 4, 2, 3, 4, 1, 1, -3, 1, 0, 5, 5, 0, 5, 0, -4, 0, 0, 5, -1, -1, -2, -2, -5, 4, 5, -3, 3, 4, 6, 3, -3, 3, 5, -2, -3, -1, 4, -1, 4, 3, 0, 3, -2, -1, 5, -5, 4, 0, -1, -4, -1, -3, 1, 3, 2, -2, -1, -4, -4, -1, -3, -4, 4, 5, -1, 2, 4, 3, -5, 0, -3, -4, -4, 4, -1, 6, 0, -3, -3, -2, 5, 3, 0, 3, -5, 0, 1, 4, -4, 4, -5, -2, 0, -3, -5, 5, -1, 0, 0, 4, -1, 4, -4, 1, -4, -5, -3, 3, 2, -4, 2, 2, -5, -4, -2, -1, 0, 1, -4, 0, 1, -2, -4, -2, -3, -1, 5, -4, 4, -2, -5, 1, 5, -3, 2, 3, 5, 4, 2, 3, 4, -4, -3, 0, -2, 3, -3, 0, 3, -5, -4, -1, 0, 6, 5, -2, 5, 1, 0, 1, -3, 5, 0, 2, 4, -2, 3, -2, -4, 2, -1, 3, -3, 4, 2, 3, 3, 0, -1, -4, 0, 1, 1, -5, -4, 5, -2, 0, 3, 4, 5, 4, -2, 1, 0, 5, 0, 4, 3, -1, 2, 0, 3, 2, 0, 0, 2, -1, -1, -1, 3, 1, 3, 1, 4, 1, 1, 3, -3, -4, 3, -3, 0, 4, 3, 3, 6, 2, 2, -1, -3, 0, -4, 3, 4, 1, 0, 4, -3, -1, -2, 4, -1, 6, -2, 5, -3, 3, 2, 0, -2, -4, 4, -3, -1, 6, -3, -2, 2, -1, -3, 2, -3, 4, -3, 3, 1, -2, 0, 0, -2, 2, 5, 0, -1, -1, 6, -4, -1, -1, 1, 2, -5, 2, -1, -5, 2, -2, 0, 0, 3, -3, -2, 3, -1, -4, 0, 2, -2, -5, -4, 0, 4, 2, 4, -5, 5, 4, -3, 2, -3, -1, 5, 4, -5, -3, 0, -3, 2, -4, -5, -5, -5, 4, 2, 5, 4, 5, 0, 5, 0, -1, 5, -1, -2, -3, -2, 4, -2, 2, 3, 4, 1, 6, 4, -2, 3, -3, 1, 0, 1, 5, 2, 2, 1, -4, -1, -3, 3, -2, -1, 4, 5, -2, -1, -2, -3, 1, -1, 4, 3, -1, 2, 0, -4, 4, 0, 0, 3, 2, 0, 3, 3, -2, 6, 4, -2, 3, 0, 5, -2, -1, 0, 5, 5, -4, -4, 1, -4, 1, -5, -3, 3, -3, 4, 2, 4, -1, 5, -3, -1, 1, -4, 6, 1, 0, 0, 2, -2, 5, 3, 0, 1, -4, 0, -4, 0, 6, 4, 1, 4, -2, -2, 1, 1, 0, 5, -4, 6, 2, -1, 5, -5, -1, -2, 2, 4, 2, 1, -2, -4, -3, 5, 5, -2, 5, 0, 1, 0, 0, 5, 3, 5, -3, 2, 4, -4, -1, 2, -3, 2, 4, -4, 2, -1, 4, 1, -1, -3, -4, 1, 0, 6, 1, -2, -1, -4, 0, 3, 0, 3, 4, -3, 2, 1, 1, 3, 6, -4, 4, -4, 0, -1, -1, 3, 2, 1, 6, -2, 0, -3, 3, 3, -1, 3, 6, -4, 3, -4, 4, 3, 3, -1, 4, -2, 1, -2, 3, 5, -3, 2, -2, 1, 4, 3, 2, -1, -1, -4, 2, 4, 5, 4, 6, 3, 3, 6, 5, -5, 2, -1, -1, 5, 1, 5, 2, -1, -4, 0, 6, -4, 0, 3, -3, -4, 5, 3, -4, 0, -4, -5, 4, 2, 2, 0, -3, 3, 3, 3, 4, 5, -1, -3, -2, -1, 2, -2, -3, 3, 3, 5, 0, -2, -5, 1, 1, 4, -1, -2, 1, 2, 1, 3, -1, 3, 2, 4, 0, 0, -2, -1, -3, 4, 4, 5, -4, 4, 5, -2, 1, 1, 3, -4, 0, 5, 1, 1, 0, 3, 2, 2, 5, 5, 1, 4, 4, 1, 4, -4, -3, 0, -1, 3, -2, 3, 0, -2, 1, -5, 3, 3, 3, -2, 3, -4, 0, 4, -3, -1, -1, -2, 1, -3, -5, -3, -5, -2, 5, -5, -4, 4, 0, 1, 0, 1, -4, -5, -4, -3, -3, 0, -4, 1, -1, -5, 2, 2, -1, -3, 0, 5, 1, -4, -4, 2, 4, -1, 4, -3, 6, 5, 3, 2, -3, 5, -4, -5, 2, -3, -5, -2, 2, -1, 3, -1, 1, 4, 2, 0, -1, 3, 2, 1, 3, -2, -4, 0, -3, -3, 3, -2, 2, -3, -1, -3, 6, -1, 5, -1, -3, 5, 6, -3, 6, -1, 0, 3, 3, -5, 1, 5, 2, -2, 2, 5, 3, 3, -2, 5, 5, 3, 3, 0, -3, 5, 5, -1, 2, 1, 5, 4, 0, -2, 1, 0, -4, 1, 5, -3, 0, 3, -5, 1, -4, 0, 3, 4, -4, 5, -2, -3, -2, 1, -2, 3, 6, -5, 1, 2, 1, -3, -3, 0, -1, -2, 2, 1, 4, 6, -1, 5, 5, -1, 0, 0, 1, 3, -1, 0, -4, 2, -2, 3, 4, 5, 0, 4, 1, -4, 5, -1, -2, 5, -1, -1, 0, 0, -3, -3, 3, 4, 3, -1, 1, 5, 6, 2, -2, 6, -1, 2, -3, 6, 6, 4, -3, -3, 3, -4, 4, -1, 1, 3, -3, 0, 2, 3, -3, -5, -5, -4, 5, -5, -1, 3, -1, 5, 6, 3, -4, -3, 5, -3, -4, -3, 1, 2, -3, 4, 1, 5, 2, 4, 6, 0, 4, 0, 0, 3, 1, -4, 6, -1, 1, 4, 4, 0, 0, -3, -2, 0, 1, -3, 4, 5, 3, 5, 0, -1, -4, 5, -4, -4, -3, 2, 0, 5, 4, 4, -2, 5, 3, 3, -2, 4, -4, -1, 2, -5, 0, -2, 0, 0, 5, 2, -2, 5, 1, 4, 2, 3, 4, 3, -2, 2, 6, 2, 5, 2, -5, -4, 1, -3, 2, 3, -2, 2, 0, 0, 1, 1, 2, -2, -2, 4, 5, -4, 4, -4, 2, 4, 1, -3, 5, 3, -3, 2, 5, 4, -4, 5, 5, 5, 4, 2, 3, -1, 4, 0, -1, -5, 1, -3, 4, 0, 5, 2, -2, -1, 4, -1, 2, 3, -1, 3, -2, -3, -3, 0, -2, -3, 3, 5, 0, 4, -3, 4, -3, -3, 1, 6, 3, -2, -4, -4, -1, 3, 3, 2, 1, -3, 3, 3, 0, 1, 4, -2, -3, 0, -3, -1, 1, -4, 2, 1, 5, -4, -2, 1, 5, 5, -3, 3, 0, -1, -1, 0, -5, -4, 3, -3, 2, 0, 4, 2, 4, 3, -4, 0, -4, -3, -1, -3, -2, 1, 3, 4, 3, -2, -1, -5, 3, -3, -3, 3, -4, 4, -2, -3, 3, 2, 1, 0, 3, 1, 1, -5, -4, -4, 4, -5, 1, -2, -1, 6, 2, 3, -4, -1, -5, 4, -2, -2, -1, 0, 4, 2, 5, -2, -1, 5, -3, -2, 1, -3, 1, -4, 5, -4, -3, -1, -4, 5, 1, -4, -1, 0, 5, 2, 1, -2, 3, 4, 2, 3, 0, 3, -1, 4, -2, 2, 5, -1, -2, 3, 2, -3, 2, 3, -3, 1, 5, 1, 0, 0, 1, 6, -1, -3, -4, 6, 6, 3, 5, 5, 4, 4, 3, -4, -2, 5, -2, 2, 5, 5, -1, 0, 0, 3, 5, 1, -4, 2, 3, -3, -3, -3, 2, 4, -4, 1, 5, 4, -4, 1, 4, -4, 5, -3, -1, -2, -1, -2, 3, -4, 2, -1, 1, 2, 0, -3, -1, 0, -5, 4, 2, 5, -2, -5, 4, 5, 2, 4, -2, 2, 5, 4, -4, 1, 1, 6, 1, -2, 3, -2, -1, 0, 0, -3, -2, -3, 3, 0, 4, 1, -1, -1, -2, 3, -3, 3, -2, 0, -1, 4, 1, -3, 4, -4, 5, 4, 3, -4, 0, 5, -4, 1, 4, 2, 3, -3, -2, 0, 0, -5, 2, -1, -4, 6, -3, -2, 0, 1, -3, 3, -3, -1, -1, -2, -2, 1, 3, 3, 4, -3, 4, 3, 6, -5, 2, 2, 4, 0, 5, 0, 0, 2, 3, 5, -1, -4, -4, 3, -4, -3, -1, -1, -4, -3, 4, -1, -1, 1, 0, -1, -4, 2, -3, -1, 2, 3, 2, 1, -1, -2, -1, 5, -3, 5, -3, -3, -3, 0, 3, 6, -2, -3, 4, 5, -4, 1, 0, 5, 4, -1, 3, 1, 5, 3, -1, -2, -2, 5, -1, 5, 4, 2, 3, 4, -5, -3, 5, 2, 2, 1, 5, 6, 5, -3, -1, -5, -2, 5, 3, 6, -5, 5, 3, 5, 5, -2, 0, 4, -3, -2, -2, 6, 0, 2, -4, -3, -2, -2, 5, -3, -2, 1, -1, 4, 1, -4, 6, -1, -2, 2, 4, -2, 4, 4, 5, 5, -4, 3, -4, -4, 3, 4, -1, -4, -2, -4, 5, 1, -4, -4, -1, -2, -3, -3, 2, 4, -1, 2, 2, -4, 2, 3, 5, 1, -4, 1, 5, 4, -4, 2, -4, -1, -4, 4, 3, 3, -3, 4, 4, -1, -1, -4, 3, 2, -4, -3, -2, -1, 0, 1, -2, 0, 0, -1, 0, -3, -4, 5, -3, -5, 3, 5, 4, -2, 3, 1, 3, 5, 3, 2, 2, 2, -2, 3, 2, -3, -3, -2, -2, 1, 5, 4, 0, -2, -1, 3, 3, 2, 3, 1, 2, -3, 3, 0, -1, -4, 3, -3, 0, -1, 1, -3, -4, 5, 2, -4, 1, -2, -3, 1, 2, -4, -4, 3, 4, -2, 0, -4, 1, 5, 1, -2, 5, 0, -2, -2, -1, -4, 0, -4, -4, -4, 3, -2, -4, 1, -5, -2, -1, 4, 4, 0, 5, -4, -4, 5, -3, -4, 5, 4, -1, -2, 4, 1, 1, -2, -1, 3, -3, 3, 0, 3, 2, -4, 5, 3, -2, -4, -2, 1, -3, 2, -2, 1, 5, -3, -4, -4, -4, -4, 3, 3, 3, -4, -2, 4, -3, 6, 5, 0, 4, -1, 1, 2, 0, 0, 0, -1, 2, 3, 3, 2, 2, 4, 1, 0, 3, -4, -4, 0, 0, -4, 4, 5, -4, 2, -2, 4, 3, 2, 0, 5, -3, -2, 0, -1, -4, -4, -4, 4, 6, 4, -3, -3, 4, 5, -4, 2, 5, 2, 4, -1, 1, -2, 1, 4, -3, 5, -3, 4, 2, 0, 1, 4, -2, 5, 4, -5, -4, -2, 2, 4, 3, 4, 0, -1, -3, 5, 3, 1, 0, 4, -2, 3, 2, 2, -3, -3, 2, -4, 3, 4, 3, 3, -3, 3, 5, 4, 6, -5, -3, -2, -3, 4, -5, -2, 2, -1, 4, -1, -3, -2, 1, 4, 0, 2, 1, 2, -3, 3, -1, 5, -3, -1, -1, 3, 2, -4, 1, -4, 5, -2, -5, 6, -4, -1, 0, 2, 1, -2, 0, -3, 2, 4, -3, 0, 1, -1, 4, 1, 4, 4, 1, -3, -1, -4, 2, -4, -4, -2, 0, 4, 4, 1, 2, 0, 3, -3, 5, 5, -4, -4, 0, 5, 4, 3, -1, 1, 4, 1, 2, 4, -4, 2, 2, 0, 1, 5, -4, -2, -2, -3, -2, -2, -2, -2, 0, -2, -5, 0, 4, -1, -4, 4, -1, -4, 2, 0, -4, -1, 1, 3, 1, -1, 0, 1, 1, 5, -1, 4, -4, -2, -3, 6, 3, 0, 5, -1, 5, 1, 4, 5, 5, -2, 1, 0, 4, 2, 3, -2, 1, 4, 6, 2, 5, -1, 6, 4, 2, 0, -1, -4, -3, 0, 3, -1, -1, 1, -3, 1, 0, 6, 3, 3, 2, -1, -4, 3, 0, -2, 5, -4, -2, 4, -3, 5, 1, 1, 4, 2, 4, -3, 3, -2, -1, 4, -2, 5, 5, -3, -2, -4, -4, -2, 3, 2, 4, 1, 4, -1, 5, -5, -4, -2, -5, 1, 5, 4, -1, 2, -5, 4, 1, 4, 6, -1, -2, 5, -4, 1, 3, -3, 2, 3, -3, -1, 4, 4, 5, -5, 0, -4, -1, 2, 0, -4, -1, -3, 6, 2, -4, -4, -4, -5, -4, -2, 1, -1, 1, -1, 2, -2, -3, -4, -1, 3, -2, 5, 3, 3, 0, 3, 6, -4, 3, 1, 1, 3, -3, 0, 4, -2, 2, -3, -4, -4, 5, 3, 5, -3, -2, 0, -2, 1, 2, 0, -4, -3, 3, -4, 1, -1, 4, 0, 5, 6, 1, 2, 3, -3, 4, -4, 2, -4, 1, -1, 6, -4, 0, -1, -3, 4, 3, -1, 3, 5, 1, -3, 2, -2, -1, 4, -3, -3, 2, 6, 4, 1, -1, 5, -1, 2, 2, -3, 4, 1, 1, -4, 2, -5, 2, -3, 0, 1, -5, 1, 5, -2, -3, -1, 3, 0, -3, -3, -4, -3, 2, 5, 5, 1, 5, 2, 4, 3, 1, 3, -3, -3, 1, -5, 1, -1, 1, -1, 1, 4, 3, 0, 5, 5, 3, 5, 4, 6, -1, 3, 1, 5, 1, 1, -4, -3, -1, 2, 5, -2, 5, 0, 5, 6, -2, -3, 0, -1, 1, -4, 0, 3, 3, -3, 3, 3, 5, 5, -1, 5, -1, 6, -4, 3, 4, 1, 6, -2, 0, -2, 1, 6, -2, 2, 3, 0, 0, 0, 5, 2, 4, -5, 5, 5, 2, 1, -4, 6, 1, -2, -2, 0, -4, -2, -2, 2, 5, 5, 5, -4, -2, -2, -1, 0, 0, -4, -3, 5, -3, 0, -1, 4, -2, 4, 2, 3, 1, 2, 1, 5, -2, 2, 0, -1, 5, -3, -2, 5, -3, 4, 0, 4, -2, 5, -1, -3, 1, -2, -2, 0, -1, 4, 5, 0, -1, -2, 4, -3, -4, -2, -1, 3, 1, 5, 5, 2, -3, 1, 0, 0, -2, -3, -3, -1, -2, -3, 2, -2, -2, -2, -4, 2, 5, 1, 4, 5, 4, 2, 2, -4, -3, 5, -4, 0, 1, -4, -3, 2, 0, 3, 2, -2, 0, 0, -5, 0, -1, -1, -3, 1, -2, -2, 5, 5, -2, 1, 4, 4, 5, 5, -1, 3, 3, 4, -2, 1, 2, 0, -4, -2, 0, 1, -3, 0, 0, 2, 5, -2, -2, 3, 4, 1, -4, 4, -4, 5, 2, 4, -2, 2, 1, 3, -3, 4, 1, -4, 6, -4, -4, 0, 1, -2, 2, 6, 2, 6, 0, -3, 2, -1, 1, 5, 2, -2, 2, 4, -3, 1, 0, 6, 1, -4, 0, 4, 1, 4, 0, 4, 1, 2, 5, -5, 4, -3, 2, 4, -3, 3, 3, 6, -4, -2, -2, 5, 0, 3, -2, 5, -4, 2, 1, 4, 4, -3, -1, 1, -4, 1, -4, -2, 4, 0, -2, -4, -1, 0, 4, 1, -3, 2, 1, 5, 4, 2, 1, -4, 2, 3, 0, 2, -4, 0, 4, 4, 3, -5, 5, 5, -3, 1, 5, 1, 3, -2, -2, -4, 6, 1, -3, 2, 2, 0, -2, -3, 2, 3, -1, 3, 0, -5, 3, 4, -5, 1, 0, 2, 3, -3, 0, -5, -2, -1, 1, 0, 4, 2, 1, 0, -2, -1, -2, -1, -5, 1, 2, 1, -2, 4, 2, 3, 0, 4, 2, 5, -2, -1, -4, -3, 0, 3, -3, -4, 6, 1, 2, 3, 5, 3, 5, 5, 2, 1, 6, -2, 3, 2, 5, -4, -1, 2, -4, 2, 2, -5, -4, -3, -2, 0, -1, 3, -1, 3, 5, -1, -2, 0, -1, 3, 6, 0, 2, 5, -2, -1, 0, 5, 2, 0, 2, -4, -3, -2, -4, -4, -2, 4, -1, -2, -3, 6, 2, 1, 2, -1, 1, 1, 5, 4, 3, 4, 0, -1, -2, -3, 0, 4, 0, 4, -3, 5, -2, 1, -4, 4, -3, 4, -1, 6, 5, 5, 1, 0, 6, -1, 2, 1, -3, 3, -3, 3, 0, 2, 4, 1, 6, -1, 3, 0, 5, 5, 3, 2, -4, 6, -4, 3, 0, 1, 3, -3, 1, 1, 0, 4, -4, -2, 3, 4, 5, -4, 3, 1, 2, 0, 1, -3, -2, -3, -2, -1, -3, -2, -4, 2, 2, -2, 5, -4, 4, 3, -2, 4, 3, 0, -4, -2, -4, -1, 3, -4, -1, 5, -2, 4, 3, -5, 5, 0, -5, -4, -1, -3, 1, 4, -2, -1, 0, 2, 1, -4, 0, 6, 5, -5, 3, -3, -1, 6, -2, 0, -1, -1, 5, -4, -2, -1, 2, 4, -3, 3, 0, 4, -2, 4, 2, -4, -3, -3, 6, -2, 0, 4, -1, -1, 0, 4, -3, 5, 0, -3, 3, -2, 2, 5, 0, 3, 2, 3, -1, 1, -2, 4, 4, 6, -4, -3, 4, -5, 0, 4, -1, 1, 1, -1, 0, 4, -2, -4, 3, 1, 2, 6, 2, 0, -3, -2, 4, 5, 5, -1, 0, 0, 5, -2, 2, 4, 6, 0, -4, 3, 3, 5, 0, 6, 1, -5, 1, 6, 5, 0, 4, 2, 0, 5, -2, 1, -4, 2, 5, -1, 1, -2, -4, 6, 4, -4, 0, 1, -3, 4, 3, 1, 1, 3, -1, 5, 2, 4, 1, 1, 5, -1, -4, -4, 5, -1, 2, 3, 5, 1, -3, -1, 1, 3, -2, 1, 1, -1, -3, -1, -3, 2, 2, -4, -2, -3, 3, 5, 0, 3, 6, 2, -3, 0, -4, 3, 3, 2, 5, 0, 0, 4, 2, -1, 1, 2, -2, -1, 0, 2, -2, -3, -2, 1, 2, 3, 2, 4, -2, 0, 2, -2, 5, 3, 3, 4, 3, -3, -1, -4, -3, 2, 5, -1, 3, 4, -3, -2, 1, 3, 2, -2, 2, 0, -1, 2, 3, 0, 0, 5, 6, -1, -2, 6, -3, 1, 5, 1, -4, 3, 5, 0, -1, 3, 3, 4, -4, 0, 5, 4, 2, 1, -1, 4, -2, 0, 4, 2, 2, -2, 4, -4, -1, 5, 4, -1, 1, 2, 1, -3, 3, 3, 3, 4, 2, -4, 4, -3, -2, -3, -4, 1, -2, 5, 4, 4, -2, 2, 5, 4, 1, -2, 2, -4, 1, 3, 0, 0, -2, 5, 6, 0, -3, -4, 3, 2, -3, 4, -4, 4, -2, 3, -5, -2, 3, -2, 1, 0, 3, 2, -2, 5, 1, 0, -3, 1, 1, -2, 1, 1, -2, 5, -2, 3, -4, -2, -2, -1, -3, 5, -2, 4, 2, 3, 3, 1, 6, -2, 4, 1, -4, 2, 4, -1, -1, 1, -1, 1, 2, 3, 1, -1, 4, -3, -1, 3, -2, 5, -2, 3, 4, 2, -2, 1, -3, -1, 5, 5, 0, 5, 1, 5, 5, 2, 4, -1, -2, 4, -1, -1, -3, 2, 4, 2, 4, -2, 4, 3, 0, 0, -2, -2, 1, 4, 4, 1, -2, -2, 5, 0, 3, -5, 5, 5, 5, -2, -1, 4, 2, 5, -3, 4, 2, 2, 2, 3, 4, 2, 4, 0, -1, 4, -4, 1, -2, 2, 1, -3, 5, 2, 1, -2, -2, 0, 3, 3, 4, 1, 0, -2, -3, -3, -2, -5, 3, 5, 5, 0, -1, -3, -1, 0, -4, -1, 0, 1, 0, -3, -2, 3, 5, 4, -1, 2, -3, 1, 4, 0, 4, -5, -3, -4, 5, -2, 2, 1, -2, 3, 4, 3, 0, 0, 2, -4, 3, -3, -1, -1, 2, 3, -2, 6, 2, 4, 5, 0, 4, -1, 1, -4, 1, -5, -4, -4, 1, 3, 4, -3, 4, -4, -2, 0, 1, -3, 4, 0, 3, -2, 5, -4, 2, 5, 2, 4, 0, -4, -2, 4, -5, 5, -1, -2, -5, -1, 1, -4, 4, -3, 0, -1, 0, -2, 3, 5, 1, 2, -2, 3, 5, 3, -4, -1, -1, -3, 0, 0, -2, 5, -2, 5, 1, 3, -3, -4, 0, -3, -5, 5, 4, -5, 3, 2, 5, 5, -2, -3, -2, 5, 4, -2, 2, -5, -3, 2, 0, -4, -5, -4, 2, 0, 3, -2, 6, 5, -2, 2, 4, 4, -2, 2, 1, -3, 1, 5, -2, 3, -3, 0, -2, -1, 3, -4, -1, -3, 3, 4, 5, 6, -3, 1, 3, 5, 3, -4, -4, -3, -3, 4, 3, -3, -3, 0, 0, -4, -4, 0, 6, 1, -3, 3, 5, 1, 3, -1, -1, -4, 6, -1, -2, 0, 6, -2, 5, -3, -1, -3, 2, -3, 4, 0, 3, -4, 2, 2, -4, -4, 4, 3, 1, -1, -1, 4, 4, 4, 5, 3, -3, -1, -3, -2, -4, -4, 1, -1, -5, 0, -2, 1, -3, 0, 5, 1, -5, 4, 4, 3, -3, 3, 1, -1, 1, 6, -2, 5, 5, 5, 4, 4, 5, 5, 1, 4, 0, -4, 4, 4, 3, 2, -3, 3, 1, -2, 1, 5, -4, -5, -3, 4, 1, 2, -1, -3, -3, 3, 2, 2, 2, -2, 1, 0, -5, 1, -2, 2, -1, 1, 1, 5, -4, 5, -2, 3, -5, 4, 6, 1, 1, 4, 4, 3, 6, 2, -3, -4, 1, 1, 5, 3, -5, -2, 3, -5, 0, 0, -4, 0, 3, 6, 1, -2, 3, -2, 3, -1, -3, 4, -3, 0, -1, 0, 1, -3, -3, -1, 0, -2, 6, 3, 5, 0, 3, 3, 4, -3, 1, 4, 2, -5, -2, -2, -1, 0, -4, -1, 3, -3, 1, -3, 2, 0, -3, -4, 1, 3, -2, 2, -5, 0, 0, -1, -3, -2, 4, 6, 3, 4, 4, 3, 3, 1, 3, 3, 1, 3, -4, 3, -4, -3, 1, -2, 2, 1, -3, -4, -3, -3, 4, -2, 1, -4, -2, 2, 0, 3, -4, 0, 3, 6, -3, -2, 2, -3, 0, 6, 1, -3, 3, 1, 3, 4, -3, 2, 1, 1, 0, 4, 1, -1, 2, 3, -4, 0, -4, 2, 6, -4, 5, -4, -4, 3, -2, 5, -5, 6, -1, 1, 2, 5, -4, 4, 0, -4, 3, 1, -3, 0, 1, 3, 3, -3, 3, 1, -2, -2, 0, -3, -3, -5, -3, -2, -2, 3, 6, 5, -1, 6, -1, -3, 5, 0, 5, 5, 2, 5, -5, -5, -3, -2, 5, 2, 4, -3, 4, 2, -2, 3, 4, 3, 2, 2, 1, 1, 0, 5, 1, -4, 1, -4, -4, -2, -1, 2, 2, -3, -2, -2, 0, -1, 4, 0, -3, 4, 4, -4, 1, 0, 5, -2, -2, -4, 2, 2, 4, -4, 4, -4, 1, 0, 6, 5, 3, 5, 0, -2, 2, -1, -1, -2, 2, 0, 3, 0, 6, 2, -3, 5, 0, 5, 4, -2, 3, 5, 5, 0, 3, 4, 3, -3, 5, 0, -3, -4, 4, 0, 0, -4, -5, -4, -4, 1, 2, -2, 1, -3, 0, 1, 0, -5, 3, 5, 3, -3, -1, -3, -1, -4, 4, -1, -1, -4, 2, 5, 5, 4, 4, -5, 3, 4, -4, 2, 5, -2, 3, 4, -1, 3, 4, 4, -3, 2, -2, 1, 0, -3, -5, 2, -3, 3, 6, 6, 6, -4, -2, 2, 4, 5, -4, -2, 3, 4, -2, 1, 1, -4, 0, 1, 2, -1, -2, 2, 5, -2, 4, 1, 2, 1, -1, -2, 4, 0, 3, 1, -4, 4, -3, 4, -1, 0, 5, -3, 5, -1, 4, 4, -1, 1, 0, 0, 2, 3, -1, 4, -1, 4, 3, -1, 3, 5, 4, -2, 4, 4, -4, -5, -5, -4, -2, -4, 1, -3, 3, 2, 0, -4, 0, 2, -1, 1, -1, -5, -1, -3, 1, 0, -1, -1, 5, 0, 6, 3, 0, -3, 0, -3, -2, 4, 5, -4, 2, 0, -4, 6, 0, 0, 6, 0, -3, 1, 4, 3, -4, 3, 3, 1, 0, 4, 2, -4, 3, 0, -4, 1, -1, 5, -3, 5, -1, 3, 1, 0, -4, 0, -2, 3, 1, 5, 0, -4, 2, 2, -1, -3, 3, 4, -5, -4, 1, 2, -4, 2, -3, -3, 1, 1, 0, 4, 6, 2, -3, 4, -4, 2, 5, -2, 5, -3, 1, 1, -1, 4, 3, -1, 3, -4, 2, 6, 5, -4, -5, 2, -2, -5, 4, 3, 2, 5, 2, -1, -3, 1, -4, 3, -1, 0, -4, 2, -2, -1, -2, -1, 5, -3, 6, -3, 2, -2, -1, -1, 2, -2, -2, 3, -1, 0, 3, 5, 0, 1, 3, 4, -4, 3, -2, -1, -1, 3, 1, 1, 5, 0, 2, 2, -2, -4, -3, 4, 4, -2, -4, 0, 3, -2, -5, -1, -4, 4, 3, -3, -2, 3, -3, 4, 1, 4, -1, 0, 0, -2, 2, 3, -2, 3, 2, 4, -3, 6, 2, -4, 0, -1, -3, 2, -1, 4, 5, -3, -4, 2, -1, 3, 4, -5, 3, -2, 0, 4, -4, 1, -5, -5, -2, 3, 6, 2, -3, 3, -2, -3, 1, 5, 1, -5, 3, 1, 0, 1, 2, 5, -1, 2, 0, -4, -1, 0, -1, -3, 2, 5, 4, -3, 0, 0, -3, 3, -3, 3, 0, -3, -1, 3, -3, -1, -4, 4, 0, 1, 6, 2, -4, -4, 5, -4, 4, -4, -1, -1, -4, -1, 2, -3, 2, 4, 0, -2, 4, 3, -2, 4, 3, -1, 5, -4, -1, 4, -3, 4, 2, 2, 5, 4, -4, 3, -5, -4, -2, 2, 5, 4, -5, 3, 5, -1, 5, -4, 0, 4, 5, -5, -4, 2, 2, 3, 1, -4, 2, 0, 3, -4, -4, 2, 4, -4, 5, 2, -1, -2, -1, -1, 5, 0, 1, 1, 5, 1, 5, 0, 0, -2, -2, 2, -1, 5, 0, 3, 3, 2, 4, 5, -1, 0, 0, 1, -2, -1, -4, -1, 6, -2, 0, 4, 1, 4, 0, -4, 2, 0, -5, 2, 2, -4, -4, 5, -2, 5, 4, 2, 0, -1, 1, 1, 3, 6, -4, -4, 2, 6, -3, 5, 6, -1, 3, -1, -3, -2, 2, 0, 5, -1, -5, 4, -2, -4, 4, -4, 5, 4, 0, 6, 2, 5, 1, -1, 3, -1, -2, -4, 6, -3, -5, 0, 1, 3, -1, 5, -4, 2, 4, -2, 1, -3, -4, -3, -4, 0, 5, 3, 3, 2, -5, 5, 1, 1, 2, 5, 0, 3, 2, 6, 3, -2, 5, 0, -5, -1, 2, 1, 4, 2, 5, 0, -4, -2, -4, -1, 5, 5, -5, 2, -3, -1, 4, 6, 5, 4, -3, 2, 0, 0, 4, -4, 1, 2, 0, 1, -3, 3, -3, 5, 1, 3, 5, -3, 5, 3, 2, 4, -1, -3, -4, 0, 3, 1, -2, 2, 2, 5, -4, 5, 2, -4, -1, -1, 4, -5, 1, 2, -4, 0, -3, 4, 5, 3, 5, 4, 5, -3, 3, 0, 4, 4, 3, 1, -2, 2, 2, 0, 0, -1, 0, -4, 2, -4, 1, 0, 6, -3, -1, 0, 1, -4, 0, 4, 3, 0, 5, 0, 3, 0, 3, 5, 3, -1, 4, 5, 1, -2, 6, 0, 5, -1, 2, 2, 4, -5, 1, -2, 4, 5, 4, 1, 1, 5, 2, 5, 3, 0, -3, 5, 5, -1, -1, 0, 5, -1, 3, -2, 0, 4, -2, 4, -4, 5, -1, -1, 3, 1, 5, -3, -4, 1, 1, 0, -1, 0, 1, -4, 0, -1, 3, 2, 0, 0, 5, 1, 2, 2, -2, 2, 3, -4, 3, 5, -2, -2, 4, 5, -2, -3, -3, 5, -4, 1, 0, 4, 4, -2, -5, -2, 2, -2, 3, -4, 4, -4, 3, 5, -2, 0, 5, -1, -1, -2, 4, -3, 4, 2, 2, 4, 1, 1, -2, -2, 3, 2, 3, 4, -1, -4, 4, 2, -3, 4, -4, 3, -2, -3, -2, 0, 3, 3, 5, -1, 2, 4, 0, 0, 1, 2, 6, 3, -3, 2, 5, -1, -4, 0, 4, -3, 0, 2, 0, 1, 5, 0, 3, -4, 0, 0, -4, -3, -3, 4, 3, -4, -3, 5, -5, -2, -3, -4, -2, -2, 0, 2, 5, 3, 6, -2, -3, -2, -3, 4, 4, -4, 6, 3, -2, 5, -3, 2, 2, 2, 0, 3, -1, -2, 5, 2, -4, -3, 6, 5, -1, 0, -3, 0, -1, -4, 4, -1, -4, -1, 5, -2, -4, 0, -4, 2, 0, 5, -1, -1, 4, -1, 0, 0, 0, -1, 3, -1, 6, -4, 4, 5, -3, 6, 4, -3, 5, 0, 2, -4, -4, -4, 1, 1, -1, -2, 0, 2, 1, -4, 3, -4, -2, 2, 3, 6, -2, 5, 5, -2, 5, 4, 3, -3, -4, -3, 6, 3, -1, 5, 0, -3, 1, -3, 4, -4, -3, -4, 1, 4, 4, -1, 0, 0, 3, 1, -4, 3, 3, -2, 4, -3, -1, -5, -3, 3, -3, -2, -3, 1, 3, 4, -4, 3, 0, 3, -1, -2, 4, 1, -1, 5, -3, 2, -5, -4, -1, 1, -3, -3, 0, -4, -4, 4, -1, -3, -4, -4, -1, -1, 5, 0, 5, -1, 5, 5, 1, -1, 4, -5, 1, 0, -2, 1, -2, 1, 3, -1, 5, -1, -1, 4, -1, -4, -1, -5, -2, -3, 5, -5, 5, 4, -1, -3, 6, 2, -1, -4, 3, 0, 4, 0, 5, 0, -2, 4, -3, -2, 3, -4, -3, 5, -3, 6, 4, 1, -3, -3, 0, 4, -3, 4, -2, 4, 4, 6, -4, -2, -3, -4, -2, 4, -3, -3, 4, 5, 5, 1, -3, 6, 3, 0, 0, -4, -1, 3, 2, -1, 4, 0, 4, 2, -4, -1, -5, 1, -4, 3, 6, -5, -3, 6, -2, 2, -3, 1, -4, -4, 0, 0, 2, -2, -1, -1, -1, 6, 2, 0, -1, -2, 0, -3, 1, -5, 0, -2, 0, 1, 3, 5, 3, 5, -1, -4, -5, -2, 3, 2, -1, -1, 3, -4, 1, 2, -2, 4, 3, 4, -3, 4, -1, 4, 3, 5, -1, 3, 3, 2, 4, 0, 1, 2, 1, -2, 3, -4, 4, -1, -1, 5, 3, 4, -1, 4, 0, 4, 6, 1, 1, 2, -4, 0, -3, 2, 5, 4, -3, 1, 6, -3, 0, 0, 1, 3, 0, -4, 4, -3, 1, 5, -1, 1, 5, 5, -3, 5, 0, -5, 5, 2, -3, 1, 3, -4, 3, 5, 0, 4, 2, 4, 1, -5, 3, 0, -5, -3, -1, 5, 0, 3, 0, -2, -3, 6, 1, -2, -3, 0, 0, 2, 3, 3, 4, 4, 0, -4, -1, 5, -1, 0, 1, 2, 4, 4, 5, -1, -3, -4, 1, -3, 4, 4, 1, 4, -4, -1, 3, -2, -1, 1, 5, -2, 3, -5, -1, 1, -2, 5, 3, 1, 4, -2, 5, 3, 1, 6, -1, 5, 3, 4, 1, -4, 5, 3, -1, 3, 5, 5, -2, -1, 4, -5, 1, -4, -3, 0, 2, 3, 5, -2, 3, 2, -3, -3, 5, -2, -1, 1, 0, -1, 3, -4, 2, 5, 1, -5, 2, -1, 1, 3, -5, -4, -1, 4, -3, 3, -3, 3, 1, 3, 3, 3, 0, 0, 3, 5, 0, -2, 5, 0, 4, 5, 2, 0, 6, 1, -4, 0, 6, -4, -2, 3, 4, -3, -3, -4, -4, -4, -2, 3, -3, 2, 4, 0, 6, 5, -4, 4, -1, 2, -4, 0, 5, 6, 5, -3, 1, 2, -2, -2, -2, 5, 1, -2, 1, -5, -2, 1, 0, 5, 4, -1, -4, 1, 1, 1, 1, -4, 4, -1, 1, -2, -4, 0, 0, 1, 3, 2, -3, 1, 4, 2, 5, 5, 5, -2, -2, 5, 2, -4, 1, 1, 3, -1, 5, -5, -3, 2, 0, 5, 0, -3, 1, -3, 3, 0, 1, 4, 0, 5, 5, 6, -4, -4, -5, 0, 4, 3, 2, 2, 0, 2, -3, -1, -5, -3, 5, 0, 5, 0, -4, -2, 4, -2, 5, 4, 1, 0, 1, 5, 2, 3, 4, -2, 6, 4, -4, -1, 3, 4, 4, 6, -4, 6, 1, 0, -4, 1, 2, -2, 4, 5, 5, 2, 1, -3, 3, -5, 4, -1, -3, 4, -4, 4, 4, -2, -1, 0, 4, -1, 4, -1, 2, 0, -1, -5, -2, -2, -1, 1, -2, 1, -4, 1, 4, -3, 3, 6, -2, -3, 5, -1, 5, 2, 1, 1, -1, 1, 4, -4, 2, -5, -2, 0, 1, -3, 0, 4, -2, 0, -5, -2, -1, 1, -2, 4, -4, -1, -1, -4, -2, -2, 1, 3, 3, -1, -4, -3, -1, 2, -1, -3, 4, -4, 6, 0, -5, 6, -4, 0, 5, 5, 4, 4, 5, -3, -3, -3, -4, 0, -1, -1, -3, -4, 1, 1, 4, 5, 0, 1, 4, -1, 0, -2, -2, 0, -2, 0, -4, -1, -4, 5, -4, 0, 0, -1, 0, -4, -5, -1, 1, 6, 2, 3, 1, 2, -1, 5, -1, 4, -2, 5, 2, -3, -4, 5, -4, 0, -1, 3, 2, 0, -4, 4, 1, 3, 3, 2, -2, 1, 3, 3, -5, 3, 0, 5, 4, 3, 3, -2, 4, -2, -2, 4, 0, 3, -1, 6, -5, 5, 3, 5, 1, 3, 4, 3, 5, 5, -3, -2, -2, -3, -5, 0, 4, 2, 3, -2, 0, 3, 1, 0, -3, 0, 3, 6, 4, -3, 3, 6, 0, -4, -3, 4, 4, -4, 3, 1, 3, 1, 3, 5, 0, -4, -1, -3, 2, 1, -4, -4, 5, -4, 2, 0, -4, 0, 4, -1, 1, 4, -1, -4, -3, -3, 4, 5, -1, 6, 3, -3, -4, 5, 0, -1, 5, -3, -4, 5, 2, -2, 2, 6, 0, 1, 6, 1, 1, -5, 0, 4, 3, 4, 4, 4, 0, 2, 2, -2, 6, 2, -2, -2, -2, -3, -1, 4, 2, 2, 4, 4, 1, 4, 3, -2, 4, 0, 4, 3, 6, -1, -1, 3, -4, -4, 4, 2, 3, -2, -4, 0, 2, 0, 5, 5, -4, 5, 3, -4, 3, 4, -5, 2, -2, 1, 2, 5, -3, -1, 1, 5, 1, 0, 4, -1, 6, -2, 0, 0, 2, 5, 2, -5, 1, 2, 1, 2, 5, -4, 1, 0, 4, 4, -4, 0, 5, -5, 4, 2, 4, -5, 0, 2, 1, -4, 3, -4, -3, -4, 3, 5, 4, -2, 1, 0, -1, 4, -1, 1, 3, -5, -2, 5, 4, 4, 2, 6, 0, -5, 6, 5, 1, 4, -3, -4, 3, 4, -3, 4, 5, 2, 1, 1, -2, 1, 4, -1, -2, 1, -3, 4, -4, 4, 3, 0, 3, -2, -4, 6, 1, 4, -3, 0, -3, -3, 0, -1, 3, 0, -4, 1, 1, 5, 1, -5, 5, -2, 6, -1, 1, 2, 1, -1, -2, 2, -3, 5, -4, -5, 1, 2, 2, 2, 0, -2, -2, -2, 1, 4, 0, 4, 4, 5, 5, -1, 2, 2, 0, 5, -3, -3, -3, 1, 0, 5, 3, 4, 0, 6, -3, 4, 5, -3, -3, -3, 3, -3, 2, 4, 3, -2, -1, 0, 2, -2, 5, 4, -4, 4, 3, -2, 4, 5, 1, 5, 5, -2, -2, -1, -1, -2, 1, 0, -4, -5, -1, 0, 1, 0, -4, 4, -4, -3, -2, 5, -1, 0, 5, -3, 1, 0, 3, -1, -2, 4, -5, -2, 0, 4, 1, 0, 2, 3, -1, -4, 0, -2, 5, -4, 0, -5, 0, 3, 1, 2, -2, -1, -1, 5, -4, -3, 1, 4, 2, -2, -4, 4, -4, 0, -1, -2, 5, 5, 2, 1, 2, 5, 3, -2, -3, 2, -1, -1, 0, 5, 5, -3, 5, -3, 5, 2, -2, 3, 2, 4, -3, 5, 2, -1, -4, 4, -2, 5, -3, -2, -2, 1, -4, 0, 4, -1, 3, -4, 0, -2, 3, -4, 6, -3, 4, -4, -2, 0, 4, -4, 3, -2, 0, 3, 6, -3, -2, 3, 0, -3, -4, -5, 4, 2, -2, -1, 1, -4, -1, 1, -2, -1, 5, 6, 3, -3, 0, 1, 3, -4, 0, 5, -4, -3, -3, -2, 2, 0, 4, 2, -3, 5, 1, 3, 6, -3, -3, 6, 5, -2, 2, 1, 5, 1, 4, -3, 1, 1, -4, -4, -4, 3, 1, 0, 4, -1, -2, -3, -4, 3, 1, -3, -2, -2, 1, -2, -5, 2, 0, -4, 6, 3, -4, 1, -2, -1, 3, 4, 1, -4, -2, 0, 2, 3, 3, -2, 5, 3, -1, -4, 5, 1, -2, 0, 4, 5, 2, -3, -4, 3, 3, 5, 0, -4, 3, 5, 3, 0, -2, -3, 4, -3, -1, 1, -3, -5, 6, 2, 6, 2, 1, 5, 1, -1, -2, 4, 2, 4, -2, 3, -2, 3, 5, -1, 2, -4, -4, -5, -3, 2, -2, 1, 1, 1, 5, -2, 4, -4, 0, -4, 3, -1, 2, -1, -2, 2, 0, 0, -3, -1, -4, 6, 1, -2, 5, 4, 1, 1, -5, -2, -1, -1, 2, 5, 5, 2, 5, -1, 0, 2, -3, -1, -4, 5, -1, -4, -4, -2, 6, 2, 1, -4, 0, 5, 4, 1, 5, -1, 2, -4, 2, -3, 2, -5, 5, -3, -4, 1, 3, -1, 2, 2, -3, 0, 6, 2, -3, 4, -2, 5, -2, -3, 0, 5, 3, -4, 6, 1, -1, -3, 1, 0, 2, -3, 5, 0, 1, -3, -2, 3, 4, -1, 3, 4, -2, 1, 3, 0, 0, 1, -4, 2, -3, 0, -4, -4, 4, 0, -2, -1, -5, -1, 0, -4, -1, 4, 4, 4, 1, -3, -3, 0, 0, -4, -4, 0, 4, -5, -2, 4, -3, -3, 5, 2, 4, -2, -1, 1, -3, 5, -4, 1, 5, -1, -1, -2, 1, 2, -4, 2, -4, -3, 1, -2, 0, 4, 4, -2, 0, 5, 1, -3, -4, -4, 1, 5, 1, 2, 5, 2, 1, -1, -4, 0, 2, 4, 6, -3, -3, -3, 5, 2, 6, 5, -4, 4, 4, 4, 2, 2, 5, -2, -1, 0, -1, 3, -2, 2, -3, 4, 6, 0, 4, -2, 2, 3, 4, -1, 5, 0, 5, 0, -2, -1, 0, -3, 0, -3, 1, 2, 3, 0, -4, 1, 1, -3, -3, 1, -3, -4, 5, 5, 1, 6, 0, -1, -1, -5, -3, -4, -4, -4, -1, 5, 2, 0, -2, 4, 2, -5, 2, -2, 5, 5, -4, 6, 0, 5, 4, 2, 2, 1, 5, -1, 3, 1, 1, 2, -1, -5, -3, 6, 4, -1, 3, -4, 5, 4, 3, 2, 4, -1, -4, 1, -5, -3, 1, -2, 5, -4, -4, 1, 4, -3, 0, 5, 1, 3, -1, 5, 5, -1, 1, 3, 3, -1, -2, 0, -3, -2, -2, -2, 1, 1, 0, 1, -3, 2, -3, -3, 4, 4, 0, -2, -5, 1, -2, -4, 6, -1, 4, -3, 4, 3, 3, 1, 2, -1, 1, -4, -5, -2, 0, -4, -3, -4, -3, -2, -4, -3, -3, 5, -1, -4, -3, 5, 6, 4, -4, 1, 2, -4, -4, -3, 0, 3, -1, -5, 2, -4, 4, 4, -4, 2, 5, 5, 2, 5, -4, -3, 1, -3, -4, 4, 1, 3, -2, -5, 5, -3, 2, -1, 2, -4, 5, 3, -1, 3, 0, -4, 5, -4, 0, -4, 5, 5, -5, 0, 4, -2, 4, -2, 1, 4, 6, 1, -4, 1, -4, 1, -4, 0, 5, -5, 4, 0, 3, 4, -4, -2, -4, 2, 4, -3, -2, -4, 2, 4, -4, 2, -2, -3, 4, 3, 1, 2, -1, -1, 2, 5, 1, -3, 5, -1, -3, 5, -1, 1, 2, 4, -1, -3, -5, -4, -2, -2, 5, 5, 5, -1, 5, 0, -2, 3, 5, 3, 5, -3, 2, 4, 5, 0, -4, -2, 5, -2, -4, 2, -2, -2, -2, -2, 2, -1, 6, -1, -5, 3, 5, 3, -3, 2, 4, -4, -2, 5, 2, 2, 4, -3, -5, 4, -1, 1, 6, 2, 0, -4, -4, 2, -2, -3, 3, -5, 4, -1, -4, 4, 1, 4, 0, -4, 5, -3, 2, 3, -2, 3, 3, -2, 4, 5, -1, 4, 1, -3, -4, 4, 3, 5, 4, 5, -2, -1, -3, -4, -4, -2, 2, -4, 3, 3, -3, 4, -4, 0, -3, 1, -2, 3, 2, -2, -2, 0, -1, -3, -1, -1, 5, 6, 1, -3, -1, 5, -5, 6, 3, 4, -1, -1, 6, -4, 5, -4, 5, -2, -1, 4, 3, 2, 4, 3, -5, 2, -4, 2, -3, -3, -2, -1, 4, 0, -1, 1, -2, 5, 5, 4, 1, 1, -2, 3, -2, -3, 5, 4, 1, -1, 1, 1, 5, -4, -4, 4, 4, 1, 0, 0, 2, -2, 2, -2, -4, 2, -2, -4, 6, -4, 0, 2, 1, 4, 0, 2, -1, -5, 2, -2, 3, 0, 1, 4, 2, 5, 6, 1, -3, 0, 5, 5, 6, -2, 1, -4, -2, 2, 4, 2, 3, 6, 3, -1, -2, 1, -2, 0, 6, 5, 0, 5, 2, -1, 2, 2, -1, 0, 0, -4, 4, 1, -4, 1, 5, 2, -3, -2, -4, 3, -3, 4, 2, 1, 0, 2, -4, -2, -2, 1, 1, 3, -1, -4, 0, -1, 4, 2, 4, -3, 3, 2, 3, -1, -4, -3, -2, -3, 5, -2, -2, -2, -2, 6, 1, 3, 0, 5, 5, -4, 0, -3, 5, -4, -3, -2, 6, 3, -2, 3, -1, 1, -2, -3, 0, -3, 1, 4, 1, -3, 3, 4, 2, 6, -4, 1, -3, 5, 5, 3, 5, -5, -1, 2, -3, -3, 2, 1, -4, -1, 1, 4, 2, 0, -3, 6, 4, 4, 6, -3, 1, 1, 5, 0, 0, -4, 2, 0, 2, 1, 1, 0, -1, -2, 3, 4, 6, 3, -2, 1, 5, 5, -4, 5, -4, 5, 4, 0, -2, 3, -4, 5, 5, 4, -3, 4, 1, 0, -3, 5, 0, 4, -5, -1, -1, 4, -1, -2, 1, -2, -2, 3, 2, 6, 1, 3, 3, 3, -1, 0, 4, -2, -4, 3, 2, 4, 2, -1, 2, 5, -1, -1, -1, -2, -4, 0, -2, 0, -3, 5, 5, -2, -2, -2, -4, 4, 3, -4, 2, -5, -2, -3, 2, -4, 1, -1, -1, -2, -2, 2, 5, -3, 4, 2, 6, -5, -1, -4, -5, 4, -2, -4, 3, 2, 0, -3, -2, -3, -4, 3, 0, -1, 3, 0, -2, -5, -4, -5, -3, -3, 5, 3, 1, 4, -3, 2, -3, 3, 1, 3, -2, -5, 5, 3, 0, -4, 5, -4, 6, 0, 3, 0, -2, 1, -2, 4, -1, -3, 4, -2, -2, 3, 4, 5, -1, -3, 3, 2, 4, 0, 2, 1, 4, -3, 1, 2, 4, 1, -1, -1, 1, -4, 1, -4, -3, 5, 2, 5, -4, -4, 2, -5, 3, 2, 1, -4, -3, 1, -2, -5, -3, 3, 0, 1, 3, 1, 5, 0, 1, 3, 5, 4, -3, 5, -1, -2, -3, -1, -4, -1, -4, 4, 2, 0, 4, -1, -3, -3, -2, -1, -3, -3, 2, -1, -2, 3, -3, 1, -2, -2, 1, -3, -3, 1, 0, 2, 1, -3, -4, 2, -4, 0, -2, 1, -2, -4, 4, 2, -1, -1, 0, -3, -2, -1, 5, -1, 2, -1, -2, 3, 2, 2, 4, 1, -3, 1, 4, -3, 3, 0, 2, -1, 0, -4, -1, 4, 4, 5, 0, -1, 1, -2, 0, 5, 0, 2, 0, 5, -1, 3, 2, 0, -1, -4, -3, 1, 2, 3, -3, 4, -1, -4, -3, 0, 0, -3, -2, 2, 2, 5, 0, -1, 4, 1, -4, -2, -3, 0, 1, 3, 0, 5, -1, 4, 0, 2, 4, 3, 3, -4, 1, 1, -1, 6, 1, 1, -1, -1, 1, 2, 6, 5, 5, -2, -4, 0, -3, 2, -2, -2, 5, 3, 5, -2, -2, -2, 5, 4, -1, 3, 3, 3, 5, -2, -1, -2, 4, -3, 6, -1, 0, -2, 5, 0, -3, 2, 2, -2, 0, -4, 4, -1, 6, 3, 4, -4, -4, 1, 2, -1, 6, 4, -4, -5, 5, -1, 3, 5, 2, -4, 5, 5, 2, -5, -5, -4, 5, -2, -2, -2, 3, 2, 1, -5, -2, -1, -1, -4, 1, 3, -4, 2, 0, 4, 3, -4, -2, -3, 0, -1, 3, 5, 4, -4, -3, 1, 5, 5, 0, 1, 0, 0, -2, 2, 1, -1, 4, 0, -2, 4, -2, -3, 5, -2, -1, 6, -1, -2, 5, 3, 0, -1, 5, 2, 3, 3, 5, 6, -2, 4, -5, 2, 2, 5, 3, -4, 4, -2, 4, -2, 0, 0, -4, -1, -2, -1, 0, 2, 1, 5, 5, -2, 3, 0, 1, -2, -4, -2, 0, -3, -3, 1, -4, 3, -4, -1, -1, 5, -1, 3, -3, -4, -4, -2, -2, 3, 0, -3, 6, 3, -3, 2, -4, 3, 2, 5, 6, -3, 3, -4, 0, 0, -3, 3, -1, 5, 1, -5, -2, -1, -1, -2, -1, 3, -3, -3, -3, 4, -3, 3, -4, 0, -2, 0, -2, 0, -3, 2, -5, -4, -1, 5, 0, 5, 5, -1, 3, 4, 1, -3, 0, -4, 4, -1, 1, 6, 0, -4, -1, 0, -1, 0, 5, -5, -3, 1, -3, 5, 0, -3, -1, 1, -4, 3, 4, -2, 2, 5, -4, 2, -4, 5, -3, 1, -1, -5, 0, 1, -4, -3, -1, 5, -4, 3, 4, 6, 1, 5, 4, 0, 6, 2, -1, 0, -3, 5, -4, 3, 3, 3, 0, -3, -3, -1, -3, 0, 0, -4, 3, 6, -4, 4, 3, 4, 1, 5, 1, -1, 1, -1, 3, -4, -3, -2, 0, 6, -1, -1, -1, 0, 4, 1, -4, 3, 5, -4, 5, 4, -4, 6, 1, -4, 6, 4, 3, 1, 0, -2, 4, 3, 2, -5, -2, 5, 6, 5, 6, 2, 2, 5, 3, 0, 0, -3, -2, 5, 5, 0, 1, -1, -3, 6, 3, 5, 2, -1, 5, 3, 3, 5, -4, 5, 1, 4, 6, 6, 0, 1, 4, 5, -1, 0, 5, 6, -3, -3, 1, -3, -2, -3, 3, 5, -2, -3, 3, -1, 3, -4, 1, 6, -3, 2, 3, -4, 3, 6, 5, -1, 1, 1, 1, 2, 0, 4, 4, -2, 0, -1, 4, 0, 3, -2, 1, -4, -4, 1, 0, -5, 5, 6, 3, -3, -2, 2, 4, -3, 2, -3, -3, -4, -4, -1, -1, 1, 4, -3, -1, -3, -1, 3, 2, -3, 5, 2, 1, -3, -2, 1, 4, 3, 5, -4, 3, 1, -4, -2, -3, -4, 1, 5, -2, -4, 1, -3, -5, 4, 1, 5, -3, -1, 1, 4, 5, 1, -4, -2, 6, 3, -4, -5, 5, -1, -1, -2, 1, 0, -2, 5, 4, -4, -4, 4, 0, 0, 0, 2, 3, -2, 4, 5, 5, 4, 3, 2, 5, 4, 1, 3, 1, 5, 0, 2, 0, 5, -4, -1, -3, 1, -5, 2, 0, 2, 0, 4, -1, -3, 1, 5, -2, 4, 5, -3, 4, 6, 3, 3, -4, 3, -3, -5, -5, 4, 5, 1, 3, 5, -1, 3, 5, 2, -1, 5, -1, 6, 2, -2, -2, 2, 4, -3, -1, -5, 2, 5, 5, -4, 4, 6, -2, 0, -1, -2, 4, 5, 3, -1, 5, -2, -2, -1, 0, 4, -2, 2, 4, 5, -2, -4, -1, -2, -2, -4, -2, 4, -2, -2, -4, 0, -1, -3, 2, -3, 4, 6, 0, 0, 4, -1, -1, 0, 3, 0, 0, -4, -1, -2, -5, -1, -4, 4, -1, -3, -2, -2, -2, -3, 6, 0, 2, 1, 5, 3, -4, 3, 1, -3, -2, 2, 5, -2, 4, 5, 4, 2, -2, 5, 4, -3, -5, -3, 0, -3, 1, -1, 0, -2, -4, -2, -1, 1, 1, -2, 2, -3, 0, 2, 4, -1, 3, 5, 0, 3, -3, -5, 5, 4, 5, 5, 5, 6, 0, -1, -3, 2, -5, 4, -4, 4, 2, -1, 1, -2, 3, -4, -2, 4, -4, 4, -2, 5, 2, 2, 5, 6, 1, 0, -5, -3, -1, -2, -1, -3, -5, 2, -2, 5, -4, 0, -1, 3, 4, 0, -2, -4, -2, -2, 5, 5, 3, 5, 1, 1, 2, 6, -1, 2, 4, 5, 5, 0, 5, 2, 5, 5, -2, -2, -4, 1, -4, 5, 6, 2, -1, 2, 4, 3, 2, -1, 0, -1, -3, 4, -1, -2, 4, -2, -1, -2, 4, 6, 1, -3, 5, -1, 5, 3, 0, 1, 1, -2, 2, -5, 4, -5, 5, -1, -2, 6, 4, 4, 3, -3, 5, -3, -4, 3, -4, -2, 5, -4, 5, -3, 5, -2, -4, -4, 0, 2, -2, -2, -1, 1, 4, -1, -3, 1, 2, 5, -1, -1, 4, -5, 1, 6, 6, -3, -2, 0, -3, 0, 3, 6, -3, 3, -2, 0, 6, -1, -3, 0, -3, 4, 0, 5, -1, 6, -4, 5, -3, 2, 4, 4, 3, 1, 1, 2, -4, -4, -2, -1, 3, 3, -2, 2, -3, 3, -2, 4, -1, 1, -3, -1, -3, 0, -1, -4, 0, 2, 0, -4, 2, 4, -1, 1, -1, 4, 2, 3, -4, -1, 2, -1, 3, -1, 2, 1, -2, -2, 3, 1, 1, 3, 6, 6, -1, 4, 0, 4, 1, 3, -2, 3, -3, -3, -3, -4, -1, 4, 5, 5, 0, 4, 1, 5, 4, -1, 1, -2, -3, 4, -2, -4, 2, 4, -3, 2, 2, -2, 4, -1, 5, -1, -2, 5, 5, -1, -1, -3, 3, 0, 4, 4, -3, -2, 0, -4, -2, 3, 4, 5, 1, 4, -1, 5, -3, 4, 1, 0, -4, -2, -3, 4, 3, -3, 2, 3, -4, 4, 5, -3, 0, 3, -4, -3, 0, -4, 5, -5, 0, 5, 6, -4, 4, -1, -3, 5, -3, -4, -4, -2, -5, -3, 3, -4, 5, 4, -4, 2, 4, 4, -3, 1, 0, 2, -4, -5, -3, 0, 4, 0, -4, -4, 3, -2, -1, 4, 1, 3, -2, -2, 2, 4, 4, 3, 4, -2, 4, -1, -3, -5, 5, 4, 5, -4, 2, 0, -5, -2, 2, 1, 2, 4, 2, -1, 1, 0, 1, 3, 1, -3, -4, 0, 1, 2, 6, -4, 1, 1, 4, -1, 3, 4, -2, 0, -4, 3, -2, 3, -2, -4, -1, 4, 3, 2, 3, -2, 2, 0, 0, -4, -3, 5, -3, -1, 4, -4, -2, -3, 2, 5, -3, -2, -5, -3, 4, -1, 4, 2, 4, 4, 0, 1, 4, -1, -3, 4, 5, -4, -2, 0, -1, 4, -1, 5, 2, -4, 5, -3, -3, 4, -4, -4, 5, 5, -2, 6, 4, 6, -4, -4, 0, 3, 2, 2, -1, 2, 1, -4, 5, -1, 4, -1, -3, -1, -3, -1, 1, -5, -1, 6, -1, 0, -3, 1, 1, 6, 1, 1, -1, 5, -1, 2, -3, -1, -5, 2, -4, 1, 4, 1, 5, 0, 1, 0, 3, -2, -2, 4, -4, 0, 2, -2, -1, 5, -4, -4, 1, 1, -4, 1, 0, 4, 4, -2, -2, 5, -3, -3, -3, 0, -5, 3, 5, 0, -2, 4, 4, 3, -1, -1, -4, 2, -2, 4, -4, 2, 5, -1, -4, 0, -3, -2, 2, 2, -4, 5, 4, 5, -4, -5, 4, -3, 5, 0, 2, -1, -3, 2, 4, -1, 1, 3, 5, 0, 5, 4, 3, 2, 4, 4, 2, 4, -1, 5, -3, -1, 2, 5, 5, 6, -4, -3, 4, 4, 5, 3, -1, 0, 1, 2, 1, 4, 3, -1, -2, 3, -4, 5, 5, 0, 0, 1, 1, -1, 4, 0, 0, -3, 2, 4, -4, -2, 4, 2, -2, 0, 3, 0, 2, -1, -2, 1, 5, -4, 1, 0, -3, 2, -2, -4, 4, 4, 5, -2, -2, 4, 6, 2, -3, 0, 2, -3, -3, -4, 6, 0, -1, 2, -3, -4, -1, 3, -2, 5, -4, 0, -4, -3, 0, -3, -1, 4, -3, -4, 4, 4, -3, 0, -5, 4, -1, 3, 2, 3, 1, -4, -4, -2, 3, 0, 4, 1, -3, -3, -1, 3, 4, 6, -1, 6, -2, -3, -3, 2, -4, -4, 3, 0, 1, -3, 1, 1, -1, 5, -5, -3, 2, 4, 2, 2, 2, 0, 0, 3, -1, 3, -3, 2, 1, 2, 2, -1, 1, 4, 5, 3, 3, -2, 5, -4, 4, -2, 5, 5, 1, 0, -5, 1, -4, 3, -2, 3, 3, -3, 1, -1, 4, 5, 3, -1, -4, 4, -1, -4, -1, -5, 1, 5, 4, -3, 3, 5, 3, 5, 0, 0, -3, -3, 2, 3, 4, 6, 6, 6, 5, -4, 4, 5, -2, -3, 3, 1, 3, 0, -5, 2, 1, 0, 2, -2, -4, -4, 5, -2, 5, 5, -3, 3, 3, -4, 3, -3, -4, -1, 2, 6, 1, 0, 3, -3, 5, 1, 2, 4, -4, 1, 2, 1, -2, 4, -2, 3, 0, 5, 0, 1, 5, 2, -2, -2, 2, 1, -3, 1, 3, 0, 3, 4, -4, -1, -4, -1, 3, 3, 0, 1, 5, 3, -5, -1, 4, -2, 1, 1, -1, -3, 0, 5, 1, 3, 2, 1, 3, 5, 2, -1, 0, -2, 5, 2, 2, -5, 1, 3, -1, 0, -2, -4, 5, 3, 0, -3, -5, 0, 5, -1, -1, 1, -5, 4, -4, 2, 4, 0, -4, 5, 3, 1, 2, 6, -1, 0, 2, 5, 1, -4, -3, 2, -2, 4, 2, 2, 0, -1, 3, -4, 5, -1, 3, 1, 1, 5, 3, -5, 1, 6, 2, 4, -3, 5, -2, 1, -5, -4, 5, 0, 2, 4, 5, 4, 0, 0, 0, 2, 0, 1, -4, 1, -4, -3, -5, 5, -4, -2, -4, 1, 1, 1, -1, -4, 4, 2, 2, -1, -4, 1, 4, -3, 1, 1, -2, -3, 4, 1, -3, -4, -3, -5, 1, -3, 4, -2, -2, 6, 6, -4, 4, 0, -3, 1, 0, -1, 0, 0, 1, 6, 6, -4, -2, 6, -1, 5, 3, 1, 1, 2, -1, -1, -4, 0, -4, 1, 2, 6, 3, 0, -5, 4, 4, 0, -1, 4, 5, -3, 3, 2, 5, -4, 0, 2, 2, -4, 0, 5, -3, 3, 5, -3, -1, -3, 3, 1, -3, 5, 0, -4, 1, 4, -4, 3, -2, -4, 3, 4, 2, 5, 0, 1, 1, -2, 3, 5, -4, 5, -3, 5, 5, -3, 3, -1, -1, -3, -5, 1, 5, 4, 5, 3, 1, -1, -1, 1, -4, 2, -2, 4, -4, 4, 3, 3, 2, 5, 0, -3, 1, -2, -3, 3, 1, 4, 4, -2, 1, 5, 2, -4, 6, -2, 4, 0, 1, -2, 4, 4, -3, 5, 4, -1, 4, -4, 0, -1, 0, -2, 5, -3, 5, 4, -4, 1, 0, 2, -3, -3, 2, 1, 5, 4, -5, 1, 4, 1, 5, 6, 2, -3, -4, -3, -2, -1, 2, -4, 0, -4, 0, 1, 2, -2, 2, 0, -4, -3, 1, -2, 2, -2, 1, -2, 3, 2, 3, -3, 5, 3, -2, 4, -4, -4, -4, 2, 2, -1, 2, -3, -4, 3, 2, -1, -4, 5, 1, 3, -4, 1, 3, -2, -3, -1, -1, 0, -2, 0, 1, -4, -2, -3, 6, 1, -4, -4, -3, -4, 1, 4, 1, 1, 0, -4, 5, 2, 3, -3, -4, -4, -4, 1, 0, 5, 3, 5, 2, -3, 5, 2, -3, 4, 5, 0, -3, 1, 2, 5, 3, -4, -5, -3, -2, 4, -4, 3, 1, -4, -1, -3, 2, 0, 3, 0, 2, -1, 5, -4, 0, 3, 2, -3, -1, -4, -4, -2, 5, -4, 1, 4, 0, 0, -2, -3, -1, -1, 2, -4, 3, 5, 2, -4, -3, 5, 5, -2, 0, 3, 3, 4, -4, 2, 3, 2, 2, -3, -4, -4, 3, 5, 5, 2, -1, 4, 0, 2, -2, 1, -1, -1, 4, 5, -4, -4, -3, 3, 3, 6, 4, 2, -4, -4, -4, -3, 1, -1, 4, -4, 3, 0, -3, 0, 4, -4, 5, 1, 2, -4, -3, -1, -2, 6, -2, -1, 3, 3, 5, 1, 5, 3, -3, -1, 0, -3, -4, 1, 2, 3, 0, 5, 2, 1, -2, -2, -3, 0, -3, -4, -5, 3, 3, -4, -2, 4, -2, 3, -4, 1, -3, -3, 1, -5, 1, 3, -1, 0, -2, 0, -1, 3, -5, -1, -5, 4, 1, 1, -4, 3, 0, 3, 0, -3, -3, 5, 6, 1, -2, 2, 4, 5, 1, 3, 3, -1, -2, -1, 3, 3, -1, 4, -1, 2, 6, 2, 4, -4, 4, -4, 3, 1, 5, 3, -1, 3, 1, -3, -3, 6, -3, -1, 3, -1, 0, 6, 5, 2, -1, -4, -3, 2, 3, 3, 5, -4, 0, 5, 5, 3, -1, -4, -4, -1, 2, -3, 0, -3, -1, -4, 5, 6, -4, -2, -4, -4, -4, -1, 1, -3, 1, 5, -1, -5, 5, 4, 3, 0, -3, 2, -4, 2, 2, -1, -2, -4, 3, 0, 1, 4, -3, 4, -3, 2, 4, 2, 5, -5, -2, -1, 2, -1, 4, -2, 4, -2, -4, -1, -1, 0, 0, 3, 4, 2, -5, -3, -2, -5, -3, 2, -5, -4, 0, 2, 2, 5, -3, -1, 2, -1, 1, -2, 5, 0, -1, 5, 3, 1, 0, -4, 2, 1, 4, -1, 2, -2, -3, -1, 0, 5, 0, -5, 5, -4, -2, 1, 3, 5, -2, 3, 1, 3, 4, 3, 4, 6, -4, -2, 6, -1, 1, -2, -4, 1, 1, -4, -1, 0, 4, -3, 4, 5, -2, 4, 1, 1, 2, 3, 4, -2, 2, -2, 5, -3, -3, -3, 2, 2, 0, 1, 5, 1, 2, 3, 2, 2, 2, -1, 4, -3, 1, 2, -1, 0, 1, -4, -3, -3, -3, 5, 0, 0, 3, -2, 3, 0, 6, -4, -2, -1, -1, -2, 3, -3, -1, -1, 4, 5, -2, 1, 0, -2, -4, 2, 6, 0, 5, 3, 4, -1, 2, -3, -3, 4, 1, -2, 1, -2, -2, 3, -1, -1, 2, 2, -1, -4, 2, -1, -1, 6, -2, 5, 2, 1, 2, 0, 0, -4, -1, 0, 0, -1, -2, 1, 1, 4, 2, -1, -2, 1, 6, -4, 3, -3, -3, -4, -3, 0, -1, -3, 3, -2, 0, -3, 0, 1, -4, 2, 0, 0, 0, 2, 1, 5, -4, 1, 4, 3, -2, 0, 4, -2, 3, -3, -2, -1, 0, 2, 4, -1, -1, 4, -4, 5, -5, 0, 4, 0, 1, -4, -2, 5, 2, 4, 4, -1, 1, 1, 0, 5, 4, 5, 2, -2, 4, -1, -4, 0, -3, -3, 3, -2, 3, 1, 2, 3, 3, 0, -1, 5, 0, -1, 1, 5, 4, -2, 4, -1, -1, 2, -3, -1, 1, -4, -1, 3, 3, 0, 0, -3, -4, 1, -4, 3, 2, 1, -5, -1, 3, 3, -1, 1, 4, 0, -1, 4, 0, -3, 6, 0, 5, -1, 4, -4, -1, -3, 0, -2, 2, 6, -3, 4, 2, 5, -3, -1, 3, 2, 0, -2, -2, 1, -3, 0, -4, -1, -3, 1, -2, 5, 4, -1, -4, -5, 1, 0, -5, -1, -4, 3, 0, 6, 1, -1, -3, -2, 0, -4, -2, -2, 4, 3, 0, -2, 1, 0, -3, 5, 4, -4, -1, 0, -5, 1, 5, 1, 4, -3, 1, 2, -2, 6, -3, -1, 5, -3, 5, 5, 2, 5, 4, -2, 6, 6, 4, 4, -2, -1, -2, 4, -1, -2, 4, -4, 0, 2, 1, 1, -1, -4, -4, -1, -1, 6, -3, 3, -3, 1, -5, 5, 0, -4, 5, -2, 0, -3, -3, 4, 0, 2, 1, -2, 2, 4, -1, -2, 4, 5, 5, -2, -2, -3, 4, -1, -3, 4, 1, -2, 0, 5, -1, 5, -2, -1, -4, -1, -3, -3, 2, -3, 0, -3, -4, -2, -2, 1, 5, 3, 4, 2, -1, 5, -5, 0, 6, -4, 6, -5, 3, -2, 1, 1, 4, -2, 6, 2, 2, -2, 5, 1, 2, -1, 2, 2, 3, -4, 5, 5, -3, 5, 2, -4, 3, 2, -1, 4, 1, 3, 5, -1, -5, 0, 1, -5, -5, 4, 2, -2, -4, 5, -1, 0, -3, 0, 5, -4, 0, -4, 5, 2, 2, 0, 3, -4, 0, -2, 3, 4, 5, 2, 6, 3, -5, -1, -4, 3, 0, -2, 1, 4, 1, -4, 6, -5, 1, -2, -1, -4, -4, 1, 1, 6, -3, -2, 1, -3, -2, 1, -2, 5, 6, 6, -2, -3, 5, 3, 0, 3, 3, -3, 0, -2, 4, -3, 2, -3, 1, 0, 5, -1, -4, -2, 2, -4, -4, -2, 0, 5, 4, -4, -1, -5, 5, 3, 1, 4, 1, -1, 4, 0, -2, -1, -1, 3, -1, -2, -2, 4, -5, 2, -5, 4, -1, 2, -2, -2, -3, 0, -2, 1, 0, -5, 4, 5, -2, 3, 6, 3, 3, -2, 4, 0, 4, 4, -1, 0, -4, -4, 2, -2, -1, -5, 2, 0, -2, 4, -4, 0, -1, 1, -1, -5, -1, -4, -1, 3, -4, 6, 1, 2, -1, 3, -1, -1, 4, 5, 5, 3, 1, 0, 0, 3, -3, 1, -1, 0, -1, 3, -3, 0, -2, -3, 1, 5, 0, -3, -3, 3, 4, -3, 6, 3, 1, -1, 1, 4, 0, -2, 5, -1, 1, -1, -4, -3, -1, 0, 5, 3, 4, 3, -2, -2, -3, -4, -4, 6, 0, 5, -1, 1, -1, 4, 5, 2, -3, -3, 2, 0, 2, 3, -3, 1, 2, 4, 4, -4, -5, 5, -3, 4, 1, -2, -2, -5, -4, -4, -4, 6, -3, 6, -4, 5, 2, 0, 5, 2, -1, -4, 6, -5, 3, 5, 3, -3, 5, 2, -5, -3, 4, 2, 2, 4, 0, -3, -1, 2, 4, -2, -4, -2, -5, 1, 0, 2, 4, -3, -2, 5, 2, 2, -3, 3, -1, 0, -3, 0, 1, -3, 0, -1, 3, 6, 3, 3, 0, -1, -2, -2, 1, -3, 4, 1, -2, -3, 3, 3, 2, 1, 1, 2, 0, 2, 0, 2, -3, -2, 1, 1, -1, 4, 5, 2, -3, -1, -4, -1, 0, 2, 4, -4, -5, -3, 3, 2, 2, 2, 4, -3, -2, 0, 4, 3, 3, 5, 0, 3, -1, 5, -4, 1, -4, 0, 5, -2, -4, -4, -3, 1, 5, -3, 0, 2, -2, 0, 5, 3, -1, 2, -4, 5, 0, -2, -4, 6, 3, 2, -1, 6, -2, -2, 0, 3, 0, 4, 0, 0, 0, 1, 4, 1, -4, 5, -1, 6, 2, -3, -4, -4, -2, -2, -3, -3, 2, -4, -5, -3, 0, 0, -5, 0, -4, 2, 6, 2, 0, 3, 2, 4, -4, -3, 2, 3, 5, 3, 2, 3, -1, -3, 1, 2, -1, 4, 0, 2, 5, 3, 1, 5, -2, -5, 5, 0, 6, -4, 2, 4, 0, 5, -4, 4, 3, 2, -4, 4, 2, 4, -3, 2, 1, 2, -4, 4, 5, 0, -3, 3, -2, 2, 2, 3, -5, 5, 3, -2, -1, 4, 1, -2, -1, 1, 4, 4, 0, 3, 2, -1, 2, 0, 4, 3, 6, 1, -3, 1, -2, 0, 2, -3, 5, -1, 4, 0, -2, -2, 3, 5, -4, 5, -5, 3, 1, 5, 5, 6, 4, 2, -3, 5, 5, -1, -1, 2, 1, -4, -2, -2, -2, -3, 3, 2, -1, 3, -2, 1, -1, -4, -1, -2, 2, -4, -2, 5, 0, 2, -1, 0, 6, 0, -1, -3, -4, 1, 2, 4, -5, -3, -1, 2, 5, 1, 5, 0, -4, -1, -4, -2, 5, -1, 1, -3, -2, 1, 5, 1, -3, 1, 1, -4, 2, -5, 4, -3, 1, 5, -3, -2, -2, 0, 5, 0, -1, 2, 4, 2, 5, -4, -2, 3, 5, -5, 6, -1, 0, 3, 5, -2, 5, -2, -2, 1, -1, 1, 4, -2, 2, 3, 5, 6, -3, -1, 3, -2, -1, -4, -3, -1, 5, 2, 3, -4, -1, 2, -3, -1, -3, 0, 4, 1, -3, -4, 3, 4, -2, 3, 1, 3, -3, 2, -3, 1, -3, -3, 6, 1, 4, 4, 1, -1, -1, 2, 4, 4, 0, -3, 0, -1, -2, -5, 3, -4, -1, 2, 2, 3, -5, 3, 3, 4, 4, 5, 6, -3, 2, 5, 3, 6, -5, 3, 1, 1, -4, -4, -3, 4, 3, 2, -3, -3, -3, 2, -2, 0, 2, 4, -4, 0, 3, 3, -1, 5, -1, 2, -3, -3, 2, 3, -5, 1, -1, 0, 3, 6, -3, 5, -2, 1, -5, 4, -2, 0, -1, -4, 1, -4, 2, 5, 3, 6, 5, -1, -5, 3, -3, -1, -4, -2, -2, -3, 0, -2, -1, -2, -4, 5, 3, -3, 1, 3, -4, 4, 0, -3, 2, -3, 0, 3, 0, 0, 2, -1, 0, -2, 4, 5, -4, 3, 6, -3, -1, -1, 0, 1, -1, -1, 1, 3, -5, -3, 5, 4, 2, -1, 2, -4, 0, -3, -2, -2, 0, 0, 3, -3, 5, 0, 0, 0, 4, 4, -2, -2, 2, 2, 4, 2, 5, -2, 2, -4, -4, 2, -4, 5, 5, 4, 0, -3, -2, -2, 4, -2, 0, -4, 1, -2, -2, -3, 2, 0, -2, 2, 2, -2, 5, 2, -3, 0, -3, 5, -3, 2, 5, -4, -1, -3, -4, -1, -3, -5, -2, -2, -2, 1, 5, 4, 3, 0, 3, -3, 3, 2, 0, -3, 3, -5, -3, -4, -1, 2, 2, -3, -1, -1, 4, -4, -1, -2, 3, 1, 1, -3, -2, -3, 0, -5, 5, 4, 4, 2, 4, 5, 0, 2, 1, 3, -1, 6, 2, -2, 1, 4, 3, -2, 5, -4, 2, 3, 4, -1, -3, 2, 4, -4, 5, 2, 0, -1, 4, -4, -2, -1, -4, -2, -3, 0, 5, 2, 0, -4, 2, -2, 6, 5, -1, -4, -2, -3, 4, -3, 4, 1, 3, 0, -2, 4, 3, -4, 1, -1, 1, -2, 2, 4, 3, 0, -3, -4, 0, 0, 3, -1, -3, -4, 5, 3, -2, -5, -4, -3, -5, 4, 2, 1, 2, -4, -2, 4, 2, -2, 0, -3, -3, -2, 0, -3, 0, 5, 1, 0, 4, -3, 0, 1, 2, 0, 1, 3, 5, -1, 2, -1, 1, 1, 0, 3, 2, -3, -3, -3, 2, 6, 2, -4, -2, 4, -5, 4, 1, 5, -1, -3, -1, -4, -3, 2, -4, -2, 0, 0, 1, -3, 4, 1, -4, -5, -4, 5, 4, -3, 0, 3, -2, 0, -2, 1, 5, 1, 3, -4, -1, 4, -4, -4, 0, -3, 3, 0, -3, 3, 1, -4, 5, -1, -5, 4, -4, 0, 4, -4, 1, 0, -4, 4, -3, 5, 2, 3, 4, -3, 3, 0, 3, -5, 1, 3, 5, 2, 3, 4, 0, 2, -1, -1, -3, 5, 0, 5, -1, -2, 0, 2, 2, -3, 2, -4, 0, -4, 5, 4, -3, -2, 5, -4, 4, -4, 5, 2, 2, 4, 0, -4, 4, 3, 5, 0, 6, 1, 5, 1, -3, 0, 0, 1, 1, 3, -3, -2, -4, -1, -1, -1, 5, -3, 4, 3, -1, -2, 5, -2, -4, 2, 1, 4, 0, 2, 0, -5, 1, -3, 0, 6, 3, 0, 2, -3, 4, 2, -2, 1, -1, 2, 4, 0, 5, 4, 3, -2, 3, 2, 2, 2, -5, 2, 2, -2, -1, -5, -4, -1, -1, 1, 5, -4, -4, -2, -2, 5, -5, 2, 1, 1, -2, 0, 0, 4, 1, 3, 6, 0, 2, 0, 6, 4, 3, 0, 5, -1, -2, 3, 3, 5, 6, 0, -5, 3, 4, -1, 3, -3, -3, 2, 5, 3, -3, 5, 3, 2, 1, -1, 6, 3, 3, -3, -1, 4, 2, -4, -4, 3, 4, -1, 1, 0, -4, -5, -3, 1, 4, 4, 5, 1, 1, 3, 1, 0, -4, 2, 1, -2, 2, 2, 3, 1, 4, 0, 1, 5, 5, 0, -2, -3, -2, -2, -1, 0, -1, 4, -1, -4, 5, 1, 2, 1, 5, -2, 2, -2, -3, 0, -4, 6, 6, 4, 3, 1, -3, 2, -3, 0, 6, -5, 0, 4, 0, -4, -3, 0, -1, 5, 0, 1, 4, 4, -2, 5, -3, 0, 1, 5, 6, 1, 0, 4, 1, 3, -3, 4, 6, -4, -2, 0, 0, 5, -2, -3, -1, -5, 1, -3, -5, 1, 0, 1, -2, 1, -3, -3, 4, 0, -3, 3, -3, -5, -1, -4, -3, 3, 0, 0, -2, -5, 3, 4, 4, -4, 0, -3, 6, -2, -2, -2, -2, 2, 0, -2, 3, -1, -4, 3, -4, 1, 2, -2, -3, 6, 4, -3, 3, 3, -1, 1, 4, 1, 0, -2, 2, 5, 5, 5, 0, 4, 1, 2, -3, 1, 0, 2, -3, 2, 2, 1, 1, 0, -4, -3, 4, 5, 0, 0, -2, -5, 5, 5, -2, 1, -3, 3, -2, 3, -3, -3, 3, -2, 4, 4, 4, 5, 3, 1, 2, -4, -5, 4, -4, 1, -4, -3, 3, -4, 4, 5, -1, 4, -4, 3, 3, 6, 5, 3, -3, 1, 1, 5, 2, 5, 3, -4, 3, 5, 2, -3, 4, 2, 0, 0, 6, 0, 3, -2, -3, 3, 1, 4, 3, -3, -3, -3, -1, -4, 2, -4, -1, 2, -5, 3, 3, 5, 0, 2, 2, -1, -2, -4, -4, 5, 6, -5, -4, 4, 6, -3, 2, 0, -5, 5, 1, 1, 0, 2, 3, -4, 4, 3, 5, 4, 5, 5, 0, 0, -1, -1, 0, 2, -1, 5, 5, -2, 2, 0, 1, -3, 0, -1, -1, -2, -3, 2, 0, 2, -2, 4, -1, -1, 3, 5, -4, 0, -5, -2, -4, 5, 2, 2, 2, -4, -2, 3, -3, 6, 1, -2, -1, -1, -2, -1, -2, 4, 5, 4, 0, -1, 5, -1, -4, 3, 5, 0, -1, -2, 5, 0, 0, -4, 0, -4, -2, -4, 2, 4, -4, -4, 1, 2, -4, -4, 4, 4, 2, 3, 4, -3, -3, 5, -2, -5, 2, 4, -1, -3, 3, 5, 5, -2, 4, 0, -1, 5, 4, -1, -3, 0, -1, 1, 2, 0, -2, 4, -3, 6, 5, 0, -1, -3, 0, -5, -2, -3, 3, 2, 1, 5, 0, -5, -1, -5, 1, -1, 2, -3, 5, 2, 6, -2, -1, 4, 5, 5, -5, 5, 2, 3, 3, 5, -1, -3, 2, -3, -1, -4, 2, -3, 1, 4, 2, 3, 0, -1, 0, -4, 4, 4, 5, 1, 3, 4, 3, -5, 1, 1, -4, 0, -3, 4, 4, -5, -3, 4, -2, 1, -3, 2, 0, -3, 4, 0, -4, -1, -2, 2, -1, -1, 1, 2, 1, 3, -2, -2, -1, 0, 6, -4, -4, 4, 5, 5, -3, 1, 2, 1, -1, 5, 1, -4, 0, -5, -2, -1, 1, -2, -3, 0, -3, 5, 5, 0, 3, 5, 1, 1, -1, 6, 1, -3, 3, -1, -5, 3, 2, 0, 1, 0, -2, 2, -4, -4, -3, 4, -5, 2, 2, -2, 3, 6, -1, 3, 2, 5, 5, 2, 4, -3, 0, -1, 2, -4, -4, 0, 4, 1, 0, 2, -1, 1, 2, 5, 5, -3, -3, 1, 2, 0, -2, 1, -4, -3, -3, 3, 0, 5, 0, 0, 0, 3, 0, 2, 1, 3, 2, -3, 3, 2, -2, -3, -4, 1, 4, -1, 0, -5, 1, -3, 2, -4, 0, 5, -2, 0, 0, -3, -2, 2, 5, -2, 4, 3, 5, 2, -1, 5, 1, -3, -1, 1, 2, 1, 0, -4, -2, 0, 3, 3, 4, 4, 5, 6, -2, 4, 0, 4, -3, -4, 5, 4, 2, 6, 0, -3, 1, 0, 3, 0, 2, -5, -1, -1, 3, 0, 0, -2, -1, 3, 5, 1, 5, -2, -4, 2, 1, 2, 4, -3, 4, 0, 2, 4, -1, 5, 2, -3, 0, 2, 1, 4, 6, 2, 4, 4, 3, -1, 5, 3, -4, 4, 5, 0, 4, 4, -3, 2, 1, 2, 2, -2, 4, -5, -1, 4, 0, 1, 5, 0, -4, 2, 3, 5, 1, 0, 1, -1, 2, 3, 0, -1, 4, 2, 2, -1, -3, 3, -4, 1, -2, -3, -2, -4, -3, 4, -3, 5, 2, 5, -2, 5, 5, -3, 5, 4, 3, 4, 4, 6, 5, 1, 0, -3, 4, 2, -1, 5, 4, -1, -2, 3, -1, 5, 5, 4, 3, -2, 3, 1, 3, 4, -3, -1, -1, 6, 2, -5, -4, 4, 0, -1, -4, 3, 3, 4, -3, 4, -5, -3, -3, -1, 0, 3, 2, 0, 1, -2, 4, -3, -3, 4, 5, 5, 0, 2, 2, -5, -1, -3, -2, 3, 1, 3, -2, -1, -3, -3, 0, 0, 1, -3, -2, -1, -2, 3, -3, 4, -2, -4, 2, -3, 2, 3, 5, 3, -2, 1, 1, 6, 2, -1, 1, -4, 5, -2, 3, -3, 1, 5, -2, 3, -3, 5, 2, -2, -1, -5, -3, 1, 3, 3, -2, -1, 3, -4, -5, 1, 1, -3, -1, -1, 5, -1, 4, -4, 5, 3, 3, -2, 4, -3, 2, 5, -1, 4, -4, -3, 3, 0, 3, 3, 3, 0, -4, 1, -5, 1, -3, 4, -3, 3, -3, 5, 4, -3, 0, -2, 2, -4, -3, -4, -4, -3, 4, 0, -3, -3, 0, 4, -1, 4, -2, -2, 1, 2, -4, 0, -4, 0, 1, 2, 4, -1, 2, 2, 1, 3, 5, 0, 0, 1, 2, 4, 2, 1, -4, 3, -1, 1, 4, 5, 5, 3, -3, 6, 3, 2, -2, -3, 5, 5, 0, -3, 1, -2, 0, 4, -2, 3, -2, 0, -5, 1, -3, 1, 4, 0, 3, -5, -3, 3, 2, 1, 0, 2, 6, 0, -5, 2, -4, 0, -3, 5, -4, 4, -5, 0, 1, 0, 2, 2, 0, 0, 0, 3, 4, -4, -5, -2, 1, -4, -1, 0, 3, -1, -2, 2, -4, 2, 1, -2, 4, 3, -2, 4, -5, 2, 4, 4, 1, -2, -4, 0, 0, -1, 3, -4, 6, -4, 1, 0, -2, 3, -1, 4, 6, 4, -1, -1, -4, 2, 4, -1, -5, 5, 5, 3, 3, 2, -1, -1, -4, -2, -3, 3, -2, 1, 6, -4, -3, 2, 1, -1, 4, -2, 5, 2, -2, 4, 2, 1, -1, 3, 1, -4, 4, 1, -4, 4, 0, 0, 4, -3, -4, 3, 3, 5, -5, -1, 3, -4, 3, 0, -3, 4, 4, 5, 2, 3, 4, 1, -3, 1, -1, -4, -2, 6, -4, 3, 1, -2, 4, 4, 1, 0, 1, 6, 0, -3, 1, 1, -1, 0, 1, -2, -2, 5, 2, 4, 2, 1, -4, 2, 5, -4, -2, -1, 4, -2, 5, 1, -4, 2, -1, -4, -1, 4, -5, -1, -4, 1, 4, 5, 1, -2, 3, -4, 2, -2, 2, -3, -1, -2, 4, -1, -2, 3, 3, 3, 3, 1, -2, 0, -4, -4, 4, -5, -1, 4, 1, -1, 1, -5, 1, 4, 0, -3, 4, -2, 0, -2, -1, 3, -4, 2, 0, -1, 5, 1, -5, 1, 0, 4, 6, 5, 4, 3, 1, -4, -3, 0, -2, -1, 4, 5, -4, 1, 6, -3, 2, 3, 4, -5, 0, 4, 0, 5, 1, 0, -4, -1, 3, -4, 3, 1, -5, -2, 2, 6, 5, 3, 0, 0, -2, 2, -4, -1, 0, -4, -2, 4, -2, 0, -4, 2, 4, -2, 1, 0, -3, 4, 5, -3, -3, 6, -1, 0, -3, 6, -3, -4, 4, -1, 4, -2, 3, -5, 5, 4, -2, -4, -1, 3, -2, -3, -5, 3, -4, -5, 3, 5, 2, 2, 5, 1, -1, -1, -5, 4, -2, -2, 2, -1, -4, 0, -1, 5, 5, 3, -2, 2, 0, -1, -3, 5, -3, -1, 5, 0, 2, -2, 0, 5, 1, 1, -5, -4, 6, -1, -4, 2, 5, 3, 2, 5, -4, -5, 4, 0, -5, 4, -5, 0, 0, 3, 6, 5, 5, -5, 1, -4, 3, 0, -4, -1, -4, -3, -2, -2, -3, 2, 4, -4, 2, 3, 0, -2, -3, 1, -2, -1, -3, 4, 1, 0, -1, 3, 6, -2, -3, -4, -4, -2, 1, 0, -3, -3, 5, 0, 5, -4, -1, -2, 3, -4, 0, 2, 2, -4, 5, -3, 3, -3, 4, -4, -3, -1, -2, 4, 0, 3, -2, -5, -4, 5, -3, -4, -4, 2, 4, 4, -1, 3, 6, 4, 0, -1, 3, 5, -1, -5, 6, 2, -4, 1, 3, -2, -1, 0, 0, 4, -3, -4, -4, 4, -4, 2, 3, -4, 4, -3, 0, 0, -5, -1, -4, -3, -2, -1, 2, 4, 5, 1, 0, 6, 6, 4, 4, -5, -2, -4, -4, 1, 2, -1, 2, 1, -2, 3, -1, -2, 5, -3, -3, -1, 3, 1, -2, -5, 5, 3, 1, 1, 0, 0, 0, -3, 1, 1, 3, 3, 2, 3, 5, -3, 5, -3, 1, -4, -4, 4, 2, -1, 5, 1, -1, -5, -3, -2, 2, 4, 2, -2, 2, 4, 5, 2, 0, 2, 2, -3, 3, -4, 3, 3, -1, -4, -2, -3, -5, -2, 1, 5, 3, 5, 2, 3, 1, -2, 0, 5, -1, -1, 5, -4, -1, -4, 0, 1, -4, 0, -2, 2, 2, 4, -5, -2, -4, 5, 2, 3, 6, 1, -4, -2, 4, 5, -2, 5, 0, 4, 5, -1, -2, -1, 4, -1, -1, 1, -2, -3, -4, -3, 4, -1, -4, 1, 4, 4, 1, 3, -5, -3, -1, -2, 4, -3, 4, 3, -2, 4, -1, 2, -4, 2, -3, 0, -3, -3, -4, 4, 1, 5, -1, 1, 5, 3, 5, 5, -4, 3, 4, -3, -3, 5, -2, 0, 3, -2, -2, 6, 3, 1, -1, 2, 0, 5, -4, 2, 0, -2, 3, 4, -4, -1, -5, -4, 6, -1, -5, -3, 4, -4, 3, 4, 4, -2, 5, -1, -1, -4, 4, 1, 5, -4, 4, -3, 5, -2, 3, 5, -4, -4, -1, -3, 4, -2, -1, -1, -4, 4, 2, -3, -1, 2, 2, 1, 2, 6, 5, 0, -1, -2, 2, -1, 0, 5, -2, 1, 2, -4, 1, -1, 3, 1, -1, -3, 2, 2, 6, 2, 2, -3, 5, 6, -3, 1, -1, 0, -4, 0, -5, 2, 2, 3, 1, 4, 4, -3, -4, 3, 4, 3, -1, 3, -1, -3, 2, -3, 3, 2, -4, 2, 3, -1, 4, 1, 1, -3, 0, 3, 5, -4, 4, -1, 1, 1, 2, 6, -1, 2, -1, 1, -2, -3, 4, 0, 6, -1, 6, -2, -2, 2, 1, 2, 4, 6, -2, 5, -5, -1, -1, 0, 0, -4, 0, 5, 0, 3, -3, 1, -4, -2, -1, -4, 3, -4, -1, 3, -3, 4, -2, -1, 6, -3, 1, -3, 3, -1, 1, 3, 2, -5, 0, -1, -3, 1, -2, 4, -4, 2, 5, 6, 5, 3, -1, -4, 3, -2, 6, -3, 0, 1, 6, 3, 6, 2, 5, -3, -2, 3, 5, 3, 1, -2, -3, 4, 6, 3, -4, -3, 5, -3, 5, 3, 3, 1, -2, 0, 4, -4, 1, 3, 5, -2, -3, -1, 2, 4, 5, -1, -4, 3, -4, -4, 4, 5, 0, 4, 2, 5, 2, -3, 3, -5, -3, -4, -3, 0, -4, -4, 4, 2, 5, 1, 3, 1, 4, 2, 5, -5, 3, 3, -4, 4, -4, 3, -3, 6, 0, 0, 4, -2, -4, -2, -3, 0, -2, 5, -1, 0, 3, 4, 2, 4, -1, -4, -2, -5, -1, 0, 5, 2, 1, -2, 0, 0, -4, -1, -2, 2, -3, -2, 3, 0, 2, -3, 5, 5, 5, -4, 5, 1, 2, 6, -5, 2, 3, 1, 0, -2, 1, 5, -1, -3, 0, -3, -2, -2, 4, 0, 4, 5, -5, -5, 0, 3, 2, -5, -1, 4, 3, 5, 0, 1, 2, -4, 2, -1, 3, -1, 3, 4, 4, -3, 5, -4, 1, -2, -2, 3, 0, 3, -3, 6, 3, 1, 0, 2, 3, 1, 0, -1, -5, -2, -2, -3, 1, -3, 2, -4, -1, 3, -3, 4, -2, 2, 5, 4, -1, -3, 0, 4, -4, -3, -2, -1, 1, -5, -3, 4, 4, 5, -4, 4, -4, 2, -1, 0, -4, -1, 0, 1, 4, 4, 5, 0, 0, 2, 0, 1, -1, 2, 2, 3, 3, 4, 4, -3, 6, 3, 4, -4, 2, -3, -4, 3, 1, 4, -4, 4, 1, -1, 1, -4, -2, -2, 5, 2, 2, 1, -3, 5, 3, 1, -4, 2, 3, -4, -1, 6, -3, 5, -1, -2, 4, 3, 5, -1, -4, 0, 1, 2, -3, 1, 2, -3, 0, 2, -3, 5, -1, -4, -1, -4, 0, 5, 1, 3, 2, -3, 0, -2, -4, -3, -2, 3, -1, 0, 3, 1, 1, -3, -4, -4, 0, 2, 0, -1, 2, 3, 2, 1, 4, 4, 3, -5, 1, -3, -1, 2, 6, 3, 4, 1, 1, 5, 2, 1, -1, 5, 2, -1, -1, 5, 5, -4, 5, 1, 5, 2, 0, 5, -1, 5, -3, 5, 0, 3, -3, 0, 3, 2, -2, -1, 0, 1, -4, 4, 1, 3, 4, 5, 5, -1, 2, 0, 5, 5, -3, -4, 0, 3, -3, -1, 2, 5, 1, 0, -3, 4, -4, 0, 0, -1, -1, -1, 3, 2, 6, 2, -4, -1, 4, 0, 2, -4, -2, 5, -3, -1, 4, -3, 1, -3, 1, -1, 5, 3, -4, -1, -3, -3, 4, 3, -5, -3, -2, 4, 1, -3, -1, -5, 5, 4, 1, 5, -2, -4, -1, 5, 2, 6, 4, 4, -2, -4, 4, 2, 5, 3, -2, -2, 2, 4, -1, -1, -2, 1, -1, -4, 5, -3, 1, 3, 4, 4, 1, 5, -2, 5, 2, 3, 2, 3, 1, -3, 0, -2, 5, -4, 1, -2, 4, -1, 5, 1, 0, 2, -5, 4, -2, 1, -1, 5, 1, 6, 1, 3, -1, 5, -3, -4};
+static int32_t DeeployNetwork_net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_3mul_tensor[128] = {514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0};
+static int32_t DeeployNetwork_net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_3add_tensor[128] = {179386.0, 324848.0, 155228.0, 298634.0, 163966.0, 37008.0, 173732.0, 336156.0, -255458.0, 198404.0, 304802.0, -200974.0, -117192.0, 192750.0, -281672.0, -97146.0, 340782.0, 163966.0, 333586.0, 8738.0, 108454.0, -129014.0, -6682.0, -256486.0, -324334.0, 33410.0, 325876.0, 286298.0, 191208.0, 203544.0, -29298.0, 45746.0, 48316.0, 70418.0, -288868.0, 149060.0, 78642.0, -296578.0, -53456.0, -29812.0, -344894.0, 236440.0, 33410.0, 13364.0, -210226.0, -24158.0, 18504.0, 53970.0, -82754.0, 143920.0, -96632.0, -243636.0, 276018.0, -216908.0, -213824.0, -262654.0, -120276.0, -227702.0, 106912.0, 111024.0, -125930.0, -166536.0, -59624.0, 44204.0, 189152.0, -344894.0, -6168.0, 180928.0, 263682.0, -301718.0, -283728.0, 325876.0, -154714.0, 155742.0, -2056.0, 132612.0, 5654.0, 170134.0, 111024.0, 244664.0, 317138.0, -269336.0, -72988.0, -7710.0, -10280.0, -106912.0, 220506.0, 10794.0, 10280.0, -248776.0, 167564.0, -130556.0, -341296.0, 86866.0, 46774.0, -27242.0, 200460.0, -68362.0, 74016.0, 221020.0, 56540.0, 113080.0, -184012.0, 123360.0, 275504.0, 173732.0, -266252.0, 286812.0, -148032.0, -299148.0, 291952.0, -64764.0, 209712.0, 134154.0, -134154.0, 76586.0, 17990.0, 113594.0, -111538.0, 34952.0, -68362.0, -121304.0, -177330.0, 257000.0, -176302.0, -133126.0, -198404.0, 19532.0};
+static int8_t DeeployNetwork_net_QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0weight_tensor[5120] = {-3, -1, 6, -5, 5, 0, -4, 2, 0, 3, -1, 0, 5, -1, 1, -3, 4, 1, 2, -3, 4, -1, 3, 0, 5, 2, -3, -2, -3, 3, -2, 5, -4, -2, 3, 4, 5, 2, 4, -4, 5, 1, -4, 3, 0, 1, -3, 5, 3, -5, -1, -2, 6, 1, -2, 0, 6, -2, -3, -2, 6, -2, 1, -3, 0, 4, -1, -5, 1, 4, 1, 3, 0, 5, 6, 5, -1, -2, -4, 2, 3, 3, 1, -1, -1, 4, -1, -3, -3, 1, -4, -1, -3, -4, -5, 0, -2, 1, 3, -2, -4, 6, 1, -5, -4, 4, 5, -1, -2, 4, -1, -2, 5, -3, 1, -3, -1, 5, 0, -4, 1, 5, 3, -3, 4, -4, -2, 2, -1, -1, 1, 6, 6, -2, -2, 5, -2, -5, -5, 5, 6, -4, -5, 3, 6, -3, -4, 6, 2, 4, -3, -4, 1, -2, -3, -2, -2, 3, -3, 2, 1, 3, 5, -1, 4, 2, 1, 6, -2, 5, 4, -3, 0, 4, 5, -1, 5, 6, 0, -4, -1, -4, -1, 0, -3, -4, 1, -4, -4, -4, 6, 1, 4, 4, 5, -4, 2, 1, 0, 5, -2, 3, -4, 5, -2, 2, -2, 2, -4, -3, -4, 2, -5, 6, 6, -4, -4, 5, 4, 3, -4, 4, 5, -4, -1, 1, 3, -4, -1, -4, 1, -5, 0, -2, -2, -3, -4, -1, -3, 1, -1, 0, 3, -3, -4, -3, 5, 0, -1, -2, 3, -1, -4, -2, 1, 5, 2, 1, -4, 4, -3, -3, 2, 3, 4, 4, -5, -4, -3, -3, 3, -1, -4, -3, -2, 4, -1, 1, 2, -3, -3, 0, 5, 0, 4, 1, 2, 3, 1, -5, 4, 6, 5, 5, -1, -1, 0, 6, -1, -2, 4, 1, -4, 0, 2, 3, -4, -3, 6, 6, -4, 2, 3, -1, 3, 4, -1, 5, 2, -4, 1, -3, 3, 4, 0, 1, 3, 6, 2, -5, 1, 3, -2, 3, -2, 5, 2, -5, 2, 3, 5, 4, -1, 2, -4, -1, 5, 6, 3, 3, -4, -2, 4, 3, -1, 0, 5, -2, -5, 5, -5, 5, -5, -3, -2, 0, 2, 5, -3, -5, 3, -3, 4, 2, -3, -4, -3, -3, 1, -4, -4, -4, 0, -4, 2, 3, 0, 0, 2, 3, 3, -4, -1, 0, 4, 4, -3, 3, 2, 4, 3, -4, -1, -2, -2, 1, -1, -3, 0, 1, 3, -2, 2, 4, -2, -1, -5, 2, 1, 2, 4, 3, -3, 4, -2, -2, 2, -2, -5, -3, -2, -3, 4, -1, 1, -3, 3, -5, 3, -3, 1, 3, -2, 6, -5, 2, -5, -5, -2, -4, 1, 4, -4, -2, -3, 3, -5, 3, 2, 5, 2, 2, 6, -3, 6, 5, 5, -1, 1, 4, 1, -1, -3, 1, -1, 4, 2, 3, 0, -2, -2, 1, 1, 5, 1, 5, 3, 5, -2, 2, 0, 5, -4, -1, -4, 3, 0, 2, -5, -3, 0, 4, 4, 1, 6, 3, 0, -3, -4, 3, -5, -3, -4, 5, 1, 2, -1, -1, -3, 1, -1, 4, -2, -5, -1, 3, 6, 4, 1, -3, -5, 2, -1, -2, -5, -4, 0, 3, -3, -4, -5, 2, -2, 1, -1, 4, -4, 1, -2, 2, 5, -1, -5, -4, 6, -4, 5, -5, 5, 0, -2, -4, 3, 1, 1, 4, 2, -2, -5, -3, 1, 3, 4, -3, 5, 5, -4, 5, -4, 5, -3, -3, 1, -5, -4, 0, -4, 2, -3, 3, 4, -1, 2, -3, -2, -4, -2, 3, 2, 2, 5, 6, -5, -2, 6, 0, -3, 1, -2, 0, 5, 6, 4, 4, 6, -2, 3, 5, 4, -2, 0, -3, 0, -4, 1, -3, 3, 0, 2, 0, 4, -3, 2, 5, 0, 2, 4, -5, -3, 3, -4, -5, -2, 2, 5, -3, 5, -1, -3, 2, 4, 1, 2, 1, 1, 3, -3, 6, 0, -5, -4, -1, 4, 4, -3, 3, -5, -3, -5, 5, 5, 4, 3, 1, 4, -3, -2, 6, 5, 0, 5, -2, 5, 0, 6, -3, -3, -4, -1, 2, 1, 4, 2, 1, -1, 1, 0, 6, -2, -5, 0, 4, -1, -4, 4, -1, -5, -3, 3, 5, -2, 1, -4, 5, 5, -3, 6, 1, 5, 1, -5, 4, 3, -5, 3, -1, -3, 5, 4, -1, 1, -3, 4, 5, -1, 4, -1, -3, -3, -1, 2, -4, -4, 5, 4, 1, 3, 3, 6, -1, 3, 5, 4, -1, 2, -2, 0, -1, 0, 5, -2, 4, -1, 4, 2, 2, 5, 2, -1, -3, -2, 4, 0, -2, 4, 4, -4, 5, 5, -4, -3, 1, -2, 2, 1, 5, -3, 2, -5, -1, 1, 2, 5, 3, 5, 6, -4, 3, 2, 5, 3, -3, -3, 6, -4, -4, 3, 0, 5, 4, 0, 2, 2, 4, -2, 2, -2, 3, -4, 5, 3, 2, -4, -3, 3, -2, 1, 6, 1, -1, -2, -4, 4, 0, -4, 1, -4, 0, 5, 5, 2, -5, -2, -3, -4, 1, -2, 0, 5, 2, 0, -4, -5, -5, 2, 1, -4, 2, -2, 3, -3, 1, 1, 3, 1, 4, -1, -2, -3, 5, 1, -3, -4, 4, -5, -2, -3, 3, 2, 6, -2, 4, -2, -3, -5, -4, -3, -1, 1, -1, -5, -2, 6, 6, -3, -2, 5, -1, 2, 5, -5, 5, 0, 6, 0, 3, 1, 0, -2, -1, 2, 1, -1, 3, -1, -4, -1, 4, -4, 1, 3, 0, -5, -3, -2, 6, -2, 0, -4, 3, 6, 3, 4, -2, 4, 2, -4, -4, 3, -1, 1, 2, -3, 1, -4, 6, -2, -3, 5, 2, 0, 2, 3, 5, 6, 5, 5, -2, -3, 4, -3, -1, 2, -4, 1, -1, 1, 5, -4, 4, 5, 5, -4, 5, 3, -3, 2, 3, -4, 6, 5, -3, -2, -4, 0, -2, 3, 3, 4, -3, 5, 5, 6, -2, 2, 5, 4, -2, 4, -4, -1, 4, 3, -1, 1, -1, -1, 2, -3, -5, -4, 5, 1, -1, -1, 0, 5, 4, -2, 6, -2, 1, 0, 3, 4, -3, -2, 5, 0, -2, 3, 5, -5, 0, -3, -4, -1, 6, 2, -4, -2, 5, 2, 5, -2, -1, -4, -3, 1, -1, 1, 2, 6, 1, 0, -2, 5, -2, -5, 1, 5, 2, 0, 5, 3, -2, 3, 2, 0, -3, 2, 2, 2, -5, 6, 4, 4, 4, 2, -5, 2, -4, -1, -3, -5, -3, 5, 5, 4, -4, -5, 4, -4, -3, 4, 4, -2, -1, 4, -3, -1, -1, 6, 5, -3, -1, -4, 0, -3, 1, -3, -4, 2, 6, -4, -2, -3, -1, 6, 6, 1, 4, -1, 3, -2, 2, -3, 0, 1, 4, 5, -1, 6, 1, -2, 0, -2, -4, 6, -2, -1, -4, -2, 2, -4, -4, 4, 4, 0, 1, 5, 3, 1, 4, 0, 0, -4, -2, 4, -1, -2, 6, 0, 0, 0, 1, 1, 4, 1, 2, 3, 6, -2, -1, -4, 5, 4, -4, -1, -3, -1, 0, 1, 6, 3, 0, 6, 4, 1, -2, 4, 4, -5, 1, -4, 5, -3, 2, -3, 1, -3, -1, -1, 2, -2, -1, -1, 3, 3, 3, 6, 2, -5, -2, -2, -5, 5, -3, 1, 3, 6, 0, -2, 2, -1, -2, 5, 1, -5, -1, -2, 3, 2, 1, 1, 6, 0, 1, 5, -1, -1, 2, -1, -1, -2, -3, 0, 5, -2, 4, 6, -1, -3, 5, -3, -2, 1, 5, -1, 5, -3, -1, 2, -2, 4, -4, 1, -1, 3, -3, 6, 3, -3, 4, -1, 0, -2, -2, 3, -1, 1, -5, -2, -3, 5, 6, 0, -2, 1, -3, -5, 6, -2, -4, 4, -1, 6, 3, -1, 1, 6, 4, 0, 1, -4, -5, -1, -3, 6, 5, 6, -4, 0, 4, -3, 4, 1, -4, 4, 6, 3, -4, 2, 1, -4, -1, -2, 2, 3, 4, 3, 6, -1, -2, 0, 5, -4, -2, 5, -5, 1, -2, -1, -2, 5, -2, 3, 1, -4, -3, 1, 6, 2, -4, -1, 1, -1, 3, 6, 4, -3, 5, 3, -4, 0, -2, 0, -2, -5, 4, -3, 3, -4, -3, 2, 1, 0, -3, 2, 5, -1, 0, -4, 2, 2, 5, 5, -2, 2, 4, -3, 2, -1, -1, 2, 6, 3, 0, 1, -2, 0, 3, 3, 6, 6, -5, 4, 1, 0, -1, -4, 5, -5, 2, 1, 3, -4, 4, 5, 3, 1, 2, 2, -4, -5, -1, 4, -1, 5, -4, 5, 2, 2, 2, 2, -4, 3, 3, -2, 5, -1, 5, 6, 3, -4, -3, -1, -4, 5, 3, 2, 0, 2, -1, -3, 1, 1, -3, 6, 0, -2, 2, 1, 0, 3, 5, 2, 5, 1, -2, 3, -3, 5, 6, -5, 1, 6, 5, 2, 3, 3, -1, -4, 3, 6, -3, -5, -2, -3, -3, 4, 0, 5, 5, 0, -5, 6, 2, 4, -3, 0, -1, 2, -3, 2, 0, 3, -2, -4, -4, 1, 4, -1, 0, 0, 1, 5, 0, 6, -3, 5, 3, -1, -4, 2, 0, 0, -1, -5, -3, 2, 3, 4, -1, -5, 5, -4, 4, -2, 4, 3, 5, -3, 2, 3, 0, -4, 5, -3, 0, 5, 1, -4, 3, 5, -4, 3, -2, -1, -2, 4, 5, 2, -1, 1, 0, -3, -3, 1, -5, -3, 3, 0, -3, 1, 2, -4, -2, -1, -4, 1, -4, 0, 2, -1, 0, 2, 4, 6, 6, 5, 4, -2, -5, -3, -1, -1, 3, -3, -4, 3, -2, 2, -3, -2, -1, -1, 1, -1, 5, 4, 1, 2, 6, 5, 0, 1, 5, 0, 6, -1, 2, 0, 6, -3, -2, -3, 1, -2, 2, 6, 5, 2, -3, 0, -3, -5, 2, -1, 2, -1, 4, -5, -4, 5, -5, 3, 4, -2, -3, -1, 5, -5, -5, -2, 4, -3, 3, -4, 1, 2, 4, 3, 2, 5, -1, 1, -3, 1, -4, -5, 0, 4, -3, -4, 1, 4, -5, 3, 3, -2, 4, -3, -1, -2, -1, 4, 1, 3, 0, 3, -2, -2, -4, -1, -3, 3, 5, 6, 1, 2, -2, 4, 3, 1, 0, 4, 4, 3, 4, 1, 4, -3, 0, -2, -3, -3, -4, -2, 6, 5, -2, 1, 6, -4, 2, 3, -3, 5, 5, 4, 2, 4, 0, 4, 4, -3, 5, 0, 5, 4, 6, -1, 0, 1, -5, 1, -5, 1, 6, 2, 0, -4, 5, -2, -4, 0, -4, 1, 5, 6, -3, 1, -1, 2, 2, -3, 1, 0, 1, 4, 0, -4, 4, 0, -2, -1, -1, 6, -2, 5, -4, 0, -4, 1, 3, -4, 5, -5, -4, -1, 5, 0, 2, -4, -1, 2, 1, -5, -4, 3, -5, -3, 4, -1, -1, -5, 4, -4, 3, 0, -1, -2, 5, -2, -4, 1, 0, -2, -4, 6, 4, 1, 4, -5, 2, 4, 1, -5, 5, 3, 5, -3, 4, -4, 0, 4, 1, 2, 0, -1, -3, 0, -5, -2, -1, 2, 3, -3, 0, -3, -1, -3, -4, 4, -4, 3, 4, 2, 4, -3, 6, -2, 1, 0, 2, 2, 3, 2, 4, -4, 1, -2, -4, -2, 2, 3, 3, 5, 1, 0, -1, -1, 0, -1, -5, 5, 5, 1, 3, 1, -1, -4, -4, 1, 5, 4, 3, 2, 4, -3, 5, 2, 2, -3, 5, 2, 3, 3, 6, -5, -1, 4, -2, -3, 3, 3, -5, 0, -2, -2, -2, 0, 6, 0, -4, 3, 4, 5, 0, 5, 4, -3, 3, 3, -1, 1, -2, 1, 2, 3, 3, -3, -2, -2, -1, -2, -4, 0, 6, 6, 5, -1, 1, -4, -3, 4, 1, 6, -3, -3, 0, 6, -4, -1, -4, 5, 5, 6, 5, 5, 1, 4, 3, 1, 6, -1, 0, 2, 4, -4, 3, -2, 3, -4, -2, 3, -5, -4, 0, 4, 5, -5, 2, -3, -1, -1, -2, -5, -4, 4, 2, -4, 1, 5, -2, -1, 2, -2, 2, -2, -3, 5, 4, -1, -1, 6, 1, 3, 5, -1, -1, -3, -1, -4, -2, 6, -3, -4, -1, -2, 5, -2, 3, 1, 5, 4, -3, 0, 0, -2, -2, -1, 4, -2, 5, 1, -5, -5, 5, 5, 1, 0, 1, 3, 0, 5, 4, 2, -1, 4, 1, 2, 3, 5, 0, -2, 3, 5, -4, -4, -4, 5, -2, -5, 1, -4, 0, -5, 0, -4, -1, 3, 3, 6, 4, -4, 1, 5, 2, -1, 1, -3, -2, 6, -3, 1, 0, -2, 0, 5, -3, -1, -4, 4, -4, -2, -5, 2, -2, 0, -2, 4, 1, 4, 4, -3, -2, 3, 3, -2, 6, -2, 3, 3, -4, 0, 3, 3, 5, 0, -2, -5, -3, 0, -4, -3, 6, 2, 1, -2, -1, 0, 0, 2, -1, -3, -2, -1, 5, 3, -3, 0, -1, -4, -1, 5, 2, 0, 1, 0, 1, -4, 4, 5, 3, 2, 1, -4, 2, 2, 1, 1, 1, -2, -5, 0, 6, 1, -1, 0, -1, 4, -2, -1, 6, 2, 0, 6, -4, 1, 2, 6, -4, 5, 4, -5, -1, 2, -4, -2, -5, 2, 0, 3, 3, 3, -3, -2, 6, -3, -3, -1, 4, -3, 1, -3, 2, -5, -1, 1, -2, 3, -4, 4, -4, 5, -1, -5, 2, -2, 3, 1, 6, 3, 5, -3, 0, 4, 2, -1, 1, 3, 4, 5, -3, -3, -1, -5, -5, 1, -2, 4, 2, 4, -4, 0, 5, -4, 4, -1, 1, 4, -1, 0, 2, -1, 2, -4, -5, 2, -1, -5, 3, -2, -2, 3, 1, 2, -2, -4, -3, -4, 4, 2, 2, 0, 6, 0, 3, 3, -1, 0, 6, -5, 2, 1, -1, -5, 3, -3, 0, -3, 4, -3, -1, -5, -4, 3, 3, 2, -5, 3, 5, -4, -4, 5, -1, 1, 4, 6, 6, 5, 1, 3, 2, 3, 6, 5, 4, -4, 4, 4, 4, 1, -1, -4, 2, 1, -1, -3, 3, -2, -3, 6, 4, -4, 3, 1, -5, -2, 5, -2, 3, -5, 4, -3, 1, 6, -3, -3, -1, 4, 3, 4, 0, 4, -3, -3, 5, -5, -3, -2, 4, 0, -5, 2, 5, 1, -2, 5, -1, -3, -2, -5, 1, -5, 2, 4, -1, -5, -4, 2, -2, -2, 0, -2, -5, -1, 1, 3, 5, 3, 5, -2, 3, 0, -1, 1, -4, 5, 1, 1, 0, -2, -2, 1, -3, -1, -1, -1, 1, 1, 0, -1, 0, 2, -5, -2, 3, -3, -2, -4, -1, 5, 5, 5, 1, 4, 5, 1, 0, -3, 0, -3, 3, -2, -2, 3, 5, -1, 3, -1, 3, 4, -1, 2, -1, 4, 6, 1, -3, -1, 5, 5, -1, -2, -2, 2, 3, -5, 0, -1, 6, 2, -2, 4, 0, -1, -1, -2, 4, -5, -1, 4, -4, 5, 5, -2, -2, -5, 1, -5, 5, 2, -1, 2, -2, 5, 2, 3, -1, -1, -3, -2, 1, 3, 1, 3, 4, 0, -4, 3, -3, 1, -2, -3, -2, 5, -5, -4, 3, -5, -2, 0, -2, 1, -3, 2, 3, 6, -4, -2, -1, 3, 5, -5, 3, -2, -1, -5, 1, -3, -1, 0, 2, 4, -4, 0, -2, 2, -1, 4, 0, -1, 5, 2, 2, -2, -3, 3, 1, -1, -1, 0, -3, 4, -1, -5, -5, 3, 0, 0, 6, 4, 5, -2, 1, 2, -1, 3, -5, -4, -4, -1, 5, -2, 1, -1, 0, -1, 5, -2, 4, 6, 0, -1, 6, -2, 6, 2, 1, -4, 0, 3, 4, 1, -4, -1, -4, 1, -5, 0, 5, 3, 0, 2, -1, -1, 6, 1, -1, 5, 2, -2, 2, -1, -1, 0, 2, -5, 5, 4, -3, 0, 4, -2, -4, -2, 2, 0, -2, 4, 4, 1, -4, 0, -4, -3, -3, -3, 0, 6, 2, 2, -4, 0, -4, -1, 0, 4, -4, 4, 3, -2, 5, -2, -4, 0, 1, 5, 0, 1, -4, 5, 6, 6, -1, 5, -5, 3, -5, 4, 5, -5, 4, -3, -5, 0, 1, 5, 6, 4, -1, -2, 3, 3, -4, -3, 5, 0, -5, -5, -1, 4, 4, -2, -2, 0, -3, -3, 1, -3, -1, -2, 3, -2, -4, 6, -3, -4, 6, -2, -3, -3, -3, 1, -5, 3, 1, -2, 1, -5, -2, -3, 1, 5, 4, 4, 0, 0, 5, 0, -2, 5, 6, 5, -1, -4, -4, 0, -2, 2, 5, 1, 0, -4, 6, 0, 5, 3, -2, 5, 2, 4, 2, -2, 3, 0, 2, -4, -1, -4, 2, 5, 2, -2, -2, -1, 4, 5, 5, 4, 6, -3, 5, -4, -3, 5, -3, -1, 2, 3, 2, 2, 1, -1, 1, 4, 5, 3, 0, 4, 2, -3, 6, 4, 3, 3, 3, 0, -2, 5, -3, 0, -1, 3, 5, 1, 0, -1, 0, -4, -1, 3, -3, 0, 2, 5, -4, 3, -4, 0, -3, -5, 3, 0, -5, 0, 2, 3, 0, -3, 0, 4, -1, -4, 0, -3, -2, 2, -3, 1, 4, 3, 6, 0, 4, -2, 2, -1, 1, 6, 5, -4, -4, 0, -2, -3, -5, -1, 2, 0, -1, 1, 4, -1, -1, -3, -5, -1, 6, -4, -4, 2, 2, -1, -3, 1, 2, 1, 1, 1, 2, 4, -3, -1, 5, 1, 5, 3, -4, 1, 1, -4, 0, -3, 3, 1, 4, 1, 2, 6, 3, -5, 4, -3, 0, 1, 2, -1, 0, 1, 2, 3, -2, -4, 3, 5, -2, 6, -3, 6, -5, 1, 6, 1, -1, -4, -3, 4, 3, 1, -1, 5, 3, -4, 3, 6, 3, -4, -3, 0, 2, 6, 3, 2, 5, 5, 6, 6, 5, 3, -2, 0, 5, -4, -4, 4, -4, 2, -1, 2, 2, 0, 0, -4, 1, 0, -4, -5, 5, 5, 5, 0, -1, 1, 1, 2, 5, -1, 5, -3, 4, -1, 2, -4, 4, 2, 0, 4, -3, 6, 0, 6, 2, -3, 3, 3, 1, -2, 5, 3, 5, -1, -3, -2, -1, 3, -4, -1, 5, 0, 4, -4, 1, 0, -4, 4, 2, 6, 4, -4, 2, 2, 5, -3, 4, 6, 1, 1, -2, -2, 1, 6, -1, 5, 1, 1, 4, -1, -5, -1, -2, -2, 5, 6, 6, 0, -4, 4, 2, -4, 5, -3, -4, 2, 1, -3, -3, 1, 2, 4, 1, -3, -3, -2, 0, 4, -3, 5, 0, 2, 6, -3, 5, 0, 4, -5, -5, 0, 5, 4, 4, 0, -2, 6, 1, 0, 5, 4, -2, -5, -3, -2, 2, -1, 0, -3, 4, 3, -3, -2, -5, 3, -2, 1, 2, 5, 3, 5, 3, -3, 5, 0, 3, 3, 5, -4, 6, 5, 5, 5, 5, -4, 0, -5, -2, 2, -1, -3, -2, -4, 2, 0, -5, -4, 2, 2, 5, 5, 4, 4, -2, -3, -3, 1, 2, 1, 2, -5, 4, -4, 2, 6, -2, 2, 1, -5, -4, -2, -3, -2, -4, -4, -5, 0, 5, 6, 2, -1, -2, -3, -3, 3, -2, -2, -5, 5, -4, 2, 4, -4, 0, 2, -4, 4, 4, 3, 3, 2, -2, 3, -2, 6, 4, 0, -1, 0, -5, 0, -3, 4, -2, 3, 2, -4, 3, -3, -3, 4, 6, 0, 4, 2, 4, -2, -4, -2, 3, -3, -3, 4, 0, -2, 0, -3, 4, 1, 4, 1, 5, 2, 6, 2, 5, 2, 1, -2, 2, 4, -5, -1, 6, -2, 4, 4, 1, -2, 5, 3, 3, -1, 5, 2, 3, 5, 5, 3, -4, 2, 5, -4, -5, 6, -4, 6, -2, -3, 5, 5, -5, -2, 3, -4, 0, 1, 2, -3, -5, -2, -1, -1, -5, 0, -5, -3, 4, 3, -3, 1, 2, -4, 5, -1, -4, 0, -4, 0, 2, -3, 1, -3, -4, 5, 4, -1, 1, 2, 4, 6, -3, 6, 3, 3, -1, 5, -1, -4, -2, -3, 0, -1, 0, -3, -3, 3, 1, 4, 3, 1, 0, -1, 2, 4, 0, -1, 5, -5, 2, -3, -5, 3, 2, 4, -2, 6, -3, 4, 3, -1, 2, -4, -2, -3, 3, -1, 6, 4, 3, -1, 3, -5, -1, 2, -1, 5, -3, -1, -2, 2, 1, 2, 5, -1, 2, 5, -3, 2, 4, 1, 1, -2, 5, 5, 5, -1, -4, -1, -3, 2, 6, 1, 5, -2, -3, 2, -5, -2, 5, -5, -3, 0, -2, -2, 3, 5, 1, -4, -5, -5, 3, 2, 2, -5, 4, 2, 1, 4, -2, -4, 1, 3, 3, -1, 4, 6, -1, 6, -4, 2, 6, 1, 4, -2, 1, -1, -1, 5, -4, 4, -4, 3, 4, -3, -5, -1, 3, -3, -2, -2, -2, 2, 2, 3, 6, 2, 6, -4, -3, -3, -2, 4, 0, -3, -5, -4, -3, 5, -1, -3, 6, -3, 5, -5, 0, 2, 1, 4, -4, -1, 4, -2, -3, -1, 0, -3, 1, 3, 0, 2, 4, 1, -5, -5, 0, -5, 4, 4, 6, 0, -3, -5, 4, -4, 0, 5, -5, -2, -1, -3, -2, 0, -1, 5, 5, 1, 2, 4, 0, 0, -4, -2, 2, -5, 0, -3, 0, -4, -5, 4, -2, 4, -2, -5, -5, 2, -3, -4, 0, -1, 2, -4, 4, 5, -4, -3, -1, -1, 2, 0, 2, 4, 4, 2, 5, 4, 3, -2, 2, 5, -3, -4, 3, 3, 2, 5, -4, 3, -2, 6, 0, 1, 5, -3, -2, 5, 3, 2, 4, -4, -4, 0, 2, 1, 1, -2, -4, 4, 4, 4, -3, -1, 2, 4, -1, 4, 2, 0, -1, 2, -5, 5, 2, 3, 1, -3, 0, 2, -5, -5, 0, 2, -1, 2, 6, -4, 5, -4, 2, 2, -5, -2, 1, 2, 3, 0, -2, 4, 2, -4, 1, 1, 0, 4, -1, 0, -4, -4, 0, -3, -2, -2, -3, -2, 1, 4, 6, 5, -3, -2, 5, 5, 4, -3, -3, 4, 3, -1, 3, 1, -2, -2, -2, 0, 3, 3, -3, -5, -4, 1, -1, -1, 3, 3, 1, 1, -3, 0, 6, -4, 0, -3, -2, 2, 1, -4, -4, -3, 4, 0, 5, 0, 6, -4, -3, 4, -5, -2, -3, 0, 5, 3, -3, 3, 1, 2, 6, 0, 6, -2, 1, 5, 2, 4, 0, 4, 6, -1, -3, 5, -5, 1, 2, 5, 0, -1, -2, 0, -2, -1, -2, 6, 3, 3, -1, 2, -2, -2, -4, 5, 2, 6, -3, 4, 2, 2, -3, -1, -1, -1, -1, -1, 0, 5, -2, -5, -2, 3, 4, 6, 5, -2, 4, 5, 1, -4, -3, 3, 2, 2, -5, 0, 2, 6, -3, -5, 0, 5, 4, -4, -3, 0, -4, 2, -3, 5, -4, 3, 3, -2, 5, 3, 3, 3, 2, 2, 1, 3, 3, 2, -4, -1, 3, -4, 5, 6, 3, -1, 1, 1, -5, 5, -3, 5, -5, -2, -4, 0, 6, -5, -3, 6, 1, -2, -3, -3, 1, -4, 4, 1, 0, 2, 4, -1, -2, 1, 1, -3, 2, 3, -3, -4, 0, 1, 0, 1, -2, -2, 5, 3, -3, 3, 2, 3, 2, -5, 1, 0, -3, -2, 5, 5, -1, -3, -4, 1, -4, 6, 0, 5, -2, 1, -3, -3, 4, -4, -2, 2, -1, 6, -4, 1, 2, 1, 0, 2, 4, -3, 0, 2, 3, 1, 1, 3, 1, 1, 0, -4, 4, 2, -4, 0, -1, -1, -1, 0, 4, 2, 2, -3, 3, -4, -4, -5, 6, -3, 0, -4, -3, 4, -1, 0, -3, -5, -3, 4, 5, 0, -5, 6, -2, 3, 0, -1, 1, -3, 1, -3, 5, 6, -4, 1, 3, 2, -5, 4, -4, 4, 3, -5, 1, 4, 6, -2, -5, 2, 4, -3, 2, -2, 5, 2, 4, -5, -3, 6, -5, 6, 3, -3, 3, 3, -1, 2, 1, 5, 0, -2, 6, -2, -4, -1, 1, -1, 1, 2, -2, 5, 2, 5, 1, -4, 0, -5, 3, 3, 3, 2, 5, 6, 0, 3, 0, -5, -5, -3, 2, 3, 1, 6, 3, -4, 4, 2, -3, -4, 1, -5, 6, -5, -4, -1, -3, 5, 5, -3, 6, 6, 0, 5, 1, 3, -2, 3, -5, 2, -1, -2, -5, -2, 2, -2, 3, 4, -4, 5, 3, 5, 2, 1, 1, 5, -3, -2, 3, 2, 3, 5, 3, 2, 4, -2, 5, -4, 1, -4, 2, -3, 2, 0, 1, 0, 4, -4, -4, -3, 3, 4, -4, 5, 3, 6, 5, 2, 5, -3, 3, 2, 5, -3, -1, 0, -5, -3, 6, -5, -5, -3, -3, 3, -2, -1, 5, -3, -4, -1, -1, -3, -2, 1, -1, 3, -2, -5, -5, 5, 2, 6, 4, 4, 2, 1, 0, 3, 5, -4, 4, 0, 0, -5, 5, -4, -4, 3, 4, 6, 1, 5, -4, -2, 0, 3, 1, 3, 4, 0, -2, 0, -2, 1, 4, -2, 3, -5, -3, 2, 3, -3, 1, 4, 0, 3, 3, 6, 2, -3, 6, -3, 0, 5, -1, -3, -2, -5, -2, -4, 4, 3, 3, -4, -5, 2, 5, 0, 4, 0, -1, 2, 4, -4, 3, 6, -2, 6, -3, 0, -1, 4, 2, 5, -1, 4, 6, 3, 2, 1, -2, 0, 4, -2, 6, 3, 5, 5, -3, -3, -2, -3, -3, 3, 5, 1, 1, -1, -3, 1, 5, -1, 0, 1, -2, 4, 1, 0, -1, -1, 0, 0, -1, -2, -2, 6, 6, 3, -4, 4, 0, 0, -3, -3, -1, -4, -1, 3, 2, -1, 3, -2, -4, -3, -5, 6, -1, 5, -4, -4, -1, -2, -2, 4, -3, 5, 1, -2, 4, 1, 4, 6, 1, -3, -3, 4, 4, 5, -2, 0, -4, -3, 4, 6, -4, 3, 3, 3, -4, -5, -4, 3, -5, -5, 1, -1, -5, 2, 5, 2, 1, -1, 2, -2, 3, 5, 5, -2, -4, -5, 1, 0, 4, 1, -2, 4, -1, 5, -4, 6, 5, -2, 6, 6, 5, -2, -5, -3, -3, -4, -5, 5, -5, 0, 0, -1, 1, -5, 4, -4, -2, 3, 4, -4, -3, -2, 6, -3, 0, 0, -2, -3, -4, 2, -4, 6, -2, -2, -1, -1, -5, -3, 3, -1, 3, 1, 6, -1, -3, -1, 4, -4, -2, 0, -3, 3, -3, -5, 5, -2, -2, 6, 6, -4, -3, 1, -4, -1, -3, -5, 3, -2, -4, 6, 2, -1, 5, -1, 3, 0, 0, 4, -1, -3, -3, 2, -1, 4, 1, 5, 0, 3, 3, 3, -4, 4, -2, -4, -1, -1, -1, 0, -2, -5, -3, 3, 3, -4, 2, -4, 1, 3, -1, -1, 5, 3, -1, 4, -1, 1, 6, -1, -4, 1, 0, -4, 1, 2, 0, -1, 2, 2, -1, 1, 3, 4, -3, 1, -2, -1, -5, -4, 1, 1, -3, 1, -1, 4, 4, 2, 1, 2, 1, 3, -5, -1, -4, 4, -4, -2, -3, 2, 6, 0, 2, 4, 3, 6, -1, 4, 0, -4, -1, 0, 0, 2, 2, -1, 1, -1, 1, -4, -3, -2, 4, 5, -2, 1, -1, -1, -4, 3, 1, 3, 0, -1, 6, -1, 6, -3, 3, 5, 0, 1, -1, 4, 5, 4, 2, -2, 6, -1, 6, 0, 2, 4, -3, 4, 4, 0, 2, 0, 4, -5, 6, 2, 0, -2, 2, -1, -1, -3, 5, -5, -5, -2, -1, 5, 5, 2, -5, -2, -4, -4, -1, 0, 2, 4, 2, 2, -2, -4, 4, 0, 2, -1, -3, 4, -1, -5, -3, 1, -1, -5, 2, 2, -3, -1, 1, 3, -5, -3, -5, -4, 4, -5, 2, 5, -3, 3, -1, -2, 4, -4, 3, -1, 1, -3, 3, 0, -3, -5, -3, -2, -4, 2, -3, 1, -3, -3, 2, 6, 5, 2, 5, -4, 2, -5, 1, 3, -3, 4, -1, 1, 4, 6, -3, 2, 6, 1, 3, 5, 3, 6, 5, 5, 4, 0, 5, -4, 3, -1, -4, 3, -5, -4, -3, 2, 5, 1, -3, 0, 3, 0, -1, 2, -3, 2, 4, 6, -2, 5, -2, 2, -4, 4, 6, -4, -2, -1, 2, 3, -3, 5, 3, 2, -5, 4, -3, -3, -3, -2, 2, 2, 2, 2, -1, 0, -4, -4, -2, 1, -2, 0, -1, 6, 2, -2, 4, 3, 3, 3, 2, -4, 1, -4, -4, -1, -5, -5, 1, 4, -2, -2, 0, -1, 3, 4, 5, -2, -3, 4, -3, 0, 5, 3, -5, -3, 6, 2, -4, -3, -2, 6, 0, -2, 5, 1, 3, -4, 0, 6, 5, 3, -1, -1, 5, -1, 0, -4, 1, 0, -4, 6, -3, 1, 6, 0, 2, -2, 4, 3, 2, -2, 0, -3, -3, -1, 6, 4, 4, 5, 1, 5, 6, 4, 5, 0, 4, -3, 2, 4, -4, 0, 2, -2, -4, -1, -3, -4, 0, -2, 0, -2, 0, -4, -1, 5, 2, -2, 0, -3, 2, 2, 1, 3, 6, 4, -2, 3, -4, 3, -4, -3, -3, -2, -2, 0, 6, 1, 2, 1, 0, -3, 5, 1, -5, 3, 4, 5, 4, -1, -4, 3, -5, 5, -2, -4, -4, -5, -2, -4, 4, 1, -5, -1, -2, 2, 1, 2, -1, 3, 4, 0, -2, 0, 1, 0, -2, 2, 4, 0, 2, 3, -4, 4, 3, -2, -4, 0, 4, -4, 2, -3, -5, -4, -3, -1, 1, -1, -3, 1, 6, -5, 1, 2, 4, 4, -5, -2, 4, 6, 5, 1, 1, -3, 1, -4, 4, -4, -5, 4, 2, 2, 0, 0, 6, 5, -4, -1, -4, 0, -1, 3, 0, -3, -3, 5, -4, 1, 5, -2, 3, -3, 4, 6, 3, -4, -3, 1, 5, -1, 6, -2, 4, -1, 5, 3, 5, -2, -4, 2, -2, 2, -2, 4, -2, 5, 5, 2, -4, 3, 1, 0, 2, -4, 1, 6, -2, 5, 2, 3, 6, 0, 2, -1, -4, 2, 2, 1, 3, 4, 4, 2, -4, -4, -2, 4, 3, -3, -4, -2, -3, -4, 0, -2, -1, 2, -4, -5, 6, -1, 0, 0, -4, -4, 3, 1, 2, -2, 3, -1, 0, 4, 4, -1, 5, 1, 3, 0, 3, 5, -4, 6, 0, -3, 3, -5, 0, -4, 5, -2, 4, 1, 5, -4, 1, 4, 2, -1, 0, -2, 3, -3, 5, 5, 4, 3, -4, -4, 3, 5, -4, -5, 0, -4, 2, -3, -4, -1, 3, -2, 3, -5, 3, -1, -5, 3, 0, 2, 3, 6, -2, 4, 5, 1, 0, -2, -1, 0, 1, -2, -4, -3, 5, 4, -4, 1, -2, -1, 4, -4, 1, 4, -1, 5, -1, -1, 5, 0, 6, 0, -2};
+static int32_t DeeployNetwork_net_QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0bias_tensor[10] = {430.0, -391.0, 511.0, 433.0, 465.0, -36.0, -254.0, 481.0, -541.0, 270.0};
+static int32_t DeeployNetwork_net_QL_REPLACED__INTEGERIZE_SIGNED_ACT_PASS_0mul_tensor[10] = {514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0, 514.0};
+static int32_t DeeployNetwork_net_QL_REPLACED__INTEGERIZE_SIGNED_ACT_PASS_0add_tensor[10] = {0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0};
+void* DeeployNetwork_inputs[1];void* DeeployNetwork_outputs[1];
+        void RunNetwork(__attribute__((unused)) uint32_t core_id, __attribute__((unused)) uint32_t numThreads){
+        int8_t* DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input;
+int32_t* DeeployNetwork_x_tensor;
+int8_t* DeeployNetwork_onnxMaxPool_18_tensor;
+int8_t* DeeployNetwork_input1_tensor;
+int8_t* DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input;
+int32_t* DeeployNetwork_x3_tensor;
+int8_t* DeeployNetwork_onnxMaxPool_21_tensor;
+int8_t* DeeployNetwork_input4_tensor;
+int8_t* DeeployNetwork__EXTRACT_CONV_PASS_2_padded_input;
+int32_t* DeeployNetwork_x7_tensor;
+int8_t* DeeployNetwork_onnxMaxPool_24_tensor;
+int8_t* DeeployNetwork_input8_tensor;
+int8_t* DeeployNetwork__EXTRACT_CONV_PASS_3_padded_input;
+int32_t* DeeployNetwork_x11_tensor;
+int8_t* DeeployNetwork_onnxMaxPool_27_tensor;
+int8_t* DeeployNetwork_onnxFlatten_28_tensor;
+int8_t* DeeployNetwork_onnxGemm_29_tensor;
+int32_t* DeeployNetwork_x15_tensor;
+{
+DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input = (int8_t*) deeploy_malloc(1 * 3468);
+
+
+
+
+// 2D Pad (Name: _EXTRACT_CONV_PASS_0_pad, Op: Pad)
+BEGIN_SINGLE_CORE
+    memset(DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input, -128, 3468*sizeof(int8_t));
+    uint32_t xoffset_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0;
+    uint32_t offset_in_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0 = 0;
+
+    // NCHW Layout
+    for(uint32_t n=0; n<1; n++){
+        xoffset_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0 = n*3468 + 1*34+1;
+        for (uint32_t c=0; c<3; ++c) {
+            for(uint32_t h=0; h<32; h++){
+                memcpy(DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input + xoffset_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0, DeeployNetwork_input_0+offset_in_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0, 32*sizeof(int8_t));
+                xoffset_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0 += 34;
+                offset_in_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0 += 32;
+            }
+            xoffset_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0 += 2*1*34;
+        }
+    }
+END_SINGLE_CORE
+
+}
+{
+DeeployNetwork_x_tensor = (int32_t*) deeploy_malloc(4 * 16384);
+
+
+
+
+// 2D Conv (Name: Conv_0, Op: Conv)
+BEGIN_SINGLE_CORE
+    int8_t* ref_DeeployNetwork_x_tensor_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input = DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input;
+    int32_t* ref_DeeployNetwork_x_tensor_DeeployNetwork_x_tensor = DeeployNetwork_x_tensor;
+
+    for (uint32_t n=0; n<1; ++n) {
+        Conv2d_s8_s8_s32_NCHW(
+            ref_DeeployNetwork_x_tensor_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input, 3, 34, 34,
+            DeeployNetwork_net_QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_0weight_tensor, 16, 3, 3,
+            1, 1,
+            ref_DeeployNetwork_x_tensor_DeeployNetwork_x_tensor, 128, -169344
+        );
+        ref_DeeployNetwork_x_tensor_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input += 3468;
+        ref_DeeployNetwork_x_tensor_DeeployNetwork_x_tensor += 16384;
+    }
+END_SINGLE_CORE
+
+
+SINGLE_CORE deeploy_free(DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input);
+
+}
+{
+DeeployNetwork_onnxMaxPool_18_tensor = (int8_t*) deeploy_malloc(1 * 16384);
+
+
+
+
+// RequantShift (Name: RequantShift_1, Op: RequantShift)
+BEGIN_SINGLE_CORE
+    RequantShift_s32_s8_NCHW(DeeployNetwork_x_tensor, 16384, DeeployNetwork_net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_0mul_tensor, DeeployNetwork_net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_0add_tensor, DeeployNetwork_onnxMaxPool_18_tensor, 16, 1024, 169344, 0, -128, 127, 1);
+END_SINGLE_CORE
+
+
+SINGLE_CORE deeploy_free(DeeployNetwork_x_tensor);
+
+}
+{
+DeeployNetwork_input1_tensor = (int8_t*) deeploy_malloc(1 * 4096);
+
+
+
+
+// 2D MaxPool (Name: MaxPool_2, Op: MaxPool)
+BEGIN_SINGLE_CORE
+    int8_t* ref_DeeployNetwork_input1_tensor_DeeployNetwork_onnxMaxPool_18_tensor = DeeployNetwork_onnxMaxPool_18_tensor;
+    int8_t* ref_DeeployNetwork_input1_tensor_DeeployNetwork_input1_tensor = DeeployNetwork_input1_tensor;
+
+    for (uint32_t n=0; n<1; ++n) {
+        MaxPool2d_s8_s8_NCHW(
+            ref_DeeployNetwork_input1_tensor_DeeployNetwork_onnxMaxPool_18_tensor, 16, 32, 32,
+            2, 2, 2, 2,
+            ref_DeeployNetwork_input1_tensor_DeeployNetwork_input1_tensor, 0, 0
+        );
+        ref_DeeployNetwork_input1_tensor_DeeployNetwork_onnxMaxPool_18_tensor += 16384;
+        ref_DeeployNetwork_input1_tensor_DeeployNetwork_input1_tensor += 4096;
+    }
+END_SINGLE_CORE
+
+
+SINGLE_CORE deeploy_free(DeeployNetwork_onnxMaxPool_18_tensor);
+
+}
+{
+DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input = (int8_t*) deeploy_malloc(1 * 5184);
+
+
+
+
+// 2D Pad (Name: _EXTRACT_CONV_PASS_1_pad, Op: Pad)
+BEGIN_SINGLE_CORE
+    memset(DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input, 0, 5184*sizeof(int8_t));
+    uint32_t xoffset_DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input_DeeployNetwork_input1_tensor;
+    uint32_t offset_in_DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input_DeeployNetwork_input1_tensor = 0;
+
+    // NCHW Layout
+    for(uint32_t n=0; n<1; n++){
+        xoffset_DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input_DeeployNetwork_input1_tensor = n*5184 + 1*18+1;
+        for (uint32_t c=0; c<16; ++c) {
+            for(uint32_t h=0; h<16; h++){
+                memcpy(DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input + xoffset_DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input_DeeployNetwork_input1_tensor, DeeployNetwork_input1_tensor+offset_in_DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input_DeeployNetwork_input1_tensor, 16*sizeof(int8_t));
+                xoffset_DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input_DeeployNetwork_input1_tensor += 18;
+                offset_in_DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input_DeeployNetwork_input1_tensor += 16;
+            }
+            xoffset_DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input_DeeployNetwork_input1_tensor += 2*1*18;
+        }
+    }
+END_SINGLE_CORE
+
+
+SINGLE_CORE deeploy_free(DeeployNetwork_input1_tensor);
+
+}
+{
+DeeployNetwork_x3_tensor = (int32_t*) deeploy_malloc(4 * 8192);
+
+
+
+
+// 2D Conv (Name: Conv_3, Op: Conv)
+BEGIN_SINGLE_CORE
+    int8_t* ref_DeeployNetwork_x3_tensor_DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input = DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input;
+    int32_t* ref_DeeployNetwork_x3_tensor_DeeployNetwork_x3_tensor = DeeployNetwork_x3_tensor;
+
+    for (uint32_t n=0; n<1; ++n) {
+        Conv2d_s8_s8_s32_NCHW(
+            ref_DeeployNetwork_x3_tensor_DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input, 16, 18, 18,
+            DeeployNetwork_net_QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_1weight_tensor, 32, 3, 3,
+            1, 1,
+            ref_DeeployNetwork_x3_tensor_DeeployNetwork_x3_tensor, 0, 0
+        );
+        ref_DeeployNetwork_x3_tensor_DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input += 5184;
+        ref_DeeployNetwork_x3_tensor_DeeployNetwork_x3_tensor += 8192;
+    }
+END_SINGLE_CORE
+
+
+SINGLE_CORE deeploy_free(DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input);
+
+}
+{
+DeeployNetwork_onnxMaxPool_21_tensor = (int8_t*) deeploy_malloc(1 * 8192);
+
+
+
+
+// RequantShift (Name: RequantShift_4, Op: RequantShift)
+BEGIN_SINGLE_CORE
+    RequantShift_s32_s8_NCHW(DeeployNetwork_x3_tensor, 8192, DeeployNetwork_net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1mul_tensor, DeeployNetwork_net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1add_tensor, DeeployNetwork_onnxMaxPool_21_tensor, 16, 256, 0, 0, -128, 127, 1);
+END_SINGLE_CORE
+
+
+SINGLE_CORE deeploy_free(DeeployNetwork_x3_tensor);
+
+}
+{
+DeeployNetwork_input4_tensor = (int8_t*) deeploy_malloc(1 * 2048);
+
+
+
+
+// 2D MaxPool (Name: MaxPool_5, Op: MaxPool)
+BEGIN_SINGLE_CORE
+    int8_t* ref_DeeployNetwork_input4_tensor_DeeployNetwork_onnxMaxPool_21_tensor = DeeployNetwork_onnxMaxPool_21_tensor;
+    int8_t* ref_DeeployNetwork_input4_tensor_DeeployNetwork_input4_tensor = DeeployNetwork_input4_tensor;
+
+    for (uint32_t n=0; n<1; ++n) {
+        MaxPool2d_s8_s8_NCHW(
+            ref_DeeployNetwork_input4_tensor_DeeployNetwork_onnxMaxPool_21_tensor, 32, 16, 16,
+            2, 2, 2, 2,
+            ref_DeeployNetwork_input4_tensor_DeeployNetwork_input4_tensor, 0, 0
+        );
+        ref_DeeployNetwork_input4_tensor_DeeployNetwork_onnxMaxPool_21_tensor += 8192;
+        ref_DeeployNetwork_input4_tensor_DeeployNetwork_input4_tensor += 2048;
+    }
+END_SINGLE_CORE
+
+
+SINGLE_CORE deeploy_free(DeeployNetwork_onnxMaxPool_21_tensor);
+
+}
+{
+DeeployNetwork__EXTRACT_CONV_PASS_2_padded_input = (int8_t*) deeploy_malloc(1 * 3200);
+
+
+
+
+// 2D Pad (Name: _EXTRACT_CONV_PASS_2_pad, Op: Pad)
+BEGIN_SINGLE_CORE
+    memset(DeeployNetwork__EXTRACT_CONV_PASS_2_padded_input, 0, 3200*sizeof(int8_t));
+    uint32_t xoffset_DeeployNetwork__EXTRACT_CONV_PASS_2_padded_input_DeeployNetwork_input4_tensor;
+    uint32_t offset_in_DeeployNetwork__EXTRACT_CONV_PASS_2_padded_input_DeeployNetwork_input4_tensor = 0;
+
+    // NCHW Layout
+    for(uint32_t n=0; n<1; n++){
+        xoffset_DeeployNetwork__EXTRACT_CONV_PASS_2_padded_input_DeeployNetwork_input4_tensor = n*3200 + 1*10+1;
+        for (uint32_t c=0; c<32; ++c) {
+            for(uint32_t h=0; h<8; h++){
+                memcpy(DeeployNetwork__EXTRACT_CONV_PASS_2_padded_input + xoffset_DeeployNetwork__EXTRACT_CONV_PASS_2_padded_input_DeeployNetwork_input4_tensor, DeeployNetwork_input4_tensor+offset_in_DeeployNetwork__EXTRACT_CONV_PASS_2_padded_input_DeeployNetwork_input4_tensor, 8*sizeof(int8_t));
+                xoffset_DeeployNetwork__EXTRACT_CONV_PASS_2_padded_input_DeeployNetwork_input4_tensor += 10;
+                offset_in_DeeployNetwork__EXTRACT_CONV_PASS_2_padded_input_DeeployNetwork_input4_tensor += 8;
+            }
+            xoffset_DeeployNetwork__EXTRACT_CONV_PASS_2_padded_input_DeeployNetwork_input4_tensor += 2*1*10;
+        }
+    }
+END_SINGLE_CORE
+
+
+SINGLE_CORE deeploy_free(DeeployNetwork_input4_tensor);
+
+}
+{
+DeeployNetwork_x7_tensor = (int32_t*) deeploy_malloc(4 * 4096);
+
+
+
+
+// 2D Conv (Name: Conv_6, Op: Conv)
+BEGIN_SINGLE_CORE
+    int8_t* ref_DeeployNetwork_x7_tensor_DeeployNetwork__EXTRACT_CONV_PASS_2_padded_input = DeeployNetwork__EXTRACT_CONV_PASS_2_padded_input;
+    int32_t* ref_DeeployNetwork_x7_tensor_DeeployNetwork_x7_tensor = DeeployNetwork_x7_tensor;
+
+    for (uint32_t n=0; n<1; ++n) {
+        Conv2d_s8_s8_s32_NCHW(
+            ref_DeeployNetwork_x7_tensor_DeeployNetwork__EXTRACT_CONV_PASS_2_padded_input, 32, 10, 10,
+            DeeployNetwork_net_QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_2weight_tensor, 64, 3, 3,
+            1, 1,
+            ref_DeeployNetwork_x7_tensor_DeeployNetwork_x7_tensor, 0, 0
+        );
+        ref_DeeployNetwork_x7_tensor_DeeployNetwork__EXTRACT_CONV_PASS_2_padded_input += 3200;
+        ref_DeeployNetwork_x7_tensor_DeeployNetwork_x7_tensor += 4096;
+    }
+END_SINGLE_CORE
+
+
+SINGLE_CORE deeploy_free(DeeployNetwork__EXTRACT_CONV_PASS_2_padded_input);
+
+}
+{
+DeeployNetwork_onnxMaxPool_24_tensor = (int8_t*) deeploy_malloc(1 * 4096);
+
+
+
+
+// RequantShift (Name: RequantShift_7, Op: RequantShift)
+BEGIN_SINGLE_CORE
+    RequantShift_s32_s8_NCHW(DeeployNetwork_x7_tensor, 4096, DeeployNetwork_net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_2mul_tensor, DeeployNetwork_net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_2add_tensor, DeeployNetwork_onnxMaxPool_24_tensor, 16, 64, 0, 0, -128, 127, 1);
+END_SINGLE_CORE
+
+
+SINGLE_CORE deeploy_free(DeeployNetwork_x7_tensor);
+
+}
+{
+DeeployNetwork_input8_tensor = (int8_t*) deeploy_malloc(1 * 1024);
+
+
+
+
+// 2D MaxPool (Name: MaxPool_8, Op: MaxPool)
+BEGIN_SINGLE_CORE
+    int8_t* ref_DeeployNetwork_input8_tensor_DeeployNetwork_onnxMaxPool_24_tensor = DeeployNetwork_onnxMaxPool_24_tensor;
+    int8_t* ref_DeeployNetwork_input8_tensor_DeeployNetwork_input8_tensor = DeeployNetwork_input8_tensor;
+
+    for (uint32_t n=0; n<1; ++n) {
+        MaxPool2d_s8_s8_NCHW(
+            ref_DeeployNetwork_input8_tensor_DeeployNetwork_onnxMaxPool_24_tensor, 64, 8, 8,
+            2, 2, 2, 2,
+            ref_DeeployNetwork_input8_tensor_DeeployNetwork_input8_tensor, 0, 0
+        );
+        ref_DeeployNetwork_input8_tensor_DeeployNetwork_onnxMaxPool_24_tensor += 4096;
+        ref_DeeployNetwork_input8_tensor_DeeployNetwork_input8_tensor += 1024;
+    }
+END_SINGLE_CORE
+
+
+SINGLE_CORE deeploy_free(DeeployNetwork_onnxMaxPool_24_tensor);
+
+}
+{
+DeeployNetwork__EXTRACT_CONV_PASS_3_padded_input = (int8_t*) deeploy_malloc(1 * 2304);
+
+
+
+
+// 2D Pad (Name: _EXTRACT_CONV_PASS_3_pad, Op: Pad)
+BEGIN_SINGLE_CORE
+    memset(DeeployNetwork__EXTRACT_CONV_PASS_3_padded_input, 0, 2304*sizeof(int8_t));
+    uint32_t xoffset_DeeployNetwork__EXTRACT_CONV_PASS_3_padded_input_DeeployNetwork_input8_tensor;
+    uint32_t offset_in_DeeployNetwork__EXTRACT_CONV_PASS_3_padded_input_DeeployNetwork_input8_tensor = 0;
+
+    // NCHW Layout
+    for(uint32_t n=0; n<1; n++){
+        xoffset_DeeployNetwork__EXTRACT_CONV_PASS_3_padded_input_DeeployNetwork_input8_tensor = n*2304 + 1*6+1;
+        for (uint32_t c=0; c<64; ++c) {
+            for(uint32_t h=0; h<4; h++){
+                memcpy(DeeployNetwork__EXTRACT_CONV_PASS_3_padded_input + xoffset_DeeployNetwork__EXTRACT_CONV_PASS_3_padded_input_DeeployNetwork_input8_tensor, DeeployNetwork_input8_tensor+offset_in_DeeployNetwork__EXTRACT_CONV_PASS_3_padded_input_DeeployNetwork_input8_tensor, 4*sizeof(int8_t));
+                xoffset_DeeployNetwork__EXTRACT_CONV_PASS_3_padded_input_DeeployNetwork_input8_tensor += 6;
+                offset_in_DeeployNetwork__EXTRACT_CONV_PASS_3_padded_input_DeeployNetwork_input8_tensor += 4;
+            }
+            xoffset_DeeployNetwork__EXTRACT_CONV_PASS_3_padded_input_DeeployNetwork_input8_tensor += 2*1*6;
+        }
+    }
+END_SINGLE_CORE
+
+
+SINGLE_CORE deeploy_free(DeeployNetwork_input8_tensor);
+
+}
+{
+DeeployNetwork_x11_tensor = (int32_t*) deeploy_malloc(4 * 2048);
+
+
+
+
+// 2D Conv (Name: Conv_9, Op: Conv)
+BEGIN_SINGLE_CORE
+    int8_t* ref_DeeployNetwork_x11_tensor_DeeployNetwork__EXTRACT_CONV_PASS_3_padded_input = DeeployNetwork__EXTRACT_CONV_PASS_3_padded_input;
+    int32_t* ref_DeeployNetwork_x11_tensor_DeeployNetwork_x11_tensor = DeeployNetwork_x11_tensor;
+
+    for (uint32_t n=0; n<1; ++n) {
+        Conv2d_s8_s8_s32_NCHW(
+            ref_DeeployNetwork_x11_tensor_DeeployNetwork__EXTRACT_CONV_PASS_3_padded_input, 64, 6, 6,
+            DeeployNetwork_net_QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_3weight_tensor, 128, 3, 3,
+            1, 1,
+            ref_DeeployNetwork_x11_tensor_DeeployNetwork_x11_tensor, 0, 0
+        );
+        ref_DeeployNetwork_x11_tensor_DeeployNetwork__EXTRACT_CONV_PASS_3_padded_input += 2304;
+        ref_DeeployNetwork_x11_tensor_DeeployNetwork_x11_tensor += 2048;
+    }
+END_SINGLE_CORE
+
+
+SINGLE_CORE deeploy_free(DeeployNetwork__EXTRACT_CONV_PASS_3_padded_input);
+
+}
+{
+DeeployNetwork_onnxMaxPool_27_tensor = (int8_t*) deeploy_malloc(1 * 2048);
+
+
+
+
+// RequantShift (Name: RequantShift_10, Op: RequantShift)
+BEGIN_SINGLE_CORE
+    RequantShift_s32_s8_NCHW(DeeployNetwork_x11_tensor, 2048, DeeployNetwork_net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_3mul_tensor, DeeployNetwork_net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_3add_tensor, DeeployNetwork_onnxMaxPool_27_tensor, 16, 16, 0, 0, -128, 127, 1);
+END_SINGLE_CORE
+
+
+SINGLE_CORE deeploy_free(DeeployNetwork_x11_tensor);
+
+}
+{
+DeeployNetwork_onnxFlatten_28_tensor = (int8_t*) deeploy_malloc(1 * 512);
+
+
+
+
+// 2D MaxPool (Name: MaxPool_11, Op: MaxPool)
+BEGIN_SINGLE_CORE
+    int8_t* ref_DeeployNetwork_onnxFlatten_28_tensor_DeeployNetwork_onnxMaxPool_27_tensor = DeeployNetwork_onnxMaxPool_27_tensor;
+    int8_t* ref_DeeployNetwork_onnxFlatten_28_tensor_DeeployNetwork_onnxFlatten_28_tensor = DeeployNetwork_onnxFlatten_28_tensor;
+
+    for (uint32_t n=0; n<1; ++n) {
+        MaxPool2d_s8_s8_NCHW(
+            ref_DeeployNetwork_onnxFlatten_28_tensor_DeeployNetwork_onnxMaxPool_27_tensor, 128, 4, 4,
+            2, 2, 2, 2,
+            ref_DeeployNetwork_onnxFlatten_28_tensor_DeeployNetwork_onnxFlatten_28_tensor, 0, 0
+        );
+        ref_DeeployNetwork_onnxFlatten_28_tensor_DeeployNetwork_onnxMaxPool_27_tensor += 2048;
+        ref_DeeployNetwork_onnxFlatten_28_tensor_DeeployNetwork_onnxFlatten_28_tensor += 512;
+    }
+END_SINGLE_CORE
+
+
+SINGLE_CORE deeploy_free(DeeployNetwork_onnxMaxPool_27_tensor);
+
+}
+{
+
+// Reshape (Name: Flatten_12, Op: Flatten)
+SINGLE_CORE DeeployNetwork_onnxGemm_29_tensor = DeeployNetwork_onnxFlatten_28_tensor;
+
+}
+{
+DeeployNetwork_x15_tensor = (int32_t*) deeploy_malloc(4 * 10);
+
+
+// GEMM (Name: Gemm_13, Op: Gemm)
+BEGIN_SINGLE_CORE
+    int8_t* ref_DeeployNetwork_x15_tensor_DeeployNetwork_onnxGemm_29_tensor = DeeployNetwork_onnxGemm_29_tensor;
+    int8_t* ref_DeeployNetwork_x15_tensor_DeeployNetwork_net_QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0weight_tensor = DeeployNetwork_net_QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0weight_tensor;
+    int32_t* ref_DeeployNetwork_x15_tensor_DeeployNetwork_net_QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0bias_tensor = DeeployNetwork_net_QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0bias_tensor;
+    int32_t* ref_DeeployNetwork_x15_tensor_DeeployNetwork_x15_tensor = DeeployNetwork_x15_tensor;
+
+    for(uint32_t i=0;i<1.0;i++){
+        Gemm_s8_s8_s32_s32(
+            ref_DeeployNetwork_x15_tensor_DeeployNetwork_onnxGemm_29_tensor,
+            ref_DeeployNetwork_x15_tensor_DeeployNetwork_net_QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0weight_tensor,
+            ref_DeeployNetwork_x15_tensor_DeeployNetwork_net_QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0bias_tensor,
+            ref_DeeployNetwork_x15_tensor_DeeployNetwork_x15_tensor,
+            1,
+            512,
+            10,
+            1,
+            1,
+            0,
+            1,
+            0,
+            0,
+            0,
+            0
+        );
+
+        ref_DeeployNetwork_x15_tensor_DeeployNetwork_onnxGemm_29_tensor += 1 * 512;
+        ref_DeeployNetwork_x15_tensor_DeeployNetwork_net_QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0weight_tensor += 512 * 10;
+        ref_DeeployNetwork_x15_tensor_DeeployNetwork_net_QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0bias_tensor += 1 * 10;
+        ref_DeeployNetwork_x15_tensor_DeeployNetwork_x15_tensor += 1 * 10;
+    }
+END_SINGLE_CORE
+
+
+SINGLE_CORE deeploy_free(DeeployNetwork_onnxGemm_29_tensor);
+
+}
+{
+
+
+
+// RequantShift (Name: RequantShift_14, Op: RequantShift)
+BEGIN_SINGLE_CORE
+    RequantShift_s32_s8_NCHW(DeeployNetwork_x15_tensor, 10, DeeployNetwork_net_QL_REPLACED__INTEGERIZE_SIGNED_ACT_PASS_0mul_tensor, DeeployNetwork_net_QL_REPLACED__INTEGERIZE_SIGNED_ACT_PASS_0add_tensor, DeeployNetwork_output_0, 16, 1, 0, 0, -128, 127, 1);
+END_SINGLE_CORE
+
+
+SINGLE_CORE deeploy_free(DeeployNetwork_x15_tensor);
+
+}
+
+        }
+        
+        void InitNetwork(__attribute__((unused)) uint32_t core_id, __attribute__((unused)) uint32_t numThreads){
+        DeeployNetwork_input_0 = (int8_t*) deeploy_malloc(1 * 3072);
+DeeployNetwork_output_0 = (int8_t*) deeploy_malloc(1 * 10);
+DeeployNetwork_inputs[0] = (void*) DeeployNetwork_input_0;DeeployNetwork_outputs[0] = (void*) DeeployNetwork_output_0;
+    }
+    
\ No newline at end of file
@@ -0,0 +1,2 @@
+int8_t testInputVector0[] ={51.0, -23.0, -68.0, -47.0, -127.0, 101.0, -35.0, 93.0, 98.0, 44.0, 5.0, 55.0, -121.0, -124.0, 81.0, 11.0, -79.0, 56.0, -58.0, 80.0, -79.0, 96.0, 79.0, 64.0, -21.0, -94.0, -127.0, -62.0, 49.0, 22.0, 52.0, -93.0, -13.0, -58.0, 16.0, -42.0, -79.0, -13.0, -117.0, -116.0, -94.0, 18.0, 15.0, -62.0, 46.0, 101.0, -87.0, 1.0, -41.0, 40.0, 38.0, 54.0, -18.0, 54.0, 63.0, -98.0, 63.0, -94.0, -69.0, -109.0, -104.0, -91.0, -118.0, 80.0, -52.0, 94.0, 38.0, 89.0, -29.0, 27.0, 127.0, -34.0, -76.0, -48.0, 73.0, -80.0, 15.0, -101.0, -66.0, 18.0, -50.0, -9.0, 57.0, -101.0, 8.0, 119.0, -21.0, -127.0, 53.0, -5.0, 103.0, -9.0, -74.0, 51.0, 29.0, 60.0, 58.0, 107.0, -32.0, 7.0, 86.0, -97.0, -126.0, 116.0, -118.0, -18.0, 120.0, -91.0, -5.0, 121.0, 118.0, 47.0, 45.0, -20.0, -47.0, 114.0, -97.0, -58.0, 71.0, 21.0, 115.0, -57.0, -42.0, -3.0, -106.0, -39.0, -18.0, -70.0, 0.0, -12.0, -55.0, -31.0, 99.0, -27.0, -126.0, 113.0, -4.0, -7.0, -4.0, 15.0, -24.0, -5.0, -109.0, 106.0, 125.0, -127.0, 76.0, -21.0, 12.0, -120.0, -48.0, 19.0, 74.0, 27.0, -68.0, -54.0, 54.0, 96.0, 71.0, -73.0, 95.0, -95.0, 91.0, 116.0, 4.0, 68.0, 59.0, -71.0, 14.0, -17.0, 64.0, 94.0, -98.0, -17.0, 18.0, 63.0, 8.0, 55.0, 62.0, -106.0, -75.0, -4.0, -21.0, 39.0, -16.0, 102.0, -34.0, -10.0, 92.0, 30.0, -126.0, 60.0, 2.0, 109.0, -111.0, -119.0, 77.0, 64.0, -83.0, 25.0, 38.0, -92.0, 99.0, -106.0, -32.0, 76.0, -21.0, -29.0, 96.0, -119.0, -63.0, 37.0, -58.0, -114.0, 26.0, -25.0, 75.0, 61.0, -121.0, 124.0, -8.0, 85.0, -30.0, 2.0, -92.0, -91.0, 22.0, -63.0, -87.0, -69.0, 2.0, 52.0, 43.0, -6.0, -19.0, -125.0, 116.0, 21.0, 9.0, -124.0, 1.0, -4.0, -95.0, 56.0, 37.0, -35.0, -87.0, -85.0, -10.0, -111.0, -78.0, 76.0, 22.0, -105.0, 111.0, -4.0, 89.0, -37.0, -106.0, -40.0, 34.0, 121.0, 47.0, 51.0, 60.0, -115.0, 56.0, -117.0, -125.0, -56.0, 95.0, 111.0, 0.0, -79.0, -54.0, 31.0, -118.0, -124.0, 50.0, 23.0, -52.0, 86.0, 62.0, 34.0, -29.0, -99.0, -108.0, -111.0, -78.0, -122.0, -81.0, 9.0, 47.0, 121.0, -41.0, 106.0, -103.0, 112.0, 94.0, -88.0, 113.0, 112.0, 31.0, -108.0, 14.0, -64.0, 59.0, 56.0, -2.0, 55.0, -44.0, -8.0, -81.0, -4.0, 48.0, 9.0, 30.0, -77.0, 63.0, 76.0, -58.0, -19.0, -31.0, 25.0, 98.0, 113.0, -25.0, 95.0, -17.0, -1.0, -83.0, -52.0, 57.0, -111.0, -21.0, -43.0, -96.0, -77.0, 76.0, 101.0, 18.0, -36.0, -60.0, 32.0, 33.0, -32.0, 111.0, 34.0, -87.0, 73.0, -39.0, 66.0, 124.0, -36.0, -63.0, -17.0, -104.0, -8.0, -116.0, -39.0, -12.0, -56.0, -94.0, -70.0, 108.0, -35.0, 73.0, -9.0, -96.0, -55.0, 104.0, 49.0, 82.0, -39.0, -113.0, 113.0, 125.0, -72.0, -114.0, 68.0, 36.0, 15.0, 72.0, 95.0, 66.0, -7.0, -57.0, 36.0, -50.0, 38.0, -87.0, -90.0, 2.0, -86.0, -6.0, -118.0, 66.0, 39.0, 22.0, 14.0, -34.0, 78.0, 82.0, 116.0, -41.0, -92.0, -76.0, 31.0, 0.0, 126.0, 95.0, -47.0, 11.0, -104.0, 47.0, -60.0, 66.0, 110.0, -113.0, -52.0, 20.0, -64.0, -26.0, 66.0, 39.0, -67.0, 125.0, -52.0, 74.0, -52.0, -51.0, -30.0, -92.0, -97.0, -46.0, 4.0, 74.0, -61.0, 119.0, 70.0, 99.0, -11.0, -120.0, 62.0, -42.0, -97.0, -31.0, -51.0, -6.0, -95.0, 56.0, -83.0, 100.0, -17.0, 29.0, 109.0, -46.0, -60.0, 42.0, 83.0, 41.0, -105.0, -2.0, 34.0, 58.0, 92.0, -42.0, -101.0, 70.0, 4.0, 119.0, -56.0, -69.0, -23.0, -85.0, -26.0, -77.0, -126.0, -111.0, -71.0, -5.0, 110.0, -15.0, 86.0, -76.0, 73.0, 22.0, -98.0, 8.0, -5.0, -87.0, -83.0, 87.0, 85.0, 106.0, -90.0, 114.0, 91.0, -16.0, 102.0, 54.0, -122.0, 50.0, 88.0, 107.0, 93.0, -27.0, -48.0, -12.0, 17.0, 97.0, 48.0, 92.0, 112.0, 1.0, 87.0, -116.0, -51.0, -69.0, -123.0, -32.0, 62.0, -62.0, -119.0, 27.0, -23.0, 76.0, -35.0, -126.0, 89.0, 69.0, 101.0, -127.0, -3.0, 37.0, 44.0, -24.0, 64.0, 75.0, 107.0, 105.0, 119.0, -20.0, -12.0, -99.0, 76.0, -96.0, -5.0, -65.0, -80.0, 108.0, -15.0, 11.0, -93.0, -3.0, 94.0, 58.0, -44.0, -90.0, -15.0, -123.0, -127.0, -66.0, -125.0, 127.0, -17.0, -19.0, -94.0, -68.0, -122.0, 116.0, 86.0, 53.0, -110.0, -97.0, -5.0, 17.0, 90.0, 117.0, 87.0, 95.0, -100.0, 69.0, -122.0, 88.0, 44.0, -88.0, 9.0, 82.0, 73.0, 110.0, 27.0, -68.0, 50.0, -64.0, 44.0, 98.0, -123.0, 110.0, 36.0, -125.0, -105.0, -40.0, -28.0, -121.0, 68.0, -37.0, 122.0, -44.0, 25.0, 18.0, 19.0, -100.0, -13.0, -49.0, -36.0, 25.0, -87.0, 24.0, 40.0, -91.0, 39.0, -74.0, -82.0, -69.0, -73.0, -40.0, 112.0, -105.0, 84.0, 68.0, 63.0, 69.0, 101.0, -62.0, -56.0, -1.0, 69.0, 118.0, -95.0, -37.0, -102.0, 113.0, -85.0, 41.0, -40.0, -13.0, 16.0, 14.0, -117.0, -86.0, 116.0, -88.0, -26.0, 44.0, 109.0, -104.0, 117.0, -127.0, -42.0, -84.0, 10.0, -104.0, -3.0, 40.0, 112.0, -14.0, 44.0, 89.0, 73.0, -54.0, -87.0, -97.0, 54.0, -63.0, -65.0, 31.0, 91.0, -113.0, -26.0, -106.0, -53.0, 18.0, -117.0, -9.0, -67.0, 97.0, -58.0, 63.0, -33.0, 94.0, 57.0, 61.0, -73.0, -90.0, 56.0, 120.0, -45.0, 110.0, 84.0, 56.0, -36.0, 51.0, -55.0, 10.0, -29.0, -71.0, -4.0, 101.0, -115.0, -83.0, 57.0, -36.0, -112.0, -47.0, 3.0, -9.0, -17.0, -52.0, 33.0, -61.0, -66.0, 68.0, -51.0, 42.0, 24.0, -81.0, -72.0, -91.0, 116.0, 47.0, 105.0, 73.0, 20.0, 110.0, 104.0, 89.0, 42.0, -65.0, -2.0, -5.0, 104.0, 93.0, 33.0, 46.0, 70.0, -122.0, -46.0, 93.0, 87.0, 38.0, -41.0, 94.0, -57.0, -14.0, 24.0, -3.0, -62.0, 125.0, 11.0, -88.0, 43.0, -37.0, -78.0, -92.0, 31.0, -54.0, -55.0, -45.0, 39.0, 109.0, 95.0, 46.0, 18.0, -7.0, 81.0, -8.0, 123.0, -126.0, 71.0, 28.0, 94.0, -93.0, 113.0, -111.0, -31.0, -55.0, 17.0, 46.0, -25.0, 92.0, 72.0, -103.0, -8.0, -75.0, 66.0, -79.0, -26.0, 2.0, 102.0, -52.0, 68.0, 4.0, -113.0, -93.0, 67.0, -94.0, -101.0, 97.0, 63.0, 104.0, -22.0, -20.0, 27.0, 99.0, -81.0, 34.0, 83.0, -5.0, 30.0, -81.0, -85.0, 72.0, 67.0, -116.0, 126.0, 78.0, 126.0, -63.0, 100.0, -32.0, -79.0, -100.0, -78.0, -8.0, 17.0, -82.0, -95.0, -73.0, -108.0, -114.0, -36.0, -47.0, 2.0, -56.0, -42.0, 52.0, 108.0, 17.0, 5.0, -122.0, -42.0, -24.0, -55.0, -112.0, -94.0, 73.0, 22.0, -15.0, 123.0, -51.0, -12.0, 71.0, 29.0, 94.0, -108.0, -115.0, -112.0, 87.0, 93.0, -57.0, 84.0, -75.0, -16.0, -128.0, 58.0, 76.0, -122.0, 0.0, -91.0, -127.0, -78.0, -27.0, -36.0, 53.0, 126.0, -32.0, -63.0, 102.0, 54.0, -92.0, -83.0, -107.0, -95.0, 115.0, 115.0, 1.0, -18.0, -5.0, 13.0, 11.0, 96.0, 16.0, 95.0, -20.0, 39.0, 14.0, -17.0, -30.0, -72.0, 107.0, 85.0, 108.0, 5.0, -112.0, 120.0, -123.0, 38.0, 89.0, -24.0, 106.0, -99.0, -99.0, 47.0, -44.0, -1.0, 67.0, -107.0, -82.0, 53.0, -43.0, -27.0, -5.0, 28.0, 55.0, 45.0, -77.0, 100.0, -48.0, -112.0, 90.0, -79.0, 72.0, 47.0, 62.0, -14.0, -36.0, -47.0, -46.0, 5.0, -108.0, 76.0, 93.0, 21.0, -3.0, -41.0, 22.0, 92.0, 99.0, 76.0, -33.0, 124.0, 80.0, -44.0, -89.0, -93.0, 2.0, 63.0, 125.0, 34.0, 77.0, 84.0, -75.0, -45.0, 10.0, -103.0, 105.0, 15.0, -68.0, 47.0, 67.0, -45.0, 24.0, -64.0, -78.0, 38.0, 117.0, -48.0, 66.0, -56.0, -26.0, -122.0, -33.0, 68.0, 120.0, -68.0, -53.0, 35.0, -50.0, -115.0, -63.0, -123.0, 7.0, 76.0, -106.0, -41.0, -31.0, 67.0, -95.0, -39.0, 16.0, -88.0, 112.0, -68.0, -51.0, -111.0, 45.0, -97.0, 123.0, -108.0, 38.0, 89.0, 60.0, 108.0, -22.0, -104.0, 20.0, -122.0, -40.0, -42.0, 40.0, 48.0, 73.0, 80.0, 121.0, 97.0, -31.0, 73.0, 126.0, -113.0, -1.0, 90.0, -32.0, -5.0, -30.0, 32.0, -97.0, 17.0, 14.0, -107.0, 123.0, 125.0, 68.0, 0.0, -44.0, 16.0, -78.0, -14.0, -12.0, -49.0, 97.0, -23.0, 91.0, -118.0, 83.0, 40.0, 82.0, -79.0, 99.0, 31.0, 24.0, -68.0, 126.0, -41.0, -95.0, 122.0, -88.0, 99.0, 27.0, 54.0, -101.0, -75.0, 92.0, -31.0, -46.0, 51.0, 103.0, -66.0, -26.0, -24.0, -55.0, -92.0, -27.0, -22.0, 38.0, 18.0, 73.0, -77.0, 37.0, -36.0, -104.0, 126.0, -70.0, -4.0, -14.0, 73.0, -30.0, -63.0, 74.0, -47.0, 76.0, -113.0, 108.0, -14.0, -44.0, -2.0, -112.0, -109.0, -94.0, 28.0, 101.0, -28.0, 117.0, 107.0, 66.0, -48.0, 108.0, 54.0, 80.0, -99.0, -13.0, 7.0, 9.0, -6.0, 114.0, -81.0, 31.0, -35.0, 71.0, 83.0, 34.0, 103.0, 26.0, -46.0, 60.0, 55.0, -53.0, -109.0, 95.0, 46.0, 96.0, 76.0, 20.0, 81.0, 120.0, -123.0, 0.0, 2.0, -8.0, 105.0, -99.0, -47.0, -90.0, -117.0, 39.0, 89.0, -89.0, -19.0, 4.0, -69.0, -88.0, 61.0, -85.0, -119.0, -106.0, -71.0, -35.0, 55.0, -101.0, -81.0, -117.0, -32.0, -37.0, 18.0, 120.0, 8.0, 33.0, -61.0, -57.0, 10.0, 48.0, 97.0, -7.0, 17.0, -93.0, 111.0, 83.0, -15.0, -43.0, 61.0, -25.0, -83.0, -126.0, -65.0, 1.0, 86.0, -71.0, -93.0, -60.0, 1.0, -51.0, 45.0, 20.0, -113.0, 76.0, -22.0, 41.0, -17.0, 62.0, -107.0, 28.0, -79.0, 113.0, -120.0, -17.0, 10.0, 25.0, 70.0, 119.0, -61.0, 10.0, 93.0, 113.0, 35.0, 21.0, -97.0, 69.0, 114.0, -69.0, -66.0, -118.0, -55.0, 46.0, 56.0, 23.0, -59.0, 38.0, -57.0, 53.0, 36.0, 18.0, -11.0, 89.0, 118.0, 54.0, 2.0, -92.0, -35.0, 53.0, 113.0, 65.0, 21.0, 105.0, -97.0, -3.0, -8.0, 74.0, -79.0, 77.0, 31.0, 17.0, 65.0, 114.0, -22.0, -31.0, -7.0, 69.0, -96.0, 64.0, 116.0, -2.0, -110.0, -88.0, -26.0, -42.0, 64.0, -108.0, -47.0, -87.0, -42.0, 126.0, 113.0, 37.0, -40.0, 74.0, -32.0, 11.0, -54.0, 7.0, -83.0, -89.0, 9.0, 71.0, -17.0, -85.0, -12.0, -81.0, 78.0, -76.0, -127.0, 38.0, -38.0, -103.0, 63.0, 53.0, 59.0, 10.0, 31.0, -124.0, 75.0, -51.0, 62.0, 6.0, 61.0, 125.0, 48.0, 113.0, -6.0, -33.0, 26.0, 125.0, 85.0, 61.0, -101.0, -52.0, 29.0, 39.0, -113.0, -57.0, 14.0, 10.0, 84.0, 85.0, -20.0, 49.0, -68.0, -99.0, 123.0, 1.0, 107.0, 60.0, -58.0, 23.0, 120.0, 3.0, -103.0, -92.0, 96.0, -115.0, 79.0, 112.0, 123.0, 26.0, 36.0, -116.0, 39.0, -101.0, -40.0, -83.0, 77.0, 115.0, -47.0, -62.0, -100.0, 33.0, -107.0, 37.0, -60.0, 69.0, -87.0, 98.0, -54.0, 67.0, 90.0, -34.0, -9.0, -58.0, 13.0, -124.0, 122.0, -45.0, -98.0, -18.0, -38.0, -80.0, -67.0, -91.0, 98.0, 91.0, 56.0, -58.0, -44.0, 51.0, 49.0, 22.0, 48.0, -37.0, 116.0, 79.0, 51.0, 120.0, -112.0, -10.0, -2.0, -50.0, 113.0, 63.0, 58.0, -60.0, 115.0, -86.0, 8.0, 126.0, 100.0, 63.0, 71.0, 124.0, 21.0, -116.0, 35.0, -24.0, -125.0, 102.0, -94.0, -25.0, 43.0, 1.0, -77.0, -114.0, -21.0, 60.0, -77.0, -28.0, 104.0, -85.0, 24.0, 88.0, -127.0, 117.0, -54.0, 33.0, -1.0, 111.0, 4.0, -74.0, 103.0, -100.0, 39.0, 23.0, 75.0, 57.0, 70.0, 55.0, -85.0, 1.0, 32.0, 95.0, -110.0, 2.0, -73.0, 42.0, -106.0, -62.0, 58.0, -9.0, -58.0, 30.0, -16.0, 100.0, 97.0, -52.0, 25.0, -69.0, 26.0, 24.0, 57.0, -101.0, 8.0, 98.0, 50.0, 83.0, 100.0, 39.0, -66.0, 64.0, -33.0, 112.0, 91.0, 104.0, -29.0, -119.0, -47.0, -91.0, 6.0, 43.0, -117.0, -13.0, -2.0, 27.0, -111.0, 25.0, 26.0, 105.0, 50.0, 121.0, 51.0, 55.0, 5.0, 111.0, 111.0, 126.0, 79.0, 102.0, 42.0, -54.0, -1.0, -4.0, 54.0, 73.0, 13.0, 89.0, 108.0, 35.0, -92.0, -57.0, 91.0, -63.0, 62.0, -87.0, 120.0, -51.0, -55.0, 83.0, 71.0, 121.0, 105.0, -58.0, -11.0, -21.0, -33.0, -57.0, 55.0, -115.0, -109.0, -118.0, 72.0, 127.0, 2.0, 103.0, -54.0, -62.0, 31.0, 51.0, -68.0, 79.0, -75.0, 46.0, 21.0, 113.0, -55.0, 66.0, 124.0, 77.0, -3.0, 125.0, -28.0, 23.0, -49.0, 102.0, -1.0, -49.0, -38.0, -79.0, -57.0, -37.0, 0.0, -108.0, -49.0, 124.0, 59.0, 74.0, -96.0, 45.0, 2.0, -91.0, -44.0, -40.0, 33.0, 24.0, -94.0, -101.0, -40.0, 16.0, 48.0, 79.0, 80.0, 10.0, -23.0, 58.0, -81.0, 26.0, -23.0, -70.0, -3.0, -120.0, 31.0, 39.0, -83.0, 49.0, -113.0, 117.0, -103.0, -14.0, -119.0, -87.0, -87.0, -94.0, 85.0, -56.0, 42.0, -112.0, -108.0, 44.0, 25.0, -121.0, -111.0, 22.0, -42.0, -79.0, -69.0, -29.0, 53.0, 10.0, 86.0, 43.0, -61.0, -32.0, -19.0, -40.0, 9.0, -81.0, -48.0, -81.0, 105.0, -108.0, 92.0, 118.0, -30.0, 1.0, -90.0, 32.0, 49.0, -3.0, -3.0, 52.0, 85.0, -89.0, 26.0, -31.0, 99.0, 126.0, -68.0, -104.0, -105.0, 21.0, -110.0, -10.0, -44.0, 11.0, 17.0, 51.0, -100.0, -47.0, -112.0, 17.0, 83.0, 99.0, -46.0, 43.0, -13.0, -12.0, 63.0, 32.0, 97.0, 87.0, -62.0, 59.0, 20.0, -85.0, 38.0, 33.0, 79.0, 6.0, -81.0, 1.0, -108.0, 99.0, 51.0, -125.0, -50.0, 24.0, -4.0, -108.0, 62.0, -119.0, 31.0, 0.0, -67.0, 29.0, -98.0, -56.0, -35.0, -72.0, 89.0, -112.0, 15.0, 11.0, -35.0, 33.0, -112.0, 116.0, -85.0, 77.0, -16.0, -57.0, 50.0, -25.0, 25.0, 16.0, 48.0, 109.0, 15.0, 93.0, 101.0, -57.0, -40.0, -2.0, 49.0, -77.0, 125.0, 70.0, 26.0, -105.0, 45.0, 35.0, 31.0, 43.0, -120.0, -83.0, 85.0, -54.0, -54.0, -2.0, -14.0, -49.0, -86.0, 123.0, -32.0, 120.0, 76.0, 110.0, 87.0, 118.0, -83.0, 74.0, -30.0, -118.0, 0.0, 103.0, -71.0, -55.0, 37.0, 97.0, -94.0, 110.0, -22.0, -14.0, -77.0, -103.0, -33.0, -102.0, 14.0, 32.0, -64.0, -48.0, 19.0, 26.0, 88.0, -18.0, -73.0, 44.0, 87.0, 68.0, 116.0, -31.0, -71.0, 113.0, -76.0, -80.0, 79.0, 16.0, -103.0, 102.0, 56.0, 117.0, -89.0, 23.0, -21.0, -23.0, -111.0, 118.0, 33.0, -41.0, -40.0, -29.0, -100.0, 117.0, 35.0, -119.0, -7.0, -67.0, 38.0, -115.0, -2.0, -27.0, -32.0, -34.0, -3.0, 82.0, -104.0, 5.0, 123.0, -110.0, 89.0, 104.0, 20.0, -10.0, 120.0, 3.0, 98.0, 39.0, 3.0, -103.0, -112.0, 18.0, -74.0, 21.0, -54.0, -78.0, 15.0, -79.0, 18.0, 34.0, -3.0, 93.0, 37.0, -25.0, 28.0, 76.0, 125.0, 1.0, -28.0, -106.0, -117.0, 24.0, 43.0, 20.0, 94.0, 4.0, 15.0, 59.0, -118.0, -85.0, -5.0, -46.0, -50.0, 106.0, -28.0, 51.0, 79.0, -59.0, -49.0, 115.0, -22.0, 80.0, 115.0, -108.0, -97.0, 25.0, 116.0, 61.0, 60.0, 101.0, 92.0, 89.0, -104.0, 60.0, 101.0, 58.0, -78.0, 42.0, 26.0, 100.0, -59.0, -5.0, -1.0, -16.0, -88.0, -5.0, -40.0, 33.0, 23.0, 122.0, -105.0, 23.0, -96.0, 58.0, -72.0, -68.0, -27.0, 79.0, 117.0, -19.0, -42.0, -110.0, 36.0, 92.0, 27.0, -63.0, -51.0, -7.0, -66.0, 112.0, -6.0, 116.0, -45.0, 56.0, -94.0, -33.0, 97.0, 67.0, 44.0, 74.0, -36.0, 60.0, -100.0, 103.0, 0.0, -64.0, -14.0, 89.0, 108.0, 97.0, -25.0, -25.0, 68.0, 62.0, 45.0, -55.0, -4.0, -73.0, 93.0, -49.0, -124.0, -94.0, -25.0, -20.0, -88.0, 85.0, -125.0, -25.0, 37.0, -63.0, 52.0, -104.0, 101.0, -28.0, -95.0, -47.0, 39.0, -47.0, -8.0, -61.0, -16.0, 102.0, 12.0, 110.0, 79.0, 26.0, 24.0, 38.0, -6.0, 77.0, -18.0, -18.0, -80.0, 2.0, 105.0, -77.0, 17.0, -92.0, 117.0, -114.0, 93.0, 95.0, -85.0, -41.0, -87.0, 50.0, -32.0, 112.0, 62.0, -98.0, 17.0, 63.0, 92.0, 14.0, -111.0, 27.0, 16.0, -116.0, 105.0, 114.0, 7.0, -93.0, -108.0, -5.0, -20.0, 102.0, -109.0, 75.0, 101.0, -49.0, 27.0, 81.0, -93.0, -37.0, -71.0, 123.0, 66.0, 97.0, -25.0, -93.0, -70.0, 58.0, 63.0, -86.0, 71.0, -89.0, 16.0, 49.0, -35.0, -71.0, -63.0, -59.0, 97.0, 29.0, 79.0, 49.0, 93.0, 30.0, 80.0, -96.0, 50.0, -87.0, -36.0, 67.0, -51.0, 61.0, 33.0, 11.0, -123.0, 55.0, -21.0, -113.0, 16.0, 44.0, -23.0, -14.0, -117.0, -76.0, -54.0, -77.0, 119.0, -118.0, -69.0, 15.0, 120.0, -7.0, -35.0, -89.0, 3.0, -109.0, 78.0, 39.0, -14.0, -108.0, -124.0, 94.0, 15.0, 5.0, -102.0, 13.0, 125.0, -15.0, 87.0, 92.0, 70.0, -56.0, -98.0, 0.0, 104.0, -55.0, -87.0, -88.0, 101.0, -115.0, -119.0, -104.0, -58.0, 99.0, 61.0, -45.0, 121.0, -110.0, -95.0, 75.0, 107.0, -40.0, 53.0, -124.0, 95.0, 1.0, 54.0, 55.0, 72.0, -121.0, 46.0, 44.0, 41.0, 119.0, 27.0, 69.0, -82.0, -67.0, -114.0, 100.0, 81.0, -21.0, 67.0, -2.0, -72.0, 37.0, 90.0, 117.0, -22.0, -38.0, -94.0, -67.0, -17.0, -128.0, -43.0, 43.0, 36.0, 46.0, -35.0, -125.0, -44.0, 48.0, 119.0, 38.0, 32.0, -10.0, 104.0, 13.0, 52.0, -97.0, -67.0, -119.0, -106.0, -128.0, -113.0, 56.0, -28.0, -82.0, -122.0, -9.0, -105.0, 36.0, 83.0, 77.0, 53.0, 19.0, -111.0, -100.0, 43.0, -64.0, 20.0, 37.0, 125.0, 15.0, -120.0, 52.0, 69.0, 106.0, 35.0, -36.0, 47.0, 70.0, 79.0, -23.0, 9.0, 28.0, -100.0, -22.0, 47.0, -117.0, -30.0, 57.0, 74.0, -31.0, 17.0, -100.0, -114.0, -47.0, 83.0, 82.0, 51.0, -66.0, 56.0, 64.0, 34.0, 9.0, 91.0, 13.0, 16.0, -8.0, 24.0, -24.0, -20.0, 16.0, -27.0, 5.0, -90.0, -101.0, -83.0, 77.0, 24.0, 75.0, -112.0, -76.0, -22.0, 25.0, 33.0, 36.0, 17.0, 126.0, 33.0, 16.0, 125.0, 115.0, -115.0, -124.0, 50.0, -76.0, 21.0, -100.0, -110.0, -89.0, 105.0, 25.0, 89.0, -6.0, -125.0, 114.0, 93.0, 96.0, -29.0, 16.0, -35.0, 5.0, 109.0, -41.0, -51.0, -90.0, -33.0, -15.0, 107.0, 28.0, -43.0, 114.0, -5.0, 66.0, 91.0, 58.0, 110.0, 108.0, -125.0, 31.0, 93.0, 78.0, -123.0, -16.0, -31.0, -85.0, -34.0, 101.0, 2.0, -11.0, -62.0, -69.0, 78.0, 111.0, 18.0, 34.0, -54.0, 113.0, 116.0, -102.0, -119.0, -85.0, 41.0, 114.0, 45.0, -103.0, 113.0, 62.0, -74.0, -120.0, -128.0, 1.0, -98.0, -12.0, 32.0, 74.0, -66.0, 28.0, 5.0, -58.0, -107.0, 29.0, -102.0, 49.0, 88.0, -81.0, -72.0, 90.0, 37.0, 56.0, 53.0, 31.0, 24.0, -11.0, 68.0, -127.0, 61.0, -19.0, 23.0, -25.0, -21.0, -100.0, 122.0, 64.0, 110.0, -7.0, 97.0, -68.0, 105.0, 90.0, 29.0, 120.0, 105.0, -53.0, -128.0, 40.0, -70.0, -94.0, -28.0, 61.0, -115.0, -44.0, -38.0, -110.0, 36.0, -93.0, 50.0, 120.0, 51.0, 12.0, 15.0, -62.0, -68.0, 100.0, -84.0, 59.0, 12.0, -21.0, 78.0, 3.0, 8.0, -56.0, -15.0, -59.0, -79.0, -123.0, 3.0, 31.0, 93.0, 91.0, -104.0, -98.0, -113.0, -28.0, 24.0, 124.0, 59.0, 95.0, -119.0, -126.0, -39.0, 124.0, 54.0, -47.0, -22.0, 33.0, -112.0, -58.0, -3.0, -104.0, -17.0, 80.0, 35.0, 20.0, 79.0, -102.0, 2.0, 110.0, 81.0, -49.0, 1.0, 106.0, -80.0, 71.0, -35.0, -96.0, -60.0, 96.0, 90.0, 55.0, 27.0, 83.0, 44.0, 85.0, -21.0, 50.0, 7.0, 85.0, -67.0, -51.0, -102.0, 40.0, -10.0, -35.0, 92.0, -91.0, 106.0, 64.0, 61.0, -33.0, -7.0, -52.0, -38.0, 3.0, -15.0, 110.0, 113.0, 70.0, 29.0, 80.0, -27.0, 51.0, 15.0, 92.0, 62.0, -111.0, 34.0, -53.0, 34.0, 72.0, 96.0, -20.0, 51.0, -12.0, 113.0, 9.0, -17.0, 6.0, 31.0, -88.0, -62.0, -66.0, -41.0, -30.0, 6.0, -59.0, 96.0, -7.0, 45.0, -15.0, 21.0, -23.0, 80.0, -48.0, -55.0, -73.0, -79.0, -109.0, -112.0, 40.0, 48.0, 43.0, -120.0, -6.0, -26.0, -43.0, 42.0, -100.0, -63.0, -41.0, -93.0, 2.0, 13.0, -5.0, -107.0, -115.0, 45.0, 92.0, 67.0, 99.0, -97.0, -1.0, 119.0, 65.0, 4.0, -70.0, 96.0, -66.0, 92.0, -51.0, 119.0, -15.0, -40.0, 104.0, -49.0, -111.0, -75.0, 43.0, -36.0, 62.0, 104.0, -67.0, 87.0, -63.0, -62.0, -110.0, -28.0, -8.0, -90.0, -117.0, -8.0, 8.0, -54.0, -53.0, 89.0, -116.0, -49.0, -122.0, 72.0, 102.0, 53.0, 69.0, -114.0, -27.0, 7.0, 25.0, -61.0, 52.0, 1.0, -40.0, 127.0, 116.0, -13.0, -126.0, -34.0, 108.0, 22.0, 61.0, 54.0, 96.0, 98.0, -88.0, -13.0, 24.0, -121.0, -76.0, 107.0, 117.0, 23.0, 92.0, 88.0, 68.0, 116.0, -95.0, -29.0, -56.0, -40.0, -68.0, 61.0, 73.0, 75.0, 45.0, -21.0, 43.0, -8.0, 64.0, -62.0, -40.0, -124.0, -17.0, -27.0, 112.0, -94.0, -63.0, 90.0, -93.0, 67.0, -48.0, -90.0, 58.0, 71.0, 77.0, 6.0, -97.0, -93.0, -56.0, 54.0, -72.0, 126.0, -9.0, -23.0, -25.0, 3.0, -51.0, -42.0, 36.0, -123.0, -128.0, 60.0, 34.0, 119.0, -86.0, 31.0, 69.0, -38.0, 112.0, -20.0, -40.0, 125.0, 60.0, 83.0, -27.0, 67.0, 9.0, -73.0, -122.0, -74.0, 78.0, 118.0, -73.0, 1.0, -34.0, 116.0, -2.0, 89.0, -49.0, 28.0, -98.0, -5.0, -32.0, 74.0, 45.0, -121.0, 101.0, -120.0, 110.0, 48.0, 111.0, 15.0, 93.0, -9.0, 44.0, 76.0, 21.0, -102.0, -66.0, -84.0, 88.0, 70.0, -107.0, 59.0, -48.0, -103.0, 17.0, 54.0, 8.0, 100.0, 2.0, -92.0, -94.0, 0.0, -85.0, -60.0, -60.0, -82.0, -107.0, -104.0, -122.0, -106.0, 116.0, 83.0, -48.0, -56.0, -24.0, -62.0, 53.0, 90.0, -92.0, 59.0, -77.0, 66.0, -60.0, 102.0, -12.0, -31.0, -71.0, -72.0, -83.0, -84.0, 68.0, -17.0, -19.0, -28.0, -54.0, 123.0, -74.0, -121.0, 32.0, -104.0, -94.0, 124.0, -97.0, 72.0, 12.0, -1.0, 26.0, -17.0, 80.0, 60.0, 122.0, 81.0, 80.0, -90.0, 58.0, 106.0, 112.0, -15.0, -88.0, -27.0, -22.0, 2.0, -113.0, 123.0, 121.0, 25.0, 45.0, -60.0, 83.0, -75.0, 7.0, 20.0, -98.0, -127.0, 43.0, 64.0, -42.0, 96.0, -71.0, 49.0, -103.0, 108.0, 100.0, 99.0, -104.0, -33.0, -26.0, 93.0, -37.0, 61.0, -99.0, 77.0, 70.0, -70.0, 56.0, -62.0, -54.0, -92.0, -68.0, 115.0, -116.0, 60.0, 0.0, 21.0, 116.0, -109.0, 50.0, -106.0, 43.0, 78.0, 34.0, -75.0, -50.0, -111.0, 115.0, 20.0, 75.0, 113.0, -109.0, -4.0, -86.0, -14.0, 112.0, 29.0, -69.0, 48.0, -91.0, -91.0, -106.0, -8.0, -32.0, 121.0, 100.0, -116.0, 24.0, 39.0, -24.0, 33.0, 32.0, 17.0, 20.0, 60.0, 46.0, -123.0, -58.0, 52.0, -28.0, -31.0, -124.0, 44.0, -31.0, 0.0, -11.0, -70.0, 98.0, 3.0, 14.0, -94.0, 34.0, -4.0, -99.0, -117.0, -57.0, 77.0, -111.0, 117.0, -34.0, -74.0, -55.0, 13.0, -79.0, -59.0, -107.0, -10.0, 19.0, -127.0, -24.0, 15.0, -120.0, 36.0, -23.0, -69.0, 7.0, -65.0, -85.0, -17.0, 5.0, 93.0, -92.0, 27.0, -108.0, -102.0, -2.0, 85.0, 69.0, -119.0, 93.0, -94.0, 126.0, -107.0, -45.0, -95.0, -98.0, -15.0, -3.0, -117.0, -13.0, 66.0, 26.0, 69.0, 16.0, 7.0, 85.0, 74.0, -67.0, -19.0, -51.0, -126.0, 2.0, -117.0, 74.0, 9.0, -39.0, -18.0, 86.0, -121.0, -12.0, 76.0, 45.0, 45.0, 97.0, 22.0, 7.0, -49.0, 5.0, -87.0, -50.0, 4.0, 105.0, -75.0, 20.0, -113.0, 92.0, 84.0, 71.0, -14.0, -57.0, -10.0, 23.0, 88.0, 64.0, -107.0, 50.0, 14.0, 21.0, 86.0, 37.0, 111.0, 46.0, 123.0, 79.0, -49.0, 105.0, 102.0, 118.0, -81.0, 85.0, 107.0, -56.0, 32.0, -20.0, -127.0, -25.0, -94.0, -19.0, -108.0, -91.0, 105.0, 61.0, -102.0, -42.0, -13.0, -62.0, -64.0, 3.0, 50.0, -66.0, -40.0, -2.0, -71.0, -77.0, 96.0, 31.0, 58.0, -70.0, -114.0, -102.0, -74.0, 86.0, 80.0, 49.0, -79.0, -50.0, 25.0, 66.0, -17.0, -113.0, -74.0, -17.0, -109.0, -94.0, 45.0, -60.0, -27.0, 98.0, 105.0, 61.0, 48.0, 37.0, -66.0, 13.0, -90.0, -42.0, 63.0, -91.0, 42.0, -51.0, -124.0, -117.0, 2.0, -61.0, 35.0, -112.0, -116.0, 16.0, 39.0, 104.0, -81.0, 64.0, -10.0, -26.0, 17.0, 78.0, 78.0};
+void* testInputVector[1] = {testInputVector0};
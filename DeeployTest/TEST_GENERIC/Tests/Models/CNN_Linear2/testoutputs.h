@@ -0,0 +1,4 @@
+#define OUTPUTTYPE int8_t
+#define ISOUTPUTFLOAT 0
+int8_t testOutputVector0[] ={72.0, 106.0, 127.0, 114.0, 76.0, 127.0, 96.0, 106.0, 52.0, 88.0, 0, 0};
+void* testOutputVector[1] = {testOutputVector0};
@@ -0,0 +1,688 @@
+#include <stdio.h>
+    #include <stdlib.h>
+    #include <math.h>
+    #include "DeeployBasicMath.h"
+
+    #include "Network.h"
+
+    int8_t* DeeployNetwork_input_0;
+int8_t* DeeployNetwork_output_0;
+static int8_t DeeployNetwork_conv_QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_0weight_tensor[432] = {7, 20, 7, 19, 6, 7, 12, -10, -21, -1, 17, 6, -18, 6, -21, 22, 14, 1, 24, 16, 20, -11, 4, 2, 19, -16, 12, 9, -19, 23, 7, 2, -10, 19, -11, 3, 20, -8, -22, 8, 1, -8, -5, 22, 14, -16, -9, 5, -24, 8, -21, -1, -13, 17, -19, 10, -4, -20, -10, -23, 6, -7, -8, -8, -11, 4, 10, 19, 13, 2, 19, -1, -9, -17, 13, 4, -19, -23, 1, -10, 25, -7, -12, -3, -14, -8, 17, -14, 24, 14, -7, 7, 17, 24, 19, -8, 23, -3, 1, -17, -17, 11, 12, 16, 10, 5, 16, 2, -5, -11, -18, -12, 10, -9, -21, 3, 1, -16, -15, -18, -10, -14, 5, -17, -22, 6, 25, 21, 4, 23, -5, -3, 5, -12, 20, -1, 13, -5, -16, -9, 14, -9, 4, 9, -10, 20, 5, -22, 9, 22, -11, 20, -23, -23, 16, 11, -3, -13, 8, -23, 12, -13, 19, -9, 17, 1, -20, 13, 0, 10, -17, 18, -23, -21, 11, 16, -3, -19, 23, 19, 6, -21, 1, 6, -5, 22, 4, -10, -14, 23, 22, -4, 22, 9, 2, 9, 19, -7, -3, 9, -19, 9, -19, -21, 20, -5, -16, -20, -15, 11, -1, 13, -20, 0, 14, -18, 17, 23, -10, -9, -24, 18, 5, 19, 6, -6, 12, 22, -11, 24, 21, 18, -20, -17, 15, -6, 17, -22, 9, 7, -5, 24, 13, -13, 21, -20, 4, -8, 11, 11, 17, 14, -18, -5, 13, 7, -8, -16, -3, 21, -1, -4, -14, 20, 21, -11, -13, -16, -20, 13, 23, -12, -3, 12, -17, 1, -5, -15, -18, 3, 24, 3, 1, -15, -2, -5, 24, -6, -14, -3, 4, -18, 23, 2, -21, -4, -6, 21, 2, 25, -1, 4, -18, 19, -10, -13, 8, 11, -20, 24, 15, -15, -4, -1, 17, 15, 18, 13, 15, 25, -22, -14, -5, 24, 5, -2, 12, 14, -1, -13, 20, -22, 14, 1, -20, -23, 9, -20, 0, -9, -24, -14, 17, 0, -15, 20, -8, 21, 8, 18, 18, 24, 19, 14, 1, 13, 21, -11, -16, 10, 6, -21, -7, -7, -23, 17, -1, 24, -2, 21, 13, 1, -19, -6, 13, 5, -8, -24, 1, 12, -6, 18, -3, 3, 8, 8, 25, -22, -2, -8, -9, -5, -11, -17, -19, -10, -10, -17, -1, -14, 22, -4, -21, 14, -3, -20, 16, -13, -15, 22, -16, -12, 6, -9, -23, -22, -7, 14, -10, 18, 16, 10, 24, 6, -11, 9, 6, 8, -12, -18, 13, -12};
+static int32_t DeeployNetwork_conv_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_0mul_tensor[16] = {64.0, 64.0, 64.0, 64.0, 64.0, 64.0, 64.0, 64.0, 64.0, 64.0, 64.0, 64.0, 64.0, 64.0, 64.0, 64.0};
+static int32_t DeeployNetwork_conv_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_0add_tensor[16] = {0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0};
+static int8_t DeeployNetwork_net0net0net_QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_1weight_tensor[512] = {25, 12, -4, 31, -25, 1, 7, 28, -17, 4, -17, 18, 26, 22, -4, -1, -21, -6, 30, -8, -8, 15, 29, 32, -26, 4, 7, 13, 9, -12, 5, 25, 17, -21, 20, -9, -24, -29, 19, 30, -24, -16, 2, 12, 24, 28, 28, -30, -6, -30, -28, -18, -13, -24, -7, 10, -11, -8, -14, 9, -21, -18, 4, 20, -9, -1, 8, 6, 5, -18, 18, -25, -13, 3, -30, 4, -10, -14, 1, 4, 4, -7, -17, -16, -11, -11, 22, -17, 5, -13, -14, 1, -8, 20, 27, 24, 0, 32, 22, 3, -12, 22, 28, -18, -10, 0, -2, 4, -6, 11, 26, -25, 11, -19, -8, -2, -30, 18, 16, -19, -16, -6, 29, 26, -6, -30, -31, 5, 16, 2, 18, 1, 7, -29, 0, -23, -9, 7, -2, 1, -16, 29, 9, 9, 4, -18, 27, 12, 28, 13, 0, -29, 20, -31, 21, 24, 2, -20, -19, 26, -27, -24, -11, -3, -27, 10, -1, -21, 27, -7, 5, 25, -7, -15, 26, -23, -7, -1, -11, -31, -3, -18, 7, 30, 14, 5, 16, -22, -12, 14, -3, -30, -15, 9, 30, -29, -9, 15, -24, 13, -18, 13, 15, -14, -8, -5, -12, 10, 1, -15, 19, 14, -9, -23, 18, -25, 26, 11, 20, -3, -4, 7, 25, -12, -23, -14, 22, 23, -13, -9, 11, -10, 1, 4, 11, 6, -20, 21, 11, 28, 9, 14, -30, -6, 18, -1, -3, -11, -29, 14, -24, 10, -24, -17, 27, 7, -17, -28, -27, 16, 32, -21, -15, 4, 1, 9, -4, -18, 29, -28, 9, 30, 1, -19, -26, 28, -6, 16, 14, 24, -18, -3, -7, -23, 3, 11, 18, 3, 3, 31, 30, -8, 10, 31, -26, -31, 5, 19, -18, -2, -12, -11, -8, -22, 3, -3, 9, -16, -1, 21, -4, -7, -3, -8, 15, -18, -21, 25, -9, 23, 30, -9, -9, 31, 2, -22, 21, 30, 4, -14, -24, -12, -9, 32, -18, 13, 20, 29, -25, 30, -2, -10, -23, 29, 28, -3, -14, 2, 0, 5, -31, -16, -3, -23, -16, 0, 23, -30, -11, 12, 30, 12, -24, 10, -4, -3, -31, 32, -13, -1, 22, -13, 32, -12, 2, -6, 21, 31, 2, -11, 31, -17, 5, -13, 20, 19, -29, 6, 23, -23, 21, 12, -13, -12, 28, -15, -31, 10, -17, 24, 26, -11, 12, -7, -7, 29, -18, 11, -30, 10, 10, -22, -14, 24, -10, -9, -1, 23, 17, 3, -8, 14, 4, 23, 1, -19, -29, -30, 13, 29, -16, -7, -5, 20, 26, -8, 18, -4, -20, -17, 15, 14, -9, 23, 13, 18, 23, -30, 3, 20, -14, 15, 22, 14, -13, -1, 19, 12, 28, -3, 4, -16, 1, 20, 13, -6, 21, -1, -26, 24, 11, -29, 10, -23, 11, 23, 11, -26, 31, 14, 11, 6, -23, 27, 17, -11, 1, -13, -9, 19, 7, 23, -25, 25, 11, -4, -24, 8, -24, 14, -20, 30, -18, 16, 6, 12, -13, 6, 19, 6, -9, 31};
+static int32_t DeeployNetwork_net0net0net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1mul_tensor[32] = {129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0};
+static int32_t DeeployNetwork_net0net0net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1add_tensor[32] = {0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0};
+static int8_t DeeployNetwork_net0net0net_QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_2weight_tensor[288] = {3, -23, -36, 31, 19, -30, 16, 6, -25, -39, -4, -5, 10, -28, -35, 43, 30, -6, -2, 32, -8, 28, 4, -36, -22, 18, 19, 26, -21, -19, 38, -33, -32, -14, 6, -34, 25, 0, -38, -32, -36, -32, -3, 7, -11, -2, -22, 31, 23, 19, 8, 7, -21, 15, 29, -23, -13, 16, 1, 33, -10, 28, -27, -20, 15, 13, -32, -32, 38, 41, -18, 42, 9, -33, 18, 13, -41, 33, 9, 35, -19, -22, 8, 14, -13, 30, 18, -6, 9, -18, -13, -42, -40, 40, 24, 29, -1, -3, -22, -26, 26, 30, -7, -10, 34, 9, -2, -22, 27, 34, 28, 8, 28, 26, -34, 27, -27, 23, -14, -32, 14, 30, 19, 31, 23, -24, 27, 39, 28, 24, 2, -34, 22, -29, 35, 29, -36, 30, -41, 25, 35, 26, 15, 31, -17, -20, 29, 38, 7, -1, 37, 37, 39, -38, 0, 37, 3, 7, 23, 5, -20, -5, -26, -12, 24, -37, -6, 37, -9, 38, -25, -30, 3, 32, -23, 40, -32, -36, 7, 37, 22, -8, 8, -36, 23, -32, 39, 36, -27, -35, -28, 27, -5, -10, 14, 12, 39, 23, 17, -19, -22, -36, -35, -23, 28, -22, 42, -24, 7, -24, 20, -32, 15, 40, 21, -4, -10, 33, 36, 18, 30, 29, -27, 17, 2, -7, 9, 12, 18, 9, -20, 34, 11, -4, 0, -18, 12, 41, 41, 22, 11, 17, 32, -36, -35, -3, -21, -37, -22, 17, 25, 11, 19, 30, -13, 30, 1, -36, 17, 16, 25, 41, -16, -31, -10, -37, 36, -2, -23, -28, -18, -8, -41, 30, 29, -27, -31, -24, 14, -41, 35, -18, 21, -37, 7, 25, 40, 37};
+static int8_t DeeployNetwork_net0net0net_QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_3weight_tensor[512] = {-11, -20, 10, 7, 4, -20, -8, -4, -5, -4, -1, -15, 18, 13, 22, -16, 13, -10, -1, 5, -7, 0, 16, -9, -2, 14, -19, 11, -10, -1, 15, 13, -8, -17, -1, -6, -20, 8, -13, 1, -14, 5, 0, -18, 8, -2, -2, -1, 13, 16, 0, 0, 13, 1, -17, -6, -20, 18, 10, 14, 4, -14, 9, -7, -3, 10, -17, 15, -12, -4, 9, 12, -11, -8, 4, -1, -16, -5, 4, -8, -17, 0, -14, 8, 8, -1, -20, 13, 12, 8, -13, 14, -9, 17, -16, 18, -17, -19, -4, -18, 8, 16, -19, -12, -8, -20, 6, -11, 1, 2, 10, -18, -11, -8, -7, -19, 16, 13, -15, -15, -1, -3, -1, 1, 7, 2, 22, -16, -16, 16, 17, -10, 20, 2, -9, -3, 0, -6, -7, 22, -14, -15, -20, -12, -2, 20, -1, -8, -9, -8, 9, 0, -10, 11, 14, -16, -2, 20, -12, 10, -2, -3, 14, 22, 11, 8, -13, 2, -16, 8, -4, 1, -9, 15, 11, 3, 9, -15, -18, 12, 0, -21, -15, -10, -20, 21, 7, -17, -9, 18, 3, -8, 1, -11, -12, 18, 19, -11, 4, 17, -7, -8, 12, -19, -18, -11, 4, 19, 6, 11, 2, 4, -10, 3, 2, 17, 18, 20, 2, 1, 10, -19, -19, 13, 6, 9, 15, -21, -22, 21, 5, -10, -11, 7, 1, 9, 22, -17, 3, -17, 17, 22, -16, -1, 5, 8, 20, -14, 6, -5, 14, -11, 5, 4, 12, 19, 1, 4, -18, 20, 7, 16, -3, 15, -14, -13, 4, 14, 0, -10, 1, 8, 15, -3, 5, 13, 6, 10, 15, -15, 11, 12, 13, -17, 23, -14, 8, -9, -11, -6, -17, 1, 22, 3, -18, 22, -21, 11, -18, 7, -10, 4, 8, -14, -21, -20, -15, -3, -13, -19, -19, 5, 23, -13, 23, 2, 22, -20, 10, 6, 10, 15, 0, 17, 21, -15, -13, -3, -9, 16, 6, 19, -5, -12, 17, -16, 16, -7, -5, -2, -4, -19, 13, 12, 13, 9, 15, -10, 12, 18, -18, 7, 1, -16, 20, -3, 15, -6, 6, 13, -6, -16, -2, -2, 8, 12, -2, -15, 23, 15, 10, -9, 11, 19, 5, 2, 5, 0, 12, -8, -6, 15, -18, 16, -1, -19, -13, -5, -16, -18, 12, -3, -5, -2, 0, 18, 11, 6, -6, 6, -1, -7, -2, 21, -22, 13, -13, 6, 0, 3, 20, -9, 16, -9, 21, -19, 1, -1, -19, -13, 9, -14, -9, 9, 11, -1, -8, 9, 14, -22, -1, 12, -20, 10, 2, 3, 3, -21, 7, 5, 12, -14, 15, 13, -19, 20, -8, 12, 1, -10, 2, 2, 3, 14, 9, -15, -16, 21, -4, 15, 18, -11, 0, 0, 5, -4, 2, -8, -8, 22, -3, 14, 19, 23, 22, 6, 0, -7, -1, -1, 4, -5, 5, 3, -17, 6, 1, -1, 9, 5, 15, 23, 7, 6, 13, 6, 6, -19, 17, 18, -12, -5, -5, -19, 13, -11, -15, 20, -5, 16, -11, -16};
+static int32_t DeeployNetwork_net0net0net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_3mul_tensor[16] = {129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0};
+static int8_t DeeployNetwork_net0net1net_QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_4weight_tensor[512] = {19, 27, -10, 5, 11, -10, -27, 15, -19, 32, 19, 15, -28, 5, -9, -27, 31, -10, 22, -31, -30, -23, 28, -31, -31, -3, -10, 21, -22, 2, -21, -27, 31, -21, -14, -2, 26, 4, -30, 8, -23, 19, -27, 30, 29, 16, 1, -23, -23, 23, 11, 18, -31, 2, 24, 10, -12, 12, 22, -9, 10, -25, -30, 26, -16, 7, 31, 20, -18, 12, -17, -21, 29, -6, 8, 17, -18, -23, -26, -18, -8, -15, -14, 18, -28, 3, 6, 32, 20, 23, 22, -19, -29, 28, -14, -3, 2, 7, -7, -10, -18, 27, 24, 4, -16, 5, -31, -26, 19, -13, 19, -31, -23, -14, 22, -2, -18, -21, -7, 24, 22, 2, 16, 12, 19, 16, -23, -9, -28, -20, 32, 27, -24, -4, 22, 22, 29, -6, -1, 2, -23, -13, 26, -19, -13, -13, 29, 31, 21, 16, -7, 14, -3, 9, 20, 13, 3, 21, -17, 0, 11, -3, 18, -28, -3, -20, -13, -7, -17, 17, 5, -1, -23, 12, -23, 23, -30, 9, -8, 18, 20, 21, -1, 19, 31, -27, 17, 6, -4, -30, -13, -9, 21, -4, -3, 11, 1, 2, 3, 8, -18, -13, -16, 26, 27, 25, -29, -21, 4, 27, -15, 8, -7, -12, 17, 12, -20, -18, -5, 19, 4, -27, 23, -28, 27, 10, -16, 30, 13, -1, -23, 21, -27, -27, 12, -14, -3, 14, -3, -29, 11, -8, 20, 5, 29, -4, 15, -11, 10, 6, 24, 7, -1, 27, -7, 20, 26, 10, 26, -1, 30, 0, 28, -15, -1, -6, 0, -8, -21, 13, -9, 25, -13, -19, -11, -24, -2, 15, -21, -22, 6, -30, 26, -22, -25, -16, 28, 23, 16, 16, -4, 3, 6, -31, -1, -29, -14, -13, 28, -29, 3, -14, 27, -18, 20, -5, -16, 27, -14, -11, -31, 25, 21, 9, -12, 32, -22, 3, 3, -20, 19, -18, 7, -21, -14, 22, 22, 8, 28, 25, -17, -20, 23, 3, 7, 18, -30, 0, 0, 20, 8, 13, 28, 25, -30, 10, -31, 9, 15, -9, 28, -22, -27, -17, 4, 3, 3, -6, 10, -2, 15, -1, 19, -15, -10, -27, -9, -22, 1, 0, 17, 22, 1, -12, -16, 9, -4, -16, -16, -23, 19, 20, 8, -22, -9, -16, -30, -11, 20, 3, -27, -6, -21, 30, 26, 17, 32, 32, 32, -16, -19, 28, 23, -5, -26, 13, 18, 3, -21, 27, 26, 3, 31, 28, 31, 18, 15, 18, -17, -17, 27, -8, 0, 15, -25, -18, -29, -3, 21, -2, 32, -14, -7, -13, 3, -17, -5, -27, 9, 1, -18, 25, -28, 1, 8, -4, -10, -18, -8, -22, -25, -25, -7, -30, -16, -2, -23, 8, -12, 29, -30, -4, 30, -20, 27, 15, -28, -13, -7, -21, -7, 4, -5, 21, 7, -19, 20, 2, 5, 13, -26, 2, -18, -11, 5, 8, -4, -1, -25, -16, 24, 9, -6, 31, -8, 28, -28, 22, 30, 8, 20, -1, -9, 17, -2, -28, 27, -8, -31, 11, 1, -25};
+static int8_t DeeployNetwork_net0net1net_QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_5weight_tensor[288] = {-11, -10, -22, 9, -9, 7, 15, -24, 21, 39, -27, 9, -17, -40, -14, 0, -27, -26, 24, -37, 27, -3, 20, -38, 33, -1, -19, -23, 29, -35, -29, 27, -35, 36, 34, 39, -14, 8, -25, -34, 25, 0, -8, -15, 13, -27, 19, 27, 39, -33, 4, -14, -6, -22, -19, 18, 1, 13, -30, 34, 3, 28, 25, 22, 5, -16, 23, -17, 30, -4, -24, -12, -12, -2, -13, 30, -6, -3, 14, 32, -5, -38, -31, 29, -40, 2, -2, 16, 0, 34, 31, -23, 7, 8, 16, 38, -36, -14, -12, -29, -2, 21, -30, -37, -26, -4, -27, 16, -37, 13, -18, 11, 29, -33, 30, 5, 20, -40, -2, 20, 18, 19, 14, 41, -17, -7, -10, 34, -2, 15, -20, 12, -6, -21, 36, -16, -8, -30, -24, -26, 39, -33, -1, -32, 31, 11, 12, -33, 5, -34, -40, -41, 26, 20, 14, 41, 15, 19, 42, 20, -30, -5, 17, 21, -42, 21, -1, 32, 27, 2, -16, -8, 20, -20, 11, 31, 22, -2, -28, 1, -8, 7, -13, -1, 15, -42, 38, -18, -36, 38, 10, -24, 19, 34, -25, 7, 30, 18, -29, 38, 19, 18, -3, 16, 25, 39, -4, -18, 36, 38, 37, -31, 1, 4, -7, -31, 2, -1, -38, 2, 27, 19, -10, 32, 42, 1, 15, 20, -16, 3, -12, 38, 25, -10, 20, 33, 26, 23, 15, -36, 2, -7, -38, 21, 15, -37, 30, -37, -32, -33, 42, 6, -38, 38, 26, 1, 25, 13, -5, 33, -6, 28, -22, -4, -17, 3, -21, -11, 0, -22, 32, -3, 5, -36, 42, -41, 23, -31, 39, 1, 28, -36, -21, 20, -11, 30, 13, 21};
+static int8_t DeeployNetwork_net0net1net_QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_6weight_tensor[512] = {-17, -17, 10, -5, 16, -13, -21, 21, 8, -17, 5, -14, 12, -6, -3, 4, 11, 7, 13, 9, -17, 1, 7, -22, -22, 9, 5, 12, -12, 13, 6, 21, -11, -17, 4, 0, -5, 21, 15, 11, -12, 21, -5, 12, 22, 12, 8, 19, 6, -15, -1, -12, 19, -5, -7, -8, 0, -9, -8, -19, -3, -16, -3, 8, -22, -8, 10, -10, 14, 3, 10, 17, -10, 11, -21, -11, -6, -9, -18, -18, 4, -20, 13, -22, 18, -10, -12, -17, -2, 9, 17, -15, 3, 22, -7, -14, 19, -3, -19, 21, 14, -18, -1, 13, -4, 3, -2, 5, -6, -5, -11, 15, 0, 9, 10, 2, -19, 0, -20, 4, 17, 16, 1, -2, -9, 1, 17, -21, -12, -8, -17, -13, 5, -14, -14, 0, 18, 0, -6, -15, -12, -2, 12, -13, 13, 11, 11, -12, 10, -8, 22, 0, 0, -3, 3, 6, 7, -11, -14, -6, 5, -8, 18, 5, 1, -17, -15, 18, 22, -5, 19, 4, 9, 8, -20, -10, 8, 17, -4, 7, 2, 0, -1, 21, -2, 7, 12, 14, -13, 7, -16, -20, 6, -9, -8, -11, 20, -2, -1, 13, 23, 11, -19, 3, 20, -5, 12, -9, -20, -8, -16, 2, -5, -2, -19, 23, 5, -2, 6, 12, 22, 4, 8, 21, -16, 1, 6, 16, 20, -7, -9, 16, 18, -20, 5, 3, -16, 14, -9, -7, -5, 8, -8, 17, 2, 13, 17, -5, -22, -10, -10, -16, -18, -14, -19, 11, 0, -21, 1, 2, 1, -20, 19, -7, -1, 5, 7, 6, 6, -3, -13, 16, 5, 2, -20, 1, -9, 12, -19, 2, 3, 0, 4, -20, -15, 22, 14, -1, -17, -5, -9, -11, 5, -9, 12, 17, -10, 13, 6, -19, -17, -21, 13, 18, 9, -8, 14, -9, 3, 18, 8, -15, 6, -14, -10, 1, 2, -9, 20, -12, 18, -16, 22, 14, -11, -19, 12, -13, 8, 17, 17, -22, 1, -5, 9, -20, -2, -13, -7, -9, -21, 2, -6, -1, -7, 15, -4, 21, 7, 4, -10, 15, -14, -6, -18, -20, 6, 19, -15, -15, 11, 16, 3, -14, 23, -2, 0, -10, 0, -20, 2, -7, -8, 10, 12, 2, -12, -4, 19, 5, -5, -6, -4, 7, 13, 11, 21, 3, 16, 5, -5, -2, 1, -13, -11, -4, 1, -3, -10, 0, 14, -11, -12, 7, 17, -19, -12, -7, -9, 20, -17, -2, 11, 8, 20, 2, -5, 6, -18, -6, -10, -3, -19, -2, 3, -5, -15, -18, 0, 11, 17, -8, 13, -6, -4, -8, 3, -6, 8, -9, -8, 8, -1, 3, -15, -7, 2, 22, -12, 19, -16, -18, -8, 20, 16, 22, -7, -2, 19, -19, -16, -17, -7, 8, -13, -22, 14, -14, 20, 19, -15, -21, 1, 1, -1, -21, 16, -7, 9, 21, 23, 7, -11, 5, 1, 1, -10, 1, -21, -11, -14, 15, 9, -8, 0, 21, -16, 19, 7, -10, 15, -3, 1, 4, -22, -9, -5, 9, 13, 4, -10, -10};
+static int32_t DeeployNetwork_net0net1net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_6mul_tensor[16] = {129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0};
+static int32_t DeeployNetwork_net0net1net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_6add_tensor[16] = {0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0};
+static int32_t DeeployNetwork__QL_OP_TREE_REPLACE_ADDITION_0acts_QL_REPLACED__INTEGERIZE_SIGNED_ACT_PASS_0mul_tensor[1] = {16384.0};
+static int32_t DeeployNetwork__QL_OP_TREE_REPLACE_ADDITION_0acts_QL_REPLACED__INTEGERIZE_SIGNED_ACT_PASS_0add_tensor[1] = {0.0};
+static int8_t DeeployNetwork_net0net2net_QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_7weight_tensor[512] = {-11, -3, 17, -4, -13, 27, -10, 11, -23, -28, 20, 8, 26, -22, 2, 1, 0, 28, 14, 2, -3, -12, -11, -26, -17, -29, 29, -31, -24, -24, -1, -5, 0, -8, 1, -12, 17, 15, 29, 4, -22, -27, -20, -7, 23, 27, 29, -12, 3, -21, 3, 32, 9, -1, -1, -19, -8, -7, -1, 9, 2, 15, -6, -30, 29, -24, -8, -23, 31, -9, 10, -15, 11, -23, 19, -4, 7, 19, 28, 15, 22, 21, 7, 15, 2, -8, 19, -29, 11, -15, 18, 32, 19, -28, -24, 0, 3, 13, -10, -9, 20, -17, 5, -18, -16, 29, 25, 24, 7, -18, -3, -10, -21, -3, 11, -5, 10, 13, 8, -26, -2, -30, 20, 9, 18, -28, 21, -9, 12, -25, -2, 16, -15, -16, -24, 31, 14, 3, 19, 2, 29, -15, 17, 13, -5, -13, 20, -1, -10, -23, 27, -8, -29, 32, -17, -3, -4, -2, 21, -20, -21, 21, 29, 3, 21, -13, 17, -1, -25, -19, 7, -13, 31, 9, 28, 26, -13, 29, 10, -21, -16, -27, -5, -13, 15, -21, 3, -20, -23, 23, -5, -16, -27, -17, 25, -21, 13, 15, -16, 30, 31, 0, -31, -4, 20, -2, -22, -15, 10, -27, 19, -6, 5, -30, -16, -5, -13, 22, -19, 3, -8, 4, 12, -18, 4, 29, 30, -10, -7, 31, -28, -3, -21, -29, -18, 1, -18, -28, -14, 16, -6, 29, -10, 4, 9, -20, 2, 12, 10, 29, 23, -30, -21, 24, 24, 7, 13, -3, 24, 3, 16, -19, 29, -19, -29, -11, -11, 3, -10, -15, 15, 2, 12, 2, -4, -28, -20, -24, -13, 12, -22, 5, 6, 6, 24, -19, -31, 27, -11, 2, 7, 21, -18, -14, 24, -4, -20, 13, 30, -7, 19, -26, 27, -6, 25, -17, 3, -14, 21, 27, -13, 1, 7, 22, 19, -6, -9, 21, 0, -17, -23, -24, -28, -28, 12, 25, 8, -17, 5, -9, 2, 29, -8, 3, -18, -21, -29, 13, -4, -9, 10, 29, 13, -31, -11, 18, 9, -24, -12, -20, 21, -15, -4, -21, -6, 0, 8, 28, -23, 14, 4, -21, 21, -9, 25, -6, 11, 26, -7, -9, 5, 25, 18, 28, 2, 14, 31, 27, -10, 15, -6, -18, 4, 20, 19, 7, 17, 20, 9, 19, -22, -23, 4, -31, -12, 1, -15, 7, -25, -13, 5, 1, 30, 20, 5, -22, 18, -21, -31, 0, 3, -18, -7, 9, 15, 29, -22, 3, 23, -31, -18, -6, -9, -7, -8, -11, 12, -10, 16, 21, -2, -17, 16, -21, 11, 29, -15, -31, 6, 21, -15, 28, -14, 9, 25, -20, 22, 21, 16, -25, 11, 13, 20, 2, -28, 4, 14, 21, 11, 19, -27, 6, -6, -30, -20, 32, -7, 23, -27, 31, -25, 22, 22, 3, 25, -5, 7, 20, -7, -26, 22, 21, 30, 23, -10, -3, 2, -3, 12, -25, 4, 11, -11, -23, 11, -24, -24, -28, 11, -11, 16, -11, -2, 21, 27, 12, -13, 20, -29, 17, 5, -23};
+static int8_t DeeployNetwork_net0net2net_QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_8weight_tensor[288] = {9, 0, -5, 42, 23, -32, -21, -39, -27, -15, -18, -16, -32, -6, -17, -19, 25, 20, -28, -6, 40, -18, -10, 17, -8, 7, -17, 24, 14, -15, -28, -24, -35, 38, 15, -12, 33, -3, -36, -7, 11, -3, 23, 42, 3, 25, -8, 18, 40, -22, -35, 21, 27, 34, 25, 6, -35, 22, -34, 19, 17, -33, 7, -27, -17, 5, -42, -7, 22, 11, 23, 24, -29, 38, 4, -13, 0, 14, -12, -3, -28, 22, -7, -15, -12, 31, 21, -18, 20, -41, -26, -9, -31, 13, -10, -41, 10, -42, 10, 20, -13, 25, 3, 16, -5, -33, 28, -17, -14, 0, 22, 19, -28, -31, -34, 17, 1, 36, 8, -25, 23, -14, -8, 27, -37, 18, 1, -8, -9, 10, 33, -11, -35, -36, 9, 37, -24, 32, 18, 13, -32, -14, -13, 21, -21, -32, -24, -24, -23, 29, -12, -17, 3, -29, -2, 5, 0, 8, 21, -7, -24, 32, -38, -24, -23, 30, -17, 20, -39, 25, 42, 11, 17, 16, -38, -21, 10, -28, -8, 0, 2, 17, -18, 40, 16, -35, 16, -33, -28, 38, 34, -23, -11, -12, -11, 19, 13, 6, -4, 29, -24, -21, -4, -42, 37, 1, 35, 9, 25, 11, -39, -22, 13, -25, 41, -22, -19, 9, 13, -23, -14, 9, 10, -32, -6, 21, 14, -7, 5, 25, 11, 1, -3, 4, -22, 0, 20, 6, 29, 14, -27, 21, -38, 36, -20, 9, 33, 38, -20, 21, -8, 12, -17, -20, 37, -40, 36, -15, -33, 38, -18, -22, -11, -35, -27, 5, 2, 29, -24, 19, -27, -28, -17, -8, -35, 14, 0, 4, -24, 34, -20, 18, 8, 19, -12, 39, -9, 14};
+static int8_t DeeployNetwork_net0net2net_QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_9weight_tensor[1024] = {12, 3, -4, 21, -8, 20, 11, -4, -7, -17, -16, 1, 7, 21, -7, -20, 12, -7, 14, 19, 18, -9, 11, 1, 17, 16, 22, 7, 19, 13, 18, 0, -6, 0, -18, 22, 15, -4, 19, 19, 4, -7, -11, -1, -12, 21, -10, -1, -16, 18, -5, -10, 23, 10, -8, -22, 20, -19, -21, -22, 15, -15, 1, 6, 16, 15, -7, 5, 4, -19, 10, -1, -17, 5, -1, 17, 18, -22, -2, 0, 18, 16, -4, -12, -17, -19, -12, -18, 20, -14, -7, 9, 12, 23, 10, 8, -12, 15, -2, -19, 22, 11, -22, 14, 11, 12, -14, 1, 12, 4, 11, -15, 20, 23, -13, 22, -17, -19, 16, -14, -12, 10, -7, -15, -12, -3, -8, 19, 2, -8, 20, 15, -8, 17, -2, 13, 10, -19, -14, -21, 4, -8, -15, 17, -16, -6, -20, -4, -3, 6, 12, 18, -9, 21, 9, 18, 15, -18, 22, 4, -13, 9, -14, 14, 23, 9, 4, -20, -19, -1, 3, 23, -13, -7, 5, 10, 9, -22, 2, 5, 21, 17, 12, -22, -16, 19, 5, 5, 3, -11, -18, 17, 14, -13, -20, -6, 6, 9, -16, -9, -12, -12, 23, -3, -16, -18, 18, 2, 20, 18, 4, 18, 15, 23, -16, -14, 9, 6, 7, 20, 17, 19, 8, 23, 16, -17, 10, 18, -9, 17, 8, -3, 18, -4, -5, 6, -19, -3, 16, 20, -5, 8, 14, 2, 10, 16, -13, -19, 14, -20, 16, 22, 14, -18, 1, 2, 4, -13, -21, 21, -22, -12, 16, -12, 4, -4, 8, -5, 9, 4, 2, -15, 15, -16, 2, 0, -8, -10, -10, -18, -3, 14, -1, 19, 22, 23, 15, -18, -16, -17, 10, 14, 2, 20, 3, 9, 21, -11, 21, -5, 14, 2, 5, 3, 16, 3, 13, -11, 22, 16, -22, -9, 22, -8, -8, -11, 6, -9, -5, -7, -21, -5, -13, 13, 2, -19, -21, -8, 21, 16, -22, 11, -11, -8, -20, -21, 0, 1, 4, 7, -7, -7, 6, 22, 6, -16, -5, 15, 19, 5, -3, -13, 20, 14, 2, -18, 20, -10, 6, 22, 22, 23, -13, -9, 6, 14, 1, -21, 2, 11, -3, -17, 6, -15, 16, 21, 13, -9, 3, -7, -19, 16, 5, -12, 1, -17, -4, 17, -8, 19, 21, -4, 0, -15, -16, -20, 19, 5, 8, 5, -2, -7, 15, 15, 18, 13, 3, 9, -8, 1, 16, 7, 12, -21, 2, -1, -1, -21, -6, -7, 18, -5, -21, 19, 2, -11, -15, -1, -11, 15, -19, -8, 21, 18, -20, -7, 6, 7, 14, -7, 16, 20, -15, -1, 13, 18, 16, 10, 22, 9, -11, -3, 9, 12, 21, -13, 6, -21, 12, 8, -3, -4, 7, 19, -10, -12, -10, 5, -6, 7, 15, -6, 16, 1, -1, 8, 11, 7, 5, 12, -21, 6, 18, -3, -17, 17, 1, 5, 15, 17, 15, 12, -21, 5, -19, -13, 3, 8, -9, -10, -3, 12, 3, -18, -22, 4, 23, 21, -7, -12, -14, 19, 6, -14, -22, 2, 11, 5, 10, 10, -11, 6, 20, 14, 17, 5, 13, 13, -9, 17, -16, 22, -8, 0, 5, -14, 7, -13, -21, -13, -16, -4, 15, 10, 13, 17, 19, 19, 9, 20, -4, -4, 15, -8, -1, 16, -10, -11, -16, 8, -16, 16, -14, 4, -7, -12, -1, 4, 6, 9, 0, 8, 13, -12, -16, 20, -20, 14, 6, -4, -21, -7, -14, -4, -18, 2, -1, -11, 3, -18, 9, 18, 14, 5, 2, 6, -11, -16, 0, -3, -4, 3, -7, -10, 10, 15, 7, 8, 4, -12, 16, -3, 8, -16, -1, 7, -5, 11, -3, 2, 4, 1, -5, -8, -20, 8, 20, 14, -4, -15, -7, -18, 2, -18, -13, 2, -13, 2, 5, 19, 21, 7, 6, -19, -16, 17, 12, -14, -9, 23, -11, 6, -6, -14, 14, -17, -1, -15, -17, 8, -21, 0, 12, -22, 3, 1, -13, 6, 2, 19, -6, -3, 22, -2, 9, -8, 1, 7, -15, 3, 23, -20, 13, 14, -8, 13, 12, -12, -18, -6, -10, -6, -7, -3, -6, -7, -4, 23, -9, -7, 13, 19, -21, 0, -4, 5, 2, 5, -1, 4, -7, 4, -9, -20, 0, -11, -4, -17, 4, 7, -2, -4, 16, 5, 0, -16, 1, 20, 12, -15, -10, 3, -17, 16, 2, -2, 10, 20, -3, -2, 8, -15, -21, -9, -18, -15, 21, 1, 8, 15, 4, 1, -3, 1, 4, 7, 3, 4, 13, 16, -10, 21, -2, 7, -3, -3, 13, 17, 19, 3, 1, -18, 21, -4, 23, -2, 6, -13, 5, -11, 1, -4, -19, -17, 21, -1, 20, 15, 20, -18, -21, 15, 1, 2, -7, 10, 11, -20, 4, 14, 22, -8, 15, -20, 21, -9, 10, -11, 23, -5, 15, -13, 1, 10, 20, 0, 2, -19, -10, -1, 20, 15, -12, -15, -17, 12, -16, -17, 15, -1, 16, -7, 12, 0, 12, 1, -13, 19, -18, 14, -22, 23, 10, -19, 15, -18, 18, -15, -17, -17, 3, 19, 19, 19, 16, 4, -14, -15, -4, 5, 14, 20, 2, 2, 9, -17, 4, -1, -19, -5, -9, -7, 10, 16, 5, 14, -11, 6, 11, 11, 12, -18, 16, 2, 17, 20, 5, 5, 13, 13, 16, 21, -14, -20, -18, -12, 13, -19, 4, 7, -8, -19, 20, -20, -21, -3, 9, 8, 5, -10, 6, 4, 6, 16, 10, 15, -15, 4, 13, 9, -9, -2, 8, 0, 5, 15, 3, -6, -3, -2, 15, -12, -20, 18, -17, -12, 4, -10, -9, -2, 6, -3, 3, -3, 9, 5, -8, 20, 19, -2, 19, 20, 0, 8, 7, -16, -15, -7, 11, 7, 12, -14, -9, -3, 21, 18, 23, 18, -20, 3, 3, 13, 13, 16, 1, 16, -3, 9, 5, -11, 8, 13, 21, 3, 10, 9, -3, -17, -18, -1, 20, -21, 4, 17, 11, 13, 5, 12, -6, 17, -12, 6, -14, -6, 0, 17, 10, 6, -9, 12, 8, 13, 3, 5, -19, -21, 11, 1, -8, 17, 15, -4, -10, 4};
+static int8_t DeeployNetwork_classifier_QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0weight_tensor[5120] = {2, 1, 0, -3, 4, 0, 0, -3, 3, -4, 4, -2, 1, -5, 3, 5, 2, 0, 6, 3, 2, 6, -3, -5, -4, -5, -4, -1, 1, -2, -2, -1, 0, 3, 5, 0, 6, 2, -3, 0, -5, 2, 5, -5, 5, 2, 0, -2, 5, -4, -4, -2, 2, 2, -3, 2, -1, -3, -3, 6, 5, 2, -4, -3, 4, -5, 2, 5, -3, 6, 4, -1, 3, -2, -1, 4, -4, 2, 5, -2, -2, -1, 4, -2, -4, 4, 4, 4, -4, -3, -4, -1, -4, -5, -1, 0, 4, 1, 4, 1, 0, 3, 3, 6, 1, -5, -3, -4, 2, 3, 4, 0, 6, -2, 0, 5, -1, 4, -4, 5, 1, 4, -4, 0, -2, 3, 3, 0, -2, -2, 0, 5, -4, -3, 2, 4, 5, 1, -4, 2, 4, 0, 2, 2, -5, -1, 4, 2, 6, -3, 5, 5, 4, -4, 0, -1, 4, -2, -4, -3, -2, -1, 2, -2, -3, 5, -4, 0, 2, -2, 4, -1, -4, 5, 6, -1, 1, -4, 3, 1, 3, 2, -1, 3, 4, 0, -3, -3, -1, 0, -5, -5, -5, 5, 1, 3, -1, 3, 6, 6, 6, 1, -4, 5, 1, -1, 3, 6, -1, 6, 5, 4, 1, 5, 0, -1, 5, 3, 2, 1, -3, -2, 4, -4, -4, -5, -5, -3, 6, 0, 3, -5, 2, -3, 0, 4, 0, 4, -1, 3, -1, 4, 4, 1, 0, -3, -3, 5, -2, 4, -2, 0, 0, -2, 3, 0, 1, 2, -1, 0, 0, 4, 3, 0, -2, -4, 0, 5, -3, -5, -4, -1, 4, 3, 6, -4, -5, 0, 4, -2, -1, 3, 4, -4, -4, 6, 1, -3, 2, -3, -2, 3, 2, 5, -2, -2, -1, 6, 6, 0, 2, -4, -5, -2, 6, 0, 5, -5, 4, 6, 6, -1, 5, 2, 0, 5, 3, 4, 4, 5, 2, 2, 1, 1, 4, -3, -2, 0, 0, 3, 6, 0, -5, -3, -1, 0, -3, -3, 0, 4, -3, -4, 5, 3, 2, 5, 5, -2, 0, -4, -5, -1, 1, 2, 6, 4, -4, -1, 2, -5, 1, 2, 2, 1, 0, -2, 3, 1, 0, 6, 6, -3, 3, 1, 3, -5, -3, 0, 1, 6, -4, 4, 1, -4, 1, 5, 1, 0, -4, 4, -4, 5, 1, -1, 3, 0, -1, 3, 3, -1, 5, 3, 4, -3, 4, -4, 5, 3, -5, 5, -1, -2, -5, -4, 2, -3, 5, -2, 4, -4, 1, 5, 4, 2, 2, -1, -4, 4, -2, 1, -4, 3, 2, 4, -1, 1, 2, 2, 1, 1, -5, -5, -5, 0, -1, 1, -3, -3, 1, 0, 0, 4, 2, -2, -1, -1, 4, 0, 1, -2, 0, 5, -4, -5, -1, 1, -3, -3, 6, 3, 2, 2, -3, 4, -2, 0, 0, -4, -2, 2, 5, -1, -3, 2, 5, -1, -1, 3, -1, 2, 4, -2, 1, -1, 1, -2, -4, -2, 2, -5, 4, 1, -4, 6, -5, 6, -2, -1, 1, 1, 4, 2, -4, 4, -5, 3, -5, 1, -4, 5, 4, 2, -5, 3, -2, -1, 1, -3, 4, 2, 4, -4, -2, 4, -1, -1, 0, 2, 3, -1, 6, 2, -1, 3, -4, -4, 4, -2, 4, 4, 2, -2, 0, -2, 2, -3, 0, 3, 5, 4, 3, 4, 3, -1, 3, -1, 3, -1, 3, 4, 0, -4, 6, -5, -1, -3, -3, 5, 5, -4, -1, -3, -4, -4, 6, -2, -3, 4, -1, 1, 6, -2, -1, -3, 3, -1, 6, 1, 2, 2, -5, -4, 0, -2, -2, 0, -2, 3, 2, 1, -1, -3, 0, -4, -4, 1, 5, 4, -2, 6, 2, 3, -2, -3, -2, 6, -2, -4, 2, -1, 3, 5, 1, -1, -3, 3, 0, 1, 4, -4, 1, 5, 2, 1, -3, -4, 2, -3, 5, 6, 2, 6, 3, -4, 2, -3, -4, -3, -5, -1, -5, 2, 1, 5, 5, -1, 1, 0, -3, 1, -4, -1, -3, 2, 3, -1, -3, 2, -4, 0, -5, 0, 4, -3, -2, 3, 2, -1, 3, 5, -2, -3, 2, 2, -4, 4, 5, 2, -5, -4, -5, -2, 1, 4, -5, 1, 2, 1, -3, 2, -1, -2, -4, -3, 1, 5, -5, 0, 1, -4, 5, 6, -5, -4, 5, 3, 2, 3, -4, -1, -5, 2, 0, 5, 3, -2, 6, 5, -2, 6, -3, 1, -2, 1, 0, 5, -1, 3, 3, -4, 1, 5, 3, 0, 5, 5, -2, 1, 4, 3, -2, 5, 2, 3, 2, 3, -4, 1, 0, 1, 4, 2, -4, 1, 3, 5, 0, 2, 2, 6, -2, -3, -2, 4, -2, -1, 3, -1, -2, 1, 5, -2, 0, 4, -1, -2, -2, 2, 3, -5, -1, -1, -2, 3, -4, -3, 5, -3, -1, 4, 3, 1, -1, 1, 1, 5, 5, -2, 5, -4, 5, 4, 0, -1, 0, 2, 1, 6, 5, -1, 1, -1, -5, 2, 2, 6, -4, -1, 0, 2, 5, 1, 2, -2, -4, 6, 5, 2, 2, 4, -3, -2, 0, -1, 6, 4, -1, 1, 5, -1, 5, -4, 0, -4, -3, -5, 2, 0, -5, 2, -1, -1, 3, -1, 0, 5, 2, 4, 6, 6, -3, 5, 1, 0, -2, -1, 3, 1, 5, 2, -3, -2, 2, 5, 1, -2, -2, 6, -5, 4, -1, -1, -1, -4, -4, 1, 6, 6, 2, -4, -4, 5, 3, 0, -3, -1, -2, 2, -1, 5, 3, 6, -5, 3, 0, 2, 4, -2, 3, 0, 4, 6, -1, 1, 0, -1, 6, 0, -2, -1, 4, 4, -4, 6, 3, -4, -4, 2, 2, 2, 5, 6, -3, -3, -1, -4, 3, 4, -4, -2, -4, -1, 0, 0, 6, 1, 3, 3, -2, -5, 1, 1, 1, -3, -2, -2, -1, 2, 3, 0, 3, -2, -3, 3, 5, -3, 0, 3, -4, -3, 1, 3, -3, 0, -2, -2, 0, 3, 1, 3, 3, -5, 2, 4, 3, -4, 4, -3, 1, 5, 4, 1, 1, -2, 4, -1, 3, 2, -1, -2, 6, 5, 0, 5, -4, -2, 0, 6, -5, 4, -2, 5, -3, -2, -4, 4, 2, 3, -3, -4, -1, -4, 0, -2, 1, 4, 1, -2, -3, 0, -3, 5, -1, 6, -4, -3, -4, -2, 4, -2, -4, -4, 0, 0, -5, -5, 0, 3, 6, -2, 3, 0, 5, 4, -4, -4, 4, 1, -2, 4, 2, -3, 0, -2, -2, -1, 4, -3, 0, -1, 3, 4, -4, -3, -2, -3, 5, 0, 6, 2, 2, 5, 3, 6, 5, -2, 2, 6, 2, -1, 1, 0, -1, 4, 5, -5, 2, -4, -2, 2, 0, 2, -2, -2, 2, 5, 0, 1, 1, 0, 1, 0, -4, -5, 1, 0, 2, 0, -3, 3, 6, -1, -2, -3, -3, -4, 4, 4, 1, 3, 4, -1, 6, 4, -2, -2, -4, 1, -2, -1, 1, 5, 2, 2, 4, -2, 4, -2, 0, 4, 4, -3, 1, 2, 3, -2, 2, -4, 2, -2, 2, 2, 4, -2, 0, 3, 0, 3, -2, -3, -3, 4, 4, -3, 0, -3, 2, -3, -1, -4, 3, -4, 2, 3, 3, 2, 2, -4, 5, -3, 6, 3, 6, -1, -5, 3, -1, 3, -2, -5, 6, 3, 1, -1, 4, 4, -1, 6, -4, -3, 1, -1, -5, -2, 0, -4, 2, -5, 3, -3, 1, -1, -3, -4, 0, 1, 4, 2, 3, -5, 5, -5, 4, 3, 5, -2, -2, -3, 1, 2, 2, 1, -2, -5, 4, 2, 5, -5, 5, 4, 6, 3, 4, 6, -4, -4, -3, 4, 4, -3, -4, -3, -3, -4, -1, -4, 0, -1, 1, 2, -2, 0, -3, -4, -3, 0, 6, -3, 0, -3, -5, -3, 3, -2, 1, 1, 5, -3, 1, 5, 5, -1, 4, -2, 4, 6, 5, 5, 5, 1, 0, 5, -3, 0, -5, -3, 6, 5, -3, 6, 3, 3, 0, -4, -3, -3, 0, 2, 2, 2, 4, 2, 2, -3, 4, 6, 0, 2, 6, 2, -4, -2, 0, -3, 5, 2, -5, 3, -3, 4, -4, 4, 1, 3, 6, 3, -5, -1, 2, 4, -1, 5, 5, -1, 3, -2, -3, 1, 2, 0, -1, -5, -5, -1, -2, 1, 1, 5, 4, -4, -4, -2, 6, -2, 6, -3, -1, -1, 4, 0, 0, 4, -3, 0, -3, -5, 0, -2, 6, 3, 3, -4, 4, -5, 5, -2, 3, -2, -4, -4, 6, -2, -3, 1, -2, 4, 3, -4, 4, -2, 6, -4, 1, 1, 3, 5, 4, -1, 4, 5, -3, 3, -1, -5, 3, 3, -3, 0, 0, 2, -3, 1, -2, 4, -5, 6, 6, -3, 4, 4, 5, -3, 0, 0, 1, 1, 4, -5, -4, 0, 6, 4, -4, 5, 2, 3, 6, 3, 2, 6, 0, -2, 6, -2, 5, 1, -2, -3, 2, -4, -3, 2, 0, 1, 4, -4, -2, 3, 0, -2, 0, 4, 6, 4, -1, 0, -2, 4, 2, -2, 4, -1, 1, -2, -3, -5, 5, 1, 3, 4, 3, 6, -3, -4, 0, 5, 3, 5, -1, -3, 5, 4, 0, -3, 4, -2, -3, 1, 4, -4, -5, 6, -4, -4, 4, -3, 5, -3, -1, -3, 3, -3, -2, 3, 2, -2, 2, -2, -3, -5, -4, -2, 2, 3, -5, -4, -1, 3, 5, -3, 5, -5, -4, 6, 0, -1, 5, 6, -3, 1, -3, 2, -3, -4, -5, 5, 1, 5, -4, 6, 3, -2, 5, 6, 2, -4, 1, 5, 4, 1, -1, 4, 4, -2, 0, -3, -4, -2, 5, 6, 1, -2, -1, 3, -3, -3, 1, 5, 5, -2, 6, -2, -3, 0, 0, 3, -5, 4, 3, -1, -1, -2, 3, -2, -3, -5, 4, -2, -5, -4, 2, -5, -4, 1, 0, 0, 0, -1, 6, -3, -4, -5, 3, 3, 5, 1, -4, 3, -3, 4, 0, 5, 2, -1, 6, -4, -3, -3, 6, -3, -2, -1, 4, 5, 1, -5, 0, -4, 2, -4, 5, 0, 5, 6, 3, 1, -3, -3, 0, 0, 3, 6, -1, -4, -4, 0, 4, 4, 2, -1, 3, 2, 2, 1, -2, 1, 3, -1, 2, 5, -5, 2, -5, 6, -1, 2, -1, -4, 0, 4, -1, 3, -2, -4, 5, 4, -4, 5, -3, -1, -5, 4, 0, 4, -5, 1, -5, 4, 5, -4, 0, 5, 0, -1, 2, 3, 5, -4, 4, 6, -4, -3, -4, -1, -3, -3, 4, -3, 3, 6, -3, 0, -2, -5, 2, 1, 3, -1, 0, -1, -2, 1, -5, -1, -4, -5, 1, -5, -2, -4, -2, 3, 4, -3, -2, -1, -5, 1, 5, 3, 3, 6, 3, -3, 3, 2, -1, -3, 3, -4, -1, 2, -2, 2, 0, -1, -5, 5, 3, -4, -4, 4, 5, -2, 5, -1, -4, 3, -3, -4, -4, 5, 1, 5, 3, 4, -3, -1, -2, -5, 4, 3, -5, 0, 0, -5, 1, -2, 0, 2, 0, 5, 1, 1, 1, 0, 5, -4, 5, -1, -2, 2, 0, 6, -4, 1, -4, 3, 0, -3, -4, -4, 5, 0, -5, 1, 5, 0, 5, -5, -3, -4, -2, 1, 0, 5, -5, -3, 3, -4, 3, -5, 0, -1, 6, 0, -4, 1, 2, -2, 2, -3, 1, 3, 0, 6, -1, 6, 1, -5, 2, 0, 2, -5, -5, 5, 0, 3, -3, -1, 1, 0, 2, -1, 1, -4, 3, -3, 2, 5, 3, -3, -2, -5, -1, 0, -3, -1, 3, -5, -1, -1, 1, -1, -2, 6, -1, -3, 3, 4, 3, 1, 4, -1, 6, -4, 2, 0, 6, 0, 1, 6, -2, 3, -4, 0, -4, -3, 0, -1, 6, -4, 1, -4, 2, 0, 6, -2, -2, -5, 4, -2, 6, 3, 1, 1, -3, 0, 0, 2, 1, -4, -4, -3, 5, 1, -4, 6, 5, 4, 2, 1, -2, 5, 1, -1, -2, 2, 3, -4, 2, -5, -2, -3, -2, 0, 0, -3, 6, 3, -4, 5, 6, -4, 6, 5, 1, -1, 6, 3, 3, -1, 3, 1, 4, -1, -1, 1, 0, 5, 4, 5, -5, -3, 1, -3, -5, -3, -3, -5, 0, -5, -4, -4, 3, -1, -3, -4, 5, 5, 4, 2, -2, 4, -2, -2, -1, 5, 2, -2, -3, 1, 1, 6, 5, 1, 0, 5, 0, -5, 1, 2, -4, -5, 1, 3, 4, -3, -1, -4, 2, 2, 4, -2, 0, 0, -1, 5, -2, 1, 4, 3, 3, -1, -4, 2, 2, -3, -1, 5, 3, -2, -2, -4, 4, -3, 4, 1, 3, -1, -2, 4, 2, -2, 0, 0, -1, 4, 6, 1, -3, 5, -3, -5, -3, 1, 2, -1, -3, 0, 5, -3, 6, 5, 2, 4, -2, -5, 0, 2, 3, -5, 6, -1, -1, -2, 0, 3, 4, 2, -1, -2, 2, -2, 2, -4, -3, -5, 2, -3, 4, 0, -5, 3, -3, 2, -5, -5, -5, -5, -3, -3, 2, 1, -1, -3, -2, 3, -3, -5, 0, 6, 6, 0, -1, 3, -4, 5, 0, 1, 2, 0, 1, 0, -3, 3, 0, 2, -1, 2, 3, -3, 4, -2, 2, -5, -3, 0, 4, -3, 0, 3, -5, 1, -4, -2, 3, 2, -3, 5, 5, 0, 3, 4, -5, -4, -2, -4, 4, 1, 2, 4, -1, 2, 4, 2, 5, 2, -4, 4, 6, -2, -4, -1, 5, -2, 1, -4, -3, 0, 3, 2, 5, -2, 1, 0, -3, 4, -3, 4, 0, -5, 4, 0, -3, 1, 1, -1, 0, -1, -1, 0, 2, 1, 5, 0, 3, 3, 2, 4, -3, -2, -1, 3, -4, -5, -1, -1, -5, 5, 1, 1, -5, -1, 0, -4, 3, -1, -3, 3, -5, -4, 4, 6, 6, -1, 1, 3, -2, 1, -3, 3, 5, 0, -3, 4, 0, 0, 6, 1, 4, -5, -1, 2, -2, -1, 5, -5, 2, 3, 4, -3, -2, 5, 3, 2, 5, -1, 0, 6, 1, -2, -1, 0, -5, 5, 6, 6, 2, 3, -2, 5, 5, -5, -2, -1, 4, -4, 0, -1, -4, 6, 6, 3, 4, 4, -2, -4, 2, -4, -2, -3, -3, 4, 0, -1, 2, -2, -2, -1, 5, 2, 6, 4, -1, 5, -2, 2, -3, 1, 4, 1, -5, 1, -3, -2, 4, -1, -1, 4, -1, 5, 3, 1, -2, -2, -3, -3, 4, -4, 4, -1, 3, -4, -1, -4, 3, 1, 0, -3, -2, 4, -1, -1, 4, 5, 6, 2, -3, 0, 4, -1, -2, 2, -2, 1, 5, 4, -2, 0, -3, 3, 2, 4, 1, 4, -1, 3, 0, 0, 4, 4, -4, -1, 2, -4, -1, 1, -2, -1, 6, 5, 6, 4, -4, 1, 1, -1, -2, -3, 5, 5, 3, 0, 4, 6, 0, 1, -4, -3, -3, 6, -1, -3, 2, -3, -3, 1, -2, 6, 0, 5, -5, -5, -2, 0, -2, -2, -1, 6, -4, -4, -3, 3, -1, 2, -4, 3, 5, 3, -5, 1, 2, 0, 4, 5, 1, 3, -4, -2, 2, 5, 0, -4, -5, 6, 0, -4, -2, 6, 5, 3, 6, 5, 0, 3, 5, 4, 2, -2, -2, -3, 4, 3, 2, -3, -5, -5, 2, 4, -3, 5, 0, 2, -1, 4, 2, 3, 4, -2, -4, -3, 3, 1, 5, -4, -4, 1, -4, 3, 0, 5, 0, -4, -2, 5, 0, -2, 3, 6, 3, 6, -4, -5, -2, 6, 2, 6, 6, -3, 3, -4, 0, -5, -1, -3, -3, -3, -2, -5, 2, 4, 4, 2, 5, 0, -1, -3, 3, 4, 2, -2, -3, 1, 4, -5, -5, -4, -2, 5, -3, 6, -3, 3, -4, 0, -2, 3, 2, 6, -4, 2, -1, -4, -5, -4, 3, -1, -3, 3, 2, -1, 2, -3, 6, -1, 3, -4, 4, -2, -1, 6, 1, -3, -5, -1, -4, 6, 4, 3, 0, 2, 3, 0, 3, 1, 5, -5, -3, 3, 6, -4, 5, -5, 5, 6, 4, -3, 4, 3, -5, 2, 2, 1, 1, 1, -4, 0, -5, 6, 2, -2, 0, 3, 2, -2, 0, 2, -4, 0, -4, 5, 4, 4, -3, 5, -4, -3, 6, 6, -4, 0, 3, -3, -1, 2, 3, 6, 3, 3, 4, -1, -5, -3, 5, 1, 1, 3, 6, -2, 6, -1, 0, -4, -2, 2, 3, -3, 6, 2, -4, -3, 2, -2, 0, -2, -2, -3, 3, 1, 0, 1, -3, -2, 1, 5, 3, 4, -2, -4, -5, 0, 1, 2, -1, -4, 5, -5, 0, 4, 5, 3, 0, 4, -1, 1, 0, 6, 3, -1, 3, -4, -1, -1, -2, -5, -5, -4, 0, 4, 2, 5, 3, 6, 1, 5, -1, 4, -1, 2, 0, 4, 2, -3, 0, -2, -3, 1, 3, -2, -4, 3, 5, 3, -1, 6, -2, 2, 4, 0, 4, 6, -2, -3, 1, 2, -2, 5, 3, -2, 0, -1, -2, -4, 0, 5, 0, 6, 1, 6, 1, 3, 3, -1, -1, 1, 0, -4, -1, 0, -4, -2, -2, -1, -1, 2, 1, 4, -2, 1, 5, -3, -2, 4, 2, 6, 5, 2, 0, -4, -1, 4, 1, -4, -4, 6, -1, 4, -5, -2, -3, -1, 4, 3, -5, -2, -5, -1, 4, 5, 5, -2, -1, 1, -4, 3, -5, -2, 1, -1, 4, 2, -4, 1, 3, 4, 1, 5, -3, -3, -3, -1, -2, 5, 5, 4, 4, 5, -5, -5, -3, -2, -3, 6, 4, 5, 6, 2, 6, 5, 5, 5, 1, 0, 1, 5, -5, 6, -4, -4, -3, 1, -4, 5, -4, 2, 2, 0, 2, 5, 6, -3, 5, -2, 1, 1, -5, -3, 2, 4, 4, 6, -3, 0, 0, 5, 2, 6, 2, -3, -2, 4, 3, 0, -1, 2, -1, 0, 4, -3, 6, -4, 1, 5, 2, 2, -2, 4, 5, 5, 6, 5, -3, -4, 1, 1, 4, -1, -5, 2, 4, 5, 2, 6, 4, 3, 2, 1, 5, 2, -3, -2, -5, 4, 5, 5, -5, 1, -1, 2, -4, -2, -4, -5, 5, 5, 0, 4, 0, 5, 1, 5, -4, -5, -4, -4, -5, 5, 6, 6, -5, -5, -4, -4, 1, -3, 5, 0, 1, 3, 1, 0, -3, 0, -3, -4, -4, -5, -1, -2, 3, 1, -1, -3, 4, -3, -2, -5, 6, -2, -2, -1, 1, -3, 4, 3, -4, 4, -2, 4, -3, 4, 5, 6, 3, -4, -3, -3, 4, 5, 0, 3, 0, -3, 2, 4, -1, 0, 6, -3, -2, -3, 5, -2, 5, 0, -3, 3, -4, -4, -4, -3, 2, 0, 1, -1, -5, 2, -2, 2, -3, -4, 4, 2, 3, -1, -4, 4, 5, -3, 0, 1, -3, 6, 4, 0, -4, 6, -1, 5, -2, 4, 0, 2, 0, 0, -4, 5, -3, 5, -2, 0, 3, -4, -5, -3, 0, 3, 4, 2, 4, -4, -5, 4, -3, -3, 5, -1, -4, -2, 4, -2, 0, -2, -1, -3, 5, 1, -3, 5, -4, 3, -3, -3, 2, 0, 1, 2, 4, 1, 4, -3, -1, 1, -1, -3, 5, 6, 6, 2, 1, 6, 1, -4, 2, -5, -2, 2, -2, -3, 4, -4, 4, 5, 4, -5, -4, 0, -2, 2, 3, 5, 3, 1, 3, -2, -1, -1, -4, 6, -2, -1, 5, 3, 5, 1, 1, 4, 0, 5, 3, 6, -5, 6, -1, -3, 2, 2, 1, -3, 5, -2, 3, 3, 4, 6, 2, 2, 1, -2, -1, 0, 3, 4, -4, 1, 2, 0, -1, 3, 3, 5, 1, -4, 2, 1, -1, -3, -1, 1, 6, 0, 4, 1, 5, -4, 1, -1, 0, 5, -5, -5, 5, 3, 0, 4, 2, 2, 1, -2, 4, 3, 4, 1, 6, 5, 0, 3, 2, 4, 0, -4, 0, -2, 3, 3, 3, -3, -2, -4, 4, 4, 3, 6, 5, -3, 0, -3, 2, -1, 2, 2, -5, -1, 0, 6, -4, 4, -5, 6, -2, -1, 0, 5, -5, 4, 5, 1, 2, 3, 6, -4, 1, -2, 0, 3, -2, 3, 1, -2, 1, 0, 3, 6, -2, 0, 1, 0, 2, 5, 3, -2, -4, -1, -1, 3, -4, 1, -3, -3, -3, 5, 4, 4, 5, -2, -2, 6, -4, 1, -4, 6, 4, 4, 5, 4, 0, 1, 1, -2, -3, -4, 6, 6, -1, -5, 1, -5, -1, 1, 4, -2, 4, 3, -3, 5, -4, -2, 3, -2, -4, 2, -2, 6, 2, 2, 3, 3, 1, -2, -3, 4, 5, -1, -4, 3, 2, -4, 6, 2, 3, 5, -3, 3, -2, 2, 5, -5, 3, 5, 3, 1, -4, 5, -5, 2, 5, -1, 1, 4, 1, -3, 2, -3, 5, -1, -1, -3, 0, 6, 2, 2, 0, -1, -4, 2, 2, 3, -3, 4, 5, -1, -1, -2, 2, 5, 2, -1, -4, 2, -3, 5, 4, 5, 5, -1, 2, -3, -1, 0, 5, -2, -4, -3, 2, 1, -1, -5, 3, 1, -1, -1, 2, -3, 0, -4, 4, -4, -4, 5, -4, 3, 2, 5, 3, 4, -1, 0, 3, -1, 6, -1, 4, 4, 2, 1, 1, 4, 1, 3, 6, 0, 1, -1, 6, 3, 6, 2, -1, 2, 0, -2, 2, -3, -2, -3, 2, 4, 5, -2, 2, 4, -1, -4, -1, 5, -2, 3, 2, -1, 0, 5, -2, 4, 0, 3, 2, 5, 4, 4, 3, -5, -4, -4, -1, 0, -1, 2, 4, -1, -3, -4, -4, 1, 5, -2, 0, 3, 3, -3, 0, 1, 1, -4, 2, 0, 1, 4, -3, 0, -3, 1, 0, 3, 5, -2, 5, -5, 1, -3, 2, 2, 2, -1, 0, 1, 5, 3, 3, -4, -1, 0, -1, 2, -4, 2, 0, -3, -2, -2, 4, 0, 5, 3, 0, -2, 0, 2, 1, 1, -2, -1, 3, 3, 3, -2, 3, -2, -5, 1, -1, -5, -3, 4, -4, 2, -1, -1, 1, 6, -1, 5, -3, 5, -1, 5, -4, -5, 4, 3, -4, 1, 2, 5, 4, 5, 1, -2, 1, 1, 1, -3, -4, 6, -2, -2, -3, -1, 2, -5, -4, 5, -2, -1, 5, 2, 3, -5, 1, -3, 4, 2, -2, -5, 4, 0, 0, -2, 2, 4, 3, 4, 6, -2, 0, -4, -4, -4, -3, 3, -4, 0, -5, -2, 4, -2, 6, -1, -4, 2, -3, 0, 0, 2, 5, 2, -1, 1, 6, 2, -2, 3, -5, -3, 1, 6, 4, 5, 4, 5, 6, 6, 2, 4, 3, -1, -3, -4, 2, -3, 3, -3, 3, 6, 6, 2, -4, 5, -2, 4, -3, 3, 0, -5, 4, 5, 3, 6, -4, -5, -5, -2, -3, -2, 1, -2, -4, -3, 1, 5, -2, 5, -3, -4, -3, -1, 6, 6, 2, 5, -4, 0, 5, 5, 0, -3, 2, 0, 6, 1, -4, 2, 1, -3, 2, -2, 1, 5, 0, 1, 2, 5, -3, -3, -3, -5, 0, 1, 0, 4, 3, 3, -4, 5, 6, 3, 3, 1, -3, 2, 4, -1, -4, 5, 4, -1, 1, 4, -3, 2, -2, 3, 6, -2, 5, -5, -5, -3, -1, -2, 0, 1, 1, 1, -1, 5, 4, 5, -1, -4, -4, 4, 3, -4, 5, 3, 4, 0, -1, 3, -3, 3, -3, -1, 5, 0, 3, 3, 3, 1, -3, -4, -1, -5, -4, 5, -5, 4, -4, 1, -5, 5, 6, -1, 5, 3, 6, 3, 4, -2, -3, -1, 5, 4, 6, 3, 3, -3, -1, 1, 1, -5, -4, 4, 3, -3, 4, -4, 3, 4, 4, 3, 3, -3, -3, 1, 2, 6, 5, -2, -3, -3, 6, 4, 4, -3, -2, 1, 4, -4, 0, 0, -1, 4, 3, -1, 0, -3, -1, 2, 1, -2, 6, -4, 6, -5, -5, -3, 2, -1, -1, 2, 3, 5, 0, -4, 1, 4, 1, -4, 6, 0, 3, 0, -5, -1, -2, -4, -5, 5, 6, 5, 1, 0, -1, 3, 4, -4, 3, 0, -1, 5, -2, 1, 0, 6, -3, -3, -5, 4, -5, 0, -4, 0, -4, -3, 1, 4, -3, 1, -1, 3, -3, 4, -1, -3, 4, 6, -4, 1, 3, -1, 0, 3, -5, -2, -2, 3, -3, -1, 3, 0, 3, 1, 4, -2, 0, -1, 1, -4, -1, 5, 5, -2, 1, -5, -4, 4, 1, -1, 6, -2, 0, 4, -4, 2, 4, 2, 4, 3, 4, 3, -2, 0, 2, 5, 0, -1, -1, -3, 5, 0, 1, 5, 1, 4, -1, -1, -2, 2, 0, 4, 1, -3, 1, -1, -1, 0, -4, -2, -2, 5, -3, -2, -3, -4, -3, 2, -3, -1, 2, -1, 0, 6, -4, 2, 5, 4, 0, 4, 0, -3, 4, -5, 6, 0, 2, 1, -4, 4, 0, -2, 1, -1, 1, 0, -5, 0, 4, 2, 5, -1, 3, -4, 1, 2, 1, -3, 3, 0, 3, 3, 4, 3, 6, 0, -3, -3, 6, 5, 6, 2, -3, 5, 1, -2, 3, 3, 0, 4, -3, -3, -1, 4, 4, -1, 1, 3, 2, -3, 4, 0, 2, 3, 5, 0, -3, -2, 4, 3, -5, 0, 4, 2, 5, 4, 2, -1, 3, -1, -2, 4, -4, -2, 3, 5, 2, -4, -4, -1, 4, 1, 0, 0, 0, 5, -3, -3, -2, 4, 5, 0, -2, 1, 0, -4, 4, 0, 3, 6, -2, 5, 0, 2, 3, 2, -1, 0, 2, -4, -5, -5, -5, -5, -1, -3, 5, 5, -1, -2, -4, 0, 1, 2, -1, -4, -1, 5, 3, 4, 4, -1, -1, -1, 1, -1, 4, 5, 3, 5, -1, 0, 1, 3, 5, -1, 1, 4, -1, 4, -3, 0, -1, 0, 0, 5, 5, 4, 5, 0, 3, -2, -4, 3, 0, -1, 5, -4, 2, -3, 0, -1, 2, 5, 2, 0, -1, 2, -1, 1, 6, 0, 6, -3, 4, 1, -1, -2, -4, 3, 1, 4, 3, 2, 4, 2, 6, -2, -3, 0, -1, 1, 1, -2, -5, -4, 6, -4, 4, 6, 6, 4, 3, -3, 1, 0, 2, 3, 6, 5, -1, -3, 4, 2, 4, -2, -2, 5, 6, -3, -1, 3, -3, 5, 3, 4, 3, -3, -1, 3, -1, 2, 5, 2, 1, -4, 3, -2, 2, -1, 6, 4, 0, 1, 5, -2, 1, 4, 1, 1, 6, 0, -1, 5, -3, 1, -1, -4, 4, -5, 3, 4, 0, -4, 5, -3, 2, 1, 0, 1, 4, 1, 1, 1, -1, -2, -2, -3, -1, -1, 2, 0, 4, 5, 5, -4, 5, 3, 5, 6, -4, -5, -2, 5, -2, -5, 6, 3, 3, 2, 2, 3, -5, -2, 0, -1, 4, 0, 0, 6, 1, -1, 5, -4, 1, -3, 0, 0, 2, 6, 5, 5, 5, -1, 1, 3, 0, -2, 0, -3, -4, -5, 2, 0, 1, 5, -4, 4, -2, 2, 4, 5, 5, 3, 5, -3, 5, -4, 2, -4, 1, 4, -3, -1, -3, -2, -1, 1, -3, 4, 4, 4, 0, 0, -2, -5, 2, 4, -1, 0, 1, 0, 5, -3, -4, 3, 0, 5, 3, 0, 0, 5, 2, 2, 3, 5, -1, -3, -4, 6, -2, 4, 0, 2, 1, -3, 4, 0, -2, 5, -4, -2, -1, 4, 4, 1, 4, 1, 3, 0, 3, -3, -4, 4, 0, -4, -5, 3, 3, 4, -4, -2, -5, 6, -2, 4, 1, -1, 0, 1, -2, -4, 2, 5, 0, -4, 1, -1, 4, 6, -2, 3, 4, -4, -1, 1, 4, -2, -2, -1, 4, -3, 5, -1, 3, 2, 5, 0, 3, -2, -4, 6, -3, -4, -2, -3, 4, 1, 4, 6, 2, -4, 0, 3, -3, -2, -2, 4, 0, -1, 5, -4, -1, 4, 2, 1, -1, 2, 5, -3, 3, -3, 2, 4, -2, 5, 2, -4, -3, 2, -5, -1, 3, 3, 5, -4, 2, -3, 2, 0, -3, 0, -1, -2, 2, 3, 5, 1, 2, 3, -1, 0, 5, -4, 6, -1, 1, 2, 3, 5, -5, 1, -1, -1, 1, 0, -4, 4, -3, -2, -3, -2, 2, -5, 5, 4, 0, 3, 5, -2, 1, 2, -5, 1, -2, 1, 4, 6, 1, 2, 1, 5, 0, -5, -5, 2, -3, 6, 2, 2, -2, 5, 3, 6, 4, 1, -5, 4, 1, 0, 6, -1, 1, -3, -4, 2, 0, -4, 3, -5, -1, 2, 3, -3, 4, 4, 0, 1, 6, 5, -5, 3, -5, 2, -3, 6, -2, 6, 6, 1, 4, -3, 1, 0, 1, -3, 4, -1, -1, -2, 5, 0, 4, -5, 1, 1, 5, 0, 2, 5, 0, -3, -3, 3, 2, 4, 5, -4, -4, -5, 1, -2, 6, -2, 2, 3, -4, -3, 4, 6, 4, -1, 5, -1, 0, -5, -1, -3, -4, 4, 5, -1, 6, 6, 1, 0, 5, -3, -1, -1, -2, 0, -2, 4, 4, 3, -4, 4, 4, 5, -3, -1, 6, 3, -2, 5, 5, 4, -4, 3, 3, 0, 3, -2, 2, -2, -3, 0, 3, -1, -5, -4, 5, -1, 5, 2, 3, 2, 0, -1, -1, -2, 3, 5, -2, 5, -5, -4, 0, 0, -4, 4, -1, -3, 6, 6, 4, 6, 2, -5, -1, 0, 3, -4, -2, -3, 0, -2, 2, -1, -5, -3, 0, 4, 0, 6, 0, -3, 2, 2, -2, 1, -3, -4, 2, -4, -1, 5, 0, 1, 3, -2, 1, 0, 6, 4, -3, -1, 5, 6, 1, 0, 6, -2, 5, 6, 5, 5, 1, -5, -5, -2, -1, 5, -2, -2, -3, 2, 2, 2, 2, -3, -5, -3, -3, -1, -1, -5, 5, -2, 2, 1, -1, 0, -4, -2, -3, -2, 4, 6, -1, -2, -1, 0, 4, 0, 0, 0, 3, 1, 5, 2, 1, 5, 5, -5, 2, 0, -2, 1, -1, 0, -4, -1, -5, 6, 1, -3, 2, 1, 0, 3, -5, 3, 1, 4, 0, -3, -3, -1, 6, -1, 4, -1, -3, 6, 4, 1, 4, -1, -4, -3, 4, -4, 0, 5, 2, 5, 0, -1, -2, -4, 4, -2, -5, 1, 4, -1, -4, 0, 0, 0, -2, 3, 0, 3, 3, -2, -3, 4, 3, 0, -4, 3, 4, -3, 1, 4, 3, 3, -2, -1, 5, 2, -4, 4, -1, 3, -4, 0, 0, -2, 1, 6, -3, -3, -5, 5, 6, -1, 4, -4, 1, 1, 2, -5, -2, 5, -4, -4, 6, -5, 6, -3, 1, 5, 0, -1, -3, -3, -2, 5, -4, 1, 0, -4, 6, 1, 0, 3, 0, 2, -3, -4, -5, -1, -3, 6, -2, 6, -1, 3, 4, 2, 5, 5, 5, 1, 3, 1};
+static int32_t DeeployNetwork_classifier_QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0bias_tensor[10] = {-497.0, 103.0, 373.0, -81.0, -59.0, 455.0, 120.0, 363.0, 213.0, 514.0};
+static int32_t DeeployNetwork_classifier_QL_REPLACED__INTEGERIZE_SIGNED_ACT_PASS_3mul_tensor[10] = {129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0, 129.0};
+static int32_t DeeployNetwork_classifier_QL_REPLACED__INTEGERIZE_SIGNED_ACT_PASS_3add_tensor[10] = {0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0};
+void* DeeployNetwork_inputs[1];void* DeeployNetwork_outputs[1];
+        void RunNetwork(__attribute__((unused)) uint32_t core_id, __attribute__((unused)) uint32_t numThreads){
+        int8_t* DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input;
+int32_t* DeeployNetwork_x_tensor;
+int8_t* DeeployNetwork_input1_tensor;
+int32_t* DeeployNetwork_x3_tensor;
+int8_t* DeeployNetwork_input4_tensor;
+int8_t* DeeployNetwork__EXTRACT_CONV_PASS_2_padded_input;
+int32_t* DeeployNetwork_x7_tensor;
+int8_t* DeeployNetwork_input8_tensor;
+int32_t* DeeployNetwork_x11_tensor;
+int8_t* DeeployNetwork_x15_tensor;
+int32_t* DeeployNetwork_x19_tensor;
+int8_t* DeeployNetwork_input12_tensor;
+int8_t* DeeployNetwork__EXTRACT_CONV_PASS_5_padded_input;
+int32_t* DeeployNetwork_x23_tensor;
+int8_t* DeeployNetwork_input16_tensor;
+int32_t* DeeployNetwork_x27_tensor;
+int8_t* DeeployNetwork_input20_tensor;
+int32_t* DeeployNetwork_x39_tensor;
+int8_t* DeeployNetwork_input24_tensor;
+int8_t* DeeployNetwork__EXTRACT_CONV_PASS_8_padded_input;
+int32_t* DeeployNetwork_x43_tensor;
+int8_t* DeeployNetwork_input28_tensor;
+int32_t* DeeployNetwork_x47_tensor;
+int8_t* DeeployNetwork_onnxFlatten_64_tensor;
+int8_t* DeeployNetwork_onnxGemm_65_tensor;
+int32_t* DeeployNetwork_x51_tensor;
+{
+DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input = (int8_t*) deeploy_malloc(1 * 972);
+
+
+
+
+// 2D Pad (Name: _EXTRACT_CONV_PASS_0_pad, Op: Pad)
+BEGIN_SINGLE_CORE
+    memset(DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input, -128, 972*sizeof(int8_t));
+    uint32_t xoffset_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0;
+    uint32_t offset_in_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0 = 0;
+
+    // NCHW Layout
+    for(uint32_t n=0; n<1; n++){
+        xoffset_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0 = n*972 + 1*18+1;
+        for (uint32_t c=0; c<3; ++c) {
+            for(uint32_t h=0; h<16; h++){
+                memcpy(DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input + xoffset_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0, DeeployNetwork_input_0+offset_in_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0, 16*sizeof(int8_t));
+                xoffset_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0 += 18;
+                offset_in_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0 += 16;
+            }
+            xoffset_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0 += 2*1*18;
+        }
+    }
+END_SINGLE_CORE
+
+}
+{
+DeeployNetwork_x_tensor = (int32_t*) deeploy_malloc(4 * 1024);
+
+
+
+
+// 2D Conv (Name: Conv_0, Op: Conv)
+BEGIN_SINGLE_CORE
+    int8_t* ref_DeeployNetwork_x_tensor_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input = DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input;
+    int32_t* ref_DeeployNetwork_x_tensor_DeeployNetwork_x_tensor = DeeployNetwork_x_tensor;
+
+    for (uint32_t n=0; n<1; ++n) {
+        Conv2d_s8_s8_s32_NCHW(
+            ref_DeeployNetwork_x_tensor_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input, 3, 18, 18,
+            DeeployNetwork_conv_QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_0weight_tensor, 16, 3, 3,
+            2, 2,
+            ref_DeeployNetwork_x_tensor_DeeployNetwork_x_tensor, 128, -169344
+        );
+        ref_DeeployNetwork_x_tensor_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input += 972;
+        ref_DeeployNetwork_x_tensor_DeeployNetwork_x_tensor += 1024;
+    }
+END_SINGLE_CORE
+
+
+SINGLE_CORE deeploy_free(DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input);
+
+}
+{
+DeeployNetwork_input1_tensor = (int8_t*) deeploy_malloc(1 * 1024);
+
+
+
+
+// RequantShift (Name: RequantShift_1, Op: RequantShift)
+BEGIN_SINGLE_CORE
+    RequantShift_s32_s8_NCHW(DeeployNetwork_x_tensor, 1024, DeeployNetwork_conv_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_0mul_tensor, DeeployNetwork_conv_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_0add_tensor, DeeployNetwork_input1_tensor, 14, 64, 169344, 0, -128, 127, 1);
+END_SINGLE_CORE
+
+
+SINGLE_CORE deeploy_free(DeeployNetwork_x_tensor);
+
+}
+{
+DeeployNetwork_x3_tensor = (int32_t*) deeploy_malloc(4 * 2048);
+
+
+
+
+// 2D Conv (Name: Conv_2, Op: Conv)
+BEGIN_SINGLE_CORE
+    int8_t* ref_DeeployNetwork_x3_tensor_DeeployNetwork_input1_tensor = DeeployNetwork_input1_tensor;
+    int32_t* ref_DeeployNetwork_x3_tensor_DeeployNetwork_x3_tensor = DeeployNetwork_x3_tensor;
+
+    for (uint32_t n=0; n<1; ++n) {
+        Conv2d_s8_s8_s32_NCHW(
+            ref_DeeployNetwork_x3_tensor_DeeployNetwork_input1_tensor, 16, 8, 8,
+            DeeployNetwork_net0net0net_QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_1weight_tensor, 32, 1, 1,
+            1, 1,
+            ref_DeeployNetwork_x3_tensor_DeeployNetwork_x3_tensor, 0, 0
+        );
+        ref_DeeployNetwork_x3_tensor_DeeployNetwork_input1_tensor += 1024;
+        ref_DeeployNetwork_x3_tensor_DeeployNetwork_x3_tensor += 2048;
+    }
+END_SINGLE_CORE
+
+
+SINGLE_CORE deeploy_free(DeeployNetwork_input1_tensor);
+
+}
+{
+DeeployNetwork_input4_tensor = (int8_t*) deeploy_malloc(1 * 2048);
+
+
+
+
+// RequantShift (Name: RequantShift_3, Op: RequantShift)
+BEGIN_SINGLE_CORE
+    RequantShift_s32_s8_NCHW(DeeployNetwork_x3_tensor, 2048, DeeployNetwork_net0net0net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1mul_tensor, DeeployNetwork_net0net0net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1add_tensor, DeeployNetwork_input4_tensor, 14, 64, 0, 0, -128, 127, 1);
+END_SINGLE_CORE
+
+
+SINGLE_CORE deeploy_free(DeeployNetwork_x3_tensor);
+
+}
+{
+DeeployNetwork__EXTRACT_CONV_PASS_2_padded_input = (int8_t*) deeploy_malloc(1 * 3200);
+
+
+
+
+// 2D Pad (Name: _EXTRACT_CONV_PASS_2_pad, Op: Pad)
+BEGIN_SINGLE_CORE
+    memset(DeeployNetwork__EXTRACT_CONV_PASS_2_padded_input, 0, 3200*sizeof(int8_t));
+    uint32_t xoffset_DeeployNetwork__EXTRACT_CONV_PASS_2_padded_input_DeeployNetwork_input4_tensor;
+    uint32_t offset_in_DeeployNetwork__EXTRACT_CONV_PASS_2_padded_input_DeeployNetwork_input4_tensor = 0;
+
+    // NCHW Layout
+    for(uint32_t n=0; n<1; n++){
+        xoffset_DeeployNetwork__EXTRACT_CONV_PASS_2_padded_input_DeeployNetwork_input4_tensor = n*3200 + 1*10+1;
+        for (uint32_t c=0; c<32; ++c) {
+            for(uint32_t h=0; h<8; h++){
+                memcpy(DeeployNetwork__EXTRACT_CONV_PASS_2_padded_input + xoffset_DeeployNetwork__EXTRACT_CONV_PASS_2_padded_input_DeeployNetwork_input4_tensor, DeeployNetwork_input4_tensor+offset_in_DeeployNetwork__EXTRACT_CONV_PASS_2_padded_input_DeeployNetwork_input4_tensor, 8*sizeof(int8_t));
+                xoffset_DeeployNetwork__EXTRACT_CONV_PASS_2_padded_input_DeeployNetwork_input4_tensor += 10;
+                offset_in_DeeployNetwork__EXTRACT_CONV_PASS_2_padded_input_DeeployNetwork_input4_tensor += 8;
+            }
+            xoffset_DeeployNetwork__EXTRACT_CONV_PASS_2_padded_input_DeeployNetwork_input4_tensor += 2*1*10;
+        }
+    }
+END_SINGLE_CORE
+
+
+SINGLE_CORE deeploy_free(DeeployNetwork_input4_tensor);
+
+}
+{
+DeeployNetwork_x7_tensor = (int32_t*) deeploy_malloc(4 * 512);
+
+
+
+
+// 2D Depth-Wise Conv (Name: Conv_4, Op: Conv)
+BEGIN_SINGLE_CORE
+    int8_t* ref_DeeployNetwork_x7_tensor_DeeployNetwork__EXTRACT_CONV_PASS_2_padded_input = DeeployNetwork__EXTRACT_CONV_PASS_2_padded_input;
+    int32_t* ref_DeeployNetwork_x7_tensor_DeeployNetwork_x7_tensor = DeeployNetwork_x7_tensor;
+
+    for (uint32_t n=0; n<1; ++n) {
+        DWConv2d_s8_s8_s32_NCHW(
+            ref_DeeployNetwork_x7_tensor_DeeployNetwork__EXTRACT_CONV_PASS_2_padded_input, 32, 10, 10,
+            DeeployNetwork_net0net0net_QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_2weight_tensor, 3, 3,
+            2, 2,
+            ref_DeeployNetwork_x7_tensor_DeeployNetwork_x7_tensor, 0, 0
+        );
+        ref_DeeployNetwork_x7_tensor_DeeployNetwork__EXTRACT_CONV_PASS_2_padded_input += 3200;
+        ref_DeeployNetwork_x7_tensor_DeeployNetwork_x7_tensor += 512;
+    }
+END_SINGLE_CORE
+
+
+SINGLE_CORE deeploy_free(DeeployNetwork__EXTRACT_CONV_PASS_2_padded_input);
+
+}
+{
+DeeployNetwork_input8_tensor = (int8_t*) deeploy_malloc(1 * 512);
+
+
+
+
+// RequantShift (Name: RequantShift_5, Op: RequantShift)
+BEGIN_SINGLE_CORE
+    RequantShift_s32_s8_NCHW(DeeployNetwork_x7_tensor, 512, DeeployNetwork_net0net0net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1mul_tensor, DeeployNetwork_net0net0net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1add_tensor, DeeployNetwork_input8_tensor, 14, 16, 0, 0, -128, 127, 1);
+END_SINGLE_CORE
+
+
+SINGLE_CORE deeploy_free(DeeployNetwork_x7_tensor);
+
+}
+{
+DeeployNetwork_x11_tensor = (int32_t*) deeploy_malloc(4 * 256);
+
+
+
+
+// 2D Conv (Name: Conv_6, Op: Conv)
+BEGIN_SINGLE_CORE
+    int8_t* ref_DeeployNetwork_x11_tensor_DeeployNetwork_input8_tensor = DeeployNetwork_input8_tensor;
+    int32_t* ref_DeeployNetwork_x11_tensor_DeeployNetwork_x11_tensor = DeeployNetwork_x11_tensor;
+
+    for (uint32_t n=0; n<1; ++n) {
+        Conv2d_s8_s8_s32_NCHW(
+            ref_DeeployNetwork_x11_tensor_DeeployNetwork_input8_tensor, 32, 4, 4,
+            DeeployNetwork_net0net0net_QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_3weight_tensor, 16, 1, 1,
+            1, 1,
+            ref_DeeployNetwork_x11_tensor_DeeployNetwork_x11_tensor, 0, 0
+        );
+        ref_DeeployNetwork_x11_tensor_DeeployNetwork_input8_tensor += 512;
+        ref_DeeployNetwork_x11_tensor_DeeployNetwork_x11_tensor += 256;
+    }
+END_SINGLE_CORE
+
+
+SINGLE_CORE deeploy_free(DeeployNetwork_input8_tensor);
+
+}
+{
+DeeployNetwork_x15_tensor = (int8_t*) deeploy_malloc(1 * 256);
+
+
+
+
+// RequantShift (Name: RequantShift_7, Op: RequantShift)
+BEGIN_SINGLE_CORE
+    RequantShift_s32_s8_NCHW(DeeployNetwork_x11_tensor, 256, DeeployNetwork_net0net0net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_3mul_tensor, DeeployNetwork_conv_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_0add_tensor, DeeployNetwork_x15_tensor, 14, 16, 0, 0, -128, 127, 1);
+END_SINGLE_CORE
+
+
+SINGLE_CORE deeploy_free(DeeployNetwork_x11_tensor);
+
+}
+{
+DeeployNetwork_x19_tensor = (int32_t*) deeploy_malloc(4 * 512);
+
+
+
+
+// 2D Conv (Name: Conv_9, Op: Conv)
+BEGIN_SINGLE_CORE
+    int8_t* ref_DeeployNetwork_x19_tensor_DeeployNetwork_x15_tensor = DeeployNetwork_x15_tensor;
+    int32_t* ref_DeeployNetwork_x19_tensor_DeeployNetwork_x19_tensor = DeeployNetwork_x19_tensor;
+
+    for (uint32_t n=0; n<1; ++n) {
+        Conv2d_s8_s8_s32_NCHW(
+            ref_DeeployNetwork_x19_tensor_DeeployNetwork_x15_tensor, 16, 4, 4,
+            DeeployNetwork_net0net1net_QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_4weight_tensor, 32, 1, 1,
+            1, 1,
+            ref_DeeployNetwork_x19_tensor_DeeployNetwork_x19_tensor, 0, 0
+        );
+        ref_DeeployNetwork_x19_tensor_DeeployNetwork_x15_tensor += 256;
+        ref_DeeployNetwork_x19_tensor_DeeployNetwork_x19_tensor += 512;
+    }
+END_SINGLE_CORE
+
+}
+{
+DeeployNetwork_input12_tensor = (int8_t*) deeploy_malloc(1 * 512);
+
+
+
+
+// RequantShift (Name: RequantShift_10, Op: RequantShift)
+BEGIN_SINGLE_CORE
+    RequantShift_s32_s8_NCHW(DeeployNetwork_x19_tensor, 512, DeeployNetwork_net0net0net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1mul_tensor, DeeployNetwork_net0net0net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1add_tensor, DeeployNetwork_input12_tensor, 14, 16, 0, 0, -128, 127, 1);
+END_SINGLE_CORE
+
+
+SINGLE_CORE deeploy_free(DeeployNetwork_x19_tensor);
+
+}
+{
+DeeployNetwork__EXTRACT_CONV_PASS_5_padded_input = (int8_t*) deeploy_malloc(1 * 1152);
+
+
+
+
+// 2D Pad (Name: _EXTRACT_CONV_PASS_5_pad, Op: Pad)
+BEGIN_SINGLE_CORE
+    memset(DeeployNetwork__EXTRACT_CONV_PASS_5_padded_input, 0, 1152*sizeof(int8_t));
+    uint32_t xoffset_DeeployNetwork__EXTRACT_CONV_PASS_5_padded_input_DeeployNetwork_input12_tensor;
+    uint32_t offset_in_DeeployNetwork__EXTRACT_CONV_PASS_5_padded_input_DeeployNetwork_input12_tensor = 0;
+
+    // NCHW Layout
+    for(uint32_t n=0; n<1; n++){
+        xoffset_DeeployNetwork__EXTRACT_CONV_PASS_5_padded_input_DeeployNetwork_input12_tensor = n*1152 + 1*6+1;
+        for (uint32_t c=0; c<32; ++c) {
+            for(uint32_t h=0; h<4; h++){
+                memcpy(DeeployNetwork__EXTRACT_CONV_PASS_5_padded_input + xoffset_DeeployNetwork__EXTRACT_CONV_PASS_5_padded_input_DeeployNetwork_input12_tensor, DeeployNetwork_input12_tensor+offset_in_DeeployNetwork__EXTRACT_CONV_PASS_5_padded_input_DeeployNetwork_input12_tensor, 4*sizeof(int8_t));
+                xoffset_DeeployNetwork__EXTRACT_CONV_PASS_5_padded_input_DeeployNetwork_input12_tensor += 6;
+                offset_in_DeeployNetwork__EXTRACT_CONV_PASS_5_padded_input_DeeployNetwork_input12_tensor += 4;
+            }
+            xoffset_DeeployNetwork__EXTRACT_CONV_PASS_5_padded_input_DeeployNetwork_input12_tensor += 2*1*6;
+        }
+    }
+END_SINGLE_CORE
+
+
+SINGLE_CORE deeploy_free(DeeployNetwork_input12_tensor);
+
+}
+{
+DeeployNetwork_x23_tensor = (int32_t*) deeploy_malloc(4 * 512);
+
+
+
+
+// 2D Depth-Wise Conv (Name: Conv_11, Op: Conv)
+BEGIN_SINGLE_CORE
+    int8_t* ref_DeeployNetwork_x23_tensor_DeeployNetwork__EXTRACT_CONV_PASS_5_padded_input = DeeployNetwork__EXTRACT_CONV_PASS_5_padded_input;
+    int32_t* ref_DeeployNetwork_x23_tensor_DeeployNetwork_x23_tensor = DeeployNetwork_x23_tensor;
+
+    for (uint32_t n=0; n<1; ++n) {
+        DWConv2d_s8_s8_s32_NCHW(
+            ref_DeeployNetwork_x23_tensor_DeeployNetwork__EXTRACT_CONV_PASS_5_padded_input, 32, 6, 6,
+            DeeployNetwork_net0net1net_QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_5weight_tensor, 3, 3,
+            1, 1,
+            ref_DeeployNetwork_x23_tensor_DeeployNetwork_x23_tensor, 0, 0
+        );
+        ref_DeeployNetwork_x23_tensor_DeeployNetwork__EXTRACT_CONV_PASS_5_padded_input += 1152;
+        ref_DeeployNetwork_x23_tensor_DeeployNetwork_x23_tensor += 512;
+    }
+END_SINGLE_CORE
+
+
+SINGLE_CORE deeploy_free(DeeployNetwork__EXTRACT_CONV_PASS_5_padded_input);
+
+}
+{
+DeeployNetwork_input16_tensor = (int8_t*) deeploy_malloc(1 * 512);
+
+
+
+
+// RequantShift (Name: RequantShift_12, Op: RequantShift)
+BEGIN_SINGLE_CORE
+    RequantShift_s32_s8_NCHW(DeeployNetwork_x23_tensor, 512, DeeployNetwork_net0net0net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1mul_tensor, DeeployNetwork_net0net0net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1add_tensor, DeeployNetwork_input16_tensor, 14, 16, 0, 0, -128, 127, 1);
+END_SINGLE_CORE
+
+
+SINGLE_CORE deeploy_free(DeeployNetwork_x23_tensor);
+
+}
+{
+DeeployNetwork_x27_tensor = (int32_t*) deeploy_malloc(4 * 256);
+
+
+
+
+// 2D Conv (Name: Conv_13, Op: Conv)
+BEGIN_SINGLE_CORE
+    int8_t* ref_DeeployNetwork_x27_tensor_DeeployNetwork_input16_tensor = DeeployNetwork_input16_tensor;
+    int32_t* ref_DeeployNetwork_x27_tensor_DeeployNetwork_x27_tensor = DeeployNetwork_x27_tensor;
+
+    for (uint32_t n=0; n<1; ++n) {
+        Conv2d_s8_s8_s32_NCHW(
+            ref_DeeployNetwork_x27_tensor_DeeployNetwork_input16_tensor, 32, 4, 4,
+            DeeployNetwork_net0net1net_QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_6weight_tensor, 16, 1, 1,
+            1, 1,
+            ref_DeeployNetwork_x27_tensor_DeeployNetwork_x27_tensor, 0, 0
+        );
+        ref_DeeployNetwork_x27_tensor_DeeployNetwork_input16_tensor += 512;
+        ref_DeeployNetwork_x27_tensor_DeeployNetwork_x27_tensor += 256;
+    }
+END_SINGLE_CORE
+
+
+SINGLE_CORE deeploy_free(DeeployNetwork_input16_tensor);
+
+}
+{
+DeeployNetwork_input20_tensor = (int8_t*) deeploy_malloc(1 * 256);
+
+
+// Fused Elementwise (Name: _FUSE_ELEMENTWISE_PASS_0, Op: FusedElementwise)
+BEGIN_SINGLE_CORE
+    for (uint32_t i = 0; i < 256; i++) {
+
+
+        int32_t x0 = (int32_t) DeeployNetwork_x27_tensor[i];
+        int32_t x1 = (int32_t) DeeployNetwork_x15_tensor[i];
+        int32_t x2 = (int32_t) DeeployNetwork_net0net1net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_6mul_tensor[((i / (4 * 4)) % 16)];
+        int32_t x3 = (int32_t) DeeployNetwork_net0net1net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_6add_tensor[((i / (4 * 4)) % 16)];
+        int32_t x4 = (int32_t) DeeployNetwork__QL_OP_TREE_REPLACE_ADDITION_0acts_QL_REPLACED__INTEGERIZE_SIGNED_ACT_PASS_0mul_tensor[0];
+        int32_t x5 = (int32_t) DeeployNetwork__QL_OP_TREE_REPLACE_ADDITION_0acts_QL_REPLACED__INTEGERIZE_SIGNED_ACT_PASS_0add_tensor[0];
+        int32_t x6 = (int32_t) DeeployNetwork__QL_OP_TREE_REPLACE_ADDITION_0acts_QL_REPLACED__INTEGERIZE_SIGNED_ACT_PASS_0mul_tensor[0];
+        int32_t x7 = (int32_t) DeeployNetwork__QL_OP_TREE_REPLACE_ADDITION_0acts_QL_REPLACED__INTEGERIZE_SIGNED_ACT_PASS_0add_tensor[0];
+        int32_t x8 = (int32_t) DeeployNetwork__QL_OP_TREE_REPLACE_ADDITION_0acts_QL_REPLACED__INTEGERIZE_SIGNED_ACT_PASS_0mul_tensor[0];
+        int32_t x9 = (int32_t) DeeployNetwork__QL_OP_TREE_REPLACE_ADDITION_0acts_QL_REPLACED__INTEGERIZE_SIGNED_ACT_PASS_0add_tensor[0];
+        int32_t t0 = (x0 * x2 + x3 + 8192) >> 14;
+        t0 = CLAMP(t0, -128, 127);
+        int32_t t1 = (t0 * x4 + x5 + 8192) >> 14;
+        t1 = CLAMP(t1, -128, 127);
+        int32_t t2 = (x1 * x6 + x7 + 8192) >> 14;
+        t2 = CLAMP(t2, -128, 127);
+        int32_t t3 = t1 + t2;
+        int32_t t4 = (t3 * x8 + x9 + 8192) >> 14;
+        t4 = CLAMP(t4, -128, 127);
+        DeeployNetwork_input20_tensor[i] = (int8_t) (t4);
+
+    }
+END_SINGLE_CORE
+
+
+SINGLE_CORE deeploy_free(DeeployNetwork_x15_tensor);
+
+
+SINGLE_CORE deeploy_free(DeeployNetwork_x27_tensor);
+
+}
+{
+DeeployNetwork_x39_tensor = (int32_t*) deeploy_malloc(4 * 512);
+
+
+
+
+// 2D Conv (Name: Conv_18, Op: Conv)
+BEGIN_SINGLE_CORE
+    int8_t* ref_DeeployNetwork_x39_tensor_DeeployNetwork_input20_tensor = DeeployNetwork_input20_tensor;
+    int32_t* ref_DeeployNetwork_x39_tensor_DeeployNetwork_x39_tensor = DeeployNetwork_x39_tensor;
+
+    for (uint32_t n=0; n<1; ++n) {
+        Conv2d_s8_s8_s32_NCHW(
+            ref_DeeployNetwork_x39_tensor_DeeployNetwork_input20_tensor, 16, 4, 4,
+            DeeployNetwork_net0net2net_QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_7weight_tensor, 32, 1, 1,
+            1, 1,
+            ref_DeeployNetwork_x39_tensor_DeeployNetwork_x39_tensor, 0, 0
+        );
+        ref_DeeployNetwork_x39_tensor_DeeployNetwork_input20_tensor += 256;
+        ref_DeeployNetwork_x39_tensor_DeeployNetwork_x39_tensor += 512;
+    }
+END_SINGLE_CORE
+
+
+SINGLE_CORE deeploy_free(DeeployNetwork_input20_tensor);
+
+}
+{
+DeeployNetwork_input24_tensor = (int8_t*) deeploy_malloc(1 * 512);
+
+
+
+
+// RequantShift (Name: RequantShift_19, Op: RequantShift)
+BEGIN_SINGLE_CORE
+    RequantShift_s32_s8_NCHW(DeeployNetwork_x39_tensor, 512, DeeployNetwork_net0net0net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1mul_tensor, DeeployNetwork_net0net0net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1add_tensor, DeeployNetwork_input24_tensor, 14, 16, 0, 0, -128, 127, 1);
+END_SINGLE_CORE
+
+
+SINGLE_CORE deeploy_free(DeeployNetwork_x39_tensor);
+
+}
+{
+DeeployNetwork__EXTRACT_CONV_PASS_8_padded_input = (int8_t*) deeploy_malloc(1 * 1152);
+
+
+
+
+// 2D Pad (Name: _EXTRACT_CONV_PASS_8_pad, Op: Pad)
+BEGIN_SINGLE_CORE
+    memset(DeeployNetwork__EXTRACT_CONV_PASS_8_padded_input, 0, 1152*sizeof(int8_t));
+    uint32_t xoffset_DeeployNetwork__EXTRACT_CONV_PASS_8_padded_input_DeeployNetwork_input24_tensor;
+    uint32_t offset_in_DeeployNetwork__EXTRACT_CONV_PASS_8_padded_input_DeeployNetwork_input24_tensor = 0;
+
+    // NCHW Layout
+    for(uint32_t n=0; n<1; n++){
+        xoffset_DeeployNetwork__EXTRACT_CONV_PASS_8_padded_input_DeeployNetwork_input24_tensor = n*1152 + 1*6+1;
+        for (uint32_t c=0; c<32; ++c) {
+            for(uint32_t h=0; h<4; h++){
+                memcpy(DeeployNetwork__EXTRACT_CONV_PASS_8_padded_input + xoffset_DeeployNetwork__EXTRACT_CONV_PASS_8_padded_input_DeeployNetwork_input24_tensor, DeeployNetwork_input24_tensor+offset_in_DeeployNetwork__EXTRACT_CONV_PASS_8_padded_input_DeeployNetwork_input24_tensor, 4*sizeof(int8_t));
+                xoffset_DeeployNetwork__EXTRACT_CONV_PASS_8_padded_input_DeeployNetwork_input24_tensor += 6;
+                offset_in_DeeployNetwork__EXTRACT_CONV_PASS_8_padded_input_DeeployNetwork_input24_tensor += 4;
+            }
+            xoffset_DeeployNetwork__EXTRACT_CONV_PASS_8_padded_input_DeeployNetwork_input24_tensor += 2*1*6;
+        }
+    }
+END_SINGLE_CORE
+
+
+SINGLE_CORE deeploy_free(DeeployNetwork_input24_tensor);
+
+}
+{
+DeeployNetwork_x43_tensor = (int32_t*) deeploy_malloc(4 * 512);
+
+
+
+
+// 2D Depth-Wise Conv (Name: Conv_20, Op: Conv)
+BEGIN_SINGLE_CORE
+    int8_t* ref_DeeployNetwork_x43_tensor_DeeployNetwork__EXTRACT_CONV_PASS_8_padded_input = DeeployNetwork__EXTRACT_CONV_PASS_8_padded_input;
+    int32_t* ref_DeeployNetwork_x43_tensor_DeeployNetwork_x43_tensor = DeeployNetwork_x43_tensor;
+
+    for (uint32_t n=0; n<1; ++n) {
+        DWConv2d_s8_s8_s32_NCHW(
+            ref_DeeployNetwork_x43_tensor_DeeployNetwork__EXTRACT_CONV_PASS_8_padded_input, 32, 6, 6,
+            DeeployNetwork_net0net2net_QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_8weight_tensor, 3, 3,
+            1, 1,
+            ref_DeeployNetwork_x43_tensor_DeeployNetwork_x43_tensor, 0, 0
+        );
+        ref_DeeployNetwork_x43_tensor_DeeployNetwork__EXTRACT_CONV_PASS_8_padded_input += 1152;
+        ref_DeeployNetwork_x43_tensor_DeeployNetwork_x43_tensor += 512;
+    }
+END_SINGLE_CORE
+
+
+SINGLE_CORE deeploy_free(DeeployNetwork__EXTRACT_CONV_PASS_8_padded_input);
+
+}
+{
+DeeployNetwork_input28_tensor = (int8_t*) deeploy_malloc(1 * 512);
+
+
+
+
+// RequantShift (Name: RequantShift_21, Op: RequantShift)
+BEGIN_SINGLE_CORE
+    RequantShift_s32_s8_NCHW(DeeployNetwork_x43_tensor, 512, DeeployNetwork_net0net0net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1mul_tensor, DeeployNetwork_net0net0net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1add_tensor, DeeployNetwork_input28_tensor, 14, 16, 0, 0, -128, 127, 1);
+END_SINGLE_CORE
+
+
+SINGLE_CORE deeploy_free(DeeployNetwork_x43_tensor);
+
+}
+{
+DeeployNetwork_x47_tensor = (int32_t*) deeploy_malloc(4 * 512);
+
+
+
+
+// 2D Conv (Name: Conv_22, Op: Conv)
+BEGIN_SINGLE_CORE
+    int8_t* ref_DeeployNetwork_x47_tensor_DeeployNetwork_input28_tensor = DeeployNetwork_input28_tensor;
+    int32_t* ref_DeeployNetwork_x47_tensor_DeeployNetwork_x47_tensor = DeeployNetwork_x47_tensor;
+
+    for (uint32_t n=0; n<1; ++n) {
+        Conv2d_s8_s8_s32_NCHW(
+            ref_DeeployNetwork_x47_tensor_DeeployNetwork_input28_tensor, 32, 4, 4,
+            DeeployNetwork_net0net2net_QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_9weight_tensor, 32, 1, 1,
+            1, 1,
+            ref_DeeployNetwork_x47_tensor_DeeployNetwork_x47_tensor, 0, 0
+        );
+        ref_DeeployNetwork_x47_tensor_DeeployNetwork_input28_tensor += 512;
+        ref_DeeployNetwork_x47_tensor_DeeployNetwork_x47_tensor += 512;
+    }
+END_SINGLE_CORE
+
+
+SINGLE_CORE deeploy_free(DeeployNetwork_input28_tensor);
+
+}
+{
+DeeployNetwork_onnxFlatten_64_tensor = (int8_t*) deeploy_malloc(1 * 512);
+
+
+
+
+// RequantShift (Name: RequantShift_23, Op: RequantShift)
+BEGIN_SINGLE_CORE
+    RequantShift_s32_s8_NCHW(DeeployNetwork_x47_tensor, 512, DeeployNetwork_net0net0net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1mul_tensor, DeeployNetwork_net0net0net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1add_tensor, DeeployNetwork_onnxFlatten_64_tensor, 14, 16, 0, 0, -128, 127, 1);
+END_SINGLE_CORE
+
+
+SINGLE_CORE deeploy_free(DeeployNetwork_x47_tensor);
+
+}
+{
+
+// Reshape (Name: Flatten_24, Op: Flatten)
+SINGLE_CORE DeeployNetwork_onnxGemm_65_tensor = DeeployNetwork_onnxFlatten_64_tensor;
+
+}
+{
+DeeployNetwork_x51_tensor = (int32_t*) deeploy_malloc(4 * 10);
+
+
+// GEMM (Name: Gemm_25, Op: Gemm)
+BEGIN_SINGLE_CORE
+    int8_t* ref_DeeployNetwork_x51_tensor_DeeployNetwork_onnxGemm_65_tensor = DeeployNetwork_onnxGemm_65_tensor;
+    int8_t* ref_DeeployNetwork_x51_tensor_DeeployNetwork_classifier_QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0weight_tensor = DeeployNetwork_classifier_QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0weight_tensor;
+    int32_t* ref_DeeployNetwork_x51_tensor_DeeployNetwork_classifier_QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0bias_tensor = DeeployNetwork_classifier_QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0bias_tensor;
+    int32_t* ref_DeeployNetwork_x51_tensor_DeeployNetwork_x51_tensor = DeeployNetwork_x51_tensor;
+
+    for(uint32_t i=0;i<1.0;i++){
+        Gemm_s8_s8_s32_s32(
+            ref_DeeployNetwork_x51_tensor_DeeployNetwork_onnxGemm_65_tensor,
+            ref_DeeployNetwork_x51_tensor_DeeployNetwork_classifier_QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0weight_tensor,
+            ref_DeeployNetwork_x51_tensor_DeeployNetwork_classifier_QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0bias_tensor,
+            ref_DeeployNetwork_x51_tensor_DeeployNetwork_x51_tensor,
+            1,
+            512,
+            10,
+            1,
+            1,
+            0,
+            1,
+            0,
+            0,
+            0,
+            0
+        );
+
+        ref_DeeployNetwork_x51_tensor_DeeployNetwork_onnxGemm_65_tensor += 1 * 512;
+        ref_DeeployNetwork_x51_tensor_DeeployNetwork_classifier_QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0weight_tensor += 512 * 10;
+        ref_DeeployNetwork_x51_tensor_DeeployNetwork_classifier_QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0bias_tensor += 1 * 10;
+        ref_DeeployNetwork_x51_tensor_DeeployNetwork_x51_tensor += 1 * 10;
+    }
+END_SINGLE_CORE
+
+
+SINGLE_CORE deeploy_free(DeeployNetwork_onnxGemm_65_tensor);
+
+}
+{
+
+
+
+// RequantShift (Name: RequantShift_26, Op: RequantShift)
+BEGIN_SINGLE_CORE
+    RequantShift_s32_s8_NCHW(DeeployNetwork_x51_tensor, 10, DeeployNetwork_classifier_QL_REPLACED__INTEGERIZE_SIGNED_ACT_PASS_3mul_tensor, DeeployNetwork_classifier_QL_REPLACED__INTEGERIZE_SIGNED_ACT_PASS_3add_tensor, DeeployNetwork_output_0, 14, 1, 0, 0, -128, 127, 1);
+END_SINGLE_CORE
+
+
+SINGLE_CORE deeploy_free(DeeployNetwork_x51_tensor);
+
+}
+
+        }
+
+        void InitNetwork(__attribute__((unused)) uint32_t core_id, __attribute__((unused)) uint32_t numThreads){
+        DeeployNetwork_input_0 = (int8_t*) deeploy_malloc(1 * 768);
+DeeployNetwork_output_0 = (int8_t*) deeploy_malloc(1 * 10);
+DeeployNetwork_inputs[0] = (void*) DeeployNetwork_input_0;DeeployNetwork_outputs[0] = (void*) DeeployNetwork_output_0;
+    }
+    
\ No newline at end of file
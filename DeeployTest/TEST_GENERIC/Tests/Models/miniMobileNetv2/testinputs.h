@@ -0,0 +1,2 @@
+int8_t testInputVector0[] ={103.0, -89.0, -82.0, -109.0, 46.0, 117.0, -38.0, -70.0, -71.0, -9.0, 57.0, -27.0, -86.0, -34.0, 83.0, -42.0, -41.0, 50.0, -107.0, 4.0, 123.0, 63.0, 76.0, 13.0, 61.0, -111.0, -56.0, -117.0, -36.0, -74.0, -81.0, 110.0, -42.0, 110.0, 40.0, 31.0, 31.0, 35.0, -102.0, -6.0, -67.0, -45.0, -67.0, 14.0, -78.0, 25.0, 122.0, 32.0, -20.0, -14.0, -69.0, -126.0, -92.0, 76.0, -4.0, -1.0, 2.0, 61.0, -56.0, 92.0, 85.0, -119.0, -89.0, 20.0, 92.0, 49.0, 68.0, 121.0, -99.0, 7.0, -10.0, 97.0, 81.0, -82.0, -1.0, -108.0, 30.0, 28.0, -39.0, -102.0, -64.0, 110.0, -108.0, -89.0, 72.0, 113.0, 11.0, 31.0, 88.0, 100.0, 126.0, 1.0, 105.0, -114.0, -126.0, 93.0, -22.0, 88.0, -93.0, -81.0, -55.0, -63.0, -114.0, 10.0, -33.0, 94.0, -75.0, -86.0, 39.0, 63.0, -13.0, 108.0, -44.0, 106.0, 17.0, -98.0, 42.0, 38.0, 72.0, -68.0, 115.0, 83.0, -76.0, -64.0, -44.0, -108.0, -13.0, 112.0, 76.0, 20.0, 26.0, 44.0, 78.0, -101.0, 82.0, -55.0, -63.0, 111.0, 71.0, -45.0, 106.0, -28.0, -9.0, 44.0, 69.0, 73.0, -12.0, -103.0, 77.0, 77.0, -125.0, 94.0, 49.0, 59.0, -62.0, 58.0, -99.0, -100.0, 102.0, 80.0, -15.0, -65.0, 114.0, -118.0, 126.0, 57.0, 21.0, -29.0, -122.0, 91.0, -111.0, -66.0, -93.0, -109.0, -81.0, 79.0, -59.0, -125.0, -81.0, -99.0, 9.0, 47.0, -119.0, 70.0, -15.0, 32.0, 100.0, -55.0, 97.0, 86.0, 89.0, -14.0, -67.0, 53.0, 127.0, 85.0, 77.0, 63.0, -57.0, 21.0, 118.0, 81.0, -5.0, -115.0, 94.0, 88.0, 101.0, 12.0, 0.0, 3.0, 38.0, -59.0, 98.0, 100.0, -121.0, 97.0, -70.0, 106.0, 34.0, 95.0, -28.0, -34.0, -17.0, -49.0, 17.0, 62.0, 38.0, -65.0, 104.0, -56.0, 98.0, 90.0, 42.0, -42.0, -49.0, -53.0, -78.0, 33.0, -32.0, 121.0, 66.0, -10.0, -16.0, 126.0, 123.0, -10.0, 63.0, 33.0, -95.0, 85.0, 68.0, 116.0, 72.0, 20.0, 42.0, -48.0, 0.0, 5.0, 90.0, 41.0, -94.0, -16.0, -126.0, 59.0, 114.0, -87.0, 1.0, -5.0, 2.0, -124.0, -90.0, -67.0, -108.0, 103.0, -111.0, 61.0, 6.0, 16.0, -83.0, -15.0, -79.0, -36.0, 72.0, 4.0, 119.0, 69.0, -54.0, 46.0, 42.0, 102.0, 60.0, -39.0, -123.0, 5.0, 36.0, 49.0, 5.0, 1.0, 85.0, -39.0, 48.0, -64.0, 44.0, 35.0, 52.0, 101.0, -92.0, -120.0, 17.0, 61.0, 25.0, 34.0, 45.0, -16.0, -102.0, 66.0, 2.0, -117.0, -56.0, -117.0, -28.0, -59.0, -41.0, 20.0, -84.0, 126.0, 71.0, 17.0, -87.0, -76.0, -43.0, 109.0, 79.0, -92.0, -94.0, -3.0, -31.0, 98.0, -52.0, -76.0, 29.0, -73.0, -108.0, -53.0, -18.0, 86.0, 81.0, 122.0, 31.0, -84.0, 34.0, 58.0, 25.0, -38.0, -4.0, -106.0, 67.0, -117.0, 84.0, 39.0, 20.0, 99.0, 54.0, -20.0, -123.0, 122.0, -98.0, -47.0, 91.0, -21.0, 17.0, 36.0, -92.0, 60.0, 7.0, -76.0, 76.0, -96.0, 43.0, -49.0, -46.0, -20.0, -14.0, -88.0, 90.0, 40.0, -117.0, 108.0, 19.0, 10.0, 70.0, -94.0, 120.0, 54.0, -100.0, -63.0, -96.0, 72.0, 0.0, -4.0, -19.0, -30.0, -121.0, 93.0, -80.0, 27.0, -4.0, 60.0, 49.0, -89.0, -53.0, 114.0, -44.0, -37.0, -90.0, -125.0, -72.0, 52.0, -47.0, 15.0, 29.0, 67.0, -68.0, -34.0, 31.0, -107.0, 36.0, -9.0, -127.0, 40.0, -51.0, 0.0, 84.0, -86.0, -125.0, -64.0, 49.0, 12.0, 3.0, 3.0, 105.0, 22.0, -44.0, 83.0, 45.0, 110.0, 5.0, -3.0, -113.0, 9.0, -112.0, -16.0, -73.0, 29.0, 14.0, -2.0, -56.0, -109.0, 25.0, -13.0, 47.0, -81.0, 31.0, 105.0, -53.0, 123.0, 8.0, 25.0, -2.0, 42.0, 20.0, 51.0, 92.0, -37.0, 16.0, 2.0, 118.0, 89.0, 23.0, -37.0, -43.0, 110.0, 3.0, -56.0, 86.0, 65.0, -22.0, -118.0, 16.0, 20.0, -57.0, 81.0, 93.0, 24.0, -83.0, 60.0, 116.0, 118.0, -66.0, -101.0, 121.0, -106.0, -19.0, 76.0, 80.0, -77.0, 75.0, -113.0, 54.0, 22.0, -40.0, 80.0, 60.0, -66.0, 94.0, 72.0, -43.0, -31.0, 29.0, 103.0, -28.0, -91.0, -44.0, 54.0, -43.0, -90.0, -116.0, -27.0, 68.0, 55.0, -106.0, -5.0, 31.0, 62.0, 20.0, 57.0, 8.0, 59.0, 35.0, -31.0, 33.0, 22.0, 109.0, 78.0, -94.0, 84.0, 24.0, 50.0, -119.0, 96.0, 37.0, 71.0, 109.0, 73.0, -90.0, -37.0, -128.0, 77.0, -113.0, 0.0, 73.0, -124.0, -15.0, -82.0, -112.0, -15.0, 7.0, 23.0, 35.0, -54.0, 39.0, -114.0, 70.0, -68.0, 119.0, -85.0, -111.0, -107.0, -115.0, 71.0, -66.0, 89.0, 42.0, 91.0, 39.0, -46.0, -74.0, 67.0, -17.0, 9.0, 8.0, 20.0, 87.0, 80.0, 93.0, -109.0, 69.0, -72.0, 36.0, 11.0, 126.0, 20.0, 4.0, 29.0, 29.0, -123.0, 33.0, 36.0, 76.0, -121.0, -75.0, 48.0, -72.0, 110.0, -104.0, -81.0, 7.0, -11.0, -5.0, -120.0, -45.0, -95.0, -85.0, 85.0, 72.0, 114.0, -90.0, 22.0, 41.0, 31.0, -73.0, 7.0, -84.0, -43.0, -91.0, -100.0, 27.0, -43.0, -7.0, 60.0, 40.0, 33.0, 14.0, -44.0, -27.0, -49.0, -73.0, 88.0, -68.0, -22.0, -94.0, -72.0, 69.0, -98.0, 96.0, 62.0, -122.0, 14.0, -75.0, -30.0, -127.0, -91.0, -23.0, -5.0, -24.0, 93.0, 49.0, 115.0, -64.0, 80.0, 112.0, -50.0, 34.0, 60.0, -20.0, -24.0, 56.0, -16.0, -56.0, 13.0, -104.0, -92.0, -80.0, -65.0, -91.0, -36.0, -56.0, 82.0, -25.0, -49.0, -124.0, 103.0, 19.0, 115.0, -48.0, -45.0, -111.0, 48.0, 67.0, 58.0, -65.0, -121.0, -103.0, -88.0, -114.0, -103.0, -83.0, 42.0, 116.0, 71.0, -35.0, -78.0, 120.0, 100.0, -12.0, -20.0, -85.0, -74.0, 18.0, -9.0, 10.0, 122.0, 117.0, 68.0, -115.0, 35.0, 15.0, -104.0, -70.0, 15.0, -55.0, 58.0, 66.0, -126.0, 2.0, 57.0, 103.0, -70.0, -127.0, -24.0, -88.0, 50.0, -16.0, -42.0, 94.0, 40.0, 80.0, -86.0, -102.0, -117.0, 100.0, -81.0, 42.0, 88.0, -112.0, 7.0, 94.0, 107.0, -83.0, -94.0, 65.0, 91.0, 42.0, 45.0, -52.0, -115.0, 115.0, -123.0};
+void* testInputVector[1] = {testInputVector0};
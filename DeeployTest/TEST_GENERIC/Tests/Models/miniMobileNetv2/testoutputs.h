@@ -0,0 +1,4 @@
+#define OUTPUTTYPE int8_t
+#define ISOUTPUTFLOAT 0
+int8_t testOutputVector0[] ={-4.0, 1.0, 3.0, -1.0, -1.0, 3.0, 1.0, 3.0, 2.0, 4.0, 0, 0};
+void* testOutputVector[1] = {testOutputVector0};
@@ -0,0 +1,9 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/network.dir/TEST_GENERIC/Tests/Models/CNN_Linear2/Network.c.o"
+  "CMakeFiles/network.dir/TEST_GENERIC/Tests/Models/CNN_Linear2/Network.c.o.d"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang C)
+  include(CMakeFiles/network.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "../../../bin/CNN_Linear2"
+  "../../../bin/CNN_Linear2.pdb"
+  "CMakeFiles/CNN_Linear2.dir/main.c.o"
+  "CMakeFiles/CNN_Linear2.dir/main.c.o.d"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang C)
+  include(CMakeFiles/CNN_Linear2.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
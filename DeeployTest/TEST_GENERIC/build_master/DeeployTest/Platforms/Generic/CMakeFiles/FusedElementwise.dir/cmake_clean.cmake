@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "../../../bin/FusedElementwise"
+  "../../../bin/FusedElementwise.pdb"
+  "CMakeFiles/FusedElementwise.dir/main.c.o"
+  "CMakeFiles/FusedElementwise.dir/main.c.o.d"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang C)
+  include(CMakeFiles/FusedElementwise.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,20 @@
+
+# Consider dependencies only in project.
+set(CMAKE_DEPENDS_IN_PROJECT_ONLY OFF)
+
+# The set of languages for which implicit dependencies are needed:
+set(CMAKE_DEPENDS_LANGUAGES
+  )
+
+# The set of dependency files which are needed:
+set(CMAKE_DEPENDS_DEPENDENCY_FILES
+  "/root/package/DeeployTest/Platforms/Generic/main.c" "DeeployTest/Platforms/Generic/CMakeFiles/Regular_2D_RQ_Add.dir/main.c.o" "gcc" "DeeployTest/Platforms/Generic/CMakeFiles/Regular_2D_RQ_Add.dir/main.c.o.d"
+  )
+
+# Targets to which this target links.
+set(CMAKE_TARGET_LINKED_INFO_FILES
+  "/root/package/DeeployTest/TEST_GENERIC/build_master/TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/DependInfo.cmake"
+  )
+
+# Fortran module output directory.
+set(CMAKE_Fortran_TARGET_MODULE_DIR "")
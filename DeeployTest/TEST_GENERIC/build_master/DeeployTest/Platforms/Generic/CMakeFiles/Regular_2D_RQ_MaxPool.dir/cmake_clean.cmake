@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "../../../bin/Regular_2D_RQ_MaxPool"
+  "../../../bin/Regular_2D_RQ_MaxPool.pdb"
+  "CMakeFiles/Regular_2D_RQ_MaxPool.dir/main.c.o"
+  "CMakeFiles/Regular_2D_RQ_MaxPool.dir/main.c.o.d"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang C)
+  include(CMakeFiles/Regular_2D_RQ_MaxPool.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
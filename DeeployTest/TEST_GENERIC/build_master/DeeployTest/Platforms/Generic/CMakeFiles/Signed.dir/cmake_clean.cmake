@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "../../../bin/Signed"
+  "../../../bin/Signed.pdb"
+  "CMakeFiles/Signed.dir/main.c.o"
+  "CMakeFiles/Signed.dir/main.c.o.d"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang C)
+  include(CMakeFiles/Signed.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
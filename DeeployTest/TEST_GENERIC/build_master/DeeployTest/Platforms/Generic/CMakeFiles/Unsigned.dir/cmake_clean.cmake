@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "../../../bin/Unsigned"
+  "../../../bin/Unsigned.pdb"
+  "CMakeFiles/Unsigned.dir/main.c.o"
+  "CMakeFiles/Unsigned.dir/main.c.o.d"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang C)
+  include(CMakeFiles/Unsigned.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
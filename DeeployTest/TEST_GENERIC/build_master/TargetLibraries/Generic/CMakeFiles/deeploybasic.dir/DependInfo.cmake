@@ -0,0 +1,61 @@
+
+# Consider dependencies only in project.
+set(CMAKE_DEPENDS_IN_PROJECT_ONLY OFF)
+
+# The set of languages for which implicit dependencies are needed:
+set(CMAKE_DEPENDS_LANGUAGES
+  )
+
+# The set of dependency files which are needed:
+set(CMAKE_DEPENDS_DEPENDENCY_FILES
+  "/root/package/TargetLibraries/Generic/src/AveragePool_fp32.c" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/AveragePool_fp32.c.o" "gcc" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/AveragePool_fp32.c.o.d"
+  "/root/package/TargetLibraries/Generic/src/BatchNorm_fp32.c" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/BatchNorm_fp32.c.o" "gcc" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/BatchNorm_fp32.c.o.d"
+  "/root/package/TargetLibraries/Generic/src/Ceil_fp32.c" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/Ceil_fp32.c.o" "gcc" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/Ceil_fp32.c.o.d"
+  "/root/package/TargetLibraries/Generic/src/Clip_fp32.c" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/Clip_fp32.c.o" "gcc" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/Clip_fp32.c.o.d"
+  "/root/package/TargetLibraries/Generic/src/ConvTranspose1d_fp32.c" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/ConvTranspose1d_fp32.c.o" "gcc" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/ConvTranspose1d_fp32.c.o.d"
+  "/root/package/TargetLibraries/Generic/src/Convolution_fp32.c" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/Convolution_fp32.c.o" "gcc" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/Convolution_fp32.c.o.d"
+  "/root/package/TargetLibraries/Generic/src/Convolution_s8.c" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/Convolution_s8.c.o" "gcc" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/Convolution_s8.c.o.d"
+  "/root/package/TargetLibraries/Generic/src/DWConvolution_fp32.c" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/DWConvolution_fp32.c.o" "gcc" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/DWConvolution_fp32.c.o.d"
+  "/root/package/TargetLibraries/Generic/src/DWConvolution_s8.c" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/DWConvolution_s8.c.o" "gcc" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/DWConvolution_s8.c.o.d"
+  "/root/package/TargetLibraries/Generic/src/Div_fp32.c" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/Div_fp32.c.o" "gcc" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/Div_fp32.c.o.d"
+  "/root/package/TargetLibraries/Generic/src/Div_s32.c" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/Div_s32.c.o" "gcc" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/Div_s32.c.o.d"
+  "/root/package/TargetLibraries/Generic/src/Exp_fp32.c" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/Exp_fp32.c.o" "gcc" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/Exp_fp32.c.o.d"
+  "/root/package/TargetLibraries/Generic/src/Floor_fp32.c" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/Floor_fp32.c.o" "gcc" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/Floor_fp32.c.o.d"
+  "/root/package/TargetLibraries/Generic/src/GELU_fp32.c" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/GELU_fp32.c.o" "gcc" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/GELU_fp32.c.o.d"
+  "/root/package/TargetLibraries/Generic/src/GELU_s8.c" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/GELU_s8.c.o" "gcc" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/GELU_s8.c.o.d"
+  "/root/package/TargetLibraries/Generic/src/Gemm_fp32.c" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/Gemm_fp32.c.o" "gcc" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/Gemm_fp32.c.o.d"
+  "/root/package/TargetLibraries/Generic/src/Gemm_s8.c" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/Gemm_s8.c.o" "gcc" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/Gemm_s8.c.o.d"
+  "/root/package/TargetLibraries/Generic/src/GlobalAveragePool_fp32.c" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/GlobalAveragePool_fp32.c.o" "gcc" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/GlobalAveragePool_fp32.c.o.d"
+  "/root/package/TargetLibraries/Generic/src/GlobalMaxPool_fp32.c" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/GlobalMaxPool_fp32.c.o" "gcc" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/GlobalMaxPool_fp32.c.o.d"
+  "/root/package/TargetLibraries/Generic/src/GroupNormalization_fp32.c" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/GroupNormalization_fp32.c.o" "gcc" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/GroupNormalization_fp32.c.o.d"
+  "/root/package/TargetLibraries/Generic/src/HardSigmoid_fp32.c" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/HardSigmoid_fp32.c.o" "gcc" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/HardSigmoid_fp32.c.o.d"
+  "/root/package/TargetLibraries/Generic/src/HardSwish_fp32.c" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/HardSwish_fp32.c.o" "gcc" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/HardSwish_fp32.c.o.d"
+  "/root/package/TargetLibraries/Generic/src/Hardswish_s8.c" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/Hardswish_s8.c.o" "gcc" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/Hardswish_s8.c.o.d"
+  "/root/package/TargetLibraries/Generic/src/InstanceNormalization_fp32.c" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/InstanceNormalization_fp32.c.o" "gcc" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/InstanceNormalization_fp32.c.o.d"
+  "/root/package/TargetLibraries/Generic/src/Layernorm_fp32.c" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/Layernorm_fp32.c.o" "gcc" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/Layernorm_fp32.c.o.d"
+  "/root/package/TargetLibraries/Generic/src/Layernorm_s8.c" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/Layernorm_s8.c.o" "gcc" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/Layernorm_s8.c.o.d"
+  "/root/package/TargetLibraries/Generic/src/MatMul_fp32.c" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/MatMul_fp32.c.o" "gcc" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/MatMul_fp32.c.o.d"
+  "/root/package/TargetLibraries/Generic/src/MatMul_s8.c" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/MatMul_s8.c.o" "gcc" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/MatMul_s8.c.o.d"
+  "/root/package/TargetLibraries/Generic/src/MaxPool_fp32.c" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/MaxPool_fp32.c.o" "gcc" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/MaxPool_fp32.c.o.d"
+  "/root/package/TargetLibraries/Generic/src/MaxPool_s8.c" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/MaxPool_s8.c.o" "gcc" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/MaxPool_s8.c.o.d"
+  "/root/package/TargetLibraries/Generic/src/Pow_fp32.c" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/Pow_fp32.c.o" "gcc" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/Pow_fp32.c.o.d"
+  "/root/package/TargetLibraries/Generic/src/RQDiv_s8.c" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/RQDiv_s8.c.o" "gcc" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/RQDiv_s8.c.o.d"
+  "/root/package/TargetLibraries/Generic/src/RQGELU_s8.c" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/RQGELU_s8.c.o" "gcc" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/RQGELU_s8.c.o.d"
+  "/root/package/TargetLibraries/Generic/src/RQHardswish.c" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/RQHardswish.c.o" "gcc" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/RQHardswish.c.o.d"
+  "/root/package/TargetLibraries/Generic/src/Relu_fp32.c" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/Relu_fp32.c.o" "gcc" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/Relu_fp32.c.o.d"
+  "/root/package/TargetLibraries/Generic/src/RequantShift_s8.c" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/RequantShift_s8.c.o" "gcc" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/RequantShift_s8.c.o.d"
+  "/root/package/TargetLibraries/Generic/src/Sigmoid_fp32.c" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/Sigmoid_fp32.c.o" "gcc" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/Sigmoid_fp32.c.o.d"
+  "/root/package/TargetLibraries/Generic/src/Softmax_fp32.c" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/Softmax_fp32.c.o" "gcc" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/Softmax_fp32.c.o.d"
+  "/root/package/TargetLibraries/Generic/src/Softmax_s8.c" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/Softmax_s8.c.o" "gcc" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/Softmax_s8.c.o.d"
+  "/root/package/TargetLibraries/Generic/src/Sqrt_fp32.c" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/Sqrt_fp32.c.o" "gcc" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/Sqrt_fp32.c.o.d"
+  "/root/package/TargetLibraries/Generic/src/Swish_fp32.c" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/Swish_fp32.c.o" "gcc" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/Swish_fp32.c.o.d"
+  "/root/package/TargetLibraries/Generic/src/Util.c" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/Util.c.o" "gcc" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/Util.c.o.d"
+  "/root/package/TargetLibraries/Generic/src/iRMSNorm_s8.c" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/iRMSNorm_s8.c.o" "gcc" "TargetLibraries/Generic/CMakeFiles/deeploybasic.dir/src/iRMSNorm_s8.c.o.d"
+  )
+
+# Targets to which this target links.
+set(CMAKE_TARGET_LINKED_INFO_FILES
+  )
+
+# Fortran module output directory.
+set(CMAKE_Fortran_TARGET_MODULE_DIR "")
@@ -0,0 +1,95 @@
+file(REMOVE_RECURSE
+  "../../lib/libdeeploybasic.a"
+  "../../lib/libdeeploybasic.pdb"
+  "CMakeFiles/deeploybasic.dir/src/AveragePool_fp32.c.o"
+  "CMakeFiles/deeploybasic.dir/src/AveragePool_fp32.c.o.d"
+  "CMakeFiles/deeploybasic.dir/src/BatchNorm_fp32.c.o"
+  "CMakeFiles/deeploybasic.dir/src/BatchNorm_fp32.c.o.d"
+  "CMakeFiles/deeploybasic.dir/src/Ceil_fp32.c.o"
+  "CMakeFiles/deeploybasic.dir/src/Ceil_fp32.c.o.d"
+  "CMakeFiles/deeploybasic.dir/src/Clip_fp32.c.o"
+  "CMakeFiles/deeploybasic.dir/src/Clip_fp32.c.o.d"
+  "CMakeFiles/deeploybasic.dir/src/ConvTranspose1d_fp32.c.o"
+  "CMakeFiles/deeploybasic.dir/src/ConvTranspose1d_fp32.c.o.d"
+  "CMakeFiles/deeploybasic.dir/src/Convolution_fp32.c.o"
+  "CMakeFiles/deeploybasic.dir/src/Convolution_fp32.c.o.d"
+  "CMakeFiles/deeploybasic.dir/src/Convolution_s8.c.o"
+  "CMakeFiles/deeploybasic.dir/src/Convolution_s8.c.o.d"
+  "CMakeFiles/deeploybasic.dir/src/DWConvolution_fp32.c.o"
+  "CMakeFiles/deeploybasic.dir/src/DWConvolution_fp32.c.o.d"
+  "CMakeFiles/deeploybasic.dir/src/DWConvolution_s8.c.o"
+  "CMakeFiles/deeploybasic.dir/src/DWConvolution_s8.c.o.d"
+  "CMakeFiles/deeploybasic.dir/src/Div_fp32.c.o"
+  "CMakeFiles/deeploybasic.dir/src/Div_fp32.c.o.d"
+  "CMakeFiles/deeploybasic.dir/src/Div_s32.c.o"
+  "CMakeFiles/deeploybasic.dir/src/Div_s32.c.o.d"
+  "CMakeFiles/deeploybasic.dir/src/Exp_fp32.c.o"
+  "CMakeFiles/deeploybasic.dir/src/Exp_fp32.c.o.d"
+  "CMakeFiles/deeploybasic.dir/src/Floor_fp32.c.o"
+  "CMakeFiles/deeploybasic.dir/src/Floor_fp32.c.o.d"
+  "CMakeFiles/deeploybasic.dir/src/GELU_fp32.c.o"
+  "CMakeFiles/deeploybasic.dir/src/GELU_fp32.c.o.d"
+  "CMakeFiles/deeploybasic.dir/src/GELU_s8.c.o"
+  "CMakeFiles/deeploybasic.dir/src/GELU_s8.c.o.d"
+  "CMakeFiles/deeploybasic.dir/src/Gemm_fp32.c.o"
+  "CMakeFiles/deeploybasic.dir/src/Gemm_fp32.c.o.d"
+  "CMakeFiles/deeploybasic.dir/src/Gemm_s8.c.o"
+  "CMakeFiles/deeploybasic.dir/src/Gemm_s8.c.o.d"
+  "CMakeFiles/deeploybasic.dir/src/GlobalAveragePool_fp32.c.o"
+  "CMakeFiles/deeploybasic.dir/src/GlobalAveragePool_fp32.c.o.d"
+  "CMakeFiles/deeploybasic.dir/src/GlobalMaxPool_fp32.c.o"
+  "CMakeFiles/deeploybasic.dir/src/GlobalMaxPool_fp32.c.o.d"
+  "CMakeFiles/deeploybasic.dir/src/GroupNormalization_fp32.c.o"
+  "CMakeFiles/deeploybasic.dir/src/GroupNormalization_fp32.c.o.d"
+  "CMakeFiles/deeploybasic.dir/src/HardSigmoid_fp32.c.o"
+  "CMakeFiles/deeploybasic.dir/src/HardSigmoid_fp32.c.o.d"
+  "CMakeFiles/deeploybasic.dir/src/HardSwish_fp32.c.o"
+  "CMakeFiles/deeploybasic.dir/src/HardSwish_fp32.c.o.d"
+  "CMakeFiles/deeploybasic.dir/src/Hardswish_s8.c.o"
+  "CMakeFiles/deeploybasic.dir/src/Hardswish_s8.c.o.d"
+  "CMakeFiles/deeploybasic.dir/src/InstanceNormalization_fp32.c.o"
+  "CMakeFiles/deeploybasic.dir/src/InstanceNormalization_fp32.c.o.d"
+  "CMakeFiles/deeploybasic.dir/src/Layernorm_fp32.c.o"
+  "CMakeFiles/deeploybasic.dir/src/Layernorm_fp32.c.o.d"
+  "CMakeFiles/deeploybasic.dir/src/Layernorm_s8.c.o"
+  "CMakeFiles/deeploybasic.dir/src/Layernorm_s8.c.o.d"
+  "CMakeFiles/deeploybasic.dir/src/MatMul_fp32.c.o"
+  "CMakeFiles/deeploybasic.dir/src/MatMul_fp32.c.o.d"
+  "CMakeFiles/deeploybasic.dir/src/MatMul_s8.c.o"
+  "CMakeFiles/deeploybasic.dir/src/MatMul_s8.c.o.d"
+  "CMakeFiles/deeploybasic.dir/src/MaxPool_fp32.c.o"
+  "CMakeFiles/deeploybasic.dir/src/MaxPool_fp32.c.o.d"
+  "CMakeFiles/deeploybasic.dir/src/MaxPool_s8.c.o"
+  "CMakeFiles/deeploybasic.dir/src/MaxPool_s8.c.o.d"
+  "CMakeFiles/deeploybasic.dir/src/Pow_fp32.c.o"
+  "CMakeFiles/deeploybasic.dir/src/Pow_fp32.c.o.d"
+  "CMakeFiles/deeploybasic.dir/src/RQDiv_s8.c.o"
+  "CMakeFiles/deeploybasic.dir/src/RQDiv_s8.c.o.d"
+  "CMakeFiles/deeploybasic.dir/src/RQGELU_s8.c.o"
+  "CMakeFiles/deeploybasic.dir/src/RQGELU_s8.c.o.d"
+  "CMakeFiles/deeploybasic.dir/src/RQHardswish.c.o"
+  "CMakeFiles/deeploybasic.dir/src/RQHardswish.c.o.d"
+  "CMakeFiles/deeploybasic.dir/src/Relu_fp32.c.o"
+  "CMakeFiles/deeploybasic.dir/src/Relu_fp32.c.o.d"
+  "CMakeFiles/deeploybasic.dir/src/RequantShift_s8.c.o"
+  "CMakeFiles/deeploybasic.dir/src/RequantShift_s8.c.o.d"
+  "CMakeFiles/deeploybasic.dir/src/Sigmoid_fp32.c.o"
+  "CMakeFiles/deeploybasic.dir/src/Sigmoid_fp32.c.o.d"
+  "CMakeFiles/deeploybasic.dir/src/Softmax_fp32.c.o"
+  "CMakeFiles/deeploybasic.dir/src/Softmax_fp32.c.o.d"
+  "CMakeFiles/deeploybasic.dir/src/Softmax_s8.c.o"
+  "CMakeFiles/deeploybasic.dir/src/Softmax_s8.c.o.d"
+  "CMakeFiles/deeploybasic.dir/src/Sqrt_fp32.c.o"
+  "CMakeFiles/deeploybasic.dir/src/Sqrt_fp32.c.o.d"
+  "CMakeFiles/deeploybasic.dir/src/Swish_fp32.c.o"
+  "CMakeFiles/deeploybasic.dir/src/Swish_fp32.c.o.d"
+  "CMakeFiles/deeploybasic.dir/src/Util.c.o"
+  "CMakeFiles/deeploybasic.dir/src/Util.c.o.d"
+  "CMakeFiles/deeploybasic.dir/src/iRMSNorm_s8.c.o"
+  "CMakeFiles/deeploybasic.dir/src/iRMSNorm_s8.c.o.d"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang C)
+  include(CMakeFiles/deeploybasic.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,1205 @@
+
+/root/package/DeeployTest/TEST_GENERIC/build_master/bin/CNN_Linear2:     file format elf64-x86-64
+
+Sections:
+Idx Name          Size      VMA               LMA               File off  Algn
+  0 .interp       0000001c  0000000000000318  0000000000000318  00000318  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+  1 .note.gnu.property 00000020  0000000000000338  0000000000000338  00000338  2**3
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+  2 .note.gnu.build-id 00000024  0000000000000358  0000000000000358  00000358  2**2
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+  3 .note.ABI-tag 00000020  000000000000037c  000000000000037c  0000037c  2**2
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+  4 .gnu.hash     00000024  00000000000003a0  00000000000003a0  000003a0  2**3
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+  5 .dynsym       00000108  00000000000003c8  00000000000003c8  000003c8  2**3
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+  6 .dynstr       00000124  00000000000004d0  00000000000004d0  000004d0  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+  7 .gnu.version  00000016  00000000000005f4  00000000000005f4  000005f4  2**1
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+  8 .gnu.version_r 00000030  0000000000000610  0000000000000610  00000610  2**3
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+  9 .rela.dyn     000000c0  0000000000000640  0000000000000640  00000640  2**3
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+ 10 .rela.plt     00000078  0000000000000700  0000000000000700  00000700  2**3
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+ 11 .init         00000017  0000000000001000  0000000000001000  00001000  2**2
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+ 12 .plt          00000060  0000000000001020  0000000000001020  00001020  2**4
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+ 13 .plt.got      00000008  0000000000001080  0000000000001080  00001080  2**3
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+ 14 .text         00000bfb  0000000000001090  0000000000001090  00001090  2**4
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+ 15 .fini         00000009  0000000000001c8c  0000000000001c8c  00001c8c  2**2
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+ 16 .rodata       0000008f  0000000000002000  0000000000002000  00002000  2**3
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+ 17 .eh_frame_hdr 0000003c  0000000000002090  0000000000002090  00002090  2**2
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+ 18 .eh_frame     000001cc  00000000000020d0  00000000000020d0  000020d0  2**3
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+ 19 .init_array   00000008  0000000000003dc0  0000000000003dc0  00002dc0  2**3
+                  CONTENTS, ALLOC, LOAD, DATA
+ 20 .fini_array   00000008  0000000000003dc8  0000000000003dc8  00002dc8  2**3
+                  CONTENTS, ALLOC, LOAD, DATA
+ 21 .dynamic      000001f0  0000000000003dd0  0000000000003dd0  00002dd0  2**3
+                  CONTENTS, ALLOC, LOAD, DATA
+ 22 .got          00000028  0000000000003fc0  0000000000003fc0  00002fc0  2**3
+                  CONTENTS, ALLOC, LOAD, DATA
+ 23 .got.plt      00000040  0000000000003fe8  0000000000003fe8  00002fe8  2**3
+                  CONTENTS, ALLOC, LOAD, DATA
+ 24 .data         0001a3f0  0000000000004040  0000000000004040  00003040  2**5
+                  CONTENTS, ALLOC, LOAD, DATA
+ 25 .bss          00000068  000000000001e440  000000000001e440  0001d430  2**5
+                  ALLOC
+ 26 .comment      00000027  0000000000000000  0000000000000000  0001d430  2**0
+                  CONTENTS, READONLY
+ 27 .debug_aranges 00000040  0000000000000000  0000000000000000  0001d457  2**0
+                  CONTENTS, READONLY, DEBUGGING, OCTETS
+ 28 .debug_info   00003e37  0000000000000000  0000000000000000  0001d497  2**0
+                  CONTENTS, READONLY, DEBUGGING, OCTETS
+ 29 .debug_abbrev 0000094b  0000000000000000  0000000000000000  000212ce  2**0
+                  CONTENTS, READONLY, DEBUGGING, OCTETS
+ 30 .debug_line   00000a26  0000000000000000  0000000000000000  00021c19  2**0
+                  CONTENTS, READONLY, DEBUGGING, OCTETS
+ 31 .debug_str    000014f7  0000000000000000  0000000000000000  0002263f  2**0
+                  CONTENTS, READONLY, DEBUGGING, OCTETS
+ 32 .debug_line_str 000004b3  0000000000000000  0000000000000000  00023b36  2**0
+                  CONTENTS, READONLY, DEBUGGING, OCTETS
+ 33 .debug_loclists 00001572  0000000000000000  0000000000000000  00023fe9  2**0
+                  CONTENTS, READONLY, DEBUGGING, OCTETS
+ 34 .debug_rnglists 0000034b  0000000000000000  0000000000000000  0002555b  2**0
+                  CONTENTS, READONLY, DEBUGGING, OCTETS
+
+Disassembly of section .init:
+
+0000000000001000 <_init>:
+    1000:	48 83 ec 08          	sub    $0x8,%rsp
+    1004:	48 8b 05 c5 2f 00 00 	mov    0x2fc5(%rip),%rax        # 3fd0 <__gmon_start__@Base>
+    100b:	48 85 c0             	test   %rax,%rax
+    100e:	74 02                	je     1012 <_init+0x12>
+    1010:	ff d0                	call   *%rax
+    1012:	48 83 c4 08          	add    $0x8,%rsp
+    1016:	c3                   	ret
+
+Disassembly of section .plt:
+
+0000000000001020 <free@plt-0x10>:
+    1020:	ff 35 ca 2f 00 00    	push   0x2fca(%rip)        # 3ff0 <_GLOBAL_OFFSET_TABLE_+0x8>
+    1026:	ff 25 cc 2f 00 00    	jmp    *0x2fcc(%rip)        # 3ff8 <_GLOBAL_OFFSET_TABLE_+0x10>
+    102c:	0f 1f 40 00          	nopl   0x0(%rax)
+
+0000000000001030 <free@plt>:
+    1030:	ff 25 ca 2f 00 00    	jmp    *0x2fca(%rip)        # 4000 <free@GLIBC_2.2.5>
+    1036:	68 00 00 00 00       	push   $0x0
+    103b:	e9 e0 ff ff ff       	jmp    1020 <_init+0x20>
+
+0000000000001040 <puts@plt>:
+    1040:	ff 25 c2 2f 00 00    	jmp    *0x2fc2(%rip)        # 4008 <puts@GLIBC_2.2.5>
+    1046:	68 01 00 00 00       	push   $0x1
+    104b:	e9 d0 ff ff ff       	jmp    1020 <_init+0x20>
+
+0000000000001050 <printf@plt>:
+    1050:	ff 25 ba 2f 00 00    	jmp    *0x2fba(%rip)        # 4010 <printf@GLIBC_2.2.5>
+    1056:	68 02 00 00 00       	push   $0x2
+    105b:	e9 c0 ff ff ff       	jmp    1020 <_init+0x20>
+
+0000000000001060 <calloc@plt>:
+    1060:	ff 25 b2 2f 00 00    	jmp    *0x2fb2(%rip)        # 4018 <calloc@GLIBC_2.2.5>
+    1066:	68 03 00 00 00       	push   $0x3
+    106b:	e9 b0 ff ff ff       	jmp    1020 <_init+0x20>
+
+0000000000001070 <malloc@plt>:
+    1070:	ff 25 aa 2f 00 00    	jmp    *0x2faa(%rip)        # 4020 <malloc@GLIBC_2.2.5>
+    1076:	68 04 00 00 00       	push   $0x4
+    107b:	e9 a0 ff ff ff       	jmp    1020 <_init+0x20>
+
+Disassembly of section .plt.got:
+
+0000000000001080 <__cxa_finalize@plt>:
+    1080:	ff 25 5a 2f 00 00    	jmp    *0x2f5a(%rip)        # 3fe0 <__cxa_finalize@GLIBC_2.2.5>
+    1086:	66 90                	xchg   %ax,%ax
+
+Disassembly of section .text:
+
+0000000000001090 <main>:
+
+#include "Network.h"
+#include "testinputs.h"
+#include "testoutputs.h"
+
+int main() {
+    1090:	41 57                	push   %r15
+
+  printf("Initializing network...\r\n");
+    1092:	48 8d 3d 67 0f 00 00 	lea    0xf67(%rip),%rdi        # 2000 <Network.c.62ac2c80+0xa5>
+int main() {
+    1099:	41 56                	push   %r14
+    109b:	41 55                	push   %r13
+    109d:	41 54                	push   %r12
+    109f:	55                   	push   %rbp
+    10a0:	53                   	push   %rbx
+    10a1:	48 83 ec 28          	sub    $0x28,%rsp
+  printf("Initializing network...\r\n");
+    10a5:	e8 96 ff ff ff       	call   1040 <puts@plt>
+  va_start(args, fmt);
+  int ret = vprintf(fmt, args);
+  va_end(args);
+  return ret;
+}
+void *deeploy_malloc(const size_t size) { return malloc(size); }
+    10aa:	bf 00 0c 00 00       	mov    $0xc00,%edi
+    10af:	e8 bc ff ff ff       	call   1070 <malloc@plt>
+    10b4:	bf 0a 00 00 00       	mov    $0xa,%edi
+    10b9:	48 89 c3             	mov    %rax,%rbx
+}
+
+        }
+        
+        void InitNetwork(__attribute__((unused)) uint32_t core_id, __attribute__((unused)) uint32_t numThreads){
+        DeeployNetwork_input_0 = (int8_t*) deeploy_malloc(1 * 3072);
+    10bc:	48 89 05 cd d3 01 00 	mov    %rax,0x1d3cd(%rip)        # 1e490 <DeeployNetwork_input_0>
+    10c3:	e8 a8 ff ff ff       	call   1070 <malloc@plt>
+
+  InitNetwork(0, 1);
+
+  for (uint32_t buf = 0; buf < DeeployNetwork_num_inputs; buf++) {
+    memcpy(DeeployNetwork_inputs[buf], testInputVector[buf],
+    10c8:	48 89 df             	mov    %rbx,%rdi
+    10cb:	48 8d 35 ae 2f 00 00 	lea    0x2fae(%rip),%rsi        # 4080 <testInputVector0>
+    10d2:	b9 80 01 00 00       	mov    $0x180,%ecx
+    10d7:	f3 48 a5             	rep movsq %ds:(%rsi),%es:(%rdi)
+           DeeployNetwork_inputs_bytes[buf]);
+  }
+
+  printf("Running network...\r\n");
+    10da:	48 8d 3d 38 0f 00 00 	lea    0xf38(%rip),%rdi        # 2019 <Network.c.62ac2c80+0xbe>
+DeeployNetwork_output_0 = (int8_t*) deeploy_malloc(1 * 10);
+DeeployNetwork_inputs[0] = (void*) DeeployNetwork_input_0;DeeployNetwork_outputs[0] = (void*) DeeployNetwork_output_0;
+    10e1:	48 89 1d b8 d3 01 00 	mov    %rbx,0x1d3b8(%rip)        # 1e4a0 <DeeployNetwork_inputs>
+DeeployNetwork_output_0 = (int8_t*) deeploy_malloc(1 * 10);
+    10e8:	48 89 05 99 d3 01 00 	mov    %rax,0x1d399(%rip)        # 1e488 <DeeployNetwork_output_0>
+DeeployNetwork_inputs[0] = (void*) DeeployNetwork_input_0;DeeployNetwork_outputs[0] = (void*) DeeployNetwork_output_0;
+    10ef:	48 89 05 a2 d3 01 00 	mov    %rax,0x1d3a2(%rip)        # 1e498 <DeeployNetwork_outputs>
+    10f6:	e8 45 ff ff ff       	call   1040 <puts@plt>
+    10fb:	bf 8c 0d 00 00       	mov    $0xd8c,%edi
+    1100:	e8 6b ff ff ff       	call   1070 <malloc@plt>
+    memset(DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input, -128, 3468*sizeof(int8_t));
+    1105:	b9 b1 01 00 00       	mov    $0x1b1,%ecx
+                memcpy(DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input + xoffset_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0, DeeployNetwork_input_0+offset_in_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0, 32*sizeof(int8_t));
+    110a:	4c 8b 05 7f d3 01 00 	mov    0x1d37f(%rip),%r8        # 1e490 <DeeployNetwork_input_0>
+    1111:	45 31 c9             	xor    %r9d,%r9d
+    1114:	48 89 c3             	mov    %rax,%rbx
+    memset(DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input, -128, 3468*sizeof(int8_t));
+    1117:	48 b8 80 80 80 80 80 	movabs $0x8080808080808080,%rax
+    111e:	80 80 80 
+    1121:	48 89 df             	mov    %rbx,%rdi
+    1124:	f3 48 ab             	rep stos %rax,%es:(%rdi)
+    1127:	c7 07 80 80 80 80    	movl   $0x80808080,(%rdi)
+                memcpy(DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input + xoffset_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0, DeeployNetwork_input_0+offset_in_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0, 32*sizeof(int8_t));
+    112d:	bf 63 04 00 00       	mov    $0x463,%edi
+    1132:	8d 8f c0 fb ff ff    	lea    -0x440(%rdi),%ecx
+int main() {
+    1138:	44 89 ce             	mov    %r9d,%esi
+    113b:	89 f2                	mov    %esi,%edx
+    113d:	89 c8                	mov    %ecx,%eax
+                xoffset_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0 += 34;
+    113f:	83 c1 22             	add    $0x22,%ecx
+                offset_in_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0 += 32;
+    1142:	83 c6 20             	add    $0x20,%esi
+                memcpy(DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input + xoffset_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0, DeeployNetwork_input_0+offset_in_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0, 32*sizeof(int8_t));
+    1145:	4c 01 c2             	add    %r8,%rdx
+    1148:	48 01 d8             	add    %rbx,%rax
+    114b:	f3 0f 6f 22          	movdqu (%rdx),%xmm4
+    114f:	0f 11 20             	movups %xmm4,(%rax)
+    1152:	f3 0f 6f 6a 10       	movdqu 0x10(%rdx),%xmm5
+    1157:	0f 11 68 10          	movups %xmm5,0x10(%rax)
+            for(uint32_t h=0; h<32; h++){
+    115b:	39 f9                	cmp    %edi,%ecx
+    115d:	75 dc                	jne    113b <main+0xab>
+                offset_in_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0 += 32;
+    115f:	41 81 c1 00 04 00 00 	add    $0x400,%r9d
+        for (uint32_t c=0; c<3; ++c) {
+    1166:	8d b9 84 04 00 00    	lea    0x484(%rcx),%edi
+    116c:	41 81 f9 00 0c 00 00 	cmp    $0xc00,%r9d
+    1173:	75 bd                	jne    1132 <main+0xa2>
+    1175:	bf 00 00 01 00       	mov    $0x10000,%edi
+    117a:	e8 f1 fe ff ff       	call   1070 <malloc@plt>
+        Conv2d_s8_s8_s32_NCHW(
+    117f:	48 83 ec 08          	sub    $0x8,%rsp
+    1183:	41 b9 10 00 00 00    	mov    $0x10,%r9d
+    1189:	4c 8d 05 f0 d0 01 00 	lea    0x1d0f0(%rip),%r8        # 1e280 <DeeployNetwork_net_QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_0weight_tensor>
+    1190:	68 80 6a fd ff       	push   $0xfffffffffffd6a80
+    1195:	b9 22 00 00 00       	mov    $0x22,%ecx
+    119a:	48 89 df             	mov    %rbx,%rdi
+    119d:	48 89 c5             	mov    %rax,%rbp
+    11a0:	68 80 00 00 00       	push   $0x80
+    11a5:	ba 22 00 00 00       	mov    $0x22,%edx
+    11aa:	be 03 00 00 00       	mov    $0x3,%esi
+    11af:	50                   	push   %rax
+    11b0:	e8 bb 08 00 00       	call   1a70 <Conv2d_s8_s8_s32_NCHW.constprop.0>
+void deeploy_free(void *const ptr) { free(ptr); }
+    11b5:	48 83 c4 20          	add    $0x20,%rsp
+    11b9:	48 89 df             	mov    %rbx,%rdi
+    11bc:	e8 6f fe ff ff       	call   1030 <free@plt>
+void *deeploy_malloc(const size_t size) { return malloc(size); }
+    11c1:	bf 00 40 00 00       	mov    $0x4000,%edi
+    11c6:	e8 a5 fe ff ff       	call   1070 <malloc@plt>
+    RequantShift_s32_s8_NCHW(DeeployNetwork_x_tensor, 16384, DeeployNetwork_net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_0mul_tensor, DeeployNetwork_net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_0add_tensor, DeeployNetwork_onnxMaxPool_18_tensor, 16, 1024, 169344, 0, -128, 127, 1);
+    11cb:	48 83 ec 08          	sub    $0x8,%rsp
+    11cf:	48 89 ef             	mov    %rbp,%rdi
+    11d2:	41 b9 00 04 00 00    	mov    $0x400,%r9d
+    11d8:	68 80 95 02 00       	push   $0x29580
+    11dd:	49 89 c0             	mov    %rax,%r8
+    11e0:	be 00 40 00 00       	mov    $0x4000,%esi
+    11e5:	48 89 c3             	mov    %rax,%rbx
+    11e8:	48 8d 0d 11 d0 01 00 	lea    0x1d011(%rip),%rcx        # 1e200 <DeeployNetwork_net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_0add_tensor>
+    11ef:	48 8d 15 4a d0 01 00 	lea    0x1d04a(%rip),%rdx        # 1e240 <DeeployNetwork_net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_0mul_tensor>
+    11f6:	e8 25 0a 00 00       	call   1c20 <RequantShift_s32_s8_NCHW.constprop.0>
+void deeploy_free(void *const ptr) { free(ptr); }
+    11fb:	e8 30 fe ff ff       	call   1030 <free@plt>
+void *deeploy_malloc(const size_t size) { return malloc(size); }
+    1200:	bf 00 10 00 00       	mov    $0x1000,%edi
+    1205:	e8 66 fe ff ff       	call   1070 <malloc@plt>
+    120a:	5d                   	pop    %rbp
+    120b:	45 31 d2             	xor    %r10d,%r10d
+    120e:	41 5d                	pop    %r13
+    1210:	49 89 c4             	mov    %rax,%r12
+    1213:	49 89 c3             	mov    %rax,%r11
+    1216:	41 b9 20 04 00 00    	mov    $0x420,%r9d
+    121c:	45 8d 81 00 fc ff ff 	lea    -0x400(%r9),%r8d
+  for (c = 0; c < C; ++c) {
+    for (h = 0; h < H_out; ++h) {
+      for (w = 0; w < W_out; ++w) {
+        max = -128;
+        // printf("(%2d,%2d,%2d) ", c, h, w);
+        for (p = 0; p < P; ++p) {
+    1223:	4d 89 dd             	mov    %r11,%r13
+    1226:	41 8d 70 e0          	lea    -0x20(%r8),%esi
+    122a:	4c 89 ef             	mov    %r13,%rdi
+    122d:	0f 1f 00             	nopl   (%rax)
+    1230:	89 f0                	mov    %esi,%eax
+        max = -128;
+    1232:	ba 80 ff ff ff       	mov    $0xffffff80,%edx
+        for (p = 0; p < P; ++p) {
+    1237:	31 ed                	xor    %ebp,%ebp
+    1239:	48 01 d8             	add    %rbx,%rax
+    123c:	eb 07                	jmp    1245 <main+0x1b5>
+    123e:	66 90                	xchg   %ax,%ax
+    1240:	bd 01 00 00 00       	mov    $0x1,%ebp
+          for (q = 0; q < Q; ++q) {
+            tmp = (int32_t)(pSrcA[c * H * W + (h * SP + p) * W + (w * SQ + q)] +
+    1245:	0f be 08             	movsbl (%rax),%ecx
+    1248:	89 4c 24 10          	mov    %ecx,0x10(%rsp)
+                            input_offset);
+            if (tmp > max) {
+    124c:	8b 4c 24 10          	mov    0x10(%rsp),%ecx
+    1250:	39 ca                	cmp    %ecx,%edx
+    1252:	7d 0c                	jge    1260 <main+0x1d0>
+              // printf("%4d >  %4d, ", tmp, max);
+              max = tmp;
+    1254:	8b 54 24 10          	mov    0x10(%rsp),%edx
+    1258:	0f 1f 84 00 00 00 00 	nopl   0x0(%rax,%rax,1)
+    125f:	00 
+            tmp = (int32_t)(pSrcA[c * H * W + (h * SP + p) * W + (w * SQ + q)] +
+    1260:	0f be 48 01          	movsbl 0x1(%rax),%ecx
+    1264:	89 4c 24 10          	mov    %ecx,0x10(%rsp)
+            if (tmp > max) {
+    1268:	8b 4c 24 10          	mov    0x10(%rsp),%ecx
+    126c:	39 d1                	cmp    %edx,%ecx
+    126e:	7e 04                	jle    1274 <main+0x1e4>
+              max = tmp;
+    1270:	8b 54 24 10          	mov    0x10(%rsp),%edx
+        for (p = 0; p < P; ++p) {
+    1274:	48 83 c0 20          	add    $0x20,%rax
+    1278:	85 ed                	test   %ebp,%ebp
+    127a:	74 c4                	je     1240 <main+0x1b0>
+      for (w = 0; w < W_out; ++w) {
+    127c:	83 c6 02             	add    $0x2,%esi
+            // }
+          }
+        }
+        // printf(" -> %d\r\n", max);
+        pDstC[c * H_out * W_out + h * W_out + w] =
+            (int8_t)(max + output_offset);
+    127f:	88 17                	mov    %dl,(%rdi)
+      for (w = 0; w < W_out; ++w) {
+    1281:	48 83 c7 01          	add    $0x1,%rdi
+    1285:	41 39 f0             	cmp    %esi,%r8d
+    1288:	75 a6                	jne    1230 <main+0x1a0>
+    for (h = 0; h < H_out; ++h) {
+    128a:	41 83 c0 40          	add    $0x40,%r8d
+    128e:	49 83 c5 10          	add    $0x10,%r13
+    1292:	45 39 c1             	cmp    %r8d,%r9d
+    1295:	75 8f                	jne    1226 <main+0x196>
+  for (c = 0; c < C; ++c) {
+    1297:	41 83 c2 10          	add    $0x10,%r10d
+    129b:	41 81 c1 00 04 00 00 	add    $0x400,%r9d
+    12a2:	49 81 c3 00 01 00 00 	add    $0x100,%r11
+    12a9:	41 81 fa 00 01 00 00 	cmp    $0x100,%r10d
+    12b0:	0f 85 66 ff ff ff    	jne    121c <main+0x18c>
+void deeploy_free(void *const ptr) { free(ptr); }
+    12b6:	48 89 df             	mov    %rbx,%rdi
+    12b9:	e8 72 fd ff ff       	call   1030 <free@plt>
+void *deeploy_malloc(const size_t size) { return malloc(size); }
+    12be:	be 01 00 00 00       	mov    $0x1,%esi
+    12c3:	bf 40 14 00 00       	mov    $0x1440,%edi
+    12c8:	e8 93 fd ff ff       	call   1060 <calloc@plt>
+    12cd:	be 33 01 00 00       	mov    $0x133,%esi
+    12d2:	31 ff                	xor    %edi,%edi
+    12d4:	48 89 c3             	mov    %rax,%rbx
+    12d7:	8d 86 e0 fe ff ff    	lea    -0x120(%rsi),%eax
+    12dd:	89 fa                	mov    %edi,%edx
+    12df:	90                   	nop
+                memcpy(DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input + xoffset_DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input_DeeployNetwork_input1_tensor, DeeployNetwork_input1_tensor+offset_in_DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input_DeeployNetwork_input1_tensor, 16*sizeof(int8_t));
+    12e0:	89 d1                	mov    %edx,%ecx
+                offset_in_DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input_DeeployNetwork_input1_tensor += 16;
+    12e2:	83 c2 10             	add    $0x10,%edx
+                memcpy(DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input + xoffset_DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input_DeeployNetwork_input1_tensor, DeeployNetwork_input1_tensor+offset_in_DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input_DeeployNetwork_input1_tensor, 16*sizeof(int8_t));
+    12e5:	f3 41 0f 6f 04 0c    	movdqu (%r12,%rcx,1),%xmm0
+    12eb:	89 c1                	mov    %eax,%ecx
+                xoffset_DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input_DeeployNetwork_input1_tensor += 18;
+    12ed:	83 c0 12             	add    $0x12,%eax
+                memcpy(DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input + xoffset_DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input_DeeployNetwork_input1_tensor, DeeployNetwork_input1_tensor+offset_in_DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input_DeeployNetwork_input1_tensor, 16*sizeof(int8_t));
+    12f0:	0f 11 04 0b          	movups %xmm0,(%rbx,%rcx,1)
+            for(uint32_t h=0; h<16; h++){
+    12f4:	39 f0                	cmp    %esi,%eax
+    12f6:	75 e8                	jne    12e0 <main+0x250>
+                offset_in_DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input_DeeployNetwork_input1_tensor += 16;
+    12f8:	81 c7 00 01 00 00    	add    $0x100,%edi
+        for (uint32_t c=0; c<16; ++c) {
+    12fe:	8d b0 44 01 00 00    	lea    0x144(%rax),%esi
+    1304:	81 ff 00 10 00 00    	cmp    $0x1000,%edi
+    130a:	75 cb                	jne    12d7 <main+0x247>
+void deeploy_free(void *const ptr) { free(ptr); }
+    130c:	4c 89 e7             	mov    %r12,%rdi
+    130f:	e8 1c fd ff ff       	call   1030 <free@plt>
+void *deeploy_malloc(const size_t size) { return malloc(size); }
+    1314:	bf 00 80 00 00       	mov    $0x8000,%edi
+    1319:	e8 52 fd ff ff       	call   1070 <malloc@plt>
+        Conv2d_s8_s8_s32_NCHW(
+    131e:	48 83 ec 08          	sub    $0x8,%rsp
+    1322:	41 b9 20 00 00 00    	mov    $0x20,%r9d
+    1328:	4c 8d 05 d1 bc 01 00 	lea    0x1bcd1(%rip),%r8        # 1d000 <DeeployNetwork_net_QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_1weight_tensor>
+    132f:	6a 00                	push   $0x0
+    1331:	b9 12 00 00 00       	mov    $0x12,%ecx
+    1336:	ba 12 00 00 00       	mov    $0x12,%edx
+    133b:	48 89 df             	mov    %rbx,%rdi
+    133e:	6a 00                	push   $0x0
+    1340:	be 10 00 00 00       	mov    $0x10,%esi
+    1345:	49 89 c4             	mov    %rax,%r12
+    1348:	50                   	push   %rax
+    1349:	e8 22 07 00 00       	call   1a70 <Conv2d_s8_s8_s32_NCHW.constprop.0>
+void deeploy_free(void *const ptr) { free(ptr); }
+    134e:	48 83 c4 20          	add    $0x20,%rsp
+    1352:	48 89 df             	mov    %rbx,%rdi
+    1355:	e8 d6 fc ff ff       	call   1030 <free@plt>
+void *deeploy_malloc(const size_t size) { return malloc(size); }
+    135a:	bf 00 20 00 00       	mov    $0x2000,%edi
+    135f:	e8 0c fd ff ff       	call   1070 <malloc@plt>
+    RequantShift_s32_s8_NCHW(DeeployNetwork_x3_tensor, 8192, DeeployNetwork_net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1mul_tensor, DeeployNetwork_net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1add_tensor, DeeployNetwork_onnxMaxPool_21_tensor, 16, 256, 0, 0, -128, 127, 1);
+    1364:	48 83 ec 08          	sub    $0x8,%rsp
+    1368:	4c 89 e7             	mov    %r12,%rdi
+    136b:	41 b9 00 01 00 00    	mov    $0x100,%r9d
+    1371:	6a 00                	push   $0x0
+    1373:	49 89 c0             	mov    %rax,%r8
+    1376:	48 8d 0d 83 bb 01 00 	lea    0x1bb83(%rip),%rcx        # 1cf00 <DeeployNetwork_net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1add_tensor>
+    137d:	49 89 c5             	mov    %rax,%r13
+    1380:	48 8d 15 f9 bb 01 00 	lea    0x1bbf9(%rip),%rdx        # 1cf80 <DeeployNetwork_net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1mul_tensor>
+    1387:	be 00 20 00 00       	mov    $0x2000,%esi
+    138c:	e8 8f 08 00 00       	call   1c20 <RequantShift_s32_s8_NCHW.constprop.0>
+void deeploy_free(void *const ptr) { free(ptr); }
+    1391:	e8 9a fc ff ff       	call   1030 <free@plt>
+void *deeploy_malloc(const size_t size) { return malloc(size); }
+    1396:	bf 00 08 00 00       	mov    $0x800,%edi
+    139b:	e8 d0 fc ff ff       	call   1070 <malloc@plt>
+    13a0:	41 59                	pop    %r9
+    13a2:	45 31 c9             	xor    %r9d,%r9d
+    13a5:	41 5a                	pop    %r10
+    13a7:	49 89 c4             	mov    %rax,%r12
+    13aa:	49 89 c3             	mov    %rax,%r11
+    13ad:	41 ba 10 00 00 00    	mov    $0x10,%r10d
+    13b3:	45 89 c8             	mov    %r9d,%r8d
+    13b6:	47 8d 3c 09          	lea    (%r9,%r9,1),%r15d
+        for (p = 0; p < P; ++p) {
+    13ba:	4d 89 de             	mov    %r11,%r14
+    13bd:	41 c1 e0 05          	shl    $0x5,%r8d
+    13c1:	4c 89 f7             	mov    %r14,%rdi
+    13c4:	31 db                	xor    %ebx,%ebx
+    13c6:	66 2e 0f 1f 84 00 00 	cs nopw 0x0(%rax,%rax,1)
+    13cd:	00 00 00 
+    13d0:	41 8d 04 18          	lea    (%r8,%rbx,1),%eax
+        max = -128;
+    13d4:	ba 80 ff ff ff       	mov    $0xffffff80,%edx
+        for (p = 0; p < P; ++p) {
+    13d9:	31 c9                	xor    %ecx,%ecx
+    13db:	4c 01 e8             	add    %r13,%rax
+    13de:	eb 02                	jmp    13e2 <main+0x352>
+    13e0:	89 e9                	mov    %ebp,%ecx
+            tmp = (int32_t)(pSrcA[c * H * W + (h * SP + p) * W + (w * SQ + q)] +
+    13e2:	0f be 30             	movsbl (%rax),%esi
+    13e5:	89 74 24 14          	mov    %esi,0x14(%rsp)
+            if (tmp > max) {
+    13e9:	8b 74 24 14          	mov    0x14(%rsp),%esi
+    13ed:	39 d6                	cmp    %edx,%esi
+    13ef:	7e 07                	jle    13f8 <main+0x368>
+              max = tmp;
+    13f1:	8b 54 24 14          	mov    0x14(%rsp),%edx
+    13f5:	0f 1f 00             	nopl   (%rax)
+            tmp = (int32_t)(pSrcA[c * H * W + (h * SP + p) * W + (w * SQ + q)] +
+    13f8:	0f be 70 01          	movsbl 0x1(%rax),%esi
+    13fc:	89 74 24 14          	mov    %esi,0x14(%rsp)
+            if (tmp > max) {
+    1400:	8b 74 24 14          	mov    0x14(%rsp),%esi
+    1404:	39 d6                	cmp    %edx,%esi
+    1406:	7e 04                	jle    140c <main+0x37c>
+              max = tmp;
+    1408:	8b 54 24 14          	mov    0x14(%rsp),%edx
+        for (p = 0; p < P; ++p) {
+    140c:	48 83 c0 10          	add    $0x10,%rax
+    1410:	85 c9                	test   %ecx,%ecx
+    1412:	74 cc                	je     13e0 <main+0x350>
+      for (w = 0; w < W_out; ++w) {
+    1414:	83 c3 02             	add    $0x2,%ebx
+            (int8_t)(max + output_offset);
+    1417:	88 17                	mov    %dl,(%rdi)
+      for (w = 0; w < W_out; ++w) {
+    1419:	48 83 c7 01          	add    $0x1,%rdi
+    141d:	83 fb 10             	cmp    $0x10,%ebx
+    1420:	75 ae                	jne    13d0 <main+0x340>
+    for (h = 0; h < H_out; ++h) {
+    1422:	41 83 c7 02          	add    $0x2,%r15d
+    1426:	49 83 c6 08          	add    $0x8,%r14
+    142a:	41 83 c0 20          	add    $0x20,%r8d
+    142e:	45 39 fa             	cmp    %r15d,%r10d
+    1431:	75 8e                	jne    13c1 <main+0x331>
+  for (c = 0; c < C; ++c) {
+    1433:	41 83 c1 08          	add    $0x8,%r9d
+    1437:	41 83 c2 10          	add    $0x10,%r10d
+    143b:	49 83 c3 40          	add    $0x40,%r11
+    143f:	41 81 f9 00 01 00 00 	cmp    $0x100,%r9d
+    1446:	0f 85 67 ff ff ff    	jne    13b3 <main+0x323>
+void deeploy_free(void *const ptr) { free(ptr); }
+    144c:	4c 89 ef             	mov    %r13,%rdi
+    144f:	e8 dc fb ff ff       	call   1030 <free@plt>
+void *deeploy_malloc(const size_t size) { return malloc(size); }
+    1454:	bf 80 0c 00 00       	mov    $0xc80,%edi
+    1459:	be 01 00 00 00       	mov    $0x1,%esi
+    145e:	e8 fd fb ff ff       	call   1060 <calloc@plt>
+    1463:	bf 40 00 00 00       	mov    $0x40,%edi
+        xoffset_DeeployNetwork__EXTRACT_CONV_PASS_2_padded_input_DeeployNetwork_input4_tensor = n*3200 + 1*10+1;
+    1468:	41 b8 0b 00 00 00    	mov    $0xb,%r8d
+    146e:	48 89 c5             	mov    %rax,%rbp
+    1471:	8d 47 c0             	lea    -0x40(%rdi),%eax
+    1474:	44 89 c2             	mov    %r8d,%edx
+    1477:	66 0f 1f 84 00 00 00 	nopw   0x0(%rax,%rax,1)
+    147e:	00 00 
+                memcpy(DeeployNetwork__EXTRACT_CONV_PASS_2_padded_input + xoffset_DeeployNetwork__EXTRACT_CONV_PASS_2_padded_input_DeeployNetwork_input4_tensor, DeeployNetwork_input4_tensor+offset_in_DeeployNetwork__EXTRACT_CONV_PASS_2_padded_input_DeeployNetwork_input4_tensor, 8*sizeof(int8_t));
+    1480:	89 c1                	mov    %eax,%ecx
+                offset_in_DeeployNetwork__EXTRACT_CONV_PASS_2_padded_input_DeeployNetwork_input4_tensor += 8;
+    1482:	83 c0 08             	add    $0x8,%eax
+                memcpy(DeeployNetwork__EXTRACT_CONV_PASS_2_padded_input + xoffset_DeeployNetwork__EXTRACT_CONV_PASS_2_padded_input_DeeployNetwork_input4_tensor, DeeployNetwork_input4_tensor+offset_in_DeeployNetwork__EXTRACT_CONV_PASS_2_padded_input_DeeployNetwork_input4_tensor, 8*sizeof(int8_t));
+    1485:	49 8b 34 0c          	mov    (%r12,%rcx,1),%rsi
+    1489:	89 d1                	mov    %edx,%ecx
+                xoffset_DeeployNetwork__EXTRACT_CONV_PASS_2_padded_input_DeeployNetwork_input4_tensor += 10;
+    148b:	83 c2 0a             	add    $0xa,%edx
+                memcpy(DeeployNetwork__EXTRACT_CONV_PASS_2_padded_input + xoffset_DeeployNetwork__EXTRACT_CONV_PASS_2_padded_input_DeeployNetwork_input4_tensor, DeeployNetwork_input4_tensor+offset_in_DeeployNetwork__EXTRACT_CONV_PASS_2_padded_input_DeeployNetwork_input4_tensor, 8*sizeof(int8_t));
+    148e:	48 89 74 0d 00       	mov    %rsi,0x0(%rbp,%rcx,1)
+            for(uint32_t h=0; h<8; h++){
+    1493:	39 f8                	cmp    %edi,%eax
+    1495:	75 e9                	jne    1480 <main+0x3f0>
+            xoffset_DeeployNetwork__EXTRACT_CONV_PASS_2_padded_input_DeeployNetwork_input4_tensor += 2*1*10;
+    1497:	41 83 c0 64          	add    $0x64,%r8d
+        for (uint32_t c=0; c<32; ++c) {
+    149b:	8d 78 40             	lea    0x40(%rax),%edi
+    149e:	3d 00 08 00 00       	cmp    $0x800,%eax
+    14a3:	75 cc                	jne    1471 <main+0x3e1>
+void deeploy_free(void *const ptr) { free(ptr); }
+    14a5:	4c 89 e7             	mov    %r12,%rdi
+    14a8:	e8 83 fb ff ff       	call   1030 <free@plt>
+void *deeploy_malloc(const size_t size) { return malloc(size); }
+    14ad:	bf 00 40 00 00       	mov    $0x4000,%edi
+    14b2:	e8 b9 fb ff ff       	call   1070 <malloc@plt>
+        Conv2d_s8_s8_s32_NCHW(
+    14b7:	48 83 ec 08          	sub    $0x8,%rsp
+    14bb:	41 b9 40 00 00 00    	mov    $0x40,%r9d
+    14c1:	4c 8d 05 38 72 01 00 	lea    0x17238(%rip),%r8        # 18700 <DeeployNetwork_net_QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_2weight_tensor>
+    14c8:	6a 00                	push   $0x0
+    14ca:	b9 0a 00 00 00       	mov    $0xa,%ecx
+    14cf:	ba 0a 00 00 00       	mov    $0xa,%edx
+    14d4:	48 89 ef             	mov    %rbp,%rdi
+    14d7:	6a 00                	push   $0x0
+    14d9:	be 20 00 00 00       	mov    $0x20,%esi
+    14de:	49 89 c4             	mov    %rax,%r12
+    14e1:	50                   	push   %rax
+    14e2:	e8 89 05 00 00       	call   1a70 <Conv2d_s8_s8_s32_NCHW.constprop.0>
+void deeploy_free(void *const ptr) { free(ptr); }
+    14e7:	48 83 c4 20          	add    $0x20,%rsp
+    14eb:	48 89 ef             	mov    %rbp,%rdi
+    14ee:	e8 3d fb ff ff       	call   1030 <free@plt>
+void *deeploy_malloc(const size_t size) { return malloc(size); }
+    14f3:	bf 00 10 00 00       	mov    $0x1000,%edi
+    14f8:	e8 73 fb ff ff       	call   1070 <malloc@plt>
+    RequantShift_s32_s8_NCHW(DeeployNetwork_x7_tensor, 4096, DeeployNetwork_net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_2mul_tensor, DeeployNetwork_net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_2add_tensor, DeeployNetwork_onnxMaxPool_24_tensor, 16, 64, 0, 0, -128, 127, 1);
+    14fd:	48 83 ec 08          	sub    $0x8,%rsp
+    1501:	4c 89 e7             	mov    %r12,%rdi
+    1504:	48 8d 15 f5 70 01 00 	lea    0x170f5(%rip),%rdx        # 18600 <DeeployNetwork_net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_2mul_tensor>
+    150b:	6a 00                	push   $0x0
+    150d:	49 89 c0             	mov    %rax,%r8
+    1510:	41 b9 40 00 00 00    	mov    $0x40,%r9d
+    1516:	be 00 10 00 00       	mov    $0x1000,%esi
+    151b:	48 8d 0d de 6f 01 00 	lea    0x16fde(%rip),%rcx        # 18500 <DeeployNetwork_net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_2add_tensor>
+    1522:	49 89 c6             	mov    %rax,%r14
+    1525:	41 bc 08 00 00 00    	mov    $0x8,%r12d
+    152b:	e8 f0 06 00 00       	call   1c20 <RequantShift_s32_s8_NCHW.constprop.0>
+void deeploy_free(void *const ptr) { free(ptr); }
+    1530:	e8 fb fa ff ff       	call   1030 <free@plt>
+void *deeploy_malloc(const size_t size) { return malloc(size); }
+    1535:	bf 00 04 00 00       	mov    $0x400,%edi
+    153a:	e8 31 fb ff ff       	call   1070 <malloc@plt>
+    153f:	5f                   	pop    %rdi
+    1540:	4d 8d 5e 10          	lea    0x10(%r14),%r11
+    1544:	41 58                	pop    %r8
+    1546:	48 89 c5             	mov    %rax,%rbp
+    1549:	48 89 c2             	mov    %rax,%rdx
+    154c:	31 c0                	xor    %eax,%eax
+    154e:	89 5c 24 0c          	mov    %ebx,0xc(%rsp)
+    1552:	8d 0c 00             	lea    (%rax,%rax,1),%ecx
+        max = -128;
+    1555:	49 89 d0             	mov    %rdx,%r8
+    1558:	44 8d 3c cd 00 00 00 	lea    0x0(,%rcx,8),%r15d
+    155f:	00 
+    1560:	4d 89 c5             	mov    %r8,%r13
+    1563:	31 db                	xor    %ebx,%ebx
+    1565:	0f 1f 00             	nopl   (%rax)
+    1568:	45 89 f9             	mov    %r15d,%r9d
+    156b:	bf 80 ff ff ff       	mov    $0xffffff80,%edi
+    1570:	4b 8d 34 0e          	lea    (%r14,%r9,1),%rsi
+    1574:	4d 01 d9             	add    %r11,%r9
+    1577:	66 0f 1f 84 00 00 00 	nopw   0x0(%rax,%rax,1)
+    157e:	00 00 
+            tmp = (int32_t)(pSrcA[c * H * W + (h * SP + p) * W + (w * SQ + q)] +
+    1580:	44 0f be 16          	movsbl (%rsi),%r10d
+    1584:	44 89 54 24 18       	mov    %r10d,0x18(%rsp)
+            if (tmp > max) {
+    1589:	44 8b 54 24 18       	mov    0x18(%rsp),%r10d
+    158e:	44 39 d7             	cmp    %r10d,%edi
+    1591:	7d 0d                	jge    15a0 <main+0x510>
+              max = tmp;
+    1593:	8b 7c 24 18          	mov    0x18(%rsp),%edi
+    1597:	66 0f 1f 84 00 00 00 	nopw   0x0(%rax,%rax,1)
+    159e:	00 00 
+            tmp = (int32_t)(pSrcA[c * H * W + (h * SP + p) * W + (w * SQ + q)] +
+    15a0:	44 0f be 56 01       	movsbl 0x1(%rsi),%r10d
+    15a5:	44 89 54 24 18       	mov    %r10d,0x18(%rsp)
+            if (tmp > max) {
+    15aa:	44 8b 54 24 18       	mov    0x18(%rsp),%r10d
+    15af:	41 39 fa             	cmp    %edi,%r10d
+    15b2:	7e 04                	jle    15b8 <main+0x528>
+              max = tmp;
+    15b4:	8b 7c 24 18          	mov    0x18(%rsp),%edi
+        for (p = 0; p < P; ++p) {
+    15b8:	48 83 c6 08          	add    $0x8,%rsi
+    15bc:	49 39 f1             	cmp    %rsi,%r9
+    15bf:	75 bf                	jne    1580 <main+0x4f0>
+      for (w = 0; w < W_out; ++w) {
+    15c1:	83 c3 02             	add    $0x2,%ebx
+            (int8_t)(max + output_offset);
+    15c4:	41 88 7d 00          	mov    %dil,0x0(%r13)
+      for (w = 0; w < W_out; ++w) {
+    15c8:	41 83 c7 02          	add    $0x2,%r15d
+    15cc:	49 83 c5 01          	add    $0x1,%r13
+    15d0:	83 fb 08             	cmp    $0x8,%ebx
+    15d3:	75 93                	jne    1568 <main+0x4d8>
+    for (h = 0; h < H_out; ++h) {
+    15d5:	83 c1 02             	add    $0x2,%ecx
+    15d8:	49 83 c0 04          	add    $0x4,%r8
+    15dc:	41 39 cc             	cmp    %ecx,%r12d
+    15df:	0f 85 73 ff ff ff    	jne    1558 <main+0x4c8>
+  for (c = 0; c < C; ++c) {
+    15e5:	83 c0 04             	add    $0x4,%eax
+    15e8:	8b 5c 24 0c          	mov    0xc(%rsp),%ebx
+    15ec:	41 83 c4 08          	add    $0x8,%r12d
+    15f0:	48 83 c2 10          	add    $0x10,%rdx
+    15f4:	3d 00 01 00 00       	cmp    $0x100,%eax
+    15f9:	0f 85 4f ff ff ff    	jne    154e <main+0x4be>
+void deeploy_free(void *const ptr) { free(ptr); }
+    15ff:	4c 89 f7             	mov    %r14,%rdi
+    1602:	e8 29 fa ff ff       	call   1030 <free@plt>
+void *deeploy_malloc(const size_t size) { return malloc(size); }
+    1607:	bf 00 09 00 00       	mov    $0x900,%edi
+    160c:	be 01 00 00 00       	mov    $0x1,%esi
+    1611:	e8 4a fa ff ff       	call   1060 <calloc@plt>
+        xoffset_DeeployNetwork__EXTRACT_CONV_PASS_3_padded_input_DeeployNetwork_input8_tensor = n*2304 + 1*6+1;
+    1616:	bf 07 00 00 00       	mov    $0x7,%edi
+    161b:	49 89 c4             	mov    %rax,%r12
+    161e:	8d 43 f0             	lea    -0x10(%rbx),%eax
+    1621:	89 fa                	mov    %edi,%edx
+                memcpy(DeeployNetwork__EXTRACT_CONV_PASS_3_padded_input + xoffset_DeeployNetwork__EXTRACT_CONV_PASS_3_padded_input_DeeployNetwork_input8_tensor, DeeployNetwork_input8_tensor+offset_in_DeeployNetwork__EXTRACT_CONV_PASS_3_padded_input_DeeployNetwork_input8_tensor, 4*sizeof(int8_t));
+    1623:	89 c1                	mov    %eax,%ecx
+                offset_in_DeeployNetwork__EXTRACT_CONV_PASS_3_padded_input_DeeployNetwork_input8_tensor += 4;
+    1625:	83 c0 04             	add    $0x4,%eax
+                memcpy(DeeployNetwork__EXTRACT_CONV_PASS_3_padded_input + xoffset_DeeployNetwork__EXTRACT_CONV_PASS_3_padded_input_DeeployNetwork_input8_tensor, DeeployNetwork_input8_tensor+offset_in_DeeployNetwork__EXTRACT_CONV_PASS_3_padded_input_DeeployNetwork_input8_tensor, 4*sizeof(int8_t));
+    1628:	8b 74 0d 00          	mov    0x0(%rbp,%rcx,1),%esi
+    162c:	89 d1                	mov    %edx,%ecx
+                xoffset_DeeployNetwork__EXTRACT_CONV_PASS_3_padded_input_DeeployNetwork_input8_tensor += 6;
+    162e:	83 c2 06             	add    $0x6,%edx
+                memcpy(DeeployNetwork__EXTRACT_CONV_PASS_3_padded_input + xoffset_DeeployNetwork__EXTRACT_CONV_PASS_3_padded_input_DeeployNetwork_input8_tensor, DeeployNetwork_input8_tensor+offset_in_DeeployNetwork__EXTRACT_CONV_PASS_3_padded_input_DeeployNetwork_input8_tensor, 4*sizeof(int8_t));
+    1631:	41 89 34 0c          	mov    %esi,(%r12,%rcx,1)
+            for(uint32_t h=0; h<4; h++){
+    1635:	39 d8                	cmp    %ebx,%eax
+    1637:	75 ea                	jne    1623 <main+0x593>
+            xoffset_DeeployNetwork__EXTRACT_CONV_PASS_3_padded_input_DeeployNetwork_input8_tensor += 2*1*6;
+    1639:	83 c7 24             	add    $0x24,%edi
+        for (uint32_t c=0; c<64; ++c) {
+    163c:	8d 58 10             	lea    0x10(%rax),%ebx
+    163f:	3d 00 04 00 00       	cmp    $0x400,%eax
+    1644:	75 d8                	jne    161e <main+0x58e>
+void deeploy_free(void *const ptr) { free(ptr); }
+    1646:	48 89 ef             	mov    %rbp,%rdi
+    1649:	e8 e2 f9 ff ff       	call   1030 <free@plt>
+void *deeploy_malloc(const size_t size) { return malloc(size); }
+    164e:	bf 00 20 00 00       	mov    $0x2000,%edi
+    1653:	e8 18 fa ff ff       	call   1070 <malloc@plt>
+        Conv2d_s8_s8_s32_NCHW(
+    1658:	48 83 ec 08          	sub    $0x8,%rsp
+    165c:	41 b9 80 00 00 00    	mov    $0x80,%r9d
+    1662:	4c 8d 05 97 4e 00 00 	lea    0x4e97(%rip),%r8        # 6500 <DeeployNetwork_net_QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_3weight_tensor>
+    1669:	6a 00                	push   $0x0
+    166b:	b9 06 00 00 00       	mov    $0x6,%ecx
+    1670:	ba 06 00 00 00       	mov    $0x6,%edx
+    1675:	4c 89 e7             	mov    %r12,%rdi
+    1678:	6a 00                	push   $0x0
+    167a:	be 40 00 00 00       	mov    $0x40,%esi
+    167f:	48 89 c5             	mov    %rax,%rbp
+    1682:	50                   	push   %rax
+    1683:	e8 e8 03 00 00       	call   1a70 <Conv2d_s8_s8_s32_NCHW.constprop.0>
+void deeploy_free(void *const ptr) { free(ptr); }
+    1688:	48 83 c4 20          	add    $0x20,%rsp
+    168c:	4c 89 e7             	mov    %r12,%rdi
+void *deeploy_malloc(const size_t size) { return malloc(size); }
+    168f:	45 31 e4             	xor    %r12d,%r12d
+void deeploy_free(void *const ptr) { free(ptr); }
+    1692:	e8 99 f9 ff ff       	call   1030 <free@plt>
+void *deeploy_malloc(const size_t size) { return malloc(size); }
+    1697:	bf 00 08 00 00       	mov    $0x800,%edi
+    169c:	e8 cf f9 ff ff       	call   1070 <malloc@plt>
+    RequantShift_s32_s8_NCHW(DeeployNetwork_x11_tensor, 2048, DeeployNetwork_net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_3mul_tensor, DeeployNetwork_net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_3add_tensor, DeeployNetwork_onnxMaxPool_27_tensor, 16, 16, 0, 0, -128, 127, 1);
+    16a1:	48 83 ec 08          	sub    $0x8,%rsp
+    16a5:	be 00 08 00 00       	mov    $0x800,%esi
+    16aa:	48 89 ef             	mov    %rbp,%rdi
+    16ad:	6a 00                	push   $0x0
+    16af:	49 89 c0             	mov    %rax,%r8
+    16b2:	48 8d 0d 47 4a 00 00 	lea    0x4a47(%rip),%rcx        # 6100 <DeeployNetwork_net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_3add_tensor>
+    16b9:	48 89 c3             	mov    %rax,%rbx
+    16bc:	41 b9 10 00 00 00    	mov    $0x10,%r9d
+    16c2:	48 8d 15 37 4c 00 00 	lea    0x4c37(%rip),%rdx        # 6300 <DeeployNetwork_net_QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_3mul_tensor>
+    16c9:	e8 52 05 00 00       	call   1c20 <RequantShift_s32_s8_NCHW.constprop.0>
+void deeploy_free(void *const ptr) { free(ptr); }
+    16ce:	e8 5d f9 ff ff       	call   1030 <free@plt>
+void *deeploy_malloc(const size_t size) { return malloc(size); }
+    16d3:	bf 00 02 00 00       	mov    $0x200,%edi
+    16d8:	e8 93 f9 ff ff       	call   1070 <malloc@plt>
+    16dd:	59                   	pop    %rcx
+    16de:	45 31 db             	xor    %r11d,%r11d
+    16e1:	5e                   	pop    %rsi
+    16e2:	48 89 c5             	mov    %rax,%rbp
+    16e5:	49 89 c5             	mov    %rax,%r13
+    16e8:	4c 8d 43 08          	lea    0x8(%rbx),%r8
+    16ec:	4d 89 ee             	mov    %r13,%r14
+    16ef:	45 8d 7b 04          	lea    0x4(%r11),%r15d
+    16f3:	46 8d 0c 9d 00 00 00 	lea    0x0(,%r11,4),%r9d
+    16fa:	00 
+    16fb:	4c 89 f7             	mov    %r14,%rdi
+    16fe:	45 31 d2             	xor    %r10d,%r10d
+    1701:	0f 1f 80 00 00 00 00 	nopl   0x0(%rax)
+    1708:	44 89 c9             	mov    %r9d,%ecx
+        max = -128;
+    170b:	ba 80 ff ff ff       	mov    $0xffffff80,%edx
+    1710:	48 8d 04 0b          	lea    (%rbx,%rcx,1),%rax
+    1714:	4c 01 c1             	add    %r8,%rcx
+    1717:	66 0f 1f 84 00 00 00 	nopw   0x0(%rax,%rax,1)
+    171e:	00 00 
+            tmp = (int32_t)(pSrcA[c * H * W + (h * SP + p) * W + (w * SQ + q)] +
+    1720:	0f be 30             	movsbl (%rax),%esi
+    1723:	89 74 24 1c          	mov    %esi,0x1c(%rsp)
+            if (tmp > max) {
+    1727:	8b 74 24 1c          	mov    0x1c(%rsp),%esi
+    172b:	39 d6                	cmp    %edx,%esi
+    172d:	7e 09                	jle    1738 <main+0x6a8>
+              max = tmp;
+    172f:	8b 54 24 1c          	mov    0x1c(%rsp),%edx
+    1733:	0f 1f 44 00 00       	nopl   0x0(%rax,%rax,1)
+            tmp = (int32_t)(pSrcA[c * H * W + (h * SP + p) * W + (w * SQ + q)] +
+    1738:	0f be 70 01          	movsbl 0x1(%rax),%esi
+    173c:	89 74 24 1c          	mov    %esi,0x1c(%rsp)
+            if (tmp > max) {
+    1740:	8b 74 24 1c          	mov    0x1c(%rsp),%esi
+    1744:	39 d6                	cmp    %edx,%esi
+    1746:	7e 04                	jle    174c <main+0x6bc>
+              max = tmp;
+    1748:	8b 54 24 1c          	mov    0x1c(%rsp),%edx
+        for (p = 0; p < P; ++p) {
+    174c:	48 83 c0 04          	add    $0x4,%rax
+    1750:	48 39 c8             	cmp    %rcx,%rax
+    1753:	75 cb                	jne    1720 <main+0x690>
+            (int8_t)(max + output_offset);
+    1755:	88 17                	mov    %dl,(%rdi)
+      for (w = 0; w < W_out; ++w) {
+    1757:	41 83 c1 02          	add    $0x2,%r9d
+    175b:	48 83 c7 01          	add    $0x1,%rdi
+    175f:	41 83 fa 02          	cmp    $0x2,%r10d
+    1763:	74 08                	je     176d <main+0x6dd>
+    1765:	41 ba 02 00 00 00    	mov    $0x2,%r10d
+    176b:	eb 9b                	jmp    1708 <main+0x678>
+    for (h = 0; h < H_out; ++h) {
+    176d:	41 83 c3 02          	add    $0x2,%r11d
+    1771:	49 83 c6 02          	add    $0x2,%r14
+    1775:	45 39 df             	cmp    %r11d,%r15d
+    1778:	0f 85 75 ff ff ff    	jne    16f3 <main+0x663>
+  for (c = 0; c < C; ++c) {
+    177e:	41 83 c4 02          	add    $0x2,%r12d
+    1782:	49 83 c5 04          	add    $0x4,%r13
+    1786:	41 81 fc 00 01 00 00 	cmp    $0x100,%r12d
+    178d:	74 08                	je     1797 <main+0x707>
+    178f:	45 89 fb             	mov    %r15d,%r11d
+    1792:	e9 55 ff ff ff       	jmp    16ec <main+0x65c>
+void deeploy_free(void *const ptr) { free(ptr); }
+    1797:	48 89 df             	mov    %rbx,%rdi
+    179a:	e8 91 f8 ff ff       	call   1030 <free@plt>
+void *deeploy_malloc(const size_t size) { return malloc(size); }
+    179f:	bf 28 00 00 00       	mov    $0x28,%edi
+    17a4:	e8 c7 f8 ff ff       	call   1070 <malloc@plt>
+    17a9:	31 c9                	xor    %ecx,%ecx
+    17ab:	66 0f ef ed          	pxor   %xmm5,%xmm5
+  } else if (transA == 0 && transB == 1) {
+    for (uint32_t m = 0; m < M; ++m) {
+      for (p = 0; p < P; p++) {
+        int32_t sum = 0;
+        for (n = 0; n < N; n++) {
+          sum += (int32_t)(pSrcA[m * N + n] + A_offset) *
+    17af:	66 0f ef e4          	pxor   %xmm4,%xmm4
+    17b3:	48 8d 15 46 35 00 00 	lea    0x3546(%rip),%rdx        # 4d00 <DeeployNetwork_net_QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0weight_tensor>
+    17ba:	48 89 c3             	mov    %rax,%rbx
+    17bd:	48 8d 35 fc 34 00 00 	lea    0x34fc(%rip),%rsi        # 4cc0 <DeeployNetwork_net_QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0bias_tensor>
+    17c4:	48 8d ba 00 14 00 00 	lea    0x1400(%rdx),%rdi
+    17cb:	31 c0                	xor    %eax,%eax
+    17cd:	66 0f ef c0          	pxor   %xmm0,%xmm0
+    17d1:	f3 0f 6f 4c 05 00    	movdqu 0x0(%rbp,%rax,1),%xmm1
+                 (pSrcB[p * N + n] + B_offset);
+    17d7:	66 0f 6f 1c 02       	movdqa (%rdx,%rax,1),%xmm3
+    17dc:	66 0f 6f fd          	movdqa %xmm5,%xmm7
+    17e0:	66 0f 6f f5          	movdqa %xmm5,%xmm6
+    17e4:	48 83 c0 10          	add    $0x10,%rax
+    17e8:	66 0f 64 f1          	pcmpgtb %xmm1,%xmm6
+    17ec:	66 0f 64 fb          	pcmpgtb %xmm3,%xmm7
+    17f0:	66 44 0f 6f c3       	movdqa %xmm3,%xmm8
+    17f5:	66 0f 6f d1          	movdqa %xmm1,%xmm2
+    17f9:	66 0f 60 d6          	punpcklbw %xmm6,%xmm2
+    17fd:	66 44 0f 60 c7       	punpcklbw %xmm7,%xmm8
+    1802:	66 0f 68 df          	punpckhbw %xmm7,%xmm3
+    1806:	66 41 0f d5 d0       	pmullw %xmm8,%xmm2
+    180b:	66 0f 68 ce          	punpckhbw %xmm6,%xmm1
+    180f:	66 0f d5 cb          	pmullw %xmm3,%xmm1
+          sum += (int32_t)(pSrcA[m * N + n] + A_offset) *
+    1813:	66 0f 6f dc          	movdqa %xmm4,%xmm3
+    1817:	66 0f 65 da          	pcmpgtw %xmm2,%xmm3
+    181b:	66 0f 6f f2          	movdqa %xmm2,%xmm6
+    181f:	66 0f 61 f3          	punpcklwd %xmm3,%xmm6
+    1823:	66 0f 69 d3          	punpckhwd %xmm3,%xmm2
+    1827:	66 0f 6f d9          	movdqa %xmm1,%xmm3
+    182b:	66 0f fe c6          	paddd  %xmm6,%xmm0
+    182f:	66 0f fe c2          	paddd  %xmm2,%xmm0
+    1833:	66 0f 6f d4          	movdqa %xmm4,%xmm2
+    1837:	66 0f 65 d1          	pcmpgtw %xmm1,%xmm2
+    183b:	66 0f 61 da          	punpcklwd %xmm2,%xmm3
+    183f:	66 0f 69 ca          	punpckhwd %xmm2,%xmm1
+    1843:	66 0f fe c3          	paddd  %xmm3,%xmm0
+    1847:	66 0f fe c1          	paddd  %xmm1,%xmm0
+    184b:	48 3d 00 02 00 00    	cmp    $0x200,%rax
+    1851:	0f 85 7a ff ff ff    	jne    17d1 <main+0x741>
+    1857:	66 0f 6f c8          	movdqa %xmm0,%xmm1
+      for (p = 0; p < P; p++) {
+    185b:	48 81 c2 00 02 00 00 	add    $0x200,%rdx
+    1862:	66 0f 73 d9 08       	psrldq $0x8,%xmm1
+    1867:	66 0f fe c1          	paddd  %xmm1,%xmm0
+        }
+        pDstY[m * P + p] =
+            alpha * sum + beta * (pSrcC[m * P + p] + C_offset) + Y_offset;
+    186b:	66 0f 6f c8          	movdqa %xmm0,%xmm1
+    186f:	66 0f 73 d9 04       	psrldq $0x4,%xmm1
+    1874:	66 0f fe c1          	paddd  %xmm1,%xmm0
+    1878:	66 0f 7e c0          	movd   %xmm0,%eax
+    187c:	03 04 0e             	add    (%rsi,%rcx,1),%eax
+        pDstY[m * P + p] =
+    187f:	89 04 0b             	mov    %eax,(%rbx,%rcx,1)
+      for (p = 0; p < P; p++) {
+    1882:	48 83 c1 04          	add    $0x4,%rcx
+    1886:	48 39 d7             	cmp    %rdx,%rdi
+    1889:	0f 85 3c ff ff ff    	jne    17cb <main+0x73b>
+void deeploy_free(void *const ptr) { free(ptr); }
+    188f:	48 89 ef             	mov    %rbp,%rdi
+    1892:	45 31 e4             	xor    %r12d,%r12d
+    1895:	4c 8d 2d c4 27 00 00 	lea    0x27c4(%rip),%r13        # 4060 <testOutputVector0>
+    189c:	e8 8f f7 ff ff       	call   1030 <free@plt>
+    RequantShift_s32_s8_NCHW(DeeployNetwork_x15_tensor, 10, DeeployNetwork_net_QL_REPLACED__INTEGERIZE_SIGNED_ACT_PASS_0mul_tensor, DeeployNetwork_net_QL_REPLACED__INTEGERIZE_SIGNED_ACT_PASS_0add_tensor, DeeployNetwork_output_0, 16, 1, 0, 0, -128, 127, 1);
+    18a1:	48 83 ec 08          	sub    $0x8,%rsp
+    18a5:	48 89 df             	mov    %rbx,%rdi
+    18a8:	4c 8b 05 d9 cb 01 00 	mov    0x1cbd9(%rip),%r8        # 1e488 <DeeployNetwork_output_0>
+    18af:	6a 00                	push   $0x0
+    18b1:	48 8d 15 c8 33 00 00 	lea    0x33c8(%rip),%rdx        # 4c80 <DeeployNetwork_net_QL_REPLACED__INTEGERIZE_SIGNED_ACT_PASS_0mul_tensor>
+    18b8:	be 0a 00 00 00       	mov    $0xa,%esi
+    18bd:	31 db                	xor    %ebx,%ebx
+    18bf:	41 b9 01 00 00 00    	mov    $0x1,%r9d
+    18c5:	48 8d 0d 94 cb 01 00 	lea    0x1cb94(%rip),%rcx        # 1e460 <DeeployNetwork_net_QL_REPLACED__INTEGERIZE_SIGNED_ACT_PASS_0add_tensor>
+      }
+#else
+      // RUNWANG: No margin for integer comparison
+      if (diff != 0) {
+        tot_err += 1;
+        printf("Expected: %4d  ", expected);
+    18cc:	4c 8d 3d 5a 07 00 00 	lea    0x75a(%rip),%r15        # 202d <Network.c.62ac2c80+0xd2>
+        printf("Actual: %4d  ", actual);
+    18d3:	4c 8d 35 63 07 00 00 	lea    0x763(%rip),%r14        # 203d <Network.c.62ac2c80+0xe2>
+    18da:	e8 41 03 00 00       	call   1c20 <RequantShift_s32_s8_NCHW.constprop.0>
+    18df:	e8 4c f7 ff ff       	call   1030 <free@plt>
+    18e4:	58                   	pop    %rax
+    18e5:	5a                   	pop    %rdx
+    18e6:	eb 0a                	jmp    18f2 <main+0x862>
+         i < DeeployNetwork_outputs_bytes[buf] / sizeof(OUTPUTTYPE); i++) {
+    18e8:	48 83 c3 01          	add    $0x1,%rbx
+    18ec:	48 83 fb 0a          	cmp    $0xa,%rbx
+    18f0:	74 5d                	je     194f <main+0x8bf>
+      actual = ((OUTPUTTYPE *)DeeployNetwork_outputs[buf])[i];
+    18f2:	48 8b 15 9f cb 01 00 	mov    0x1cb9f(%rip),%rdx        # 1e498 <DeeployNetwork_outputs>
+      expected = ((OUTPUTTYPE *)testOutputVector[buf])[i];
+    18f9:	41 0f b6 44 1d 00    	movzbl 0x0(%r13,%rbx,1),%eax
+      actual = ((OUTPUTTYPE *)DeeployNetwork_outputs[buf])[i];
+    18ff:	0f b6 2c 1a          	movzbl (%rdx,%rbx,1),%ebp
+      if (diff != 0) {
+    1903:	89 c7                	mov    %eax,%edi
+    1905:	40 28 ef             	sub    %bpl,%dil
+    1908:	40 88 7c 24 0c       	mov    %dil,0xc(%rsp)
+    190d:	74 d9                	je     18e8 <main+0x858>
+        printf("Expected: %4d  ", expected);
+    190f:	0f be f0             	movsbl %al,%esi
+    1912:	4c 89 ff             	mov    %r15,%rdi
+    1915:	31 c0                	xor    %eax,%eax
+        tot_err += 1;
+    1917:	41 83 c4 01          	add    $0x1,%r12d
+        printf("Expected: %4d  ", expected);
+    191b:	e8 30 f7 ff ff       	call   1050 <printf@plt>
+        printf("Actual: %4d  ", actual);
+    1920:	40 0f be f5          	movsbl %bpl,%esi
+    1924:	4c 89 f7             	mov    %r14,%rdi
+    1927:	31 c0                	xor    %eax,%eax
+    1929:	e8 22 f7 ff ff       	call   1050 <printf@plt>
+        printf("Diff: %4d at Index %12u in Output %u\r\n", diff, i, buf);
+    192e:	0f be 74 24 0c       	movsbl 0xc(%rsp),%esi
+    1933:	89 da                	mov    %ebx,%edx
+    1935:	31 c9                	xor    %ecx,%ecx
+    1937:	48 8d 3d 2a 07 00 00 	lea    0x72a(%rip),%rdi        # 2068 <Network.c.62ac2c80+0x10d>
+    193e:	31 c0                	xor    %eax,%eax
+         i < DeeployNetwork_outputs_bytes[buf] / sizeof(OUTPUTTYPE); i++) {
+    1940:	48 83 c3 01          	add    $0x1,%rbx
+        printf("Diff: %4d at Index %12u in Output %u\r\n", diff, i, buf);
+    1944:	e8 07 f7 ff ff       	call   1050 <printf@plt>
+         i < DeeployNetwork_outputs_bytes[buf] / sizeof(OUTPUTTYPE); i++) {
+    1949:	48 83 fb 0a          	cmp    $0xa,%rbx
+    194d:	75 a3                	jne    18f2 <main+0x862>
+      }
+#endif
+    }
+  }
+
+  printf("Errors: %d out of %d \r\n", tot_err, tot);
+    194f:	44 89 e6             	mov    %r12d,%esi
+    1952:	ba 0a 00 00 00       	mov    $0xa,%edx
+    1957:	48 8d 3d ed 06 00 00 	lea    0x6ed(%rip),%rdi        # 204b <Network.c.62ac2c80+0xf0>
+    195e:	31 c0                	xor    %eax,%eax
+    1960:	e8 eb f6 ff ff       	call   1050 <printf@plt>
+
+  return tot_err;
+    1965:	48 83 c4 28          	add    $0x28,%rsp
+    1969:	44 89 e0             	mov    %r12d,%eax
+    196c:	5b                   	pop    %rbx
+    196d:	5d                   	pop    %rbp
+    196e:	41 5c                	pop    %r12
+    1970:	41 5d                	pop    %r13
+    1972:	41 5e                	pop    %r14
+    1974:	41 5f                	pop    %r15
+    1976:	c3                   	ret
+    1977:	66 0f 1f 84 00 00 00 	nopw   0x0(%rax,%rax,1)
+    197e:	00 00 
+
+0000000000001980 <_start>:
+    1980:	31 ed                	xor    %ebp,%ebp
+    1982:	49 89 d1             	mov    %rdx,%r9
+    1985:	5e                   	pop    %rsi
+    1986:	48 89 e2             	mov    %rsp,%rdx
+    1989:	48 83 e4 f0          	and    $0xfffffffffffffff0,%rsp
+    198d:	50                   	push   %rax
+    198e:	54                   	push   %rsp
+    198f:	45 31 c0             	xor    %r8d,%r8d
+    1992:	31 c9                	xor    %ecx,%ecx
+    1994:	48 8d 3d f5 f6 ff ff 	lea    -0x90b(%rip),%rdi        # 1090 <main>
+    199b:	ff 15 1f 26 00 00    	call   *0x261f(%rip)        # 3fc0 <__libc_start_main@GLIBC_2.34>
+    19a1:	f4                   	hlt
+    19a2:	66 2e 0f 1f 84 00 00 	cs nopw 0x0(%rax,%rax,1)
+    19a9:	00 00 00 
+    19ac:	0f 1f 40 00          	nopl   0x0(%rax)
+
+00000000000019b0 <deregister_tm_clones>:
+    19b0:	48 8d 3d 79 ca 01 00 	lea    0x1ca79(%rip),%rdi        # 1e430 <__TMC_END__>
+    19b7:	48 8d 05 72 ca 01 00 	lea    0x1ca72(%rip),%rax        # 1e430 <__TMC_END__>
+    19be:	48 39 f8             	cmp    %rdi,%rax
+    19c1:	74 15                	je     19d8 <deregister_tm_clones+0x28>
+    19c3:	48 8b 05 fe 25 00 00 	mov    0x25fe(%rip),%rax        # 3fc8 <_ITM_deregisterTMCloneTable@Base>
+    19ca:	48 85 c0             	test   %rax,%rax
+    19cd:	74 09                	je     19d8 <deregister_tm_clones+0x28>
+    19cf:	ff e0                	jmp    *%rax
+    19d1:	0f 1f 80 00 00 00 00 	nopl   0x0(%rax)
+    19d8:	c3                   	ret
+    19d9:	0f 1f 80 00 00 00 00 	nopl   0x0(%rax)
+
+00000000000019e0 <register_tm_clones>:
+    19e0:	48 8d 3d 49 ca 01 00 	lea    0x1ca49(%rip),%rdi        # 1e430 <__TMC_END__>
+    19e7:	48 8d 35 42 ca 01 00 	lea    0x1ca42(%rip),%rsi        # 1e430 <__TMC_END__>
+    19ee:	48 29 fe             	sub    %rdi,%rsi
+    19f1:	48 89 f0             	mov    %rsi,%rax
+    19f4:	48 c1 ee 3f          	shr    $0x3f,%rsi
+    19f8:	48 c1 f8 03          	sar    $0x3,%rax
+    19fc:	48 01 c6             	add    %rax,%rsi
+    19ff:	48 d1 fe             	sar    %rsi
+    1a02:	74 14                	je     1a18 <register_tm_clones+0x38>
+    1a04:	48 8b 05 cd 25 00 00 	mov    0x25cd(%rip),%rax        # 3fd8 <_ITM_registerTMCloneTable@Base>
+    1a0b:	48 85 c0             	test   %rax,%rax
+    1a0e:	74 08                	je     1a18 <register_tm_clones+0x38>
+    1a10:	ff e0                	jmp    *%rax
+    1a12:	66 0f 1f 44 00 00    	nopw   0x0(%rax,%rax,1)
+    1a18:	c3                   	ret
+    1a19:	0f 1f 80 00 00 00 00 	nopl   0x0(%rax)
+
+0000000000001a20 <__do_global_dtors_aux>:
+    1a20:	f3 0f 1e fa          	endbr64
+    1a24:	80 3d 15 ca 01 00 00 	cmpb   $0x0,0x1ca15(%rip)        # 1e440 <completed.0>
+    1a2b:	75 2b                	jne    1a58 <__do_global_dtors_aux+0x38>
+    1a2d:	55                   	push   %rbp
+    1a2e:	48 83 3d aa 25 00 00 	cmpq   $0x0,0x25aa(%rip)        # 3fe0 <__cxa_finalize@GLIBC_2.2.5>
+    1a35:	00 
+    1a36:	48 89 e5             	mov    %rsp,%rbp
+    1a39:	74 0c                	je     1a47 <__do_global_dtors_aux+0x27>
+    1a3b:	48 8b 3d fe 25 00 00 	mov    0x25fe(%rip),%rdi        # 4040 <__dso_handle>
+    1a42:	e8 39 f6 ff ff       	call   1080 <__cxa_finalize@plt>
+    1a47:	e8 64 ff ff ff       	call   19b0 <deregister_tm_clones>
+    1a4c:	c6 05 ed c9 01 00 01 	movb   $0x1,0x1c9ed(%rip)        # 1e440 <completed.0>
+    1a53:	5d                   	pop    %rbp
+    1a54:	c3                   	ret
+    1a55:	0f 1f 00             	nopl   (%rax)
+    1a58:	c3                   	ret
+    1a59:	0f 1f 80 00 00 00 00 	nopl   0x0(%rax)
+
+0000000000001a60 <frame_dummy>:
+    1a60:	f3 0f 1e fa          	endbr64
+    1a64:	e9 77 ff ff ff       	jmp    19e0 <register_tm_clones>
+    1a69:	0f 1f 80 00 00 00 00 	nopl   0x0(%rax)
+
+0000000000001a70 <Conv2d_s8_s8_s32_NCHW.constprop.0>:
+    1a70:	41 57                	push   %r15
+    1a72:	44 8d 59 fe          	lea    -0x2(%rcx),%r11d
+    1a76:	89 d0                	mov    %edx,%eax
+    1a78:	45 31 d2             	xor    %r10d,%r10d
+    1a7b:	41 56                	push   %r14
+    1a7d:	0f af c1             	imul   %ecx,%eax
+    1a80:	4d 89 c6             	mov    %r8,%r14
+    1a83:	41 55                	push   %r13
+    1a85:	49 89 fd             	mov    %rdi,%r13
+    1a88:	8d 7a fe             	lea    -0x2(%rdx),%edi
+    1a8b:	41 54                	push   %r12
+    1a8d:	41 89 cc             	mov    %ecx,%r12d
+    1a90:	31 c9                	xor    %ecx,%ecx
+    1a92:	55                   	push   %rbp
+    1a93:	41 89 c7             	mov    %eax,%r15d
+    1a96:	53                   	push   %rbx
+    1a97:	31 db                	xor    %ebx,%ebx
+    1a99:	89 7c 24 c8          	mov    %edi,-0x38(%rsp)
+    1a9d:	41 0f af fb          	imul   %r11d,%edi
+    1aa1:	89 74 24 d0          	mov    %esi,-0x30(%rsp)
+    1aa5:	44 89 4c 24 d4       	mov    %r9d,-0x2c(%rsp)
+    1aaa:	44 8b 4c 24 40       	mov    0x40(%rsp),%r9d
+    1aaf:	89 7c 24 cc          	mov    %edi,-0x34(%rsp)
+    1ab3:	31 ff                	xor    %edi,%edi
+    1ab5:	42 8d 04 11          	lea    (%rcx,%r10,1),%eax
+    1ab9:	89 7c 24 e0          	mov    %edi,-0x20(%rsp)
+    1abd:	89 de                	mov    %ebx,%esi
+    1abf:	31 d2                	xor    %edx,%edx
+    1ac1:	89 44 24 d8          	mov    %eax,-0x28(%rsp)
+    1ac5:	8b 44 24 d0          	mov    -0x30(%rsp),%eax
+    1ac9:	45 31 c0             	xor    %r8d,%r8d
+    1acc:	41 01 c2             	add    %eax,%r10d
+    1acf:	43 8d 0c 12          	lea    (%r10,%r10,1),%ecx
+    1ad3:	44 89 54 24 e4       	mov    %r10d,-0x1c(%rsp)
+    1ad8:	42 8d 04 11          	lea    (%rcx,%r10,1),%eax
+    1adc:	41 89 ca             	mov    %ecx,%r10d
+    1adf:	48 8b 4c 24 38       	mov    0x38(%rsp),%rcx
+    1ae4:	89 f7                	mov    %esi,%edi
+    1ae6:	44 89 5c 24 e8       	mov    %r11d,-0x18(%rsp)
+    1aeb:	44 89 44 24 ec       	mov    %r8d,-0x14(%rsp)
+    1af0:	48 8d 3c b9          	lea    (%rcx,%rdi,4),%rdi
+    1af4:	41 8d 0c 13          	lea    (%r11,%rdx,1),%ecx
+    1af8:	89 5c 24 f0          	mov    %ebx,-0x10(%rsp)
+    1afc:	89 4c 24 dc          	mov    %ecx,-0x24(%rsp)
+    1b00:	89 54 24 f4          	mov    %edx,-0xc(%rsp)
+    1b04:	89 74 24 f8          	mov    %esi,-0x8(%rsp)
+    1b08:	48 89 7c 24 c0       	mov    %rdi,-0x40(%rsp)
+    1b0d:	89 d7                	mov    %edx,%edi
+    1b0f:	8b 54 24 d8          	mov    -0x28(%rsp),%edx
+    1b13:	89 7c 24 fc          	mov    %edi,-0x4(%rsp)
+    1b17:	89 fe                	mov    %edi,%esi
+    1b19:	31 c9                	xor    %ecx,%ecx
+    1b1b:	44 89 ff             	mov    %r15d,%edi
+    1b1e:	45 89 d0             	mov    %r10d,%r8d
+    1b21:	0f 1f 80 00 00 00 00 	nopl   0x0(%rax)
+    1b28:	44 8d 1c 52          	lea    (%rdx,%rdx,2),%r11d
+    1b2c:	89 54 24 b8          	mov    %edx,-0x48(%rsp)
+    1b30:	89 f5                	mov    %esi,%ebp
+    1b32:	89 74 24 bc          	mov    %esi,-0x44(%rsp)
+    1b36:	4c 89 db             	mov    %r11,%rbx
+    1b39:	4d 01 f3             	add    %r14,%r11
+    1b3c:	44 8d 7b 09          	lea    0x9(%rbx),%r15d
+    1b40:	89 6c 24 b4          	mov    %ebp,-0x4c(%rsp)
+    1b44:	41 89 ea             	mov    %ebp,%r10d
+    1b47:	31 f6                	xor    %esi,%esi
+    1b49:	4d 01 ea             	add    %r13,%r10
+    1b4c:	0f 1f 40 00          	nopl   0x0(%rax)
+    1b50:	41 0f be 14 32       	movsbl (%r10,%rsi,1),%edx
+    1b55:	41 0f be 2c 33       	movsbl (%r11,%rsi,1),%ebp
+    1b5a:	48 83 c6 01          	add    $0x1,%rsi
+    1b5e:	44 01 ca             	add    %r9d,%edx
+    1b61:	0f af d5             	imul   %ebp,%edx
+    1b64:	01 d1                	add    %edx,%ecx
+    1b66:	48 83 fe 03          	cmp    $0x3,%rsi
+    1b6a:	75 e4                	jne    1b50 <Conv2d_s8_s8_s32_NCHW.constprop.0+0xe0>
+    1b6c:	8b 6c 24 b4          	mov    -0x4c(%rsp),%ebp
+    1b70:	83 c3 03             	add    $0x3,%ebx
+    1b73:	49 83 c3 03          	add    $0x3,%r11
+    1b77:	44 01 e5             	add    %r12d,%ebp
+    1b7a:	41 39 df             	cmp    %ebx,%r15d
+    1b7d:	75 c1                	jne    1b40 <Conv2d_s8_s8_s32_NCHW.constprop.0+0xd0>
+    1b7f:	8b 54 24 b8          	mov    -0x48(%rsp),%edx
+    1b83:	8b 74 24 bc          	mov    -0x44(%rsp),%esi
+    1b87:	83 c2 03             	add    $0x3,%edx
+    1b8a:	01 fe                	add    %edi,%esi
+    1b8c:	39 d0                	cmp    %edx,%eax
+    1b8e:	75 98                	jne    1b28 <Conv2d_s8_s8_s32_NCHW.constprop.0+0xb8>
+    1b90:	48 8b 5c 24 c0       	mov    -0x40(%rsp),%rbx
+    1b95:	41 89 ff             	mov    %edi,%r15d
+    1b98:	03 4c 24 48          	add    0x48(%rsp),%ecx
+    1b9c:	45 89 c2             	mov    %r8d,%r10d
+    1b9f:	8b 7c 24 fc          	mov    -0x4(%rsp),%edi
+    1ba3:	89 0b                	mov    %ecx,(%rbx)
+    1ba5:	48 83 c3 04          	add    $0x4,%rbx
+    1ba9:	48 89 5c 24 c0       	mov    %rbx,-0x40(%rsp)
+    1bae:	83 c7 01             	add    $0x1,%edi
+    1bb1:	39 7c 24 dc          	cmp    %edi,-0x24(%rsp)
+    1bb5:	0f 85 54 ff ff ff    	jne    1b0f <Conv2d_s8_s8_s32_NCHW.constprop.0+0x9f>
+    1bbb:	44 8b 44 24 ec       	mov    -0x14(%rsp),%r8d
+    1bc0:	44 8b 5c 24 e8       	mov    -0x18(%rsp),%r11d
+    1bc5:	8b 54 24 f4          	mov    -0xc(%rsp),%edx
+    1bc9:	8b 74 24 f8          	mov    -0x8(%rsp),%esi
+    1bcd:	8b 7c 24 c8          	mov    -0x38(%rsp),%edi
+    1bd1:	41 83 c0 01          	add    $0x1,%r8d
+    1bd5:	8b 5c 24 f0          	mov    -0x10(%rsp),%ebx
+    1bd9:	44 01 de             	add    %r11d,%esi
+    1bdc:	44 01 e2             	add    %r12d,%edx
+    1bdf:	41 39 f8             	cmp    %edi,%r8d
+    1be2:	0f 85 f7 fe ff ff    	jne    1adf <Conv2d_s8_s8_s32_NCHW.constprop.0+0x6f>
+    1be8:	8b 44 24 cc          	mov    -0x34(%rsp),%eax
+    1bec:	8b 7c 24 e0          	mov    -0x20(%rsp),%edi
+    1bf0:	44 89 d1             	mov    %r10d,%ecx
+    1bf3:	44 8b 54 24 e4       	mov    -0x1c(%rsp),%r10d
+    1bf8:	01 c3                	add    %eax,%ebx
+    1bfa:	8b 44 24 d4          	mov    -0x2c(%rsp),%eax
+    1bfe:	83 c7 01             	add    $0x1,%edi
+    1c01:	39 c7                	cmp    %eax,%edi
+    1c03:	0f 85 ac fe ff ff    	jne    1ab5 <Conv2d_s8_s8_s32_NCHW.constprop.0+0x45>
+    1c09:	5b                   	pop    %rbx
+    1c0a:	5d                   	pop    %rbp
+    1c0b:	41 5c                	pop    %r12
+    1c0d:	41 5d                	pop    %r13
+    1c0f:	41 5e                	pop    %r14
+    1c11:	41 5f                	pop    %r15
+    1c13:	c3                   	ret
+    1c14:	66 66 2e 0f 1f 84 00 	data16 cs nopw 0x0(%rax,%rax,1)
+    1c1b:	00 00 00 00 
+    1c1f:	90                   	nop
+
+0000000000001c20 <RequantShift_s32_s8_NCHW.constprop.0>:
+    out = (int8_t)CLAMP(intermediate, output_min, output_max);
+    data_out[i] = out;
+  }
+}
+
+void RequantShift_s32_s8_NCHW(int32_t *data_in, int32_t size, int32_t *mul,
+    1c20:	41 54                	push   %r12
+    1c22:	49 89 cb             	mov    %rcx,%r11
+    1c25:	49 89 d2             	mov    %rdx,%r10
+    1c28:	48 63 f6             	movslq %esi,%rsi
+    1c2b:	55                   	push   %rbp
+    1c2c:	31 c9                	xor    %ecx,%ecx
+
+    intermediate = (intermediate + input_offset) * mul[i / HW] + add[i / HW];
+    if (rounding && log2D > 0)
+      intermediate += 1 << (log2D - 1);
+    intermediate = (intermediate >> log2D) + output_offset;
+    out = (int8_t)CLAMP(intermediate, output_min, output_max);
+    1c2e:	bd 80 ff ff ff       	mov    $0xffffff80,%ebp
+void RequantShift_s32_s8_NCHW(int32_t *data_in, int32_t size, int32_t *mul,
+    1c33:	53                   	push   %rbx
+    1c34:	8b 5c 24 20          	mov    0x20(%rsp),%ebx
+    1c38:	0f 1f 84 00 00 00 00 	nopl   0x0(%rax,%rax,1)
+    1c3f:	00 
+    intermediate = (intermediate + input_offset) * mul[i / HW] + add[i / HW];
+    1c40:	89 c8                	mov    %ecx,%eax
+    1c42:	99                   	cltd
+    1c43:	41 f7 f9             	idiv   %r9d
+    1c46:	48 63 d0             	movslq %eax,%rdx
+    1c49:	8b 04 8f             	mov    (%rdi,%rcx,4),%eax
+    1c4c:	01 d8                	add    %ebx,%eax
+    1c4e:	41 0f af 04 92       	imul   (%r10,%rdx,4),%eax
+    1c53:	41 03 04 93          	add    (%r11,%rdx,4),%eax
+    out = (int8_t)CLAMP(intermediate, output_min, output_max);
+    1c57:	ba 7f 00 00 00       	mov    $0x7f,%edx
+      intermediate += 1 << (log2D - 1);
+    1c5c:	05 00 80 00 00       	add    $0x8000,%eax
+    intermediate = (intermediate >> log2D) + output_offset;
+    1c61:	41 89 c4             	mov    %eax,%r12d
+    1c64:	41 c1 fc 10          	sar    $0x10,%r12d
+    out = (int8_t)CLAMP(intermediate, output_min, output_max);
+    1c68:	3d ff ff 7f 00       	cmp    $0x7fffff,%eax
+    1c6d:	7f 0a                	jg     1c79 <RequantShift_s32_s8_NCHW.constprop.0+0x59>
+    1c6f:	41 83 fc 80          	cmp    $0xffffff80,%r12d
+    1c73:	44 89 e2             	mov    %r12d,%edx
+    1c76:	0f 4c d5             	cmovl  %ebp,%edx
+    data_out[i] = out;
+    1c79:	41 88 14 08          	mov    %dl,(%r8,%rcx,1)
+  for (int i = 0; i < size; i++) {
+    1c7d:	48 83 c1 01          	add    $0x1,%rcx
+    1c81:	48 39 ce             	cmp    %rcx,%rsi
+    1c84:	75 ba                	jne    1c40 <RequantShift_s32_s8_NCHW.constprop.0+0x20>
+  }
+}
+    1c86:	5b                   	pop    %rbx
+    1c87:	5d                   	pop    %rbp
+    1c88:	41 5c                	pop    %r12
+    1c8a:	c3                   	ret
+
+Disassembly of section .fini:
+
+0000000000001c8c <_fini>:
+    1c8c:	48 83 ec 08          	sub    $0x8,%rsp
+    1c90:	48 83 c4 08          	add    $0x8,%rsp
+    1c94:	c3                   	ret
@@ -0,0 +1,379 @@
+
+/root/package/DeeployTest/TEST_GENERIC/build_master/bin/FusedElementwise:     file format elf64-x86-64
+
+Sections:
+Idx Name          Size      VMA               LMA               File off  Algn
+  0 .interp       0000001c  0000000000000318  0000000000000318  00000318  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+  1 .note.gnu.property 00000020  0000000000000338  0000000000000338  00000338  2**3
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+  2 .note.gnu.build-id 00000024  0000000000000358  0000000000000358  00000358  2**2
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+  3 .note.ABI-tag 00000020  000000000000037c  000000000000037c  0000037c  2**2
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+  4 .gnu.hash     00000024  00000000000003a0  00000000000003a0  000003a0  2**3
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+  5 .dynsym       000000d8  00000000000003c8  00000000000003c8  000003c8  2**3
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+  6 .dynstr       00000128  00000000000004a0  00000000000004a0  000004a0  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+  7 .gnu.version  00000012  00000000000005c8  00000000000005c8  000005c8  2**1
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+  8 .gnu.version_r 00000030  00000000000005e0  00000000000005e0  000005e0  2**3
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+  9 .rela.dyn     000000c0  0000000000000610  0000000000000610  00000610  2**3
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+ 10 .rela.plt     00000048  00000000000006d0  00000000000006d0  000006d0  2**3
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+ 11 .init         00000017  0000000000001000  0000000000001000  00001000  2**2
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+ 12 .plt          00000040  0000000000001020  0000000000001020  00001020  2**4
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+ 13 .plt.got      00000008  0000000000001060  0000000000001060  00001060  2**3
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+ 14 .text         000002d9  0000000000001070  0000000000001070  00001070  2**4
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+ 15 .fini         00000009  000000000000134c  000000000000134c  0000134c  2**2
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+ 16 .rodata       000000f8  0000000000002000  0000000000002000  00002000  2**5
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+ 17 .eh_frame_hdr 0000002c  00000000000020f8  00000000000020f8  000020f8  2**2
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+ 18 .eh_frame     000000d8  0000000000002128  0000000000002128  00002128  2**3
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+ 19 .init_array   00000008  0000000000003dc0  0000000000003dc0  00002dc0  2**3
+                  CONTENTS, ALLOC, LOAD, DATA
+ 20 .fini_array   00000008  0000000000003dc8  0000000000003dc8  00002dc8  2**3
+                  CONTENTS, ALLOC, LOAD, DATA
+ 21 .dynamic      000001f0  0000000000003dd0  0000000000003dd0  00002dd0  2**3
+                  CONTENTS, ALLOC, LOAD, DATA
+ 22 .got          00000028  0000000000003fc0  0000000000003fc0  00002fc0  2**3
+                  CONTENTS, ALLOC, LOAD, DATA
+ 23 .got.plt      00000030  0000000000003fe8  0000000000003fe8  00002fe8  2**3
+                  CONTENTS, ALLOC, LOAD, DATA
+ 24 .data         00003020  0000000000004020  0000000000004020  00003020  2**5
+                  CONTENTS, ALLOC, LOAD, DATA
+ 25 .bss          00000040  0000000000007040  0000000000007040  00006040  2**4
+                  ALLOC
+ 26 .comment      00000027  0000000000000000  0000000000000000  00006040  2**0
+                  CONTENTS, READONLY
+ 27 .debug_aranges 00000030  0000000000000000  0000000000000000  00006067  2**0
+                  CONTENTS, READONLY, DEBUGGING, OCTETS
+ 28 .debug_info   00001524  0000000000000000  0000000000000000  00006097  2**0
+                  CONTENTS, READONLY, DEBUGGING, OCTETS
+ 29 .debug_abbrev 00000582  0000000000000000  0000000000000000  000075bb  2**0
+                  CONTENTS, READONLY, DEBUGGING, OCTETS
+ 30 .debug_line   000002ef  0000000000000000  0000000000000000  00007b3d  2**0
+                  CONTENTS, READONLY, DEBUGGING, OCTETS
+ 31 .debug_str    00000779  0000000000000000  0000000000000000  00007e2c  2**0
+                  CONTENTS, READONLY, DEBUGGING, OCTETS
+ 32 .debug_line_str 0000039b  0000000000000000  0000000000000000  000085a5  2**0
+                  CONTENTS, READONLY, DEBUGGING, OCTETS
+ 33 .debug_loclists 000002c9  0000000000000000  0000000000000000  00008940  2**0
+                  CONTENTS, READONLY, DEBUGGING, OCTETS
+ 34 .debug_rnglists 0000008b  0000000000000000  0000000000000000  00008c09  2**0
+                  CONTENTS, READONLY, DEBUGGING, OCTETS
+
+Disassembly of section .init:
+
+0000000000001000 <_init>:
+    1000:	48 83 ec 08          	sub    $0x8,%rsp
+    1004:	48 8b 05 c5 2f 00 00 	mov    0x2fc5(%rip),%rax        # 3fd0 <__gmon_start__@Base>
+    100b:	48 85 c0             	test   %rax,%rax
+    100e:	74 02                	je     1012 <_init+0x12>
+    1010:	ff d0                	call   *%rax
+    1012:	48 83 c4 08          	add    $0x8,%rsp
+    1016:	c3                   	ret
+
+Disassembly of section .plt:
+
+0000000000001020 <puts@plt-0x10>:
+    1020:	ff 35 ca 2f 00 00    	push   0x2fca(%rip)        # 3ff0 <_GLOBAL_OFFSET_TABLE_+0x8>
+    1026:	ff 25 cc 2f 00 00    	jmp    *0x2fcc(%rip)        # 3ff8 <_GLOBAL_OFFSET_TABLE_+0x10>
+    102c:	0f 1f 40 00          	nopl   0x0(%rax)
+
+0000000000001030 <puts@plt>:
+    1030:	ff 25 ca 2f 00 00    	jmp    *0x2fca(%rip)        # 4000 <puts@GLIBC_2.2.5>
+    1036:	68 00 00 00 00       	push   $0x0
+    103b:	e9 e0 ff ff ff       	jmp    1020 <_init+0x20>
+
+0000000000001040 <printf@plt>:
+    1040:	ff 25 c2 2f 00 00    	jmp    *0x2fc2(%rip)        # 4008 <printf@GLIBC_2.2.5>
+    1046:	68 01 00 00 00       	push   $0x1
+    104b:	e9 d0 ff ff ff       	jmp    1020 <_init+0x20>
+
+0000000000001050 <malloc@plt>:
+    1050:	ff 25 ba 2f 00 00    	jmp    *0x2fba(%rip)        # 4010 <malloc@GLIBC_2.2.5>
+    1056:	68 02 00 00 00       	push   $0x2
+    105b:	e9 c0 ff ff ff       	jmp    1020 <_init+0x20>
+
+Disassembly of section .plt.got:
+
+0000000000001060 <__cxa_finalize@plt>:
+    1060:	ff 25 7a 2f 00 00    	jmp    *0x2f7a(%rip)        # 3fe0 <__cxa_finalize@GLIBC_2.2.5>
+    1066:	66 90                	xchg   %ax,%ax
+
+Disassembly of section .text:
+
+0000000000001070 <main>:
+    1070:	41 57                	push   %r15
+    1072:	48 8d 3d 87 0f 00 00 	lea    0xf87(%rip),%rdi        # 2000 <_fini+0xcb4>
+    1079:	41 56                	push   %r14
+    107b:	41 55                	push   %r13
+    107d:	41 54                	push   %r12
+    107f:	55                   	push   %rbp
+    1080:	53                   	push   %rbx
+    1081:	48 83 ec 18          	sub    $0x18,%rsp
+    1085:	e8 a6 ff ff ff       	call   1030 <puts@plt>
+  va_start(args, fmt);
+  int ret = vprintf(fmt, args);
+  va_end(args);
+  return ret;
+}
+void *deeploy_malloc(const size_t size) { return malloc(size); }
+    108a:	bf 00 10 00 00       	mov    $0x1000,%edi
+    108f:	e8 bc ff ff ff       	call   1050 <malloc@plt>
+    1094:	bf 00 10 00 00       	mov    $0x1000,%edi
+    1099:	48 89 c5             	mov    %rax,%rbp
+}
+
+        }
+        
+        void InitNetwork(__attribute__((unused)) uint32_t core_id, __attribute__((unused)) uint32_t numThreads){
+        DeeployNetwork_input_0 = (float32_t*) deeploy_malloc(4 * 1024);
+    109c:	48 89 05 bd 5f 00 00 	mov    %rax,0x5fbd(%rip)        # 7060 <DeeployNetwork_input_0>
+    10a3:	e8 a8 ff ff ff       	call   1050 <malloc@plt>
+    10a8:	bf 00 10 00 00       	mov    $0x1000,%edi
+    10ad:	48 89 c3             	mov    %rax,%rbx
+DeeployNetwork_input_1 = (float32_t*) deeploy_malloc(4 * 1024);
+    10b0:	48 89 05 a1 5f 00 00 	mov    %rax,0x5fa1(%rip)        # 7058 <DeeployNetwork_input_1>
+    10b7:	e8 94 ff ff ff       	call   1050 <malloc@plt>
+  printf("Initializing network...\r\n");
+
+  InitNetwork(0, 1);
+
+  for (uint32_t buf = 0; buf < DeeployNetwork_num_inputs; buf++) {
+    memcpy(DeeployNetwork_inputs[buf], testInputVector[buf],
+    10bc:	48 8d 35 7d 4f 00 00 	lea    0x4f7d(%rip),%rsi        # 6040 <testInputVector0>
+    10c3:	48 89 ef             	mov    %rbp,%rdi
+    10c6:	b9 00 02 00 00       	mov    $0x200,%ecx
+    10cb:	f3 48 a5             	rep movsq %ds:(%rsi),%es:(%rdi)
+    10ce:	b9 00 02 00 00       	mov    $0x200,%ecx
+    10d3:	48 8d 35 66 3f 00 00 	lea    0x3f66(%rip),%rsi        # 5040 <testInputVector1>
+    10da:	48 89 df             	mov    %rbx,%rdi
+    10dd:	f3 48 a5             	rep movsq %ds:(%rsi),%es:(%rdi)
+           DeeployNetwork_inputs_bytes[buf]);
+  }
+
+  printf("Running network...\r\n");
+    10e0:	48 8d 3d 32 0f 00 00 	lea    0xf32(%rip),%rdi        # 2019 <_fini+0xccd>
+DeeployNetwork_output_0 = (float32_t*) deeploy_malloc(4 * 1024);
+    10e7:	48 89 05 62 5f 00 00 	mov    %rax,0x5f62(%rip)        # 7050 <DeeployNetwork_output_0>
+DeeployNetwork_inputs[0] = (void*) DeeployNetwork_input_0;DeeployNetwork_inputs[1] = (void*) DeeployNetwork_input_1;DeeployNetwork_outputs[0] = (void*) DeeployNetwork_output_0;
+    10ee:	48 89 2d 7b 5f 00 00 	mov    %rbp,0x5f7b(%rip)        # 7070 <DeeployNetwork_inputs>
+    10f5:	48 89 1d 7c 5f 00 00 	mov    %rbx,0x5f7c(%rip)        # 7078 <DeeployNetwork_inputs+0x8>
+    10fc:	48 89 05 65 5f 00 00 	mov    %rax,0x5f65(%rip)        # 7068 <DeeployNetwork_outputs>
+    1103:	e8 28 ff ff ff       	call   1030 <puts@plt>
+        float32_t x0 = (float32_t) DeeployNetwork_input_0[i];
+    1108:	48 8b 3d 51 5f 00 00 	mov    0x5f51(%rip),%rdi        # 7060 <DeeployNetwork_input_0>
+        float32_t x1 = (float32_t) DeeployNetwork_input_1[i];
+    110f:	48 8b 35 42 5f 00 00 	mov    0x5f42(%rip),%rsi        # 7058 <DeeployNetwork_input_1>
+        DeeployNetwork_output_0[i] = (float32_t) (t3);
+    1116:	b8 01 00 00 00       	mov    $0x1,%eax
+    111b:	48 8b 0d 2e 5f 00 00 	mov    0x5f2e(%rip),%rcx        # 7050 <DeeployNetwork_output_0>
+    1122:	f3 0f 10 05 b6 0f 00 	movss  0xfb6(%rip),%xmm0        # 20e0 <DeeployNetwork_bias_tensor+0x40>
+    1129:	00 
+        float32_t t1 = MAX(t0, 0.0f);
+    112a:	66 0f ef d2          	pxor   %xmm2,%xmm2
+        float32_t x2 = (float32_t) DeeployNetwork_bias_tensor[((i / (8 * 8)) % 16)];
+    112e:	4c 8d 05 6b 0f 00 00 	lea    0xf6b(%rip),%r8        # 20a0 <DeeployNetwork_bias_tensor>
+        float32_t t2 = t1 * x3;
+    1135:	f3 0f 10 1d a7 0f 00 	movss  0xfa7(%rip),%xmm3        # 20e4 <DeeployNetwork_bias_tensor+0x44>
+    113c:	00 
+    113d:	eb 26                	jmp    1165 <main+0xf5>
+    113f:	90                   	nop
+    1140:	f3 0f 59 c3          	mulss  %xmm3,%xmm0
+        float32_t t3 = t2 + x1;
+    1144:	f3 0f 58 c1          	addss  %xmm1,%xmm0
+    1148:	89 c2                	mov    %eax,%edx
+        DeeployNetwork_output_0[i] = (float32_t) (t3);
+    114a:	f3 0f 11 44 81 fc    	movss  %xmm0,-0x4(%rcx,%rax,4)
+    for (uint32_t i = 0; i < 1024; i++) {
+    1150:	48 83 c0 01          	add    $0x1,%rax
+    1154:	48 3d 01 04 00 00    	cmp    $0x401,%rax
+    115a:	74 20                	je     117c <main+0x10c>
+        float32_t x2 = (float32_t) DeeployNetwork_bias_tensor[((i / (8 * 8)) % 16)];
+    115c:	c1 ea 06             	shr    $0x6,%edx
+    115f:	f3 41 0f 10 04 90    	movss  (%r8,%rdx,4),%xmm0
+        float32_t t0 = x0 + x2;
+    1165:	f3 0f 58 44 87 fc    	addss  -0x4(%rdi,%rax,4),%xmm0
+        float32_t x1 = (float32_t) DeeployNetwork_input_1[i];
+    116b:	f3 0f 10 4c 86 fc    	movss  -0x4(%rsi,%rax,4),%xmm1
+        float32_t t1 = MAX(t0, 0.0f);
+    1171:	0f 2f c2             	comiss %xmm2,%xmm0
+    1174:	77 ca                	ja     1140 <main+0xd0>
+    1176:	66 0f ef c0          	pxor   %xmm0,%xmm0
+    117a:	eb c8                	jmp    1144 <main+0xd4>
+    117c:	31 db                	xor    %ebx,%ebx
+    117e:	31 ed                	xor    %ebp,%ebp
+    1180:	4c 8d 25 b9 2e 00 00 	lea    0x2eb9(%rip),%r12        # 4040 <testOutputVector0>
+
+#if ISOUTPUTFLOAT == 1
+      // RUNWANG: Allow margin of error for float32_t
+      if ((diff < -1e-4) || (diff > 1e-4)) {
+        tot_err += 1;
+        printf("Expected: %10.6f  ", (float)expected);
+    1187:	4c 8d 3d 9f 0e 00 00 	lea    0xe9f(%rip),%r15        # 202d <_fini+0xce1>
+        printf("Actual: %10.6f  ", (float)actual);
+    118e:	4c 8d 35 ab 0e 00 00 	lea    0xeab(%rip),%r14        # 2040 <_fini+0xcf4>
+        printf("Diff: %10.6f at Index %12u in Output %u\r\n", (float)diff, i,
+    1195:	4c 8d 2d d4 0e 00 00 	lea    0xed4(%rip),%r13        # 2070 <_fini+0xd24>
+    119c:	0f 1f 40 00          	nopl   0x0(%rax)
+      actual = ((OUTPUTTYPE *)DeeployNetwork_outputs[buf])[i];
+    11a0:	48 8b 05 c1 5e 00 00 	mov    0x5ec1(%rip),%rax        # 7068 <DeeployNetwork_outputs>
+      expected = ((OUTPUTTYPE *)testOutputVector[buf])[i];
+    11a7:	f3 41 0f 10 04 9c    	movss  (%r12,%rbx,4),%xmm0
+      if ((diff < -1e-4) || (diff > 1e-4)) {
+    11ad:	f2 0f 10 25 33 0f 00 	movsd  0xf33(%rip),%xmm4        # 20e8 <DeeployNetwork_bias_tensor+0x48>
+    11b4:	00 
+      actual = ((OUTPUTTYPE *)DeeployNetwork_outputs[buf])[i];
+    11b5:	f3 0f 10 14 98       	movss  (%rax,%rbx,4),%xmm2
+      diff = expected - actual;
+    11ba:	0f 28 c8             	movaps %xmm0,%xmm1
+    11bd:	f3 0f 5c ca          	subss  %xmm2,%xmm1
+      if ((diff < -1e-4) || (diff > 1e-4)) {
+    11c1:	f3 0f 5a c9          	cvtss2sd %xmm1,%xmm1
+    11c5:	66 0f 2f e1          	comisd %xmm1,%xmm4
+    11c9:	77 0a                	ja     11d5 <main+0x165>
+    11cb:	66 0f 2f 0d 1d 0f 00 	comisd 0xf1d(%rip),%xmm1        # 20f0 <DeeployNetwork_bias_tensor+0x50>
+    11d2:	00 
+    11d3:	76 54                	jbe    1229 <main+0x1b9>
+        printf("Expected: %10.6f  ", (float)expected);
+    11d5:	4c 89 ff             	mov    %r15,%rdi
+    11d8:	b8 01 00 00 00       	mov    $0x1,%eax
+    11dd:	f2 0f 11 0c 24       	movsd  %xmm1,(%rsp)
+        tot_err += 1;
+    11e2:	83 c5 01             	add    $0x1,%ebp
+        printf("Expected: %10.6f  ", (float)expected);
+    11e5:	f3 0f 11 54 24 0c    	movss  %xmm2,0xc(%rsp)
+    11eb:	f3 0f 5a c0          	cvtss2sd %xmm0,%xmm0
+    11ef:	e8 4c fe ff ff       	call   1040 <printf@plt>
+        printf("Actual: %10.6f  ", (float)actual);
+    11f4:	f3 0f 10 54 24 0c    	movss  0xc(%rsp),%xmm2
+    11fa:	4c 89 f7             	mov    %r14,%rdi
+    11fd:	66 0f ef c0          	pxor   %xmm0,%xmm0
+    1201:	b8 01 00 00 00       	mov    $0x1,%eax
+    1206:	f3 0f 5a c2          	cvtss2sd %xmm2,%xmm0
+    120a:	e8 31 fe ff ff       	call   1040 <printf@plt>
+        printf("Diff: %10.6f at Index %12u in Output %u\r\n", (float)diff, i,
+    120f:	31 d2                	xor    %edx,%edx
+    1211:	89 de                	mov    %ebx,%esi
+    1213:	f2 0f 10 0c 24       	movsd  (%rsp),%xmm1
+    1218:	4c 89 ef             	mov    %r13,%rdi
+    121b:	b8 01 00 00 00       	mov    $0x1,%eax
+    1220:	66 0f 28 c1          	movapd %xmm1,%xmm0
+    1224:	e8 17 fe ff ff       	call   1040 <printf@plt>
+         i < DeeployNetwork_outputs_bytes[buf] / sizeof(OUTPUTTYPE); i++) {
+    1229:	48 83 c3 01          	add    $0x1,%rbx
+    122d:	48 81 fb 00 04 00 00 	cmp    $0x400,%rbx
+    1234:	0f 85 66 ff ff ff    	jne    11a0 <main+0x130>
+      }
+#endif
+    }
+  }
+
+  printf("Errors: %d out of %d \r\n", tot_err, tot);
+    123a:	89 ee                	mov    %ebp,%esi
+    123c:	ba 00 04 00 00       	mov    $0x400,%edx
+    1241:	48 8d 3d 09 0e 00 00 	lea    0xe09(%rip),%rdi        # 2051 <_fini+0xd05>
+    1248:	31 c0                	xor    %eax,%eax
+    124a:	e8 f1 fd ff ff       	call   1040 <printf@plt>
+
+  return tot_err;
+    124f:	48 83 c4 18          	add    $0x18,%rsp
+    1253:	89 e8                	mov    %ebp,%eax
+    1255:	5b                   	pop    %rbx
+    1256:	5d                   	pop    %rbp
+    1257:	41 5c                	pop    %r12
+    1259:	41 5d                	pop    %r13
+    125b:	41 5e                	pop    %r14
+    125d:	41 5f                	pop    %r15
+    125f:	c3                   	ret
+
+0000000000001260 <_start>:
+    1260:	31 ed                	xor    %ebp,%ebp
+    1262:	49 89 d1             	mov    %rdx,%r9
+    1265:	5e                   	pop    %rsi
+    1266:	48 89 e2             	mov    %rsp,%rdx
+    1269:	48 83 e4 f0          	and    $0xfffffffffffffff0,%rsp
+    126d:	50                   	push   %rax
+    126e:	54                   	push   %rsp
+    126f:	45 31 c0             	xor    %r8d,%r8d
+    1272:	31 c9                	xor    %ecx,%ecx
+    1274:	48 8d 3d f5 fd ff ff 	lea    -0x20b(%rip),%rdi        # 1070 <main>
+    127b:	ff 15 3f 2d 00 00    	call   *0x2d3f(%rip)        # 3fc0 <__libc_start_main@GLIBC_2.34>
+    1281:	f4                   	hlt
+    1282:	66 2e 0f 1f 84 00 00 	cs nopw 0x0(%rax,%rax,1)
+    1289:	00 00 00 
+    128c:	0f 1f 40 00          	nopl   0x0(%rax)
+
+0000000000001290 <deregister_tm_clones>:
+    1290:	48 8d 3d a9 5d 00 00 	lea    0x5da9(%rip),%rdi        # 7040 <__TMC_END__>
+    1297:	48 8d 05 a2 5d 00 00 	lea    0x5da2(%rip),%rax        # 7040 <__TMC_END__>
+    129e:	48 39 f8             	cmp    %rdi,%rax
+    12a1:	74 15                	je     12b8 <deregister_tm_clones+0x28>
+    12a3:	48 8b 05 1e 2d 00 00 	mov    0x2d1e(%rip),%rax        # 3fc8 <_ITM_deregisterTMCloneTable@Base>
+    12aa:	48 85 c0             	test   %rax,%rax
+    12ad:	74 09                	je     12b8 <deregister_tm_clones+0x28>
+    12af:	ff e0                	jmp    *%rax
+    12b1:	0f 1f 80 00 00 00 00 	nopl   0x0(%rax)
+    12b8:	c3                   	ret
+    12b9:	0f 1f 80 00 00 00 00 	nopl   0x0(%rax)
+
+00000000000012c0 <register_tm_clones>:
+    12c0:	48 8d 3d 79 5d 00 00 	lea    0x5d79(%rip),%rdi        # 7040 <__TMC_END__>
+    12c7:	48 8d 35 72 5d 00 00 	lea    0x5d72(%rip),%rsi        # 7040 <__TMC_END__>
+    12ce:	48 29 fe             	sub    %rdi,%rsi
+    12d1:	48 89 f0             	mov    %rsi,%rax
+    12d4:	48 c1 ee 3f          	shr    $0x3f,%rsi
+    12d8:	48 c1 f8 03          	sar    $0x3,%rax
+    12dc:	48 01 c6             	add    %rax,%rsi
+    12df:	48 d1 fe             	sar    %rsi
+    12e2:	74 14                	je     12f8 <register_tm_clones+0x38>
+    12e4:	48 8b 05 ed 2c 00 00 	mov    0x2ced(%rip),%rax        # 3fd8 <_ITM_registerTMCloneTable@Base>
+    12eb:	48 85 c0             	test   %rax,%rax
+    12ee:	74 08                	je     12f8 <register_tm_clones+0x38>
+    12f0:	ff e0                	jmp    *%rax
+    12f2:	66 0f 1f 44 00 00    	nopw   0x0(%rax,%rax,1)
+    12f8:	c3                   	ret
+    12f9:	0f 1f 80 00 00 00 00 	nopl   0x0(%rax)
+
+0000000000001300 <__do_global_dtors_aux>:
+    1300:	f3 0f 1e fa          	endbr64
+    1304:	80 3d 35 5d 00 00 00 	cmpb   $0x0,0x5d35(%rip)        # 7040 <__TMC_END__>
+    130b:	75 2b                	jne    1338 <__do_global_dtors_aux+0x38>
+    130d:	55                   	push   %rbp
+    130e:	48 83 3d ca 2c 00 00 	cmpq   $0x0,0x2cca(%rip)        # 3fe0 <__cxa_finalize@GLIBC_2.2.5>
+    1315:	00 
+    1316:	48 89 e5             	mov    %rsp,%rbp
+    1319:	74 0c                	je     1327 <__do_global_dtors_aux+0x27>
+    131b:	48 8b 3d fe 2c 00 00 	mov    0x2cfe(%rip),%rdi        # 4020 <__dso_handle>
+    1322:	e8 39 fd ff ff       	call   1060 <__cxa_finalize@plt>
+    1327:	e8 64 ff ff ff       	call   1290 <deregister_tm_clones>
+    132c:	c6 05 0d 5d 00 00 01 	movb   $0x1,0x5d0d(%rip)        # 7040 <__TMC_END__>
+    1333:	5d                   	pop    %rbp
+    1334:	c3                   	ret
+    1335:	0f 1f 00             	nopl   (%rax)
+    1338:	c3                   	ret
+    1339:	0f 1f 80 00 00 00 00 	nopl   0x0(%rax)
+
+0000000000001340 <frame_dummy>:
+    1340:	f3 0f 1e fa          	endbr64
+    1344:	e9 77 ff ff ff       	jmp    12c0 <register_tm_clones>
+
+Disassembly of section .fini:
+
+000000000000134c <_fini>:
+    134c:	48 83 ec 08          	sub    $0x8,%rsp
+    1350:	48 83 c4 08          	add    $0x8,%rsp
+    1354:	c3                   	ret
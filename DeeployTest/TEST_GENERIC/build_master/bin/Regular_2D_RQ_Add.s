@@ -0,0 +1,663 @@
+
+/root/package/DeeployTest/TEST_GENERIC/build_master/bin/Regular_2D_RQ_Add:     file format elf64-x86-64
+
+Sections:
+Idx Name          Size      VMA               LMA               File off  Algn
+  0 .interp       0000001c  0000000000000318  0000000000000318  00000318  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+  1 .note.gnu.property 00000020  0000000000000338  0000000000000338  00000338  2**3
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+  2 .note.gnu.build-id 00000024  0000000000000358  0000000000000358  00000358  2**2
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+  3 .note.ABI-tag 00000020  000000000000037c  000000000000037c  0000037c  2**2
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+  4 .gnu.hash     00000024  00000000000003a0  00000000000003a0  000003a0  2**3
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+  5 .dynsym       00000108  00000000000003c8  00000000000003c8  000003c8  2**3
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+  6 .dynstr       0000013e  00000000000004d0  00000000000004d0  000004d0  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+  7 .gnu.version  00000016  000000000000060e  000000000000060e  0000060e  2**1
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+  8 .gnu.version_r 00000030  0000000000000628  0000000000000628  00000628  2**3
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+  9 .rela.dyn     000000c0  0000000000000658  0000000000000658  00000658  2**3
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+ 10 .rela.plt     00000078  0000000000000718  0000000000000718  00000718  2**3
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+ 11 .init         00000017  0000000000001000  0000000000001000  00001000  2**2
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+ 12 .plt          00000060  0000000000001020  0000000000001020  00001020  2**4
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+ 13 .plt.got      00000008  0000000000001080  0000000000001080  00001080  2**3
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+ 14 .text         0000063b  0000000000001090  0000000000001090  00001090  2**4
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+ 15 .fini         00000009  00000000000016cc  00000000000016cc  000016cc  2**2
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+ 16 .rodata       000001a0  0000000000002000  0000000000002000  00002000  2**5
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+ 17 .eh_frame_hdr 00000034  00000000000021a0  00000000000021a0  000021a0  2**2
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+ 18 .eh_frame     0000011c  00000000000021d8  00000000000021d8  000021d8  2**3
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+ 19 .init_array   00000008  0000000000003dc0  0000000000003dc0  00002dc0  2**3
+                  CONTENTS, ALLOC, LOAD, DATA
+ 20 .fini_array   00000008  0000000000003dc8  0000000000003dc8  00002dc8  2**3
+                  CONTENTS, ALLOC, LOAD, DATA
+ 21 .dynamic      000001f0  0000000000003dd0  0000000000003dd0  00002dd0  2**3
+                  CONTENTS, ALLOC, LOAD, DATA
+ 22 .got          00000028  0000000000003fc0  0000000000003fc0  00002fc0  2**3
+                  CONTENTS, ALLOC, LOAD, DATA
+ 23 .got.plt      00000040  0000000000003fe8  0000000000003fe8  00002fe8  2**3
+                  CONTENTS, ALLOC, LOAD, DATA
+ 24 .data         00000de0  0000000000004040  0000000000004040  00003040  2**5
+                  CONTENTS, ALLOC, LOAD, DATA
+ 25 .bss          00000040  0000000000004e20  0000000000004e20  00003e20  2**4
+                  ALLOC
+ 26 .comment      00000027  0000000000000000  0000000000000000  00003e20  2**0
+                  CONTENTS, READONLY
+ 27 .debug_aranges 00000040  0000000000000000  0000000000000000  00003e47  2**0
+                  CONTENTS, READONLY, DEBUGGING, OCTETS
+ 28 .debug_info   00001eef  0000000000000000  0000000000000000  00003e87  2**0
+                  CONTENTS, READONLY, DEBUGGING, OCTETS
+ 29 .debug_abbrev 00000653  0000000000000000  0000000000000000  00005d76  2**0
+                  CONTENTS, READONLY, DEBUGGING, OCTETS
+ 30 .debug_line   00000584  0000000000000000  0000000000000000  000063c9  2**0
+                  CONTENTS, READONLY, DEBUGGING, OCTETS
+ 31 .debug_str    00000afd  0000000000000000  0000000000000000  0000694d  2**0
+                  CONTENTS, READONLY, DEBUGGING, OCTETS
+ 32 .debug_line_str 00000427  0000000000000000  0000000000000000  0000744a  2**0
+                  CONTENTS, READONLY, DEBUGGING, OCTETS
+ 33 .debug_loclists 000009c1  0000000000000000  0000000000000000  00007871  2**0
+                  CONTENTS, READONLY, DEBUGGING, OCTETS
+ 34 .debug_rnglists 000001fe  0000000000000000  0000000000000000  00008232  2**0
+                  CONTENTS, READONLY, DEBUGGING, OCTETS
+
+Disassembly of section .init:
+
+0000000000001000 <_init>:
+    1000:	48 83 ec 08          	sub    $0x8,%rsp
+    1004:	48 8b 05 c5 2f 00 00 	mov    0x2fc5(%rip),%rax        # 3fd0 <__gmon_start__@Base>
+    100b:	48 85 c0             	test   %rax,%rax
+    100e:	74 02                	je     1012 <_init+0x12>
+    1010:	ff d0                	call   *%rax
+    1012:	48 83 c4 08          	add    $0x8,%rsp
+    1016:	c3                   	ret
+
+Disassembly of section .plt:
+
+0000000000001020 <free@plt-0x10>:
+    1020:	ff 35 ca 2f 00 00    	push   0x2fca(%rip)        # 3ff0 <_GLOBAL_OFFSET_TABLE_+0x8>
+    1026:	ff 25 cc 2f 00 00    	jmp    *0x2fcc(%rip)        # 3ff8 <_GLOBAL_OFFSET_TABLE_+0x10>
+    102c:	0f 1f 40 00          	nopl   0x0(%rax)
+
+0000000000001030 <free@plt>:
+    1030:	ff 25 ca 2f 00 00    	jmp    *0x2fca(%rip)        # 4000 <free@GLIBC_2.2.5>
+    1036:	68 00 00 00 00       	push   $0x0
+    103b:	e9 e0 ff ff ff       	jmp    1020 <_init+0x20>
+
+0000000000001040 <puts@plt>:
+    1040:	ff 25 c2 2f 00 00    	jmp    *0x2fc2(%rip)        # 4008 <puts@GLIBC_2.2.5>
+    1046:	68 01 00 00 00       	push   $0x1
+    104b:	e9 d0 ff ff ff       	jmp    1020 <_init+0x20>
+
+0000000000001050 <printf@plt>:
+    1050:	ff 25 ba 2f 00 00    	jmp    *0x2fba(%rip)        # 4010 <printf@GLIBC_2.2.5>
+    1056:	68 02 00 00 00       	push   $0x2
+    105b:	e9 c0 ff ff ff       	jmp    1020 <_init+0x20>
+
+0000000000001060 <calloc@plt>:
+    1060:	ff 25 b2 2f 00 00    	jmp    *0x2fb2(%rip)        # 4018 <calloc@GLIBC_2.2.5>
+    1066:	68 03 00 00 00       	push   $0x3
+    106b:	e9 b0 ff ff ff       	jmp    1020 <_init+0x20>
+
+0000000000001070 <malloc@plt>:
+    1070:	ff 25 aa 2f 00 00    	jmp    *0x2faa(%rip)        # 4020 <malloc@GLIBC_2.2.5>
+    1076:	68 04 00 00 00       	push   $0x4
+    107b:	e9 a0 ff ff ff       	jmp    1020 <_init+0x20>
+
+Disassembly of section .plt.got:
+
+0000000000001080 <__cxa_finalize@plt>:
+    1080:	ff 25 5a 2f 00 00    	jmp    *0x2f5a(%rip)        # 3fe0 <__cxa_finalize@GLIBC_2.2.5>
+    1086:	66 90                	xchg   %ax,%ax
+
+Disassembly of section .text:
+
+0000000000001090 <main>:
+
+#include "Network.h"
+#include "testinputs.h"
+#include "testoutputs.h"
+
+int main() {
+    1090:	41 57                	push   %r15
+
+  printf("Initializing network...\r\n");
+    1092:	48 8d 3d 67 0f 00 00 	lea    0xf67(%rip),%rdi        # 2000 <_fini+0x934>
+int main() {
+    1099:	41 56                	push   %r14
+    109b:	41 55                	push   %r13
+    109d:	41 54                	push   %r12
+    109f:	55                   	push   %rbp
+    10a0:	53                   	push   %rbx
+    10a1:	48 83 ec 08          	sub    $0x8,%rsp
+  printf("Initializing network...\r\n");
+    10a5:	e8 96 ff ff ff       	call   1040 <puts@plt>
+  va_start(args, fmt);
+  int ret = vprintf(fmt, args);
+  va_end(args);
+  return ret;
+}
+void *deeploy_malloc(const size_t size) { return malloc(size); }
+    10aa:	bf 00 02 00 00       	mov    $0x200,%edi
+    10af:	e8 bc ff ff ff       	call   1070 <malloc@plt>
+    10b4:	bf 00 01 00 00       	mov    $0x100,%edi
+    10b9:	48 89 c5             	mov    %rax,%rbp
+}
+
+        }
+        
+        void InitNetwork(__attribute__((unused)) uint32_t core_id, __attribute__((unused)) uint32_t numThreads){
+        DeeployNetwork_input_0 = (int8_t*) deeploy_malloc(1 * 512);
+    10bc:	48 89 05 7d 3d 00 00 	mov    %rax,0x3d7d(%rip)        # 4e40 <DeeployNetwork_input_0>
+    10c3:	e8 a8 ff ff ff       	call   1070 <malloc@plt>
+    10c8:	bf 00 04 00 00       	mov    $0x400,%edi
+    10cd:	48 89 c3             	mov    %rax,%rbx
+DeeployNetwork_input_1 = (int8_t*) deeploy_malloc(1 * 256);
+    10d0:	48 89 05 61 3d 00 00 	mov    %rax,0x3d61(%rip)        # 4e38 <DeeployNetwork_input_1>
+    10d7:	e8 94 ff ff ff       	call   1070 <malloc@plt>
+
+  InitNetwork(0, 1);
+
+  for (uint32_t buf = 0; buf < DeeployNetwork_num_inputs; buf++) {
+    memcpy(DeeployNetwork_inputs[buf], testInputVector[buf],
+    10dc:	66 0f 6f 05 7c 33 00 	movdqa 0x337c(%rip),%xmm0        # 4460 <testInputVector1>
+    10e3:	00 
+    10e4:	48 89 ef             	mov    %rbp,%rdi
+    10e7:	66 0f 6f 0d 81 33 00 	movdqa 0x3381(%rip),%xmm1        # 4470 <testInputVector1+0x10>
+    10ee:	00 
+    10ef:	66 0f 6f 15 89 33 00 	movdqa 0x3389(%rip),%xmm2        # 4480 <testInputVector1+0x20>
+    10f6:	00 
+    10f7:	66 0f 6f 1d 91 33 00 	movdqa 0x3391(%rip),%xmm3        # 4490 <testInputVector1+0x30>
+    10fe:	00 
+DeeployNetwork_output_0 = (int8_t*) deeploy_malloc(1 * 1024);
+    10ff:	48 89 05 2a 3d 00 00 	mov    %rax,0x3d2a(%rip)        # 4e30 <DeeployNetwork_output_0>
+    1106:	48 8d 35 53 34 00 00 	lea    0x3453(%rip),%rsi        # 4560 <testInputVector0>
+    110d:	66 0f 6f 25 8b 33 00 	movdqa 0x338b(%rip),%xmm4        # 44a0 <testInputVector1+0x40>
+    1114:	00 
+    1115:	0f 11 03             	movups %xmm0,(%rbx)
+    1118:	b9 40 00 00 00       	mov    $0x40,%ecx
+    111d:	66 0f 6f 05 bb 33 00 	movdqa 0x33bb(%rip),%xmm0        # 44e0 <testInputVector1+0x80>
+    1124:	00 
+    1125:	66 0f 6f 35 93 33 00 	movdqa 0x3393(%rip),%xmm6        # 44c0 <testInputVector1+0x60>
+    112c:	00 
+    112d:	66 0f 6f 3d 9b 33 00 	movdqa 0x339b(%rip),%xmm7        # 44d0 <testInputVector1+0x70>
+    1134:	00 
+    1135:	0f 11 4b 10          	movups %xmm1,0x10(%rbx)
+    1139:	66 0f 6f 2d 6f 33 00 	movdqa 0x336f(%rip),%xmm5        # 44b0 <testInputVector1+0x50>
+    1140:	00 
+    1141:	66 0f 6f 0d a7 33 00 	movdqa 0x33a7(%rip),%xmm1        # 44f0 <testInputVector1+0x90>
+    1148:	00 
+    1149:	0f 11 53 20          	movups %xmm2,0x20(%rbx)
+    114d:	f3 48 a5             	rep movsq %ds:(%rsi),%es:(%rdi)
+    1150:	66 0f 6f 15 a8 33 00 	movdqa 0x33a8(%rip),%xmm2        # 4500 <testInputVector1+0xa0>
+    1157:	00 
+    1158:	0f 11 5b 30          	movups %xmm3,0x30(%rbx)
+    115c:	66 0f 6f 1d ac 33 00 	movdqa 0x33ac(%rip),%xmm3        # 4510 <testInputVector1+0xb0>
+    1163:	00 
+    1164:	0f 11 63 40          	movups %xmm4,0x40(%rbx)
+    1168:	66 0f 6f 25 b0 33 00 	movdqa 0x33b0(%rip),%xmm4        # 4520 <testInputVector1+0xc0>
+    116f:	00 
+           DeeployNetwork_inputs_bytes[buf]);
+  }
+
+  printf("Running network...\r\n");
+    1170:	48 8d 3d a2 0e 00 00 	lea    0xea2(%rip),%rdi        # 2019 <_fini+0x94d>
+    memcpy(DeeployNetwork_inputs[buf], testInputVector[buf],
+    1177:	0f 11 83 80 00 00 00 	movups %xmm0,0x80(%rbx)
+    117e:	0f 11 8b 90 00 00 00 	movups %xmm1,0x90(%rbx)
+    1185:	0f 11 93 a0 00 00 00 	movups %xmm2,0xa0(%rbx)
+    118c:	0f 11 9b b0 00 00 00 	movups %xmm3,0xb0(%rbx)
+    1193:	0f 11 a3 c0 00 00 00 	movups %xmm4,0xc0(%rbx)
+DeeployNetwork_inputs[0] = (void*) DeeployNetwork_input_0;DeeployNetwork_inputs[1] = (void*) DeeployNetwork_input_1;DeeployNetwork_outputs[0] = (void*) DeeployNetwork_output_0;
+    119a:	48 89 05 a7 3c 00 00 	mov    %rax,0x3ca7(%rip)        # 4e48 <DeeployNetwork_outputs>
+    11a1:	0f 11 73 60          	movups %xmm6,0x60(%rbx)
+    11a5:	0f 11 7b 70          	movups %xmm7,0x70(%rbx)
+    11a9:	48 89 2d a0 3c 00 00 	mov    %rbp,0x3ca0(%rip)        # 4e50 <DeeployNetwork_inputs>
+    11b0:	48 89 1d a1 3c 00 00 	mov    %rbx,0x3ca1(%rip)        # 4e58 <DeeployNetwork_inputs+0x8>
+    11b7:	0f 11 6b 50          	movups %xmm5,0x50(%rbx)
+    11bb:	66 0f 6f 2d 6d 33 00 	movdqa 0x336d(%rip),%xmm5        # 4530 <testInputVector1+0xd0>
+    11c2:	00 
+    11c3:	66 0f 6f 35 75 33 00 	movdqa 0x3375(%rip),%xmm6        # 4540 <testInputVector1+0xe0>
+    11ca:	00 
+    11cb:	66 0f 6f 3d 7d 33 00 	movdqa 0x337d(%rip),%xmm7        # 4550 <testInputVector1+0xf0>
+    11d2:	00 
+    11d3:	0f 11 ab d0 00 00 00 	movups %xmm5,0xd0(%rbx)
+    11da:	0f 11 b3 e0 00 00 00 	movups %xmm6,0xe0(%rbx)
+    11e1:	0f 11 bb f0 00 00 00 	movups %xmm7,0xf0(%rbx)
+  printf("Running network...\r\n");
+    11e8:	e8 53 fe ff ff       	call   1040 <puts@plt>
+    11ed:	bf 20 03 00 00       	mov    $0x320,%edi
+    11f2:	be 01 00 00 00       	mov    $0x1,%esi
+    11f7:	e8 64 fe ff ff       	call   1060 <calloc@plt>
+                memcpy(DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input + xoffset_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0, DeeployNetwork_input_0+offset_in_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0, 8*sizeof(int8_t));
+    11fc:	4c 8b 05 3d 3c 00 00 	mov    0x3c3d(%rip),%r8        # 4e40 <DeeployNetwork_input_0>
+    1203:	bf 5b 00 00 00       	mov    $0x5b,%edi
+    1208:	45 31 c9             	xor    %r9d,%r9d
+    120b:	49 89 c4             	mov    %rax,%r12
+    120e:	66 90                	xchg   %ax,%ax
+    1210:	8d 47 b0             	lea    -0x50(%rdi),%eax
+int main() {
+    1213:	44 89 ca             	mov    %r9d,%edx
+    1216:	66 2e 0f 1f 84 00 00 	cs nopw 0x0(%rax,%rax,1)
+    121d:	00 00 00 
+    1220:	89 d6                	mov    %edx,%esi
+    1222:	89 c1                	mov    %eax,%ecx
+                xoffset_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0 += 10;
+    1224:	83 c0 0a             	add    $0xa,%eax
+                offset_in_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0 += 8;
+    1227:	83 c2 08             	add    $0x8,%edx
+                memcpy(DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input + xoffset_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0, DeeployNetwork_input_0+offset_in_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0, 8*sizeof(int8_t));
+    122a:	49 8b 34 30          	mov    (%r8,%rsi,1),%rsi
+    122e:	49 89 34 0c          	mov    %rsi,(%r12,%rcx,1)
+            for(uint32_t h=0; h<8; h++){
+    1232:	39 f8                	cmp    %edi,%eax
+    1234:	75 ea                	jne    1220 <Convolution_s8.c.c18aab41+0x92>
+                offset_in_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0 += 8;
+    1236:	41 83 c1 40          	add    $0x40,%r9d
+        for (uint32_t c=0; c<8; ++c) {
+    123a:	8d 78 64             	lea    0x64(%rax),%edi
+    123d:	41 81 f9 00 02 00 00 	cmp    $0x200,%r9d
+    1244:	75 ca                	jne    1210 <Convolution_s8.c.c18aab41+0x82>
+    1246:	bf 90 01 00 00       	mov    $0x190,%edi
+    124b:	be 01 00 00 00       	mov    $0x1,%esi
+    1250:	e8 0b fe ff ff       	call   1060 <calloc@plt>
+                memcpy(DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input + xoffset_DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input_DeeployNetwork_input_1, DeeployNetwork_input_1+offset_in_DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input_DeeployNetwork_input_1, 8*sizeof(int8_t));
+    1255:	4c 8b 05 dc 3b 00 00 	mov    0x3bdc(%rip),%r8        # 4e38 <DeeployNetwork_input_1>
+    125c:	bf 5b 00 00 00       	mov    $0x5b,%edi
+    1261:	45 31 c9             	xor    %r9d,%r9d
+    1264:	48 89 c3             	mov    %rax,%rbx
+    1267:	8d 47 b0             	lea    -0x50(%rdi),%eax
+                memcpy(DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input + xoffset_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0, DeeployNetwork_input_0+offset_in_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0, 8*sizeof(int8_t));
+    126a:	44 89 ca             	mov    %r9d,%edx
+    126d:	0f 1f 00             	nopl   (%rax)
+                memcpy(DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input + xoffset_DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input_DeeployNetwork_input_1, DeeployNetwork_input_1+offset_in_DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input_DeeployNetwork_input_1, 8*sizeof(int8_t));
+    1270:	89 d6                	mov    %edx,%esi
+    1272:	89 c1                	mov    %eax,%ecx
+                xoffset_DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input_DeeployNetwork_input_1 += 10;
+    1274:	83 c0 0a             	add    $0xa,%eax
+                offset_in_DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input_DeeployNetwork_input_1 += 8;
+    1277:	83 c2 08             	add    $0x8,%edx
+                memcpy(DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input + xoffset_DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input_DeeployNetwork_input_1, DeeployNetwork_input_1+offset_in_DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input_DeeployNetwork_input_1, 8*sizeof(int8_t));
+    127a:	49 8b 34 30          	mov    (%r8,%rsi,1),%rsi
+    127e:	48 89 34 0b          	mov    %rsi,(%rbx,%rcx,1)
+            for(uint32_t h=0; h<8; h++){
+    1282:	39 c7                	cmp    %eax,%edi
+    1284:	75 ea                	jne    1270 <Convolution_s8.c.c18aab41+0xe2>
+                offset_in_DeeployNetwork__EXTRACT_CONV_PASS_1_padded_input_DeeployNetwork_input_1 += 8;
+    1286:	41 83 c1 40          	add    $0x40,%r9d
+        for (uint32_t c=0; c<4; ++c) {
+    128a:	83 c7 64             	add    $0x64,%edi
+    128d:	41 81 f9 00 01 00 00 	cmp    $0x100,%r9d
+    1294:	75 d1                	jne    1267 <Convolution_s8.c.c18aab41+0xd9>
+    1296:	bf 00 10 00 00       	mov    $0x1000,%edi
+        DeeployNetwork_output_0[i] = (int8_t) (t3);
+    129b:	41 bd c1 e9 ff ff    	mov    $0xffffe9c1,%r13d
+    12a1:	e8 ca fd ff ff       	call   1070 <malloc@plt>
+        Conv2d_s8_s8_s32_NCHW(
+    12a6:	48 8d 15 33 39 00 00 	lea    0x3933(%rip),%rdx        # 4be0 <DeeployNetwork_skip_weight_tensor>
+    12ad:	be 04 00 00 00       	mov    $0x4,%esi
+    12b2:	48 89 df             	mov    %rbx,%rdi
+    12b5:	48 89 c1             	mov    %rax,%rcx
+    12b8:	48 89 c5             	mov    %rax,%rbp
+    12bb:	e8 c0 02 00 00       	call   1580 <Conv2d_s8_s8_s32_NCHW.constprop.0>
+void deeploy_free(void *const ptr) { free(ptr); }
+    12c0:	48 89 df             	mov    %rbx,%rdi
+    12c3:	e8 68 fd ff ff       	call   1030 <free@plt>
+void *deeploy_malloc(const size_t size) { return malloc(size); }
+    12c8:	bf 00 10 00 00       	mov    $0x1000,%edi
+    12cd:	e8 9e fd ff ff       	call   1070 <malloc@plt>
+        Conv2d_s8_s8_s32_NCHW(
+    12d2:	48 8d 15 87 34 00 00 	lea    0x3487(%rip),%rdx        # 4760 <DeeployNetwork_weight_tensor>
+    12d9:	be 08 00 00 00       	mov    $0x8,%esi
+    12de:	4c 89 e7             	mov    %r12,%rdi
+    12e1:	48 89 c1             	mov    %rax,%rcx
+    12e4:	48 89 c3             	mov    %rax,%rbx
+    12e7:	e8 94 02 00 00       	call   1580 <Conv2d_s8_s8_s32_NCHW.constprop.0>
+void deeploy_free(void *const ptr) { free(ptr); }
+    12ec:	4c 89 e7             	mov    %r12,%rdi
+        DeeployNetwork_output_0[i] = (int8_t) (t3);
+    12ef:	41 bc 47 d4 ff ff    	mov    $0xffffd447,%r12d
+    12f5:	e8 36 fd ff ff       	call   1030 <free@plt>
+    12fa:	b9 01 00 00 00       	mov    $0x1,%ecx
+    12ff:	41 bb 1f 01 00 00    	mov    $0x11f,%r11d
+    1305:	48 8b 35 24 3b 00 00 	mov    0x3b24(%rip),%rsi        # 4e30 <DeeployNetwork_output_0>
+    130c:	ba 4f 01 00 00       	mov    $0x14f,%edx
+        int32_t x2 = (int32_t) DeeployNetwork_rqs_convmul_tensor[((i / (8 * 8)) % 16)];
+    1311:	4c 8d 15 48 0e 00 00 	lea    0xe48(%rip),%r10        # 2160 <DeeployNetwork_rqs_convmul_tensor>
+        int32_t x3 = (int32_t) DeeployNetwork_rqs_convadd_tensor[((i / (8 * 8)) % 16)];
+    1318:	4c 8d 0d 01 0e 00 00 	lea    0xe01(%rip),%r9        # 2120 <DeeployNetwork_rqs_convadd_tensor>
+        int32_t x4 = (int32_t) DeeployNetwork_skip_rqs_convmul_tensor[((i / (8 * 8)) % 16)];
+    131f:	4c 8d 05 ba 0d 00 00 	lea    0xdba(%rip),%r8        # 20e0 <DeeployNetwork_skip_rqs_convmul_tensor>
+        int32_t x5 = (int32_t) DeeployNetwork_skip_rqs_convadd_tensor[((i / (8 * 8)) % 16)];
+    1326:	48 8d 3d 73 0d 00 00 	lea    0xd73(%rip),%rdi        # 20a0 <DeeployNetwork_skip_rqs_convadd_tensor>
+    132d:	eb 14                	jmp    1343 <Util.c.3747f75c+0x5>
+    132f:	90                   	nop
+        int32_t x2 = (int32_t) DeeployNetwork_rqs_convmul_tensor[((i / (8 * 8)) % 16)];
+    1330:	c1 e8 06             	shr    $0x6,%eax
+    1333:	41 8b 14 82          	mov    (%r10,%rax,4),%edx
+        int32_t x3 = (int32_t) DeeployNetwork_rqs_convadd_tensor[((i / (8 * 8)) % 16)];
+    1337:	45 8b 2c 81          	mov    (%r9,%rax,4),%r13d
+        int32_t x4 = (int32_t) DeeployNetwork_skip_rqs_convmul_tensor[((i / (8 * 8)) % 16)];
+    133b:	45 8b 1c 80          	mov    (%r8,%rax,4),%r11d
+        int32_t x5 = (int32_t) DeeployNetwork_skip_rqs_convadd_tensor[((i / (8 * 8)) % 16)];
+    133f:	44 8b 24 87          	mov    (%rdi,%rax,4),%r12d
+        int32_t t0 = (x0 * x2 + x3 + 32768) >> 16;
+    1343:	0f af 54 8b fc       	imul   -0x4(%rbx,%rcx,4),%edx
+    1348:	41 8d 84 15 00 80 00 	lea    0x8000(%r13,%rdx,1),%eax
+    134f:	00 
+        t0 = CLAMP(t0, -128, 127);
+    1350:	ba 80 ff ff ff       	mov    $0xffffff80,%edx
+        int32_t t0 = (x0 * x2 + x3 + 32768) >> 16;
+    1355:	c1 f8 10             	sar    $0x10,%eax
+        t0 = CLAMP(t0, -128, 127);
+    1358:	39 d0                	cmp    %edx,%eax
+    135a:	0f 4c c2             	cmovl  %edx,%eax
+        int32_t t2 = t0 + t1;
+    135d:	ba 7f 00 00 00       	mov    $0x7f,%edx
+    1362:	39 d0                	cmp    %edx,%eax
+    1364:	0f 4f c2             	cmovg  %edx,%eax
+        int32_t t1 = (x1 * x4 + x5 + 32768) >> 16;
+    1367:	44 0f af 5c 8d fc    	imul   -0x4(%rbp,%rcx,4),%r11d
+    136d:	43 8d 94 1c 00 80 00 	lea    0x8000(%r12,%r11,1),%edx
+    1374:	00 
+        t1 = CLAMP(t1, -128, 127);
+    1375:	41 bb 80 ff ff ff    	mov    $0xffffff80,%r11d
+        int32_t t1 = (x1 * x4 + x5 + 32768) >> 16;
+    137b:	c1 fa 10             	sar    $0x10,%edx
+        t1 = CLAMP(t1, -128, 127);
+    137e:	44 39 da             	cmp    %r11d,%edx
+    1381:	41 0f 4c d3          	cmovl  %r11d,%edx
+        int32_t t2 = t0 + t1;
+    1385:	41 bb 7f 00 00 00    	mov    $0x7f,%r11d
+    138b:	44 39 da             	cmp    %r11d,%edx
+    138e:	41 0f 4f d3          	cmovg  %r11d,%edx
+    1392:	01 d0                	add    %edx,%eax
+        t3 = CLAMP(t3, -128, 127);
+    1394:	ba 80 ff ff ff       	mov    $0xffffff80,%edx
+        int32_t t3 = (t2 * x6 + x7 + 2) >> 2;
+    1399:	8d 44 40 02          	lea    0x2(%rax,%rax,2),%eax
+    139d:	c1 f8 02             	sar    $0x2,%eax
+        t3 = CLAMP(t3, -128, 127);
+    13a0:	39 d0                	cmp    %edx,%eax
+    13a2:	0f 4c c2             	cmovl  %edx,%eax
+        DeeployNetwork_output_0[i] = (int8_t) (t3);
+    13a5:	ba 7f 00 00 00       	mov    $0x7f,%edx
+    13aa:	39 d0                	cmp    %edx,%eax
+    13ac:	0f 4f c2             	cmovg  %edx,%eax
+    13af:	88 44 0e ff          	mov    %al,-0x1(%rsi,%rcx,1)
+    13b3:	89 c8                	mov    %ecx,%eax
+    for (uint32_t i = 0; i < 1024; i++) {
+    13b5:	48 83 c1 01          	add    $0x1,%rcx
+    13b9:	48 81 f9 01 04 00 00 	cmp    $0x401,%rcx
+    13c0:	0f 85 6a ff ff ff    	jne    1330 <Convolution_s8.c.c18aab41+0x1a2>
+    13c6:	48 89 ef             	mov    %rbp,%rdi
+    13c9:	45 31 e4             	xor    %r12d,%r12d
+    13cc:	4c 8d 2d 8d 2c 00 00 	lea    0x2c8d(%rip),%r13        # 4060 <testOutputVector0>
+    13d3:	e8 58 fc ff ff       	call   1030 <free@plt>
+    13d8:	48 89 df             	mov    %rbx,%rdi
+      }
+#else
+      // RUNWANG: No margin for integer comparison
+      if (diff != 0) {
+        tot_err += 1;
+        printf("Expected: %4d  ", expected);
+    13db:	4c 8d 3d 4b 0c 00 00 	lea    0xc4b(%rip),%r15        # 202d <_fini+0x961>
+    13e2:	31 db                	xor    %ebx,%ebx
+    13e4:	e8 47 fc ff ff       	call   1030 <free@plt>
+         i < DeeployNetwork_outputs_bytes[buf] / sizeof(OUTPUTTYPE); i++) {
+    13e9:	eb 12                	jmp    13fd <Util.c.3747f75c+0xbf>
+    13eb:	0f 1f 44 00 00       	nopl   0x0(%rax,%rax,1)
+    13f0:	48 83 c3 01          	add    $0x1,%rbx
+    13f4:	48 81 fb 00 04 00 00 	cmp    $0x400,%rbx
+    13fb:	74 5c                	je     1459 <Util.c.3747f75c+0x11b>
+      actual = ((OUTPUTTYPE *)DeeployNetwork_outputs[buf])[i];
+    13fd:	48 8b 05 44 3a 00 00 	mov    0x3a44(%rip),%rax        # 4e48 <DeeployNetwork_outputs>
+      expected = ((OUTPUTTYPE *)testOutputVector[buf])[i];
+    1404:	41 0f be 74 1d 00    	movsbl 0x0(%r13,%rbx,1),%esi
+      actual = ((OUTPUTTYPE *)DeeployNetwork_outputs[buf])[i];
+    140a:	0f b6 2c 18          	movzbl (%rax,%rbx,1),%ebp
+      if (diff != 0) {
+    140e:	41 89 f6             	mov    %esi,%r14d
+    1411:	41 28 ee             	sub    %bpl,%r14b
+    1414:	74 da                	je     13f0 <Util.c.3747f75c+0xb2>
+        printf("Expected: %4d  ", expected);
+    1416:	4c 89 ff             	mov    %r15,%rdi
+    1419:	31 c0                	xor    %eax,%eax
+        tot_err += 1;
+    141b:	41 83 c4 01          	add    $0x1,%r12d
+        printf("Expected: %4d  ", expected);
+    141f:	e8 2c fc ff ff       	call   1050 <printf@plt>
+        printf("Actual: %4d  ", actual);
+    1424:	40 0f be f5          	movsbl %bpl,%esi
+    1428:	48 8d 3d 0e 0c 00 00 	lea    0xc0e(%rip),%rdi        # 203d <_fini+0x971>
+    142f:	31 c0                	xor    %eax,%eax
+    1431:	e8 1a fc ff ff       	call   1050 <printf@plt>
+        printf("Diff: %4d at Index %12u in Output %u\r\n", diff, i, buf);
+    1436:	89 da                	mov    %ebx,%edx
+    1438:	41 0f be f6          	movsbl %r14b,%esi
+    143c:	31 c9                	xor    %ecx,%ecx
+    143e:	48 8d 3d 23 0c 00 00 	lea    0xc23(%rip),%rdi        # 2068 <_fini+0x99c>
+    1445:	31 c0                	xor    %eax,%eax
+         i < DeeployNetwork_outputs_bytes[buf] / sizeof(OUTPUTTYPE); i++) {
+    1447:	48 83 c3 01          	add    $0x1,%rbx
+        printf("Diff: %4d at Index %12u in Output %u\r\n", diff, i, buf);
+    144b:	e8 00 fc ff ff       	call   1050 <printf@plt>
+         i < DeeployNetwork_outputs_bytes[buf] / sizeof(OUTPUTTYPE); i++) {
+    1450:	48 81 fb 00 04 00 00 	cmp    $0x400,%rbx
+    1457:	75 a4                	jne    13fd <Util.c.3747f75c+0xbf>
+      }
+#endif
+    }
+  }
+
+  printf("Errors: %d out of %d \r\n", tot_err, tot);
+    1459:	44 89 e6             	mov    %r12d,%esi
+    145c:	ba 00 04 00 00       	mov    $0x400,%edx
+    1461:	48 8d 3d e3 0b 00 00 	lea    0xbe3(%rip),%rdi        # 204b <_fini+0x97f>
+    1468:	31 c0                	xor    %eax,%eax
+    146a:	e8 e1 fb ff ff       	call   1050 <printf@plt>
+
+  return tot_err;
+    146f:	48 83 c4 08          	add    $0x8,%rsp
+    1473:	44 89 e0             	mov    %r12d,%eax
+    1476:	5b                   	pop    %rbx
+    1477:	5d                   	pop    %rbp
+    1478:	41 5c                	pop    %r12
+    147a:	41 5d                	pop    %r13
+    147c:	41 5e                	pop    %r14
+    147e:	41 5f                	pop    %r15
+    1480:	c3                   	ret
+    1481:	66 2e 0f 1f 84 00 00 	cs nopw 0x0(%rax,%rax,1)
+    1488:	00 00 00 
+    148b:	0f 1f 44 00 00       	nopl   0x0(%rax,%rax,1)
+
+0000000000001490 <_start>:
+    1490:	31 ed                	xor    %ebp,%ebp
+    1492:	49 89 d1             	mov    %rdx,%r9
+    1495:	5e                   	pop    %rsi
+    1496:	48 89 e2             	mov    %rsp,%rdx
+    1499:	48 83 e4 f0          	and    $0xfffffffffffffff0,%rsp
+    149d:	50                   	push   %rax
+    149e:	54                   	push   %rsp
+    149f:	45 31 c0             	xor    %r8d,%r8d
+    14a2:	31 c9                	xor    %ecx,%ecx
+    14a4:	48 8d 3d e5 fb ff ff 	lea    -0x41b(%rip),%rdi        # 1090 <main>
+    14ab:	ff 15 0f 2b 00 00    	call   *0x2b0f(%rip)        # 3fc0 <__libc_start_main@GLIBC_2.34>
+    14b1:	f4                   	hlt
+    14b2:	66 2e 0f 1f 84 00 00 	cs nopw 0x0(%rax,%rax,1)
+    14b9:	00 00 00 
+    14bc:	0f 1f 40 00          	nopl   0x0(%rax)
+
+00000000000014c0 <deregister_tm_clones>:
+    14c0:	48 8d 3d 59 39 00 00 	lea    0x3959(%rip),%rdi        # 4e20 <__TMC_END__>
+    14c7:	48 8d 05 52 39 00 00 	lea    0x3952(%rip),%rax        # 4e20 <__TMC_END__>
+    14ce:	48 39 f8             	cmp    %rdi,%rax
+    14d1:	74 15                	je     14e8 <deregister_tm_clones+0x28>
+    14d3:	48 8b 05 ee 2a 00 00 	mov    0x2aee(%rip),%rax        # 3fc8 <_ITM_deregisterTMCloneTable@Base>
+    14da:	48 85 c0             	test   %rax,%rax
+    14dd:	74 09                	je     14e8 <deregister_tm_clones+0x28>
+    14df:	ff e0                	jmp    *%rax
+    14e1:	0f 1f 80 00 00 00 00 	nopl   0x0(%rax)
+    14e8:	c3                   	ret
+    14e9:	0f 1f 80 00 00 00 00 	nopl   0x0(%rax)
+
+00000000000014f0 <register_tm_clones>:
+    14f0:	48 8d 3d 29 39 00 00 	lea    0x3929(%rip),%rdi        # 4e20 <__TMC_END__>
+    14f7:	48 8d 35 22 39 00 00 	lea    0x3922(%rip),%rsi        # 4e20 <__TMC_END__>
+    14fe:	48 29 fe             	sub    %rdi,%rsi
+    1501:	48 89 f0             	mov    %rsi,%rax
+    1504:	48 c1 ee 3f          	shr    $0x3f,%rsi
+    1508:	48 c1 f8 03          	sar    $0x3,%rax
+    150c:	48 01 c6             	add    %rax,%rsi
+    150f:	48 d1 fe             	sar    %rsi
+    1512:	74 14                	je     1528 <register_tm_clones+0x38>
+    1514:	48 8b 05 bd 2a 00 00 	mov    0x2abd(%rip),%rax        # 3fd8 <_ITM_registerTMCloneTable@Base>
+    151b:	48 85 c0             	test   %rax,%rax
+    151e:	74 08                	je     1528 <register_tm_clones+0x38>
+    1520:	ff e0                	jmp    *%rax
+    1522:	66 0f 1f 44 00 00    	nopw   0x0(%rax,%rax,1)
+    1528:	c3                   	ret
+    1529:	0f 1f 80 00 00 00 00 	nopl   0x0(%rax)
+
+0000000000001530 <__do_global_dtors_aux>:
+    1530:	f3 0f 1e fa          	endbr64
+    1534:	80 3d e5 38 00 00 00 	cmpb   $0x0,0x38e5(%rip)        # 4e20 <__TMC_END__>
+    153b:	75 2b                	jne    1568 <__do_global_dtors_aux+0x38>
+    153d:	55                   	push   %rbp
+    153e:	48 83 3d 9a 2a 00 00 	cmpq   $0x0,0x2a9a(%rip)        # 3fe0 <__cxa_finalize@GLIBC_2.2.5>
+    1545:	00 
+    1546:	48 89 e5             	mov    %rsp,%rbp
+    1549:	74 0c                	je     1557 <__do_global_dtors_aux+0x27>
+    154b:	48 8b 3d ee 2a 00 00 	mov    0x2aee(%rip),%rdi        # 4040 <__dso_handle>
+    1552:	e8 29 fb ff ff       	call   1080 <__cxa_finalize@plt>
+    1557:	e8 64 ff ff ff       	call   14c0 <deregister_tm_clones>
+    155c:	c6 05 bd 38 00 00 01 	movb   $0x1,0x38bd(%rip)        # 4e20 <__TMC_END__>
+    1563:	5d                   	pop    %rbp
+    1564:	c3                   	ret
+    1565:	0f 1f 00             	nopl   (%rax)
+    1568:	c3                   	ret
+    1569:	0f 1f 80 00 00 00 00 	nopl   0x0(%rax)
+
+0000000000001570 <frame_dummy>:
+    1570:	f3 0f 1e fa          	endbr64
+    1574:	e9 77 ff ff ff       	jmp    14f0 <register_tm_clones>
+    1579:	0f 1f 80 00 00 00 00 	nopl   0x0(%rax)
+
+0000000000001580 <Conv2d_s8_s8_s32_NCHW.constprop.0>:
+    1580:	41 57                	push   %r15
+    1582:	49 89 c9             	mov    %rcx,%r9
+    1585:	31 c9                	xor    %ecx,%ecx
+    1587:	41 89 f0             	mov    %esi,%r8d
+    158a:	41 56                	push   %r14
+    158c:	89 c8                	mov    %ecx,%eax
+    158e:	41 55                	push   %r13
+    1590:	44 8d 2c f6          	lea    (%rsi,%rsi,8),%r13d
+    1594:	41 54                	push   %r12
+    1596:	45 89 ec             	mov    %r13d,%r12d
+    1599:	55                   	push   %rbp
+    159a:	48 89 fd             	mov    %rdi,%rbp
+    159d:	53                   	push   %rbx
+    159e:	89 44 24 e0          	mov    %eax,-0x20(%rsp)
+    15a2:	4c 89 ce             	mov    %r9,%rsi
+    15a5:	4d 89 ca             	mov    %r9,%r10
+    15a8:	44 8d 3c c0          	lea    (%rax,%rax,8),%r15d
+    15ac:	89 4c 24 dc          	mov    %ecx,-0x24(%rsp)
+    15b0:	45 31 f6             	xor    %r14d,%r14d
+    15b3:	31 ff                	xor    %edi,%edi
+    15b5:	45 89 c1             	mov    %r8d,%r9d
+    15b8:	44 89 e9             	mov    %r13d,%ecx
+    15bb:	8d 04 bf             	lea    (%rdi,%rdi,4),%eax
+    15be:	89 7c 24 e4          	mov    %edi,-0x1c(%rsp)
+    15c2:	48 89 f3             	mov    %rsi,%rbx
+    15c5:	8d 44 00 08          	lea    0x8(%rax,%rax,1),%eax
+    15c9:	89 44 24 d8          	mov    %eax,-0x28(%rsp)
+    15cd:	44 89 f0             	mov    %r14d,%eax
+    15d0:	44 89 64 24 d4       	mov    %r12d,-0x2c(%rsp)
+    15d5:	41 89 c0             	mov    %eax,%r8d
+    15d8:	31 ff                	xor    %edi,%edi
+    15da:	48 89 74 24 f0       	mov    %rsi,-0x10(%rsp)
+    15df:	89 44 24 fc          	mov    %eax,-0x4(%rsp)
+    15e3:	4c 89 54 24 e8       	mov    %r10,-0x18(%rsp)
+    15e8:	49 89 da             	mov    %rbx,%r10
+    15eb:	44 89 74 24 f8       	mov    %r14d,-0x8(%rsp)
+    15f0:	45 89 fe             	mov    %r15d,%r14d
+    15f3:	0f 1f 44 00 00       	nopl   0x0(%rax,%rax,1)
+    15f8:	45 89 f3             	mov    %r14d,%r11d
+    15fb:	44 89 c3             	mov    %r8d,%ebx
+    15fe:	45 89 f5             	mov    %r14d,%r13d
+    1601:	48 01 eb             	add    %rbp,%rbx
+    1604:	49 01 d3             	add    %rdx,%r11
+    1607:	45 8d 76 09          	lea    0x9(%r14),%r14d
+    160b:	0f 1f 44 00 00       	nopl   0x0(%rax,%rax,1)
+    1610:	31 c0                	xor    %eax,%eax
+    1612:	66 0f 1f 44 00 00    	nopw   0x0(%rax,%rax,1)
+    1618:	0f be 34 03          	movsbl (%rbx,%rax,1),%esi
+    161c:	45 0f be 24 03       	movsbl (%r11,%rax,1),%r12d
+    1621:	48 83 c0 01          	add    $0x1,%rax
+    1625:	41 0f af f4          	imul   %r12d,%esi
+    1629:	01 f7                	add    %esi,%edi
+    162b:	48 83 f8 03          	cmp    $0x3,%rax
+    162f:	75 e7                	jne    1618 <Conv2d_s8_s8_s32_NCHW.constprop.0+0x98>
+    1631:	41 83 c5 03          	add    $0x3,%r13d
+    1635:	48 83 c3 0a          	add    $0xa,%rbx
+    1639:	49 83 c3 03          	add    $0x3,%r11
+    163d:	45 39 ee             	cmp    %r13d,%r14d
+    1640:	75 ce                	jne    1610 <Conv2d_s8_s8_s32_NCHW.constprop.0+0x90>
+    1642:	41 83 c0 64          	add    $0x64,%r8d
+    1646:	44 39 74 24 d4       	cmp    %r14d,-0x2c(%rsp)
+    164b:	75 ab                	jne    15f8 <Conv2d_s8_s8_s32_NCHW.constprop.0+0x78>
+    164d:	8b 44 24 fc          	mov    -0x4(%rsp),%eax
+    1651:	4c 89 d3             	mov    %r10,%rbx
+    1654:	44 8b 64 24 d4       	mov    -0x2c(%rsp),%r12d
+    1659:	48 8b 74 24 f0       	mov    -0x10(%rsp),%rsi
+    165e:	44 8b 74 24 f8       	mov    -0x8(%rsp),%r14d
+    1663:	89 3b                	mov    %edi,(%rbx)
+    1665:	48 83 c3 04          	add    $0x4,%rbx
+    1669:	4c 8b 54 24 e8       	mov    -0x18(%rsp),%r10
+    166e:	83 c0 01             	add    $0x1,%eax
+    1671:	39 44 24 d8          	cmp    %eax,-0x28(%rsp)
+    1675:	0f 85 55 ff ff ff    	jne    15d0 <Conv2d_s8_s8_s32_NCHW.constprop.0+0x50>
+    167b:	8b 7c 24 e4          	mov    -0x1c(%rsp),%edi
+    167f:	41 83 c6 0a          	add    $0xa,%r14d
+    1683:	48 83 c6 20          	add    $0x20,%rsi
+    1687:	83 c7 01             	add    $0x1,%edi
+    168a:	83 ff 08             	cmp    $0x8,%edi
+    168d:	0f 85 28 ff ff ff    	jne    15bb <Conv2d_s8_s8_s32_NCHW.constprop.0+0x3b>
+    1693:	41 89 cd             	mov    %ecx,%r13d
+    1696:	8b 4c 24 dc          	mov    -0x24(%rsp),%ecx
+    169a:	8b 44 24 e0          	mov    -0x20(%rsp),%eax
+    169e:	45 89 c8             	mov    %r9d,%r8d
+    16a1:	4d 89 d1             	mov    %r10,%r9
+    16a4:	45 01 ec             	add    %r13d,%r12d
+    16a7:	83 c1 08             	add    $0x8,%ecx
+    16aa:	44 01 c0             	add    %r8d,%eax
+    16ad:	49 81 c1 00 01 00 00 	add    $0x100,%r9
+    16b4:	81 f9 80 00 00 00    	cmp    $0x80,%ecx
+    16ba:	0f 85 de fe ff ff    	jne    159e <Conv2d_s8_s8_s32_NCHW.constprop.0+0x1e>
+    16c0:	5b                   	pop    %rbx
+    16c1:	5d                   	pop    %rbp
+    16c2:	41 5c                	pop    %r12
+    16c4:	41 5d                	pop    %r13
+    16c6:	41 5e                	pop    %r14
+    16c8:	41 5f                	pop    %r15
+    16ca:	c3                   	ret
+
+Disassembly of section .fini:
+
+00000000000016cc <_fini>:
+    16cc:	48 83 ec 08          	sub    $0x8,%rsp
+    16d0:	48 83 c4 08          	add    $0x8,%rsp
+    16d4:	c3                   	ret
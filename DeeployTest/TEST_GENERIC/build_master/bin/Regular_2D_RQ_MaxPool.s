@@ -0,0 +1,923 @@
+
+/root/package/DeeployTest/TEST_GENERIC/build_master/bin/Regular_2D_RQ_MaxPool:     file format elf64-x86-64
+
+Sections:
+Idx Name          Size      VMA               LMA               File off  Algn
+  0 .interp       0000001c  0000000000000318  0000000000000318  00000318  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+  1 .note.gnu.property 00000020  0000000000000338  0000000000000338  00000338  2**3
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+  2 .note.gnu.build-id 00000024  0000000000000358  0000000000000358  00000358  2**2
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+  3 .note.ABI-tag 00000020  000000000000037c  000000000000037c  0000037c  2**2
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+  4 .gnu.hash     00000024  00000000000003a0  00000000000003a0  000003a0  2**3
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+  5 .dynsym       00000108  00000000000003c8  00000000000003c8  000003c8  2**3
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+  6 .dynstr       00000146  00000000000004d0  00000000000004d0  000004d0  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+  7 .gnu.version  00000016  0000000000000616  0000000000000616  00000616  2**1
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+  8 .gnu.version_r 00000030  0000000000000630  0000000000000630  00000630  2**3
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+  9 .rela.dyn     000000c0  0000000000000660  0000000000000660  00000660  2**3
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+ 10 .rela.plt     00000078  0000000000000720  0000000000000720  00000720  2**3
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+ 11 .init         00000017  0000000000001000  0000000000001000  00001000  2**2
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+ 12 .plt          00000060  0000000000001020  0000000000001020  00001020  2**4
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+ 13 .plt.got      00000008  0000000000001080  0000000000001080  00001080  2**3
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+ 14 .text         00000a19  0000000000001090  0000000000001090  00001090  2**4
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+ 15 .fini         00000009  0000000000001aac  0000000000001aac  00001aac  2**2
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+ 16 .rodata       00000170  0000000000002000  0000000000002000  00002000  2**4
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+ 17 .eh_frame_hdr 0000002c  0000000000002170  0000000000002170  00002170  2**2
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+ 18 .eh_frame     000000d8  00000000000021a0  00000000000021a0  000021a0  2**3
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+ 19 .init_array   00000008  0000000000003dc0  0000000000003dc0  00002dc0  2**3
+                  CONTENTS, ALLOC, LOAD, DATA
+ 20 .fini_array   00000008  0000000000003dc8  0000000000003dc8  00002dc8  2**3
+                  CONTENTS, ALLOC, LOAD, DATA
+ 21 .dynamic      000001f0  0000000000003dd0  0000000000003dd0  00002dd0  2**3
+                  CONTENTS, ALLOC, LOAD, DATA
+ 22 .got          00000028  0000000000003fc0  0000000000003fc0  00002fc0  2**3
+                  CONTENTS, ALLOC, LOAD, DATA
+ 23 .got.plt      00000040  0000000000003fe8  0000000000003fe8  00002fe8  2**3
+                  CONTENTS, ALLOC, LOAD, DATA
+ 24 .data         00000fa0  0000000000004040  0000000000004040  00003040  2**5
+                  CONTENTS, ALLOC, LOAD, DATA
+ 25 .bss          00000028  0000000000004fe0  0000000000004fe0  00003fe0  2**3
+                  ALLOC
+ 26 .comment      00000027  0000000000000000  0000000000000000  00003fe0  2**0
+                  CONTENTS, READONLY
+ 27 .debug_aranges 00000030  0000000000000000  0000000000000000  00004007  2**0
+                  CONTENTS, READONLY, DEBUGGING, OCTETS
+ 28 .debug_info   0000238d  0000000000000000  0000000000000000  00004037  2**0
+                  CONTENTS, READONLY, DEBUGGING, OCTETS
+ 29 .debug_abbrev 000007de  0000000000000000  0000000000000000  000063c4  2**0
+                  CONTENTS, READONLY, DEBUGGING, OCTETS
+ 30 .debug_line   00000615  0000000000000000  0000000000000000  00006ba2  2**0
+                  CONTENTS, READONLY, DEBUGGING, OCTETS
+ 31 .debug_str    00000a4a  0000000000000000  0000000000000000  000071b7  2**0
+                  CONTENTS, READONLY, DEBUGGING, OCTETS
+ 32 .debug_line_str 000004bb  0000000000000000  0000000000000000  00007c01  2**0
+                  CONTENTS, READONLY, DEBUGGING, OCTETS
+ 33 .debug_loclists 000007de  0000000000000000  0000000000000000  000080bc  2**0
+                  CONTENTS, READONLY, DEBUGGING, OCTETS
+ 34 .debug_rnglists 0000014a  0000000000000000  0000000000000000  0000889a  2**0
+                  CONTENTS, READONLY, DEBUGGING, OCTETS
+
+Disassembly of section .init:
+
+0000000000001000 <_init>:
+    1000:	48 83 ec 08          	sub    $0x8,%rsp
+    1004:	48 8b 05 c5 2f 00 00 	mov    0x2fc5(%rip),%rax        # 3fd0 <__gmon_start__@Base>
+    100b:	48 85 c0             	test   %rax,%rax
+    100e:	74 02                	je     1012 <_init+0x12>
+    1010:	ff d0                	call   *%rax
+    1012:	48 83 c4 08          	add    $0x8,%rsp
+    1016:	c3                   	ret
+
+Disassembly of section .plt:
+
+0000000000001020 <free@plt-0x10>:
+    1020:	ff 35 ca 2f 00 00    	push   0x2fca(%rip)        # 3ff0 <_GLOBAL_OFFSET_TABLE_+0x8>
+    1026:	ff 25 cc 2f 00 00    	jmp    *0x2fcc(%rip)        # 3ff8 <_GLOBAL_OFFSET_TABLE_+0x10>
+    102c:	0f 1f 40 00          	nopl   0x0(%rax)
+
+0000000000001030 <free@plt>:
+    1030:	ff 25 ca 2f 00 00    	jmp    *0x2fca(%rip)        # 4000 <free@GLIBC_2.2.5>
+    1036:	68 00 00 00 00       	push   $0x0
+    103b:	e9 e0 ff ff ff       	jmp    1020 <_init+0x20>
+
+0000000000001040 <puts@plt>:
+    1040:	ff 25 c2 2f 00 00    	jmp    *0x2fc2(%rip)        # 4008 <puts@GLIBC_2.2.5>
+    1046:	68 01 00 00 00       	push   $0x1
+    104b:	e9 d0 ff ff ff       	jmp    1020 <_init+0x20>
+
+0000000000001050 <printf@plt>:
+    1050:	ff 25 ba 2f 00 00    	jmp    *0x2fba(%rip)        # 4010 <printf@GLIBC_2.2.5>
+    1056:	68 02 00 00 00       	push   $0x2
+    105b:	e9 c0 ff ff ff       	jmp    1020 <_init+0x20>
+
+0000000000001060 <calloc@plt>:
+    1060:	ff 25 b2 2f 00 00    	jmp    *0x2fb2(%rip)        # 4018 <calloc@GLIBC_2.2.5>
+    1066:	68 03 00 00 00       	push   $0x3
+    106b:	e9 b0 ff ff ff       	jmp    1020 <_init+0x20>
+
+0000000000001070 <malloc@plt>:
+    1070:	ff 25 aa 2f 00 00    	jmp    *0x2faa(%rip)        # 4020 <malloc@GLIBC_2.2.5>
+    1076:	68 04 00 00 00       	push   $0x4
+    107b:	e9 a0 ff ff ff       	jmp    1020 <_init+0x20>
+
+Disassembly of section .plt.got:
+
+0000000000001080 <__cxa_finalize@plt>:
+    1080:	ff 25 5a 2f 00 00    	jmp    *0x2f5a(%rip)        # 3fe0 <__cxa_finalize@GLIBC_2.2.5>
+    1086:	66 90                	xchg   %ax,%ax
+
+Disassembly of section .text:
+
+0000000000001090 <main>:
+    1090:	41 57                	push   %r15
+    1092:	48 8d 3d 67 0f 00 00 	lea    0xf67(%rip),%rdi        # 2000 <_fini+0x554>
+    1099:	41 56                	push   %r14
+    109b:	41 55                	push   %r13
+    109d:	41 54                	push   %r12
+    109f:	55                   	push   %rbp
+    10a0:	53                   	push   %rbx
+    10a1:	48 83 ec 68          	sub    $0x68,%rsp
+    10a5:	e8 96 ff ff ff       	call   1040 <puts@plt>
+  va_start(args, fmt);
+  int ret = vprintf(fmt, args);
+  va_end(args);
+  return ret;
+}
+void *deeploy_malloc(const size_t size) { return malloc(size); }
+    10aa:	bf 00 02 00 00       	mov    $0x200,%edi
+    10af:	e8 bc ff ff ff       	call   1070 <malloc@plt>
+    10b4:	bf 00 01 00 00       	mov    $0x100,%edi
+    10b9:	48 89 c3             	mov    %rax,%rbx
+}
+
+        }
+        
+        void InitNetwork(__attribute__((unused)) uint32_t core_id, __attribute__((unused)) uint32_t numThreads){
+        DeeployNetwork_input_0 = (int8_t*) deeploy_malloc(1 * 512);
+    10bc:	48 89 05 2d 3f 00 00 	mov    %rax,0x3f2d(%rip)        # 4ff0 <DeeployNetwork_input_0>
+    10c3:	e8 a8 ff ff ff       	call   1070 <malloc@plt>
+  printf("Initializing network...\r\n");
+
+  InitNetwork(0, 1);
+
+  for (uint32_t buf = 0; buf < DeeployNetwork_num_inputs; buf++) {
+    memcpy(DeeployNetwork_inputs[buf], testInputVector[buf],
+    10c8:	48 8d 35 91 30 00 00 	lea    0x3091(%rip),%rsi        # 4160 <testInputVector0>
+    10cf:	48 89 df             	mov    %rbx,%rdi
+    10d2:	b9 40 00 00 00       	mov    $0x40,%ecx
+    10d7:	f3 48 a5             	rep movsq %ds:(%rsi),%es:(%rdi)
+           DeeployNetwork_inputs_bytes[buf]);
+  }
+
+  printf("Running network...\r\n");
+    10da:	48 8d 3d 38 0f 00 00 	lea    0xf38(%rip),%rdi        # 2019 <_fini+0x56d>
+DeeployNetwork_output_0 = (int8_t*) deeploy_malloc(1 * 256);
+    10e1:	48 89 05 00 3f 00 00 	mov    %rax,0x3f00(%rip)        # 4fe8 <DeeployNetwork_output_0>
+DeeployNetwork_inputs[0] = (void*) DeeployNetwork_input_0;DeeployNetwork_outputs[0] = (void*) DeeployNetwork_output_0;
+    10e8:	48 89 1d 11 3f 00 00 	mov    %rbx,0x3f11(%rip)        # 5000 <DeeployNetwork_inputs>
+    10ef:	48 89 05 02 3f 00 00 	mov    %rax,0x3f02(%rip)        # 4ff8 <DeeployNetwork_outputs>
+    10f6:	e8 45 ff ff ff       	call   1040 <puts@plt>
+    10fb:	be 01 00 00 00       	mov    $0x1,%esi
+    1100:	bf 20 03 00 00       	mov    $0x320,%edi
+    1105:	e8 56 ff ff ff       	call   1060 <calloc@plt>
+                memcpy(DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input + xoffset_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0, DeeployNetwork_input_0+offset_in_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0, 8*sizeof(int8_t));
+    110a:	48 8b 35 df 3e 00 00 	mov    0x3edf(%rip),%rsi        # 4ff0 <DeeployNetwork_input_0>
+        xoffset_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0 = n*800 + 1*10+1;
+    1111:	ba 0b 00 00 00       	mov    $0xb,%edx
+    1116:	49 89 c7             	mov    %rax,%r15
+                memcpy(DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input + xoffset_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0, DeeployNetwork_input_0+offset_in_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0, 8*sizeof(int8_t));
+    1119:	31 c0                	xor    %eax,%eax
+int main() {
+    111b:	89 d1                	mov    %edx,%ecx
+    111d:	8d 78 40             	lea    0x40(%rax),%edi
+    1120:	41 89 c1             	mov    %eax,%r9d
+    1123:	41 89 c8             	mov    %ecx,%r8d
+                offset_in_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0 += 8;
+    1126:	83 c0 08             	add    $0x8,%eax
+                xoffset_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0 += 10;
+    1129:	83 c1 0a             	add    $0xa,%ecx
+                memcpy(DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input + xoffset_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0, DeeployNetwork_input_0+offset_in_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0, 8*sizeof(int8_t));
+    112c:	4e 8b 0c 0e          	mov    (%rsi,%r9,1),%r9
+    1130:	4f 89 0c 07          	mov    %r9,(%r15,%r8,1)
+            for(uint32_t h=0; h<8; h++){
+    1134:	39 f8                	cmp    %edi,%eax
+    1136:	75 e8                	jne    1120 <MaxPool_s8.c.ebc9b653+0x74>
+            xoffset_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0 += 2*1*10;
+    1138:	83 c2 64             	add    $0x64,%edx
+        for (uint32_t c=0; c<8; ++c) {
+    113b:	3d 00 02 00 00       	cmp    $0x200,%eax
+    1140:	75 d9                	jne    111b <MaxPool_s8.c.ebc9b653+0x6f>
+    1142:	bf 00 10 00 00       	mov    $0x1000,%edi
+    1147:	4c 8d 2d 12 3a 00 00 	lea    0x3a12(%rip),%r13        # 4b60 <DeeployNetwork_weight_tensor>
+    114e:	e8 1d ff ff ff       	call   1070 <malloc@plt>
+    1153:	31 d2                	xor    %edx,%edx
+    1155:	48 89 44 24 30       	mov    %rax,0x30(%rsp)
+    115a:	48 89 c6             	mov    %rax,%rsi
+    115d:	89 d0                	mov    %edx,%eax
+    115f:	89 44 24 38          	mov    %eax,0x38(%rsp)
+    1163:	44 8d 34 c0          	lea    (%rax,%rax,8),%r14d
+
+  int32_t sum;
+  for (f = 0; f < F; ++f) {
+    for (h = 0; h < H_out; ++h) {
+      for (w = 0; w < W_out; ++w) {
+        sum = 0;
+    1167:	48 89 f7             	mov    %rsi,%rdi
+    116a:	b9 50 00 00 00       	mov    $0x50,%ecx
+    116f:	45 31 c0             	xor    %r8d,%r8d
+    1172:	41 8d 58 08          	lea    0x8(%r8),%ebx
+    1176:	48 89 74 24 40       	mov    %rsi,0x40(%rsp)
+    117b:	8d 41 b0             	lea    -0x50(%rcx),%eax
+    117e:	49 89 fa             	mov    %rdi,%r10
+    1181:	89 5c 24 28          	mov    %ebx,0x28(%rsp)
+    1185:	89 44 24 20          	mov    %eax,0x20(%rsp)
+    1189:	44 89 c0             	mov    %r8d,%eax
+    118c:	4c 89 7c 24 10       	mov    %r15,0x10(%rsp)
+    1191:	8b 5c 24 20          	mov    0x20(%rsp),%ebx
+    1195:	89 c5                	mov    %eax,%ebp
+    1197:	45 31 db             	xor    %r11d,%r11d
+    119a:	4c 89 54 24 48       	mov    %r10,0x48(%rsp)
+    119f:	44 89 f2             	mov    %r14d,%edx
+    11a2:	89 c6                	mov    %eax,%esi
+    11a4:	45 89 c2             	mov    %r8d,%r10d
+    11a7:	66 0f 1f 84 00 00 00 	nopw   0x0(%rax,%rax,1)
+    11ae:	00 00 
+    11b0:	48 8b 44 24 10       	mov    0x10(%rsp),%rax
+    11b5:	89 6c 24 08          	mov    %ebp,0x8(%rsp)
+    11b9:	41 89 e9             	mov    %ebp,%r9d
+    11bc:	41 89 d0             	mov    %edx,%r8d
+    11bf:	4d 01 e8             	add    %r13,%r8
+    11c2:	44 8d 62 09          	lea    0x9(%rdx),%r12d
+    11c6:	49 01 c1             	add    %rax,%r9
+    11c9:	0f 1f 80 00 00 00 00 	nopl   0x0(%rax)
+        xoffset_DeeployNetwork__EXTRACT_CONV_PASS_0_padded_input_DeeployNetwork_input_0 = n*800 + 1*10+1;
+    11d0:	31 c0                	xor    %eax,%eax
+    11d2:	66 0f 1f 44 00 00    	nopw   0x0(%rax,%rax,1)
+        for (c = 0; c < C; ++c) {
+          // printf("(%2d,%2d,%2d) ", c, h, w);
+          for (p = 0; p < P; ++p) {
+            for (q = 0; q < Q; ++q) {
+              sum += (pSrcA[c * H * W + (h * SP + p) * W + (w * SQ + q)] +
+    11d8:	41 0f be 2c 01       	movsbl (%r9,%rax,1),%ebp
+                      input_offset) *
+                     pSrcB[f * C * P * Q + c * P * Q + p * Q + q];
+    11dd:	45 0f be 3c 00       	movsbl (%r8,%rax,1),%r15d
+            for (q = 0; q < Q; ++q) {
+    11e2:	48 83 c0 01          	add    $0x1,%rax
+                      input_offset) *
+    11e6:	41 0f af ef          	imul   %r15d,%ebp
+              sum += (pSrcA[c * H * W + (h * SP + p) * W + (w * SQ + q)] +
+    11ea:	41 01 eb             	add    %ebp,%r11d
+            for (q = 0; q < Q; ++q) {
+    11ed:	48 83 f8 03          	cmp    $0x3,%rax
+    11f1:	75 e5                	jne    11d8 <MaxPool_s8.c.ebc9b653+0x12c>
+          for (p = 0; p < P; ++p) {
+    11f3:	83 c2 03             	add    $0x3,%edx
+    11f6:	49 83 c1 0a          	add    $0xa,%r9
+    11fa:	49 83 c0 03          	add    $0x3,%r8
+    11fe:	44 39 e2             	cmp    %r12d,%edx
+    1201:	75 cd                	jne    11d0 <MaxPool_s8.c.ebc9b653+0x124>
+        for (c = 0; c < C; ++c) {
+    1203:	8b 6c 24 08          	mov    0x8(%rsp),%ebp
+    1207:	83 c3 0a             	add    $0xa,%ebx
+    120a:	83 c5 64             	add    $0x64,%ebp
+    120d:	39 cb                	cmp    %ecx,%ebx
+    120f:	75 9f                	jne    11b0 <MaxPool_s8.c.ebc9b653+0x104>
+            }
+          }
+          // printf("\r\n");
+        }
+        // printf("= %-6ld\r\n", sum);
+        pDstC[f * H_out * W_out + h * W_out + w] = sum + output_offset;
+    1211:	45 89 d0             	mov    %r10d,%r8d
+    1214:	4c 8b 54 24 48       	mov    0x48(%rsp),%r10
+    1219:	89 f0                	mov    %esi,%eax
+    121b:	4c 8b 7c 24 10       	mov    0x10(%rsp),%r15
+      for (w = 0; w < W_out; ++w) {
+    1220:	83 c0 01             	add    $0x1,%eax
+        pDstC[f * H_out * W_out + h * W_out + w] = sum + output_offset;
+    1223:	45 89 1a             	mov    %r11d,(%r10)
+      for (w = 0; w < W_out; ++w) {
+    1226:	49 83 c2 04          	add    $0x4,%r10
+    122a:	39 44 24 28          	cmp    %eax,0x28(%rsp)
+    122e:	0f 85 58 ff ff ff    	jne    118c <MaxPool_s8.c.ebc9b653+0xe0>
+    for (h = 0; h < H_out; ++h) {
+    1234:	41 83 c0 0a          	add    $0xa,%r8d
+    1238:	48 8b 74 24 40       	mov    0x40(%rsp),%rsi
+    123d:	8d 4b 01             	lea    0x1(%rbx),%ecx
+    1240:	48 83 c7 20          	add    $0x20,%rdi
+    1244:	41 83 f8 50          	cmp    $0x50,%r8d
+    1248:	0f 85 24 ff ff ff    	jne    1172 <MaxPool_s8.c.ebc9b653+0xc6>
+  for (f = 0; f < F; ++f) {
+    124e:	8b 44 24 38          	mov    0x38(%rsp),%eax
+    1252:	48 81 c6 00 01 00 00 	add    $0x100,%rsi
+    1259:	83 c0 08             	add    $0x8,%eax
+    125c:	3d 80 00 00 00       	cmp    $0x80,%eax
+    1261:	0f 85 f8 fe ff ff    	jne    115f <MaxPool_s8.c.ebc9b653+0xb3>
+void deeploy_free(void *const ptr) { free(ptr); }
+    1267:	4c 89 ff             	mov    %r15,%rdi
+    126a:	48 8b 6c 24 30       	mov    0x30(%rsp),%rbp
+    126f:	e8 bc fd ff ff       	call   1030 <free@plt>
+void *deeploy_malloc(const size_t size) { return malloc(size); }
+    1274:	bf 00 04 00 00       	mov    $0x400,%edi
+    1279:	e8 f2 fd ff ff       	call   1070 <malloc@plt>
+    127e:	66 0f 6f 35 0a 0e 00 	movdqa 0xe0a(%rip),%xmm6        # 2090 <_fini+0x5e4>
+    1285:	00 
+    1286:	4c 8d 1d d3 34 00 00 	lea    0x34d3(%rip),%r11        # 4760 <DeeployNetwork_rqs_convmul_tensor>
+    128d:	31 ff                	xor    %edi,%edi
+    128f:	48 89 44 24 08       	mov    %rax,0x8(%rsp)
+    out = (int8_t)CLAMP(intermediate, output_min, output_max);
+    data_out[i] = out;
+  }
+}
+
+void RequantShift_s32_s8_NCHW(int32_t *data_in, int32_t size, int32_t *mul,
+    1294:	4c 8d 0d c5 30 00 00 	lea    0x30c5(%rip),%r9        # 4360 <DeeployNetwork_rqs_convadd_tensor>
+    129b:	66 44 0f 6f 2d 3c 0e 	movdqa 0xe3c(%rip),%xmm13        # 20e0 <_fini+0x634>
+    12a2:	00 00 
+    12a4:	66 44 0f 6f 05 43 0e 	movdqa 0xe43(%rip),%xmm8        # 20f0 <_fini+0x644>
+    12ab:	00 00 
+    12ad:	0f 29 74 24 10       	movaps %xmm6,0x10(%rsp)
+    12b2:	66 44 0f 6f 25 45 0e 	movdqa 0xe45(%rip),%xmm12        # 2100 <_fini+0x654>
+    12b9:	00 00 
+    12bb:	66 44 0f 6f 1d 4c 0e 	movdqa 0xe4c(%rip),%xmm11        # 2110 <_fini+0x664>
+    12c2:	00 00 
+    12c4:	66 44 0f 6f 15 73 0e 	movdqa 0xe73(%rip),%xmm10        # 2140 <_fini+0x694>
+    12cb:	00 00 
+    12cd:	66 44 0f 6f 0d 8a 0e 	movdqa 0xe8a(%rip),%xmm9        # 2160 <_fini+0x6b4>
+    12d4:	00 00 
+    12d6:	66 0f 6f 74 24 10    	movdqa 0x10(%rsp),%xmm6
+    for (int j = 0; j < 3; j++) {
+      asm volatile("nop" ::);
+    }
+#endif
+
+    intermediate = (intermediate + input_offset) * mul[i / HW] + add[i / HW];
+    12dc:	66 0f 6f 0d cc 0d 00 	movdqa 0xdcc(%rip),%xmm1        # 20b0 <_fini+0x604>
+    12e3:	00 
+    12e4:	66 45 0f 6f f4       	movdqa %xmm12,%xmm14
+    12e9:	66 0f 6f 1d cf 0d 00 	movdqa 0xdcf(%rip),%xmm3        # 20c0 <_fini+0x614>
+    12f0:	00 
+    12f1:	66 0f 6f c6          	movdqa %xmm6,%xmm0
+    12f5:	66 0f fe 35 a3 0d 00 	paddd  0xda3(%rip),%xmm6        # 20a0 <_fini+0x5f4>
+    12fc:	00 
+    12fd:	66 0f 6f d0          	movdqa %xmm0,%xmm2
+    1301:	66 0f fe c8          	paddd  %xmm0,%xmm1
+    1305:	66 0f fe d8          	paddd  %xmm0,%xmm3
+    1309:	66 0f 72 e2 06       	psrad  $0x6,%xmm2
+    130e:	66 0f 72 e1 06       	psrad  $0x6,%xmm1
+    1313:	66 0f fe 05 b5 0d 00 	paddd  0xdb5(%rip),%xmm0        # 20d0 <_fini+0x624>
+    131a:	00 
+    131b:	0f 29 74 24 10       	movaps %xmm6,0x10(%rsp)
+    1320:	66 0f 70 e2 55       	pshufd $0x55,%xmm2,%xmm4
+    1325:	66 41 0f 7e d7       	movd   %xmm2,%r15d
+    132a:	66 0f 7e c8          	movd   %xmm1,%eax
+    132e:	66 41 0f 7e e5       	movd   %xmm4,%r13d
+    1333:	66 0f 6f e2          	movdqa %xmm2,%xmm4
+    1337:	48 98                	cltq
+    1339:	4d 63 ff             	movslq %r15d,%r15
+    133c:	66 0f 6a e2          	punpckhdq %xmm2,%xmm4
+    1340:	66 0f 70 d2 ff       	pshufd $0xff,%xmm2,%xmm2
+    1345:	48 89 44 24 20       	mov    %rax,0x20(%rsp)
+    134a:	4d 63 ed             	movslq %r13d,%r13
+    134d:	66 0f 7e d6          	movd   %xmm2,%esi
+    1351:	66 0f 70 d1 55       	pshufd $0x55,%xmm1,%xmm2
+    1356:	66 41 0f 7e e6       	movd   %xmm4,%r14d
+    135b:	66 0f 7e d3          	movd   %xmm2,%ebx
+    135f:	66 0f 6f d1          	movdqa %xmm1,%xmm2
+    1363:	4d 63 f6             	movslq %r14d,%r14
+    1366:	48 63 f6             	movslq %esi,%rsi
+    1369:	66 0f 72 e3 06       	psrad  $0x6,%xmm3
+    136e:	66 0f 6a d1          	punpckhdq %xmm1,%xmm2
+    1372:	66 0f 70 c9 ff       	pshufd $0xff,%xmm1,%xmm1
+    1377:	48 63 db             	movslq %ebx,%rbx
+    137a:	66 0f 7e c9          	movd   %xmm1,%ecx
+    137e:	66 0f 70 cb 55       	pshufd $0x55,%xmm3,%xmm1
+    1383:	66 0f 7e d8          	movd   %xmm3,%eax
+    1387:	66 41 0f 6e 34 b3    	movd   (%r11,%rsi,4),%xmm6
+    138d:	66 41 0f 7e ca       	movd   %xmm1,%r10d
+    1392:	66 0f 6f cb          	movdqa %xmm3,%xmm1
+    1396:	48 63 d0             	movslq %eax,%rdx
+    1399:	41 8b 34 b1          	mov    (%r9,%rsi,4),%esi
+    139d:	66 0f 6a cb          	punpckhdq %xmm3,%xmm1
+    13a1:	66 0f 72 e0 06       	psrad  $0x6,%xmm0
+    13a6:	48 63 c9             	movslq %ecx,%rcx
+    13a9:	4d 63 d2             	movslq %r10d,%r10
+    13ac:	66 0f 7e c8          	movd   %xmm1,%eax
+    13b0:	66 0f 70 cb ff       	pshufd $0xff,%xmm3,%xmm1
+    13b5:	48 89 54 24 28       	mov    %rdx,0x28(%rsp)
+    13ba:	66 41 0f 7e d4       	movd   %xmm2,%r12d
+    13bf:	4c 63 c0             	movslq %eax,%r8
+    13c2:	66 0f 7e ca          	movd   %xmm1,%edx
+    13c6:	66 0f 70 c8 55       	pshufd $0x55,%xmm0,%xmm1
+    13cb:	4d 63 e4             	movslq %r12d,%r12
+    13ce:	4c 89 44 24 30       	mov    %r8,0x30(%rsp)
+    13d3:	66 0f 7e c0          	movd   %xmm0,%eax
+    13d7:	48 63 d2             	movslq %edx,%rdx
+    13da:	66 41 0f 7e c8       	movd   %xmm1,%r8d
+    13df:	66 0f 6f c8          	movdqa %xmm0,%xmm1
+    13e3:	48 98                	cltq
+    13e5:	f3 0f 6f 54 bd 00    	movdqu 0x0(%rbp,%rdi,4),%xmm2
+    13eb:	4d 63 c0             	movslq %r8d,%r8
+    13ee:	66 0f 6a c8          	punpckhdq %xmm0,%xmm1
+    13f2:	48 89 44 24 38       	mov    %rax,0x38(%rsp)
+    13f7:	66 0f 70 c0 ff       	pshufd $0xff,%xmm0,%xmm0
+    13fc:	f3 0f 6f 5c bd 10    	movdqu 0x10(%rbp,%rdi,4),%xmm3
+    1402:	66 0f 7e c8          	movd   %xmm1,%eax
+    1406:	66 43 0f 6e 0c b3    	movd   (%r11,%r14,4),%xmm1
+    140c:	66 0f 73 d2 20       	psrlq  $0x20,%xmm2
+    1411:	48 98                	cltq
+    1413:	66 0f 62 ce          	punpckldq %xmm6,%xmm1
+    1417:	48 89 44 24 40       	mov    %rax,0x40(%rsp)
+    141c:	66 43 0f 6e 34 ab    	movd   (%r11,%r13,4),%xmm6
+    1422:	66 0f 7e c0          	movd   %xmm0,%eax
+    1426:	66 43 0f 6e 04 bb    	movd   (%r11,%r15,4),%xmm0
+    142c:	48 98                	cltq
+    142e:	66 0f 62 c6          	punpckldq %xmm6,%xmm0
+    1432:	66 0f 6e f6          	movd   %esi,%xmm6
+    1436:	43 8b 34 a9          	mov    (%r9,%r13,4),%esi
+    143a:	66 0f 6c c1          	punpcklqdq %xmm1,%xmm0
+    143e:	f3 0f 6f 4c bd 00    	movdqu 0x0(%rbp,%rdi,4),%xmm1
+    1444:	66 0f f4 c8          	pmuludq %xmm0,%xmm1
+    1448:	66 0f 73 d0 20       	psrlq  $0x20,%xmm0
+    144d:	66 0f f4 c2          	pmuludq %xmm2,%xmm0
+    1451:	66 43 0f 6e 14 b1    	movd   (%r9,%r14,4),%xmm2
+    1457:	66 0f 62 d6          	punpckldq %xmm6,%xmm2
+    145b:	66 0f 6e f6          	movd   %esi,%xmm6
+    145f:	48 8b 74 24 20       	mov    0x20(%rsp),%rsi
+    1464:	66 0f 70 c9 08       	pshufd $0x8,%xmm1,%xmm1
+    1469:	66 0f 70 c0 08       	pshufd $0x8,%xmm0,%xmm0
+    146e:	66 0f 62 c8          	punpckldq %xmm0,%xmm1
+    1472:	66 43 0f 6e 04 b9    	movd   (%r9,%r15,4),%xmm0
+    1478:	66 0f 62 c6          	punpckldq %xmm6,%xmm0
+    147c:	66 41 0f 6e 34 8b    	movd   (%r11,%rcx,4),%xmm6
+    1482:	41 8b 0c 89          	mov    (%r9,%rcx,4),%ecx
+    1486:	66 0f 6c c2          	punpcklqdq %xmm2,%xmm0
+    148a:	66 43 0f 6e 14 a3    	movd   (%r11,%r12,4),%xmm2
+    1490:	66 0f fe c1          	paddd  %xmm1,%xmm0
+    1494:	66 41 0f 6e 0c b3    	movd   (%r11,%rsi,4),%xmm1
+    149a:	66 0f 62 d6          	punpckldq %xmm6,%xmm2
+    149e:	66 41 0f 6e 34 9b    	movd   (%r11,%rbx,4),%xmm6
+    if (rounding && log2D > 0)
+      intermediate += 1 << (log2D - 1);
+    14a4:	66 41 0f fe c5       	paddd  %xmm13,%xmm0
+    intermediate = (intermediate >> log2D) + output_offset;
+    14a9:	66 0f 72 e0 10       	psrad  $0x10,%xmm0
+    intermediate = (intermediate + input_offset) * mul[i / HW] + add[i / HW];
+    14ae:	66 0f 62 ce          	punpckldq %xmm6,%xmm1
+    14b2:	66 0f 6e f1          	movd   %ecx,%xmm6
+    14b6:	41 8b 0c 99          	mov    (%r9,%rbx,4),%ecx
+    14ba:	66 0f 6c ca          	punpcklqdq %xmm2,%xmm1
+    14be:	f3 0f 6f 54 bd 10    	movdqu 0x10(%rbp,%rdi,4),%xmm2
+    14c4:	66 0f f4 d9          	pmuludq %xmm1,%xmm3
+    14c8:	66 0f 73 d1 20       	psrlq  $0x20,%xmm1
+    14cd:	66 0f 73 d2 20       	psrlq  $0x20,%xmm2
+    14d2:	66 0f f4 ca          	pmuludq %xmm2,%xmm1
+    14d6:	66 43 0f 6e 14 a1    	movd   (%r9,%r12,4),%xmm2
+    14dc:	66 0f 62 d6          	punpckldq %xmm6,%xmm2
+    14e0:	66 0f 6e f1          	movd   %ecx,%xmm6
+    14e4:	66 0f 70 db 08       	pshufd $0x8,%xmm3,%xmm3
+    14e9:	66 0f 70 c9 08       	pshufd $0x8,%xmm1,%xmm1
+    14ee:	66 0f 62 d9          	punpckldq %xmm1,%xmm3
+    14f2:	66 41 0f 6e 0c b1    	movd   (%r9,%rsi,4),%xmm1
+    14f8:	48 8b 74 24 30       	mov    0x30(%rsp),%rsi
+    14fd:	48 8b 5c 24 28       	mov    0x28(%rsp),%rbx
+    1502:	f3 0f 6f 64 bd 20    	movdqu 0x20(%rbp,%rdi,4),%xmm4
+    1508:	66 0f 62 ce          	punpckldq %xmm6,%xmm1
+    150c:	66 41 0f 6e 34 93    	movd   (%r11,%rdx,4),%xmm6
+    1512:	41 8b 14 91          	mov    (%r9,%rdx,4),%edx
+    1516:	66 0f 6c ca          	punpcklqdq %xmm2,%xmm1
+    151a:	66 41 0f 6e 14 b3    	movd   (%r11,%rsi,4),%xmm2
+    1520:	66 0f 73 d4 20       	psrlq  $0x20,%xmm4
+    1525:	f3 0f 6f 6c bd 30    	movdqu 0x30(%rbp,%rdi,4),%xmm5
+    152b:	66 0f fe d9          	paddd  %xmm1,%xmm3
+    152f:	66 41 0f 6e 0c 9b    	movd   (%r11,%rbx,4),%xmm1
+    1535:	66 0f 62 d6          	punpckldq %xmm6,%xmm2
+    1539:	66 43 0f 6e 34 93    	movd   (%r11,%r10,4),%xmm6
+      intermediate += 1 << (log2D - 1);
+    153f:	66 41 0f fe dd       	paddd  %xmm13,%xmm3
+    intermediate = (intermediate >> log2D) + output_offset;
+    1544:	66 0f 72 e3 10       	psrad  $0x10,%xmm3
+    intermediate = (intermediate + input_offset) * mul[i / HW] + add[i / HW];
+    1549:	66 0f 62 ce          	punpckldq %xmm6,%xmm1
+    154d:	66 0f 6e f2          	movd   %edx,%xmm6
+    1551:	43 8b 14 91          	mov    (%r9,%r10,4),%edx
+    1555:	66 0f 6c ca          	punpcklqdq %xmm2,%xmm1
+    1559:	f3 0f 6f 54 bd 20    	movdqu 0x20(%rbp,%rdi,4),%xmm2
+    155f:	66 0f f4 d1          	pmuludq %xmm1,%xmm2
+    1563:	66 0f 73 d1 20       	psrlq  $0x20,%xmm1
+    1568:	66 0f f4 cc          	pmuludq %xmm4,%xmm1
+    156c:	66 41 0f 6e 24 b1    	movd   (%r9,%rsi,4),%xmm4
+    1572:	48 8b 74 24 40       	mov    0x40(%rsp),%rsi
+    1577:	66 0f 62 e6          	punpckldq %xmm6,%xmm4
+    157b:	66 0f 6e f2          	movd   %edx,%xmm6
+    157f:	66 0f 70 d2 08       	pshufd $0x8,%xmm2,%xmm2
+    1584:	66 0f 70 c9 08       	pshufd $0x8,%xmm1,%xmm1
+    1589:	66 0f 62 d1          	punpckldq %xmm1,%xmm2
+    158d:	66 41 0f 6e 0c 99    	movd   (%r9,%rbx,4),%xmm1
+    1593:	48 8b 5c 24 38       	mov    0x38(%rsp),%rbx
+    1598:	66 0f 62 ce          	punpckldq %xmm6,%xmm1
+    159c:	66 41 0f 6e 34 83    	movd   (%r11,%rax,4),%xmm6
+    15a2:	41 8b 04 81          	mov    (%r9,%rax,4),%eax
+    15a6:	66 0f 6c cc          	punpcklqdq %xmm4,%xmm1
+    15aa:	66 41 0f 6e 24 b3    	movd   (%r11,%rsi,4),%xmm4
+    15b0:	66 0f fe ca          	paddd  %xmm2,%xmm1
+    15b4:	66 41 0f 6e 14 9b    	movd   (%r11,%rbx,4),%xmm2
+    15ba:	66 0f 62 e6          	punpckldq %xmm6,%xmm4
+    15be:	66 43 0f 6e 34 83    	movd   (%r11,%r8,4),%xmm6
+      intermediate += 1 << (log2D - 1);
+    15c4:	66 41 0f fe cd       	paddd  %xmm13,%xmm1
+    intermediate = (intermediate >> log2D) + output_offset;
+    15c9:	66 0f 72 e1 10       	psrad  $0x10,%xmm1
+    intermediate = (intermediate + input_offset) * mul[i / HW] + add[i / HW];
+    15ce:	66 0f 62 d6          	punpckldq %xmm6,%xmm2
+    15d2:	66 0f 6e f0          	movd   %eax,%xmm6
+    15d6:	43 8b 04 81          	mov    (%r9,%r8,4),%eax
+    15da:	66 0f 6c d4          	punpcklqdq %xmm4,%xmm2
+    15de:	f3 0f 6f 64 bd 30    	movdqu 0x30(%rbp,%rdi,4),%xmm4
+    15e4:	66 0f f4 ea          	pmuludq %xmm2,%xmm5
+    15e8:	66 0f 73 d2 20       	psrlq  $0x20,%xmm2
+    15ed:	66 0f 73 d4 20       	psrlq  $0x20,%xmm4
+    15f2:	66 0f f4 d4          	pmuludq %xmm4,%xmm2
+    15f6:	66 0f 70 e5 08       	pshufd $0x8,%xmm5,%xmm4
+    15fb:	66 41 0f 6e 2c b1    	movd   (%r9,%rsi,4),%xmm5
+    1601:	66 0f 70 d2 08       	pshufd $0x8,%xmm2,%xmm2
+    1606:	66 0f 62 ee          	punpckldq %xmm6,%xmm5
+    160a:	66 0f 6e f0          	movd   %eax,%xmm6
+    out = (int8_t)CLAMP(intermediate, output_min, output_max);
+    data_out[i] = out;
+    160e:	48 8b 44 24 08       	mov    0x8(%rsp),%rax
+    intermediate = (intermediate + input_offset) * mul[i / HW] + add[i / HW];
+    1613:	66 0f 62 e2          	punpckldq %xmm2,%xmm4
+    1617:	66 41 0f 6e 14 99    	movd   (%r9,%rbx,4),%xmm2
+    161d:	66 0f 62 d6          	punpckldq %xmm6,%xmm2
+    out = (int8_t)CLAMP(intermediate, output_min, output_max);
+    1621:	66 0f 6f f0          	movdqa %xmm0,%xmm6
+    intermediate = (intermediate + input_offset) * mul[i / HW] + add[i / HW];
+    1625:	66 0f 6c d5          	punpcklqdq %xmm5,%xmm2
+    out = (int8_t)CLAMP(intermediate, output_min, output_max);
+    1629:	66 0f 61 f3          	punpcklwd %xmm3,%xmm6
+    intermediate = (intermediate + input_offset) * mul[i / HW] + add[i / HW];
+    162d:	66 0f fe d4          	paddd  %xmm4,%xmm2
+    out = (int8_t)CLAMP(intermediate, output_min, output_max);
+    1631:	66 0f 6f e0          	movdqa %xmm0,%xmm4
+    1635:	66 0f 6f ee          	movdqa %xmm6,%xmm5
+    1639:	66 0f 69 e3          	punpckhwd %xmm3,%xmm4
+      intermediate += 1 << (log2D - 1);
+    163d:	66 41 0f fe d5       	paddd  %xmm13,%xmm2
+    intermediate = (intermediate >> log2D) + output_offset;
+    1642:	66 0f 72 e2 10       	psrad  $0x10,%xmm2
+    out = (int8_t)CLAMP(intermediate, output_min, output_max);
+    1647:	66 0f 69 ec          	punpckhwd %xmm4,%xmm5
+    164b:	66 0f 61 f4          	punpcklwd %xmm4,%xmm6
+    164f:	66 0f 6f e1          	movdqa %xmm1,%xmm4
+    1653:	66 0f 61 f5          	punpcklwd %xmm5,%xmm6
+    1657:	66 0f 6f e9          	movdqa %xmm1,%xmm5
+    165b:	66 0f 61 e2          	punpcklwd %xmm2,%xmm4
+    165f:	66 0f 69 ea          	punpckhwd %xmm2,%xmm5
+    1663:	66 41 0f db f0       	pand   %xmm8,%xmm6
+    1668:	66 0f 6f fc          	movdqa %xmm4,%xmm7
+    166c:	66 0f 61 e5          	punpcklwd %xmm5,%xmm4
+    1670:	66 44 0f 6f fa       	movdqa %xmm2,%xmm15
+    1675:	66 44 0f 66 f2       	pcmpgtd %xmm2,%xmm14
+    167a:	66 0f 69 fd          	punpckhwd %xmm5,%xmm7
+    167e:	66 41 0f fe d2       	paddd  %xmm10,%xmm2
+    1683:	66 0f 61 e7          	punpcklwd %xmm7,%xmm4
+    1687:	66 45 0f 66 fb       	pcmpgtd %xmm11,%xmm15
+    168c:	66 41 0f 6f fc       	movdqa %xmm12,%xmm7
+    1691:	66 41 0f db e0       	pand   %xmm8,%xmm4
+    1696:	66 0f 66 fb          	pcmpgtd %xmm3,%xmm7
+    169a:	66 0f 67 f4          	packuswb %xmm4,%xmm6
+    169e:	66 41 0f 6f e4       	movdqa %xmm12,%xmm4
+    16a3:	66 0f 66 e0          	pcmpgtd %xmm0,%xmm4
+    16a7:	66 0f 6f ec          	movdqa %xmm4,%xmm5
+    16ab:	66 0f 61 e7          	punpcklwd %xmm7,%xmm4
+    16af:	66 0f 69 ef          	punpckhwd %xmm7,%xmm5
+    16b3:	66 0f 6f fc          	movdqa %xmm4,%xmm7
+    16b7:	66 0f 69 fd          	punpckhwd %xmm5,%xmm7
+    16bb:	66 0f 61 e5          	punpcklwd %xmm5,%xmm4
+    16bf:	66 41 0f 6f ec       	movdqa %xmm12,%xmm5
+    16c4:	66 0f 66 e9          	pcmpgtd %xmm1,%xmm5
+    16c8:	66 0f 61 e7          	punpcklwd %xmm7,%xmm4
+    16cc:	66 41 0f db e0       	pand   %xmm8,%xmm4
+    16d1:	66 0f 6f fd          	movdqa %xmm5,%xmm7
+    16d5:	66 41 0f 61 ee       	punpcklwd %xmm14,%xmm5
+    16da:	66 41 0f 69 fe       	punpckhwd %xmm14,%xmm7
+    16df:	66 44 0f 6f f5       	movdqa %xmm5,%xmm14
+    16e4:	66 44 0f 69 f7       	punpckhwd %xmm7,%xmm14
+    16e9:	66 0f 61 ef          	punpcklwd %xmm7,%xmm5
+    16ed:	66 41 0f 61 ee       	punpcklwd %xmm14,%xmm5
+    16f2:	66 44 0f 6f f3       	movdqa %xmm3,%xmm14
+    16f7:	66 41 0f fe da       	paddd  %xmm10,%xmm3
+    16fc:	66 41 0f db e8       	pand   %xmm8,%xmm5
+    1701:	66 45 0f 66 f3       	pcmpgtd %xmm11,%xmm14
+    1706:	66 0f fa 1d 42 0a 00 	psubd  0xa42(%rip),%xmm3        # 2150 <_fini+0x6a4>
+    170d:	00 
+    170e:	66 0f 67 e5          	packuswb %xmm5,%xmm4
+    1712:	66 0f 6f e8          	movdqa %xmm0,%xmm5
+    1716:	66 41 0f fe c2       	paddd  %xmm10,%xmm0
+    171b:	66 41 0f 66 eb       	pcmpgtd %xmm11,%xmm5
+    1720:	66 0f fa 05 28 0a 00 	psubd  0xa28(%rip),%xmm0        # 2150 <_fini+0x6a4>
+    1727:	00 
+    1728:	66 41 0f 66 d9       	pcmpgtd %xmm9,%xmm3
+    172d:	66 41 0f 66 c1       	pcmpgtd %xmm9,%xmm0
+    1732:	66 0f 6f fd          	movdqa %xmm5,%xmm7
+    1736:	66 41 0f 61 ee       	punpcklwd %xmm14,%xmm5
+    173b:	66 41 0f 69 fe       	punpckhwd %xmm14,%xmm7
+    1740:	66 44 0f 6f f5       	movdqa %xmm5,%xmm14
+    1745:	66 44 0f 69 f7       	punpckhwd %xmm7,%xmm14
+    174a:	66 0f 61 ef          	punpcklwd %xmm7,%xmm5
+    174e:	66 0f 6f f9          	movdqa %xmm1,%xmm7
+    1752:	66 41 0f 66 fb       	pcmpgtd %xmm11,%xmm7
+    1757:	66 41 0f 61 ee       	punpcklwd %xmm14,%xmm5
+    175c:	66 41 0f db e8       	pand   %xmm8,%xmm5
+    1761:	66 44 0f 6f f7       	movdqa %xmm7,%xmm14
+    1766:	66 41 0f 61 ff       	punpcklwd %xmm15,%xmm7
+    176b:	66 45 0f 69 f7       	punpckhwd %xmm15,%xmm14
+    1770:	66 44 0f 6f ff       	movdqa %xmm7,%xmm15
+    1775:	66 45 0f 69 fe       	punpckhwd %xmm14,%xmm15
+    177a:	66 41 0f 61 fe       	punpcklwd %xmm14,%xmm7
+    177f:	66 41 0f 61 ff       	punpcklwd %xmm15,%xmm7
+    1784:	66 41 0f db f8       	pand   %xmm8,%xmm7
+    1789:	66 0f 67 ef          	packuswb %xmm7,%xmm5
+    178d:	66 0f ef ff          	pxor   %xmm7,%xmm7
+    1791:	66 0f 76 df          	pcmpeqd %xmm7,%xmm3
+    1795:	66 0f 76 c7          	pcmpeqd %xmm7,%xmm0
+    1799:	66 0f df e5          	pandn  %xmm5,%xmm4
+    179d:	66 0f 6f 2d 7b 09 00 	movdqa 0x97b(%rip),%xmm5        # 2120 <_fini+0x674>
+    17a4:	00 
+    17a5:	66 0f db ec          	pand   %xmm4,%xmm5
+    17a9:	66 0f df 25 7f 09 00 	pandn  0x97f(%rip),%xmm4        # 2130 <_fini+0x684>
+    17b0:	00 
+    17b1:	66 0f eb e5          	por    %xmm5,%xmm4
+    17b5:	66 0f 6f e8          	movdqa %xmm0,%xmm5
+    17b9:	66 0f 61 c3          	punpcklwd %xmm3,%xmm0
+    17bd:	66 0f 69 eb          	punpckhwd %xmm3,%xmm5
+    17c1:	66 0f 6f d8          	movdqa %xmm0,%xmm3
+    17c5:	66 0f 69 dd          	punpckhwd %xmm5,%xmm3
+    17c9:	66 0f 61 c5          	punpcklwd %xmm5,%xmm0
+    17cd:	66 0f 61 c3          	punpcklwd %xmm3,%xmm0
+    17d1:	66 0f 6f d9          	movdqa %xmm1,%xmm3
+    17d5:	66 0f 6f ca          	movdqa %xmm2,%xmm1
+    17d9:	66 41 0f fe da       	paddd  %xmm10,%xmm3
+    17de:	66 0f fa 1d 6a 09 00 	psubd  0x96a(%rip),%xmm3        # 2150 <_fini+0x6a4>
+    17e5:	00 
+    17e6:	66 41 0f db c0       	pand   %xmm8,%xmm0
+    17eb:	66 0f fa 0d 5d 09 00 	psubd  0x95d(%rip),%xmm1        # 2150 <_fini+0x6a4>
+    17f2:	00 
+    17f3:	66 41 0f 66 d9       	pcmpgtd %xmm9,%xmm3
+    17f8:	66 41 0f 66 c9       	pcmpgtd %xmm9,%xmm1
+    17fd:	66 0f 76 df          	pcmpeqd %xmm7,%xmm3
+    1801:	66 0f 76 cf          	pcmpeqd %xmm7,%xmm1
+    1805:	66 0f 6f d3          	movdqa %xmm3,%xmm2
+    1809:	66 0f 6f eb          	movdqa %xmm3,%xmm5
+    180d:	66 0f 61 d1          	punpcklwd %xmm1,%xmm2
+    1811:	66 0f 69 e9          	punpckhwd %xmm1,%xmm5
+    1815:	66 0f 6f ca          	movdqa %xmm2,%xmm1
+    1819:	66 0f 61 d5          	punpcklwd %xmm5,%xmm2
+    181d:	66 0f 69 cd          	punpckhwd %xmm5,%xmm1
+    1821:	66 0f 61 d1          	punpcklwd %xmm1,%xmm2
+    1825:	66 41 0f db d0       	pand   %xmm8,%xmm2
+    182a:	66 0f 67 c2          	packuswb %xmm2,%xmm0
+    182e:	66 0f db f0          	pand   %xmm0,%xmm6
+    1832:	66 0f df c4          	pandn  %xmm4,%xmm0
+    1836:	66 0f eb c6          	por    %xmm6,%xmm0
+    data_out[i] = out;
+    183a:	0f 11 04 38          	movups %xmm0,(%rax,%rdi,1)
+    183e:	48 83 c7 10          	add    $0x10,%rdi
+    1842:	48 81 ff 00 04 00 00 	cmp    $0x400,%rdi
+    1849:	0f 85 87 fa ff ff    	jne    12d6 <MaxPool_s8.c.ebc9b653+0x22a>
+void deeploy_free(void *const ptr) { free(ptr); }
+    184f:	48 89 ef             	mov    %rbp,%rdi
+    1852:	e8 d9 f7 ff ff       	call   1030 <free@plt>
+    1857:	48 8b 44 24 08       	mov    0x8(%rsp),%rax
+    int8_t* ref_DeeployNetwork_output_0_DeeployNetwork_output_0 = DeeployNetwork_output_0;
+    185c:	31 ff                	xor    %edi,%edi
+    185e:	4c 8b 15 83 37 00 00 	mov    0x3783(%rip),%r10        # 4fe8 <DeeployNetwork_output_0>
+    1865:	41 b9 08 00 00 00    	mov    $0x8,%r9d
+    186b:	4c 8d 68 10          	lea    0x10(%rax),%r13
+    186f:	44 8d 04 3f          	lea    (%rdi,%rdi,1),%r8d
+  int32_t max;
+  int32_t volatile tmp;
+  for (c = 0; c < C; ++c) {
+    for (h = 0; h < H_out; ++h) {
+      for (w = 0; w < W_out; ++w) {
+        max = -128;
+    1873:	4d 89 d3             	mov    %r10,%r11
+    1876:	46 8d 24 c5 00 00 00 	lea    0x0(,%r8,8),%r12d
+    187d:	00 
+    187e:	4c 89 dd             	mov    %r11,%rbp
+    1881:	31 db                	xor    %ebx,%ebx
+    1883:	48 8b 44 24 08       	mov    0x8(%rsp),%rax
+    1888:	44 89 e6             	mov    %r12d,%esi
+    188b:	ba 80 ff ff ff       	mov    $0xffffff80,%edx
+    1890:	48 01 f0             	add    %rsi,%rax
+    1893:	4c 01 ee             	add    %r13,%rsi
+        // printf("(%2d,%2d,%2d) ", c, h, w);
+        for (p = 0; p < P; ++p) {
+          for (q = 0; q < Q; ++q) {
+            tmp = (int32_t)(pSrcA[c * H * W + (h * SP + p) * W + (w * SQ + q)] +
+    1896:	0f be 08             	movsbl (%rax),%ecx
+    1899:	89 4c 24 5c          	mov    %ecx,0x5c(%rsp)
+                            input_offset);
+            if (tmp > max) {
+    189d:	8b 4c 24 5c          	mov    0x5c(%rsp),%ecx
+    18a1:	39 d1                	cmp    %edx,%ecx
+    18a3:	7e 04                	jle    18a9 <Util.c.3747f75c+0xcd>
+              // printf("%4d >  %4d, ", tmp, max);
+              max = tmp;
+    18a5:	8b 54 24 5c          	mov    0x5c(%rsp),%edx
+            tmp = (int32_t)(pSrcA[c * H * W + (h * SP + p) * W + (w * SQ + q)] +
+    18a9:	0f be 48 01          	movsbl 0x1(%rax),%ecx
+    18ad:	89 4c 24 5c          	mov    %ecx,0x5c(%rsp)
+            if (tmp > max) {
+    18b1:	8b 4c 24 5c          	mov    0x5c(%rsp),%ecx
+    18b5:	39 ca                	cmp    %ecx,%edx
+    18b7:	7d 04                	jge    18bd <Util.c.3747f75c+0xe1>
+              max = tmp;
+    18b9:	8b 54 24 5c          	mov    0x5c(%rsp),%edx
+        for (p = 0; p < P; ++p) {
+    18bd:	48 83 c0 08          	add    $0x8,%rax
+    18c1:	48 39 f0             	cmp    %rsi,%rax
+    18c4:	75 d0                	jne    1896 <Util.c.3747f75c+0xba>
+      for (w = 0; w < W_out; ++w) {
+    18c6:	83 c3 02             	add    $0x2,%ebx
+            // }
+          }
+        }
+        // printf(" -> %d\r\n", max);
+        pDstC[c * H_out * W_out + h * W_out + w] =
+            (int8_t)(max + output_offset);
+    18c9:	88 55 00             	mov    %dl,0x0(%rbp)
+      for (w = 0; w < W_out; ++w) {
+    18cc:	41 83 c4 02          	add    $0x2,%r12d
+    18d0:	48 83 c5 01          	add    $0x1,%rbp
+    18d4:	83 fb 08             	cmp    $0x8,%ebx
+    18d7:	75 aa                	jne    1883 <Util.c.3747f75c+0xa7>
+    for (h = 0; h < H_out; ++h) {
+    18d9:	41 83 c0 02          	add    $0x2,%r8d
+    18dd:	49 83 c3 04          	add    $0x4,%r11
+    18e1:	45 39 c1             	cmp    %r8d,%r9d
+    18e4:	75 90                	jne    1876 <Util.c.3747f75c+0x9a>
+  for (c = 0; c < C; ++c) {
+    18e6:	83 c7 04             	add    $0x4,%edi
+    18e9:	41 83 c1 08          	add    $0x8,%r9d
+    18ed:	49 83 c2 10          	add    $0x10,%r10
+    18f1:	83 ff 40             	cmp    $0x40,%edi
+    18f4:	0f 85 75 ff ff ff    	jne    186f <Util.c.3747f75c+0x93>
+    18fa:	48 8b 7c 24 08       	mov    0x8(%rsp),%rdi
+    18ff:	31 db                	xor    %ebx,%ebx
+    1901:	45 31 e4             	xor    %r12d,%r12d
+    1904:	4c 8d 2d 55 27 00 00 	lea    0x2755(%rip),%r13        # 4060 <testOutputVector0>
+      }
+#else
+      // RUNWANG: No margin for integer comparison
+      if (diff != 0) {
+        tot_err += 1;
+        printf("Expected: %4d  ", expected);
+    190b:	4c 8d 3d 1b 07 00 00 	lea    0x71b(%rip),%r15        # 202d <_fini+0x581>
+        printf("Actual: %4d  ", actual);
+    1912:	4c 8d 35 24 07 00 00 	lea    0x724(%rip),%r14        # 203d <_fini+0x591>
+    1919:	e8 12 f7 ff ff       	call   1030 <free@plt>
+         i < DeeployNetwork_outputs_bytes[buf] / sizeof(OUTPUTTYPE); i++) {
+    191e:	eb 0d                	jmp    192d <Util.c.3747f75c+0x151>
+    1920:	48 83 c3 01          	add    $0x1,%rbx
+    1924:	48 81 fb 00 01 00 00 	cmp    $0x100,%rbx
+    192b:	74 60                	je     198d <Util.c.3747f75c+0x1b1>
+      actual = ((OUTPUTTYPE *)DeeployNetwork_outputs[buf])[i];
+    192d:	48 8b 15 c4 36 00 00 	mov    0x36c4(%rip),%rdx        # 4ff8 <DeeployNetwork_outputs>
+      expected = ((OUTPUTTYPE *)testOutputVector[buf])[i];
+    1934:	41 0f b6 44 1d 00    	movzbl 0x0(%r13,%rbx,1),%eax
+      actual = ((OUTPUTTYPE *)DeeployNetwork_outputs[buf])[i];
+    193a:	0f b6 2c 1a          	movzbl (%rdx,%rbx,1),%ebp
+      if (diff != 0) {
+    193e:	89 c7                	mov    %eax,%edi
+    1940:	40 28 ef             	sub    %bpl,%dil
+    1943:	40 88 7c 24 08       	mov    %dil,0x8(%rsp)
+    1948:	74 d6                	je     1920 <Util.c.3747f75c+0x144>
+        printf("Expected: %4d  ", expected);
+    194a:	0f be f0             	movsbl %al,%esi
+    194d:	4c 89 ff             	mov    %r15,%rdi
+    1950:	31 c0                	xor    %eax,%eax
+        tot_err += 1;
+    1952:	41 83 c4 01          	add    $0x1,%r12d
+        printf("Expected: %4d  ", expected);
+    1956:	e8 f5 f6 ff ff       	call   1050 <printf@plt>
+        printf("Actual: %4d  ", actual);
+    195b:	40 0f be f5          	movsbl %bpl,%esi
+    195f:	4c 89 f7             	mov    %r14,%rdi
+    1962:	31 c0                	xor    %eax,%eax
+    1964:	e8 e7 f6 ff ff       	call   1050 <printf@plt>
+        printf("Diff: %4d at Index %12u in Output %u\r\n", diff, i, buf);
+    1969:	0f be 74 24 08       	movsbl 0x8(%rsp),%esi
+    196e:	89 da                	mov    %ebx,%edx
+    1970:	31 c9                	xor    %ecx,%ecx
+    1972:	48 8d 3d ef 06 00 00 	lea    0x6ef(%rip),%rdi        # 2068 <_fini+0x5bc>
+    1979:	31 c0                	xor    %eax,%eax
+         i < DeeployNetwork_outputs_bytes[buf] / sizeof(OUTPUTTYPE); i++) {
+    197b:	48 83 c3 01          	add    $0x1,%rbx
+        printf("Diff: %4d at Index %12u in Output %u\r\n", diff, i, buf);
+    197f:	e8 cc f6 ff ff       	call   1050 <printf@plt>
+         i < DeeployNetwork_outputs_bytes[buf] / sizeof(OUTPUTTYPE); i++) {
+    1984:	48 81 fb 00 01 00 00 	cmp    $0x100,%rbx
+    198b:	75 a0                	jne    192d <Util.c.3747f75c+0x151>
+      }
+#endif
+    }
+  }
+
+  printf("Errors: %d out of %d \r\n", tot_err, tot);
+    198d:	44 89 e6             	mov    %r12d,%esi
+    1990:	ba 00 01 00 00       	mov    $0x100,%edx
+    1995:	48 8d 3d af 06 00 00 	lea    0x6af(%rip),%rdi        # 204b <_fini+0x59f>
+    199c:	31 c0                	xor    %eax,%eax
+    199e:	e8 ad f6 ff ff       	call   1050 <printf@plt>
+
+  return tot_err;
+    19a3:	48 83 c4 68          	add    $0x68,%rsp
+    19a7:	44 89 e0             	mov    %r12d,%eax
+    19aa:	5b                   	pop    %rbx
+    19ab:	5d                   	pop    %rbp
+    19ac:	41 5c                	pop    %r12
+    19ae:	41 5d                	pop    %r13
+    19b0:	41 5e                	pop    %r14
+    19b2:	41 5f                	pop    %r15
+    19b4:	c3                   	ret
+    19b5:	66 2e 0f 1f 84 00 00 	cs nopw 0x0(%rax,%rax,1)
+    19bc:	00 00 00 
+    19bf:	90                   	nop
+
+00000000000019c0 <_start>:
+    19c0:	31 ed                	xor    %ebp,%ebp
+    19c2:	49 89 d1             	mov    %rdx,%r9
+    19c5:	5e                   	pop    %rsi
+    19c6:	48 89 e2             	mov    %rsp,%rdx
+    19c9:	48 83 e4 f0          	and    $0xfffffffffffffff0,%rsp
+    19cd:	50                   	push   %rax
+    19ce:	54                   	push   %rsp
+    19cf:	45 31 c0             	xor    %r8d,%r8d
+    19d2:	31 c9                	xor    %ecx,%ecx
+    19d4:	48 8d 3d b5 f6 ff ff 	lea    -0x94b(%rip),%rdi        # 1090 <main>
+    19db:	ff 15 df 25 00 00    	call   *0x25df(%rip)        # 3fc0 <__libc_start_main@GLIBC_2.34>
+    19e1:	f4                   	hlt
+    19e2:	66 2e 0f 1f 84 00 00 	cs nopw 0x0(%rax,%rax,1)
+    19e9:	00 00 00 
+    19ec:	0f 1f 40 00          	nopl   0x0(%rax)
+
+00000000000019f0 <deregister_tm_clones>:
+    19f0:	48 8d 3d e9 35 00 00 	lea    0x35e9(%rip),%rdi        # 4fe0 <__TMC_END__>
+    19f7:	48 8d 05 e2 35 00 00 	lea    0x35e2(%rip),%rax        # 4fe0 <__TMC_END__>
+    19fe:	48 39 f8             	cmp    %rdi,%rax
+    1a01:	74 15                	je     1a18 <deregister_tm_clones+0x28>
+    1a03:	48 8b 05 be 25 00 00 	mov    0x25be(%rip),%rax        # 3fc8 <_ITM_deregisterTMCloneTable@Base>
+    1a0a:	48 85 c0             	test   %rax,%rax
+    1a0d:	74 09                	je     1a18 <deregister_tm_clones+0x28>
+    1a0f:	ff e0                	jmp    *%rax
+    1a11:	0f 1f 80 00 00 00 00 	nopl   0x0(%rax)
+    1a18:	c3                   	ret
+    1a19:	0f 1f 80 00 00 00 00 	nopl   0x0(%rax)
+
+0000000000001a20 <register_tm_clones>:
+    1a20:	48 8d 3d b9 35 00 00 	lea    0x35b9(%rip),%rdi        # 4fe0 <__TMC_END__>
+    1a27:	48 8d 35 b2 35 00 00 	lea    0x35b2(%rip),%rsi        # 4fe0 <__TMC_END__>
+    1a2e:	48 29 fe             	sub    %rdi,%rsi
+    1a31:	48 89 f0             	mov    %rsi,%rax
+    1a34:	48 c1 ee 3f          	shr    $0x3f,%rsi
+    1a38:	48 c1 f8 03          	sar    $0x3,%rax
+    1a3c:	48 01 c6             	add    %rax,%rsi
+    1a3f:	48 d1 fe             	sar    %rsi
+    1a42:	74 14                	je     1a58 <register_tm_clones+0x38>
+    1a44:	48 8b 05 8d 25 00 00 	mov    0x258d(%rip),%rax        # 3fd8 <_ITM_registerTMCloneTable@Base>
+    1a4b:	48 85 c0             	test   %rax,%rax
+    1a4e:	74 08                	je     1a58 <register_tm_clones+0x38>
+    1a50:	ff e0                	jmp    *%rax
+    1a52:	66 0f 1f 44 00 00    	nopw   0x0(%rax,%rax,1)
+    1a58:	c3                   	ret
+    1a59:	0f 1f 80 00 00 00 00 	nopl   0x0(%rax)
+
+0000000000001a60 <__do_global_dtors_aux>:
+    1a60:	f3 0f 1e fa          	endbr64
+    1a64:	80 3d 75 35 00 00 00 	cmpb   $0x0,0x3575(%rip)        # 4fe0 <__TMC_END__>
+    1a6b:	75 2b                	jne    1a98 <__do_global_dtors_aux+0x38>
+    1a6d:	55                   	push   %rbp
+    1a6e:	48 83 3d 6a 25 00 00 	cmpq   $0x0,0x256a(%rip)        # 3fe0 <__cxa_finalize@GLIBC_2.2.5>
+    1a75:	00 
+    1a76:	48 89 e5             	mov    %rsp,%rbp
+    1a79:	74 0c                	je     1a87 <__do_global_dtors_aux+0x27>
+    1a7b:	48 8b 3d be 25 00 00 	mov    0x25be(%rip),%rdi        # 4040 <__dso_handle>
+    1a82:	e8 f9 f5 ff ff       	call   1080 <__cxa_finalize@plt>
+    1a87:	e8 64 ff ff ff       	call   19f0 <deregister_tm_clones>
+    1a8c:	c6 05 4d 35 00 00 01 	movb   $0x1,0x354d(%rip)        # 4fe0 <__TMC_END__>
+    1a93:	5d                   	pop    %rbp
+    1a94:	c3                   	ret
+    1a95:	0f 1f 00             	nopl   (%rax)
+    1a98:	c3                   	ret
+    1a99:	0f 1f 80 00 00 00 00 	nopl   0x0(%rax)
+
+0000000000001aa0 <frame_dummy>:
+    1aa0:	f3 0f 1e fa          	endbr64
+    1aa4:	e9 77 ff ff ff       	jmp    1a20 <register_tm_clones>
+
+Disassembly of section .fini:
+
+0000000000001aac <_fini>:
+    1aac:	48 83 ec 08          	sub    $0x8,%rsp
+    1ab0:	48 83 c4 08          	add    $0x8,%rsp
+    1ab4:	c3                   	ret
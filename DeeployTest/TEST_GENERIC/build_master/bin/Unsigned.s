@@ -0,0 +1,419 @@
+
+/root/package/DeeployTest/TEST_GENERIC/build_master/bin/Unsigned:     file format elf64-x86-64
+
+Sections:
+Idx Name          Size      VMA               LMA               File off  Algn
+  0 .interp       0000001c  0000000000000318  0000000000000318  00000318  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+  1 .note.gnu.property 00000020  0000000000000338  0000000000000338  00000338  2**3
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+  2 .note.gnu.build-id 00000024  0000000000000358  0000000000000358  00000358  2**2
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+  3 .note.ABI-tag 00000020  000000000000037c  000000000000037c  0000037c  2**2
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+  4 .gnu.hash     00000024  00000000000003a0  00000000000003a0  000003a0  2**3
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+  5 .dynsym       000000d8  00000000000003c8  00000000000003c8  000003c8  2**3
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+  6 .dynstr       0000012c  00000000000004a0  00000000000004a0  000004a0  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+  7 .gnu.version  00000012  00000000000005cc  00000000000005cc  000005cc  2**1
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+  8 .gnu.version_r 00000030  00000000000005e0  00000000000005e0  000005e0  2**3
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+  9 .rela.dyn     000000c0  0000000000000610  0000000000000610  00000610  2**3
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+ 10 .rela.plt     00000048  00000000000006d0  00000000000006d0  000006d0  2**3
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+ 11 .init         00000017  0000000000001000  0000000000001000  00001000  2**2
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+ 12 .plt          00000040  0000000000001020  0000000000001020  00001020  2**4
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+ 13 .plt.got      00000008  0000000000001060  0000000000001060  00001060  2**3
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+ 14 .text         00000309  0000000000001070  0000000000001070  00001070  2**4
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+ 15 .fini         00000009  000000000000137c  000000000000137c  0000137c  2**2
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+ 16 .rodata       00000120  0000000000002000  0000000000002000  00002000  2**5
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+ 17 .eh_frame_hdr 0000002c  0000000000002120  0000000000002120  00002120  2**2
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+ 18 .eh_frame     000000d8  0000000000002150  0000000000002150  00002150  2**3
+                  CONTENTS, ALLOC, LOAD, READONLY, DATA
+ 19 .init_array   00000008  0000000000003dc0  0000000000003dc0  00002dc0  2**3
+                  CONTENTS, ALLOC, LOAD, DATA
+ 20 .fini_array   00000008  0000000000003dc8  0000000000003dc8  00002dc8  2**3
+                  CONTENTS, ALLOC, LOAD, DATA
+ 21 .dynamic      000001f0  0000000000003dd0  0000000000003dd0  00002dd0  2**3
+                  CONTENTS, ALLOC, LOAD, DATA
+ 22 .got          00000028  0000000000003fc0  0000000000003fc0  00002fc0  2**3
+                  CONTENTS, ALLOC, LOAD, DATA
+ 23 .got.plt      00000030  0000000000003fe8  0000000000003fe8  00002fe8  2**3
+                  CONTENTS, ALLOC, LOAD, DATA
+ 24 .data         00000620  0000000000004020  0000000000004020  00003020  2**5
+                  CONTENTS, ALLOC, LOAD, DATA
+ 25 .bss          00000040  0000000000004640  0000000000004640  00003640  2**4
+                  ALLOC
+ 26 .comment      00000027  0000000000000000  0000000000000000  00003640  2**0
+                  CONTENTS, READONLY
+ 27 .debug_aranges 00000030  0000000000000000  0000000000000000  00003667  2**0
+                  CONTENTS, READONLY, DEBUGGING, OCTETS
+ 28 .debug_info   00001566  0000000000000000  0000000000000000  00003697  2**0
+                  CONTENTS, READONLY, DEBUGGING, OCTETS
+ 29 .debug_abbrev 00000557  0000000000000000  0000000000000000  00004bfd  2**0
+                  CONTENTS, READONLY, DEBUGGING, OCTETS
+ 30 .debug_line   0000034b  0000000000000000  0000000000000000  00005154  2**0
+                  CONTENTS, READONLY, DEBUGGING, OCTETS
+ 31 .debug_str    000007b4  0000000000000000  0000000000000000  0000549f  2**0
+                  CONTENTS, READONLY, DEBUGGING, OCTETS
+ 32 .debug_line_str 000003b3  0000000000000000  0000000000000000  00005c53  2**0
+                  CONTENTS, READONLY, DEBUGGING, OCTETS
+ 33 .debug_loclists 000007bd  0000000000000000  0000000000000000  00006006  2**0
+                  CONTENTS, READONLY, DEBUGGING, OCTETS
+ 34 .debug_rnglists 000000ae  0000000000000000  0000000000000000  000067c3  2**0
+                  CONTENTS, READONLY, DEBUGGING, OCTETS
+
+Disassembly of section .init:
+
+0000000000001000 <_init>:
+    1000:	48 83 ec 08          	sub    $0x8,%rsp
+    1004:	48 8b 05 c5 2f 00 00 	mov    0x2fc5(%rip),%rax        # 3fd0 <__gmon_start__@Base>
+    100b:	48 85 c0             	test   %rax,%rax
+    100e:	74 02                	je     1012 <_init+0x12>
+    1010:	ff d0                	call   *%rax
+    1012:	48 83 c4 08          	add    $0x8,%rsp
+    1016:	c3                   	ret
+
+Disassembly of section .plt:
+
+0000000000001020 <puts@plt-0x10>:
+    1020:	ff 35 ca 2f 00 00    	push   0x2fca(%rip)        # 3ff0 <_GLOBAL_OFFSET_TABLE_+0x8>
+    1026:	ff 25 cc 2f 00 00    	jmp    *0x2fcc(%rip)        # 3ff8 <_GLOBAL_OFFSET_TABLE_+0x10>
+    102c:	0f 1f 40 00          	nopl   0x0(%rax)
+
+0000000000001030 <puts@plt>:
+    1030:	ff 25 ca 2f 00 00    	jmp    *0x2fca(%rip)        # 4000 <puts@GLIBC_2.2.5>
+    1036:	68 00 00 00 00       	push   $0x0
+    103b:	e9 e0 ff ff ff       	jmp    1020 <_init+0x20>
+
+0000000000001040 <printf@plt>:
+    1040:	ff 25 c2 2f 00 00    	jmp    *0x2fc2(%rip)        # 4008 <printf@GLIBC_2.2.5>
+    1046:	68 01 00 00 00       	push   $0x1
+    104b:	e9 d0 ff ff ff       	jmp    1020 <_init+0x20>
+
+0000000000001050 <malloc@plt>:
+    1050:	ff 25 ba 2f 00 00    	jmp    *0x2fba(%rip)        # 4010 <malloc@GLIBC_2.2.5>
+    1056:	68 02 00 00 00       	push   $0x2
+    105b:	e9 c0 ff ff ff       	jmp    1020 <_init+0x20>
+
+Disassembly of section .plt.got:
+
+0000000000001060 <__cxa_finalize@plt>:
+    1060:	ff 25 7a 2f 00 00    	jmp    *0x2f7a(%rip)        # 3fe0 <__cxa_finalize@GLIBC_2.2.5>
+    1066:	66 90                	xchg   %ax,%ax
+
+Disassembly of section .text:
+
+0000000000001070 <main>:
+    1070:	41 57                	push   %r15
+    1072:	48 8d 3d 87 0f 00 00 	lea    0xf87(%rip),%rdi        # 2000 <_fini+0xc84>
+    1079:	41 56                	push   %r14
+    107b:	41 55                	push   %r13
+        int32_t t0 = (x0 * x2 + x3 + 32) >> 6;
+        t0 = CLAMP(t0, 0, 255);
+        int32_t t1 = t0 + x1;
+        int32_t t2 = (t1 * x4 + x5 + 64) >> 7;
+        t2 = CLAMP(t2, 0, 255);
+        DeeployNetwork_output_0[i] = (int8_t) (t2 + -128);
+    107d:	41 bd 59 00 00 00    	mov    $0x59,%r13d
+
+#include "Network.h"
+#include "testinputs.h"
+#include "testoutputs.h"
+
+int main() {
+    1083:	41 54                	push   %r12
+    1085:	41 bc 43 fe ff ff    	mov    $0xfffffe43,%r12d
+    108b:	55                   	push   %rbp
+    108c:	53                   	push   %rbx
+    108d:	48 83 ec 08          	sub    $0x8,%rsp
+
+  printf("Initializing network...\r\n");
+    1091:	e8 9a ff ff ff       	call   1030 <puts@plt>
+  va_start(args, fmt);
+  int ret = vprintf(fmt, args);
+  va_end(args);
+  return ret;
+}
+void *deeploy_malloc(const size_t size) { return malloc(size); }
+    1096:	bf 00 02 00 00       	mov    $0x200,%edi
+    109b:	e8 b0 ff ff ff       	call   1050 <malloc@plt>
+    10a0:	bf 00 02 00 00       	mov    $0x200,%edi
+    10a5:	48 89 c5             	mov    %rax,%rbp
+}
+
+        }
+        
+        void InitNetwork(__attribute__((unused)) uint32_t core_id, __attribute__((unused)) uint32_t numThreads){
+        DeeployNetwork_input_0 = (int8_t*) deeploy_malloc(1 * 512);
+    10a8:	48 89 05 b1 35 00 00 	mov    %rax,0x35b1(%rip)        # 4660 <DeeployNetwork_input_0>
+    10af:	e8 9c ff ff ff       	call   1050 <malloc@plt>
+    10b4:	bf 00 02 00 00       	mov    $0x200,%edi
+    10b9:	48 89 c3             	mov    %rax,%rbx
+DeeployNetwork_input_1 = (int8_t*) deeploy_malloc(1 * 512);
+    10bc:	48 89 05 95 35 00 00 	mov    %rax,0x3595(%rip)        # 4658 <DeeployNetwork_input_1>
+    10c3:	e8 88 ff ff ff       	call   1050 <malloc@plt>
+
+  InitNetwork(0, 1);
+
+  for (uint32_t buf = 0; buf < DeeployNetwork_num_inputs; buf++) {
+    memcpy(DeeployNetwork_inputs[buf], testInputVector[buf],
+    10c8:	48 89 ef             	mov    %rbp,%rdi
+    10cb:	48 8d 35 6e 33 00 00 	lea    0x336e(%rip),%rsi        # 4440 <testInputVector0>
+    10d2:	b9 40 00 00 00       	mov    $0x40,%ecx
+    10d7:	f3 48 a5             	rep movsq %ds:(%rsi),%es:(%rdi)
+    10da:	48 89 df             	mov    %rbx,%rdi
+    10dd:	48 8d 35 5c 31 00 00 	lea    0x315c(%rip),%rsi        # 4240 <testInputVector1>
+    10e4:	b9 40 00 00 00       	mov    $0x40,%ecx
+    10e9:	f3 48 a5             	rep movsq %ds:(%rsi),%es:(%rdi)
+           DeeployNetwork_inputs_bytes[buf]);
+  }
+
+  printf("Running network...\r\n");
+    10ec:	48 8d 3d 26 0f 00 00 	lea    0xf26(%rip),%rdi        # 2019 <_fini+0xc9d>
+DeeployNetwork_output_0 = (int8_t*) deeploy_malloc(1 * 512);
+DeeployNetwork_inputs[0] = (void*) DeeployNetwork_input_0;DeeployNetwork_inputs[1] = (void*) DeeployNetwork_input_1;DeeployNetwork_outputs[0] = (void*) DeeployNetwork_output_0;
+    10f3:	48 89 2d 76 35 00 00 	mov    %rbp,0x3576(%rip)        # 4670 <DeeployNetwork_inputs>
+        DeeployNetwork_output_0[i] = (int8_t) (t2 + -128);
+    10fa:	bd 0f 03 00 00       	mov    $0x30f,%ebp
+DeeployNetwork_inputs[0] = (void*) DeeployNetwork_input_0;DeeployNetwork_inputs[1] = (void*) DeeployNetwork_input_1;DeeployNetwork_outputs[0] = (void*) DeeployNetwork_output_0;
+    10ff:	48 89 1d 72 35 00 00 	mov    %rbx,0x3572(%rip)        # 4678 <DeeployNetwork_inputs+0x8>
+        DeeployNetwork_output_0[i] = (int8_t) (t2 + -128);
+    1106:	bb 1b 00 00 00       	mov    $0x1b,%ebx
+DeeployNetwork_output_0 = (int8_t*) deeploy_malloc(1 * 512);
+    110b:	48 89 05 3e 35 00 00 	mov    %rax,0x353e(%rip)        # 4650 <DeeployNetwork_output_0>
+DeeployNetwork_inputs[0] = (void*) DeeployNetwork_input_0;DeeployNetwork_inputs[1] = (void*) DeeployNetwork_input_1;DeeployNetwork_outputs[0] = (void*) DeeployNetwork_output_0;
+    1112:	48 89 05 4f 35 00 00 	mov    %rax,0x354f(%rip)        # 4668 <DeeployNetwork_outputs>
+    1119:	e8 12 ff ff ff       	call   1030 <puts@plt>
+        int32_t x0 = (int32_t) DeeployNetwork_input_0[i] + 128;
+    111e:	48 8b 3d 3b 35 00 00 	mov    0x353b(%rip),%rdi        # 4660 <DeeployNetwork_input_0>
+        DeeployNetwork_output_0[i] = (int8_t) (t2 + -128);
+    1125:	ba 01 00 00 00       	mov    $0x1,%edx
+        int32_t x1 = (int32_t) DeeployNetwork_input_1[i] + 128;
+    112a:	48 8b 35 27 35 00 00 	mov    0x3527(%rip),%rsi        # 4658 <DeeployNetwork_input_1>
+        DeeployNetwork_output_0[i] = (int8_t) (t2 + -128);
+    1131:	48 8b 0d 18 35 00 00 	mov    0x3518(%rip),%rcx        # 4650 <DeeployNetwork_output_0>
+        int32_t x2 = (int32_t) DeeployNetwork_rqs0_mul_tensor[((i / (8 * 8)) % 8)];
+    1138:	4c 8d 1d c1 0f 00 00 	lea    0xfc1(%rip),%r11        # 2100 <DeeployNetwork_rqs0_mul_tensor>
+        int32_t x3 = (int32_t) DeeployNetwork_rqs0_add_tensor[((i / (8 * 8)) % 8)];
+    113f:	4c 8d 15 9a 0f 00 00 	lea    0xf9a(%rip),%r10        # 20e0 <DeeployNetwork_rqs0_add_tensor>
+        int32_t x4 = (int32_t) DeeployNetwork_rqs1_mul_tensor[((i / (8 * 8)) % 8)];
+    1146:	4c 8d 0d 73 0f 00 00 	lea    0xf73(%rip),%r9        # 20c0 <DeeployNetwork_rqs1_mul_tensor>
+        int32_t x5 = (int32_t) DeeployNetwork_rqs1_add_tensor[((i / (8 * 8)) % 8)];
+    114d:	4c 8d 05 4c 0f 00 00 	lea    0xf4c(%rip),%r8        # 20a0 <DeeployNetwork_rqs1_add_tensor>
+    1154:	eb 1d                	jmp    1173 <main+0x103>
+    1156:	66 2e 0f 1f 84 00 00 	cs nopw 0x0(%rax,%rax,1)
+    115d:	00 00 00 
+        int32_t x2 = (int32_t) DeeployNetwork_rqs0_mul_tensor[((i / (8 * 8)) % 8)];
+    1160:	c1 e8 06             	shr    $0x6,%eax
+    1163:	45 8b 2c 83          	mov    (%r11,%rax,4),%r13d
+        int32_t x3 = (int32_t) DeeployNetwork_rqs0_add_tensor[((i / (8 * 8)) % 8)];
+    1167:	45 8b 24 82          	mov    (%r10,%rax,4),%r12d
+        int32_t x4 = (int32_t) DeeployNetwork_rqs1_mul_tensor[((i / (8 * 8)) % 8)];
+    116b:	41 8b 1c 81          	mov    (%r9,%rax,4),%ebx
+        int32_t x5 = (int32_t) DeeployNetwork_rqs1_add_tensor[((i / (8 * 8)) % 8)];
+    116f:	41 8b 2c 80          	mov    (%r8,%rax,4),%ebp
+        int32_t x0 = (int32_t) DeeployNetwork_input_0[i] + 128;
+    1173:	0f be 44 17 ff       	movsbl -0x1(%rdi,%rdx,1),%eax
+    1178:	83 e8 80             	sub    $0xffffff80,%eax
+        int32_t t0 = (x0 * x2 + x3 + 32) >> 6;
+    117b:	41 0f af c5          	imul   %r13d,%eax
+    117f:	41 8d 44 04 20       	lea    0x20(%r12,%rax,1),%eax
+        t0 = CLAMP(t0, 0, 255);
+    1184:	41 bc 00 00 00 00    	mov    $0x0,%r12d
+        int32_t t0 = (x0 * x2 + x3 + 32) >> 6;
+    118a:	c1 f8 06             	sar    $0x6,%eax
+        t0 = CLAMP(t0, 0, 255);
+    118d:	41 0f 48 c4          	cmovs  %r12d,%eax
+        int32_t t1 = t0 + x1;
+    1191:	41 bc ff 00 00 00    	mov    $0xff,%r12d
+    1197:	44 39 e0             	cmp    %r12d,%eax
+    119a:	41 0f 4f c4          	cmovg  %r12d,%eax
+        int32_t x1 = (int32_t) DeeployNetwork_input_1[i] + 128;
+    119e:	44 0f be 64 16 ff    	movsbl -0x1(%rsi,%rdx,1),%r12d
+        int32_t t1 = t0 + x1;
+    11a4:	42 8d 84 20 80 00 00 	lea    0x80(%rax,%r12,1),%eax
+    11ab:	00 
+        int32_t t2 = (t1 * x4 + x5 + 64) >> 7;
+    11ac:	0f af c3             	imul   %ebx,%eax
+        t2 = CLAMP(t2, 0, 255);
+    11af:	bb 00 00 00 00       	mov    $0x0,%ebx
+        int32_t t2 = (t1 * x4 + x5 + 64) >> 7;
+    11b4:	8d 44 05 40          	lea    0x40(%rbp,%rax,1),%eax
+    11b8:	c1 f8 07             	sar    $0x7,%eax
+        t2 = CLAMP(t2, 0, 255);
+    11bb:	0f 48 c3             	cmovs  %ebx,%eax
+        DeeployNetwork_output_0[i] = (int8_t) (t2 + -128);
+    11be:	bb ff 00 00 00       	mov    $0xff,%ebx
+    11c3:	39 d8                	cmp    %ebx,%eax
+    11c5:	0f 4f c3             	cmovg  %ebx,%eax
+    11c8:	83 c0 80             	add    $0xffffff80,%eax
+    11cb:	88 44 11 ff          	mov    %al,-0x1(%rcx,%rdx,1)
+    11cf:	89 d0                	mov    %edx,%eax
+    for (uint32_t i = 0; i < 512; i++) {
+    11d1:	48 83 c2 01          	add    $0x1,%rdx
+    11d5:	48 81 fa 01 02 00 00 	cmp    $0x201,%rdx
+    11dc:	75 82                	jne    1160 <main+0xf0>
+    11de:	31 db                	xor    %ebx,%ebx
+    11e0:	45 31 e4             	xor    %r12d,%r12d
+    11e3:	4c 8d 2d 56 2e 00 00 	lea    0x2e56(%rip),%r13        # 4040 <testOutputVector0>
+      }
+#else
+      // RUNWANG: No margin for integer comparison
+      if (diff != 0) {
+        tot_err += 1;
+        printf("Expected: %4d  ", expected);
+    11ea:	4c 8d 3d 3c 0e 00 00 	lea    0xe3c(%rip),%r15        # 202d <_fini+0xcb1>
+    11f1:	eb 12                	jmp    1205 <main+0x195>
+    11f3:	0f 1f 44 00 00       	nopl   0x0(%rax,%rax,1)
+         i < DeeployNetwork_outputs_bytes[buf] / sizeof(OUTPUTTYPE); i++) {
+    11f8:	48 83 c3 01          	add    $0x1,%rbx
+    11fc:	48 81 fb 00 02 00 00 	cmp    $0x200,%rbx
+    1203:	74 5c                	je     1261 <main+0x1f1>
+      actual = ((OUTPUTTYPE *)DeeployNetwork_outputs[buf])[i];
+    1205:	48 8b 05 5c 34 00 00 	mov    0x345c(%rip),%rax        # 4668 <DeeployNetwork_outputs>
+      expected = ((OUTPUTTYPE *)testOutputVector[buf])[i];
+    120c:	41 0f be 74 1d 00    	movsbl 0x0(%r13,%rbx,1),%esi
+      actual = ((OUTPUTTYPE *)DeeployNetwork_outputs[buf])[i];
+    1212:	0f b6 2c 18          	movzbl (%rax,%rbx,1),%ebp
+      if (diff != 0) {
+    1216:	41 89 f6             	mov    %esi,%r14d
+    1219:	41 28 ee             	sub    %bpl,%r14b
+    121c:	74 da                	je     11f8 <main+0x188>
+        printf("Expected: %4d  ", expected);
+    121e:	4c 89 ff             	mov    %r15,%rdi
+    1221:	31 c0                	xor    %eax,%eax
+        tot_err += 1;
+    1223:	41 83 c4 01          	add    $0x1,%r12d
+        printf("Expected: %4d  ", expected);
+    1227:	e8 14 fe ff ff       	call   1040 <printf@plt>
+        printf("Actual: %4d  ", actual);
+    122c:	40 0f be f5          	movsbl %bpl,%esi
+    1230:	48 8d 3d 06 0e 00 00 	lea    0xe06(%rip),%rdi        # 203d <_fini+0xcc1>
+    1237:	31 c0                	xor    %eax,%eax
+    1239:	e8 02 fe ff ff       	call   1040 <printf@plt>
+        printf("Diff: %4d at Index %12u in Output %u\r\n", diff, i, buf);
+    123e:	89 da                	mov    %ebx,%edx
+    1240:	41 0f be f6          	movsbl %r14b,%esi
+    1244:	31 c9                	xor    %ecx,%ecx
+    1246:	48 8d 3d 1b 0e 00 00 	lea    0xe1b(%rip),%rdi        # 2068 <_fini+0xcec>
+    124d:	31 c0                	xor    %eax,%eax
+         i < DeeployNetwork_outputs_bytes[buf] / sizeof(OUTPUTTYPE); i++) {
+    124f:	48 83 c3 01          	add    $0x1,%rbx
+        printf("Diff: %4d at Index %12u in Output %u\r\n", diff, i, buf);
+    1253:	e8 e8 fd ff ff       	call   1040 <printf@plt>
+         i < DeeployNetwork_outputs_bytes[buf] / sizeof(OUTPUTTYPE); i++) {
+    1258:	48 81 fb 00 02 00 00 	cmp    $0x200,%rbx
+    125f:	75 a4                	jne    1205 <main+0x195>
+      }
+#endif
+    }
+  }
+
+  printf("Errors: %d out of %d \r\n", tot_err, tot);
+    1261:	44 89 e6             	mov    %r12d,%esi
+    1264:	ba 00 02 00 00       	mov    $0x200,%edx
+    1269:	48 8d 3d db 0d 00 00 	lea    0xddb(%rip),%rdi        # 204b <_fini+0xccf>
+    1270:	31 c0                	xor    %eax,%eax
+    1272:	e8 c9 fd ff ff       	call   1040 <printf@plt>
+
+  return tot_err;
+    1277:	48 83 c4 08          	add    $0x8,%rsp
+    127b:	44 89 e0             	mov    %r12d,%eax
+    127e:	5b                   	pop    %rbx
+    127f:	5d                   	pop    %rbp
+    1280:	41 5c                	pop    %r12
+    1282:	41 5d                	pop    %r13
+    1284:	41 5e                	pop    %r14
+    1286:	41 5f                	pop    %r15
+    1288:	c3                   	ret
+    1289:	0f 1f 80 00 00 00 00 	nopl   0x0(%rax)
+
+0000000000001290 <_start>:
+    1290:	31 ed                	xor    %ebp,%ebp
+    1292:	49 89 d1             	mov    %rdx,%r9
+    1295:	5e                   	pop    %rsi
+    1296:	48 89 e2             	mov    %rsp,%rdx
+    1299:	48 83 e4 f0          	and    $0xfffffffffffffff0,%rsp
+    129d:	50                   	push   %rax
+    129e:	54                   	push   %rsp
+    129f:	45 31 c0             	xor    %r8d,%r8d
+    12a2:	31 c9                	xor    %ecx,%ecx
+    12a4:	48 8d 3d c5 fd ff ff 	lea    -0x23b(%rip),%rdi        # 1070 <main>
+    12ab:	ff 15 0f 2d 00 00    	call   *0x2d0f(%rip)        # 3fc0 <__libc_start_main@GLIBC_2.34>
+    12b1:	f4                   	hlt
+    12b2:	66 2e 0f 1f 84 00 00 	cs nopw 0x0(%rax,%rax,1)
+    12b9:	00 00 00 
+    12bc:	0f 1f 40 00          	nopl   0x0(%rax)
+
+00000000000012c0 <deregister_tm_clones>:
+    12c0:	48 8d 3d 79 33 00 00 	lea    0x3379(%rip),%rdi        # 4640 <__TMC_END__>
+    12c7:	48 8d 05 72 33 00 00 	lea    0x3372(%rip),%rax        # 4640 <__TMC_END__>
+    12ce:	48 39 f8             	cmp    %rdi,%rax
+    12d1:	74 15                	je     12e8 <deregister_tm_clones+0x28>
+    12d3:	48 8b 05 ee 2c 00 00 	mov    0x2cee(%rip),%rax        # 3fc8 <_ITM_deregisterTMCloneTable@Base>
+    12da:	48 85 c0             	test   %rax,%rax
+    12dd:	74 09                	je     12e8 <deregister_tm_clones+0x28>
+    12df:	ff e0                	jmp    *%rax
+    12e1:	0f 1f 80 00 00 00 00 	nopl   0x0(%rax)
+    12e8:	c3                   	ret
+    12e9:	0f 1f 80 00 00 00 00 	nopl   0x0(%rax)
+
+00000000000012f0 <register_tm_clones>:
+    12f0:	48 8d 3d 49 33 00 00 	lea    0x3349(%rip),%rdi        # 4640 <__TMC_END__>
+    12f7:	48 8d 35 42 33 00 00 	lea    0x3342(%rip),%rsi        # 4640 <__TMC_END__>
+    12fe:	48 29 fe             	sub    %rdi,%rsi
+    1301:	48 89 f0             	mov    %rsi,%rax
+    1304:	48 c1 ee 3f          	shr    $0x3f,%rsi
+    1308:	48 c1 f8 03          	sar    $0x3,%rax
+    130c:	48 01 c6             	add    %rax,%rsi
+    130f:	48 d1 fe             	sar    %rsi
+    1312:	74 14                	je     1328 <register_tm_clones+0x38>
+    1314:	48 8b 05 bd 2c 00 00 	mov    0x2cbd(%rip),%rax        # 3fd8 <_ITM_registerTMCloneTable@Base>
+    131b:	48 85 c0             	test   %rax,%rax
+    131e:	74 08                	je     1328 <register_tm_clones+0x38>
+    1320:	ff e0                	jmp    *%rax
+    1322:	66 0f 1f 44 00 00    	nopw   0x0(%rax,%rax,1)
+    1328:	c3                   	ret
+    1329:	0f 1f 80 00 00 00 00 	nopl   0x0(%rax)
+
+0000000000001330 <__do_global_dtors_aux>:
+    1330:	f3 0f 1e fa          	endbr64
+    1334:	80 3d 05 33 00 00 00 	cmpb   $0x0,0x3305(%rip)        # 4640 <__TMC_END__>
+    133b:	75 2b                	jne    1368 <__do_global_dtors_aux+0x38>
+    133d:	55                   	push   %rbp
+    133e:	48 83 3d 9a 2c 00 00 	cmpq   $0x0,0x2c9a(%rip)        # 3fe0 <__cxa_finalize@GLIBC_2.2.5>
+    1345:	00 
+    1346:	48 89 e5             	mov    %rsp,%rbp
+    1349:	74 0c                	je     1357 <__do_global_dtors_aux+0x27>
+    134b:	48 8b 3d ce 2c 00 00 	mov    0x2cce(%rip),%rdi        # 4020 <__dso_handle>
+    1352:	e8 09 fd ff ff       	call   1060 <__cxa_finalize@plt>
+    1357:	e8 64 ff ff ff       	call   12c0 <deregister_tm_clones>
+    135c:	c6 05 dd 32 00 00 01 	movb   $0x1,0x32dd(%rip)        # 4640 <__TMC_END__>
+    1363:	5d                   	pop    %rbp
+    1364:	c3                   	ret
+    1365:	0f 1f 00             	nopl   (%rax)
+    1368:	c3                   	ret
+    1369:	0f 1f 80 00 00 00 00 	nopl   0x0(%rax)
+
+0000000000001370 <frame_dummy>:
+    1370:	f3 0f 1e fa          	endbr64
+    1374:	e9 77 ff ff ff       	jmp    12f0 <register_tm_clones>
+
+Disassembly of section .fini:
+
+000000000000137c <_fini>:
+    137c:	48 83 ec 08          	sub    $0x8,%rsp
+    1380:	48 83 c4 08          	add    $0x8,%rsp
+    1384:	c3                   	ret
@@ -0,0 +1,2460 @@
+In archive /root/package/DeeployTest/TEST_GENERIC/build_master/lib/libdeeploybasic.a:
+
+AveragePool_fp32.c.o:     file format elf64-x86-64
+
+Sections:
+Idx Name          Size      VMA               LMA               File off  Algn
+  0 .text         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+  1 .data         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, DATA
+  2 .bss          00000000  0000000000000000  0000000000000000  00000040  2**0
+                  ALLOC
+  3 .gnu.debuglto_.debug_info 000002c6  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  4 .gnu.debuglto_.debug_abbrev 000000b6  0000000000000000  0000000000000000  00000306  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  5 .gnu.debuglto_.debug_line 00000056  0000000000000000  0000000000000000  000003bc  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  6 .gnu.debuglto_.debug_str 0000020b  0000000000000000  0000000000000000  00000412  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  7 .gnu.debuglto_.debug_line_str 00000138  0000000000000000  0000000000000000  0000061d  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  8 .gnu.lto_.profile.84a45da8d70b4c42 0000000f  0000000000000000  0000000000000000  00000755  2**0
+                  CONTENTS, READONLY, EXCLUDE
+  9 .gnu.lto_.icf.84a45da8d70b4c42 0000002a  0000000000000000  0000000000000000  00000764  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 10 .gnu.lto_.ipa_sra.84a45da8d70b4c42 0000001e  0000000000000000  0000000000000000  0000078e  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 11 .gnu.lto_.inline.84a45da8d70b4c42 00000182  0000000000000000  0000000000000000  000007ac  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 12 .gnu.lto_.jmpfuncs.84a45da8d70b4c42 00000031  0000000000000000  0000000000000000  0000092e  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 13 .gnu.lto_.pureconst.84a45da8d70b4c42 00000014  0000000000000000  0000000000000000  0000095f  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 14 .gnu.lto_.ipa_modref.84a45da8d70b4c42 00000030  0000000000000000  0000000000000000  00000973  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 15 .gnu.lto_.lto.84a45da8d70b4c42 00000008  0000000000000000  0000000000000000  000009a3  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 16 .gnu.lto_AveragePool2d_fp32_fp32.13.84a45da8d70b4c42 000009f5  0000000000000000  0000000000000000  000009ab  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 17 .gnu.lto_AveragePool1d_fp32_fp32.14.84a45da8d70b4c42 000007d1  0000000000000000  0000000000000000  000013a0  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 18 .gnu.lto_.symbol_nodes.84a45da8d70b4c42 00000030  0000000000000000  0000000000000000  00001b71  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 19 .gnu.lto_.refs.84a45da8d70b4c42 0000000e  0000000000000000  0000000000000000  00001ba1  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 20 .gnu.lto_.decls.84a45da8d70b4c42 00000454  0000000000000000  0000000000000000  00001baf  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 21 .gnu.lto_.symtab.84a45da8d70b4c42 0000004e  0000000000000000  0000000000000000  00002003  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 22 .gnu.lto_.ext_symtab.84a45da8d70b4c42 00000005  0000000000000000  0000000000000000  00002051  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 23 .gnu.lto_.opts 000000d3  0000000000000000  0000000000000000  00002056  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 24 .comment      00000028  0000000000000000  0000000000000000  00002129  2**0
+                  CONTENTS, READONLY
+ 25 .note.GNU-stack 00000000  0000000000000000  0000000000000000  00002151  2**0
+                  CONTENTS, READONLY
+
+BatchNorm_fp32.c.o:     file format elf64-x86-64
+
+Sections:
+Idx Name          Size      VMA               LMA               File off  Algn
+  0 .text         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+  1 .data         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, DATA
+  2 .bss          00000000  0000000000000000  0000000000000000  00000040  2**0
+                  ALLOC
+  3 .gnu.debuglto_.debug_info 00000192  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  4 .gnu.debuglto_.debug_abbrev 000000bc  0000000000000000  0000000000000000  000001d2  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  5 .gnu.debuglto_.debug_line 0000004c  0000000000000000  0000000000000000  0000028e  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  6 .gnu.debuglto_.debug_str 00000187  0000000000000000  0000000000000000  000002da  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  7 .gnu.debuglto_.debug_line_str 00000123  0000000000000000  0000000000000000  00000461  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  8 .gnu.lto_.profile.e1757d9fd9771d2f 0000000f  0000000000000000  0000000000000000  00000584  2**0
+                  CONTENTS, READONLY, EXCLUDE
+  9 .gnu.lto_.icf.e1757d9fd9771d2f 00000021  0000000000000000  0000000000000000  00000593  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 10 .gnu.lto_.ipa_sra.e1757d9fd9771d2f 00000022  0000000000000000  0000000000000000  000005b4  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 11 .gnu.lto_.inline.e1757d9fd9771d2f 00000064  0000000000000000  0000000000000000  000005d6  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 12 .gnu.lto_.jmpfuncs.e1757d9fd9771d2f 0000002b  0000000000000000  0000000000000000  0000063a  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 13 .gnu.lto_.pureconst.e1757d9fd9771d2f 00000011  0000000000000000  0000000000000000  00000665  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 14 .gnu.lto_.ipa_modref.e1757d9fd9771d2f 00000040  0000000000000000  0000000000000000  00000676  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 15 .gnu.lto_.lto.e1757d9fd9771d2f 00000008  0000000000000000  0000000000000000  000006b6  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 16 .gnu.lto_BatchNorm_fp32.13.e1757d9fd9771d2f 000005e8  0000000000000000  0000000000000000  000006be  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 17 .gnu.lto_.symbol_nodes.e1757d9fd9771d2f 00000047  0000000000000000  0000000000000000  00000ca6  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 18 .gnu.lto_.refs.e1757d9fd9771d2f 0000000e  0000000000000000  0000000000000000  00000ced  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 19 .gnu.lto_.decls.e1757d9fd9771d2f 00000416  0000000000000000  0000000000000000  00000cfb  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 20 .gnu.lto_.symtab.e1757d9fd9771d2f 00000033  0000000000000000  0000000000000000  00001111  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 21 .gnu.lto_.ext_symtab.e1757d9fd9771d2f 00000005  0000000000000000  0000000000000000  00001144  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 22 .gnu.lto_.opts 000000d3  0000000000000000  0000000000000000  00001149  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 23 .comment      00000028  0000000000000000  0000000000000000  0000121c  2**0
+                  CONTENTS, READONLY
+ 24 .note.GNU-stack 00000000  0000000000000000  0000000000000000  00001244  2**0
+                  CONTENTS, READONLY
+
+Ceil_fp32.c.o:     file format elf64-x86-64
+
+Sections:
+Idx Name          Size      VMA               LMA               File off  Algn
+  0 .text         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+  1 .data         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, DATA
+  2 .bss          00000000  0000000000000000  0000000000000000  00000040  2**0
+                  ALLOC
+  3 .gnu.debuglto_.debug_info 000000e3  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  4 .gnu.debuglto_.debug_abbrev 00000094  0000000000000000  0000000000000000  00000123  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  5 .gnu.debuglto_.debug_line 00000056  0000000000000000  0000000000000000  000001b7  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  6 .gnu.debuglto_.debug_str 0000015d  0000000000000000  0000000000000000  0000020d  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  7 .gnu.debuglto_.debug_line_str 00000127  0000000000000000  0000000000000000  0000036a  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  8 .gnu.lto_.profile.304059bbe7dbc29e 0000000f  0000000000000000  0000000000000000  00000491  2**0
+                  CONTENTS, READONLY, EXCLUDE
+  9 .gnu.lto_.icf.304059bbe7dbc29e 00000022  0000000000000000  0000000000000000  000004a0  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 10 .gnu.lto_.ipa_sra.304059bbe7dbc29e 00000023  0000000000000000  0000000000000000  000004c2  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 11 .gnu.lto_.inline.304059bbe7dbc29e 0000004d  0000000000000000  0000000000000000  000004e5  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 12 .gnu.lto_.jmpfuncs.304059bbe7dbc29e 00000024  0000000000000000  0000000000000000  00000532  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 13 .gnu.lto_.pureconst.304059bbe7dbc29e 00000011  0000000000000000  0000000000000000  00000556  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 14 .gnu.lto_.ipa_modref.304059bbe7dbc29e 00000028  0000000000000000  0000000000000000  00000567  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 15 .gnu.lto_.lto.304059bbe7dbc29e 00000008  0000000000000000  0000000000000000  0000058f  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 16 .gnu.lto_Ceil_fp32_fp32.13.304059bbe7dbc29e 0000027e  0000000000000000  0000000000000000  00000597  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 17 .gnu.lto_.symbol_nodes.304059bbe7dbc29e 00000048  0000000000000000  0000000000000000  00000815  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 18 .gnu.lto_.refs.304059bbe7dbc29e 0000000e  0000000000000000  0000000000000000  0000085d  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 19 .gnu.lto_.decls.304059bbe7dbc29e 000003bf  0000000000000000  0000000000000000  0000086b  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 20 .gnu.lto_.symtab.304059bbe7dbc29e 00000033  0000000000000000  0000000000000000  00000c2a  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 21 .gnu.lto_.ext_symtab.304059bbe7dbc29e 00000005  0000000000000000  0000000000000000  00000c5d  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 22 .gnu.lto_.opts 000000d3  0000000000000000  0000000000000000  00000c62  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 23 .comment      00000028  0000000000000000  0000000000000000  00000d35  2**0
+                  CONTENTS, READONLY
+ 24 .note.GNU-stack 00000000  0000000000000000  0000000000000000  00000d5d  2**0
+                  CONTENTS, READONLY
+
+Clip_fp32.c.o:     file format elf64-x86-64
+
+Sections:
+Idx Name          Size      VMA               LMA               File off  Algn
+  0 .text         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+  1 .data         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, DATA
+  2 .bss          00000000  0000000000000000  0000000000000000  00000040  2**0
+                  ALLOC
+  3 .gnu.debuglto_.debug_info 0000011a  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  4 .gnu.debuglto_.debug_abbrev 00000095  0000000000000000  0000000000000000  0000015a  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  5 .gnu.debuglto_.debug_line 00000056  0000000000000000  0000000000000000  000001ef  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  6 .gnu.debuglto_.debug_str 00000173  0000000000000000  0000000000000000  00000245  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  7 .gnu.debuglto_.debug_line_str 00000127  0000000000000000  0000000000000000  000003b8  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  8 .gnu.lto_.profile.e5e9dab5b5c2f4eb 0000000f  0000000000000000  0000000000000000  000004df  2**0
+                  CONTENTS, READONLY, EXCLUDE
+  9 .gnu.lto_.icf.e5e9dab5b5c2f4eb 00000022  0000000000000000  0000000000000000  000004ee  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 10 .gnu.lto_.ipa_sra.e5e9dab5b5c2f4eb 0000002c  0000000000000000  0000000000000000  00000510  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 11 .gnu.lto_.inline.e5e9dab5b5c2f4eb 00000052  0000000000000000  0000000000000000  0000053c  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 12 .gnu.lto_.jmpfuncs.e5e9dab5b5c2f4eb 0000003c  0000000000000000  0000000000000000  0000058e  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 13 .gnu.lto_.pureconst.e5e9dab5b5c2f4eb 00000011  0000000000000000  0000000000000000  000005ca  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 14 .gnu.lto_.ipa_modref.e5e9dab5b5c2f4eb 0000002a  0000000000000000  0000000000000000  000005db  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 15 .gnu.lto_.lto.e5e9dab5b5c2f4eb 00000008  0000000000000000  0000000000000000  00000605  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 16 .gnu.lto_Clip_fp32_fp32.13.e5e9dab5b5c2f4eb 000002c7  0000000000000000  0000000000000000  0000060d  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 17 .gnu.lto_.symbol_nodes.e5e9dab5b5c2f4eb 00000054  0000000000000000  0000000000000000  000008d4  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 18 .gnu.lto_.refs.e5e9dab5b5c2f4eb 0000000e  0000000000000000  0000000000000000  00000928  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 19 .gnu.lto_.decls.e5e9dab5b5c2f4eb 0000041f  0000000000000000  0000000000000000  00000936  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 20 .gnu.lto_.symtab.e5e9dab5b5c2f4eb 00000048  0000000000000000  0000000000000000  00000d55  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 21 .gnu.lto_.ext_symtab.e5e9dab5b5c2f4eb 00000007  0000000000000000  0000000000000000  00000d9d  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 22 .gnu.lto_.opts 000000d3  0000000000000000  0000000000000000  00000da4  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 23 .comment      00000028  0000000000000000  0000000000000000  00000e77  2**0
+                  CONTENTS, READONLY
+ 24 .note.GNU-stack 00000000  0000000000000000  0000000000000000  00000e9f  2**0
+                  CONTENTS, READONLY
+
+ConvTranspose1d_fp32.c.o:     file format elf64-x86-64
+
+Sections:
+Idx Name          Size      VMA               LMA               File off  Algn
+  0 .text         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+  1 .data         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, DATA
+  2 .bss          00000000  0000000000000000  0000000000000000  00000040  2**0
+                  ALLOC
+  3 .gnu.debuglto_.debug_info 000001ad  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  4 .gnu.debuglto_.debug_abbrev 000000a4  0000000000000000  0000000000000000  000001ed  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  5 .gnu.debuglto_.debug_line 00000051  0000000000000000  0000000000000000  00000291  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  6 .gnu.debuglto_.debug_str 0000019e  0000000000000000  0000000000000000  000002e2  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  7 .gnu.debuglto_.debug_line_str 00000132  0000000000000000  0000000000000000  00000480  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  8 .gnu.lto_.profile.ed49008544ef9146 0000000f  0000000000000000  0000000000000000  000005b2  2**0
+                  CONTENTS, READONLY, EXCLUDE
+  9 .gnu.lto_.icf.ed49008544ef9146 0000002c  0000000000000000  0000000000000000  000005c1  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 10 .gnu.lto_.ipa_sra.ed49008544ef9146 00000019  0000000000000000  0000000000000000  000005ed  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 11 .gnu.lto_.inline.ed49008544ef9146 000000a1  0000000000000000  0000000000000000  00000606  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 12 .gnu.lto_.jmpfuncs.ed49008544ef9146 0000002f  0000000000000000  0000000000000000  000006a7  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 13 .gnu.lto_.pureconst.ed49008544ef9146 00000011  0000000000000000  0000000000000000  000006d6  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 14 .gnu.lto_.ipa_modref.ed49008544ef9146 00000044  0000000000000000  0000000000000000  000006e7  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 15 .gnu.lto_.lto.ed49008544ef9146 00000008  0000000000000000  0000000000000000  0000072b  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 16 .gnu.lto_ConvTranspose1d_fp32.13.ed49008544ef9146 0000085e  0000000000000000  0000000000000000  00000733  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 17 .gnu.lto_.symbol_nodes.ed49008544ef9146 00000025  0000000000000000  0000000000000000  00000f91  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 18 .gnu.lto_.refs.ed49008544ef9146 0000000e  0000000000000000  0000000000000000  00000fb6  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 19 .gnu.lto_.decls.ed49008544ef9146 0000039e  0000000000000000  0000000000000000  00000fc4  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 20 .gnu.lto_.symtab.ed49008544ef9146 00000024  0000000000000000  0000000000000000  00001362  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 21 .gnu.lto_.ext_symtab.ed49008544ef9146 00000003  0000000000000000  0000000000000000  00001386  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 22 .gnu.lto_.opts 000000d3  0000000000000000  0000000000000000  00001389  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 23 .comment      00000028  0000000000000000  0000000000000000  0000145c  2**0
+                  CONTENTS, READONLY
+ 24 .note.GNU-stack 00000000  0000000000000000  0000000000000000  00001484  2**0
+                  CONTENTS, READONLY
+
+Convolution_fp32.c.o:     file format elf64-x86-64
+
+Sections:
+Idx Name          Size      VMA               LMA               File off  Algn
+  0 .text         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+  1 .data         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, DATA
+  2 .bss          00000000  0000000000000000  0000000000000000  00000040  2**0
+                  ALLOC
+  3 .gnu.debuglto_.debug_info 00000273  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  4 .gnu.debuglto_.debug_abbrev 000000bd  0000000000000000  0000000000000000  000002b3  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  5 .gnu.debuglto_.debug_line 00000051  0000000000000000  0000000000000000  00000370  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  6 .gnu.debuglto_.debug_str 000001da  0000000000000000  0000000000000000  000003c1  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  7 .gnu.debuglto_.debug_line_str 0000012a  0000000000000000  0000000000000000  0000059b  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  8 .gnu.lto_.profile.af3db790703f8bc7 0000000f  0000000000000000  0000000000000000  000006c5  2**0
+                  CONTENTS, READONLY, EXCLUDE
+  9 .gnu.lto_.icf.af3db790703f8bc7 00000033  0000000000000000  0000000000000000  000006d4  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 10 .gnu.lto_.ipa_sra.af3db790703f8bc7 0000001e  0000000000000000  0000000000000000  00000707  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 11 .gnu.lto_.inline.af3db790703f8bc7 0000012e  0000000000000000  0000000000000000  00000725  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 12 .gnu.lto_.jmpfuncs.af3db790703f8bc7 0000003e  0000000000000000  0000000000000000  00000853  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 13 .gnu.lto_.pureconst.af3db790703f8bc7 00000014  0000000000000000  0000000000000000  00000891  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 14 .gnu.lto_.ipa_modref.af3db790703f8bc7 0000004d  0000000000000000  0000000000000000  000008a5  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 15 .gnu.lto_.lto.af3db790703f8bc7 00000008  0000000000000000  0000000000000000  000008f2  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 16 .gnu.lto_Conv2d_fp32_fp32_fp32_NCHW.13.af3db790703f8bc7 00000aa3  0000000000000000  0000000000000000  000008fa  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 17 .gnu.lto_Conv1d_fp32_fp32_fp32.14.af3db790703f8bc7 0000069d  0000000000000000  0000000000000000  0000139d  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 18 .gnu.lto_.symbol_nodes.af3db790703f8bc7 00000030  0000000000000000  0000000000000000  00001a3a  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 19 .gnu.lto_.refs.af3db790703f8bc7 0000000e  0000000000000000  0000000000000000  00001a6a  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 20 .gnu.lto_.decls.af3db790703f8bc7 0000047f  0000000000000000  0000000000000000  00001a78  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 21 .gnu.lto_.symtab.af3db790703f8bc7 0000004f  0000000000000000  0000000000000000  00001ef7  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 22 .gnu.lto_.ext_symtab.af3db790703f8bc7 00000005  0000000000000000  0000000000000000  00001f46  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 23 .gnu.lto_.opts 000000d3  0000000000000000  0000000000000000  00001f4b  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 24 .comment      00000028  0000000000000000  0000000000000000  0000201e  2**0
+                  CONTENTS, READONLY
+ 25 .note.GNU-stack 00000000  0000000000000000  0000000000000000  00002046  2**0
+                  CONTENTS, READONLY
+
+Convolution_s8.c.o:     file format elf64-x86-64
+
+Sections:
+Idx Name          Size      VMA               LMA               File off  Algn
+  0 .text         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+  1 .data         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, DATA
+  2 .bss          00000000  0000000000000000  0000000000000000  00000040  2**0
+                  ALLOC
+  3 .gnu.debuglto_.debug_info 000001b0  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  4 .gnu.debuglto_.debug_abbrev 000000a1  0000000000000000  0000000000000000  000001f0  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  5 .gnu.debuglto_.debug_line 0000004d  0000000000000000  0000000000000000  00000291  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  6 .gnu.debuglto_.debug_str 0000019b  0000000000000000  0000000000000000  000002de  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  7 .gnu.debuglto_.debug_line_str 0000010a  0000000000000000  0000000000000000  00000479  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  8 .gnu.lto_.profile.337c7a88dd4803a8 0000000f  0000000000000000  0000000000000000  00000583  2**0
+                  CONTENTS, READONLY, EXCLUDE
+  9 .gnu.lto_.icf.337c7a88dd4803a8 00000021  0000000000000000  0000000000000000  00000592  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 10 .gnu.lto_.ipa_sra.337c7a88dd4803a8 00000019  0000000000000000  0000000000000000  000005b3  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 11 .gnu.lto_.inline.337c7a88dd4803a8 00000096  0000000000000000  0000000000000000  000005cc  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 12 .gnu.lto_.jmpfuncs.337c7a88dd4803a8 0000002f  0000000000000000  0000000000000000  00000662  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 13 .gnu.lto_.pureconst.337c7a88dd4803a8 00000011  0000000000000000  0000000000000000  00000691  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 14 .gnu.lto_.ipa_modref.337c7a88dd4803a8 00000034  0000000000000000  0000000000000000  000006a2  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 15 .gnu.lto_.lto.337c7a88dd4803a8 00000008  0000000000000000  0000000000000000  000006d6  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 16 .gnu.lto_Conv2d_s8_s8_s32_NCHW.13.337c7a88dd4803a8 0000074c  0000000000000000  0000000000000000  000006de  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 17 .gnu.lto_.symbol_nodes.337c7a88dd4803a8 00000024  0000000000000000  0000000000000000  00000e2a  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 18 .gnu.lto_.refs.337c7a88dd4803a8 0000000e  0000000000000000  0000000000000000  00000e4e  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 19 .gnu.lto_.decls.337c7a88dd4803a8 000003c4  0000000000000000  0000000000000000  00000e5c  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 20 .gnu.lto_.symtab.337c7a88dd4803a8 00000025  0000000000000000  0000000000000000  00001220  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 21 .gnu.lto_.ext_symtab.337c7a88dd4803a8 00000003  0000000000000000  0000000000000000  00001245  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 22 .gnu.lto_.opts 000000d3  0000000000000000  0000000000000000  00001248  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 23 .comment      00000028  0000000000000000  0000000000000000  0000131b  2**0
+                  CONTENTS, READONLY
+ 24 .note.GNU-stack 00000000  0000000000000000  0000000000000000  00001343  2**0
+                  CONTENTS, READONLY
+
+DWConvolution_fp32.c.o:     file format elf64-x86-64
+
+Sections:
+Idx Name          Size      VMA               LMA               File off  Algn
+  0 .text         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+  1 .data         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, DATA
+  2 .bss          00000000  0000000000000000  0000000000000000  00000040  2**0
+                  ALLOC
+  3 .gnu.debuglto_.debug_info 000001af  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  4 .gnu.debuglto_.debug_abbrev 000000ad  0000000000000000  0000000000000000  000001ef  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  5 .gnu.debuglto_.debug_line 00000051  0000000000000000  0000000000000000  0000029c  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  6 .gnu.debuglto_.debug_str 00000199  0000000000000000  0000000000000000  000002ed  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  7 .gnu.debuglto_.debug_line_str 0000012e  0000000000000000  0000000000000000  00000486  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  8 .gnu.lto_.profile.3f903e523157823c 0000000f  0000000000000000  0000000000000000  000005b4  2**0
+                  CONTENTS, READONLY, EXCLUDE
+  9 .gnu.lto_.icf.3f903e523157823c 00000023  0000000000000000  0000000000000000  000005c3  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 10 .gnu.lto_.ipa_sra.3f903e523157823c 00000019  0000000000000000  0000000000000000  000005e6  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 11 .gnu.lto_.inline.3f903e523157823c 000000dc  0000000000000000  0000000000000000  000005ff  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 12 .gnu.lto_.jmpfuncs.3f903e523157823c 0000002f  0000000000000000  0000000000000000  000006db  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 13 .gnu.lto_.pureconst.3f903e523157823c 00000011  0000000000000000  0000000000000000  0000070a  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 14 .gnu.lto_.ipa_modref.3f903e523157823c 0000003a  0000000000000000  0000000000000000  0000071b  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 15 .gnu.lto_.lto.3f903e523157823c 00000008  0000000000000000  0000000000000000  00000755  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 16 .gnu.lto_DWConv2d_fp32_fp32_fp32_NCHW.13.3f903e523157823c 00000af4  0000000000000000  0000000000000000  0000075d  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 17 .gnu.lto_.symbol_nodes.3f903e523157823c 00000024  0000000000000000  0000000000000000  00001251  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 18 .gnu.lto_.refs.3f903e523157823c 0000000e  0000000000000000  0000000000000000  00001275  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 19 .gnu.lto_.decls.3f903e523157823c 000003e5  0000000000000000  0000000000000000  00001283  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 20 .gnu.lto_.symtab.3f903e523157823c 0000002c  0000000000000000  0000000000000000  00001668  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 21 .gnu.lto_.ext_symtab.3f903e523157823c 00000003  0000000000000000  0000000000000000  00001694  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 22 .gnu.lto_.opts 000000d3  0000000000000000  0000000000000000  00001697  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 23 .comment      00000028  0000000000000000  0000000000000000  0000176a  2**0
+                  CONTENTS, READONLY
+ 24 .note.GNU-stack 00000000  0000000000000000  0000000000000000  00001792  2**0
+                  CONTENTS, READONLY
+
+DWConvolution_s8.c.o:     file format elf64-x86-64
+
+Sections:
+Idx Name          Size      VMA               LMA               File off  Algn
+  0 .text         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+  1 .data         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, DATA
+  2 .bss          00000000  0000000000000000  0000000000000000  00000040  2**0
+                  ALLOC
+  3 .gnu.debuglto_.debug_info 000001a7  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  4 .gnu.debuglto_.debug_abbrev 000000a1  0000000000000000  0000000000000000  000001e7  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  5 .gnu.debuglto_.debug_line 0000004d  0000000000000000  0000000000000000  00000288  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  6 .gnu.debuglto_.debug_str 0000019d  0000000000000000  0000000000000000  000002d5  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  7 .gnu.debuglto_.debug_line_str 0000010e  0000000000000000  0000000000000000  00000472  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  8 .gnu.lto_.profile.4cc1131430ac9578 0000000f  0000000000000000  0000000000000000  00000580  2**0
+                  CONTENTS, READONLY, EXCLUDE
+  9 .gnu.lto_.icf.4cc1131430ac9578 00000021  0000000000000000  0000000000000000  0000058f  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 10 .gnu.lto_.ipa_sra.4cc1131430ac9578 00000019  0000000000000000  0000000000000000  000005b0  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 11 .gnu.lto_.inline.4cc1131430ac9578 00000089  0000000000000000  0000000000000000  000005c9  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 12 .gnu.lto_.jmpfuncs.4cc1131430ac9578 00000030  0000000000000000  0000000000000000  00000652  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 13 .gnu.lto_.pureconst.4cc1131430ac9578 00000011  0000000000000000  0000000000000000  00000682  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 14 .gnu.lto_.ipa_modref.4cc1131430ac9578 00000035  0000000000000000  0000000000000000  00000693  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 15 .gnu.lto_.lto.4cc1131430ac9578 00000008  0000000000000000  0000000000000000  000006c8  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 16 .gnu.lto_DWConv2d_s8_s8_s32_NCHW.13.4cc1131430ac9578 000006cf  0000000000000000  0000000000000000  000006d0  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 17 .gnu.lto_.symbol_nodes.4cc1131430ac9578 00000025  0000000000000000  0000000000000000  00000d9f  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 18 .gnu.lto_.refs.4cc1131430ac9578 0000000e  0000000000000000  0000000000000000  00000dc4  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 19 .gnu.lto_.decls.4cc1131430ac9578 000003c2  0000000000000000  0000000000000000  00000dd2  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 20 .gnu.lto_.symtab.4cc1131430ac9578 00000027  0000000000000000  0000000000000000  00001194  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 21 .gnu.lto_.ext_symtab.4cc1131430ac9578 00000003  0000000000000000  0000000000000000  000011bb  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 22 .gnu.lto_.opts 000000d3  0000000000000000  0000000000000000  000011be  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 23 .comment      00000028  0000000000000000  0000000000000000  00001291  2**0
+                  CONTENTS, READONLY
+ 24 .note.GNU-stack 00000000  0000000000000000  0000000000000000  000012b9  2**0
+                  CONTENTS, READONLY
+
+Div_fp32.c.o:     file format elf64-x86-64
+
+Sections:
+Idx Name          Size      VMA               LMA               File off  Algn
+  0 .text         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+  1 .data         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, DATA
+  2 .bss          00000000  0000000000000000  0000000000000000  00000040  2**0
+                  ALLOC
+  3 .gnu.debuglto_.debug_info 000000db  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  4 .gnu.debuglto_.debug_abbrev 00000075  0000000000000000  0000000000000000  0000011b  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  5 .gnu.debuglto_.debug_line 00000051  0000000000000000  0000000000000000  00000190  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  6 .gnu.debuglto_.debug_str 00000167  0000000000000000  0000000000000000  000001e1  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  7 .gnu.debuglto_.debug_line_str 00000119  0000000000000000  0000000000000000  00000348  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  8 .gnu.lto_.profile.dd7fd3d681cdc9c6 0000000f  0000000000000000  0000000000000000  00000461  2**0
+                  CONTENTS, READONLY, EXCLUDE
+  9 .gnu.lto_.icf.dd7fd3d681cdc9c6 0000001e  0000000000000000  0000000000000000  00000470  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 10 .gnu.lto_.ipa_sra.dd7fd3d681cdc9c6 00000019  0000000000000000  0000000000000000  0000048e  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 11 .gnu.lto_.inline.dd7fd3d681cdc9c6 00000044  0000000000000000  0000000000000000  000004a7  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 12 .gnu.lto_.jmpfuncs.dd7fd3d681cdc9c6 00000021  0000000000000000  0000000000000000  000004eb  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 13 .gnu.lto_.pureconst.dd7fd3d681cdc9c6 00000011  0000000000000000  0000000000000000  0000050c  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 14 .gnu.lto_.ipa_modref.dd7fd3d681cdc9c6 0000002e  0000000000000000  0000000000000000  0000051d  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 15 .gnu.lto_.lto.dd7fd3d681cdc9c6 00000008  0000000000000000  0000000000000000  0000054b  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 16 .gnu.lto_Div_fp32_fp32_fp32.13.dd7fd3d681cdc9c6 0000029e  0000000000000000  0000000000000000  00000553  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 17 .gnu.lto_.symbol_nodes.dd7fd3d681cdc9c6 00000026  0000000000000000  0000000000000000  000007f1  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 18 .gnu.lto_.refs.dd7fd3d681cdc9c6 0000000e  0000000000000000  0000000000000000  00000817  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 19 .gnu.lto_.decls.dd7fd3d681cdc9c6 000002f4  0000000000000000  0000000000000000  00000825  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 20 .gnu.lto_.symtab.dd7fd3d681cdc9c6 00000022  0000000000000000  0000000000000000  00000b19  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 21 .gnu.lto_.ext_symtab.dd7fd3d681cdc9c6 00000003  0000000000000000  0000000000000000  00000b3b  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 22 .gnu.lto_.opts 000000d3  0000000000000000  0000000000000000  00000b3e  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 23 .comment      00000028  0000000000000000  0000000000000000  00000c11  2**0
+                  CONTENTS, READONLY
+ 24 .note.GNU-stack 00000000  0000000000000000  0000000000000000  00000c39  2**0
+                  CONTENTS, READONLY
+
+Div_s32.c.o:     file format elf64-x86-64
+
+Sections:
+Idx Name          Size      VMA               LMA               File off  Algn
+  0 .text         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+  1 .data         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, DATA
+  2 .bss          00000000  0000000000000000  0000000000000000  00000040  2**0
+                  ALLOC
+  3 .gnu.debuglto_.debug_info 00000179  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  4 .gnu.debuglto_.debug_abbrev 00000098  0000000000000000  0000000000000000  000001b9  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  5 .gnu.debuglto_.debug_line 00000048  0000000000000000  0000000000000000  00000251  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  6 .gnu.debuglto_.debug_str 000001c5  0000000000000000  0000000000000000  00000299  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  7 .gnu.debuglto_.debug_line_str 000000ed  0000000000000000  0000000000000000  0000045e  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  8 .gnu.lto_.profile.f08cdbb4dda594ea 0000000f  0000000000000000  0000000000000000  0000054b  2**0
+                  CONTENTS, READONLY, EXCLUDE
+  9 .gnu.lto_.icf.f08cdbb4dda594ea 0000001e  0000000000000000  0000000000000000  0000055a  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 10 .gnu.lto_.ipa_sra.f08cdbb4dda594ea 0000001c  0000000000000000  0000000000000000  00000578  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 11 .gnu.lto_.inline.f08cdbb4dda594ea 0000007f  0000000000000000  0000000000000000  00000594  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 12 .gnu.lto_.jmpfuncs.f08cdbb4dda594ea 0000002b  0000000000000000  0000000000000000  00000613  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 13 .gnu.lto_.pureconst.f08cdbb4dda594ea 00000011  0000000000000000  0000000000000000  0000063e  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 14 .gnu.lto_.ipa_modref.f08cdbb4dda594ea 00000031  0000000000000000  0000000000000000  0000064f  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 15 .gnu.lto_.lto.f08cdbb4dda594ea 00000008  0000000000000000  0000000000000000  00000680  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 16 .gnu.lto_Div_s32_s32.13.f08cdbb4dda594ea 00000654  0000000000000000  0000000000000000  00000688  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 17 .gnu.lto_.symbol_nodes.f08cdbb4dda594ea 00000026  0000000000000000  0000000000000000  00000cdc  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 18 .gnu.lto_.refs.f08cdbb4dda594ea 0000000e  0000000000000000  0000000000000000  00000d02  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 19 .gnu.lto_.decls.f08cdbb4dda594ea 00000369  0000000000000000  0000000000000000  00000d10  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 20 .gnu.lto_.symtab.f08cdbb4dda594ea 0000001b  0000000000000000  0000000000000000  00001079  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 21 .gnu.lto_.ext_symtab.f08cdbb4dda594ea 00000003  0000000000000000  0000000000000000  00001094  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 22 .gnu.lto_.opts 000000d3  0000000000000000  0000000000000000  00001097  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 23 .comment      00000028  0000000000000000  0000000000000000  0000116a  2**0
+                  CONTENTS, READONLY
+ 24 .note.GNU-stack 00000000  0000000000000000  0000000000000000  00001192  2**0
+                  CONTENTS, READONLY
+
+Exp_fp32.c.o:     file format elf64-x86-64
+
+Sections:
+Idx Name          Size      VMA               LMA               File off  Algn
+  0 .text         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+  1 .data         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, DATA
+  2 .bss          00000000  0000000000000000  0000000000000000  00000040  2**0
+                  ALLOC
+  3 .gnu.debuglto_.debug_info 000000e3  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  4 .gnu.debuglto_.debug_abbrev 00000094  0000000000000000  0000000000000000  00000123  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  5 .gnu.debuglto_.debug_line 00000056  0000000000000000  0000000000000000  000001b7  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  6 .gnu.debuglto_.debug_str 0000015b  0000000000000000  0000000000000000  0000020d  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  7 .gnu.debuglto_.debug_line_str 00000125  0000000000000000  0000000000000000  00000368  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  8 .gnu.lto_.profile.18779b7370928882 0000000f  0000000000000000  0000000000000000  0000048d  2**0
+                  CONTENTS, READONLY, EXCLUDE
+  9 .gnu.lto_.icf.18779b7370928882 00000022  0000000000000000  0000000000000000  0000049c  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 10 .gnu.lto_.ipa_sra.18779b7370928882 00000023  0000000000000000  0000000000000000  000004be  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 11 .gnu.lto_.inline.18779b7370928882 0000004d  0000000000000000  0000000000000000  000004e1  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 12 .gnu.lto_.jmpfuncs.18779b7370928882 00000024  0000000000000000  0000000000000000  0000052e  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 13 .gnu.lto_.pureconst.18779b7370928882 00000011  0000000000000000  0000000000000000  00000552  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 14 .gnu.lto_.ipa_modref.18779b7370928882 00000030  0000000000000000  0000000000000000  00000563  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 15 .gnu.lto_.lto.18779b7370928882 00000008  0000000000000000  0000000000000000  00000593  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 16 .gnu.lto_Exp_fp32_fp32.13.18779b7370928882 0000027c  0000000000000000  0000000000000000  0000059b  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 17 .gnu.lto_.symbol_nodes.18779b7370928882 00000048  0000000000000000  0000000000000000  00000817  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 18 .gnu.lto_.refs.18779b7370928882 0000000e  0000000000000000  0000000000000000  0000085f  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 19 .gnu.lto_.decls.18779b7370928882 000003d7  0000000000000000  0000000000000000  0000086d  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 20 .gnu.lto_.symtab.18779b7370928882 00000031  0000000000000000  0000000000000000  00000c44  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 21 .gnu.lto_.ext_symtab.18779b7370928882 00000005  0000000000000000  0000000000000000  00000c75  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 22 .gnu.lto_.opts 000000d3  0000000000000000  0000000000000000  00000c7a  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 23 .comment      00000028  0000000000000000  0000000000000000  00000d4d  2**0
+                  CONTENTS, READONLY
+ 24 .note.GNU-stack 00000000  0000000000000000  0000000000000000  00000d75  2**0
+                  CONTENTS, READONLY
+
+Floor_fp32.c.o:     file format elf64-x86-64
+
+Sections:
+Idx Name          Size      VMA               LMA               File off  Algn
+  0 .text         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+  1 .data         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, DATA
+  2 .bss          00000000  0000000000000000  0000000000000000  00000040  2**0
+                  ALLOC
+  3 .gnu.debuglto_.debug_info 000000e3  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  4 .gnu.debuglto_.debug_abbrev 00000094  0000000000000000  0000000000000000  00000123  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  5 .gnu.debuglto_.debug_line 00000056  0000000000000000  0000000000000000  000001b7  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  6 .gnu.debuglto_.debug_str 0000015f  0000000000000000  0000000000000000  0000020d  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  7 .gnu.debuglto_.debug_line_str 00000129  0000000000000000  0000000000000000  0000036c  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  8 .gnu.lto_.profile.c8df402a67e4cec2 0000000f  0000000000000000  0000000000000000  00000495  2**0
+                  CONTENTS, READONLY, EXCLUDE
+  9 .gnu.lto_.icf.c8df402a67e4cec2 00000022  0000000000000000  0000000000000000  000004a4  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 10 .gnu.lto_.ipa_sra.c8df402a67e4cec2 00000023  0000000000000000  0000000000000000  000004c6  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 11 .gnu.lto_.inline.c8df402a67e4cec2 0000004d  0000000000000000  0000000000000000  000004e9  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 12 .gnu.lto_.jmpfuncs.c8df402a67e4cec2 00000024  0000000000000000  0000000000000000  00000536  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 13 .gnu.lto_.pureconst.c8df402a67e4cec2 00000011  0000000000000000  0000000000000000  0000055a  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 14 .gnu.lto_.ipa_modref.c8df402a67e4cec2 00000028  0000000000000000  0000000000000000  0000056b  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 15 .gnu.lto_.lto.c8df402a67e4cec2 00000008  0000000000000000  0000000000000000  00000593  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 16 .gnu.lto_Floor_fp32_fp32.13.c8df402a67e4cec2 00000280  0000000000000000  0000000000000000  0000059b  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 17 .gnu.lto_.symbol_nodes.c8df402a67e4cec2 00000048  0000000000000000  0000000000000000  0000081b  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 18 .gnu.lto_.refs.c8df402a67e4cec2 0000000e  0000000000000000  0000000000000000  00000863  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 19 .gnu.lto_.decls.c8df402a67e4cec2 000003c5  0000000000000000  0000000000000000  00000871  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 20 .gnu.lto_.symtab.c8df402a67e4cec2 00000035  0000000000000000  0000000000000000  00000c36  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 21 .gnu.lto_.ext_symtab.c8df402a67e4cec2 00000005  0000000000000000  0000000000000000  00000c6b  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 22 .gnu.lto_.opts 000000d3  0000000000000000  0000000000000000  00000c70  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 23 .comment      00000028  0000000000000000  0000000000000000  00000d43  2**0
+                  CONTENTS, READONLY
+ 24 .note.GNU-stack 00000000  0000000000000000  0000000000000000  00000d6b  2**0
+                  CONTENTS, READONLY
+
+GELU_fp32.c.o:     file format elf64-x86-64
+
+Sections:
+Idx Name          Size      VMA               LMA               File off  Algn
+  0 .text         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+  1 .data         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, DATA
+  2 .bss          00000000  0000000000000000  0000000000000000  00000040  2**0
+                  ALLOC
+  3 .gnu.debuglto_.debug_info 00000227  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  4 .gnu.debuglto_.debug_abbrev 000000c0  0000000000000000  0000000000000000  00000267  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  5 .gnu.debuglto_.debug_line 00000056  0000000000000000  0000000000000000  00000327  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  6 .gnu.debuglto_.debug_str 00000221  0000000000000000  0000000000000000  0000037d  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  7 .gnu.debuglto_.debug_line_str 00000127  0000000000000000  0000000000000000  0000059e  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  8 .gnu.lto_.profile.6df9607b540d1be7 0000000f  0000000000000000  0000000000000000  000006c5  2**0
+                  CONTENTS, READONLY, EXCLUDE
+  9 .gnu.lto_.icf.6df9607b540d1be7 00000032  0000000000000000  0000000000000000  000006d4  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 10 .gnu.lto_.ipa_sra.6df9607b540d1be7 0000002b  0000000000000000  0000000000000000  00000706  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 11 .gnu.lto_.inline.6df9607b540d1be7 0000007f  0000000000000000  0000000000000000  00000731  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 12 .gnu.lto_.jmpfuncs.6df9607b540d1be7 0000004f  0000000000000000  0000000000000000  000007b0  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 13 .gnu.lto_.pureconst.6df9607b540d1be7 00000017  0000000000000000  0000000000000000  000007ff  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 14 .gnu.lto_.ipa_modref.6df9607b540d1be7 00000048  0000000000000000  0000000000000000  00000816  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 15 .gnu.lto_.lto.6df9607b540d1be7 00000008  0000000000000000  0000000000000000  0000085e  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 16 .gnu.lto_GELU_fp32_fp32.13.6df9607b540d1be7 00000364  0000000000000000  0000000000000000  00000866  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 17 .gnu.lto_GELU_fp32_fp32_sigmoid.14.6df9607b540d1be7 0000036b  0000000000000000  0000000000000000  00000bca  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 18 .gnu.lto_GELU_fp32_fp32_sigmoid_grad_chunk.15.6df9607b540d1be7 0000044d  0000000000000000  0000000000000000  00000f35  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 19 .gnu.lto_.symbol_nodes.6df9607b540d1be7 0000006f  0000000000000000  0000000000000000  00001382  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 20 .gnu.lto_.refs.6df9607b540d1be7 0000000e  0000000000000000  0000000000000000  000013f1  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 21 .gnu.lto_.decls.6df9607b540d1be7 00000556  0000000000000000  0000000000000000  000013ff  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 22 .gnu.lto_.symtab.6df9607b540d1be7 000000b2  0000000000000000  0000000000000000  00001955  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 23 .gnu.lto_.ext_symtab.6df9607b540d1be7 0000000d  0000000000000000  0000000000000000  00001a07  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 24 .gnu.lto_.opts 000000d3  0000000000000000  0000000000000000  00001a14  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 25 .comment      00000028  0000000000000000  0000000000000000  00001ae7  2**0
+                  CONTENTS, READONLY
+ 26 .note.GNU-stack 00000000  0000000000000000  0000000000000000  00001b0f  2**0
+                  CONTENTS, READONLY
+
+GELU_s8.c.o:     file format elf64-x86-64
+
+Sections:
+Idx Name          Size      VMA               LMA               File off  Algn
+  0 .text         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+  1 .data         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, DATA
+  2 .bss          00000000  0000000000000000  0000000000000000  00000040  2**0
+                  ALLOC
+  3 .gnu.debuglto_.debug_info 00000157  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  4 .gnu.debuglto_.debug_abbrev 00000098  0000000000000000  0000000000000000  00000197  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  5 .gnu.debuglto_.debug_line 00000048  0000000000000000  0000000000000000  0000022f  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  6 .gnu.debuglto_.debug_str 00000188  0000000000000000  0000000000000000  00000277  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  7 .gnu.debuglto_.debug_line_str 000000ed  0000000000000000  0000000000000000  000003ff  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  8 .gnu.lto_.profile.e5d860a21e562a9e 0000000f  0000000000000000  0000000000000000  000004ec  2**0
+                  CONTENTS, READONLY, EXCLUDE
+  9 .gnu.lto_.icf.e5d860a21e562a9e 00000022  0000000000000000  0000000000000000  000004fb  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 10 .gnu.lto_.ipa_sra.e5d860a21e562a9e 00000019  0000000000000000  0000000000000000  0000051d  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 11 .gnu.lto_.inline.e5d860a21e562a9e 00000051  0000000000000000  0000000000000000  00000536  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 12 .gnu.lto_.jmpfuncs.e5d860a21e562a9e 0000002c  0000000000000000  0000000000000000  00000587  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 13 .gnu.lto_.pureconst.e5d860a21e562a9e 00000011  0000000000000000  0000000000000000  000005b3  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 14 .gnu.lto_.ipa_modref.e5d860a21e562a9e 0000002a  0000000000000000  0000000000000000  000005c4  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 15 .gnu.lto_.lto.e5d860a21e562a9e 00000008  0000000000000000  0000000000000000  000005ee  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 16 .gnu.lto_GELU_s8_s32.13.e5d860a21e562a9e 00000459  0000000000000000  0000000000000000  000005f6  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 17 .gnu.lto_.symbol_nodes.e5d860a21e562a9e 00000026  0000000000000000  0000000000000000  00000a4f  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 18 .gnu.lto_.refs.e5d860a21e562a9e 0000000e  0000000000000000  0000000000000000  00000a75  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 19 .gnu.lto_.decls.e5d860a21e562a9e 00000389  0000000000000000  0000000000000000  00000a83  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 20 .gnu.lto_.symtab.e5d860a21e562a9e 0000001b  0000000000000000  0000000000000000  00000e0c  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 21 .gnu.lto_.ext_symtab.e5d860a21e562a9e 00000003  0000000000000000  0000000000000000  00000e27  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 22 .gnu.lto_.opts 000000d3  0000000000000000  0000000000000000  00000e2a  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 23 .comment      00000028  0000000000000000  0000000000000000  00000efd  2**0
+                  CONTENTS, READONLY
+ 24 .note.GNU-stack 00000000  0000000000000000  0000000000000000  00000f25  2**0
+                  CONTENTS, READONLY
+
+Gemm_fp32.c.o:     file format elf64-x86-64
+
+Sections:
+Idx Name          Size      VMA               LMA               File off  Algn
+  0 .text         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+  1 .data         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, DATA
+  2 .bss          00000000  0000000000000000  0000000000000000  00000040  2**0
+                  ALLOC
+  3 .gnu.debuglto_.debug_info 0000016f  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  4 .gnu.debuglto_.debug_abbrev 000000a6  0000000000000000  0000000000000000  000001af  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  5 .gnu.debuglto_.debug_line 00000056  0000000000000000  0000000000000000  00000255  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  6 .gnu.debuglto_.debug_str 00000191  0000000000000000  0000000000000000  000002ab  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  7 .gnu.debuglto_.debug_line_str 0000012a  0000000000000000  0000000000000000  0000043c  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  8 .gnu.lto_.profile.a61ae2152cc4f775 0000000f  0000000000000000  0000000000000000  00000566  2**0
+                  CONTENTS, READONLY, EXCLUDE
+  9 .gnu.lto_.icf.a61ae2152cc4f775 00000021  0000000000000000  0000000000000000  00000575  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 10 .gnu.lto_.ipa_sra.a61ae2152cc4f775 00000019  0000000000000000  0000000000000000  00000596  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 11 .gnu.lto_.inline.a61ae2152cc4f775 000000a2  0000000000000000  0000000000000000  000005af  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 12 .gnu.lto_.jmpfuncs.a61ae2152cc4f775 0000002a  0000000000000000  0000000000000000  00000651  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 13 .gnu.lto_.pureconst.a61ae2152cc4f775 00000011  0000000000000000  0000000000000000  0000067b  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 14 .gnu.lto_.ipa_modref.a61ae2152cc4f775 00000034  0000000000000000  0000000000000000  0000068c  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 15 .gnu.lto_.lto.a61ae2152cc4f775 00000008  0000000000000000  0000000000000000  000006c0  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 16 .gnu.lto_Gemm_fp32_fp32_fp32_fp32.13.a61ae2152cc4f775 000005eb  0000000000000000  0000000000000000  000006c8  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 17 .gnu.lto_.symbol_nodes.a61ae2152cc4f775 00000026  0000000000000000  0000000000000000  00000cb3  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 18 .gnu.lto_.refs.a61ae2152cc4f775 0000000e  0000000000000000  0000000000000000  00000cd9  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 19 .gnu.lto_.decls.a61ae2152cc4f775 0000038f  0000000000000000  0000000000000000  00000ce7  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 20 .gnu.lto_.symtab.a61ae2152cc4f775 00000028  0000000000000000  0000000000000000  00001076  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 21 .gnu.lto_.ext_symtab.a61ae2152cc4f775 00000003  0000000000000000  0000000000000000  0000109e  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 22 .gnu.lto_.opts 000000d3  0000000000000000  0000000000000000  000010a1  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 23 .comment      00000028  0000000000000000  0000000000000000  00001174  2**0
+                  CONTENTS, READONLY
+ 24 .note.GNU-stack 00000000  0000000000000000  0000000000000000  0000119c  2**0
+                  CONTENTS, READONLY
+
+Gemm_s8.c.o:     file format elf64-x86-64
+
+Sections:
+Idx Name          Size      VMA               LMA               File off  Algn
+  0 .text         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+  1 .data         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, DATA
+  2 .bss          00000000  0000000000000000  0000000000000000  00000040  2**0
+                  ALLOC
+  3 .gnu.debuglto_.debug_info 00000204  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  4 .gnu.debuglto_.debug_abbrev 0000009c  0000000000000000  0000000000000000  00000244  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  5 .gnu.debuglto_.debug_line 0000004d  0000000000000000  0000000000000000  000002e0  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  6 .gnu.debuglto_.debug_str 000001b4  0000000000000000  0000000000000000  0000032d  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  7 .gnu.debuglto_.debug_line_str 000000fc  0000000000000000  0000000000000000  000004e1  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  8 .gnu.lto_.profile.ef957ed11e1a7064 0000000f  0000000000000000  0000000000000000  000005dd  2**0
+                  CONTENTS, READONLY, EXCLUDE
+  9 .gnu.lto_.icf.ef957ed11e1a7064 00000025  0000000000000000  0000000000000000  000005ec  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 10 .gnu.lto_.ipa_sra.ef957ed11e1a7064 00000019  0000000000000000  0000000000000000  00000611  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 11 .gnu.lto_.inline.ef957ed11e1a7064 000000a0  0000000000000000  0000000000000000  0000062a  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 12 .gnu.lto_.jmpfuncs.ef957ed11e1a7064 0000002d  0000000000000000  0000000000000000  000006ca  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 13 .gnu.lto_.pureconst.ef957ed11e1a7064 00000011  0000000000000000  0000000000000000  000006f7  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 14 .gnu.lto_.ipa_modref.ef957ed11e1a7064 0000003c  0000000000000000  0000000000000000  00000708  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 15 .gnu.lto_.lto.ef957ed11e1a7064 00000008  0000000000000000  0000000000000000  00000744  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 16 .gnu.lto_Gemm_s8_s8_s32_s32.13.ef957ed11e1a7064 00000cd3  0000000000000000  0000000000000000  0000074c  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 17 .gnu.lto_.symbol_nodes.ef957ed11e1a7064 00000026  0000000000000000  0000000000000000  0000141f  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 18 .gnu.lto_.refs.ef957ed11e1a7064 0000000e  0000000000000000  0000000000000000  00001445  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 19 .gnu.lto_.decls.ef957ed11e1a7064 00000420  0000000000000000  0000000000000000  00001453  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 20 .gnu.lto_.symtab.ef957ed11e1a7064 00000022  0000000000000000  0000000000000000  00001873  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 21 .gnu.lto_.ext_symtab.ef957ed11e1a7064 00000003  0000000000000000  0000000000000000  00001895  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 22 .gnu.lto_.opts 000000d3  0000000000000000  0000000000000000  00001898  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 23 .comment      00000028  0000000000000000  0000000000000000  0000196b  2**0
+                  CONTENTS, READONLY
+ 24 .note.GNU-stack 00000000  0000000000000000  0000000000000000  00001993  2**0
+                  CONTENTS, READONLY
+
+GlobalAveragePool_fp32.c.o:     file format elf64-x86-64
+
+Sections:
+Idx Name          Size      VMA               LMA               File off  Algn
+  0 .text         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+  1 .data         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, DATA
+  2 .bss          00000000  0000000000000000  0000000000000000  00000040  2**0
+                  ALLOC
+  3 .gnu.debuglto_.debug_info 00000121  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  4 .gnu.debuglto_.debug_abbrev 00000094  0000000000000000  0000000000000000  00000161  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  5 .gnu.debuglto_.debug_line 00000051  0000000000000000  0000000000000000  000001f5  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  6 .gnu.debuglto_.debug_str 0000015d  0000000000000000  0000000000000000  00000246  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  7 .gnu.debuglto_.debug_line_str 00000136  0000000000000000  0000000000000000  000003a3  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  8 .gnu.lto_.profile.210e7a6ce354bcf8 0000000f  0000000000000000  0000000000000000  000004d9  2**0
+                  CONTENTS, READONLY, EXCLUDE
+  9 .gnu.lto_.icf.210e7a6ce354bcf8 00000029  0000000000000000  0000000000000000  000004e8  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 10 .gnu.lto_.ipa_sra.210e7a6ce354bcf8 0000003f  0000000000000000  0000000000000000  00000511  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 11 .gnu.lto_.inline.210e7a6ce354bcf8 0000008f  0000000000000000  0000000000000000  00000550  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 12 .gnu.lto_.jmpfuncs.210e7a6ce354bcf8 00000053  0000000000000000  0000000000000000  000005df  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 13 .gnu.lto_.pureconst.210e7a6ce354bcf8 00000014  0000000000000000  0000000000000000  00000632  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 14 .gnu.lto_.ipa_modref.210e7a6ce354bcf8 0000002f  0000000000000000  0000000000000000  00000646  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 15 .gnu.lto_.lto.210e7a6ce354bcf8 00000008  0000000000000000  0000000000000000  00000675  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 16 .gnu.lto_GlobalAveragePool_fp32_fp32.13.210e7a6ce354bcf8 0000021b  0000000000000000  0000000000000000  0000067d  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 17 .gnu.lto_GlobalAveragePool_fp32_fp32.part.0.14.210e7a6ce354bcf8 00000535  0000000000000000  0000000000000000  00000898  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 18 .gnu.lto_.symbol_nodes.210e7a6ce354bcf8 00000049  0000000000000000  0000000000000000  00000dcd  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 19 .gnu.lto_.refs.210e7a6ce354bcf8 0000000e  0000000000000000  0000000000000000  00000e16  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 20 .gnu.lto_.decls.210e7a6ce354bcf8 00000390  0000000000000000  0000000000000000  00000e24  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 21 .gnu.lto_.symtab.210e7a6ce354bcf8 0000002b  0000000000000000  0000000000000000  000011b4  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 22 .gnu.lto_.ext_symtab.210e7a6ce354bcf8 00000003  0000000000000000  0000000000000000  000011df  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 23 .gnu.lto_.opts 000000d3  0000000000000000  0000000000000000  000011e2  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 24 .comment      00000028  0000000000000000  0000000000000000  000012b5  2**0
+                  CONTENTS, READONLY
+ 25 .note.GNU-stack 00000000  0000000000000000  0000000000000000  000012dd  2**0
+                  CONTENTS, READONLY
+
+GlobalMaxPool_fp32.c.o:     file format elf64-x86-64
+
+Sections:
+Idx Name          Size      VMA               LMA               File off  Algn
+  0 .text         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+  1 .data         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, DATA
+  2 .bss          00000000  0000000000000000  0000000000000000  00000040  2**0
+                  ALLOC
+  3 .gnu.debuglto_.debug_info 0000012c  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  4 .gnu.debuglto_.debug_abbrev 00000094  0000000000000000  0000000000000000  0000016c  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  5 .gnu.debuglto_.debug_line 00000051  0000000000000000  0000000000000000  00000200  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  6 .gnu.debuglto_.debug_str 00000159  0000000000000000  0000000000000000  00000251  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  7 .gnu.debuglto_.debug_line_str 0000012e  0000000000000000  0000000000000000  000003aa  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  8 .gnu.lto_.profile.9af445332695bedf 0000000f  0000000000000000  0000000000000000  000004d8  2**0
+                  CONTENTS, READONLY, EXCLUDE
+  9 .gnu.lto_.icf.9af445332695bedf 00000028  0000000000000000  0000000000000000  000004e7  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 10 .gnu.lto_.ipa_sra.9af445332695bedf 0000003f  0000000000000000  0000000000000000  0000050f  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 11 .gnu.lto_.inline.9af445332695bedf 00000087  0000000000000000  0000000000000000  0000054e  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 12 .gnu.lto_.jmpfuncs.9af445332695bedf 00000053  0000000000000000  0000000000000000  000005d5  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 13 .gnu.lto_.pureconst.9af445332695bedf 00000014  0000000000000000  0000000000000000  00000628  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 14 .gnu.lto_.ipa_modref.9af445332695bedf 0000002c  0000000000000000  0000000000000000  0000063c  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 15 .gnu.lto_.lto.9af445332695bedf 00000008  0000000000000000  0000000000000000  00000668  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 16 .gnu.lto_GlobalMaxPool_fp32_fp32.13.9af445332695bedf 00000216  0000000000000000  0000000000000000  00000670  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 17 .gnu.lto_GlobalMaxPool_fp32_fp32.part.0.14.9af445332695bedf 00000575  0000000000000000  0000000000000000  00000886  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 18 .gnu.lto_.symbol_nodes.9af445332695bedf 00000049  0000000000000000  0000000000000000  00000dfb  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 19 .gnu.lto_.refs.9af445332695bedf 0000000e  0000000000000000  0000000000000000  00000e44  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 20 .gnu.lto_.decls.9af445332695bedf 00000387  0000000000000000  0000000000000000  00000e52  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 21 .gnu.lto_.symtab.9af445332695bedf 00000027  0000000000000000  0000000000000000  000011d9  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 22 .gnu.lto_.ext_symtab.9af445332695bedf 00000003  0000000000000000  0000000000000000  00001200  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 23 .gnu.lto_.opts 000000d3  0000000000000000  0000000000000000  00001203  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 24 .comment      00000028  0000000000000000  0000000000000000  000012d6  2**0
+                  CONTENTS, READONLY
+ 25 .note.GNU-stack 00000000  0000000000000000  0000000000000000  000012fe  2**0
+                  CONTENTS, READONLY
+
+GroupNormalization_fp32.c.o:     file format elf64-x86-64
+
+Sections:
+Idx Name          Size      VMA               LMA               File off  Algn
+  0 .text         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+  1 .data         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, DATA
+  2 .bss          00000000  0000000000000000  0000000000000000  00000040  2**0
+                  ALLOC
+  3 .gnu.debuglto_.debug_info 00000230  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  4 .gnu.debuglto_.debug_abbrev 000000cb  0000000000000000  0000000000000000  00000270  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  5 .gnu.debuglto_.debug_line 00000056  0000000000000000  0000000000000000  0000033b  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  6 .gnu.debuglto_.debug_str 000001fc  0000000000000000  0000000000000000  00000391  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  7 .gnu.debuglto_.debug_line_str 00000144  0000000000000000  0000000000000000  0000058d  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  8 .gnu.lto_.profile.d1397aae99ff7576 0000000f  0000000000000000  0000000000000000  000006d1  2**0
+                  CONTENTS, READONLY, EXCLUDE
+  9 .gnu.lto_.icf.d1397aae99ff7576 0000002d  0000000000000000  0000000000000000  000006e0  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 10 .gnu.lto_.ipa_sra.d1397aae99ff7576 00000052  0000000000000000  0000000000000000  0000070d  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 11 .gnu.lto_.inline.d1397aae99ff7576 000000d5  0000000000000000  0000000000000000  0000075f  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 12 .gnu.lto_.jmpfuncs.d1397aae99ff7576 0000006b  0000000000000000  0000000000000000  00000834  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 13 .gnu.lto_.pureconst.d1397aae99ff7576 00000014  0000000000000000  0000000000000000  0000089f  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 14 .gnu.lto_.ipa_modref.d1397aae99ff7576 0000003f  0000000000000000  0000000000000000  000008b3  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 15 .gnu.lto_.lto.d1397aae99ff7576 00000008  0000000000000000  0000000000000000  000008f2  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 16 .gnu.lto_GroupNormalization_fp32_fp32.13.d1397aae99ff7576 000002f0  0000000000000000  0000000000000000  000008fa  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 17 .gnu.lto_GroupNormalization_fp32_fp32.part.0.15.d1397aae99ff7576 00000c36  0000000000000000  0000000000000000  00000bea  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 18 .gnu.lto_.symbol_nodes.d1397aae99ff7576 0000005f  0000000000000000  0000000000000000  00001820  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 19 .gnu.lto_.refs.d1397aae99ff7576 0000000e  0000000000000000  0000000000000000  0000187f  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 20 .gnu.lto_.decls.d1397aae99ff7576 000004f2  0000000000000000  0000000000000000  0000188d  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 21 .gnu.lto_.symtab.d1397aae99ff7576 00000040  0000000000000000  0000000000000000  00001d7f  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 22 .gnu.lto_.ext_symtab.d1397aae99ff7576 00000005  0000000000000000  0000000000000000  00001dbf  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 23 .gnu.lto_.opts 000000d3  0000000000000000  0000000000000000  00001dc4  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 24 .comment      00000028  0000000000000000  0000000000000000  00001e97  2**0
+                  CONTENTS, READONLY
+ 25 .note.GNU-stack 00000000  0000000000000000  0000000000000000  00001ebf  2**0
+                  CONTENTS, READONLY
+
+HardSigmoid_fp32.c.o:     file format elf64-x86-64
+
+Sections:
+Idx Name          Size      VMA               LMA               File off  Algn
+  0 .text         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+  1 .data         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, DATA
+  2 .bss          00000000  0000000000000000  0000000000000000  00000040  2**0
+                  ALLOC
+  3 .gnu.debuglto_.debug_info 0000011a  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  4 .gnu.debuglto_.debug_abbrev 00000095  0000000000000000  0000000000000000  0000015a  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  5 .gnu.debuglto_.debug_line 00000056  0000000000000000  0000000000000000  000001ef  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  6 .gnu.debuglto_.debug_str 00000175  0000000000000000  0000000000000000  00000245  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  7 .gnu.debuglto_.debug_line_str 00000135  0000000000000000  0000000000000000  000003ba  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  8 .gnu.lto_.profile.505ef7eee73c075a 0000000f  0000000000000000  0000000000000000  000004ef  2**0
+                  CONTENTS, READONLY, EXCLUDE
+  9 .gnu.lto_.icf.505ef7eee73c075a 00000022  0000000000000000  0000000000000000  000004fe  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 10 .gnu.lto_.ipa_sra.505ef7eee73c075a 0000002c  0000000000000000  0000000000000000  00000520  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 11 .gnu.lto_.inline.505ef7eee73c075a 00000050  0000000000000000  0000000000000000  0000054c  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 12 .gnu.lto_.jmpfuncs.505ef7eee73c075a 00000044  0000000000000000  0000000000000000  0000059c  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 13 .gnu.lto_.pureconst.505ef7eee73c075a 00000011  0000000000000000  0000000000000000  000005e0  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 14 .gnu.lto_.ipa_modref.505ef7eee73c075a 0000002a  0000000000000000  0000000000000000  000005f1  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 15 .gnu.lto_.lto.505ef7eee73c075a 00000008  0000000000000000  0000000000000000  0000061b  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 16 .gnu.lto_HardSigmoid_fp32_fp32.13.505ef7eee73c075a 000002ea  0000000000000000  0000000000000000  00000623  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 17 .gnu.lto_.symbol_nodes.505ef7eee73c075a 00000054  0000000000000000  0000000000000000  0000090d  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 18 .gnu.lto_.refs.505ef7eee73c075a 0000000e  0000000000000000  0000000000000000  00000961  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 19 .gnu.lto_.decls.505ef7eee73c075a 00000425  0000000000000000  0000000000000000  0000096f  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 20 .gnu.lto_.symtab.505ef7eee73c075a 0000004f  0000000000000000  0000000000000000  00000d94  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 21 .gnu.lto_.ext_symtab.505ef7eee73c075a 00000007  0000000000000000  0000000000000000  00000de3  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 22 .gnu.lto_.opts 000000d3  0000000000000000  0000000000000000  00000dea  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 23 .comment      00000028  0000000000000000  0000000000000000  00000ebd  2**0
+                  CONTENTS, READONLY
+ 24 .note.GNU-stack 00000000  0000000000000000  0000000000000000  00000ee5  2**0
+                  CONTENTS, READONLY
+
+HardSwish_fp32.c.o:     file format elf64-x86-64
+
+Sections:
+Idx Name          Size      VMA               LMA               File off  Algn
+  0 .text         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+  1 .data         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, DATA
+  2 .bss          00000000  0000000000000000  0000000000000000  00000040  2**0
+                  ALLOC
+  3 .gnu.debuglto_.debug_info 0000010e  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  4 .gnu.debuglto_.debug_abbrev 00000096  0000000000000000  0000000000000000  0000014e  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  5 .gnu.debuglto_.debug_line 00000056  0000000000000000  0000000000000000  000001e4  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  6 .gnu.debuglto_.debug_str 00000168  0000000000000000  0000000000000000  0000023a  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  7 .gnu.debuglto_.debug_line_str 00000131  0000000000000000  0000000000000000  000003a2  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  8 .gnu.lto_.profile.8d88300ed17dd850 0000000f  0000000000000000  0000000000000000  000004d3  2**0
+                  CONTENTS, READONLY, EXCLUDE
+  9 .gnu.lto_.icf.8d88300ed17dd850 00000022  0000000000000000  0000000000000000  000004e2  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 10 .gnu.lto_.ipa_sra.8d88300ed17dd850 0000001d  0000000000000000  0000000000000000  00000504  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 11 .gnu.lto_.inline.8d88300ed17dd850 00000050  0000000000000000  0000000000000000  00000521  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 12 .gnu.lto_.jmpfuncs.8d88300ed17dd850 0000003e  0000000000000000  0000000000000000  00000571  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 13 .gnu.lto_.pureconst.8d88300ed17dd850 00000011  0000000000000000  0000000000000000  000005af  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 14 .gnu.lto_.ipa_modref.8d88300ed17dd850 00000028  0000000000000000  0000000000000000  000005c0  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 15 .gnu.lto_.lto.8d88300ed17dd850 00000008  0000000000000000  0000000000000000  000005e8  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 16 .gnu.lto_HardSwish_fp32_fp32.13.8d88300ed17dd850 00000302  0000000000000000  0000000000000000  000005f0  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 17 .gnu.lto_.symbol_nodes.8d88300ed17dd850 00000054  0000000000000000  0000000000000000  000008f2  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 18 .gnu.lto_.refs.8d88300ed17dd850 0000000e  0000000000000000  0000000000000000  00000946  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 19 .gnu.lto_.decls.8d88300ed17dd850 0000040a  0000000000000000  0000000000000000  00000954  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 20 .gnu.lto_.symtab.8d88300ed17dd850 0000004d  0000000000000000  0000000000000000  00000d5e  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 21 .gnu.lto_.ext_symtab.8d88300ed17dd850 00000007  0000000000000000  0000000000000000  00000dab  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 22 .gnu.lto_.opts 000000d3  0000000000000000  0000000000000000  00000db2  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 23 .comment      00000028  0000000000000000  0000000000000000  00000e85  2**0
+                  CONTENTS, READONLY
+ 24 .note.GNU-stack 00000000  0000000000000000  0000000000000000  00000ead  2**0
+                  CONTENTS, READONLY
+
+Hardswish_s8.c.o:     file format elf64-x86-64
+
+Sections:
+Idx Name          Size      VMA               LMA               File off  Algn
+  0 .text         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+  1 .data         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, DATA
+  2 .bss          00000000  0000000000000000  0000000000000000  00000040  2**0
+                  ALLOC
+  3 .gnu.debuglto_.debug_info 00000119  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  4 .gnu.debuglto_.debug_abbrev 00000094  0000000000000000  0000000000000000  00000159  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  5 .gnu.debuglto_.debug_line 00000048  0000000000000000  0000000000000000  000001ed  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  6 .gnu.debuglto_.debug_str 00000181  0000000000000000  0000000000000000  00000235  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  7 .gnu.debuglto_.debug_line_str 000000f7  0000000000000000  0000000000000000  000003b6  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  8 .gnu.lto_.profile.f88ec5c944fb6168 0000000f  0000000000000000  0000000000000000  000004ad  2**0
+                  CONTENTS, READONLY, EXCLUDE
+  9 .gnu.lto_.icf.f88ec5c944fb6168 00000022  0000000000000000  0000000000000000  000004bc  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 10 .gnu.lto_.ipa_sra.f88ec5c944fb6168 00000019  0000000000000000  0000000000000000  000004de  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 11 .gnu.lto_.inline.f88ec5c944fb6168 00000044  0000000000000000  0000000000000000  000004f7  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 12 .gnu.lto_.jmpfuncs.f88ec5c944fb6168 00000025  0000000000000000  0000000000000000  0000053b  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 13 .gnu.lto_.pureconst.f88ec5c944fb6168 00000011  0000000000000000  0000000000000000  00000560  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 14 .gnu.lto_.ipa_modref.f88ec5c944fb6168 0000002a  0000000000000000  0000000000000000  00000571  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 15 .gnu.lto_.lto.f88ec5c944fb6168 00000008  0000000000000000  0000000000000000  0000059b  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 16 .gnu.lto_iHardswish_s8_s32.13.f88ec5c944fb6168 0000035c  0000000000000000  0000000000000000  000005a3  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 17 .gnu.lto_.symbol_nodes.f88ec5c944fb6168 00000026  0000000000000000  0000000000000000  000008ff  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 18 .gnu.lto_.refs.f88ec5c944fb6168 0000000e  0000000000000000  0000000000000000  00000925  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 19 .gnu.lto_.decls.f88ec5c944fb6168 00000331  0000000000000000  0000000000000000  00000933  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 20 .gnu.lto_.symtab.f88ec5c944fb6168 00000021  0000000000000000  0000000000000000  00000c64  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 21 .gnu.lto_.ext_symtab.f88ec5c944fb6168 00000003  0000000000000000  0000000000000000  00000c85  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 22 .gnu.lto_.opts 000000d3  0000000000000000  0000000000000000  00000c88  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 23 .comment      00000028  0000000000000000  0000000000000000  00000d5b  2**0
+                  CONTENTS, READONLY
+ 24 .note.GNU-stack 00000000  0000000000000000  0000000000000000  00000d83  2**0
+                  CONTENTS, READONLY
+
+InstanceNormalization_fp32.c.o:     file format elf64-x86-64
+
+Sections:
+Idx Name          Size      VMA               LMA               File off  Algn
+  0 .text         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+  1 .data         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, DATA
+  2 .bss          00000000  0000000000000000  0000000000000000  00000040  2**0
+                  ALLOC
+  3 .gnu.debuglto_.debug_info 000001f5  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  4 .gnu.debuglto_.debug_abbrev 000000cb  0000000000000000  0000000000000000  00000235  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  5 .gnu.debuglto_.debug_line 0000005f  0000000000000000  0000000000000000  00000300  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  6 .gnu.debuglto_.debug_str 000001bf  0000000000000000  0000000000000000  0000035f  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  7 .gnu.debuglto_.debug_line_str 0000017c  0000000000000000  0000000000000000  0000051e  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  8 .gnu.lto_.profile.a786b4f14d7fae19 0000000f  0000000000000000  0000000000000000  0000069a  2**0
+                  CONTENTS, READONLY, EXCLUDE
+  9 .gnu.lto_.icf.a786b4f14d7fae19 0000002d  0000000000000000  0000000000000000  000006a9  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 10 .gnu.lto_.ipa_sra.a786b4f14d7fae19 0000004f  0000000000000000  0000000000000000  000006d6  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 11 .gnu.lto_.inline.a786b4f14d7fae19 000000a4  0000000000000000  0000000000000000  00000725  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 12 .gnu.lto_.jmpfuncs.a786b4f14d7fae19 00000067  0000000000000000  0000000000000000  000007c9  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 13 .gnu.lto_.pureconst.a786b4f14d7fae19 00000014  0000000000000000  0000000000000000  00000830  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 14 .gnu.lto_.ipa_modref.a786b4f14d7fae19 00000041  0000000000000000  0000000000000000  00000844  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 15 .gnu.lto_.lto.a786b4f14d7fae19 00000008  0000000000000000  0000000000000000  00000885  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 16 .gnu.lto_InstanceNormalization_fp32_fp32.13.a786b4f14d7fae19 00000261  0000000000000000  0000000000000000  0000088d  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 17 .gnu.lto_InstanceNormalization_fp32_fp32.part.0.15.a786b4f14d7fae19 00000a3a  0000000000000000  0000000000000000  00000aee  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 18 .gnu.lto_.symbol_nodes.a786b4f14d7fae19 00000061  0000000000000000  0000000000000000  00001528  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 19 .gnu.lto_.refs.a786b4f14d7fae19 0000000e  0000000000000000  0000000000000000  00001589  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 20 .gnu.lto_.decls.a786b4f14d7fae19 000004eb  0000000000000000  0000000000000000  00001597  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 21 .gnu.lto_.symtab.a786b4f14d7fae19 00000043  0000000000000000  0000000000000000  00001a82  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 22 .gnu.lto_.ext_symtab.a786b4f14d7fae19 00000005  0000000000000000  0000000000000000  00001ac5  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 23 .gnu.lto_.opts 000000d3  0000000000000000  0000000000000000  00001aca  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 24 .comment      00000028  0000000000000000  0000000000000000  00001b9d  2**0
+                  CONTENTS, READONLY
+ 25 .note.GNU-stack 00000000  0000000000000000  0000000000000000  00001bc5  2**0
+                  CONTENTS, READONLY
+
+Layernorm_fp32.c.o:     file format elf64-x86-64
+
+Sections:
+Idx Name          Size      VMA               LMA               File off  Algn
+  0 .text         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+  1 .data         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, DATA
+  2 .bss          00000000  0000000000000000  0000000000000000  00000040  2**0
+                  ALLOC
+  3 .gnu.debuglto_.debug_info 00000262  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  4 .gnu.debuglto_.debug_abbrev 000000bc  0000000000000000  0000000000000000  000002a2  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  5 .gnu.debuglto_.debug_line 00000056  0000000000000000  0000000000000000  0000035e  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  6 .gnu.debuglto_.debug_str 00000202  0000000000000000  0000000000000000  000003b4  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  7 .gnu.debuglto_.debug_line_str 00000131  0000000000000000  0000000000000000  000005b6  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  8 .gnu.lto_.profile.4d62091d6c55b03f 0000000f  0000000000000000  0000000000000000  000006e7  2**0
+                  CONTENTS, READONLY, EXCLUDE
+  9 .gnu.lto_.icf.4d62091d6c55b03f 00000028  0000000000000000  0000000000000000  000006f6  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 10 .gnu.lto_.ipa_sra.4d62091d6c55b03f 00000038  0000000000000000  0000000000000000  0000071e  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 11 .gnu.lto_.inline.4d62091d6c55b03f 00000089  0000000000000000  0000000000000000  00000756  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 12 .gnu.lto_.jmpfuncs.4d62091d6c55b03f 0000003c  0000000000000000  0000000000000000  000007df  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 13 .gnu.lto_.pureconst.4d62091d6c55b03f 00000014  0000000000000000  0000000000000000  0000081b  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 14 .gnu.lto_.ipa_modref.4d62091d6c55b03f 0000004a  0000000000000000  0000000000000000  0000082f  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 15 .gnu.lto_.lto.4d62091d6c55b03f 00000008  0000000000000000  0000000000000000  00000879  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 16 .gnu.lto_Layernorm_fp32_fp32.13.4d62091d6c55b03f 00000693  0000000000000000  0000000000000000  00000881  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 17 .gnu.lto_LayernormGrad_fp32_fp32.14.4d62091d6c55b03f 000008f9  0000000000000000  0000000000000000  00000f14  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 18 .gnu.lto_.symbol_nodes.4d62091d6c55b03f 00000051  0000000000000000  0000000000000000  0000180d  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 19 .gnu.lto_.refs.4d62091d6c55b03f 0000000e  0000000000000000  0000000000000000  0000185e  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 20 .gnu.lto_.decls.4d62091d6c55b03f 00000463  0000000000000000  0000000000000000  0000186c  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 21 .gnu.lto_.symtab.4d62091d6c55b03f 0000005f  0000000000000000  0000000000000000  00001ccf  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 22 .gnu.lto_.ext_symtab.4d62091d6c55b03f 00000007  0000000000000000  0000000000000000  00001d2e  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 23 .gnu.lto_.opts 000000d3  0000000000000000  0000000000000000  00001d35  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 24 .comment      00000028  0000000000000000  0000000000000000  00001e08  2**0
+                  CONTENTS, READONLY
+ 25 .note.GNU-stack 00000000  0000000000000000  0000000000000000  00001e30  2**0
+                  CONTENTS, READONLY
+
+Layernorm_s8.c.o:     file format elf64-x86-64
+
+Sections:
+Idx Name          Size      VMA               LMA               File off  Algn
+  0 .text         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+  1 .data         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, DATA
+  2 .bss          00000000  0000000000000000  0000000000000000  00000040  2**0
+                  ALLOC
+  3 .gnu.debuglto_.debug_info 0000022f  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  4 .gnu.debuglto_.debug_abbrev 0000009e  0000000000000000  0000000000000000  0000026f  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  5 .gnu.debuglto_.debug_line 0000004d  0000000000000000  0000000000000000  0000030d  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  6 .gnu.debuglto_.debug_str 0000020d  0000000000000000  0000000000000000  0000035a  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  7 .gnu.debuglto_.debug_line_str 00000106  0000000000000000  0000000000000000  00000567  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  8 .gnu.lto_.profile.c1dea5113e9f7fd5 0000000f  0000000000000000  0000000000000000  0000066d  2**0
+                  CONTENTS, READONLY, EXCLUDE
+  9 .gnu.lto_.icf.c1dea5113e9f7fd5 0000003c  0000000000000000  0000000000000000  0000067c  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 10 .gnu.lto_.ipa_sra.c1dea5113e9f7fd5 0000002b  0000000000000000  0000000000000000  000006b8  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 11 .gnu.lto_.inline.c1dea5113e9f7fd5 000000b7  0000000000000000  0000000000000000  000006e3  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 12 .gnu.lto_.jmpfuncs.c1dea5113e9f7fd5 00000055  0000000000000000  0000000000000000  0000079a  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 13 .gnu.lto_.pureconst.c1dea5113e9f7fd5 00000014  0000000000000000  0000000000000000  000007ef  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 14 .gnu.lto_.ipa_modref.c1dea5113e9f7fd5 00000056  0000000000000000  0000000000000000  00000803  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 15 .gnu.lto_.lto.c1dea5113e9f7fd5 00000008  0000000000000000  0000000000000000  00000859  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 16 .gnu.lto__plp_sqrt_q32.13.c1dea5113e9f7fd5 00000408  0000000000000000  0000000000000000  00000861  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 17 .gnu.lto_Layernorm_s8_s8.14.c1dea5113e9f7fd5 00000763  0000000000000000  0000000000000000  00000c69  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 18 .gnu.lto_.symbol_nodes.c1dea5113e9f7fd5 0000003f  0000000000000000  0000000000000000  000013cc  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 19 .gnu.lto_.refs.c1dea5113e9f7fd5 0000000e  0000000000000000  0000000000000000  0000140b  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 20 .gnu.lto_.decls.c1dea5113e9f7fd5 00000479  0000000000000000  0000000000000000  00001419  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 21 .gnu.lto_.symtab.c1dea5113e9f7fd5 0000003c  0000000000000000  0000000000000000  00001892  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 22 .gnu.lto_.ext_symtab.c1dea5113e9f7fd5 00000005  0000000000000000  0000000000000000  000018ce  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 23 .gnu.lto_.opts 000000d3  0000000000000000  0000000000000000  000018d3  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 24 .comment      00000028  0000000000000000  0000000000000000  000019a6  2**0
+                  CONTENTS, READONLY
+ 25 .note.GNU-stack 00000000  0000000000000000  0000000000000000  000019ce  2**0
+                  CONTENTS, READONLY
+
+MatMul_fp32.c.o:     file format elf64-x86-64
+
+Sections:
+Idx Name          Size      VMA               LMA               File off  Algn
+  0 .text         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+  1 .data         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, DATA
+  2 .bss          00000000  0000000000000000  0000000000000000  00000040  2**0
+                  ALLOC
+  3 .gnu.debuglto_.debug_info 00000260  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  4 .gnu.debuglto_.debug_abbrev 000000bd  0000000000000000  0000000000000000  000002a0  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  5 .gnu.debuglto_.debug_line 00000051  0000000000000000  0000000000000000  0000035d  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  6 .gnu.debuglto_.debug_str 000001b8  0000000000000000  0000000000000000  000003ae  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  7 .gnu.debuglto_.debug_line_str 00000120  0000000000000000  0000000000000000  00000566  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  8 .gnu.lto_.profile.b9c337027b407d7a 0000000f  0000000000000000  0000000000000000  00000686  2**0
+                  CONTENTS, READONLY, EXCLUDE
+  9 .gnu.lto_.icf.b9c337027b407d7a 00000035  0000000000000000  0000000000000000  00000695  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 10 .gnu.lto_.ipa_sra.b9c337027b407d7a 0000001c  0000000000000000  0000000000000000  000006ca  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 11 .gnu.lto_.inline.b9c337027b407d7a 0000008c  0000000000000000  0000000000000000  000006e6  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 12 .gnu.lto_.jmpfuncs.b9c337027b407d7a 00000028  0000000000000000  0000000000000000  00000772  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 13 .gnu.lto_.pureconst.b9c337027b407d7a 00000014  0000000000000000  0000000000000000  0000079a  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 14 .gnu.lto_.ipa_modref.b9c337027b407d7a 00000033  0000000000000000  0000000000000000  000007ae  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 15 .gnu.lto_.lto.b9c337027b407d7a 00000008  0000000000000000  0000000000000000  000007e1  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 16 .gnu.lto_MatMul_fp32_fp32_fp32.13.b9c337027b407d7a 00000494  0000000000000000  0000000000000000  000007e9  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 17 .gnu.lto_MatMul_fp32_fp32_fp32_unroll1x7.14.b9c337027b407d7a 00000ac7  0000000000000000  0000000000000000  00000c7d  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 18 .gnu.lto_.symbol_nodes.b9c337027b407d7a 0000002e  0000000000000000  0000000000000000  00001744  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 19 .gnu.lto_.refs.b9c337027b407d7a 0000000e  0000000000000000  0000000000000000  00001772  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 20 .gnu.lto_.decls.b9c337027b407d7a 00000381  0000000000000000  0000000000000000  00001780  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 21 .gnu.lto_.symtab.b9c337027b407d7a 00000054  0000000000000000  0000000000000000  00001b01  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 22 .gnu.lto_.ext_symtab.b9c337027b407d7a 00000005  0000000000000000  0000000000000000  00001b55  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 23 .gnu.lto_.opts 000000d3  0000000000000000  0000000000000000  00001b5a  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 24 .comment      00000028  0000000000000000  0000000000000000  00001c2d  2**0
+                  CONTENTS, READONLY
+ 25 .note.GNU-stack 00000000  0000000000000000  0000000000000000  00001c55  2**0
+                  CONTENTS, READONLY
+
+MatMul_s8.c.o:     file format elf64-x86-64
+
+Sections:
+Idx Name          Size      VMA               LMA               File off  Algn
+  0 .text         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+  1 .data         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, DATA
+  2 .bss          00000000  0000000000000000  0000000000000000  00000040  2**0
+                  ALLOC
+  3 .gnu.debuglto_.debug_info 00000230  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  4 .gnu.debuglto_.debug_abbrev 000000ac  0000000000000000  0000000000000000  00000270  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  5 .gnu.debuglto_.debug_line 0000004d  0000000000000000  0000000000000000  0000031c  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  6 .gnu.debuglto_.debug_str 000001e9  0000000000000000  0000000000000000  00000369  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  7 .gnu.debuglto_.debug_line_str 00000100  0000000000000000  0000000000000000  00000552  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  8 .gnu.lto_.profile.313926ae13abf002 0000000f  0000000000000000  0000000000000000  00000652  2**0
+                  CONTENTS, READONLY, EXCLUDE
+  9 .gnu.lto_.icf.313926ae13abf002 00000031  0000000000000000  0000000000000000  00000661  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 10 .gnu.lto_.ipa_sra.313926ae13abf002 00000019  0000000000000000  0000000000000000  00000692  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 11 .gnu.lto_.inline.313926ae13abf002 00000091  0000000000000000  0000000000000000  000006ab  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 12 .gnu.lto_.jmpfuncs.313926ae13abf002 0000002c  0000000000000000  0000000000000000  0000073c  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 13 .gnu.lto_.pureconst.313926ae13abf002 00000011  0000000000000000  0000000000000000  00000768  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 14 .gnu.lto_.ipa_modref.313926ae13abf002 00000034  0000000000000000  0000000000000000  00000779  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 15 .gnu.lto_.lto.313926ae13abf002 00000008  0000000000000000  0000000000000000  000007ad  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 16 .gnu.lto_MatMul_s8_s8_s32.13.313926ae13abf002 000010fa  0000000000000000  0000000000000000  000007b5  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 17 .gnu.lto_.symbol_nodes.313926ae13abf002 00000026  0000000000000000  0000000000000000  000018af  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 18 .gnu.lto_.refs.313926ae13abf002 0000000e  0000000000000000  0000000000000000  000018d5  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 19 .gnu.lto_.decls.313926ae13abf002 000003b7  0000000000000000  0000000000000000  000018e3  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 20 .gnu.lto_.symtab.313926ae13abf002 00000020  0000000000000000  0000000000000000  00001c9a  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 21 .gnu.lto_.ext_symtab.313926ae13abf002 00000003  0000000000000000  0000000000000000  00001cba  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 22 .gnu.lto_.opts 000000d3  0000000000000000  0000000000000000  00001cbd  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 23 .comment      00000028  0000000000000000  0000000000000000  00001d90  2**0
+                  CONTENTS, READONLY
+ 24 .note.GNU-stack 00000000  0000000000000000  0000000000000000  00001db8  2**0
+                  CONTENTS, READONLY
+
+MaxPool_fp32.c.o:     file format elf64-x86-64
+
+Sections:
+Idx Name          Size      VMA               LMA               File off  Algn
+  0 .text         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+  1 .data         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, DATA
+  2 .bss          00000000  0000000000000000  0000000000000000  00000040  2**0
+                  ALLOC
+  3 .gnu.debuglto_.debug_info 00000226  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  4 .gnu.debuglto_.debug_abbrev 000000b6  0000000000000000  0000000000000000  00000266  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  5 .gnu.debuglto_.debug_line 00000051  0000000000000000  0000000000000000  0000031c  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  6 .gnu.debuglto_.debug_str 0000018f  0000000000000000  0000000000000000  0000036d  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  7 .gnu.debuglto_.debug_line_str 00000122  0000000000000000  0000000000000000  000004fc  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  8 .gnu.lto_.profile.8c79d3ae07639ab0 0000000f  0000000000000000  0000000000000000  0000061e  2**0
+                  CONTENTS, READONLY, EXCLUDE
+  9 .gnu.lto_.icf.8c79d3ae07639ab0 00000039  0000000000000000  0000000000000000  0000062d  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 10 .gnu.lto_.ipa_sra.8c79d3ae07639ab0 00000051  0000000000000000  0000000000000000  00000666  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 11 .gnu.lto_.inline.8c79d3ae07639ab0 0000012d  0000000000000000  0000000000000000  000006b7  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 12 .gnu.lto_.jmpfuncs.8c79d3ae07639ab0 0000007f  0000000000000000  0000000000000000  000007e4  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 13 .gnu.lto_.pureconst.8c79d3ae07639ab0 0000001a  0000000000000000  0000000000000000  00000863  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 14 .gnu.lto_.ipa_modref.8c79d3ae07639ab0 0000003e  0000000000000000  0000000000000000  0000087d  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 15 .gnu.lto_.lto.8c79d3ae07639ab0 00000008  0000000000000000  0000000000000000  000008bb  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 16 .gnu.lto_MaxPool2d_fp32_fp32_NCHW.13.8c79d3ae07639ab0 000002c6  0000000000000000  0000000000000000  000008c3  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 17 .gnu.lto_MaxPool1d_fp32_fp32.14.8c79d3ae07639ab0 0000022c  0000000000000000  0000000000000000  00000b89  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 18 .gnu.lto_MaxPool2d_fp32_fp32_NCHW.part.0.15.8c79d3ae07639ab0 0000089f  0000000000000000  0000000000000000  00000db5  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 19 .gnu.lto_MaxPool1d_fp32_fp32.part.0.16.8c79d3ae07639ab0 0000063e  0000000000000000  0000000000000000  00001654  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 20 .gnu.lto_.symbol_nodes.8c79d3ae07639ab0 00000060  0000000000000000  0000000000000000  00001c92  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 21 .gnu.lto_.refs.8c79d3ae07639ab0 0000000e  0000000000000000  0000000000000000  00001cf2  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 22 .gnu.lto_.decls.8c79d3ae07639ab0 0000045d  0000000000000000  0000000000000000  00001d00  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 23 .gnu.lto_.symtab.8c79d3ae07639ab0 0000004b  0000000000000000  0000000000000000  0000215d  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 24 .gnu.lto_.ext_symtab.8c79d3ae07639ab0 00000005  0000000000000000  0000000000000000  000021a8  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 25 .gnu.lto_.opts 000000d3  0000000000000000  0000000000000000  000021ad  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 26 .comment      00000028  0000000000000000  0000000000000000  00002280  2**0
+                  CONTENTS, READONLY
+ 27 .note.GNU-stack 00000000  0000000000000000  0000000000000000  000022a8  2**0
+                  CONTENTS, READONLY
+
+MaxPool_s8.c.o:     file format elf64-x86-64
+
+Sections:
+Idx Name          Size      VMA               LMA               File off  Algn
+  0 .text         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+  1 .data         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, DATA
+  2 .bss          00000000  0000000000000000  0000000000000000  00000040  2**0
+                  ALLOC
+  3 .gnu.debuglto_.debug_info 00000251  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  4 .gnu.debuglto_.debug_abbrev 000000bd  0000000000000000  0000000000000000  00000291  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  5 .gnu.debuglto_.debug_line 0000004d  0000000000000000  0000000000000000  0000034e  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  6 .gnu.debuglto_.debug_str 000001b5  0000000000000000  0000000000000000  0000039b  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  7 .gnu.debuglto_.debug_line_str 00000102  0000000000000000  0000000000000000  00000550  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  8 .gnu.lto_.profile.90b7dff2ca27ea69 0000000f  0000000000000000  0000000000000000  00000652  2**0
+                  CONTENTS, READONLY, EXCLUDE
+  9 .gnu.lto_.icf.90b7dff2ca27ea69 0000003e  0000000000000000  0000000000000000  00000661  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 10 .gnu.lto_.ipa_sra.90b7dff2ca27ea69 0000005c  0000000000000000  0000000000000000  0000069f  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 11 .gnu.lto_.inline.90b7dff2ca27ea69 00000125  0000000000000000  0000000000000000  000006fb  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 12 .gnu.lto_.jmpfuncs.90b7dff2ca27ea69 00000099  0000000000000000  0000000000000000  00000820  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 13 .gnu.lto_.pureconst.90b7dff2ca27ea69 0000001a  0000000000000000  0000000000000000  000008b9  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 14 .gnu.lto_.ipa_modref.90b7dff2ca27ea69 0000003b  0000000000000000  0000000000000000  000008d3  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 15 .gnu.lto_.lto.90b7dff2ca27ea69 00000008  0000000000000000  0000000000000000  0000090e  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 16 .gnu.lto_MaxPool2d_s8_s8_NCHW.13.90b7dff2ca27ea69 00000358  0000000000000000  0000000000000000  00000916  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 17 .gnu.lto_MaxPool1d_s8_s8.14.90b7dff2ca27ea69 0000026e  0000000000000000  0000000000000000  00000c6e  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 18 .gnu.lto_MaxPool2d_s8_s8_NCHW.part.0.15.90b7dff2ca27ea69 00000781  0000000000000000  0000000000000000  00000edc  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 19 .gnu.lto_MaxPool1d_s8_s8.part.0.16.90b7dff2ca27ea69 0000067f  0000000000000000  0000000000000000  0000165d  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 20 .gnu.lto_.symbol_nodes.90b7dff2ca27ea69 00000062  0000000000000000  0000000000000000  00001cdc  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 21 .gnu.lto_.refs.90b7dff2ca27ea69 0000000e  0000000000000000  0000000000000000  00001d3e  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 22 .gnu.lto_.decls.90b7dff2ca27ea69 000004d0  0000000000000000  0000000000000000  00001d4c  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 23 .gnu.lto_.symtab.90b7dff2ca27ea69 00000043  0000000000000000  0000000000000000  0000221c  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 24 .gnu.lto_.ext_symtab.90b7dff2ca27ea69 00000005  0000000000000000  0000000000000000  0000225f  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 25 .gnu.lto_.opts 000000d3  0000000000000000  0000000000000000  00002264  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 26 .comment      00000028  0000000000000000  0000000000000000  00002337  2**0
+                  CONTENTS, READONLY
+ 27 .note.GNU-stack 00000000  0000000000000000  0000000000000000  0000235f  2**0
+                  CONTENTS, READONLY
+
+Pow_fp32.c.o:     file format elf64-x86-64
+
+Sections:
+Idx Name          Size      VMA               LMA               File off  Algn
+  0 .text         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+  1 .data         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, DATA
+  2 .bss          00000000  0000000000000000  0000000000000000  00000040  2**0
+                  ALLOC
+  3 .gnu.debuglto_.debug_info 00000146  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  4 .gnu.debuglto_.debug_abbrev 000000b5  0000000000000000  0000000000000000  00000186  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  5 .gnu.debuglto_.debug_line 00000056  0000000000000000  0000000000000000  0000023b  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  6 .gnu.debuglto_.debug_str 0000017e  0000000000000000  0000000000000000  00000291  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  7 .gnu.debuglto_.debug_line_str 00000125  0000000000000000  0000000000000000  0000040f  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  8 .gnu.lto_.profile.cae81c072aa02136 0000000f  0000000000000000  0000000000000000  00000534  2**0
+                  CONTENTS, READONLY, EXCLUDE
+  9 .gnu.lto_.icf.cae81c072aa02136 0000002a  0000000000000000  0000000000000000  00000543  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 10 .gnu.lto_.ipa_sra.cae81c072aa02136 00000028  0000000000000000  0000000000000000  0000056d  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 11 .gnu.lto_.inline.cae81c072aa02136 00000064  0000000000000000  0000000000000000  00000595  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 12 .gnu.lto_.jmpfuncs.cae81c072aa02136 0000003a  0000000000000000  0000000000000000  000005f9  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 13 .gnu.lto_.pureconst.cae81c072aa02136 00000014  0000000000000000  0000000000000000  00000633  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 14 .gnu.lto_.ipa_modref.cae81c072aa02136 00000042  0000000000000000  0000000000000000  00000647  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 15 .gnu.lto_.lto.cae81c072aa02136 00000008  0000000000000000  0000000000000000  00000689  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 16 .gnu.lto_Pow_fp32_fp32_fp32.13.cae81c072aa02136 000002bd  0000000000000000  0000000000000000  00000691  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 17 .gnu.lto_Pow_fp32_scalar_fp32.14.cae81c072aa02136 000002a9  0000000000000000  0000000000000000  0000094e  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 18 .gnu.lto_.symbol_nodes.cae81c072aa02136 00000052  0000000000000000  0000000000000000  00000bf7  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 19 .gnu.lto_.refs.cae81c072aa02136 0000000e  0000000000000000  0000000000000000  00000c49  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 20 .gnu.lto_.decls.cae81c072aa02136 0000047c  0000000000000000  0000000000000000  00000c57  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 21 .gnu.lto_.symtab.cae81c072aa02136 0000005a  0000000000000000  0000000000000000  000010d3  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 22 .gnu.lto_.ext_symtab.cae81c072aa02136 00000007  0000000000000000  0000000000000000  0000112d  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 23 .gnu.lto_.opts 000000d3  0000000000000000  0000000000000000  00001134  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 24 .comment      00000028  0000000000000000  0000000000000000  00001207  2**0
+                  CONTENTS, READONLY
+ 25 .note.GNU-stack 00000000  0000000000000000  0000000000000000  0000122f  2**0
+                  CONTENTS, READONLY
+
+RQDiv_s8.c.o:     file format elf64-x86-64
+
+Sections:
+Idx Name          Size      VMA               LMA               File off  Algn
+  0 .text         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+  1 .data         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, DATA
+  2 .bss          00000000  0000000000000000  0000000000000000  00000040  2**0
+                  ALLOC
+  3 .gnu.debuglto_.debug_info 000001cf  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  4 .gnu.debuglto_.debug_abbrev 00000098  0000000000000000  0000000000000000  0000020f  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  5 .gnu.debuglto_.debug_line 00000048  0000000000000000  0000000000000000  000002a7  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  6 .gnu.debuglto_.debug_str 00000209  0000000000000000  0000000000000000  000002ef  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  7 .gnu.debuglto_.debug_line_str 000000ef  0000000000000000  0000000000000000  000004f8  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  8 .gnu.lto_.profile.3e47b5ce03f4120c 0000000f  0000000000000000  0000000000000000  000005e7  2**0
+                  CONTENTS, READONLY, EXCLUDE
+  9 .gnu.lto_.icf.3e47b5ce03f4120c 00000021  0000000000000000  0000000000000000  000005f6  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 10 .gnu.lto_.ipa_sra.3e47b5ce03f4120c 0000001c  0000000000000000  0000000000000000  00000617  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 11 .gnu.lto_.inline.3e47b5ce03f4120c 00000084  0000000000000000  0000000000000000  00000633  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 12 .gnu.lto_.jmpfuncs.3e47b5ce03f4120c 0000002d  0000000000000000  0000000000000000  000006b7  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 13 .gnu.lto_.pureconst.3e47b5ce03f4120c 00000011  0000000000000000  0000000000000000  000006e4  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 14 .gnu.lto_.ipa_modref.3e47b5ce03f4120c 00000031  0000000000000000  0000000000000000  000006f5  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 15 .gnu.lto_.lto.3e47b5ce03f4120c 00000008  0000000000000000  0000000000000000  00000726  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 16 .gnu.lto_RQDiv_s32_s8.13.3e47b5ce03f4120c 000007f1  0000000000000000  0000000000000000  0000072e  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 17 .gnu.lto_.symbol_nodes.3e47b5ce03f4120c 00000026  0000000000000000  0000000000000000  00000f1f  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 18 .gnu.lto_.refs.3e47b5ce03f4120c 0000000e  0000000000000000  0000000000000000  00000f45  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 19 .gnu.lto_.decls.3e47b5ce03f4120c 000003c9  0000000000000000  0000000000000000  00000f53  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 20 .gnu.lto_.symtab.3e47b5ce03f4120c 0000001c  0000000000000000  0000000000000000  0000131c  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 21 .gnu.lto_.ext_symtab.3e47b5ce03f4120c 00000003  0000000000000000  0000000000000000  00001338  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 22 .gnu.lto_.opts 000000d3  0000000000000000  0000000000000000  0000133b  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 23 .comment      00000028  0000000000000000  0000000000000000  0000140e  2**0
+                  CONTENTS, READONLY
+ 24 .note.GNU-stack 00000000  0000000000000000  0000000000000000  00001436  2**0
+                  CONTENTS, READONLY
+
+RQGELU_s8.c.o:     file format elf64-x86-64
+
+Sections:
+Idx Name          Size      VMA               LMA               File off  Algn
+  0 .text         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+  1 .data         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, DATA
+  2 .bss          00000000  0000000000000000  0000000000000000  00000040  2**0
+                  ALLOC
+  3 .gnu.debuglto_.debug_info 00000190  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  4 .gnu.debuglto_.debug_abbrev 00000097  0000000000000000  0000000000000000  000001d0  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  5 .gnu.debuglto_.debug_line 00000048  0000000000000000  0000000000000000  00000267  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  6 .gnu.debuglto_.debug_str 000001aa  0000000000000000  0000000000000000  000002af  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  7 .gnu.debuglto_.debug_line_str 000000f1  0000000000000000  0000000000000000  00000459  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  8 .gnu.lto_.profile.1263c854a3ec0751 0000000f  0000000000000000  0000000000000000  0000054a  2**0
+                  CONTENTS, READONLY, EXCLUDE
+  9 .gnu.lto_.icf.1263c854a3ec0751 00000025  0000000000000000  0000000000000000  00000559  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 10 .gnu.lto_.ipa_sra.1263c854a3ec0751 00000022  0000000000000000  0000000000000000  0000057e  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 11 .gnu.lto_.inline.1263c854a3ec0751 00000054  0000000000000000  0000000000000000  000005a0  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 12 .gnu.lto_.jmpfuncs.1263c854a3ec0751 00000033  0000000000000000  0000000000000000  000005f4  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 13 .gnu.lto_.pureconst.1263c854a3ec0751 00000011  0000000000000000  0000000000000000  00000627  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 14 .gnu.lto_.ipa_modref.1263c854a3ec0751 00000044  0000000000000000  0000000000000000  00000638  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 15 .gnu.lto_.lto.1263c854a3ec0751 00000008  0000000000000000  0000000000000000  0000067c  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 16 .gnu.lto_RQGELU_s8_s8.13.1263c854a3ec0751 000005be  0000000000000000  0000000000000000  00000684  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 17 .gnu.lto_.symbol_nodes.1263c854a3ec0751 00000026  0000000000000000  0000000000000000  00000c42  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 18 .gnu.lto_.refs.1263c854a3ec0751 0000000e  0000000000000000  0000000000000000  00000c68  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 19 .gnu.lto_.decls.1263c854a3ec0751 000003b0  0000000000000000  0000000000000000  00000c76  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 20 .gnu.lto_.symtab.1263c854a3ec0751 0000001c  0000000000000000  0000000000000000  00001026  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 21 .gnu.lto_.ext_symtab.1263c854a3ec0751 00000003  0000000000000000  0000000000000000  00001042  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 22 .gnu.lto_.opts 000000d3  0000000000000000  0000000000000000  00001045  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 23 .comment      00000028  0000000000000000  0000000000000000  00001118  2**0
+                  CONTENTS, READONLY
+ 24 .note.GNU-stack 00000000  0000000000000000  0000000000000000  00001140  2**0
+                  CONTENTS, READONLY
+
+RQHardswish.c.o:     file format elf64-x86-64
+
+Sections:
+Idx Name          Size      VMA               LMA               File off  Algn
+  0 .text         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+  1 .data         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, DATA
+  2 .bss          00000000  0000000000000000  0000000000000000  00000040  2**0
+                  ALLOC
+  3 .gnu.debuglto_.debug_info 00000140  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  4 .gnu.debuglto_.debug_abbrev 00000094  0000000000000000  0000000000000000  00000180  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  5 .gnu.debuglto_.debug_line 00000048  0000000000000000  0000000000000000  00000214  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  6 .gnu.debuglto_.debug_str 00000196  0000000000000000  0000000000000000  0000025c  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  7 .gnu.debuglto_.debug_line_str 000000f5  0000000000000000  0000000000000000  000003f2  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  8 .gnu.lto_.profile.2afacf5d52c46cef 0000000f  0000000000000000  0000000000000000  000004e7  2**0
+                  CONTENTS, READONLY, EXCLUDE
+  9 .gnu.lto_.icf.2afacf5d52c46cef 00000022  0000000000000000  0000000000000000  000004f6  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 10 .gnu.lto_.ipa_sra.2afacf5d52c46cef 00000019  0000000000000000  0000000000000000  00000518  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 11 .gnu.lto_.inline.2afacf5d52c46cef 00000050  0000000000000000  0000000000000000  00000531  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 12 .gnu.lto_.jmpfuncs.2afacf5d52c46cef 00000024  0000000000000000  0000000000000000  00000581  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 13 .gnu.lto_.pureconst.2afacf5d52c46cef 00000011  0000000000000000  0000000000000000  000005a5  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 14 .gnu.lto_.ipa_modref.2afacf5d52c46cef 00000026  0000000000000000  0000000000000000  000005b6  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 15 .gnu.lto_.lto.2afacf5d52c46cef 00000008  0000000000000000  0000000000000000  000005dc  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 16 .gnu.lto_RQiHardswish_s8_s8.13.2afacf5d52c46cef 0000045f  0000000000000000  0000000000000000  000005e4  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 17 .gnu.lto_.symbol_nodes.2afacf5d52c46cef 00000026  0000000000000000  0000000000000000  00000a43  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 18 .gnu.lto_.refs.2afacf5d52c46cef 0000000e  0000000000000000  0000000000000000  00000a69  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 19 .gnu.lto_.decls.2afacf5d52c46cef 0000034b  0000000000000000  0000000000000000  00000a77  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 20 .gnu.lto_.symtab.2afacf5d52c46cef 00000022  0000000000000000  0000000000000000  00000dc2  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 21 .gnu.lto_.ext_symtab.2afacf5d52c46cef 00000003  0000000000000000  0000000000000000  00000de4  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 22 .gnu.lto_.opts 000000d3  0000000000000000  0000000000000000  00000de7  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 23 .comment      00000028  0000000000000000  0000000000000000  00000eba  2**0
+                  CONTENTS, READONLY
+ 24 .note.GNU-stack 00000000  0000000000000000  0000000000000000  00000ee2  2**0
+                  CONTENTS, READONLY
+
+Relu_fp32.c.o:     file format elf64-x86-64
+
+Sections:
+Idx Name          Size      VMA               LMA               File off  Algn
+  0 .text         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+  1 .data         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, DATA
+  2 .bss          00000000  0000000000000000  0000000000000000  00000040  2**0
+                  ALLOC
+  3 .gnu.debuglto_.debug_info 000000e2  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  4 .gnu.debuglto_.debug_abbrev 00000077  0000000000000000  0000000000000000  00000122  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  5 .gnu.debuglto_.debug_line 00000051  0000000000000000  0000000000000000  00000199  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  6 .gnu.debuglto_.debug_str 00000153  0000000000000000  0000000000000000  000001ea  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  7 .gnu.debuglto_.debug_line_str 0000011b  0000000000000000  0000000000000000  0000033d  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  8 .gnu.lto_.profile.cfd96bbbe394fc76 0000000f  0000000000000000  0000000000000000  00000458  2**0
+                  CONTENTS, READONLY, EXCLUDE
+  9 .gnu.lto_.icf.cfd96bbbe394fc76 00000022  0000000000000000  0000000000000000  00000467  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 10 .gnu.lto_.ipa_sra.cfd96bbbe394fc76 00000019  0000000000000000  0000000000000000  00000489  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 11 .gnu.lto_.inline.cfd96bbbe394fc76 0000004a  0000000000000000  0000000000000000  000004a2  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 12 .gnu.lto_.jmpfuncs.cfd96bbbe394fc76 00000022  0000000000000000  0000000000000000  000004ec  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 13 .gnu.lto_.pureconst.cfd96bbbe394fc76 00000011  0000000000000000  0000000000000000  0000050e  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 14 .gnu.lto_.ipa_modref.cfd96bbbe394fc76 00000028  0000000000000000  0000000000000000  0000051f  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 15 .gnu.lto_.lto.cfd96bbbe394fc76 00000008  0000000000000000  0000000000000000  00000547  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 16 .gnu.lto_Relu_fp32_fp32.13.cfd96bbbe394fc76 00000300  0000000000000000  0000000000000000  0000054f  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 17 .gnu.lto_.symbol_nodes.cfd96bbbe394fc76 00000026  0000000000000000  0000000000000000  0000084f  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 18 .gnu.lto_.refs.cfd96bbbe394fc76 0000000e  0000000000000000  0000000000000000  00000875  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 19 .gnu.lto_.decls.cfd96bbbe394fc76 000002e5  0000000000000000  0000000000000000  00000883  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 20 .gnu.lto_.symtab.cfd96bbbe394fc76 0000001e  0000000000000000  0000000000000000  00000b68  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 21 .gnu.lto_.ext_symtab.cfd96bbbe394fc76 00000003  0000000000000000  0000000000000000  00000b86  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 22 .gnu.lto_.opts 000000d3  0000000000000000  0000000000000000  00000b89  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 23 .comment      00000028  0000000000000000  0000000000000000  00000c5c  2**0
+                  CONTENTS, READONLY
+ 24 .note.GNU-stack 00000000  0000000000000000  0000000000000000  00000c84  2**0
+                  CONTENTS, READONLY
+
+RequantShift_s8.c.o:     file format elf64-x86-64
+
+Sections:
+Idx Name          Size      VMA               LMA               File off  Algn
+  0 .text         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+  1 .data         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, DATA
+  2 .bss          00000000  0000000000000000  0000000000000000  00000040  2**0
+                  ALLOC
+  3 .gnu.debuglto_.debug_info 000004df  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  4 .gnu.debuglto_.debug_abbrev 000000ab  0000000000000000  0000000000000000  0000051f  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  5 .gnu.debuglto_.debug_line 00000048  0000000000000000  0000000000000000  000005ca  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  6 .gnu.debuglto_.debug_str 00000250  0000000000000000  0000000000000000  00000612  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  7 .gnu.debuglto_.debug_line_str 000000fd  0000000000000000  0000000000000000  00000862  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  8 .gnu.lto_.profile.6cee120ea01fbefc 0000000f  0000000000000000  0000000000000000  0000095f  2**0
+                  CONTENTS, READONLY, EXCLUDE
+  9 .gnu.lto_.icf.6cee120ea01fbefc 00000056  0000000000000000  0000000000000000  0000096e  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 10 .gnu.lto_.ipa_sra.6cee120ea01fbefc 0000002b  0000000000000000  0000000000000000  000009c4  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 11 .gnu.lto_.inline.6cee120ea01fbefc 0000008b  0000000000000000  0000000000000000  000009ef  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 12 .gnu.lto_.jmpfuncs.6cee120ea01fbefc 0000004f  0000000000000000  0000000000000000  00000a7a  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 13 .gnu.lto_.pureconst.6cee120ea01fbefc 00000020  0000000000000000  0000000000000000  00000ac9  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 14 .gnu.lto_.ipa_modref.6cee120ea01fbefc 00000068  0000000000000000  0000000000000000  00000ae9  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 15 .gnu.lto_.lto.6cee120ea01fbefc 00000008  0000000000000000  0000000000000000  00000b51  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 16 .gnu.lto_RequantShift_s8_s8_NHWC.13.6cee120ea01fbefc 0000054c  0000000000000000  0000000000000000  00000b59  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 17 .gnu.lto_RequantShift_s16_s8_NHWC.14.6cee120ea01fbefc 0000055f  0000000000000000  0000000000000000  000010a5  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 18 .gnu.lto_RequantShift_s32_s8_NHWC.15.6cee120ea01fbefc 00000546  0000000000000000  0000000000000000  00001604  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 19 .gnu.lto_RequantShift_s8_s8_NCHW.16.6cee120ea01fbefc 0000054d  0000000000000000  0000000000000000  00001b4a  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 20 .gnu.lto_RequantShift_s16_s8_NCHW.17.6cee120ea01fbefc 0000055d  0000000000000000  0000000000000000  00002097  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 21 .gnu.lto_RequantShift_s32_s8_NCHW.18.6cee120ea01fbefc 00000553  0000000000000000  0000000000000000  000025f4  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 22 .gnu.lto_.symbol_nodes.6cee120ea01fbefc 00000043  0000000000000000  0000000000000000  00002b47  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 23 .gnu.lto_.refs.6cee120ea01fbefc 0000000e  0000000000000000  0000000000000000  00002b8a  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 24 .gnu.lto_.decls.6cee120ea01fbefc 00000518  0000000000000000  0000000000000000  00002b98  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 25 .gnu.lto_.symtab.6cee120ea01fbefc 000000ee  0000000000000000  0000000000000000  000030b0  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 26 .gnu.lto_.ext_symtab.6cee120ea01fbefc 0000000d  0000000000000000  0000000000000000  0000319e  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 27 .gnu.lto_.opts 000000d3  0000000000000000  0000000000000000  000031ab  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 28 .comment      00000028  0000000000000000  0000000000000000  0000327e  2**0
+                  CONTENTS, READONLY
+ 29 .note.GNU-stack 00000000  0000000000000000  0000000000000000  000032a6  2**0
+                  CONTENTS, READONLY
+
+Sigmoid_fp32.c.o:     file format elf64-x86-64
+
+Sections:
+Idx Name          Size      VMA               LMA               File off  Algn
+  0 .text         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+  1 .data         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, DATA
+  2 .bss          00000000  0000000000000000  0000000000000000  00000040  2**0
+                  ALLOC
+  3 .gnu.debuglto_.debug_info 000000e3  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  4 .gnu.debuglto_.debug_abbrev 00000094  0000000000000000  0000000000000000  00000123  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  5 .gnu.debuglto_.debug_line 00000056  0000000000000000  0000000000000000  000001b7  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  6 .gnu.debuglto_.debug_str 0000015f  0000000000000000  0000000000000000  0000020d  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  7 .gnu.debuglto_.debug_line_str 0000012d  0000000000000000  0000000000000000  0000036c  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  8 .gnu.lto_.profile.3fb6a4b82577a391 0000000f  0000000000000000  0000000000000000  00000499  2**0
+                  CONTENTS, READONLY, EXCLUDE
+  9 .gnu.lto_.icf.3fb6a4b82577a391 00000022  0000000000000000  0000000000000000  000004a8  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 10 .gnu.lto_.ipa_sra.3fb6a4b82577a391 00000023  0000000000000000  0000000000000000  000004ca  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 11 .gnu.lto_.inline.3fb6a4b82577a391 0000004d  0000000000000000  0000000000000000  000004ed  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 12 .gnu.lto_.jmpfuncs.3fb6a4b82577a391 00000024  0000000000000000  0000000000000000  0000053a  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 13 .gnu.lto_.pureconst.3fb6a4b82577a391 00000011  0000000000000000  0000000000000000  0000055e  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 14 .gnu.lto_.ipa_modref.3fb6a4b82577a391 00000030  0000000000000000  0000000000000000  0000056f  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 15 .gnu.lto_.lto.3fb6a4b82577a391 00000008  0000000000000000  0000000000000000  0000059f  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 16 .gnu.lto_Sigmoid_fp32_fp32.13.3fb6a4b82577a391 000002b7  0000000000000000  0000000000000000  000005a7  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 17 .gnu.lto_.symbol_nodes.3fb6a4b82577a391 00000048  0000000000000000  0000000000000000  0000085e  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 18 .gnu.lto_.refs.3fb6a4b82577a391 0000000e  0000000000000000  0000000000000000  000008a6  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 19 .gnu.lto_.decls.3fb6a4b82577a391 000003db  0000000000000000  0000000000000000  000008b4  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 20 .gnu.lto_.symtab.3fb6a4b82577a391 00000035  0000000000000000  0000000000000000  00000c8f  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 21 .gnu.lto_.ext_symtab.3fb6a4b82577a391 00000005  0000000000000000  0000000000000000  00000cc4  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 22 .gnu.lto_.opts 000000d3  0000000000000000  0000000000000000  00000cc9  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 23 .comment      00000028  0000000000000000  0000000000000000  00000d9c  2**0
+                  CONTENTS, READONLY
+ 24 .note.GNU-stack 00000000  0000000000000000  0000000000000000  00000dc4  2**0
+                  CONTENTS, READONLY
+
+Softmax_fp32.c.o:     file format elf64-x86-64
+
+Sections:
+Idx Name          Size      VMA               LMA               File off  Algn
+  0 .text         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+  1 .data         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, DATA
+  2 .bss          00000000  0000000000000000  0000000000000000  00000040  2**0
+                  ALLOC
+  3 .gnu.debuglto_.debug_info 000001ed  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  4 .gnu.debuglto_.debug_abbrev 000000bc  0000000000000000  0000000000000000  0000022d  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  5 .gnu.debuglto_.debug_line 00000056  0000000000000000  0000000000000000  000002e9  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  6 .gnu.debuglto_.debug_str 000001e2  0000000000000000  0000000000000000  0000033f  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  7 .gnu.debuglto_.debug_line_str 0000012d  0000000000000000  0000000000000000  00000521  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  8 .gnu.lto_.profile.225f05ea98d7749b 0000000f  0000000000000000  0000000000000000  0000064e  2**0
+                  CONTENTS, READONLY, EXCLUDE
+  9 .gnu.lto_.icf.225f05ea98d7749b 00000026  0000000000000000  0000000000000000  0000065d  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 10 .gnu.lto_.ipa_sra.225f05ea98d7749b 00000025  0000000000000000  0000000000000000  00000683  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 11 .gnu.lto_.inline.225f05ea98d7749b 00000078  0000000000000000  0000000000000000  000006a8  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 12 .gnu.lto_.jmpfuncs.225f05ea98d7749b 0000003a  0000000000000000  0000000000000000  00000720  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 13 .gnu.lto_.pureconst.225f05ea98d7749b 00000014  0000000000000000  0000000000000000  0000075a  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 14 .gnu.lto_.ipa_modref.225f05ea98d7749b 00000044  0000000000000000  0000000000000000  0000076e  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 15 .gnu.lto_.lto.225f05ea98d7749b 00000008  0000000000000000  0000000000000000  000007b2  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 16 .gnu.lto_Softmax_fp32_fp32.13.225f05ea98d7749b 00000648  0000000000000000  0000000000000000  000007ba  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 17 .gnu.lto_SoftmaxGrad_fp32_fp32_fp32.14.225f05ea98d7749b 00000509  0000000000000000  0000000000000000  00000e02  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 18 .gnu.lto_.symbol_nodes.225f05ea98d7749b 0000004c  0000000000000000  0000000000000000  0000130b  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 19 .gnu.lto_.refs.225f05ea98d7749b 0000000e  0000000000000000  0000000000000000  00001357  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 20 .gnu.lto_.decls.225f05ea98d7749b 0000043f  0000000000000000  0000000000000000  00001365  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 21 .gnu.lto_.symtab.225f05ea98d7749b 0000005f  0000000000000000  0000000000000000  000017a4  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 22 .gnu.lto_.ext_symtab.225f05ea98d7749b 00000007  0000000000000000  0000000000000000  00001803  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 23 .gnu.lto_.opts 000000d3  0000000000000000  0000000000000000  0000180a  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 24 .comment      00000028  0000000000000000  0000000000000000  000018dd  2**0
+                  CONTENTS, READONLY
+ 25 .note.GNU-stack 00000000  0000000000000000  0000000000000000  00001905  2**0
+                  CONTENTS, READONLY
+
+Softmax_s8.c.o:     file format elf64-x86-64
+
+Sections:
+Idx Name          Size      VMA               LMA               File off  Algn
+  0 .text         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+  1 .data         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, DATA
+  2 .bss          00000000  0000000000000000  0000000000000000  00000040  2**0
+                  ALLOC
+  3 .gnu.debuglto_.debug_info 00000411  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  4 .gnu.debuglto_.debug_abbrev 000000d8  0000000000000000  0000000000000000  00000451  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  5 .gnu.debuglto_.debug_line 0000005f  0000000000000000  0000000000000000  00000529  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  6 .gnu.debuglto_.debug_str 000002f7  0000000000000000  0000000000000000  00000588  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  7 .gnu.debuglto_.debug_line_str 00000166  0000000000000000  0000000000000000  0000087f  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  8 .gnu.lto_.profile.91366fd9a8d4f615 0000000f  0000000000000000  0000000000000000  000009e5  2**0
+                  CONTENTS, READONLY, EXCLUDE
+  9 .gnu.lto_.icf.91366fd9a8d4f615 00000043  0000000000000000  0000000000000000  000009f4  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 10 .gnu.lto_.ipa_sra.91366fd9a8d4f615 00000026  0000000000000000  0000000000000000  00000a37  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 11 .gnu.lto_.inline.91366fd9a8d4f615 000000ed  0000000000000000  0000000000000000  00000a5d  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 12 .gnu.lto_.jmpfuncs.91366fd9a8d4f615 00000063  0000000000000000  0000000000000000  00000b4a  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 13 .gnu.lto_.pureconst.91366fd9a8d4f615 00000017  0000000000000000  0000000000000000  00000bad  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 14 .gnu.lto_.ipa_modref.91366fd9a8d4f615 00000055  0000000000000000  0000000000000000  00000bc4  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 15 .gnu.lto_.lto.91366fd9a8d4f615 00000008  0000000000000000  0000000000000000  00000c19  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 16 .gnu.lto_Softmax_s8_s8.24.91366fd9a8d4f615 0000081f  0000000000000000  0000000000000000  00000c21  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 17 .gnu.lto_ITAMax_s8.25.91366fd9a8d4f615 000006a6  0000000000000000  0000000000000000  00001440  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 18 .gnu.lto_ITAPartialMax_s8.26.91366fd9a8d4f615 000009d2  0000000000000000  0000000000000000  00001ae6  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 19 .gnu.lto_.symbol_nodes.91366fd9a8d4f615 00000062  0000000000000000  0000000000000000  000024b8  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 20 .gnu.lto_.refs.91366fd9a8d4f615 0000000e  0000000000000000  0000000000000000  0000251a  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 21 .gnu.lto_.decls.91366fd9a8d4f615 00000645  0000000000000000  0000000000000000  00002528  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 22 .gnu.lto_.symtab.91366fd9a8d4f615 00000090  0000000000000000  0000000000000000  00002b6d  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 23 .gnu.lto_.ext_symtab.91366fd9a8d4f615 0000000b  0000000000000000  0000000000000000  00002bfd  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 24 .gnu.lto_.opts 000000d3  0000000000000000  0000000000000000  00002c08  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 25 .comment      00000028  0000000000000000  0000000000000000  00002cdb  2**0
+                  CONTENTS, READONLY
+ 26 .note.GNU-stack 00000000  0000000000000000  0000000000000000  00002d03  2**0
+                  CONTENTS, READONLY
+
+Sqrt_fp32.c.o:     file format elf64-x86-64
+
+Sections:
+Idx Name          Size      VMA               LMA               File off  Algn
+  0 .text         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+  1 .data         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, DATA
+  2 .bss          00000000  0000000000000000  0000000000000000  00000040  2**0
+                  ALLOC
+  3 .gnu.debuglto_.debug_info 000000e3  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  4 .gnu.debuglto_.debug_abbrev 00000094  0000000000000000  0000000000000000  00000123  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  5 .gnu.debuglto_.debug_line 00000056  0000000000000000  0000000000000000  000001b7  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  6 .gnu.debuglto_.debug_str 0000015d  0000000000000000  0000000000000000  0000020d  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  7 .gnu.debuglto_.debug_line_str 00000127  0000000000000000  0000000000000000  0000036a  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  8 .gnu.lto_.profile.3dbf3244e173afb0 0000000f  0000000000000000  0000000000000000  00000491  2**0
+                  CONTENTS, READONLY, EXCLUDE
+  9 .gnu.lto_.icf.3dbf3244e173afb0 00000022  0000000000000000  0000000000000000  000004a0  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 10 .gnu.lto_.ipa_sra.3dbf3244e173afb0 00000023  0000000000000000  0000000000000000  000004c2  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 11 .gnu.lto_.inline.3dbf3244e173afb0 0000004d  0000000000000000  0000000000000000  000004e5  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 12 .gnu.lto_.jmpfuncs.3dbf3244e173afb0 00000024  0000000000000000  0000000000000000  00000532  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 13 .gnu.lto_.pureconst.3dbf3244e173afb0 00000011  0000000000000000  0000000000000000  00000556  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 14 .gnu.lto_.ipa_modref.3dbf3244e173afb0 00000030  0000000000000000  0000000000000000  00000567  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 15 .gnu.lto_.lto.3dbf3244e173afb0 00000008  0000000000000000  0000000000000000  00000597  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 16 .gnu.lto_Sqrt_fp32_fp32.13.3dbf3244e173afb0 0000027d  0000000000000000  0000000000000000  0000059f  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 17 .gnu.lto_.symbol_nodes.3dbf3244e173afb0 00000048  0000000000000000  0000000000000000  0000081c  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 18 .gnu.lto_.refs.3dbf3244e173afb0 0000000e  0000000000000000  0000000000000000  00000864  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 19 .gnu.lto_.decls.3dbf3244e173afb0 000003d7  0000000000000000  0000000000000000  00000872  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 20 .gnu.lto_.symtab.3dbf3244e173afb0 00000033  0000000000000000  0000000000000000  00000c49  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 21 .gnu.lto_.ext_symtab.3dbf3244e173afb0 00000005  0000000000000000  0000000000000000  00000c7c  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 22 .gnu.lto_.opts 000000d3  0000000000000000  0000000000000000  00000c81  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 23 .comment      00000028  0000000000000000  0000000000000000  00000d54  2**0
+                  CONTENTS, READONLY
+ 24 .note.GNU-stack 00000000  0000000000000000  0000000000000000  00000d7c  2**0
+                  CONTENTS, READONLY
+
+Swish_fp32.c.o:     file format elf64-x86-64
+
+Sections:
+Idx Name          Size      VMA               LMA               File off  Algn
+  0 .text         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+  1 .data         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, DATA
+  2 .bss          00000000  0000000000000000  0000000000000000  00000040  2**0
+                  ALLOC
+  3 .gnu.debuglto_.debug_info 000000fb  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  4 .gnu.debuglto_.debug_abbrev 00000094  0000000000000000  0000000000000000  0000013b  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  5 .gnu.debuglto_.debug_line 00000056  0000000000000000  0000000000000000  000001cf  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  6 .gnu.debuglto_.debug_str 00000163  0000000000000000  0000000000000000  00000225  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  7 .gnu.debuglto_.debug_line_str 00000129  0000000000000000  0000000000000000  00000388  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  8 .gnu.lto_.profile.24794a64294ea9fe 0000000f  0000000000000000  0000000000000000  000004b1  2**0
+                  CONTENTS, READONLY, EXCLUDE
+  9 .gnu.lto_.icf.24794a64294ea9fe 00000022  0000000000000000  0000000000000000  000004c0  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 10 .gnu.lto_.ipa_sra.24794a64294ea9fe 00000023  0000000000000000  0000000000000000  000004e2  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 11 .gnu.lto_.inline.24794a64294ea9fe 00000054  0000000000000000  0000000000000000  00000505  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 12 .gnu.lto_.jmpfuncs.24794a64294ea9fe 00000029  0000000000000000  0000000000000000  00000559  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 13 .gnu.lto_.pureconst.24794a64294ea9fe 00000011  0000000000000000  0000000000000000  00000582  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 14 .gnu.lto_.ipa_modref.24794a64294ea9fe 00000031  0000000000000000  0000000000000000  00000593  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 15 .gnu.lto_.lto.24794a64294ea9fe 00000008  0000000000000000  0000000000000000  000005c4  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 16 .gnu.lto_Swish_fp32_fp32.13.24794a64294ea9fe 00000309  0000000000000000  0000000000000000  000005cc  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 17 .gnu.lto_.symbol_nodes.24794a64294ea9fe 00000048  0000000000000000  0000000000000000  000008d5  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 18 .gnu.lto_.refs.24794a64294ea9fe 0000000e  0000000000000000  0000000000000000  0000091d  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 19 .gnu.lto_.decls.24794a64294ea9fe 000003e0  0000000000000000  0000000000000000  0000092b  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 20 .gnu.lto_.symtab.24794a64294ea9fe 00000033  0000000000000000  0000000000000000  00000d0b  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 21 .gnu.lto_.ext_symtab.24794a64294ea9fe 00000005  0000000000000000  0000000000000000  00000d3e  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 22 .gnu.lto_.opts 000000d3  0000000000000000  0000000000000000  00000d43  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 23 .comment      00000028  0000000000000000  0000000000000000  00000e16  2**0
+                  CONTENTS, READONLY
+ 24 .note.GNU-stack 00000000  0000000000000000  0000000000000000  00000e3e  2**0
+                  CONTENTS, READONLY
+
+Util.c.o:     file format elf64-x86-64
+
+Sections:
+Idx Name          Size      VMA               LMA               File off  Algn
+  0 .text         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+  1 .data         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, DATA
+  2 .bss          00000000  0000000000000000  0000000000000000  00000040  2**0
+                  ALLOC
+  3 .gnu.debuglto_.debug_info 00000bb1  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  4 .gnu.debuglto_.debug_abbrev 000001d9  0000000000000000  0000000000000000  00000bf1  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  5 .gnu.debuglto_.debug_line 00000081  0000000000000000  0000000000000000  00000dca  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  6 .gnu.debuglto_.debug_str 0000056c  0000000000000000  0000000000000000  00000e4b  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  7 .gnu.debuglto_.debug_line_str 00000198  0000000000000000  0000000000000000  000013b7  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  8 .gnu.lto_.profile.89c3c00a7bcb110d 0000000f  0000000000000000  0000000000000000  0000154f  2**0
+                  CONTENTS, READONLY, EXCLUDE
+  9 .gnu.lto_.icf.89c3c00a7bcb110d 000000d5  0000000000000000  0000000000000000  0000155e  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 10 .gnu.lto_.ipa_sra.89c3c00a7bcb110d 00000088  0000000000000000  0000000000000000  00001633  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 11 .gnu.lto_.inline.89c3c00a7bcb110d 000001a2  0000000000000000  0000000000000000  000016bb  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 12 .gnu.lto_.jmpfuncs.89c3c00a7bcb110d 00000178  0000000000000000  0000000000000000  0000185d  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 13 .gnu.lto_.pureconst.89c3c00a7bcb110d 00000042  0000000000000000  0000000000000000  000019d5  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 14 .gnu.lto_.ipa_modref.89c3c00a7bcb110d 000000b0  0000000000000000  0000000000000000  00001a17  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 15 .gnu.lto_.lto.89c3c00a7bcb110d 00000008  0000000000000000  0000000000000000  00001ac7  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 16 .gnu.lto_deeploy_log.24.89c3c00a7bcb110d 000002ac  0000000000000000  0000000000000000  00001acf  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 17 .gnu.lto_deeploy_malloc.25.89c3c00a7bcb110d 0000011b  0000000000000000  0000000000000000  00001d7b  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 18 .gnu.lto_deeploy_free.26.89c3c00a7bcb110d 00000106  0000000000000000  0000000000000000  00001e96  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 19 .gnu.lto_PrintMatrix_s8_NCHW.27.89c3c00a7bcb110d 00000511  0000000000000000  0000000000000000  00001f9c  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 20 .gnu.lto_PrintMatrix_s8_NHWC.28.89c3c00a7bcb110d 0000053c  0000000000000000  0000000000000000  000024ad  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 21 .gnu.lto_PrintMatrix_s16_NCHW.29.89c3c00a7bcb110d 00000533  0000000000000000  0000000000000000  000029e9  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 22 .gnu.lto_PrintMatrix_s16_NHWC.30.89c3c00a7bcb110d 0000054a  0000000000000000  0000000000000000  00002f1c  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 23 .gnu.lto_PrintMatrix_s32_NCHW.31.89c3c00a7bcb110d 0000050f  0000000000000000  0000000000000000  00003466  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 24 .gnu.lto_PrintMatrix_s32_NHWC.32.89c3c00a7bcb110d 00000526  0000000000000000  0000000000000000  00003975  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 25 .gnu.lto_PrintArray_s8.33.89c3c00a7bcb110d 000002bb  0000000000000000  0000000000000000  00003e9b  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 26 .gnu.lto_PrintArray_s16.34.89c3c00a7bcb110d 000002c9  0000000000000000  0000000000000000  00004156  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 27 .gnu.lto_PrintArray_s32.35.89c3c00a7bcb110d 000002a7  0000000000000000  0000000000000000  0000441f  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 28 .gnu.lto_PrintMatrix_u8_NCHW.36.89c3c00a7bcb110d 00000508  0000000000000000  0000000000000000  000046c6  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 29 .gnu.lto_PrintMatrix_u8_NHWC.37.89c3c00a7bcb110d 00000522  0000000000000000  0000000000000000  00004bce  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 30 .gnu.lto_PrintMatrix_u16_NCHW.38.89c3c00a7bcb110d 00000514  0000000000000000  0000000000000000  000050f0  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 31 .gnu.lto_PrintMatrix_u16_NHWC.39.89c3c00a7bcb110d 0000052f  0000000000000000  0000000000000000  00005604  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 32 .gnu.lto_PrintMatrix_u32_NCHW.40.89c3c00a7bcb110d 00000502  0000000000000000  0000000000000000  00005b33  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 33 .gnu.lto_PrintMatrix_u32_NHWC.41.89c3c00a7bcb110d 0000051e  0000000000000000  0000000000000000  00006035  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 34 .gnu.lto_PrintArray_u8.42.89c3c00a7bcb110d 000002a5  0000000000000000  0000000000000000  00006553  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 35 .gnu.lto_PrintArray_u16.43.89c3c00a7bcb110d 000002b3  0000000000000000  0000000000000000  000067f8  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 36 .gnu.lto_PrintArray_u32.44.89c3c00a7bcb110d 000002a2  0000000000000000  0000000000000000  00006aab  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 37 .gnu.lto_.symbol_nodes.89c3c00a7bcb110d 0000020b  0000000000000000  0000000000000000  00006d4d  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 38 .gnu.lto_.refs.89c3c00a7bcb110d 00000014  0000000000000000  0000000000000000  00006f58  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 39 .gnu.lto_.decls.89c3c00a7bcb110d 000014c3  0000000000000000  0000000000000000  00006f6c  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 40 .gnu.lto_.symtab.89c3c00a7bcb110d 000002c9  0000000000000000  0000000000000000  0000842f  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 41 .gnu.lto_.ext_symtab.89c3c00a7bcb110d 0000002d  0000000000000000  0000000000000000  000086f8  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 42 .gnu.lto_.opts 000000d3  0000000000000000  0000000000000000  00008725  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 43 .comment      00000028  0000000000000000  0000000000000000  000087f8  2**0
+                  CONTENTS, READONLY
+ 44 .note.GNU-stack 00000000  0000000000000000  0000000000000000  00008820  2**0
+                  CONTENTS, READONLY
+
+iRMSNorm_s8.c.o:     file format elf64-x86-64
+
+Sections:
+Idx Name          Size      VMA               LMA               File off  Algn
+  0 .text         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, READONLY, CODE
+  1 .data         00000000  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, ALLOC, LOAD, DATA
+  2 .bss          00000000  0000000000000000  0000000000000000  00000040  2**0
+                  ALLOC
+  3 .gnu.debuglto_.debug_info 000001f6  0000000000000000  0000000000000000  00000040  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  4 .gnu.debuglto_.debug_abbrev 0000009f  0000000000000000  0000000000000000  00000236  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  5 .gnu.debuglto_.debug_line 0000004d  0000000000000000  0000000000000000  000002d5  2**0
+                  CONTENTS, RELOC, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  6 .gnu.debuglto_.debug_str 000001f0  0000000000000000  0000000000000000  00000322  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  7 .gnu.debuglto_.debug_line_str 00000104  0000000000000000  0000000000000000  00000512  2**0
+                  CONTENTS, READONLY, DEBUGGING, EXCLUDE, OCTETS
+  8 .gnu.lto_.profile.79d4a4cb198d231a 0000000f  0000000000000000  0000000000000000  00000616  2**0
+                  CONTENTS, READONLY, EXCLUDE
+  9 .gnu.lto_.icf.79d4a4cb198d231a 0000003c  0000000000000000  0000000000000000  00000625  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 10 .gnu.lto_.ipa_sra.79d4a4cb198d231a 0000002b  0000000000000000  0000000000000000  00000661  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 11 .gnu.lto_.inline.79d4a4cb198d231a 000000bc  0000000000000000  0000000000000000  0000068c  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 12 .gnu.lto_.jmpfuncs.79d4a4cb198d231a 00000054  0000000000000000  0000000000000000  00000748  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 13 .gnu.lto_.pureconst.79d4a4cb198d231a 00000014  0000000000000000  0000000000000000  0000079c  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 14 .gnu.lto_.ipa_modref.79d4a4cb198d231a 00000051  0000000000000000  0000000000000000  000007b0  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 15 .gnu.lto_.lto.79d4a4cb198d231a 00000008  0000000000000000  0000000000000000  00000801  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 16 .gnu.lto__plp_sqrt_q32.13.79d4a4cb198d231a 00000400  0000000000000000  0000000000000000  00000809  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 17 .gnu.lto_iRMSnorm_s8_s8.14.79d4a4cb198d231a 0000066f  0000000000000000  0000000000000000  00000c09  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 18 .gnu.lto_.symbol_nodes.79d4a4cb198d231a 0000003f  0000000000000000  0000000000000000  00001278  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 19 .gnu.lto_.refs.79d4a4cb198d231a 0000000e  0000000000000000  0000000000000000  000012b7  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 20 .gnu.lto_.decls.79d4a4cb198d231a 0000046f  0000000000000000  0000000000000000  000012c5  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 21 .gnu.lto_.symtab.79d4a4cb198d231a 0000003b  0000000000000000  0000000000000000  00001734  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 22 .gnu.lto_.ext_symtab.79d4a4cb198d231a 00000005  0000000000000000  0000000000000000  0000176f  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 23 .gnu.lto_.opts 000000d3  0000000000000000  0000000000000000  00001774  2**0
+                  CONTENTS, READONLY, EXCLUDE
+ 24 .comment      00000028  0000000000000000  0000000000000000  00001847  2**0
+                  CONTENTS, READONLY
+ 25 .note.GNU-stack 00000000  0000000000000000  0000000000000000  0000186f  2**0
+                  CONTENTS, READONLY
@@ -0,0 +1,6 @@
+
+    #ifndef __DEEPLOY_CONSTANTS_HEADER__
+    #define __DEEPLOY_CONSTANTS_HEADER__
+    
+    #endif
+    
\ No newline at end of file
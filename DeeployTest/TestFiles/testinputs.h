@@ -0,0 +1,33 @@
+int16_t testInputVector0[] = {-4175.0,  -13116.0, 16305.0,  -16437.0, 10117.0,  26714.0,  1396.0,   -28975.0, -27720.0, -23414.0, -32111.0, 30826.0, 3662.0,
+                              -13416.0, 24901.0,  -19280.0, 14038.0,  -10446.0, 2417.0,   10696.0,  -31052.0, 10134.0,  -8202.0,  -1857.0,  -9748.0, 27760.0,
+                              -2550.0,  2839.0,   -5077.0,  18928.0,  16991.0,  -4202.0,  -17542.0, -22184.0, -2764.0,  -4841.0,  22403.0,  -7118.0, 2236.0,
+                              4360.0,   -22722.0, 7103.0,   -13708.0, -6421.0,  -10871.0, 15795.0,  -28306.0, 23469.0,  12377.0,  -18210.0, 10940.0, -6662.0,
+                              24660.0,  28460.0,  25897.0,  10459.0,  2869.0,   -22088.0, 14799.0,  -18479.0, -2129.0,  9364.0,   -21738.0, 7163.0,  -12902.0,
+                              -16088.0, 20021.0,  7684.0,   7183.0,   21514.0,  24156.0,  -2125.0,  -20689.0, -28013.0, 9341.0,   -26392.0, 23612.0, -22539.0,
+                              -31113.0, 18381.0,  14027.0,  6825.0,   11771.0,  26948.0,  -14808.0, 15427.0,  12325.0,  29273.0,  7798.0,   24431.0, -1289.0,
+                              -6928.0,  31431.0,  13101.0,  4648.0,   -13488.0, 7774.0,   27069.0,  -20660.0, 10743.0,  -13620.0, 666.0,    10273.0, 25877.0,
+                              24096.0,  23522.0,  5051.0,   3184.0,   8788.0,   -22206.0, -22985.0, 7185.0,   -10599.0, -23494.0, 29503.0,  4982.0,  -26888.0,
+                              -5613.0,  -25075.0, -13794.0, 20803.0,  24983.0,  26944.0,  17470.0,  -11139.0, 0};
+int8_t testInputVector1[] = {70.0,   116.0, -123.0, 111.0,  -119.0, -63.0,  -90.0, -102.0, 69.0,   4.0,    -30.0,  -54.0,  -67.0,  -83.0, 111.0,  -103.0,
+                             15.0,   -97.0, 28.0,   -51.0,  -49.0,  -100.0, -41.0, -44.0,  8.0,    3.0,    -124.0, -1.0,   57.0,   122.0, 52.0,   -76.0,
+                             85.0,   21.0,  -53.0,  -121.0, 51.0,   83.0,   -7.0,  42.0,   -51.0,  82.0,   -61.0,  -127.0, -114.0, 74.0,  75.0,   -17.0,
+                             -127.0, 10.0,  120.0,  116.0,  13.0,   6.0,    -61.0, 127.0,  112.0,  56.0,   21.0,   114.0,  -48.0,  -66.0, 113.0,  -72.0,
+                             -47.0,  52.0,  -109.0, -20.0,  -93.0,  -81.0,  121.0, -61.0,  -100.0, 33.0,   -6.0,   -10.0,  -93.0,  -78.0, -27.0,  -49.0,
+                             67.0,   97.0,  -66.0,  -111.0, 121.0,  22.0,   86.0,  55.0,   -10.0,  -11.0,  -16.0,  -127.0, -87.0,  -89.0, -104.0, 37.0,
+                             -86.0,  -68.0, -88.0,  36.0,   1.0,    -48.0,  73.0,  76.0,   109.0,  -117.0, 40.0,   -17.0,  6.0,    -89.0, -93.0,  110.0,
+                             103.0,  7.0,   94.0,   -116.0, -48.0,  -3.0,   109.0, 52.0,   -41.0,  -120.0, -81.0,  -44.0,  9.0,    0,     0,      0};
+int32_t testInputVector2[] = {
+    -2121376000.0, -1753021440.0, -734844736.0,  -1417539072.0, -1442767872.0, -453575424.0,  507389504.0,   281094816.0,   -1554456192.0, -293776544.0,
+    -1397488896.0, 295169216.0,   -191200336.0,  1497041408.0,  153624576.0,   -1340920192.0, 507353088.0,   -318989152.0,  1902094848.0,  1717166976.0,
+    1284078592.0,  1565910784.0,  2038498304.0,  -635298880.0,  1934134272.0,  1063619392.0,  -630963328.0,  1445592576.0,  -2038732032.0, -441055392.0,
+    829398656.0,   -2085668224.0, 212256576.0,   753958464.0,   2062224000.0,  -512491360.0,  -130298656.0,  -1594909952.0, 15643377.0,    1358248320.0,
+    189439648.0,   -2054136320.0, -1307686272.0, 1924340352.0,  -1835061632.0, 35902852.0,    -1125758080.0, -19498492.0,   -687218688.0,  -653010112.0,
+    -2076693120.0, 425101408.0,   1018504192.0,  -416100992.0,  -1702565760.0, 971600960.0,   310766336.0,   37188696.0,    1570177920.0,  -1085961216.0,
+    920619392.0,   -479957696.0,  -377689984.0,  -1711833088.0, 2096474624.0,  -1027796160.0, 1032106176.0,  -171508720.0,  1146826880.0,  -35824324.0,
+    -1503959552.0, 691166720.0,   975052352.0,   1226679168.0,  1734787200.0,  -1776411264.0, 157079152.0,   653123200.0,   -787328384.0,  -2063743360.0,
+    -491877568.0,  -682778176.0,  785515840.0,   -2092838912.0, -1422599808.0, 63995360.0,    1495471104.0,  2125955968.0,  824371712.0,   1409133440.0,
+    114480544.0,   -316332704.0,  23833726.0,    -2072566144.0, -386373888.0,  362656544.0,   1884699136.0,  437923552.0,   369874272.0,   630154688.0,
+    -849540032.0,  -459315904.0,  -195432656.0,  -169862944.0,  1641908352.0,  -1879677056.0, -902130048.0,  -882792640.0,  -769595008.0,  1918071680.0,
+    -2021799040.0, -1460710528.0, -1746569344.0, -1395647232.0, -1327376640.0, 534035040.0,   -808311232.0,  -1524414592.0, -606265664.0,  1413856384.0,
+    888467968.0,   -1021330624.0, -184817888.0,  -236941840.0,  -748982080.0};
+void *testInputVector[3] = {testInputVector0, testInputVector1, testInputVector2};
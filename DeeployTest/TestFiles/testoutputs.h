@@ -0,0 +1,17 @@
+#define OUTPUTTYPE int32_t
+#define ISOUTPUTFLOAT 0
+int32_t testOutputVector0[] = {
+    -2121380105.0, -1753034440.0, -734828554.0,  -1417555398.0, -1442757874.0, -453548773.0,  507390810.0,   281065739.0,   -1554483843.0, -293799954.0,
+    -1397521037.0, 295199988.0,   -191196741.0,  1497027909.0,  153649588.0,   -1340939575.0, 507367141.0,   -318999695.0,  1902097293.0,  1717177621.0,
+    1284047491.0,  1565920818.0,  2038490061.0,  -635300781.0,  1934124532.0,  1063647155.0,  -630966002.0,  1445595414.0,  -2038737052.0, -441036342.0,
+    829415699.0,   -2085672502.0, 212239119.0,   753936301.0,   2062221183.0,  -512496322.0,  -130276202.0,  -1594916987.0, 15645606.0,    1358252722.0,
+    189416875.0,   -2054129135.0, -1307700041.0, 1924333804.0,  -1835072617.0, 35918721.0,    -1125786311.0, -19475040.0,   -687206438.0,  -653028312.0,
+    -2076682060.0, 425094862.0,   1018528865.0,  -416072526.0,  -1702539924.0, 971611546.0,   310769317.0,   37166664.0,    1570192740.0,  -1085979581.0,
+    920617215.0,   -479948398.0,  -377711609.0,  -1711825997.0, 2096461675.0,  -1027812196.0, 1032126088.0,  -171501056.0,  1146833970.0,  -35802891.0,
+    -1503935275.0, 691164534.0,   975031563.0,   1226651188.0,  1734796535.0,  -1776437666.0, 157102671.0,   653100583.0,   -787359524.0,  -2063725028.0,
+    -491863474.0,  -682771254.0,  785527545.0,   -2092812075.0, -1422614495.0, 64010809.0,    1495483515.0,  2125985296.0,  824379500.0,   1409157860.0,
+    114479239.0,   -316339759.0,  23865070.0,    -2072553132.0, -386369344.0,  362643093.0,   1884706824.0,  437950553.0,   369853524.0,   630165467.0,
+    -849553651.0,  -459315286.0,  -195422310.0,  -169836991.0,  1641932557.0,  -1879653651.0, -902124957.0,  -882789473.0,  -769586214.0,  1918049385.0,
+    -2021822118.0, -1460703233.0, -1746579840.0, -1395670719.0, -1327347043.0, 534039906.0,   -808338168.0,  -1524420208.0, -606290630.0,  1413842642.0,
+    888488730.0,   -1021305761.0, -184791025.0,  -236924414.0,  -748993210.0};
+void *testOutputVector[1] = {testOutputVector0};
@@ -12,8 +12,8 @@ import onnx_graphsurgeon as gs
 from testUtils.platformMapping import mapDeployer, mapPlatform, setupMemoryPlatform
 from testUtils.typeMapping import inferTypeAndOffset
 
-from Deeploy.DeeployTypes import NetworkContext, StructBuffer, VariableBuffer, _backendPostBindingFilename, \
-    _middlewarePreLoweringFilename
+from Deeploy.DeeployTypes import NetworkContainer, NetworkContext, StructBuffer, VariableBuffer, \
+    _backendPostBindingFilename, _middlewarePreLoweringFilename
 from Deeploy.MemoryLevelExtension.MemoryLevels import MemoryHierarchy, MemoryLevel
 from Deeploy.MemoryLevelExtension.NetworkDeployers.MemoryLevelDeployer import MemoryDeployerWrapper
 
@@ -38,9 +38,17 @@ if __name__ == '__main__':
                         type = str,
                         default = "QEMU-ARM",
                         help = 'Choose the target Platform\n')
+    parser.add_argument('--compactDeeployState',
+                        action = 'store_true',
+                        help = 'Store DeeployState constants once in a content-addressed blob store\n')
+    parser.add_argument('--asyncDeeployState',
+                        action = 'store_true',
+                        help = 'Write DeeployState snapshots from a background thread\n')
     args = parser.parse_args()
 
     _DEEPLOYSTATEDIR = os.path.join("./TEST_STATE_EQUALITY_DeeployState", args.platform, args.dir)
+    if args.compactDeeployState:
+        _DEEPLOYSTATEDIR += "_compact"
 
     onnx_graph = onnx.load_model(f'./{args.dir}/network.onnx')
     graph = gs.import_onnx(onnx_graph)
@@ -62,6 +70,8 @@ if __name__ == '__main__':
         inputOffsets[f"input_{index}"] = offset
 
     deployer = mapDeployer(platform, graph, inputTypes, deeployStateDir = _DEEPLOYSTATEDIR, inputOffsets = inputOffsets)
+    deployer.compactDeeployState = args.compactDeeployState
+    deployer.asyncDeeployState = args.asyncDeeployState
 
     # Instantiate Classes Requried for Memory Level Annotation Extension
     L3 = MemoryLevel(name = "L3", neighbourNames = ["L2"], size = 1024000)
@@ -78,6 +88,13 @@ if __name__ == '__main__':
 
     ctxt_post_binding_imported = NetworkContext.importNetworkContext(_DEEPLOYSTATEDIR, _backendPostBindingFilename)
     ctxt_pre_lowering_imported = NetworkContext.importNetworkContext(_DEEPLOYSTATEDIR, _middlewarePreLoweringFilename)
+    graph_post_binding_imported = NetworkContainer._importONNXGraph(_DEEPLOYSTATEDIR, _backendPostBindingFilename)
+
+    importedConstants = graph_post_binding_imported.tensors()
+    for tensorName, tensor in deployer.graph.tensors().items():
+        if isinstance(tensor, gs.Constant):
+            assert np.array_equal(importedConstants[tensorName].values, tensor.values), \
+                f"Constant {tensorName} of the exported graph does not match, test failed!"
 
     memoryHierarchy = deployer.Platform.memoryHierarchy
     defaultMemoryLevel = deployer.Platform.memoryHierarchy.getDefaultMemoryLevel()
@@ -17,6 +17,7 @@ from testUtils.typeMapping import inferTypeAndOffset, parseDataType
 from Deeploy.AbstractDataTypes import PointerClass
 from Deeploy.CommonExtensions.DataTypes import IntegerDataTypes
 from Deeploy.CommonExtensions.OptimizationPasses.TopologyOptimizationPasses.DebugPasses import EmulateCMSISRequantPass
+from Deeploy.CompilerProfiling import CompilerProfiler
 from Deeploy.DeeployTypes import _NoVerbosity
 from Deeploy.Logging import DEFAULT_LOGGER as log
 from Deeploy.Targets.CortexM.Platform import CMSISPlatform
@@ -132,6 +133,13 @@ def generateNetwork(args):
     _DEEPLOYSTATEDIR = os.path.join(args.dumpdir, "deeployStates")
 
     deployer = mapDeployer(platform, graph, inputTypes, deeployStateDir = _DEEPLOYSTATEDIR, inputOffsets = inputOffsets)
+    deployer.deeployStateSnapshots = args.deeployState
+    deployer.compactDeeployState = args.compactDeeployState
+    deployer.asyncDeeployState = args.asyncDeeployState
+    if args.profileCompiler:
+        deployer.compilerProfiler = CompilerProfiler()
+    if args.compilationCache:
+        deployer.compilationCacheDir = os.path.join(args.dumpdir, "compilationCache")
 
     log.debug(f"Deployer: {deployer}")
 
@@ -148,6 +156,10 @@ def generateNetwork(args):
     # Parse graph and infer output levels and signedness
     _ = deployer.prepare(verbosityCfg)
 
+    if args.profileCompiler:
+        deployer.compilerProfiler.export(os.path.join(args.dumpdir, "compilerProfile.json"),
+                                         os.path.join(args.dumpdir, "compilerTrace.json"))
+
     # Offset the input and output values if signprop
     if signProp:
         test_inputs = [value - inputOffsets[f"input_{i}"] for i, value in enumerate(test_inputs)]
@@ -159,7 +171,12 @@ def generateNetwork(args):
             if not buffer._signed:
                 values -= buffer.nLevels // 2
 
-    generateTestNetwork(deployer, test_inputs, test_outputs, args.dumpdir, verbosityCfg)
+    generateTestNetwork(deployer,
+                        test_inputs,
+                        test_outputs,
+                        args.dumpdir,
+                        verbosityCfg,
+                        binaryConstants = args.binaryConstants)
 
 
 if __name__ == '__main__':
@@ -180,6 +197,11 @@ if __name__ == '__main__':
                         dest = 'profileMicrobenchmark',
                         default = False,
                         help = 'Wrap each layer with PULP perf-counter microbenchmark\n')
+    parser.add_argument('--binaryConstants',
+                        action = 'store_true',
+                        dest = 'binaryConstants',
+                        default = False,
+                        help = 'Emit constants and test vectors as binary blobs linked with .incbin (ELF only)\n')
     parser.add_argument('--input-type-map',
                         nargs = '*',
                         default = [],
@@ -0,0 +1,183 @@
+# SPDX-FileCopyrightText: 2025 ETH Zurich and University of Bologna
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import re
+import tempfile
+from collections import deque
+
+from testUtils.codeGenerate import canonicalCode
+from testUtils.deployUtils import deployNetwork, readNetwork
+
+from Deeploy.AbstractDataTypes import PointerClass, StructClass
+from Deeploy.CommonExtensions.CodeTransformationPasses.MemoryAllocation import _stackAllocateTemplate
+from Deeploy.CommonExtensions.DataTypes import int8_t, uint16_t
+from Deeploy.DeeployTypes import CodeSnippet, ConstantBuffer, ExecutionBlock, NetworkContext, NodeTemplate, \
+    StructBuffer, TransientBuffer, VariableBuffer
+from Deeploy.Targets.PULPOpen.DMA.MchanDma import MchanDma
+from Deeploy.TilingExtension.CodeTransformationPasses.DoubleBufferingTilingCodeGeneration import \
+    DoubleBufferingTilingCodeGeneration
+from Deeploy.TilingExtension.CodeTransformationPasses.TilingVariableReplacement import TilingVariableReplacementUpdate
+from Deeploy.TilingExtension.TilingCodegen import VariableReplacementScheme
+
+_testDir = "Tests/Kernels/Integer/Conv/Regular_2D_RQ"
+_deployArgs = ["-p", "Siracusa", "--defaultMemLevel=L2", "--l1=5000", "--memAllocStrategy=TetrisRandom"]
+
+_structName = "DeeployNetwork___MERGE_CONVRQ_PASS_0_cluster_fork_args"
+_declarationRegex = re.compile(rf"__MERGE_CONVRQ_PASS_0_cluster_fork_args_t {_structName}=\(\w+\)\{{([^;]*)\}};")
+_fieldUpdateRegex = re.compile(rf"{_structName}\.(\w+)=(\w+);")
+_fieldRegex = re.compile(r"\.(\w+)=(\w+)")
+
+
+def _deploy(dumpdir: str, doublebuffer: bool, hoistArgumentStructs: bool = True) -> str:
+    args = [*_deployArgs]
+    if doublebuffer:
+        args.append("--doublebuffer")
+    if hoistArgumentStructs:
+        args.append("--hoistArgumentStructs")
+    deployNetwork(_testDir, dumpdir, args)
+    network = readNetwork(dumpdir)
+    start = network.index("static void __MERGE_CONVRQ_PASS_0_closure(")
+    return network[start:network.index("// CLOSURE ARG WRITEBACK", start)]
+
+
+def _checkClosureArgs(doublebuffer: bool):
+    with tempfile.TemporaryDirectory() as dumpdir:
+        closure = _deploy(dumpdir, doublebuffer)
+
+    setup, loop = closure.split("// TILING LOOP")
+    loop = loop[:loop.index("// CLOSE TILING LOOP")]
+
+    # The argument struct is built once before the loop, the braces of its initializer are on separate lines
+    declarations = _declarationRegex.findall(setup.replace("\n", ""))
+    assert len(declarations) == 1, f"Expected a single declaration of the arguments, got {declarations}!"
+    assert _declarationRegex.search(loop.replace("\n", "")) is None, "The arguments are still built for every tile!"
+
+    # The loop only updates the fields which change from tile to tile
+    constFields = dict(_fieldRegex.findall(declarations[0]))
+    tileFields = dict(_fieldUpdateRegex.findall(loop))
+    assert len(tileFields) > 0 and constFields.keys().isdisjoint(tileFields.keys())
+    assert all(re.search(rf"\b{value}=(?!=)", loop) is None for value in constFields.values())
+    assert all(re.search(rf"\b{value}=(?!=)", loop) is not None for value in tileFields.values())
+
+    return constFields, tileFields
+
+
+def testSingleBuffer():
+    constFields, tileFields = _checkClosureArgs(doublebuffer = False)
+
+    # Single buffering keeps the local buffers at the same address
+    assert any(field.endswith("_data_in_ref") for field in constFields), constFields
+    assert not any(field.endswith("_data_in_ref") for field in tileFields), tileFields
+
+    return True
+
+
+def testDoubleBuffer():
+    constFields, tileFields = _checkClosureArgs(doublebuffer = True)
+
+    # Double buffering alternates the local buffers
+    assert any(field.endswith("_data_in_ref") for field in tileFields), tileFields
+    assert any(field.endswith("_buffer") for field in constFields), constFields
+
+    return True
+
+
+def testOptIn():
+    with tempfile.TemporaryDirectory() as dumpdir:
+        closure = _deploy(dumpdir, doublebuffer = False, hoistArgumentStructs = False)
+
+    # Without the option, the argument struct is built for every tile
+    setup, loop = closure.split("// TILING LOOP")
+    assert _declarationRegex.search(setup.replace("\n", "")) is None, "The arguments are hoisted by default!"
+    assert _declarationRegex.search(loop.replace("\n", "")) is not None, "The arguments are not built in the loop!"
+    assert _fieldUpdateRegex.search(loop) is None, "The fields of the arguments are updated by default!"
+
+    return True
+
+
+def testScalarFields():
+    ctxt = NetworkContext(VariableBuffer, ConstantBuffer, StructBuffer, TransientBuffer)
+    for name in ["in_ref", "out_ref"]:
+        ctxt.add(VariableBuffer(name, [1]), "local")
+        ctxt.annotateType(name, PointerClass(int8_t))
+
+    argsType = StructClass("args_t", {
+        "in_ref": PointerClass(int8_t),
+        "out_ref": PointerClass(int8_t),
+        "size": uint16_t
+    })
+    ctxt.hoistStruct({"in_ref": "in_ref", "out_ref": "out_ref", "size": 16}, "args", argsType)
+
+    codeGeneration = DoubleBufferingTilingCodeGeneration("L2", "L1", MchanDma())
+    executionBlock = ExecutionBlock()
+    executionBlock.codeSnippets = deque([
+        CodeSnippet(codeGeneration._openTileLoopTemplate, {
+            "numTiles": "numTiles",
+            "tileIdxPtr": "tileIdxPtr"
+        }),
+        CodeSnippet(codeGeneration._referenceUpdate, {
+            "reference": "in_ref",
+            "type": "int8_t*",
+            "update": "in_buffer_0"
+        }),
+        CodeSnippet(_stackAllocateTemplate(bufferName = "args"),
+                    ctxt.lookup("args")._bufferRepresentation()),
+        CodeSnippet(codeGeneration._closeTileLoopTemplate, {"tileIdxPtr": "tileIdxPtr"}),
+    ])
+    executionBlock = codeGeneration._hoistArgumentStructs(ctxt, executionBlock, VariableReplacementScheme({}, {}), {})
+
+    # The scalar field is a literal of the declaration, the loop only stores the pointer of the current tile
+    setup, loop = canonicalCode(executionBlock.generate(ctxt)).split("// TILING LOOP")
+    declarations = _fieldRegex.findall(setup)
+    assert declarations == [("out_ref", ctxt._mangle("out_ref")), ("size", "16")], declarations
+    tileFields = re.findall(rf"{ctxt._mangle('args')}\.(\w+)=(\w+);", loop)
+    assert tileFields == [("in_ref", ctxt._mangle("in_ref"))], tileFields
+
+    return True
+
+
+def testTileVariables():
+    ctxt = NetworkContext(VariableBuffer, ConstantBuffer, StructBuffer, TransientBuffer)
+    for name in ["in_ref", "in_buffer_0", "out_ref", "ext_ref", "dim_ref", "pad_ref", "size"]:
+        ctxt.add(VariableBuffer(name, [1]), "local")
+
+    codeGeneration = DoubleBufferingTilingCodeGeneration("L2", "L1", MchanDma())
+    variableReplacement = VariableReplacementScheme({"dim": [4, 2]}, {"dim": PointerClass(uint16_t)})
+    snippets = [
+        CodeSnippet(codeGeneration._referenceUpdate, {
+            "reference": "in_ref",
+            "type": "int8_t*",
+            "update": "in_buffer_0"
+        }),
+        CodeSnippet(codeGeneration._relativeOffsetReferenceUpdateTiledTemplate, {
+            "reference": "ext_ref",
+            "typeName": "int8_t",
+            "relativeOffset": "ext_relativeOffset",
+            "tileIdxVar": "TILING_I"
+        }),
+        CodeSnippet(TilingVariableReplacementUpdate._updateReferenceTemplate, {
+            "reference": "pad_ref",
+            "baseReference": "pad",
+            "tileIdxVar": "TILING_I"
+        }),
+        CodeSnippet(NodeTemplate("kernel(${out}, ${size});"), {
+            "out": "out_ref",
+            "size": "size"
+        }),
+    ]
+
+    # The buffer choice, the offset and variable replacement updates and the per-tile replacements change from tile to
+    # tile, while the buffers only used by the kernel are the same for all tiles
+    tileVariables = codeGeneration._tileVariables(ctxt, snippets, variableReplacement, {"dim": "dim_ref"})
+    assert tileVariables == {ctxt._mangle(name) for name in ["in_ref", "ext_ref", "pad_ref", "dim_ref"]}, tileVariables
+
+    return True
+
+
+if __name__ == "__main__":
+    testSingleBuffer()
+    testDoubleBuffer()
+    testOptIn()
+    testScalarFields()
+    testTileVariables()
@@ -0,0 +1,78 @@
+# SPDX-FileCopyrightText: 2025 ETH Zurich and University of Bologna
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import os
+import tempfile
+
+from testUtils.deployUtils import deployNetwork
+
+from Deeploy.CompilerProfiling import CompilerProfiler, activateProfiler, profileStage
+
+
+def testProfiler():
+    with profileStage("inactive") as stage:
+        assert stage is None, "Stages must not be recorded without an active profiler!"
+
+    profiler = CompilerProfiler()
+    with activateProfiler(profiler):
+        with profileStage("outer", "test"):
+            with profileStage("inner", "test", layer = "conv") as stage:
+                buffer = bytearray(8 * 1024 * 1024)
+                stage.args["size"] = len(buffer)
+                del buffer
+            for _ in range(3):
+                with profileStage("repeated", "test"):
+                    pass
+
+    outer, inner = profiler.stages[0], profiler.stages[1]
+    assert [stage.name for stage in profiler.stages] == ["outer", "inner", "repeated", "repeated", "repeated"]
+    assert (outer.depth, inner.depth) == (0, 1)
+    assert outer.start <= inner.start and inner.start + inner.duration <= outer.start + outer.duration
+    assert inner.peakMemory >= 8 * 1024 * 1024, f"Peak memory of the inner stage is {inner.peakMemory} bytes!"
+    assert outer.peakMemory >= inner.peakMemory, "The peak of a nested stage is not part of its parent's peak!"
+    assert inner.args == {"layer": "conv", "size": 8 * 1024 * 1024}
+
+    summary = profiler.summary()
+    assert summary["test/repeated"]["count"] == 3
+    assert summary["test/outer"]["totalMs"] >= summary["test/inner"]["totalMs"]
+
+    events = profiler.chromeTrace()["traceEvents"]
+    assert len(events) == len(profiler.stages) and all(event["ph"] == "X" for event in events)
+    assert events[1]["args"]["peakMemory"] == inner.peakMemory
+    return True
+
+
+def testDeployerProfile():
+    with tempfile.TemporaryDirectory() as dumpdir:
+        deployNetwork("Tests/Models/CNN_Linear2", dumpdir, [
+            "-p", "Siracusa", "--defaultMemLevel=L2", "--l1=64000", "--l2=512000", "--memAllocStrategy=TetrisRandom",
+            "--profileCompiler"
+        ])
+
+        with open(os.path.join(dumpdir, "compilerProfile.json")) as f:
+            report = json.load(f)
+        with open(os.path.join(dumpdir, "compilerTrace.json")) as f:
+            trace = json.load(f)
+
+    summary = report["summary"]
+    for key in [
+            "deeploy/prepare", "frontEnd/foldConstants", "frontEnd/lower", "frontEnd/parse", "midEnd/bind",
+            "tiling/setupModel", "tiling/solveModel", "tiling/computeMemoryMap", "backEnd/codeTransform"
+    ]:
+        assert key in summary, f"Stage {key} missing in the report!"
+    assert any(key.startswith("topologyOptimizationPass/") for key in summary), "No topology pass was recorded!"
+    assert any(key.startswith("codeTransformationPass/") for key in summary), "No code transformation was recorded!"
+
+    parse = next(stage for stage in report["stages"] if stage["name"] == "parse")
+    assert parse["args"]["layers"] > 0 and isinstance(parse["args"]["backtracks"], dict)
+    assert all(stage["peakMemory"] is not None for stage in report["stages"])
+
+    assert len(trace["traceEvents"]) == len(report["stages"])
+    return True
+
+
+if __name__ == "__main__":
+    testProfiler()
+    testDeployerProfile()
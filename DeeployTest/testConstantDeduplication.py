@@ -0,0 +1,89 @@
+# SPDX-FileCopyrightText: 2025 ETH Zurich and University of Bologna
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import numpy as np
+import onnx_graphsurgeon as gs
+from testUtils.platformMapping import mapDeployer, mapPlatform
+
+from Deeploy.AbstractDataTypes import PointerClass
+from Deeploy.CommonExtensions.DataTypes import int8_t
+from Deeploy.DeeployTypes import ConstantBuffer, NetworkContainer, NetworkDeployer
+
+
+def _graph() -> gs.Graph:
+    # Two identical constants feeding different nodes
+    values = np.arange(-4, 4, dtype = np.int8).reshape(1, 8)
+    data = gs.Variable("input_0", dtype = np.int8, shape = (1, 8))
+    hidden = gs.Variable("hidden", dtype = np.int32, shape = (1, 8))
+    output = gs.Variable("output_0", dtype = np.int32, shape = (1, 8))
+    nodes = [
+        gs.Node("Add", "Add_0", inputs = [data, gs.Constant("bias_0", values.copy())], outputs = [hidden]),
+        gs.Node("Add", "Add_1", inputs = [hidden, gs.Constant("bias_1", values.copy())], outputs = [output]),
+    ]
+    return gs.Graph(nodes = nodes, inputs = [data], outputs = [output], opset = 13)
+
+
+def _boundDeployer() -> NetworkDeployer:
+    platform, _ = mapPlatform("Generic")
+    deployer = mapDeployer(platform, _graph(), {"input_0": PointerClass(int8_t)}, inputOffsets = {"input_0": 0})
+    deployer.frontEnd()
+    # Bind without deduplication, such that the layers can be inspected before
+    assert NetworkContainer.bind(deployer), "Binding failed!"
+    return deployer
+
+
+def testRenameBufferReferences():
+    renames = {"bias_1": "bias_0"}
+    value = {"data": ["bias_1", ("bias_1", "other")], "nested": {"bias": "bias_1"}, "size": 8}
+    renamed = NetworkDeployer._renameBufferReferences(value, renames)
+    assert renamed == {"data": ["bias_0", ("bias_0", "other")], "nested": {"bias": "bias_0"}, "size": 8}
+    return True
+
+
+def testDeduplication():
+    deployer = _boundDeployer()
+    constants = [
+        name for name, buffer in deployer.ctxt.globalObjects.items()
+        if isinstance(buffer, ConstantBuffer) and buffer._deploy
+    ]
+    assert len(constants) == 2, f"Expected two constants before deduplication, got {constants}!"
+
+    layers = list(deployer.layerBinding.values())
+    references = [
+        next(key
+             for key, value in layer.mapper.parser.operatorRepresentation.items()
+             if value in constants)
+        for layer in layers
+    ]
+    canonical, duplicate = (layers[0].mapper.parser.operatorRepresentation[references[0]],
+                            layers[1].mapper.parser.operatorRepresentation[references[1]])
+
+    # A reference held in a dict, and a field of a node which does not consume the duplicate
+    operatorRepresentation = layers[1].mapper.parser.operatorRepresentation
+    operatorRepresentation["buffers"] = {"bias": duplicate}
+    layers[0].mapper.parser.operatorRepresentation["label"] = duplicate
+    before = {key: value for key, value in operatorRepresentation.items() if key not in (references[1], "buffers")}
+
+    assert deployer._deduplicateConstants() == 1
+
+    assert canonical in deployer.ctxt.globalObjects and duplicate not in deployer.ctxt.globalObjects
+    for layer, reference in zip(layers, references):
+        assert layer.mapper.parser.operatorRepresentation[reference] == canonical
+        assert canonical in [tensor.name for tensor in layer.node.inputs]
+        for snippet in layer.mapper.binder.executionBlock.codeSnippets:
+            assert snippet.operatorRepresentation.get(reference, canonical) == canonical
+
+    # References held in dicts are renamed, unrelated fields are left untouched
+    assert operatorRepresentation["buffers"] == {"bias": canonical}
+    assert layers[0].mapper.parser.operatorRepresentation["label"] == duplicate
+    for key, value in before.items():
+        assert operatorRepresentation[key] == value, f"Field {key} changed!"
+
+    assert deployer.constantRenames == {duplicate: canonical}
+    return True
+
+
+if __name__ == "__main__":
+    testRenameBufferReferences()
+    testDeduplication()
@@ -0,0 +1,115 @@
+# SPDX-FileCopyrightText: 2025 ETH Zurich and University of Bologna
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import re
+import tempfile
+from typing import Dict, List, Tuple
+
+from testUtils.deployUtils import deployNetwork, readNetwork
+
+_testDir = "Tests/Models/CNN_Linear2"
+_deployArgs = [
+    "-p", "Siracusa", "--defaultMemLevel=L2", "--l1=64000", "--l2=512000", "--memAllocStrategy=TetrisRandom",
+    "--doublebuffer"
+]
+
+_arenaName = "DeeployNetwork_MEMORYARENA_L1"
+_functionRegex = re.compile(r"^static void (\w+)\(", re.MULTILINE)
+_pointerRegex = re.compile(r"(\w+)=\([\w*]+\)\(\(char\*\)(\w+)\+(\d+)\);")
+_issueRegex = re.compile(r"(\w+_prefetch)=mchan_channel_alloc\(\);")
+_waitRegex = re.compile(r"mchan_channel_wait\((\w+_prefetch)\);")
+_transferRegex = re.compile(r"mchan_transfer_\dd\((\d+),(\w+),(\w+)")
+
+
+def _deploy(dumpdir: str, crossLayerPrefetch: bool) -> str:
+    args = [*_deployArgs]
+    if crossLayerPrefetch:
+        args.append("--crossLayerPrefetch")
+    deployNetwork(_testDir, dumpdir, args)
+    return readNetwork(dumpdir)
+
+
+def _tilingClosures(network: str) -> List[Tuple[str, str]]:
+    # Closures containing the L1 tiling loop of every layer in execution order
+    functions = list(_functionRegex.finditer(network))
+    closures = []
+    for function, nextFunction in zip(functions, functions[1:] + [None]):
+        body = network[function.start():nextFunction.start() if nextFunction is not None else len(network)]
+        if "// TILING LOOP" in body and not function.group(1).endswith("_tiling_closure"):
+            closures.append((function.group(1), body))
+    return closures
+
+
+def _arenaOffsets(closure: str) -> Dict[str, int]:
+    # Offsets of all pointers into the L1 arena
+    pointers = {name: (base, int(offset)) for name, base, offset in _pointerRegex.findall(closure)}
+    offsets = {}
+    for name in pointers:
+        base, offset = pointers[name]
+        while base in pointers:
+            base, baseOffset = pointers[base]
+            offset += baseOffset
+        if base == _arenaName:
+            offsets[name] = offset
+    return offsets
+
+
+def _hoistPrefix(closure: str) -> str:
+    return re.search(r"(DeeployNetwork_TILING_CODEGEN_L1_\w+?_)tileIdxPtr", closure).group(1)
+
+
+def _setupTransfers(closure: str) -> int:
+    return len(_transferRegex.findall(closure[:closure.index("// TILING LOOP")]))
+
+
+def testCrossLayerPrefetch():
+    with tempfile.TemporaryDirectory() as dumpdir:
+        closures = _tilingClosures(_deploy(os.path.join(dumpdir, "prefetch"), crossLayerPrefetch = True))
+        referenceClosures = _tilingClosures(_deploy(os.path.join(dumpdir, "reference"), crossLayerPrefetch = False))
+
+    assert [name for name, _ in closures] == [name for name, _ in referenceClosures]
+
+    numPrefetches = 0
+    for (name, producer), (nextName, consumer), (_, reference) in zip(closures, closures[1:], referenceClosures[1:]):
+        issued = _issueRegex.findall(producer)
+        numPrefetches += len(issued)
+
+        # Prefetches are issued during the last tile of the producer and waited for before the tiling loop of the consumer
+        loopBody = producer[producer.index("// TILING LOOP"):producer.index("// CLOSE TILING LOOP")]
+        if len(issued) > 0:
+            assert "CROSS-LAYER PREFETCH CHECK LAST TILE" in loopBody, f"{name}: prefetch is not guarded by the last tile!"
+        assert all(future in loopBody for future in issued), f"{name}: prefetch is issued outside of the tiling loop!"
+        waited = _waitRegex.findall(consumer[:consumer.index("// TILING LOOP")])
+        assert sorted(future for future in waited if future in issued) == sorted(issued), \
+            f"{nextName}: prefetches {issued} of the previous layer are not waited for before the tiling loop!"
+
+        # The prefetched tiles replace the initial transfers of the consumer
+        assert _setupTransfers(consumer) == _setupTransfers(reference) - len(issued), \
+            f"{nextName}: prefetched tiles are transferred again!"
+
+        # The prefetched tiles are transferred to the first buffer of the consumer, outside of the producer's buffers
+        producerOffsets = _arenaOffsets(producer)
+        consumerOffsets = _arenaOffsets(consumer)
+        for cmd, local, _ in _transferRegex.findall(producer):
+            if not local.endswith("_prefetch_buffer"):
+                continue
+            start = producerOffsets[local]
+            end = start + (int(cmd) & ((1 << 17) - 1))
+            tensorName = local[len(_hoistPrefix(producer)):-len("_prefetch_buffer")]
+            firstBuffer = _hoistPrefix(consumer) + tensorName + "_buffer_0"
+            assert consumerOffsets.get(firstBuffer) == start, \
+                f"{nextName}: {tensorName} is prefetched to {start} instead of its first buffer!"
+            collisions = [
+                pointer for pointer, offset in producerOffsets.items()
+                if start <= offset < end and not pointer.endswith("_prefetch_buffer")
+            ]
+            assert len(collisions) == 0, f"{name}: prefetched tile [{start}, {end}) overlaps with {collisions}!"
+
+    assert numPrefetches > 0, "No tile was prefetched!"
+    return True
+
+
+if __name__ == "__main__":
+    testCrossLayerPrefetch()
@@ -0,0 +1,78 @@
+# SPDX-FileCopyrightText: 2025 ETH Zurich and University of Bologna
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import tempfile
+from typing import List
+
+from testUtils.deployUtils import deployNetwork, readNetwork
+
+_testDir = "Tests/Kernels/FP32/Add/Regular"
+_deployArgs = ["-p", "Siracusa", "--defaultMemLevel=L2", "--l1=600", "--cores=8", "--memAllocStrategy=TetrisRandom"]
+
+_teamName = "DeeployNetwork_cluster_team"
+
+
+def _deploy(dumpdir: str, extraArgs: List[str]) -> str:
+    deployNetwork(_testDir, dumpdir, [*_deployArgs, *extraArgs])
+    return readNetwork(dumpdir)
+
+
+def testDoubleBuffer():
+    with tempfile.TemporaryDirectory() as dumpdir:
+        network = _deploy(dumpdir, ["--doublebuffer", "--dmaCore"])
+
+    assert f"deeploy_cluster_run_dma_core(&{_teamName}" in network
+
+    # The kernel is computed by the remaining cores, which signal their completion instead of a barrier
+    assert "_chunk=((uint32_t)*DeeployNetwork_TILING_CODEGEN_L1_Add_0_size_ref+DEEPLOY_COMPUTE_CORES" in network
+    assert f"deeploy_cluster_task_done(&{_teamName});" in network
+    assert "pi_cl_team_barrier" not in network
+
+    loop = network[network.index("// TILING LOOP"):network.index("// CLOSE TILING LOOP")]
+    teardown = network[network.index("// CLOSE TILING LOOP"):]
+
+    # The kernel of the previous tile is waited for before its buffers are reused, ...
+    wait = loop.index(f"deeploy_cluster_wait(&{_teamName});")
+    assert wait < loop.index("mchan_channel_wait(channel_output);") < loop.index("mchan_channel_alloc()")
+
+    # ... while the transfers of the previous output tile run after the kernel of the current tile is posted
+    post = loop.index(f"deeploy_cluster_post(&{_teamName}")
+    assert wait < post < loop.index("// ASYNCHRONOUS KERNEL CHECK PREVIOUS TILE")
+    assert "_data_out_cmd[TILING_I-1]" in loop[post:]
+    assert "_data_out_cmd[TILING_I]" not in loop
+
+    # The final output tile is transferred once its kernel completed
+    assert teardown.index(f"deeploy_cluster_wait(&{_teamName});") < teardown.index("// Transfer final output tile")
+    assert "_data_out_cmd[DeeployNetwork_TILING_CODEGEN_L1_Add_0_numTiles[" in teardown
+
+    return True
+
+
+def testSingleBuffer():
+    with tempfile.TemporaryDirectory() as dumpdir:
+        network = _deploy(dumpdir, ["--dmaCore"])
+
+    # Without a second buffer, the kernel is waited for right away
+    post = network.index(f"deeploy_cluster_post(&{_teamName}")
+    assert network.index(f"deeploy_cluster_wait(&{_teamName});", post) < network.index("mchan_channel_alloc()", post)
+
+    return True
+
+
+def testReference():
+    with tempfile.TemporaryDirectory() as dumpdir:
+        network = _deploy(dumpdir, ["--doublebuffer"])
+
+    # All cores compute the kernel and join in a barrier
+    assert "deeploy_cluster" not in network
+    assert "_chunk=((uint32_t)*DeeployNetwork_TILING_CODEGEN_L1_Add_0_size_ref+NUM_CORES" in network
+    assert "pi_cl_team_barrier();" in network
+
+    return True
+
+
+if __name__ == "__main__":
+    testDoubleBuffer()
+    testSingleBuffer()
+    testReference()
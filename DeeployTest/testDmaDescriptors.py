@@ -0,0 +1,100 @@
+# SPDX-FileCopyrightText: 2025 ETH Zurich and University of Bologna
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import re
+import tempfile
+from typing import List, Tuple
+
+from testUtils.codeGenerate import canonicalCode
+from testUtils.deployUtils import deployNetwork, readNetwork
+
+from Deeploy.DeeployTypes import ConstantBuffer, NetworkContext, StructBuffer, TransientBuffer, VariableBuffer
+from Deeploy.Targets.PULPOpen.DMA.MchanDma import MchanDma
+from Deeploy.Targets.Snitch.DMA.SnitchDma import SnitchDma
+from Deeploy.TilingExtension.AsyncDma import AnydimAsyncDmaTransferAdapter, AsyncDma
+from Deeploy.TilingExtension.TilingCodegen import stridesFromShape
+
+_testDir = "Tests/Models/MLPerf/ImageClassification"
+_deployArgs = [
+    "-p", "Siracusa", "--defaultMemLevel=L2", "--l1=16000", "--l2=1024000", "--memAllocStrategy=TetrisRandom"
+]
+
+# Loops of transfers, as opposed to the loops of kernels, start with the offsets of the transfer
+_nestedLoopRegex = re.compile(
+    r"for\(uint32_t i_0=0;\n[^{]*\{\n(?:for\(uint32_t i_\d+=0;\n[^{]*\{\n)*const uint32_t ext_offset=")
+_descriptorRegex = re.compile(
+    r"(?:mchan_transfer_nd_ext_strided|deeploy_dma_start_nd)\([^;]*?\((?:const )?\w+\[(\d)\]\)\{([^;]*)\},(\d)\);")
+
+
+def _generate(dma: AsyncDma, shape: Tuple[int, ...], extShape: Tuple[int, ...]) -> str:
+    ctxt = NetworkContext(VariableBuffer, ConstantBuffer, StructBuffer, TransientBuffer)
+    external = VariableBuffer("ext", list(extShape))
+    local = VariableBuffer("loc", list(shape))
+    external._memoryLevel, local._memoryLevel = "L2", "L1"
+    adapter = AnydimAsyncDmaTransferAdapter(dma)
+    future = adapter.getFuture("loc", "ExternalToLocal")
+    snippets = adapter.transfer(ctxt, external, local, shape, stridesFromShape(extShape), stridesFromShape(shape),
+                                "ExternalToLocal", future)
+    return canonicalCode("\n".join(snippet.template.generate(snippet.operatorRepresentation) for snippet in snippets))
+
+
+def _descriptors(code: str) -> List[Tuple[str, str, str]]:
+    # The braces of the descriptor array put its entries on separate lines
+    return _descriptorRegex.findall(code.replace("\n", ""))
+
+
+def _checkLowering(dma: AsyncDma, descriptorCall: str):
+    adapter = AnydimAsyncDmaTransferAdapter(dma)
+
+    # Many short rows are issued by a single descriptor transfer
+    code = _generate(dma, (32, 4, 8), (32, 16, 64))
+    assert adapter.cheapestTransferRank([(32, 4, 8)]) == 3
+    assert descriptorCall in code and _nestedLoopRegex.search(code) is None, code
+    assert ("1", "{32,32,1024}", "1") in _descriptors(code), code
+
+    # A single outer iteration is cheaper to issue without the descriptor
+    assert adapter.cheapestTransferRank([(1, 4, 8)]) == 2
+    code = _generate(dma, (1, 4, 8), (32, 16, 64))
+    assert descriptorCall not in code and _nestedLoopRegex.search(code) is not None, code
+
+    # Ranks above the descriptor ranks loop over the cheapest descriptor transfers
+    assert adapter.cheapestTransferRank([(2, 3, 5, 7, 4)]) == 4
+    code = _generate(dma, (2, 3, 5, 7, 4), (10, 10, 10, 10, 10))
+    assert descriptorCall in code and len(_nestedLoopRegex.findall(code)) == 1, code
+    assert ("2", "{3,140,1000},{5,28,100}", "2") in _descriptors(code), code
+
+    # The lowering of all tiles is chosen by their total cost
+    assert adapter.cheapestTransferRank([(1, 4, 8)] * 3 + [(32, 4, 8)]) == 3
+
+
+def testMchanLowering():
+    _checkLowering(MchanDma(), "mchan_transfer_nd_ext_strided(")
+    return True
+
+
+def testSnitchLowering():
+    _checkLowering(SnitchDma(), "deeploy_dma_start_nd(")
+    return True
+
+
+def testSiracusaDeployment():
+    with tempfile.TemporaryDirectory() as dumpdir:
+        deployNetwork(_testDir, dumpdir, _deployArgs)
+        network = readNetwork(dumpdir)
+
+    # The 3D tiles with many short rows are issued by descriptor transfers instead of loops of 2D transfers
+    descriptors = _descriptors(network)
+    assert len(descriptors) > 0, "No descriptor transfer is issued!"
+    assert all(
+        int(size) == int(numDims) and entries.count("{") == int(numDims)
+        for size, entries, numDims in descriptors), descriptors
+    assert _nestedLoopRegex.search(network) is None, "Transfers are still issued in nested loops!"
+
+    return True
+
+
+if __name__ == "__main__":
+    testMchanLowering()
+    testSnitchLowering()
+    testSiracusaDeployment()
@@ -0,0 +1,108 @@
+# SPDX-FileCopyrightText: 2025 ETH Zurich and University of Bologna
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import re
+import tempfile
+
+from testUtils.deployUtils import deployNetwork, readNetwork
+
+from Deeploy.Targets.PULPOpen.DMA.MchanDma import MchanDma
+from Deeploy.TilingExtension.AsyncDma import DmaTransferScheduler
+
+_testDir = "Tests/Kernels/Integer/Conv/Regular_2D_RQ"
+_deployArgs = ["-p", "Siracusa", "--defaultMemLevel=L2", "--l1=20000", "--memAllocStrategy=TetrisRandom"]
+
+_transferRegex = re.compile(
+    r"mchan_transfer_\w+\(\w+, DeeployNetwork_TILING_CODEGEN_L1_\w+_PASS_0_(\w+?)_(?:ref|next),")
+_allocRegex = re.compile(r"(channel_\w+) = mchan_channel_alloc\(\);")
+_waitRegex = re.compile(r"mchan_channel_wait\((channel_\w+)\);")
+
+
+def _deploy(dumpdir: str, doublebuffer: bool) -> str:
+    args = [*_deployArgs]
+    if doublebuffer:
+        args.append("--doublebuffer")
+    deployNetwork(_testDir, dumpdir, args)
+    network = readNetwork(dumpdir, canonical = False)
+    # Only the tiled convolution, the transposes around it have a single input
+    start = network.index("static void __MERGE_CONVRQ_PASS_0_closure(")
+    return network[start:network.index("// CLOSURE ARG WRITEBACK", start)]
+
+
+def testScheduler():
+    # Largest first, equal sizes keep their order
+    scheduler = DmaTransferScheduler()
+    assert scheduler.schedule({"a": 8, "b": 64, "c": 8, "d": 16}) == [("b", 0), ("d", 0), ("a", 0), ("c", 0)]
+
+    # Every transfer goes to the channel with the fewest bytes
+    scheduler = DmaTransferScheduler(numChannels = 2)
+    assert scheduler.schedule({
+        "a": 8,
+        "b": 64,
+        "c": 32,
+        "d": 16,
+        "e": 24
+    }) == [("b", 0), ("c", 1), ("e", 1), ("d", 1), ("a", 0)]
+
+    return True
+
+
+def testChannelFutures():
+    dma = MchanDma(numChannels = 3)
+    futures = [dma.getFuture("x", "ExternalToLocal", channel) for channel in range(dma.numChannels())]
+    assert [future.name for future in futures] == ["channel_input", "channel_input_1", "channel_input_2"]
+    assert dma.getFuture("y", "ExternalToLocal", 1) is futures[1]
+    assert dma.getFuture("x", "LocalToExternal", 1).name == "channel_output_1"
+
+    # Both directions of all channels have to fit the transfer IDs of mchan
+    try:
+        MchanDma(numChannels = 9)
+    except AssertionError:
+        return True
+    raise AssertionError("Expected more channels than transfer IDs to fail!")
+
+
+def testSingleBuffer():
+    with tempfile.TemporaryDirectory() as dumpdir:
+        closure = _deploy(dumpdir, doublebuffer = False)
+
+    loop = closure[closure.index("// TILING LOOP"):closure.index("// CLOSE TILING LOOP")]
+    ingress, egress = loop.split("pi_cl_team_fork(")
+
+    # The largest input is issued first on its own channel, the small inputs share the other channel
+    assert _transferRegex.findall(ingress) == ["data_in", "weight", "add", "mul"], _transferRegex.findall(ingress)
+    assert _allocRegex.findall(ingress) == ["channel_input", "channel_input_1"], _allocRegex.findall(ingress)
+
+    # The output tile is only waited for before the next tile, after its input transfers are issued
+    assert _waitRegex.search(egress) is None, "The output write-back blocks the input transfers of the next tile!"
+    waits = _waitRegex.findall(ingress)
+    assert waits[0] == "channel_output" and set(waits[1:]) == {"channel_input", "channel_input_1"}, waits
+    assert ingress.index("mchan_channel_wait(channel_output)") > ingress.index("mchan_transfer_")
+    assert "mchan_channel_wait(channel_output)" in closure[closure.index("// CLOSE TILING LOOP"):]
+
+    return True
+
+
+def testDoubleBuffer():
+    with tempfile.TemporaryDirectory() as dumpdir:
+        closure = _deploy(dumpdir, doublebuffer = True)
+
+    loop = closure[closure.index("// TILING LOOP"):closure.index("// CLOSE TILING LOOP")]
+    ingress, _ = loop.split("pi_cl_team_fork(")
+
+    # The next tile of a channel is issued as soon as the current tile of this channel arrived
+    events = [(match.lastgroup, match.group(match.lastgroup)) for match in re.finditer(
+        r"mchan_channel_wait\((?P<wait>channel_\w+)\);|(?P<alloc>channel_\w+) = "
+        r"mchan_channel_alloc\(\);", ingress)]
+    assert events == [("wait", "channel_input"), ("alloc", "channel_input"), ("wait", "channel_input_1"),
+                      ("alloc", "channel_input_1")], events
+
+    return True
+
+
+if __name__ == "__main__":
+    testScheduler()
+    testChannelFutures()
+    testSingleBuffer()
+    testDoubleBuffer()
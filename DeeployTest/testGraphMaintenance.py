@@ -0,0 +1,156 @@
+# SPDX-FileCopyrightText: 2025 ETH Zurich and University of Bologna
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import random
+import sys
+from contextlib import contextmanager
+
+import numpy as np
+import onnx
+import onnx_graphsurgeon as gs
+from testUtils.platformMapping import mapDeployer, mapPlatform
+
+import Deeploy.GraphMaintenance as GraphMaintenance
+from Deeploy.CommonExtensions.OptimizationPasses.Matchers import Match
+from Deeploy.CommonExtensions.OptimizationPasses.PassClasses import ReplaceSequentialPatternPass, contextagnostic
+from Deeploy.DeeployTypes import FixpointTopologyOptimizer
+from Deeploy.GraphMaintenance import cleanupGraph, toposortGraph
+
+_platforms = ["Generic", "Siracusa", "Siracusa_w_neureka", "QEMU-ARM", "MemPool"]
+_models = ["Tests/Models/CNN_Linear2", "Tests/Models/miniMobileNetv2", "Tests/Models/CCT/Int/ICCT"]
+
+
+def _scrambledGraph(model: onnx.ModelProto, seed: int) -> gs.Graph:
+    rng = random.Random(seed)
+    graph = gs.import_onnx(model)
+    rng.shuffle(graph.nodes)
+    for node in rng.sample(graph.nodes, 3):
+        node.outputs = []
+    return graph
+
+
+def _signature(graph: gs.Graph):
+    signature = []
+    for node in graph.nodes:
+        signature.append(
+            (node.name, node.op, [tensor.name for tensor in node.inputs], [tensor.name for tensor in node.outputs]))
+    return signature
+
+
+def testEquivalence():
+    # cleanupGraph and toposortGraph must reproduce onnx_graphsurgeon exactly, including the order of the nodes
+    for testDir in _models + ["Tests/Models/microLlama/INT8/microLlama4"]:
+        model = onnx.load_model(f"{testDir}/network.onnx")
+        for seed in range(4):
+            reference, graph = _scrambledGraph(model, seed), _scrambledGraph(model, seed)
+            reference.cleanup().toposort()
+            toposortGraph(cleanupGraph(graph))
+            assert _signature(graph) == _signature(reference), f"cleanup().toposort() of {testDir} differs!"
+
+            reference, graph = _scrambledGraph(model, seed), _scrambledGraph(model, seed)
+            reference.toposort().cleanup()
+            cleanupGraph(toposortGraph(graph))
+            assert _signature(graph) == _signature(reference), f"toposort().cleanup() of {testDir} differs!"
+    return True
+
+
+def _lower(platformName: str, testDir: str) -> gs.Graph:
+    graph = gs.import_onnx(onnx.load_model(f"{testDir}/network.onnx"))
+    platform, _ = mapPlatform(platformName)
+    deployer = mapDeployer(platform, graph, {})
+    # Apply the preprocessing of the frontEnd that the lowering passes rely on
+    deployer._removeIdentityNodes()
+    deployer._duplicateConstants(deployer.graph)
+    deployer._foldConstants(deployer.graph)
+    return deployer.lower(deployer.graph)
+
+
+@contextmanager
+def _referenceMaintenance():
+    # Full cleanup and sort after every modification, as before the incremental graph maintenance
+    reference = {
+        "cleanupGraph": lambda graph: graph.cleanup(),
+        "toposortGraph": lambda graph: graph.toposort(),
+        "insertNode": lambda graph, node: graph.nodes.append(node),
+        "removeDeadNodes": lambda graph, nodes: graph.cleanup(),
+    }
+    # Modules of all targets have to be loaded before they can be patched
+    for platformName in _platforms:
+        mapPlatform(platformName)
+
+    incremental = {name: getattr(GraphMaintenance, name) for name in reference}
+    patched = []
+    for module in list(sys.modules.values()):
+        if not getattr(module, "__name__", "").startswith("Deeploy.") or module is GraphMaintenance:
+            continue
+        for name, function in reference.items():
+            if getattr(module, name, None) is incremental[name]:
+                patched.append((module, name))
+                setattr(module, name, function)
+    try:
+        yield
+    finally:
+        for module, name in patched:
+            setattr(module, name, incremental[name])
+
+
+def testIncrementalLowering():
+    for platformName in _platforms:
+        for testDir in _models:
+            with _referenceMaintenance():
+                referenceGraph = _lower(platformName, testDir)
+            graph = _lower(platformName, testDir)
+            assert _signature(graph) == _signature(referenceGraph), \
+                f"Incremental lowering of {testDir} on {platformName} differs from the reference!"
+    return True
+
+
+def _merge_relu_fun(graph: gs.Graph, match: Match, name: str):
+    _ = name
+    relu1, relu2 = match.nodes_map['relu1'], match.nodes_map['relu2']
+    graph.replaceInsertNode(list(relu1.inputs), list(relu2.outputs),
+                            gs.Node(op = "Relu", name = f"{relu1.name}_{relu2.name}"))
+    return graph
+
+
+@contextagnostic
+class _MergeReluPass(ReplaceSequentialPatternPass):
+
+    def __init__(self, op: str = "Relu"):
+        graph = gs.Graph()
+        _input = gs.Variable(name = 'input_1')
+        output = graph.layer(inputs = [_input], outputs = ['relu1_out'], op = op, name = 'relu1')
+        output = graph.layer(inputs = output, outputs = ['relu2_out'], op = op, name = 'relu2')
+        graph.outputs.append(output)
+        graph.inputs.append(_input)
+        super().__init__(graph, _merge_relu_fun, f"_MERGE_{op.upper()}_PASS")
+        self.applications = 0
+
+    def apply(self, graph: gs.Graph) -> gs.Graph:
+        self.applications += 1
+        return super().apply(graph)
+
+
+def testFixpointOptimizer():
+    tensor = gs.Variable("input", dtype = np.float32, shape = (4,))
+    graph = gs.Graph(inputs = [tensor])
+    for idx in range(8):
+        tensor = graph.layer(op = "Relu", name = f"relu{idx}", inputs = [tensor], outputs = [f"relu{idx}_out"])[0]
+    graph.outputs = [tensor]
+
+    mergeRelu, mergeSigmoid = _MergeReluPass("Relu"), _MergeReluPass("Sigmoid")
+    graph = FixpointTopologyOptimizer([mergeRelu, mergeSigmoid]).optimize(graph)
+
+    assert [node.op for node in graph.nodes] == ["Relu"], f"Fixpoint not reached: {[node.op for node in graph.nodes]}"
+    # Three sweeps merge 8 -> 4 -> 2 -> 1 nodes, the last one confirms the fixpoint
+    assert mergeRelu.applications == 4, f"Relu pass applied {mergeRelu.applications} times!"
+    # Only Relu nodes change, so the Sigmoid pass has to run only once
+    assert mergeSigmoid.applications == 1, f"Sigmoid pass applied {mergeSigmoid.applications} times!"
+    return True
+
+
+if __name__ == "__main__":
+    testEquivalence()
+    testIncrementalLowering()
+    testFixpointOptimizer()
@@ -0,0 +1,119 @@
+# SPDX-FileCopyrightText: 2025 ETH Zurich and University of Bologna
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import re
+import tempfile
+from typing import Dict, List, Set, Tuple
+
+from testUtils.deployUtils import deployNetwork, readNetwork
+
+_testDir = "Tests/Models/CNN_Linear2"
+_deployArgs = ["-p", "Siracusa", "--defaultMemLevel=L3", "--l1=64000", "--l2=60000", "--memAllocStrategy=TetrisRandom"]
+
+_initRegex = re.compile(r"pi_cl_ram_req_t (\w+)\[\d+\]")
+_issueRegex = re.compile(r"=&(\w+)\[\1_issued%")
+_waitRegex = re.compile(r"pi_cl_ram_copy_wait\(&(\w+)\[\1_req\]\)")
+_useRegex = re.compile(r"^\w+_closure\(&")
+_closureRegex = re.compile(r"static void (\w+_closure_L3)\(")
+
+
+def _deploy(dumpdir: str, doublebuffer: bool, asyncL3Dma: bool = True) -> str:
+    args = [*_deployArgs]
+    if doublebuffer:
+        args.append("--doublebuffer")
+    if asyncL3Dma:
+        args.append("--asyncL3Dma")
+    deployNetwork(_testDir, dumpdir, args)
+    return readNetwork(dumpdir)
+
+
+def _l3TilingLoops(network: str) -> Dict[str, Tuple[List[str], List[str], List[str]]]:
+    # Setup, loop body and teardown of the L3 tiling loop of every closure
+    loops = {}
+    networkLines = network.splitlines()
+    for start, line in enumerate(networkLines):
+        closure = _closureRegex.match(line)
+        if closure is None:
+            continue
+        depth = 0
+        for end in range(start, len(networkLines)):
+            depth += networkLines[end].count("{") - networkLines[end].count("}")
+            if depth == 0:
+                break
+        lines = networkLines[start:end + 1]
+        if not any(_initRegex.search(line) for line in lines):
+            continue
+        # The three clauses of the loop header are on separate lines
+        loopStart = next(i for i, line in enumerate(lines) if line.startswith("for(int TILING_I="))
+        loopEnd = next(i for i, line in enumerate(lines) if "CLOSE TILING LOOP" in line)
+        loops[closure.group(1)] = (lines[:loopStart], lines[loopStart + 3:loopEnd], lines[loopEnd + 1:])
+    return loops
+
+
+def _checkFutureLifetimes(name: str, setup: List[str], body: List[str], teardown: List[str]) -> int:
+    # Execute the setup, two iterations of the loop and the teardown, assuming there is always a next tile.
+    # Returns how often a tile was processed while the transfer of the next input tile was in flight.
+    initialized: Set[str] = set()
+    outstanding: Dict[str, int] = {}  # Future -> step issuing its transfers
+    overlappedUses = 0
+    for step, lines in enumerate([setup, body, body, teardown]):
+        for line in lines:
+            if match := _initRegex.search(line):
+                initialized.add(match.group(1))
+            elif match := _issueRegex.search(line):
+                assert match.group(1) in initialized, f"{name}: {match.group(1)} is used before its initialization!"
+                outstanding.setdefault(match.group(1), step)
+            elif match := _waitRegex.search(line):
+                assert match.group(1) in initialized, f"{name}: {match.group(1)} is waited before its initialization!"
+                outstanding.pop(match.group(1), None)
+            elif _useRegex.search(line):
+                inFlight = {
+                    future: issued for future, issued in outstanding.items() if future.endswith("_ExternalToLocal")
+                }
+                # Only transfers of the next tile, issued in the same iteration, may be in flight
+                assert all(issued == step for issued in inFlight.values()), \
+                    f"{name}: the current tile of {list(inFlight)} is used before waiting for it!"
+                overlappedUses += len(inFlight) > 0
+
+    assert all(future.endswith("_ExternalToLocal") for future in outstanding), \
+        f"{name}: output transfers {list(outstanding)} are not waited for!"
+    return overlappedUses
+
+
+def testSingleBuffering():
+    with tempfile.TemporaryDirectory() as dumpdir:
+        loops = _l3TilingLoops(_deploy(dumpdir, doublebuffer = False))
+
+    assert len(loops) > 0, "No L3 tiling loop was generated!"
+    for name, (setup, body, teardown) in loops.items():
+        assert _checkFutureLifetimes(name, setup, body, teardown) == 0, \
+            f"{name}: a tile is used while its input transfer is in flight!"
+    return True
+
+
+def testDoubleBuffering():
+    with tempfile.TemporaryDirectory() as dumpdir:
+        loops = _l3TilingLoops(_deploy(dumpdir, doublebuffer = True))
+
+    assert len(loops) > 0, "No L3 tiling loop was generated!"
+    for name, (setup, body, teardown) in loops.items():
+        assert _checkFutureLifetimes(name, setup, body, teardown) > 0, \
+            f"{name}: no input transfer overlaps with the processing of a tile!"
+    return True
+
+
+def testBlockingDefault():
+    with tempfile.TemporaryDirectory() as dumpdir:
+        network = _deploy(dumpdir, doublebuffer = True, asyncL3Dma = False)
+
+    # Without --asyncL3Dma, every L3 transfer is waited for right after issuing it
+    assert "pi_cl_ram_copy_2d(" in network, "No L3 transfer was generated!"
+    assert _initRegex.search(network) is None, "The asynchronous L3 DMA is used without being enabled!"
+    return True
+
+
+if __name__ == "__main__":
+    testSingleBuffering()
+    testDoubleBuffering()
+    testBlockingDefault()
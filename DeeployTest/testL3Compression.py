@@ -0,0 +1,87 @@
+# SPDX-FileCopyrightText: 2025 ETH Zurich and University of Bologna
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import numpy as np
+
+from Deeploy.CommonExtensions.DataTypes import float32_t, int8_t, int32_t, uint8_t
+from Deeploy.Targets.PULPOpen.L3Compression import L3_COMPRESSION_BITPACK, L3_COMPRESSION_HUFFMAN, \
+    L3_COMPRESSION_ZRLE, compressL3Tiles, decompressL3Chunk, huffmanCodeLengths, l3Image
+
+
+def _roundTrip(values: np.ndarray, _type, numTiles: int = 1) -> int:
+    image = l3Image(values, _type)
+    tiles = np.array_split(image, numTiles)
+    compressed = compressL3Tiles(tiles, image.nbytes)
+    assert compressed is not None, "Compressible tiles should be compressed!"
+
+    encoding, chunks, stageOffsets = compressed
+    assert sum(len(chunk) for chunk in chunks) < image.nbytes, "Compressed tiles must be smaller than the raw image!"
+    for tile, chunk, stageOffset in zip(tiles, chunks, stageOffsets):
+        assert len(chunk) % 4 == 0 and stageOffset % 4 == 0, "Chunks and their staging offset must be 32 bit aligned!"
+        assert stageOffset + len(chunk) <= tile.nbytes, "Chunks must be staged inside their tile!"
+
+        decoded, consumed = decompressL3Chunk(chunk)
+        assert decoded.tobytes() == tile.tobytes(), f"Encoding {encoding} does not round-trip!"
+        # Writing an output byte overwrites the staged chunk byte at its offset, which has to be read already unless
+        # it is padding behind the chunk's data
+        overwritten = np.arange(tile.nbytes) - stageOffset
+        assert np.all((consumed > overwritten) | (overwritten >= consumed[-1])), \
+            f"Encoding {encoding} overwrites input it has not read yet!"
+
+    return encoding
+
+
+def testHuffmanCodeLengths():
+    counts = np.zeros(256, dtype = np.int64)
+    counts[:20] = 2**np.arange(20)
+    lengths = huffmanCodeLengths(counts)
+    assert lengths.max() <= 16, "Huffman codes must not exceed 16 bits!"
+    assert np.all(lengths[counts == 0] == 0) and np.all(lengths[counts > 0] > 0), "Only used symbols get a code!"
+    assert np.sum(2.0**-lengths[lengths > 0]) <= 1, "Huffman code lengths must form a prefix code!"
+
+    single = np.zeros(256, dtype = np.int64)
+    single[7] = 10
+    assert huffmanCodeLengths(single)[7] == 1, "A single symbol still needs a code of one bit!"
+    return True
+
+
+def testBitPacking():
+    rng = np.random.default_rng(0)
+    assert _roundTrip(rng.integers(-8, 8, 1001), int8_t) & L3_COMPRESSION_BITPACK
+    assert _roundTrip(rng.integers(0, 4, 777), uint8_t, 3) & L3_COMPRESSION_BITPACK
+    assert _roundTrip(rng.integers(-1, 1, 999), int8_t, 4) & L3_COMPRESSION_BITPACK
+    return True
+
+
+def testZeroRunLength():
+    rng = np.random.default_rng(1)
+    sparse = np.where(rng.random(5000) < 0.95, 0, rng.integers(-128, 128, 5000))
+    assert _roundTrip(sparse, int8_t, 5) == L3_COMPRESSION_ZRLE
+    assert _roundTrip(sparse * 1024, int32_t) & L3_COMPRESSION_ZRLE
+    assert _roundTrip(np.zeros(4000), int8_t, 2) & L3_COMPRESSION_ZRLE
+    return True
+
+
+def testHuffman():
+    rng = np.random.default_rng(2)
+    # Dense, skewed weights neither fit into fewer bits nor contain zero runs
+    skewed = np.clip(np.round(rng.laplace(0, 6, 6000)), -128, 127)
+    assert _roundTrip(skewed, int8_t, 3) == L3_COMPRESSION_HUFFMAN
+    return True
+
+
+def testIncompressible():
+    rng = np.random.default_rng(3)
+    for values, _type in [(rng.integers(-128, 128, 3000), int8_t), (rng.standard_normal(300), float32_t)]:
+        image = l3Image(values, _type)
+        assert compressL3Tiles([image], image.nbytes) is None, "Incompressible tiles should stay raw!"
+    return True
+
+
+if __name__ == "__main__":
+    testHuffmanCodeLengths()
+    testBitPacking()
+    testZeroRunLength()
+    testHuffman()
+    testIncompressible()
@@ -20,6 +20,7 @@ from testUtils.testRunner import TestGeneratorArgumentParser
 from testUtils.tilingUtils import DBOnlyL3Tiler, DBTiler, SBTiler
 from testUtils.typeMapping import inferTypeAndOffset
 
+from Deeploy.CompilerProfiling import CompilerProfiler
 from Deeploy.DeeployTypes import CodeGenVerbosity, NetworkDeployer, ONNXLayer
 from Deeploy.EngineExtension.NetworkDeployers.EngineColoringDeployer import EngineColoringDeployerWrapper
 from Deeploy.Logging import DEFAULT_LOGGER as log
@@ -94,6 +95,13 @@ def setupDeployer(graph: gs.Graph, memoryHierarchy: MemoryHierarchy, defaultTarg
                            deeployStateDir = _DEEPLOYSTATEDIR,
                            inputOffsets = inputOffsets,
                            scheduler = _mockScheduler)
+    deployer.deeployStateSnapshots = args.deeployState
+    deployer.compactDeeployState = args.compactDeeployState
+    deployer.asyncDeeployState = args.asyncDeeployState
+    if args.profileCompiler:
+        deployer.compilerProfiler = CompilerProfiler()
+    if args.compilationCache:
+        deployer.compilationCacheDir = os.path.join(args.dumpdir, "compilationCache")
 
     # Make the deployer engine-color-aware
     if args.platform == "Siracusa_w_neureka":
@@ -133,6 +141,23 @@ def setupDeployer(graph: gs.Graph, memoryHierarchy: MemoryHierarchy, defaultTarg
     deployer.tiler.visualizeMemoryAlloc = args.plotMemAlloc
     deployer.tiler.memoryAllocStrategy = args.memAllocStrategy
     deployer.tiler.searchStrategy = args.searchStrategy
+    deployer.tiler.crossLayerPrefetch = args.crossLayerPrefetch
+
+    if args.compressL3Weights:
+        assert hasattr(deployer, "compressL3Constants"), f"{args.platform} does not support L3 weight compression"
+        deployer.compressL3Constants = True
+
+    if args.persistentCluster:
+        assert hasattr(deployer, "persistentCluster"), f"{args.platform} does not support a persistent cluster"
+        deployer.persistentCluster = True
+
+    if args.dmaCore:
+        assert hasattr(deployer, "dmaCore"), f"{args.platform} does not support a dedicated DMA core"
+        deployer.dmaCore = True
+
+    if args.asyncL3Dma:
+        assert hasattr(deployer, "asyncL3Dma"), f"{args.platform} does not support the asynchronous L3 DMA"
+        deployer.asyncL3Dma = True
 
     return deployer, signProp
 
@@ -164,6 +189,33 @@ if __name__ == '__main__':
                         default = False,
                         help = 'Adds EXPERIMENTAL support for strided convolutions on N-EUREKA\n')
     parser.add_argument('--doublebuffer', action = 'store_true')
+    parser.add_argument('--crossLayerPrefetch',
+                        action = 'store_true',
+                        default = False,
+                        help = 'Transfer the first input tiles of a layer during the last tile of the previous layer\n')
+    parser.add_argument('--persistentCluster',
+                        action = 'store_true',
+                        default = False,
+                        help = 'Fork the cluster once per inference instead of once per layer\n')
+    parser.add_argument('--dmaCore',
+                        action = 'store_true',
+                        default = False,
+                        help = 'Dedicate a cluster core to the DMA while the other cores compute (implies '
+                        '--persistentCluster)\n')
+    parser.add_argument('--asyncL3Dma',
+                        action = 'store_true',
+                        default = False,
+                        help = 'Transfer L3 tiles with the asynchronous L3 DMA instead of the blocking one\n')
+    parser.add_argument('--tileSpecializations',
+                        metavar = 'tileSpecializations',
+                        dest = 'tileSpecializations',
+                        type = int,
+                        default = 0,
+                        help = 'Maximum number of tile variants per layer whose kernel call gets literal arguments\n')
+    parser.add_argument('--hoistArgumentStructs',
+                        action = 'store_true',
+                        default = False,
+                        help = 'Build the argument structs of a tiling loop once before the loop\n')
     parser.add_argument('--l1',
                         metavar = 'l1',
                         dest = 'l1',
@@ -201,6 +253,12 @@ if __name__ == '__main__':
     parser.add_argument('--profileMicrobenchmark',
                         action = "store_true",
                         help = 'Wrap each layer with PULP perf-counter microbenchmark instrumentation')
+    parser.add_argument('--compressL3Weights',
+                        action = 'store_true',
+                        help = 'Keep L3-resident constants compressed and decompress their tiles in L2\n')
+    parser.add_argument('--binaryConstants',
+                        action = 'store_true',
+                        help = 'Emit constants and test vectors as binary blobs linked with .incbin (ELF only)\n')
     parser.add_argument('--plotMemAlloc',
                         action = 'store_true',
                         help = 'Turn on plotting of the memory allocation and save it in the deeployState folder\n')
@@ -225,6 +283,9 @@ if __name__ == '__main__':
     if args.profileMicrobenchmark:
         verbosityCfg.microbenchmarkProfiling = True
 
+    verbosityCfg.tileSpecializations = args.tileSpecializations
+    verbosityCfg.hoistArgumentStructs = args.hoistArgumentStructs
+
     onnx_graph = onnx.load_model(f'{args.dir}/network.onnx')
     graph = gs.import_onnx(onnx_graph)
 
@@ -300,6 +361,10 @@ if __name__ == '__main__':
 
         _ = deployer.prepare(verbosityCfg)
 
+        if args.profileCompiler:
+            deployer.compilerProfiler.export(os.path.join(args.dumpdir, "compilerProfile.json"),
+                                             os.path.join(args.dumpdir, "compilerTrace.json"))
+
         # Offset the input and output values if signprop
         if signProp:
             test_inputs = [value - inputOffsets[f"input_{i}"] for i, value in enumerate(test_inputs)]
@@ -311,4 +376,9 @@ if __name__ == '__main__':
                 if not buffer._signed:
                     values -= buffer.nLevels // 2
 
-        generateTestNetwork(deployer, test_inputs, test_outputs, args.dumpdir, verbosityCfg)
+        generateTestNetwork(deployer,
+                            test_inputs,
+                            test_outputs,
+                            args.dumpdir,
+                            verbosityCfg,
+                            binaryConstants = args.binaryConstants)
@@ -0,0 +1,97 @@
+# SPDX-FileCopyrightText: 2025 ETH Zurich and University of Bologna
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import numpy as np
+
+from Deeploy.AbstractDataTypes import PointerClass
+from Deeploy.CommonExtensions.DataTypes import int4_t
+from Deeploy.DeeployTypes import ConstantBuffer, NetworkContext, StructBuffer, TransientBuffer, VariableBuffer
+from Deeploy.MemoryLevelExtension.MemoryLevels import MemoryLevel
+from Deeploy.Targets.PULPOpen.DMA.MchanDma import MchanDma
+from Deeploy.TilingExtension.CodeTransformationPasses.DoubleBufferingTilingCodeGeneration import \
+    DoubleBufferingTilingCodeGeneration
+from Deeploy.TilingExtension.MemoryConstraints import MemoryConstraint
+from Deeploy.TilingExtension.TilerModel import TilerModel
+from Deeploy.TilingExtension.TilingCodegen import HyperRectangle, MemoryTransfer, calculateFlatOffset, \
+    calculateFlatOffsetInBytes, computeTileHyperRectangles, stridesFromShape
+
+_l1 = MemoryLevel("L1", ["L2"], size = 37)
+
+
+def _generateCtxt(shapes) -> NetworkContext:
+    ctxt = NetworkContext(VariableBuffer, ConstantBuffer, StructBuffer, TransientBuffer)
+    for name, shape in shapes.items():
+        ctxt.add(VariableBuffer(name, shape), "global")
+        ctxt.annotateType(name, PointerClass(int4_t))
+    return ctxt
+
+
+def _solveTile(ctxt: NetworkContext, tensorName: str):
+    tilerModel = TilerModel(searchStrategy = "max")
+    tilerModel.addTensorDimToModel(ctxt, tensorName)
+    tilerModel.addTensorNumOfEltToModel(ctxt, tensorName)
+
+    numElements = tilerModel.getTensorNumberOfEltVar(tensorName)
+    tilerModel.addConstraint(tilerModel.getTensorNumberOfBytesExpr(ctxt, tensorName), memoryLevel = _l1)
+    tilerModel.addObjective(numElements, "maximize")
+    tilerModel.trySolveModel()
+
+    shape = ctxt.lookup(tensorName).shape
+    dims = tuple(tilerModel._resolveVariable(tilerModel.getTensorDimVar(tensorName, idx)) for idx in range(len(shape)))
+    numBytes = tilerModel._resolveVariable(tilerModel.getTensorNumberOfBytesExpr(ctxt, tensorName))
+    return dims, numBytes
+
+
+def testPackedTileConstraint():
+    ctxt = _generateCtxt({"packed": [8, 30], "oddRows": [3, 5]})
+
+    dims, numBytes = _solveTile(ctxt, "packed")
+    assert dims[-1] % 2 == 0, f"Packed int4 tile {dims} does not cover whole bytes!"
+    assert numBytes == np.prod(dims) // 2, f"Packed int4 tile {dims} should occupy {np.prod(dims) // 2} bytes!"
+    assert numBytes <= _l1.size, f"Packed int4 tile of {numBytes} bytes does not fit into L1!"
+    assert np.prod(dims) > _l1.size, "Packed int4 tiles should be accounted in bytes, not elements!"
+
+    # Rows of 5 int4 elements end in the middle of a byte, hence only the whole tensor is a legal tile
+    dims, numBytes = _solveTile(ctxt, "oddRows")
+    assert dims == (3, 5) and numBytes == 8, f"Packed int4 tensor with odd rows should not be tiled, got {dims}!"
+
+    return True
+
+
+def testPackedTileTransfers():
+    ctxt = _generateCtxt({"packed": [8, 30]})
+    buffer = ctxt.lookup("packed")
+
+    dims, _ = _solveTile(ctxt, "packed")
+    source = MemoryConstraint("L2", int(np.prod(buffer.shape)))
+    source.shape = tuple(buffer.shape)
+    destination = MemoryConstraint("L1", int(np.prod(dims)))
+    destination.shape = dims
+    tiles = computeTileHyperRectangles(MemoryTransfer(source, destination))
+    assert len(tiles) > 1, "Packed int4 tensor should be tiled!"
+
+    for tile in tiles:
+        flatOffset = calculateFlatOffset(tile.offset, stridesFromShape(buffer.shape))
+        assert calculateFlatOffsetInBytes(tile, buffer) == flatOffset * 4 // 8, \
+            f"Tile {tile} has a wrong byte offset!"
+
+    codeGeneration = DoubleBufferingTilingCodeGeneration("L2", "L1", MchanDma())
+    transfers, outerShape = codeGeneration._legalizeTransfers(tiles, tuple(buffer.shape), 4, True)
+    assert outerShape[-1] == 15, f"Rows of 30 int4 elements should span 15 bytes, got {outerShape}!"
+    for tile, transfer in zip(tiles, transfers):
+        assert transfer.dims[-1] * 2 == tile.dims[-1] and transfer.offset[-1] * 2 == tile.offset[-1], \
+            f"Transfer {transfer} of tile {tile} is not the packed byte transfer!"
+
+    # Tiles starting in the middle of a byte cannot be transferred
+    try:
+        calculateFlatOffsetInBytes(HyperRectangle((0, 1), (1, 2)), buffer)
+    except AssertionError:
+        return True
+
+    assert False, "Tile starting in the middle of a byte should be rejected!"
+
+
+if __name__ == "__main__":
+    testPackedTileConstraint()
+    testPackedTileTransfers()
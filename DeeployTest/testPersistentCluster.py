@@ -0,0 +1,86 @@
+# SPDX-FileCopyrightText: 2025 ETH Zurich and University of Bologna
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import re
+import tempfile
+from typing import Dict
+
+from testUtils.deployUtils import deployNetwork, readNetwork
+
+_testDir = "Tests/Models/CNN_Linear2"
+_deployArgs = ["--defaultMemLevel=L2", "--l1=64000", "--l2=512000", "--memAllocStrategy=TetrisRandom"]
+
+_functionRegex = re.compile(r"^(?:static )?void (\w+)\(.*?\)\{", re.MULTILINE)
+_forkRegex = re.compile(r"pi_cl_team_fork\(NUM_CORES,\(void\*\)(\w+),&\w+\);")
+_dispatchRegex = re.compile(r"deeploy_cluster_dispatch\(&(\w+),\(void\*\)(\w+),&\w+\);")
+_runRegex = re.compile(r"deeploy_cluster_run\(&(\w+),(\w+),NULL\);")
+_teamRegex = re.compile(r"PI_L1 deeploy_cluster_team_t (\w+);")
+
+
+def _deploy(dumpdir: str, platform: str, persistentCluster: bool) -> str:
+    args = ["-p", platform, *_deployArgs]
+    if persistentCluster:
+        args.append("--persistentCluster")
+    deployNetwork(_testDir, dumpdir, args)
+    return readNetwork(dumpdir)
+
+
+def _functions(network: str) -> Dict[str, str]:
+    functions = list(_functionRegex.finditer(network))
+    return {
+        function.group(1): network[function.start():nextFunction.start() if nextFunction is not None else len(network)]
+        for function, nextFunction in zip(functions, functions[1:] + [None])
+    }
+
+
+def _checkPersistentCluster(platform: str):
+    with tempfile.TemporaryDirectory() as dumpdir:
+        network = _deploy(os.path.join(dumpdir, "persistent"), platform, persistentCluster = True)
+        reference = _deploy(os.path.join(dumpdir, "reference"), platform, persistentCluster = False)
+
+    forked = _forkRegex.findall(reference)
+    assert len(forked) > 0, f"{platform}: no layer is forked on the cluster!"
+    assert _runRegex.search(reference) is None and _teamRegex.search(reference) is None, \
+        f"{platform}: the persistent cluster team is used without being requested!"
+    assert '#include "persistent_cluster.h"' not in reference, \
+        f"{platform}: the persistent cluster header is included without being requested!"
+    assert '#include "persistent_cluster.h"' in network, f"{platform}: the persistent cluster header is missing!"
+
+    # Every layer is dispatched to the same team instead of forking the cluster
+    assert len(_forkRegex.findall(network)) == 0, f"{platform}: layers still fork the cluster!"
+    dispatched = _dispatchRegex.findall(network)
+    assert [closure for _, closure in dispatched] == forked, \
+        f"{platform}: dispatched closures {dispatched} do not match the forked closures {forked}!"
+    teams = _teamRegex.findall(network)
+    assert len(teams) == 1, f"{platform}: expected a single cluster team, got {teams}!"
+    assert all(team == teams[0] for team, _ in dispatched)
+
+    # The team is forked once and runs the network
+    functions = _functions(network)
+    runs = _runRegex.findall(network)
+    assert len(runs) == 1 and runs[0][0] == teams[0], f"{platform}: the cluster team is not started exactly once!"
+    assert _runRegex.search(functions["RunNetwork"]) is not None, f"{platform}: RunNetwork does not start the team!"
+    assert runs[0][1] in functions and runs[0][1] != "RunNetwork", f"{platform}: the network entry is missing!"
+    assert "TILING_CODEGEN" in functions[runs[0][1]], f"{platform}: the network entry does not run the layers!"
+
+    # The dispatched tasks end in a team barrier, which joins the team before the next dispatch
+    for _, closure in dispatched:
+        body = functions[closure]
+        assert "pi_cl_team_barrier();" in body, f"{platform}: {closure} does not join the team!"
+
+    return True
+
+
+def testSiracusa():
+    return _checkPersistentCluster("Siracusa")
+
+
+def testGAP9():
+    return _checkPersistentCluster("GAP9")
+
+
+if __name__ == "__main__":
+    testSiracusa()
+    testGAP9()
@@ -0,0 +1,74 @@
+# SPDX-FileCopyrightText: 2025 ETH Zurich and University of Bologna
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import subprocess
+import sys
+
+_importScript = """
+import sys, time
+start = time.perf_counter()
+{statement}
+targets = {{name.split(".")[2] for name in sys.modules if name.startswith("Deeploy.Targets.")}}
+print(time.perf_counter() - start, ",".join(sorted(targets)))
+"""
+
+
+def _measureImport(statement: str, repetitions: int = 3):
+    # Each measurement runs in a fresh interpreter to time a cold start, the fastest run is reported
+    times = []
+    for _ in range(repetitions):
+        result = subprocess.run(
+            [sys.executable, "-c", _importScript.format(statement = statement)],
+            capture_output = True,
+            text = True,
+            check = True)
+        seconds, _, targets = result.stdout.strip().splitlines()[-1].partition(" ")
+        times.append(float(seconds))
+    return min(times), set(filter(None, targets.split(",")))
+
+
+def testRegistry():
+    from testUtils.platformMapping import _PLATFORM_TARGETS, _PLATFORMS, _TARGETS, _isInstance, _loadEntryPoint
+
+    assert set(_PLATFORMS) == set(_PLATFORM_TARGETS.keys()), "Every platform must be mapped to a target!"
+
+    for name, target in _TARGETS.items():
+        # XDNA2 depends on the optional mlir-aie package
+        if name == "XDNA2":
+            continue
+
+        for entryPoint in (target.platform, target.deployer, target.optimizer) + target.platformClasses:
+            _loadEntryPoint(entryPoint)
+
+        for platformClass in target.platformClasses:
+            cls = _loadEntryPoint(platformClass)
+            assert f"{cls.__module__}:{cls.__qualname__}" == platformClass, f"{platformClass} is not a class path!"
+
+        platform = _loadEntryPoint(target.platform)()
+        assert _isInstance(platform, target.platformClasses)
+    return True
+
+
+def testLazyImport():
+    mappingTime, targets = _measureImport("import testUtils.platformMapping")
+    assert len(targets) == 0, f"Importing the platform mapping imported the targets {targets}!"
+
+    genericTime, targets = _measureImport("from testUtils.platformMapping import mapPlatform\nmapPlatform('Generic')")
+    assert targets == {"Generic"}, f"Mapping the Generic platform imported the targets {targets}!"
+
+    eagerTime, _ = _measureImport(
+        "\n".join(f"import Deeploy.Targets.{target}.Deployer, Deeploy.Targets.{target}.Platform" for target in
+                  ["Generic", "CortexM", "MemPool", "PULPOpen", "Neureka", "Snitch", "SoftHier", "Chimera", "GAP9"]))
+
+    print(f"Import platform mapping: {mappingTime:.3f}s")
+    print(f"Map Generic platform:    {genericTime:.3f}s")
+    print(f"Import all targets:      {eagerTime:.3f}s")
+
+    assert mappingTime < eagerTime, "Importing the platform mapping is not faster than importing all targets!"
+    return True
+
+
+if __name__ == "__main__":
+    testRegistry()
+    testLazyImport()
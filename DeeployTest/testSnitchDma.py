@@ -0,0 +1,98 @@
+# SPDX-FileCopyrightText: 2025 ETH Zurich and University of Bologna
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import re
+import tempfile
+
+from testUtils.codeGenerate import canonicalCode
+from testUtils.deployUtils import deployNetwork, readNetwork
+
+from Deeploy.DeeployTypes import ConstantBuffer, NetworkContext, StructBuffer, TransientBuffer, VariableBuffer
+from Deeploy.Targets.Snitch.DMA.SnitchDma import SnitchDma, SnitchFuture, batchDmaStatements
+from Deeploy.TilingExtension.AsyncDma import DirectionWaitingStrategy
+
+_testDir = "Tests/Kernels/FP32/GEMM/Regular"
+_deployArgs = ["--defaultMemLevel=L2", "--l1=10000", "--memAllocStrategy=TetrisRandom"]
+
+_guardOpen = "if(snrt_is_dm_core()){"
+_dummyTransferRegex = re.compile(r"snrt_dma_start_2d\((\w+),\1,1,0,0,0\)")
+_transferRegex = re.compile(r"(\w+)=deeploy_dma_start_2d\(")
+_waitRegex = re.compile(r"deeploy_dma_wait\((.*)\);")
+
+
+def _deploy(dumpdir: str, doublebuffer: bool) -> str:
+    args = ["-p", "Snitch", *_deployArgs]
+    if doublebuffer:
+        args.append("--doublebuffer")
+    deployNetwork(_testDir, dumpdir, args)
+    return readNetwork(dumpdir)
+
+
+def _tilingLoop(network: str) -> str:
+    start = network.index("// TILING LOOP")
+    return network[start:network.index("// CLOSE TILING LOOP", start)]
+
+
+def _checkTiling(doublebuffer: bool):
+    with tempfile.TemporaryDirectory() as dumpdir:
+        network = _deploy(dumpdir, doublebuffer)
+
+    assert _dummyTransferRegex.search(network) is None, "The dummy transfer is still issued!"
+    assert "snrt_dma_wait_all" not in network, "Waits are not resolved by transaction ID!"
+
+    # Ingress and egress of a tile are each issued within a single DM core guard
+    loop = _tilingLoop(network)
+    assert loop.count(
+        _guardOpen) == 2, f"Expected one DM core guard for ingress and egress, got {loop.count(_guardOpen)}!"
+    ingress, egress = loop.split("__tiling_closure(")
+    assert len(_transferRegex.findall(ingress)) == 3 and len(_transferRegex.findall(egress)) == 1
+
+    if not doublebuffer:
+        # All input transfers of a tile are resolved by a single wait for the highest transaction ID
+        waits = _waitRegex.findall(ingress)
+        assert len(waits) == 1, f"Expected a single wait for the input tile, got {waits}!"
+        assert all(future in waits[0] for future in _transferRegex.findall(ingress))
+
+    return True
+
+
+def testSingleBuffer():
+    return _checkTiling(doublebuffer = False)
+
+
+def testDoubleBuffer():
+    return _checkTiling(doublebuffer = True)
+
+
+def testDirectionWaitingStrategy():
+    ctxt = NetworkContext(VariableBuffer, ConstantBuffer, StructBuffer, TransientBuffer)
+    dma = SnitchDma(waitingStrategy = DirectionWaitingStrategy(SnitchFuture, "txid"))
+
+    transfers = []
+    waits = []
+    for name in ["A", "B"]:
+        external = VariableBuffer(f"{name}_ext", [16, 16])
+        local = VariableBuffer(f"{name}_loc", [16, 16])
+        future = dma.getFuture(f"{name}_loc", "ExternalToLocal")
+        transfers.extend(dma.transfer(ctxt, external, local, (16, 16), (16, 1), (16, 1), "ExternalToLocal", future))
+        waits.append(future.wait())
+
+    for dmCoreOnly in [False, True]:
+        code = canonicalCode("\n".join(
+            snippet.template.generate(snippet.operatorRepresentation)
+            for snippet in batchDmaStatements(transfers + waits, dmCoreOnly = dmCoreOnly)))
+
+        # Both transfers share the future of their direction, which is waited for once after the last transfer
+        assert code.count(_guardOpen) == 1, f"Transfers are not issued within a single DM core guard:\n{code}"
+        futures = _transferRegex.findall(code)
+        assert len(futures) == 2 and len(set(futures)) == 1
+        assert _waitRegex.findall(code) == [futures[0]], f"Expected a single wait for {futures[0]}:\n{code}"
+
+    return True
+
+
+if __name__ == "__main__":
+    testSingleBuffer()
+    testDoubleBuffer()
+    testDirectionWaitingStrategy()
@@ -0,0 +1,67 @@
+# SPDX-FileCopyrightText: 2025 ETH Zurich and University of Bologna
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import List, Tuple
+
+import onnx
+import onnx_graphsurgeon as gs
+from testUtils.platformMapping import mapDeployer, mapPlatform
+
+from Deeploy.CommonExtensions.OptimizationPasses.Matchers import Match, SubgraphMatcher
+
+_indexedMatch = SubgraphMatcher.match
+_matchCount = 0
+
+
+def _referenceMatch(matcher: SubgraphMatcher, graph: gs.Graph, pattern: gs.Graph) -> List[Match]:
+    # Anchor on every node of the graph, as the matcher did before indexing the graph by operation type
+    matcher._valid_pattern(pattern)
+    matches = []
+    matchedNodeNames = set()
+    for node in graph.nodes:
+        match = matcher._match_from_anchor(node, pattern)
+        if match is not None and matchedNodeNames.isdisjoint(node.name for node in match.nodes_map.values()):
+            matches.append(match)
+            matchedNodeNames.update(node.name for node in match.nodes_map.values())
+    return matches
+
+
+def _signature(matches: List[Match]) -> List[Tuple[str, List[Tuple[str, str]]]]:
+    return [(match.anchor.name, sorted((key, node.name) for key, node in match.nodes_map.items())) for match in matches]
+
+
+def _checkedMatch(self: SubgraphMatcher, graph: gs.Graph, pattern: gs.Graph) -> List[Match]:
+    global _matchCount
+    matches = _indexedMatch(self, graph, pattern)
+    assert _signature(matches) == _signature(_referenceMatch(self, graph, pattern)), \
+        f"Indexed matching of {[node.op for node in pattern.nodes]} differs from exhaustive matching!"
+    _matchCount += len(matches)
+    return matches
+
+
+def testIndexedMatching():
+    SubgraphMatcher.match = _checkedMatch
+    try:
+        for platformName in ["Generic", "Siracusa", "QEMU-ARM", "MemPool"]:
+            for testDir in [
+                    "Tests/Models/CNN_Linear2", "Tests/Models/miniMobileNetv2",
+                    "Tests/Models/microLlama/INT8/microLlama4", "Tests/Models/CCT/Int/ICCT"
+            ]:
+                graph = gs.import_onnx(onnx.load_model(f"{testDir}/network.onnx"))
+                platform, _ = mapPlatform(platformName)
+                deployer = mapDeployer(platform, graph, {})
+                # Apply the preprocessing of the frontEnd that the lowering passes rely on
+                deployer._removeIdentityNodes()
+                deployer._duplicateConstants(deployer.graph)
+                deployer._foldConstants(deployer.graph)
+                deployer.lower(deployer.graph)
+    finally:
+        SubgraphMatcher.match = _indexedMatch
+
+    assert _matchCount > 0, "No pattern matched, the test is vacuous!"
+    return True
+
+
+if __name__ == "__main__":
+    testIndexedMatching()
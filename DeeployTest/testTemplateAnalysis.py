@@ -0,0 +1,58 @@
+# SPDX-FileCopyrightText: 2025 ETH Zurich and University of Bologna
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import copy
+
+from Deeploy.CommonExtensions.CodeTransformationPasses.IntrospectiveCodeTransformation import \
+    IntrospectiveCodeTransformationMixIn, clearTemplateAnalyses, templateAnalysis
+from Deeploy.DeeployTypes import NodeTemplate
+
+_templateStr = """
+for (int i = 0; i < ${size}; i++) {
+    ${data_out}[i] = ${data_in}[i] + ${pageargs['offset_0']};
+}
+"""
+
+
+def testTemplateAnalysis():
+    clearTemplateAnalyses()
+    templateA, templateB = NodeTemplate(_templateStr), NodeTemplate(_templateStr)
+
+    analysis = templateAnalysis(templateA.template)
+    assert templateAnalysis(templateB.template) is analysis, "Templates with the same source are analysed twice!"
+    assert analysis.expressions == ["size", "data_out", "data_in", "pageargs['offset_0']"]
+    assert analysis.pageargsKeys == ["offset_0"]
+    return True
+
+
+def testTransformationReuse():
+    clearTemplateAnalyses()
+    operatorRepresentation = {"size": 4, "data_out": "out", "data_in": "in", "offset_0": 1, "idx": "t"}
+
+    indexed = []
+    for _ in range(2):
+        template = copy.deepcopy(NodeTemplate(_templateStr))
+        IntrospectiveCodeTransformationMixIn.indexVars(template.template, ["size"], "idx")
+        indexed.append(template)
+
+    assert indexed[0].template.module is indexed[1].template.module, "The transformed code was not reused!"
+    for template in indexed:
+        assert "i < 4[t]" in template.generate(operatorRepresentation)
+
+    dereferenced = copy.deepcopy(NodeTemplate(_templateStr))
+    IntrospectiveCodeTransformationMixIn.dereferenceVars(dereferenced.template, ["data_out"])
+    assert dereferenced.template.module is not indexed[0].template.module
+    assert "*out[i]" in dereferenced.generate(operatorRepresentation)
+
+    # The cached transformations must produce the same code as a fresh reconstruction
+    clearTemplateAnalyses()
+    reference = copy.deepcopy(NodeTemplate(_templateStr))
+    IntrospectiveCodeTransformationMixIn.indexVars(reference.template, ["size"], "idx")
+    assert reference.generate(operatorRepresentation) == indexed[1].generate(operatorRepresentation)
+    return True
+
+
+if __name__ == "__main__":
+    testTemplateAnalysis()
+    testTransformationReuse()
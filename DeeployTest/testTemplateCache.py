@@ -0,0 +1,78 @@
+# SPDX-FileCopyrightText: 2025 ETH Zurich and University of Bologna
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import copy
+import os
+import subprocess
+import sys
+import tempfile
+
+import Deeploy.DeeployTypes as DeeployTypes
+from Deeploy.DeeployTypes import NodeTemplate
+
+_templateStr = """
+% for i in range(size):
+${name}[${i}] = ${value};
+% endfor
+"""
+
+_reference = "\n".join(f"x[{i}] = 3;" for i in range(4)) + "\n"
+
+
+def testLazyCompilation():
+    template = NodeTemplate(_templateStr)
+    assert template._template is None, "NodeTemplate must not compile on construction!"
+    assert template.generate(name = "x", size = 4, value = 3).strip() == _reference.strip()
+    assert template._template is not None
+
+    _copy = copy.deepcopy(NodeTemplate(_templateStr))
+    assert _copy._template is None, "Deep copies of uncompiled templates must stay uncompiled!"
+    assert _copy.generate(name = "x", size = 4, value = 3) == template.generate(name = "x", size = 4, value = 3)
+
+    try:
+        template.generate(name = "x", size = 4)
+    except KeyError:
+        pass
+    else:
+        assert False, "Undefined template variables must raise!"
+    return True
+
+
+def testCacheOptIn():
+    # Without the environment variable, Deeploy must not write outside of its outputs
+    env = {key: value for key, value in os.environ.items() if key != "DEEPLOY_TEMPLATE_CACHE"}
+    cmd = [sys.executable, "-c", "import Deeploy.DeeployTypes as DeeployTypes; print(DeeployTypes._templateCacheDir)"]
+    result = subprocess.run(cmd, env = env, capture_output = True, text = True)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "None", f"Template cache should be disabled by default, got {result.stdout}!"
+    return True
+
+
+def testTemplateCache():
+    defaultCacheDir = DeeployTypes._templateCacheDir
+    with tempfile.TemporaryDirectory() as cacheDir:
+        DeeployTypes._templateCacheDir = cacheDir
+        try:
+            first = NodeTemplate(_templateStr).generate(name = "x", size = 4, value = 3)
+            cachedModules = [f for f in os.listdir(cacheDir) if f.endswith(".py")]
+            assert len(cachedModules) == 1, "Compiled template module was not written to the cache!"
+
+            modulePath = os.path.join(cacheDir, cachedModules[0])
+            mtime = os.stat(modulePath).st_mtime_ns
+            template = NodeTemplate(_templateStr)
+            assert template.generate(name = "x", size = 4, value = 3) == first
+            assert os.stat(modulePath).st_mtime_ns == mtime, "Cached template module was regenerated!"
+            assert template.template._source == _templateStr, "Cached templates must keep their source!"
+
+            DeeployTypes._templateCacheDir = None
+            assert NodeTemplate(_templateStr).generate(name = "x", size = 4, value = 3) == first
+        finally:
+            DeeployTypes._templateCacheDir = defaultCacheDir
+    return True
+
+
+if __name__ == "__main__":
+    testLazyCompilation()
+    testCacheOptIn()
+    testTemplateCache()
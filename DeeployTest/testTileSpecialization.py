@@ -0,0 +1,87 @@
+# SPDX-FileCopyrightText: 2025 ETH Zurich and University of Bologna
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import re
+import tempfile
+
+from testUtils.deployUtils import deployNetwork, readNetwork
+
+from Deeploy.AbstractDataTypes import PointerClass
+from Deeploy.CommonExtensions.CodeTransformationPasses.IntrospectiveCodeTransformation import \
+    IntrospectiveCodeTransformationMixIn
+from Deeploy.CommonExtensions.DataTypes import uint8_t, uint16_t
+from Deeploy.DeeployTypes import NodeTemplate
+from Deeploy.TilingExtension.TilingCodegen import VariableReplacementScheme, specializeVariableReplacement
+
+_testDir = "Tests/Kernels/Integer/Conv/Regular_2D_RQ"
+_deployArgs = ["-p", "Siracusa", "--defaultMemLevel=L2", "--l1=5000", "--memAllocStrategy=TetrisRandom"]
+
+_kernelRegex = re.compile(r"pulp_nn_conv_i8_i8_i8\((.*)\);")
+
+
+def testVariants():
+    scheme = VariableReplacementScheme({
+        "dim": [16, 16, 16, 16, 8],
+        "padding": [1, 0, 0, 0, 0]
+    }, {
+        "dim": PointerClass(uint16_t),
+        "padding": PointerClass(uint8_t)
+    })
+
+    # The uniform interior tiles first, then the remainder tiles in their order
+    assert specializeVariableReplacement(scheme, 0) == []
+    assert specializeVariableReplacement(scheme, 2) == [{"dim": 16, "padding": 0}, {"dim": 16, "padding": 1}]
+    assert len(specializeVariableReplacement(scheme, 5)) == 3
+
+    return True
+
+
+def testTemplate():
+    opRepr = {"data": "buf", "dim": "dim_ref", "padding": "padding_ref"}
+    variants = [{"dim": 16, "padding": 0}, {"dim": 8, "padding": 0}]
+
+    template = NodeTemplate("kernel(${data}, ${dim}, ${padding});")
+    IntrospectiveCodeTransformationMixIn.specializeVars(template.template, ["dim", "padding"], variants)
+    code = template.generate(opRepr)
+
+    assert "if ((*dim_ref == 16) && (*padding_ref == 0)) {kernel(buf, 16, 0);" in code, code
+    assert "} else if ((*dim_ref == 8) && (*padding_ref == 0)) {kernel(buf, 8, 0);" in code, code
+    assert "} else {kernel(buf, *dim_ref, *padding_ref);" in code, code
+
+    # Without variants, the variables are only dereferenced
+    template = NodeTemplate("kernel(${data}, ${dim}, ${padding});")
+    IntrospectiveCodeTransformationMixIn.specializeVars(template.template, ["dim", "padding"], [])
+    assert template.generate(opRepr) == "kernel(buf, *dim_ref, *padding_ref);"
+
+    return True
+
+
+def _deploy(dumpdir: str, tileSpecializations: int) -> str:
+    deployNetwork(_testDir, dumpdir, [*_deployArgs, f"--tileSpecializations={tileSpecializations}"])
+    network = readNetwork(dumpdir)
+    start = network.index("static void __MERGE_CONVRQ_PASS_0_tiling_closure(")
+    return network[start:network.index("// CLOSURE ARG WRITEBACK", start)]
+
+
+def testDeployment():
+    with tempfile.TemporaryDirectory() as dumpdir:
+        closure = _deploy(dumpdir, tileSpecializations = 0)
+    assert len(_kernelRegex.findall(closure)) == 1 and "else{" not in closure
+
+    with tempfile.TemporaryDirectory() as dumpdir:
+        closure = _deploy(dumpdir, tileSpecializations = 1)
+
+    # The most common tile gets literal kernel arguments, all other tiles load them
+    specialized, generic = _kernelRegex.findall(closure)
+    assert "*" not in specialized, specialized
+    assert "*" in generic, generic
+    assert closure.index("else{") < closure.index(generic)
+
+    return True
+
+
+if __name__ == "__main__":
+    testVariants()
+    testTemplate()
+    testDeployment()
@@ -2,12 +2,15 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import math
 import pickle
 
+import numpy as np
 import pytest
 
-from Deeploy.AbstractDataTypes import PointerClass, StructClass
-from Deeploy.CommonExtensions.DataTypes import IntegerDataTypes, bfloat16_t, float32_t, int8_t, int16_t, int32_t
+from Deeploy.AbstractDataTypes import FloatImmediate, PointerClass, StructClass
+from Deeploy.CommonExtensions.DataTypes import IntegerDataTypes, bfloat16_t, float16_t, float32_t, float64_t, int4_t, \
+    int8_t, int16_t, int32_t, uint2_t, uint16_t
 from Deeploy.DeeployTypes import ConstantBuffer, NetworkContext, StructBuffer, TransientBuffer, VariableBuffer
 
 
@@ -98,6 +101,92 @@ def testImmediatePromotionFloat():
     return True
 
 
+def _scalarCheckValue(cls, values) -> bool:
+    # Per-element implementation of FloatImmediate.checkValue preceding the vectorized one
+    DOUBLE_MIN_EXP = -1023
+    for val in values:
+        mantissa, exponent = math.frexp(val)
+        sign = True if mantissa < 0 else False
+        mantissa = -mantissa * 2 if sign else mantissa * 2
+        exponent -= 1
+
+        if not (math.isfinite(val) and val != 0 and exponent > DOUBLE_MIN_EXP):
+            continue
+
+        if (cls.typeExponentOffset + exponent) > cls.typeExponentMax or (cls.typeExponentOffset + exponent) < 0:
+            return False
+
+        truncated_mantissa = 1 + math.floor((2**cls.typeMantissa) * (mantissa - 1)) / (2**cls.typeMantissa)
+        if math.fabs(truncated_mantissa - mantissa) > 0.0:
+            return False
+
+    return True
+
+
+def _customFloat(mantissa: int, exponent: int):
+    return type(
+        f"float_e{exponent}m{mantissa}_t", (FloatImmediate,), {
+            "typeName": f"float_e{exponent}m{mantissa}_t",
+            "typeWidth": 1 + exponent + mantissa,
+            "typeMantissa": mantissa,
+            "typeExponent": exponent
+        })
+
+
+def _checkValueCandidates(cls, rng: np.random.Generator) -> np.ndarray:
+    special = [
+        0.0, -0.0, math.inf, -math.inf, math.nan, 5e-324, -5e-324, 2.0**-1022, 2.0**-1023, 1.7976931348623157e308
+    ]
+
+    # Largest and smallest exponents of the type and their neighbours
+    boundary = []
+    for exponent in (cls.typeExponentMax - cls.typeExponentOffset, -cls.typeExponentOffset):
+        # Powers of two beyond the range of FP64 are covered by the special values
+        for offset in (-1, 0, 1):
+            if -1074 <= exponent + offset <= 1023:
+                boundary += [2.0**(exponent + offset), -2.0**(exponent + offset)]
+
+    # Mantissas using exactly all bits of the type, and one bit more
+    mantissas = []
+    for bits in (cls.typeMantissa, cls.typeMantissa + 1):
+        if bits <= 52:
+            mantissas += [1 + 2.0**-bits, 2 - 2.0**-bits, -(1 + 2.0**-bits), (2 - 2.0**-bits) * 2.0**3]
+
+    # Random values, rounded to the mantissa of the type for half of them
+    randomValues = rng.standard_normal(64) * 2.0**rng.integers(-40, 40, 64)
+    roundedValues = np.array([
+        math.ldexp(round(math.ldexp(m, cls.typeMantissa + 1)), e - cls.typeMantissa - 1)
+        for m, e in (math.frexp(val) for val in randomValues)
+    ])
+
+    return np.concatenate([special, boundary, mantissas, randomValues, roundedValues])
+
+
+def testFloatCheckValueEquivalence():
+    rng = np.random.default_rng(0)
+    floatTypes = [
+        bfloat16_t, float16_t, float32_t, float64_t,
+        _customFloat(2, 5),
+        _customFloat(3, 4),
+        _customFloat(40, 9)
+    ]
+
+    for floatType in floatTypes:
+        candidates = _checkValueCandidates(floatType, rng)
+        for value in candidates:
+            assert floatType.checkValue(float(value)) == _scalarCheckValue(floatType, [float(value)]), \
+                f"{floatType.typeName}.checkValue({value!r}) differs from the scalar implementation!"
+
+        # Arrays are representable if and only if all their elements are
+        for _ in range(16):
+            values = rng.choice(candidates, 8)
+            assert floatType.checkValue(values) == _scalarCheckValue(floatType, values.tolist()), \
+                f"{floatType.typeName}.checkValue({values!r}) differs from the scalar implementation!"
+            assert floatType.checkValue(values.tolist()) == floatType.checkValue(values)
+
+    return True
+
+
 def generateTestStruct() -> StructClass:
     testStructType = {"f1": int32_t, "f2": int8_t}
     s1 = StructClass("s2", testStructType)
@@ -224,11 +313,41 @@ def testPointerTypeEquivalence():
     return True
 
 
+def testSubBytePacking():
+    assert int4_t.isPacked and not int8_t.isPacked, "Only sub-byte types should be packed!"
+    assert int4_t.sizeInBytes(5) == 3, "Packed int4 buffers should be rounded up to full bytes!"
+    assert list(int4_t.packValues([1, -1, -8, 7])) == [0xF1, 0x78], "int4 values should be packed low nibble first!"
+    assert list(uint2_t.packValues([0, 1, 2, 3, 3])) == [0xE4, 0x03], "uint2 values should be packed LSB first!"
+
+    testCtxt = NetworkContext(VariableBuffer, ConstantBuffer, StructBuffer, TransientBuffer)
+    var = ConstantBuffer("testPacked", shape = [
+        5,
+    ], values = np.array([1, -1, -8, 7, 3]))
+    testCtxt.add(var, 'global')
+    testCtxt.annotateType(name = "testPacked", _type = PointerClass(int4_t))
+
+    assert var.sizeInBytes == 3, "Packed constant should occupy 3 bytes!"
+    assert var._bufferRepresentation()['size'] == 3, "Packed constant should be declared with 3 containers!"
+    assert var._valueString() == "241, 120, 3", "Packed constant should be serialized as packed bytes!"
+
+    return True
+
+
+def testBinaryImage():
+    assert int8_t.binaryImage([-1, 2]).tobytes() == b"\xff\x02", "int8 values should be stored as two's complement!"
+    assert uint16_t.binaryImage([258]).tobytes() == b"\x02\x01", "Values should be stored little-endian!"
+    assert float32_t.binaryImage([1.0]).tobytes() == b"\x00\x00\x80\x3f", "float32 values should be IEEE754!"
+    assert int4_t.binaryImage([1, -1]).tobytes() == b"\xf1", "Sub-byte values should be packed!"
+    assert bfloat16_t.binaryImage([1.0]) is None, "bfloat16 has no native binary representation!"
+    return True
+
+
 if __name__ == "__main__":
     testImmediateSerialization()
     testImmediatePromotion()
     testImmediateTypeEquivalence()
     testImmediatePromotionFloat()
+    testFloatCheckValueEquivalence()
 
     testStructSerialization()
     testStructPromotion()
@@ -239,3 +358,6 @@ if __name__ == "__main__":
     testPointerSerialization()
     testPointerPromotion()
     testPointerTypeEquivalence()
+
+    testSubBytePacking()
+    testBinaryImage()
@@ -3,17 +3,39 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import os
-from typing import List, Tuple
+import re
+from typing import List, Optional
 
 import numpy as np
 
 from Deeploy.DeeployTypes import CodeGenVerbosity, ConstantBuffer, NetworkDeployer, VariableBuffer
 from Deeploy.Targets.MemPool.Platform import MemPoolPlatform
+from Deeploy.Targets.PULPOpen.CodeTransformationPasses.PULPClusterFork import persistentClusterTeamName
+from Deeploy.Targets.PULPOpen.L3Compression import l3Image
 from Deeploy.Targets.PULPOpen.Platform import MemoryPULPPlatform, MemoryPULPPlatformWrapper, PULPPlatform
 from Deeploy.Targets.Snitch.Platform import SnitchPlatform
 
 _TEXT_ALIGN = 30
 
+# Comments and preprocessor directives, which end at the end of the line
+_lineRegex = re.compile(r"(//.*|^[ \t]*#.*)", re.MULTILINE)
+
+
+def canonicalCode(code: str) -> str:
+    """Strip the formatting of generated code, such that it can be inspected with or without clang-format
+
+    Whitespace is removed around punctuation and collapsed between words. Every statement, brace, comment and
+    preprocessor directive is put on its own line.
+    """
+    lines = []
+    for segment in _lineRegex.split(code):
+        if _lineRegex.fullmatch(segment):
+            lines.append(" ".join(segment.split()))
+            continue
+        segment = " ".join(re.sub(r"\s*([^\w\s])\s*", r"\1", segment).split())
+        lines += [line.strip() for line in re.split(r"(?<=[;{}])", segment) if line.strip() != ""]
+    return "\n".join(lines)
+
 
 def _shapeBroadcast(ctxt, value, name):
     if ctxt.is_global(f"{name}"):
@@ -31,7 +53,23 @@ def _shapeBroadcast(ctxt, value, name):
     return broadcastNum
 
 
-def generateTestInputsHeader(deployer: NetworkDeployer, test_inputs: List) -> str:
+def _binaryVector(typeName: str, vectorName: str, image: np.ndarray, binaryDir: str) -> str:
+    # Blobs are word-aligned and padded, like the literal arrays
+    image = np.pad(image, (0, (-image.size) % 4))
+
+    os.makedirs(binaryDir, exist_ok = True)
+    image.tofile(os.path.join(binaryDir, f"{vectorName}.bin"))
+
+    # The assembler looks the blob up relative to the generated sources, which are on the include path of the build
+    blobPath = f"{os.path.basename(os.path.normpath(binaryDir))}/{vectorName}.bin"
+
+    retStr = f'__asm__(".pushsection .data, \\"aw\\"\\n.balign 16\\n.global {vectorName}\\n{vectorName}:\\n'
+    retStr += f'.incbin \\"{blobPath}\\"\\n.popsection");\n'
+    retStr += f"extern {typeName} {vectorName}[];\n"
+    return retStr
+
+
+def generateTestInputsHeader(deployer: NetworkDeployer, test_inputs: List, binaryDir: Optional[str] = None) -> str:
     vectors = []
     retStr = ""
     for index, values in enumerate(test_inputs):
@@ -64,6 +102,11 @@ def generateTestInputsHeader(deployer: NetworkDeployer, test_inputs: List) -> st
         vectorName = f"testInputVector{index}"
         vectors.append(vectorName)
 
+        image = buffer._type.referencedType.binaryImage(values) if binaryDir is not None else None
+        if image is not None:
+            retStr += _binaryVector(typeName, vectorName, image, binaryDir)
+            continue
+
         retStr += f"{typeName} {vectorName}[] ="
         retStr += "{"
         if typeName == 'float32_t':
@@ -88,19 +131,28 @@ def generateTestInputsHeader(deployer: NetworkDeployer, test_inputs: List) -> st
     return retStr
 
 
-def generateTestOutputsHeader(deployer: NetworkDeployer, test_outputs: List[np.ndarray]) -> str:
+def generateTestOutputsHeader(deployer: NetworkDeployer,
+                              test_outputs: List[np.ndarray],
+                              binaryDir: Optional[str] = None) -> str:
     retStr = ""
     for index, values in enumerate(test_outputs):
-        typeName = deployer.ctxt.lookup(f'output_{index}')._type.referencedType.typeName
-        typeWidth = deployer.ctxt.lookup(f'output_{index}')._type.referencedType.typeWidth
+        referencedType = deployer.ctxt.lookup(f'output_{index}')._type.referencedType
+        typeName = referencedType.typeName
+        typeWidth = referencedType.typeWidth
 
         retStr += f"#define OUTPUTTYPE {typeName}\n"
         retStr += f"#define ISOUTPUTFLOAT {int(typeName == 'float32_t')}\n"
-        retStr += f"{typeName} testOutputVector{index}[] ="
-        retStr += "{"
 
         values = values.flatten()
 
+        image = referencedType.binaryImage(values) if binaryDir is not None else None
+        if image is not None:
+            retStr += _binaryVector(typeName, f"testOutputVector{index}", image, binaryDir)
+            continue
+
+        retStr += f"{typeName} testOutputVector{index}[] ="
+        retStr += "{"
+
         if typeName == "float32_t":
             list_str = (", ").join([f'{x}f' if not (np.isinf(x) or np.isnan(x)) else str(x) for x in values])
         else:
@@ -170,38 +222,56 @@ def generateTestNetworkImplementation(deployer: NetworkDeployer, verbosityCfg: C
 
     """
 
-    retStr += deployer.generateBufferInitializationCode()
+    # With a compilation cache, the constants are kept in NetworkConstants.h, see generateTestNetworkConstants
+    splitConstants = deployer.compilationCacheDir is not None
+    if splitConstants:
+        retStr += """
+        #include "NetworkConstants.h"
+        """
+
+    retStr += deployer.generateBufferInitializationCode(constants = not splitConstants)
     retStr += deployer.generateGlobalDefinitionCode()
 
+    if isinstance(deployer.Platform, (PULPPlatform, MemoryPULPPlatform, MemoryPULPPlatformWrapper)):
+        runNetworkSignature = "void RunNetwork()"
+        initNetworkSignature = "void InitNetwork()"
+    else:
+        runNetworkSignature = "void RunNetwork(__attribute__((unused)) uint32_t core_id, __attribute__((unused)) uint32_t numThreads)"
+        initNetworkSignature = "void InitNetwork(__attribute__((unused)) uint32_t core_id, __attribute__((unused)) uint32_t numThreads)"
+
     # MemPool and Snitch declare intermediate buffers at file scope (before RunNetwork) so they are shared across cores.
-    if isinstance(deployer.Platform, (MemPoolPlatform, SnitchPlatform)):
+    fileScopeBuffers = isinstance(deployer.Platform, (MemPoolPlatform, SnitchPlatform))
+    if fileScopeBuffers:
         retStr += deployer.generateInferenceInitializationCode()
+
+    # With a persistent cluster team, the network runs inside a single fork of the cluster
+    dmaCore = getattr(deployer, "dmaCore", False)
+    persistentCluster = getattr(deployer, "persistentCluster", False) or dmaCore
+    if persistentCluster:
         retStr += """
-        void RunNetwork(__attribute__((unused)) uint32_t core_id, __attribute__((unused)) uint32_t numThreads){
-        """
-    elif isinstance(deployer.Platform, (PULPPlatform, MemoryPULPPlatform, MemoryPULPPlatformWrapper)):
-        retStr += """
-        void RunNetwork(){
+        static void RunNetworkPersistent(__attribute__((unused)) void* args){
         """
-        retStr += deployer.generateInferenceInitializationCode()
     else:
-        retStr += """
-        void RunNetwork(__attribute__((unused)) uint32_t core_id, __attribute__((unused)) uint32_t numThreads){
+        retStr += f"""
+        {runNetworkSignature}{{
         """
+
+    if not fileScopeBuffers:
         retStr += deployer.generateInferenceInitializationCode()
 
     retStr += deployer.generateFunction(verbosityCfg)
-    if isinstance(deployer.Platform, (PULPPlatform, MemoryPULPPlatform, MemoryPULPPlatformWrapper)):
-        retStr += """
+    retStr += """
         }
-
-        void InitNetwork(){
         """
-    else:
-        retStr += """
-        }
-
-        void InitNetwork(__attribute__((unused)) uint32_t core_id, __attribute__((unused)) uint32_t numThreads){
+    if persistentCluster:
+        teamName = deployer.ctxt._mangle(persistentClusterTeamName)
+        retStr += f"""
+        {runNetworkSignature}{{
+        {"deeploy_cluster_run_dma_core" if dmaCore else "deeploy_cluster_run"}(&{teamName}, RunNetworkPersistent, NULL);
+        }}
+        """
+    retStr += f"""
+        {initNetworkSignature}{{
         """
     retStr += deployer.generateEngineInitializationCode()
     retStr += deployer.generateBufferAllocationCode()
@@ -212,26 +282,21 @@ def generateTestNetworkImplementation(deployer: NetworkDeployer, verbosityCfg: C
     return retStr
 
 
-def generateL3HexDump(deployer: NetworkDeployer, path: str, test_inputs: List, test_outputs: List):
-
-    def type2TypeStr(dataType) -> Tuple[str, int]:
-        if dataType.referencedType.typeName == "float32_t":
-            retStr = "float32"
-            width = 32
-        else:
-            width = dataType.referencedType.typeWidth
-            signed = (dataType.referencedType.typeMin < 0)
-
-            retStr = ""
+def generateTestNetworkConstants(deployer: NetworkDeployer) -> str:
+    # Constants are kept in their own header, such that they can be regenerated alone if only the weights change
+    retStr = """
+    #ifndef __DEEPLOY_CONSTANTS_HEADER__
+    #define __DEEPLOY_CONSTANTS_HEADER__
+    """
+    retStr += deployer.generateConstantInitializationCode()
+    retStr += """
+    #endif
+    """
 
-            if signed:
-                retStr += "int"
-            else:
-                retStr += "uint"
+    return retStr
 
-            retStr += str(width)
 
-        return retStr, width
+def generateL3HexDump(deployer: NetworkDeployer, path: str, test_inputs: List, test_outputs: List):
 
     def dumpBuffer(buf: VariableBuffer, path: str):
 
@@ -250,51 +315,69 @@ def generateL3HexDump(deployer: NetworkDeployer, path: str, test_inputs: List, t
         else:
             raise Exception(f"Unexpected buffer {buf}!")
 
-        typeStr, width = type2TypeStr(buf._type)
-
-        # Word alignment
-        mod = (32 // width)
-        paddingLength = (mod - (array.size % mod)) % mod
-        paddedArray = np.pad(array.flatten(), (0, paddingLength), 'constant')
-
-        paddedArray.astype(typeStr).tofile(path)
+        # Word-aligned, sub-byte types are packed
+        l3Image(array, buf._type.referencedType).tofile(path)
 
     # LMACAN: Dump all global buffers with the "extName" attribute
     os.makedirs(path, exist_ok = True)
     for buf in deployer.ctxt.globalObjects.values():
         if hasattr(buf, "extName"):
             pathName = os.path.join(path, f"{buf.extName}.hex")
-            dumpBuffer(buf, pathName)
+            # Compressed constants carry their L3 image
+            if hasattr(buf, "extData"):
+                with open(pathName, "wb") as f:
+                    f.write(buf.extData)
+            else:
+                dumpBuffer(buf, pathName)
 
 
-def generateTestNetwork(deployer: NetworkDeployer, test_inputs: List[np.ndarray], test_outputs: List[np.ndarray],
-                        dumpdir: str, verbosityCfg: CodeGenVerbosity) -> None:
+def generateTestNetwork(deployer: NetworkDeployer,
+                        test_inputs: List[np.ndarray],
+                        test_outputs: List[np.ndarray],
+                        dumpdir: str,
+                        verbosityCfg: CodeGenVerbosity,
+                        binaryConstants: bool = False) -> None:
     assert deployer.prepared, "An unprepared deployer was given"
 
     # Create input and output vectors
     os.makedirs(dumpdir, exist_ok = True)
 
-    testInputStr = generateTestInputsHeader(deployer, test_inputs)
+    # Constants and test vectors are written as binary blobs and linked with .incbin instead of literal arrays
+    binaryDir = os.path.join(dumpdir, "bin") if binaryConstants else None
+    deployer.binaryConstantDir = binaryDir
+
+    testInputStr = generateTestInputsHeader(deployer, test_inputs, binaryDir)
     with open(f'{dumpdir}/testinputs.h', "w") as f:
         f.write(testInputStr)
 
-    testOutputStr = generateTestOutputsHeader(deployer, test_outputs)
+    testOutputStr = generateTestOutputsHeader(deployer, test_outputs, binaryDir)
     with open(f'{dumpdir}/testoutputs.h', "w") as f:
         f.write(testOutputStr)
 
-    # Generate code for Network
-    testNetworkHeaderStr = generateTestNetworkHeader(deployer)
-    with open(f'{dumpdir}/Network.h', "w") as f:
-        f.write(testNetworkHeaderStr)
+    splitConstants = deployer.compilationCacheDir is not None
+    if splitConstants:
+        testNetworkConstantsStr = generateTestNetworkConstants(deployer)
+        with open(f'{dumpdir}/NetworkConstants.h', "w") as f:
+            f.write(testNetworkConstantsStr)
+
+    # A reused compilation only changes constants, the network code from the cached compilation stays valid
+    if not deployer.reusedCompilation:
+        # Generate code for Network
+        testNetworkHeaderStr = generateTestNetworkHeader(deployer)
+        with open(f'{dumpdir}/Network.h', "w") as f:
+            f.write(testNetworkHeaderStr)
 
-    testNetworkImplementationStr = generateTestNetworkImplementation(deployer, verbosityCfg)
-    with open(f'{dumpdir}/Network.c', "w") as f:
-        f.write(testNetworkImplementationStr)
+        testNetworkImplementationStr = generateTestNetworkImplementation(deployer, verbosityCfg)
+        with open(f'{dumpdir}/Network.c', "w") as f:
+            f.write(testNetworkImplementationStr)
 
     generateL3HexDump(deployer, os.path.join(f'{dumpdir}', 'hex'), test_inputs, test_outputs)
 
     clang_format = "{BasedOnStyle: llvm, IndentWidth: 2, ColumnLimit: 160}"
-    os.system(f'clang-format -i --style="{clang_format}" {dumpdir}/Network.c')
-    os.system(f'clang-format -i --style="{clang_format}" {dumpdir}/Network.h')
+    if splitConstants:
+        os.system(f'clang-format -i --style="{clang_format}" {dumpdir}/NetworkConstants.h')
+    if not deployer.reusedCompilation:
+        os.system(f'clang-format -i --style="{clang_format}" {dumpdir}/Network.c')
+        os.system(f'clang-format -i --style="{clang_format}" {dumpdir}/Network.h')
     os.system(f'clang-format -i --style="{clang_format}" {dumpdir}/testoutputs.h')
     os.system(f'clang-format -i --style="{clang_format}" {dumpdir}/testinputs.h')
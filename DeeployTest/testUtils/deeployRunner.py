@@ -101,6 +101,34 @@ class DeeployRunnerArgumentParser(argparse.ArgumentParser):
                           action = 'store_true',
                           default = False,
                           help = 'Wrap each layer with PULP perf-counter microbenchmark\n')
+        self.add_argument('--binaryConstants',
+                          dest = 'binaryConstants',
+                          action = 'store_true',
+                          default = False,
+                          help = 'Emit constants and test vectors as binary blobs linked with .incbin (ELF only)\n')
+        self.add_argument('--deeployState',
+                          metavar = '<mode>',
+                          dest = 'deeployState',
+                          type = str,
+                          choices = ["off", "final", "all"],
+                          default = "all",
+                          help = 'Select which intermediate DeeployState snapshots are exported\n')
+        self.add_argument('--compactDeeployState',
+                          action = 'store_true',
+                          default = False,
+                          help = 'Store DeeployState constants once in a content-addressed blob store\n')
+        self.add_argument('--asyncDeeployState',
+                          action = 'store_true',
+                          default = False,
+                          help = 'Write DeeployState snapshots from a background thread\n')
+        self.add_argument('--profileCompiler',
+                          action = 'store_true',
+                          default = False,
+                          help = 'Export wall time and peak memory of the compiler stages\n')
+        self.add_argument('--compilationCache',
+                          action = 'store_true',
+                          default = False,
+                          help = 'Only regenerate the constants if only the weights of the network changed\n')
         self.add_argument('--toolchain',
                           metavar = '<LLVM|GCC>',
                           dest = 'toolchain',
@@ -134,6 +162,27 @@ class DeeployRunnerArgumentParser(argparse.ArgumentParser):
                               default = "L2",
                               help = 'Default memory level (L2 or L3)\n')
             self.add_argument('--doublebuffer', action = 'store_true', help = 'Enable double buffering\n')
+            self.add_argument('--crossLayerPrefetch',
+                              action = 'store_true',
+                              help = 'Prefetch the first input tiles of the next layer (requires double buffering)\n')
+            self.add_argument('--persistentCluster',
+                              action = 'store_true',
+                              help = 'Fork the cluster once per inference instead of once per layer\n')
+            self.add_argument('--dmaCore',
+                              action = 'store_true',
+                              help = 'Dedicate a cluster core to the DMA while the other cores compute\n')
+            self.add_argument('--asyncL3Dma',
+                              action = 'store_true',
+                              help = 'Transfer L3 tiles with the asynchronous L3 DMA instead of the blocking one\n')
+            self.add_argument('--tileSpecializations',
+                              metavar = '<count>',
+                              dest = 'tileSpecializations',
+                              type = int,
+                              default = 0,
+                              help = 'Maximum number of tile variants per layer whose kernel call gets literals\n')
+            self.add_argument('--hoistArgumentStructs',
+                              action = 'store_true',
+                              help = 'Build the argument structs of a tiling loop once before the loop\n')
             self.add_argument('--l1',
                               metavar = '<size>',
                               dest = 'l1',
@@ -156,6 +205,9 @@ class DeeployRunnerArgumentParser(argparse.ArgumentParser):
                               action = "store_true",
                               help = 'Enable randomized memory scheduler\n')
             self.add_argument('--profileTiling', action = 'store_true', help = 'Enable tiling profiling\n')
+            self.add_argument('--compressL3Weights',
+                              action = 'store_true',
+                              help = 'Keep L3-resident constants compressed and decompress their tiles in L2\n')
             self.add_argument('--memAllocStrategy',
                               metavar = '<strategy>',
                               dest = 'memAllocStrategy',
@@ -230,6 +282,18 @@ def create_config_from_args(args: argparse.Namespace,
             gen_args_list.append(f"--defaultMemLevel={args.defaultMemLevel}")
         if hasattr(args, 'doublebuffer') and args.doublebuffer:
             gen_args_list.append("--doublebuffer")
+        if hasattr(args, 'crossLayerPrefetch') and args.crossLayerPrefetch:
+            gen_args_list.append("--crossLayerPrefetch")
+        if hasattr(args, 'persistentCluster') and args.persistentCluster:
+            gen_args_list.append("--persistentCluster")
+        if hasattr(args, 'dmaCore') and args.dmaCore:
+            gen_args_list.append("--dmaCore")
+        if hasattr(args, 'asyncL3Dma') and args.asyncL3Dma:
+            gen_args_list.append("--asyncL3Dma")
+        if hasattr(args, 'tileSpecializations') and args.tileSpecializations:
+            gen_args_list.append(f"--tileSpecializations={args.tileSpecializations}")
+        if hasattr(args, 'hoistArgumentStructs') and args.hoistArgumentStructs:
+            gen_args_list.append("--hoistArgumentStructs")
         if hasattr(args, 'l1') and args.l1:
             gen_args_list.append(f"--l1={args.l1}")
         if hasattr(args, 'l2') and args.l2 and args.l2 != 1024000:
@@ -240,6 +304,8 @@ def create_config_from_args(args: argparse.Namespace,
             gen_args_list.append("--randomizedMemoryScheduler")
         if hasattr(args, 'profileTiling') and args.profileTiling:
             gen_args_list.append("--profileTiling")
+        if hasattr(args, 'compressL3Weights') and args.compressL3Weights:
+            gen_args_list.append("--compressL3Weights")
         if hasattr(args, 'memAllocStrategy') and args.memAllocStrategy:
             gen_args_list.append(f"--memAllocStrategy={args.memAllocStrategy}")
         if hasattr(args, 'searchStrategy') and args.searchStrategy:
@@ -255,6 +321,24 @@ def create_config_from_args(args: argparse.Namespace,
     if getattr(args, 'profileMicrobenchmark', False):
         gen_args_list.append("--profileMicrobenchmark")
 
+    if getattr(args, 'binaryConstants', False):
+        gen_args_list.append("--binaryConstants")
+
+    if getattr(args, 'deeployState', "all") != "all":
+        gen_args_list.append(f"--deeployState={args.deeployState}")
+
+    if getattr(args, 'compactDeeployState', False):
+        gen_args_list.append("--compactDeeployState")
+
+    if getattr(args, 'asyncDeeployState', False):
+        gen_args_list.append("--asyncDeeployState")
+
+    if getattr(args, 'profileCompiler', False):
+        gen_args_list.append("--profileCompiler")
+
+    if getattr(args, 'compilationCache', False):
+        gen_args_list.append("--compilationCache")
+
     config = DeeployTestConfig(
         test_name = test_name,
         test_dir = test_dir_abs,
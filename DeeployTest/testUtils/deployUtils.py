@@ -0,0 +1,42 @@
+# SPDX-FileCopyrightText: 2025 ETH Zurich and University of Bologna
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import subprocess
+import sys
+from typing import Sequence
+
+from testUtils.codeGenerate import canonicalCode
+
+_scriptDir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def deployNetwork(testDir: str, dumpdir: str, args: Sequence[str] = ()) -> str:
+    """Generate the code of a test network with testMVP.py and return the output of the generation
+
+    Parameters
+    ----------
+    testDir : str
+        Directory of the test network, relative to DeeployTest
+    dumpdir : str
+        Directory the code is generated into
+    args : Sequence[str]
+        Additional arguments of testMVP.py, e.g. the platform and the tiling options
+
+    Returns
+    -------
+    str
+        The standard output and error of the generation
+    """
+    cmd = [sys.executable, "testMVP.py", "-t", testDir, *args, "-d", dumpdir]
+    result = subprocess.run(cmd, cwd = _scriptDir, capture_output = True, text = True)
+    assert result.returncode == 0, f"Deployment of {testDir} with {' '.join(args)} failed:\n{result.stderr}"
+    return result.stdout + result.stderr
+
+
+def readNetwork(dumpdir: str, canonical: bool = True) -> str:
+    """Read the generated Network.c, by default in the canonical form of `canonicalCode`"""
+    with open(os.path.join(dumpdir, "Network.c")) as f:
+        network = f.read()
+    return canonicalCode(network) if canonical else network
@@ -2,7 +2,9 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import Callable, Dict, Optional, Tuple, Type, Union
+import importlib
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
 import onnx_graphsurgeon as gs
 
@@ -10,94 +12,183 @@ from Deeploy.AbstractDataTypes import Pointer
 from Deeploy.DeeployTypes import DeploymentPlatform, NetworkDeployer, TopologyOptimizer
 from Deeploy.MemoryLevelExtension.MemoryLevels import MemoryHierarchy, MemoryLevel
 from Deeploy.MemoryLevelExtension.NetworkDeployers.MemoryLevelDeployer import MemoryPlatform, MemoryPlatformWrapper
-from Deeploy.Targets.Chimera.Deployer import ChimeraDeployer
-from Deeploy.Targets.Chimera.Platform import ChimeraOptimizer, ChimeraPlatform
-from Deeploy.Targets.CortexM.Deployer import CMSISDeployer
-from Deeploy.Targets.CortexM.Platform import CMSISOptimizer, CMSISPlatform
-from Deeploy.Targets.GAP9.Deployer import GAP9Deployer
-from Deeploy.Targets.GAP9.Platform import GAP9Platform, MemoryGAP9Platform, MemoryGAP9PlatformWrapper
-from Deeploy.Targets.Generic.Deployer import GenericDeployer
-from Deeploy.Targets.Generic.Platform import GenericOptimizer, GenericPlatform
-from Deeploy.Targets.MemPool.Deployer import MemPoolDeployer
-from Deeploy.Targets.MemPool.Platform import MemPoolOptimizer, MemPoolPlatform
-from Deeploy.Targets.Neureka.Deployer import NeurekaDeployer
-from Deeploy.Targets.Neureka.Platform import MemoryNeurekaPlatform, MemoryNeurekaPlatformWrapper, NeurekaOptimizer, \
-    NeurekaPlatform
-from Deeploy.Targets.PULPOpen.Deployer import PULPDeployer
-from Deeploy.Targets.PULPOpen.Platform import MemoryPULPPlatform, MemoryPULPPlatformWrapper, PULPOptimizer, PULPPlatform
-from Deeploy.Targets.Snitch.Deployer import SnitchDeployer
-from Deeploy.Targets.Snitch.Platform import SnitchOptimizer, SnitchPlatform
-from Deeploy.Targets.SoftHier.Deployer import SoftHierDeployer
-from Deeploy.Targets.SoftHier.Platform import SoftHierOptimizer, SoftHierPlatform
+
+# Targets are declared by the entry points ("module:attribute") of their platform, deployer and optimizer. A target's
+# module tree is only imported once a platform or deployer of that target is requested.
+
+
+@dataclass(frozen = True)
+class _Target:
+    platform: str  # Entry point of the platform class
+    deployer: str  # Entry point of the deployer class
+    optimizer: str  # Entry point of the default lowering optimizer
+    platformClasses: Tuple[str, ...]  # Entry points of all platform classes handled by the deployer
+    defaultChannelsFirst: bool
+    forwardInputOffsets: bool = False
+
+
+# Ordered by priority, the first target whose platform classes match a platform is used
+_TARGETS: Dict[str, _Target] = {
+    "CortexM":
+        _Target("Deeploy.Targets.CortexM.Platform:CMSISPlatform",
+                "Deeploy.Targets.CortexM.Deployer:CMSISDeployer",
+                "Deeploy.Targets.CortexM.Platform:CMSISOptimizer", ("Deeploy.Targets.CortexM.Platform:CMSISPlatform",),
+                defaultChannelsFirst = False,
+                forwardInputOffsets = True),
+    "MemPool":
+        _Target("Deeploy.Targets.MemPool.Platform:MemPoolPlatform",
+                "Deeploy.Targets.MemPool.Deployer:MemPoolDeployer",
+                "Deeploy.Targets.MemPool.Platform:MemPoolOptimizer",
+                ("Deeploy.Targets.MemPool.Platform:MemPoolPlatform",),
+                defaultChannelsFirst = True,
+                forwardInputOffsets = True),
+    "SoftHier":
+        _Target("Deeploy.Targets.SoftHier.Platform:SoftHierPlatform",
+                "Deeploy.Targets.SoftHier.Deployer:SoftHierDeployer",
+                "Deeploy.Targets.SoftHier.Platform:SoftHierOptimizer",
+                ("Deeploy.Targets.SoftHier.Platform:SoftHierPlatform",),
+                defaultChannelsFirst = True,
+                forwardInputOffsets = True),
+    # WIESEP: CMSIS performs add-multiply-divide and we normally do multiply-add-divide
+    #         Because these deployer were fine-tuned with a add-multiply-divide aware deployer can emulate this
+    #         behavior with the EmulateCMSISRequantPass
+    "Generic":
+        _Target("Deeploy.Targets.Generic.Platform:GenericPlatform",
+                "Deeploy.Targets.Generic.Deployer:GenericDeployer",
+                "Deeploy.Targets.Generic.Platform:GenericOptimizer",
+                ("Deeploy.Targets.Generic.Platform:GenericPlatform",),
+                defaultChannelsFirst = True,
+                forwardInputOffsets = True),
+    "Neureka":
+        _Target("Deeploy.Targets.Neureka.Platform:NeurekaPlatform",
+                "Deeploy.Targets.Neureka.Deployer:NeurekaDeployer",
+                "Deeploy.Targets.Neureka.Platform:NeurekaOptimizer",
+                ("Deeploy.Targets.Neureka.Platform:NeurekaPlatform",
+                 "Deeploy.Targets.Neureka.Platform:MemoryNeurekaPlatform",
+                 "Deeploy.Targets.Neureka.Platform:MemoryNeurekaPlatformWrapper"),
+                defaultChannelsFirst = False),
+    "GAP9":
+        _Target("Deeploy.Targets.GAP9.Platform:GAP9Platform",
+                "Deeploy.Targets.GAP9.Deployer:GAP9Deployer",
+                "Deeploy.Targets.PULPOpen.Platform:PULPOptimizer",
+                ("Deeploy.Targets.GAP9.Platform:GAP9Platform", "Deeploy.Targets.GAP9.Platform:MemoryGAP9Platform",
+                 "Deeploy.Targets.GAP9.Platform:MemoryGAP9PlatformWrapper"),
+                defaultChannelsFirst = False),
+    "PULPOpen":
+        _Target(
+            "Deeploy.Targets.PULPOpen.Platform:PULPPlatform",
+            "Deeploy.Targets.PULPOpen.Deployer:PULPDeployer",
+            "Deeploy.Targets.PULPOpen.Platform:PULPOptimizer",
+            ("Deeploy.Targets.PULPOpen.Platform:PULPPlatform", "Deeploy.Targets.PULPOpen.Platform:MemoryPULPPlatform",
+             "Deeploy.Targets.PULPOpen.Platform:MemoryPULPPlatformWrapper"),
+            defaultChannelsFirst = False),
+    "Snitch":
+        _Target("Deeploy.Targets.Snitch.Platform:SnitchPlatform",
+                "Deeploy.Targets.Snitch.Deployer:SnitchDeployer",
+                "Deeploy.Targets.Snitch.Platform:SnitchOptimizer", ("Deeploy.Targets.Snitch.Platform:SnitchPlatform",),
+                defaultChannelsFirst = False),
+    "Chimera":
+        _Target("Deeploy.Targets.Chimera.Platform:ChimeraPlatform",
+                "Deeploy.Targets.Chimera.Deployer:ChimeraDeployer",
+                "Deeploy.Targets.Chimera.Platform:ChimeraOptimizer",
+                ("Deeploy.Targets.Chimera.Platform:ChimeraPlatform",),
+                defaultChannelsFirst = False),
+    # XDNA2 requires mlir-aie, which is only imported if an XDNA2 platform is requested
+    "XDNA2":
+        _Target("Deeploy.Targets.XDNA2.Platform:XDNA2Platform",
+                "Deeploy.Targets.XDNA2.Deployer:XDNA2Deployer",
+                "Deeploy.Targets.XDNA2.Platform:XDNA2Optimizer",
+                ("Deeploy.Targets.XDNA2.Platform:XDNA2Platform", "Deeploy.Targets.XDNA2.Platform:MemoryXDNA2Platform",
+                 "Deeploy.Targets.XDNA2.Platform:MemoryXDNA2PlatformWrapper"),
+                defaultChannelsFirst = False),
+}
+
+_PLATFORM_TARGETS: Dict[str, str] = {
+    "Apollo3": "CortexM",
+    "Apollo4": "CortexM",
+    "QEMU-ARM": "CortexM",
+    "Generic": "Generic",
+    "MemPool": "MemPool",
+    "SoftHier": "SoftHier",
+    "Siracusa": "PULPOpen",
+    "PULPOpen": "PULPOpen",
+    "Siracusa_w_neureka": "Neureka",
+    "Snitch": "Snitch",
+    "Chimera": "Chimera",
+    "GAP9": "GAP9",
+    "XDNA2": "XDNA2",
+}
 
 _SIGNPROP_PLATFORMS = ["Apollo3", "Apollo4", "QEMU-ARM", "Generic", "MemPool", "SoftHier"]
 _NONSIGNPROP_PLATFORMS = ["Siracusa", "Siracusa_w_neureka", "PULPOpen", "Snitch", "Chimera", "GAP9", "XDNA2"]
 _PLATFORMS = _SIGNPROP_PLATFORMS + _NONSIGNPROP_PLATFORMS
 
 
-def defaultScheduler(graph: gs.Graph):
-    return graph.nodes
+def _loadEntryPoint(entryPoint: str) -> Any:
+    moduleName, attribute = entryPoint.split(":")
+    return getattr(importlib.import_module(moduleName), attribute)
 
 
-def mapPlatform(platformName: str) -> Tuple[DeploymentPlatform, bool]:
+def _isInstance(obj: Any, entryPoints: Tuple[str, ...]) -> bool:
+    # Matches the class hierarchy by name, so checking against a target never imports it
+    return any(f"{cls.__module__}:{cls.__qualname__}" in entryPoints for cls in type(obj).__mro__)
 
-    assert platformName in _PLATFORMS,\
-        "Platform's signprop preference is unknown! Add it in platformMapping.py."
 
-    if platformName in _SIGNPROP_PLATFORMS:
-        signProp = True
-    else:
-        signProp = False
+def _neurekaMemoryPlatform(platform: DeploymentPlatform, memoryHierarchy: MemoryHierarchy,
+                           defaultTargetMemoryLevel: MemoryLevel) -> MemoryPlatformWrapper:
+    from Deeploy.Targets.Neureka.Platform import MemoryNeurekaPlatformWrapper
+    weightMemoryLevel = memoryHierarchy.memoryLevels["WeightMemory_SRAM"] \
+        if "WeightMemory_SRAM" in memoryHierarchy.memoryLevels else None
+    return MemoryNeurekaPlatformWrapper(platform, memoryHierarchy, defaultTargetMemoryLevel, weightMemoryLevel)
+
 
-    if platformName == "Apollo3" or platformName == "Apollo4" or platformName == "QEMU-ARM":
-        Platform = CMSISPlatform()
+def _memoryPlatformWrapper(entryPoint: str) -> Callable[..., MemoryPlatformWrapper]:
 
-    elif platformName == "MemPool":
-        Platform = MemPoolPlatform()
+    def factory(platform: DeploymentPlatform, memoryHierarchy: MemoryHierarchy,
+                defaultTargetMemoryLevel: MemoryLevel) -> MemoryPlatformWrapper:
+        return _loadEntryPoint(entryPoint)(platform, memoryHierarchy, defaultTargetMemoryLevel)
 
-    elif platformName == "Generic":
-        Platform = GenericPlatform()
+    return factory
 
-    elif platformName == "Siracusa" or platformName == "PULPOpen":
-        Platform = PULPPlatform()
 
-    elif platformName == "GAP9":
-        Platform = GAP9Platform()
+# Ordered by priority, the first matching platform class selects the wrapper
+_MEMORY_PLATFORM_WRAPPERS: List[Tuple[str, Callable[..., MemoryPlatformWrapper]]] = [
+    ("Deeploy.Targets.PULPOpen.Platform:PULPPlatform",
+     _memoryPlatformWrapper("Deeploy.Targets.PULPOpen.Platform:MemoryPULPPlatformWrapper")),
+    ("Deeploy.Targets.Neureka.Platform:NeurekaPlatform", _neurekaMemoryPlatform),
+    ("Deeploy.Targets.GAP9.Platform:GAP9Platform",
+     _memoryPlatformWrapper("Deeploy.Targets.GAP9.Platform:MemoryGAP9PlatformWrapper")),
+]
 
-    elif platformName == "Siracusa_w_neureka":
-        Platform = NeurekaPlatform()
 
-    elif platformName == "Snitch":
-        Platform = SnitchPlatform()
+def defaultScheduler(graph: gs.Graph):
+    return graph.nodes
 
-    elif platformName == "SoftHier":
-        Platform = SoftHierPlatform()
 
-    elif platformName == "Chimera":
-        Platform = ChimeraPlatform()
+def mapPlatform(platformName: str) -> Tuple[DeploymentPlatform, bool]:
 
-    elif platformName == "XDNA2":
-        from Deeploy.Targets.XDNA2.Platform import XDNA2Platform
-        Platform = XDNA2Platform()
+    assert platformName in _PLATFORMS,\
+        "Platform's signprop preference is unknown! Add it in platformMapping.py."
 
+    if platformName in _SIGNPROP_PLATFORMS:
+        signProp = True
     else:
+        signProp = False
+
+    if platformName not in _PLATFORM_TARGETS:
         raise RuntimeError(f"Deployment platform {platformName} is not implemented")
 
+    Platform = _loadEntryPoint(_TARGETS[_PLATFORM_TARGETS[platformName]].platform)()
+
     return Platform, signProp
 
 
 def setupMemoryPlatform(platform: DeploymentPlatform, memoryHierarchy: MemoryHierarchy,
                         defaultTargetMemoryLevel: MemoryLevel) -> Union[MemoryPlatform, MemoryPlatformWrapper]:
-    if isinstance(platform, PULPPlatform):
-        return MemoryPULPPlatformWrapper(platform, memoryHierarchy, defaultTargetMemoryLevel)
-    elif isinstance(platform, NeurekaPlatform):
-        weightMemoryLevel = memoryHierarchy.memoryLevels["WeightMemory_SRAM"] \
-            if "WeightMemory_SRAM" in memoryHierarchy.memoryLevels else None
-        return MemoryNeurekaPlatformWrapper(platform, memoryHierarchy, defaultTargetMemoryLevel, weightMemoryLevel)
-    if isinstance(platform, GAP9Platform):
-        return MemoryGAP9PlatformWrapper(platform, memoryHierarchy, defaultTargetMemoryLevel)
-    else:
-        return MemoryPlatformWrapper(platform, memoryHierarchy, defaultTargetMemoryLevel)
+    for platformClass, wrapper in _MEMORY_PLATFORM_WRAPPERS:
+        if _isInstance(platform, (platformClass,)):
+            return wrapper(platform, memoryHierarchy, defaultTargetMemoryLevel)
+    return MemoryPlatformWrapper(platform, memoryHierarchy, defaultTargetMemoryLevel)
 
 
 def mapDeployer(platform: DeploymentPlatform,
@@ -119,189 +210,28 @@ def mapDeployer(platform: DeploymentPlatform,
     if name is None:
         name = "DeeployNetwork"
 
-    if isinstance(platform, CMSISPlatform):
-
-        if loweringOptimizer is None:
-            loweringOptimizer = CMSISOptimizer
-
-        if default_channels_first is None:
-            default_channels_first = False
-
-        deployer = CMSISDeployer(graph,
-                                 platform,
-                                 inputTypes,
-                                 loweringOptimizer,
-                                 scheduler,
-                                 name = name,
-                                 default_channels_first = default_channels_first,
-                                 deeployStateDir = deeployStateDir,
-                                 inputOffsets = inputOffsets)
-
-    elif isinstance(platform, MemPoolPlatform):
-
-        if loweringOptimizer is None:
-            loweringOptimizer = MemPoolOptimizer
-
-        if default_channels_first is None:
-            default_channels_first = True
-
-        deployer = MemPoolDeployer(graph,
-                                   platform,
-                                   inputTypes,
-                                   loweringOptimizer,
-                                   scheduler,
-                                   name = name,
-                                   default_channels_first = default_channels_first,
-                                   deeployStateDir = deeployStateDir,
-                                   inputOffsets = inputOffsets)
-
-    elif isinstance(platform, SoftHierPlatform):
-
-        if loweringOptimizer is None:
-            loweringOptimizer = SoftHierOptimizer
-
-        if default_channels_first is None:
-            default_channels_first = True
-
-        deployer = SoftHierDeployer(graph,
-                                    platform,
-                                    inputTypes,
-                                    loweringOptimizer,
-                                    scheduler,
-                                    name = name,
-                                    default_channels_first = default_channels_first,
-                                    deeployStateDir = deeployStateDir,
-                                    inputOffsets = inputOffsets)
-
-    elif isinstance(platform, GenericPlatform):
-        # WIESEP: CMSIS performs add-multiply-divide and we normally do multiply-add-divide
-        #         Because these deployer were fine-tuned with a add-multiply-divide aware deployer can emulate this
-        #         behavior with the EmulateCMSISRequantPass
-
-        if loweringOptimizer is None:
-            loweringOptimizer = GenericOptimizer
-
-        if default_channels_first is None:
-            default_channels_first = True
-
-        deployer = GenericDeployer(graph,
-                                   platform,
-                                   inputTypes,
-                                   loweringOptimizer,
-                                   scheduler,
-                                   name = name,
-                                   default_channels_first = default_channels_first,
-                                   deeployStateDir = deeployStateDir,
-                                   inputOffsets = inputOffsets)
-
-    elif isinstance(platform, (NeurekaPlatform, MemoryNeurekaPlatform, MemoryNeurekaPlatformWrapper)):
-
-        if loweringOptimizer is None:
-            loweringOptimizer = NeurekaOptimizer
-
-        if default_channels_first is None:
-            default_channels_first = False
-
-        deployer = NeurekaDeployer(graph,
-                                   platform,
-                                   inputTypes,
-                                   loweringOptimizer,
-                                   scheduler,
-                                   name = name,
-                                   default_channels_first = default_channels_first,
-                                   deeployStateDir = deeployStateDir)
-
-    elif isinstance(platform, (GAP9Platform, MemoryGAP9Platform, MemoryGAP9PlatformWrapper)):
-
-        if loweringOptimizer is None:
-            loweringOptimizer = PULPOptimizer
-
-        if default_channels_first is None:
-            default_channels_first = False
-
-        deployer = GAP9Deployer(graph,
-                                platform,
-                                inputTypes,
-                                loweringOptimizer,
-                                scheduler,
-                                name = name,
-                                default_channels_first = default_channels_first,
-                                deeployStateDir = deeployStateDir)
-
-    elif isinstance(platform, (PULPPlatform, MemoryPULPPlatform, MemoryPULPPlatformWrapper)):
-
-        if loweringOptimizer is None:
-            loweringOptimizer = PULPOptimizer
-
-        if default_channels_first is None:
-            default_channels_first = False
-
-        deployer = PULPDeployer(graph,
-                                platform,
-                                inputTypes,
-                                loweringOptimizer,
-                                scheduler,
-                                name = name,
-                                default_channels_first = default_channels_first,
-                                deeployStateDir = deeployStateDir)
-
-    elif isinstance(platform, (SnitchPlatform)):
-        if loweringOptimizer is None:
-            loweringOptimizer = SnitchOptimizer
-
-        if default_channels_first is None:
-            default_channels_first = False
-
-        deployer = SnitchDeployer(graph,
-                                  platform,
-                                  inputTypes,
-                                  loweringOptimizer,
-                                  scheduler,
-                                  name = name,
-                                  default_channels_first = default_channels_first,
-                                  deeployStateDir = deeployStateDir)
-
-    elif isinstance(platform, (ChimeraPlatform)):
-        if loweringOptimizer is None:
-            loweringOptimizer = ChimeraOptimizer
-
-        if default_channels_first is None:
-            default_channels_first = False
-
-        deployer = ChimeraDeployer(graph,
-                                   platform,
-                                   inputTypes,
-                                   loweringOptimizer,
-                                   scheduler,
-                                   name = name,
-                                   default_channels_first = default_channels_first,
-                                   deeployStateDir = deeployStateDir)
-
-    else:
-        # Lazy-import XDNA2 to avoid requiring mlir-aie on non-XDNA2 platforms
-        try:
-            from Deeploy.Targets.XDNA2.Deployer import XDNA2Deployer
-            from Deeploy.Targets.XDNA2.Platform import MemoryXDNA2Platform, MemoryXDNA2PlatformWrapper, \
-                XDNA2Optimizer, XDNA2Platform
-        except ImportError:
-            raise RuntimeError(f"Deployer for platform {platform} is not implemented")
-
-        if not isinstance(platform, (XDNA2Platform, MemoryXDNA2Platform, MemoryXDNA2PlatformWrapper)):
-            raise RuntimeError(f"Deployer for platform {platform} is not implemented")
-
-        if loweringOptimizer is None:
-            loweringOptimizer = XDNA2Optimizer
-
-        if default_channels_first is None:
-            default_channels_first = False
-
-        deployer = XDNA2Deployer(graph,
-                                 platform,
-                                 inputTypes,
-                                 loweringOptimizer,
-                                 scheduler,
-                                 name = name,
-                                 default_channels_first = default_channels_first,
-                                 deeployStateDir = deeployStateDir)
+    target = next((target for target in _TARGETS.values() if _isInstance(platform, target.platformClasses)), None)
+    if target is None:
+        raise RuntimeError(f"Deployer for platform {platform} is not implemented")
+
+    if loweringOptimizer is None:
+        loweringOptimizer = _loadEntryPoint(target.optimizer)
+
+    if default_channels_first is None:
+        default_channels_first = target.defaultChannelsFirst
+
+    kwargs = {}
+    if target.forwardInputOffsets:
+        kwargs['inputOffsets'] = inputOffsets
+
+    deployer = _loadEntryPoint(target.deployer)(graph,
+                                                platform,
+                                                inputTypes,
+                                                loweringOptimizer,
+                                                scheduler,
+                                                name = name,
+                                                default_channels_first = default_channels_first,
+                                                deeployStateDir = deeployStateDir,
+                                                **kwargs)
 
     return deployer
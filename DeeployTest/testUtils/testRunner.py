@@ -91,6 +91,26 @@ class TestGeneratorArgumentParser(argparse.ArgumentParser):
                           default = './TestFiles',
                           help = 'Set the output dump folder\n')
         self.add_argument('-v', action = 'count', dest = 'verbose', default = 0, help = 'Increase verbosity level\n')
+        self.add_argument('--deeployState',
+                          metavar = '<mode>',
+                          dest = 'deeployState',
+                          type = str,
+                          choices = ["off", "final", "all"],
+                          default = "all",
+                          help = 'Select which intermediate DeeployState snapshots are exported\n')
+        self.add_argument('--compactDeeployState',
+                          action = 'store_true',
+                          help = 'Store DeeployState constants once in a content-addressed blob store\n')
+        self.add_argument('--asyncDeeployState',
+                          action = 'store_true',
+                          help = 'Write DeeployState snapshots from a background thread\n')
+        self.add_argument('--profileCompiler',
+                          action = 'store_true',
+                          help = 'Export wall time and peak memory of the compiler stages to the output dump folder\n')
+        self.add_argument('--compilationCache',
+                          action = 'store_true',
+                          help = 'Cache the compilation in the output dump folder and only regenerate the constants '
+                          'if only the weights of the network changed\n')
 
         # Tiling-related arguments (for XDNA2 and other tiled platforms)
         if self.tiling_arguments:
@@ -218,6 +238,24 @@ class TestRunnerArgumentParser(argparse.ArgumentParser):
                               default = "L2",
                               help = 'Set default memory level\n')
             self.add_argument('--doublebuffer', action = 'store_true', help = 'Enable double buffering\n')
+            self.add_argument('--crossLayerPrefetch',
+                              action = 'store_true',
+                              help = 'Prefetch the first input tiles of the next layer (requires double buffering)\n')
+            self.add_argument('--persistentCluster',
+                              action = 'store_true',
+                              help = 'Fork the cluster once per inference instead of once per layer\n')
+            self.add_argument('--dmaCore',
+                              action = 'store_true',
+                              help = 'Dedicate a cluster core to the DMA while the other cores compute\n')
+            self.add_argument('--tileSpecializations',
+                              metavar = '<count>',
+                              dest = 'tileSpecializations',
+                              type = int,
+                              default = 0,
+                              help = 'Maximum number of tile variants per layer whose kernel call gets literals\n')
+            self.add_argument('--hoistArgumentStructs',
+                              action = 'store_true',
+                              help = 'Build the argument structs of a tiling loop once before the loop\n')
             self.add_argument('--l1',
                               metavar = '<size>',
                               dest = 'l1',
@@ -289,6 +327,16 @@ class TestRunnerArgumentParser(argparse.ArgumentParser):
                 command += f" --defaultMemLevel={self.args.defaultMemLevel}"
             if self.args.doublebuffer:
                 command += " --doublebuffer"
+            if self.args.crossLayerPrefetch:
+                command += " --crossLayerPrefetch"
+            if self.args.persistentCluster:
+                command += " --persistentCluster"
+            if self.args.dmaCore:
+                command += " --dmaCore"
+            if self.args.tileSpecializations:
+                command += f" --tileSpecializations={self.args.tileSpecializations}"
+            if self.args.hoistArgumentStructs:
+                command += " --hoistArgumentStructs"
             if self.args.l1:
                 command += f" --l1={self.args.l1}"
             if self.args.l2:
@@ -0,0 +1,92 @@
+# SPDX-FileCopyrightText: 2025 ETH Zurich and University of Bologna
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import shutil
+import tempfile
+from typing import Sequence
+
+import numpy as np
+import onnx
+from onnx import numpy_helper
+from testUtils.deployUtils import deployNetwork, readNetwork
+
+_testDir = "Tests/Models/CNN_Linear2"
+_deployArgs = ["-p", "Siracusa", "--defaultMemLevel=L2", "--l1=64000", "--l2=512000", "--memAllocStrategy=TetrisRandom"]
+
+
+def _deploy(testDir: str, dumpdir: str, compilationCache: bool, extraArgs: Sequence[str] = ()) -> str:
+    args = [*_deployArgs, *extraArgs, "-v"]
+    if compilationCache:
+        args.append("--compilationCache")
+    return deployNetwork(testDir, dumpdir, args)
+
+
+def _perturbWeights(dstDir: str) -> str:
+    # Same network with different values of the weights of one convolution
+    shutil.copytree(_testDir, dstDir)
+    model = onnx.load_model(os.path.join(dstDir, "network.onnx"))
+    for initializer in model.graph.initializer:
+        if initializer.name.endswith("PASS_2.weight"):
+            values = numpy_helper.to_array(initializer)
+            initializer.CopyFrom(numpy_helper.from_array(np.clip(values + np.sign(values), -7, 7), initializer.name))
+    onnx.save_model(model, os.path.join(dstDir, "network.onnx"))
+    return dstDir
+
+
+def _read(path: str) -> str:
+    with open(path) as f:
+        return f.read()
+
+
+def testWeightsRecompilation():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cachedDir, referenceDir = os.path.join(tmpdir, "cached"), os.path.join(tmpdir, "reference")
+        plainDir = os.path.join(tmpdir, "plain")
+        perturbedDir = _perturbWeights(os.path.join(tmpdir, "perturbed"))
+
+        output = _deploy(_testDir, cachedDir, compilationCache = True)
+        assert "No cached compilation found" in output
+        network = readNetwork(cachedDir, canonical = False)
+
+        output = _deploy(perturbedDir, cachedDir, compilationCache = True)
+        assert "Reuse cached compilation, updated 1 constants" in output, "The cached compilation was not reused!"
+        assert readNetwork(cachedDir, canonical = False) == network, "The network code was regenerated!"
+
+        # A full compilation into an empty cache
+        _deploy(perturbedDir, referenceDir, compilationCache = True)
+        for fileName in ["NetworkConstants.h", "testinputs.h", "testoutputs.h"]:
+            assert _read(os.path.join(cachedDir, fileName)) == _read(os.path.join(referenceDir, fileName)), \
+                f"{fileName} of the reused compilation differs from a full compilation!"
+
+        # Without a compilation cache, the constants stay in Network.c
+        _deploy(_testDir, plainDir, compilationCache = False)
+        assert not os.path.exists(os.path.join(plainDir, "NetworkConstants.h"))
+        assert "NetworkConstants.h" not in readNetwork(plainDir, canonical = False)
+
+        # A different network must not reuse the cache
+        output = _deploy("Tests/Models/CNN_Linear1", cachedDir, compilationCache = True)
+        assert "The structure of the graph or the deployment options changed" in output, \
+            "The cached compilation of another graph was reused!"
+    return True
+
+
+def testOptionsInvalidateCache():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        _deploy(_testDir, tmpdir, compilationCache = True)
+
+        # Deployment options change the network code, a compilation with other options must not be reused
+        for extraArgs in [["--doublebuffer", "--cores", "4"], ["--tileSpecializations", "2"]]:
+            output = _deploy(_testDir, tmpdir, compilationCache = True, extraArgs = extraArgs)
+            assert "The structure of the graph or the deployment options changed" in output, \
+                f"The cached compilation was reused with {extraArgs}!"
+
+        output = _deploy(_testDir, tmpdir, compilationCache = True, extraArgs = ["--tileSpecializations", "2"])
+        assert "Reuse cached compilation" in output, "The cached compilation with the same options was not reused!"
+    return True
+
+
+if __name__ == "__main__":
+    testWeightsRecompilation()
+    testOptionsInvalidateCache()
@@ -2,6 +2,7 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import shutil
 import subprocess
 from pathlib import Path
 
@@ -30,6 +31,27 @@ def test_deeploy_state_serialization(platform):
                                     f"stderr: {result.stderr}")
 
 
+@pytest.mark.parametrize("platform", ["Siracusa", "Generic"])
+def test_deeploy_state_compact_serialization(platform):
+    """Test that compact Deeploy states written in the background can be deserialized correctly."""
+    script_dir = Path(__file__).parent
+    cmd = [
+        "python",
+        str(script_dir / "deeployStateEqualityTest.py"),
+        "-t",
+        "./Tests/Models/CNN_Linear2",
+        "-p",
+        platform,
+        "--compactDeeployState",
+        "--asyncDeeployState",
+    ]
+    result = subprocess.run(cmd, cwd = script_dir, capture_output = True, text = True)
+
+    assert result.returncode == 0, (f"Compact state serialization test failed for platform {platform}\n"
+                                    f"stdout: {result.stdout}\n"
+                                    f"stderr: {result.stderr}")
+
+
 @pytest.mark.parametrize("platform", ["QEMU-ARM", "Siracusa", "MemPool", "Generic"])
 def test_memory_level_extension(platform):
     """Test memory level extension functionality."""
@@ -234,6 +256,124 @@ def test_types():
                                     f"stderr: {result.stderr}")
 
 
+def test_packed_tiling():
+    """Test tiling of packed sub-byte tensors (byte-aligned tiles, byte offsets)."""
+    script_dir = Path(__file__).parent
+    cmd = [
+        "python",
+        str(script_dir / "testPackedTiling.py"),
+    ]
+    result = subprocess.run(cmd, cwd = script_dir, capture_output = True, text = True)
+
+    assert result.returncode == 0, (f"Packed tiling test failed\n"
+                                    f"stdout: {result.stdout}\n"
+                                    f"stderr: {result.stderr}")
+
+
+def test_l3_compression():
+    """Test in-place decompression of the compressed tiles of L3 constants."""
+    script_dir = Path(__file__).parent
+    cmd = [
+        "python",
+        str(script_dir / "testL3Compression.py"),
+    ]
+    result = subprocess.run(cmd, cwd = script_dir, capture_output = True, text = True)
+
+    assert result.returncode == 0, (f"L3 compression test failed\n"
+                                    f"stdout: {result.stdout}\n"
+                                    f"stderr: {result.stderr}")
+
+
+def test_template_cache():
+    """Test lazy compilation and on-disk caching of node templates."""
+    script_dir = Path(__file__).parent
+    cmd = [
+        "python",
+        str(script_dir / "testTemplateCache.py"),
+    ]
+    result = subprocess.run(cmd, cwd = script_dir, capture_output = True, text = True)
+
+    assert result.returncode == 0, (f"Template cache test failed\n"
+                                    f"stdout: {result.stdout}\n"
+                                    f"stderr: {result.stderr}")
+
+
+def test_platform_mapping():
+    """Test the lazy platform registry and benchmark its import time."""
+    script_dir = Path(__file__).parent
+    cmd = [
+        "python",
+        str(script_dir / "testPlatformMapping.py"),
+    ]
+    result = subprocess.run(cmd, cwd = script_dir, capture_output = True, text = True)
+
+    assert result.returncode == 0, (f"Platform mapping test failed\n"
+                                    f"stdout: {result.stdout}\n"
+                                    f"stderr: {result.stderr}")
+
+
+@pytest.mark.parametrize("platform", ["Generic", "Siracusa"])
+def test_binary_constants(platform):
+    """Test code generation with constants and test vectors linked from binary blobs."""
+    script_dir = Path(__file__).parent
+    cmd = [
+        "python",
+        str(script_dir / "generateNetwork.py"),
+        "-t",
+        "./Tests/Models/CNN_Linear2",
+        "-p",
+        platform,
+        "--binaryConstants",
+    ]
+    result = subprocess.run(cmd, cwd = script_dir, capture_output = True, text = True)
+
+    assert result.returncode == 0, (f"Binary constant emission test failed for platform {platform}\n"
+                                    f"stdout: {result.stdout}\n"
+                                    f"stderr: {result.stderr}")
+
+
+@pytest.mark.skipif(shutil.which("gcc") is None, reason = "Requires a host gcc")
+def test_binary_constants_include_path(tmp_path):
+    """Test that binary blobs are found through the include path, independent of the build directory."""
+    script_dir = Path(__file__).parent
+    dumpdir = tmp_path / "generated"
+    cmd = [
+        "python",
+        str(script_dir / "generateNetwork.py"),
+        "-t",
+        "./Tests/Models/CNN_Linear2",
+        "-p",
+        "Generic",
+        "-d",
+        str(dumpdir),
+        "--binaryConstants",
+    ]
+    result = subprocess.run(cmd, cwd = script_dir, capture_output = True, text = True)
+    assert result.returncode == 0, (f"Binary constant emission failed\n"
+                                    f"stdout: {result.stdout}\n"
+                                    f"stderr: {result.stderr}")
+
+    network = (dumpdir / "Network.c").read_text()
+    assert str(dumpdir) not in network, "Blobs should be referenced relative to the generated sources!"
+    assert ".global" not in network, "Blobs of static constants should keep their labels local!"
+
+    cmd = [
+        "gcc",
+        "-c",
+        str(dumpdir / "Network.c"),
+        "-I",
+        str(dumpdir),
+        "-I",
+        str(script_dir.parent / "TargetLibraries" / "Generic" / "inc"),
+        "-o",
+        str(tmp_path / "Network.o"),
+    ]
+    result = subprocess.run(cmd, cwd = tmp_path, capture_output = True, text = True)
+    assert result.returncode == 0, (f"Compiling the network with binary blobs failed\n"
+                                    f"stdout: {result.stdout}\n"
+                                    f"stderr: {result.stderr}")
+
+
 class TestDebugTransformations:
     """Test debug and diagnostic transformations."""
 
@@ -287,6 +427,235 @@ def test_regex_matching():
                                     f"stderr: {result.stderr}")
 
 
+def test_subgraph_matching():
+    """Test that the op-type indexed subgraph matcher finds the same matches as exhaustive matching."""
+    script_dir = Path(__file__).parent
+    cmd = [
+        "python",
+        str(script_dir / "testSubgraphMatching.py"),
+    ]
+    result = subprocess.run(cmd, cwd = script_dir, capture_output = True, text = True)
+
+    assert result.returncode == 0, (f"Subgraph matching test failed\n"
+                                    f"stdout: {result.stdout}\n"
+                                    f"stderr: {result.stderr}")
+
+
+def test_graph_maintenance():
+    """Test the incremental graph maintenance and the fixpoint topology optimizer."""
+    script_dir = Path(__file__).parent
+    cmd = [
+        "python",
+        str(script_dir / "testGraphMaintenance.py"),
+    ]
+    result = subprocess.run(cmd, cwd = script_dir, capture_output = True, text = True)
+
+    assert result.returncode == 0, (f"Graph maintenance test failed\n"
+                                    f"stdout: {result.stdout}\n"
+                                    f"stderr: {result.stderr}")
+
+
+def test_compiler_profiling():
+    """Test the compiler stage profiling report and Chrome trace."""
+    script_dir = Path(__file__).parent
+    cmd = [
+        "python",
+        str(script_dir / "testCompilerProfiling.py"),
+    ]
+    result = subprocess.run(cmd, cwd = script_dir, capture_output = True, text = True)
+
+    assert result.returncode == 0, (f"Compiler profiling test failed\n"
+                                    f"stdout: {result.stdout}\n"
+                                    f"stderr: {result.stderr}")
+
+
+def test_weights_recompilation():
+    """Test that a cached compilation is reused if only the weights change."""
+    script_dir = Path(__file__).parent
+    cmd = [
+        "python",
+        str(script_dir / "testWeightsRecompilation.py"),
+    ]
+    result = subprocess.run(cmd, cwd = script_dir, capture_output = True, text = True)
+
+    assert result.returncode == 0, (f"Weights recompilation test failed\n"
+                                    f"stdout: {result.stdout}\n"
+                                    f"stderr: {result.stderr}")
+
+
+def test_template_analysis():
+    """Test the template analysis cache of the introspective code transformations."""
+    script_dir = Path(__file__).parent
+    cmd = [
+        "python",
+        str(script_dir / "testTemplateAnalysis.py"),
+    ]
+    result = subprocess.run(cmd, cwd = script_dir, capture_output = True, text = True)
+
+    assert result.returncode == 0, (f"Template analysis test failed\n"
+                                    f"stdout: {result.stdout}\n"
+                                    f"stderr: {result.stderr}")
+
+
+def test_l3_async_dma():
+    """Test the future lifetimes of the asynchronous L3 tiling code."""
+    script_dir = Path(__file__).parent
+    cmd = [
+        "python",
+        str(script_dir / "testL3AsyncDma.py"),
+    ]
+    result = subprocess.run(cmd, cwd = script_dir, capture_output = True, text = True)
+
+    assert result.returncode == 0, (f"L3 async DMA test failed\n"
+                                    f"stdout: {result.stdout}\n"
+                                    f"stderr: {result.stderr}")
+
+
+def test_cross_layer_prefetch():
+    """Test the handover of the first input tiles prefetched by the previous layer."""
+    script_dir = Path(__file__).parent
+    cmd = [
+        "python",
+        str(script_dir / "testCrossLayerPrefetch.py"),
+    ]
+    result = subprocess.run(cmd, cwd = script_dir, capture_output = True, text = True)
+
+    assert result.returncode == 0, (f"Cross-layer prefetch test failed\n"
+                                    f"stdout: {result.stdout}\n"
+                                    f"stderr: {result.stderr}")
+
+
+def test_persistent_cluster():
+    """Test that the layers are dispatched to a single persistent cluster team."""
+    script_dir = Path(__file__).parent
+    cmd = [
+        "python",
+        str(script_dir / "testPersistentCluster.py"),
+    ]
+    result = subprocess.run(cmd, cwd = script_dir, capture_output = True, text = True)
+
+    assert result.returncode == 0, (f"Persistent cluster test failed\n"
+                                    f"stdout: {result.stdout}\n"
+                                    f"stderr: {result.stderr}")
+
+
+def test_snitch_dma():
+    """Test that Snitch DMA transfers are batched per tile and resolved by transaction ID."""
+    script_dir = Path(__file__).parent
+    cmd = [
+        "python",
+        str(script_dir / "testSnitchDma.py"),
+    ]
+    result = subprocess.run(cmd, cwd = script_dir, capture_output = True, text = True)
+
+    assert result.returncode == 0, (f"Snitch DMA test failed\n"
+                                    f"stdout: {result.stdout}\n"
+                                    f"stderr: {result.stderr}")
+
+
+def test_dma_descriptors():
+    """Test that higher-rank transfers are lowered to descriptor transfers by their issue cost."""
+    script_dir = Path(__file__).parent
+    cmd = [
+        "python",
+        str(script_dir / "testDmaDescriptors.py"),
+    ]
+    result = subprocess.run(cmd, cwd = script_dir, capture_output = True, text = True)
+
+    assert result.returncode == 0, (f"DMA descriptor test failed\n"
+                                    f"stdout: {result.stdout}\n"
+                                    f"stderr: {result.stderr}")
+
+
+def test_dma_scheduling():
+    """Test that transfers are issued largest first over multiple DMA channels."""
+    script_dir = Path(__file__).parent
+    cmd = [
+        "python",
+        str(script_dir / "testDmaScheduling.py"),
+    ]
+    result = subprocess.run(cmd, cwd = script_dir, capture_output = True, text = True)
+
+    assert result.returncode == 0, (f"DMA scheduling test failed\n"
+                                    f"stdout: {result.stdout}\n"
+                                    f"stderr: {result.stderr}")
+
+
+def test_closure_args():
+    """Test that the closure arguments of tiled layers are built once and only updated per tile."""
+    script_dir = Path(__file__).parent
+    cmd = [
+        "python",
+        str(script_dir / "testClosureArgs.py"),
+    ]
+    result = subprocess.run(cmd, cwd = script_dir, capture_output = True, text = True)
+
+    assert result.returncode == 0, (f"Closure argument test failed\n"
+                                    f"stdout: {result.stdout}\n"
+                                    f"stderr: {result.stderr}")
+
+
+def test_tile_specialization():
+    """Test that the kernel calls of the most common tiles are specialized with literal arguments."""
+    script_dir = Path(__file__).parent
+    cmd = [
+        "python",
+        str(script_dir / "testTileSpecialization.py"),
+    ]
+    result = subprocess.run(cmd, cwd = script_dir, capture_output = True, text = True)
+
+    assert result.returncode == 0, (f"Tile specialization test failed\n"
+                                    f"stdout: {result.stdout}\n"
+                                    f"stderr: {result.stderr}")
+
+
+def test_dma_core():
+    """Test that a dedicated DMA core overlaps the tile transfers with the kernels of the compute cores."""
+    script_dir = Path(__file__).parent
+    cmd = [
+        "python",
+        str(script_dir / "testDmaCore.py"),
+    ]
+    result = subprocess.run(cmd, cwd = script_dir, capture_output = True, text = True)
+
+    assert result.returncode == 0, (f"DMA core test failed\n"
+                                    f"stdout: {result.stdout}\n"
+                                    f"stderr: {result.stderr}")
+
+
+def test_constant_deduplication():
+    """Test that identical constants are merged and only the references of their consumers are renamed."""
+    script_dir = Path(__file__).parent
+    cmd = [
+        "python",
+        str(script_dir / "testConstantDeduplication.py"),
+    ]
+    result = subprocess.run(cmd, cwd = script_dir, capture_output = True, text = True)
+
+    assert result.returncode == 0, (f"Constant deduplication test failed\n"
+                                    f"stdout: {result.stdout}\n"
+                                    f"stderr: {result.stderr}")
+
+
+@pytest.mark.parametrize("script", [
+    "testMVP.py", "generateNetwork.py", "deeployRunner_generic.py", "deeployRunner_siracusa.py",
+    "deeployRunner_tiled_siracusa.py"
+])
+def test_help(script):
+    """Test that the help of the deployment scripts can be printed."""
+    script_dir = Path(__file__).parent
+    cmd = [
+        "python",
+        str(script_dir / script),
+        "--help",
+    ]
+    result = subprocess.run(cmd, cwd = script_dir, capture_output = True, text = True)
+
+    assert result.returncode == 0, (f"Help of {script} failed\n"
+                                    f"stdout: {result.stdout}\n"
+                                    f"stderr: {result.stderr}")
+
+
 class TestTypeInference:
     """Test type inference functionality with different input type configurations."""
 
@@ -3,15 +3,20 @@
 # SPDX-License-Identifier: Apache-2.0
 """DMA test suite for Siracusa and Snitch platforms.
 
-Tests three DMA implementations across various tensor shapes and configurations:
+Tests four DMA implementations across various tensor shapes and configurations:
 - MchanDma: Siracusa L2→L1 DMA transfers
-- L3Dma: Siracusa L3→L2 DMA transfers
+- L3Dma: Siracusa L3→L2 DMA transfers, blocking
+- L3AsyncDma: Siracusa L3→L2 DMA transfers, asynchronous with request pools
 - SnitchDma: Snitch L2→L1 DMA transfers
 
-Total test matrix: 3 DMAs × 10 shapes × 2 buffering modes = 60 tests
+Total test matrix: 4 DMAs × 10 shapes × 2 buffering modes = 80 tests
+
+Additionally, the code generated for transfers around the maximum transfer size of mchan is checked without
+building, since transfers above the maximum transfer size are split into several transfers.
 """
 
 import os
+import re
 from pathlib import Path
 
 import numpy as np
@@ -25,13 +30,15 @@ from testUtils.typeMapping import baseTypeFromName, dtypeFromDeeployType
 from Deeploy.AbstractDataTypes import PointerClass
 from Deeploy.CommonExtensions.CodeTransformationPasses.MemoryAllocation import ArgumentStructGeneration, \
     MemoryManagementGeneration
-from Deeploy.DeeployTypes import CodeTransformation, NodeBinding, NodeMapper, _NoVerbosity
+from Deeploy.DeeployTypes import CodeTransformation, ConstantBuffer, NetworkContext, NodeBinding, NodeMapper, \
+    StructBuffer, TransientBuffer, VariableBuffer, _NoVerbosity
+from Deeploy.Targets.GAP9.DMA.MchanDma import GAP9MchanDma
 from Deeploy.Targets.PULPOpen.Bindings import L3MemoryAwareFunctionCallClosure
 from Deeploy.Targets.PULPOpen.Bindings import MemoryAwareFunctionCallClosure as PULPMemoryAwareFunctionCallClosure
 from Deeploy.Targets.PULPOpen.Bindings import TilingCallClosure as PULPTilingCallClosure
 from Deeploy.Targets.PULPOpen.CodeTransformationPasses.PULPClusterTiling import PULPClusterTiling
 from Deeploy.Targets.PULPOpen.CodeTransformationPasses.PULPL3Tiling import PULPL3Tiling
-from Deeploy.Targets.PULPOpen.DMA.L3Dma import L3Dma, l3DmaHack
+from Deeploy.Targets.PULPOpen.DMA.L3Dma import L3AsyncDma, l3DmaHack
 from Deeploy.Targets.PULPOpen.DMA.MchanDma import MchanDma
 from Deeploy.Targets.Snitch.Bindings import MemoryAwareFunctionCallClosure, TilingCallClosure
 from Deeploy.Targets.Snitch.CodeTransformationPasses import SnitchClusterTiling
@@ -39,9 +46,11 @@ from Deeploy.Targets.Snitch.CodeTransformationPasses.SnitchClusterSynch import S
 from Deeploy.Targets.Snitch.CodeTransformationPasses.SnitchCoreFilter import SnitchCoreFilterPass
 from Deeploy.Targets.Snitch.CodeTransformationPasses.SnitchProfileExecutionBlock import SnitchProfileExecutionBlockPass
 from Deeploy.Targets.Snitch.DMA.SnitchDma import SnitchDma
+from Deeploy.TilingExtension.AsyncDma import AnydimAsyncDmaTransferAdapter
 from Deeploy.TilingExtension.CodeTransformationPasses.TilingVariableReplacement import TilingVariableReplacement, \
     TilingVariableReplacementUpdate
 from Deeploy.TilingExtension.TilerExtension import TilingReadyNodeBindings
+from Deeploy.TilingExtension.TilingCodegen import stridesFromShape
 
 
 @pytest.fixture(autouse = True)
@@ -113,7 +122,7 @@ def setup_dma_deployer(dma_type: str, input_shape: tuple, tile_shape: tuple, nod
     Set up deployer for DMA testing with custom tiling.
 
     Args:
-        dma_type: DMA implementation ("MchanDma", "L3Dma", "SnitchDma")
+        dma_type: DMA implementation ("MchanDma", "L3Dma", "L3AsyncDma", "SnitchDma")
         input_shape: Tensor shape to copy
         tile_shape: Tiling dimensions
         node_count: Number of memcpy nodes
@@ -141,7 +150,11 @@ def setup_dma_deployer(dma_type: str, input_shape: tuple, tile_shape: tuple, nod
     elif dma_type == "L3Dma":
         defaultMemory = "L3"
         targetMemory = "L2"
-        dma_obj = L3Dma()
+        dma_obj = l3DmaHack
+    elif dma_type == "L3AsyncDma":
+        defaultMemory = "L3"
+        targetMemory = "L2"
+        dma_obj = L3AsyncDma()
     elif dma_type == "SnitchDma":
         defaultMemory = "L2"
         targetMemory = "L1"
@@ -175,13 +188,13 @@ def setup_dma_deployer(dma_type: str, input_shape: tuple, tile_shape: tuple, nod
             MemoryManagementGeneration(defaultMemory),
             MemoryManagementGeneration(),
         ])
-    elif dma_type == "L3Dma":
+    elif dma_type in ("L3Dma", "L3AsyncDma"):
         # L3Dma uses PULPL3Tiling and L3MemoryAwareFunctionCallClosure
         transformer = CodeTransformation([
             TilingVariableReplacement(targetMemory),
             PULPTilingCallClosure(writeback = False, generateStruct = True),
             TilingVariableReplacementUpdate(targetMemory),
-            PULPL3Tiling("L3", "L2", l3DmaHack),
+            PULPL3Tiling("L3", "L2", dma_obj),
             ArgumentStructGeneration(),
             L3MemoryAwareFunctionCallClosure(writeback = False),
             MemoryManagementGeneration("L2"),
@@ -275,19 +288,20 @@ def test_mchan_dma(test_shape, doublebuffer, deeploy_test_dir, toolchain, toolch
 @pytest.mark.deeploy_internal
 @pytest.mark.parametrize("test_shape", DMA_TEST_SHAPES, ids = param_id_dma)
 @pytest.mark.parametrize("doublebuffer", [True, False], ids = param_id_dma)
-def test_l3_dma(test_shape, doublebuffer, deeploy_test_dir, toolchain, toolchain_dir, cmake_args, skipgen,
+@pytest.mark.parametrize("dma_type", ["L3Dma", "L3AsyncDma"])
+def test_l3_dma(test_shape, doublebuffer, dma_type, deeploy_test_dir, toolchain, toolchain_dir, cmake_args, skipgen,
                 skipsim) -> None:
-    """Test L3Dma (Siracusa L3→L2 DMA transfers)."""
+    """Test L3Dma (Siracusa L3→L2 DMA transfers), blocking and asynchronous."""
     input_shape, tile_shape, node_count, data_type = test_shape
 
     # Setup paths
-    test_name = f"testL3Dma_{param_id_dma(test_shape)}_{param_id_dma(doublebuffer)}"
+    test_name = f"test{dma_type}_{param_id_dma(test_shape)}_{param_id_dma(doublebuffer)}"
     platform = "Siracusa"
     gen_dir, _, test_name_clean = get_test_paths(f"test_dma_gen/{test_name}", platform, base_dir = deeploy_test_dir)
 
     # Generate network
     if not skipgen:
-        deployer, test_inputs, test_outputs = setup_dma_deployer("L3Dma", input_shape, tile_shape, node_count,
+        deployer, test_inputs, test_outputs = setup_dma_deployer(dma_type, input_shape, tile_shape, node_count,
                                                                  data_type, doublebuffer, gen_dir)
         generateTestNetwork(deployer, [test_inputs], [test_outputs], gen_dir, _NoVerbosity)
 
@@ -318,7 +332,7 @@ def test_l3_dma(test_shape, doublebuffer, deeploy_test_dir, toolchain, toolchain
     if not skipsim:
         from testUtils.pytestRunner import run_simulation
         result = run_simulation(config)
-        assert result.success, f"L3Dma test failed with {result.error_count} errors"
+        assert result.success, f"{dma_type} test failed with {result.error_count} errors"
         assert result.error_count == 0, f"Found {result.error_count} errors"
 
 
@@ -370,3 +384,111 @@ def test_snitch_dma(test_shape, doublebuffer, deeploy_test_dir, toolchain, toolc
         result = run_simulation(config)
         assert result.success, f"SnitchDma test failed with {result.error_count} errors"
         assert result.error_count == 0, f"Found {result.error_count} errors"
+
+
+# Transfer shapes in bytes around the maximum transfer size of mchan (2^17 - 1 bytes per command):
+# (transfer_shape, expected split as (number of chunks, remainder rows) or None if not split)
+MCHAN_DMA_SPLIT_TEST_SHAPES = [
+    ((131071,), None),
+    ((131072,), (1, 8)),
+    ((300000,), (2, 37872)),
+    ((2, 65535), None),
+    ((2, 65536), (2, 0)),
+    ((20, 10000), (1, 7)),
+    ((4, 13, 10000), None),
+    ((4, 14, 10000), (1, 1)),
+]
+
+_mchanTransferRegex = re.compile(r"mchan_transfer_\w+\((\d+),")
+_mchanPushRegex = re.compile(r"\.cmd = (\d+), \.size = (\d+),")
+_chunkLoopRegex = re.compile(r"for \(uint32_t chunk = 0; chunk < (\d+); chunk\+\+\) \{")
+_remainderRegex = re.compile(r"if \((\d+) > 0\) \{")
+
+
+def param_id_dma_split(val):
+    """Generate readable test IDs for DMA split tests."""
+    if isinstance(val, tuple) and len(val) == 2 and isinstance(val[0], tuple):
+        transfer_shape, expected_split = val
+        split_str = "unsplit" if expected_split is None else f"split{expected_split[0]}x_rem{expected_split[1]}"
+        return f"{'x'.join(map(str, transfer_shape))}_{split_str}"
+    return str(val)
+
+
+def generate_transfer_code(dma_type: str, transfer_shape: tuple, split = None) -> str:
+    """Generate the code of a single L2→L1 transfer of a contiguous tile."""
+    dma_obj = MchanDma() if dma_type == "MchanDma" else GAP9MchanDma()
+    ctxt = NetworkContext(VariableBuffer, ConstantBuffer, StructBuffer, TransientBuffer)
+    external_buffer = VariableBuffer("ext", list(transfer_shape))
+    external_buffer._memoryLevel = "L2"
+    local_buffer = VariableBuffer("loc", list(transfer_shape))
+    local_buffer._memoryLevel = "L1"
+    adapter = AnydimAsyncDmaTransferAdapter(dma_obj)
+    future = adapter.getFuture(local_buffer.name, "ExternalToLocal")
+    snippets = adapter.transfer(ctxt,
+                                external_buffer,
+                                local_buffer,
+                                transfer_shape,
+                                stridesFromShape(transfer_shape),
+                                stridesFromShape(transfer_shape),
+                                "ExternalToLocal",
+                                future,
+                                split = split)
+    return "\n".join(snippet.template.generate(snippet.operatorRepresentation) for snippet in snippets)
+
+
+def transfer_sizes(dma_type: str, code: str):
+    """Sizes of all transfer commands in the generated code."""
+    if dma_type == "MchanDma":
+        return [int(cmd) & ((1 << 17) - 1) for cmd in _mchanTransferRegex.findall(code)]
+    return [int(size) for _, size in _mchanPushRegex.findall(code)]
+
+
+@pytest.mark.deeploy_internal
+@pytest.mark.parametrize("dma_type", ["MchanDma", "GAP9MchanDma"])
+@pytest.mark.parametrize("test_shape", MCHAN_DMA_SPLIT_TEST_SHAPES, ids = param_id_dma_split)
+def test_mchan_dma_split(test_shape, dma_type) -> None:
+    """Test that mchan transfers above the maximum transfer size are split into several transfers."""
+    transfer_shape, expected_split = test_shape
+    if dma_type == "GAP9MchanDma" and len(transfer_shape) > 2:
+        pytest.skip(reason = "GAP9 mchan supports only transfers up to rank 2")
+
+    code = generate_transfer_code(dma_type, transfer_shape)
+    sizes = transfer_sizes(dma_type, code)
+    assert all(0 < size < (1 << 17) for size in sizes), f"Transfer size exceeds 17 bits:\n{code}"
+
+    if expected_split is None:
+        assert len(sizes) == 1 and _chunkLoopRegex.search(code) is None, f"Transfer should not be split:\n{code}"
+        return
+
+    expected_chunks, expected_remainder = expected_split
+    assert [int(chunks) for chunks in _chunkLoopRegex.findall(code)] == [expected_chunks], code
+    assert [int(remainder) for remainder in _remainderRegex.findall(code)] == [expected_remainder], code
+
+    # The chunks and the remainder cover the tile
+    chunk_size, remainder_size = sizes
+    rows = transfer_shape[-2] if len(transfer_shape) > 1 else transfer_shape[0]
+    row_size = transfer_shape[-1] if len(transfer_shape) > 1 else 1
+    assert expected_chunks * chunk_size + expected_remainder * row_size == rows * row_size, code
+    if expected_remainder > 0:
+        assert remainder_size == expected_remainder * row_size, code
+
+
+@pytest.mark.deeploy_internal
+@pytest.mark.parametrize("dma_type", ["MchanDma", "GAP9MchanDma"])
+def test_mchan_dma_forced_split(dma_type) -> None:
+    """Test that forcing the split of a transfer below the maximum transfer size yields the same code structure."""
+    below = generate_transfer_code(dma_type, (4, 1000), split = True)
+    above = generate_transfer_code(dma_type, (400, 1000))
+
+    # Tiles of the same tensor share the code, which differs only in the values of the transfers
+    assert re.sub(r"\d+", "N", below) == re.sub(r"\d+", "N", above)
+    assert [int(chunks) for chunks in _chunkLoopRegex.findall(below)] == [0]
+    assert [int(remainder) for remainder in _remainderRegex.findall(below)] == [4]
+    assert transfer_sizes(dma_type, below)[1] == 4000
+
+
+@pytest.mark.deeploy_internal
+def test_mchan_dma_split_row_too_long() -> None:
+    """Test that rows above the maximum transfer size are rejected."""
+    with pytest.raises(AssertionError, match = "exceed the maximum transfer size"):
+        generate_transfer_code("MchanDma", (2, 131072))
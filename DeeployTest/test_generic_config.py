@@ -21,6 +21,7 @@ KERNEL_TESTS = [
     "Kernels/FP32/Div/Regular",
     "Kernels/FP32/Exp",
     "Kernels/FP32/Floor",
+    "Kernels/FP32/FusedElementwise",
     "Kernels/FP32/GEMM/Regular",
     "Kernels/FP32/GlobalAveragePool",
     "Kernels/FP32/GlobalMaxPool",
@@ -64,6 +65,8 @@ KERNEL_TESTS = [
     "Kernels/Integer/Softmax/Regular",
     "Kernels/Integer/Add/MultIO",
     "Kernels/Integer/Add/Regular",
+    "Kernels/Integer/FusedElementwise/Signed",
+    "Kernels/Integer/FusedElementwise/Unsigned",
     "Kernels/Integer/Conv/DW_1D",
     "Kernels/Integer/Conv/Regular_1D",
     "Kernels/Integer/Conv/DW_2D",
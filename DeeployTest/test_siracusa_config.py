@@ -22,6 +22,7 @@ KERNEL_TESTS = [
     "Kernels/FP32/GEMM/Regular",
     "Kernels/FP32/MatMul",
     "Kernels/FP32/MaxPool/Regular_2D",
+    "Kernels/FP32/FusedElementwise",
     "Kernels/FP32/Mul/Regular",
     "Kernels/FP32/LayerNorm",
     "Kernels/FP32/ReduceMean/KeepDims/Add_ReduceMean",
@@ -49,6 +50,8 @@ KERNEL_TESTS = [
     "Kernels/Integer/Softmax/Regular",
     "Kernels/Integer/Add/MultIO",
     "Kernels/Integer/Add/Regular",
+    "Kernels/Integer/FusedElementwise/Signed",
+    "Kernels/Integer/FusedElementwise/Unsigned",
     "Kernels/Integer/Concat",
     "Kernels/Integer/MatMul/Add",
     "Kernels/Integer/MatMul/Regular",
@@ -61,6 +64,8 @@ KERNEL_TESTS = [
     "Kernels/Mixed/Quant",
     "Models/Transformer_DeepQuant",
     "Kernels/Integer/Conv/Regular_2D_RQ",
+    "Kernels/Integer/Conv/Regular_2D_RQ_Add",
+    "Kernels/Integer/Conv/Regular_2D_RQ_MaxPool",
     "Kernels/Integer/Conv/DW_2D_RQ",
     "Kernels/Integer/Hardswish/Regular_RQ",
     "Kernels/Integer/TrueIntegerDiv",
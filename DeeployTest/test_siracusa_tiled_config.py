@@ -23,6 +23,7 @@ L2_SINGLEBUFFER_KERNELS = {
     "Kernels/FP32/MatMul": [2000],
     "Kernels/FP32/MaxPool/Regular_2D": [2000],
     "Kernels/FP32/Mul/Regular": [2000],
+    "Kernels/FP32/FusedElementwise": [2000],
     "Kernels/FP32/LayerNorm": [2000],
     "Kernels/FP32/ReduceMean/KeepDims/Add_ReduceMean": [8000],
     "Kernels/FP32/ReduceMean/KeepDims/Add_ReduceMean_Add": [8000],
@@ -46,11 +47,15 @@ L2_SINGLEBUFFER_KERNELS = {
     "Kernels/FP32/Transpose": [2000],
     "Kernels/Integer/Hardswish/Regular": [750],
     "Kernels/Integer/Softmax/Regular": [800, 500, 300],
+    "Kernels/Integer/FusedElementwise/Signed": [2000],
+    "Kernels/Integer/FusedElementwise/Unsigned": [2000],
     "Kernels/Integer/Concat": [32000, 16000, 8000],
     "Kernels/Integer/MatMul/Batch": [20000],
     "Kernels/Integer/MatMul/Regular": [64000, 32000, 16000],
     "Kernels/Integer/RMSNorm": [2048, 1024, 512],
     "Kernels/Integer/Conv/Regular_2D_RQ": [8000, 6000, 4000],
+    "Kernels/Integer/Conv/Regular_2D_RQ_Add": [8000, 4000, 2000],
+    "Kernels/Integer/Conv/Regular_2D_RQ_MaxPool": [8000, 4000, 2000],
     "Kernels/Integer/Conv/DW_2D_RQ": [2561],
     "Kernels/Integer/Conv/StriddedPadded_2D_RQ": [600],
     "Kernels/Integer/GEMM/Batch_RQ": [20000],
@@ -70,6 +75,7 @@ L2_DOUBLEBUFFER_KERNELS = {
     "Kernels/FP32/MatMul": [5000],
     "Kernels/FP32/MaxPool/Regular_2D": [5000],
     "Kernels/FP32/Mul/Regular": [2000],
+    "Kernels/FP32/FusedElementwise": [2000],
     "Kernels/FP32/LayerNorm": [2000],
     "Kernels/FP32/ReduceMean/KeepDims/Add_ReduceMean": [8000],
     "Kernels/FP32/ReduceMean/KeepDims/Add_ReduceMean_Add": [8000],
@@ -93,10 +99,14 @@ L2_DOUBLEBUFFER_KERNELS = {
     "Kernels/FP32/Transpose": [2000],
     "Kernels/Integer/Hardswish/Regular": [750],
     "Kernels/Integer/Softmax/Regular": [1600, 1000, 600],
+    "Kernels/Integer/FusedElementwise/Signed": [2000],
+    "Kernels/Integer/FusedElementwise/Unsigned": [2000],
     "Kernels/Integer/Concat": [64000, 32000, 16000],
     "Kernels/Integer/MatMul/Regular": [64000, 32000, 16000],
     "Kernels/Integer/RMSNorm": [4096, 2048, 1024],
     "Kernels/Integer/Conv/Regular_2D_RQ": [8000, 6000, 5000],
+    "Kernels/Integer/Conv/Regular_2D_RQ_Add": [8000, 4000],
+    "Kernels/Integer/Conv/Regular_2D_RQ_MaxPool": [8000, 4000],
     "Kernels/Integer/Conv/DW_2D_RQ": [5121],
     "Kernels/Integer/Hardswish/Regular_RQ": [800],
 }
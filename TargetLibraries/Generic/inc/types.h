@@ -11,4 +11,10 @@
 typedef double float64_t;
 typedef float float32_t;
 
+// packed sub-byte integer types, the C type is the byte container
+typedef uint8_t int2_t;
+typedef uint8_t uint2_t;
+typedef uint8_t int4_t;
+typedef uint8_t uint4_t;
+
 #endif //__DEEPLOY_BASIC_MATH_TYPES_HEADER_
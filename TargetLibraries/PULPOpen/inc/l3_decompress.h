@@ -0,0 +1,36 @@
+/*
+ * SPDX-FileCopyrightText: 2025 ETH Zurich and University of Bologna
+ *
+ * SPDX-License-Identifier: Apache-2.0
+ *
+ * In-place decoder of the compressed tiles of L3 constants, shared by PULPOpen
+ * and GAP9. A compressed tile is transferred into the end of its L2 buffer and
+ * decompressed to the start of the same buffer. See
+ * Deeploy/Targets/PULPOpen/L3Compression.py for the encoder.
+ */
+
+#ifndef __L3_DECOMPRESS_H__
+#define __L3_DECOMPRESS_H__
+
+#include <stdint.h>
+
+#define L3_COMPRESSION_BITPACK 1
+#define L3_COMPRESSION_ZRLE 2
+#define L3_COMPRESSION_HUFFMAN 4
+
+#define L3_DECOMPRESS_MAX_CODE_LENGTH 16
+#define L3_DECOMPRESS_MAX_TAIL_SIZE 64
+
+typedef struct {
+  uint8_t encoding;
+  uint8_t bits;
+  uint8_t is_signed;
+  uint8_t tail_size;
+  uint32_t size;
+  uint32_t body_size;
+} l3_compression_header_t;
+
+// Decompress the chunk at src to dest, src may lie inside the decompressed tile
+void l3_decompress(void *dest, const void *src);
+
+#endif // __L3_DECOMPRESS_H__
@@ -0,0 +1,68 @@
+/*
+ * SPDX-FileCopyrightText: 2025 ETH Zurich and University of Bologna
+ *
+ * SPDX-License-Identifier: Apache-2.0
+ *
+ * Software-managed transfer descriptors: Transfers of a rank above the 2D
+ * transfers of mchan are issued by a single call, which walks the outer
+ * dimensions from a descriptor array. The 2D transfers are pushed
+ * back-to-back without waiting, such that the address calculation and the
+ * issue of a transfer overlap with the previous transfer in flight.
+ */
+
+#ifndef __MCHAN_DESCRIPTOR_H__
+#define __MCHAN_DESCRIPTOR_H__
+
+// Requires mchan_transfer_2d_ext_strided of mchan_v6.h or mchan_v7.h
+#if !defined(__MCHAN_V6_H__) && !defined(__MCHAN_V7_H__)
+#error "[mchan_descriptor.h] Include an mchan version header first!"
+#endif
+
+#define MCHAN_DESCRIPTOR_MAX_DIMS (4)
+
+// Outer dimension of a transfer, strides are in bytes
+typedef struct {
+  uint32_t count;
+  uint32_t loc_stride;
+  uint32_t ext_stride;
+} mchan_dim_t;
+
+/*
+ * Issue a 2D transfer for every index of the outer dimensions. The first
+ * descriptor is the outermost dimension. All transfers share the channel
+ * allocated before the call.
+ */
+static void mchan_transfer_nd_ext_strided(uint32_t cmd, void *loc, void *ext,
+                                          uint32_t ext_size_1d,
+                                          uint32_t ext_stride_2d,
+                                          const mchan_dim_t *dims,
+                                          uint32_t num_dims) {
+  assert(num_dims <= MCHAN_DESCRIPTOR_MAX_DIMS);
+
+  uint32_t idx[MCHAN_DESCRIPTOR_MAX_DIMS] = {0};
+  uint32_t num_transfers = 1;
+  for (uint32_t d = 0; d < num_dims; d++) {
+    num_transfers *= dims[d].count;
+  }
+
+  char *loc_ptr = (char *)loc;
+  char *ext_ptr = (char *)ext;
+  for (uint32_t i = 0; i < num_transfers; i++) {
+    mchan_transfer_2d_ext_strided(cmd, loc_ptr, ext_ptr, ext_size_1d,
+                                  ext_stride_2d);
+
+    // Advance to the next index, innermost outer dimension first
+    for (int32_t d = num_dims - 1; d >= 0; d--) {
+      loc_ptr += dims[d].loc_stride;
+      ext_ptr += dims[d].ext_stride;
+      if (++idx[d] < dims[d].count) {
+        break;
+      }
+      idx[d] = 0;
+      loc_ptr -= dims[d].count * dims[d].loc_stride;
+      ext_ptr -= dims[d].count * dims[d].ext_stride;
+    }
+  }
+}
+
+#endif // __MCHAN_DESCRIPTOR_H__
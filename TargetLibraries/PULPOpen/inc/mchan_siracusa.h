@@ -19,3 +19,6 @@
 #endif
 
 #include "mchan_v7.h"
+
+// Requires the mchan version header
+#include "mchan_descriptor.h"
@@ -0,0 +1,176 @@
+/*
+ * SPDX-FileCopyrightText: 2025 ETH Zurich and University of Bologna
+ *
+ * SPDX-License-Identifier: Apache-2.0
+ *
+ * Persistent cluster team: The cluster cores are forked once per inference
+ * instead of once per layer. The core that starts the team runs the network
+ * and hands every parallel layer to the other cores of the team via a shared
+ * task descriptor. The workers wait for the next task in a team barrier.
+ *
+ * Dedicated DMA core: The last core of the team runs the network and only
+ * controls the DMA, while the other cores wait for tasks on a flag instead of
+ * a team barrier. Tasks of kernels which accept a core count are computed by
+ * the compute cores alone, which signal their completion per core, such that
+ * the DMA core transfers the tiles of the previous and next kernel meanwhile.
+ */
+
+#ifndef __PERSISTENT_CLUSTER_H__
+#define __PERSISTENT_CLUSTER_H__
+
+#include "pmsis.h"
+
+// The compute cores keep the indices 0 to NUM_CORES - 2
+#define DEEPLOY_DMA_CORE (NUM_CORES - 1)
+#define DEEPLOY_COMPUTE_CORES (NUM_CORES - 1)
+
+typedef void (*deeploy_cluster_fn_t)(void *args);
+
+typedef struct {
+  // Task published to the team, NULL terminates the workers
+  deeploy_cluster_fn_t volatile fn;
+  void *volatile args;
+  // Network entry executed by the core that started the team
+  deeploy_cluster_fn_t entry;
+  void *entry_args;
+  uint32_t master;
+  // Tasks are handed over by flags instead of team barriers
+  uint32_t dma_core;
+  // Number of published tasks and of the latest task finished by every core
+  volatile uint32_t posted;
+  volatile uint32_t finished[NUM_CORES];
+  // The compute cores run a task the master did not wait for yet
+  uint32_t pending;
+} deeploy_cluster_team_t;
+
+/*
+ * Wait until the compute cores finished the latest task posted with
+ * deeploy_cluster_post. Returns immediately if there is no such task.
+ */
+static inline void deeploy_cluster_wait(deeploy_cluster_team_t *team) {
+  if (!team->pending) {
+    return;
+  }
+  for (uint32_t core = 0; core < NUM_CORES; core++) {
+    if (core == team->master) {
+      continue;
+    }
+    while (team->finished[core] != team->posted) {
+    }
+  }
+  team->pending = 0;
+}
+
+static inline void deeploy_cluster_publish(deeploy_cluster_team_t *team,
+                                           deeploy_cluster_fn_t fn,
+                                           void *args) {
+  if (team->dma_core) {
+    // The descriptor is only free once the compute cores finished their task
+    deeploy_cluster_wait(team);
+  }
+  team->fn = fn;
+  team->args = args;
+  if (team->dma_core) {
+    team->posted = team->posted + 1;
+  } else {
+    pi_cl_team_barrier();
+  }
+}
+
+/*
+ * Execute a parallel task on all cores of the team. Must be called by the
+ * core running the network. The task has to end in a team barrier, which
+ * joins the team and makes the descriptor available for the next task.
+ */
+static inline void deeploy_cluster_dispatch(deeploy_cluster_team_t *team,
+                                            deeploy_cluster_fn_t fn,
+                                            void *args) {
+  deeploy_cluster_publish(team, fn, args);
+  fn(args);
+}
+
+/*
+ * Start a task on the compute cores and return without waiting for it. Must
+ * be called by the dedicated DMA core. The task has to end in
+ * deeploy_cluster_task_done instead of a team barrier. The arguments must not
+ * change before deeploy_cluster_wait returned.
+ */
+static inline void deeploy_cluster_post(deeploy_cluster_team_t *team,
+                                        deeploy_cluster_fn_t fn, void *args) {
+  deeploy_cluster_publish(team, fn, args);
+  team->pending = 1;
+}
+
+// Signal the completion of a posted task by the calling compute core
+static inline void deeploy_cluster_task_done(deeploy_cluster_team_t *team) {
+  team->finished[pi_core_id()] = team->posted;
+}
+
+static inline void deeploy_cluster_team_entry(void *arg) {
+  deeploy_cluster_team_t *team = (deeploy_cluster_team_t *)arg;
+
+  if (pi_core_id() == team->master) {
+    team->entry(team->entry_args);
+    // Release the workers
+    if (team->dma_core) {
+      deeploy_cluster_publish(team, NULL, NULL);
+    } else {
+      team->fn = NULL;
+      pi_cl_team_barrier();
+    }
+    return;
+  }
+
+  uint32_t received = 0;
+  while (1) {
+    if (team->dma_core) {
+      while (team->posted == received) {
+      }
+      received = team->posted;
+    } else {
+      pi_cl_team_barrier();
+    }
+    deeploy_cluster_fn_t fn = team->fn;
+    if (fn == NULL) {
+      break;
+    }
+    fn(team->args);
+  }
+}
+
+static inline void deeploy_cluster_start(deeploy_cluster_team_t *team,
+                                         deeploy_cluster_fn_t entry, void *args,
+                                         uint32_t master, uint32_t dma_core) {
+  team->fn = NULL;
+  team->args = NULL;
+  team->entry = entry;
+  team->entry_args = args;
+  team->master = master;
+  team->dma_core = dma_core;
+  team->posted = 0;
+  team->pending = 0;
+  for (uint32_t core = 0; core < NUM_CORES; core++) {
+    team->finished[core] = 0;
+  }
+  pi_cl_team_fork(NUM_CORES, deeploy_cluster_team_entry, team);
+}
+
+/*
+ * Fork the team once and run the network entry on the calling core, which
+ * takes part in the team.
+ */
+static inline void deeploy_cluster_run(deeploy_cluster_team_t *team,
+                                       deeploy_cluster_fn_t entry, void *args) {
+  deeploy_cluster_start(team, entry, args, pi_core_id(), 0);
+}
+
+/*
+ * Fork the team once and run the network entry on the dedicated DMA core.
+ */
+static inline void deeploy_cluster_run_dma_core(deeploy_cluster_team_t *team,
+                                                deeploy_cluster_fn_t entry,
+                                                void *args) {
+  deeploy_cluster_start(team, entry, args, DEEPLOY_DMA_CORE, 1);
+}
+
+#endif // __PERSISTENT_CLUSTER_H__
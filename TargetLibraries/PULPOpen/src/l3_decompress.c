@@ -0,0 +1,127 @@
+/*
+ * SPDX-FileCopyrightText: 2025 ETH Zurich and University of Bologna
+ *
+ * SPDX-License-Identifier: Apache-2.0
+ */
+
+#include "l3_decompress.h"
+
+#include <string.h>
+
+typedef struct {
+  const uint8_t *body;
+  uint32_t body_size;
+  uint32_t read;
+  uint8_t huffman;
+  uint8_t bit_buffer;
+  uint8_t bit_count;
+  uint8_t counts[L3_DECOMPRESS_MAX_CODE_LENGTH];
+  uint8_t symbols[256];
+  uint8_t tail[L3_DECOMPRESS_MAX_TAIL_SIZE];
+} l3_decompress_t;
+
+static uint8_t l3_decompress_payload_byte(l3_decompress_t *state) {
+  uint32_t idx = state->read++;
+  if (idx < state->body_size) {
+    return state->body[idx];
+  }
+  return state->tail[idx - state->body_size];
+}
+
+static uint8_t l3_decompress_byte(l3_decompress_t *state) {
+  if (!state->huffman) {
+    return l3_decompress_payload_byte(state);
+  }
+
+  // Canonical Huffman code, the bits are read one by one as the code grows
+  int32_t code = 0;
+  int32_t first = 0;
+  int32_t index = 0;
+  for (uint32_t len = 0; len < L3_DECOMPRESS_MAX_CODE_LENGTH; len++) {
+    if (state->bit_count == 0) {
+      state->bit_buffer = l3_decompress_payload_byte(state);
+      state->bit_count = 8;
+    }
+    state->bit_count--;
+    code |= (state->bit_buffer >> state->bit_count) & 1;
+    int32_t count = state->counts[len];
+    if (code - count < first) {
+      return state->symbols[index + (code - first)];
+    }
+    index += count;
+    first = (first + count) << 1;
+    code <<= 1;
+  }
+  return 0;
+}
+
+void l3_decompress(void *dest, const void *src) {
+  const uint8_t *in = (const uint8_t *)src;
+  uint8_t *out = (uint8_t *)dest;
+  l3_compression_header_t header;
+  l3_decompress_t state;
+
+  // Everything in front of the body is read before the output may overwrite it
+  memcpy(&header, in, sizeof(header));
+  in += sizeof(header);
+
+  state.huffman = (header.encoding & L3_COMPRESSION_HUFFMAN) != 0;
+  if (state.huffman) {
+    uint32_t num_symbols = 0;
+    memcpy(state.counts, in, L3_DECOMPRESS_MAX_CODE_LENGTH);
+    in += L3_DECOMPRESS_MAX_CODE_LENGTH;
+    for (uint32_t len = 0; len < L3_DECOMPRESS_MAX_CODE_LENGTH; len++) {
+      num_symbols += state.counts[len];
+    }
+    memcpy(state.symbols, in, num_symbols);
+    in += num_symbols;
+  }
+
+  memcpy(state.tail, in, header.tail_size);
+  in += header.tail_size;
+
+  state.body = in;
+  state.body_size = header.body_size;
+  state.read = 0;
+  state.bit_count = 0;
+
+  const uint8_t mask = (uint8_t)((1 << header.bits) - 1);
+  uint32_t produced = 0;
+  uint32_t zeros = 0;
+  uint32_t literals = 0;
+  while (produced < header.size) {
+    uint8_t value;
+    if (!(header.encoding & L3_COMPRESSION_ZRLE)) {
+      value = l3_decompress_byte(&state);
+    } else if (zeros > 0) {
+      zeros--;
+      value = 0;
+    } else if (literals > 0) {
+      literals--;
+      value = l3_decompress_byte(&state);
+    } else {
+      uint8_t control = l3_decompress_byte(&state);
+      if (control & 0x80) {
+        zeros = (control & 0x7F) + 1;
+      } else {
+        literals = control + 1;
+      }
+      continue;
+    }
+
+    if (!(header.encoding & L3_COMPRESSION_BITPACK)) {
+      out[produced++] = value;
+      continue;
+    }
+
+    // Bit-packed payloads are padded to full bytes
+    for (uint8_t shift = 0; shift < 8 && produced < header.size;
+         shift += header.bits) {
+      uint8_t element = (value >> shift) & mask;
+      if (header.is_signed && (element & (1 << (header.bits - 1)))) {
+        element |= (uint8_t)(0xFF << header.bits);
+      }
+      out[produced++] = element;
+    }
+  }
+}
@@ -41,6 +41,8 @@ typedef float v2f32 __attribute__((vector_size(8)));
 #include "kernel/UniformRequantShift.h"
 #include "kernel/iNoNorm.h"
 
+#include "dmaDescriptor.h"
 #include "dmaStruct.h"
+#include "dmaTxid.h"
 
 #endif //__DEEPLOY_MATH_HEADER_
@@ -0,0 +1,64 @@
+/*
+ * SPDX-FileCopyrightText: 2025 ETH Zurich and University of Bologna
+ *
+ * SPDX-License-Identifier: Apache-2.0
+ *
+ * Software-managed transfer descriptors: Transfers of a rank above the 2D
+ * transfers of the Snitch DMA are issued by a single call, which walks the
+ * outer dimensions from a descriptor array. The 2D transfers are issued
+ * back-to-back without waiting, such that the address calculation and the
+ * issue of a transfer overlap with the previous transfer in flight.
+ */
+
+#ifndef __DEEPLOY_MATH_DMADESCRIPTOR_HEADER_
+#define __DEEPLOY_MATH_DMADESCRIPTOR_HEADER_
+
+#include "dmaTxid.h"
+
+#define DEEPLOY_DMA_DESCRIPTOR_MAX_DIMS (4)
+
+// Outer dimension of a transfer, strides are in bytes
+typedef struct {
+  uint32_t count;
+  uint32_t dst_stride;
+  uint32_t src_stride;
+} deeploy_dma_dim_t;
+
+/*
+ * Issue a 2D transfer for every index of the outer dimensions. The first
+ * descriptor is the outermost dimension. Returns the transaction ID of the
+ * last transfer, which resolves all of them.
+ */
+static inline snrt_dma_txid_t
+deeploy_dma_start_nd(void *dst, const void *src, size_t size, size_t dst_stride,
+                     size_t src_stride, size_t repeat,
+                     const deeploy_dma_dim_t *dims, uint32_t num_dims) {
+  uint32_t idx[DEEPLOY_DMA_DESCRIPTOR_MAX_DIMS] = {0};
+  uint32_t num_transfers = 1;
+  for (uint32_t d = 0; d < num_dims; d++) {
+    num_transfers *= dims[d].count;
+  }
+
+  snrt_dma_txid_t txid = DEEPLOY_DMA_TXID_NONE;
+  char *dst_ptr = (char *)dst;
+  const char *src_ptr = (const char *)src;
+  for (uint32_t i = 0; i < num_transfers; i++) {
+    txid = deeploy_dma_start_2d(dst_ptr, src_ptr, size, dst_stride, src_stride,
+                                repeat);
+
+    // Advance to the next index, innermost outer dimension first
+    for (int32_t d = num_dims - 1; d >= 0; d--) {
+      dst_ptr += dims[d].dst_stride;
+      src_ptr += dims[d].src_stride;
+      if (++idx[d] < dims[d].count) {
+        break;
+      }
+      idx[d] = 0;
+      dst_ptr -= dims[d].count * dims[d].dst_stride;
+      src_ptr -= dims[d].count * dims[d].src_stride;
+    }
+  }
+  return txid;
+}
+
+#endif // __DEEPLOY_MATH_DMADESCRIPTOR_HEADER_
@@ -0,0 +1,52 @@
+/*
+ * SPDX-FileCopyrightText: 2025 ETH Zurich and University of Bologna
+ *
+ * SPDX-License-Identifier: Apache-2.0
+ *
+ * Transaction ID tracking for the Snitch DMA: Transaction IDs are monotonic,
+ * so waiting for the highest ID of a group of transfers resolves all of them.
+ * The most recently issued ID is only resolved once the DMA is idle, hence it
+ * is tracked and waited for by draining the DMA.
+ */
+
+#ifndef __DEEPLOY_MATH_DMATXID_HEADER_
+#define __DEEPLOY_MATH_DMATXID_HEADER_
+
+#include "snrt.h"
+
+#define DEEPLOY_DMA_TXID_NONE ((snrt_dma_txid_t)-1)
+
+extern snrt_dma_txid_t deeploy_dma_last_txid;
+
+static inline snrt_dma_txid_t
+deeploy_dma_start_2d(void *dst, const void *src, size_t size, size_t dst_stride,
+                     size_t src_stride, size_t repeat) {
+  snrt_dma_txid_t txid =
+      snrt_dma_start_2d(dst, src, size, dst_stride, src_stride, repeat);
+  deeploy_dma_last_txid = txid;
+  return txid;
+}
+
+static inline snrt_dma_txid_t deeploy_dma_txid_max(snrt_dma_txid_t a,
+                                                   snrt_dma_txid_t b) {
+  if (a == DEEPLOY_DMA_TXID_NONE) {
+    return b;
+  }
+  if (b == DEEPLOY_DMA_TXID_NONE) {
+    return a;
+  }
+  return (a > b) ? a : b;
+}
+
+static inline void deeploy_dma_wait(snrt_dma_txid_t txid) {
+  if (txid == DEEPLOY_DMA_TXID_NONE) {
+    return;
+  }
+  if (txid == deeploy_dma_last_txid) {
+    snrt_dma_wait_all();
+  } else {
+    snrt_dma_wait(txid);
+  }
+}
+
+#endif // __DEEPLOY_MATH_DMATXID_HEADER_
@@ -0,0 +1,11 @@
+/*
+ * SPDX-FileCopyrightText: 2025 ETH Zurich and University of Bologna
+ *
+ * SPDX-License-Identifier: Apache-2.0
+ */
+
+#include "DeeploySnitchMath.h"
+
+// Only accessed by the DM core. A stale value only makes deeploy_dma_wait
+// drain the DMA instead of waiting for a single transaction.
+snrt_dma_txid_t deeploy_dma_last_txid __attribute__((section(".l1")));